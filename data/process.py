@@ -23,21 +23,19 @@ def make_word_list(in_file, out_file, letter_count):
         words = [line.strip() for line in f]
     words = [w for w in words if matches(w, letter_count)]
     words.sort(key=lambda w: freqs.get(w, 0), reverse=True)
-    with open(out_file, "w") as f:
-        f.write("WORDS=[\n")
-        for word in words:
-            f.write(f"    '{word}',\n")
-        f.write("]\n")
+    # Fixed width records, letter_count ASCII bytes per word, no separators
+    with open(out_file, "wb") as f:
+        f.write("".join(words).encode("ascii"))
 
 
 if __name__ == "__main__":
-    make_word_list("scrabble.txt", "scrabble4.py", 4)
-    make_word_list("scrabble.txt", "scrabble5.py", 5)
-    make_word_list("scrabble.txt", "scrabble6.py", 6)
-    make_word_list("scrabble.txt", "scrabble7.py", 7)
-    make_word_list("scrabble.txt", "scrabble8.py", 8)
-    make_word_list("dictionary.txt", "dictionary4.py", 4)
-    make_word_list("dictionary.txt", "dictionary5.py", 5)
-    make_word_list("dictionary.txt", "dictionary6.py", 6)
-    make_word_list("dictionary.txt", "dictionary7.py", 7)
-    make_word_list("dictionary.txt", "dictionary8.py", 8)
+    make_word_list("scrabble.txt", "scrabble4.bin", 4)
+    make_word_list("scrabble.txt", "scrabble5.bin", 5)
+    make_word_list("scrabble.txt", "scrabble6.bin", 6)
+    make_word_list("scrabble.txt", "scrabble7.bin", 7)
+    make_word_list("scrabble.txt", "scrabble8.bin", 8)
+    make_word_list("dictionary.txt", "dictionary4.bin", 4)
+    make_word_list("dictionary.txt", "dictionary5.bin", 5)
+    make_word_list("dictionary.txt", "dictionary6.bin", 6)
+    make_word_list("dictionary.txt", "dictionary7.bin", 7)
+    make_word_list("dictionary.txt", "dictionary8.bin", 8)
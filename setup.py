@@ -1,9 +1,30 @@
-from setuptools import setup, find_packages
+import os
+import sys
+
+from setuptools import Extension, setup, find_packages
+
+if os.environ.get("WORDGAME_NO_OPENMP") or sys.platform == "darwin":
+    # Apple clang has no OpenMP, parallel loops then run on a single thread
+    openmp_compile_args = openmp_link_args = []
+elif sys.platform == "win32":
+    openmp_compile_args = ["/openmp"]
+    openmp_link_args = []
+else:
+    openmp_compile_args = openmp_link_args = ["-fopenmp"]
 
 try:
     from Cython.Build import cythonize
 
-    ext_modules = cythonize("wordgame/fastcheck.pyx")
+    ext_modules = cythonize(
+        [
+            Extension(
+                "wordgame.fastcheck",
+                ["wordgame/fastcheck.pyx"],
+                extra_compile_args=openmp_compile_args,
+                extra_link_args=openmp_link_args,
+            )
+        ]
+    )
 except ImportError:
     print("cython not found, will use slow check function")
     ext_modules = []
@@ -16,11 +37,16 @@ setup(
     author_email="me@jbchouinard.net",
     description="Word game and solver.",
     packages=find_packages(),
+    package_data={"wordgame.words": ["*.bin", "*.json"]},
     install_requires=[],
     entry_points={
         "console_scripts": [
             "word-game = wordgame.gui:main",
+            "word-game-startup-benchmark = wordgame.startup:main",
             "word-solver-benchmark = wordgame.solver:main",
+            "word-solver-microbenchmark = wordgame.bench:main",
+            "word-solver-openings = wordgame.openings:main",
+            "word-solver-tree = wordgame.tree:main",
         ]
     },
     ext_modules=ext_modules,
@@ -0,0 +1,200 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+from wordgame.game import Game, State
+from wordgame.kernel import fastcheck, py_check_code
+from wordgame.solver import GuessCache, scoring, Solver
+from wordgame.words import WORD_SETS
+
+# (guess, solution) pairs timed by the check benchmarks
+CHECK_PAIRS = 1000
+
+
+def quiet_solver(game):
+    """Solver with no guess cache or decision tree, so every search is timed."""
+    return Solver(game, cache=GuessCache(0), use_tree=False)
+
+
+def benchmarks(wordset):
+    """Get (name, function, operations per call) for every benchmark of a word set.
+
+    Mid-game benchmarks start from the state after the word set's first guess,
+    with the solution in the middle of the solutions list.
+    """
+    words = wordset.words
+    solutions = wordset.solutions
+    solution = solutions[len(solutions) // 2]
+
+    game = Game(wordset, solution=solution)
+    game.guess(wordset.first_guess)
+    ((first_guess, first_response),) = game.guesses
+    mid_game = quiet_solver(game)
+    hard_game = Game(wordset, solution=solution, hard=True)
+    hard_game.guess(first_guess)
+    mid_game_hard = quiet_solver(hard_game)
+
+    opening = quiet_solver(Game(wordset, solution=solution))
+    all_candidates = opening.candidate_mask
+
+    step = max(1, len(words) // CHECK_PAIRS)
+    pairs = [(words[i], solutions[i % len(solutions)]) for i in range(0, len(words), step)]
+    pairs = pairs[:CHECK_PAIRS]
+
+    def check(check_code):
+        def run():
+            for (guess, soln) in pairs:
+                check_code(guess, soln)
+
+        return run
+
+    def filter_solutions():
+        opening.candidate_mask = all_candidates
+        opening.filter_solutions(first_guess, first_response)
+
+    def solve(hard=False):
+        solver = quiet_solver(Game(wordset, solution=solution, hard=hard))
+        while solver.game.state == State.OPEN:
+            solver.guess()
+
+    yield "check_python", check(py_check_code), len(pairs)
+    if fastcheck:
+        yield "check_fastcheck", check(fastcheck.check_code), len(pairs)
+    yield "compute_score", lambda: mid_game.compute_score(words[0]), 1
+    yield "filter_solutions", filter_solutions, 1
+    yield "find_guess", mid_game.find_guess, 1
+    yield "find_guess_hard", mid_game_hard.find_guess, 1
+    yield "wordset_load", wordset.load, 1
+    yield "solve", solve, 1
+    yield "solve_hard", lambda: solve(hard=True), 1
+
+
+def measure(fn, repeat, warmup, min_time):
+    """Seconds per call of fn, one sample per repeat.
+
+    Each sample runs fn enough times in a row to take at least min_time.
+    """
+    for _ in range(warmup):
+        fn()
+
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        loops *= 2 if elapsed * 10 > min_time else 10
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        samples.append((time.perf_counter() - start) / loops)
+    return samples
+
+
+def summarize(samples, ops):
+    samples = [s / ops for s in samples]
+    if len(samples) < 2:
+        # Quartiles need two samples, a single one has no spread
+        q1 = median = q3 = samples[0]
+    else:
+        q1, median, q3 = statistics.quantiles(samples, n=4, method="inclusive")
+    return {"median": median, "q1": q1, "q3": q3, "iqr": q3 - q1, "samples": samples}
+
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "fastcheck": bool(fastcheck),
+        "numpy": bool(scoring),
+    }
+
+
+def format_time(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g}{unit}"
+    return f"{seconds / 1e-9:.3g}ns"
+
+
+def compare(results, baseline, threshold):
+    """Print the change of every median from baseline, return the regressions."""
+    regressions = []
+    for words, benches in results.items():
+        for name, stats in benches.items():
+            base = baseline.get(words, {}).get(name)
+            if not base:
+                continue
+            change = stats["median"] / base["median"] - 1
+            regressed = change > threshold
+            if regressed:
+                regressions.append((words, name))
+            flag = "  REGRESSION" if regressed else ""
+            print(f"{words:24} {name:18} {change:+8.1%} vs {format_time(base['median'])}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the solver hot paths.")
+    parser.add_argument("-w", "--words", choices=WORD_SETS.keys(), action="append")
+    parser.add_argument("-b", "--bench", action="append", help="only run benchmarks named so")
+    parser.add_argument("-n", "--repeat", type=int, default=7, help="samples (default: 7)")
+    parser.add_argument("--warmup", type=int, default=1, help="warm up runs (default: 1)")
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.05,
+        help="minimum duration of one sample, in seconds (default: 0.05)",
+    )
+    parser.add_argument("-o", "--output", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="compare against results saved with --output")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown of a median reported as a regression (default: 0.1)",
+    )
+    args = parser.parse_args()
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    results = {}
+    for words in args.words or WORD_SETS.keys():
+        wordset = WORD_SETS[words]
+        # Build or map the response matrix outside of the timings
+        wordset.response_matrix
+        results[words] = {}
+        for name, fn, ops in benchmarks(wordset):
+            if args.bench and name not in args.bench:
+                continue
+            samples = measure(fn, args.repeat, args.warmup, args.min_time)
+            stats = results[words][name] = summarize(samples, ops)
+            print(
+                f"{words:24} {name:18} median {format_time(stats['median']):>8} "
+                f"IQR {format_time(stats['iqr']):>8}"
+            )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"environment": environment(), "results": results}, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        print(f"Compared to {args.baseline}:")
+        if compare(results, baseline["results"], args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
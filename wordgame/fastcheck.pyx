@@ -1,34 +1,294 @@
-UNKNOWN = 0
-EXACT = 1
-SOME = 2
-NONE = 3
+from cpython cimport array
+from cython.parallel cimport parallel, prange, threadid
+from libc.math cimport floor, INFINITY, log
+from libc.stdlib cimport calloc, free, malloc
 
+import array
 
-def check(guess, solution, letter_count):
-    result = []
-    cdef int guessarr[10]
-    cdef int solnarr[10]
-    cdef int count_nonexact_guess[26]
+cdef array.array codes_template = array.array("H", [])
+
+# Same as wordgame.strategy.ENTROPY_SCALE
+cdef double ENTROPY_SCALE = 1 << 20
+
+
+cdef inline int _check_code(
+    const unsigned char *guess, const unsigned char *solution, int letter_count
+) noexcept nogil:
     cdef int count_nonexact_solution[26]
     cdef int i
+    cdef int code = 0
+    cdef int place = 1
     for i in range(0, 26):
-        count_nonexact_guess[i] = 0
         count_nonexact_solution[i] = 0
 
     for i in range(0, letter_count):
-        guessarr[i] = ord(guess[i]) - 97
-        solnarr[i] = ord(solution[i]) - 97
-
-    for i in range(0, letter_count):
-        if guessarr[i] != solnarr[i]:
-            count_nonexact_solution[solnarr[i]] += 1
+        if guess[i] != solution[i]:
+            count_nonexact_solution[solution[i] - 97] += 1
 
     for i in range(0, letter_count):
-        if guessarr[i] == solnarr[i]:
-            result.append(EXACT)
-        elif count_nonexact_guess[guessarr[i]] < count_nonexact_solution[guessarr[i]]:
-            result.append(SOME)
+        if guess[i] == solution[i]:
+            pass
+        elif count_nonexact_solution[guess[i] - 97] > 0:
+            count_nonexact_solution[guess[i] - 97] -= 1
+            code += place
         else:
-            result.append(NONE)
+            code += 2 * place
+        place *= 3
+
+    return code
+
+
+cdef _check_letters(bytes word):
+    """Raise ValueError unless word only has letters a to z, which _check_code relies on."""
+    cdef unsigned char c
+    for c in word:
+        if c < 97 or c > 122:
+            raise ValueError(f"not a lowercase a-z word: {word.decode('ascii')!r}")
+
+
+def check_code(str guess, str solution):
+    cdef bytes guess_bytes = guess.encode("ascii")
+    cdef bytes solution_bytes = solution.encode("ascii")
+    if len(guess_bytes) != len(solution_bytes):
+        raise ValueError(f"guess and solution lengths differ: {guess!r}, {solution!r}")
+    _check_letters(guess_bytes)
+    _check_letters(solution_bytes)
+    return _check_code(
+        <const unsigned char *> guess_bytes,
+        <const unsigned char *> solution_bytes,
+        len(guess_bytes),
+    )
+
+
+def max_code(const unsigned short[::1] codes):
+    """Largest of a buffer of response codes, 0 if empty."""
+    cdef Py_ssize_t i
+    cdef unsigned short best = 0
+    with nogil:
+        for i in range(codes.shape[0]):
+            if codes[i] > best:
+                best = codes[i]
+    return best
+
+
+def check_many(const unsigned char[::1] guess, const unsigned char[::1] solutions):
+    """Response codes of an encoded guess against a buffer of encoded solutions.
+
+    solutions holds the solution words back to back, len(guess) bytes each.
+    """
+    cdef int letter_count = guess.shape[0]
+    cdef Py_ssize_t n = solutions.shape[0] // letter_count
+    cdef Py_ssize_t i
+    cdef array.array codes = array.clone(codes_template, n, zero=False)
+    with nogil:
+        for i in range(n):
+            codes.data.as_ushorts[i] = _check_code(
+                &guess[0], &solutions[i * letter_count], letter_count
+            )
+    return codes
+
+
+def score_guess(
+    const unsigned char[::1] guess, const unsigned char[::1] candidates, long long limit=-1
+):
+    """Sum of squared partition sizes of an encoded guess over encoded candidates.
+
+    If limit is not negative, stop and return None as soon as the score is
+    known to be greater than limit.
+    """
+    cdef int letter_count = guess.shape[0]
+    cdef Py_ssize_t n = candidates.shape[0] // letter_count
+    cdef Py_ssize_t i
+    cdef int n_codes = 1
+    cdef int code
+    cdef long long score = 0
+    cdef bint pruned = False
+    for i in range(letter_count):
+        n_codes *= 3
+    cdef int *counts = <int *> calloc(n_codes, sizeof(int))
+    if counts == NULL:
+        raise MemoryError()
+    with nogil:
+        for i in range(n):
+            code = _check_code(&guess[0], &candidates[i * letter_count], letter_count)
+            # (n + 1) ** 2 - n ** 2 == 2n + 1
+            score += 2 * counts[code] + 1
+            counts[code] += 1
+            # Every remaining candidate adds at least 1
+            if limit >= 0 and score + (n - i - 1) > limit:
+                pruned = True
+                break
+    free(counts)
+    if pruned:
+        return None
+    return score
+
+
+cdef inline double _weighted_score(
+    const unsigned short *row,
+    const int *candidate_ids,
+    Py_ssize_t n_candidates,
+    int *counts,
+    const double *weights,
+) noexcept nogil:
+    """Weighted sum of the partition metrics of a guess, see wordgame.strategy.
+
+    counts must be all zeros, and is left so.
+    """
+    cdef Py_ssize_t j
+    cdef int code, n
+    cdef double squares = 0, entropy = 0, worst = 0, buckets = 0
+    for j in range(n_candidates):
+        code = row[candidate_ids[j]]
+        counts[code] += 1
+    for j in range(n_candidates):
+        code = row[candidate_ids[j]]
+        n = counts[code]
+        # Only count each partition once, on its first candidate
+        if n == 0:
+            continue
+        counts[code] = 0
+        squares += <double> n * n
+        # Rounded like wordgame.strategy.xlogx
+        entropy += floor(n * log(n) * ENTROPY_SCALE + 0.5) / ENTROPY_SCALE
+        if n > worst:
+            worst = n
+        buckets -= 1
+    return (
+        weights[0] * squares + weights[1] * entropy + weights[2] * worst + weights[3] * buckets
+    )
+
+
+def best_guess(
+    const unsigned short[::1] codes,
+    Py_ssize_t n_solutions,
+    const int[::1] guess_ids,
+    const int[::1] candidate_ids,
+    int n_codes,
+    int num_threads=1,
+    const double[::1] weights=None,
+):
+    """Best guess id and its score, with the same tie-break as Solver.
+
+    codes is the flat response matrix, n_solutions codes per guess. Guesses
+    are scored in parallel with the GIL released, each thread with its own
+    histogram, then reduced in guess order so the result does not depend on
+    scheduling: the lowest (score, is not a candidate, guess id) wins.
+
+    Guesses are scored by the sum of squared partition sizes, or if weights
+    is given by the weighted sum of the metrics of wordgame.strategy.METRICS,
+    as a float.
+
+    With the sum of squares, each thread keeps the best score it found so
+    far, and stops scoring a guess once it is sure to be greater (branch and
+    bound). Such a guess cannot win, and gets an infinite score. Guesses
+    which tie with the best score are always fully scored, so the result
+    is the same as without the bound. Guesses likely to score well should
+    come first for the bound to cut early.
+
+    Guess and candidate ids are checked against the shape of codes, but
+    codes themselves are trusted to be less than n_codes, as
+    wordgame.matrix.ResponseMatrix guarantees for built and cached matrices.
+    """
+    cdef Py_ssize_t n_guesses = guess_ids.shape[0]
+    cdef Py_ssize_t n_candidates = candidate_ids.shape[0]
+    cdef Py_ssize_t i, j, k
+    cdef const unsigned short *row
+    cdef int *counts
+    cdef double score
+    cdef bint weighted = weights is not None
+    cdef const double *weights_ptr = NULL
+    cdef const int *candidates_ptr = &candidate_ids[0] if n_candidates else NULL
+    if n_guesses == 0:
+        raise ValueError("no guesses to pick from")
+    if weighted:
+        if weights.shape[0] != 4:
+            raise ValueError("expected one weight per metric")
+        weights_ptr = &weights[0]
+    if n_solutions <= 0 or codes.shape[0] % n_solutions:
+        raise ValueError("codes do not hold rows of n_solutions codes")
+    cdef Py_ssize_t n_rows = codes.shape[0] // n_solutions
+    # Bad ids would read and write out of bounds in the parallel loop
+    for i in range(n_guesses):
+        if not 0 <= guess_ids[i] < n_rows:
+            raise ValueError(f"guess id out of range: {guess_ids[i]}")
+    for j in range(n_candidates):
+        if not 0 <= candidate_ids[j] < n_solutions:
+            raise ValueError(f"candidate id out of range: {candidate_ids[j]}")
+    cdef int failed = 0
+    num_threads = max(num_threads, 1)
+    cdef double *scores = <double *> malloc(n_guesses * sizeof(double))
+    cdef char *is_candidate = <char *> calloc(max(n_solutions, 1), sizeof(char))
+    # Best score found by each thread so far
+    cdef double *bounds = <double *> malloc(num_threads * sizeof(double))
+    if scores == NULL or is_candidate == NULL or bounds == NULL:
+        free(scores)
+        free(is_candidate)
+        free(bounds)
+        raise MemoryError()
+    for j in range(num_threads):
+        bounds[j] = INFINITY
+
+    for j in range(n_candidates):
+        is_candidate[candidate_ids[j]] = 1
+
+    with nogil, parallel(num_threads=num_threads):
+        counts = <int *> calloc(n_codes, sizeof(int))
+        for i in prange(n_guesses, schedule="dynamic", chunksize=64):
+            row = &codes[guess_ids[i] * n_solutions]
+            score = 0
+            if counts != NULL and weighted:
+                score = _weighted_score(row, candidates_ptr, n_candidates, counts, weights_ptr)
+            elif counts != NULL:
+                k = n_candidates
+                for j in range(n_candidates):
+                    # (n + 1) ** 2 - n ** 2 == 2n + 1
+                    score = score + 2 * counts[row[candidate_ids[j]]] + 1
+                    counts[row[candidate_ids[j]]] += 1
+                    # Every remaining candidate adds at least 1
+                    if score + (n_candidates - j - 1) > bounds[threadid()]:
+                        k = j + 1
+                        break
+                for j in range(k):
+                    counts[row[candidate_ids[j]]] = 0
+                if k < n_candidates:
+                    score = INFINITY
+                elif score < bounds[threadid()]:
+                    bounds[threadid()] = score
+            else:
+                failed += 1
+            scores[i] = score
+        free(counts)
+
+    free(bounds)
+    if failed:
+        free(scores)
+        free(is_candidate)
+        raise MemoryError()
 
-    return tuple(result)
+    cdef double best_score = 0
+    cdef int best_guess_id = -1
+    cdef int best_not_candidate = 1
+    cdef int guess_id, not_candidate
+    for i in range(n_guesses):
+        score = scores[i]
+        guess_id = guess_ids[i]
+        not_candidate = not (guess_id < n_solutions and is_candidate[guess_id])
+        if (
+            best_guess_id < 0
+            or score < best_score
+            or (score == best_score and not_candidate < best_not_candidate)
+            or (
+                score == best_score
+                and not_candidate == best_not_candidate
+                and guess_id < best_guess_id
+            )
+        ):
+            best_score = score
+            best_guess_id = guess_id
+            best_not_candidate = not_candidate
+    free(scores)
+    free(is_candidate)
+    if weighted:
+        return best_guess_id, best_score
+    return best_guess_id, <long long> best_score
@@ -1,42 +1,41 @@
 import random
-from collections import defaultdict
+from collections import Counter, defaultdict
 
-from wordgame import eprint
-from wordgame.words import WORD_SETS
 
+def __getattr__(name):
+    # The check kernel is only imported when first needed
+    if name in ("check_code", "fastcheck"):
+        from wordgame import kernel
 
-try:
-    from wordgame.fastcheck import check
+        return getattr(kernel, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-    eprint("Using compiled fastcheck.")
-except ImportError:
 
-    def check(guess, solution, _letter_count):
-        result = []
-        count_nonexact_guess = defaultdict(lambda: 0)
-        count_nonexact_solution = defaultdict(lambda: 0)
+def encode_response(response):
+    """Pack a response tuple into an int, one base 3 digit per letter.
 
-        for (letter_solution, letter_guess) in zip(solution, guess):
-            if letter_solution != letter_guess:
-                count_nonexact_solution[letter_solution] += 1
+    The first letter is the least significant digit, and the digit is the
+    LetterState minus one (EXACT=0, SOME=1, NONE=2).
+    """
+    code = 0
+    for state in reversed(response):
+        code = code * 3 + state - 1
+    return code
 
-        for (letter_solution, letter_guess) in zip(solution, guess):
-            if letter_solution == letter_guess:
-                result.append(LetterState.EXACT)
-            elif count_nonexact_guess[letter_guess] < count_nonexact_solution[letter_guess]:
-                result.append(LetterState.SOME)
-                count_nonexact_guess[letter_guess] += 1
-            else:
-                result.append(LetterState.NONE)
 
-        return tuple(result)
+def decode_response(code, letter_count):
+    """Unpack a response code into a tuple of LetterState."""
+    response = []
+    for _ in range(letter_count):
+        code, digit = divmod(code, 3)
+        response.append(digit + 1)
+    return tuple(response)
 
-    eprint(
-        "Could not import fastcheck, was it built with Cython?\n"
-        "You may try building it with: python setup.py build_ext --inplace\n"
-        "and re-installing the package.\n"
-        "Using slower check function."
-    )
+
+def check(guess, solution, letter_count):
+    from wordgame.kernel import check_code
+
+    return decode_response(check_code(guess, solution), letter_count)
 
 
 class GameFinished(Exception):
@@ -61,21 +60,45 @@ class LetterState:
 
 
 class Game:
-    def __init__(self, wordset, tries=6, solution=None):
+    def __init__(self, wordset, tries=6, solution=None, hard=False):
         self.wordset = wordset
         self.tries = tries
+        # In hard mode every guess must use all the hints of previous responses
+        self.hard = hard
         self.solution = solution if solution else random.choice(wordset.solutions)
         self.guesses = []
 
     def guess(self, guess):
         if self.state != State.OPEN:
             raise GameFinished()
-        if guess not in self.wordset.words_set:
+        if guess not in self.wordset.words:
             raise InvalidGuess(guess)
+        if self.hard:
+            unused = self.unused_hint(guess)
+            if unused:
+                raise InvalidGuess(guess, unused)
         response = check(guess, self.solution, self.wordset.letter_count)
         self.guesses.append((guess, response))
         return response
 
+    def unused_hint(self, guess):
+        """Description of the first hint guess does not use, or None if it uses them all.
+
+        Exact letters must stay in place, and letters in the solution must be
+        in the guess at least as many times as they were found.
+        """
+        for (previous, response) in self.guesses:
+            found = Counter()
+            for (p, (letter, state)) in enumerate(zip(previous, response)):
+                if state == LetterState.EXACT and guess[p] != letter:
+                    return f"letter {p + 1} must be {letter}"
+                if state != LetterState.NONE:
+                    found[letter] += 1
+            for (letter, n) in found.items():
+                if guess.count(letter) < n:
+                    return f"must contain {letter}" if n == 1 else f"must contain {n} {letter}"
+        return None
+
     def restart(self):
         self.guesses = []
 
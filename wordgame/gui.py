@@ -1,12 +1,20 @@
+import os
+import queue
 import sys
+import threading
 from tkinter import (
+    BooleanVar,
     Button,
     Canvas,
+    Checkbutton,
     E,
     Frame,
+    HIDDEN,
     HORIZONTAL,
     IntVar,
+    Label,
     N,
+    NORMAL,
     OptionMenu,
     StringVar,
     SW,
@@ -15,7 +23,6 @@ from tkinter import (
 from tkinter.font import Font
 
 from wordgame.game import Game, InvalidGuess, LetterState
-from wordgame.solver import Solver
 from wordgame.words import WORD_SETS
 
 
@@ -35,6 +42,10 @@ KEY_COLORS = {
     LetterState.UNKNOWN: Colors.DEFAULT,
 }
 
+# Milliseconds between two checks for messages of the solver thread
+SOLVER_POLL_MS = 50
+SPINNER = "|/-\\"
+
 XSCALE = 1.75
 YSCALE = 1.75
 
@@ -97,6 +108,7 @@ class GameWidget:
         self.root = root
         self.n_tries_var = IntVar(root, 6)
         self.word_set_var = StringVar(root, "wordle")
+        self.hard_var = BooleanVar(root, False)
         self.game = self.create_game()
 
         self.guesses_canvas = None
@@ -105,13 +117,34 @@ class GameWidget:
         self.reset_guess()
         self.current_cell = 0
         self.invalid_guess = False
-        self.input_cells = []
+        # Canvas items of every letter box by row and column, and of every key
+        # by letter, created once per board layout by reset_canvas
+        self.cells = []
+        self.keys = {}
+        # What each item currently shows, to only update the ones which change
+        self.cell_looks = {}
+        self.key_colors = {}
 
         self.letter_font = Font(size=18)
         self.keyboard_font = Font(size=10)
 
+        # Messages from the running solver thread, None when it is not running
+        self.solver_queue = None
+        # Set to stop the running solver thread, which may outlive its queue
+        self.solver_cancel = None
+        self.solver_thread = None
+        self.solver_game = None
+        self.solver_text = ""
+        self.solver_status = StringVar(root, "")
+        self.solver_button_text = StringVar(root, "SOLVER")
+        self.spinner_step = 0
+
     def create_game(self):
-        return Game(tries=self.n_tries_var.get(), wordset=WORD_SETS[self.word_set_var.get()])
+        return Game(
+            tries=self.n_tries_var.get(),
+            wordset=WORD_SETS[self.word_set_var.get()],
+            hard=self.hard_var.get(),
+        )
 
     @property
     def letter_count(self):
@@ -140,6 +173,23 @@ class GameWidget:
         self.keys_canvas = Canvas(self.keys_frame, width=w + sx(100), height=h + sx(20))
         self.keys_canvas.pack(anchor=SW)
 
+        self.cells = []
+        self.cell_looks = {}
+        for i in range(self.game.tries):
+            row = []
+            for j in range(self.letter_count + 1):
+                box_id, text_id = self.draw_letterbox(i, j)
+                self.guesses_canvas.tag_bind(box_id, "<ButtonPress-1>", self.on_cell_click(i, j))
+                self.guesses_canvas.tag_bind(text_id, "<ButtonPress-1>", self.on_cell_click(i, j))
+                row.append((box_id, text_id))
+            self.cells.append(row)
+
+        self.keys = {}
+        self.key_colors = {}
+        for (i, letter) in enumerate(LETTERS_BY_FREQUENCY):
+            self.keys[letter] = self.draw_key(i // 13, i % 13, letter, Colors.DEFAULT)
+            self.key_colors[letter] = Colors.DEFAULT
+
     def get_coords(self, row, col):
         """Get x, y coords for box at position row, column"""
         x = self.x0 + (self.width + self.x_pad) * col
@@ -165,35 +215,48 @@ class GameWidget:
         return box_id, text_id
 
     def draw_key(self, row, col, letter, color):
+        """draw a keyboard key at given position, return the id of its box."""
         x0, y0 = self.get_keys_coords(row, col)
         x1 = x0 + self.keys_width
         y1 = y0 + self.keys_height
-        self.keys_canvas.create_rectangle(x0, y0, x1, y1, fill=color)
+        box_id = self.keys_canvas.create_rectangle(x0, y0, x1, y1, fill=color)
         self.keys_canvas.create_text(
             (x0 + x1) / 2, (y0 + y1) / 2, text=letter, font=self.keyboard_font
         )
+        return box_id
+
+    def update_letterbox(self, row, col, letter=" ", color=Colors.DEFAULT, state=NORMAL):
+        """Show a letter and color in the letter box at given position."""
+        look = (letter, color, state)
+        if self.cell_looks.get((row, col)) == look:
+            return
+        self.cell_looks[row, col] = look
+        box_id, text_id = self.cells[row][col]
+        self.guesses_canvas.itemconfig(box_id, fill=color, state=state)
+        self.guesses_canvas.itemconfig(text_id, text=letter, state=state)
 
     def draw_keys(self):
         states = self.game.letter_states()
-        for (i, letter) in enumerate(LETTERS_BY_FREQUENCY):
-            row = i // 13
-            col = i % 13
+        for letter in LETTERS_BY_FREQUENCY:
             color = KEY_COLORS[states[letter]]
-            self.draw_key(row, col, letter, color)
+            if self.key_colors[letter] != color:
+                self.key_colors[letter] = color
+                self.keys_canvas.itemconfig(self.keys[letter], fill=color)
 
     def submit_guess(self):
         try:
             self.game.guess("".join(self.current_guess))
             self.reset_guess()
-        except InvalidGuess:
+        except InvalidGuess as e:
             self.invalid_guess = True
+            # Hard mode tells which hint the guess does not use
+            if len(e.args) > 1 and self.solver_queue is None:
+                self.solver_status.set(e.args[1])
+            return
+        if self.solver_queue is None:
+            self.solver_status.set("")
 
     def draw_input_cells(self):
-        for box_id, text_id in self.input_cells:
-            self.guesses_canvas.delete(box_id)
-            self.guesses_canvas.delete(text_id)
-
-        self.input_cells = []
         i = len(self.game.guesses)
         unselected = Colors.WRONG if self.invalid_guess else Colors.DEFAULT
         for j in range(self.letter_count + 1):
@@ -204,19 +267,15 @@ class GameWidget:
             else:
                 letter = self.current_guess[j]
 
-            box_id, text_id = self.draw_letterbox(i, j, color=color, letter=letter)
-            self.input_cells.append((box_id, text_id))
-            self.guesses_canvas.tag_bind(box_id, "<ButtonPress-1>", self.on_input_cell_click(j))
-            self.guesses_canvas.tag_bind(text_id, "<ButtonPress-1>", self.on_input_cell_click(j))
+            self.update_letterbox(i, j, color=color, letter=letter)
 
     def draw_previous_guess(self, i):
         guess, response = self.game.guesses[i]
         for j, (letter, state) in enumerate(zip(guess, response)):
-            self.draw_letterbox(i, j, letter=letter, color=KEY_COLORS[state])
+            self.update_letterbox(i, j, letter=letter, color=KEY_COLORS[state])
+        self.update_letterbox(i, self.letter_count, state=HIDDEN)
 
     def draw_game(self):
-        self.guesses_canvas.delete("all")
-
         n = 0
 
         for i in range(len(self.game.guesses)):
@@ -230,14 +289,17 @@ class GameWidget:
 
         for i in range(n, self.game.tries):
             for j in range(self.letter_count):
-                self.draw_letterbox(i, j)
+                self.update_letterbox(i, j)
+            self.update_letterbox(i, self.letter_count, state=HIDDEN)
 
         self.draw_keys()
 
-    def on_input_cell_click(self, j):
+    def on_cell_click(self, i, j):
         def callback(event):
-            self.current_cell = j
-            self.draw_input_cells()
+            # Only the cells of the input row are selectable
+            if i == len(self.game.guesses) and not self.game.is_finished:
+                self.current_cell = j
+                self.draw_input_cells()
 
         return callback
 
@@ -284,31 +346,127 @@ class GameWidget:
             self.draw_game()
 
     def button_new_game(self):
+        self.cancel_solver()
         self.game = self.create_game()
         self.reset_guess()
         self.reset_canvas()
         self.draw_game()
 
     def button_restart(self):
+        self.cancel_solver()
         self.game.restart()
         self.reset_guess()
         self.draw_game()
 
     def button_undo(self):
+        self.cancel_solver()
         self.undo()
         self.draw_game()
 
     def button_give_up(self):
+        self.cancel_solver()
         if not self.game.is_finished:
             self.game.guess(self.game.solution)
             self.draw_game()
 
     def button_solver(self):
-        if not self.game.is_finished:
-            solver = Solver(self.game)
-            solver.guess()
+        if self.solver_queue is not None:
+            self.cancel_solver()
+        elif not self.game.is_finished:
+            self.start_solver()
+
+    def start_solver(self):
+        """Search the next guess in a background thread, see poll_solver."""
+        game = self.game
+        # The thread works on its own copy of the game, so that the player
+        # can keep typing while it searches
+        snapshot = Game(game.wordset, game.tries, game.solution, game.hard)
+        snapshot.guesses = list(game.guesses)
+        messages = queue.Queue()
+        cancel = threading.Event()
+        previous = self.solver_thread
+
+        def run():
+            try:
+                if previous is not None and previous.is_alive():
+                    # Never search on every CPU twice at once
+                    messages.put(("progress", "Stopping previous search"))
+                    previous.join()
+                if cancel.is_set():
+                    return
+                messages.put(("progress", "Loading words"))
+                # Deferred, the solver and its dependencies are slow to import
+                from wordgame.solver import SearchCancelled, Solver
+
+                solver = Solver(snapshot, workers=os.cpu_count() or 1)
+                solver.cancel_event = cancel
+                messages.put(("progress", f"{solver.n_candidates} possible solutions"))
+                try:
+                    guess, _ = solver.next_guess()
+                except SearchCancelled:
+                    return
+                messages.put(("done", guess))
+            except Exception as e:
+                messages.put(("error", e))
+
+        self.solver_queue = messages
+        self.solver_cancel = cancel
+        self.solver_game = (game, len(game.guesses))
+        self.solver_text = "Solving"
+        self.solver_button_text.set("CANCEL")
+        self.solver_status.set(self.solver_text)
+        self.root.config(cursor="watch")
+        self.solver_thread = threading.Thread(target=run, daemon=True)
+        self.solver_thread.start()
+        self.root.after(SOLVER_POLL_MS, self.poll_solver, messages)
+
+    def poll_solver(self, messages):
+        """Handle the messages of a solver thread, on the Tk event loop."""
+        if messages is not self.solver_queue:
+            # Cancelled, the thread stops at its next check for cancellation
+            # and its result is ignored
+            return
+        try:
+            while True:
+                kind, value = messages.get_nowait()
+                if kind == "progress":
+                    self.solver_text = value
+                elif kind == "done":
+                    self.stop_solver()
+                    self.play_solver_guess(value)
+                    return
+                else:
+                    self.stop_solver()
+                    self.solver_status.set(f"Solver failed: {value}")
+                    return
+        except queue.Empty:
+            pass
+        self.spinner_step = (self.spinner_step + 1) % len(SPINNER)
+        self.solver_status.set(f"{SPINNER[self.spinner_step]} {self.solver_text}")
+        self.root.after(SOLVER_POLL_MS, self.poll_solver, messages)
+
+    def play_solver_guess(self, guess):
+        game, n_guesses = self.solver_game
+        # Ignore the guess if the game changed during the search
+        if game is self.game and len(game.guesses) == n_guesses and not game.is_finished:
+            game.guess(guess)
             self.draw_game()
 
+    def stop_solver(self):
+        self.solver_queue = None
+        self.solver_text = ""
+        self.solver_button_text.set("SOLVER")
+        self.solver_status.set("")
+        self.root.config(cursor="")
+
+    def cancel_solver(self):
+        if self.solver_queue is not None:
+            self.solver_cancel.set()
+            self.stop_solver()
+        else:
+            # Clear the hint of a guess rejected in hard mode
+            self.solver_status.set("")
+
     def destroy(self):
         self.guesses_frame.destroy()
         self.keys_frame.destroy()
@@ -333,10 +491,11 @@ class GameWidget:
             widget.grid(row=button_row, column=0, sticky=N + E)
             button_row += 1
 
-        def menu_button(text, command):
+        def menu_button(text, command, textvariable=None):
             button = Button(
                 self.menu_frame,
                 text=text,
+                textvariable=textvariable,
                 width=button_width,
                 font=button_font,
                 command=command,
@@ -357,11 +516,21 @@ class GameWidget:
         select_wordset.config(width=sx(11), font=button_font)
         menu_grid(select_wordset)
 
+        # Applies from the next new game
+        hard_mode = Checkbutton(
+            self.menu_frame, text="HARD MODE", variable=self.hard_var, font=button_font
+        )
+        menu_grid(hard_mode)
+
         menu_button("RESTART", self.button_restart)
         menu_button("UNDO", self.button_undo)
-        menu_button("SOLVER", self.button_solver)
+        menu_button("SOLVER", self.button_solver, self.solver_button_text)
         menu_button("GIVE UP", self.button_give_up)
         menu_button("QUIT", lambda: sys.exit(0))
+        status = Label(
+            self.menu_frame, textvariable=self.solver_status, width=button_width, font=button_font
+        )
+        menu_grid(status)
 
         # Title
         self.title_frame = Frame(root)
@@ -378,12 +547,16 @@ class GameWidget:
         self.keys_frame.grid(row=3, column=0, columnspan=2)
 
 
-def main():
+def create_window():
     root = Tk()
     root.title("Untitled Word Game")
     game_widget = GameWidget(root)
     game_widget.render()
-    root.mainloop()
+    return root
+
+
+def main():
+    create_window().mainloop()
 
 
 if __name__ == "__main__":
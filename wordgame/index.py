@@ -0,0 +1,90 @@
+from collections import Counter
+
+from wordgame.game import LetterState
+from wordgame.matrix import ids_to_mask
+
+
+class LetterIndex:
+    """Inverted index of a list of words, as bitsets of their ids in the list.
+
+    positions[p][letter] has the words with letter at position p, and
+    at_least[letter][k] the words with at least k of letter, for k from 0 to
+    letter_count + 1.
+    """
+
+    def __init__(self, letter_count, positions, at_least, all_mask):
+        self.letter_count = letter_count
+        self.positions = positions
+        self.at_least = at_least
+        self.all_mask = all_mask
+
+    @classmethod
+    def build(cls, letter_count, words):
+        by_position = [{} for _ in range(letter_count)]
+        by_count = {}
+        for (i, word) in enumerate(words):
+            for (p, letter) in enumerate(word):
+                by_position[p].setdefault(letter, []).append(i)
+            for (letter, n) in Counter(word).items():
+                counts = by_count.setdefault(letter, [[] for _ in range(letter_count + 2)])
+                for k in range(1, n + 1):
+                    counts[k].append(i)
+
+        all_mask = (1 << len(words)) - 1
+        positions = [
+            {letter: ids_to_mask(ids) for (letter, ids) in letters.items()}
+            for letters in by_position
+        ]
+        at_least = {
+            letter: [all_mask] + [ids_to_mask(ids) for ids in counts[1:]]
+            for (letter, counts) in by_count.items()
+        }
+        return cls(letter_count, positions, at_least, all_mask)
+
+    def mask(self, guess, response):
+        """Bitset of the words which, as solution, give this response to this guess.
+
+        response must be one check can return, as from Game.guess.
+        """
+        mask = self.all_mask
+        # Number of letters known to be in the solution, and letters known
+        # not to be there more than that
+        counts = Counter()
+        capped = set()
+        for (p, (letter, state)) in enumerate(zip(guess, response)):
+            at_position = self.positions[p].get(letter, 0)
+            if state == LetterState.EXACT:
+                mask &= at_position
+                counts[letter] += 1
+            else:
+                mask &= ~at_position
+                if state == LetterState.SOME:
+                    counts[letter] += 1
+                else:
+                    capped.add(letter)
+
+        no_word = [0] * (self.letter_count + 2)
+        for (letter, n) in counts.items():
+            mask &= self.at_least.get(letter, no_word)[n]
+        for letter in capped:
+            mask &= ~self.at_least.get(letter, no_word)[counts[letter] + 1]
+        return mask
+
+    def hint_mask(self, guess, response):
+        """Bitset of the words which use every hint of this response to this guess.
+
+        That is the words allowed in hard mode after this guess, by the same
+        rules as Game.unused_hint.
+        """
+        mask = self.all_mask
+        found = Counter()
+        for (p, (letter, state)) in enumerate(zip(guess, response)):
+            if state == LetterState.EXACT:
+                mask &= self.positions[p].get(letter, 0)
+            if state != LetterState.NONE:
+                found[letter] += 1
+
+        no_word = [0] * (self.letter_count + 2)
+        for (letter, n) in found.items():
+            mask &= self.at_least.get(letter, no_word)[n]
+        return mask
@@ -0,0 +1,43 @@
+from collections import defaultdict
+
+from wordgame import eprint
+
+
+def py_check_code(guess, solution):
+    """Pure Python check_code, used when fastcheck was not built."""
+    code = 0
+    place = 1
+    count_nonexact_solution = defaultdict(lambda: 0)
+
+    for (letter_solution, letter_guess) in zip(solution, guess):
+        if letter_solution != letter_guess:
+            count_nonexact_solution[letter_solution] += 1
+
+    for (letter_solution, letter_guess) in zip(solution, guess):
+        if letter_solution == letter_guess:
+            pass
+        elif count_nonexact_solution[letter_guess]:
+            count_nonexact_solution[letter_guess] -= 1
+            code += place
+        else:
+            code += 2 * place
+        place *= 3
+
+    return code
+
+
+try:
+    from wordgame import fastcheck
+    from wordgame.fastcheck import check_code
+
+    eprint("Using compiled fastcheck.")
+except ImportError:
+    fastcheck = None
+    check_code = py_check_code
+
+    eprint(
+        "Could not import fastcheck, was it built with Cython?\n"
+        "You may try building it with: python setup.py build_ext --inplace\n"
+        "and re-installing the package.\n"
+        "Using slower check function."
+    )
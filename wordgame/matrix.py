@@ -0,0 +1,199 @@
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from glob import escape as glob_escape, glob
+
+from wordgame import eprint
+from wordgame.kernel import check_code, fastcheck
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Bump whenever the response codes computed for a word set may change
+KERNEL_VERSION = 1
+
+MAGIC = b"UWGRMX01"
+# magic, cache key, n_guesses, n_solutions
+HEADER = struct.Struct("<8s32sII")
+
+
+def cache_dir():
+    path = os.environ.get("WORDGAME_CACHE_DIR")
+    if not path:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        path = os.path.join(base, "untitled-word-game")
+    return path
+
+
+def cache_key(wordset):
+    """Digest of everything the codes of a word set depend on."""
+    digest = hashlib.sha256()
+    params = f"{KERNEL_VERSION}:{sys.byteorder}:{wordset.letter_count}:{wordset.top_n}\n"
+    digest.update(params.encode("ascii"))
+    digest.update(wordset.encoded)
+    return digest.digest()
+
+
+def cache_name(wordset, variant=None):
+    """Prefix of the cache files of a word set, or of a variant of its files."""
+    return wordset.name if variant is None else f"{wordset.name}.{variant}"
+
+
+def cache_path(wordset, key, ext="matrix", variant=None):
+    return os.path.join(cache_dir(), f"{cache_name(wordset, variant)}-{key.hex()[:16]}.{ext}")
+
+
+def remove_stale(wordset, path, variant=None):
+    """Remove cache files of wordset with the same extension and variant as path, except path."""
+    ext = os.path.splitext(path)[1]
+    pattern = f"{glob_escape(cache_name(wordset, variant))}-*{ext}"
+    for stale in glob(os.path.join(os.path.dirname(path), pattern)):
+        if stale != path:
+            os.remove(stale)
+
+
+def write_atomic(path, *chunks, mode=None):
+    """Write chunks of bytes to path through a temporary file.
+
+    The file is only readable by its owner, unless given other permissions
+    with mode.
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def ids_to_mask(ids):
+    """Bitset int with bit i set for each i in ids."""
+    ids = list(ids)
+    bits = bytearray((max(ids, default=-1) >> 3) + 1)
+    for i in ids:
+        bits[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(bits, "little")
+
+
+def mask_to_ids(mask):
+    """Sorted list of the bits set in a bitset int."""
+    ids = []
+    for (i, byte) in enumerate(mask.to_bytes((mask.bit_length() + 7) >> 3, "little")):
+        while byte:
+            low = byte & -byte
+            ids.append((i << 3) + low.bit_length() - 1)
+            byte ^= low
+    return ids
+
+
+def max_code(codes):
+    """Largest of a buffer of response codes, 0 if empty."""
+    if np is not None:
+        codes = np.frombuffer(codes, dtype=np.uint16)
+        return int(codes.max()) if len(codes) else 0
+    if fastcheck:
+        return fastcheck.max_code(codes)
+    return max(codes, default=0)
+
+
+def mask_count(mask):
+    return bin(mask).count("1")
+
+
+class ResponseMatrix:
+    """Response codes for every (guess, solution) pair of a word set.
+
+    Row g holds the codes of wordset.words[g] checked against each of
+    wordset.solutions, in order.
+    """
+
+    def __init__(self, letter_count, n_guesses, n_solutions, codes):
+        self.n_codes = 3 ** letter_count
+        self.n_guesses = n_guesses
+        self.n_solutions = n_solutions
+        self.codes = codes
+        self._view = memoryview(codes)
+        self._array = None
+
+    @classmethod
+    def build(cls, wordset):
+        letter_count = wordset.letter_count
+        solutions = wordset.solutions
+        codes = array("H")
+        if fastcheck:
+            encoded_solutions = wordset.encoded[: len(solutions) * letter_count]
+            for guess_id in range(len(wordset.words)):
+                guess = wordset.encoded_word(guess_id)
+                codes.extend(fastcheck.check_many(guess, encoded_solutions))
+        else:
+            for guess in wordset.words:
+                codes.extend(check_code(guess, soln) for soln in solutions)
+        return cls(letter_count, len(wordset.words), len(solutions), codes)
+
+    @classmethod
+    def load(cls, wordset):
+        """Map the cached matrix of a word set, building and caching it if needed."""
+        key = cache_key(wordset)
+        path = cache_path(wordset, key)
+        try:
+            return cls.open(path, wordset, key)
+        except (OSError, ValueError) as e:
+            if not isinstance(e, FileNotFoundError):
+                eprint(f"Ignoring invalid response matrix cache {path}: {e}")
+
+        eprint(f"Building response matrix for {wordset.name}...")
+        matrix = cls.build(wordset)
+        try:
+            matrix.save(path, key)
+            remove_stale(wordset, path)
+        except OSError as e:
+            eprint(f"Could not cache response matrix: {e}")
+        return matrix
+
+    @classmethod
+    def open(cls, path, wordset, key):
+        n_guesses = len(wordset.words)
+        n_solutions = len(wordset.solutions)
+        with open(path, "rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(data) != HEADER.size + 2 * n_guesses * n_solutions:
+            raise ValueError("wrong file size")
+        header = HEADER.unpack_from(data)
+        if header != (MAGIC, key, n_guesses, n_solutions):
+            raise ValueError("wrong header")
+        codes = memoryview(data)[HEADER.size :].cast("H")
+        # The kernels index histograms with the codes, a corrupt body must
+        # not reach them
+        if max_code(codes) >= 3 ** wordset.letter_count:
+            raise ValueError("response code out of range")
+        return cls(wordset.letter_count, n_guesses, n_solutions, codes)
+
+    def save(self, path, key):
+        header = HEADER.pack(MAGIC, key, self.n_guesses, self.n_solutions)
+        write_atomic(path, header, self.codes)
+
+    @property
+    def array(self):
+        """2D NumPy view of the codes, sharing their memory."""
+        if self._array is None:
+            self._array = np.frombuffer(self.codes, dtype=np.uint16).reshape(
+                self.n_guesses, self.n_solutions
+            )
+        return self._array
+
+    def row(self, guess_id):
+        start = guess_id * self.n_solutions
+        return self._view[start : start + self.n_solutions]
@@ -0,0 +1,205 @@
+import argparse
+import hashlib
+import json
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import as_completed, ProcessPoolExecutor
+
+from wordgame import eprint
+from wordgame.matrix import cache_path, write_atomic
+from wordgame.words import WORD_SETS
+
+# Bump whenever the guesses picked by Solver.best_guess may change
+OPENINGS_VERSION = 1
+
+# Generated by word-solver-openings, shipped with the package
+TABLE_PATH = os.path.join(os.path.dirname(__file__), "words", "openings.json")
+
+# Guesses scored per task, and per checkpoint
+CHUNK_SIZE = 512
+
+
+def opening_key(wordset):
+    """Digest of everything the best first guess of a word set depends on."""
+    params = f"{OPENINGS_VERSION}:{wordset.letter_count}:{wordset.top_n}\n"
+    digest = hashlib.sha256(params.encode("ascii"))
+    digest.update(wordset.encoded)
+    return digest.digest()
+
+
+def load_table(path=TABLE_PATH):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        eprint(f"Ignoring invalid openings table {path}: {e}")
+        return {}
+
+
+def table_entry(wordset):
+    """Openings of a word set in the openings table, or None if missing or stale.
+
+    The entry holds the first guess, its score, and if generated the best
+    second guess by response code to the first guess, in second_guesses.
+    """
+    entry = load_table().get(wordset.name)
+    if entry and entry["key"] == opening_key(wordset).hex():
+        return entry
+    return None
+
+
+def score_chunk(task):
+    """Best (guess id, score) as first guess among a range of ids, in a worker process."""
+    from wordgame.game import Game
+    from wordgame.solver import GuessCache, Solver
+
+    words, start, stop = task
+    wordset = WORD_SETS[words]
+    game = Game(wordset, solution=wordset.solutions[0])
+    solver = Solver(game, cache=GuessCache(0), use_tree=False)
+    return start, solver.best_guess(range(start, stop))
+
+
+def second_guess(task):
+    """Best guess after the first one, for one response, in a worker process."""
+    from wordgame.game import Game
+    from wordgame.solver import GuessCache, Solver
+
+    words, code, candidates = task
+    wordset = WORD_SETS[words]
+    game = Game(wordset, solution=wordset.solutions[candidates[0]])
+    solver = Solver(game, cache=GuessCache(0), use_tree=False)
+    solver.candidates = candidates
+    return code, solver.find_guess()
+
+
+def load_checkpoint(path):
+    """Best (guess id, score) by first guess id of every chunk already scored."""
+    try:
+        with open(path) as f:
+            checkpoint = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if checkpoint.get("chunk_size") != CHUNK_SIZE:
+        return {}
+    return {int(start): tuple(best) for (start, best) in checkpoint["done"].items()}
+
+
+def save_checkpoint(path, done):
+    checkpoint = {"chunk_size": CHUNK_SIZE, "done": done}
+    write_atomic(path, json.dumps(checkpoint).encode("ascii"))
+
+
+def compute_first_guess(words, executor=None):
+    """Best first guess of a word set and its score, resuming from a checkpoint."""
+    wordset = WORD_SETS[words]
+    key = opening_key(wordset)
+    path = cache_path(wordset, key, "openings")
+    done = load_checkpoint(path)
+
+    n_guesses = len(wordset.words)
+    tasks = [
+        (words, start, min(start + CHUNK_SIZE, n_guesses))
+        for start in range(0, n_guesses, CHUNK_SIZE)
+        if start not in done
+    ]
+    if tasks:
+        # Build or map the response matrix once, before workers need it
+        wordset.response_matrix
+    if executor:
+        futures = [executor.submit(score_chunk, task) for task in tasks]
+        results = (future.result() for future in as_completed(futures))
+    else:
+        results = map(score_chunk, tasks)
+    for (start, best) in results:
+        done[start] = best
+        save_checkpoint(path, done)
+
+    # Same tie-break as Solver, every solution is a candidate
+    n_solutions = len(wordset.solutions)
+    guess_id, score = min(done.values(), key=lambda b: (b[1], b[0] >= n_solutions, b[0]))
+    os.remove(path)
+    return wordset.words[guess_id], score
+
+
+def compute_second_guesses(words, first_guess, executor=None, jobs=1):
+    """Best second guess of a word set by response code to first_guess."""
+    wordset = WORD_SETS[words]
+    row = wordset.response_matrix.row(wordset.word_id(first_guess))
+    partitions = defaultdict(list)
+    for i in range(len(wordset.solutions)):
+        partitions[row[i]].append(i)
+    # All letters exact, solved
+    partitions.pop(0, None)
+
+    tasks = [(words, code, candidates) for (code, candidates) in sorted(partitions.items())]
+    if executor:
+        chunksize = max(1, len(tasks) // (4 * jobs))
+        results = executor.map(second_guess, tasks, chunksize=chunksize)
+    else:
+        results = map(second_guess, tasks)
+    return dict(results)
+
+
+def save_table(table, path):
+    data = json.dumps(table, indent=2, sort_keys=True) + "\n"
+    # Shipped with the package, readable by every user of an install
+    write_atomic(path, data.encode("ascii"), mode=0o644)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compute the best first and second guesses of word sets, for the openings table."
+    )
+    parser.add_argument("-w", "--words", choices=WORD_SETS.keys(), action="append")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=0,
+        help="number of worker processes, 0 for one per CPU (default: 0)",
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="recompute word sets which are up to date"
+    )
+    parser.add_argument("-o", "--output", default=TABLE_PATH, help="openings table to update")
+    args = parser.parse_args()
+
+    jobs = args.jobs or os.cpu_count() or 1
+    table = load_table(args.output)
+    executor = ProcessPoolExecutor(jobs) if jobs > 1 else None
+    try:
+        for words in args.words or WORD_SETS.keys():
+            wordset = WORD_SETS[words]
+            key = opening_key(wordset).hex()
+            entry = table.get(wordset.name)
+            if not entry or entry["key"] != key or args.force:
+                start_time = time.time()
+                first_guess, score = compute_first_guess(words, executor)
+                elapsed = time.time() - start_time
+                entry = table[wordset.name] = {
+                    "key": key,
+                    "first_guess": first_guess,
+                    "score": score,
+                }
+                save_table(table, args.output)
+                print(f"{words}: first guess {first_guess}, score {score}, in {elapsed:.1f}s.")
+            if "second_guesses" not in entry:
+                start_time = time.time()
+                second_guesses = compute_second_guesses(words, entry["first_guess"], executor, jobs)
+                elapsed = time.time() - start_time
+                entry["second_guesses"] = {str(code): g for (code, g) in second_guesses.items()}
+                save_table(table, args.output)
+                print(f"{words}: {len(second_guesses)} second guesses, in {elapsed:.1f}s.")
+            else:
+                print(f"{words}: up to date.")
+    finally:
+        if executor:
+            executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import numpy as np
+
+from wordgame.strategy import DEFAULT, ENTROPY_SCALE
+
+# Upper bound on the number of histogram bins (and codes) per bincount call
+CHUNK_SIZE = 1 << 22
+
+# Metric name to its value for every row of a histogram of partition sizes
+METRICS = {
+    "squares": lambda counts: (counts * counts).sum(axis=1),
+    "entropy": lambda counts: (
+        np.floor(counts * np.log(np.maximum(counts, 1)) * ENTROPY_SCALE + 0.5) / ENTROPY_SCALE
+    ).sum(axis=1),
+    "worst": lambda counts: counts.max(axis=1),
+    "buckets": lambda counts: -np.count_nonzero(counts, axis=1),
+}
+
+
+def strategy_scores(counts, strategy):
+    """Score of every row of a histogram of partition sizes."""
+    if strategy.is_squares:
+        return METRICS["squares"](counts)
+    return sum(weight * METRICS[m](counts) for m, weight in strategy.weights.items())
+
+
+def partition_scores(codes, guess_ids, candidates, n_codes, strategy=DEFAULT):
+    """Score of the partition of candidates, for every guess id (row of codes)."""
+    guess_ids = np.asarray(guess_ids, dtype=np.intp)
+    candidates = np.asarray(candidates, dtype=np.intp)
+    n_rows, n_candidates = len(guess_ids), len(candidates)
+    scores = np.empty(n_rows, dtype=np.int64 if strategy.is_squares else np.float64)
+    chunk = max(1, CHUNK_SIZE // max(n_codes, n_candidates))
+    offsets = np.arange(chunk, dtype=np.int64)[:, None] * n_codes
+    for start in range(0, n_rows, chunk):
+        # Only copy one chunk of rows out of the matrix at a time
+        block = codes[np.ix_(guess_ids[start : start + chunk], candidates)]
+        rows = block.shape[0]
+        keys = (block + offsets[:rows]).ravel()
+        counts = np.bincount(keys, minlength=rows * n_codes).reshape(rows, n_codes)
+        scores[start : start + rows] = strategy_scores(counts, strategy)
+    return scores
+
+
+def best_guess(codes, guess_ids, candidates, n_codes, strategy=DEFAULT):
+    """Id and score of the best of sorted guess_ids, with the same tie-break as Solver."""
+    guess_ids = np.asarray(guess_ids, dtype=np.intp)
+    candidates = np.asarray(candidates, dtype=np.intp)
+    scores = partition_scores(codes, guess_ids, candidates, n_codes, strategy)
+    best_score = scores.min().item()
+    ties = guess_ids[np.flatnonzero(scores == best_score)]
+    # Favor a guess which is a potential solution
+    is_candidate = np.isin(ties, candidates)
+    if is_candidate.any():
+        return int(ties[is_candidate.argmax()]), best_score
+    return int(ties[0]), best_score
@@ -1,96 +1,789 @@
 import argparse
+import hashlib
+import json
+import os
+import sys
 import time
-from collections import defaultdict
+from array import array
+from collections import Counter, defaultdict, deque, namedtuple, OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import lru_cache
+from itertools import islice
+from threading import Lock
 
-from wordgame.game import check, Game, State
+from wordgame.game import encode_response, Game, State
+from wordgame.kernel import fastcheck
+from wordgame.matrix import ids_to_mask, mask_count, mask_to_ids
+from wordgame.strategy import DEFAULT, METRICS, Strategy
 from wordgame.words import WORD_SETS
 
+try:
+    import numpy as np
+
+    from wordgame import scoring
+except ImportError:
+    np = None
+    scoring = None
+
+# Target words sent at once to a worker process in batch mode
+BATCH_SIZE = 64
+
+# Guesses scored between two checks for cancellation, see Solver.cancel_event
+CANCEL_CHUNK_SIZE = 1024
+
+
+class SearchCancelled(Exception):
+    pass
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+# One solver move. source is how the guess was picked: "first" (the word set's
+# first guess), "tree" (decision tree), "book" (the word set's second guesses),
+# "cache" (guess cache) or "search".
+# responses counts the guess/solution responses the search looked up or
+# computed, an upper bound when branch and bound cut scoring short. Times are
+# in seconds.
+MoveStats = namedtuple(
+    "MoveStats",
+    [
+        "turn",
+        "guess",
+        "source",
+        "candidates_before",
+        "candidates_after",
+        "guesses_scored",
+        "responses",
+        "find_time",
+        "filter_time",
+    ],
+)
+
+StatsSummary = namedtuple(
+    "StatsSummary",
+    [
+        "turn",
+        "moves",
+        "avg_candidates",
+        "avg_find_ms",
+        "avg_filter_ms",
+        "responses",
+        "sources",
+    ],
+)
+
+
+class SolverStats:
+    """Moves recorded by solvers, possibly over many games."""
+
+    def __init__(self, moves=()):
+        self.moves = list(moves)
+
+    def add(self, stats):
+        self.moves.extend(stats.moves)
+
+    def summary(self):
+        """Get a StatsSummary per turn, then one over all turns with turn None."""
+        by_turn = defaultdict(list)
+        for move in self.moves:
+            by_turn[move.turn].append(move)
+
+        def summarize(turn, moves):
+            n = len(moves)
+            return StatsSummary(
+                turn,
+                n,
+                sum(m.candidates_before for m in moves) / n,
+                1000 * sum(m.find_time for m in moves) / n,
+                1000 * sum(m.filter_time for m in moves) / n,
+                sum(m.responses for m in moves),
+                Counter(m.source for m in moves),
+            )
+
+        rows = [summarize(turn, by_turn[turn]) for turn in sorted(by_turn)]
+        if self.moves:
+            rows.append(summarize(None, self.moves))
+        return rows
+
+    def print_summary(self):
+        print("Turn    Moves  Candidates  Find ms  Filter ms   Responses  Sources")
+        for row in self.summary():
+            turn = "all" if row.turn is None else row.turn
+            sources = ", ".join(f"{source} {n}" for source, n in sorted(row.sources.items()))
+            print(
+                f"{turn:>4} {row.moves:8d} {row.avg_candidates:11.1f} {row.avg_find_ms:8.3f} "
+                f"{row.avg_filter_ms:10.3f} {row.responses:11d}  {sources}"
+            )
+
+
+class GuessCache:
+    """Bounded cache of find_guess results, keyed by word set and candidates.
+
+    Eviction policy is "lru" (least recently used) or "fifo" (first in,
+    first out). A maxsize of 0 disables caching.
+    """
+
+    POLICIES = ("lru", "fifo")
+
+    def __init__(self, maxsize=4096, policy="lru"):
+        self.lock = Lock()
+        self.entries = OrderedDict()
+        self.configure(maxsize, policy)
+
+    def configure(self, maxsize, policy="lru"):
+        if policy not in self.POLICIES:
+            raise ValueError(f"unknown eviction policy: {policy}")
+        with self.lock:
+            self.maxsize = maxsize
+            self.policy = policy
+            self.hits = 0
+            self.misses = 0
+            self.entries.clear()
+
+    @staticmethod
+    def key(wordset, candidate_mask, strategy=DEFAULT, legal_mask=None):
+        """Compact fingerprint of a solver state.
+
+        legal_mask is the bitset of the guesses allowed in hard mode, None
+        when not in hard mode.
+        """
+        n_bytes = (len(wordset.solutions) + 7) >> 3
+        digest = hashlib.blake2b(candidate_mask.to_bytes(n_bytes, "little"), digest_size=16)
+        if legal_mask is not None:
+            n_bytes = (len(wordset.words) + 7) >> 3
+            digest.update(legal_mask.to_bytes(n_bytes, "little"))
+        return wordset.name, strategy.name, digest.digest()
+
+    def get(self, key):
+        with self.lock:
+            guess = self.entries.get(key)
+            if guess is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                if self.policy == "lru":
+                    self.entries.move_to_end(key)
+            return guess
+
+    def put(self, key, guess):
+        with self.lock:
+            if not self.maxsize:
+                return
+            self.entries[key] = guess
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def info(self):
+        with self.lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self.entries))
+
+
+# Shared by all solvers in the process
+guess_cache = GuessCache()
+
+
+def configure_guess_cache(maxsize, policy="lru"):
+    """Configure the guess cache of the process, as worker process initializer.
+
+    Unlike the bound method, it can be pickled for spawned worker processes.
+    """
+    guess_cache.configure(maxsize, policy)
+
+
+@lru_cache(maxsize=None)
+def guess_order(wordset):
+    """Guess ids sorted by how common their distinct letters are among solutions."""
+    words = wordset.words
+    letter_counts = Counter(letter for soln in wordset.solutions for letter in set(soln))
+
+    def strength(guess):
+        return sum(letter_counts[letter] for letter in set(words[guess]))
+
+    return sorted(range(len(words)), key=strength, reverse=True)
+
 
 class Solver:
-    def __init__(self, game):
+    def __init__(self, game, workers=1, cache=None, use_tree=True, stats=None, strategy=None):
         self.game = game
-        self.possible_solutions = game.wordset.solutions[:]
-        self.first_guess = True
+        # How guesses are scored, see wordgame.strategy
+        self.strategy = strategy or DEFAULT
+        # Number of threads find_guess splits the guess pool across
+        self.workers = workers
+        self.cache = cache if cache is not None else guess_cache
+        # Skip guesses as soon as they cannot beat the best one found so far,
+        # when scoring guesses one at a time
+        self.branch_and_bound = True
+        # Only score guesses which may be picked, see guess_pool
+        self.prune = True
+        self.matrix = game.wordset.response_matrix
+        # Bitset of the solution ids still possible
+        self.candidate_mask = (1 << len(game.wordset.solutions)) - 1
+        # Bitset of the guess ids allowed by hard mode, None if not in hard mode
+        self.legal_mask = (1 << len(game.wordset.words)) - 1 if game.hard else None
+        # The decision tree and second guesses may break hard mode rules
+        use_tree = use_tree and not game.hard
+        self.tree = game.wordset.decision_tree(self.strategy) if use_tree else None
+        # Current node in the decision tree, None once the game left it
+        self.tree_node = self.tree.root if self.tree else None
+        # The word set's first guess is the best one for the default strategy only
+        self.first_guess = self.strategy == DEFAULT
+        # SolverStats recording every move, None to not measure anything
+        self.stats = stats
+        # Guesses scored and responses used by searches, for the current move
+        self.searched = [0, 0]
+        # threading.Event set from another thread to stop a running search,
+        # which then raises SearchCancelled. None if searches cannot be cancelled.
+        self.cancel_event = None
         # Take into account pre-existing guesses on the game
         for (guess, response) in game.guesses:
             self.first_guess = False
             self.filter_solutions(guess, response)
 
+    @property
+    def candidate_mask(self):
+        return self._candidate_mask
+
+    @candidate_mask.setter
+    def candidate_mask(self, mask):
+        self._candidate_mask = mask
+        self._candidates = None
+
+    @property
+    def candidates(self):
+        """Sorted list of the solution ids still possible."""
+        if self._candidates is None:
+            self._candidates = mask_to_ids(self._candidate_mask)
+        return self._candidates
+
+    @candidates.setter
+    def candidates(self, ids):
+        self.candidate_mask = ids_to_mask(ids)
+
+    @property
+    def legal_mask(self):
+        return self._legal_mask
+
+    @legal_mask.setter
+    def legal_mask(self, mask):
+        self._legal_mask = mask
+        self._legal_ids = None
+
+    @property
+    def legal_ids(self):
+        """Sorted list of the guess ids allowed by hard mode, or of all of them."""
+        if self._legal_mask is None:
+            return range(len(self.game.wordset.words))
+        if self._legal_ids is None:
+            self._legal_ids = mask_to_ids(self._legal_mask)
+        return self._legal_ids
+
+    @property
+    def n_candidates(self):
+        return mask_count(self._candidate_mask)
+
+    @property
+    def possible_solutions(self):
+        solutions = self.game.wordset.solutions
+        return [solutions[i] for i in self.candidates]
+
     def filter_solutions(self, guess, response):
-        self.possible_solutions = [
-            soln
-            for soln in self.possible_solutions
-            if check(guess, soln, self.game.wordset.letter_count) == response
-        ]
+        wordset = self.game.wordset
+        self.candidate_mask &= wordset.index.mask(guess, response)
+        if self.legal_mask is not None:
+            self.legal_mask &= wordset.guess_index.hint_mask(guess, response)
+        if self.tree_node is not None:
+            code = encode_response(response)
+            self.tree_node = self.tree.child(self.tree_node, wordset.word_id(guess), code)
 
     def find_guess(self):
-        best_guess = self.game.wordset.words[0]
-        best_score = self.compute_score(best_guess)
-        for guess in self.game.wordset.words[1:]:
-            score = self.compute_score(guess)
+        key = self.cache.key(self.game.wordset, self.candidate_mask, self.strategy, self.legal_mask)
+        guess = self.cache.get(key)
+        if guess is None:
+            guess = self._search_guess()
+            self.cache.put(key, guess)
+        return guess
+
+    def guess_pool(self):
+        """Sorted ids of the guesses which may be the best one.
+
+        A letter absent from every candidate gets the same response wherever
+        it is in a guess, without changing the response of other letters.
+        Guesses which only differ by the absent letters they have at some
+        positions thus partition the candidates the same way, and get the
+        same score whatever the strategy. Only the one which ranks first by
+        the tie-break of _pick_best is kept.
+
+        With two candidates or less, guessing the first one leaves no
+        ambiguity, no other guess can rank before it.
+
+        In hard mode only the guesses allowed are considered. The candidates
+        use every hint by definition, so they always are.
+        """
+        wordset = self.game.wordset
+        candidates = self.candidates
+        legal_ids = self.legal_ids
+        if not self.prune:
+            return legal_ids
+        if 0 < len(candidates) <= 2:
+            return candidates[:1]
+
+        if fastcheck and np is None:
+            # Grouping guesses in Python costs about what it saves the compiled search
+            return legal_ids
+
+        letter_count = wordset.letter_count
+        present = set(b"".join(wordset.encoded_word(i) for i in candidates))
+        absent = bytes(b for b in range(ord("a"), ord("z") + 1) if b not in present)
+        if not absent:
+            return legal_ids
+
+        # Replace absent letters with "_"
+        signatures = bytes(wordset.encoded).translate(bytes.maketrans(absent, b"_" * len(absent)))
+        if np is not None:
+            # Words have 8 letters at most, make each signature an integer
+            letters = np.frombuffer(signatures, dtype=np.uint8).reshape(-1, letter_count)
+            keys = np.zeros((len(letters), 8), dtype=np.uint8)
+            keys[:, :letter_count] = letters
+            keys = keys.view(np.uint64).ravel()
+            # Candidates first, so that np.unique picks them over other guesses
+            order = np.concatenate(
+                (np.asarray(candidates, dtype=np.intp), np.asarray(legal_ids, dtype=np.intp))
+            )
+            _, first = np.unique(keys[order], return_index=True)
+            return np.sort(order[first]).tolist()
+
+        signatures = [
+            signatures[i : i + letter_count] for i in range(0, len(signatures), letter_count)
+        ]
+        # First candidate, or else first guess, with each signature
+        first = {signatures[i]: i for i in reversed(legal_ids)}
+        for i in reversed(candidates):
+            first[signatures[i]] = i
+        return sorted(first.values())
+
+    def _search_guess(self):
+        guess_ids = self.guess_pool()
+        n_guesses = len(guess_ids)
+        self.searched[0] += n_guesses
+        self.searched[1] += n_guesses * len(self.candidates)
+        if n_guesses == 1:
+            return self.game.wordset.words[guess_ids[0]]
+        best_guess, _ = self.best_guess(guess_ids)
+        return self.game.wordset.words[best_guess]
+
+    def best_guess(self, guess_ids):
+        """Get the best (guess id, score) among sorted guess ids, on self.workers threads.
+
+        With a cancel_event, guesses are scored in chunks, checking it before
+        each one.
+        """
+        if self.cancel_event is None:
+            return self._best_guess(guess_ids)
+        best_per_chunk = []
+        for start in range(0, len(guess_ids), CANCEL_CHUNK_SIZE):
+            if self.cancel_event.is_set():
+                raise SearchCancelled()
+            best_per_chunk.append(self._best_guess(guess_ids[start : start + CANCEL_CHUNK_SIZE]))
+        return self._pick_best(best_per_chunk)
+
+    def _best_guess(self, guess_ids):
+        if fastcheck:
+            # Compiled search over the response matrix, bounded per thread for squares
+            return fastcheck.best_guess(
+                self.matrix.codes,
+                self.matrix.n_solutions,
+                array("i", guess_ids),
+                array("i", self.candidates),
+                self.matrix.n_codes,
+                self.workers,
+                None if self.strategy.is_squares else array("d", self.strategy.weight_vector),
+            )
+
+        n_guesses = len(guess_ids)
+        if self.workers > 1:
+            size = -(-n_guesses // self.workers)
+            chunks = [guess_ids[i : i + size] for i in range(0, n_guesses, size)]
+            with ThreadPoolExecutor(self.workers) as executor:
+                best_per_chunk = list(executor.map(self._find_best_in, chunks))
+        else:
+            best_per_chunk = [self._find_best_in(guess_ids)]
+        return self._pick_best(best_per_chunk)
+
+    def _find_best_in(self, guess_ids):
+        """Get the best (guess id, score) among sorted guess ids."""
+        if scoring:
+            return scoring.best_guess(
+                self.matrix.array, guess_ids, self.candidates, self.matrix.n_codes, self.strategy
+            )
+
+        # The bounds only hold for the sum of squares
+        if self.branch_and_bound and self.strategy.is_squares:
+            return self._bound_best_in(guess_ids)
+
+        score_guess = self._guess_scorer()
+        return self._pick_best((guess, score_guess(guess)) for guess in guess_ids)
+
+    def _bound_best_in(self, guess_ids):
+        """Branch and bound version of _find_best_in.
+
+        The best guess has the lowest (score, is not a candidate, guess id),
+        which is what _pick_best selects, so guesses can be scored in any
+        order. Guesses likely to score well are scored first, and scoring a
+        guess stops once it is sure to rank after the best one so far.
+        """
+        candidates = set(self.candidates)
+        score_guess = self._guess_scorer()
+        best = None
+        for guess in self._guess_order(guess_ids):
+            rank = (guess not in candidates, guess)
+            if best is None:
+                limit = None
+            elif rank < best[1:]:
+                limit = best[0]
+            else:
+                limit = best[0] - 1
+            score = score_guess(guess, limit)
+            if score is not None and (best is None or (score, *rank) < best):
+                best = (score, *rank)
+        return best[2], best[0]
+
+    def _guess_order(self, guess_ids):
+        """Order guess ids from likely strong to likely weak guesses."""
+        order = guess_order(self.game.wordset)
+        if len(guess_ids) == len(order):
+            return order
+        guess_ids = set(guess_ids)
+        return [guess for guess in order if guess in guess_ids]
+
+    def _pick_best(self, scored_guesses):
+        """Reduce (guess id, score) pairs, in guess id order, to the best one."""
+        candidates = set(self.candidates)
+        scored_guesses = iter(scored_guesses)
+        best_guess, best_score = next(scored_guesses)
+        for guess, score in scored_guesses:
             # Favor a guess which is a potential solution
-            if (
-                score == best_score
-                and guess in self.possible_solutions
-                and best_guess not in self.possible_solutions
-            ):
+            if score == best_score and guess in candidates and best_guess not in candidates:
                 best_guess = guess
             elif score < best_score:
                 best_guess, best_score = guess, score
-        return best_guess
+        return best_guess, best_score
 
     def compute_score(self, guess):
-        results = defaultdict(lambda: 0)
-        for soln in self.possible_solutions:
-            response = check(guess, soln, self.game.wordset.letter_count)
-            results[response] += 1
+        return self._guess_scorer()(self.game.wordset.word_id(guess))
 
-        return sum(n ** 2 for n in results.values())
+    def _guess_scorer(self):
+        """Get a function scoring a guess id against the possible solutions.
 
-    def guess(self):
+        If a limit is given and the strategy is the sum of squares, the
+        function returns None as soon as the score is known to be greater
+        than limit.
+        """
+        wordset = self.game.wordset
+        if not self.strategy.is_squares:
+
+            def score_guess(guess_id, limit=None):
+                row = self.matrix.row(guess_id)
+                return self.strategy.score(Counter(row[i] for i in self.candidates).values())
+
+        elif fastcheck:
+            encoded_candidates = b"".join(wordset.encoded_word(i) for i in self.candidates)
+
+            def score_guess(guess_id, limit=None):
+                return fastcheck.score_guess(
+                    wordset.encoded_word(guess_id),
+                    encoded_candidates,
+                    -1 if limit is None else limit,
+                )
+
+        else:
+
+            def score_guess(guess_id, limit=None):
+                if limit is None:
+                    results = defaultdict(lambda: 0)
+                    row = self.matrix.row(guess_id)
+                    for i in self.candidates:
+                        results[row[i]] += 1
+
+                    return sum(n ** 2 for n in results.values())
+
+                results = defaultdict(lambda: 0)
+                row = self.matrix.row(guess_id)
+                # Every remaining candidate adds at least 1
+                bound = len(self.candidates)
+                for i in self.candidates:
+                    n = results[row[i]]
+                    results[row[i]] = n + 1
+                    # (n + 1) ** 2 - n ** 2 - 1 == 2n
+                    bound += 2 * n
+                    if bound > limit:
+                        return None
+
+                return bound
+
+        return score_guess
+
+    def next_guess(self):
+        """Pick the next guess without playing it, and how it was picked.
+
+        See MoveStats for the possible sources.
+        """
+        self.searched = [0, 0]
         # Precomputed best first move
         if self.first_guess:
-            guess = self.game.wordset.first_guess
             self.first_guess = False
-        else:
-            guess = self.find_guess()
+            return self.game.wordset.first_guess, "first"
+        if self.tree_node is not None:
+            return self.game.wordset.words[self.tree.guess(self.tree_node)], "tree"
+        guess = self.book_guess()
+        if guess:
+            return guess, "book"
+        guess = self.find_guess()
+        return guess, "search" if self.searched[0] else "cache"
+
+    def book_guess(self):
+        """Precomputed second guess after the word set's first guess, or None."""
+        wordset = self.game.wordset
+        if len(self.game.guesses) != 1 or self.strategy != DEFAULT or self.game.hard:
+            return None
+        ((guess, response),) = self.game.guesses
+        if guess != wordset.first_guess:
+            return None
+        return wordset.second_guesses.get(encode_response(response))
+
+    def guess(self):
+        stats = self.stats
+        if stats is not None:
+            candidates_before = self.n_candidates
+            start = time.perf_counter()
+
+        guess, source = self.next_guess()
+        if stats is None:
+            response = self.game.guess(guess)
+            self.filter_solutions(guess, response)
+            return
+
+        find_time = time.perf_counter() - start
         response = self.game.guess(guess)
+        start = time.perf_counter()
         self.filter_solutions(guess, response)
+        filter_time = time.perf_counter() - start
+        stats.moves.append(
+            MoveStats(
+                len(self.game.guesses),
+                guess,
+                source,
+                candidates_before,
+                self.n_candidates,
+                *self.searched,
+                find_time,
+                filter_time,
+            )
+        )
+
+
+def solve(wordset, solution, workers=1, stats=None, strategy=None, hard=False):
+    game = Game(wordset, solution=solution, hard=hard)
+    solver = Solver(game, workers, stats=stats, strategy=strategy)
+    while game.state == State.OPEN:
+        solver.guess()
+    return game
+
+
+def solve_trial(trial):
+    """Solve one benchmark puzzle, in a worker process."""
+    words, solution, workers, collect_stats, strategy, hard = trial
+    stats = SolverStats() if collect_stats else None
+    before = guess_cache.info()
+    game = solve(WORD_SETS[words], solution, workers, stats, strategy, hard)
+    after = guess_cache.info()
+    cache_hits, cache_misses = after.hits - before.hits, after.misses - before.misses
+    return len(game.guesses), game.state == State.SOLVED, cache_hits, cache_misses, stats
+
+
+def solve_target(words, target, workers=1, strategy=None, hard=False):
+    """Solve for one target word, as a dict ready to be written as JSON."""
+    wordset = WORD_SETS[words]
+    result = {"words": words, "target": target}
+    if hard:
+        result["hard"] = True
+    # The solver only ever considers the solutions of the word set
+    if target not in wordset.solutions_set:
+        result["error"] = "not a solution of the word set"
+        return result
+    start = time.perf_counter()
+    game = solve(wordset, target, workers, strategy=strategy, hard=hard)
+    elapsed = time.perf_counter() - start
+    result["guesses"] = [guess for (guess, _) in game.guesses]
+    result["codes"] = [encode_response(response) for (_, response) in game.guesses]
+    result["n_guesses"] = len(game.guesses)
+    result["solved"] = game.state == State.SOLVED
+    result["time_ms"] = round(1000 * elapsed, 3)
+    return result
+
+
+def solve_batch(batch):
+    """Solve a list of (words, target, workers, strategy, hard), in a worker process, as JSON lines."""
+    return [json.dumps(solve_target(*target)) for target in batch]
+
+
+def read_targets(f):
+    """Lazily read target words, one per line, skipping blank lines."""
+    for line in f:
+        target = line.strip().lower()
+        if target:
+            yield target
+
+
+def map_bounded(executor, fn, iterable, window):
+    """Like executor.map, with at most window calls submitted ahead of results.
+
+    Unlike executor.map, iterable is consumed as results are yielded, so it
+    can be arbitrarily long.
+    """
+    pending = deque()
+    for item in iterable:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(executor.submit(fn, item))
+    while pending:
+        yield pending.popleft().result()
+
+
+def run_batch(args, strategy, executor, jobs):
+    """Stream the solutions of the target words of args.batch as JSON lines."""
+    f = sys.stdin if args.batch == "-" else open(args.batch)
+    with f:
+        targets = ((args.words, t, args.threads, strategy, args.hard) for t in read_targets(f))
+        if executor:
+            batches = iter(lambda: list(islice(targets, BATCH_SIZE)), [])
+            results = map_bounded(executor, solve_batch, batches, 2 * jobs)
+        else:
+            results = ([json.dumps(solve_target(*target))] for target in targets)
+        try:
+            for lines in results:
+                for line in lines:
+                    print(line)
+        except BrokenPipeError:
+            # The reader went away, as with | head; exit without a traceback
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            sys.exit(1)
 
 
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("-w", "--words", choices=WORD_SETS.keys(), default="wordle")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of worker processes, 0 for one per CPU (default: 1)",
+    )
+    parser.add_argument(
+        "-t",
+        "--threads",
+        type=int,
+        default=1,
+        help="number of threads each guess search is split across (default: 1)",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=guess_cache.maxsize,
+        help=f"guess cache entries per process, 0 to disable (default: {guess_cache.maxsize})",
+    )
+    parser.add_argument("--cache-policy", choices=GuessCache.POLICIES, default="lru")
+    parser.add_argument(
+        "--stats", action="store_true", help="print solver statistics per turn, over all puzzles"
+    )
+    parser.add_argument(
+        "-s",
+        "--strategy",
+        default=DEFAULT.name,
+        help=(
+            f"guess scoring strategy: one of {', '.join(METRICS)}, or a weighted mix such "
+            f"as squares=1,worst=0.5 (default: {DEFAULT.name})"
+        ),
+    )
+    parser.add_argument(
+        "--hard",
+        action="store_true",
+        help="play in hard mode, where every guess must use all the hints revealed so far",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help=(
+            "instead of the benchmark, solve the target words of FILE (- for stdin), one per "
+            "line, and print a JSON object per target"
+        ),
+    )
     args = parser.parse_args()
+    try:
+        strategy = Strategy.parse(args.strategy)
+    except ValueError as e:
+        parser.error(str(e))
 
     wordset = WORD_SETS[args.words]
+    jobs = args.jobs or os.cpu_count() or 1
+    # Build or map the response matrix once, before workers need it
+    wordset.response_matrix
+    cache_config = (args.cache_size, args.cache_policy)
+    configure_guess_cache(*cache_config)
+
+    if jobs > 1:
+        pool = ProcessPoolExecutor(jobs, initializer=configure_guess_cache, initargs=cache_config)
+    else:
+        pool = nullcontext()
+
+    if args.batch:
+        with pool as executor:
+            run_batch(args, strategy, executor, jobs)
+        return
 
     n_trials = len(wordset.solutions)
-    trials = wordset.solutions
+    trials = [
+        (args.words, soln, args.threads, args.stats, strategy, args.hard)
+        for soln in wordset.solutions
+    ]
     n_guesses = []
     n_failed = 0
+    cache_hits = cache_misses = 0
+    stats = SolverStats()
     start_time = time.time()
-    for i, soln in enumerate(trials, 1):
-        game = Game(wordset, solution=soln)
-        solver = Solver(game)
-        while game.state == State.OPEN:
-            solver.guess()
-        n = len(game.guesses)
-        if game.state == State.SOLVED:
-            print(f"{i}/{n_trials} Solved {soln} in {n} guesses.")
-            n_guesses.append(n)
+    with pool as executor:
+        if executor:
+            chunksize = max(1, n_trials // (jobs * 32))
+            results = executor.map(solve_trial, trials, chunksize=chunksize)
         else:
-            print(f"{i}/{n_trials} Failed to solve {soln}.")
-            n_failed += 1
+            results = map(solve_trial, trials)
+        for i, (trial, result) in enumerate(zip(trials, results), 1):
+            soln = trial[1]
+            n, solved, hits, misses, trial_stats = result
+            cache_hits += hits
+            cache_misses += misses
+            if trial_stats:
+                stats.add(trial_stats)
+            if solved:
+                print(f"{i}/{n_trials} Solved {soln} in {n} guesses.")
+                n_guesses.append(n)
+            else:
+                print(f"{i}/{n_trials} Failed to solve {soln}.")
+                n_failed += 1
 
     elapsed = time.time() - start_time
     avg = sum(n_guesses) / len(n_guesses)
     avg_ms = 1000 * (elapsed / len(n_guesses))
     if n_failed:
         print(f"Failed to solve {n_failed} puzzles.")
+    print(f"Guess cache: {cache_hits} hits, {cache_misses} misses.")
+    if args.stats:
+        stats.print_summary()
     print(
         (
-            f"Solved puzzles in average of {avg:.2f} guesses in {avg_ms:.1f}ms, "
+            f"Solved puzzles{' in hard mode' if args.hard else ''} in average of {avg:.2f} "
+            f"guesses in {avg_ms:.1f}ms, "
             f"max of {max(n_guesses):d} guesses."
         )
     )
@@ -0,0 +1,111 @@
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+IMPORT_TIME_PREFIX = "import time:"
+
+FIRST_FRAME_SCRIPT = """
+from wordgame.gui import create_window
+
+root = create_window()
+root.update()
+print("first frame", flush=True)
+root.destroy()
+"""
+
+
+def run_time(*args):
+    """Wall time of a fresh interpreter running args, or None if it failed."""
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, *args], capture_output=True)
+    elapsed = time.perf_counter() - start
+    return elapsed if result.returncode == 0 else None
+
+
+def time_to_first_frame():
+    """Time from process start until the GUI has drawn its window, or None."""
+    start = time.perf_counter()
+    with subprocess.Popen(
+        [sys.executable, "-c", FIRST_FRAME_SCRIPT],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    ) as proc:
+        line = proc.stdout.readline()
+        elapsed = time.perf_counter() - start
+    if proc.returncode != 0 or not line:
+        return None
+    return elapsed
+
+
+def import_times(module):
+    """Cumulative import time of every module imported by module, in seconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith(IMPORT_TIME_PREFIX):
+            continue
+        _, cumulative, name = line[len(IMPORT_TIME_PREFIX) :].split("|")
+        # Skip the column headers
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative) / 1e6
+    return times
+
+
+def median_ms(samples):
+    samples = [s for s in samples if s is not None]
+    return 1000 * statistics.median(samples) if samples else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the startup time of word-game.")
+    parser.add_argument("-n", "--repeat", type=int, default=5, help="runs per measure (default: 5)")
+    parser.add_argument(
+        "--top", type=int, default=15, help="number of slowest imports shown (default: 15)"
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        help="exit with an error if the median time to first frame exceeds this, in ms",
+    )
+    parser.add_argument("--module", default="wordgame.gui", help="module to profile imports of")
+    args = parser.parse_args()
+
+    # Warm up bytecode and OS file caches
+    import_times(args.module)
+    time_to_first_frame()
+
+    interpreter = median_ms(run_time("-c", "pass") for _ in range(args.repeat))
+    module_import = median_ms(run_time("-c", f"import {args.module}") for _ in range(args.repeat))
+    first_frame = median_ms(time_to_first_frame() for _ in range(args.repeat))
+    by_module = defaultdict(list)
+    for _ in range(args.repeat):
+        for name, seconds in import_times(args.module).items():
+            by_module[name].append(seconds)
+
+    print(f"Interpreter startup: {interpreter:.1f}ms")
+    print(f"Startup with import {args.module}: {module_import:.1f}ms")
+    if first_frame is None:
+        print("Time to first frame: unavailable, could not open a window.")
+    else:
+        print(f"Time to first frame: {first_frame:.1f}ms")
+    print(f"Slowest imports (median of {args.repeat} runs, cumulative):")
+    slowest = sorted(by_module.items(), key=lambda item: statistics.median(item[1]), reverse=True)
+    for name, samples in slowest[: args.top]:
+        print(f"{median_ms(samples):9.1f}ms  {name}")
+
+    if args.budget is not None and first_frame is not None and first_frame > args.budget:
+        print(f"Time to first frame is over budget of {args.budget:.1f}ms.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+import math
+
+# Metrics of the partition of the candidates by their response to a guess,
+# lower is better for all of them. n is the size of a partition.
+#   squares: sum of n ** 2, the number of candidates times the expected
+#            number of candidates left after the guess
+#   entropy: sum of n * log(n), lower means more information is expected
+#            from the response
+#   worst:   size of the largest partition
+#   buckets: minus the number of partitions
+METRICS = ("squares", "entropy", "worst", "buckets")
+
+# Each n * log(n) term of the entropy metric is rounded to a multiple of
+# 1 / ENTROPY_SCALE, so that sums are exact and every scoring engine ranks
+# guesses the same whatever order it adds terms in.
+ENTROPY_SCALE = 1 << 20
+
+
+def xlogx(n):
+    """Entropy metric term of a partition of size n."""
+    return math.floor(n * math.log(n) * ENTROPY_SCALE + 0.5) / ENTROPY_SCALE if n else 0.0
+
+
+def format_weight(weight):
+    """Shortest of %g and repr formatting of a weight which reads back as the same float."""
+    short = f"{weight:g}"
+    return short if float(short) == weight else repr(weight)
+
+
+class Strategy:
+    """How the solver scores guesses: a weighted sum of partition metrics.
+
+    Every metric is read from the same histogram of partition sizes, so
+    mixing metrics costs little more than scoring with one.
+    """
+
+    def __init__(self, weights):
+        for (metric, weight) in weights.items():
+            if metric not in METRICS:
+                raise ValueError(f"unknown metric: {metric}")
+            # Scores must be comparable numbers
+            if not math.isfinite(weight):
+                raise ValueError(f"weight is not finite: {metric}={weight:g}")
+            # The solver relies on guesses leaving no ambiguity scoring best
+            if weight < 0:
+                raise ValueError(f"negative weight: {metric}={weight:g}")
+        self.weights = {m: weights[m] for m in METRICS if weights.get(m)}
+        if not self.weights:
+            raise ValueError("a strategy needs at least one metric with a weight")
+
+    @classmethod
+    def parse(cls, spec):
+        """Strategy of a metric name, or comma separated metric=weight pairs."""
+        weights = {}
+        for item in spec.split(","):
+            metric, _, weight = item.partition("=")
+            metric = metric.strip()
+            if metric in weights:
+                raise ValueError(f"duplicate metric: {metric}")
+            try:
+                weights[metric] = float(weight) if weight else 1.0
+            except ValueError:
+                raise ValueError(f"invalid weight: {item}") from None
+        return cls(weights)
+
+    @property
+    def name(self):
+        """Short form of the strategy, which Strategy.parse reads back exactly.
+
+        Guess caches and decision trees are keyed on it, so different
+        weights always give different names.
+        """
+        if len(self.weights) == 1 and 1.0 in self.weights.values():
+            return next(iter(self.weights))
+        return ",".join(f"{m}={format_weight(w)}" for m, w in self.weights.items())
+
+    @property
+    def is_squares(self):
+        """Whether this is the sum of squares alone, which scores are integers."""
+        return self.weights == {"squares": 1.0}
+
+    @property
+    def weight_vector(self):
+        """Weights of every metric, in METRICS order."""
+        return [self.weights.get(m, 0.0) for m in METRICS]
+
+    def score(self, sizes):
+        """Score of a guess from the sizes of the partitions it makes."""
+        if self.is_squares:
+            return sum(n * n for n in sizes)
+        sizes = list(sizes)
+        metrics = {
+            "squares": lambda: sum(n * n for n in sizes),
+            "entropy": lambda: sum(xlogx(n) for n in sizes),
+            "worst": lambda: max(sizes, default=0),
+            "buckets": lambda: -sum(1 for n in sizes if n),
+        }
+        return sum(weight * metrics[m]() for m, weight in self.weights.items())
+
+    def __eq__(self, other):
+        return isinstance(other, Strategy) and self.weights == other.weights
+
+    def __hash__(self):
+        return hash(self.name)
+
+    def __repr__(self):
+        return f"Strategy({self.name!r})"
+
+
+DEFAULT = Strategy({"squares": 1})
@@ -0,0 +1,155 @@
+import argparse
+import hashlib
+import struct
+import time
+from array import array
+from collections import defaultdict
+
+from wordgame import eprint
+from wordgame.matrix import cache_key, cache_path, remove_stale, write_atomic
+from wordgame.strategy import DEFAULT, Strategy
+from wordgame.words import WORD_SETS
+
+# Bump whenever the guesses picked by Solver.find_guess may change
+SOLVER_VERSION = 1
+
+MAGIC = b"UWGDT001"
+# magic, tree key, number of uint32 in nodes
+HEADER = struct.Struct("<8s32sI")
+
+
+def tree_key(wordset, strategy=DEFAULT):
+    """Digest of everything the solver's moves on a word set depend on."""
+    digest = hashlib.sha256(cache_key(wordset))
+    digest.update(f"{SOLVER_VERSION}:{wordset.first_guess}:{strategy.name}".encode("ascii"))
+    return digest.digest()
+
+
+def tree_path(wordset, key, strategy=DEFAULT):
+    """Path of a decision tree, the default strategy's trees have no variant."""
+    variant = None if strategy == DEFAULT else strategy.name
+    return cache_path(wordset, key, "tree", variant), variant
+
+
+class DecisionTree:
+    """Every move the solver can make on a word set, from its first guess.
+
+    Nodes are stored flat in an array of uint32, in depth first order. A node
+    is its guess id and number of children, followed by a (response code,
+    child offset) pair per child. The root node is at offset 0. The response
+    meaning the guess was the solution has no child.
+    """
+
+    root = 0
+
+    def __init__(self, nodes):
+        self.nodes = nodes
+
+    def guess(self, node):
+        return self.nodes[node]
+
+    def child(self, node, guess_id, code):
+        """Offset of the node reached by a guess and its response, or None."""
+        nodes = self.nodes
+        if nodes[node] != guess_id:
+            return None
+        for i in range(node + 2, node + 2 + 2 * nodes[node + 1], 2):
+            if nodes[i] == code:
+                return nodes[i + 1]
+        return None
+
+    @classmethod
+    def build(cls, wordset, workers=1, strategy=DEFAULT):
+        from wordgame.game import Game
+        from wordgame.solver import Solver
+
+        game = Game(wordset, solution=wordset.solutions[0])
+        solver = Solver(game, workers, use_tree=False, strategy=strategy)
+        matrix = solver.matrix
+        nodes = array("I")
+
+        def add_node(guess_id, candidates):
+            node = len(nodes)
+            partitions = defaultdict(list)
+            row = matrix.row(guess_id)
+            for i in candidates:
+                partitions[row[i]].append(i)
+            # All letters exact, solved
+            partitions.pop(0, None)
+
+            nodes.extend((guess_id, len(partitions)))
+            children = len(nodes)
+            nodes.extend([0] * 2 * len(partitions))
+            for (i, code) in enumerate(sorted(partitions)):
+                solver.candidates = partitions[code]
+                child = add_node(wordset.word_id(solver.find_guess()), partitions[code])
+                nodes[children + 2 * i] = code
+                nodes[children + 2 * i + 1] = child
+            return node
+
+        first_guess, _ = solver.next_guess()
+        add_node(wordset.word_id(first_guess), range(len(wordset.solutions)))
+        return cls(nodes)
+
+    @classmethod
+    def load(cls, wordset, strategy=DEFAULT):
+        """Load the decision tree of a word set, or None if it was not built."""
+        key = tree_key(wordset, strategy)
+        path, _ = tree_path(wordset, key, strategy)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            magic, file_key, size = HEADER.unpack_from(data)
+            if (magic, file_key) != (MAGIC, key) or len(data) != HEADER.size + 4 * size:
+                raise ValueError("wrong header")
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, struct.error) as e:
+            eprint(f"Ignoring invalid decision tree {path}: {e}")
+            return None
+
+        nodes = array("I")
+        nodes.frombytes(data[HEADER.size :])
+        return cls(nodes)
+
+    def save(self, wordset, strategy=DEFAULT):
+        key = tree_key(wordset, strategy)
+        path, variant = tree_path(wordset, key, strategy)
+        write_atomic(path, HEADER.pack(MAGIC, key, len(self.nodes)), self.nodes)
+        remove_stale(wordset, path, variant)
+        return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the solver decision tree of word sets.")
+    parser.add_argument("-w", "--words", choices=WORD_SETS.keys(), action="append")
+    parser.add_argument(
+        "-t",
+        "--threads",
+        type=int,
+        default=1,
+        help="number of threads each guess search is split across (default: 1)",
+    )
+    parser.add_argument(
+        "-s",
+        "--strategy",
+        default=DEFAULT.name,
+        help=f"guess scoring strategy, see word-solver-benchmark --help (default: {DEFAULT.name})",
+    )
+    args = parser.parse_args()
+    try:
+        strategy = Strategy.parse(args.strategy)
+    except ValueError as e:
+        parser.error(str(e))
+
+    for name in args.words or WORD_SETS.keys():
+        wordset = WORD_SETS[name]
+        start_time = time.time()
+        tree = DecisionTree.build(wordset, args.threads, strategy)
+        path = tree.save(wordset, strategy)
+        elapsed = time.time() - start_time
+        print(f"Built {name} decision tree in {elapsed:.1f}s: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,58 @@
-from importlib import import_module
+import mmap
+import os
+from collections.abc import Sequence
+
+# Marks a lazily loaded attribute which may legitimately be None
+NOT_LOADED = object()
+
+
+class PackedWords(Sequence):
+    """Read-only list of words stored back to back as ASCII bytes.
+
+    Words are decoded one at a time when accessed.
+    """
+
+    def __init__(self, data, letter_count, count=None):
+        self.data = data
+        self.letter_count = letter_count
+        self.count = len(data) // letter_count if count is None else count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            start, stop, step = i.indices(self.count)
+            if start == 0 and step == 1:
+                return PackedWords(self.data, self.letter_count, stop)
+            return [self[j] for j in range(start, stop, step)]
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError("word index out of range")
+        start = i * self.letter_count
+        return self.data[start : start + self.letter_count].decode("ascii")
+
+    def __contains__(self, word):
+        try:
+            self.index(word)
+        except ValueError:
+            return False
+        return True
+
+    def index(self, word, start=0, stop=None):
+        """Get the index of word, searching the packed bytes without decoding."""
+        stop = self.count if stop is None else min(stop, self.count)
+        if isinstance(word, str) and len(word) == self.letter_count and word.isascii():
+            needle = word.encode("ascii")
+            end = stop * self.letter_count
+            pos = self.data.find(needle, start * self.letter_count, end)
+            while pos != -1:
+                # Only matches aligned on a word boundary count
+                if pos % self.letter_count == 0:
+                    return pos // self.letter_count
+                pos = self.data.find(needle, pos + 1, end)
+        raise ValueError(f"{word!r} is not in word list")
 
 
 class WordSet:
@@ -6,20 +60,61 @@ class WordSet:
         self.letter_count = letter_count
         self.top_n = top_n
         self.name = name
-        self.first_guess = first_guess
+        # Used when the openings table has no up to date first guess
+        self.default_first_guess = first_guess
+        self._opening = NOT_LOADED
+        self._second_guesses = None
         self._words = None
         self._words_set = None
         self._solutions = None
         self._solutions_set = None
+        self._response_matrix = None
+        self._index = None
+        self._guess_index = None
+        # Decision tree by scoring strategy
+        self._decision_trees = {}
+
+    @property
+    def path(self):
+        return os.path.join(os.path.dirname(__file__), f"{self.name}.bin")
 
     def load(self):
-        mod = import_module(f"wordgame.words.{self.name}")
-        return mod.WORDS
+        with open(self.path, "rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return PackedWords(data, self.letter_count)
+
+    @property
+    def opening(self):
+        """Entry of the openings table generated by word-solver-openings.
+
+        None if the table is missing or stale for this word set.
+        """
+        if self._opening is NOT_LOADED:
+            from wordgame.openings import table_entry
+
+            self._opening = table_entry(self)
+        return self._opening
+
+    @property
+    def first_guess(self):
+        """Best first guess of the solver."""
+        return self.opening["first_guess"] if self.opening else self.default_first_guess
+
+    @property
+    def second_guesses(self):
+        """Best second guess of the solver by response code to first_guess.
+
+        Empty if not generated with word-solver-openings.
+        """
+        if self._second_guesses is None:
+            book = self.opening.get("second_guesses", {}) if self.opening else {}
+            self._second_guesses = {int(code): guess for (code, guess) in book.items()}
+        return self._second_guesses
 
     @property
     def words(self):
-        if not self._words:
-            self._words = self.load()[:]
+        if self._words is None:
+            self._words = self.load()
         return self._words
 
     @property
@@ -30,8 +125,8 @@ class WordSet:
 
     @property
     def solutions(self):
-        if not self._solutions:
-            self._solutions = self.load()[: self.top_n]
+        if self._solutions is None:
+            self._solutions = self.words[: self.top_n]
         return self._solutions
 
     @property
@@ -40,6 +135,57 @@ class WordSet:
             self._solutions_set = set(self.solutions)
         return self._solutions_set
 
+    def word_id(self, word):
+        return self.words.index(word)
+
+    @property
+    def encoded(self):
+        """All words as ASCII bytes, back to back, letter_count bytes each."""
+        return self.words.data
+
+    def encoded_word(self, word_id):
+        start = word_id * self.letter_count
+        return self.encoded[start : start + self.letter_count]
+
+    @property
+    def response_matrix(self):
+        if not self._response_matrix:
+            from wordgame.matrix import ResponseMatrix
+
+            self._response_matrix = ResponseMatrix.load(self)
+        return self._response_matrix
+
+    @property
+    def index(self):
+        """Inverted index of the solutions by letter and position."""
+        if self._index is None:
+            from wordgame.index import LetterIndex
+
+            self._index = LetterIndex.build(self.letter_count, self.solutions)
+        return self._index
+
+    @property
+    def guess_index(self):
+        """Inverted index of all words by letter and position, for hard mode."""
+        if self._guess_index is None:
+            from wordgame.index import LetterIndex
+
+            self._guess_index = LetterIndex.build(self.letter_count, self.words)
+        return self._guess_index
+
+    def decision_tree(self, strategy=None):
+        """Precomputed solver moves, or None if not built with word-solver-tree.
+
+        strategy is the scoring strategy of the solver, the default one if None.
+        """
+        from wordgame.strategy import DEFAULT
+        from wordgame.tree import DecisionTree
+
+        strategy = strategy or DEFAULT
+        if strategy not in self._decision_trees:
+            self._decision_trees[strategy] = DecisionTree.load(self, strategy)
+        return self._decision_trees[strategy]
+
 
 WORD_SETS = {
     "wordle": WordSet("wordle", 5, 2315, "tares"),
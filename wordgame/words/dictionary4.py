@@ -1,2980 +0,0 @@
-WORDS = [
-    "that",
-    "this",
-    "with",
-    "from",
-    "your",
-    "have",
-    "more",
-    "will",
-    "home",
-    "page",
-    "free",
-    "time",
-    "they",
-    "site",
-    "what",
-    "news",
-    "only",
-    "when",
-    "here",
-    "also",
-    "help",
-    "view",
-    "been",
-    "were",
-    "some",
-    "like",
-    "than",
-    "find",
-    "date",
-    "back",
-    "list",
-    "name",
-    "just",
-    "over",
-    "year",
-    "into",
-    "next",
-    "used",
-    "work",
-    "last",
-    "most",
-    "data",
-    "make",
-    "them",
-    "post",
-    "city",
-    "such",
-    "best",
-    "then",
-    "good",
-    "well",
-    "info",
-    "high",
-    "each",
-    "very",
-    "book",
-    "read",
-    "need",
-    "many",
-    "user",
-    "said",
-    "does",
-    "mail",
-    "full",
-    "life",
-    "know",
-    "days",
-    "part",
-    "real",
-    "item",
-    "must",
-    "made",
-    "line",
-    "send",
-    "type",
-    "take",
-    "area",
-    "want",
-    "long",
-    "code",
-    "show",
-    "even",
-    "much",
-    "sign",
-    "file",
-    "link",
-    "open",
-    "case",
-    "same",
-    "both",
-    "game",
-    "care",
-    "down",
-    "size",
-    "shop",
-    "text",
-    "rate",
-    "form",
-    "love",
-    "john",
-    "main",
-    "call",
-    "save",
-    "york",
-    "card",
-    "jobs",
-    "food",
-    "sale",
-    "teen",
-    "room",
-    "join",
-    "west",
-    "look",
-    "left",
-    "team",
-    "week",
-    "note",
-    "live",
-    "june",
-    "plan",
-    "cost",
-    "july",
-    "test",
-    "come",
-    "cart",
-    "play",
-    "less",
-    "park",
-    "side",
-    "give",
-    "sell",
-    "body",
-    "east",
-    "club",
-    "road",
-    "gift",
-    "hard",
-    "four",
-    "blue",
-    "easy",
-    "star",
-    "hand",
-    "keep",
-    "porn",
-    "baby",
-    "term",
-    "film",
-    "head",
-    "cell",
-    "self",
-    "away",
-    "once",
-    "sure",
-    "cars",
-    "tell",
-    "able",
-    "gold",
-    "arts",
-    "past",
-    "five",
-    "upon",
-    "says",
-    "land",
-    "done",
-    "ever",
-    "word",
-    "bill",
-    "talk",
-    "nude",
-    "kids",
-    "true",
-    "else",
-    "mark",
-    "rock",
-    "tips",
-    "plus",
-    "auto",
-    "edit",
-    "fast",
-    "fact",
-    "unit",
-    "tech",
-    "meet",
-    "feel",
-    "bank",
-    "risk",
-    "town",
-    "girl",
-    "toys",
-    "golf",
-    "loan",
-    "wide",
-    "sort",
-    "half",
-    "step",
-    "none",
-    "paul",
-    "lake",
-    "sony",
-    "fire",
-    "chat",
-    "loss",
-    "face",
-    "base",
-    "near",
-    "stay",
-    "turn",
-    "mean",
-    "king",
-    "copy",
-    "drug",
-    "cash",
-    "seen",
-    "port",
-    "stop",
-    "soon",
-    "held",
-    "mind",
-    "lost",
-    "tour",
-    "menu",
-    "hope",
-    "wish",
-    "role",
-    "came",
-    "fine",
-    "hour",
-    "bush",
-    "huge",
-    "kind",
-    "move",
-    "logo",
-    "nice",
-    "sent",
-    "band",
-    "lead",
-    "went",
-    "mode",
-    "fund",
-    "male",
-    "took",
-    "song",
-    "late",
-    "fall",
-    "idea",
-    "tool",
-    "hill",
-    "maps",
-    "deal",
-    "hold",
-    "safe",
-    "feed",
-    "hall",
-    "anti",
-    "ship",
-    "paid",
-    "hair",
-    "anal",
-    "tree",
-    "thus",
-    "wall",
-    "wine",
-    "vote",
-    "ways",
-    "rule",
-    "told",
-    "feet",
-    "sexy",
-    "door",
-    "cool",
-    "asia",
-    "uses",
-    "java",
-    "pass",
-    "fees",
-    "skin",
-    "mary",
-    "ring",
-    "iraq",
-    "boys",
-    "deep",
-    "rest",
-    "pool",
-    "mini",
-    "fish",
-    "pack",
-    "born",
-    "race",
-    "rape",
-    "debt",
-    "core",
-    "sets",
-    "wood",
-    "rent",
-    "dark",
-    "host",
-    "isbn",
-    "fair",
-    "ohio",
-    "gets",
-    "dead",
-    "mike",
-    "trip",
-    "poor",
-    "eyes",
-    "farm",
-    "lord",
-    "hear",
-    "goes",
-    "wife",
-    "hits",
-    "zone",
-    "jack",
-    "flat",
-    "flow",
-    "path",
-    "laws",
-    "skip",
-    "diet",
-    "army",
-    "gear",
-    "lots",
-    "firm",
-    "jump",
-    "ball",
-    "goal",
-    "sold",
-    "wind",
-    "palm",
-    "pain",
-    "oral",
-    "ford",
-    "edge",
-    "root",
-    "pink",
-    "shot",
-    "cold",
-    "foot",
-    "mass",
-    "heat",
-    "wild",
-    "miss",
-    "task",
-    "soft",
-    "fuel",
-    "walk",
-    "fuck",
-    "wait",
-    "rose",
-    "pick",
-    "load",
-    "tags",
-    "guys",
-    "cock",
-    "drop",
-    "rich",
-    "seem",
-    "hire",
-    "gave",
-    "ones",
-    "tits",
-    "rank",
-    "kong",
-    "died",
-    "inch",
-    "snow",
-    "camp",
-    "fill",
-    "gone",
-    "fort",
-    "gene",
-    "disc",
-    "boat",
-    "icon",
-    "ends",
-    "cast",
-    "felt",
-    "soul",
-    "aids",
-    "flag",
-    "atom",
-    "iron",
-    "void",
-    "disk",
-    "desk",
-    "dave",
-    "hong",
-    "vice",
-    "duty",
-    "bear",
-    "gain",
-    "lack",
-    "iowa",
-    "knew",
-    "zoom",
-    "blow",
-    "clip",
-    "wire",
-    "tape",
-    "spam",
-    "acid",
-    "cent",
-    "null",
-    "zero",
-    "roll",
-    "bath",
-    "font",
-    "beta",
-    "fail",
-    "jazz",
-    "bags",
-    "wear",
-    "rare",
-    "bars",
-    "dual",
-    "rise",
-    "bird",
-    "lady",
-    "fans",
-    "dell",
-    "seat",
-    "bids",
-    "toll",
-    "cape",
-    "mine",
-    "whom",
-    "math",
-    "dogs",
-    "moon",
-    "fear",
-    "wars",
-    "kept",
-    "beat",
-    "arms",
-    "utah",
-    "hide",
-    "slow",
-    "nine",
-    "eric",
-    "spot",
-    "grow",
-    "rain",
-    "onto",
-    "bass",
-    "hole",
-    "pets",
-    "ride",
-    "pair",
-    "runs",
-    "yeah",
-    "evil",
-    "euro",
-    "peak",
-    "dick",
-    "salt",
-    "bell",
-    "jeff",
-    "lane",
-    "kill",
-    "ages",
-    "plug",
-    "cook",
-    "bike",
-    "lose",
-    "seek",
-    "tony",
-    "kits",
-    "soil",
-    "matt",
-    "exit",
-    "iran",
-    "keys",
-    "wave",
-    "holy",
-    "acts",
-    "mesh",
-    "dean",
-    "poll",
-    "unix",
-    "bond",
-    "jean",
-    "visa",
-    "pure",
-    "hell",
-    "lens",
-    "draw",
-    "warm",
-    "suck",
-    "babe",
-    "crew",
-    "legs",
-    "rear",
-    "node",
-    "lock",
-    "mile",
-    "bowl",
-    "tank",
-    "navy",
-    "dish",
-    "adam",
-    "slot",
-    "gray",
-    "demo",
-    "hate",
-    "rice",
-    "loop",
-    "gary",
-    "vary",
-    "rome",
-    "arab",
-    "milk",
-    "boot",
-    "push",
-    "alan",
-    "dear",
-    "beer",
-    "jose",
-    "jane",
-    "earn",
-    "twin",
-    "bits",
-    "suit",
-    "chip",
-    "char",
-    "echo",
-    "grid",
-    "pull",
-    "nick",
-    "plot",
-    "pump",
-    "anne",
-    "exam",
-    "ryan",
-    "beds",
-    "grey",
-    "bold",
-    "scan",
-    "aged",
-    "bulk",
-    "cute",
-    "seed",
-    "peer",
-    "meat",
-    "alex",
-    "bang",
-    "bone",
-    "bugs",
-    "gate",
-    "tone",
-    "busy",
-    "neck",
-    "wing",
-    "tiny",
-    "rail",
-    "tube",
-    "belt",
-    "luck",
-    "dial",
-    "gang",
-    "cake",
-    "semi",
-    "andy",
-    "cafe",
-    "till",
-    "shoe",
-    "sand",
-    "seal",
-    "lies",
-    "pipe",
-    "deck",
-    "thin",
-    "sick",
-    "dose",
-    "lets",
-    "cats",
-    "greg",
-    "folk",
-    "okay",
-    "lift",
-    "lisa",
-    "mall",
-    "fell",
-    "yard",
-    "sean",
-    "pour",
-    "dust",
-    "butt",
-    "kent",
-    "adds",
-    "ward",
-    "roof",
-    "kiss",
-    "rush",
-    "yoga",
-    "lamp",
-    "rico",
-    "phil",
-    "glad",
-    "wins",
-    "rack",
-    "boss",
-    "ross",
-    "anna",
-    "solo",
-    "tall",
-    "nova",
-    "wake",
-    "shit",
-    "drum",
-    "ease",
-    "orgy",
-    "tabs",
-    "pine",
-    "tend",
-    "gulf",
-    "rick",
-    "hunt",
-    "thai",
-    "fred",
-    "mill",
-    "burn",
-    "labs",
-    "sole",
-    "laid",
-    "clay",
-    "weak",
-    "wise",
-    "odds",
-    "sons",
-    "leaf",
-    "cuba",
-    "silk",
-    "kate",
-    "wolf",
-    "fits",
-    "kick",
-    "meal",
-    "hurt",
-    "slip",
-    "cuts",
-    "mars",
-    "caps",
-    "pill",
-    "mint",
-    "spin",
-    "wash",
-    "aims",
-    "soap",
-    "axis",
-    "guns",
-    "hero",
-    "punk",
-    "duke",
-    "pace",
-    "wage",
-    "dawn",
-    "carl",
-    "coat",
-    "rica",
-    "doll",
-    "peru",
-    "reed",
-    "mice",
-    "temp",
-    "vast",
-    "wrap",
-    "mood",
-    "quiz",
-    "beam",
-    "tops",
-    "shut",
-    "thou",
-    "mask",
-    "coal",
-    "lion",
-    "neil",
-    "beef",
-    "hats",
-    "surf",
-    "hook",
-    "cord",
-    "crop",
-    "lite",
-    "sing",
-    "tons",
-    "hang",
-    "damn",
-    "hood",
-    "fame",
-    "eggs",
-    "ruby",
-    "stem",
-    "drew",
-    "tune",
-    "corn",
-    "puts",
-    "grew",
-    "trek",
-    "ties",
-    "brad",
-    "jury",
-    "tail",
-    "lawn",
-    "soup",
-    "byte",
-    "nose",
-    "juan",
-    "jews",
-    "trim",
-    "quit",
-    "lung",
-    "todd",
-    "doug",
-    "sees",
-    "bull",
-    "cole",
-    "mart",
-    "tale",
-    "lynn",
-    "coin",
-    "fake",
-    "cure",
-    "arch",
-    "bomb",
-    "harm",
-    "deer",
-    "oven",
-    "noon",
-    "cams",
-    "piss",
-    "joel",
-    "mate",
-    "chef",
-    "isle",
-    "slim",
-    "luke",
-    "comp",
-    "pete",
-    "spec",
-    "penn",
-    "midi",
-    "tied",
-    "dale",
-    "boob",
-    "oils",
-    "unto",
-    "pays",
-    "lang",
-    "stud",
-    "fold",
-    "slut",
-    "pole",
-    "mega",
-    "bend",
-    "moms",
-    "glen",
-    "lips",
-    "pond",
-    "tire",
-    "chad",
-    "josh",
-    "drag",
-    "ripe",
-    "rely",
-    "nuts",
-    "nail",
-    "span",
-    "joke",
-    "pads",
-    "inns",
-    "cups",
-    "foam",
-    "poem",
-    "asks",
-    "bean",
-    "bias",
-    "swim",
-    "loud",
-    "rats",
-    "cruz",
-    "bios",
-    "ruth",
-    "pray",
-    "pope",
-    "jeep",
-    "bare",
-    "hung",
-    "mono",
-    "tile",
-    "knee",
-    "prep",
-    "pros",
-    "cant",
-    "sara",
-    "joan",
-    "duck",
-    "dive",
-    "fiji",
-    "raid",
-    "volt",
-    "dirt",
-    "sink",
-    "grip",
-    "watt",
-    "pins",
-    "reno",
-    "polo",
-    "horn",
-    "frog",
-    "logs",
-    "snap",
-    "swap",
-    "flip",
-    "buzz",
-    "nuke",
-    "boom",
-    "calm",
-    "fork",
-    "troy",
-    "tray",
-    "sage",
-    "cave",
-    "wool",
-    "eyed",
-    "grab",
-    "oops",
-    "trap",
-    "fool",
-    "karl",
-    "dies",
-    "jail",
-    "lace",
-    "ugly",
-    "hart",
-    "ment",
-    "rows",
-    "gods",
-    "poly",
-    "ears",
-    "fist",
-    "mere",
-    "cons",
-    "taxi",
-    "worn",
-    "shaw",
-    "deny",
-    "bali",
-    "judy",
-    "trio",
-    "cube",
-    "rugs",
-    "crap",
-    "fate",
-    "oval",
-    "soma",
-    "benz",
-    "tier",
-    "earl",
-    "guam",
-    "cite",
-    "mess",
-    "rope",
-    "dump",
-    "hose",
-    "pubs",
-    "mild",
-    "clan",
-    "sync",
-    "mesa",
-    "hull",
-    "shed",
-    "memo",
-    "tide",
-    "funk",
-    "reel",
-    "wang",
-    "bind",
-    "rand",
-    "buck",
-    "acre",
-    "lows",
-    "aqua",
-    "emma",
-    "pest",
-    "reef",
-    "beth",
-    "jill",
-    "sofa",
-    "tent",
-    "dept",
-    "hack",
-    "dare",
-    "hawk",
-    "lamb",
-    "junk",
-    "lucy",
-    "hans",
-    "poet",
-    "epic",
-    "sake",
-    "sans",
-    "lean",
-    "dude",
-    "luis",
-    "alto",
-    "gore",
-    "cult",
-    "dash",
-    "cage",
-    "hugh",
-    "jake",
-    "ping",
-    "flux",
-    "oman",
-    "rage",
-    "prix",
-    "avon",
-    "rays",
-    "walt",
-    "acne",
-    "undo",
-    "dana",
-    "halo",
-    "gays",
-    "exec",
-    "maui",
-    "yale",
-    "doom",
-    "owen",
-    "bite",
-    "myth",
-    "weed",
-    "dice",
-    "quad",
-    "dock",
-    "hint",
-    "buys",
-    "pork",
-    "barn",
-    "fare",
-    "bald",
-    "fuji",
-    "leon",
-    "mold",
-    "dame",
-    "herb",
-    "idle",
-    "cove",
-    "eden",
-    "incl",
-    "reid",
-    "flex",
-    "hash",
-    "lazy",
-    "pens",
-    "worm",
-    "deaf",
-    "mats",
-    "mime",
-    "keen",
-    "peas",
-    "owns",
-    "zinc",
-    "guru",
-    "levy",
-    "grad",
-    "bras",
-    "kyle",
-    "pale",
-    "gaps",
-    "tear",
-    "nest",
-    "nato",
-    "gale",
-    "stan",
-    "idol",
-    "moss",
-    "cork",
-    "mali",
-    "dome",
-    "heel",
-    "yang",
-    "dumb",
-    "feat",
-    "glow",
-    "oaks",
-    "paso",
-    "norm",
-    "ware",
-    "jade",
-    "foul",
-    "keno",
-    "seas",
-    "pose",
-    "goat",
-    "sail",
-    "bolt",
-    "gage",
-    "urge",
-    "kurt",
-    "neon",
-    "ours",
-    "lone",
-    "cope",
-    "lime",
-    "kirk",
-    "spas",
-    "jets",
-    "yarn",
-    "knit",
-    "pike",
-    "hugo",
-    "bent",
-    "laos",
-    "mama",
-    "coil",
-    "lily",
-    "rita",
-    "joey",
-    "tilt",
-    "bead",
-    "leak",
-    "bulb",
-    "iris",
-    "bach",
-    "khan",
-    "stir",
-    "togo",
-    "pile",
-    "wade",
-    "pony",
-    "leap",
-    "swan",
-    "scat",
-    "nets",
-    "bash",
-    "ansi",
-    "neat",
-    "webb",
-    "bump",
-    "aunt",
-    "crow",
-    "faso",
-    "gram",
-    "sits",
-    "toes",
-    "bust",
-    "palo",
-    "tina",
-    "cola",
-    "saab",
-    "gems",
-    "mann",
-    "outs",
-    "nero",
-    "foil",
-    "pogo",
-    "amps",
-    "tick",
-    "vans",
-    "glue",
-    "cone",
-    "gals",
-    "ivan",
-    "olds",
-    "ramp",
-    "pear",
-    "clue",
-    "duff",
-    "scam",
-    "beck",
-    "tome",
-    "prof",
-    "sins",
-    "prop",
-    "maid",
-    "erin",
-    "rods",
-    "pigs",
-    "maya",
-    "deed",
-    "papa",
-    "nina",
-    "seth",
-    "warn",
-    "cops",
-    "peso",
-    "vent",
-    "pitt",
-    "hyde",
-    "dots",
-    "mugs",
-    "vase",
-    "lyon",
-    "vera",
-    "boyd",
-    "napa",
-    "homo",
-    "pier",
-    "nazi",
-    "saga",
-    "mayo",
-    "lisp",
-    "erie",
-    "chin",
-    "ajax",
-    "wont",
-    "nile",
-    "hubs",
-    "soda",
-    "dunn",
-    "tomb",
-    "prom",
-    "cubs",
-    "pulp",
-    "pots",
-    "slam",
-    "crib",
-    "coca",
-    "noun",
-    "xmas",
-    "crab",
-    "hike",
-    "bore",
-    "cows",
-    "peel",
-    "bake",
-    "oslo",
-    "heal",
-    "tote",
-    "alfa",
-    "sour",
-    "sock",
-    "bail",
-    "tees",
-    "mist",
-    "verb",
-    "chic",
-    "vest",
-    "tens",
-    "puma",
-    "rant",
-    "gaza",
-    "gill",
-    "rude",
-    "sang",
-    "curl",
-    "deli",
-    "vine",
-    "vale",
-    "russ",
-    "limo",
-    "rust",
-    "nash",
-    "avid",
-    "bets",
-    "carr",
-    "fade",
-    "gwen",
-    "monk",
-    "pooh",
-    "torn",
-    "heck",
-    "bark",
-    "lynx",
-    "odor",
-    "flew",
-    "apex",
-    "curb",
-    "deco",
-    "coke",
-    "webs",
-    "prod",
-    "cane",
-    "fury",
-    "noah",
-    "wore",
-    "lima",
-    "dues",
-    "gigs",
-    "lori",
-    "plea",
-    "pres",
-    "prey",
-    "lick",
-    "ness",
-    "whip",
-    "gail",
-    "bins",
-    "bout",
-    "hank",
-    "amos",
-    "fond",
-    "sore",
-    "fiat",
-    "noel",
-    "cans",
-    "aide",
-    "lieu",
-    "ibid",
-    "reds",
-    "bart",
-    "noir",
-    "evan",
-    "knob",
-    "knox",
-    "dove",
-    "mack",
-    "sung",
-    "ally",
-    "kung",
-    "alma",
-    "isis",
-    "dull",
-    "bees",
-    "sigh",
-    "mock",
-    "bats",
-    "melt",
-    "faux",
-    "pant",
-    "hype",
-    "rite",
-    "dong",
-    "turf",
-    "berg",
-    "muse",
-    "tyne",
-    "lust",
-    "jude",
-    "lien",
-    "marx",
-    "vein",
-    "hale",
-    "tiff",
-    "bait",
-    "dent",
-    "macs",
-    "sums",
-    "lame",
-    "soho",
-    "fuse",
-    "pops",
-    "amid",
-    "knot",
-    "acta",
-    "yuan",
-    "tate",
-    "coop",
-    "kris",
-    "plum",
-    "loft",
-    "lump",
-    "halt",
-    "bury",
-    "duct",
-    "lend",
-    "levi",
-    "pans",
-    "ions",
-    "mets",
-    "rams",
-    "gown",
-    "ruin",
-    "tuna",
-    "wipe",
-    "gcse",
-    "haul",
-    "duly",
-    "obey",
-    "mare",
-    "kite",
-    "heap",
-    "eats",
-    "flea",
-    "pals",
-    "hail",
-    "herd",
-    "amex",
-    "calf",
-    "rave",
-    "jerk",
-    "situ",
-    "flap",
-    "diva",
-    "taps",
-    "oath",
-    "gala",
-    "dane",
-    "dora",
-    "tang",
-    "riot",
-    "fats",
-    "ritz",
-    "lush",
-    "grim",
-    "flop",
-    "toss",
-    "pity",
-    "woke",
-    "cuff",
-    "reps",
-    "eddy",
-    "cues",
-    "kerr",
-    "colt",
-    "jars",
-    "hips",
-    "wigs",
-    "zion",
-    "hunk",
-    "chap",
-    "tele",
-    "harp",
-    "tack",
-    "sack",
-    "peek",
-    "ella",
-    "sued",
-    "toby",
-    "axle",
-    "opal",
-    "viva",
-    "blew",
-    "howe",
-    "lava",
-    "envy",
-    "ussr",
-    "shah",
-    "stag",
-    "rash",
-    "boil",
-    "vain",
-    "bert",
-    "maze",
-    "rode",
-    "amen",
-    "warp",
-    "kobe",
-    "brew",
-    "coup",
-    "cass",
-    "fore",
-    "alps",
-    "subs",
-    "limb",
-    "limp",
-    "mute",
-    "dart",
-    "robe",
-    "ezra",
-    "mast",
-    "goth",
-    "comb",
-    "alas",
-    "chop",
-    "onyx",
-    "hoop",
-    "dire",
-    "gull",
-    "jour",
-    "brit",
-    "rims",
-    "shin",
-    "flaw",
-    "pane",
-    "vibe",
-    "meth",
-    "teas",
-    "anon",
-    "ribs",
-    "elem",
-    "barb",
-    "aura",
-    "sect",
-    "nous",
-    "mole",
-    "owed",
-    "buff",
-    "clad",
-    "fled",
-    "xiii",
-    "bros",
-    "aces",
-    "ymca",
-    "lied",
-    "bloc",
-    "hugs",
-    "owls",
-    "pimp",
-    "gimp",
-    "hemp",
-    "burt",
-    "inks",
-    "wink",
-    "fife",
-    "stub",
-    "tort",
-    "dams",
-    "afro",
-    "mach",
-    "spur",
-    "skis",
-    "pact",
-    "lulu",
-    "vita",
-    "nora",
-    "ibis",
-    "mule",
-    "kiwi",
-    "duel",
-    "mead",
-    "gong",
-    "bono",
-    "bays",
-    "gaze",
-    "hulk",
-    "cyan",
-    "cory",
-    "axes",
-    "haze",
-    "pits",
-    "ants",
-    "tuck",
-    "slab",
-    "lure",
-    "aviv",
-    "tubs",
-    "hers",
-    "grin",
-    "spit",
-    "acme",
-    "rove",
-    "chow",
-    "jung",
-    "aria",
-    "scar",
-    "dorm",
-    "pies",
-    "saws",
-    "demi",
-    "cain",
-    "rudy",
-    "dine",
-    "slap",
-    "jaws",
-    "finn",
-    "ante",
-    "leah",
-    "bred",
-    "shea",
-    "oahu",
-    "tout",
-    "hare",
-    "plat",
-    "bonn",
-    "tory",
-    "oder",
-    "veil",
-    "peck",
-    "helm",
-    "jays",
-    "saul",
-    "apis",
-    "chew",
-    "teak",
-    "sane",
-    "dune",
-    "lest",
-    "blur",
-    "punt",
-    "dime",
-    "carp",
-    "dusk",
-    "lent",
-    "aloe",
-    "puff",
-    "claw",
-    "tyre",
-    "wand",
-    "taco",
-    "weld",
-    "writ",
-    "typo",
-    "damp",
-    "fern",
-    "lore",
-    "gyms",
-    "arid",
-    "jive",
-    "siam",
-    "spun",
-    "loch",
-    "balm",
-    "figs",
-    "chit",
-    "lays",
-    "drip",
-    "mans",
-    "pint",
-    "maxi",
-    "liar",
-    "opus",
-    "novo",
-    "teal",
-    "bard",
-    "reap",
-    "thor",
-    "hess",
-    "tidy",
-    "vets",
-    "bows",
-    "beau",
-    "rang",
-    "jeux",
-    "laps",
-    "pong",
-    "vows",
-    "bern",
-    "nemo",
-    "haas",
-    "skye",
-    "uefa",
-    "soar",
-    "flee",
-    "woes",
-    "stew",
-    "hush",
-    "kiev",
-    "lama",
-    "akin",
-    "dads",
-    "hays",
-    "soak",
-    "hymn",
-    "quay",
-    "weir",
-    "dram",
-    "orig",
-    "burr",
-    "slug",
-    "lira",
-    "mimi",
-    "jams",
-    "dyes",
-    "yell",
-    "fins",
-    "rake",
-    "suns",
-    "bunk",
-    "stab",
-    "dyer",
-    "dyke",
-    "seam",
-    "omit",
-    "darn",
-    "ammo",
-    "veto",
-    "clam",
-    "nerd",
-    "guts",
-    "alec",
-    "judd",
-    "bans",
-    "buds",
-    "sire",
-    "ding",
-    "coma",
-    "thug",
-    "opel",
-    "sham",
-    "loaf",
-    "skid",
-    "abel",
-    "poop",
-    "whey",
-    "curt",
-    "moth",
-    "mash",
-    "germ",
-    "voir",
-    "atop",
-    "puck",
-    "gogh",
-    "edna",
-    "moor",
-    "sway",
-    "toad",
-    "eros",
-    "olga",
-    "malt",
-    "iain",
-    "pisa",
-    "pods",
-    "clap",
-    "sera",
-    "paws",
-    "poke",
-    "zeus",
-    "dope",
-    "kiln",
-    "sous",
-    "jock",
-    "dyed",
-    "wasp",
-    "fuss",
-    "muir",
-    "swat",
-    "anus",
-    "sine",
-    "bray",
-    "roar",
-    "gall",
-    "jugs",
-    "apes",
-    "ives",
-    "kahn",
-    "bona",
-    "slit",
-    "cine",
-    "beep",
-    "toms",
-    "slid",
-    "raft",
-    "fide",
-    "brow",
-    "gels",
-    "fink",
-    "deem",
-    "flax",
-    "tart",
-    "tram",
-    "alia",
-    "iced",
-    "urdu",
-    "bile",
-    "heir",
-    "loco",
-    "baba",
-    "loom",
-    "grub",
-    "slew",
-    "duet",
-    "diem",
-    "riga",
-    "ohms",
-    "tong",
-    "muck",
-    "hoax",
-    "wary",
-    "mace",
-    "dahl",
-    "lids",
-    "pore",
-    "oily",
-    "whoa",
-    "joys",
-    "lear",
-    "grit",
-    "nays",
-    "sues",
-    "tame",
-    "oats",
-    "wilt",
-    "rolf",
-    "emit",
-    "rink",
-    "numb",
-    "scot",
-    "pave",
-    "airy",
-    "hobo",
-    "loma",
-    "hops",
-    "airs",
-    "dole",
-    "wick",
-    "owes",
-    "peat",
-    "tofu",
-    "sunk",
-    "perm",
-    "lair",
-    "lacy",
-    "wren",
-    "arcs",
-    "ayes",
-    "heed",
-    "boon",
-    "pawn",
-    "tore",
-    "dunk",
-    "snip",
-    "olaf",
-    "mutt",
-    "vide",
-    "ouch",
-    "dips",
-    "digs",
-    "womb",
-    "joss",
-    "enid",
-    "kohl",
-    "pups",
-    "lido",
-    "daft",
-    "bleu",
-    "gilt",
-    "sled",
-    "elan",
-    "milo",
-    "refs",
-    "coax",
-    "lees",
-    "alum",
-    "smut",
-    "foes",
-    "blot",
-    "imam",
-    "hove",
-    "rial",
-    "sewn",
-    "zulu",
-    "rift",
-    "turk",
-    "peep",
-    "arse",
-    "judo",
-    "manu",
-    "luxe",
-    "mays",
-    "oboe",
-    "hurd",
-    "lobe",
-    "wynn",
-    "gosh",
-    "mica",
-    "lads",
-    "sumo",
-    "inca",
-    "urea",
-    "zeal",
-    "bong",
-    "gent",
-    "hind",
-    "ache",
-    "yoke",
-    "tins",
-    "loot",
-    "gasp",
-    "tint",
-    "emil",
-    "silt",
-    "lint",
-    "blob",
-    "roam",
-    "toto",
-    "fait",
-    "stun",
-    "trey",
-    "fang",
-    "weep",
-    "gael",
-    "ergo",
-    "moan",
-    "opec",
-    "sank",
-    "bale",
-    "smog",
-    "keel",
-    "fart",
-    "cosy",
-    "seer",
-    "vial",
-    "huff",
-    "gust",
-    "doha",
-    "nell",
-    "xvii",
-    "musk",
-    "lice",
-    "skim",
-    "rune",
-    "welt",
-    "veal",
-    "rags",
-    "posh",
-    "mink",
-    "penh",
-    "itch",
-    "dill",
-    "rigs",
-    "moot",
-    "agar",
-    "rein",
-    "buoy",
-    "hive",
-    "newt",
-    "dung",
-    "lark",
-    "hoes",
-    "ruff",
-    "zoos",
-    "scum",
-    "bran",
-    "faro",
-    "giro",
-    "cots",
-    "fret",
-    "haut",
-    "gums",
-    "glib",
-    "gees",
-    "vile",
-    "brio",
-    "serb",
-    "loci",
-    "hula",
-    "foxy",
-    "putt",
-    "coon",
-    "yeas",
-    "cram",
-    "hens",
-    "hogs",
-    "tess",
-    "fray",
-    "gags",
-    "rips",
-    "sash",
-    "lire",
-    "aida",
-    "raja",
-    "boar",
-    "mite",
-    "sikh",
-    "mina",
-    "spar",
-    "chas",
-    "redo",
-    "nome",
-    "brat",
-    "aeon",
-    "wits",
-    "anew",
-    "loon",
-    "hone",
-    "sips",
-    "nuns",
-    "tuba",
-    "sinn",
-    "jest",
-    "mort",
-    "cray",
-    "repo",
-    "gnus",
-    "jolt",
-    "iona",
-    "skew",
-    "cyst",
-    "hors",
-    "fowl",
-    "pate",
-    "snug",
-    "nook",
-    "rosy",
-    "howl",
-    "hobs",
-    "ogre",
-    "baud",
-    "sped",
-    "yogi",
-    "pats",
-    "gait",
-    "meek",
-    "stow",
-    "bibs",
-    "cabs",
-    "hump",
-    "eyre",
-    "beet",
-    "geld",
-    "pegs",
-    "shay",
-    "meow",
-    "lash",
-    "ills",
-    "omen",
-    "brig",
-    "tuff",
-    "coda",
-    "defy",
-    "kwon",
-    "kilt",
-    "mise",
-    "rata",
-    "whit",
-    "coos",
-    "clog",
-    "yeti",
-    "sill",
-    "ufos",
-    "buns",
-    "dada",
-    "lain",
-    "holm",
-    "tots",
-    "tors",
-    "furl",
-    "hora",
-    "afar",
-    "leas",
-    "fawn",
-    "sess",
-    "etch",
-    "odin",
-    "iras",
-    "olin",
-    "flue",
-    "emir",
-    "kiel",
-    "mobs",
-    "anno",
-    "gout",
-    "rubs",
-    "bobs",
-    "bane",
-    "rudd",
-    "thaw",
-    "gatt",
-    "eels",
-    "shun",
-    "daze",
-    "boer",
-    "trot",
-    "fein",
-    "iata",
-    "woof",
-    "davy",
-    "wham",
-    "begs",
-    "mull",
-    "bode",
-    "urns",
-    "quid",
-    "sigs",
-    "oems",
-    "kilo",
-    "slay",
-    "thea",
-    "nods",
-    "irma",
-    "sari",
-    "mitt",
-    "yawn",
-    "feud",
-    "brut",
-    "gist",
-    "lobo",
-    "zips",
-    "mudd",
-    "tact",
-    "rife",
-    "huts",
-    "silo",
-    "eras",
-    "pugh",
-    "mend",
-    "mums",
-    "tern",
-    "lass",
-    "rota",
-    "jute",
-    "prim",
-    "pang",
-    "swag",
-    "opts",
-    "ryde",
-    "furs",
-    "whim",
-    "pied",
-    "nigh",
-    "ales",
-    "sump",
-    "zest",
-    "banc",
-    "wisp",
-    "sift",
-    "ooze",
-    "fume",
-    "brag",
-    "muff",
-    "snag",
-    "yank",
-    "shag",
-    "pict",
-    "hues",
-    "bute",
-    "lags",
-    "spat",
-    "ices",
-    "ahem",
-    "shad",
-    "wavy",
-    "crux",
-    "obit",
-    "slag",
-    "skit",
-    "malo",
-    "kcal",
-    "kelp",
-    "vamp",
-    "marg",
-    "iota",
-    "pris",
-    "bled",
-    "pita",
-    "slum",
-    "amis",
-    "doit",
-    "bala",
-    "styx",
-    "fuzz",
-    "toil",
-    "goff",
-    "pius",
-    "garb",
-    "loca",
-    "rosh",
-    "twig",
-    "mala",
-    "wept",
-    "edgy",
-    "jigs",
-    "burg",
-    "rook",
-    "pall",
-    "trig",
-    "moat",
-    "swam",
-    "hazy",
-    "hoof",
-    "sola",
-    "bess",
-    "hemi",
-    "trop",
-    "pere",
-    "lute",
-    "pram",
-    "luau",
-    "brim",
-    "chum",
-    "glut",
-    "sacs",
-    "soot",
-    "whiz",
-    "roux",
-    "vane",
-    "mane",
-    "kink",
-    "xxii",
-    "rhea",
-    "sown",
-    "beak",
-    "rung",
-    "loam",
-    "argh",
-    "romp",
-    "rasa",
-    "czar",
-    "mush",
-    "foal",
-    "gogo",
-    "noes",
-    "whew",
-    "pail",
-    "loin",
-    "leer",
-    "nave",
-    "leek",
-    "puss",
-    "oars",
-    "ital",
-    "clot",
-    "pard",
-    "soya",
-    "morn",
-    "sass",
-    "rout",
-    "aprs",
-    "ploy",
-    "magi",
-    "puke",
-    "glee",
-    "ywca",
-    "hams",
-    "hoot",
-    "kale",
-    "juke",
-    "jinx",
-    "tics",
-    "jura",
-    "suez",
-    "auld",
-    "gaul",
-    "klan",
-    "aver",
-    "pugs",
-    "tala",
-    "cols",
-    "milt",
-    "dike",
-    "wart",
-    "naps",
-    "sive",
-    "gush",
-    "reif",
-    "ogle",
-    "buss",
-    "hiss",
-    "eire",
-    "rusk",
-    "gory",
-    "bony",
-    "moll",
-    "mews",
-    "cask",
-    "brie",
-    "oxen",
-    "bums",
-    "mops",
-    "nota",
-    "fend",
-    "veer",
-    "oban",
-    "nips",
-    "bola",
-    "glob",
-    "ream",
-    "ores",
-    "boll",
-    "shim",
-    "manx",
-    "hopi",
-    "ides",
-    "gnat",
-    "amok",
-    "arty",
-    "smug",
-    "dons",
-    "awol",
-    "yule",
-    "lugs",
-    "bate",
-    "pert",
-    "tsar",
-    "cies",
-    "cosh",
-    "burp",
-    "cusp",
-    "bade",
-    "revs",
-    "eton",
-    "yolk",
-    "boos",
-    "cull",
-    "maul",
-    "ahoy",
-    "esse",
-    "yelp",
-    "gyro",
-    "seri",
-    "elba",
-    "xxiv",
-    "sear",
-    "egos",
-    "pare",
-    "axon",
-    "bord",
-    "viol",
-    "tarp",
-    "puny",
-    "fizz",
-    "foci",
-    "drab",
-    "sufi",
-    "flak",
-    "yuck",
-    "etna",
-    "quod",
-    "ably",
-    "aran",
-    "lard",
-    "hypo",
-    "mils",
-    "soit",
-    "swab",
-    "rind",
-    "burl",
-    "aden",
-    "rote",
-    "ruse",
-    "spud",
-    "inde",
-    "elms",
-    "ikon",
-    "onus",
-    "bier",
-    "lull",
-    "lino",
-    "veda",
-    "taro",
-    "elks",
-    "tutu",
-    "joie",
-    "anni",
-    "raps",
-    "goya",
-    "alms",
-    "swot",
-    "vill",
-    "asps",
-    "mote",
-    "wold",
-    "boas",
-    "idem",
-    "hark",
-    "thud",
-    "weds",
-    "epos",
-    "perk",
-    "firs",
-    "dieu",
-    "rump",
-    "modi",
-    "vela",
-    "pent",
-    "sago",
-    "rive",
-    "tabu",
-    "gawk",
-    "seta",
-    "hock",
-    "heft",
-    "lewd",
-    "dupe",
-    "bogs",
-    "tosh",
-    "rani",
-    "swig",
-    "pais",
-    "voce",
-    "bunt",
-    "fete",
-    "pows",
-    "duns",
-    "fain",
-    "pips",
-    "sirs",
-    "cowl",
-    "slat",
-    "maes",
-    "goon",
-    "hmso",
-    "pica",
-    "taut",
-    "kola",
-    "snob",
-    "crud",
-    "tine",
-    "nolo",
-    "leis",
-    "racy",
-    "awry",
-    "celt",
-    "lode",
-    "spay",
-    "zuni",
-    "kwai",
-    "clef",
-    "pelt",
-    "goof",
-    "ager",
-    "dank",
-    "zany",
-    "xxvi",
-    "toga",
-    "puns",
-    "hilt",
-    "roan",
-    "nags",
-    "wily",
-    "dodo",
-    "mots",
-    "cogs",
-    "talc",
-    "pomp",
-    "noms",
-    "spew",
-    "gulp",
-    "lurk",
-    "pend",
-    "bosh",
-    "toot",
-    "snot",
-    "hurl",
-    "dory",
-    "nary",
-    "ibex",
-    "orbs",
-    "jove",
-    "anat",
-    "razz",
-    "zing",
-    "rien",
-    "toed",
-    "scab",
-    "phew",
-    "wail",
-    "crag",
-    "eves",
-    "minx",
-    "dens",
-    "purr",
-    "nits",
-    "oust",
-    "bask",
-    "divi",
-    "gash",
-    "esau",
-    "dubs",
-    "bolo",
-    "odes",
-    "wane",
-    "oyez",
-    "fads",
-    "gens",
-    "ovum",
-    "wale",
-    "pled",
-    "huis",
-    "slaw",
-    "yoyo",
-    "nabs",
-    "whig",
-    "tugs",
-    "meld",
-    "lyre",
-    "deft",
-    "husk",
-    "hick",
-    "honk",
-    "cuss",
-    "bede",
-    "pout",
-    "mire",
-    "nama",
-    "gwyn",
-    "saps",
-    "venn",
-    "balk",
-    "sark",
-    "robs",
-    "idly",
-    "ewes",
-    "gast",
-    "paix",
-    "waxy",
-    "loos",
-    "mien",
-    "abet",
-    "kerb",
-    "curd",
-    "suva",
-    "blip",
-    "bast",
-    "bude",
-    "doss",
-    "sows",
-    "wimp",
-    "marl",
-    "moos",
-    "guar",
-    "yams",
-    "rend",
-    "quam",
-    "rots",
-    "rood",
-    "loge",
-    "whet",
-    "doer",
-    "lege",
-    "seep",
-    "rhyl",
-    "sods",
-    "leal",
-    "mota",
-    "raga",
-    "ecru",
-    "aryl",
-    "sobs",
-    "purl",
-    "sawn",
-    "wean",
-    "juju",
-    "imps",
-    "pupa",
-    "suds",
-    "gams",
-    "okra",
-    "snub",
-    "prat",
-    "dims",
-    "xxix",
-    "scud",
-    "sops",
-    "slur",
-    "uric",
-    "tusk",
-    "twee",
-    "crts",
-    "shoo",
-    "ruhr",
-    "sate",
-    "yore",
-    "slop",
-    "bozo",
-    "twos",
-    "berm",
-    "hake",
-    "gaol",
-    "tarn",
-    "unde",
-    "fags",
-    "saar",
-    "tare",
-    "gaga",
-    "flay",
-    "hots",
-    "ilex",
-    "awed",
-    "idee",
-    "twit",
-    "elbe",
-    "ruck",
-    "slog",
-    "flog",
-    "wile",
-    "duds",
-    "ouse",
-    "jinn",
-    "nunc",
-    "jure",
-    "lapp",
-    "acte",
-    "rime",
-    "goad",
-    "spry",
-    "coot",
-    "jabs",
-    "dyne",
-    "pews",
-    "brae",
-    "bata",
-    "peps",
-    "jots",
-    "plop",
-    "ripa",
-    "rohr",
-    "tans",
-    "grog",
-    "spey",
-    "runt",
-    "cede",
-    "teem",
-    "bonk",
-    "duos",
-    "suet",
-    "inky",
-    "hewn",
-    "alga",
-    "vole",
-    "ands",
-    "mbar",
-    "benj",
-    "flan",
-    "axed",
-    "jags",
-    "quip",
-    "shod",
-    "dels",
-    "iffy",
-    "wove",
-    "narr",
-    "gobi",
-    "bide",
-    "bevy",
-    "flit",
-    "dour",
-    "kegs",
-    "nosy",
-    "quia",
-    "soli",
-    "dabs",
-    "posy",
-    "kurd",
-    "rube",
-    "vend",
-    "abut",
-    "eons",
-    "teat",
-    "dais",
-    "pith",
-    "gaff",
-    "biro",
-    "chug",
-    "laud",
-    "buts",
-    "goer",
-    "peed",
-    "dred",
-    "cera",
-    "peal",
-    "molt",
-    "ipso",
-    "kook",
-    "nobs",
-    "vats",
-    "trod",
-    "nape",
-    "weft",
-    "gins",
-    "reek",
-    "wets",
-    "hums",
-    "vacs",
-    "ludo",
-    "bung",
-    "rapt",
-    "mers",
-    "leet",
-    "pees",
-    "rasp",
-    "doze",
-    "tats",
-    "dint",
-    "slav",
-    "ells",
-    "gape",
-    "reus",
-    "wows",
-    "dure",
-    "puis",
-    "quae",
-    "bole",
-    "ipsa",
-    "craw",
-    "tuft",
-    "ious",
-    "tams",
-    "nibs",
-    "ails",
-    "cued",
-    "slob",
-    "glum",
-    "apia",
-    "kayo",
-    "alai",
-    "lill",
-    "hems",
-    "divs",
-    "serf",
-    "boxy",
-    "woks",
-    "hued",
-    "refl",
-    "tunc",
-    "jamb",
-    "vidi",
-    "whys",
-    "fens",
-    "cads",
-    "lave",
-    "abed",
-    "wilf",
-    "shat",
-    "girt",
-    "juge",
-    "ures",
-    "ruts",
-    "ulan",
-    "prow",
-    "suss",
-    "dace",
-    "wags",
-    "maim",
-    "ppos",
-    "obis",
-    "espy",
-    "rums",
-    "curs",
-    "zits",
-    "gunk",
-    "vies",
-    "nisi",
-    "lope",
-    "errs",
-    "ipse",
-    "faze",
-    "ajar",
-    "mynd",
-    "fobs",
-    "irks",
-    "nosh",
-    "boor",
-    "looe",
-    "byes",
-    "alts",
-    "lout",
-    "pixy",
-    "fata",
-    "mete",
-    "lief",
-    "wads",
-    "swop",
-    "togs",
-    "jibe",
-    "haws",
-    "gobs",
-    "raze",
-    "hasp",
-    "wain",
-    "pyre",
-    "omsk",
-    "apse",
-    "cods",
-    "souk",
-    "tope",
-    "tows",
-    "dewy",
-    "weal",
-    "offa",
-    "puce",
-    "peon",
-    "epee",
-    "stet",
-    "tars",
-    "amyl",
-    "teed",
-    "yobs",
-    "emus",
-    "caws",
-    "lade",
-    "wend",
-    "mors",
-    "daps",
-    "wiry",
-    "tuts",
-    "olio",
-    "vici",
-    "dray",
-    "ebbw",
-    "haft",
-    "gits",
-    "fogs",
-    "oleo",
-    "kaki",
-    "kist",
-    "dawa",
-    "gook",
-    "loth",
-    "sibs",
-    "blab",
-    "ceng",
-    "gyre",
-    "achy",
-    "arum",
-    "clus",
-    "dyad",
-    "sags",
-    "lath",
-    "woos",
-    "uist",
-    "fuze",
-    "gild",
-    "wino",
-    "lank",
-    "cere",
-    "aced",
-    "whir",
-    "burs",
-    "plod",
-    "adit",
-    "adze",
-    "agio",
-    "agms",
-    "agog",
-    "ague",
-    "albs",
-    "alit",
-    "amax",
-    "aped",
-    "aril",
-    "arks",
-    "ashy",
-    "auks",
-    "avow",
-    "awes",
-    "awls",
-    "bawd",
-    "bawl",
-    "bilk",
-    "bleb",
-    "bogy",
-    "bops",
-    "bote",
-    "brer",
-    "bubo",
-    "bumf",
-    "busk",
-    "byre",
-    "cagy",
-    "cegb",
-    "ceps",
-    "chid",
-    "cill",
-    "civi",
-    "clew",
-    "clod",
-    "clop",
-    "cloy",
-    "cobs",
-    "coif",
-    "conk",
-    "cony",
-    "copt",
-    "corm",
-    "cvos",
-    "daub",
-    "dazy",
-    "dbes",
-    "ddss",
-    "dedi",
-    "deff",
-    "derv",
-    "dews",
-    "dhss",
-    "dica",
-    "dins",
-    "dits",
-    "dmus",
-    "doff",
-    "doli",
-    "dolt",
-    "doni",
-    "dopy",
-    "dote",
-    "doun",
-    "dozy",
-    "drat",
-    "drib",
-    "drub",
-    "dsos",
-    "ebba",
-    "ebbs",
-    "edam",
-    "efts",
-    "egad",
-    "eigg",
-    "eked",
-    "ekes",
-    "ergs",
-    "erne",
-    "esns",
-    "etui",
-    "etym",
-    "ewer",
-    "eyam",
-    "faun",
-    "feal",
-    "felo",
-    "feme",
-    "feod",
-    "ferm",
-    "fibs",
-    "fief",
-    "fisc",
-    "flab",
-    "floc",
-    "floe",
-    "flub",
-    "fogy",
-    "fops",
-    "fori",
-    "funs",
-    "gabs",
-    "gads",
-    "gamy",
-    "gars",
-    "gcmg",
-    "gebo",
-    "geed",
-    "gelt",
-    "gibe",
-    "gics",
-    "gird",
-    "glom",
-    "gnaw",
-    "gnps",
-    "gpis",
-    "guff",
-    "gyps",
-    "haec",
-    "hags",
-    "hews",
-    "hods",
-    "hoed",
-    "homy",
-    "iamb",
-    "icus",
-    "idyl",
-    "ilea",
-    "jape",
-    "jeer",
-    "jibs",
-    "jiff",
-    "jilt",
-    "jogs",
-    "jowl",
-    "juas",
-    "juts",
-    "kaia",
-    "kbes",
-    "kcmg",
-    "kepi",
-    "kerf",
-    "kips",
-    "kith",
-    "kyth",
-    "laic",
-    "lams",
-    "laye",
-    "laze",
-    "lese",
-    "lilt",
-    "limn",
-    "limy",
-    "lobs",
-    "logy",
-    "loll",
-    "lops",
-    "lour",
-    "lrun",
-    "lydd",
-    "maws",
-    "mese",
-    "mewl",
-    "mhos",
-    "miff",
-    "miry",
-    "moil",
-    "mope",
-    "moue",
-    "mown",
-    "mows",
-    "murk",
-    "musd",
-    "myna",
-    "nark",
-    "neap",
-    "nevi",
-    "nubs",
-    "oafs",
-    "oast",
-    "ocas",
-    "ocrs",
-    "ogee",
-    "omne",
-    "oohs",
-    "oozy",
-    "ouzo",
-    "oyer",
-    "pawl",
-    "pdsa",
-    "peen",
-    "peez",
-    "pelf",
-    "piny",
-    "pock",
-    "poky",
-    "pouf",
-    "prig",
-    "psbr",
-    "pule",
-    "qdos",
-    "qmon",
-    "qpac",
-    "qptr",
-    "qram",
-    "qtyp",
-    "rase",
-    "reae",
-    "reck",
-    "rids",
-    "rile",
-    "rill",
-    "rocs",
-    "roes",
-    "roil",
-    "ropy",
-    "ruat",
-    "rucs",
-    "rued",
-    "rues",
-    "ryas",
-    "ryes",
-    "sces",
-    "scow",
-    "scup",
-    "scut",
-    "sego",
-    "sere",
-    "sews",
-    "skua",
-    "sloe",
-    "slue",
-    "snit",
-    "sorb",
-    "sots",
-    "spiv",
-    "stye",
-    "sulk",
-    "sups",
-    "surd",
-    "suum",
-    "suus",
-    "swum",
-    "tads",
-    "tamp",
-    "taws",
-    "tike",
-    "toff",
-    "tuns",
-    "tuta",
-    "tyke",
-    "tyro",
-    "tzar",
-    "ugli",
-    "ulna",
-    "uxor",
-    "viam",
-    "vied",
-    "vild",
-    "viri",
-    "vulg",
-    "vult",
-    "waft",
-    "waif",
-    "wens",
-    "whop",
-    "woad",
-    "wrac",
-    "wraf",
-    "wrns",
-    "wrvs",
-    "yaks",
-    "yaps",
-    "yawl",
-    "yaws",
-    "yens",
-    "yews",
-    "yick",
-    "yips",
-    "yowl",
-    "zaps",
-    "zebu",
-    "zeds",
-    "zees",
-]
@@ -1,5789 +0,0 @@
-WORDS = [
-    "about",
-    "other",
-    "which",
-    "their",
-    "there",
-    "first",
-    "would",
-    "these",
-    "click",
-    "price",
-    "state",
-    "world",
-    "music",
-    "after",
-    "video",
-    "where",
-    "books",
-    "links",
-    "years",
-    "order",
-    "items",
-    "group",
-    "under",
-    "games",
-    "could",
-    "great",
-    "hotel",
-    "store",
-    "terms",
-    "right",
-    "local",
-    "those",
-    "using",
-    "phone",
-    "forum",
-    "based",
-    "black",
-    "check",
-    "index",
-    "being",
-    "women",
-    "today",
-    "south",
-    "pages",
-    "found",
-    "house",
-    "photo",
-    "power",
-    "while",
-    "three",
-    "total",
-    "place",
-    "think",
-    "north",
-    "posts",
-    "media",
-    "water",
-    "since",
-    "guide",
-    "board",
-    "white",
-    "small",
-    "times",
-    "sites",
-    "level",
-    "hours",
-    "image",
-    "title",
-    "shall",
-    "class",
-    "still",
-    "money",
-    "every",
-    "visit",
-    "tools",
-    "reply",
-    "value",
-    "press",
-    "learn",
-    "print",
-    "stock",
-    "point",
-    "sales",
-    "large",
-    "table",
-    "start",
-    "model",
-    "human",
-    "movie",
-    "march",
-    "yahoo",
-    "going",
-    "study",
-    "staff",
-    "again",
-    "april",
-    "never",
-    "users",
-    "topic",
-    "below",
-    "party",
-    "legal",
-    "above",
-    "quote",
-    "story",
-    "rates",
-    "young",
-    "field",
-    "paper",
-    "girls",
-    "night",
-    "texas",
-    "poker",
-    "issue",
-    "range",
-    "court",
-    "audio",
-    "light",
-    "write",
-    "offer",
-    "given",
-    "files",
-    "event",
-    "china",
-    "needs",
-    "might",
-    "month",
-    "major",
-    "areas",
-    "space",
-    "cards",
-    "child",
-    "enter",
-    "share",
-    "added",
-    "radio",
-    "until",
-    "color",
-    "track",
-    "least",
-    "trade",
-    "david",
-    "green",
-    "close",
-    "drive",
-    "short",
-    "means",
-    "daily",
-    "beach",
-    "costs",
-    "style",
-    "front",
-    "parts",
-    "early",
-    "miles",
-    "sound",
-    "works",
-    "rules",
-    "final",
-    "adult",
-    "thing",
-    "cheap",
-    "third",
-    "gifts",
-    "cover",
-    "often",
-    "watch",
-    "deals",
-    "words",
-    "james",
-    "heart",
-    "error",
-    "clear",
-    "makes",
-    "india",
-    "taken",
-    "known",
-    "cases",
-    "quick",
-    "whole",
-    "later",
-    "basic",
-    "shows",
-    "along",
-    "among",
-    "death",
-    "speed",
-    "brand",
-    "stuff",
-    "japan",
-    "doing",
-    "loans",
-    "shoes",
-    "entry",
-    "notes",
-    "force",
-    "river",
-    "album",
-    "views",
-    "plans",
-    "build",
-    "types",
-    "lines",
-    "apply",
-    "asked",
-    "cross",
-    "weeks",
-    "lower",
-    "union",
-    "names",
-    "leave",
-    "teens",
-    "woman",
-    "cable",
-    "score",
-    "shown",
-    "flash",
-    "ideas",
-    "allow",
-    "homes",
-    "super",
-    "asian",
-    "cause",
-    "focus",
-    "rooms",
-    "voice",
-    "comes",
-    "brown",
-    "forms",
-    "glass",
-    "happy",
-    "smith",
-    "thank",
-    "prior",
-    "sport",
-    "ready",
-    "round",
-    "built",
-    "blood",
-    "earth",
-    "italy",
-    "basis",
-    "award",
-    "peter",
-    "extra",
-    "pussy",
-    "rated",
-    "quite",
-    "horse",
-    "stars",
-    "lists",
-    "owner",
-    "takes",
-    "bring",
-    "input",
-    "agent",
-    "valid",
-    "grand",
-    "trial",
-    "units",
-    "wrote",
-    "ships",
-    "metal",
-    "funds",
-    "guest",
-    "seems",
-    "trust",
-    "multi",
-    "grade",
-    "panel",
-    "floor",
-    "match",
-    "plant",
-    "sense",
-    "stage",
-    "goods",
-    "maybe",
-    "spain",
-    "youth",
-    "break",
-    "dance",
-    "apple",
-    "enjoy",
-    "block",
-    "civil",
-    "steel",
-    "songs",
-    "fixed",
-    "wrong",
-    "hands",
-    "paris",
-    "fully",
-    "worth",
-    "peace",
-    "coast",
-    "grant",
-    "agree",
-    "scale",
-    "stand",
-    "frame",
-    "chief",
-    "gives",
-    "heard",
-    "begin",
-    "royal",
-    "clean",
-    "bible",
-    "suite",
-    "vegas",
-    "chris",
-    "piece",
-    "sheet",
-    "seven",
-    "older",
-    "cells",
-    "looks",
-    "calls",
-    "whose",
-    "naked",
-    "lives",
-    "stone",
-    "tests",
-    "buyer",
-    "steve",
-    "label",
-    "scott",
-    "canon",
-    "waste",
-    "chair",
-    "phase",
-    "motor",
-    "shirt",
-    "crime",
-    "count",
-    "claim",
-    "patch",
-    "santa",
-    "alone",
-    "jones",
-    "saint",
-    "drugs",
-    "joint",
-    "fresh",
-    "dates",
-    "upper",
-    "prime",
-    "limit",
-    "began",
-    "louis",
-    "steps",
-    "shops",
-    "creek",
-    "urban",
-    "tours",
-    "labor",
-    "heavy",
-    "solid",
-    "theme",
-    "porno",
-    "touch",
-    "goals",
-    "serve",
-    "magic",
-    "mount",
-    "smart",
-    "latin",
-    "avoid",
-    "birth",
-    "virus",
-    "abuse",
-    "facts",
-    "faith",
-    "chain",
-    "moved",
-    "reach",
-    "sorry",
-    "gamma",
-    "truth",
-    "films",
-    "owned",
-    "draft",
-    "chart",
-    "jesus",
-    "clubs",
-    "equal",
-    "codes",
-    "kinds",
-    "teams",
-    "funny",
-    "tried",
-    "named",
-    "laser",
-    "harry",
-    "taxes",
-    "mouse",
-    "brain",
-    "dream",
-    "false",
-    "falls",
-    "carry",
-    "hello",
-    "clips",
-    "brief",
-    "ended",
-    "eight",
-    "wants",
-    "alert",
-    "queen",
-    "sweet",
-    "diego",
-    "truck",
-    "votes",
-    "ocean",
-    "signs",
-    "depth",
-    "train",
-    "feeds",
-    "route",
-    "frank",
-    "speak",
-    "query",
-    "rural",
-    "judge",
-    "bytes",
-    "fight",
-    "filed",
-    "korea",
-    "banks",
-    "kelly",
-    "leads",
-    "brian",
-    "miami",
-    "wales",
-    "minor",
-    "noted",
-    "spent",
-    "davis",
-    "helps",
-    "cycle",
-    "sleep",
-    "scene",
-    "drink",
-    "intel",
-    "rings",
-    "henry",
-    "guess",
-    "ahead",
-    "delta",
-    "alpha",
-    "bonus",
-    "adobe",
-    "trees",
-    "dress",
-    "refer",
-    "babes",
-    "layer",
-    "spend",
-    "clock",
-    "ratio",
-    "proof",
-    "empty",
-    "maine",
-    "ideal",
-    "specs",
-    "parks",
-    "cream",
-    "boxes",
-    "hills",
-    "aware",
-    "shape",
-    "irish",
-    "firms",
-    "usage",
-    "mixed",
-    "exist",
-    "wheel",
-    "angel",
-    "width",
-    "noise",
-    "array",
-    "greek",
-    "sharp",
-    "occur",
-    "knows",
-    "coach",
-    "kevin",
-    "plate",
-    "logic",
-    "sizes",
-    "plain",
-    "costa",
-    "trail",
-    "buddy",
-    "blues",
-    "scope",
-    "crazy",
-    "bears",
-    "mouth",
-    "meter",
-    "fruit",
-    "lewis",
-    "sugar",
-    "stick",
-    "allen",
-    "genre",
-    "slide",
-    "exact",
-    "bound",
-    "storm",
-    "micro",
-    "dolls",
-    "paint",
-    "delay",
-    "pilot",
-    "czech",
-    "novel",
-    "ultra",
-    "idaho",
-    "plays",
-    "truly",
-    "lodge",
-    "boobs",
-    "broad",
-    "swiss",
-    "sarah",
-    "clark",
-    "foods",
-    "guard",
-    "newly",
-    "raise",
-    "drama",
-    "bands",
-    "lunch",
-    "audit",
-    "polls",
-    "tower",
-    "yours",
-    "jason",
-    "shell",
-    "solar",
-    "catch",
-    "doubt",
-    "tasks",
-    "doors",
-    "forth",
-    "bruce",
-    "split",
-    "twice",
-    "egypt",
-    "shift",
-    "simon",
-    "marks",
-    "loved",
-    "birds",
-    "saved",
-    "shots",
-    "moore",
-    "treat",
-    "piano",
-    "risks",
-    "ports",
-    "teach",
-    "rapid",
-    "hairy",
-    "dutch",
-    "boots",
-    "holds",
-    "pulse",
-    "metro",
-    "strip",
-    "pearl",
-    "penis",
-    "heads",
-    "logos",
-    "honda",
-    "bills",
-    "opera",
-    "asset",
-    "blank",
-    "humor",
-    "lived",
-    "tight",
-    "meant",
-    "plane",
-    "meets",
-    "tampa",
-    "grace",
-    "susan",
-    "adams",
-    "villa",
-    "inner",
-    "roman",
-    "taste",
-    "trips",
-    "sides",
-    "turns",
-    "cache",
-    "lease",
-    "proud",
-    "giant",
-    "seats",
-    "alarm",
-    "usual",
-    "angle",
-    "vinyl",
-    "worst",
-    "honor",
-    "eagle",
-    "pants",
-    "nurse",
-    "quiet",
-    "comic",
-    "crown",
-    "maker",
-    "crack",
-    "picks",
-    "smoke",
-    "craft",
-    "apart",
-    "blind",
-    "coins",
-    "gross",
-    "epson",
-    "actor",
-    "finds",
-    "fifth",
-    "prize",
-    "dirty",
-    "wayne",
-    "alive",
-    "prove",
-    "wings",
-    "ridge",
-    "modem",
-    "larry",
-    "skill",
-    "moves",
-    "throw",
-    "trend",
-    "rhode",
-    "worse",
-    "boats",
-    "tells",
-    "fiber",
-    "graph",
-    "talks",
-    "bonds",
-    "fraud",
-    "roger",
-    "crash",
-    "inter",
-    "grove",
-    "spray",
-    "roads",
-    "faces",
-    "cocks",
-    "mayor",
-    "yield",
-    "hence",
-    "radar",
-    "lakes",
-    "diary",
-    "kings",
-    "flags",
-    "baker",
-    "shock",
-    "walls",
-    "ebony",
-    "drawn",
-    "beast",
-    "dodge",
-    "pizza",
-    "yards",
-    "woods",
-    "jokes",
-    "globe",
-    "kerry",
-    "ghost",
-    "pride",
-    "keith",
-    "linda",
-    "chile",
-    "maria",
-    "brass",
-    "plaza",
-    "quest",
-    "trans",
-    "booty",
-    "acres",
-    "venue",
-    "vital",
-    "excel",
-    "modes",
-    "enemy",
-    "wells",
-    "opens",
-    "lucky",
-    "thick",
-    "iraqi",
-    "vista",
-    "chips",
-    "terry",
-    "flood",
-    "arena",
-    "grown",
-    "jerry",
-    "smile",
-    "lands",
-    "armed",
-    "laura",
-    "tokyo",
-    "candy",
-    "pills",
-    "tiger",
-    "folks",
-    "balls",
-    "boost",
-    "icons",
-    "moral",
-    "keeps",
-    "pound",
-    "roses",
-    "bread",
-    "tough",
-    "chest",
-    "billy",
-    "craig",
-    "solve",
-    "nancy",
-    "tones",
-    "sight",
-    "towns",
-    "worry",
-    "reads",
-    "roles",
-    "glory",
-    "saudi",
-    "fault",
-    "karen",
-    "jimmy",
-    "rugby",
-    "fluid",
-    "barry",
-    "devil",
-    "grass",
-    "marie",
-    "kenya",
-    "sized",
-    "theft",
-    "swing",
-    "dated",
-    "shoot",
-    "elite",
-    "poems",
-    "robot",
-    "winds",
-    "gnome",
-    "roots",
-    "noble",
-    "shore",
-    "loves",
-    "loose",
-    "slots",
-    "rocks",
-    "genes",
-    "horny",
-    "hosts",
-    "atlas",
-    "feels",
-    "ralph",
-    "corps",
-    "liver",
-    "decor",
-    "texts",
-    "evans",
-    "fails",
-    "aging",
-    "alice",
-    "intro",
-    "clerk",
-    "mills",
-    "jeans",
-    "fonts",
-    "favor",
-    "sigma",
-    "aside",
-    "essay",
-    "camps",
-    "aaron",
-    "trace",
-    "packs",
-    "spoke",
-    "arrow",
-    "rough",
-    "weird",
-    "holes",
-    "blade",
-    "meals",
-    "robin",
-    "strap",
-    "crowd",
-    "cloud",
-    "valve",
-    "knife",
-    "shelf",
-    "liked",
-    "adopt",
-    "outer",
-    "tales",
-    "islam",
-    "nodes",
-    "seeds",
-    "cited",
-    "tired",
-    "steam",
-    "acute",
-    "stood",
-    "carol",
-    "stack",
-    "curve",
-    "amber",
-    "trunk",
-    "waves",
-    "camel",
-    "lamps",
-    "juice",
-    "chase",
-    "sauce",
-    "beads",
-    "flows",
-    "fewer",
-    "proxy",
-    "lanka",
-    "voted",
-    "bikes",
-    "gates",
-    "slave",
-    "combo",
-    "haven",
-    "charm",
-    "basin",
-    "ranch",
-    "drunk",
-    "toner",
-    "latex",
-    "delhi",
-    "alien",
-    "broke",
-    "nepal",
-    "nylon",
-    "discs",
-    "rocky",
-    "fleet",
-    "bunch",
-    "cents",
-    "omega",
-    "civic",
-    "saver",
-    "grill",
-    "grain",
-    "seeks",
-    "gains",
-    "spots",
-    "salon",
-    "turbo",
-    "aimed",
-    "reset",
-    "brush",
-    "spare",
-    "kodak",
-    "skirt",
-    "honey",
-    "gauge",
-    "faced",
-    "sixth",
-    "farms",
-    "cheat",
-    "sandy",
-    "macro",
-    "laugh",
-    "pitch",
-    "autos",
-    "perry",
-    "dozen",
-    "teeth",
-    "cloth",
-    "stamp",
-    "lotus",
-    "cargo",
-    "salem",
-    "likes",
-    "tapes",
-    "zones",
-    "races",
-    "maple",
-    "depot",
-    "blend",
-    "julie",
-    "janet",
-    "probe",
-    "helen",
-    "debug",
-    "chuck",
-    "bingo",
-    "minds",
-    "sunny",
-    "leeds",
-    "cedar",
-    "blair",
-    "hopes",
-    "mason",
-    "burns",
-    "pumps",
-    "mario",
-    "pairs",
-    "chose",
-    "blast",
-    "tommy",
-    "brake",
-    "congo",
-    "olive",
-    "clone",
-    "dicks",
-    "relay",
-    "tears",
-    "oasis",
-    "angry",
-    "lover",
-    "rolls",
-    "malta",
-    "daddy",
-    "ferry",
-    "omaha",
-    "loads",
-    "motel",
-    "rally",
-    "dying",
-    "stuck",
-    "stops",
-    "vocal",
-    "organ",
-    "lemon",
-    "toxic",
-    "bench",
-    "rider",
-    "butts",
-    "bobby",
-    "sheep",
-    "wines",
-    "salad",
-    "paste",
-    "katie",
-    "relax",
-    "sword",
-    "sells",
-    "coral",
-    "pixel",
-    "float",
-    "colin",
-    "paths",
-    "acids",
-    "dairy",
-    "admit",
-    "fancy",
-    "samoa",
-    "squad",
-    "wages",
-    "males",
-    "chaos",
-    "wheat",
-    "bases",
-    "unity",
-    "bride",
-    "begun",
-    "socks",
-    "essex",
-    "fever",
-    "drums",
-    "rover",
-    "flame",
-    "tanks",
-    "spell",
-    "emily",
-    "annex",
-    "sudan",
-    "sluts",
-    "hints",
-    "wired",
-    "elvis",
-    "argue",
-    "arise",
-    "jamie",
-    "bitch",
-    "chess",
-    "oscar",
-    "menus",
-    "canal",
-    "amino",
-    "herbs",
-    "lying",
-    "drill",
-    "bryan",
-    "hobby",
-    "tries",
-    "trick",
-    "drops",
-    "wider",
-    "screw",
-    "blame",
-    "fifty",
-    "uncle",
-    "jacob",
-    "randy",
-    "brick",
-    "naval",
-    "donna",
-    "cabin",
-    "fired",
-    "perth",
-    "syria",
-    "klein",
-    "tires",
-    "retro",
-    "anger",
-    "suits",
-    "glenn",
-    "handy",
-    "crops",
-    "guild",
-    "tribe",
-    "batch",
-    "alter",
-    "ghana",
-    "edges",
-    "twins",
-    "amend",
-    "chick",
-    "thong",
-    "medal",
-    "walks",
-    "sucks",
-    "booth",
-    "bones",
-    "breed",
-    "polar",
-    "carey",
-    "danny",
-    "patio",
-    "lloyd",
-    "beans",
-    "ellis",
-    "snake",
-    "julia",
-    "berry",
-    "ought",
-    "fixes",
-    "sends",
-    "mazda",
-    "timer",
-    "tyler",
-    "verse",
-    "highs",
-    "ellen",
-    "racks",
-    "nasty",
-    "tumor",
-    "watts",
-    "forty",
-    "tubes",
-    "queue",
-    "skins",
-    "exams",
-    "welsh",
-    "belly",
-    "haiti",
-    "elder",
-    "sonic",
-    "thumb",
-    "twist",
-    "ranks",
-    "debut",
-    "volvo",
-    "penny",
-    "ivory",
-    "alias",
-    "newer",
-    "spice",
-    "ascii",
-    "donor",
-    "trash",
-    "manor",
-    "diane",
-    "disco",
-    "minus",
-    "milan",
-    "shade",
-    "digit",
-    "lions",
-    "pools",
-    "lyric",
-    "grave",
-    "devon",
-    "saves",
-    "lobby",
-    "punch",
-    "karma",
-    "betty",
-    "lucas",
-    "mardi",
-    "shake",
-    "holly",
-    "silly",
-    "mercy",
-    "fence",
-    "diana",
-    "shame",
-    "fatal",
-    "flesh",
-    "jesse",
-    "qatar",
-    "sheer",
-    "witch",
-    "cohen",
-    "puppy",
-    "kathy",
-    "smell",
-    "satin",
-    "promo",
-    "tunes",
-    "lucia",
-    "nerve",
-    "renew",
-    "locks",
-    "euros",
-    "rebel",
-    "hired",
-    "hindu",
-    "kills",
-    "slope",
-    "nails",
-    "rides",
-    "merit",
-    "disks",
-    "condo",
-    "fairy",
-    "shaft",
-    "kitty",
-    "drain",
-    "fires",
-    "panic",
-    "onion",
-    "beats",
-    "merry",
-    "scuba",
-    "verde",
-    "dried",
-    "derby",
-    "annie",
-    "derek",
-    "steal",
-    "fears",
-    "tuner",
-    "alike",
-    "scout",
-    "dealt",
-    "bucks",
-    "badge",
-    "wrist",
-    "heath",
-    "realm",
-    "jenny",
-    "yemen",
-    "buses",
-    "rouge",
-    "yeast",
-    "kenny",
-    "yukon",
-    "singh",
-    "brook",
-    "wives",
-    "xerox",
-    "sorts",
-    "papua",
-    "armor",
-    "viral",
-    "pipes",
-    "laden",
-    "aruba",
-    "merge",
-    "edgar",
-    "dubai",
-    "allan",
-    "sperm",
-    "craps",
-    "frost",
-    "sally",
-    "yacht",
-    "tracy",
-    "whale",
-    "shark",
-    "grows",
-    "cliff",
-    "tract",
-    "shine",
-    "wendy",
-    "ozone",
-    "pasta",
-    "serum",
-    "swift",
-    "focal",
-    "samba",
-    "wound",
-    "belle",
-    "cindy",
-    "lined",
-    "boxed",
-    "cubic",
-    "spies",
-    "elect",
-    "bunny",
-    "flyer",
-    "baths",
-    "emacs",
-    "climb",
-    "dover",
-    "token",
-    "dylan",
-    "belts",
-    "burke",
-    "flush",
-    "hayes",
-    "moses",
-    "johns",
-    "jewel",
-    "teddy",
-    "dryer",
-    "ruled",
-    "funky",
-    "joins",
-    "scary",
-    "cakes",
-    "mixer",
-    "tooth",
-    "stays",
-    "drove",
-    "upset",
-    "mines",
-    "lance",
-    "colon",
-    "lanes",
-    "purse",
-    "align",
-    "bless",
-    "crest",
-    "alloy",
-    "plots",
-    "casey",
-    "draws",
-    "bloom",
-    "loops",
-    "surge",
-    "souls",
-    "spank",
-    "vault",
-    "wires",
-    "mails",
-    "blake",
-    "orbit",
-    "niger",
-    "bacon",
-    "spine",
-    "trout",
-    "fatty",
-    "joyce",
-    "marco",
-    "isaac",
-    "oxide",
-    "badly",
-    "scoop",
-    "blink",
-    "tiles",
-    "tamil",
-    "fuzzy",
-    "grams",
-    "forge",
-    "dense",
-    "brave",
-    "awful",
-    "whore",
-    "wagon",
-    "knock",
-    "peers",
-    "quilt",
-    "mambo",
-    "flour",
-    "choir",
-    "blond",
-    "burst",
-    "fibre",
-    "daisy",
-    "crude",
-    "bored",
-    "allah",
-    "fares",
-    "hoped",
-    "safer",
-    "marsh",
-    "ricky",
-    "theta",
-    "stake",
-    "arbor",
-    "rifle",
-    "bulbs",
-    "waist",
-    "sewer",
-    "bosch",
-    "vitro",
-    "romeo",
-    "turks",
-    "demos",
-    "sided",
-    "cuban",
-    "resin",
-    "linen",
-    "seals",
-    "decay",
-    "usher",
-    "skate",
-    "lynch",
-    "franc",
-    "timor",
-    "flats",
-    "heels",
-    "voter",
-    "urine",
-    "capri",
-    "towel",
-    "sears",
-    "flies",
-    "crane",
-    "habit",
-    "coupe",
-    "benin",
-    "lords",
-    "tends",
-    "sixty",
-    "spark",
-    "spike",
-    "tonga",
-    "backs",
-    "soils",
-    "hunks",
-    "libya",
-    "sedan",
-    "cares",
-    "flora",
-    "hardy",
-    "bells",
-    "denim",
-    "buick",
-    "doses",
-    "baked",
-    "glove",
-    "plush",
-    "weber",
-    "urged",
-    "brent",
-    "kyoto",
-    "adapt",
-    "fuels",
-    "paula",
-    "stern",
-    "shawn",
-    "tutor",
-    "idiot",
-    "debit",
-    "edits",
-    "raven",
-    "slice",
-    "aspen",
-    "lemma",
-    "venus",
-    "dolby",
-    "halls",
-    "pause",
-    "demon",
-    "gabon",
-    "asses",
-    "couch",
-    "downs",
-    "rogue",
-    "optic",
-    "chili",
-    "grief",
-    "sweat",
-    "masks",
-    "quake",
-    "alley",
-    "twain",
-    "boise",
-    "nevis",
-    "loyal",
-    "renal",
-    "spite",
-    "imply",
-    "chill",
-    "liner",
-    "lifts",
-    "vivid",
-    "acted",
-    "byron",
-    "skull",
-    "riley",
-    "sands",
-    "steak",
-    "cobra",
-    "gucci",
-    "threw",
-    "ninth",
-    "marry",
-    "wills",
-    "atoms",
-    "drake",
-    "rails",
-    "fried",
-    "cairo",
-    "malls",
-    "woody",
-    "cried",
-    "plugs",
-    "coded",
-    "supra",
-    "molly",
-    "rival",
-    "beige",
-    "homer",
-    "gases",
-    "genus",
-    "dixon",
-    "debts",
-    "myths",
-    "knees",
-    "poets",
-    "woven",
-    "trent",
-    "rigid",
-    "salsa",
-    "blown",
-    "baton",
-    "abbey",
-    "bruno",
-    "diets",
-    "sauna",
-    "bauer",
-    "bowls",
-    "kitts",
-    "cruel",
-    "eager",
-    "pupil",
-    "feast",
-    "ankle",
-    "decks",
-    "blunt",
-    "react",
-    "rises",
-    "shane",
-    "coats",
-    "aston",
-    "fairs",
-    "flute",
-    "hindi",
-    "harsh",
-    "burma",
-    "cease",
-    "poles",
-    "sioux",
-    "equip",
-    "hedge",
-    "curry",
-    "worms",
-    "pouch",
-    "hooks",
-    "peaks",
-    "spoon",
-    "bombs",
-    "niche",
-    "cigar",
-    "curse",
-    "titan",
-    "anita",
-    "shout",
-    "nudes",
-    "straw",
-    "reuse",
-    "loses",
-    "suede",
-    "peach",
-    "uncut",
-    "stove",
-    "nixon",
-    "freak",
-    "bluff",
-    "sadly",
-    "avail",
-    "hatch",
-    "stein",
-    "spill",
-    "drift",
-    "crisp",
-    "scans",
-    "onset",
-    "assay",
-    "leigh",
-    "tents",
-    "snack",
-    "pulls",
-    "squid",
-    "maxim",
-    "slate",
-    "pagan",
-    "widow",
-    "skies",
-    "kicks",
-    "canoe",
-    "juicy",
-    "moody",
-    "pedal",
-    "tuned",
-    "geoff",
-    "scrap",
-    "terra",
-    "vapor",
-    "aloud",
-    "goose",
-    "hydro",
-    "playa",
-    "noisy",
-    "abide",
-    "bliss",
-    "parse",
-    "jelly",
-    "mania",
-    "edwin",
-    "clare",
-    "bolts",
-    "typed",
-    "satan",
-    "megan",
-    "cheer",
-    "clamp",
-    "grape",
-    "deeds",
-    "traps",
-    "racer",
-    "guilt",
-    "sweep",
-    "doyle",
-    "ducks",
-    "lunar",
-    "posed",
-    "forks",
-    "boxer",
-    "weigh",
-    "rodeo",
-    "moose",
-    "crush",
-    "cathy",
-    "paulo",
-    "lever",
-    "tasty",
-    "rants",
-    "tarot",
-    "carts",
-    "cocoa",
-    "mixes",
-    "panty",
-    "aires",
-    "bulls",
-    "orion",
-    "hurry",
-    "clash",
-    "biker",
-    "stain",
-    "reign",
-    "baron",
-    "bates",
-    "stiff",
-    "rabbi",
-    "sushi",
-    "puffy",
-    "elbow",
-    "stark",
-    "circa",
-    "razor",
-    "cough",
-    "tibet",
-    "isles",
-    "ovens",
-    "inlet",
-    "bronx",
-    "gloss",
-    "panda",
-    "porch",
-    "eaten",
-    "sinks",
-    "steep",
-    "dinar",
-    "creed",
-    "carat",
-    "nobel",
-    "faxes",
-    "plump",
-    "midst",
-    "borne",
-    "tempo",
-    "payne",
-    "torch",
-    "hacks",
-    "attic",
-    "piper",
-    "stems",
-    "avery",
-    "tenth",
-    "desks",
-    "aided",
-    "notch",
-    "seoul",
-    "lacks",
-    "bowie",
-    "poses",
-    "scent",
-    "akron",
-    "fines",
-    "grasp",
-    "ounce",
-    "toast",
-    "kinky",
-    "quota",
-    "versa",
-    "jumbo",
-    "maths",
-    "flint",
-    "dummy",
-    "awake",
-    "burnt",
-    "studs",
-    "roast",
-    "petty",
-    "felix",
-    "shiny",
-    "smash",
-    "ample",
-    "royce",
-    "scarf",
-    "hated",
-    "spicy",
-    "fools",
-    "beard",
-    "wedge",
-    "peggy",
-    "ruins",
-    "denis",
-    "hyper",
-    "cites",
-    "savvy",
-    "norms",
-    "prima",
-    "fetal",
-    "palms",
-    "chord",
-    "hawks",
-    "irons",
-    "comet",
-    "lotto",
-    "syrup",
-    "erase",
-    "bites",
-    "prose",
-    "swear",
-    "intra",
-    "clown",
-    "taboo",
-    "dwarf",
-    "pines",
-    "fucks",
-    "urges",
-    "pablo",
-    "beams",
-    "props",
-    "dough",
-    "stool",
-    "welch",
-    "horde",
-    "mommy",
-    "nanny",
-    "roach",
-    "angus",
-    "ashes",
-    "natal",
-    "locus",
-    "elton",
-    "prone",
-    "clues",
-    "crews",
-    "timed",
-    "scare",
-    "thief",
-    "motif",
-    "hurts",
-    "sofia",
-    "spear",
-    "nigel",
-    "blanc",
-    "birch",
-    "slash",
-    "mikes",
-    "seiko",
-    "helix",
-    "dixie",
-    "shook",
-    "matte",
-    "zebra",
-    "fetch",
-    "unite",
-    "shear",
-    "ponds",
-    "trump",
-    "mates",
-    "avian",
-    "visas",
-    "champ",
-    "recap",
-    "crawl",
-    "flaws",
-    "hazel",
-    "messy",
-    "rupee",
-    "irene",
-    "lungs",
-    "jacks",
-    "stole",
-    "quasi",
-    "exile",
-    "anglo",
-    "knots",
-    "anton",
-    "gerry",
-    "kappa",
-    "jumps",
-    "snoop",
-    "vague",
-    "wraps",
-    "rusty",
-    "warns",
-    "sting",
-    "bravo",
-    "liter",
-    "basil",
-    "paced",
-    "renee",
-    "giles",
-    "shack",
-    "sleek",
-    "monty",
-    "cafes",
-    "hitch",
-    "nexus",
-    "tango",
-    "ernst",
-    "sings",
-    "carte",
-    "queer",
-    "pains",
-    "kuala",
-    "comma",
-    "avant",
-    "perez",
-    "torah",
-    "freed",
-    "cheek",
-    "gavin",
-    "lasts",
-    "bowel",
-    "chats",
-    "mafia",
-    "lilly",
-    "shire",
-    "lyons",
-    "scams",
-    "lipid",
-    "clyde",
-    "irwin",
-    "mains",
-    "misty",
-    "prism",
-    "rests",
-    "vegan",
-    "groom",
-    "weeds",
-    "beers",
-    "clive",
-    "fills",
-    "grips",
-    "kayak",
-    "altar",
-    "gears",
-    "risen",
-    "rhino",
-    "eaton",
-    "ruler",
-    "swept",
-    "troop",
-    "arose",
-    "becky",
-    "klaus",
-    "hogan",
-    "debra",
-    "corey",
-    "slips",
-    "trays",
-    "flock",
-    "boris",
-    "shave",
-    "swamp",
-    "faint",
-    "gland",
-    "blows",
-    "stoke",
-    "kauai",
-    "nasal",
-    "nitro",
-    "loser",
-    "claus",
-    "jolly",
-    "femme",
-    "siege",
-    "wolfe",
-    "tyres",
-    "butte",
-    "hicks",
-    "pratt",
-    "chalk",
-    "negro",
-    "wrath",
-    "grind",
-    "clint",
-    "blitz",
-    "osaka",
-    "cooks",
-    "rainy",
-    "pluto",
-    "viola",
-    "rumor",
-    "volts",
-    "diver",
-    "blaze",
-    "wreck",
-    "sammy",
-    "arabs",
-    "hoops",
-    "lynne",
-    "horns",
-    "naomi",
-    "risky",
-    "crete",
-    "tulip",
-    "owing",
-    "benny",
-    "annum",
-    "ropes",
-    "morse",
-    "cords",
-    "ditch",
-    "slick",
-    "chunk",
-    "reels",
-    "slept",
-    "waits",
-    "tenor",
-    "scrub",
-    "cello",
-    "caves",
-    "metre",
-    "topaz",
-    "soaps",
-    "gibbs",
-    "dusty",
-    "patty",
-    "crate",
-    "cared",
-    "sworn",
-    "beech",
-    "frogs",
-    "agnes",
-    "maori",
-    "tense",
-    "basel",
-    "decal",
-    "temps",
-    "fritz",
-    "mover",
-    "erica",
-    "betsy",
-    "shaun",
-    "fauna",
-    "spurs",
-    "darts",
-    "tails",
-    "hangs",
-    "quark",
-    "veins",
-    "folds",
-    "sneak",
-    "octet",
-    "mccoy",
-    "willy",
-    "edith",
-    "magna",
-    "polly",
-    "tidal",
-    "jules",
-    "ernie",
-    "poole",
-    "crust",
-    "dolly",
-    "miner",
-    "cecil",
-    "cajun",
-    "diner",
-    "regis",
-    "mound",
-    "ibiza",
-    "chefs",
-    "scion",
-    "hoods",
-    "wears",
-    "regal",
-    "alvin",
-    "curly",
-    "hound",
-    "wharf",
-    "flick",
-    "datum",
-    "maize",
-    "banff",
-    "psalm",
-    "gowns",
-    "luton",
-    "leaks",
-    "swell",
-    "irony",
-    "levin",
-    "viper",
-    "gypsy",
-    "litre",
-    "binds",
-    "titus",
-    "flare",
-    "wight",
-    "crank",
-    "goats",
-    "rains",
-    "brace",
-    "garth",
-    "argus",
-    "mango",
-    "thigh",
-    "meats",
-    "windy",
-    "alamo",
-    "steer",
-    "vogue",
-    "aired",
-    "vodka",
-    "zaire",
-    "knobs",
-    "salts",
-    "soups",
-    "moist",
-    "pests",
-    "doris",
-    "petit",
-    "fries",
-    "saxon",
-    "stall",
-    "deere",
-    "serif",
-    "monks",
-    "aloha",
-    "utter",
-    "rents",
-    "cater",
-    "colts",
-    "dunes",
-    "pinch",
-    "flynn",
-    "troll",
-    "filth",
-    "kraft",
-    "algae",
-    "arden",
-    "shady",
-    "erect",
-    "vests",
-    "lydia",
-    "valet",
-    "eliot",
-    "jihad",
-    "elgin",
-    "jonah",
-    "raped",
-    "plato",
-    "taxis",
-    "hates",
-    "hague",
-    "tammy",
-    "madam",
-    "tease",
-    "aroma",
-    "rowan",
-    "dwell",
-    "stair",
-    "sonny",
-    "rotor",
-    "quart",
-    "bison",
-    "fungi",
-    "greed",
-    "bleed",
-    "incur",
-    "cores",
-    "nifty",
-    "leroy",
-    "dukes",
-    "fudge",
-    "homme",
-    "weave",
-    "vicki",
-    "exits",
-    "dante",
-    "cured",
-    "buggy",
-    "slack",
-    "vines",
-    "gorge",
-    "liens",
-    "boyle",
-    "cages",
-    "pager",
-    "banjo",
-    "stout",
-    "hanna",
-    "pepsi",
-    "adler",
-    "stare",
-    "missy",
-    "flair",
-    "aisle",
-    "limbs",
-    "paved",
-    "scots",
-    "tyson",
-    "seize",
-    "spawn",
-    "epoxy",
-    "stony",
-    "crypt",
-    "bogus",
-    "faded",
-    "mobil",
-    "tying",
-    "diode",
-    "motto",
-    "alton",
-    "deter",
-    "furry",
-    "cubes",
-    "rinse",
-    "tides",
-    "venom",
-    "mummy",
-    "cries",
-    "ether",
-    "sheds",
-    "sofas",
-    "haute",
-    "wacky",
-    "reits",
-    "muddy",
-    "shalt",
-    "visor",
-    "naive",
-    "hires",
-    "merck",
-    "tanya",
-    "folio",
-    "fiery",
-    "fakes",
-    "acorn",
-    "bayer",
-    "basal",
-    "wilde",
-    "smoky",
-    "flirt",
-    "slang",
-    "finch",
-    "largo",
-    "tally",
-    "creep",
-    "agile",
-    "sacks",
-    "kiosk",
-    "ionic",
-    "stray",
-    "poppy",
-    "turin",
-    "forte",
-    "hanoi",
-    "waive",
-    "vance",
-    "greet",
-    "lymph",
-    "latch",
-    "verbs",
-    "drank",
-    "santo",
-    "torso",
-    "grabs",
-    "wards",
-    "hinge",
-    "faire",
-    "stunt",
-    "maven",
-    "vitae",
-    "witty",
-    "hertz",
-    "flown",
-    "silky",
-    "micah",
-    "repay",
-    "await",
-    "fetus",
-    "cider",
-    "gangs",
-    "lenny",
-    "percy",
-    "lilac",
-    "sinus",
-    "hears",
-    "pivot",
-    "huron",
-    "glide",
-    "creme",
-    "waltz",
-    "paige",
-    "blush",
-    "malay",
-    "modal",
-    "cadet",
-    "opted",
-    "tweak",
-    "trait",
-    "eater",
-    "cymru",
-    "hides",
-    "synth",
-    "nazis",
-    "piles",
-    "bezel",
-    "havoc",
-    "sling",
-    "rican",
-    "tummy",
-    "axial",
-    "epoch",
-    "plaid",
-    "fable",
-    "scars",
-    "susie",
-    "pesos",
-    "spans",
-    "obese",
-    "sober",
-    "tread",
-    "wigan",
-    "paddy",
-    "norma",
-    "wyatt",
-    "otter",
-    "earns",
-    "sassy",
-    "vases",
-    "aries",
-    "ramps",
-    "dread",
-    "casts",
-    "heinz",
-    "argos",
-    "needy",
-    "reich",
-    "weary",
-    "tweed",
-    "snowy",
-    "genie",
-    "chars",
-    "mcgee",
-    "fined",
-    "apron",
-    "aides",
-    "forma",
-    "yummy",
-    "momma",
-    "sexes",
-    "husky",
-    "bland",
-    "sails",
-    "robes",
-    "adept",
-    "mckay",
-    "kudos",
-    "krona",
-    "ester",
-    "servo",
-    "snail",
-    "sutra",
-    "mower",
-    "swine",
-    "heron",
-    "graft",
-    "envoy",
-    "clans",
-    "abort",
-    "edged",
-    "duvet",
-    "spade",
-    "glare",
-    "grids",
-    "haley",
-    "facto",
-    "haiku",
-    "wafer",
-    "stash",
-    "roofs",
-    "reefs",
-    "semen",
-    "hover",
-    "molds",
-    "elias",
-    "genoa",
-    "leafs",
-    "agony",
-    "parte",
-    "lacey",
-    "cones",
-    "lupus",
-    "taxed",
-    "taped",
-    "docks",
-    "bully",
-    "rhyme",
-    "snort",
-    "triad",
-    "fitch",
-    "sinai",
-    "cameo",
-    "leach",
-    "fanny",
-    "sunni",
-    "milky",
-    "combs",
-    "macao",
-    "snaps",
-    "hurst",
-    "coils",
-    "navel",
-    "bumps",
-    "sable",
-    "spool",
-    "annoy",
-    "toxin",
-    "axiom",
-    "aztec",
-    "vents",
-    "mater",
-    "humps",
-    "joker",
-    "hikes",
-    "wiped",
-    "tudor",
-    "heirs",
-    "twill",
-    "cures",
-    "timex",
-    "freud",
-    "brink",
-    "truss",
-    "khaki",
-    "mould",
-    "gimme",
-    "croft",
-    "penal",
-    "riots",
-    "lapse",
-    "wally",
-    "shrub",
-    "finer",
-    "smack",
-    "cloak",
-    "manic",
-    "choke",
-    "gravy",
-    "payer",
-    "moods",
-    "glaze",
-    "infra",
-    "gated",
-    "amish",
-    "dizzy",
-    "cribs",
-    "psych",
-    "verge",
-    "nomad",
-    "thorn",
-    "spins",
-    "spoil",
-    "hoses",
-    "provo",
-    "sissy",
-    "hymns",
-    "palsy",
-    "cuffs",
-    "monet",
-    "xenon",
-    "bayou",
-    "tonic",
-    "potty",
-    "rites",
-    "ditto",
-    "oddly",
-    "undue",
-    "elves",
-    "chant",
-    "hutch",
-    "tufts",
-    "parry",
-    "raves",
-    "mamma",
-    "folly",
-    "mural",
-    "wager",
-    "purge",
-    "poser",
-    "perky",
-    "fused",
-    "stump",
-    "scalp",
-    "actin",
-    "erwin",
-    "melon",
-    "siren",
-    "clasp",
-    "wipes",
-    "krone",
-    "aegis",
-    "derry",
-    "amour",
-    "totes",
-    "thugs",
-    "ethel",
-    "sonar",
-    "ethyl",
-    "lambs",
-    "ulcer",
-    "ethic",
-    "thine",
-    "genet",
-    "opium",
-    "enema",
-    "seams",
-    "barge",
-    "famed",
-    "utica",
-    "grimm",
-    "rufus",
-    "slant",
-    "chops",
-    "broom",
-    "snare",
-    "shank",
-    "leash",
-    "hunts",
-    "faber",
-    "acton",
-    "deems",
-    "geese",
-    "polio",
-    "mecca",
-    "broth",
-    "crows",
-    "taper",
-    "revue",
-    "smear",
-    "memos",
-    "serge",
-    "waldo",
-    "slain",
-    "quail",
-    "mayan",
-    "futon",
-    "icing",
-    "wilma",
-    "lowry",
-    "strut",
-    "wolff",
-    "plume",
-    "plank",
-    "enact",
-    "deity",
-    "claws",
-    "virgo",
-    "manly",
-    "pings",
-    "peril",
-    "hairs",
-    "quads",
-    "maids",
-    "louie",
-    "swirl",
-    "emery",
-    "upton",
-    "libre",
-    "abode",
-    "savoy",
-    "comfy",
-    "polka",
-    "wiper",
-    "nicer",
-    "lagos",
-    "boast",
-    "gents",
-    "perch",
-    "angst",
-    "gecko",
-    "codex",
-    "judas",
-    "barns",
-    "raids",
-    "solos",
-    "facet",
-    "wares",
-    "verve",
-    "spree",
-    "embed",
-    "gurus",
-    "brute",
-    "kabul",
-    "butch",
-    "yarns",
-    "defer",
-    "liars",
-    "deans",
-    "kites",
-    "dumps",
-    "hanks",
-    "crave",
-    "salty",
-    "zeros",
-    "valor",
-    "sabre",
-    "goofy",
-    "mimic",
-    "ticks",
-    "vigil",
-    "banco",
-    "itchy",
-    "bulky",
-    "booze",
-    "widen",
-    "adore",
-    "colds",
-    "stowe",
-    "fluke",
-    "stomp",
-    "glade",
-    "licks",
-    "caste",
-    "libra",
-    "lures",
-    "slows",
-    "flaps",
-    "inset",
-    "rhine",
-    "druid",
-    "swarm",
-    "elise",
-    "ledge",
-    "drown",
-    "bangs",
-    "radon",
-    "abyss",
-    "niece",
-    "pleas",
-    "flask",
-    "idols",
-    "gusts",
-    "xviii",
-    "hippo",
-    "dudes",
-    "altos",
-    "overs",
-    "nests",
-    "padre",
-    "plead",
-    "milne",
-    "sheen",
-    "warts",
-    "medic",
-    "grail",
-    "seine",
-    "dhabi",
-    "lapel",
-    "pecan",
-    "aches",
-    "chime",
-    "sligo",
-    "remit",
-    "exert",
-    "pinto",
-    "pears",
-    "heats",
-    "lucid",
-    "shiva",
-    "infer",
-    "dandy",
-    "swaps",
-    "synod",
-    "lousy",
-    "amigo",
-    "caddy",
-    "cobol",
-    "brits",
-    "bleak",
-    "regan",
-    "tramp",
-    "minis",
-    "mckee",
-    "hubby",
-    "safes",
-    "andes",
-    "stubs",
-    "dents",
-    "perks",
-    "essen",
-    "vibes",
-    "moons",
-    "lathe",
-    "bylaw",
-    "trims",
-    "leaps",
-    "lends",
-    "gayle",
-    "crook",
-    "typos",
-    "dives",
-    "drury",
-    "stale",
-    "putty",
-    "patsy",
-    "corgi",
-    "swans",
-    "cupid",
-    "cline",
-    "piers",
-    "dykes",
-    "hosea",
-    "haste",
-    "corfu",
-    "prong",
-    "berth",
-    "crabs",
-    "kurds",
-    "lingo",
-    "piggy",
-    "saber",
-    "platt",
-    "oxfam",
-    "folic",
-    "lager",
-    "doggy",
-    "exxon",
-    "divas",
-    "babel",
-    "foyer",
-    "brood",
-    "azure",
-    "sniff",
-    "posse",
-    "pixie",
-    "melee",
-    "llama",
-    "vowel",
-    "fecal",
-    "psion",
-    "humid",
-    "guile",
-    "mined",
-    "sores",
-    "reeds",
-    "lofty",
-    "phnom",
-    "moron",
-    "dogma",
-    "winch",
-    "evils",
-    "limos",
-    "jocks",
-    "unzip",
-    "floss",
-    "shawl",
-    "bends",
-    "pence",
-    "emile",
-    "lenin",
-    "dhaka",
-    "thyme",
-    "chino",
-    "ovary",
-    "bebop",
-    "merle",
-    "flops",
-    "zeiss",
-    "vices",
-    "karat",
-    "tolls",
-    "abbot",
-    "magma",
-    "arson",
-    "dakar",
-    "haunt",
-    "fuses",
-    "braid",
-    "munro",
-    "fists",
-    "chimp",
-    "lefty",
-    "heres",
-    "vigor",
-    "glued",
-    "shuts",
-    "alder",
-    "lawns",
-    "midas",
-    "raced",
-    "deuce",
-    "riser",
-    "quits",
-    "knoll",
-    "inlay",
-    "craze",
-    "texan",
-    "roper",
-    "volta",
-    "fumes",
-    "totem",
-    "indus",
-    "harms",
-    "amore",
-    "carve",
-    "apnea",
-    "swish",
-    "relic",
-    "ethos",
-    "cling",
-    "mainz",
-    "toned",
-    "erred",
-    "mabel",
-    "dared",
-    "nudge",
-    "doves",
-    "skunk",
-    "heaps",
-    "hydra",
-    "anvil",
-    "stalk",
-    "inert",
-    "eject",
-    "rayon",
-    "mocha",
-    "nouns",
-    "tonne",
-    "faxed",
-    "loire",
-    "firth",
-    "slams",
-    "cadre",
-    "cabot",
-    "squat",
-    "koran",
-    "zoned",
-    "pubic",
-    "quito",
-    "tiara",
-    "hives",
-    "cyril",
-    "koala",
-    "crock",
-    "retry",
-    "telex",
-    "bowed",
-    "serbs",
-    "verdi",
-    "khmer",
-    "clogs",
-    "flank",
-    "looms",
-    "atoll",
-    "ducts",
-    "mules",
-    "spoof",
-    "truro",
-    "amman",
-    "spout",
-    "hefty",
-    "hoist",
-    "celia",
-    "slabs",
-    "agate",
-    "swami",
-    "lofts",
-    "feral",
-    "truce",
-    "laird",
-    "petal",
-    "dries",
-    "autre",
-    "peeps",
-    "waugh",
-    "tiers",
-    "inuit",
-    "pluck",
-    "prick",
-    "herds",
-    "adder",
-    "ascot",
-    "germs",
-    "grays",
-    "frees",
-    "vixen",
-    "whips",
-    "fades",
-    "bulge",
-    "slump",
-    "laude",
-    "nerds",
-    "enrol",
-    "gloom",
-    "wakes",
-    "marge",
-    "comps",
-    "edema",
-    "sadie",
-    "stink",
-    "overt",
-    "slime",
-    "swung",
-    "waved",
-    "libel",
-    "fryer",
-    "boron",
-    "tetra",
-    "vowed",
-    "skier",
-    "tiled",
-    "snuff",
-    "carta",
-    "talon",
-    "elsie",
-    "crewe",
-    "stint",
-    "shred",
-    "sieve",
-    "binge",
-    "jazzy",
-    "janus",
-    "limbo",
-    "shove",
-    "sykes",
-    "flake",
-    "daley",
-    "dumas",
-    "powys",
-    "wiser",
-    "flung",
-    "fiche",
-    "juror",
-    "grads",
-    "kayla",
-    "donut",
-    "tabor",
-    "tenet",
-    "chute",
-    "bowes",
-    "mulch",
-    "whine",
-    "curso",
-    "fouls",
-    "fuchs",
-    "canes",
-    "diced",
-    "vicar",
-    "prank",
-    "kinks",
-    "delft",
-    "faust",
-    "suing",
-    "brine",
-    "lorna",
-    "piled",
-    "fluff",
-    "unfit",
-    "rouse",
-    "yucca",
-    "spiel",
-    "gizmo",
-    "scamp",
-    "danes",
-    "cysts",
-    "dwyer",
-    "helms",
-    "moths",
-    "evoke",
-    "assam",
-    "boyce",
-    "foxes",
-    "gully",
-    "brill",
-    "gauss",
-    "mites",
-    "macho",
-    "reeve",
-    "haydn",
-    "keyed",
-    "jerks",
-    "bagel",
-    "cults",
-    "amaze",
-    "easel",
-    "gable",
-    "laced",
-    "yeats",
-    "quill",
-    "mares",
-    "chaps",
-    "lanai",
-    "fermi",
-    "keats",
-    "dimes",
-    "verso",
-    "cleft",
-    "bambi",
-    "groin",
-    "bower",
-    "biggs",
-    "longs",
-    "swain",
-    "mourn",
-    "waite",
-    "pores",
-    "oiled",
-    "blurb",
-    "moray",
-    "noses",
-    "erode",
-    "brisk",
-    "meath",
-    "ponce",
-    "eerie",
-    "epsom",
-    "butyl",
-    "shale",
-    "anode",
-    "torts",
-    "crepe",
-    "avert",
-    "guise",
-    "vomit",
-    "bongo",
-    "shaky",
-    "bloke",
-    "necks",
-    "levee",
-    "chews",
-    "phony",
-    "soles",
-    "jetty",
-    "nukes",
-    "rerun",
-    "jerky",
-    "byers",
-    "argon",
-    "clams",
-    "speck",
-    "selby",
-    "papal",
-    "duets",
-    "labia",
-    "mogul",
-    "addis",
-    "gwent",
-    "vials",
-    "droit",
-    "teeny",
-    "silas",
-    "tunis",
-    "reins",
-    "massa",
-    "aural",
-    "margo",
-    "prius",
-    "tombs",
-    "frown",
-    "privy",
-    "sepia",
-    "brava",
-    "minsk",
-    "forts",
-    "levis",
-    "goody",
-    "jails",
-    "stork",
-    "tunic",
-    "farce",
-    "rhone",
-    "howdy",
-    "timmy",
-    "whack",
-    "drone",
-    "godly",
-    "spire",
-    "stead",
-    "nicks",
-    "shrug",
-    "boils",
-    "greta",
-    "covey",
-    "dials",
-    "aster",
-    "ferns",
-    "curls",
-    "wince",
-    "melts",
-    "wasps",
-    "mitre",
-    "norse",
-    "bosom",
-    "bales",
-    "rapes",
-    "picky",
-    "busts",
-    "lumen",
-    "pious",
-    "tonal",
-    "tarts",
-    "cadiz",
-    "foggy",
-    "shone",
-    "leafy",
-    "uzbek",
-    "dolor",
-    "trove",
-    "eased",
-    "filer",
-    "lusty",
-    "arias",
-    "steed",
-    "hasty",
-    "haifa",
-    "munch",
-    "clove",
-    "preps",
-    "leech",
-    "giver",
-    "nymph",
-    "frail",
-    "tikes",
-    "swank",
-    "churn",
-    "muted",
-    "feats",
-    "bumpy",
-    "amine",
-    "awoke",
-    "parka",
-    "prune",
-    "cairn",
-    "draco",
-    "knits",
-    "nutty",
-    "sever",
-    "titre",
-    "fling",
-    "hilda",
-    "lewes",
-    "drier",
-    "auger",
-    "enoch",
-    "dales",
-    "betts",
-    "domes",
-    "coors",
-    "execs",
-    "hiker",
-    "zloty",
-    "crumb",
-    "pinky",
-    "mints",
-    "grate",
-    "fiend",
-    "baits",
-    "wicks",
-    "fleas",
-    "taupe",
-    "kelso",
-    "heals",
-    "pyrex",
-    "runes",
-    "pique",
-    "swore",
-    "trier",
-    "bello",
-    "cools",
-    "legit",
-    "wands",
-    "fishy",
-    "filmy",
-    "timid",
-    "barra",
-    "veils",
-    "tirol",
-    "corby",
-    "lobos",
-    "leaky",
-    "molar",
-    "mamas",
-    "earls",
-    "hyped",
-    "batik",
-    "odour",
-    "irvin",
-    "gulch",
-    "axles",
-    "henna",
-    "bribe",
-    "doped",
-    "ghent",
-    "louth",
-    "towed",
-    "lisle",
-    "canto",
-    "aorta",
-    "delve",
-    "crimp",
-    "lumps",
-    "facie",
-    "clout",
-    "jours",
-    "feces",
-    "alkyl",
-    "paces",
-    "glyph",
-    "plumb",
-    "unify",
-    "briar",
-    "junta",
-    "grout",
-    "curie",
-    "taker",
-    "dijon",
-    "sages",
-    "scorn",
-    "whirl",
-    "hinds",
-    "tibia",
-    "pesky",
-    "moles",
-    "obits",
-    "shams",
-    "conwy",
-    "knack",
-    "rivet",
-    "sonya",
-    "grunt",
-    "eases",
-    "buffs",
-    "rabid",
-    "cumin",
-    "payee",
-    "nosed",
-    "laces",
-    "gower",
-    "aunts",
-    "hippy",
-    "roost",
-    "mitts",
-    "nappy",
-    "cavan",
-    "evade",
-    "lapis",
-    "shunt",
-    "synch",
-    "sects",
-    "lhasa",
-    "tawny",
-    "ferro",
-    "mucus",
-    "flips",
-    "aptly",
-    "liege",
-    "sheik",
-    "pints",
-    "piety",
-    "goofs",
-    "froze",
-    "ripon",
-    "tacit",
-    "modus",
-    "whisk",
-    "solis",
-    "unmet",
-    "hails",
-    "mauve",
-    "spore",
-    "crept",
-    "canna",
-    "punks",
-    "aryan",
-    "bugle",
-    "fours",
-    "comer",
-    "festa",
-    "accra",
-    "bimbo",
-    "moors",
-    "waged",
-    "waxed",
-    "jaded",
-    "radii",
-    "roomy",
-    "nears",
-    "lasso",
-    "waxes",
-    "bevel",
-    "dodgy",
-    "neath",
-    "xxiii",
-    "coney",
-    "brawl",
-    "chore",
-    "sighs",
-    "mises",
-    "piped",
-    "dells",
-    "boson",
-    "anima",
-    "trams",
-    "praia",
-    "octal",
-    "gauze",
-    "gazed",
-    "skips",
-    "amuse",
-    "fixer",
-    "haves",
-    "idiom",
-    "trawl",
-    "gamut",
-    "pease",
-    "manta",
-    "filet",
-    "lorry",
-    "beryl",
-    "revel",
-    "madly",
-    "gripe",
-    "summa",
-    "lowly",
-    "scant",
-    "flier",
-    "pours",
-    "amity",
-    "drool",
-    "lupin",
-    "hallo",
-    "hades",
-    "honky",
-    "muses",
-    "freer",
-    "leans",
-    "leith",
-    "foils",
-    "buoys",
-    "brest",
-    "murky",
-    "tongs",
-    "yanks",
-    "cabal",
-    "poked",
-    "chubb",
-    "laois",
-    "gnats",
-    "dares",
-    "cynic",
-    "booms",
-    "swipe",
-    "clays",
-    "bough",
-    "radix",
-    "grist",
-    "sloth",
-    "fates",
-    "stews",
-    "tacky",
-    "drags",
-    "mumps",
-    "chasm",
-    "styli",
-    "masse",
-    "rasta",
-    "ravel",
-    "decoy",
-    "ababa",
-    "grime",
-    "eared",
-    "rigor",
-    "gusto",
-    "tacos",
-    "dwelt",
-    "hilly",
-    "sager",
-    "caged",
-    "prawn",
-    "rowdy",
-    "popes",
-    "cotta",
-    "chock",
-    "emits",
-    "hough",
-    "elgar",
-    "curio",
-    "savor",
-    "anion",
-    "tabby",
-    "therm",
-    "dazed",
-    "sited",
-    "puffs",
-    "gourd",
-    "moped",
-    "errol",
-    "foray",
-    "filly",
-    "aesop",
-    "vulva",
-    "amici",
-    "nodal",
-    "aloft",
-    "mated",
-    "plums",
-    "kafka",
-    "telly",
-    "slurp",
-    "arles",
-    "tempt",
-    "bathe",
-    "patna",
-    "wyman",
-    "girth",
-    "lobes",
-    "remus",
-    "coals",
-    "brunt",
-    "glens",
-    "ember",
-    "islet",
-    "blyth",
-    "gulls",
-    "balsa",
-    "caper",
-    "quack",
-    "drape",
-    "mezzo",
-    "silos",
-    "giddy",
-    "nehru",
-    "oaths",
-    "hells",
-    "broil",
-    "cacti",
-    "curbs",
-    "jiffy",
-    "colic",
-    "warms",
-    "saucy",
-    "askew",
-    "groan",
-    "touts",
-    "toile",
-    "antes",
-    "ducky",
-    "arran",
-    "abate",
-    "voids",
-    "mossy",
-    "basra",
-    "clots",
-    "hater",
-    "expel",
-    "swoop",
-    "gumbo",
-    "mavis",
-    "lured",
-    "manna",
-    "soars",
-    "liszt",
-    "adorn",
-    "dorms",
-    "pimps",
-    "pared",
-    "slums",
-    "squaw",
-    "bouts",
-    "epics",
-    "larva",
-    "growl",
-    "brash",
-    "slits",
-    "chard",
-    "sully",
-    "inept",
-    "divan",
-    "papas",
-    "thump",
-    "trudy",
-    "minas",
-    "bruin",
-    "dewar",
-    "capes",
-    "salvo",
-    "twigs",
-    "degas",
-    "joked",
-    "fared",
-    "fleck",
-    "mists",
-    "zippy",
-    "odeon",
-    "goers",
-    "slugs",
-    "frome",
-    "rafts",
-    "moans",
-    "eaves",
-    "alibi",
-    "pikes",
-    "peels",
-    "credo",
-    "femur",
-    "bushy",
-    "grits",
-    "maris",
-    "faked",
-    "affix",
-    "quirk",
-    "flaky",
-    "domed",
-    "panes",
-    "treks",
-    "beets",
-    "repel",
-    "puree",
-    "bonny",
-    "finns",
-    "swath",
-    "rouen",
-    "prods",
-    "harem",
-    "fussy",
-    "shoal",
-    "biota",
-    "heady",
-    "celts",
-    "fives",
-    "hoard",
-    "juris",
-    "meson",
-    "senna",
-    "spelt",
-    "barks",
-    "nerdy",
-    "knelt",
-    "glues",
-    "fated",
-    "halts",
-    "cinch",
-    "cubed",
-    "dinky",
-    "stirs",
-    "honed",
-    "scrum",
-    "lopes",
-    "snipe",
-    "beaux",
-    "litho",
-    "thane",
-    "salve",
-    "winks",
-    "hulls",
-    "friar",
-    "pygmy",
-    "pansy",
-    "tosca",
-    "dingo",
-    "cowes",
-    "baggy",
-    "heist",
-    "wield",
-    "adage",
-    "morel",
-    "budge",
-    "silks",
-    "kneel",
-    "masts",
-    "peony",
-    "batty",
-    "camus",
-    "bongs",
-    "twine",
-    "agape",
-    "bilge",
-    "chewy",
-    "grins",
-    "cheep",
-    "pasha",
-    "scour",
-    "leapt",
-    "riyal",
-    "taffy",
-    "brows",
-    "pacer",
-    "bitty",
-    "flack",
-    "crass",
-    "yells",
-    "durst",
-    "inked",
-    "objet",
-    "picts",
-    "rumba",
-    "spunk",
-    "stung",
-    "smirk",
-    "uriah",
-    "toads",
-    "liber",
-    "cramp",
-    "sodom",
-    "hawes",
-    "gills",
-    "fugue",
-    "hoary",
-    "rodin",
-    "purim",
-    "bleep",
-    "sills",
-    "igloo",
-    "rakes",
-    "burgh",
-    "dikes",
-    "allot",
-    "meaty",
-    "gages",
-    "artis",
-    "egret",
-    "felon",
-    "nacho",
-    "swims",
-    "spasm",
-    "rimes",
-    "dusky",
-    "proms",
-    "gluon",
-    "slush",
-    "kbyte",
-    "aphis",
-    "lough",
-    "trios",
-    "vouch",
-    "gales",
-    "gipsy",
-    "ruddy",
-    "fjord",
-    "fords",
-    "axons",
-    "boned",
-    "junky",
-    "dirge",
-    "carpe",
-    "dames",
-    "runny",
-    "edict",
-    "shrew",
-    "foals",
-    "cased",
-    "prays",
-    "nonce",
-    "mauna",
-    "kilns",
-    "mirth",
-    "kilts",
-    "booby",
-    "conch",
-    "corny",
-    "lundy",
-    "noose",
-    "recur",
-    "camas",
-    "zooms",
-    "halal",
-    "taint",
-    "chine",
-    "crier",
-    "beset",
-    "swede",
-    "sheba",
-    "glows",
-    "ladle",
-    "pinks",
-    "surly",
-    "cleat",
-    "helga",
-    "clwyd",
-    "volga",
-    "brews",
-    "laity",
-    "hales",
-    "beefy",
-    "skits",
-    "welds",
-    "noire",
-    "spiny",
-    "clung",
-    "maxis",
-    "iliad",
-    "graze",
-    "judea",
-    "afoot",
-    "woken",
-    "hotly",
-    "stave",
-    "shins",
-    "punts",
-    "recht",
-    "crick",
-    "sedge",
-    "rummy",
-    "stoop",
-    "curvy",
-    "sikhs",
-    "jeeps",
-    "rages",
-    "tithe",
-    "cocky",
-    "idler",
-    "slaps",
-    "spate",
-    "madge",
-    "gleam",
-    "halos",
-    "kilos",
-    "tamer",
-    "trice",
-    "stile",
-    "nadir",
-    "debby",
-    "golan",
-    "gavel",
-    "sahib",
-    "foams",
-    "splat",
-    "snows",
-    "bogey",
-    "islay",
-    "nitty",
-    "vying",
-    "pooch",
-    "adios",
-    "dyfed",
-    "reims",
-    "whims",
-    "fangs",
-    "rabat",
-    "wiles",
-    "ensue",
-    "jaffa",
-    "sybil",
-    "slimy",
-    "domus",
-    "borer",
-    "clump",
-    "mensa",
-    "tarps",
-    "tilde",
-    "midis",
-    "skids",
-    "skeet",
-    "prowl",
-    "dimly",
-    "bijou",
-    "fuser",
-    "hymen",
-    "nairn",
-    "forgo",
-    "tacks",
-    "brats",
-    "poise",
-    "duchy",
-    "etude",
-    "gaunt",
-    "suave",
-    "tulle",
-    "gabby",
-    "milli",
-    "micky",
-    "gooey",
-    "bidet",
-    "croat",
-    "tyrol",
-    "tangy",
-    "wilds",
-    "brads",
-    "grebe",
-    "blobs",
-    "rondo",
-    "piste",
-    "jewry",
-    "whoop",
-    "cacao",
-    "soggy",
-    "repos",
-    "beret",
-    "holst",
-    "golly",
-    "snips",
-    "scrip",
-    "mince",
-    "frets",
-    "hunch",
-    "spurt",
-    "mazes",
-    "dalek",
-    "farts",
-    "anise",
-    "pinup",
-    "omagh",
-    "dixit",
-    "swabs",
-    "prise",
-    "terns",
-    "raged",
-    "hiked",
-    "umbra",
-    "amply",
-    "spits",
-    "loony",
-    "duped",
-    "rumps",
-    "inane",
-    "ibsen",
-    "corky",
-    "yolks",
-    "spook",
-    "snags",
-    "olden",
-    "herne",
-    "abuja",
-    "reedy",
-    "ceded",
-    "amide",
-    "sleds",
-    "wreak",
-    "vivre",
-    "bloat",
-    "kiwis",
-    "seder",
-    "conga",
-    "beeps",
-    "greys",
-    "wench",
-    "pawns",
-    "quint",
-    "loins",
-    "midge",
-    "melba",
-    "bream",
-    "imago",
-    "betas",
-    "leduc",
-    "omits",
-    "ewell",
-    "ricks",
-    "sleet",
-    "novus",
-    "drips",
-    "soapy",
-    "xxvii",
-    "tardy",
-    "harps",
-    "isbns",
-    "boner",
-    "coppa",
-    "smelt",
-    "yearn",
-    "paged",
-    "erupt",
-    "carne",
-    "sodas",
-    "plats",
-    "upped",
-    "trine",
-    "belay",
-    "slats",
-    "lumpy",
-    "galls",
-    "heave",
-    "rarer",
-    "snook",
-    "coven",
-    "mores",
-    "elegy",
-    "sloop",
-    "taunt",
-    "aphid",
-    "myrrh",
-    "chaff",
-    "showy",
-    "emcee",
-    "spied",
-    "aloof",
-    "snore",
-    "silty",
-    "ochre",
-    "quell",
-    "posit",
-    "dined",
-    "freda",
-    "magus",
-    "bores",
-    "vireo",
-    "umber",
-    "downy",
-    "kudzu",
-    "lemur",
-    "terse",
-    "utile",
-    "trite",
-    "shard",
-    "hanky",
-    "sires",
-    "dowel",
-    "bards",
-    "stags",
-    "pylon",
-    "seedy",
-    "caret",
-    "vichy",
-    "weeps",
-    "quoth",
-    "ditty",
-    "skiff",
-    "gummy",
-    "sisal",
-    "pokes",
-    "tipsy",
-    "atria",
-    "sagas",
-    "cress",
-    "culpa",
-    "froth",
-    "derma",
-    "tubby",
-    "mired",
-    "breve",
-    "rinks",
-    "raver",
-    "colne",
-    "smote",
-    "bolus",
-    "mushy",
-    "dowry",
-    "adieu",
-    "snuck",
-    "campy",
-    "awash",
-    "luzon",
-    "barbs",
-    "locum",
-    "aback",
-    "griff",
-    "scaly",
-    "esker",
-    "glint",
-    "stoic",
-    "amiss",
-    "livid",
-    "hares",
-    "smite",
-    "chump",
-    "scoot",
-    "hyena",
-    "daffy",
-    "blurs",
-    "stabs",
-    "lurks",
-    "larch",
-    "situs",
-    "boles",
-    "byway",
-    "pleat",
-    "litem",
-    "clank",
-    "marts",
-    "locos",
-    "ruble",
-    "brier",
-    "coves",
-    "noddy",
-    "doers",
-    "blimp",
-    "loopy",
-    "larne",
-    "nulla",
-    "chomp",
-    "rosin",
-    "wilts",
-    "gulag",
-    "macaw",
-    "opals",
-    "kooks",
-    "dived",
-    "loner",
-    "writs",
-    "banal",
-    "rears",
-    "lolly",
-    "guava",
-    "holed",
-    "grieg",
-    "wimpy",
-    "snout",
-    "bigot",
-    "goons",
-    "paves",
-    "omnia",
-    "goole",
-    "balms",
-    "jamey",
-    "irate",
-    "sitar",
-    "pushy",
-    "sheaf",
-    "roars",
-    "bilbo",
-    "dingy",
-    "topsy",
-    "rands",
-    "truer",
-    "limes",
-    "kraut",
-    "reams",
-    "quays",
-    "slung",
-    "bight",
-    "fells",
-    "tucks",
-    "calyx",
-    "coram",
-    "pails",
-    "burly",
-    "mange",
-    "dings",
-    "mowed",
-    "gouda",
-    "causa",
-    "leeks",
-    "troon",
-    "lusts",
-    "blots",
-    "raked",
-    "bizet",
-    "gaudy",
-    "swoon",
-    "kebab",
-    "somme",
-    "arvin",
-    "ambit",
-    "ghoul",
-    "aswan",
-    "clack",
-    "whiff",
-    "caulk",
-    "tilts",
-    "flees",
-    "blocs",
-    "tarry",
-    "joule",
-    "tuber",
-    "vexed",
-    "plied",
-    "bemis",
-    "twang",
-    "belli",
-    "calms",
-    "obeys",
-    "voile",
-    "whorl",
-    "carib",
-    "gouge",
-    "chirp",
-    "halve",
-    "tamed",
-    "rower",
-    "aunty",
-    "snafu",
-    "prams",
-    "monad",
-    "bandy",
-    "shits",
-    "snide",
-    "dusts",
-    "gruff",
-    "buxom",
-    "musty",
-    "pepys",
-    "knead",
-    "lamas",
-    "rebut",
-    "coups",
-    "segue",
-    "dotty",
-    "twirl",
-    "ingot",
-    "guppy",
-    "signa",
-    "rooks",
-    "homey",
-    "glean",
-    "anjou",
-    "carew",
-    "pasty",
-    "defoe",
-    "shoji",
-    "agios",
-    "ovals",
-    "crone",
-    "pubes",
-    "peeks",
-    "creel",
-    "delis",
-    "fosse",
-    "fides",
-    "pater",
-    "mused",
-    "shays",
-    "rebus",
-    "luger",
-    "foamy",
-    "lurid",
-    "mulls",
-    "hoots",
-    "whiny",
-    "huffy",
-    "bests",
-    "tinge",
-    "scuff",
-    "quips",
-    "loran",
-    "cruse",
-    "evens",
-    "yalta",
-    "muffs",
-    "chums",
-    "tomes",
-    "miser",
-    "phlox",
-    "fuqua",
-    "sakes",
-    "tepid",
-    "slurs",
-    "smock",
-    "sired",
-    "sooty",
-    "cubby",
-    "covet",
-    "gyros",
-    "minty",
-    "loons",
-    "cored",
-    "dears",
-    "tints",
-    "waver",
-    "conic",
-    "bares",
-    "strum",
-    "omens",
-    "rheum",
-    "vanes",
-    "sappy",
-    "mocks",
-    "hythe",
-    "natty",
-    "elude",
-    "tripe",
-    "gault",
-    "saran",
-    "bantu",
-    "liven",
-    "spilt",
-    "dunks",
-    "bunks",
-    "feria",
-    "peeve",
-    "gutsy",
-    "nooks",
-    "shyly",
-    "scone",
-    "throb",
-    "duels",
-    "shims",
-    "mumbo",
-    "miler",
-    "evict",
-    "negev",
-    "neigh",
-    "balmy",
-    "toots",
-    "zesty",
-    "canny",
-    "rifts",
-    "eiger",
-    "vroom",
-    "taiga",
-    "rumen",
-    "krill",
-    "incas",
-    "skein",
-    "moldy",
-    "nines",
-    "aught",
-    "corks",
-    "chins",
-    "perms",
-    "tryst",
-    "lurch",
-    "quash",
-    "mufti",
-    "gasps",
-    "greve",
-    "septa",
-    "spars",
-    "howls",
-    "sneer",
-    "curia",
-    "allay",
-    "esher",
-    "decry",
-    "gusty",
-    "usury",
-    "hooch",
-    "steno",
-    "plies",
-    "leper",
-    "oldie",
-    "lunge",
-    "hosed",
-    "rives",
-    "wrens",
-    "tenon",
-    "novae",
-    "polyp",
-    "refit",
-    "dosed",
-    "foyle",
-    "pucks",
-    "ouija",
-    "slink",
-    "droll",
-    "endow",
-    "razed",
-    "manus",
-    "klutz",
-    "joist",
-    "omnis",
-    "fizzy",
-    "offal",
-    "dawns",
-    "tenby",
-    "frais",
-    "staid",
-    "pithy",
-    "shirk",
-    "pangs",
-    "knell",
-    "exalt",
-    "juste",
-    "liana",
-    "wisps",
-    "oaten",
-    "durum",
-    "guano",
-    "boars",
-    "afore",
-    "ripen",
-    "brawn",
-    "gaius",
-    "pacts",
-    "putts",
-    "riche",
-    "flyby",
-    "wring",
-    "stilt",
-    "idris",
-    "seeps",
-    "slims",
-    "roped",
-    "clang",
-    "saris",
-    "bared",
-    "humus",
-    "rspca",
-    "lauds",
-    "pales",
-    "felts",
-    "tykes",
-    "frock",
-    "wrest",
-    "runic",
-    "copes",
-    "recto",
-    "ashen",
-    "snarl",
-    "gogol",
-    "waned",
-    "leggy",
-    "nulls",
-    "caved",
-    "corns",
-    "amass",
-    "iliac",
-    "spiky",
-    "sumac",
-    "dower",
-    "wordy",
-    "reeks",
-    "bogie",
-    "jaunt",
-    "agers",
-    "amica",
-    "oleic",
-    "imams",
-    "freon",
-    "dicky",
-    "gorse",
-    "louse",
-    "burro",
-    "ileum",
-    "scoff",
-    "maser",
-    "musky",
-    "furor",
-    "oomph",
-    "casks",
-    "wader",
-    "sixes",
-    "dregs",
-    "udder",
-    "pliny",
-    "sewed",
-    "malts",
-    "basle",
-    "biome",
-    "scull",
-    "flume",
-    "bakes",
-    "rungs",
-    "mamba",
-    "trill",
-    "borax",
-    "wimps",
-    "coped",
-    "banta",
-    "lowed",
-    "usurp",
-    "aggro",
-    "kapok",
-    "crags",
-    "bodes",
-    "homed",
-    "scold",
-    "tress",
-    "sawed",
-    "croak",
-    "abhor",
-    "panky",
-    "dopey",
-    "tweet",
-    "leery",
-    "rowed",
-    "elfin",
-    "emote",
-    "loupe",
-    "jumpy",
-    "testy",
-    "pasts",
-    "infix",
-    "liras",
-    "geode",
-    "minim",
-    "riven",
-    "jeers",
-    "soaks",
-    "turvy",
-    "snobs",
-    "dicta",
-    "clink",
-    "weirs",
-    "whigs",
-    "shill",
-    "bossy",
-    "arras",
-    "whist",
-    "ketch",
-    "algol",
-    "manes",
-    "weald",
-    "dicey",
-    "dowdy",
-    "muzak",
-    "rials",
-    "dilly",
-    "stuns",
-    "annis",
-    "bawdy",
-    "joust",
-    "weedy",
-    "sacra",
-    "grope",
-    "booed",
-    "afoul",
-    "nobis",
-    "blest",
-    "mesas",
-    "dente",
-    "feuds",
-    "toque",
-    "scite",
-    "milks",
-    "cryer",
-    "simul",
-    "comex",
-    "cilia",
-    "torte",
-    "rajah",
-    "gazes",
-    "peppy",
-    "loess",
-    "sulky",
-    "droop",
-    "waded",
-    "grubs",
-    "flail",
-    "eland",
-    "ardor",
-    "tinny",
-    "sexed",
-    "apace",
-    "loral",
-    "carob",
-    "boric",
-    "dross",
-    "hauls",
-    "novum",
-    "baler",
-    "mutes",
-    "gaels",
-    "kooky",
-    "ached",
-    "xylem",
-    "atone",
-    "paler",
-    "cuter",
-    "frisk",
-    "oiler",
-    "pumas",
-    "govan",
-    "loath",
-    "exult",
-    "claps",
-    "nspcc",
-    "nomen",
-    "swazi",
-    "spews",
-    "galas",
-    "vetch",
-    "stour",
-    "toyed",
-    "extol",
-    "knave",
-    "croup",
-    "quire",
-    "brags",
-    "bails",
-    "moats",
-    "ratty",
-    "pilaf",
-    "scree",
-    "lamer",
-    "gunny",
-    "antic",
-    "hirer",
-    "fowls",
-    "coons",
-    "berms",
-    "cushy",
-    "husks",
-    "raved",
-    "reaps",
-    "actes",
-    "scrim",
-    "nihil",
-    "erith",
-    "ovine",
-    "untie",
-    "annul",
-    "lanky",
-    "outdo",
-    "mammy",
-    "beaks",
-    "hexes",
-    "banns",
-    "ennui",
-    "purer",
-    "porgy",
-    "colas",
-    "bleat",
-    "coops",
-    "thins",
-    "fasts",
-    "sprig",
-    "ovate",
-    "dally",
-    "duces",
-    "shorn",
-    "orals",
-    "exude",
-    "gamin",
-    "surfs",
-    "amble",
-    "fiver",
-    "ducal",
-    "sooth",
-    "aider",
-    "tuxes",
-    "sabot",
-    "scram",
-    "slavs",
-    "jawed",
-    "lobed",
-    "grimy",
-    "cheam",
-    "burrs",
-    "loamy",
-    "jinks",
-    "biddy",
-    "crony",
-    "swags",
-    "duffs",
-    "teary",
-    "sower",
-    "bombe",
-    "nuked",
-    "satyr",
-    "pares",
-    "yokes",
-    "drams",
-    "fount",
-    "meany",
-    "lithe",
-    "tusks",
-    "robed",
-    "pelts",
-    "auras",
-    "skied",
-    "seers",
-    "cluck",
-    "pates",
-    "cubit",
-    "brigg",
-    "kazoo",
-    "gaffe",
-    "tiber",
-    "liken",
-    "nosey",
-    "toddy",
-    "spoor",
-    "doily",
-    "wowed",
-    "chink",
-    "gaily",
-    "harts",
-    "henge",
-    "oozes",
-    "tatty",
-    "divot",
-    "tines",
-    "gazer",
-    "frizz",
-    "pipit",
-    "eider",
-    "junto",
-    "novas",
-    "wooed",
-    "pulps",
-    "biter",
-    "warps",
-    "teste",
-    "sedum",
-    "undid",
-    "purrs",
-    "betel",
-    "wonky",
-    "unwed",
-    "clued",
-    "boggy",
-    "tunas",
-    "lifer",
-    "vivos",
-    "meted",
-    "outre",
-    "hetty",
-    "creak",
-    "splay",
-    "dupes",
-    "larks",
-    "voles",
-    "fowey",
-    "eclat",
-    "doric",
-    "mutts",
-    "irked",
-    "boers",
-    "toils",
-    "scabs",
-    "stoma",
-    "omnes",
-    "mente",
-    "jukes",
-    "gongs",
-    "wrung",
-    "manse",
-    "augur",
-    "motes",
-    "idyll",
-    "riled",
-    "veers",
-    "beget",
-    "wispy",
-    "inure",
-    "dryad",
-    "wishy",
-    "chafe",
-    "nobly",
-    "vitus",
-    "serfs",
-    "jammy",
-    "feign",
-    "mealy",
-    "zilch",
-    "pupae",
-    "shuck",
-    "haply",
-    "scowl",
-    "belch",
-    "limey",
-    "plonk",
-    "dices",
-    "pitta",
-    "dines",
-    "whizz",
-    "capon",
-    "afire",
-    "sowed",
-    "gloat",
-    "tames",
-    "squib",
-    "coots",
-    "dunce",
-    "massy",
-    "hoofs",
-    "drawl",
-    "chive",
-    "setae",
-    "sibyl",
-    "ypres",
-    "kaman",
-    "parva",
-    "warty",
-    "clefs",
-    "mucky",
-    "podge",
-    "vapid",
-    "aglow",
-    "certi",
-    "fetes",
-    "trope",
-    "avers",
-    "fumed",
-    "washy",
-    "teats",
-    "junco",
-    "catty",
-    "crake",
-    "rerum",
-    "skimp",
-    "caned",
-    "harpy",
-    "singe",
-    "plunk",
-    "donee",
-    "abuts",
-    "beefs",
-    "picot",
-    "caput",
-    "deism",
-    "cohan",
-    "yogis",
-    "raspy",
-    "ovoid",
-    "imbue",
-    "slags",
-    "filey",
-    "ogres",
-    "acrid",
-    "matey",
-    "comas",
-    "jolts",
-    "belie",
-    "slyly",
-    "shied",
-    "opine",
-    "lutes",
-    "plait",
-    "soled",
-    "metus",
-    "wails",
-    "fazed",
-    "alkyd",
-    "spuds",
-    "scald",
-    "skink",
-    "bilan",
-    "ramie",
-    "leant",
-    "ergot",
-    "trots",
-    "actus",
-    "stank",
-    "tills",
-    "yawns",
-    "frill",
-    "vamps",
-    "dooms",
-    "chace",
-    "abaci",
-    "abaft",
-    "abase",
-    "abash",
-    "abeam",
-    "abets",
-    "abler",
-    "abysm",
-    "acing",
-    "actum",
-    "addax",
-    "addle",
-    "adeem",
-    "adits",
-    "adman",
-    "admix",
-    "adzes",
-    "aeons",
-    "afros",
-    "agars",
-    "agist",
-    "agues",
-    "ailed",
-    "alcms",
-    "aleck",
-    "alfas",
-    "algid",
-    "aloes",
-    "amies",
-    "amuck",
-    "anent",
-    "angli",
-    "animo",
-    "annos",
-    "anted",
-    "antis",
-    "aping",
-    "apish",
-    "appal",
-    "apses",
-    "arams",
-    "arced",
-    "arere",
-    "argil",
-    "argot",
-    "arils",
-    "armis",
-    "arses",
-    "artem",
-    "aryls",
-    "aspic",
-    "astir",
-    "attar",
-    "audis",
-    "avows",
-    "awing",
-    "axing",
-    "babas",
-    "bacup",
-    "bairn",
-    "baize",
-    "baled",
-    "balks",
-    "balky",
-    "bancs",
-    "barch",
-    "barer",
-    "barmy",
-    "baser",
-    "basks",
-    "baste",
-    "batas",
-    "bated",
-    "bator",
-    "baulk",
-    "bawds",
-    "bawls",
-    "bayed",
-    "beady",
-    "bedel",
-    "bedew",
-    "befit",
-    "befog",
-    "begot",
-    "bents",
-    "bergs",
-    "bided",
-    "bides",
-    "biens",
-    "biers",
-    "biked",
-    "bilks",
-    "biped",
-    "biros",
-    "blabs",
-    "blaby",
-    "blahs",
-    "blare",
-    "blear",
-    "blebs",
-    "blees",
-    "bleta",
-    "blips",
-    "blitt",
-    "blowy",
-    "bluer",
-    "blurt",
-    "boded",
-    "bodge",
-    "bolas",
-    "bolls",
-    "bolos",
-    "bonis",
-    "bonum",
-    "bonze",
-    "boons",
-    "boors",
-    "boozy",
-    "bosky",
-    "bosun",
-    "botch",
-    "bothy",
-    "boyar",
-    "bozos",
-    "brach",
-    "bract",
-    "braes",
-    "brays",
-    "braze",
-    "brigs",
-    "brims",
-    "briny",
-    "bruit",
-    "brume",
-    "buffo",
-    "bulgy",
-    "bulks",
-    "bumph",
-    "bungs",
-    "bunts",
-    "burgs",
-    "burin",
-    "burls",
-    "burps",
-    "busks",
-    "byres",
-    "cabby",
-    "caber",
-    "cadge",
-    "cagey",
-    "caked",
-    "calve",
-    "canap",
-    "cants",
-    "capax",
-    "carom",
-    "carps",
-    "casus",
-    "cavil",
-    "cawed",
-    "cchem",
-    "cedes",
-    "cedit",
-    "ceorl",
-    "cepit",
-    "chary",
-    "chide",
-    "chits",
-    "chivy",
-    "choko",
-    "choux",
-    "chows",
-    "chuff",
-    "chugs",
-    "churl",
-    "cirri",
-    "cista",
-    "civet",
-    "civvy",
-    "clews",
-    "clich",
-    "clime",
-    "clods",
-    "clomp",
-    "clops",
-    "cloys",
-    "coati",
-    "cocas",
-    "codas",
-    "cogit",
-    "coifs",
-    "coked",
-    "cokes",
-    "coned",
-    "conks",
-    "cooed",
-    "coomb",
-    "copal",
-    "copra",
-    "copse",
-    "copts",
-    "corer",
-    "corms",
-    "cosec",
-    "cosen",
-    "covin",
-    "cowed",
-    "cower",
-    "cowls",
-    "cowry",
-    "coyer",
-    "coyly",
-    "coypu",
-    "cozen",
-    "crams",
-    "crape",
-    "craws",
-    "crche",
-    "croon",
-    "cruce",
-    "cruet",
-    "culls",
-    "culta",
-    "curae",
-    "curat",
-    "curds",
-    "cusps",
-    "czars",
-    "dacca",
-    "daces",
-    "dacha",
-    "damns",
-    "damps",
-    "darks",
-    "darns",
-    "daubs",
-    "daunt",
-    "davit",
-    "dazes",
-    "dcvos",
-    "debar",
-    "debet",
-    "deeps",
-    "defog",
-    "deify",
-    "deign",
-    "deist",
-    "demob",
-    "demur",
-    "dends",
-    "dewed",
-    "dicer",
-    "dicit",
-    "dilli",
-    "dills",
-    "dints",
-    "direr",
-    "dishy",
-    "divvy",
-    "dodos",
-    "doffs",
-    "doggo",
-    "doled",
-    "doles",
-    "dolts",
-    "donis",
-    "doone",
-    "doper",
-    "dopes",
-    "dorsa",
-    "dotal",
-    "doted",
-    "dotes",
-    "dotis",
-    "douns",
-    "douse",
-    "dowle",
-    "dowse",
-    "doyen",
-    "dozed",
-    "dozes",
-    "drabs",
-    "draff",
-    "drays",
-    "dribs",
-    "drily",
-    "drubs",
-    "drupe",
-    "dryly",
-    "ducat",
-    "dulls",
-    "dully",
-    "dumpy",
-    "duple",
-    "dyads",
-    "dyers",
-    "dynes",
-    "eadem",
-    "ebbed",
-    "edale",
-    "edify",
-    "educe",
-    "egged",
-    "eigne",
-    "eking",
-    "elate",
-    "elide",
-    "elope",
-    "elute",
-    "emend",
-    "emirs",
-    "endue",
-    "entia",
-    "enure",
-    "envoi",
-    "eosin",
-    "epees",
-    "epode",
-    "eruct",
-    "estop",
-    "ewage",
-    "ewers",
-    "exall",
-    "exeat",
-    "eying",
-    "eyres",
-    "eyrie",
-    "facer",
-    "facti",
-    "faddy",
-    "fagot",
-    "faits",
-    "faker",
-    "fakir",
-    "falsi",
-    "farad",
-    "faros",
-    "fatua",
-    "fauns",
-    "fawns",
-    "fazes",
-    "fecit",
-    "feint",
-    "femes",
-    "fends",
-    "feods",
-    "ferae",
-    "ferms",
-    "feted",
-    "fetid",
-    "fiats",
-    "fidei",
-    "fiefs",
-    "fieri",
-    "fifes",
-    "filch",
-    "filum",
-    "finks",
-    "finny",
-    "fiord",
-    "fiscs",
-    "flaco",
-    "flans",
-    "flays",
-    "fleta",
-    "flits",
-    "flocs",
-    "floes",
-    "flogs",
-    "flout",
-    "flubs",
-    "flues",
-    "fluky",
-    "flunk",
-    "flyma",
-    "foeti",
-    "fogey",
-    "foist",
-    "foots",
-    "foris",
-    "fovea",
-    "foxed",
-    "frays",
-    "freta",
-    "frond",
-    "frump",
-    "fugal",
-    "fugam",
-    "fundi",
-    "funks",
-    "furls",
-    "furta",
-    "furze",
-    "fusel",
-    "fusty",
-    "fuzes",
-    "gaffs",
-    "gafol",
-    "gager",
-    "gaits",
-    "gamed",
-    "gaols",
-    "gaped",
-    "gapes",
-    "garbs",
-    "gassy",
-    "gauzy",
-    "gawks",
-    "gawky",
-    "gayer",
-    "gelds",
-    "gelid",
-    "gemot",
-    "genii",
-    "gesso",
-    "getup",
-    "gibed",
-    "gibes",
-    "gigot",
-    "gigue",
-    "gilds",
-    "gimps",
-    "gimpy",
-    "girds",
-    "giros",
-    "gismo",
-    "glees",
-    "globs",
-    "gloms",
-    "gluey",
-    "gluts",
-    "gnarl",
-    "gnash",
-    "gnaws",
-    "goads",
-    "gofer",
-    "golfs",
-    "gonad",
-    "goner",
-    "gooks",
-    "gored",
-    "gores",
-    "gouts",
-    "gouty",
-    "grata",
-    "groat",
-    "gruel",
-    "grump",
-    "guars",
-    "gulfs",
-    "gulps",
-    "gunge",
-    "gungy",
-    "gushy",
-    "guyed",
-    "gyred",
-    "gyres",
-    "gyves",
-    "habeo",
-    "habet",
-    "hable",
-    "hafts",
-    "hakes",
-    "hammy",
-    "hanse",
-    "hared",
-    "harks",
-    "hasid",
-    "hasps",
-    "haugh",
-    "hawed",
-    "hawse",
-    "hayed",
-    "hazed",
-    "hazes",
-    "hecto",
-    "heeds",
-    "hefts",
-    "helot",
-    "hewed",
-    "hewer",
-    "hexed",
-    "hilts",
-    "hobos",
-    "hocks",
-    "hokum",
-    "hones",
-    "honks",
-    "hooey",
-    "hooky",
-    "hopis",
-    "horae",
-    "horsy",
-    "hovel",
-    "huffs",
-    "hulas",
-    "hulks",
-    "hullo",
-    "humph",
-    "hurls",
-    "hussy",
-    "hyoid",
-    "hypes",
-    "hypos",
-    "hyrax",
-    "iambs",
-    "icier",
-    "icily",
-    "idees",
-    "idled",
-    "idles",
-    "idyls",
-    "ieuan",
-    "ikbal",
-    "ikons",
-    "ileac",
-    "illud",
-    "imbed",
-    "immix",
-    "impel",
-    "inapt",
-    "intol",
-    "ivied",
-    "ivies",
-    "jabot",
-    "jades",
-    "jambs",
-    "japed",
-    "japer",
-    "japes",
-    "jemmy",
-    "jests",
-    "jibed",
-    "jibes",
-    "jidda",
-    "jilts",
-    "jingo",
-    "jinni",
-    "jived",
-    "jives",
-    "jokey",
-    "jowls",
-    "judos",
-    "juges",
-    "jujus",
-    "julep",
-    "julys",
-    "junes",
-    "junks",
-    "jural",
-    "jurat",
-    "kabob",
-    "kakis",
-    "kaput",
-    "kasha",
-    "kayos",
-    "kebob",
-    "keels",
-    "keens",
-    "kelps",
-    "kenos",
-    "kepis",
-    "kerbs",
-    "keyus",
-    "khans",
-    "kited",
-    "klieg",
-    "kneed",
-    "knish",
-    "knurl",
-    "kolas",
-    "korma",
-    "kraal",
-    "lacer",
-    "lacta",
-    "laded",
-    "lades",
-    "laesa",
-    "laica",
-    "lairs",
-    "lamed",
-    "lames",
-    "lards",
-    "laths",
-    "laved",
-    "laves",
-    "laxly",
-    "lazed",
-    "lazes",
-    "leers",
-    "leets",
-    "lefts",
-    "legem",
-    "leges",
-    "legum",
-    "lento",
-    "lessa",
-    "letup",
-    "licet",
-    "licit",
-    "lilts",
-    "limas",
-    "limed",
-    "limns",
-    "limps",
-    "lisps",
-    "litis",
-    "lleyn",
-    "loafs",
-    "lobar",
-    "lochs",
-    "lodes",
-    "loges",
-    "lolls",
-    "loofa",
-    "loots",
-    "loped",
-    "lours",
-    "louts",
-    "lrams",
-    "luaus",
-    "lucks",
-    "lucre",
-    "ludic",
-    "lulls",
-    "lulus",
-    "lyres",
-    "lysol",
-    "maces",
-    "maims",
-    "malty",
-    "malum",
-    "mangy",
-    "margb",
-    "margl",
-    "margr",
-    "margt",
-    "marls",
-    "matzo",
-    "mauls",
-    "mayas",
-    "mecum",
-    "medoc",
-    "melds",
-    "mends",
-    "meows",
-    "mesne",
-    "metes",
-    "meths",
-    "mewed",
-    "mewls",
-    "miaow",
-    "micas",
-    "middy",
-    "miens",
-    "miffs",
-    "milch",
-    "milts",
-    "mimed",
-    "mimes",
-    "minks",
-    "mires",
-    "moils",
-    "molls",
-    "molts",
-    "mooch",
-    "mooed",
-    "moony",
-    "moots",
-    "mopes",
-    "morns",
-    "mosey",
-    "motet",
-    "moues",
-    "moult",
-    "mousy",
-    "mucks",
-    "muggy",
-    "mulct",
-    "multa",
-    "murex",
-    "musts",
-    "muzzy",
-    "mynah",
-    "naafi",
-    "nabob",
-    "nacre",
-    "naffs",
-    "naiad",
-    "napes",
-    "narks",
-    "narrs",
-    "naves",
-    "navvy",
-    "neagh",
-    "neaps",
-    "nervy",
-    "nevil",
-    "nevus",
-    "newel",
-    "newsy",
-    "newts",
-    "nikes",
-    "nimbi",
-    "ninny",
-    "nippy",
-    "nisei",
-    "nitre",
-    "nixes",
-    "noels",
-    "nolle",
-    "nones",
-    "notae",
-    "nudum",
-    "nulle",
-    "nulli",
-    "numbs",
-    "oaken",
-    "oakum",
-    "oared",
-    "oases",
-    "oboes",
-    "odder",
-    "odium",
-    "ogees",
-    "ogled",
-    "ogles",
-    "okapi",
-    "okays",
-    "okras",
-    "oleos",
-    "onere",
-    "ongar",
-    "oohed",
-    "oozed",
-    "orate",
-    "ormuz",
-    "osier",
-    "ousts",
-    "outgo",
-    "ouzel",
-    "ovule",
-    "owlet",
-    "oxeye",
-    "oxlip",
-    "oyers",
-    "paean",
-    "paled",
-    "palls",
-    "paned",
-    "papaw",
-    "parch",
-    "paria",
-    "parol",
-    "passu",
-    "paten",
-    "pawed",
-    "pawls",
-    "peaky",
-    "peals",
-    "peaty",
-    "pecks",
-    "pedis",
-    "peens",
-    "peine",
-    "pekoe",
-    "pends",
-    "penge",
-    "pensa",
-    "peons",
-    "perts",
-    "pewee",
-    "pewit",
-    "phial",
-    "phyla",
-    "picas",
-    "pieta",
-    "pigmy",
-    "piker",
-    "pilau",
-    "pined",
-    "piths",
-    "piton",
-    "plash",
-    "platy",
-    "plebe",
-    "plebs",
-    "plena",
-    "plink",
-    "plods",
-    "plops",
-    "ploys",
-    "plumy",
-    "poach",
-    "pocks",
-    "podgy",
-    "podia",
-    "poesy",
-    "poled",
-    "ponit",
-    "poona",
-    "poops",
-    "pored",
-    "poufs",
-    "pouts",
-    "poxes",
-    "prang",
-    "prate",
-    "prece",
-    "preen",
-    "preys",
-    "pried",
-    "prier",
-    "pries",
-    "prigs",
-    "primp",
-    "proem",
-    "prole",
-    "prosy",
-    "prows",
-    "prude",
-    "pubis",
-    "puked",
-    "pukes",
-    "pukka",
-    "puled",
-    "pules",
-    "pulpy",
-    "punic",
-    "pupal",
-    "pupas",
-    "puris",
-    "purls",
-    "pyres",
-    "quaff",
-    "quaky",
-    "qualm",
-    "quare",
-    "quern",
-    "quids",
-    "quiff",
-    "quirt",
-    "quoad",
-    "quoin",
-    "quoit",
-    "ragas",
-    "rajas",
-    "rased",
-    "rases",
-    "rasps",
-    "ratam",
-    "rawer",
-    "rayed",
-    "razes",
-    "rearm",
-    "recks",
-    "recta",
-    "recti",
-    "redid",
-    "regii",
-    "regni",
-    "reify",
-    "rejig",
-    "rends",
-    "reran",
-    "resat",
-    "resit",
-    "retch",
-    "retie",
-    "rette",
-    "rheas",
-    "ricer",
-    "rifer",
-    "riles",
-    "rills",
-    "rimed",
-    "rinds",
-    "riper",
-    "ritzy",
-    "rived",
-    "roams",
-    "roans",
-    "roils",
-    "romps",
-    "roods",
-    "ropey",
-    "rorer",
-    "rotas",
-    "rotes",
-    "roust",
-    "routs",
-    "roved",
-    "roves",
-    "rowel",
-    "rubes",
-    "ruche",
-    "rucks",
-    "ruder",
-    "ruffs",
-    "ruing",
-    "runts",
-    "ruses",
-    "rusks",
-    "rusts",
-    "rutty",
-    "saabs",
-    "sacci",
-    "salic",
-    "salmi",
-    "salop",
-    "salus",
-    "saner",
-    "sated",
-    "sates",
-    "satre",
-    "saxes",
-    "scads",
-    "scarp",
-    "scats",
-    "schwa",
-    "scire",
-    "scows",
-    "scrod",
-    "scuds",
-    "scups",
-    "scurf",
-    "seamy",
-    "seato",
-    "sebum",
-    "secus",
-    "segos",
-    "seign",
-    "seisi",
-    "seism",
-    "sepal",
-    "shads",
-    "shags",
-    "shahs",
-    "shako",
-    "shier",
-    "shies",
-    "shirr",
-    "shish",
-    "shoat",
-    "shoed",
-    "shoos",
-    "shuns",
-    "shush",
-    "shyer",
-    "sidle",
-    "sifts",
-    "silts",
-    "sinew",
-    "sitae",
-    "skald",
-    "skews",
-    "skims",
-    "skirl",
-    "skive",
-    "skuas",
-    "skulk",
-    "slake",
-    "slaws",
-    "slays",
-    "slier",
-    "slobs",
-    "sloes",
-    "slogs",
-    "slops",
-    "slosh",
-    "slued",
-    "slues",
-    "slunk",
-    "slyer",
-    "smuts",
-    "snaky",
-    "snick",
-    "snits",
-    "snood",
-    "snots",
-    "snubs",
-    "soave",
-    "softy",
-    "solet",
-    "solum",
-    "somas",
-    "soppy",
-    "sorbs",
-    "sorer",
-    "sough",
-    "souks",
-    "soupy",
-    "sours",
-    "souse",
-    "spats",
-    "spays",
-    "spick",
-    "spivs",
-    "sprat",
-    "sprit",
-    "spume",
-    "spurn",
-    "sputa",
-    "squab",
-    "stagy",
-    "stele",
-    "stets",
-    "sties",
-    "stoat",
-    "stoup",
-    "stows",
-    "strew",
-    "strop",
-    "stunk",
-    "styes",
-    "sudsy",
-    "sufic",
-    "sufis",
-    "sulfa",
-    "sulks",
-    "sumps",
-    "sunup",
-    "surds",
-    "surer",
-    "swage",
-    "sward",
-    "swats",
-    "sways",
-    "swigs",
-    "swill",
-    "swops",
-    "swots",
-    "sylph",
-    "talas",
-    "talky",
-    "tamps",
-    "tangs",
-    "tansy",
-    "tapir",
-    "tares",
-    "tarns",
-    "tarok",
-    "taros",
-    "tarsi",
-    "teaks",
-    "teals",
-    "tecum",
-    "teems",
-    "teign",
-    "tempi",
-    "tench",
-    "tepee",
-    "thaws",
-    "theca",
-    "throe",
-    "thrum",
-    "thuds",
-    "tided",
-    "tiffs",
-    "tiler",
-    "tilth",
-    "timet",
-    "tined",
-    "tiree",
-    "tizzy",
-    "toady",
-    "toffs",
-    "togas",
-    "tondo",
-    "toped",
-    "toper",
-    "topes",
-    "tosco",
-    "toted",
-    "towyn",
-    "treed",
-    "trews",
-    "treys",
-    "trigs",
-    "trior",
-    "tromp",
-    "troth",
-    "trued",
-    "trues",
-    "tsars",
-    "tubas",
-    "tuffs",
-    "tumid",
-    "tunny",
-    "turfs",
-    "turps",
-    "tutee",
-    "tutus",
-    "twerp",
-    "twits",
-    "twixt",
-    "tyros",
-    "tzars",
-    "ukaea",
-    "ukase",
-    "ulnae",
-    "ulnas",
-    "unapt",
-    "unarm",
-    "unbar",
-    "uncap",
-    "unfed",
-    "uniat",
-    "unius",
-    "unlit",
-    "unman",
-    "unpeg",
-    "unpin",
-    "unsay",
-    "unsex",
-    "upend",
-    "ureic",
-    "uteri",
-    "uvula",
-    "vacua",
-    "vaduz",
-    "vales",
-    "vatic",
-    "vaunt",
-    "veies",
-    "velar",
-    "veldt",
-    "velum",
-    "venal",
-    "vends",
-    "venia",
-    "veray",
-    "verba",
-    "verus",
-    "vexes",
-    "viand",
-    "viler",
-    "villi",
-    "viols",
-    "vires",
-    "virge",
-    "visne",
-    "visus",
-    "vitas",
-    "vivum",
-    "vizor",
-    "wades",
-    "wafts",
-    "waifs",
-    "waked",
-    "waken",
-    "wanes",
-    "wanly",
-    "waxen",
-    "weals",
-    "weans",
-    "weeny",
-    "weepy",
-    "wefts",
-    "welts",
-    "wends",
-    "wetly",
-    "whams",
-    "whelk",
-    "whelp",
-    "whets",
-    "whirr",
-    "whops",
-    "wined",
-    "winos",
-    "wised",
-    "wises",
-    "witam",
-    "witco",
-    "wizen",
-    "wolds",
-    "wolfs",
-    "wombs",
-    "wooer",
-    "woofs",
-    "woozy",
-    "wormy",
-    "wrack",
-    "wrier",
-    "wroth",
-    "wryer",
-    "wryly",
-    "xebec",
-    "yawed",
-    "yawls",
-    "yelps",
-    "yenta",
-    "yetis",
-    "yodel",
-    "yoked",
-    "yokel",
-    "yolky",
-    "yowls",
-    "yoyos",
-    "yuans",
-    "zebus",
-    "zings",
-    "zulus",
-    "zunis",
-]
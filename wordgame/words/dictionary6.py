@@ -1,9159 +0,0 @@
-WORDS = [
-    "search",
-    "online",
-    "people",
-    "health",
-    "should",
-    "system",
-    "policy",
-    "number",
-    "please",
-    "rights",
-    "public",
-    "school",
-    "review",
-    "united",
-    "center",
-    "travel",
-    "report",
-    "member",
-    "before",
-    "hotels",
-    "office",
-    "design",
-    "posted",
-    "within",
-    "states",
-    "family",
-    "prices",
-    "sports",
-    "county",
-    "access",
-    "change",
-    "rating",
-    "during",
-    "return",
-    "events",
-    "little",
-    "movies",
-    "source",
-    "author",
-    "around",
-    "course",
-    "canada",
-    "credit",
-    "estate",
-    "select",
-    "photos",
-    "thread",
-    "market",
-    "really",
-    "action",
-    "series",
-    "second",
-    "forums",
-    "better",
-    "friend",
-    "server",
-    "issues",
-    "street",
-    "things",
-    "person",
-    "mobile",
-    "offers",
-    "recent",
-    "stores",
-    "memory",
-    "social",
-    "august",
-    "create",
-    "single",
-    "latest",
-    "status",
-    "browse",
-    "seller",
-    "always",
-    "result",
-    "groups",
-    "making",
-    "future",
-    "london",
-    "become",
-    "garden",
-    "listed",
-    "energy",
-    "images",
-    "notice",
-    "others",
-    "format",
-    "months",
-    "safety",
-    "having",
-    "common",
-    "living",
-    "called",
-    "period",
-    "window",
-    "france",
-    "region",
-    "island",
-    "record",
-    "direct",
-    "update",
-    "either",
-    "centre",
-    "europe",
-    "topics",
-    "videos",
-    "global",
-    "player",
-    "lyrics",
-    "submit",
-    "amount",
-    "though",
-    "thanks",
-    "weight",
-    "choose",
-    "points",
-    "camera",
-    "domain",
-    "beauty",
-    "models",
-    "simple",
-    "friday",
-    "annual",
-    "church",
-    "method",
-    "active",
-    "figure",
-    "enough",
-    "higher",
-    "yellow",
-    "french",
-    "nature",
-    "orders",
-    "africa",
-    "growth",
-    "agency",
-    "monday",
-    "income",
-    "engine",
-    "double",
-    "screen",
-    "across",
-    "needed",
-    "season",
-    "effect",
-    "sunday",
-    "casino",
-    "volume",
-    "anyone",
-    "silver",
-    "inside",
-    "mature",
-    "rather",
-    "supply",
-    "robert",
-    "skills",
-    "advice",
-    "career",
-    "rental",
-    "middle",
-    "taking",
-    "values",
-    "coming",
-    "object",
-    "length",
-    "client",
-    "follow",
-    "sample",
-    "george",
-    "choice",
-    "artist",
-    "levels",
-    "letter",
-    "phones",
-    "summer",
-    "degree",
-    "button",
-    "matter",
-    "custom",
-    "almost",
-    "editor",
-    "female",
-    "thomas",
-    "cancer",
-    "reason",
-    "spring",
-    "answer",
-    "police",
-    "wanted",
-    "unique",
-    "survey",
-    "animal",
-    "mexico",
-    "secure",
-    "simply",
-    "option",
-    "master",
-    "valley",
-    "larger",
-    "impact",
-    "strong",
-    "ground",
-    "owners",
-    "cities",
-    "ensure",
-    "budget",
-    "guides",
-    "amazon",
-    "retail",
-    "useful",
-    "trying",
-    "mother",
-    "joined",
-    "modern",
-    "senior",
-    "charge",
-    "normal",
-    "entire",
-    "output",
-    "likely",
-    "indian",
-    "dating",
-    "filter",
-    "longer",
-    "behind",
-    "german",
-    "buying",
-    "allows",
-    "boards",
-    "string",
-    "unless",
-    "target",
-    "except",
-    "moving",
-    "brands",
-    "places",
-    "pretty",
-    "winter",
-    "boston",
-    "incest",
-    "medium",
-    "itself",
-    "papers",
-    "awards",
-    "studio",
-    "reader",
-    "device",
-    "remote",
-    "theory",
-    "remove",
-    "visual",
-    "martin",
-    "manual",
-    "agents",
-    "repair",
-    "sector",
-    "jersey",
-    "father",
-    "quotes",
-    "driver",
-    "campus",
-    "beyond",
-    "museum",
-    "former",
-    "parent",
-    "bottom",
-    "detail",
-    "switch",
-    "titles",
-    "basket",
-    "weekly",
-    "demand",
-    "square",
-    "nation",
-    "module",
-    "resort",
-    "random",
-    "motion",
-    "forest",
-    "couple",
-    "giving",
-    "chance",
-    "vision",
-    "ending",
-    "listen",
-    "accept",
-    "lowest",
-    "highly",
-    "appear",
-    "actual",
-    "coffee",
-    "easily",
-    "poster",
-    "closed",
-    "league",
-    "minute",
-    "effort",
-    "fields",
-    "breast",
-    "kansas",
-    "doctor",
-    "reduce",
-    "enable",
-    "leader",
-    "israel",
-    "flight",
-    "pocket",
-    "factor",
-    "stream",
-    "signed",
-    "errors",
-    "worked",
-    "sorted",
-    "myself",
-    "expert",
-    "became",
-    "orange",
-    "marine",
-    "guitar",
-    "saying",
-    "spirit",
-    "claims",
-    "branch",
-    "manage",
-    "corner",
-    "oregon",
-    "tables",
-    "define",
-    "racing",
-    "column",
-    "plants",
-    "avenue",
-    "mental",
-    "viewed",
-    "moment",
-    "attack",
-    "damage",
-    "placed",
-    "dollar",
-    "bridge",
-    "native",
-    "played",
-    "shirts",
-    "profit",
-    "expect",
-    "russia",
-    "golden",
-    "senate",
-    "forces",
-    "turned",
-    "delete",
-    "signal",
-    "issued",
-    "sexual",
-    "flower",
-    "passed",
-    "stated",
-    "hawaii",
-    "covers",
-    "adults",
-    "script",
-    "served",
-    "dining",
-    "dakota",
-    "handle",
-    "looked",
-    "logged",
-    "laptop",
-    "nearly",
-    "forgot",
-    "origin",
-    "gaming",
-    "faster",
-    "dallas",
-    "bought",
-    "broken",
-    "alaska",
-    "battle",
-    "equity",
-    "speech",
-    "shared",
-    "sounds",
-    "forced",
-    "height",
-    "obtain",
-    "remain",
-    "failed",
-    "secret",
-    "austin",
-    "andrew",
-    "assets",
-    "injury",
-    "joseph",
-    "lawyer",
-    "portal",
-    "gratis",
-    "toward",
-    "assist",
-    "comics",
-    "houses",
-    "postal",
-    "finish",
-    "daniel",
-    "brazil",
-    "static",
-    "hunter",
-    "famous",
-    "writer",
-    "gender",
-    "colour",
-    "vendor",
-    "junior",
-    "ladies",
-    "ticket",
-    "agreed",
-    "soccer",
-    "import",
-    "christ",
-    "scheme",
-    "manner",
-    "matrix",
-    "turkey",
-    "proper",
-    "inches",
-    "shares",
-    "voyeur",
-    "colors",
-    "appeal",
-    "cruise",
-    "disney",
-    "drives",
-    "dealer",
-    "nearby",
-    "happen",
-    "miller",
-    "caused",
-    "luxury",
-    "frames",
-    "indeed",
-    "easier",
-    "adding",
-    "mostly",
-    "taylor",
-    "prints",
-    "suites",
-    "hidden",
-    "serial",
-    "relief",
-    "planet",
-    "copies",
-    "recipe",
-    "permit",
-    "seeing",
-    "tennis",
-    "bureau",
-    "pieces",
-    "dinner",
-    "sydney",
-    "stress",
-    "trends",
-    "fourth",
-    "wilson",
-    "charts",
-    "census",
-    "poetry",
-    "lights",
-    "forget",
-    "sister",
-    "newest",
-    "extent",
-    "export",
-    "sweden",
-    "backup",
-    "spread",
-    "expand",
-    "jordan",
-    "affect",
-    "virgin",
-    "raised",
-    "blonde",
-    "albums",
-    "cheats",
-    "guests",
-    "hosted",
-    "nevada",
-    "agenda",
-    "anyway",
-    "tracks",
-    "prince",
-    "circle",
-    "grants",
-    "edward",
-    "launch",
-    "symbol",
-    "crafts",
-    "fiscal",
-    "styles",
-    "denver",
-    "filled",
-    "notify",
-    "cables",
-    "cotton",
-    "dental",
-    "killed",
-    "border",
-    "debate",
-    "starts",
-    "causes",
-    "opened",
-    "scores",
-    "comedy",
-    "linear",
-    "edited",
-    "jewish",
-    "linked",
-    "wonder",
-    "begins",
-    "reform",
-    "alerts",
-    "assume",
-    "howard",
-    "leaves",
-    "checks",
-    "safari",
-    "tested",
-    "formal",
-    "hockey",
-    "showed",
-    "cancel",
-    "limits",
-    "outlet",
-    "winner",
-    "potter",
-    "modify",
-    "oxford",
-    "patent",
-    "eating",
-    "mirror",
-    "kernel",
-    "stocks",
-    "buyers",
-    "taiwan",
-    "chosen",
-    "greece",
-    "labour",
-    "nights",
-    "behalf",
-    "liquid",
-    "salary",
-    "saving",
-    "empire",
-    "resume",
-    "twenty",
-    "avatar",
-    "helped",
-    "decide",
-    "guinea",
-    "muscle",
-    "attend",
-    "shower",
-    "seemed",
-    "finder",
-    "unable",
-    "insert",
-    "alumni",
-    "themes",
-    "powers",
-    "heaven",
-    "norway",
-    "asking",
-    "blocks",
-    "bodies",
-    "paying",
-    "carbon",
-    "crisis",
-    "bright",
-    "header",
-    "formed",
-    "sheets",
-    "puerto",
-    "plasma",
-    "banner",
-    "dreams",
-    "stands",
-    "wheels",
-    "poland",
-    "folder",
-    "upload",
-    "voting",
-    "courts",
-    "regard",
-    "exists",
-    "smooth",
-    "strike",
-    "narrow",
-    "threat",
-    "castle",
-    "missed",
-    "labels",
-    "acting",
-    "stored",
-    "stable",
-    "lesson",
-    "cinema",
-    "severe",
-    "deluxe",
-    "fabric",
-    "visits",
-    "flying",
-    "berlin",
-    "pounds",
-    "desire",
-    "caught",
-    "marked",
-    "driven",
-    "bottle",
-    "rubber",
-    "legend",
-    "python",
-    "entity",
-    "holder",
-    "duties",
-    "erotic",
-    "ethics",
-    "dragon",
-    "brings",
-    "stereo",
-    "commit",
-    "jacket",
-    "oracle",
-    "excess",
-    "stamps",
-    "mining",
-    "garage",
-    "thongs",
-    "morgan",
-    "prayer",
-    "cheese",
-    "fetish",
-    "apache",
-    "fellow",
-    "lounge",
-    "hilton",
-    "horror",
-    "mainly",
-    "ethnic",
-    "occurs",
-    "layout",
-    "horses",
-    "donate",
-    "taught",
-    "worker",
-    "temple",
-    "breaks",
-    "waters",
-    "prefer",
-    "harris",
-    "toyota",
-    "vector",
-    "shaved",
-    "buffer",
-    "purple",
-    "mutual",
-    "syntax",
-    "prison",
-    "chairs",
-    "sierra",
-    "desert",
-    "oldest",
-    "steven",
-    "summit",
-    "spaces",
-    "escape",
-    "glance",
-    "arcade",
-    "filing",
-    "foster",
-    "trials",
-    "tissue",
-    "aspect",
-    "counts",
-    "priced",
-    "closer",
-    "shadow",
-    "riding",
-    "clinic",
-    "korean",
-    "packet",
-    "funded",
-    "extend",
-    "dublin",
-    "nelson",
-    "murder",
-    "grades",
-    "digest",
-    "rescue",
-    "losses",
-    "combat",
-    "abroad",
-    "arthur",
-    "walker",
-    "gordon",
-    "serves",
-    "palace",
-    "verify",
-    "copper",
-    "nobody",
-    "cloudy",
-    "plenty",
-    "throat",
-    "ignore",
-    "wealth",
-    "vacuum",
-    "writes",
-    "plates",
-    "essays",
-    "fairly",
-    "stupid",
-    "harbor",
-    "puzzle",
-    "rising",
-    "latter",
-    "repeat",
-    "pupils",
-    "casual",
-    "polish",
-    "lovely",
-    "extras",
-    "clause",
-    "troops",
-    "indoor",
-    "broker",
-    "trucks",
-    "partly",
-    "donald",
-    "sensor",
-    "angels",
-    "deputy",
-    "sealed",
-    "loaded",
-    "scenes",
-    "finger",
-    "locate",
-    "wooden",
-    "motors",
-    "shorts",
-    "johnny",
-    "facing",
-    "refund",
-    "cyprus",
-    "makers",
-    "hearts",
-    "carter",
-    "legacy",
-    "danger",
-    "widely",
-    "phrase",
-    "hybrid",
-    "bigger",
-    "diesel",
-    "versus",
-    "exceed",
-    "babies",
-    "albert",
-    "graham",
-    "slowly",
-    "infant",
-    "samuel",
-    "unlike",
-    "wright",
-    "proven",
-    "cached",
-    "warren",
-    "comply",
-    "cherry",
-    "quebec",
-    "dennis",
-    "socket",
-    "silent",
-    "humans",
-    "analog",
-    "facial",
-    "talent",
-    "seeker",
-    "wisdom",
-    "offset",
-    "philip",
-    "stages",
-    "powder",
-    "assess",
-    "stones",
-    "losing",
-    "gospel",
-    "knight",
-    "earned",
-    "parker",
-    "triple",
-    "cooper",
-    "titans",
-    "sought",
-    "median",
-    "herein",
-    "basics",
-    "carpet",
-    "lenses",
-    "binary",
-    "walter",
-    "warner",
-    "inkjet",
-    "wizard",
-    "actors",
-    "liable",
-    "morris",
-    "recall",
-    "picked",
-    "belief",
-    "bikini",
-    "lookup",
-    "ottawa",
-    "refine",
-    "bidder",
-    "singer",
-    "herald",
-    "diving",
-    "invite",
-    "terror",
-    "thirty",
-    "refers",
-    "victim",
-    "arrive",
-    "sunset",
-    "framed",
-    "inform",
-    "murray",
-    "intent",
-    "oxygen",
-    "cookie",
-    "canyon",
-    "meters",
-    "merely",
-    "passes",
-    "durham",
-    "muslim",
-    "sleeve",
-    "stroke",
-    "sharon",
-    "gloves",
-    "skiing",
-    "timing",
-    "denied",
-    "fucked",
-    "deaths",
-    "rivers",
-    "thumbs",
-    "twelve",
-    "decade",
-    "drinks",
-    "voices",
-    "honest",
-    "albany",
-    "coding",
-    "hiking",
-    "pierre",
-    "arabia",
-    "panama",
-    "athens",
-    "judges",
-    "walked",
-    "nissan",
-    "afraid",
-    "norton",
-    "locked",
-    "fusion",
-    "canvas",
-    "parish",
-    "coupon",
-    "nurses",
-    "tagged",
-    "killer",
-    "bishop",
-    "pulled",
-    "shaped",
-    "farmer",
-    "heroes",
-    "floral",
-    "fisher",
-    "spears",
-    "worlds",
-    "guilty",
-    "tablet",
-    "crimes",
-    "moscow",
-    "thesis",
-    "pixels",
-    "totals",
-    "afford",
-    "turner",
-    "spoken",
-    "stayed",
-    "redeem",
-    "rogers",
-    "regime",
-    "wishes",
-    "depend",
-    "differ",
-    "monica",
-    "breath",
-    "candle",
-    "herbal",
-    "loving",
-    "deemed",
-    "hacker",
-    "madrid",
-    "margin",
-    "solely",
-    "norman",
-    "headed",
-    "voters",
-    "murphy",
-    "thinks",
-    "justin",
-    "tricks",
-    "panels",
-    "tongue",
-    "danish",
-    "monkey",
-    "invest",
-    "lovers",
-    "atomic",
-    "arabic",
-    "rachel",
-    "chains",
-    "engage",
-    "quoted",
-    "bronze",
-    "sender",
-    "spouse",
-    "exotic",
-    "viewer",
-    "proved",
-    "salmon",
-    "butter",
-    "pepper",
-    "weapon",
-    "burden",
-    "finest",
-    "realty",
-    "autumn",
-    "toilet",
-    "ranked",
-    "routes",
-    "packed",
-    "timely",
-    "talked",
-    "villas",
-    "peeing",
-    "brooks",
-    "newton",
-    "whilst",
-    "prompt",
-    "victor",
-    "attach",
-    "spider",
-    "ranges",
-    "trails",
-    "hudson",
-    "divine",
-    "dialog",
-    "venues",
-    "shield",
-    "prague",
-    "pickup",
-    "sacred",
-    "chrome",
-    "oliver",
-    "delays",
-    "scored",
-    "lambda",
-    "belong",
-    "escort",
-    "barnes",
-    "rabbit",
-    "unions",
-    "frozen",
-    "scales",
-    "strain",
-    "yamaha",
-    "hebrew",
-    "gained",
-    "adjust",
-    "soviet",
-    "treaty",
-    "vienna",
-    "chapel",
-    "layers",
-    "guided",
-    "powell",
-    "radius",
-    "harder",
-    "stuart",
-    "monroe",
-    "tender",
-    "clouds",
-    "easter",
-    "praise",
-    "jeremy",
-    "venice",
-    "hardly",
-    "absent",
-    "hoping",
-    "bubble",
-    "vessel",
-    "lauren",
-    "ashley",
-    "scroll",
-    "relate",
-    "suffer",
-    "retain",
-    "tunnel",
-    "genres",
-    "beaver",
-    "eagles",
-    "anchor",
-    "parade",
-    "hiring",
-    "clocks",
-    "surely",
-    "stylus",
-    "arnold",
-    "chicks",
-    "cattle",
-    "reload",
-    "kuwait",
-    "struck",
-    "bridal",
-    "tribal",
-    "rebate",
-    "cycles",
-    "detect",
-    "butler",
-    "immune",
-    "latvia",
-    "rarely",
-    "martha",
-    "trains",
-    "metals",
-    "celtic",
-    "advise",
-    "boxing",
-    "hughes",
-    "reveal",
-    "watson",
-    "strict",
-    "timber",
-    "ruling",
-    "steady",
-    "hourly",
-    "geneva",
-    "handed",
-    "intake",
-    "tucson",
-    "assure",
-    "sodium",
-    "decent",
-    "dayton",
-    "uganda",
-    "trivia",
-    "adidas",
-    "harvey",
-    "hazard",
-    "fruits",
-    "ribbon",
-    "suzuki",
-    "exempt",
-    "dishes",
-    "refuse",
-    "trades",
-    "superb",
-    "floors",
-    "speaks",
-    "burton",
-    "copied",
-    "scotia",
-    "roller",
-    "nicole",
-    "latino",
-    "mixing",
-    "fitted",
-    "asthma",
-    "reward",
-    "zambia",
-    "sprint",
-    "inputs",
-    "knives",
-    "honors",
-    "fallen",
-    "sussex",
-    "gather",
-    "backed",
-    "alfred",
-    "motels",
-    "slight",
-    "arrest",
-    "deeply",
-    "marina",
-    "prizes",
-    "bosnia",
-    "optics",
-    "pursue",
-    "nipple",
-    "plains",
-    "lonely",
-    "hereby",
-    "collar",
-    "racial",
-    "amanda",
-    "novels",
-    "safely",
-    "finite",
-    "kidney",
-    "allied",
-    "throws",
-    "roster",
-    "tuning",
-    "gotten",
-    "rocket",
-    "bullet",
-    "towers",
-    "duncan",
-    "priest",
-    "ronald",
-    "trance",
-    "locale",
-    "bundle",
-    "hammer",
-    "runner",
-    "notion",
-    "mailed",
-    "arctic",
-    "defend",
-    "stolen",
-    "agrees",
-    "cheers",
-    "zoning",
-    "mighty",
-    "holmes",
-    "galaxy",
-    "caring",
-    "buried",
-    "darwin",
-    "milton",
-    "marker",
-    "sandra",
-    "monaco",
-    "belize",
-    "robust",
-    "porter",
-    "jungle",
-    "alpine",
-    "cooler",
-    "shapes",
-    "andrea",
-    "breeds",
-    "rapids",
-    "bailey",
-    "eugene",
-    "metric",
-    "joshua",
-    "varied",
-    "grande",
-    "assign",
-    "tigers",
-    "aurora",
-    "slides",
-    "lender",
-    "chorus",
-    "rhythm",
-    "argued",
-    "clarke",
-    "sudden",
-    "claire",
-    "speeds",
-    "vocals",
-    "chubby",
-    "burner",
-    "gentle",
-    "deeper",
-    "worthy",
-    "saints",
-    "helena",
-    "marion",
-    "cowboy",
-    "queens",
-    "tribes",
-    "defeat",
-    "clicks",
-    "harper",
-    "tenant",
-    "tattoo",
-    "freely",
-    "marcus",
-    "nudist",
-    "remedy",
-    "genius",
-    "barely",
-    "pamela",
-    "marble",
-    "surrey",
-    "giants",
-    "solved",
-    "magnet",
-    "cayman",
-    "jaguar",
-    "posing",
-    "urgent",
-    "gothic",
-    "graphs",
-    "patrol",
-    "divide",
-    "boring",
-    "schema",
-    "prefix",
-    "barrel",
-    "typing",
-    "harold",
-    "floppy",
-    "namely",
-    "aerial",
-    "makeup",
-    "nathan",
-    "tobago",
-    "wicked",
-    "pushed",
-    "reggae",
-    "saturn",
-    "enzyme",
-    "planes",
-    "tackle",
-    "vernon",
-    "builds",
-    "leslie",
-    "favors",
-    "potato",
-    "sticks",
-    "excuse",
-    "strand",
-    "cheque",
-    "reject",
-    "italic",
-    "valued",
-    "batman",
-    "luther",
-    "settle",
-    "scenic",
-    "sewing",
-    "munich",
-    "trusts",
-    "pillow",
-    "finals",
-    "parcel",
-    "rolled",
-    "flavor",
-    "hungry",
-    "malawi",
-    "lesser",
-    "charms",
-    "trader",
-    "denial",
-    "thrown",
-    "raises",
-    "ballot",
-    "angola",
-    "squirt",
-    "helmet",
-    "nickel",
-    "wallet",
-    "coated",
-    "intend",
-    "louise",
-    "beings",
-    "habits",
-    "accent",
-    "eleven",
-    "auburn",
-    "unlock",
-    "pledge",
-    "angela",
-    "merger",
-    "rwanda",
-    "riders",
-    "remark",
-    "dozens",
-    "varies",
-    "guards",
-    "nudity",
-    "kruger",
-    "granny",
-    "fleece",
-    "pierce",
-    "breach",
-    "wiring",
-    "pastor",
-    "calvin",
-    "phases",
-    "ballet",
-    "bumper",
-    "garlic",
-    "banned",
-    "briefs",
-    "radios",
-    "tariff",
-    "vagina",
-    "hostel",
-    "employ",
-    "yearly",
-    "marvel",
-    "petite",
-    "strips",
-    "gossip",
-    "rotary",
-    "skirts",
-    "serbia",
-    "guyana",
-    "deadly",
-    "rounds",
-    "dosage",
-    "baking",
-    "needle",
-    "brakes",
-    "sticky",
-    "heated",
-    "jackie",
-    "adrian",
-    "brutal",
-    "yields",
-    "suited",
-    "blacks",
-    "curves",
-    "vertex",
-    "tomato",
-    "waiver",
-    "valves",
-    "donors",
-    "julian",
-    "velvet",
-    "wesley",
-    "lately",
-    "brunei",
-    "banana",
-    "slovak",
-    "bloody",
-    "remind",
-    "affair",
-    "washer",
-    "beside",
-    "mentor",
-    "fought",
-    "metres",
-    "pencil",
-    "freeze",
-    "titled",
-    "sphere",
-    "ratios",
-    "walnut",
-    "ladder",
-    "orgasm",
-    "condos",
-    "gently",
-    "fridge",
-    "fraser",
-    "blades",
-    "trauma",
-    "advert",
-    "picnic",
-    "hollow",
-    "groove",
-    "sleeps",
-    "travis",
-    "heater",
-    "colony",
-    "cannon",
-    "circus",
-    "forbes",
-    "cooked",
-    "gerald",
-    "hunger",
-    "cement",
-    "closes",
-    "violin",
-    "naples",
-    "modems",
-    "newark",
-    "turtle",
-    "warned",
-    "neural",
-    "fossil",
-    "apollo",
-    "greene",
-    "robots",
-    "nested",
-    "movers",
-    "verbal",
-    "bryant",
-    "render",
-    "carmen",
-    "impose",
-    "enters",
-    "savage",
-    "willow",
-    "favour",
-    "roland",
-    "mounts",
-    "subtle",
-    "cradle",
-    "virtue",
-    "corpus",
-    "shades",
-    "cursor",
-    "maiden",
-    "viking",
-    "myrtle",
-    "bother",
-    "bhutan",
-    "mating",
-    "unwrap",
-    "resist",
-    "wagner",
-    "ranger",
-    "newman",
-    "scared",
-    "asylum",
-    "poison",
-    "costly",
-    "stitch",
-    "inland",
-    "racism",
-    "accord",
-    "modest",
-    "unused",
-    "insure",
-    "treats",
-    "marino",
-    "carson",
-    "gallon",
-    "bitter",
-    "burned",
-    "depart",
-    "minded",
-    "allies",
-    "alicia",
-    "quartz",
-    "eighth",
-    "buffet",
-    "masses",
-    "cheryl",
-    "ginger",
-    "crying",
-    "rotten",
-    "garnet",
-    "honour",
-    "peters",
-    "clever",
-    "primer",
-    "fresno",
-    "bypass",
-    "orgies",
-    "plated",
-    "drawer",
-    "judith",
-    "davies",
-    "pilots",
-    "humour",
-    "caller",
-    "viable",
-    "defect",
-    "poorly",
-    "argues",
-    "organs",
-    "bolton",
-    "refill",
-    "reagan",
-    "sailor",
-    "lining",
-    "statue",
-    "hilary",
-    "equals",
-    "jumper",
-    "majors",
-    "delphi",
-    "trophy",
-    "sights",
-    "liquor",
-    "debbie",
-    "trojan",
-    "spinal",
-    "sooner",
-    "tenure",
-    "shifts",
-    "greens",
-    "naming",
-    "slaves",
-    "mickey",
-    "aliens",
-    "domino",
-    "gambia",
-    "angles",
-    "flames",
-    "toledo",
-    "closet",
-    "reebok",
-    "unfair",
-    "sahara",
-    "vacant",
-    "fixing",
-    "hiding",
-    "hannah",
-    "insect",
-    "breeze",
-    "yankee",
-    "snacks",
-    "saddle",
-    "fedora",
-    "capita",
-    "wholly",
-    "manila",
-    "purely",
-    "enroll",
-    "daemon",
-    "alarms",
-    "stairs",
-    "falcon",
-    "critic",
-    "bucket",
-    "subset",
-    "sutton",
-    "zombie",
-    "mutant",
-    "bounce",
-    "spiral",
-    "jacobs",
-    "irvine",
-    "nicely",
-    "laurel",
-    "traded",
-    "shrimp",
-    "chords",
-    "cracks",
-    "lotion",
-    "beaten",
-    "tucker",
-    "chiefs",
-    "lodges",
-    "scream",
-    "biking",
-    "pirate",
-    "senses",
-    "willie",
-    "slower",
-    "vanity",
-    "cutter",
-    "melody",
-    "cousin",
-    "torque",
-    "burial",
-    "willis",
-    "camden",
-    "emerge",
-    "clutch",
-    "towels",
-    "barber",
-    "barton",
-    "olivia",
-    "straps",
-    "romans",
-    "shores",
-    "thames",
-    "cosmic",
-    "beacon",
-    "hoover",
-    "firing",
-    "denise",
-    "gloria",
-    "maggie",
-    "canton",
-    "bonnie",
-    "laying",
-    "strive",
-    "shells",
-    "cooker",
-    "digits",
-    "banker",
-    "borrow",
-    "bamboo",
-    "insane",
-    "buddha",
-    "voyage",
-    "mozart",
-    "sketch",
-    "dancer",
-    "firmly",
-    "washed",
-    "mosaic",
-    "rhodes",
-    "fiesta",
-    "boeing",
-    "sizing",
-    "outfit",
-    "aboard",
-    "irving",
-    "joints",
-    "bounds",
-    "devils",
-    "arrays",
-    "splash",
-    "fender",
-    "violet",
-    "hitler",
-    "pearls",
-    "apples",
-    "advent",
-    "screws",
-    "enjoys",
-    "stripe",
-    "locker",
-    "squash",
-    "tumors",
-    "booked",
-    "lumber",
-    "asleep",
-    "bissau",
-    "subway",
-    "lifted",
-    "citrus",
-    "ernest",
-    "bakery",
-    "orchid",
-    "widget",
-    "atkins",
-    "waited",
-    "stefan",
-    "diaper",
-    "ounces",
-    "intact",
-    "noting",
-    "moines",
-    "duplex",
-    "herman",
-    "refuge",
-    "walton",
-    "carved",
-    "jasper",
-    "deploy",
-    "regina",
-    "autism",
-    "fuller",
-    "keeper",
-    "spells",
-    "rookie",
-    "births",
-    "ritual",
-    "miguel",
-    "parser",
-    "plaque",
-    "drying",
-    "proves",
-    "brooke",
-    "morton",
-    "debris",
-    "benson",
-    "alison",
-    "audits",
-    "grains",
-    "jumped",
-    "rename",
-    "copier",
-    "beware",
-    "gifted",
-    "esteem",
-    "shelby",
-    "landed",
-    "scouts",
-    "warsaw",
-    "regret",
-    "stakes",
-    "litter",
-    "rugged",
-    "humble",
-    "petrol",
-    "midway",
-    "flyers",
-    "whites",
-    "locals",
-    "fringe",
-    "steele",
-    "citing",
-    "hassle",
-    "exeter",
-    "docket",
-    "nordic",
-    "thirds",
-    "intern",
-    "oppose",
-    "sparks",
-    "madden",
-    "lively",
-    "tripod",
-    "paints",
-    "tastes",
-    "storms",
-    "smiled",
-    "elaine",
-    "expose",
-    "arises",
-    "lisbon",
-    "hobart",
-    "dorset",
-    "buenos",
-    "mystic",
-    "afghan",
-    "oakley",
-    "brenda",
-    "wasted",
-    "footer",
-    "graves",
-    "ghetto",
-    "meadow",
-    "feeder",
-    "mercer",
-    "wastes",
-    "parked",
-    "castro",
-    "peanut",
-    "kaiser",
-    "wallis",
-    "retire",
-    "rumors",
-    "conrad",
-    "wished",
-    "kicked",
-    "gadget",
-    "ticker",
-    "thrust",
-    "novice",
-    "hewitt",
-    "traces",
-    "weston",
-    "fights",
-    "padded",
-    "revise",
-    "weaver",
-    "macros",
-    "pewter",
-    "trevor",
-    "oceans",
-    "arrows",
-    "eureka",
-    "esther",
-    "laurie",
-    "zodiac",
-    "tubing",
-    "artery",
-    "fluids",
-    "canopy",
-    "fibers",
-    "brains",
-    "indigo",
-    "tuvalu",
-    "excite",
-    "rebels",
-    "pseudo",
-    "throne",
-    "slopes",
-    "seized",
-    "leases",
-    "expire",
-    "methyl",
-    "marvin",
-    "usable",
-    "conway",
-    "denote",
-    "slayer",
-    "tester",
-    "relies",
-    "rodney",
-    "fulton",
-    "zurich",
-    "spares",
-    "salons",
-    "helper",
-    "rancho",
-    "skinny",
-    "sewage",
-    "iraqis",
-    "wretch",
-    "racist",
-    "convey",
-    "govern",
-    "reboot",
-    "blinds",
-    "traits",
-    "graded",
-    "abused",
-    "billed",
-    "smiles",
-    "merged",
-    "relied",
-    "kindly",
-    "sharks",
-    "minors",
-    "dances",
-    "mapped",
-    "decree",
-    "jerome",
-    "gamble",
-    "gravel",
-    "judged",
-    "assert",
-    "thrice",
-    "edison",
-    "sequel",
-    "wolves",
-    "herpes",
-    "upward",
-    "dundee",
-    "streak",
-    "tragic",
-    "hooked",
-    "shrink",
-    "taipei",
-    "unesco",
-    "stance",
-    "beaded",
-    "exodus",
-    "gemini",
-    "derive",
-    "opener",
-    "jigsaw",
-    "unreal",
-    "wounds",
-    "probes",
-    "swivel",
-    "medals",
-    "proton",
-    "lister",
-    "cabins",
-    "linens",
-    "beetle",
-    "hatred",
-    "behave",
-    "encore",
-    "unsure",
-    "merits",
-    "sidney",
-    "sheila",
-    "ripper",
-    "burger",
-    "syrian",
-    "abbott",
-    "tailor",
-    "pascal",
-    "faults",
-    "grease",
-    "cairns",
-    "seated",
-    "sirius",
-    "replay",
-    "smoked",
-    "baltic",
-    "fowler",
-    "warmth",
-    "verses",
-    "toggle",
-    "barker",
-    "solids",
-    "demons",
-    "coping",
-    "baxter",
-    "curved",
-    "amazed",
-    "shocks",
-    "lasers",
-    "candid",
-    "caesar",
-    "savers",
-    "sophie",
-    "decker",
-    "extern",
-    "badges",
-    "kitten",
-    "brides",
-    "glossy",
-    "haired",
-    "lethal",
-    "cavity",
-    "molded",
-    "decals",
-    "towing",
-    "suburb",
-    "cohort",
-    "pueblo",
-    "nylons",
-    "misses",
-    "purity",
-    "cellar",
-    "onions",
-    "issuer",
-    "sylvia",
-    "swords",
-    "evolve",
-    "leased",
-    "bergen",
-    "sweets",
-    "ashton",
-    "saloon",
-    "unisex",
-    "folded",
-    "unpaid",
-    "ghosts",
-    "doubts",
-    "insist",
-    "resale",
-    "howell",
-    "scalar",
-    "sesame",
-    "joanne",
-    "yachts",
-    "misuse",
-    "cosmos",
-    "legion",
-    "isaiah",
-    "addict",
-    "pistol",
-    "runway",
-    "admits",
-    "bombay",
-    "buckle",
-    "divers",
-    "upside",
-    "patron",
-    "boiler",
-    "induce",
-    "debtor",
-    "mortal",
-    "stella",
-    "cereal",
-    "drills",
-    "rented",
-    "openly",
-    "jabber",
-    "rotate",
-    "behold",
-    "ledger",
-    "laughs",
-    "depths",
-    "spices",
-    "loader",
-    "felony",
-    "strait",
-    "donkey",
-    "boasts",
-    "radial",
-    "armour",
-    "tonnes",
-    "corona",
-    "bylaws",
-    "reside",
-    "samson",
-    "seldom",
-    "morrow",
-    "lasted",
-    "awhile",
-    "winery",
-    "scaled",
-    "photon",
-    "franco",
-    "coarse",
-    "archer",
-    "warmer",
-    "dryers",
-    "asians",
-    "orient",
-    "contra",
-    "mclean",
-    "cigars",
-    "maroon",
-    "drafts",
-    "marrow",
-    "tavern",
-    "clones",
-    "gerard",
-    "runoff",
-    "garner",
-    "buster",
-    "nassau",
-    "karate",
-    "sorrow",
-    "canned",
-    "dupont",
-    "supper",
-    "hooded",
-    "sonata",
-    "stools",
-    "stacks",
-    "owning",
-    "sermon",
-    "thrill",
-    "lagoon",
-    "ramsey",
-    "pigeon",
-    "rivals",
-    "binder",
-    "parrot",
-    "magnum",
-    "attain",
-    "sulfur",
-    "corpse",
-    "speedy",
-    "stills",
-    "biased",
-    "brewer",
-    "adhere",
-    "whales",
-    "parity",
-    "grapes",
-    "ripped",
-    "cobalt",
-    "aspire",
-    "jewels",
-    "bonded",
-    "dudley",
-    "canary",
-    "clergy",
-    "oyster",
-    "sturdy",
-    "tokens",
-    "piping",
-    "elders",
-    "heroin",
-    "oldies",
-    "parole",
-    "ninety",
-    "kisses",
-    "galway",
-    "learns",
-    "slices",
-    "lawson",
-    "damned",
-    "fierce",
-    "blends",
-    "winnie",
-    "grills",
-    "escrow",
-    "lumpur",
-    "anthem",
-    "abuses",
-    "jockey",
-    "edmund",
-    "peoria",
-    "housed",
-    "havana",
-    "ranged",
-    "spruce",
-    "jeanne",
-    "cortex",
-    "mixers",
-    "braves",
-    "shoots",
-    "clover",
-    "duluth",
-    "snakes",
-    "lester",
-    "truths",
-    "enamel",
-    "bomber",
-    "reeves",
-    "spends",
-    "almond",
-    "alexis",
-    "puppet",
-    "pillar",
-    "mirage",
-    "piracy",
-    "rowing",
-    "siding",
-    "albeit",
-    "freaks",
-    "tended",
-    "cactus",
-    "janice",
-    "sucked",
-    "regent",
-    "evelyn",
-    "misery",
-    "mailer",
-    "liners",
-    "unread",
-    "forged",
-    "bistro",
-    "voodoo",
-    "rustic",
-    "rushed",
-    "weighs",
-    "dexter",
-    "ringer",
-    "zipper",
-    "crowds",
-    "uptake",
-    "geared",
-    "ideals",
-    "tycoon",
-    "lawful",
-    "crosby",
-    "tandem",
-    "gagged",
-    "barley",
-    "potent",
-    "nerves",
-    "sherry",
-    "indies",
-    "madame",
-    "dalton",
-    "denies",
-    "draper",
-    "bowman",
-    "spires",
-    "barney",
-    "champs",
-    "salads",
-    "eighty",
-    "scarce",
-    "plague",
-    "canine",
-    "gladly",
-    "julius",
-    "cannes",
-    "piston",
-    "topped",
-    "absorb",
-    "feared",
-    "overly",
-    "chalet",
-    "hopper",
-    "ludwig",
-    "filler",
-    "zenith",
-    "browns",
-    "softly",
-    "occupy",
-    "audrey",
-    "merlin",
-    "aiming",
-    "beanie",
-    "tricky",
-    "spaced",
-    "albion",
-    "psycho",
-    "tutors",
-    "kettle",
-    "satire",
-    "humane",
-    "raider",
-    "timers",
-    "miners",
-    "rocker",
-    "sawyer",
-    "cooled",
-    "invoke",
-    "paddle",
-    "rooted",
-    "finale",
-    "weaker",
-    "nausea",
-    "floods",
-    "malaga",
-    "sleepy",
-    "rupert",
-    "shrine",
-    "memoir",
-    "cliffs",
-    "hayden",
-    "smells",
-    "waking",
-    "reflex",
-    "carers",
-    "keypad",
-    "bibles",
-    "joanna",
-    "sauces",
-    "creole",
-    "trendy",
-    "badger",
-    "quilts",
-    "ageing",
-    "splits",
-    "keynes",
-    "tomcat",
-    "clerks",
-    "pissed",
-    "sponge",
-    "snatch",
-    "kissed",
-    "psalms",
-    "hamlet",
-    "grange",
-    "brandy",
-    "swings",
-    "vortex",
-    "purses",
-    "bodily",
-    "equine",
-    "lizard",
-    "tehran",
-    "encode",
-    "sliced",
-    "durban",
-    "learnt",
-    "gauges",
-    "briggs",
-    "spying",
-    "talbot",
-    "kosher",
-    "mantle",
-    "armies",
-    "camper",
-    "ceased",
-    "sophia",
-    "pastry",
-    "repeal",
-    "eileen",
-    "cyclic",
-    "condom",
-    "admire",
-    "poured",
-    "suffix",
-    "gandhi",
-    "mister",
-    "creamy",
-    "mayhem",
-    "octave",
-    "struts",
-    "proofs",
-    "alloys",
-    "jessie",
-    "truman",
-    "polite",
-    "paving",
-    "boogie",
-    "bricks",
-    "jingle",
-    "bounty",
-    "fishes",
-    "taurus",
-    "absurd",
-    "stoves",
-    "embryo",
-    "unsafe",
-    "sheikh",
-    "append",
-    "motive",
-    "bethel",
-    "dwight",
-    "stokes",
-    "harlem",
-    "resets",
-    "faulty",
-    "brunch",
-    "pundit",
-    "expiry",
-    "inning",
-    "monies",
-    "marcel",
-    "stacey",
-    "storey",
-    "scotch",
-    "juliet",
-    "galore",
-    "bangor",
-    "persia",
-    "theirs",
-    "emblem",
-    "sniper",
-    "scopes",
-    "braces",
-    "skates",
-    "crises",
-    "darker",
-    "globes",
-    "choral",
-    "edible",
-    "beirut",
-    "evenly",
-    "lionel",
-    "rhymes",
-    "coyote",
-    "pollen",
-    "shrubs",
-    "barrow",
-    "rifles",
-    "excise",
-    "poetic",
-    "mortar",
-    "blamed",
-    "inmate",
-    "septic",
-    "armada",
-    "wrench",
-    "flawed",
-    "fences",
-    "unicef",
-    "carton",
-    "outlaw",
-    "bovine",
-    "tights",
-    "motley",
-    "verona",
-    "punish",
-    "causal",
-    "hacked",
-    "classy",
-    "kbytes",
-    "saline",
-    "botany",
-    "dreamy",
-    "bengal",
-    "gasket",
-    "lastly",
-    "wander",
-    "micron",
-    "pantie",
-    "covert",
-    "crater",
-    "thence",
-    "goblet",
-    "fronts",
-    "nodded",
-    "utmost",
-    "cheeks",
-    "beasts",
-    "planar",
-    "quorum",
-    "muller",
-    "mosque",
-    "vested",
-    "sander",
-    "oldham",
-    "climax",
-    "pardon",
-    "teller",
-    "biopsy",
-    "quarry",
-    "insult",
-    "scraps",
-    "waived",
-    "kennel",
-    "pastel",
-    "mcgill",
-    "carrot",
-    "opaque",
-    "marian",
-    "hurley",
-    "pedals",
-    "shaker",
-    "athena",
-    "relays",
-    "fading",
-    "endure",
-    "cursed",
-    "youths",
-    "massey",
-    "tumble",
-    "helium",
-    "bernie",
-    "finely",
-    "filmed",
-    "staten",
-    "smoker",
-    "benign",
-    "sludge",
-    "tanned",
-    "bunker",
-    "mormon",
-    "blanks",
-    "annals",
-    "losers",
-    "barred",
-    "urging",
-    "melted",
-    "whores",
-    "staple",
-    "rulers",
-    "grille",
-    "pushes",
-    "topeka",
-    "ulster",
-    "tailed",
-    "punjab",
-    "winged",
-    "ruined",
-    "sanity",
-    "haynes",
-    "rumble",
-    "heroic",
-    "bonsai",
-    "odessa",
-    "faucet",
-    "midget",
-    "boiled",
-    "anemia",
-    "biting",
-    "idiots",
-    "paging",
-    "spikes",
-    "latent",
-    "marcia",
-    "hector",
-    "wicker",
-    "nephew",
-    "traced",
-    "myriad",
-    "stains",
-    "sandal",
-    "hanger",
-    "echoes",
-    "blazer",
-    "linden",
-    "dumped",
-    "convex",
-    "richer",
-    "patton",
-    "surfer",
-    "paired",
-    "vaults",
-    "yogurt",
-    "tossed",
-    "caucus",
-    "salute",
-    "parody",
-    "lacked",
-    "bosses",
-    "thrive",
-    "clamps",
-    "plural",
-    "shaded",
-    "frenzy",
-    "jargon",
-    "bazaar",
-    "greedy",
-    "termed",
-    "reilly",
-    "basque",
-    "daring",
-    "realms",
-    "fiddle",
-    "crunch",
-    "styled",
-    "logger",
-    "barrie",
-    "miriam",
-    "pumped",
-    "grower",
-    "litres",
-    "raging",
-    "assays",
-    "occult",
-    "hooker",
-    "lilies",
-    "fulfil",
-    "dunlop",
-    "lucent",
-    "wilkes",
-    "sicily",
-    "marlin",
-    "pulses",
-    "theses",
-    "wilton",
-    "ironic",
-    "staged",
-    "hustle",
-    "capped",
-    "liking",
-    "blower",
-    "dubbed",
-    "groovy",
-    "sparse",
-    "remake",
-    "harman",
-    "clears",
-    "dustin",
-    "blooms",
-    "slogan",
-    "elijah",
-    "menace",
-    "dramas",
-    "geisha",
-    "unseen",
-    "silica",
-    "widest",
-    "medley",
-    "temper",
-    "yorker",
-    "tahiti",
-    "juices",
-    "morale",
-    "solder",
-    "trench",
-    "lodged",
-    "revolt",
-    "shines",
-    "regain",
-    "resize",
-    "popped",
-    "busted",
-    "basins",
-    "tuners",
-    "utopia",
-    "slider",
-    "manure",
-    "savior",
-    "hinges",
-    "creepy",
-    "filthy",
-    "piazza",
-    "stroll",
-    "thighs",
-    "infect",
-    "dotted",
-    "doomed",
-    "francs",
-    "ballad",
-    "ravens",
-    "nuclei",
-    "slowed",
-    "outing",
-    "wilcox",
-    "ferris",
-    "affirm",
-    "phelps",
-    "padres",
-    "whisky",
-    "uptown",
-    "batter",
-    "rectal",
-    "vivian",
-    "shakes",
-    "pallet",
-    "tanner",
-    "melvin",
-    "steals",
-    "velcro",
-    "loyola",
-    "plunge",
-    "pearce",
-    "chaser",
-    "texans",
-    "ripley",
-    "spades",
-    "coffin",
-    "navajo",
-    "recess",
-    "stared",
-    "coward",
-    "teamed",
-    "riches",
-    "resign",
-    "poised",
-    "walden",
-    "tactic",
-    "tapped",
-    "wisely",
-    "bremen",
-    "steaks",
-    "toxins",
-    "avoids",
-    "larvae",
-    "fungal",
-    "riddle",
-    "nozzle",
-    "diners",
-    "greeks",
-    "minnie",
-    "handel",
-    "orphan",
-    "linker",
-    "carver",
-    "shouts",
-    "stalls",
-    "inward",
-    "starch",
-    "antony",
-    "fluffy",
-    "bender",
-    "gaelic",
-    "glazed",
-    "dashed",
-    "libyan",
-    "wilder",
-    "routed",
-    "shaver",
-    "grammy",
-    "ported",
-    "fungus",
-    "chunks",
-    "bourne",
-    "revert",
-    "enigma",
-    "glands",
-    "arenas",
-    "outset",
-    "yvonne",
-    "trunks",
-    "strata",
-    "solver",
-    "hubert",
-    "creams",
-    "scrubs",
-    "devote",
-    "facets",
-    "noises",
-    "booths",
-    "guelph",
-    "demise",
-    "faxing",
-    "gerber",
-    "warden",
-    "notary",
-    "indent",
-    "antrim",
-    "barlow",
-    "tyrone",
-    "hermes",
-    "decode",
-    "sultan",
-    "masked",
-    "casing",
-    "spacer",
-    "spills",
-    "reaper",
-    "freddy",
-    "bushes",
-    "nitric",
-    "breads",
-    "glover",
-    "floats",
-    "flange",
-    "hearth",
-    "stride",
-    "archie",
-    "bleach",
-    "ferret",
-    "louisa",
-    "taller",
-    "enrich",
-    "raffle",
-    "mascot",
-    "preach",
-    "petals",
-    "fluent",
-    "renter",
-    "booker",
-    "mattel",
-    "airway",
-    "commas",
-    "anyhow",
-    "primal",
-    "upheld",
-    "alamos",
-    "attire",
-    "upland",
-    "outage",
-    "chunky",
-    "adopts",
-    "raptor",
-    "gluten",
-    "ascent",
-    "golfer",
-    "welded",
-    "cirque",
-    "depict",
-    "quotas",
-    "sucker",
-    "wildly",
-    "neatly",
-    "clarks",
-    "rovers",
-    "voiced",
-    "abound",
-    "curing",
-    "confer",
-    "cranes",
-    "prayed",
-    "kicker",
-    "loudly",
-    "racers",
-    "drains",
-    "maxima",
-    "slough",
-    "blasts",
-    "poorer",
-    "anglia",
-    "rubbed",
-    "uterus",
-    "trashy",
-    "chimes",
-    "shaman",
-    "jaipur",
-    "henley",
-    "eiffel",
-    "tracts",
-    "nestle",
-    "boxers",
-    "awaits",
-    "amends",
-    "shafts",
-    "shelly",
-    "brooch",
-    "motifs",
-    "etched",
-    "tuxedo",
-    "mouths",
-    "halter",
-    "lumens",
-    "packer",
-    "arroyo",
-    "tipped",
-    "amidst",
-    "resins",
-    "cougar",
-    "soaked",
-    "raster",
-    "quirky",
-    "palate",
-    "quests",
-    "fueled",
-    "pelvic",
-    "phased",
-    "airbus",
-    "condor",
-    "austen",
-    "rascal",
-    "ransom",
-    "dagger",
-    "invade",
-    "invent",
-    "planck",
-    "famine",
-    "orally",
-    "bearer",
-    "horace",
-    "morals",
-    "pickle",
-    "quaker",
-    "waving",
-    "uneven",
-    "queues",
-    "louder",
-    "stalin",
-    "trough",
-    "leaned",
-    "resell",
-    "harrow",
-    "thorpe",
-    "hodges",
-    "saucer",
-    "spooky",
-    "waiter",
-    "thrift",
-    "stunts",
-    "cystic",
-    "weakly",
-    "smiths",
-    "magyar",
-    "groves",
-    "sprays",
-    "crowns",
-    "matted",
-    "mantra",
-    "tundra",
-    "skater",
-    "cavern",
-    "solves",
-    "spoons",
-    "oscars",
-    "fibres",
-    "hadley",
-    "vastly",
-    "olives",
-    "porous",
-    "freaky",
-    "thirst",
-    "lesley",
-    "iodine",
-    "phoebe",
-    "legged",
-    "sailed",
-    "forage",
-    "payoff",
-    "pebble",
-    "staffs",
-    "lesion",
-    "tickle",
-    "bandit",
-    "blouse",
-    "chests",
-    "cessna",
-    "feline",
-    "canals",
-    "ankara",
-    "zephyr",
-    "tamara",
-    "fannie",
-    "atrium",
-    "devise",
-    "toying",
-    "wreath",
-    "plight",
-    "goalie",
-    "arches",
-    "lowers",
-    "metros",
-    "jurors",
-    "gutter",
-    "ulcers",
-    "sloppy",
-    "jailed",
-    "ridden",
-    "dianne",
-    "amtrak",
-    "lessee",
-    "tasted",
-    "licked",
-    "banged",
-    "safest",
-    "daphne",
-    "meteor",
-    "boosts",
-    "veneer",
-    "uphold",
-    "glider",
-    "kinder",
-    "deduct",
-    "tweaks",
-    "beagle",
-    "locust",
-    "bursts",
-    "rested",
-    "paused",
-    "widths",
-    "nebula",
-    "junkie",
-    "sugars",
-    "albans",
-    "allure",
-    "pianos",
-    "ponder",
-    "messed",
-    "fooled",
-    "helens",
-    "combos",
-    "cloned",
-    "fulham",
-    "tensor",
-    "breton",
-    "tracer",
-    "mcleod",
-    "simons",
-    "nearer",
-    "tanker",
-    "rector",
-    "taxing",
-    "pinned",
-    "gables",
-    "bantam",
-    "zimmer",
-    "rewind",
-    "poplar",
-    "hinder",
-    "nashua",
-    "pantry",
-    "billet",
-    "revoke",
-    "slated",
-    "wagons",
-    "platte",
-    "lumbar",
-    "osprey",
-    "teaser",
-    "promos",
-    "neuron",
-    "pulsar",
-    "celery",
-    "offend",
-    "somali",
-    "caviar",
-    "retina",
-    "kelsey",
-    "bouncy",
-    "sheath",
-    "mammal",
-    "twists",
-    "allele",
-    "eczema",
-    "danced",
-    "revive",
-    "veggie",
-    "amused",
-    "oxides",
-    "mellow",
-    "rapper",
-    "craven",
-    "homage",
-    "surety",
-    "cutler",
-    "resent",
-    "podium",
-    "tucked",
-    "seeded",
-    "haines",
-    "unjust",
-    "rankin",
-    "picker",
-    "dialer",
-    "noodle",
-    "scents",
-    "bangle",
-    "bertha",
-    "levied",
-    "lizzie",
-    "intuit",
-    "shaken",
-    "onward",
-    "dipped",
-    "lancet",
-    "deacon",
-    "sweeps",
-    "chores",
-    "mowers",
-    "sienna",
-    "calves",
-    "lawton",
-    "astral",
-    "yelled",
-    "hamper",
-    "balkan",
-    "aortic",
-    "hutton",
-    "lipids",
-    "joyful",
-    "dosing",
-    "strobe",
-    "waffle",
-    "ripple",
-    "upbeat",
-    "donuts",
-    "rupees",
-    "sporty",
-    "tumour",
-    "pooled",
-    "healed",
-    "ceases",
-    "dorsal",
-    "collie",
-    "spleen",
-    "orbits",
-    "whence",
-    "stigma",
-    "inject",
-    "tartan",
-    "stormy",
-    "raglan",
-    "vulgar",
-    "serene",
-    "forbid",
-    "robbed",
-    "hotter",
-    "parlor",
-    "setter",
-    "facade",
-    "bikers",
-    "cipher",
-    "orwell",
-    "lennox",
-    "hearty",
-    "triton",
-    "venous",
-    "moneys",
-    "teflon",
-    "cleans",
-    "chilly",
-    "corset",
-    "hinged",
-    "gopher",
-    "distal",
-    "robins",
-    "cramps",
-    "digger",
-    "caches",
-    "acidic",
-    "psyche",
-    "eraser",
-    "rudolf",
-    "sighed",
-    "rattle",
-    "shasta",
-    "unrest",
-    "newell",
-    "poodle",
-    "sitter",
-    "colder",
-    "kelvin",
-    "nectar",
-    "strife",
-    "esprit",
-    "reckon",
-    "murals",
-    "sinful",
-    "softer",
-    "tarzan",
-    "arisen",
-    "femmes",
-    "ribbed",
-    "hereof",
-    "untold",
-    "tulips",
-    "nugget",
-    "wooded",
-    "bodied",
-    "rosary",
-    "scotty",
-    "pulley",
-    "krakow",
-    "catchy",
-    "hugely",
-    "franks",
-    "influx",
-    "convoy",
-    "ingrid",
-    "kroner",
-    "nailed",
-    "cocoon",
-    "gladys",
-    "bowers",
-    "breezy",
-    "pisces",
-    "cloths",
-    "clowns",
-    "barren",
-    "hollis",
-    "assent",
-    "harmed",
-    "tabled",
-    "flowed",
-    "barnet",
-    "tinted",
-    "topper",
-    "leaked",
-    "genera",
-    "idioms",
-    "argent",
-    "healey",
-    "mildly",
-    "bonnet",
-    "unborn",
-    "coasts",
-    "cheesy",
-    "concur",
-    "wedges",
-    "corded",
-    "bakers",
-    "canaan",
-    "toners",
-    "kenyan",
-    "sergei",
-    "quaint",
-    "oswald",
-    "revere",
-    "solemn",
-    "gentry",
-    "cadets",
-    "lancer",
-    "muffin",
-    "gallup",
-    "fruity",
-    "summed",
-    "chopin",
-    "joiner",
-    "pliers",
-    "kayaks",
-    "drudge",
-    "saliva",
-    "lessen",
-    "embark",
-    "manned",
-    "orkney",
-    "sphinx",
-    "glitch",
-    "sonnet",
-    "sprung",
-    "hedges",
-    "splice",
-    "crooks",
-    "walled",
-    "debuts",
-    "rocked",
-    "rancid",
-    "malice",
-    "harlow",
-    "funnel",
-    "hippie",
-    "shabby",
-    "virgil",
-    "halves",
-    "teapot",
-    "squire",
-    "armagh",
-    "zagreb",
-    "melton",
-    "levers",
-    "custer",
-    "eldest",
-    "climbs",
-    "tories",
-    "weaken",
-    "flakes",
-    "argyll",
-    "joking",
-    "simmer",
-    "reacts",
-    "aubrey",
-    "tuscan",
-    "midday",
-    "innate",
-    "calais",
-    "impair",
-    "bluffs",
-    "goblin",
-    "tiered",
-    "optima",
-    "seward",
-    "accuse",
-    "hunted",
-    "hurdle",
-    "errata",
-    "zipped",
-    "cuckoo",
-    "acacia",
-    "compel",
-    "dieter",
-    "unwind",
-    "halted",
-    "crotch",
-    "diodes",
-    "dipole",
-    "weldon",
-    "frying",
-    "impala",
-    "flicks",
-    "ludlow",
-    "gustav",
-    "waxing",
-    "sinner",
-    "crafty",
-    "pacers",
-    "nagoya",
-    "treble",
-    "galley",
-    "shovel",
-    "entail",
-    "mashed",
-    "pacing",
-    "fluxes",
-    "cicero",
-    "scribe",
-    "nellie",
-    "sleigh",
-    "ration",
-    "turing",
-    "unfold",
-    "selves",
-    "sprite",
-    "praxis",
-    "angler",
-    "flares",
-    "swatch",
-    "questa",
-    "bumped",
-    "divert",
-    "merton",
-    "abacus",
-    "richly",
-    "priori",
-    "melons",
-    "farley",
-    "guilds",
-    "ridges",
-    "angled",
-    "grimes",
-    "unison",
-    "dongle",
-    "crouch",
-    "placid",
-    "napkin",
-    "marsha",
-    "caveat",
-    "vulcan",
-    "garter",
-    "footed",
-    "euclid",
-    "payers",
-    "gritty",
-    "hailed",
-    "hounds",
-    "reborn",
-    "dazzle",
-    "dangle",
-    "eaters",
-    "bronco",
-    "chased",
-    "savory",
-    "rodent",
-    "racket",
-    "putter",
-    "sickle",
-    "attest",
-    "sentry",
-    "maniac",
-    "antics",
-    "ealing",
-    "consul",
-    "lahore",
-    "aiding",
-    "chilli",
-    "canoes",
-    "fodder",
-    "peeled",
-    "layton",
-    "inbred",
-    "rabies",
-    "hirsch",
-    "angina",
-    "seaman",
-    "skulls",
-    "biases",
-    "mccann",
-    "sprawl",
-    "reopen",
-    "erased",
-    "madras",
-    "faiths",
-    "tinker",
-    "echoed",
-    "elisha",
-    "gazing",
-    "awning",
-    "stroud",
-    "squads",
-    "ursula",
-    "parsed",
-    "healer",
-    "ocular",
-    "scoops",
-    "castor",
-    "evoked",
-    "cleric",
-    "spared",
-    "ensign",
-    "warped",
-    "humber",
-    "octets",
-    "hereto",
-    "nombre",
-    "grated",
-    "romana",
-    "banded",
-    "toured",
-    "bobble",
-    "widows",
-    "pellet",
-    "doggie",
-    "inflow",
-    "futile",
-    "fenced",
-    "saigon",
-    "fabian",
-    "muster",
-    "gideon",
-    "hitter",
-    "sylvan",
-    "argyle",
-    "agatha",
-    "quasar",
-    "liters",
-    "comets",
-    "ramona",
-    "rumour",
-    "ragged",
-    "pulsed",
-    "ignite",
-    "hornet",
-    "jesuit",
-    "mounds",
-    "devoid",
-    "parted",
-    "placer",
-    "cedric",
-    "doping",
-    "dryden",
-    "saunas",
-    "jitter",
-    "barter",
-    "frugal",
-    "starry",
-    "medway",
-    "hobbit",
-    "danube",
-    "mayors",
-    "caster",
-    "wicket",
-    "glycol",
-    "medial",
-    "pixies",
-    "accrue",
-    "vented",
-    "outlay",
-    "airing",
-    "crates",
-    "jaeger",
-    "velour",
-    "martyr",
-    "brahms",
-    "discus",
-    "gaping",
-    "maxine",
-    "abrupt",
-    "landau",
-    "amigos",
-    "boldly",
-    "gazebo",
-    "cocker",
-    "cloves",
-    "presto",
-    "harden",
-    "molten",
-    "repaid",
-    "warmly",
-    "lessor",
-    "reused",
-    "uneasy",
-    "shalom",
-    "cartel",
-    "wiener",
-    "sexton",
-    "washes",
-    "frosty",
-    "marmot",
-    "remand",
-    "ponies",
-    "blight",
-    "grader",
-    "larkin",
-    "perish",
-    "calder",
-    "relics",
-    "relish",
-    "holman",
-    "knocks",
-    "primes",
-    "thrash",
-    "trolls",
-    "scorer",
-    "oilers",
-    "cruces",
-    "vanish",
-    "elbows",
-    "kiosks",
-    "amicus",
-    "cervix",
-    "elixir",
-    "mantis",
-    "carpal",
-    "slavic",
-    "vapour",
-    "morbid",
-    "rubble",
-    "cheeky",
-    "uranus",
-    "censor",
-    "begged",
-    "lavish",
-    "scarab",
-    "skiers",
-    "weasel",
-    "riyadh",
-    "octane",
-    "carols",
-    "taping",
-    "hiatus",
-    "louvre",
-    "severn",
-    "aikido",
-    "ashore",
-    "unload",
-    "seater",
-    "stoned",
-    "fables",
-    "crumbs",
-    "figaro",
-    "squish",
-    "jagged",
-    "squeak",
-    "dearly",
-    "gypsum",
-    "lament",
-    "banked",
-    "dismal",
-    "cirrus",
-    "hijack",
-    "eskimo",
-    "phobia",
-    "sadler",
-    "buxton",
-    "apathy",
-    "peaked",
-    "huxley",
-    "greasy",
-    "creeks",
-    "rattan",
-    "carlow",
-    "hectic",
-    "haggai",
-    "raiser",
-    "calmly",
-    "dilute",
-    "gloomy",
-    "dinghy",
-    "habeas",
-    "grassy",
-    "aprons",
-    "clumsy",
-    "uphill",
-    "warmed",
-    "bumble",
-    "elects",
-    "alpaca",
-    "tented",
-    "pleads",
-    "whitby",
-    "horned",
-    "hester",
-    "rarity",
-    "rheims",
-    "hating",
-    "sewers",
-    "spores",
-    "shears",
-    "flutes",
-    "minced",
-    "ornate",
-    "goethe",
-    "jester",
-    "wipers",
-    "snoopy",
-    "bowler",
-    "rotors",
-    "bagels",
-    "spline",
-    "goggle",
-    "banter",
-    "awaken",
-    "alters",
-    "fleets",
-    "libido",
-    "shoals",
-    "clique",
-    "curran",
-    "mcneil",
-    "acetyl",
-    "boomer",
-    "curses",
-    "undies",
-    "prepay",
-    "ankles",
-    "spiked",
-    "iberia",
-    "duffel",
-    "strung",
-    "hermit",
-    "josiah",
-    "deepen",
-    "crease",
-    "cantor",
-    "impede",
-    "clasps",
-    "tilted",
-    "repent",
-    "pulpit",
-    "ambush",
-    "stiles",
-    "elicit",
-    "bitten",
-    "doodle",
-    "dynamo",
-    "summon",
-    "lingua",
-    "loosen",
-    "sneaky",
-    "smarts",
-    "fright",
-    "decays",
-    "easing",
-    "picket",
-    "waning",
-    "queued",
-    "hanley",
-    "supple",
-    "shaggy",
-    "ordeal",
-    "hernia",
-    "operas",
-    "kermit",
-    "arcane",
-    "peavey",
-    "sacked",
-    "amulet",
-    "borden",
-    "bombed",
-    "halton",
-    "aegean",
-    "nadine",
-    "grouse",
-    "pasted",
-    "mousse",
-    "thrush",
-    "smokes",
-    "ascend",
-    "nutmeg",
-    "wrists",
-    "rubric",
-    "puddle",
-    "azores",
-    "plough",
-    "sloane",
-    "smelly",
-    "hangar",
-    "umpire",
-    "takers",
-    "lemons",
-    "potion",
-    "tendon",
-    "cuddly",
-    "deceit",
-    "joyous",
-    "pricey",
-    "shekel",
-    "gunner",
-    "samoan",
-    "cranky",
-    "untrue",
-    "larval",
-    "drapes",
-    "booted",
-    "sitcom",
-    "osborn",
-    "grumpy",
-    "sirens",
-    "soften",
-    "caters",
-    "troupe",
-    "calico",
-    "wrongs",
-    "coined",
-    "birdie",
-    "pagers",
-    "corral",
-    "hickey",
-    "lysine",
-    "pronto",
-    "vistas",
-    "salaam",
-    "exited",
-    "crispy",
-    "priory",
-    "sequin",
-    "wiping",
-    "bobbie",
-    "siting",
-    "egress",
-    "eroded",
-    "heresy",
-    "armory",
-    "nicest",
-    "slalom",
-    "hindus",
-    "luster",
-    "undone",
-    "uplift",
-    "lorenz",
-    "perils",
-    "pylori",
-    "welder",
-    "juicer",
-    "lloyds",
-    "sensed",
-    "shiite",
-    "hooray",
-    "biotin",
-    "salter",
-    "nobles",
-    "fumble",
-    "discos",
-    "levies",
-    "rudder",
-    "scares",
-    "tyrant",
-    "skewed",
-    "sprang",
-    "aromas",
-    "sadism",
-    "muncie",
-    "plenum",
-    "axioms",
-    "sweaty",
-    "rectum",
-    "aachen",
-    "bisque",
-    "grieve",
-    "reigns",
-    "fiasco",
-    "slings",
-    "dwarfs",
-    "sweats",
-    "fresco",
-    "gizmos",
-    "mildew",
-    "steels",
-    "feeble",
-    "droits",
-    "unpack",
-    "qantas",
-    "damper",
-    "yahweh",
-    "madman",
-    "pelvis",
-    "gunmen",
-    "dugout",
-    "giggle",
-    "casket",
-    "dickey",
-    "detour",
-    "bexley",
-    "marisa",
-    "dioxin",
-    "unveil",
-    "layoff",
-    "shitty",
-    "dodger",
-    "acuity",
-    "popper",
-    "chants",
-    "manger",
-    "chills",
-    "edging",
-    "shroud",
-    "aching",
-    "recoil",
-    "raisin",
-    "bobcat",
-    "misled",
-    "nepali",
-    "spiced",
-    "bogota",
-    "pamper",
-    "tabbed",
-    "poking",
-    "buyout",
-    "snails",
-    "rushes",
-    "airman",
-    "sabres",
-    "bhopal",
-    "grudge",
-    "fondue",
-    "fascia",
-    "woburn",
-    "fryers",
-    "jagger",
-    "jumble",
-    "cognac",
-    "wading",
-    "borneo",
-    "thorns",
-    "basalt",
-    "votive",
-    "wafers",
-    "antler",
-    "babble",
-    "niches",
-    "hikers",
-    "camels",
-    "unites",
-    "cleats",
-    "millet",
-    "invert",
-    "thelma",
-    "carats",
-    "nigger",
-    "scrape",
-    "prized",
-    "hombre",
-    "mallet",
-    "equate",
-    "pajama",
-    "toning",
-    "arched",
-    "curfew",
-    "enlist",
-    "romney",
-    "robber",
-    "roving",
-    "peking",
-    "linger",
-    "fillet",
-    "nimbus",
-    "impart",
-    "touted",
-    "masons",
-    "surges",
-    "piling",
-    "burley",
-    "woofer",
-    "scouse",
-    "galena",
-    "wirral",
-    "ilford",
-    "thinly",
-    "arable",
-    "alkali",
-    "mowing",
-    "expend",
-    "auntie",
-    "blames",
-    "merino",
-    "barium",
-    "adagio",
-    "flocks",
-    "havens",
-    "raving",
-    "panzer",
-    "poncho",
-    "choirs",
-    "godwin",
-    "shoved",
-    "papaya",
-    "iconic",
-    "mahler",
-    "gambit",
-    "polled",
-    "jogger",
-    "verity",
-    "covent",
-    "turret",
-    "wessex",
-    "vowels",
-    "mojave",
-    "soothe",
-    "slurry",
-    "tamper",
-    "unduly",
-    "winger",
-    "rigged",
-    "sealer",
-    "sleazy",
-    "margot",
-    "andean",
-    "armpit",
-    "ratify",
-    "ginkgo",
-    "muzzle",
-    "basing",
-    "opting",
-    "hauled",
-    "recite",
-    "doreen",
-    "dismay",
-    "sunken",
-    "reared",
-    "numero",
-    "sedans",
-    "sundry",
-    "woking",
-    "boreal",
-    "flashy",
-    "signet",
-    "feudal",
-    "basses",
-    "glenda",
-    "fathom",
-    "extant",
-    "unmask",
-    "chisel",
-    "pauses",
-    "barbed",
-    "lustre",
-    "pagans",
-    "dinars",
-    "afloat",
-    "dashes",
-    "forint",
-    "nudism",
-    "moaned",
-    "wiggle",
-    "propel",
-    "verily",
-    "ardent",
-    "tremor",
-    "loaned",
-    "astute",
-    "salted",
-    "tiling",
-    "doubly",
-    "brewed",
-    "fiance",
-    "retard",
-    "iguana",
-    "choker",
-    "harass",
-    "alsace",
-    "fished",
-    "unholy",
-    "caving",
-    "livery",
-    "milieu",
-    "injure",
-    "esters",
-    "medusa",
-    "pagoda",
-    "primed",
-    "ensued",
-    "justly",
-    "curled",
-    "dermal",
-    "lashes",
-    "allege",
-    "draped",
-    "subtly",
-    "niacin",
-    "wesson",
-    "sibley",
-    "tooled",
-    "moulds",
-    "pranks",
-    "mantel",
-    "fatima",
-    "winder",
-    "shrunk",
-    "cetera",
-    "farmed",
-    "tupelo",
-    "watery",
-    "coiled",
-    "sledge",
-    "gilded",
-    "tropic",
-    "datsun",
-    "yvette",
-    "sprout",
-    "bagged",
-    "stinky",
-    "muriel",
-    "penned",
-    "kiddie",
-    "danzig",
-    "sallie",
-    "solace",
-    "salvia",
-    "stucco",
-    "geiger",
-    "shawls",
-    "harare",
-    "intros",
-    "ruffle",
-    "aragon",
-    "talmud",
-    "ailing",
-    "obeyed",
-    "mutiny",
-    "cornea",
-    "mortem",
-    "dengue",
-    "shanks",
-    "deduce",
-    "bolted",
-    "probed",
-    "jammed",
-    "cymbal",
-    "shogun",
-    "quanta",
-    "uppers",
-    "pitman",
-    "minima",
-    "hugged",
-    "flurry",
-    "testis",
-    "vapors",
-    "kenney",
-    "scilly",
-    "icarus",
-    "tenets",
-    "dialed",
-    "muscat",
-    "crayon",
-    "marque",
-    "texaco",
-    "rework",
-    "detach",
-    "apogee",
-    "worsen",
-    "steamy",
-    "acetic",
-    "dyeing",
-    "bianco",
-    "layman",
-    "asimov",
-    "bungee",
-    "vellum",
-    "renoir",
-    "stalks",
-    "stanza",
-    "morons",
-    "florin",
-    "chaise",
-    "rained",
-    "merges",
-    "mythic",
-    "tasked",
-    "palmas",
-    "nieces",
-    "synths",
-    "girdle",
-    "veiled",
-    "phenol",
-    "stares",
-    "byline",
-    "bedlam",
-    "entree",
-    "desist",
-    "embody",
-    "soiled",
-    "plexus",
-    "disarm",
-    "cronin",
-    "astray",
-    "patios",
-    "hinted",
-    "bertie",
-    "lemony",
-    "basset",
-    "exiled",
-    "flared",
-    "artful",
-    "mbytes",
-    "caress",
-    "downed",
-    "twitch",
-    "combed",
-    "swamps",
-    "exiles",
-    "quarks",
-    "forman",
-    "seduce",
-    "kimono",
-    "ceylon",
-    "gracie",
-    "hanged",
-    "dimmer",
-    "dredge",
-    "patchy",
-    "haters",
-    "penile",
-    "spokes",
-    "engels",
-    "mullet",
-    "devout",
-    "pizzas",
-    "lagged",
-    "hawker",
-    "trumps",
-    "mekong",
-    "thwart",
-    "potted",
-    "goings",
-    "clinch",
-    "fitter",
-    "fasten",
-    "epping",
-    "kendal",
-    "mingle",
-    "purify",
-    "choked",
-    "oblong",
-    "wearer",
-    "capers",
-    "entice",
-    "yonder",
-    "cabana",
-    "gasped",
-    "blurry",
-    "greets",
-    "thymus",
-    "vacate",
-    "eyelid",
-    "taming",
-    "snider",
-    "barons",
-    "stuffs",
-    "blurbs",
-    "sowing",
-    "bronte",
-    "frills",
-    "pinion",
-    "haunts",
-    "saxony",
-    "possum",
-    "mohair",
-    "steers",
-    "juries",
-    "crazed",
-    "fondly",
-    "flasks",
-    "phenyl",
-    "raided",
-    "visors",
-    "evokes",
-    "spoils",
-    "sexist",
-    "triage",
-    "rabble",
-    "sconce",
-    "lactic",
-    "milled",
-    "meshes",
-    "firsts",
-    "grotto",
-    "buzzer",
-    "rivets",
-    "graces",
-    "propos",
-    "sorter",
-    "saudis",
-    "betray",
-    "sodomy",
-    "tangle",
-    "upsets",
-    "rialto",
-    "bustle",
-    "risers",
-    "putney",
-    "refute",
-    "parson",
-    "slinky",
-    "dreary",
-    "duffle",
-    "horrid",
-    "volley",
-    "carnal",
-    "versed",
-    "recaps",
-    "bridle",
-    "revamp",
-    "rubens",
-    "tiller",
-    "hordes",
-    "peruse",
-    "alleys",
-    "suture",
-    "bribes",
-    "kidnap",
-    "sorely",
-    "dahlia",
-    "ravine",
-    "napalm",
-    "starve",
-    "skimpy",
-    "sepsis",
-    "rouble",
-    "semper",
-    "keying",
-    "spines",
-    "acumen",
-    "shiver",
-    "cliche",
-    "civics",
-    "nuance",
-    "myosin",
-    "caruso",
-    "levees",
-    "fennel",
-    "weaves",
-    "futons",
-    "tassel",
-    "phoned",
-    "renown",
-    "beggar",
-    "cuddle",
-    "downer",
-    "mucous",
-    "stinks",
-    "kemper",
-    "repose",
-    "hasten",
-    "earthy",
-    "rabbis",
-    "adored",
-    "assisi",
-    "rapist",
-    "douche",
-    "sparky",
-    "pitted",
-    "wrecks",
-    "siesta",
-    "rubies",
-    "snappy",
-    "zircon",
-    "upkeep",
-    "bausch",
-    "inseam",
-    "denier",
-    "uncles",
-    "soared",
-    "mouser",
-    "whoops",
-    "nether",
-    "nomads",
-    "ramble",
-    "natura",
-    "bering",
-    "tarpon",
-    "duster",
-    "signer",
-    "steely",
-    "relive",
-    "quirks",
-    "plover",
-    "yeovil",
-    "solute",
-    "haggis",
-    "godiva",
-    "razors",
-    "worded",
-    "fleshy",
-    "balsam",
-    "outcry",
-    "pecans",
-    "cordon",
-    "humbly",
-    "azalea",
-    "halide",
-    "insole",
-    "aisles",
-    "slacks",
-    "trusty",
-    "radium",
-    "phylum",
-    "waging",
-    "puffin",
-    "shaper",
-    "raping",
-    "stench",
-    "gravis",
-    "thefts",
-    "polity",
-    "celiac",
-    "wanton",
-    "airmen",
-    "locket",
-    "gander",
-    "darkly",
-    "vernal",
-    "nikkei",
-    "astrid",
-    "faeroe",
-    "deuces",
-    "keenly",
-    "fliers",
-    "negate",
-    "defies",
-    "purest",
-    "newham",
-    "bodice",
-    "opiate",
-    "honeys",
-    "depots",
-    "bubbly",
-    "cedars",
-    "snooze",
-    "prawns",
-    "fairer",
-    "prides",
-    "rogues",
-    "mussel",
-    "unruly",
-    "cutest",
-    "etudes",
-    "gurney",
-    "sunnis",
-    "lifter",
-    "bellow",
-    "aitken",
-    "inlaid",
-    "busses",
-    "crests",
-    "solent",
-    "toffee",
-    "pippin",
-    "frauds",
-    "hoaxes",
-    "grafts",
-    "brunel",
-    "necked",
-    "feasts",
-    "teacup",
-    "toques",
-    "adapts",
-    "vetoed",
-    "simian",
-    "apiece",
-    "gammon",
-    "friars",
-    "maples",
-    "cobble",
-    "halley",
-    "cranks",
-    "burrow",
-    "hyphen",
-    "teased",
-    "detain",
-    "savant",
-    "leaded",
-    "sultry",
-    "sinned",
-    "sharps",
-    "bruges",
-    "grooms",
-    "otters",
-    "ousted",
-    "grocer",
-    "chases",
-    "hither",
-    "druids",
-    "patina",
-    "gibbon",
-    "urchin",
-    "varian",
-    "spasms",
-    "uproar",
-    "tenths",
-    "quench",
-    "passer",
-    "hurrah",
-    "barges",
-    "walrus",
-    "apical",
-    "jokers",
-    "piglet",
-    "lomond",
-    "eccles",
-    "netted",
-    "dispel",
-    "adolph",
-    "prelim",
-    "masque",
-    "offaly",
-    "girlie",
-    "creeps",
-    "stoker",
-    "nymphs",
-    "jurist",
-    "vestal",
-    "tiring",
-    "banque",
-    "bowels",
-    "cornet",
-    "unplug",
-    "lodger",
-    "minnow",
-    "neuter",
-    "visage",
-    "beheld",
-    "belles",
-    "baffle",
-    "albino",
-    "sexism",
-    "murmur",
-    "cotter",
-    "bionic",
-    "gorges",
-    "canons",
-    "bugger",
-    "lipton",
-    "imaged",
-    "crusty",
-    "drones",
-    "camped",
-    "parlay",
-    "strewn",
-    "rubles",
-    "wining",
-    "sleuth",
-    "willed",
-    "magpie",
-    "docked",
-    "lilian",
-    "clough",
-    "unlink",
-    "homers",
-    "pointy",
-    "eyeing",
-    "wombat",
-    "inhale",
-    "dreamt",
-    "lichen",
-    "lapsed",
-    "gallop",
-    "barrio",
-    "caries",
-    "talkie",
-    "longed",
-    "rammed",
-    "shrugs",
-    "polyps",
-    "marred",
-    "hashes",
-    "meager",
-    "reread",
-    "iodide",
-    "torbay",
-    "darwen",
-    "nettle",
-    "eyelet",
-    "kitsch",
-    "blinks",
-    "sawing",
-    "hopped",
-    "bowing",
-    "cogent",
-    "seaton",
-    "tufted",
-    "tiaras",
-    "adonis",
-    "medics",
-    "dainty",
-    "beater",
-    "planks",
-    "plumes",
-    "lumina",
-    "cosine",
-    "haddon",
-    "stumps",
-    "fouled",
-    "incite",
-    "tampon",
-    "easels",
-    "sublet",
-    "deluge",
-    "goodie",
-    "fluted",
-    "smears",
-    "reseal",
-    "bathed",
-    "lading",
-    "crocus",
-    "vishnu",
-    "cherub",
-    "straws",
-    "jeddah",
-    "cringe",
-    "crimea",
-    "gauche",
-    "minion",
-    "drivel",
-    "roared",
-    "unwise",
-    "stifle",
-    "devour",
-    "arouse",
-    "wobble",
-    "ticked",
-    "purged",
-    "hauler",
-    "sayers",
-    "averse",
-    "afield",
-    "casein",
-    "mishap",
-    "lackey",
-    "labors",
-    "musing",
-    "gunman",
-    "ullman",
-    "cubans",
-    "legato",
-    "singly",
-    "fusing",
-    "abuser",
-    "sevens",
-    "grates",
-    "talker",
-    "bestow",
-    "cunard",
-    "surged",
-    "woolly",
-    "tapers",
-    "beaker",
-    "quiver",
-    "mimics",
-    "coombs",
-    "wetter",
-    "adrift",
-    "stacie",
-    "stings",
-    "citric",
-    "liaise",
-    "excels",
-    "garret",
-    "eatery",
-    "culled",
-    "moduli",
-    "buchan",
-    "tigris",
-    "hoists",
-    "tempus",
-    "drifts",
-    "cleave",
-    "flimsy",
-    "tirana",
-    "bedded",
-    "graced",
-    "ultimo",
-    "silage",
-    "chewed",
-    "fallow",
-    "jackal",
-    "rinsed",
-    "bogged",
-    "lacing",
-    "tiffin",
-    "lapses",
-    "dwells",
-    "shrewd",
-    "micros",
-    "biotic",
-    "shaven",
-    "euchre",
-    "quarts",
-    "wraith",
-    "nimble",
-    "brazen",
-    "brahma",
-    "pipers",
-    "butane",
-    "angers",
-    "gigolo",
-    "guerre",
-    "sliver",
-    "impure",
-    "pilate",
-    "retort",
-    "regula",
-    "syrups",
-    "pawnee",
-    "squibb",
-    "oblige",
-    "anklet",
-    "taoism",
-    "samara",
-    "unsung",
-    "nubian",
-    "pandas",
-    "braids",
-    "milder",
-    "initio",
-    "lathes",
-    "kyushu",
-    "beamed",
-    "sateen",
-    "marten",
-    "howler",
-    "carded",
-    "ambler",
-    "firmer",
-    "quando",
-    "glides",
-    "redcar",
-    "hurled",
-    "splint",
-    "llamas",
-    "touchy",
-    "decoys",
-    "pariah",
-    "filers",
-    "scones",
-    "euston",
-    "belted",
-    "sizzle",
-    "fifths",
-    "loaves",
-    "heeled",
-    "kirkby",
-    "cheery",
-    "feisty",
-    "mutton",
-    "zigzag",
-    "batten",
-    "maldon",
-    "pompey",
-    "larynx",
-    "meeker",
-    "jarrow",
-    "dusted",
-    "inlets",
-    "mutter",
-    "ataxia",
-    "bourse",
-    "moslem",
-    "welwyn",
-    "catnip",
-    "renews",
-    "lowing",
-    "bluish",
-    "pusher",
-    "tingle",
-    "typist",
-    "bruise",
-    "rebuke",
-    "swayed",
-    "lipase",
-    "seamen",
-    "sculpt",
-    "harbin",
-    "pauper",
-    "brooms",
-    "instep",
-    "septum",
-    "escudo",
-    "pastas",
-    "yoruba",
-    "alexia",
-    "mignon",
-    "thorax",
-    "parses",
-    "homing",
-    "weevil",
-    "morgue",
-    "juggle",
-    "sartre",
-    "errant",
-    "heifer",
-    "surfed",
-    "steins",
-    "hendon",
-    "rarest",
-    "rashes",
-    "lytham",
-    "looser",
-    "bookie",
-    "lauded",
-    "peptic",
-    "malaya",
-    "risked",
-    "bowled",
-    "pearly",
-    "kirsch",
-    "islets",
-    "looted",
-    "gdansk",
-    "parkin",
-    "wagers",
-    "heyday",
-    "lipper",
-    "briton",
-    "livers",
-    "glassy",
-    "mimosa",
-    "shrill",
-    "halved",
-    "swedes",
-    "misfit",
-    "asides",
-    "rusted",
-    "keeler",
-    "zeroes",
-    "candor",
-    "wigwam",
-    "gnomes",
-    "mocked",
-    "holler",
-    "furrow",
-    "fewest",
-    "drowsy",
-    "cashew",
-    "bushel",
-    "cypher",
-    "examen",
-    "jaclyn",
-    "bolero",
-    "dumber",
-    "earner",
-    "zoomed",
-    "forked",
-    "camber",
-    "gutted",
-    "arming",
-    "felons",
-    "dearth",
-    "tarmac",
-    "swells",
-    "bobbin",
-    "doings",
-    "coptic",
-    "dumper",
-    "silken",
-    "seabed",
-    "looped",
-    "myelin",
-    "oddity",
-    "aphids",
-    "puffed",
-    "leaped",
-    "embers",
-    "peseta",
-    "sordid",
-    "bleeds",
-    "avenge",
-    "yarrow",
-    "fickle",
-    "cursus",
-    "zapper",
-    "raison",
-    "roping",
-    "decked",
-    "choppy",
-    "vandal",
-    "romper",
-    "nimrod",
-    "brecon",
-    "beards",
-    "canter",
-    "facile",
-    "sneeze",
-    "somber",
-    "shards",
-    "whimsy",
-    "iceman",
-    "clumps",
-    "pegged",
-    "baboon",
-    "ensues",
-    "elated",
-    "lentil",
-    "backer",
-    "angora",
-    "stuffy",
-    "clings",
-    "hubris",
-    "swirls",
-    "dawned",
-    "crusoe",
-    "farrow",
-    "cracow",
-    "biceps",
-    "rococo",
-    "seared",
-    "tinged",
-    "amines",
-    "faking",
-    "balzac",
-    "shreds",
-    "boxcar",
-    "kronor",
-    "cinder",
-    "glyphs",
-    "aligns",
-    "recoup",
-    "naught",
-    "prisms",
-    "gorton",
-    "totten",
-    "planer",
-    "defray",
-    "oeuvre",
-    "idiocy",
-    "vermin",
-    "incurs",
-    "sorbet",
-    "lariat",
-    "leyton",
-    "redraw",
-    "trifle",
-    "berths",
-    "retake",
-    "quiche",
-    "eulogy",
-    "fabled",
-    "defied",
-    "errand",
-    "yeoman",
-    "coerce",
-    "annexe",
-    "muslin",
-    "hugger",
-    "thorny",
-    "testes",
-    "oriole",
-    "shiner",
-    "rhesus",
-    "givers",
-    "ingest",
-    "potash",
-    "wyvern",
-    "inlays",
-    "foiled",
-    "tether",
-    "toucan",
-    "karats",
-    "urinal",
-    "bunyan",
-    "tubers",
-    "jerked",
-    "waders",
-    "squall",
-    "chokes",
-    "cinque",
-    "fervor",
-    "reefer",
-    "exerts",
-    "idling",
-    "lepton",
-    "ionian",
-    "comers",
-    "lunacy",
-    "loathe",
-    "huddle",
-    "coughs",
-    "gating",
-    "widens",
-    "ringed",
-    "braced",
-    "spigot",
-    "coupes",
-    "baring",
-    "jacked",
-    "tartar",
-    "nazism",
-    "rejoin",
-    "crawls",
-    "smudge",
-    "herder",
-    "stingy",
-    "zealot",
-    "vigour",
-    "snares",
-    "wither",
-    "kippur",
-    "seamed",
-    "calmed",
-    "pisses",
-    "vipers",
-    "taster",
-    "arbors",
-    "forego",
-    "farina",
-    "bygone",
-    "exhale",
-    "altars",
-    "cecile",
-    "lusaka",
-    "cashed",
-    "ushers",
-    "barfly",
-    "annoys",
-    "crisps",
-    "dressy",
-    "portia",
-    "frayed",
-    "woolen",
-    "spunky",
-    "burgos",
-    "litany",
-    "nutter",
-    "larder",
-    "ganges",
-    "claret",
-    "wobbly",
-    "lockup",
-    "tosses",
-    "throng",
-    "resold",
-    "turnip",
-    "berber",
-    "gusset",
-    "banish",
-    "schism",
-    "tidbit",
-    "maputo",
-    "dogged",
-    "pinyin",
-    "messes",
-    "topple",
-    "waives",
-    "radish",
-    "tabula",
-    "taoist",
-    "retype",
-    "feller",
-    "franca",
-    "enmity",
-    "boater",
-    "weirdo",
-    "racked",
-    "spoilt",
-    "strode",
-    "grainy",
-    "swears",
-    "maoist",
-    "paring",
-    "humbug",
-    "homely",
-    "cocked",
-    "gobble",
-    "breech",
-    "pyrite",
-    "drunks",
-    "hotkey",
-    "kidder",
-    "damask",
-    "batted",
-    "papacy",
-    "ablaze",
-    "spotty",
-    "tannoy",
-    "thawed",
-    "toulon",
-    "loafer",
-    "fjords",
-    "dipper",
-    "byways",
-    "ribble",
-    "derail",
-    "amazes",
-    "gripes",
-    "spiffy",
-    "dampen",
-    "imbued",
-    "mouton",
-    "cameos",
-    "sputum",
-    "mongol",
-    "peeler",
-    "brecht",
-    "radian",
-    "geyser",
-    "xxviii",
-    "shoddy",
-    "mersey",
-    "mended",
-    "abject",
-    "morden",
-    "mervyn",
-    "kismet",
-    "hookah",
-    "lucian",
-    "ethers",
-    "treads",
-    "mayday",
-    "honing",
-    "deftly",
-    "curios",
-    "toasts",
-    "litmus",
-    "spools",
-    "medico",
-    "grinds",
-    "coulee",
-    "bugged",
-    "bolded",
-    "ribose",
-    "faggot",
-    "sarong",
-    "lumped",
-    "frigid",
-    "bruton",
-    "ashram",
-    "carafe",
-    "peachy",
-    "selwyn",
-    "myopia",
-    "winded",
-    "blunts",
-    "flirty",
-    "clothe",
-    "snipes",
-    "staked",
-    "simile",
-    "sloped",
-    "groans",
-    "canker",
-    "keener",
-    "busily",
-    "gluing",
-    "captor",
-    "grazed",
-    "joules",
-    "smacks",
-    "bolder",
-    "girder",
-    "pruned",
-    "wedded",
-    "lashed",
-    "whaler",
-    "playas",
-    "alcove",
-    "hazing",
-    "skyway",
-    "matron",
-    "nibble",
-    "hedged",
-    "minter",
-    "trowel",
-    "fatale",
-    "stiffs",
-    "earths",
-    "tenors",
-    "rapier",
-    "salami",
-    "prunes",
-    "mallow",
-    "duress",
-    "herons",
-    "banger",
-    "doable",
-    "stoked",
-    "glades",
-    "crutch",
-    "bandar",
-    "ardour",
-    "levant",
-    "sleaze",
-    "sundae",
-    "rhinos",
-    "leeway",
-    "wisest",
-    "kabuki",
-    "cesium",
-    "yippee",
-    "siphon",
-    "aviary",
-    "hushed",
-    "cadres",
-    "markka",
-    "sanded",
-    "havant",
-    "venter",
-    "maggot",
-    "infuse",
-    "pathos",
-    "roused",
-    "fijian",
-    "chutes",
-    "hatter",
-    "sorrel",
-    "phonon",
-    "gainer",
-    "gringo",
-    "beluga",
-    "diatom",
-    "legume",
-    "damsel",
-    "hommes",
-    "proust",
-    "rimmed",
-    "efflux",
-    "moored",
-    "daleks",
-    "peered",
-    "bonito",
-    "maxims",
-    "frolic",
-    "cassia",
-    "lamina",
-    "reruns",
-    "romsey",
-    "plazas",
-    "witney",
-    "roasts",
-    "erupts",
-    "swarms",
-    "chives",
-    "hander",
-    "fisted",
-    "squats",
-    "stubby",
-    "forays",
-    "flanks",
-    "sickly",
-    "curbed",
-    "banjos",
-    "minder",
-    "orator",
-    "mopeds",
-    "steppe",
-    "recast",
-    "bursar",
-    "chaste",
-    "oozing",
-    "subdue",
-    "raking",
-    "ruckus",
-    "juiced",
-    "amoeba",
-    "duvets",
-    "sortie",
-    "withal",
-    "barman",
-    "mourns",
-    "ferric",
-    "thatch",
-    "emboss",
-    "grunts",
-    "prying",
-    "rudely",
-    "lacuna",
-    "queers",
-    "yanked",
-    "minted",
-    "peeves",
-    "animas",
-    "citron",
-    "tacked",
-    "slates",
-    "timbre",
-    "pravda",
-    "whiter",
-    "taboos",
-    "boning",
-    "mosses",
-    "wattle",
-    "stoles",
-    "tinsel",
-    "adverb",
-    "lazily",
-    "nachos",
-    "shandy",
-    "castes",
-    "massif",
-    "shrike",
-    "darken",
-    "mitten",
-    "ilkley",
-    "heriot",
-    "domini",
-    "moiety",
-    "darned",
-    "ampere",
-    "denser",
-    "lignin",
-    "debits",
-    "lassie",
-    "pumice",
-    "stator",
-    "indium",
-    "heaped",
-    "cobham",
-    "untied",
-    "quince",
-    "hansel",
-    "quarto",
-    "creeds",
-    "outrun",
-    "shanty",
-    "voided",
-    "rowena",
-    "geezer",
-    "tydfil",
-    "crusts",
-    "tibial",
-    "populi",
-    "unsold",
-    "opined",
-    "falter",
-    "chatty",
-    "titres",
-    "judaic",
-    "obtuse",
-    "caudal",
-    "sextet",
-    "savour",
-    "lupine",
-    "tenses",
-    "spooks",
-    "prefab",
-    "yeasts",
-    "seizes",
-    "flamed",
-    "strays",
-    "foetus",
-    "punter",
-    "damped",
-    "leaner",
-    "batons",
-    "shinto",
-    "calmer",
-    "turpin",
-    "paltry",
-    "threes",
-    "orford",
-    "eltham",
-    "turban",
-    "zebras",
-    "humpty",
-    "weaned",
-    "pectin",
-    "odense",
-    "flatly",
-    "tipper",
-    "alight",
-    "epochs",
-    "genial",
-    "snowed",
-    "cachet",
-    "infamy",
-    "dapper",
-    "belfry",
-    "odious",
-    "cycled",
-    "broads",
-    "deport",
-    "lemmas",
-    "karmic",
-    "inking",
-    "delves",
-    "bosons",
-    "czechs",
-    "facies",
-    "wrekin",
-    "chucks",
-    "lucite",
-    "rafter",
-    "hexane",
-    "blazes",
-    "saxons",
-    "goodly",
-    "enacts",
-    "lather",
-    "quakes",
-    "gapped",
-    "pastes",
-    "gerbil",
-    "cloaks",
-    "finial",
-    "glazes",
-    "posses",
-    "radnor",
-    "remade",
-    "grisly",
-    "tramps",
-    "yemeni",
-    "hexham",
-    "winkle",
-    "mesons",
-    "brogan",
-    "omelet",
-    "folios",
-    "lazuli",
-    "dictum",
-    "ledges",
-    "gabber",
-    "frieze",
-    "yuppie",
-    "baryon",
-    "sullen",
-    "beeper",
-    "donnas",
-    "pieced",
-    "gourds",
-    "acorns",
-    "rowers",
-    "dormer",
-    "stasis",
-    "panics",
-    "arnica",
-    "talons",
-    "pounce",
-    "dually",
-    "valour",
-    "pashto",
-    "tweedy",
-    "jojoba",
-    "behest",
-    "colada",
-    "infirm",
-    "menage",
-    "divest",
-    "abated",
-    "poplin",
-    "lyceum",
-    "harlot",
-    "glared",
-    "mikado",
-    "gunned",
-    "throes",
-    "theism",
-    "bognor",
-    "troika",
-    "choate",
-    "brainy",
-    "patted",
-    "revels",
-    "sugary",
-    "droves",
-    "defuse",
-    "rigors",
-    "blokes",
-    "spawns",
-    "sombre",
-    "hearse",
-    "roamed",
-    "fatter",
-    "crepes",
-    "senile",
-    "graver",
-    "torrid",
-    "pluses",
-    "myopic",
-    "snugly",
-    "fevers",
-    "eocene",
-    "hoarse",
-    "haggle",
-    "phonic",
-    "gantry",
-    "sufism",
-    "teases",
-    "cromer",
-    "scythe",
-    "homily",
-    "upshot",
-    "sifted",
-    "busier",
-    "marple",
-    "dimmed",
-    "bulges",
-    "scurry",
-    "toting",
-    "fiends",
-    "tallow",
-    "anions",
-    "unkind",
-    "spoofs",
-    "horsey",
-    "eerily",
-    "slouch",
-    "biopic",
-    "eddies",
-    "joists",
-    "alumna",
-    "pendle",
-    "irises",
-    "teeter",
-    "gadfly",
-    "barony",
-    "caddie",
-    "isomer",
-    "swerve",
-    "lector",
-    "vegans",
-    "litton",
-    "updike",
-    "bateau",
-    "cassis",
-    "sacral",
-    "wilful",
-    "twisty",
-    "bitchy",
-    "sprain",
-    "platen",
-    "rother",
-    "abides",
-    "strove",
-    "beadle",
-    "nodule",
-    "paella",
-    "mullah",
-    "spayed",
-    "tourer",
-    "icicle",
-    "hooves",
-    "tralee",
-    "priors",
-    "chimps",
-    "frisky",
-    "racoon",
-    "fibrin",
-    "bamako",
-    "caliph",
-    "cuffed",
-    "tumult",
-    "curate",
-    "donned",
-    "vixens",
-    "tarsus",
-    "valero",
-    "truest",
-    "ghouls",
-    "snitch",
-    "felled",
-    "tinned",
-    "patter",
-    "commie",
-    "bootie",
-    "bummed",
-    "wintry",
-    "anemic",
-    "shamed",
-    "eluded",
-    "bereft",
-    "seaway",
-    "vestry",
-    "thrall",
-    "barked",
-    "blazed",
-    "cupped",
-    "maimed",
-    "petrel",
-    "hymnal",
-    "shrank",
-    "pineal",
-    "budgie",
-    "upping",
-    "knolls",
-    "unwell",
-    "wedged",
-    "deltas",
-    "cubism",
-    "curlew",
-    "salsas",
-    "snazzy",
-    "husker",
-    "moguls",
-    "lapped",
-    "clawed",
-    "nabbed",
-    "gasses",
-    "quills",
-    "erases",
-    "hewett",
-    "bodmin",
-    "haring",
-    "ethane",
-    "puffer",
-    "maitre",
-    "oakham",
-    "heeded",
-    "whammy",
-    "sachet",
-    "drakes",
-    "vetted",
-    "shriek",
-    "posits",
-    "faecal",
-    "bungle",
-    "pokers",
-    "mutate",
-    "qualms",
-    "baffin",
-    "stilts",
-    "roofed",
-    "instal",
-    "hotbed",
-    "gusher",
-    "hemmed",
-    "musket",
-    "repute",
-    "faeces",
-    "hissed",
-    "tirade",
-    "prongs",
-    "peewee",
-    "conger",
-    "unease",
-    "upturn",
-    "muddle",
-    "bladed",
-    "bailed",
-    "boggle",
-    "exudes",
-    "minoan",
-    "recede",
-    "swanky",
-    "sterol",
-    "objets",
-    "mastic",
-    "bongos",
-    "caning",
-    "docent",
-    "manors",
-    "eamonn",
-    "purina",
-    "widnes",
-    "filial",
-    "pavlov",
-    "borage",
-    "regnum",
-    "posers",
-    "sneaks",
-    "diktat",
-    "reaped",
-    "cicada",
-    "enjoin",
-    "boyish",
-    "neared",
-    "cobras",
-    "grater",
-    "peyote",
-    "rigour",
-    "afresh",
-    "ducked",
-    "loomed",
-    "egbert",
-    "clamor",
-    "hiccup",
-    "stewed",
-    "stowed",
-    "pidgin",
-    "squeal",
-    "scorch",
-    "arbour",
-    "colwyn",
-    "skeins",
-    "forges",
-    "loosed",
-    "madcap",
-    "crabby",
-    "burlap",
-    "equips",
-    "dieppe",
-    "dozier",
-    "massed",
-    "shires",
-    "wiggly",
-    "tricot",
-    "bigots",
-    "hovers",
-    "mulled",
-    "inborn",
-    "russet",
-    "specie",
-    "mettle",
-    "insets",
-    "lilacs",
-    "buoyed",
-    "malady",
-    "olefin",
-    "parkas",
-    "fester",
-    "roseau",
-    "grubby",
-    "wooing",
-    "hippos",
-    "hoopla",
-    "aborts",
-    "envied",
-    "coring",
-    "rezone",
-    "nursed",
-    "squirm",
-    "althea",
-    "driest",
-    "settee",
-    "flaunt",
-    "dasher",
-    "callus",
-    "shifty",
-    "upwind",
-    "hashed",
-    "darted",
-    "colons",
-    "gauged",
-    "nought",
-    "sinker",
-    "eggnog",
-    "rehash",
-    "enlace",
-    "purist",
-    "dished",
-    "corned",
-    "tamils",
-    "octavo",
-    "luring",
-    "flirts",
-    "witted",
-    "coldly",
-    "envoys",
-    "staves",
-    "croats",
-    "avowed",
-    "oodles",
-    "docile",
-    "sexier",
-    "mumble",
-    "vizier",
-    "roadie",
-    "smalls",
-    "blanch",
-    "mugger",
-    "crewed",
-    "sabers",
-    "animus",
-    "dimple",
-    "supine",
-    "squint",
-    "vitals",
-    "scanty",
-    "bartok",
-    "laymen",
-    "drench",
-    "cupola",
-    "minuet",
-    "spouts",
-    "nicene",
-    "glided",
-    "largos",
-    "fanned",
-    "wetted",
-    "giveth",
-    "wallop",
-    "leaver",
-    "exmoor",
-    "befall",
-    "anodes",
-    "dodged",
-    "finned",
-    "dorcas",
-    "looses",
-    "bloods",
-    "odours",
-    "meagre",
-    "chintz",
-    "lineal",
-    "aleppo",
-    "knotty",
-    "cajuns",
-    "ironed",
-    "retold",
-    "embeds",
-    "smithy",
-    "gratin",
-    "kigali",
-    "suitor",
-    "creche",
-    "urbane",
-    "stupor",
-    "sexing",
-    "pleats",
-    "accede",
-    "measly",
-    "swampy",
-    "lifers",
-    "ouster",
-    "tugged",
-    "detest",
-    "nipper",
-    "passim",
-    "jovial",
-    "romany",
-    "meddle",
-    "tomboy",
-    "wampum",
-    "sutras",
-    "canard",
-    "winked",
-    "scurvy",
-    "lenten",
-    "shimmy",
-    "taunts",
-    "pivots",
-    "glowed",
-    "sunlit",
-    "rigger",
-    "totnes",
-    "gaggle",
-    "callow",
-    "edicts",
-    "pimple",
-    "bashed",
-    "tannin",
-    "boughs",
-    "ginnie",
-    "sprigs",
-    "stymie",
-    "virago",
-    "thresh",
-    "snooty",
-    "foetal",
-    "congas",
-    "fuming",
-    "gnosis",
-    "powwow",
-    "framer",
-    "vigils",
-    "dented",
-    "patria",
-    "skewer",
-    "pained",
-    "looker",
-    "ramjet",
-    "peddle",
-    "utters",
-    "panned",
-    "riffle",
-    "pucker",
-    "messrs",
-    "specks",
-    "suntan",
-    "kaolin",
-    "adroit",
-    "belies",
-    "faring",
-    "oolong",
-    "effigy",
-    "shaves",
-    "broach",
-    "partes",
-    "aghast",
-    "reheat",
-    "jovian",
-    "biomes",
-    "wallow",
-    "brunet",
-    "cubits",
-    "frothy",
-    "geckos",
-    "biller",
-    "mangle",
-    "shined",
-    "rapped",
-    "hurray",
-    "amoral",
-    "luanda",
-    "limbic",
-    "oedema",
-    "flexed",
-    "kindle",
-    "pricks",
-    "viator",
-    "tithes",
-    "sipped",
-    "rodeos",
-    "milked",
-    "hormel",
-    "sluice",
-    "forfar",
-    "craves",
-    "soiree",
-    "grimly",
-    "folger",
-    "cabled",
-    "spongy",
-    "monger",
-    "rustle",
-    "carnet",
-    "bezels",
-    "vainly",
-    "malign",
-    "canvey",
-    "buzzed",
-    "eluted",
-    "crofts",
-    "redden",
-    "fizzle",
-    "sobbed",
-    "omnium",
-    "syphon",
-    "surest",
-    "bribed",
-    "diddle",
-    "pestle",
-    "elapse",
-    "goring",
-    "plinth",
-    "mooted",
-    "enemas",
-    "navies",
-    "pinker",
-    "thanet",
-    "rotted",
-    "abbots",
-    "redeye",
-    "signum",
-    "dogmas",
-    "waddle",
-    "debunk",
-    "crummy",
-    "goatee",
-    "baited",
-    "veined",
-    "thirsk",
-    "vesper",
-    "mortis",
-    "fronds",
-    "foxing",
-    "oporto",
-    "stints",
-    "sicker",
-    "carper",
-    "winced",
-    "gaffer",
-    "nostro",
-    "glitzy",
-    "ordain",
-    "sedate",
-    "ricans",
-    "engulf",
-    "frilly",
-    "defame",
-    "spurts",
-    "cubist",
-    "bijoux",
-    "coolly",
-    "triads",
-    "batley",
-    "punchy",
-    "ingots",
-    "skunks",
-    "jiggle",
-    "pylons",
-    "bidets",
-    "civile",
-    "noggin",
-    "skated",
-    "berets",
-    "icebox",
-    "caiman",
-    "emptor",
-    "taxman",
-    "preppy",
-    "webbed",
-    "gingko",
-    "gerona",
-    "meshed",
-    "nicked",
-    "fetter",
-    "jarred",
-    "lidded",
-    "attics",
-    "manama",
-    "morsel",
-    "cussed",
-    "evaded",
-    "deeded",
-    "titian",
-    "cynics",
-    "dither",
-    "elysee",
-    "physic",
-    "polder",
-    "codify",
-    "adores",
-    "melvyn",
-    "gasser",
-    "boucle",
-    "costed",
-    "screed",
-    "eschew",
-    "swifts",
-    "gloved",
-    "dodges",
-    "finery",
-    "dibble",
-    "stoops",
-    "ludlum",
-    "spurge",
-    "allude",
-    "scuffs",
-    "exacta",
-    "vowing",
-    "plying",
-    "conker",
-    "graven",
-    "craved",
-    "fracas",
-    "jetted",
-    "celled",
-    "boomed",
-    "hooter",
-    "shacks",
-    "pimped",
-    "jailer",
-    "braved",
-    "ersatz",
-    "menial",
-    "clayey",
-    "flinch",
-    "despot",
-    "koalas",
-    "privet",
-    "planed",
-    "vivant",
-    "flexor",
-    "raffia",
-    "kipper",
-    "begone",
-    "bigwig",
-    "supers",
-    "snotty",
-    "remiss",
-    "birder",
-    "felted",
-    "fasted",
-    "eunuch",
-    "dicker",
-    "woeful",
-    "indict",
-    "slicks",
-    "nester",
-    "hearer",
-    "awakes",
-    "molars",
-    "nomine",
-    "jobber",
-    "flabby",
-    "anorak",
-    "beefed",
-    "heaved",
-    "gallic",
-    "phobic",
-    "tubule",
-    "recurs",
-    "refuel",
-    "thurso",
-    "levity",
-    "tussle",
-    "reamer",
-    "tempos",
-    "wilted",
-    "conned",
-    "skybox",
-    "outwit",
-    "buries",
-    "boozer",
-    "phlegm",
-    "scruff",
-    "nudged",
-    "asters",
-    "deform",
-    "frosts",
-    "ipecac",
-    "defile",
-    "pallid",
-    "borzoi",
-    "offing",
-    "infest",
-    "tonics",
-    "honcho",
-    "edwina",
-    "sieves",
-    "vexing",
-    "piquet",
-    "seraph",
-    "kebabs",
-    "scampi",
-    "plucky",
-    "loggia",
-    "untidy",
-    "baobab",
-    "scarfs",
-    "growls",
-    "goiter",
-    "oiling",
-    "saluki",
-    "papuan",
-    "spewed",
-    "disuse",
-    "reeled",
-    "garish",
-    "gaiety",
-    "cerise",
-    "frowns",
-    "phoney",
-    "lynton",
-    "alphas",
-    "kennet",
-    "nubile",
-    "sadder",
-    "ravage",
-    "mugged",
-    "peeked",
-    "labile",
-    "beckon",
-    "dabble",
-    "buttes",
-    "chitin",
-    "unsaid",
-    "reaves",
-    "truant",
-    "ermine",
-    "swiped",
-    "dunoon",
-    "squids",
-    "zeroed",
-    "drowns",
-    "flours",
-    "caddis",
-    "steeds",
-    "moroni",
-    "waster",
-    "overdo",
-    "driers",
-    "putrid",
-    "verges",
-    "ridged",
-    "adders",
-    "comely",
-    "vosges",
-    "puking",
-    "wields",
-    "dreads",
-    "pander",
-    "totems",
-    "riyals",
-    "nobler",
-    "howled",
-    "gullet",
-    "cicely",
-    "cabbie",
-    "vetoes",
-    "menses",
-    "malays",
-    "cobweb",
-    "avocet",
-    "gassed",
-    "typhus",
-    "welter",
-    "brushy",
-    "pudsey",
-    "zwolle",
-    "valuer",
-    "zapped",
-    "zinger",
-    "purges",
-    "groggy",
-    "dander",
-    "madmen",
-    "shelve",
-    "dyadic",
-    "tedium",
-    "miffed",
-    "knifes",
-    "kilter",
-    "diadem",
-    "anoxic",
-    "tittle",
-    "obsess",
-    "poling",
-    "hallow",
-    "sashes",
-    "whined",
-    "assail",
-    "tensed",
-    "bootle",
-    "posies",
-    "glamor",
-    "madder",
-    "brevet",
-    "besoin",
-    "herded",
-    "litera",
-    "endive",
-    "koreas",
-    "lemurs",
-    "severs",
-    "mercia",
-    "furies",
-    "formby",
-    "piqued",
-    "instar",
-    "demure",
-    "veered",
-    "purley",
-    "cygnet",
-    "tonsil",
-    "huzzah",
-    "tempts",
-    "penman",
-    "basher",
-    "pampas",
-    "gounod",
-    "grayed",
-    "stocky",
-    "sidcup",
-    "laxity",
-    "balked",
-    "kisser",
-    "railed",
-    "ocelot",
-    "moneta",
-    "payola",
-    "revved",
-    "likens",
-    "hubbub",
-    "droopy",
-    "macaws",
-    "dafydd",
-    "dative",
-    "whines",
-    "trivet",
-    "egoism",
-    "cretan",
-    "mattes",
-    "coaxed",
-    "chimed",
-    "morass",
-    "pinkie",
-    "slumps",
-    "bashes",
-    "leaven",
-    "solway",
-    "unwary",
-    "begets",
-    "froman",
-    "reamed",
-    "anoxia",
-    "holier",
-    "dolmen",
-    "gonads",
-    "brutes",
-    "sniffs",
-    "dilate",
-    "ceding",
-    "lasses",
-    "twiggy",
-    "uppity",
-    "eludes",
-    "deface",
-    "mayans",
-    "beaked",
-    "dozing",
-    "revues",
-    "caxton",
-    "shoves",
-    "blithe",
-    "retell",
-    "storks",
-    "arcing",
-    "kludge",
-    "molest",
-    "egrets",
-    "whoosh",
-    "lawman",
-    "hotrod",
-    "bimbos",
-    "toiled",
-    "honshu",
-    "guises",
-    "borate",
-    "bunsen",
-    "deters",
-    "tamale",
-    "butted",
-    "chalks",
-    "binned",
-    "zygote",
-    "shucks",
-    "adduct",
-    "befell",
-    "formic",
-    "covens",
-    "secede",
-    "prises",
-    "marshy",
-    "grasps",
-    "zinnia",
-    "morose",
-    "abbeys",
-    "flaked",
-    "pedant",
-    "grouch",
-    "cellos",
-    "erodes",
-    "queasy",
-    "chalky",
-    "ageism",
-    "demean",
-    "broods",
-    "limber",
-    "dunmow",
-    "rinses",
-    "jolted",
-    "tenner",
-    "darter",
-    "banjul",
-    "abduct",
-    "muting",
-    "violas",
-    "soured",
-    "exhort",
-    "ramrod",
-    "rusher",
-    "bucked",
-    "stumpy",
-    "gramme",
-    "dowels",
-    "uglier",
-    "climes",
-    "addled",
-    "anoint",
-    "braver",
-    "termes",
-    "founds",
-    "blocky",
-    "jaunty",
-    "dollop",
-    "screwy",
-    "cockle",
-    "loaner",
-    "unseat",
-    "bellum",
-    "linkup",
-    "atolls",
-    "parley",
-    "adorns",
-    "mummer",
-    "craggy",
-    "gushed",
-    "aplomb",
-    "truism",
-    "turbid",
-    "sterna",
-    "defers",
-    "buffed",
-    "rappel",
-    "cerium",
-    "curler",
-    "squawk",
-    "liming",
-    "gratia",
-    "outbid",
-    "lulled",
-    "repels",
-    "pliant",
-    "pyjama",
-    "avocat",
-    "vassal",
-    "cantos",
-    "pining",
-    "labial",
-    "hyssop",
-    "kiting",
-    "limped",
-    "flexes",
-    "depose",
-    "pacify",
-    "sunder",
-    "vodkas",
-    "florid",
-    "quacks",
-    "hubcap",
-    "tarred",
-    "nipped",
-    "gnarly",
-    "premix",
-    "pleura",
-    "pester",
-    "fencer",
-    "triune",
-    "hairdo",
-    "chines",
-    "shunts",
-    "hawick",
-    "induct",
-    "manche",
-    "bracts",
-    "furore",
-    "sharer",
-    "delved",
-    "nighty",
-    "gluons",
-    "oddest",
-    "evince",
-    "hyenas",
-    "spanks",
-    "seesaw",
-    "hosing",
-    "flings",
-    "cueing",
-    "coleus",
-    "meekly",
-    "wailed",
-    "dement",
-    "firmed",
-    "scrawl",
-    "foamed",
-    "yearns",
-    "purser",
-    "googol",
-    "groped",
-    "warder",
-    "rumpus",
-    "braked",
-    "sadist",
-    "warily",
-    "aflame",
-    "aright",
-    "googly",
-    "infers",
-    "jeffry",
-    "tureen",
-    "uproot",
-    "flints",
-    "logjam",
-    "extort",
-    "carves",
-    "roofer",
-    "pooped",
-    "tinder",
-    "leaden",
-    "bayeux",
-    "brevis",
-    "coking",
-    "wholes",
-    "skidoo",
-    "tunics",
-    "muesli",
-    "osmium",
-    "lepers",
-    "meaner",
-    "roamer",
-    "teepee",
-    "merman",
-    "missal",
-    "louver",
-    "crisco",
-    "gneiss",
-    "unroll",
-    "casted",
-    "novena",
-    "tropes",
-    "pitter",
-    "junket",
-    "prissy",
-    "kabobs",
-    "drools",
-    "zlotys",
-    "schist",
-    "lances",
-    "macula",
-    "impute",
-    "mauled",
-    "blimps",
-    "pepsin",
-    "porker",
-    "fining",
-    "pitied",
-    "erring",
-    "plaids",
-    "unworn",
-    "panted",
-    "tetley",
-    "fondle",
-    "bulbul",
-    "umlaut",
-    "nobile",
-    "slaved",
-    "tsetse",
-    "mendip",
-    "semite",
-    "midden",
-    "mommas",
-    "kneels",
-    "pinged",
-    "sepals",
-    "iambic",
-    "bicker",
-    "theist",
-    "coitus",
-    "ravers",
-    "redder",
-    "tiptoe",
-    "chinos",
-    "flyway",
-    "yawned",
-    "rewire",
-    "anther",
-    "stomps",
-    "gulped",
-    "cupids",
-    "thumps",
-    "augers",
-    "lychee",
-    "amides",
-    "lunged",
-    "cranny",
-    "goober",
-    "wavers",
-    "syndic",
-    "pommel",
-    "linnet",
-    "dicing",
-    "gaiter",
-    "laddie",
-    "yahoos",
-    "stooge",
-    "dulled",
-    "kingly",
-    "chided",
-    "acquit",
-    "smooch",
-    "akimbo",
-    "aryans",
-    "motile",
-    "rectus",
-    "flecks",
-    "chesty",
-    "lunges",
-    "fealty",
-    "vendee",
-    "leafed",
-    "balled",
-    "seeped",
-    "newlyn",
-    "beachy",
-    "greyed",
-    "clammy",
-    "rifled",
-    "fresca",
-    "bogeys",
-    "gaited",
-    "knacks",
-    "chinas",
-    "befits",
-    "svelte",
-    "wheeze",
-    "avidly",
-    "tilled",
-    "weeded",
-    "brassy",
-    "papyri",
-    "parens",
-    "fibula",
-    "dearer",
-    "inched",
-    "apnoea",
-    "milady",
-    "erbium",
-    "dugong",
-    "hellos",
-    "ostend",
-    "woodsy",
-    "silvan",
-    "phloem",
-    "tarter",
-    "ladles",
-    "prided",
-    "malted",
-    "ejecta",
-    "whiten",
-    "virile",
-    "shrift",
-    "jilted",
-    "poring",
-    "whited",
-    "docker",
-    "peeped",
-    "doused",
-    "triode",
-    "booing",
-    "ruffed",
-    "carder",
-    "seaham",
-    "dauber",
-    "relict",
-    "fatten",
-    "tolled",
-    "gurkha",
-    "rancor",
-    "baling",
-    "cresol",
-    "cashes",
-    "whiles",
-    "payees",
-    "lurked",
-    "masher",
-    "hobble",
-    "trawls",
-    "biding",
-    "mammon",
-    "opines",
-    "tinkle",
-    "wormed",
-    "unhurt",
-    "burros",
-    "quanti",
-    "hoards",
-    "toupee",
-    "tannic",
-    "sacrum",
-    "dammed",
-    "abased",
-    "abases",
-    "abater",
-    "abates",
-    "abator",
-    "abbacy",
-    "abbess",
-    "abhors",
-    "abided",
-    "abjure",
-    "ablate",
-    "ablaut",
-    "ablest",
-    "abloom",
-    "abodes",
-    "abrade",
-    "abseil",
-    "abysms",
-    "accost",
-    "acidly",
-    "adages",
-    "addend",
-    "addles",
-    "adduce",
-    "adeems",
-    "adepts",
-    "adieus",
-    "adieux",
-    "aditus",
-    "adjoin",
-    "adjure",
-    "adobes",
-    "adorer",
-    "adsorb",
-    "aequum",
-    "aerate",
-    "aerobe",
-    "affeer",
-    "affray",
-    "afters",
-    "agalma",
-    "agates",
-    "agists",
-    "agleam",
-    "agnate",
-    "agouti",
-    "agreer",
-    "aiders",
-    "airier",
-    "airily",
-    "alders",
-    "alecks",
-    "aleuts",
-    "alibis",
-    "aliter",
-    "alkyds",
-    "alkyls",
-    "allays",
-    "allots",
-    "ambits",
-    "ambled",
-    "ambles",
-    "amebic",
-    "amerce",
-    "amissa",
-    "amnion",
-    "amoris",
-    "amours",
-    "ampler",
-    "amstar",
-    "amsted",
-    "amuses",
-    "angary",
-    "anises",
-    "anneal",
-    "annuli",
-    "annuls",
-    "anomie",
-    "anuses",
-    "anvils",
-    "aortal",
-    "aortas",
-    "aoudad",
-    "apexes",
-    "apiary",
-    "apices",
-    "apneas",
-    "appall",
-    "appals",
-    "archly",
-    "ardlui",
-    "argils",
-    "argots",
-    "arguer",
-    "aribas",
-    "armata",
-    "armful",
-    "armlet",
-    "armors",
-    "arrant",
-    "arsine",
-    "artier",
-    "artily",
-    "ascots",
-    "ashlar",
-    "aslant",
-    "aspens",
-    "aspics",
-    "assize",
-    "assort",
-    "astern",
-    "ataxic",
-    "atonal",
-    "atoned",
-    "atones",
-    "attars",
-    "attlee",
-    "attorn",
-    "attune",
-    "atypic",
-    "augurs",
-    "augury",
-    "avails",
-    "averts",
-    "avouch",
-    "avowal",
-    "avowry",
-    "avulse",
-    "awaked",
-    "awoken",
-    "babied",
-    "bacons",
-    "badman",
-    "badmen",
-    "bagful",
-    "bagman",
-    "bagmen",
-    "bailee",
-    "bailer",
-    "bailor",
-    "bairns",
-    "balder",
-    "baldly",
-    "baleen",
-    "balers",
-    "balsas",
-    "bancos",
-    "bangui",
-    "barbel",
-    "barest",
-    "barged",
-    "bargee",
-    "barite",
-    "barmen",
-    "basely",
-    "basest",
-    "basked",
-    "baslow",
-    "basted",
-    "bastes",
-    "bather",
-    "bathes",
-    "bathos",
-    "batiks",
-    "bating",
-    "batmen",
-    "battel",
-    "bauble",
-    "baulks",
-    "bawled",
-    "baying",
-    "bayous",
-    "becalm",
-    "bedaub",
-    "bedbug",
-    "bedeck",
-    "bedels",
-    "bedews",
-    "bedpan",
-    "bedsit",
-    "beduin",
-    "beeped",
-    "beeves",
-    "befogs",
-    "befoul",
-    "begird",
-    "begirt",
-    "behead",
-    "behoof",
-    "behove",
-    "belays",
-    "belied",
-    "bemire",
-    "bemoan",
-    "bemuse",
-    "benumb",
-    "benzes",
-    "berate",
-    "berton",
-    "besets",
-    "bested",
-    "bestir",
-    "betake",
-    "betide",
-    "betook",
-    "betted",
-    "bettor",
-    "bevels",
-    "bevies",
-    "bewail",
-    "bidden",
-    "bigamy",
-    "bights",
-    "bilges",
-    "bilked",
-    "billam",
-    "billow",
-    "bindle",
-    "binged",
-    "binges",
-    "bipeds",
-    "biscay",
-    "bisect",
-    "biters",
-    "blared",
-    "blares",
-    "blazon",
-    "blears",
-    "bleary",
-    "bleats",
-    "bleeps",
-    "blench",
-    "blintz",
-    "bloats",
-    "blotch",
-    "blotto",
-    "blowsy",
-    "blowzy",
-    "bluest",
-    "bluets",
-    "bluing",
-    "blumba",
-    "blurts",
-    "boated",
-    "boatel",
-    "bobbed",
-    "bodged",
-    "bodges",
-    "boding",
-    "bodkin",
-    "boffin",
-    "bogies",
-    "bollix",
-    "bombes",
-    "bonbon",
-    "boners",
-    "bonged",
-    "bonier",
-    "bonked",
-    "bonker",
-    "bonzes",
-    "booboo",
-    "boodle",
-    "boohoo",
-    "bootee",
-    "boozed",
-    "boozes",
-    "bopped",
-    "borers",
-    "borsch",
-    "borsht",
-    "bosoms",
-    "bossed",
-    "bosuns",
-    "bovary",
-    "bovril",
-    "bowfin",
-    "bowies",
-    "bowmen",
-    "boyars",
-    "bracer",
-    "braise",
-    "bratty",
-    "bravos",
-    "brawls",
-    "brawny",
-    "brayed",
-    "brazed",
-    "brazes",
-    "breams",
-    "breves",
-    "brevia",
-    "briars",
-    "briber",
-    "briers",
-    "brined",
-    "brines",
-    "brogue",
-    "broils",
-    "brolly",
-    "broody",
-    "broths",
-    "bruits",
-    "brumes",
-    "brutum",
-    "buboes",
-    "budded",
-    "budged",
-    "budges",
-    "buffos",
-    "bugler",
-    "bugles",
-    "builth",
-    "bulbar",
-    "bulged",
-    "bulgur",
-    "bulked",
-    "bulled",
-    "bunged",
-    "bunion",
-    "bunked",
-    "bunkum",
-    "bunted",
-    "bunter",
-    "burble",
-    "burbot",
-    "burghs",
-    "burgle",
-    "burins",
-    "burlaw",
-    "burped",
-    "burred",
-    "busboy",
-    "bushed",
-    "busied",
-    "busies",
-    "busked",
-    "busker",
-    "buskin",
-    "busman",
-    "busmen",
-    "bussed",
-    "buttal",
-    "buzzes",
-    "byroad",
-    "byword",
-    "cabala",
-    "cabals",
-    "cabers",
-    "cabman",
-    "cabmen",
-    "cacaos",
-    "cackle",
-    "cadere",
-    "cadged",
-    "cadger",
-    "cadges",
-    "cadmic",
-    "caduca",
-    "caftan",
-    "cagier",
-    "cagily",
-    "caging",
-    "cajole",
-    "caking",
-    "calmat",
-    "calque",
-    "calved",
-    "cambia",
-    "canape",
-    "canaps",
-    "cancan",
-    "cannel",
-    "cannot",
-    "canoed",
-    "cantab",
-    "canted",
-    "cantel",
-    "cantle",
-    "canute",
-    "capful",
-    "capias",
-    "capite",
-    "caplet",
-    "capons",
-    "cappis",
-    "captus",
-    "carboy",
-    "carcer",
-    "careen",
-    "carets",
-    "cargos",
-    "carhop",
-    "carobs",
-    "caroms",
-    "carped",
-    "carrel",
-    "carted",
-    "casaba",
-    "catals",
-    "catgut",
-    "catkin",
-    "catnap",
-    "catsup",
-    "caulks",
-    "cavere",
-    "cavils",
-    "cavort",
-    "cawing",
-    "censer",
-    "cental",
-    "ceorls",
-    "certed",
-    "cesser",
-    "cestui",
-    "chacer",
-    "chaces",
-    "chadic",
-    "chador",
-    "chafed",
-    "chafes",
-    "chaffs",
-    "chancy",
-    "charta",
-    "chasid",
-    "chasms",
-    "cheeps",
-    "chesil",
-    "chichi",
-    "chides",
-    "chinch",
-    "chinks",
-    "chirps",
-    "chirpy",
-    "chivvy",
-    "chocks",
-    "chomps",
-    "choosy",
-    "chorea",
-    "chuffs",
-    "chukka",
-    "chummy",
-    "chumps",
-    "churls",
-    "churns",
-    "chymin",
-    "ciders",
-    "cilium",
-    "citify",
-    "civets",
-    "clacks",
-    "clangs",
-    "clanks",
-    "claque",
-    "clefts",
-    "clench",
-    "clichs",
-    "cliffy",
-    "clines",
-    "clingy",
-    "clinks",
-    "clipei",
-    "cloche",
-    "cloere",
-    "cloggy",
-    "clomps",
-    "clouts",
-    "cloven",
-    "cloyed",
-    "clubby",
-    "clucks",
-    "clypei",
-    "coatis",
-    "coaxes",
-    "coccyx",
-    "cocket",
-    "cocoas",
-    "coddle",
-    "codger",
-    "coelum",
-    "coeval",
-    "coffer",
-    "coheir",
-    "cohere",
-    "coifed",
-    "coital",
-    "comfit",
-    "comity",
-    "commix",
-    "compos",
-    "conchs",
-    "confab",
-    "conies",
-    "coning",
-    "conked",
-    "cooing",
-    "coolie",
-    "cooped",
-    "cootie",
-    "coppas",
-    "copped",
-    "copses",
-    "copula",
-    "corbel",
-    "corers",
-    "corgis",
-    "corium",
-    "corked",
-    "corker",
-    "corody",
-    "cortis",
-    "corvee",
-    "corwen",
-    "cosens",
-    "coshed",
-    "coshes",
-    "cosier",
-    "cosies",
-    "cosign",
-    "cosily",
-    "cosset",
-    "covets",
-    "coveys",
-    "covins",
-    "cowers",
-    "cowing",
-    "cowman",
-    "cowmen",
-    "cowpox",
-    "cowrie",
-    "coyest",
-    "coypus",
-    "cozens",
-    "cozier",
-    "cozies",
-    "cozily",
-    "crakes",
-    "craned",
-    "crania",
-    "crapes",
-    "crated",
-    "cravat",
-    "crawly",
-    "crazes",
-    "crches",
-    "creaks",
-    "creaky",
-    "credos",
-    "creels",
-    "cretin",
-    "crewel",
-    "cricks",
-    "criers",
-    "crimen",
-    "crimps",
-    "croaks",
-    "croaky",
-    "crocia",
-    "crocks",
-    "crones",
-    "croons",
-    "crowed",
-    "cruder",
-    "cruets",
-    "cruses",
-    "cryers",
-    "crypta",
-    "crypts",
-    "cubage",
-    "cubbed",
-    "cubing",
-    "cudgel",
-    "cultic",
-    "cumber",
-    "cumuli",
-    "cupful",
-    "cupric",
-    "curare",
-    "curdle",
-    "curies",
-    "curium",
-    "currit",
-    "curtly",
-    "curtsy",
-    "cusses",
-    "custos",
-    "cutely",
-    "cutlet",
-    "cyanic",
-    "dabbed",
-    "dachas",
-    "dactyl",
-    "daises",
-    "damply",
-    "damson",
-    "dandle",
-    "dangly",
-    "danker",
-    "dankly",
-    "dapped",
-    "dapple",
-    "darnel",
-    "darner",
-    "daubed",
-    "daunts",
-    "davits",
-    "dawdle",
-    "dazing",
-    "deaden",
-    "deader",
-    "deafen",
-    "deafer",
-    "debark",
-    "debars",
-    "debase",
-    "debtee",
-    "debugs",
-    "decamp",
-    "decana",
-    "decani",
-    "decant",
-    "decime",
-    "deckle",
-    "decoct",
-    "defalk",
-    "defter",
-    "dehors",
-    "deigns",
-    "deists",
-    "delict",
-    "delude",
-    "demain",
-    "demist",
-    "demobs",
-    "demote",
-    "demurs",
-    "denary",
-    "denims",
-    "denize",
-    "denude",
-    "depute",
-    "deride",
-    "dermas",
-    "desalt",
-    "descry",
-    "deuced",
-    "devest",
-    "dewier",
-    "dewing",
-    "dewlap",
-    "dicers",
-    "dicier",
-    "dictus",
-    "dieted",
-    "digama",
-    "digamy",
-    "dilwyn",
-    "dimisi",
-    "dimity",
-    "dimwit",
-    "dinged",
-    "dinned",
-    "direly",
-    "direst",
-    "dirges",
-    "dirndl",
-    "disbar",
-    "disked",
-    "disown",
-    "distil",
-    "dittos",
-    "divans",
-    "divots",
-    "dodder",
-    "dodgem",
-    "doffed",
-    "dogger",
-    "dogleg",
-    "doling",
-    "dolled",
-    "dolman",
-    "dolour",
-    "dombec",
-    "doming",
-    "donees",
-    "donjon",
-    "doodad",
-    "dopers",
-    "dopier",
-    "dories",
-    "dorsum",
-    "dossed",
-    "dosser",
-    "dosses",
-    "dotage",
-    "dotard",
-    "doting",
-    "doughy",
-    "dourer",
-    "dourly",
-    "douses",
-    "dowers",
-    "dowles",
-    "dowsed",
-    "dowser",
-    "dowses",
-    "doyley",
-    "drably",
-    "drachm",
-    "drawee",
-    "drawls",
-    "drippy",
-    "drogue",
-    "drolly",
-    "droned",
-    "droops",
-    "dropsy",
-    "drover",
-    "drowse",
-    "drupes",
-    "dryads",
-    "dubbin",
-    "ducats",
-    "dueled",
-    "dueler",
-    "duella",
-    "duffer",
-    "dulcet",
-    "duller",
-    "dumbly",
-    "dumdum",
-    "dunces",
-    "dunked",
-    "dunlin",
-    "dunned",
-    "duping",
-    "dynast",
-    "dynode",
-    "eaglet",
-    "earful",
-    "earwax",
-    "earwig",
-    "ebbing",
-    "echoic",
-    "eclair",
-    "eddied",
-    "edemas",
-    "edgier",
-    "edgily",
-    "educed",
-    "educes",
-    "eerier",
-    "efface",
-    "effete",
-    "effuse",
-    "eggcup",
-    "egging",
-    "egoist",
-    "eiders",
-    "ejects",
-    "elands",
-    "elates",
-    "elegit",
-    "elfish",
-    "elided",
-    "elides",
-    "eloign",
-    "eloped",
-    "elopes",
-    "elutes",
-    "embalm",
-    "embank",
-    "emboli",
-    "emceed",
-    "emcees",
-    "emends",
-    "emetic",
-    "emoted",
-    "emotes",
-    "enamor",
-    "encamp",
-    "encase",
-    "endear",
-    "endows",
-    "endued",
-    "endues",
-    "enfold",
-    "engird",
-    "engirt",
-    "enitia",
-    "enmesh",
-    "enrage",
-    "enrols",
-    "enseal",
-    "ensile",
-    "entomb",
-    "entrap",
-    "enured",
-    "enures",
-    "envies",
-    "envois",
-    "enwrap",
-    "eolith",
-    "epodes",
-    "eponym",
-    "erects",
-    "ergots",
-    "eructs",
-    "eskers",
-    "esnecy",
-    "espied",
-    "espies",
-    "essoin",
-    "estops",
-    "estray",
-    "etcher",
-    "etches",
-    "eunomy",
-    "evades",
-    "evened",
-    "evicts",
-    "evilly",
-    "ewages",
-    "exacts",
-    "exalts",
-    "exeats",
-    "exedra",
-    "exhume",
-    "expels",
-    "extoll",
-    "extols",
-    "exuded",
-    "exults",
-    "eyecup",
-    "eyeful",
-    "eyries",
-    "facere",
-    "facias",
-    "factum",
-    "fagged",
-    "fagots",
-    "faille",
-    "faints",
-    "faired",
-    "fakers",
-    "fakery",
-    "fakirs",
-    "falser",
-    "falsus",
-    "famish",
-    "fanged",
-    "fantod",
-    "farads",
-    "farces",
-    "fardel",
-    "farleu",
-    "faroes",
-    "farted",
-    "fatted",
-    "fatuum",
-    "fatuus",
-    "fauces",
-    "faunae",
-    "faunas",
-    "fautor",
-    "fawned",
-    "fazing",
-    "fecial",
-    "fecund",
-    "feebly",
-    "feeler",
-    "feigns",
-    "feints",
-    "fellah",
-    "femora",
-    "femurs",
-    "fended",
-    "fenian",
-    "feodal",
-    "fermes",
-    "ferule",
-    "fervid",
-    "festal",
-    "festas",
-    "feting",
-    "fettle",
-    "feuded",
-    "fezzes",
-    "fiaunt",
-    "fibbed",
-    "fibber",
-    "fibril",
-    "fiches",
-    "fidget",
-    "figgie",
-    "filare",
-    "filets",
-    "fillip",
-    "finked",
-    "fiords",
-    "firkin",
-    "firmae",
-    "firths",
-    "fitful",
-    "fivers",
-    "fixate",
-    "fixers",
-    "fizzed",
-    "fizzes",
-    "flacks",
-    "flacon",
-    "flagon",
-    "flails",
-    "flatus",
-    "flaxen",
-    "flayed",
-    "fledge",
-    "fleecy",
-    "flinty",
-    "flitch",
-    "floozy",
-    "florae",
-    "floras",
-    "floret",
-    "flossy",
-    "floury",
-    "flouts",
-    "fluffs",
-    "flukes",
-    "flumes",
-    "flunks",
-    "flunky",
-    "fluxed",
-    "fluxum",
-    "flybys",
-    "flymas",
-    "foaled",
-    "fobbed",
-    "foetid",
-    "fogeys",
-    "fogged",
-    "fogies",
-    "foible",
-    "foists",
-    "folksy",
-    "foment",
-    "fonder",
-    "forbad",
-    "forded",
-    "forger",
-    "formam",
-    "fornix",
-    "fortes",
-    "fosses",
-    "fouler",
-    "foully",
-    "founts",
-    "foveae",
-    "fowled",
-    "foxier",
-    "foyers",
-    "frappe",
-    "freest",
-    "fregit",
-    "freons",
-    "fretum",
-    "friary",
-    "frijol",
-    "frisca",
-    "frisks",
-    "frizzy",
-    "frocks",
-    "froths",
-    "frowzy",
-    "frumps",
-    "frumpy",
-    "frusta",
-    "fuddle",
-    "fudged",
-    "fudges",
-    "fugues",
-    "fulcra",
-    "fulmar",
-    "fulmen",
-    "funked",
-    "funned",
-    "furled",
-    "furors",
-    "furred",
-    "fusels",
-    "fusers",
-    "fussed",
-    "fusses",
-    "fustis",
-    "fuzzed",
-    "gabbed",
-    "gabble",
-    "gabled",
-    "gadded",
-    "gaffed",
-    "gaffes",
-    "gagers",
-    "gagman",
-    "gagmen",
-    "galled",
-    "galosh",
-    "gambol",
-    "gamely",
-    "gamete",
-    "gamier",
-    "gamine",
-    "gamins",
-    "ganged",
-    "ganger",
-    "gangly",
-    "gangue",
-    "gannet",
-    "gaoled",
-    "gaoler",
-    "garbed",
-    "garble",
-    "garene",
-    "gargle",
-    "garths",
-    "gashed",
-    "gashes",
-    "gasify",
-    "gasman",
-    "gasmen",
-    "gateau",
-    "gauger",
-    "gavels",
-    "gavial",
-    "gawked",
-    "gayest",
-    "gayety",
-    "gazers",
-    "gazump",
-    "geeing",
-    "gelded",
-    "gelled",
-    "gemote",
-    "genets",
-    "genies",
-    "geniis",
-    "gentes",
-    "geodes",
-    "gerens",
-    "gerund",
-    "gestae",
-    "gewgaw",
-    "gibber",
-    "gibbet",
-    "gibing",
-    "giblet",
-    "giggly",
-    "gigots",
-    "gigues",
-    "gilled",
-    "gimlet",
-    "gimped",
-    "ginned",
-    "girded",
-    "girths",
-    "girvan",
-    "gismos",
-    "glares",
-    "gleams",
-    "gleans",
-    "glebae",
-    "glibly",
-    "glints",
-    "gloats",
-    "glossa",
-    "glower",
-    "glumly",
-    "glutei",
-    "gnarls",
-    "gnawed",
-    "gnomic",
-    "gnomon",
-    "goaded",
-    "godson",
-    "gofers",
-    "goitre",
-    "golfed",
-    "goners",
-    "goodby",
-    "goofed",
-    "gooier",
-    "gooney",
-    "goosed",
-    "gooses",
-    "gorged",
-    "gorier",
-    "gouged",
-    "gouges",
-    "gowned",
-    "grabby",
-    "gradus",
-    "grails",
-    "gravid",
-    "grayer",
-    "grazer",
-    "grazes",
-    "grebes",
-    "greves",
-    "greyer",
-    "griffs",
-    "grimed",
-    "griped",
-    "grippe",
-    "groats",
-    "groins",
-    "gropes",
-    "grotty",
-    "grouts",
-    "grovel",
-    "groyne",
-    "grumps",
-    "guavas",
-    "guffaw",
-    "gulags",
-    "gulled",
-    "gumbos",
-    "gummed",
-    "gurgle",
-    "gushes",
-    "gusted",
-    "guying",
-    "guzzle",
-    "gypped",
-    "gyrate",
-    "gyring",
-    "habere",
-    "hables",
-    "hackie",
-    "hackle",
-    "hafnes",
-    "hafted",
-    "hailer",
-    "halals",
-    "haling",
-    "halite",
-    "halloo",
-    "haloes",
-    "halvah",
-    "hammed",
-    "hanker",
-    "hankie",
-    "hanses",
-    "harems",
-    "harked",
-    "harped",
-    "hasher",
-    "hassid",
-    "hatbox",
-    "hatpin",
-    "hatted",
-    "haughs",
-    "haunch",
-    "havers",
-    "hawing",
-    "hawked",
-    "hawser",
-    "hawses",
-    "haying",
-    "haymow",
-    "hazels",
-    "hazier",
-    "hazily",
-    "heaths",
-    "heaves",
-    "heckle",
-    "hedger",
-    "heehaw",
-    "heeler",
-    "hefted",
-    "hegira",
-    "heists",
-    "helots",
-    "henges",
-    "henrys",
-    "hereon",
-    "hewers",
-    "hewing",
-    "hexing",
-    "higler",
-    "hirers",
-    "hisses",
-    "hoaxed",
-    "hoaxer",
-    "hobnob",
-    "hoboes",
-    "hocked",
-    "hoeing",
-    "hogged",
-    "holing",
-    "holism",
-    "homier",
-    "hominy",
-    "honked",
-    "honker",
-    "honkie",
-    "hoofed",
-    "hoofer",
-    "hookey",
-    "hooped",
-    "hoopoe",
-    "hooted",
-    "hormuz",
-    "horrei",
-    "horsed",
-    "hosier",
-    "hotpot",
-    "hotted",
-    "hovels",
-    "howdah",
-    "hoyden",
-    "hoyman",
-    "hoymen",
-    "huffed",
-    "hulled",
-    "hullos",
-    "humeri",
-    "hummed",
-    "humors",
-    "humped",
-    "hunker",
-    "hurler",
-    "hurtle",
-    "hushes",
-    "husked",
-    "hussar",
-    "hydras",
-    "hymens",
-    "hymned",
-    "hyping",
-    "ibexes",
-    "ibidem",
-    "ibises",
-    "icemen",
-    "iciest",
-    "icings",
-    "ideate",
-    "idlers",
-    "idonea",
-    "idylls",
-    "iffier",
-    "igloos",
-    "ilexes",
-    "illtyd",
-    "imbeds",
-    "imbibe",
-    "imbrue",
-    "imbues",
-    "imidic",
-    "immure",
-    "impale",
-    "imparl",
-    "impels",
-    "impend",
-    "impish",
-    "impost",
-    "impugn",
-    "incept",
-    "incise",
-    "incubi",
-    "indite",
-    "infans",
-    "inhere",
-    "inhume",
-    "inkier",
-    "inmost",
-    "inroad",
-    "inrush",
-    "instil",
-    "insula",
-    "inters",
-    "intone",
-    "inuits",
-    "inured",
-    "inures",
-    "iodise",
-    "iodize",
-    "ionise",
-    "ionize",
-    "ireful",
-    "irking",
-    "irrupt",
-    "isobar",
-    "itched",
-    "itches",
-    "jabbed",
-    "jabots",
-    "jactus",
-    "jading",
-    "jailor",
-    "jalopy",
-    "jangle",
-    "japans",
-    "japers",
-    "japery",
-    "japing",
-    "jarful",
-    "jaunts",
-    "jawing",
-    "jazzed",
-    "jazzes",
-    "jeered",
-    "jejune",
-    "jennet",
-    "jerboa",
-    "jerkin",
-    "jested",
-    "jetsam",
-    "jewess",
-    "jibbed",
-    "jibing",
-    "jigged",
-    "jigger",
-    "jinxed",
-    "jinxes",
-    "jiving",
-    "jobbed",
-    "jocose",
-    "jocund",
-    "jogged",
-    "joggle",
-    "joshed",
-    "joshes",
-    "josses",
-    "jostle",
-    "jotted",
-    "jotter",
-    "jounce",
-    "jousts",
-    "judaea",
-    "judder",
-    "judice",
-    "jugful",
-    "jugged",
-    "jujube",
-    "juleps",
-    "jumbos",
-    "juncos",
-    "junked",
-    "juntas",
-    "juntos",
-    "jurats",
-    "jutted",
-    "kaftan",
-    "kayoed",
-    "kazoos",
-    "kebobs",
-    "keeled",
-    "keened",
-    "kernes",
-    "kibitz",
-    "kibosh",
-    "kidded",
-    "kintle",
-    "kipped",
-    "kitted",
-    "klatch",
-    "klaxon",
-    "kliegs",
-    "knaves",
-    "kneads",
-    "knells",
-    "knifed",
-    "knobby",
-    "knurls",
-    "kopeck",
-    "kowtow",
-    "kraals",
-    "krauts",
-    "krises",
-    "labium",
-    "lacers",
-    "laches",
-    "lacier",
-    "ladled",
-    "lagena",
-    "lagers",
-    "lagger",
-    "laical",
-    "laicus",
-    "lairds",
-    "lambed",
-    "lamely",
-    "lamest",
-    "laming",
-    "lammas",
-    "lammed",
-    "lanced",
-    "lankly",
-    "lapdog",
-    "lapels",
-    "lappet",
-    "larded",
-    "larked",
-    "lassos",
-    "lateen",
-    "latish",
-    "laving",
-    "lawmen",
-    "lazier",
-    "lazing",
-    "lealte",
-    "leaper",
-    "lecher",
-    "leered",
-    "legare",
-    "legate",
-    "lenity",
-    "lentos",
-    "lesing",
-    "lewder",
-    "lewdly",
-    "lianas",
-    "libber",
-    "libels",
-    "lieges",
-    "lienee",
-    "lienor",
-    "ligare",
-    "ligium",
-    "ligius",
-    "lilted",
-    "limbos",
-    "limeys",
-    "limine",
-    "limned",
-    "limner",
-    "limper",
-    "limpet",
-    "limpid",
-    "limply",
-    "lintel",
-    "lipoid",
-    "lisped",
-    "lisper",
-    "lissom",
-    "litchi",
-    "livens",
-    "loafed",
-    "lobbed",
-    "lobule",
-    "locoed",
-    "lofted",
-    "loiter",
-    "lolled",
-    "loners",
-    "loofah",
-    "loofas",
-    "looter",
-    "loping",
-    "lopped",
-    "lorded",
-    "lordly",
-    "lotted",
-    "loughs",
-    "loupes",
-    "loured",
-    "loused",
-    "louses",
-    "lovage",
-    "lowboy",
-    "lucked",
-    "luctus",
-    "lugged",
-    "lugger",
-    "lummox",
-    "lupins",
-    "lushes",
-    "lushly",
-    "lusted",
-    "lutist",
-    "lynxes",
-    "machos",
-    "macron",
-    "madams",
-    "maenad",
-    "magmas",
-    "maguey",
-    "mahout",
-    "malham",
-    "malian",
-    "mambas",
-    "mambos",
-    "mammas",
-    "manbot",
-    "manens",
-    "manful",
-    "mangos",
-    "manias",
-    "manioc",
-    "manses",
-    "mantas",
-    "mantic",
-    "maoism",
-    "maoris",
-    "maraca",
-    "maraud",
-    "mariti",
-    "marled",
-    "masers",
-    "maseru",
-    "mashes",
-    "mashie",
-    "masker",
-    "masted",
-    "maters",
-    "mateus",
-    "matima",
-    "matins",
-    "matzos",
-    "mauler",
-    "maundy",
-    "mauves",
-    "mavens",
-    "maybes",
-    "mayfly",
-    "mazola",
-    "meanly",
-    "mecums",
-    "medlar",
-    "megohm",
-    "megrim",
-    "melded",
-    "melees",
-    "membra",
-    "mender",
-    "mensae",
-    "mensal",
-    "menthe",
-    "mentis",
-    "meowed",
-    "mercat",
-    "merest",
-    "merles",
-    "merlon",
-    "mermen",
-    "mersea",
-    "meruit",
-    "mervin",
-    "mescal",
-    "meting",
-    "metope",
-    "mewing",
-    "mewled",
-    "mezzos",
-    "miaows",
-    "miasma",
-    "midges",
-    "midrib",
-    "milers",
-    "milord",
-    "milted",
-    "miming",
-    "mincer",
-    "minces",
-    "minify",
-    "minims",
-    "minxes",
-    "miring",
-    "miscue",
-    "misers",
-    "mislay",
-    "misted",
-    "miters",
-    "mitred",
-    "mitres",
-    "mitter",
-    "mizzen",
-    "moaner",
-    "mobbed",
-    "mocker",
-    "modish",
-    "moiled",
-    "molder",
-    "molted",
-    "monads",
-    "monism",
-    "monist",
-    "monody",
-    "mooing",
-    "mooned",
-    "moping",
-    "mopped",
-    "moppet",
-    "morays",
-    "morels",
-    "mornay",
-    "mortua",
-    "moseys",
-    "motets",
-    "mottle",
-    "mottos",
-    "mouldy",
-    "moults",
-    "moused",
-    "mouthy",
-    "mucked",
-    "muffed",
-    "muffle",
-    "muftis",
-    "mukluk",
-    "mulcts",
-    "mulier",
-    "mulish",
-    "munros",
-    "muskeg",
-    "mussed",
-    "musses",
-    "mutely",
-    "mutuum",
-    "nabobs",
-    "nacres",
-    "nadirs",
-    "naffed",
-    "nagged",
-    "nagger",
-    "naiads",
-    "naives",
-    "napery",
-    "napped",
-    "nasals",
-    "natter",
-    "navaho",
-    "navels",
-    "neaten",
-    "neater",
-    "neighs",
-    "nekton",
-    "nerved",
-    "nevern",
-    "nevoid",
-    "newels",
-    "niamey",
-    "nicety",
-    "niggle",
-    "nigrum",
-    "nimbly",
-    "nimmer",
-    "ninths",
-    "nitres",
-    "nitwit",
-    "nixing",
-    "nobble",
-    "nocent",
-    "noised",
-    "nomina",
-    "nontax",
-    "noosed",
-    "nooses",
-    "noshed",
-    "noshes",
-    "nosier",
-    "nosily",
-    "nosing",
-    "nougat",
-    "nowise",
-    "noxell",
-    "nubbin",
-    "nudges",
-    "nuking",
-    "numbed",
-    "numbly",
-    "nuncio",
-    "nutria",
-    "nuzzle",
-    "oafish",
-    "oaring",
-    "obiter",
-    "oblate",
-    "oboist",
-    "obvert",
-    "octant",
-    "octopi",
-    "offish",
-    "ogling",
-    "ogress",
-    "oilcan",
-    "oilier",
-    "oilman",
-    "oilmen",
-    "okapis",
-    "okayed",
-    "oldish",
-    "oleron",
-    "omegas",
-    "onrush",
-    "onsets",
-    "onside",
-    "onuses",
-    "onyxes",
-    "oohing",
-    "oozier",
-    "opuses",
-    "orated",
-    "orates",
-    "ordure",
-    "orison",
-    "ormolu",
-    "ornery",
-    "orrery",
-    "osbert",
-    "oscine",
-    "osiers",
-    "ossify",
-    "ostler",
-    "otiose",
-    "ouches",
-    "outdid",
-    "outfox",
-    "outgun",
-    "outlot",
-    "outran",
-    "ouzels",
-    "ovular",
-    "ovules",
-    "owelty",
-    "owlets",
-    "owlish",
-    "oxalic",
-    "oxalis",
-    "oxcart",
-    "oxeyes",
-    "oxlips",
-    "oxtail",
-    "pacare",
-    "paccar",
-    "pactio",
-    "pactis",
-    "paeans",
-    "palely",
-    "palest",
-    "paling",
-    "palled",
-    "pallor",
-    "palmed",
-    "palter",
-    "panful",
-    "papaws",
-    "paperh",
-    "paperw",
-    "papery",
-    "papist",
-    "parage",
-    "paraph",
-    "parium",
-    "parsec",
-    "partem",
-    "pashas",
-    "patois",
-    "paunch",
-    "pawing",
-    "pawned",
-    "pawnor",
-    "pawpaw",
-    "peahen",
-    "pealed",
-    "pebbly",
-    "pecked",
-    "pedlar",
-    "peeved",
-    "pekoes",
-    "pelage",
-    "pelota",
-    "pelted",
-    "pended",
-    "penmen",
-    "pennon",
-    "pentad",
-    "penult",
-    "penury",
-    "peplos",
-    "peplum",
-    "pepped",
-    "periit",
-    "perked",
-    "permed",
-    "pernod",
-    "persil",
-    "pertly",
-    "petard",
-    "petrii",
-    "petted",
-    "pewits",
-    "pewsey",
-    "phalli",
-    "phials",
-    "phooey",
-    "piacle",
-    "pickax",
-    "picots",
-    "picric",
-    "piddle",
-    "pietas",
-    "piffle",
-    "pigged",
-    "pigpen",
-    "pigsty",
-    "pilaff",
-    "pilafs",
-    "pilaus",
-    "pilfer",
-    "pilled",
-    "pimply",
-    "pincer",
-    "pinked",
-    "pintos",
-    "pipits",
-    "pipped",
-    "piques",
-    "pistil",
-    "pities",
-    "pitmen",
-    "pitons",
-    "placit",
-    "plaice",
-    "plaint",
-    "plaits",
-    "platys",
-    "plebes",
-    "plevin",
-    "plinks",
-    "plisse",
-    "plonks",
-    "plucks",
-    "plumbs",
-    "plumed",
-    "plummy",
-    "plumps",
-    "plunks",
-    "pocked",
-    "pogrom",
-    "poises",
-    "pokier",
-    "pokily",
-    "poleax",
-    "polies",
-    "polkas",
-    "pomade",
-    "pompon",
-    "ponces",
-    "ponere",
-    "pongee",
-    "pontes",
-    "popery",
-    "popish",
-    "poppet",
-    "portly",
-    "poseur",
-    "potage",
-    "pother",
-    "potior",
-    "potpie",
-    "pourer",
-    "pouted",
-    "pouter",
-    "prance",
-    "prangs",
-    "prated",
-    "prates",
-    "praxes",
-    "preens",
-    "premed",
-    "preter",
-    "pretia",
-    "preyed",
-    "priers",
-    "primly",
-    "primps",
-    "prised",
-    "proems",
-    "proles",
-    "prolix",
-    "provos",
-    "prowls",
-    "prudes",
-    "psychs",
-    "puisne",
-    "puling",
-    "pullet",
-    "pulped",
-    "pummel",
-    "puncta",
-    "punier",
-    "punned",
-    "punnet",
-    "punted",
-    "pupate",
-    "purdah",
-    "pureed",
-    "purees",
-    "purism",
-    "purled",
-    "purler",
-    "purply",
-    "purred",
-    "pursed",
-    "purvey",
-    "pusses",
-    "putout",
-    "putsch",
-    "putted",
-    "puttee",
-    "putura",
-    "quaere",
-    "quaffs",
-    "quahog",
-    "quails",
-    "quaked",
-    "quango",
-    "quater",
-    "quaver",
-    "quells",
-    "querns",
-    "quieti",
-    "quiets",
-    "quiffs",
-    "quinsy",
-    "quints",
-    "quires",
-    "quirts",
-    "quoins",
-    "quoits",
-    "quokka",
-    "rabbet",
-    "raceme",
-    "racier",
-    "rafted",
-    "ragbag",
-    "ragman",
-    "ragmen",
-    "ragout",
-    "ragtag",
-    "rajahs",
-    "rakish",
-    "ramify",
-    "ramose",
-    "ramous",
-    "ranker",
-    "rankle",
-    "rankly",
-    "ranted",
-    "ranter",
-    "rapine",
-    "raptly",
-    "rarefy",
-    "raring",
-    "rasher",
-    "rashly",
-    "rasing",
-    "rasped",
-    "rasure",
-    "ratite",
-    "ratted",
-    "ratter",
-    "ravels",
-    "ravish",
-    "rawest",
-    "raying",
-    "razing",
-    "razzed",
-    "razzes",
-    "realer",
-    "rearms",
-    "rebind",
-    "rebuff",
-    "rebury",
-    "rebuts",
-    "recant",
-    "recked",
-    "rectos",
-    "recuse",
-    "redact",
-    "redcap",
-    "redoes",
-    "redout",
-    "redrew",
-    "reedit",
-    "reefed",
-    "reeked",
-    "refits",
-    "refold",
-    "regale",
-    "regium",
-    "regnal",
-    "rehear",
-    "rehire",
-    "reined",
-    "rejigs",
-    "relent",
-    "reline",
-    "remise",
-    "remits",
-    "remold",
-    "remora",
-    "renege",
-    "rennet",
-    "rennin",
-    "renvoi",
-    "repast",
-    "repays",
-    "repine",
-    "repton",
-    "reship",
-    "resits",
-    "resole",
-    "retied",
-    "reties",
-    "retook",
-    "retool",
-    "reuses",
-    "revers",
-    "revest",
-    "revile",
-    "reword",
-    "rexene",
-    "rheumy",
-    "rhombi",
-    "rhymed",
-    "ribald",
-    "riband",
-    "ribaud",
-    "ricers",
-    "ricked",
-    "ridded",
-    "rifest",
-    "rifted",
-    "riling",
-    "riming",
-    "rioted",
-    "rioter",
-    "ripens",
-    "ripest",
-    "ripsaw",
-    "riving",
-    "robing",
-    "roding",
-    "roiled",
-    "romped",
-    "rondos",
-    "rooked",
-    "roomed",
-    "roomer",
-    "roosts",
-    "ropers",
-    "ropier",
-    "rosier",
-    "rosily",
-    "rosins",
-    "rostra",
-    "rotter",
-    "rotund",
-    "rouged",
-    "rouges",
-    "roughs",
-    "rouses",
-    "rousts",
-    "rowans",
-    "rowels",
-    "royton",
-    "ruanda",
-    "ruches",
-    "rucked",
-    "rudest",
-    "rueful",
-    "rueing",
-    "rugger",
-    "rumbas",
-    "rummer",
-    "rumple",
-    "runlet",
-    "runnel",
-    "rutted",
-    "sables",
-    "sabots",
-    "saccus",
-    "sachem",
-    "sacker",
-    "sadden",
-    "sagely",
-    "sagest",
-    "sagged",
-    "sahibs",
-    "sallow",
-    "salmis",
-    "salved",
-    "salver",
-    "salves",
-    "salvor",
-    "salvos",
-    "sambas",
-    "samosa",
-    "sampan",
-    "sanely",
-    "sanest",
-    "sansei",
-    "sapped",
-    "sapper",
-    "sashay",
-    "sassed",
-    "sasses",
-    "sating",
-    "satins",
-    "satiny",
-    "satrap",
-    "satyrs",
-    "sauced",
-    "savors",
-    "scabby",
-    "scalds",
-    "scalps",
-    "scamps",
-    "scants",
-    "scarps",
-    "scathe",
-    "scatty",
-    "schlep",
-    "schuss",
-    "schwas",
-    "scions",
-    "scites",
-    "sclera",
-    "scoffs",
-    "scolds",
-    "scoots",
-    "scoria",
-    "scorns",
-    "scoter",
-    "scours",
-    "scowls",
-    "scrams",
-    "scrimp",
-    "scrims",
-    "scrods",
-    "scrota",
-    "scrums",
-    "scubas",
-    "sculls",
-    "scurfy",
-    "seabee",
-    "seance",
-    "secant",
-    "seders",
-    "sedges",
-    "seemly",
-    "seethe",
-    "segued",
-    "segues",
-    "seined",
-    "seines",
-    "seised",
-    "seisin",
-    "seisms",
-    "seizin",
-    "semble",
-    "senage",
-    "sepias",
-    "sepses",
-    "septet",
-    "serape",
-    "serifs",
-    "serums",
-    "servus",
-    "sestet",
-    "setoff",
-    "shakos",
-    "shames",
-    "shammy",
-    "shamus",
-    "sheers",
-    "sheiks",
-    "shiest",
-    "shinny",
-    "shirks",
-    "shirrs",
-    "shirty",
-    "shoats",
-    "shojis",
-    "shooed",
-    "shoran",
-    "shored",
-    "shrews",
-    "shrive",
-    "shrove",
-    "shtick",
-    "shyest",
-    "shying",
-    "sibyls",
-    "siccus",
-    "sicken",
-    "sidled",
-    "sidles",
-    "sieges",
-    "sieved",
-    "sifter",
-    "silted",
-    "simony",
-    "simper",
-    "sinews",
-    "sinewy",
-    "singed",
-    "singes",
-    "sinter",
-    "sipper",
-    "siring",
-    "sitars",
-    "sixths",
-    "skalds",
-    "skiffs",
-    "skimps",
-    "skinks",
-    "skirls",
-    "skived",
-    "skiver",
-    "skives",
-    "skulks",
-    "skycap",
-    "slaked",
-    "slakes",
-    "slangs",
-    "slangy",
-    "slants",
-    "slaver",
-    "sleeks",
-    "sleets",
-    "sleety",
-    "sliest",
-    "slimed",
-    "slimes",
-    "slimly",
-    "slinks",
-    "sloops",
-    "sloths",
-    "sludgy",
-    "sluing",
-    "slurps",
-    "slushy",
-    "slyest",
-    "smarmy",
-    "smeary",
-    "smelts",
-    "smilax",
-    "smirch",
-    "smirks",
-    "smites",
-    "smocks",
-    "smoggy",
-    "smudgy",
-    "smugly",
-    "smutty",
-    "snaked",
-    "snared",
-    "snarls",
-    "sneers",
-    "snicks",
-    "sniffy",
-    "sniped",
-    "snippy",
-    "snivel",
-    "snobby",
-    "snoods",
-    "snoops",
-    "snored",
-    "snorer",
-    "snores",
-    "snorts",
-    "snouts",
-    "snuffs",
-    "soaped",
-    "soaves",
-    "sobers",
-    "socage",
-    "socked",
-    "sodded",
-    "sodden",
-    "softie",
-    "solidi",
-    "soling",
-    "soloed",
-    "sonans",
-    "sopped",
-    "sorbed",
-    "sorest",
-    "soughs",
-    "sourer",
-    "sourly",
-    "soused",
-    "souses",
-    "spaded",
-    "sparer",
-    "spates",
-    "sperms",
-    "spicks",
-    "spiels",
-    "spinet",
-    "spital",
-    "spited",
-    "spites",
-    "splays",
-    "sponte",
-    "spoors",
-    "sprats",
-    "sprees",
-    "sprits",
-    "spryer",
-    "spryly",
-    "spumes",
-    "spurns",
-    "squabs",
-    "squaws",
-    "squibs",
-    "staffa",
-    "stager",
-    "stagna",
-    "staled",
-    "staler",
-    "stales",
-    "stamen",
-    "stanch",
-    "standi",
-    "stante",
-    "stapes",
-    "stases",
-    "staved",
-    "steams",
-    "steeps",
-    "steles",
-    "stemma",
-    "stenos",
-    "sterns",
-    "stoats",
-    "stodgy",
-    "stoics",
-    "stolid",
-    "stoups",
-    "stouts",
-    "stowes",
-    "strafe",
-    "strews",
-    "stripy",
-    "strond",
-    "strops",
-    "strums",
-    "suable",
-    "subbed",
-    "suborn",
-    "succor",
-    "suckle",
-    "sulked",
-    "sulpha",
-    "sumacs",
-    "summum",
-    "sunned",
-    "supped",
-    "surtax",
-    "sussed",
-    "susses",
-    "sutler",
-    "suttee",
-    "swaged",
-    "swages",
-    "swains",
-    "swamis",
-    "swards",
-    "swathe",
-    "swaths",
-    "swazis",
-    "swills",
-    "swingy",
-    "swipes",
-    "swirly",
-    "swoons",
-    "swoops",
-    "sylphs",
-    "symond",
-    "synchs",
-    "synods",
-    "syrupy",
-    "tabard",
-    "tabors",
-    "tacite",
-    "taigas",
-    "taints",
-    "talcum",
-    "talweg",
-    "tamely",
-    "tamers",
-    "tamest",
-    "tamped",
-    "tangos",
-    "tanked",
-    "tapirs",
-    "tappet",
-    "taroks",
-    "tarots",
-    "tarsal",
-    "tartly",
-    "tatler",
-    "tatted",
-    "tatter",
-    "tattle",
-    "tauten",
-    "tauter",
-    "tautly",
-    "tawdry",
-    "tawney",
-    "taxied",
-    "taxies",
-    "taxmen",
-    "teasel",
-    "teeing",
-    "teemed",
-    "teensy",
-    "teethe",
-    "tencon",
-    "tenens",
-    "tenere",
-    "teneri",
-    "tenons",
-    "tenpin",
-    "tenser",
-    "tenter",
-    "tenuit",
-    "tepees",
-    "termor",
-    "terrae",
-    "terram",
-    "tertii",
-    "tetchy",
-    "tetrad",
-    "tetras",
-    "teuton",
-    "thanes",
-    "thecae",
-    "therms",
-    "thetas",
-    "thieve",
-    "throbs",
-    "throve",
-    "thrums",
-    "thwack",
-    "tibiae",
-    "tibias",
-    "tidied",
-    "tidier",
-    "tidies",
-    "tidily",
-    "tiding",
-    "tierce",
-    "tildes",
-    "tilers",
-    "timbal",
-    "tinges",
-    "tingly",
-    "tinier",
-    "tippee",
-    "tippet",
-    "tipple",
-    "tiptop",
-    "tirane",
-    "tisane",
-    "titbit",
-    "tithed",
-    "tither",
-    "titter",
-    "tocsin",
-    "toddle",
-    "toeing",
-    "togaed",
-    "togged",
-    "toiler",
-    "toller",
-    "tomtit",
-    "tondos",
-    "tooted",
-    "toothy",
-    "tootle",
-    "topers",
-    "toping",
-    "torahs",
-    "torero",
-    "torpid",
-    "torpor",
-    "torsos",
-    "tortes",
-    "tosher",
-    "tosser",
-    "tossup",
-    "totted",
-    "totter",
-    "toughs",
-    "tousle",
-    "towage",
-    "towhee",
-    "townie",
-    "toxify",
-    "trebly",
-    "trepan",
-    "triers",
-    "trilby",
-    "trills",
-    "trimly",
-    "trines",
-    "triors",
-    "triply",
-    "tripos",
-    "troche",
-    "tromps",
-    "troths",
-    "trouts",
-    "trover",
-    "troves",
-    "truces",
-    "trudge",
-    "trysts",
-    "tuareg",
-    "tudors",
-    "tulles",
-    "tumuli",
-    "turbot",
-    "turfed",
-    "turgid",
-    "turves",
-    "tusked",
-    "tussah",
-    "tutees",
-    "tutrix",
-    "tutted",
-    "twangs",
-    "twangy",
-    "tweeds",
-    "tweets",
-    "tweeze",
-    "twerps",
-    "twilit",
-    "twills",
-    "twined",
-    "twines",
-    "twinge",
-    "twirls",
-    "twirly",
-    "tyburn",
-    "typify",
-    "tythes",
-    "udders",
-    "ukases",
-    "ullage",
-    "umbrae",
-    "unawed",
-    "unbars",
-    "unbend",
-    "unbent",
-    "unbind",
-    "unbolt",
-    "uncaps",
-    "uncial",
-    "unclad",
-    "unclip",
-    "unclog",
-    "uncoil",
-    "uncork",
-    "uncurl",
-    "undock",
-    "undoes",
-    "unfelt",
-    "unfits",
-    "unfurl",
-    "unglue",
-    "unhand",
-    "unhook",
-    "uniate",
-    "uniats",
-    "univac",
-    "unlace",
-    "unlash",
-    "unmade",
-    "unmake",
-    "unmans",
-    "unpick",
-    "unpins",
-    "unques",
-    "unreel",
-    "unripe",
-    "unsays",
-    "unseal",
-    "unshed",
-    "unshod",
-    "unsnap",
-    "unstop",
-    "unthaw",
-    "unties",
-    "unwept",
-    "unwire",
-    "unyoke",
-    "unzips",
-    "upends",
-    "upmost",
-    "uppish",
-    "uremia",
-    "ursine",
-    "usance",
-    "usurer",
-    "usurps",
-    "utlage",
-    "uvulae",
-    "uvular",
-    "uvulas",
-    "uzbeks",
-    "vadium",
-    "vagary",
-    "vaguer",
-    "vainer",
-    "valets",
-    "valise",
-    "vamped",
-    "vaster",
-    "vaunts",
-    "velars",
-    "veldts",
-    "vended",
-    "vendue",
-    "venery",
-    "venial",
-    "venire",
-    "verbis",
-    "verbum",
-    "verged",
-    "verger",
-    "verism",
-    "verist",
-    "versos",
-    "vexari",
-    "vexata",
-    "viably",
-    "viands",
-    "vicars",
-    "victus",
-    "vicuna",
-    "vilely",
-    "vilest",
-    "vilify",
-    "vinous",
-    "vireos",
-    "viscid",
-    "visnes",
-    "vivary",
-    "vivify",
-    "vogues",
-    "voiles",
-    "volens",
-    "volute",
-    "vomits",
-    "votary",
-    "vulvas",
-    "wabble",
-    "wadded",
-    "wadset",
-    "wafted",
-    "wagged",
-    "waggle",
-    "waists",
-    "wakens",
-    "wangle",
-    "wanner",
-    "wapiti",
-    "warble",
-    "warded",
-    "warier",
-    "warley",
-    "warmen",
-    "warred",
-    "wavier",
-    "waylay",
-    "wedeln",
-    "weepie",
-    "weever",
-    "welkin",
-    "welled",
-    "welted",
-    "wended",
-    "whacks",
-    "whacky",
-    "whaled",
-    "wharfe",
-    "wharfs",
-    "wheezy",
-    "whelks",
-    "whelps",
-    "wherry",
-    "whiffs",
-    "whiled",
-    "whiner",
-    "whinge",
-    "whinny",
-    "whirls",
-    "whisks",
-    "whored",
-    "whorls",
-    "wifely",
-    "wigeon",
-    "wigwag",
-    "wilier",
-    "wimple",
-    "winces",
-    "windex",
-    "windup",
-    "winker",
-    "winnow",
-    "wirier",
-    "wising",
-    "wizens",
-    "wolfed",
-    "wonted",
-    "wooers",
-    "wowing",
-    "wracks",
-    "wreaks",
-    "wrests",
-    "wriest",
-    "wrings",
-    "writhe",
-    "wryest",
-    "xebecs",
-    "xmases",
-    "yammer",
-    "yapped",
-    "yardie",
-    "yawing",
-    "yawner",
-    "yeasty",
-    "yelped",
-    "yentas",
-    "yeomen",
-    "yipped",
-    "yodels",
-    "yokels",
-    "yoking",
-    "yowled",
-    "yuccas",
-    "zanier",
-    "zanies",
-    "zeugma",
-    "zinged",
-    "zither",
-    "zounds",
-]
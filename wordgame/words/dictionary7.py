@@ -1,12454 +0,0 @@
-WORDS = [
-    "contact",
-    "service",
-    "product",
-    "support",
-    "message",
-    "through",
-    "privacy",
-    "company",
-    "general",
-    "january",
-    "reviews",
-    "program",
-    "details",
-    "because",
-    "results",
-    "address",
-    "subject",
-    "between",
-    "special",
-    "project",
-    "version",
-    "section",
-    "related",
-    "members",
-    "network",
-    "systems",
-    "without",
-    "current",
-    "control",
-    "history",
-    "account",
-    "digital",
-    "profile",
-    "another",
-    "quality",
-    "listing",
-    "content",
-    "country",
-    "private",
-    "compare",
-    "include",
-    "college",
-    "article",
-    "provide",
-    "process",
-    "science",
-    "english",
-    "windows",
-    "gallery",
-    "however",
-    "october",
-    "library",
-    "medical",
-    "looking",
-    "comment",
-    "working",
-    "against",
-    "payment",
-    "student",
-    "problem",
-    "options",
-    "america",
-    "example",
-    "changes",
-    "release",
-    "request",
-    "picture",
-    "meeting",
-    "similar",
-    "schools",
-    "million",
-    "popular",
-    "stories",
-    "journal",
-    "reports",
-    "welcome",
-    "central",
-    "council",
-    "archive",
-    "society",
-    "friends",
-    "edition",
-    "further",
-    "updated",
-    "already",
-    "studies",
-    "several",
-    "display",
-    "limited",
-    "powered",
-    "natural",
-    "whether",
-    "weather",
-    "average",
-    "records",
-    "present",
-    "written",
-    "federal",
-    "hosting",
-    "tickets",
-    "finance",
-    "minutes",
-    "reading",
-    "usually",
-    "percent",
-    "getting",
-    "germany",
-    "various",
-    "receive",
-    "methods",
-    "chapter",
-    "manager",
-    "michael",
-    "florida",
-    "license",
-    "holiday",
-    "writing",
-    "effects",
-    "created",
-    "kingdom",
-    "thought",
-    "storage",
-    "summary",
-    "western",
-    "overall",
-    "package",
-    "players",
-    "started",
-    "someone",
-    "printer",
-    "believe",
-    "nothing",
-    "certain",
-    "running",
-    "jewelry",
-    "islands",
-    "british",
-    "sellers",
-    "tuesday",
-    "lesbian",
-    "machine",
-    "returns",
-    "capital",
-    "england",
-    "culture",
-    "courses",
-    "airport",
-    "foreign",
-    "outside",
-    "channel",
-    "located",
-    "primary",
-    "numbers",
-    "browser",
-    "purpose",
-    "feature",
-    "cameras",
-    "ratings",
-    "chicago",
-    "sources",
-    "regular",
-    "station",
-    "rentals",
-    "improve",
-    "parents",
-    "kitchen",
-    "wedding",
-    "disease",
-    "perfect",
-    "classic",
-    "command",
-    "william",
-    "express",
-    "success",
-    "maximum",
-    "warning",
-    "forward",
-    "flowers",
-    "animals",
-    "housing",
-    "traffic",
-    "ireland",
-    "testing",
-    "instead",
-    "leading",
-    "fitness",
-    "chinese",
-    "opinion",
-    "greater",
-    "develop",
-    "artists",
-    "session",
-    "century",
-    "pacific",
-    "mailing",
-    "vehicle",
-    "default",
-    "require",
-    "outdoor",
-    "morning",
-    "protein",
-    "partner",
-    "authors",
-    "faculty",
-    "parties",
-    "mission",
-    "richard",
-    "ability",
-    "battery",
-    "defined",
-    "playing",
-    "virtual",
-    "answers",
-    "offered",
-    "surface",
-    "minimum",
-    "variety",
-    "finally",
-    "updates",
-    "desktop",
-    "classes",
-    "officer",
-    "respect",
-    "unknown",
-    "teacher",
-    "workers",
-    "fucking",
-    "georgia",
-    "showing",
-    "benefit",
-    "funding",
-    "devices",
-    "fiction",
-    "watches",
-    "careers",
-    "complex",
-    "spanish",
-    "setting",
-    "economy",
-    "highest",
-    "helpful",
-    "monthly",
-    "musical",
-    "angeles",
-    "changed",
-    "russian",
-    "largest",
-    "african",
-    "justice",
-    "connect",
-    "applied",
-    "advance",
-    "auction",
-    "allowed",
-    "correct",
-    "charles",
-    "selling",
-    "species",
-    "pricing",
-    "fashion",
-    "monitor",
-    "trading",
-    "clients",
-    "actions",
-    "discuss",
-    "markets",
-    "leather",
-    "patient",
-    "perhaps",
-    "persons",
-    "village",
-    "amateur",
-    "factors",
-    "zealand",
-    "balance",
-    "replies",
-    "initial",
-    "fishing",
-    "fantasy",
-    "letters",
-    "context",
-    "install",
-    "apparel",
-    "johnson",
-    "quickly",
-    "dollars",
-    "driving",
-    "surgery",
-    "brought",
-    "himself",
-    "diamond",
-    "servers",
-    "seconds",
-    "arizona",
-    "keyword",
-    "italian",
-    "freedom",
-    "premium",
-    "upgrade",
-    "growing",
-    "hearing",
-    "eastern",
-    "therapy",
-    "entries",
-    "serious",
-    "bondage",
-    "efforts",
-    "nursing",
-    "defense",
-    "covered",
-    "protect",
-    "prevent",
-    "finding",
-    "affairs",
-    "towards",
-    "suggest",
-    "charges",
-    "reasons",
-    "talking",
-    "element",
-    "quarter",
-    "missing",
-    "houston",
-    "centers",
-    "opening",
-    "reserve",
-    "recipes",
-    "plastic",
-    "produce",
-    "counter",
-    "failure",
-    "follows",
-    "weekend",
-    "ontario",
-    "readers",
-    "jackson",
-    "leaders",
-    "posters",
-    "parking",
-    "seattle",
-    "brother",
-    "pattern",
-    "theatre",
-    "earlier",
-    "sponsor",
-    "indiana",
-    "objects",
-    "evening",
-    "nuclear",
-    "promote",
-    "appears",
-    "decided",
-    "designs",
-    "tourism",
-    "savings",
-    "graphic",
-    "binding",
-    "winning",
-    "atlanta",
-    "credits",
-    "clearly",
-    "enlarge",
-    "revenue",
-    "measure",
-    "flights",
-    "experts",
-    "vintage",
-    "exactly",
-    "explore",
-    "concept",
-    "reality",
-    "billion",
-    "nations",
-    "speaker",
-    "offices",
-    "managed",
-    "toronto",
-    "theater",
-    "springs",
-    "perform",
-    "healthy",
-    "drivers",
-    "figures",
-    "married",
-    "sharing",
-    "waiting",
-    "banking",
-    "conduct",
-    "calling",
-    "serving",
-    "matters",
-    "reduced",
-    "physics",
-    "extreme",
-    "samples",
-    "removed",
-    "singles",
-    "amounts",
-    "contain",
-    "crystal",
-    "academy",
-    "dynamic",
-    "regions",
-    "meaning",
-    "posting",
-    "instant",
-    "viewing",
-    "aspects",
-    "austria",
-    "utility",
-    "preview",
-    "despite",
-    "degrees",
-    "seeking",
-    "phoenix",
-    "comfort",
-    "smoking",
-    "becomes",
-    "alabama",
-    "achieve",
-    "carried",
-    "clothes",
-    "circuit",
-    "printed",
-    "removal",
-    "factory",
-    "revised",
-    "optical",
-    "amazing",
-    "feeling",
-    "bedroom",
-    "orlando",
-    "lawyers",
-    "advisor",
-    "remains",
-    "generic",
-    "transit",
-    "compact",
-    "keeping",
-    "attempt",
-    "matches",
-    "engines",
-    "stephen",
-    "climate",
-    "alcohol",
-    "walking",
-    "explain",
-    "smaller",
-    "modules",
-    "concern",
-    "holding",
-    "trouble",
-    "dealers",
-    "helping",
-    "totally",
-    "organic",
-    "leaving",
-    "cooking",
-    "respond",
-    "entered",
-    "belgium",
-    "highway",
-    "booking",
-    "portion",
-    "biology",
-    "ancient",
-    "leisure",
-    "learned",
-    "husband",
-    "britain",
-    "concert",
-    "adopted",
-    "carrier",
-    "reflect",
-    "deliver",
-    "lessons",
-    "treated",
-    "confirm",
-    "neither",
-    "offline",
-    "replace",
-    "reached",
-    "enabled",
-    "montana",
-    "enhance",
-    "adapter",
-    "laptops",
-    "editors",
-    "threads",
-    "supreme",
-    "weapons",
-    "episode",
-    "planned",
-    "antonio",
-    "charged",
-    "gourmet",
-    "orleans",
-    "prepare",
-    "illegal",
-    "lincoln",
-    "premier",
-    "consent",
-    "contest",
-    "chamber",
-    "typical",
-    "chicken",
-    "sending",
-    "tonight",
-    "formula",
-    "periods",
-    "attacks",
-    "resorts",
-    "biggest",
-    "visitor",
-    "gateway",
-    "drawing",
-    "ordered",
-    "happens",
-    "romance",
-    "focused",
-    "bargain",
-    "vermont",
-    "hunting",
-    "cutting",
-    "writers",
-    "mapping",
-    "indexed",
-    "cartoon",
-    "granted",
-    "choices",
-    "outlook",
-    "massive",
-    "denmark",
-    "poverty",
-    "patrick",
-    "mystery",
-    "journey",
-    "bidding",
-    "charter",
-    "barbara",
-    "reverse",
-    "deposit",
-    "seminar",
-    "specify",
-    "formats",
-    "depends",
-    "editing",
-    "notices",
-    "detroit",
-    "toshiba",
-    "airline",
-    "surveys",
-    "sitting",
-    "putting",
-    "vietnam",
-    "trailer",
-    "gardens",
-    "antique",
-    "willing",
-    "density",
-    "hundred",
-    "strange",
-    "breasts",
-    "mention",
-    "amended",
-    "operate",
-    "doctors",
-    "domains",
-    "siemens",
-    "capture",
-    "buffalo",
-    "camping",
-    "welfare",
-    "massage",
-    "closing",
-    "monster",
-    "columns",
-    "cookies",
-    "cruises",
-    "forever",
-    "captain",
-    "imagine",
-    "heating",
-    "scripts",
-    "dealing",
-    "liberal",
-    "matthew",
-    "hobbies",
-    "console",
-    "shipped",
-    "voltage",
-    "anthony",
-    "loading",
-    "ongoing",
-    "imaging",
-    "betting",
-    "liberty",
-    "wyoming",
-    "convert",
-    "analyst",
-    "finland",
-    "derived",
-    "postage",
-    "applies",
-    "casinos",
-    "filters",
-    "capable",
-    "douglas",
-    "elected",
-    "victory",
-    "madison",
-    "citizen",
-    "anytime",
-    "lecture",
-    "genetic",
-    "promise",
-    "cabinet",
-    "tiffany",
-    "collect",
-    "streets",
-    "turning",
-    "inquiry",
-    "checked",
-    "exhibit",
-    "visible",
-    "mercury",
-    "victims",
-    "burning",
-    "coupons",
-    "russell",
-    "obvious",
-    "passing",
-    "awarded",
-    "clinton",
-    "masters",
-    "alberta",
-    "commons",
-    "arrival",
-    "pottery",
-    "awesome",
-    "mexican",
-    "desired",
-    "assumes",
-    "heights",
-    "expense",
-    "venture",
-    "healing",
-    "studios",
-    "buttons",
-    "winners",
-    "rolling",
-    "arrived",
-    "creates",
-    "tourist",
-    "senator",
-    "lodging",
-    "stopped",
-    "closely",
-    "visited",
-    "targets",
-    "counsel",
-    "invited",
-    "farmers",
-    "queries",
-    "ukraine",
-    "absence",
-    "nearest",
-    "cluster",
-    "vendors",
-    "whereas",
-    "partial",
-    "couples",
-    "ranking",
-    "simpson",
-    "sublime",
-    "trusted",
-    "receipt",
-    "knowing",
-    "uniform",
-    "dancing",
-    "publish",
-    "pioneer",
-    "acrobat",
-    "thermal",
-    "telling",
-    "coastal",
-    "charity",
-    "hungary",
-    "segment",
-    "realize",
-    "insight",
-    "secrets",
-    "penalty",
-    "glasses",
-    "enables",
-    "builder",
-    "jessica",
-    "stewart",
-    "outcome",
-    "centres",
-    "charger",
-    "cooling",
-    "divorce",
-    "shopper",
-    "exposed",
-    "telecom",
-    "founded",
-    "chronic",
-    "trained",
-    "tobacco",
-    "roberts",
-    "pension",
-    "worship",
-    "herself",
-    "damages",
-    "diverse",
-    "passion",
-    "defence",
-    "patches",
-    "divided",
-    "insider",
-    "pleased",
-    "vitamin",
-    "genuine",
-    "raising",
-    "billing",
-    "combine",
-    "examine",
-    "bristol",
-    "sectors",
-    "grounds",
-    "regards",
-    "baskets",
-    "studied",
-    "profits",
-    "florist",
-    "funeral",
-    "enjoyed",
-    "charlie",
-    "nipples",
-    "francis",
-    "noticed",
-    "signals",
-    "symbols",
-    "packard",
-    "holders",
-    "swedish",
-    "witness",
-    "collins",
-    "gadgets",
-    "glasgow",
-    "impacts",
-    "induced",
-    "linking",
-    "appeals",
-    "illness",
-    "islamic",
-    "pending",
-    "lebanon",
-    "kennedy",
-    "teenage",
-    "vincent",
-    "secured",
-    "unusual",
-    "routine",
-    "toolbar",
-    "wearing",
-    "mounted",
-    "habitat",
-    "scanner",
-    "integer",
-    "engaged",
-    "falling",
-    "dropped",
-    "besides",
-    "moments",
-    "strings",
-    "torture",
-    "deleted",
-    "antenna",
-    "assumed",
-    "killing",
-    "memphis",
-    "harvard",
-    "brokers",
-    "seasons",
-    "pissing",
-    "suppose",
-    "involve",
-    "younger",
-    "rapidly",
-    "fisting",
-    "outline",
-    "holland",
-    "demands",
-    "careful",
-    "tracked",
-    "minimal",
-    "lottery",
-    "licence",
-    "romania",
-    "consult",
-    "greatly",
-    "cycling",
-    "turkish",
-    "pentium",
-    "quantum",
-    "largely",
-    "pointer",
-    "stretch",
-    "permits",
-    "cleaner",
-    "cricket",
-    "feeding",
-    "olympic",
-    "customs",
-    "rainbow",
-    "decline",
-    "israeli",
-    "hewlett",
-    "proceed",
-    "jamaica",
-    "founder",
-    "dispute",
-    "adverse",
-    "excerpt",
-    "perfume",
-    "restore",
-    "creator",
-    "museums",
-    "tracker",
-    "passage",
-    "headset",
-    "oakland",
-    "suicide",
-    "logical",
-    "extract",
-    "payable",
-    "retired",
-    "remarks",
-    "decades",
-    "arising",
-    "railway",
-    "pointed",
-    "causing",
-    "mistake",
-    "mineral",
-    "fortune",
-    "claimed",
-    "screens",
-    "planner",
-    "croatia",
-    "stadium",
-    "edwards",
-    "costume",
-    "norfolk",
-    "painted",
-    "artwork",
-    "ethical",
-    "schemes",
-    "neutral",
-    "bedding",
-    "joining",
-    "heading",
-    "equally",
-    "bearing",
-    "seniors",
-    "violent",
-    "cottage",
-    "anymore",
-    "locator",
-    "resolve",
-    "melissa",
-    "nigeria",
-    "ceiling",
-    "anybody",
-    "singing",
-    "optimal",
-    "sucking",
-    "reuters",
-    "manuals",
-    "watched",
-    "thereof",
-    "ranging",
-    "repairs",
-    "hanging",
-    "colored",
-    "routing",
-    "stanley",
-    "elegant",
-    "renewal",
-    "opposed",
-    "scoring",
-    "panties",
-    "sisters",
-    "critics",
-    "madonna",
-    "soldier",
-    "mirrors",
-    "assault",
-    "bowling",
-    "solving",
-    "deviant",
-    "imports",
-    "suspect",
-    "crucial",
-    "tuition",
-    "threats",
-    "puzzles",
-    "damaged",
-    "destroy",
-    "olympus",
-    "starter",
-    "luggage",
-    "stylish",
-    "grocery",
-    "kenneth",
-    "jackets",
-    "excited",
-    "recover",
-    "delayed",
-    "exclude",
-    "anxiety",
-    "spatial",
-    "ceramic",
-    "fingers",
-    "raleigh",
-    "qualify",
-    "diagram",
-    "beijing",
-    "peoples",
-    "advised",
-    "calgary",
-    "interim",
-    "approve",
-    "calcium",
-    "newport",
-    "indians",
-    "harvest",
-    "locally",
-    "mothers",
-    "iceland",
-    "candles",
-    "sailing",
-    "morocco",
-    "refused",
-    "ecology",
-    "silicon",
-    "compete",
-    "beatles",
-    "thomson",
-    "seating",
-    "exports",
-    "heather",
-    "warrant",
-    "solaris",
-    "royalty",
-    "somehow",
-    "laundry",
-    "solomon",
-    "placing",
-    "filling",
-    "imposed",
-    "silence",
-    "focuses",
-    "trainer",
-    "volumes",
-    "implied",
-    "packing",
-    "statute",
-    "satisfy",
-    "shelter",
-    "bahamas",
-    "mixture",
-    "logging",
-    "hampton",
-    "borders",
-    "nursery",
-    "staying",
-    "estonia",
-    "veteran",
-    "streams",
-    "landing",
-    "signing",
-    "namibia",
-    "prairie",
-    "reunion",
-    "ecuador",
-    "spirits",
-    "acquire",
-    "tribune",
-    "viruses",
-    "cheaper",
-    "leasing",
-    "beliefs",
-    "analyze",
-    "forests",
-    "invalid",
-    "martial",
-    "colours",
-    "execute",
-    "patents",
-    "accused",
-    "defines",
-    "packets",
-    "trigger",
-    "beaches",
-    "folders",
-    "pendant",
-    "dresses",
-    "baptist",
-    "females",
-    "wallace",
-    "cuisine",
-    "theorem",
-    "topless",
-    "radical",
-    "elderly",
-    "bolivia",
-    "hottest",
-    "stevens",
-    "alleged",
-    "compile",
-    "webster",
-    "curious",
-    "freight",
-    "eclipse",
-    "shuttle",
-    "affects",
-    "fastest",
-    "injured",
-    "payroll",
-    "courier",
-    "tribute",
-    "genesis",
-    "barrier",
-    "bicycle",
-    "letting",
-    "thereby",
-    "bottles",
-    "bangkok",
-    "jeffrey",
-    "survive",
-    "clinics",
-    "offense",
-    "protest",
-    "washing",
-    "enquiry",
-    "closure",
-    "intense",
-    "showers",
-    "sensors",
-    "heavily",
-    "headers",
-    "devoted",
-    "hormone",
-    "timothy",
-    "bridges",
-    "casting",
-    "shortly",
-    "cameron",
-    "warrior",
-    "diploma",
-    "copying",
-    "grammar",
-    "gregory",
-    "boolean",
-    "chances",
-    "bizarre",
-    "kissing",
-    "reduces",
-    "capitol",
-    "nervous",
-    "extends",
-    "replica",
-    "trinity",
-    "handled",
-    "legends",
-    "exhaust",
-    "farming",
-    "handles",
-    "skilled",
-    "harmony",
-    "windsor",
-    "escorts",
-    "coaches",
-    "vessels",
-    "harbour",
-    "arrange",
-    "unified",
-    "ignored",
-    "precise",
-    "invoice",
-    "forming",
-    "embassy",
-    "rebecca",
-    "amongst",
-    "horizon",
-    "toolbox",
-    "surfing",
-    "attract",
-    "disable",
-    "succeed",
-    "leonard",
-    "lending",
-    "raymond",
-    "midwest",
-    "observe",
-    "bermuda",
-    "mobiles",
-    "terrace",
-    "replied",
-    "seafood",
-    "playboy",
-    "durable",
-    "spencer",
-    "wichita",
-    "uruguay",
-    "tablets",
-    "futures",
-    "wanting",
-    "custody",
-    "scratch",
-    "beverly",
-    "bernard",
-    "fujitsu",
-    "rewards",
-    "beneath",
-    "seventh",
-    "soonest",
-    "lenders",
-    "fitting",
-    "surplus",
-    "gravity",
-    "guitars",
-    "essence",
-    "chester",
-    "stomach",
-    "anatomy",
-    "defects",
-    "clarity",
-    "settled",
-    "folding",
-    "airfare",
-    "vaccine",
-    "implies",
-    "tension",
-    "eternal",
-    "bennett",
-    "armenia",
-    "closest",
-    "actress",
-    "dietary",
-    "marilyn",
-    "matched",
-    "carroll",
-    "warming",
-    "finnish",
-    "muslims",
-    "footage",
-    "reveals",
-    "carries",
-    "tunisia",
-    "bahrain",
-    "consist",
-    "naughty",
-    "hazards",
-    "insured",
-    "algebra",
-    "shadows",
-    "sunrise",
-    "belongs",
-    "readily",
-    "ensures",
-    "lindsay",
-    "legally",
-    "briefly",
-    "fighter",
-    "retreat",
-    "adapted",
-    "estates",
-    "borough",
-    "failing",
-    "andrews",
-    "modular",
-    "brandon",
-    "balloon",
-    "winston",
-    "porsche",
-    "hopkins",
-    "infants",
-    "revenge",
-    "expires",
-    "enemies",
-    "accepts",
-    "roughly",
-    "sticker",
-    "deserve",
-    "worried",
-    "garbage",
-    "phrases",
-    "chelsea",
-    "reaches",
-    "quizzes",
-    "planets",
-    "deficit",
-    "boulder",
-    "coupled",
-    "texture",
-    "antigua",
-    "thunder",
-    "caution",
-    "pirates",
-    "origins",
-    "textile",
-    "indexes",
-    "licking",
-    "markers",
-    "weights",
-    "albania",
-    "lasting",
-    "surname",
-    "evident",
-    "allergy",
-    "twisted",
-    "algeria",
-    "blessed",
-    "cardiff",
-    "reforms",
-    "lawsuit",
-    "banners",
-    "circles",
-    "passive",
-    "courage",
-    "gazette",
-    "hitachi",
-    "coleman",
-    "anaheim",
-    "knights",
-    "altered",
-    "pontiac",
-    "propose",
-    "lighter",
-    "tactics",
-    "shorter",
-    "relying",
-    "refined",
-    "fifteen",
-    "predict",
-    "acrylic",
-    "shannon",
-    "toddler",
-    "blocked",
-    "strikes",
-    "dressed",
-    "belfast",
-    "niagara",
-    "prepaid",
-    "varying",
-    "trustee",
-    "tsunami",
-    "scholar",
-    "geology",
-    "coating",
-    "cleared",
-    "boating",
-    "corners",
-    "broader",
-    "hitting",
-    "aquatic",
-    "gilbert",
-    "ferrari",
-    "outputs",
-    "insulin",
-    "assured",
-    "ambient",
-    "utilize",
-    "mileage",
-    "adaptor",
-    "hyundai",
-    "vampire",
-    "relates",
-    "framing",
-    "picking",
-    "pockets",
-    "inquire",
-    "realtor",
-    "chassis",
-    "pushing",
-    "prefers",
-    "bedford",
-    "mustang",
-    "emerald",
-    "abraham",
-    "hostels",
-    "senegal",
-    "muscles",
-    "wrapped",
-    "runtime",
-    "distant",
-    "decimal",
-    "penguin",
-    "magical",
-    "miracle",
-    "reprint",
-    "hamburg",
-    "fathers",
-    "terrain",
-    "rangers",
-    "labeled",
-    "marking",
-    "sheriff",
-    "griffin",
-    "preston",
-    "longest",
-    "nirvana",
-    "destiny",
-    "madness",
-    "blowing",
-    "cardiac",
-    "vatican",
-    "seekers",
-    "numeric",
-    "skating",
-    "emperor",
-    "rebates",
-    "proudly",
-    "pulling",
-    "obesity",
-    "touring",
-    "andorra",
-    "expired",
-    "travels",
-    "delight",
-    "counted",
-    "declare",
-    "teaches",
-    "tragedy",
-    "painful",
-    "prayers",
-    "nowhere",
-    "rebound",
-    "baghdad",
-    "concord",
-    "liberia",
-    "sherman",
-    "workout",
-    "stating",
-    "triumph",
-    "welding",
-    "locking",
-    "blanket",
-    "elliott",
-    "justify",
-    "possess",
-    "vanilla",
-    "pursuit",
-    "backing",
-    "endless",
-    "figured",
-    "pressed",
-    "scanned",
-    "surgeon",
-    "missile",
-    "deborah",
-    "assists",
-    "gabriel",
-    "auditor",
-    "prophet",
-    "bracket",
-    "harmful",
-    "glucose",
-    "phantom",
-    "persian",
-    "grenada",
-    "earning",
-    "mailman",
-    "somalia",
-    "novelty",
-    "budgets",
-    "toolkit",
-    "erotica",
-    "viewers",
-    "resumes",
-    "existed",
-    "optimum",
-    "refresh",
-    "stripes",
-    "expects",
-    "jumping",
-    "fabrics",
-    "polymer",
-    "hygiene",
-    "poultry",
-    "bouquet",
-    "mandate",
-    "indices",
-    "halifax",
-    "donated",
-    "stuffed",
-    "insects",
-    "cleanup",
-    "compute",
-    "redhead",
-    "arrives",
-    "tractor",
-    "touched",
-    "cologne",
-    "wishing",
-    "outlets",
-    "lesotho",
-    "notable",
-    "warfare",
-    "sorting",
-    "liaison",
-    "sandals",
-    "clarify",
-    "fatigue",
-    "patriot",
-    "exceeds",
-    "battles",
-    "traders",
-    "carlton",
-    "dragons",
-    "burundi",
-    "grading",
-    "tenants",
-    "crossed",
-    "nominal",
-    "herbert",
-    "vanuatu",
-    "hackers",
-    "granite",
-    "athlete",
-    "enforce",
-    "adviser",
-    "booklet",
-    "suburbs",
-    "imagery",
-    "useless",
-    "manages",
-    "erosion",
-    "oceania",
-    "handbag",
-    "exploit",
-    "clipart",
-    "pathway",
-    "shallow",
-    "jacques",
-    "spectra",
-    "lifting",
-    "curtain",
-    "mailbox",
-    "imprint",
-    "natalie",
-    "shirley",
-    "goodbye",
-    "emerged",
-    "goddess",
-    "magnets",
-    "chapman",
-    "loyalty",
-    "beloved",
-    "beating",
-    "offence",
-    "expands",
-    "lithium",
-    "facials",
-    "airways",
-    "banquet",
-    "caravan",
-    "harness",
-    "yankees",
-    "dorothy",
-    "freeman",
-    "puppies",
-    "emotion",
-    "wounded",
-    "clayton",
-    "suffolk",
-    "educate",
-    "baldwin",
-    "enacted",
-    "iranian",
-    "fulfill",
-    "gaining",
-    "therein",
-    "bentley",
-    "dentist",
-    "crafted",
-    "burkina",
-    "eritrea",
-    "strains",
-    "tanning",
-    "lacking",
-    "sensing",
-    "cowboys",
-    "malcolm",
-    "norwich",
-    "relaxed",
-    "pearson",
-    "handler",
-    "decides",
-    "caption",
-    "compass",
-    "evolved",
-    "augusta",
-    "rebuild",
-    "shelves",
-    "cleaned",
-    "honored",
-    "frances",
-    "diaries",
-    "dolphin",
-    "wonders",
-    "lateral",
-    "sanders",
-    "refunds",
-    "debates",
-    "booster",
-    "taxable",
-    "malaria",
-    "torrent",
-    "odyssey",
-    "freezer",
-    "embrace",
-    "whitney",
-    "buddies",
-    "hunters",
-    "allison",
-    "crashes",
-    "hotline",
-    "servant",
-    "jointly",
-    "avoided",
-    "terrier",
-    "renewed",
-    "variant",
-    "squares",
-    "voucher",
-    "margins",
-    "commits",
-    "recruit",
-    "bidders",
-    "wherein",
-    "dessert",
-    "tissues",
-    "jakarta",
-    "cynthia",
-    "carolyn",
-    "scooter",
-    "desires",
-    "psychic",
-    "visions",
-    "topical",
-    "cocaine",
-    "omitted",
-    "parkway",
-    "scandal",
-    "dangers",
-    "bonuses",
-    "timeout",
-    "repeats",
-    "fairfax",
-    "warwick",
-    "restart",
-    "rounded",
-    "dioxide",
-    "roofing",
-    "elastic",
-    "recalls",
-    "renting",
-    "balcony",
-    "neglect",
-    "jerseys",
-    "refugee",
-    "stained",
-    "marital",
-    "slavery",
-    "flowing",
-    "sustain",
-    "lengths",
-    "quartet",
-    "conform",
-    "helmets",
-    "vacancy",
-    "painter",
-    "leagues",
-    "monkeys",
-    "easiest",
-    "denotes",
-    "vectors",
-    "stepped",
-    "issuing",
-    "heaters",
-    "accents",
-    "colonel",
-    "hoffman",
-    "nightly",
-    "filings",
-    "forcing",
-    "meadows",
-    "dignity",
-    "barbuda",
-    "sliding",
-    "fellows",
-    "perkins",
-    "ideally",
-    "dancers",
-    "handset",
-    "maxwell",
-    "oblique",
-    "singers",
-    "mansion",
-    "arsenal",
-    "pyramid",
-    "hacking",
-    "keynote",
-    "planted",
-    "jenkins",
-    "spotted",
-    "coconut",
-    "removes",
-    "pillows",
-    "portals",
-    "whoever",
-    "mankind",
-    "upright",
-    "shocked",
-    "renault",
-    "comoros",
-    "breathe",
-    "smiling",
-    "samurai",
-    "lightly",
-    "runners",
-    "talents",
-    "newborn",
-    "laughed",
-    "emerson",
-    "orchard",
-    "bombing",
-    "metrics",
-    "vaginal",
-    "wheeler",
-    "enzymes",
-    "jacuzzi",
-    "beavers",
-    "styling",
-    "quietly",
-    "scenery",
-    "peugeot",
-    "learner",
-    "swallow",
-    "marines",
-    "trilogy",
-    "maurice",
-    "suzanne",
-    "jupiter",
-    "chopped",
-    "randall",
-    "sleeves",
-    "vibrant",
-    "sweater",
-    "burners",
-    "reminds",
-    "corrupt",
-    "drought",
-    "symptom",
-    "scaling",
-    "thyroid",
-    "wizards",
-    "storing",
-    "staples",
-    "blondes",
-    "literal",
-    "guiding",
-    "overlap",
-    "cruiser",
-    "cascade",
-    "endorse",
-    "strokes",
-    "nucleus",
-    "spokane",
-    "brigade",
-    "movable",
-    "doubles",
-    "appoint",
-    "hostile",
-    "trapped",
-    "tattoos",
-    "peptide",
-    "regents",
-    "darling",
-    "everett",
-    "clutter",
-    "whereby",
-    "belgian",
-    "simpler",
-    "hancock",
-    "mammals",
-    "cloning",
-    "peppers",
-    "alright",
-    "aligned",
-    "shuffle",
-    "bladder",
-    "shooter",
-    "shields",
-    "inserts",
-    "tasting",
-    "branded",
-    "manning",
-    "shining",
-    "voyager",
-    "sampler",
-    "checker",
-    "fischer",
-    "shaping",
-    "inspire",
-    "pumping",
-    "revival",
-    "regency",
-    "midland",
-    "invites",
-    "cushion",
-    "panther",
-    "goodman",
-    "reactor",
-    "trumpet",
-    "neurons",
-    "crimson",
-    "needing",
-    "trivial",
-    "clauses",
-    "remover",
-    "proving",
-    "encoded",
-    "hammond",
-    "uranium",
-    "honours",
-    "antigen",
-    "refusal",
-    "secular",
-    "majesty",
-    "fishery",
-    "pumpkin",
-    "notably",
-    "intends",
-    "garment",
-    "grandma",
-    "bundles",
-    "garrett",
-    "priests",
-    "fencing",
-    "violate",
-    "realise",
-    "vanessa",
-    "stealth",
-    "concise",
-    "handful",
-    "motions",
-    "shampoo",
-    "quoting",
-    "dynasty",
-    "raiders",
-    "spreads",
-    "sensory",
-    "dummies",
-    "roundup",
-    "memoirs",
-    "forgive",
-    "almanac",
-    "polling",
-    "tibetan",
-    "selects",
-    "haunted",
-    "adverts",
-    "olympia",
-    "unclear",
-    "wealthy",
-    "feather",
-    "sixteen",
-    "tightly",
-    "brushes",
-    "capsule",
-    "suspend",
-    "michele",
-    "daytime",
-    "contour",
-    "descent",
-    "analyse",
-    "shutter",
-    "residue",
-    "goodies",
-    "inspect",
-    "babylon",
-    "musings",
-    "layouts",
-    "titanic",
-    "judging",
-    "kicking",
-    "happily",
-    "pretend",
-    "amnesty",
-    "needles",
-    "chooses",
-    "tuscany",
-    "crowded",
-    "turbine",
-    "addison",
-    "varsity",
-    "insurer",
-    "hanover",
-    "inverse",
-    "clifton",
-    "verdict",
-    "nominee",
-    "christi",
-    "incubus",
-    "impulse",
-    "testers",
-    "getaway",
-    "sockets",
-    "ashland",
-    "abusive",
-    "garland",
-    "riviera",
-    "obscure",
-    "glamour",
-    "trolley",
-    "frankly",
-    "linkage",
-    "chateau",
-    "changer",
-    "cypress",
-    "uploads",
-    "gallons",
-    "urinary",
-    "premise",
-    "condoms",
-    "lattice",
-    "asphalt",
-    "flavors",
-    "dilemma",
-    "shifted",
-    "placebo",
-    "probing",
-    "seagate",
-    "solvent",
-    "spacing",
-    "mergers",
-    "certify",
-    "arguing",
-    "summers",
-    "wetland",
-    "consume",
-    "volcano",
-    "fremont",
-    "someday",
-    "sounded",
-    "honesty",
-    "killers",
-    "stellar",
-    "pussies",
-    "bullets",
-    "probate",
-    "incense",
-    "seismic",
-    "smokers",
-    "glacier",
-    "gigabit",
-    "relieve",
-    "clarion",
-    "squeeze",
-    "hillary",
-    "factual",
-    "shaking",
-    "valerie",
-    "lobster",
-    "judaism",
-    "preteen",
-    "bonding",
-    "crosses",
-    "furnace",
-    "doubled",
-    "rabbits",
-    "anxious",
-    "tariffs",
-    "baptism",
-    "cutlery",
-    "differs",
-    "brewing",
-    "blossom",
-    "lowered",
-    "prisons",
-    "grabbed",
-    "rocking",
-    "employs",
-    "bubbles",
-    "pitcher",
-    "standby",
-    "wallets",
-    "ethanol",
-    "worries",
-    "rejects",
-    "referee",
-    "swinger",
-    "broadly",
-    "parsons",
-    "bounded",
-    "touches",
-    "pursued",
-    "biomass",
-    "lesions",
-    "sausage",
-    "melanie",
-    "juniors",
-    "rockets",
-    "seymour",
-    "milford",
-    "asshole",
-    "sundays",
-    "admiral",
-    "padding",
-    "popcorn",
-    "cracked",
-    "archery",
-    "refuses",
-    "sabbath",
-    "escaped",
-    "hospice",
-    "brushed",
-    "annuity",
-    "tracing",
-    "incomes",
-    "fragile",
-    "sapiens",
-    "serbian",
-    "rushing",
-    "trainee",
-    "scarlet",
-    "crushed",
-    "statues",
-    "latency",
-    "subsidy",
-    "growers",
-    "roasted",
-    "tenders",
-    "mustard",
-    "praying",
-    "shaving",
-    "bishops",
-    "ribbons",
-    "cashier",
-    "kathryn",
-    "blender",
-    "blaster",
-    "wasting",
-    "decoder",
-    "glitter",
-    "overlay",
-    "bitches",
-    "resting",
-    "carpets",
-    "brendan",
-    "grouped",
-    "boiling",
-    "parsing",
-    "abandon",
-    "cinemas",
-    "encoder",
-    "bathing",
-    "lambert",
-    "goggles",
-    "unhappy",
-    "jukebox",
-    "cancers",
-    "melting",
-    "harriet",
-    "decatur",
-    "wrapper",
-    "drummer",
-    "lengthy",
-    "agendas",
-    "bipolar",
-    "inbound",
-    "regimes",
-    "invoked",
-    "utterly",
-    "claudia",
-    "kinetic",
-    "glimpse",
-    "quicker",
-    "smarter",
-    "calorie",
-    "farther",
-    "dungeon",
-    "germans",
-    "kashmir",
-    "skyline",
-    "barrels",
-    "cabling",
-    "playoff",
-    "payload",
-    "merrill",
-    "grilled",
-    "enquire",
-    "toilets",
-    "hubbard",
-    "rewrite",
-    "vending",
-    "chasing",
-    "janeiro",
-    "shelley",
-    "batting",
-    "cumbria",
-    "winding",
-    "synergy",
-    "doughty",
-    "fixture",
-    "salvage",
-    "orbital",
-    "empires",
-    "undergo",
-    "blended",
-    "digging",
-    "lantern",
-    "catches",
-    "kidding",
-    "swansea",
-    "airmail",
-    "staring",
-    "seventy",
-    "chatham",
-    "whistle",
-    "sulfate",
-    "dresden",
-    "fortran",
-    "spouses",
-    "arabian",
-    "bending",
-    "denying",
-    "recycle",
-    "furnish",
-    "rubbish",
-    "knocked",
-    "tornado",
-    "turtles",
-    "hickory",
-    "inmates",
-    "rebuilt",
-    "striped",
-    "higgins",
-    "whitman",
-    "surfers",
-    "monarch",
-    "costing",
-    "paradox",
-    "jackpot",
-    "halfway",
-    "miranda",
-    "neutron",
-    "directs",
-    "resides",
-    "wording",
-    "obliged",
-    "rockies",
-    "redwood",
-    "thereto",
-    "radiant",
-    "virgins",
-    "firstly",
-    "martini",
-    "bastard",
-    "coaster",
-    "trenton",
-    "grazing",
-    "seaside",
-    "renamed",
-    "soluble",
-    "hardest",
-    "freeway",
-    "patrons",
-    "redmond",
-    "bankers",
-    "rutgers",
-    "sampled",
-    "sincere",
-    "broncos",
-    "sharply",
-    "granada",
-    "vinegar",
-    "rafting",
-    "safaris",
-    "preface",
-    "pencils",
-    "caching",
-    "eleanor",
-    "castles",
-    "notions",
-    "plateau",
-    "palette",
-    "onboard",
-    "robbery",
-    "nucleic",
-    "jasmine",
-    "crochet",
-    "stamped",
-    "dismiss",
-    "maureen",
-    "presses",
-    "amusing",
-    "retains",
-    "docking",
-    "chimney",
-    "packers",
-    "carving",
-    "slipped",
-    "realism",
-    "bologna",
-    "implant",
-    "buffers",
-    "masonry",
-    "accrued",
-    "temples",
-    "indoors",
-    "staging",
-    "spiders",
-    "diluted",
-    "brewery",
-    "lineage",
-    "vaughan",
-    "sealing",
-    "despair",
-    "dumping",
-    "magenta",
-    "tagging",
-    "prelude",
-    "drafted",
-    "layered",
-    "copiers",
-    "ovarian",
-    "plenary",
-    "suffers",
-    "midtown",
-    "immense",
-    "seizure",
-    "wrought",
-    "theresa",
-    "captive",
-    "baggage",
-    "vikings",
-    "vicious",
-    "hayward",
-    "liquids",
-    "osborne",
-    "migrant",
-    "leaning",
-    "watkins",
-    "benches",
-    "foolish",
-    "compose",
-    "clearer",
-    "modeled",
-    "diocese",
-    "thistle",
-    "aspirin",
-    "gatwick",
-    "dispose",
-    "falcons",
-    "crashed",
-    "urgency",
-    "flashes",
-    "angular",
-    "grinder",
-    "conquer",
-    "filming",
-    "impress",
-    "eminent",
-    "cheques",
-    "aliases",
-    "screwed",
-    "ballots",
-    "testify",
-    "boycott",
-    "genital",
-    "analogy",
-    "kristen",
-    "winters",
-    "orgasms",
-    "butcher",
-    "cabbage",
-    "arrests",
-    "breaker",
-    "collage",
-    "jealous",
-    "rhythms",
-    "shotgun",
-    "langley",
-    "unaware",
-    "scented",
-    "sandbox",
-    "gesture",
-    "cutters",
-    "merging",
-    "plaques",
-    "breadth",
-    "mammoth",
-    "innings",
-    "parcels",
-    "manners",
-    "thieves",
-    "pelican",
-    "cousins",
-    "dodgers",
-    "textual",
-    "spindle",
-    "heavens",
-    "mondays",
-    "couture",
-    "foliage",
-    "backups",
-    "sheldon",
-    "washers",
-    "harding",
-    "bridget",
-    "jubilee",
-    "cyclone",
-    "bulldog",
-    "gradual",
-    "brennan",
-    "mastery",
-    "nesting",
-    "outward",
-    "whisper",
-    "ipswich",
-    "molding",
-    "leopard",
-    "ringing",
-    "whiskey",
-    "earring",
-    "furious",
-    "refills",
-    "drained",
-    "acreage",
-    "stocked",
-    "motives",
-    "provost",
-    "steroid",
-    "fridays",
-    "isolate",
-    "acronym",
-    "veritas",
-    "messiah",
-    "mutants",
-    "sensual",
-    "burgess",
-    "freshly",
-    "foundry",
-    "acetate",
-    "portage",
-    "aerosol",
-    "hostage",
-    "cracker",
-    "sermons",
-    "coolers",
-    "freddie",
-    "audited",
-    "adjunct",
-    "bottled",
-    "gastric",
-    "donovan",
-    "toaster",
-    "strauss",
-    "roadway",
-    "serials",
-    "walters",
-    "murders",
-    "bottoms",
-    "alaskan",
-    "widgets",
-    "chopper",
-    "nitrate",
-    "pinball",
-    "latvian",
-    "tunnels",
-    "heavier",
-    "dissent",
-    "maximal",
-    "mcbride",
-    "anarchy",
-    "clicked",
-    "drawers",
-    "leakage",
-    "chemist",
-    "propane",
-    "praised",
-    "breeder",
-    "drunken",
-    "spoiler",
-    "baroque",
-    "posture",
-    "thereon",
-    "valleys",
-    "thanked",
-    "citroen",
-    "apology",
-    "collars",
-    "andover",
-    "pudding",
-    "squared",
-    "barnett",
-    "cookers",
-    "luckily",
-    "rutland",
-    "lighted",
-    "erected",
-    "haitian",
-    "dialing",
-    "migrate",
-    "mentors",
-    "ammonia",
-    "steiner",
-    "dislike",
-    "soybean",
-    "brewers",
-    "pierced",
-    "awkward",
-    "weaving",
-    "lookout",
-    "ironing",
-    "doppler",
-    "entropy",
-    "snooker",
-    "nairobi",
-    "sterile",
-    "orioles",
-    "pauline",
-    "allegro",
-    "phyllis",
-    "scrolls",
-    "fairies",
-    "lubbock",
-    "sparkle",
-    "refrain",
-    "firearm",
-    "bundled",
-    "bombers",
-    "favored",
-    "swindon",
-    "neptune",
-    "unveils",
-    "peacock",
-    "helpers",
-    "elapsed",
-    "anthrax",
-    "hopeful",
-    "spinach",
-    "peanuts",
-    "eastman",
-    "discard",
-    "cavalry",
-    "trimmed",
-    "ferries",
-    "earnest",
-    "annette",
-    "outback",
-    "oceanic",
-    "festive",
-    "hustler",
-    "schultz",
-    "drilled",
-    "picasso",
-    "pilgrim",
-    "flaming",
-    "empower",
-    "prevail",
-    "methane",
-    "natives",
-    "deepest",
-    "climbed",
-    "roaming",
-    "sibling",
-    "weighed",
-    "ashamed",
-    "gorilla",
-    "inhibit",
-    "dickens",
-    "juniper",
-    "blowout",
-    "oversee",
-    "trojans",
-    "clement",
-    "pasture",
-    "richest",
-    "cruelty",
-    "plugged",
-    "mifflin",
-    "shapiro",
-    "marshal",
-    "rituals",
-    "sailors",
-    "sadness",
-    "flavour",
-    "onwards",
-    "prompts",
-    "witches",
-    "skinner",
-    "nouveau",
-    "feeders",
-    "kaufman",
-    "galileo",
-    "singled",
-    "centric",
-    "militia",
-    "bananas",
-    "golfing",
-    "kittens",
-    "scarves",
-    "outfits",
-    "puppets",
-    "tapping",
-    "explode",
-    "escapes",
-    "berries",
-    "happier",
-    "stacked",
-    "catcher",
-    "suction",
-    "crusade",
-    "spheres",
-    "assigns",
-    "croydon",
-    "whipped",
-    "dinners",
-    "selfish",
-    "walkman",
-    "neville",
-    "herring",
-    "nudists",
-    "keeling",
-    "yielded",
-    "sparrow",
-    "poorest",
-    "gannett",
-    "milling",
-    "sinking",
-    "sulphur",
-    "confess",
-    "chaotic",
-    "rubbing",
-    "detects",
-    "everest",
-    "dragged",
-    "foreman",
-    "conduit",
-    "ladders",
-    "prudent",
-    "glowing",
-    "alchemy",
-    "tristan",
-    "audible",
-    "colleen",
-    "lexicon",
-    "diapers",
-    "pillars",
-    "pistons",
-    "maltese",
-    "rightly",
-    "paragon",
-    "turnout",
-    "persist",
-    "illicit",
-    "firefly",
-    "pledged",
-    "curling",
-    "princes",
-    "krishna",
-    "skipped",
-    "hebrews",
-    "tempted",
-    "plaster",
-    "hearted",
-    "agility",
-    "sudbury",
-    "upscale",
-    "runaway",
-    "slowing",
-    "sleeper",
-    "unnamed",
-    "epstein",
-    "jerking",
-    "sharper",
-    "rodgers",
-    "coolest",
-    "downing",
-    "halogen",
-    "pegasus",
-    "maestro",
-    "coaxial",
-    "tipping",
-    "holster",
-    "leipzig",
-    "kellogg",
-    "faucets",
-    "caliber",
-    "apostle",
-    "playful",
-    "bethany",
-    "soprano",
-    "marquis",
-    "acclaim",
-    "rollers",
-    "weekday",
-    "kurdish",
-    "revoked",
-    "outpost",
-    "seville",
-    "chatter",
-    "lettuce",
-    "aerobic",
-    "ecstasy",
-    "fourier",
-    "strands",
-    "compost",
-    "flooded",
-    "corsair",
-    "cockpit",
-    "carrots",
-    "resumed",
-    "excuses",
-    "commute",
-    "stimuli",
-    "upwards",
-    "loosely",
-    "anchors",
-    "atheist",
-    "grizzly",
-    "chaired",
-    "hurting",
-    "fossils",
-    "crooked",
-    "braille",
-    "charmed",
-    "enfield",
-    "soaring",
-    "virtues",
-    "banning",
-    "newbury",
-    "jacking",
-    "ezekiel",
-    "compton",
-    "biscuit",
-    "submits",
-    "emerges",
-    "leaflet",
-    "informs",
-    "mcmahon",
-    "asserts",
-    "mariner",
-    "collier",
-    "artisan",
-    "raphael",
-    "aqueous",
-    "norwood",
-    "lillian",
-    "renders",
-    "catalan",
-    "ottoman",
-    "graders",
-    "insists",
-    "pouring",
-    "goodwin",
-    "secrecy",
-    "dreamed",
-    "fertile",
-    "sweeney",
-    "denoted",
-    "oneself",
-    "vaginas",
-    "anomaly",
-    "avatars",
-    "frontal",
-    "arsenic",
-    "synonym",
-    "devised",
-    "obscene",
-    "aladdin",
-    "burgers",
-    "campers",
-    "spelled",
-    "rescued",
-    "nuggets",
-    "hershey",
-    "embryos",
-    "pistols",
-    "garages",
-    "avenues",
-    "urology",
-    "zoology",
-    "huskies",
-    "vantage",
-    "diffuse",
-    "boredom",
-    "flatbed",
-    "golfers",
-    "shouted",
-    "advises",
-    "dresser",
-    "tackles",
-    "barking",
-    "serpent",
-    "pitched",
-    "tubular",
-    "scorpio",
-    "richter",
-    "ashford",
-    "kernels",
-    "wilkins",
-    "chilean",
-    "fainter",
-    "cabaret",
-    "awaited",
-    "wheeled",
-    "noodles",
-    "corning",
-    "armored",
-    "pianist",
-    "pigment",
-    "faction",
-    "mcguire",
-    "rulings",
-    "oakwood",
-    "astoria",
-    "epsilon",
-    "annoyed",
-    "hansard",
-    "greeted",
-    "hartley",
-    "glazing",
-    "tyranny",
-    "regimen",
-    "slender",
-    "bullock",
-    "mermaid",
-    "centred",
-    "uncover",
-    "rudolph",
-    "abigail",
-    "ignores",
-    "popping",
-    "pandora",
-    "polaris",
-    "latinos",
-    "doherty",
-    "inferno",
-    "confuse",
-    "lounges",
-    "lothian",
-    "hybrids",
-    "gillian",
-    "shawnee",
-    "crowley",
-    "ensured",
-    "cereals",
-    "outrage",
-    "elusive",
-    "madeira",
-    "hallway",
-    "ripping",
-    "polygon",
-    "hampers",
-    "curator",
-    "grooves",
-    "quicken",
-    "derrick",
-    "antoine",
-    "domingo",
-    "stencil",
-    "doorway",
-    "pledges",
-    "plotted",
-    "broaden",
-    "begging",
-    "handout",
-    "contend",
-    "paisley",
-    "gibbons",
-    "unicorn",
-    "orderly",
-    "chilled",
-    "citadel",
-    "wrinkle",
-    "indulge",
-    "melodic",
-    "primers",
-    "mcgrath",
-    "valiant",
-    "banging",
-    "vertigo",
-    "suffice",
-    "debated",
-    "walkers",
-    "camelot",
-    "keepers",
-    "oranges",
-    "melrose",
-    "obtains",
-    "antwerp",
-    "straits",
-    "subsets",
-    "blazers",
-    "endowed",
-    "goddard",
-    "defends",
-    "depicts",
-    "spanked",
-    "notepad",
-    "tedious",
-    "chewing",
-    "scripps",
-    "marxism",
-    "bosnian",
-    "callers",
-    "interns",
-    "bikinis",
-    "addicts",
-    "spaniel",
-    "grandpa",
-    "cornish",
-    "guessed",
-    "kennels",
-    "stamina",
-    "crowned",
-    "rooster",
-    "proctor",
-    "balkans",
-    "dictate",
-    "trimmer",
-    "abdomen",
-    "fasting",
-    "recital",
-    "pairing",
-    "utrecht",
-    "bedtime",
-    "rapport",
-    "catfish",
-    "peaches",
-    "skipper",
-    "prodigy",
-    "shakers",
-    "bourbon",
-    "lexical",
-    "karachi",
-    "platter",
-    "dracula",
-    "pageant",
-    "plywood",
-    "binders",
-    "morally",
-    "hosiery",
-    "reptile",
-    "overdue",
-    "teasing",
-    "unbound",
-    "quentin",
-    "guthrie",
-    "hepatic",
-    "kindred",
-    "aquifer",
-    "condemn",
-    "fullest",
-    "marlins",
-    "burdens",
-    "exiting",
-    "swollen",
-    "grasses",
-    "scatter",
-    "steward",
-    "codeine",
-    "tougher",
-    "clipper",
-    "cynical",
-    "hamster",
-    "potomac",
-    "etching",
-    "inherit",
-    "handing",
-    "laborer",
-    "watcher",
-    "surreal",
-    "encrypt",
-    "pajamas",
-    "murdoch",
-    "sayings",
-    "upstate",
-    "topping",
-    "simplex",
-    "reliant",
-    "twelfth",
-    "solicit",
-    "orchids",
-    "buckets",
-    "blazing",
-    "palermo",
-    "grantee",
-    "anglers",
-    "snapped",
-    "strives",
-    "pivotal",
-    "plating",
-    "eagerly",
-    "trooper",
-    "jogging",
-    "horrors",
-    "pastors",
-    "pitches",
-    "invaded",
-    "spoiled",
-    "dieting",
-    "tangent",
-    "tempest",
-    "rockers",
-    "dunedin",
-    "staffed",
-    "orphans",
-    "boilers",
-    "yelling",
-    "burnout",
-    "raining",
-    "peasant",
-    "citrate",
-    "snowman",
-    "edmonds",
-    "chinook",
-    "devious",
-    "dreamer",
-    "estuary",
-    "pouches",
-    "typhoon",
-    "induces",
-    "tooling",
-    "admired",
-    "tidbits",
-    "fairway",
-    "emitted",
-    "spinner",
-    "braking",
-    "parsley",
-    "setback",
-    "stunned",
-    "kimball",
-    "turnkey",
-    "renters",
-    "markham",
-    "tighten",
-    "apricot",
-    "cuckold",
-    "tongues",
-    "jehovah",
-    "entails",
-    "disrupt",
-    "rampage",
-    "imposes",
-    "persona",
-    "peabody",
-    "excused",
-    "roaring",
-    "stopper",
-    "saharan",
-    "crested",
-    "hubbell",
-    "summons",
-    "bathtub",
-    "exposes",
-    "natures",
-    "verbose",
-    "chalets",
-    "craving",
-    "leaking",
-    "masonic",
-    "yiddish",
-    "flasher",
-    "patched",
-    "caramel",
-    "octopus",
-    "zombies",
-    "hornets",
-    "spandex",
-    "tearing",
-    "muffins",
-    "cougars",
-    "nemesis",
-    "taunton",
-    "tripods",
-    "prussia",
-    "cookery",
-    "hangers",
-    "pleaded",
-    "flannel",
-    "steamer",
-    "spartan",
-    "rumours",
-    "bengali",
-    "respite",
-    "schemas",
-    "plainly",
-    "punches",
-    "nurture",
-    "lotions",
-    "adrenal",
-    "sixties",
-    "booting",
-    "engages",
-    "carbide",
-    "pullman",
-    "colombo",
-    "cadmium",
-    "villain",
-    "waivers",
-    "secures",
-    "rejoice",
-    "plumper",
-    "poisson",
-    "uterine",
-    "hurdles",
-    "candies",
-    "regatta",
-    "macbeth",
-    "martins",
-    "telford",
-    "topples",
-    "burnham",
-    "fallout",
-    "stalker",
-    "reclaim",
-    "extinct",
-    "lunches",
-    "rigging",
-    "derives",
-    "praises",
-    "caracas",
-    "mathews",
-    "reissue",
-    "striker",
-    "screams",
-    "masking",
-    "integra",
-    "jaguars",
-    "assures",
-    "waldorf",
-    "chiefly",
-    "autopsy",
-    "powders",
-    "debtors",
-    "wartime",
-    "ballast",
-    "rallies",
-    "earthly",
-    "malvern",
-    "proxies",
-    "issuers",
-    "martian",
-    "equinox",
-    "presume",
-    "cecilia",
-    "mckenna",
-    "adjusts",
-    "pickups",
-    "calypso",
-    "italics",
-    "porting",
-    "hammock",
-    "chevron",
-    "wolfram",
-    "bonanza",
-    "longing",
-    "inertia",
-    "pruning",
-    "swiftly",
-    "fearful",
-    "potency",
-    "nestled",
-    "drastic",
-    "catered",
-    "guarded",
-    "bureaus",
-    "voyages",
-    "retinal",
-    "dubious",
-    "listens",
-    "blanche",
-    "dialect",
-    "fanatic",
-    "raptors",
-    "bromley",
-    "corolla",
-    "knitted",
-    "quintet",
-    "rampant",
-    "vacuums",
-    "attends",
-    "hooters",
-    "tighter",
-    "thrifty",
-    "canning",
-    "totaled",
-    "shipper",
-    "unitary",
-    "liturgy",
-    "cradles",
-    "mideast",
-    "opposes",
-    "faceted",
-    "jericho",
-    "turmoil",
-    "disturb",
-    "bounced",
-    "saddles",
-    "amadeus",
-    "gushing",
-    "godfrey",
-    "minerva",
-    "iceberg",
-    "plumber",
-    "humping",
-    "redneck",
-    "planter",
-    "rivalry",
-    "charley",
-    "bespoke",
-    "drowned",
-    "kidneys",
-    "warbler",
-    "snippet",
-    "pellets",
-    "starred",
-    "skillet",
-    "offeror",
-    "ginseng",
-    "barnard",
-    "grenade",
-    "mayfair",
-    "enclose",
-    "sinners",
-    "watford",
-    "desmond",
-    "pharaoh",
-    "itching",
-    "endemic",
-    "tourney",
-    "terence",
-    "blurred",
-    "martens",
-    "duality",
-    "cordoba",
-    "buckles",
-    "sweeper",
-    "measles",
-    "amenity",
-    "hawking",
-    "divides",
-    "burmese",
-    "gathers",
-    "messing",
-    "empress",
-    "slogans",
-    "celtics",
-    "fascism",
-    "emanuel",
-    "isotope",
-    "locales",
-    "rebirth",
-    "wysiwyg",
-    "stirred",
-    "subtype",
-    "arrears",
-    "thicker",
-    "weeping",
-    "salford",
-    "infancy",
-    "cleanse",
-    "rosters",
-    "marlene",
-    "cheddar",
-    "cummins",
-    "booming",
-    "atlases",
-    "avenged",
-    "bounces",
-    "fascist",
-    "thinner",
-    "sampson",
-    "angling",
-    "requiem",
-    "bavaria",
-    "heroine",
-    "cadence",
-    "frosted",
-    "openers",
-    "insults",
-    "oatmeal",
-    "raceway",
-    "monsoon",
-    "treason",
-    "prosper",
-    "cheeses",
-    "malachi",
-    "empathy",
-    "omnibus",
-    "stables",
-    "mitzvah",
-    "bashing",
-    "tenancy",
-    "rupture",
-    "lyrical",
-    "braided",
-    "sleeved",
-    "cathode",
-    "slammed",
-    "aviator",
-    "paladin",
-    "marched",
-    "rotated",
-    "sighted",
-    "hopping",
-    "platoon",
-    "regrets",
-    "twister",
-    "sequoia",
-    "marquee",
-    "darkest",
-    "ballads",
-    "bobcats",
-    "swahili",
-    "thinker",
-    "phonics",
-    "donegal",
-    "endings",
-    "reagent",
-    "chomsky",
-    "frantic",
-    "zachary",
-    "algarve",
-    "valance",
-    "mundane",
-    "matador",
-    "deletes",
-    "lombard",
-    "behaved",
-    "embargo",
-    "claudio",
-    "specter",
-    "shading",
-    "conceal",
-    "saviour",
-    "boomers",
-    "benzene",
-    "sparked",
-    "forging",
-    "caribou",
-    "footing",
-    "cheetah",
-    "stumble",
-    "fridges",
-    "hammers",
-    "worldly",
-    "portray",
-    "napkins",
-    "upfront",
-    "hauling",
-    "dipping",
-    "rambler",
-    "endured",
-    "lockers",
-    "fishers",
-    "wexford",
-    "colgate",
-    "burrows",
-    "bedside",
-    "bumpers",
-    "torches",
-    "procure",
-    "sunsets",
-    "marxist",
-    "damping",
-    "bootleg",
-    "winslow",
-    "syringe",
-    "leftist",
-    "tequila",
-    "granger",
-    "glacial",
-    "tapered",
-    "alleges",
-    "blaming",
-    "gearbox",
-    "tensile",
-    "quilted",
-    "relapse",
-    "commend",
-    "descend",
-    "bolster",
-    "racquet",
-    "trident",
-    "calming",
-    "lingual",
-    "thirsty",
-    "punched",
-    "marbles",
-    "mildred",
-    "conveys",
-    "rearing",
-    "pooling",
-    "coyotes",
-    "zionist",
-    "reacted",
-    "sunless",
-    "puzzled",
-    "gaskets",
-    "remnant",
-    "immoral",
-    "unequal",
-    "backlog",
-    "ensuing",
-    "revived",
-    "hodgkin",
-    "alfalfa",
-    "chaplin",
-    "norbert",
-    "cherish",
-    "budding",
-    "hackney",
-    "glanced",
-    "rapture",
-    "purcell",
-    "sunbeam",
-    "beetles",
-    "caspian",
-    "beading",
-    "ratchet",
-    "parrots",
-    "anthems",
-    "photons",
-    "emulate",
-    "insofar",
-    "primate",
-    "revisit",
-    "whiting",
-    "netting",
-    "offsets",
-    "erasmus",
-    "tallinn",
-    "palaces",
-    "airflow",
-    "gliding",
-    "outings",
-    "wavelet",
-    "hostess",
-    "tangled",
-    "walsall",
-    "majorca",
-    "celsius",
-    "leopold",
-    "sprague",
-    "pundits",
-    "grabber",
-    "fearing",
-    "dossier",
-    "finders",
-    "deserts",
-    "milking",
-    "outages",
-    "blister",
-    "opacity",
-    "veggies",
-    "lacquer",
-    "thrills",
-    "punjabi",
-    "atheism",
-    "cellars",
-    "caterer",
-    "tainted",
-    "augment",
-    "gelatin",
-    "cursors",
-    "cripple",
-    "dropout",
-    "cropped",
-    "lockout",
-    "torquay",
-    "vaguely",
-    "siberia",
-    "almonds",
-    "equator",
-    "blatant",
-    "oysters",
-    "puberty",
-    "crawler",
-    "shorten",
-    "tabular",
-    "dormant",
-    "tropics",
-    "soaking",
-    "ferrous",
-    "zillion",
-    "abusing",
-    "bedrock",
-    "lucille",
-    "badgers",
-    "accrual",
-    "smashed",
-    "paroles",
-    "seeding",
-    "ulysses",
-    "botanic",
-    "crawley",
-    "stature",
-    "skaters",
-    "berwick",
-    "bangles",
-    "stereos",
-    "forster",
-    "fireman",
-    "vickers",
-    "wrongly",
-    "falsely",
-    "officio",
-    "plagued",
-    "suckers",
-    "matilda",
-    "impetus",
-    "whining",
-    "modulus",
-    "boosted",
-    "sprayed",
-    "gearing",
-    "freeing",
-    "redress",
-    "settles",
-    "coupler",
-    "cayenne",
-    "defeats",
-    "daimler",
-    "montage",
-    "hedging",
-    "inhaled",
-    "collide",
-    "blinded",
-    "arundel",
-    "grained",
-    "mediate",
-    "hackett",
-    "cunning",
-    "divider",
-    "pennies",
-    "giraffe",
-    "azimuth",
-    "chariot",
-    "coolant",
-    "warmers",
-    "alleles",
-    "belinda",
-    "wembley",
-    "sandman",
-    "lullaby",
-    "trucker",
-    "choking",
-    "stately",
-    "studded",
-    "brownie",
-    "nearing",
-    "burglar",
-    "freezes",
-    "wildcat",
-    "parting",
-    "avocado",
-    "torpedo",
-    "muffler",
-    "jumpers",
-    "edmunds",
-    "provoke",
-    "calvary",
-    "invests",
-    "kildare",
-    "adjourn",
-    "mediums",
-    "calumet",
-    "discern",
-    "animate",
-    "rethink",
-    "closets",
-    "junkies",
-    "okinawa",
-    "pertain",
-    "mallory",
-    "martyrs",
-    "shavers",
-    "aborted",
-    "booties",
-    "abiding",
-    "cancels",
-    "slipper",
-    "clashes",
-    "commune",
-    "snoring",
-    "governs",
-    "rooftop",
-    "seeming",
-    "rosebud",
-    "intakes",
-    "saffron",
-    "munster",
-    "casters",
-    "mailbag",
-    "vilnius",
-    "postwar",
-    "favours",
-    "gwynedd",
-    "evasion",
-    "gospels",
-    "lazarus",
-    "blasted",
-    "triples",
-    "gresham",
-    "pancake",
-    "dreaded",
-    "looping",
-    "undated",
-    "ramadan",
-    "exalted",
-    "tabloid",
-    "nitrous",
-    "skinned",
-    "rodents",
-    "seminal",
-    "manfred",
-    "laramie",
-    "sexiest",
-    "gambler",
-    "fosters",
-    "fillers",
-    "mcnally",
-    "beltway",
-    "eyebrow",
-    "applaud",
-    "abolish",
-    "busiest",
-    "spawned",
-    "departs",
-    "mindful",
-    "lurking",
-    "spectre",
-    "smother",
-    "moaning",
-    "duchess",
-    "rainier",
-    "snapper",
-    "bravery",
-    "lizards",
-    "flagged",
-    "offbeat",
-    "protons",
-    "fleeing",
-    "lambeth",
-    "fluency",
-    "uniting",
-    "behaves",
-    "incline",
-    "listers",
-    "oneness",
-    "climber",
-    "lactose",
-    "gifford",
-    "strides",
-    "woodrow",
-    "hooking",
-    "wrexham",
-    "resigns",
-    "anguish",
-    "bangers",
-    "handgun",
-    "clipped",
-    "grating",
-    "alerted",
-    "remodel",
-    "gaylord",
-    "bunting",
-    "avenger",
-    "wycombe",
-    "needham",
-    "corsica",
-    "piranha",
-    "weakest",
-    "salient",
-    "beehive",
-    "semitic",
-    "fission",
-    "widowed",
-    "flushed",
-    "marches",
-    "bunnies",
-    "outflow",
-    "resided",
-    "raunchy",
-    "toasted",
-    "brittle",
-    "bandits",
-    "soapbox",
-    "obadiah",
-    "somatic",
-    "hepburn",
-    "fetched",
-    "batches",
-    "angelic",
-    "workman",
-    "swimmer",
-    "jockeys",
-    "badness",
-    "sanding",
-    "vulgate",
-    "carotid",
-    "convent",
-    "adhered",
-    "haircut",
-    "bromide",
-    "summing",
-    "canyons",
-    "disgust",
-    "ranches",
-    "encodes",
-    "whaling",
-    "patrols",
-    "outlaws",
-    "ellipse",
-    "alarmed",
-    "justine",
-    "stalled",
-    "infused",
-    "bearded",
-    "tactile",
-    "carnage",
-    "coroner",
-    "convene",
-    "burnley",
-    "tylenol",
-    "gaseous",
-    "retiree",
-    "buckeye",
-    "marques",
-    "clothed",
-    "blowers",
-    "sorcery",
-    "abstain",
-    "barring",
-    "fielder",
-    "pounded",
-    "sarcasm",
-    "colitis",
-    "hassles",
-    "parable",
-    "affords",
-    "rhodium",
-    "sarcoma",
-    "sniffer",
-    "degrade",
-    "flemish",
-    "mailers",
-    "steamed",
-    "aroused",
-    "reddish",
-    "goliath",
-    "caprice",
-    "cohorts",
-    "torsion",
-    "utilise",
-    "midwife",
-    "coveted",
-    "moulded",
-    "convict",
-    "albumin",
-    "tossing",
-    "potable",
-    "recount",
-    "mascara",
-    "dearest",
-    "unleash",
-    "gallant",
-    "jeweler",
-    "ostrich",
-    "pallets",
-    "warlock",
-    "breakup",
-    "railing",
-    "pigeons",
-    "signify",
-    "progeny",
-    "tackled",
-    "satanic",
-    "torment",
-    "mussels",
-    "caitlin",
-    "hilltop",
-    "bohemia",
-    "mcgowan",
-    "pickles",
-    "marinas",
-    "looming",
-    "soulful",
-    "mosques",
-    "evolves",
-    "locates",
-    "ringers",
-    "cartons",
-    "riddles",
-    "marshes",
-    "bellies",
-    "palazzo",
-    "heparin",
-    "bonfire",
-    "plotter",
-    "slapped",
-    "forfeit",
-    "paddles",
-    "plasmas",
-    "barbell",
-    "beowulf",
-    "imputed",
-    "coached",
-    "cheated",
-    "willows",
-    "flipped",
-    "harbors",
-    "adorned",
-    "cowgirl",
-    "layoffs",
-    "matures",
-    "thrones",
-    "sneaker",
-    "armoire",
-    "twinkle",
-    "shifter",
-    "uttered",
-    "tending",
-    "flicker",
-    "midsize",
-    "briefed",
-    "carcass",
-    "reprise",
-    "pebbles",
-    "stipend",
-    "snorkel",
-    "iridium",
-    "toppers",
-    "daisies",
-    "sorrows",
-    "boobies",
-    "sorghum",
-    "batavia",
-    "slotted",
-    "decking",
-    "cyanide",
-    "chiffon",
-    "fanfare",
-    "archaic",
-    "elevate",
-    "affixed",
-    "ticking",
-    "webbing",
-    "bribery",
-    "glencoe",
-    "kettles",
-    "chained",
-    "magnify",
-    "travail",
-    "fiddler",
-    "falkirk",
-    "severed",
-    "operand",
-    "willful",
-    "busting",
-    "wooster",
-    "annexed",
-    "esquire",
-    "cryptic",
-    "entrees",
-    "corpora",
-    "cholera",
-    "bullion",
-    "hateful",
-    "procter",
-    "walleye",
-    "stratum",
-    "wicklow",
-    "walkway",
-    "ovation",
-    "paddock",
-    "bellows",
-    "boswell",
-    "venting",
-    "grossly",
-    "stabbed",
-    "banding",
-    "origami",
-    "awnings",
-    "donates",
-    "lucknow",
-    "hurried",
-    "vacated",
-    "manatee",
-    "koreans",
-    "sprouts",
-    "shopped",
-    "puritan",
-    "forearm",
-    "seaport",
-    "flashed",
-    "deceive",
-    "starved",
-    "scorers",
-    "hastily",
-    "invader",
-    "benelux",
-    "thirdly",
-    "keyless",
-    "sharpen",
-    "caveats",
-    "lanyard",
-    "plunged",
-    "defiant",
-    "termite",
-    "perjury",
-    "busters",
-    "hectare",
-    "netball",
-    "jackass",
-    "coffees",
-    "corpses",
-    "howling",
-    "nozzles",
-    "raisins",
-    "turkeys",
-    "pasting",
-    "caliper",
-    "concave",
-    "kipling",
-    "pennant",
-    "mathias",
-    "overrun",
-    "inhabit",
-    "pleated",
-    "digests",
-    "resists",
-    "subdued",
-    "acidity",
-    "echelon",
-    "narrows",
-    "queuing",
-    "valuing",
-    "jeannie",
-    "stetson",
-    "accuses",
-    "calibre",
-    "proverb",
-    "gutters",
-    "microns",
-    "surpass",
-    "hideous",
-    "abreast",
-    "pompano",
-    "decency",
-    "teaming",
-    "varnish",
-    "rounder",
-    "perched",
-    "sunroof",
-    "densely",
-    "raffles",
-    "decrees",
-    "drayton",
-    "redline",
-    "solvers",
-    "lucerne",
-    "deacons",
-    "tumours",
-    "horsham",
-    "midgets",
-    "hidalgo",
-    "lawless",
-    "inhuman",
-    "despise",
-    "floated",
-    "rundown",
-    "custard",
-    "accords",
-    "gentile",
-    "loaders",
-    "trouser",
-    "annuals",
-    "valence",
-    "chianti",
-    "hombres",
-    "peering",
-    "slumber",
-    "chipped",
-    "potluck",
-    "creamer",
-    "fledged",
-    "aquinas",
-    "pollack",
-    "arousal",
-    "vandals",
-    "mammary",
-    "hillman",
-    "garnish",
-    "peeling",
-    "blindly",
-    "halibut",
-    "fifties",
-    "penrith",
-    "alumnus",
-    "fenders",
-    "frisbee",
-    "seagull",
-    "streaks",
-    "corinth",
-    "eurasia",
-    "yorkers",
-    "visibly",
-    "defunct",
-    "decoded",
-    "kinship",
-    "blouses",
-    "hemlock",
-    "uncanny",
-    "concede",
-    "fallacy",
-    "noxious",
-    "lunatic",
-    "haggard",
-    "reorder",
-    "breezes",
-    "cymbals",
-    "emblems",
-    "jamming",
-    "poisons",
-    "susanne",
-    "culprit",
-    "slicing",
-    "lighten",
-    "canteen",
-    "ominous",
-    "misfits",
-    "parlour",
-    "quieter",
-    "replays",
-    "baseman",
-    "tallest",
-    "wrestle",
-    "rectify",
-    "mittens",
-    "cranial",
-    "wrecked",
-    "deities",
-    "trickle",
-    "erratic",
-    "cashing",
-    "spousal",
-    "abusers",
-    "drifted",
-    "mallard",
-    "corsets",
-    "tonnage",
-    "greener",
-    "helical",
-    "wetting",
-    "othello",
-    "maniacs",
-    "cypriot",
-    "critter",
-    "mooring",
-    "porters",
-    "forgery",
-    "grimsby",
-    "gagging",
-    "imitate",
-    "cyclist",
-    "magneto",
-    "crunchy",
-    "sealant",
-    "mosaics",
-    "unfolds",
-    "brocade",
-    "ashtray",
-    "seaweed",
-    "hugging",
-    "postman",
-    "vivaldi",
-    "ephraim",
-    "preheat",
-    "rookies",
-    "overton",
-    "matured",
-    "brixton",
-    "deprive",
-    "kremlin",
-    "buzzing",
-    "dauphin",
-    "zionism",
-    "grinned",
-    "sumatra",
-    "macular",
-    "leyland",
-    "traitor",
-    "widened",
-    "sapporo",
-    "fueling",
-    "crayons",
-    "awfully",
-    "corneal",
-    "profane",
-    "beckman",
-    "crusher",
-    "mccarty",
-    "drinker",
-    "hangman",
-    "sloping",
-    "unlucky",
-    "distort",
-    "ketchup",
-    "alimony",
-    "viscous",
-    "loosing",
-    "soloist",
-    "robbers",
-    "lowland",
-    "unheard",
-    "nomadic",
-    "prolong",
-    "weaning",
-    "afghans",
-    "vividly",
-    "stooges",
-    "looting",
-    "humming",
-    "shearer",
-    "millard",
-    "exerted",
-    "tumbler",
-    "ranting",
-    "erupted",
-    "comrade",
-    "piccolo",
-    "bushing",
-    "soviets",
-    "tweeter",
-    "stinger",
-    "wreaths",
-    "absorbs",
-    "gwyneth",
-    "kuwaiti",
-    "bothers",
-    "parades",
-    "cubicle",
-    "invokes",
-    "cannons",
-    "sulfide",
-    "emptied",
-    "precede",
-    "jodhpur",
-    "molokai",
-    "tetanus",
-    "farnham",
-    "wildest",
-    "outlays",
-    "osmosis",
-    "priming",
-    "heathen",
-    "fanning",
-    "spurred",
-    "adamson",
-    "guilder",
-    "lourdes",
-    "grilles",
-    "demonic",
-    "deduced",
-    "burials",
-    "drapery",
-    "entrant",
-    "phasing",
-    "lactate",
-    "skeptic",
-    "backlit",
-    "slander",
-    "onshore",
-    "potions",
-    "squirts",
-    "watered",
-    "smelled",
-    "metcalf",
-    "groomed",
-    "leaping",
-    "sliders",
-    "quickie",
-    "prowess",
-    "dogwood",
-    "manhood",
-    "nephews",
-    "boarded",
-    "syllabi",
-    "umpires",
-    "wayward",
-    "redness",
-    "erasure",
-    "glimmer",
-    "blooded",
-    "teddies",
-    "upsilon",
-    "sizable",
-    "weavers",
-    "thyself",
-    "rooting",
-    "sucrose",
-    "modesty",
-    "banshee",
-    "fisheye",
-    "wayside",
-    "aerials",
-    "summits",
-    "stylist",
-    "sprayer",
-    "gliders",
-    "legions",
-    "juicers",
-    "hangout",
-    "amnesia",
-    "bigotry",
-    "actuate",
-    "bruised",
-    "shipley",
-    "impeach",
-    "atrophy",
-    "utopian",
-    "confers",
-    "decrypt",
-    "bellamy",
-    "fringes",
-    "affirms",
-    "takeoff",
-    "hitters",
-    "wickets",
-    "shimmer",
-    "violins",
-    "logbook",
-    "inflict",
-    "rotates",
-    "legible",
-    "rescues",
-    "waffles",
-    "annexes",
-    "vulture",
-    "mislead",
-    "ventral",
-    "welders",
-    "sponges",
-    "revered",
-    "shingle",
-    "timbers",
-    "glaring",
-    "tilting",
-    "oregano",
-    "drizzle",
-    "boaters",
-    "bracing",
-    "remorse",
-    "spacers",
-    "metered",
-    "cultura",
-    "lucifer",
-    "fatties",
-    "inflows",
-    "chaucer",
-    "dosages",
-    "recited",
-    "throats",
-    "barrage",
-    "peeping",
-    "earners",
-    "walnuts",
-    "conical",
-    "mocking",
-    "tricked",
-    "raccoon",
-    "cheaply",
-    "consort",
-    "unwired",
-    "bacchus",
-    "chuckle",
-    "swapped",
-    "bloated",
-    "armband",
-    "belated",
-    "stemmed",
-    "appleby",
-    "crammed",
-    "hatchet",
-    "jocelyn",
-    "pastels",
-    "creeper",
-    "hocking",
-    "femoral",
-    "zooming",
-    "keswick",
-    "nuances",
-    "knuckle",
-    "moulton",
-    "bastion",
-    "gypsies",
-    "submenu",
-    "yucatan",
-    "sipping",
-    "stepper",
-    "realist",
-    "pervert",
-    "retails",
-    "circled",
-    "withers",
-    "bunches",
-    "deviate",
-    "atelier",
-    "veneers",
-    "zambezi",
-    "horatio",
-    "cheered",
-    "beanies",
-    "beacons",
-    "bruises",
-    "freebie",
-    "bulimia",
-    "newquay",
-    "ladybug",
-    "bassoon",
-    "doubted",
-    "ravaged",
-    "ghostly",
-    "foresee",
-    "rations",
-    "kinross",
-    "triplet",
-    "risking",
-    "ingress",
-    "barbers",
-    "retires",
-    "bissell",
-    "organza",
-    "funnies",
-    "hamlets",
-    "setters",
-    "lovable",
-    "synapse",
-    "airplay",
-    "sawmill",
-    "perseus",
-    "warmest",
-    "capping",
-    "hipster",
-    "walpole",
-    "bertram",
-    "bullish",
-    "mutated",
-    "fuchsia",
-    "queried",
-    "rotting",
-    "ditches",
-    "scourge",
-    "bandage",
-    "tankers",
-    "cramped",
-    "racking",
-    "avignon",
-    "selkirk",
-    "enclave",
-    "senders",
-    "unarmed",
-    "sconces",
-    "novices",
-    "grasped",
-    "bequest",
-    "beggars",
-    "quixote",
-    "timings",
-    "trellis",
-    "marries",
-    "echoing",
-    "papyrus",
-    "wiggles",
-    "siamese",
-    "javelin",
-    "bouncer",
-    "crawled",
-    "rallied",
-    "quakers",
-    "putters",
-    "firebox",
-    "sonatas",
-    "bullies",
-    "caustic",
-    "romford",
-    "emporia",
-    "pretext",
-    "notting",
-    "margate",
-    "ordinal",
-    "wilfred",
-    "fibrous",
-    "epistle",
-    "acetone",
-    "finesse",
-    "nickels",
-    "banbury",
-    "choctaw",
-    "reputed",
-    "bearers",
-    "guesses",
-    "courant",
-    "potters",
-    "flatter",
-    "cordial",
-    "chorley",
-    "quarrel",
-    "liqueur",
-    "pastime",
-    "pursues",
-    "healers",
-    "actuary",
-    "latches",
-    "emitter",
-    "ralston",
-    "trotter",
-    "winders",
-    "mortals",
-    "tillage",
-    "lasagna",
-    "debuted",
-    "lagging",
-    "rosette",
-    "sequels",
-    "clapham",
-    "twofold",
-    "marlowe",
-    "chanson",
-    "leprosy",
-    "goddamn",
-    "daggers",
-    "pleases",
-    "tritium",
-    "revolve",
-    "confine",
-    "yardage",
-    "whereof",
-    "defying",
-    "erskine",
-    "britons",
-    "outcast",
-    "faraday",
-    "macabre",
-    "ophelia",
-    "spotter",
-    "hearsay",
-    "matting",
-    "heretic",
-    "draught",
-    "comical",
-    "waiters",
-    "catwalk",
-    "caverns",
-    "boarder",
-    "minibus",
-    "bumping",
-    "amplify",
-    "seduced",
-    "angrily",
-    "croquet",
-    "burrito",
-    "backers",
-    "warlord",
-    "sichuan",
-    "wrigley",
-    "pasteur",
-    "shocker",
-    "ruining",
-    "heroism",
-    "hoosier",
-    "toluene",
-    "bayonet",
-    "janitor",
-    "reunite",
-    "whither",
-    "flipper",
-    "eyeball",
-    "telefax",
-    "bossier",
-    "culvert",
-    "spanner",
-    "battled",
-    "styrene",
-    "alumnae",
-    "settler",
-    "orpheus",
-    "ovaries",
-    "daddies",
-    "follies",
-    "cleanly",
-    "unclean",
-    "seizing",
-    "ferrets",
-    "menzies",
-    "leveled",
-    "adheres",
-    "rawhide",
-    "downers",
-    "knotted",
-    "misused",
-    "heywood",
-    "mormons",
-    "debacle",
-    "undress",
-    "tenured",
-    "rumored",
-    "galicia",
-    "evesham",
-    "grantor",
-    "sceptre",
-    "matinee",
-    "plunder",
-    "midweek",
-    "inhaler",
-    "nervosa",
-    "shudder",
-    "firemen",
-    "tuxedos",
-    "batters",
-    "crispin",
-    "scraper",
-    "dryness",
-    "gophers",
-    "haworth",
-    "dockers",
-    "infidel",
-    "larceny",
-    "matlock",
-    "unravel",
-    "android",
-    "galilee",
-    "orifice",
-    "rubella",
-    "jobless",
-    "slashed",
-    "idyllic",
-    "satchel",
-    "giggles",
-    "balfour",
-    "stiller",
-    "loggers",
-    "steeped",
-    "eyelids",
-    "archers",
-    "forbids",
-    "disdain",
-    "daemons",
-    "fitzroy",
-    "huntley",
-    "enlaces",
-    "mastiff",
-    "pirated",
-    "leavers",
-    "fronted",
-    "picnics",
-    "broiler",
-    "abscess",
-    "memento",
-    "tumbled",
-    "harwich",
-    "sweeter",
-    "tallied",
-    "saucers",
-    "gondola",
-    "truffle",
-    "flutter",
-    "shatter",
-    "pickled",
-    "rotator",
-    "carpool",
-    "armpits",
-    "slacker",
-    "bandana",
-    "padlock",
-    "classed",
-    "solidly",
-    "chimera",
-    "foaming",
-    "tailors",
-    "fixings",
-    "baffled",
-    "tripoli",
-    "fillets",
-    "dailies",
-    "retract",
-    "tinting",
-    "sigmund",
-    "materia",
-    "slashes",
-    "dwarves",
-    "artiste",
-    "centaur",
-    "pinhole",
-    "partake",
-    "snooper",
-    "rancher",
-    "grocers",
-    "vesting",
-    "panache",
-    "detract",
-    "pelagic",
-    "runways",
-    "frowned",
-    "tasking",
-    "tweaked",
-    "hatched",
-    "trample",
-    "colonic",
-    "wattage",
-    "harrods",
-    "resized",
-    "forgets",
-    "grapple",
-    "fumbles",
-    "nitrite",
-    "violets",
-    "monomer",
-    "hexagon",
-    "idiotic",
-    "formosa",
-    "workmen",
-    "pronoun",
-    "pulleys",
-    "sublets",
-    "antiwar",
-    "shadowy",
-    "liquors",
-    "abalone",
-    "creases",
-    "nourish",
-    "gingham",
-    "teasers",
-    "beveled",
-    "ejected",
-    "scribes",
-    "browsed",
-    "acutely",
-    "profess",
-    "legumes",
-    "inflate",
-    "sundown",
-    "workday",
-    "cutlass",
-    "maidens",
-    "joinery",
-    "octagon",
-    "equates",
-    "genders",
-    "harming",
-    "fatally",
-    "bravely",
-    "cheater",
-    "clogged",
-    "leashes",
-    "sounder",
-    "cursing",
-    "messier",
-    "flanges",
-    "bowlers",
-    "keypads",
-    "regress",
-    "spanned",
-    "rappers",
-    "cumulus",
-    "reigned",
-    "hookers",
-    "amalgam",
-    "zambian",
-    "renfrew",
-    "meriden",
-    "pleural",
-    "dilated",
-    "angered",
-    "condone",
-    "thermos",
-    "garters",
-    "adamant",
-    "pontoon",
-    "tableau",
-    "numeral",
-    "myeloid",
-    "rubicon",
-    "ivanhoe",
-    "frigate",
-    "harrier",
-    "entrust",
-    "tripled",
-    "burying",
-    "chicano",
-    "erasing",
-    "cyclops",
-    "gunfire",
-    "groaned",
-    "voicing",
-    "grouper",
-    "bunkers",
-    "precast",
-    "caritas",
-    "rhubarb",
-    "ragtime",
-    "mayoral",
-    "tidings",
-    "silvery",
-    "nodding",
-    "algiers",
-    "templar",
-    "kestrel",
-    "ruffled",
-    "hoppers",
-    "trinket",
-    "tolstoy",
-    "wishful",
-    "trailed",
-    "expanse",
-    "hippies",
-    "preside",
-    "oeuvres",
-    "stapler",
-    "encased",
-    "scarred",
-    "ignited",
-    "scrooge",
-    "nagging",
-    "debussy",
-    "millers",
-    "clerics",
-    "poppies",
-    "notched",
-    "reeling",
-    "rimming",
-    "loafers",
-    "fuelled",
-    "squires",
-    "insures",
-    "slaying",
-    "mahatma",
-    "winches",
-    "rebekah",
-    "chapels",
-    "minions",
-    "iterate",
-    "ganglia",
-    "headway",
-    "buzzard",
-    "plunger",
-    "halting",
-    "veranda",
-    "moreton",
-    "hatches",
-    "eyelets",
-    "flatten",
-    "asiatic",
-    "lentils",
-    "negroes",
-    "paprika",
-    "novella",
-    "diggers",
-    "glances",
-    "tyrants",
-    "furness",
-    "ripples",
-    "durante",
-    "griddle",
-    "nascent",
-    "precept",
-    "woodman",
-    "gravely",
-    "errands",
-    "foxboro",
-    "savages",
-    "craters",
-    "nicosia",
-    "mockery",
-    "epitaph",
-    "bursary",
-    "bugaboo",
-    "chowder",
-    "freaked",
-    "mascots",
-    "cadbury",
-    "comedic",
-    "crumble",
-    "spatula",
-    "drifter",
-    "stardom",
-    "exotics",
-    "immerse",
-    "envious",
-    "hirsute",
-    "fooling",
-    "vaulted",
-    "coulomb",
-    "gleaned",
-    "flowery",
-    "sunburn",
-    "elector",
-    "fielded",
-    "dusting",
-    "shrines",
-    "bridged",
-    "sitcoms",
-    "ukulele",
-    "bracken",
-    "couches",
-    "arduous",
-    "slugger",
-    "fulcrum",
-    "gripped",
-    "sprites",
-    "dashing",
-    "shipman",
-    "carrick",
-    "bellied",
-    "decreed",
-    "addenda",
-    "keyhole",
-    "porcine",
-    "inshore",
-    "reducer",
-    "tremors",
-    "apropos",
-    "pitiful",
-    "linings",
-    "arbiter",
-    "buoyant",
-    "airtime",
-    "gryphon",
-    "vitally",
-    "chatted",
-    "hurling",
-    "brevity",
-    "prickly",
-    "whittle",
-    "elitist",
-    "iberian",
-    "copycat",
-    "denials",
-    "cargill",
-    "anklets",
-    "impasse",
-    "piloted",
-    "snowdon",
-    "squeaky",
-    "bulging",
-    "chemise",
-    "hydrate",
-    "diurnal",
-    "subways",
-    "roebuck",
-    "typhoid",
-    "yardley",
-    "afghani",
-    "derwent",
-    "scallop",
-    "singlet",
-    "kiddies",
-    "minster",
-    "instill",
-    "fraught",
-    "droplet",
-    "slowest",
-    "revises",
-    "coexist",
-    "holborn",
-    "tripped",
-    "woodard",
-    "copious",
-    "tremble",
-    "pompeii",
-    "alluded",
-    "sojourn",
-    "zippers",
-    "caloric",
-    "surging",
-    "greased",
-    "yoghurt",
-    "robbing",
-    "peebles",
-    "epitome",
-    "breaths",
-    "flanked",
-    "primacy",
-    "carmine",
-    "chipper",
-    "fiancee",
-    "rhyming",
-    "stroked",
-    "buggies",
-    "speedup",
-    "fareham",
-    "cranium",
-    "politic",
-    "mitotic",
-    "mingled",
-    "shelved",
-    "wailing",
-    "buffets",
-    "poetics",
-    "entitle",
-    "angolan",
-    "relayed",
-    "jellies",
-    "airlift",
-    "nodules",
-    "tunable",
-    "plucked",
-    "rippers",
-    "discord",
-    "infield",
-    "stances",
-    "hashing",
-    "thrower",
-    "funnier",
-    "stormed",
-    "gifting",
-    "fistula",
-    "censure",
-    "carbine",
-    "porches",
-    "glorify",
-    "lineman",
-    "cleaver",
-    "overuse",
-    "haulage",
-    "conifer",
-    "wareham",
-    "fateful",
-    "beeswax",
-    "sprints",
-    "insular",
-    "lagoons",
-    "tellers",
-    "herding",
-    "halcyon",
-    "cantina",
-    "nappies",
-    "sundial",
-    "gestalt",
-    "chorale",
-    "gelding",
-    "crackle",
-    "splices",
-    "orville",
-    "spirals",
-    "onerous",
-    "haddock",
-    "pyjamas",
-    "copilot",
-    "phobias",
-    "clouded",
-    "bighorn",
-    "leitrim",
-    "gimmick",
-    "wiretap",
-    "moniker",
-    "welling",
-    "divulge",
-    "wardens",
-    "peaking",
-    "seltzer",
-    "venison",
-    "basking",
-    "pinging",
-    "coopers",
-    "deploys",
-    "royston",
-    "creamed",
-    "nannies",
-    "dodging",
-    "browned",
-    "cheadle",
-    "unearth",
-    "gazelle",
-    "harpers",
-    "tendons",
-    "thrives",
-    "refuges",
-    "rousing",
-    "petting",
-    "rossini",
-    "roaster",
-    "warring",
-    "parsers",
-    "upholds",
-    "inroads",
-    "boasted",
-    "donkeys",
-    "chutney",
-    "sonnets",
-    "inquest",
-    "hapless",
-    "hitches",
-    "shrinks",
-    "phoning",
-    "fissure",
-    "curtail",
-    "transom",
-    "enraged",
-    "blotter",
-    "sitters",
-    "clamped",
-    "creased",
-    "trapper",
-    "slanted",
-    "plagues",
-    "adipose",
-    "potting",
-    "natured",
-    "puccini",
-    "blemish",
-    "bushels",
-    "evicted",
-    "digress",
-    "arcades",
-    "jeweled",
-    "repaint",
-    "spastic",
-    "coronet",
-    "taverns",
-    "conjure",
-    "mowbray",
-    "herbals",
-    "sequins",
-    "chasers",
-    "sherwin",
-    "fringed",
-    "goblins",
-    "nitride",
-    "caveman",
-    "nucleon",
-    "hideout",
-    "calcite",
-    "gunshot",
-    "desiree",
-    "zealous",
-    "ocarina",
-    "payoffs",
-    "defrost",
-    "meteors",
-    "diction",
-    "granola",
-    "ferrite",
-    "lampoon",
-    "firming",
-    "annular",
-    "chalice",
-    "prefect",
-    "sweetly",
-    "delilah",
-    "kingpin",
-    "bingley",
-    "vermeil",
-    "moraine",
-    "sunbelt",
-    "dueling",
-    "reshape",
-    "gainers",
-    "widower",
-    "purging",
-    "scaring",
-    "igneous",
-    "skipton",
-    "aramaic",
-    "valorem",
-    "tempera",
-    "mystics",
-    "teapots",
-    "fresher",
-    "skimmer",
-    "sketchy",
-    "ephesus",
-    "steered",
-    "kampala",
-    "whatnot",
-    "mangled",
-    "staunch",
-    "viscose",
-    "manhunt",
-    "mitosis",
-    "skylark",
-    "jigsaws",
-    "dockets",
-    "orinoco",
-    "dunning",
-    "pinning",
-    "raisers",
-    "anemone",
-    "weeding",
-    "evasive",
-    "pausing",
-    "replete",
-    "glories",
-    "prelims",
-    "bristle",
-    "terrors",
-    "panacea",
-    "vibrate",
-    "deflect",
-    "stumped",
-    "seaford",
-    "proxima",
-    "appease",
-    "furlong",
-    "shovels",
-    "mouthed",
-    "howarth",
-    "andante",
-    "overtly",
-    "oedipus",
-    "scraped",
-    "chagrin",
-    "panning",
-    "tickled",
-    "sparing",
-    "heifers",
-    "wanders",
-    "restful",
-    "pinched",
-    "granule",
-    "purport",
-    "ageless",
-    "hardtop",
-    "swaying",
-    "trashed",
-    "lobbies",
-    "coldest",
-    "proviso",
-    "bazooka",
-    "rescind",
-    "dioxins",
-    "gymnast",
-    "forceps",
-    "rafters",
-    "vermeer",
-    "framers",
-    "humbled",
-    "radiate",
-    "attains",
-    "blunder",
-    "antlers",
-    "powwows",
-    "dunkirk",
-    "reaping",
-    "dumbest",
-    "prowler",
-    "dredged",
-    "merthyr",
-    "carport",
-    "dubbing",
-    "cobbler",
-    "heinous",
-    "manhole",
-    "eroding",
-    "tabasco",
-    "shutout",
-    "quibble",
-    "curbing",
-    "harshly",
-    "blinked",
-    "snuggle",
-    "dragoon",
-    "merrily",
-    "ceasing",
-    "eyelash",
-    "clicker",
-    "academe",
-    "obeying",
-    "gunners",
-    "gosling",
-    "mishaps",
-    "fouling",
-    "litters",
-    "brothel",
-    "shelled",
-    "planing",
-    "abysmal",
-    "termini",
-    "denture",
-    "fourths",
-    "wagoner",
-    "minding",
-    "bullied",
-    "gnostic",
-    "parlors",
-    "scottie",
-    "fistful",
-    "thither",
-    "vesicle",
-    "gauging",
-    "staines",
-    "censors",
-    "voyeurs",
-    "boyhood",
-    "fervent",
-    "likened",
-    "hydride",
-    "livable",
-    "ushered",
-    "adenine",
-    "tayside",
-    "ionized",
-    "warship",
-    "rattles",
-    "marvels",
-    "quetzal",
-    "kickers",
-    "yeshiva",
-    "earthen",
-    "uplands",
-    "ugandan",
-    "shivers",
-    "smitten",
-    "averted",
-    "equated",
-    "clocked",
-    "skewers",
-    "miocene",
-    "steeple",
-    "nailing",
-    "tannins",
-    "penance",
-    "charted",
-    "ravioli",
-    "walling",
-    "jointed",
-    "topsoil",
-    "isomers",
-    "beaming",
-    "chooser",
-    "zermatt",
-    "bugging",
-    "haskins",
-    "riddled",
-    "utensil",
-    "dinning",
-    "mistral",
-    "admirer",
-    "divisor",
-    "searing",
-    "bretton",
-    "drugged",
-    "marbled",
-    "mombasa",
-    "guanine",
-    "cruelly",
-    "tapioca",
-    "cursive",
-    "forties",
-    "ghastly",
-    "tongued",
-    "walcott",
-    "succumb",
-    "insoles",
-    "starlet",
-    "groupie",
-    "laminar",
-    "cowards",
-    "captors",
-    "amassed",
-    "romulus",
-    "charade",
-    "anagram",
-    "seepage",
-    "poppers",
-    "rapists",
-    "rectory",
-    "currant",
-    "seduces",
-    "sawdust",
-    "ballets",
-    "snowing",
-    "polices",
-    "dogging",
-    "rotunda",
-    "faintly",
-    "dweller",
-    "bitumen",
-    "spliced",
-    "gunning",
-    "tadpole",
-    "berserk",
-    "coerced",
-    "billets",
-    "advices",
-    "coffers",
-    "deposed",
-    "forsake",
-    "swamped",
-    "tenuous",
-    "depress",
-    "kitties",
-    "waiving",
-    "dampers",
-    "rudyard",
-    "hitchin",
-    "relaxes",
-    "malaise",
-    "hydrant",
-    "presser",
-    "chamois",
-    "urethra",
-    "leeward",
-    "metlife",
-    "risotto",
-    "exmouth",
-    "anaemia",
-    "jungles",
-    "permian",
-    "pounder",
-    "archway",
-    "oversaw",
-    "loudest",
-    "viaduct",
-    "laurels",
-    "trekker",
-    "warhead",
-    "coinage",
-    "endgame",
-    "dimming",
-    "zealots",
-    "weighty",
-    "gasping",
-    "revisor",
-    "pendent",
-    "edifice",
-    "lobbied",
-    "gallium",
-    "steeper",
-    "rangoon",
-    "topiary",
-    "buttery",
-    "cronies",
-    "pipette",
-    "soundly",
-    "wicking",
-    "austral",
-    "weakens",
-    "leggett",
-    "piraeus",
-    "pooping",
-    "undoing",
-    "cassava",
-    "negated",
-    "purview",
-    "adeline",
-    "rwandan",
-    "gallows",
-    "devotee",
-    "smelter",
-    "manmade",
-    "sagging",
-    "cupcake",
-    "raggedy",
-    "sobbing",
-    "prequel",
-    "shekels",
-    "ponders",
-    "sealers",
-    "erratum",
-    "foxtrot",
-    "reusing",
-    "thrusts",
-    "faraway",
-    "gazebos",
-    "sirloin",
-    "abounds",
-    "salutes",
-    "lapping",
-    "muffled",
-    "lockets",
-    "flocked",
-    "dialers",
-    "brahman",
-    "pulsing",
-    "obligor",
-    "heralds",
-    "lessors",
-    "amiable",
-    "shiites",
-    "hinders",
-    "opulent",
-    "houdini",
-    "exotica",
-    "scooped",
-    "cursory",
-    "batsman",
-    "refuted",
-    "penises",
-    "velvety",
-    "ternary",
-    "teeming",
-    "panting",
-    "romaine",
-    "peckham",
-    "signers",
-    "adenoma",
-    "truancy",
-    "taxicab",
-    "onetime",
-    "bagging",
-    "huddled",
-    "carrion",
-    "plantar",
-    "braised",
-    "pollute",
-    "pretzel",
-    "warping",
-    "pronged",
-    "dundalk",
-    "snipers",
-    "gosport",
-    "rubrics",
-    "kerouac",
-    "patties",
-    "samaria",
-    "smeared",
-    "outfall",
-    "parasol",
-    "concurs",
-    "farting",
-    "culling",
-    "devotes",
-    "mortars",
-    "ductile",
-    "punters",
-    "dropper",
-    "surinam",
-    "krypton",
-    "castile",
-    "ricotta",
-    "humidor",
-    "broiled",
-    "airdrie",
-    "insides",
-    "cutaway",
-    "defraud",
-    "toothed",
-    "cliches",
-    "likable",
-    "flexion",
-    "kinsman",
-    "footers",
-    "mutable",
-    "sputnik",
-    "coffins",
-    "rackets",
-    "heiress",
-    "godhead",
-    "shyness",
-    "pickers",
-    "angelus",
-    "cuticle",
-    "pimples",
-    "shorted",
-    "readies",
-    "fairest",
-    "majeure",
-    "obelisk",
-    "lapland",
-    "gambian",
-    "jesuits",
-    "mottled",
-    "publics",
-    "unlocks",
-    "rinsing",
-    "shunned",
-    "trotsky",
-    "groucho",
-    "crushes",
-    "punting",
-    "molotov",
-    "pungent",
-    "reboots",
-    "fanzine",
-    "canvass",
-    "reigate",
-    "baiting",
-    "sunspot",
-    "elation",
-    "cowbell",
-    "cezanne",
-    "tranche",
-    "sanctum",
-    "stapled",
-    "fancied",
-    "crafter",
-    "abidjan",
-    "giggled",
-    "titular",
-    "trapeze",
-    "extents",
-    "damning",
-    "ailment",
-    "sharpie",
-    "taproot",
-    "shoving",
-    "menthol",
-    "hadrian",
-    "bagpipe",
-    "dribble",
-    "colloid",
-    "oxidant",
-    "parquet",
-    "emotive",
-    "thimble",
-    "racists",
-    "skydive",
-    "fairing",
-    "collate",
-    "invades",
-    "talkers",
-    "sockeye",
-    "bluntly",
-    "assayed",
-    "goblets",
-    "touting",
-    "crappie",
-    "famille",
-    "diorama",
-    "bacardi",
-    "rattled",
-    "tramway",
-    "slayers",
-    "reapply",
-    "snowmen",
-    "rhizome",
-    "bureaux",
-    "leotard",
-    "impeded",
-    "pompous",
-    "subvert",
-    "muscled",
-    "berlioz",
-    "takings",
-    "triplex",
-    "casings",
-    "sparkly",
-    "repeals",
-    "cassius",
-    "alpacas",
-    "powdery",
-    "diverge",
-    "untamed",
-    "notches",
-    "riveted",
-    "drafter",
-    "pitting",
-    "fittest",
-    "tarnish",
-    "isthmus",
-    "raucous",
-    "hairpin",
-    "nabisco",
-    "blushed",
-    "saddest",
-    "exempts",
-    "perrier",
-    "lefties",
-    "bloomer",
-    "barrows",
-    "scribed",
-    "borrows",
-    "butters",
-    "armrest",
-    "woollen",
-    "impairs",
-    "enteric",
-    "marimba",
-    "rambles",
-    "diatoms",
-    "dawning",
-    "caplets",
-    "wingers",
-    "dorking",
-    "trachea",
-    "sandown",
-    "numbing",
-    "osmotic",
-    "knitter",
-    "swelled",
-    "belting",
-    "rigidly",
-    "phalanx",
-    "sifting",
-    "meander",
-    "poached",
-    "hailing",
-    "slumped",
-    "thrived",
-    "ascribe",
-    "stalked",
-    "deluded",
-    "labored",
-    "troughs",
-    "piscine",
-    "skilful",
-    "endures",
-    "bismuth",
-    "intents",
-    "laissez",
-    "smacked",
-    "trusses",
-    "grooved",
-    "ungodly",
-    "felling",
-    "couleur",
-    "botched",
-    "segovia",
-    "microbe",
-    "necktie",
-    "seaward",
-    "ciphers",
-    "fleeces",
-    "adopter",
-    "decayed",
-    "oddball",
-    "viceroy",
-    "yellows",
-    "mummies",
-    "beseech",
-    "hitched",
-    "nabokov",
-    "enchant",
-    "austere",
-    "cowhide",
-    "plumage",
-    "antibes",
-    "haughty",
-    "opiates",
-    "cadaver",
-    "yawning",
-    "attuned",
-    "raiding",
-    "ramming",
-    "inboard",
-    "caboose",
-    "fitters",
-    "cements",
-    "boudoir",
-    "rioting",
-    "amylase",
-    "unpaved",
-    "rushdie",
-    "dinette",
-    "turners",
-    "dimples",
-    "hessian",
-    "petunia",
-    "gremlin",
-    "lifters",
-    "offends",
-    "shackle",
-    "dulwich",
-    "itemize",
-    "splints",
-    "airship",
-    "gauguin",
-    "trundle",
-    "cognate",
-    "flushes",
-    "restate",
-    "godless",
-    "birders",
-    "brazing",
-    "hinting",
-    "omicron",
-    "bailiff",
-    "defaced",
-    "pampers",
-    "moorish",
-    "bobbing",
-    "machete",
-    "smartly",
-    "laments",
-    "menorah",
-    "charred",
-    "validly",
-    "rematch",
-    "faberge",
-    "unsound",
-    "bearish",
-    "reverie",
-    "callous",
-    "jingles",
-    "softens",
-    "flanged",
-    "sinuses",
-    "morpeth",
-    "amputee",
-    "undying",
-    "stubble",
-    "caddies",
-    "splines",
-    "uptight",
-    "actives",
-    "doodles",
-    "hatters",
-    "soothes",
-    "compels",
-    "bobsled",
-    "decorum",
-    "taffeta",
-    "lenient",
-    "hyphens",
-    "medulla",
-    "scrappy",
-    "jezebel",
-    "reverts",
-    "mitcham",
-    "toppled",
-    "mending",
-    "hurtful",
-    "oratory",
-    "sprains",
-    "slovene",
-    "burford",
-    "cannock",
-    "growled",
-    "nebulae",
-    "gentler",
-    "infects",
-    "impaled",
-    "diesels",
-    "geodesy",
-    "valuers",
-    "pitfall",
-    "lingers",
-    "bestial",
-    "restock",
-    "bookish",
-    "grommet",
-    "belvoir",
-    "wetness",
-    "bindery",
-    "elysium",
-    "tantrum",
-    "flexing",
-    "tracers",
-    "awakens",
-    "bromine",
-    "rampart",
-    "facades",
-    "conceit",
-    "needful",
-    "locusts",
-    "bambini",
-    "meiosis",
-    "thicket",
-    "rascals",
-    "nanking",
-    "birdies",
-    "radians",
-    "flaring",
-    "rhondda",
-    "grafted",
-    "propped",
-    "staking",
-    "bedouin",
-    "fancies",
-    "accuser",
-    "sultans",
-    "finches",
-    "basques",
-    "mullahs",
-    "grosses",
-    "oilseed",
-    "stiffer",
-    "allelic",
-    "layette",
-    "worsley",
-    "clasped",
-    "scrotum",
-    "pecking",
-    "crimean",
-    "grieved",
-    "tallies",
-    "sniping",
-    "tassels",
-    "regalia",
-    "peerage",
-    "storied",
-    "verbena",
-    "doublet",
-    "typeset",
-    "subside",
-    "jarring",
-    "managua",
-    "mumbled",
-    "cattery",
-    "cantata",
-    "hillier",
-    "diploid",
-    "toggles",
-    "calving",
-    "offside",
-    "dairies",
-    "plunges",
-    "aseptic",
-    "shapers",
-    "gouging",
-    "spinoza",
-    "chekhov",
-    "fulfils",
-    "moravia",
-    "repress",
-    "steeply",
-    "peeking",
-    "gushers",
-    "skimmed",
-    "spewing",
-    "erasers",
-    "combing",
-    "dovecot",
-    "deepens",
-    "blather",
-    "oracles",
-    "palmtop",
-    "cranked",
-    "piecing",
-    "helices",
-    "benders",
-    "rapping",
-    "delores",
-    "swivels",
-    "bravado",
-    "ravings",
-    "grecian",
-    "saddled",
-    "trawler",
-    "bifocal",
-    "sachets",
-    "scalpel",
-    "wedlock",
-    "sternly",
-    "chanted",
-    "softest",
-    "sniffed",
-    "babbler",
-    "rewrote",
-    "buffing",
-    "aphasia",
-    "maoists",
-    "icicles",
-    "godsend",
-    "doorman",
-    "rubbers",
-    "injures",
-    "pigtail",
-    "reloads",
-    "dollies",
-    "indicia",
-    "excised",
-    "forlorn",
-    "whacked",
-    "slimmer",
-    "socials",
-    "clacton",
-    "passers",
-    "alnwick",
-    "screech",
-    "fetches",
-    "clobber",
-    "tremolo",
-    "goulash",
-    "beckons",
-    "ruffles",
-    "gaiters",
-    "edgware",
-    "curving",
-    "tankard",
-    "amorous",
-    "grumble",
-    "wronged",
-    "labours",
-    "harsher",
-    "fortify",
-    "cherubs",
-    "tolling",
-    "bucking",
-    "baffles",
-    "obverse",
-    "elysian",
-    "sutures",
-    "cobbled",
-    "imparts",
-    "joggers",
-    "thawing",
-    "hovered",
-    "stunted",
-    "kempton",
-    "portico",
-    "excites",
-    "weasels",
-    "placard",
-    "jitters",
-    "perusal",
-    "cloaked",
-    "lichens",
-    "fresnel",
-    "titling",
-    "sunfish",
-    "bellman",
-    "pliable",
-    "dissect",
-    "olivine",
-    "gestapo",
-    "bramble",
-    "canasta",
-    "tooting",
-    "scalars",
-    "anthill",
-    "balding",
-    "quasars",
-    "strayed",
-    "hiccups",
-    "silvers",
-    "jurists",
-    "perches",
-    "scrapes",
-    "warthog",
-    "vetting",
-    "goalies",
-    "joiners",
-    "mantras",
-    "figural",
-    "kleenex",
-    "thorium",
-    "lorries",
-    "swindle",
-    "candied",
-    "poodles",
-    "unboxed",
-    "origine",
-    "wrecker",
-    "upstart",
-    "refocus",
-    "remakes",
-    "retries",
-    "forbade",
-    "woofers",
-    "arching",
-    "worsted",
-    "vagrant",
-    "empties",
-    "decibel",
-    "pythons",
-    "barrios",
-    "embarks",
-    "dualism",
-    "marbury",
-    "arrayed",
-    "hissing",
-    "outcrop",
-    "intrude",
-    "topmost",
-    "charmer",
-    "pontiff",
-    "scabies",
-    "napping",
-    "tiniest",
-    "caskets",
-    "urinate",
-    "ravages",
-    "unlined",
-    "humanly",
-    "peddler",
-    "adverbs",
-    "hobbits",
-    "crowbar",
-    "nettles",
-    "cruised",
-    "lashing",
-    "tabling",
-    "floater",
-    "recluse",
-    "stoning",
-    "blacker",
-    "aspires",
-    "cloture",
-    "calculi",
-    "victors",
-    "runcorn",
-    "phrased",
-    "puddles",
-    "pardons",
-    "whisker",
-    "latched",
-    "clashed",
-    "holdall",
-    "harpoon",
-    "reining",
-    "deflate",
-    "cannery",
-    "cobwebs",
-    "hellish",
-    "hominid",
-    "ugliest",
-    "trumped",
-    "sikhism",
-    "keratin",
-    "tilbury",
-    "hutches",
-    "engrave",
-    "bauxite",
-    "barrack",
-    "gouache",
-    "moslems",
-    "muddled",
-    "evoking",
-    "curries",
-    "cliques",
-    "delving",
-    "mallets",
-    "floored",
-    "beaters",
-    "implode",
-    "syrians",
-    "stagger",
-    "crusted",
-    "turrets",
-    "slither",
-    "juggler",
-    "worsens",
-    "stifled",
-    "formica",
-    "urinals",
-    "lioness",
-    "lorelei",
-    "heaving",
-    "pensive",
-    "paschal",
-    "cowling",
-    "ferment",
-    "thinned",
-    "flapper",
-    "aircrew",
-    "seabird",
-    "hoisted",
-    "wastage",
-    "mommies",
-    "growths",
-    "garbled",
-    "tickers",
-    "dimmers",
-    "misread",
-    "paucity",
-    "frisian",
-    "amulets",
-    "cargoes",
-    "disobey",
-    "chromed",
-    "savoury",
-    "amharic",
-    "cleaved",
-    "eskimos",
-    "blarney",
-    "magnate",
-    "pillage",
-    "scruffy",
-    "chesham",
-    "vibrato",
-    "ejector",
-    "tampons",
-    "curable",
-    "guineas",
-    "brisket",
-    "plummet",
-    "deplete",
-    "casuals",
-    "bambino",
-    "tubules",
-    "frailty",
-    "tangier",
-    "ragweed",
-    "vetiver",
-    "reopens",
-    "boxwood",
-    "broking",
-    "erudite",
-    "laotian",
-    "chisels",
-    "phoneme",
-    "eustace",
-    "spoofed",
-    "talkies",
-    "stutter",
-    "bonkers",
-    "verdant",
-    "secrete",
-    "lounger",
-    "cockney",
-    "penning",
-    "gammons",
-    "leeches",
-    "convoys",
-    "ospreys",
-    "shapely",
-    "wheelie",
-    "preemie",
-    "refiner",
-    "galleon",
-    "chafing",
-    "betrays",
-    "assyria",
-    "inwards",
-    "regroup",
-    "soiling",
-    "germane",
-    "mourned",
-    "woodcut",
-    "thickly",
-    "cistern",
-    "phaeton",
-    "purists",
-    "funnels",
-    "amazons",
-    "canines",
-    "strobes",
-    "sidecar",
-    "cartels",
-    "squelch",
-    "vitriol",
-    "rumbles",
-    "febrile",
-    "mercies",
-    "manilla",
-    "airfoil",
-    "lignite",
-    "scorned",
-    "thicken",
-    "minimis",
-    "puffing",
-    "wielded",
-    "castors",
-    "finials",
-    "trestle",
-    "spiking",
-    "mulling",
-    "sighing",
-    "pergola",
-    "cupping",
-    "earache",
-    "evading",
-    "striper",
-    "shrimps",
-    "stirrup",
-    "flopped",
-    "subtext",
-    "looters",
-    "minnows",
-    "briskly",
-    "subplot",
-    "ingrown",
-    "affront",
-    "baileys",
-    "murmurs",
-    "ridings",
-    "chokers",
-    "tanager",
-    "winsome",
-    "equaled",
-    "longbow",
-    "scalper",
-    "tartans",
-    "grayish",
-    "recline",
-    "fluvial",
-    "candela",
-    "collard",
-    "typists",
-    "ledgers",
-    "glossop",
-    "crozier",
-    "cropper",
-    "groping",
-    "cabanas",
-    "shoring",
-    "medians",
-    "asunder",
-    "statist",
-    "sheaves",
-    "polemic",
-    "armoury",
-    "hubcaps",
-    "knocker",
-    "storeys",
-    "sherbet",
-    "vernier",
-    "breaded",
-    "nibbles",
-    "cornice",
-    "tannery",
-    "buckled",
-    "kindled",
-    "worksop",
-    "rimless",
-    "wistful",
-    "admires",
-    "moronic",
-    "fumbled",
-    "lancers",
-    "marsala",
-    "upsurge",
-    "tugging",
-    "fissile",
-    "heckler",
-    "whippet",
-    "chicane",
-    "feedlot",
-    "sheared",
-    "unaided",
-    "curried",
-    "clapped",
-    "hotkeys",
-    "squishy",
-    "shamans",
-    "smocked",
-    "faulted",
-    "maggots",
-    "hominem",
-    "snagged",
-    "bexhill",
-    "hockley",
-    "caraway",
-    "earshot",
-    "batsmen",
-    "coughed",
-    "niggers",
-    "thiamin",
-    "tugboat",
-    "deanery",
-    "kibbutz",
-    "commode",
-    "adoring",
-    "trodden",
-    "huskers",
-    "debited",
-    "saguaro",
-    "reaming",
-    "carvers",
-    "aniline",
-    "decodes",
-    "oxalate",
-    "evinced",
-    "freesia",
-    "situate",
-    "devises",
-    "ditched",
-    "whalers",
-    "smuggle",
-    "accrues",
-    "titania",
-    "ducking",
-    "cellist",
-    "rusting",
-    "slicker",
-    "falsify",
-    "swagger",
-    "flicked",
-    "hellcat",
-    "mandrel",
-    "actinic",
-    "offload",
-    "ponchos",
-    "detours",
-    "bravest",
-    "crevice",
-    "rescuer",
-    "dominus",
-    "epithet",
-    "elution",
-    "camphor",
-    "mongols",
-    "beecham",
-    "comings",
-    "crinkle",
-    "edibles",
-    "tearful",
-    "betwixt",
-    "actuals",
-    "mantels",
-    "sorties",
-    "revives",
-    "suitors",
-    "forking",
-    "sleight",
-    "shutoff",
-    "skirted",
-    "daybook",
-    "reckons",
-    "puzzler",
-    "fainted",
-    "fleshed",
-    "winking",
-    "wallaby",
-    "grossed",
-    "cottons",
-    "ramdisk",
-    "dazzled",
-    "consuls",
-    "newness",
-    "ascetic",
-    "patella",
-    "placket",
-    "bigoted",
-    "formers",
-    "levying",
-    "bethnal",
-    "brahmin",
-    "tempers",
-    "quinine",
-    "retards",
-    "saintly",
-    "feltham",
-    "pushkin",
-    "diethyl",
-    "moonlit",
-    "melange",
-    "populus",
-    "demoted",
-    "nullify",
-    "refines",
-    "infarct",
-    "sacking",
-    "clapper",
-    "upswing",
-    "gunnery",
-    "snorted",
-    "fitment",
-    "lemming",
-    "appends",
-    "buttock",
-    "retrace",
-    "splurge",
-    "bombard",
-    "magpies",
-    "swirled",
-    "warlike",
-    "fretted",
-    "begonia",
-    "dieters",
-    "roaches",
-    "pulsars",
-    "cording",
-    "scepter",
-    "enticed",
-    "schmuck",
-    "exclaim",
-    "clavier",
-    "annulus",
-    "whisked",
-    "rumania",
-    "vedanta",
-    "grouchy",
-    "mobster",
-    "devizes",
-    "brazier",
-    "filofax",
-    "cantons",
-    "tangles",
-    "meanest",
-    "refutes",
-    "hollows",
-    "oppress",
-    "torrens",
-    "nostril",
-    "impedes",
-    "surmise",
-    "saluted",
-    "octaves",
-    "emanate",
-    "rummage",
-    "makings",
-    "noblest",
-    "bobbins",
-    "marmite",
-    "hemming",
-    "defiled",
-    "triceps",
-    "neonate",
-    "roofers",
-    "combats",
-    "aquaria",
-    "legibly",
-    "doormat",
-    "timpani",
-    "wagging",
-    "farrier",
-    "teheran",
-    "granary",
-    "whitish",
-    "melanin",
-    "blacked",
-    "dowsing",
-    "bookies",
-    "figment",
-    "wearily",
-    "glazier",
-    "playpen",
-    "anchovy",
-    "hotshot",
-    "rolland",
-    "linseed",
-    "lectern",
-    "mongrel",
-    "hashish",
-    "ventnor",
-    "mopping",
-    "gainful",
-    "lessees",
-    "whimper",
-    "incised",
-    "elicits",
-    "invents",
-    "wantage",
-    "tenfold",
-    "scoured",
-    "layaway",
-    "pilsner",
-    "chancel",
-    "lamprey",
-    "washout",
-    "pigskin",
-    "redruth",
-    "naphtha",
-    "girdles",
-    "bannock",
-    "crating",
-    "ferrule",
-    "ignites",
-    "enrolls",
-    "fulness",
-    "majored",
-    "bronzes",
-    "startle",
-    "smashes",
-    "erector",
-    "rooming",
-    "cashews",
-    "opossum",
-    "tickles",
-    "sardine",
-    "meshing",
-    "aimless",
-    "parfait",
-    "cuddles",
-    "sorters",
-    "sangria",
-    "turnips",
-    "sextant",
-    "stomped",
-    "donning",
-    "planers",
-    "lustful",
-    "rebuked",
-    "buyouts",
-    "phenols",
-    "presage",
-    "ruislip",
-    "tidying",
-    "maypole",
-    "piglets",
-    "mongers",
-    "greases",
-    "boatman",
-    "negates",
-    "wisbech",
-    "syncope",
-    "freshen",
-    "outdone",
-    "sternum",
-    "iguanas",
-    "hamming",
-    "paraded",
-    "whirled",
-    "padstow",
-    "enlists",
-    "blaring",
-    "spooler",
-    "heaping",
-    "oration",
-    "grunted",
-    "batched",
-    "posited",
-    "pennine",
-    "fiestas",
-    "coarser",
-    "lerwick",
-    "challis",
-    "aliquot",
-    "outsell",
-    "regains",
-    "lessens",
-    "ripened",
-    "toenail",
-    "waltzes",
-    "attests",
-    "parched",
-    "stanzas",
-    "tonsils",
-    "asexual",
-    "kindest",
-    "bonnets",
-    "paneled",
-    "jungian",
-    "sciatic",
-    "sheaths",
-    "jugular",
-    "bemused",
-    "hacksaw",
-    "confide",
-    "sweeten",
-    "macaque",
-    "chilies",
-    "spender",
-    "naturel",
-    "suzette",
-    "chicory",
-    "subsoil",
-    "chablis",
-    "unifies",
-    "elitism",
-    "helicon",
-    "hearken",
-    "patting",
-    "niobium",
-    "traumas",
-    "doilies",
-    "dusters",
-    "psyched",
-    "chattel",
-    "butlers",
-    "teeside",
-    "paddled",
-    "inkling",
-    "arbutus",
-    "darting",
-    "tripper",
-    "blunted",
-    "pushers",
-    "denbigh",
-    "limping",
-    "nineveh",
-    "anionic",
-    "forages",
-    "noisily",
-    "wearers",
-    "beastly",
-    "letdown",
-    "matrons",
-    "buckler",
-    "flyover",
-    "ecstacy",
-    "melding",
-    "pinkish",
-    "blurted",
-    "merited",
-    "beatnik",
-    "shellac",
-    "sowerby",
-    "saloons",
-    "meiotic",
-    "scuttle",
-    "rougher",
-    "raiment",
-    "disused",
-    "avebury",
-    "stooped",
-    "carbons",
-    "bolting",
-    "fixated",
-    "forgave",
-    "homeric",
-    "biplane",
-    "barrens",
-    "outlast",
-    "dangles",
-    "adduced",
-    "alludes",
-    "ledbury",
-    "realign",
-    "saracen",
-    "tailing",
-    "walkout",
-    "tensors",
-    "pharynx",
-    "dishing",
-    "vespers",
-    "lobelia",
-    "urchins",
-    "implore",
-    "dragnet",
-    "mangoes",
-    "lancing",
-    "enslave",
-    "espouse",
-    "conagra",
-    "bitters",
-    "ludovic",
-    "avarice",
-    "insipid",
-    "biasing",
-    "holiest",
-    "compote",
-    "pansies",
-    "acceded",
-    "foresaw",
-    "hunched",
-    "pickets",
-    "soothed",
-    "floured",
-    "pueblos",
-    "tenable",
-    "jumbled",
-    "scolded",
-    "fetters",
-    "tipster",
-    "falsity",
-    "sapling",
-    "baboons",
-    "propels",
-    "jittery",
-    "godlike",
-    "unblock",
-    "bailing",
-    "renames",
-    "brutish",
-    "extrema",
-    "disband",
-    "joyride",
-    "megabit",
-    "hearers",
-    "availed",
-    "damsels",
-    "sashimi",
-    "morsels",
-    "snicker",
-    "ghettos",
-    "honiton",
-    "aerated",
-    "boldest",
-    "impound",
-    "unsaved",
-    "parapet",
-    "dogfish",
-    "duelist",
-    "recheck",
-    "proofed",
-    "glosses",
-    "swapper",
-    "beeping",
-    "airless",
-    "isfahan",
-    "naively",
-    "cleaves",
-    "enamels",
-    "fillies",
-    "linemen",
-    "afflict",
-    "ceilidh",
-    "adducts",
-    "mimicry",
-    "perigee",
-    "trotted",
-    "vaunted",
-    "astride",
-    "alcazar",
-    "receded",
-    "halters",
-    "impinge",
-    "genteel",
-    "normans",
-    "speeder",
-    "theists",
-    "toiling",
-    "voiding",
-    "collies",
-    "prosody",
-    "ridding",
-    "pinhead",
-    "exhaled",
-    "snipped",
-    "rioters",
-    "amperes",
-    "girders",
-    "wasters",
-    "cookout",
-    "sharers",
-    "labeler",
-    "dipoles",
-    "mortise",
-    "sleuths",
-    "stymied",
-    "muskrat",
-    "mumbles",
-    "brained",
-    "tempura",
-    "peonies",
-    "stealer",
-    "offhand",
-    "bashful",
-    "absolve",
-    "barkers",
-    "purples",
-    "kinsmen",
-    "morello",
-    "pimping",
-    "tacitly",
-    "sawfish",
-    "mistook",
-    "zipping",
-    "exhumed",
-    "subzero",
-    "baloney",
-    "omelets",
-    "hermits",
-    "gullies",
-    "falafel",
-    "whopper",
-    "pothole",
-    "felines",
-    "pizzazz",
-    "yuppies",
-    "thruway",
-    "jetting",
-    "felting",
-    "injects",
-    "nodular",
-    "juicing",
-    "aplenty",
-    "fathoms",
-    "nuptial",
-    "daphnia",
-    "bulbous",
-    "expound",
-    "chanced",
-    "comfrey",
-    "milkman",
-    "inexact",
-    "aground",
-    "redwing",
-    "sinning",
-    "gnawing",
-    "mucking",
-    "crudely",
-    "profuse",
-    "couched",
-    "maroons",
-    "bestows",
-    "rickets",
-    "penarth",
-    "blesses",
-    "burdock",
-    "scherzo",
-    "arapaho",
-    "hotness",
-    "cheviot",
-    "brasher",
-    "tanners",
-    "netsuke",
-    "courted",
-    "earmark",
-    "enliven",
-    "envelop",
-    "dustbin",
-    "stamens",
-    "launder",
-    "aerator",
-    "newbold",
-    "grander",
-    "hittite",
-    "gladden",
-    "geysers",
-    "usurped",
-    "inkwell",
-    "tillers",
-    "nubiles",
-    "dutiful",
-    "gordian",
-    "unquote",
-    "pasties",
-    "buggers",
-    "distill",
-    "leptons",
-    "nunnery",
-    "epoxies",
-    "clatter",
-    "beamish",
-    "trefoil",
-    "vapours",
-    "firings",
-    "quipped",
-    "speckle",
-    "cossack",
-    "sultana",
-    "topsail",
-    "modicum",
-    "steppes",
-    "derided",
-    "vocally",
-    "retrial",
-    "seeping",
-    "flotsam",
-    "readied",
-    "antacid",
-    "sistine",
-    "stashed",
-    "unmoved",
-    "stunner",
-    "fancier",
-    "hangars",
-    "skyward",
-    "heroics",
-    "tithing",
-    "gerbils",
-    "speeded",
-    "slovaks",
-    "outgrow",
-    "swanage",
-    "generis",
-    "flaking",
-    "probity",
-    "affable",
-    "stepney",
-    "sterols",
-    "missive",
-    "ascends",
-    "loafing",
-    "foibles",
-    "slurred",
-    "stepson",
-    "deeside",
-    "bulwark",
-    "sheltie",
-    "stringy",
-    "churned",
-    "ironies",
-    "dappled",
-    "azaleas",
-    "tacking",
-    "feigned",
-    "dripped",
-    "epicure",
-    "speller",
-    "tamales",
-    "satsuma",
-    "dervish",
-    "tinfoil",
-    "hoodlum",
-    "midyear",
-    "revamps",
-    "paddler",
-    "dwarfed",
-    "debrief",
-    "ribbing",
-    "maghreb",
-    "lozenge",
-    "scarier",
-    "topside",
-    "hardens",
-    "paroled",
-    "obliges",
-    "mulatto",
-    "courtly",
-    "phallic",
-    "taunted",
-    "bubbled",
-    "soloing",
-    "cordage",
-    "hobbled",
-    "nightie",
-    "jesters",
-    "tutored",
-    "leftism",
-    "misting",
-    "sarongs",
-    "aileron",
-    "rebuffs",
-    "sputter",
-    "handily",
-    "presale",
-    "baptize",
-    "horning",
-    "subsist",
-    "nutters",
-    "beagles",
-    "sported",
-    "quaking",
-    "nuclide",
-    "riskier",
-    "animism",
-    "asquith",
-    "stiffen",
-    "louvers",
-    "showman",
-    "aspired",
-    "runnels",
-    "seawall",
-    "curlers",
-    "demerol",
-    "amanita",
-    "solider",
-    "gusting",
-    "quintin",
-    "leveler",
-    "balling",
-    "layover",
-    "maugham",
-    "baronet",
-    "turnoff",
-    "airlock",
-    "scoffed",
-    "snarled",
-    "languid",
-    "reviled",
-    "starkly",
-    "fiddles",
-    "fogging",
-    "gilding",
-    "twining",
-    "sickest",
-    "outland",
-    "phrasal",
-    "acolyte",
-    "aeolian",
-    "sedated",
-    "obviate",
-    "redrawn",
-    "lanolin",
-    "baubles",
-    "bacilli",
-    "crucify",
-    "blushes",
-    "axially",
-    "emirate",
-    "tunings",
-    "bittern",
-    "abetted",
-    "daystar",
-    "outpace",
-    "revving",
-    "exigent",
-    "deadpan",
-    "sneaked",
-    "walloon",
-    "squalor",
-    "bulking",
-    "chaplet",
-    "narrate",
-    "legwork",
-    "gleamed",
-    "carmack",
-    "quashed",
-    "comport",
-    "deeming",
-    "flaccid",
-    "prodded",
-    "sterner",
-    "womanly",
-    "chorizo",
-    "fibroid",
-    "dimpled",
-    "massing",
-    "grimace",
-    "bribing",
-    "bridles",
-    "pannier",
-    "parotid",
-    "pilling",
-    "bistros",
-    "blanked",
-    "swarmed",
-    "shafted",
-    "cradled",
-    "trolled",
-    "brixham",
-    "basting",
-    "merrier",
-    "simples",
-    "vegetal",
-    "mimetic",
-    "rubbery",
-    "spooked",
-    "crewman",
-    "settlor",
-    "redbird",
-    "cochlea",
-    "innards",
-    "marabou",
-    "whoring",
-    "gassing",
-    "sulfite",
-    "rending",
-    "consign",
-    "mantles",
-    "faustus",
-    "supremo",
-    "honking",
-    "crazies",
-    "gapping",
-    "halides",
-    "chunked",
-    "halving",
-    "wheaten",
-    "faggots",
-    "lasagne",
-    "stilton",
-    "latrine",
-    "gulping",
-    "beeline",
-    "gametes",
-    "servile",
-    "pintail",
-    "benzoic",
-    "rickety",
-    "prosaic",
-    "bimodal",
-    "snubbed",
-    "humerus",
-    "revolts",
-    "wharves",
-    "borodin",
-    "kerning",
-    "bruiser",
-    "stowage",
-    "contras",
-    "dawlish",
-    "spurned",
-    "percale",
-    "bolshoi",
-    "mitford",
-    "viscera",
-    "smirked",
-    "unscrew",
-    "bronzed",
-    "basenji",
-    "cwmbran",
-    "gobbles",
-    "bringer",
-    "wettest",
-    "bunched",
-    "fusible",
-    "kimonos",
-    "baklava",
-    "automat",
-    "garnets",
-    "haploid",
-    "shrieks",
-    "vacuous",
-    "hasidic",
-    "greeter",
-    "serfdom",
-    "gossips",
-    "scuffle",
-    "riotous",
-    "florets",
-    "durrell",
-    "clinker",
-    "devolve",
-    "weirder",
-    "suppers",
-    "ravines",
-    "diverts",
-    "bazaars",
-    "deathly",
-    "unloved",
-    "railcar",
-    "entreat",
-    "placate",
-    "cocking",
-    "crisper",
-    "beakers",
-    "poacher",
-    "hosanna",
-    "prescot",
-    "linkers",
-    "blotted",
-    "grammes",
-    "shrouds",
-    "tatting",
-    "recites",
-    "royally",
-    "retrain",
-    "garners",
-    "minders",
-    "eyewash",
-    "topcoat",
-    "bracers",
-    "guzzler",
-    "maltose",
-    "rookery",
-    "blankly",
-    "chantry",
-    "fondant",
-    "vestige",
-    "shoeing",
-    "harried",
-    "blubber",
-    "memoire",
-    "stirrer",
-    "braving",
-    "perspex",
-    "torched",
-    "tucking",
-    "bivalve",
-    "decried",
-    "dwindle",
-    "quizzed",
-    "mugging",
-    "uncivil",
-    "nelsons",
-    "pegging",
-    "boggles",
-    "commies",
-    "jointer",
-    "plurals",
-    "tandems",
-    "corsage",
-    "cession",
-    "heeding",
-    "revelry",
-    "hogging",
-    "haywire",
-    "ruinous",
-    "overage",
-    "lugging",
-    "furrows",
-    "throngs",
-    "toccata",
-    "harpist",
-    "tilling",
-    "crimped",
-    "sidings",
-    "salukis",
-    "zeroing",
-    "purring",
-    "strolls",
-    "gentian",
-    "cicadas",
-    "shagged",
-    "phallus",
-    "nasties",
-    "foramen",
-    "braemar",
-    "trifles",
-    "lockups",
-    "suiting",
-    "asinine",
-    "upriver",
-    "galleys",
-    "chapped",
-    "sunning",
-    "indents",
-    "incited",
-    "shebang",
-    "rippled",
-    "tresses",
-    "cheeked",
-    "pentair",
-    "curfews",
-    "repulse",
-    "kilsyth",
-    "zapping",
-    "glossed",
-    "hounded",
-    "jutting",
-    "yttrium",
-    "unfunny",
-    "sneered",
-    "vacuole",
-    "pincher",
-    "gambles",
-    "unmixed",
-    "grieves",
-    "doggies",
-    "dahlias",
-    "tumbles",
-    "frogman",
-    "flyaway",
-    "coaxing",
-    "preying",
-    "olefins",
-    "praline",
-    "agitate",
-    "shindig",
-    "consett",
-    "rattler",
-    "eyesore",
-    "piggies",
-    "conakry",
-    "shallot",
-    "beached",
-    "flexure",
-    "solutes",
-    "weirdly",
-    "summery",
-    "eardrum",
-    "resells",
-    "vandyke",
-    "chalked",
-    "grannie",
-    "gambled",
-    "inverts",
-    "gratify",
-    "carding",
-    "goshawk",
-    "possums",
-    "dunkeld",
-    "moisten",
-    "moorhen",
-    "peopled",
-    "maracas",
-    "swooped",
-    "quieted",
-    "albumen",
-    "jujitsu",
-    "weevils",
-    "retouch",
-    "senates",
-    "whereon",
-    "entente",
-    "falters",
-    "muskets",
-    "gibbous",
-    "wavered",
-    "hayseed",
-    "eluting",
-    "chiming",
-    "poplars",
-    "debater",
-    "macduff",
-    "mousses",
-    "finicky",
-    "ousting",
-    "audibly",
-    "starchy",
-    "bronchi",
-    "bleeder",
-    "cussing",
-    "hayling",
-    "expunge",
-    "externs",
-    "plovers",
-    "grudges",
-    "inflame",
-    "bluster",
-    "fattest",
-    "prelate",
-    "plastid",
-    "spooled",
-    "feuding",
-    "saviors",
-    "maudlin",
-    "lowbrow",
-    "deplore",
-    "swizzle",
-    "macadam",
-    "fervour",
-    "tickler",
-    "bathers",
-    "digraph",
-    "malthus",
-    "legroom",
-    "mashing",
-    "ebonite",
-    "mangers",
-    "laminae",
-    "crooner",
-    "couplet",
-    "erosive",
-    "mezuzah",
-    "bedbugs",
-    "loaning",
-    "mutatis",
-    "bashers",
-    "whoopee",
-    "dentate",
-    "attired",
-    "platted",
-    "picador",
-    "squeaks",
-    "moderns",
-    "stipple",
-    "schlock",
-    "chapeau",
-    "partied",
-    "assuage",
-    "yearned",
-    "fondest",
-    "nombres",
-    "coining",
-    "loathed",
-    "weirdos",
-    "chanter",
-    "roubles",
-    "solders",
-    "dakotas",
-    "bandeau",
-    "babysit",
-    "sirocco",
-    "teacups",
-    "nudging",
-    "blinder",
-    "girlish",
-    "encores",
-    "foremen",
-    "ranchos",
-    "bragged",
-    "sawyers",
-    "harries",
-    "footman",
-    "saddler",
-    "prepped",
-    "sinless",
-    "moulder",
-    "delimit",
-    "grosser",
-    "wilting",
-    "resound",
-    "jaspers",
-    "exacted",
-    "smetana",
-    "crasher",
-    "hoarded",
-    "noonday",
-    "sinuous",
-    "ettrick",
-    "briefer",
-    "homburg",
-    "revokes",
-    "adjoins",
-    "slatted",
-    "bloomed",
-    "rhombus",
-    "forbear",
-    "quitter",
-    "furtive",
-    "conning",
-    "dippers",
-    "gnocchi",
-    "palfrey",
-    "jawbone",
-    "jejunum",
-    "jackals",
-    "outlive",
-    "bollard",
-    "evacuee",
-    "roundly",
-    "mollusk",
-    "flirted",
-    "toggled",
-    "scuffed",
-    "alveoli",
-    "wellies",
-    "devalue",
-    "gleeful",
-    "cobbles",
-    "proffer",
-    "fussing",
-    "shakily",
-    "pounced",
-    "famines",
-    "oxidize",
-    "policed",
-    "nipping",
-    "baryons",
-    "graphed",
-    "sessile",
-    "fondled",
-    "sporran",
-    "wrinkly",
-    "parsnip",
-    "crewmen",
-    "toughen",
-    "wracked",
-    "dabbled",
-    "piteous",
-    "inching",
-    "tatters",
-    "perfidy",
-    "psalter",
-    "impious",
-    "stilted",
-    "stiffly",
-    "proprio",
-    "clawing",
-    "wrangle",
-    "hogwash",
-    "unkempt",
-    "jotting",
-    "stuarts",
-    "ascents",
-    "draping",
-    "hallows",
-    "decease",
-    "tactful",
-    "friable",
-    "monadic",
-    "yanking",
-    "fawning",
-    "huggers",
-    "psychos",
-    "littler",
-    "funnily",
-    "resents",
-    "nostrum",
-    "treacle",
-    "corrode",
-    "blooper",
-    "amphora",
-    "bourses",
-    "fannies",
-    "filbert",
-    "cutlets",
-    "condors",
-    "leaguer",
-    "plumbed",
-    "glutton",
-    "graying",
-    "wearied",
-    "panoply",
-    "astound",
-    "coiling",
-    "minuses",
-    "narwhal",
-    "whiners",
-    "pitying",
-    "overman",
-    "nullity",
-    "hawkers",
-    "deltoid",
-    "cuddled",
-    "fending",
-    "heavies",
-    "betters",
-    "remarry",
-    "pesetas",
-    "petiole",
-    "veering",
-    "tabbing",
-    "streaky",
-    "rutting",
-    "fevered",
-    "pinches",
-    "chucked",
-    "bugbear",
-    "wreaked",
-    "masques",
-    "gravels",
-    "treetop",
-    "tethers",
-    "dhahran",
-    "sceptic",
-    "fibrils",
-    "eunuchs",
-    "wagered",
-    "cocoons",
-    "shaming",
-    "cutback",
-    "retorts",
-    "troupes",
-    "bungled",
-    "crowing",
-    "birches",
-    "droning",
-    "deviled",
-    "subtler",
-    "predate",
-    "mullets",
-    "lusting",
-    "brimmed",
-    "thrifts",
-    "podiums",
-    "phonons",
-    "salting",
-    "scrawny",
-    "peppery",
-    "splodge",
-    "nymphet",
-    "hernias",
-    "vomited",
-    "dunking",
-    "pouting",
-    "springy",
-    "perplex",
-    "tenures",
-    "ammeter",
-    "squalid",
-    "cinders",
-    "smudges",
-    "preachy",
-    "pilings",
-    "blitzed",
-    "sissies",
-    "gutting",
-    "freemen",
-    "duopoly",
-    "butanol",
-    "hornsey",
-    "shrilly",
-    "turbans",
-    "harping",
-    "beeches",
-    "semites",
-    "tensely",
-    "clamour",
-    "slivers",
-    "radials",
-    "ruffian",
-    "newsman",
-    "ourself",
-    "varmint",
-    "bikeway",
-    "ciliate",
-    "bubonic",
-    "crumbly",
-    "untried",
-    "spaying",
-    "borings",
-    "coppice",
-    "nestles",
-    "goofing",
-    "acerbic",
-    "malayan",
-    "flogged",
-    "dispels",
-    "wagtail",
-    "someway",
-    "flutist",
-    "pervade",
-    "apaches",
-    "diarist",
-    "egotism",
-    "wapping",
-    "foghorn",
-    "affixes",
-    "wallops",
-    "longish",
-    "somalis",
-    "mohican",
-    "buffoon",
-    "rumbled",
-    "pricked",
-    "coppers",
-    "derails",
-    "lollies",
-    "regalis",
-    "timbres",
-    "strudel",
-    "naipaul",
-    "grassed",
-    "gunboat",
-    "saddens",
-    "spangle",
-    "unfazed",
-    "malting",
-    "coterie",
-    "puffins",
-    "caudate",
-    "jailing",
-    "carting",
-    "benzine",
-    "perused",
-    "joinder",
-    "stinker",
-    "quivers",
-    "mulches",
-    "fraying",
-    "cockles",
-    "bucolic",
-    "infuses",
-    "decries",
-    "gruyere",
-    "librium",
-    "tigress",
-    "girlies",
-    "lancets",
-    "gravest",
-    "butting",
-    "gobbled",
-    "minaret",
-    "cupolas",
-    "skewing",
-    "arouses",
-    "fiddled",
-    "reapers",
-    "molders",
-    "uncouth",
-    "hornsea",
-    "portent",
-    "crossly",
-    "blabber",
-    "dowager",
-    "usurper",
-    "grahams",
-    "crazier",
-    "ryedale",
-    "knurled",
-    "instate",
-    "bettors",
-    "gutless",
-    "pulping",
-    "ignoble",
-    "timidly",
-    "greyish",
-    "grimmer",
-    "lookers",
-    "pagodas",
-    "willies",
-    "sickles",
-    "mutters",
-    "squeals",
-    "pfennig",
-    "rustler",
-    "jetties",
-    "civilly",
-    "untaxed",
-    "obligee",
-    "kintyre",
-    "megaton",
-    "shylock",
-    "hoovers",
-    "handers",
-    "gnarled",
-    "splayed",
-    "abactor",
-    "abashed",
-    "abashes",
-    "abasing",
-    "abaters",
-    "abating",
-    "abators",
-    "abducts",
-    "abettor",
-    "abeyant",
-    "abiders",
-    "abjured",
-    "abjurer",
-    "abjures",
-    "ablated",
-    "ablates",
-    "abortus",
-    "abraded",
-    "abrader",
-    "abrades",
-    "abridge",
-    "abscise",
-    "abscond",
-    "abseils",
-    "absente",
-    "absents",
-    "absinth",
-    "abutted",
-    "abutter",
-    "abyssal",
-    "abysses",
-    "acacias",
-    "acanthi",
-    "acceder",
-    "accedes",
-    "accosts",
-    "accrete",
-    "accusal",
-    "acidify",
-    "aconite",
-    "acquest",
-    "acquits",
-    "acridly",
-    "adagios",
-    "addaxes",
-    "addends",
-    "addling",
-    "adducer",
-    "adduces",
-    "adeemed",
-    "adenoid",
-    "adeptly",
-    "adjudge",
-    "adjured",
-    "adjures",
-    "admixed",
-    "admixes",
-    "adorers",
-    "adsorbs",
-    "adulate",
-    "advents",
-    "advisee",
-    "aerates",
-    "aerobes",
-    "affably",
-    "affeers",
-    "affrays",
-    "agelong",
-    "agendum",
-    "aggress",
-    "agilely",
-    "agisted",
-    "agister",
-    "agistor",
-    "agnates",
-    "agnomen",
-    "agonies",
-    "agonise",
-    "agonize",
-    "agotage",
-    "agoutis",
-    "aintree",
-    "airdrop",
-    "airiest",
-    "airings",
-    "airsick",
-    "albinos",
-    "alcalde",
-    "alcoves",
-    "alembic",
-    "alertly",
-    "alewife",
-    "aliened",
-    "alienee",
-    "alienor",
-    "alights",
-    "aliment",
-    "aliquem",
-    "aliunde",
-    "alkalis",
-    "allayed",
-    "allonge",
-    "allonym",
-    "alloyed",
-    "allured",
-    "allures",
-    "alluvia",
-    "allying",
-    "almaria",
-    "almoner",
-    "aloofly",
-    "althorn",
-    "alyssum",
-    "amasses",
-    "amatory",
-    "amblers",
-    "ambling",
-    "amerced",
-    "amerces",
-    "amiably",
-    "amities",
-    "amoebae",
-    "amoebas",
-    "amoebic",
-    "amorist",
-    "amotion",
-    "amplest",
-    "ampoule",
-    "anaemic",
-    "anapest",
-    "andiron",
-    "aneroid",
-    "angliae",
-    "angoras",
-    "angrier",
-    "animist",
-    "aniseed",
-    "anneals",
-    "annelid",
-    "anodise",
-    "anodize",
-    "anodyne",
-    "anoints",
-    "anonyme",
-    "anoraks",
-    "anteing",
-    "anthers",
-    "antigun",
-    "antonym",
-    "anywise",
-    "aoudads",
-    "apanage",
-    "aphasic",
-    "aphelia",
-    "aphonia",
-    "apishly",
-    "apnoeas",
-    "apogean",
-    "apogees",
-    "apothem",
-    "appalls",
-    "apposer",
-    "apprise",
-    "apraxia",
-    "aptness",
-    "aquilia",
-    "arbours",
-    "ardency",
-    "areaway",
-    "areolar",
-    "arguers",
-    "argyles",
-    "aridity",
-    "arisaig",
-    "armadas",
-    "armfuls",
-    "armhole",
-    "armless",
-    "armlets",
-    "armload",
-    "armours",
-    "arraign",
-    "arroyos",
-    "artiest",
-    "artless",
-    "asepses",
-    "asepsis",
-    "ashlars",
-    "ashrams",
-    "askance",
-    "asocial",
-    "asperse",
-    "assails",
-    "assayer",
-    "assegai",
-    "assents",
-    "assises",
-    "assizes",
-    "assorts",
-    "assurer",
-    "asylums",
-    "atavism",
-    "athirst",
-    "athwart",
-    "atomise",
-    "atomize",
-    "atoning",
-    "atriums",
-    "attaint",
-    "attires",
-    "attorns",
-    "attunes",
-    "augured",
-    "augusts",
-    "aunties",
-    "aurally",
-    "aureate",
-    "aureole",
-    "auricle",
-    "aurochs",
-    "auroras",
-    "auspice",
-    "autarky",
-    "autocue",
-    "autumns",
-    "avenges",
-    "averred",
-    "avidity",
-    "avocets",
-    "avowals",
-    "avowing",
-    "avowrys",
-    "avulsed",
-    "avulses",
-    "awaking",
-    "azurite",
-    "babbled",
-    "babbles",
-    "babying",
-    "babyish",
-    "babysat",
-    "backbit",
-    "baffler",
-    "baggier",
-    "baggily",
-    "bahaman",
-    "bahrein",
-    "bailees",
-    "bailers",
-    "bailors",
-    "bairiki",
-    "baldest",
-    "baldric",
-    "baleful",
-    "balkier",
-    "balking",
-    "balliol",
-    "balmier",
-    "balsams",
-    "banally",
-    "bandied",
-    "bandies",
-    "baneful",
-    "banques",
-    "bantams",
-    "banters",
-    "baptise",
-    "barbels",
-    "barbing",
-    "bardsey",
-    "bargees",
-    "barging",
-    "barmaid",
-    "barmier",
-    "baronis",
-    "baronum",
-    "barroom",
-    "barters",
-    "basemen",
-    "bassets",
-    "batboys",
-    "bateaux",
-    "batiste",
-    "battens",
-    "battier",
-    "batwing",
-    "baulked",
-    "bawdier",
-    "bawdily",
-    "bawling",
-    "beadier",
-    "beadles",
-    "beatify",
-    "becalms",
-    "becloud",
-    "bedaubs",
-    "bedecks",
-    "bedevil",
-    "bedewed",
-    "bedfast",
-    "bedizen",
-    "bedpans",
-    "bedpost",
-    "bedroll",
-    "bedsock",
-    "bedsore",
-    "beduins",
-    "beefier",
-    "beefing",
-    "beepers",
-    "beetled",
-    "befalls",
-    "befouls",
-    "beggary",
-    "begirds",
-    "begrime",
-    "beguile",
-    "beheads",
-    "behinds",
-    "beholds",
-    "behoove",
-    "behoved",
-    "behoves",
-    "bejewel",
-    "belabor",
-    "belayed",
-    "belched",
-    "belches",
-    "belisha",
-    "bellboy",
-    "bellhop",
-    "bellmen",
-    "belying",
-    "bemired",
-    "bemires",
-    "bemoans",
-    "bemuses",
-    "benched",
-    "benison",
-    "benumbs",
-    "berated",
-    "berates",
-    "berbers",
-    "bereave",
-    "berthed",
-    "besiege",
-    "besmear",
-    "bespeak",
-    "besting",
-    "bestirs",
-    "bestrew",
-    "betaken",
-    "betakes",
-    "bethink",
-    "betided",
-    "betides",
-    "betimes",
-    "betoken",
-    "betroth",
-    "betties",
-    "bewails",
-    "bewared",
-    "bewares",
-    "bewitch",
-    "bezique",
-    "biassed",
-    "bibelot",
-    "bickers",
-    "biddies",
-    "biennia",
-    "bighead",
-    "bigness",
-    "bigwigs",
-    "bilboes",
-    "bilious",
-    "bilking",
-    "billers",
-    "billows",
-    "billowy",
-    "bindles",
-    "bionics",
-    "biopics",
-    "bipedal",
-    "birdied",
-    "birthed",
-    "biryani",
-    "bisects",
-    "bisques",
-    "bitable",
-    "bitched",
-    "bivouac",
-    "blabbed",
-    "blacken",
-    "blander",
-    "blandly",
-    "blanker",
-    "blaydon",
-    "blazons",
-    "bleaker",
-    "bleakly",
-    "bleared",
-    "bleated",
-    "bleeped",
-    "bleeper",
-    "blether",
-    "blights",
-    "blighty",
-    "blinker",
-    "blipped",
-    "blither",
-    "blitzes",
-    "bloater",
-    "blonder",
-    "blotchy",
-    "bloused",
-    "blouson",
-    "blowfly",
-    "blowgun",
-    "blucher",
-    "bluffed",
-    "bluffer",
-    "blunter",
-    "blusher",
-    "boaster",
-    "boatels",
-    "boatmen",
-    "bobbies",
-    "bobbled",
-    "bobbles",
-    "bobtail",
-    "bodging",
-    "bodices",
-    "bodkins",
-    "bodying",
-    "boeings",
-    "boffins",
-    "bogeyed",
-    "boggier",
-    "bogging",
-    "boggled",
-    "boilary",
-    "boleros",
-    "boletus",
-    "bolshie",
-    "boluses",
-    "bombast",
-    "bonbons",
-    "bonging",
-    "bongoes",
-    "boniest",
-    "bonitos",
-    "bonking",
-    "bonnier",
-    "booboos",
-    "boodles",
-    "boogied",
-    "boogies",
-    "boohoos",
-    "bookend",
-    "bookers",
-    "boorish",
-    "bootees",
-    "boozers",
-    "boozier",
-    "boozing",
-    "bopping",
-    "borates",
-    "borscht",
-    "borstal",
-    "borzois",
-    "bosomed",
-    "bossily",
-    "bossing",
-    "botches",
-    "bothies",
-    "bottler",
-    "botulin",
-    "bounder",
-    "bovines",
-    "bowline",
-    "bowmore",
-    "boxcars",
-    "brachia",
-    "bradawl",
-    "bragger",
-    "braises",
-    "brambly",
-    "brashly",
-    "brasses",
-    "bravoes",
-    "bravura",
-    "brawled",
-    "brawler",
-    "braying",
-    "brazens",
-    "brazils",
-    "breathy",
-    "breezed",
-    "bretons",
-    "brevets",
-    "bribers",
-    "bricked",
-    "bridals",
-    "bridled",
-    "brigand",
-    "brimful",
-    "brining",
-    "brioche",
-    "brisker",
-    "bristly",
-    "brocage",
-    "brogans",
-    "brogues",
-    "brooded",
-    "brooder",
-    "brooked",
-    "browses",
-    "bruegel",
-    "bruited",
-    "brunets",
-    "brusque",
-    "buckden",
-    "buckram",
-    "budgies",
-    "budging",
-    "buggery",
-    "buglers",
-    "bulbuls",
-    "bulgier",
-    "bulimic",
-    "bulkier",
-    "bulkily",
-    "bulling",
-    "bulrush",
-    "bumbled",
-    "bumbles",
-    "bumming",
-    "bumpier",
-    "bumpily",
-    "bumpkin",
-    "bunging",
-    "bungler",
-    "bungles",
-    "bunions",
-    "bunking",
-    "bunters",
-    "buoying",
-    "burbled",
-    "burbles",
-    "burbots",
-    "burette",
-    "burgage",
-    "burgeon",
-    "burgher",
-    "burgled",
-    "burgles",
-    "burking",
-    "burkism",
-    "burlaps",
-    "burlaws",
-    "burleys",
-    "burlier",
-    "burnish",
-    "burnous",
-    "burping",
-    "burring",
-    "bursars",
-    "busboys",
-    "bushier",
-    "buskers",
-    "busking",
-    "buskins",
-    "busload",
-    "bussing",
-    "bustard",
-    "bustled",
-    "bustles",
-    "busying",
-    "butanes",
-    "butches",
-    "buttals",
-    "butyric",
-    "buzzers",
-    "bygones",
-    "bylines",
-    "byroads",
-    "byronic",
-    "bywords",
-    "cabbala",
-    "cabbies",
-    "cachets",
-    "cackled",
-    "cackles",
-    "caddied",
-    "caddish",
-    "cadenza",
-    "cadgers",
-    "cadging",
-    "caducei",
-    "caesium",
-    "caesura",
-    "caftans",
-    "cagiest",
-    "cagoule",
-    "cahoots",
-    "caimans",
-    "caisson",
-    "caitiff",
-    "cajoled",
-    "cajoles",
-    "calcify",
-    "caldron",
-    "calends",
-    "calicos",
-    "caliphs",
-    "callboy",
-    "calmest",
-    "calomel",
-    "calques",
-    "calumny",
-    "calyces",
-    "calyxes",
-    "camases",
-    "cambers",
-    "cambism",
-    "cambist",
-    "cambium",
-    "cambric",
-    "cameral",
-    "canapes",
-    "canards",
-    "cancans",
-    "candled",
-    "candour",
-    "cankers",
-    "cannier",
-    "cannily",
-    "canonic",
-    "canters",
-    "canting",
-    "cantles",
-    "cantors",
-    "cantred",
-    "capably",
-    "capered",
-    "capfuls",
-    "caporal",
-    "capsize",
-    "capstan",
-    "carafes",
-    "caravel",
-    "carboys",
-    "careens",
-    "carfare",
-    "carhops",
-    "carious",
-    "carload",
-    "carnets",
-    "caroled",
-    "caroler",
-    "caromed",
-    "carouse",
-    "carping",
-    "carrels",
-    "carroty",
-    "carsick",
-    "cartage",
-    "casabas",
-    "cascara",
-    "cassare",
-    "cassias",
-    "cassock",
-    "castled",
-    "casuist",
-    "catalla",
-    "catalpa",
-    "catarrh",
-    "catbird",
-    "catcall",
-    "catkins",
-    "catlike",
-    "catmint",
-    "catnaps",
-    "catnips",
-    "cattalo",
-    "cattier",
-    "cattily",
-    "caulked",
-    "cavemen",
-    "caviare",
-    "caviled",
-    "caviler",
-    "cavorts",
-    "caymans",
-    "cedilla",
-    "celebes",
-    "censers",
-    "censive",
-    "centals",
-    "centavo",
-    "centena",
-    "centime",
-    "centimo",
-    "cerebra",
-    "cessare",
-    "cessors",
-    "cesspit",
-    "cestuis",
-    "ceteris",
-    "chacers",
-    "chadors",
-    "chaffed",
-    "chaises",
-    "chalder",
-    "chamfer",
-    "champed",
-    "chancer",
-    "chancre",
-    "chantey",
-    "chapati",
-    "chardin",
-    "charier",
-    "charily",
-    "charnel",
-    "chassid",
-    "chasten",
-    "cheapen",
-    "cheeped",
-    "cheerio",
-    "cheesed",
-    "chequer",
-    "cheroot",
-    "chervil",
-    "chewier",
-    "chidden",
-    "chiding",
-    "chigger",
-    "chignon",
-    "chinked",
-    "chinned",
-    "chintzy",
-    "chirped",
-    "chirrup",
-    "chivied",
-    "chivies",
-    "chloral",
-    "choicer",
-    "choosey",
-    "choreic",
-    "chorine",
-    "chortle",
-    "chromes",
-    "chromic",
-    "chuffed",
-    "chugged",
-    "chukkas",
-    "chukker",
-    "chummed",
-    "ciboria",
-    "cinched",
-    "cinches",
-    "circlet",
-    "cirques",
-    "citator",
-    "citrons",
-    "civilis",
-    "civvies",
-    "clabber",
-    "clacked",
-    "clamber",
-    "clammed",
-    "clamors",
-    "clanged",
-    "clanger",
-    "clangor",
-    "clanked",
-    "claques",
-    "clarets",
-    "clausit",
-    "clausum",
-    "clerked",
-    "clinked",
-    "clipeus",
-    "cliquey",
-    "cloches",
-    "cloeres",
-    "clomped",
-    "clopped",
-    "clotted",
-    "cloughs",
-    "clouted",
-    "clovers",
-    "clowned",
-    "cloying",
-    "clubbed",
-    "clucked",
-    "clueing",
-    "clumped",
-    "coarsen",
-    "coasted",
-    "cockade",
-    "cockers",
-    "cockets",
-    "cockier",
-    "cockily",
-    "coddled",
-    "coddler",
-    "coddles",
-    "codfish",
-    "codgers",
-    "codices",
-    "codicil",
-    "codling",
-    "coequal",
-    "coerces",
-    "coevals",
-    "cogency",
-    "cognacs",
-    "cohabit",
-    "cohered",
-    "coheres",
-    "coifing",
-    "coition",
-    "coladas",
-    "colditz",
-    "colicky",
-    "collude",
-    "colossi",
-    "coltish",
-    "combust",
-    "comfier",
-    "comfits",
-    "commote",
-    "compeer",
-    "compere",
-    "conches",
-    "concoct",
-    "concuss",
-    "condign",
-    "condole",
-    "conduce",
-    "confabs",
-    "confute",
-    "congaed",
-    "congeal",
-    "congers",
-    "congest",
-    "conjoin",
-    "conkers",
-    "conking",
-    "connate",
-    "connive",
-    "connote",
-    "consols",
-    "consomm",
-    "constat",
-    "contemn",
-    "contort",
-    "contuse",
-    "conusee",
-    "convoke",
-    "coolies",
-    "cooping",
-    "cooties",
-    "copeman",
-    "copemen",
-    "copepod",
-    "copings",
-    "coppery",
-    "copping",
-    "copular",
-    "copulas",
-    "copyist",
-    "coquina",
-    "coracle",
-    "corbels",
-    "cordite",
-    "cordons",
-    "corkage",
-    "corkers",
-    "corking",
-    "cornage",
-    "corncob",
-    "corneas",
-    "cornets",
-    "cornier",
-    "cornrow",
-    "corodio",
-    "coronae",
-    "coronas",
-    "corrals",
-    "cortege",
-    "corvees",
-    "corvine",
-    "coshing",
-    "cosiest",
-    "cosines",
-    "cossets",
-    "costive",
-    "cotland",
-    "cotters",
-    "cottier",
-    "cottony",
-    "coucher",
-    "coulees",
-    "coursed",
-    "courser",
-    "coverts",
-    "cowbird",
-    "cowered",
-    "cowhand",
-    "cowherd",
-    "cowlick",
-    "cowpoke",
-    "cowries",
-    "cowshed",
-    "cowslip",
-    "coxcomb",
-    "coyness",
-    "cozened",
-    "crabbed",
-    "cragged",
-    "crammer",
-    "crampon",
-    "cranage",
-    "craning",
-    "cranker",
-    "crapped",
-    "crasser",
-    "crassly",
-    "cravats",
-    "cravens",
-    "crazily",
-    "crazing",
-    "creaked",
-    "creches",
-    "credere",
-    "cremate",
-    "crenate",
-    "creoles",
-    "creosol",
-    "cretans",
-    "cretins",
-    "crewels",
-    "crewing",
-    "cribbed",
-    "crimina",
-    "cringed",
-    "cringes",
-    "crisped",
-    "crisply",
-    "croaked",
-    "crocked",
-    "crofter",
-    "croises",
-    "crooned",
-    "crosier",
-    "crouton",
-    "crudest",
-    "crudits",
-    "crudity",
-    "crueler",
-    "cruller",
-    "crumbed",
-    "crumpet",
-    "crumple",
-    "crupper",
-    "cryogen",
-    "cubbing",
-    "cubical",
-    "cubists",
-    "cuckoos",
-    "cudgels",
-    "cuffing",
-    "cuirass",
-    "cultist",
-    "cumbers",
-    "cumnock",
-    "cupfuls",
-    "cuprous",
-    "curably",
-    "curates",
-    "curdled",
-    "curdles",
-    "curette",
-    "curlews",
-    "curlier",
-    "curnock",
-    "curtesy",
-    "curtsey",
-    "cushier",
-    "cutlers",
-    "cutworm",
-    "cyanate",
-    "cycloid",
-    "cygnets",
-    "cyphers",
-    "dabbing",
-    "dabbler",
-    "dabbles",
-    "dactyls",
-    "dadaism",
-    "dadaist",
-    "dahomey",
-    "dallied",
-    "dallies",
-    "damasks",
-    "damming",
-    "damnify",
-    "dampens",
-    "dampish",
-    "damsons",
-    "dandier",
-    "dandies",
-    "dandify",
-    "dandily",
-    "dandled",
-    "dandles",
-    "dangled",
-    "dankest",
-    "dantean",
-    "daphnes",
-    "dapping",
-    "dapples",
-    "darkens",
-    "darnels",
-    "darners",
-    "darning",
-    "darrein",
-    "darters",
-    "dashers",
-    "dashiki",
-    "datable",
-    "datives",
-    "daubers",
-    "daubing",
-    "daunted",
-    "dawdled",
-    "dawdler",
-    "dawdles",
-    "daysman",
-    "daysmen",
-    "dazedly",
-    "dazzler",
-    "dazzles",
-    "deadens",
-    "deadest",
-    "deafens",
-    "deafest",
-    "debarks",
-    "debased",
-    "debases",
-    "debauch",
-    "debilis",
-    "debitor",
-    "debtees",
-    "debunks",
-    "decagon",
-    "decamps",
-    "decants",
-    "deceits",
-    "decenna",
-    "decider",
-    "deckled",
-    "deckles",
-    "declaim",
-    "declass",
-    "decocts",
-    "decoyed",
-    "dedimus",
-    "deduces",
-    "deducts",
-    "deeding",
-    "defaces",
-    "defamed",
-    "defames",
-    "defenso",
-    "defiles",
-    "definer",
-    "defocus",
-    "deforce",
-    "deforms",
-    "defrays",
-    "defrock",
-    "deftest",
-    "defused",
-    "defuses",
-    "degauss",
-    "dehisce",
-    "deified",
-    "deifies",
-    "deigned",
-    "deistic",
-    "delator",
-    "delicti",
-    "delicto",
-    "delicts",
-    "delouse",
-    "delphic",
-    "deludes",
-    "deluged",
-    "deluges",
-    "demaine",
-    "demains",
-    "demeans",
-    "dements",
-    "demerit",
-    "demesne",
-    "demigod",
-    "demised",
-    "demises",
-    "demists",
-    "demotes",
-    "demurer",
-    "denarii",
-    "deniers",
-    "denized",
-    "denizen",
-    "denizes",
-    "densest",
-    "dentine",
-    "denting",
-    "denuded",
-    "denudes",
-    "deodand",
-    "deplane",
-    "deports",
-    "deposes",
-    "deprave",
-    "deputed",
-    "deputes",
-    "deraign",
-    "derange",
-    "derbies",
-    "derides",
-    "desalts",
-    "descant",
-    "desists",
-    "despoil",
-    "despond",
-    "despots",
-    "destine",
-    "detains",
-    "detests",
-    "detinet",
-    "detinue",
-    "detrain",
-    "devests",
-    "devilry",
-    "devisee",
-    "devisor",
-    "devours",
-    "dewdrop",
-    "dewiest",
-    "dewlaps",
-    "dextral",
-    "dextras",
-    "dextrin",
-    "diadems",
-    "dialled",
-    "dialler",
-    "dialyse",
-    "dialyze",
-    "diarium",
-    "dibasic",
-    "dibbled",
-    "dibbles",
-    "dibrell",
-    "diciest",
-    "dickers",
-    "dickeys",
-    "dictums",
-    "diddled",
-    "diddles",
-    "digamas",
-    "dignify",
-    "diktats",
-    "dilates",
-    "dilator",
-    "dillies",
-    "dilutes",
-    "dimmest",
-    "dimness",
-    "dimorph",
-    "dimwits",
-    "dingier",
-    "dinging",
-    "dingoes",
-    "dinkier",
-    "diorite",
-    "diptych",
-    "direful",
-    "dirndls",
-    "dirtied",
-    "dirtier",
-    "dirties",
-    "dirtily",
-    "disalts",
-    "disarms",
-    "disavow",
-    "disbars",
-    "discoed",
-    "discoid",
-    "dishier",
-    "dishrag",
-    "disjoin",
-    "disking",
-    "dismays",
-    "disowns",
-    "disport",
-    "disrate",
-    "disrobe",
-    "distaff",
-    "distend",
-    "distils",
-    "ditcher",
-    "dithers",
-    "ditties",
-    "dittoed",
-    "divests",
-    "divined",
-    "diviner",
-    "divines",
-    "divisim",
-    "divvied",
-    "divvies",
-    "dizzied",
-    "dizzier",
-    "dizzies",
-    "dizzily",
-    "docents",
-    "dockage",
-    "dodders",
-    "dodgems",
-    "dodgier",
-    "doeskin",
-    "doffing",
-    "dogcart",
-    "doggers",
-    "doggone",
-    "doglegs",
-    "dogsled",
-    "dogtrot",
-    "doitkin",
-    "doleful",
-    "dolling",
-    "dollops",
-    "dolmans",
-    "dolmens",
-    "doltish",
-    "domicil",
-    "donatio",
-    "donator",
-    "donnish",
-    "doodads",
-    "doodled",
-    "doodler",
-    "dooming",
-    "doormen",
-    "dopiest",
-    "dorados",
-    "dormers",
-    "dormice",
-    "dorture",
-    "dossers",
-    "dotards",
-    "dottier",
-    "dotting",
-    "doubter",
-    "douched",
-    "douches",
-    "dourest",
-    "dousing",
-    "dowable",
-    "dowdier",
-    "dowdily",
-    "doweled",
-    "dowered",
-    "dowment",
-    "downier",
-    "dowress",
-    "dowries",
-    "dowsers",
-    "doziest",
-    "drabber",
-    "drachma",
-    "draftee",
-    "dragger",
-    "draggle",
-    "drapers",
-    "drawees",
-    "drawled",
-    "drayage",
-    "dredger",
-    "dredges",
-    "drenges",
-    "driblet",
-    "drivels",
-    "drizzly",
-    "drogues",
-    "droller",
-    "drooled",
-    "drooped",
-    "drovers",
-    "drowsed",
-    "drowses",
-    "drubbed",
-    "drudged",
-    "drudges",
-    "drumlin",
-    "drummed",
-    "drunker",
-    "dryings",
-    "duarchy",
-    "dubiety",
-    "duchies",
-    "dudgeon",
-    "duelers",
-    "duelled",
-    "dueller",
-    "duffers",
-    "dugongs",
-    "dugouts",
-    "dukedom",
-    "dullard",
-    "dullest",
-    "dulling",
-    "dumdums",
-    "dummodo",
-    "dumpier",
-    "dunlins",
-    "dunnage",
-    "dunwich",
-    "duodena",
-    "durably",
-    "durance",
-    "durmast",
-    "duskier",
-    "dustier",
-    "dustman",
-    "dustmen",
-    "dustpan",
-    "duteous",
-    "dwelled",
-    "dynamos",
-    "dynasts",
-    "dynodes",
-    "eaglets",
-    "earflap",
-    "earfuls",
-    "earldom",
-    "earlobe",
-    "earmuff",
-    "earplug",
-    "earthed",
-    "earwigs",
-    "easters",
-    "eastnor",
-    "eatable",
-    "ebonies",
-    "ebriety",
-    "echidna",
-    "eclairs",
-    "eclogue",
-    "ecocide",
-    "ecotype",
-    "eddying",
-    "edgiest",
-    "edgings",
-    "edified",
-    "edifies",
-    "educing",
-    "eeriest",
-    "effaced",
-    "effaces",
-    "effused",
-    "effuses",
-    "eggcups",
-    "egghead",
-    "eggnogs",
-    "egoists",
-    "egotist",
-    "eidetic",
-    "eighths",
-    "elapses",
-    "elating",
-    "elbowed",
-    "elegiac",
-    "elegies",
-    "elegise",
-    "elegize",
-    "elenchi",
-    "eliding",
-    "elision",
-    "elisors",
-    "elixirs",
-    "eloping",
-    "elstree",
-    "eluding",
-    "elusion",
-    "embalms",
-    "embanks",
-    "embolic",
-    "embolus",
-    "embower",
-    "embroil",
-    "emended",
-    "emetics",
-    "emoting",
-    "empanel",
-    "empiric",
-    "emplead",
-    "emptier",
-    "emptily",
-    "emulous",
-    "enactor",
-    "enamors",
-    "enamour",
-    "encamps",
-    "encases",
-    "enchain",
-    "encored",
-    "encrust",
-    "endears",
-    "endives",
-    "endmost",
-    "enduing",
-    "endways",
-    "endwise",
-    "enfeoff",
-    "enflame",
-    "enfolds",
-    "engirds",
-    "engorge",
-    "engraft",
-    "engross",
-    "engulfs",
-    "enigmas",
-    "enjoins",
-    "enlaced",
-    "ennoble",
-    "enplane",
-    "enrages",
-    "enrolee",
-    "enseals",
-    "ensigns",
-    "ensiled",
-    "ensiles",
-    "ensnare",
-    "entebbe",
-    "enthral",
-    "enthuse",
-    "entices",
-    "entombs",
-    "entrain",
-    "entraps",
-    "entwine",
-    "enuring",
-    "envenom",
-    "envying",
-    "enwraps",
-    "eoliths",
-    "epaulet",
-    "epicene",
-    "epigram",
-    "epochal",
-    "eponyms",
-    "equable",
-    "equably",
-    "equerry",
-    "equines",
-    "erectly",
-    "eremite",
-    "ermines",
-    "eructed",
-    "escapee",
-    "escheat",
-    "eschews",
-    "escudos",
-    "eskdale",
-    "esparto",
-    "espying",
-    "essayed",
-    "essoins",
-    "esteems",
-    "estover",
-    "estrays",
-    "estreat",
-    "estrepe",
-    "estrous",
-    "etagere",
-    "eugenic",
-    "euphony",
-    "evictor",
-    "evinces",
-    "examens",
-    "excepts",
-    "excises",
-    "excreta",
-    "excrete",
-    "excusat",
-    "exedras",
-    "exegete",
-    "exempla",
-    "exempli",
-    "exhales",
-    "exhorts",
-    "exhumes",
-    "exiling",
-    "exogamy",
-    "expends",
-    "expiate",
-    "exposit",
-    "extolls",
-    "extorts",
-    "extrude",
-    "exuding",
-    "exulted",
-    "eyebolt",
-    "eyecups",
-    "eyefuls",
-    "fabliau",
-    "facings",
-    "faddish",
-    "fadeout",
-    "faeroes",
-    "fagging",
-    "faience",
-    "falcare",
-    "falloff",
-    "falsest",
-    "fancily",
-    "fanfold",
-    "fangled",
-    "fantail",
-    "fantods",
-    "farceur",
-    "fardels",
-    "farleus",
-    "farrago",
-    "farvand",
-    "fastens",
-    "fatales",
-    "fatness",
-    "fattens",
-    "fattier",
-    "fatuity",
-    "fatuous",
-    "fautors",
-    "fauvism",
-    "favorer",
-    "feasant",
-    "feasted",
-    "fedoras",
-    "feebler",
-    "feelers",
-    "feinted",
-    "fellers",
-    "fenatio",
-    "fencers",
-    "fenians",
-    "feodary",
-    "feoffee",
-    "feoffor",
-    "ferarum",
-    "fermium",
-    "fermory",
-    "fernery",
-    "ferried",
-    "ferules",
-    "festers",
-    "festoon",
-    "fetidly",
-    "fetlock",
-    "fettled",
-    "fettles",
-    "feudary",
-    "fiances",
-    "fiascos",
-    "fibbers",
-    "fibbing",
-    "fibulas",
-    "fickler",
-    "fictive",
-    "fidgets",
-    "fidgety",
-    "fiefdom",
-    "fiercer",
-    "fierier",
-    "fierily",
-    "fifthly",
-    "fijians",
-    "filacer",
-    "filched",
-    "filches",
-    "filiate",
-    "fillips",
-    "filmdom",
-    "filmier",
-    "finable",
-    "finagle",
-    "finales",
-    "finalis",
-    "finical",
-    "finites",
-    "finitio",
-    "finking",
-    "firebug",
-    "firedog",
-    "firkins",
-    "firmest",
-    "fishier",
-    "fishily",
-    "fistuca",
-    "fitchew",
-    "fixable",
-    "fixates",
-    "fixedly",
-    "fizzing",
-    "fizzled",
-    "fizzles",
-    "flacons",
-    "flagons",
-    "flailed",
-    "flakier",
-    "flapped",
-    "flatcar",
-    "flatlet",
-    "flatted",
-    "flattop",
-    "flaunts",
-    "flaying",
-    "flecked",
-    "fledges",
-    "fleeced",
-    "fleeted",
-    "fleeter",
-    "fleshes",
-    "fleshly",
-    "flexors",
-    "flighty",
-    "flitted",
-    "flogger",
-    "florins",
-    "flosses",
-    "flotage",
-    "flounce",
-    "flouted",
-    "flowage",
-    "flubbed",
-    "fluffed",
-    "fluidly",
-    "flummox",
-    "flunked",
-    "flunkey",
-    "fluster",
-    "fluting",
-    "fluvius",
-    "fluxing",
-    "flyleaf",
-    "flypast",
-    "flytrap",
-    "flyways",
-    "foaling",
-    "foamier",
-    "fobbing",
-    "focally",
-    "foggier",
-    "foggily",
-    "foiling",
-    "foisted",
-    "foldage",
-    "folgers",
-    "foliate",
-    "folkway",
-    "foments",
-    "fondles",
-    "fondues",
-    "fonttbl",
-    "foolery",
-    "footmen",
-    "footpad",
-    "footsie",
-    "foppery",
-    "foppish",
-    "foraged",
-    "forager",
-    "foraker",
-    "forayed",
-    "forbore",
-    "fording",
-    "foreleg",
-    "forepaw",
-    "forgers",
-    "forgoes",
-    "forgone",
-    "forkful",
-    "formata",
-    "forsook",
-    "fortuit",
-    "forwent",
-    "foulard",
-    "foulest",
-    "fowling",
-    "foxhall",
-    "foxhole",
-    "foxiest",
-    "fractio",
-    "frailer",
-    "francum",
-    "franked",
-    "franker",
-    "frappes",
-    "frazzle",
-    "freckle",
-    "frescos",
-    "freshet",
-    "fretful",
-    "fretsaw",
-    "friezes",
-    "frights",
-    "frilled",
-    "frisked",
-    "fritter",
-    "frizzed",
-    "frizzes",
-    "frizzle",
-    "frogmen",
-    "frolics",
-    "fronton",
-    "frothed",
-    "fructus",
-    "fruited",
-    "frustra",
-    "frustum",
-    "fuddled",
-    "fuddles",
-    "fudging",
-    "fugator",
-    "fullers",
-    "fulmars",
-    "fulsome",
-    "fumbler",
-    "funfair",
-    "fungoid",
-    "fungous",
-    "funkier",
-    "funking",
-    "funning",
-    "furandi",
-    "furbish",
-    "furiosi",
-    "furling",
-    "furores",
-    "furrier",
-    "furring",
-    "fussier",
-    "fussily",
-    "fusspot",
-    "fustian",
-    "fustier",
-    "fuzzier",
-    "fuzzily",
-    "gabbers",
-    "gabbier",
-    "gabbing",
-    "gabbled",
-    "gabbles",
-    "gabelle",
-    "gabfest",
-    "gadding",
-    "gaffers",
-    "gaffing",
-    "gaggles",
-    "gainage",
-    "gainery",
-    "gainsay",
-    "galling",
-    "galloon",
-    "gallops",
-    "gambits",
-    "gambols",
-    "gambrel",
-    "gamiest",
-    "ganders",
-    "ganging",
-    "gangues",
-    "gangway",
-    "gannets",
-    "gantlet",
-    "gaolers",
-    "gaoling",
-    "garaged",
-    "garbing",
-    "garbles",
-    "gardein",
-    "garenes",
-    "garfish",
-    "gargled",
-    "gargles",
-    "garrets",
-    "garrote",
-    "gascony",
-    "gashing",
-    "gasohol",
-    "gassers",
-    "gassier",
-    "gateaus",
-    "gateaux",
-    "gaudier",
-    "gaudily",
-    "gaugers",
-    "gaunter",
-    "gauntly",
-    "gausses",
-    "gavials",
-    "gavotte",
-    "gawkier",
-    "gawking",
-    "gayness",
-    "gazumps",
-    "geckoes",
-    "geezers",
-    "gefilte",
-    "geishas",
-    "gelling",
-    "gemlike",
-    "gemsbok",
-    "geneses",
-    "genevan",
-    "genitor",
-    "gentium",
-    "gentled",
-    "gentles",
-    "georgic",
-    "gerunds",
-    "gessoes",
-    "gestate",
-    "gestors",
-    "gewgaws",
-    "gherkin",
-    "ghosted",
-    "ghoulie",
-    "gibbers",
-    "gibbets",
-    "giblets",
-    "giddier",
-    "giddies",
-    "giddily",
-    "giggler",
-    "gigolos",
-    "gimbals",
-    "gimlets",
-    "gimping",
-    "gingers",
-    "ginning",
-    "gipsies",
-    "girante",
-    "girding",
-    "girdled",
-    "gizzard",
-    "gladder",
-    "glamors",
-    "glassed",
-    "glibber",
-    "glinted",
-    "glisten",
-    "glister",
-    "gloated",
-    "gloater",
-    "globate",
-    "globule",
-    "glommed",
-    "gloried",
-    "glossae",
-    "glossas",
-    "glottal",
-    "glottis",
-    "glovers",
-    "gloving",
-    "glowers",
-    "glummer",
-    "gluteus",
-    "glutted",
-    "gnashed",
-    "gnashes",
-    "gnomish",
-    "gnomons",
-    "goading",
-    "goatees",
-    "gobbler",
-    "godsons",
-    "goggled",
-    "goiters",
-    "goitres",
-    "gomorra",
-    "goobers",
-    "goodish",
-    "goofier",
-    "googols",
-    "gooiest",
-    "gooneys",
-    "goosing",
-    "gorging",
-    "goriest",
-    "gossipy",
-    "gourock",
-    "gracing",
-    "grackle",
-    "gradate",
-    "grafter",
-    "grampus",
-    "grandam",
-    "grandee",
-    "grandly",
-    "granges",
-    "granter",
-    "grapnel",
-    "grasser",
-    "grassum",
-    "graters",
-    "gratiae",
-    "gravies",
-    "grazers",
-    "grazier",
-    "greaser",
-    "grecism",
-    "greened",
-    "greyest",
-    "greying",
-    "greylag",
-    "grimier",
-    "grimily",
-    "griming",
-    "gringos",
-    "griping",
-    "grippes",
-    "gristle",
-    "gristly",
-    "gritted",
-    "gritter",
-    "grizzle",
-    "grottos",
-    "groused",
-    "grouses",
-    "grouted",
-    "grovels",
-    "grownup",
-    "groynes",
-    "grubbed",
-    "grudged",
-    "gruffly",
-    "grumped",
-    "grunion",
-    "guanaco",
-    "gudgeon",
-    "guelphs",
-    "guertin",
-    "guffaws",
-    "guinean",
-    "gulches",
-    "gullets",
-    "gulling",
-    "gumboil",
-    "gumboot",
-    "gumdrop",
-    "gummier",
-    "gumming",
-    "gumshoe",
-    "gunlock",
-    "gunnies",
-    "gunplay",
-    "gunwale",
-    "guppies",
-    "gurgled",
-    "gurgles",
-    "gurkhas",
-    "gurneys",
-    "gussets",
-    "gustier",
-    "guzzled",
-    "guzzles",
-    "gypping",
-    "gyrated",
-    "gyrates",
-    "gyrator",
-    "habitue",
-    "hackies",
-    "hackles",
-    "hafnium",
-    "hafting",
-    "hagfish",
-    "haggled",
-    "haggler",
-    "haggles",
-    "hailers",
-    "hairdos",
-    "hairier",
-    "halberd",
-    "halimas",
-    "halloos",
-    "halvahs",
-    "halyard",
-    "handcar",
-    "handier",
-    "handsaw",
-    "handsel",
-    "hangdog",
-    "hangmen",
-    "hankers",
-    "hankies",
-    "hardier",
-    "hardrow",
-    "harelip",
-    "haricot",
-    "hariots",
-    "harking",
-    "harlech",
-    "harlots",
-    "harpies",
-    "harrows",
-    "hasidim",
-    "hassled",
-    "hassock",
-    "hastens",
-    "hastier",
-    "hatband",
-    "hatless",
-    "hatpins",
-    "hatreds",
-    "hauberk",
-    "haulier",
-    "haunchs",
-    "hauteur",
-    "hawsers",
-    "hayloft",
-    "haymows",
-    "hayrack",
-    "hayrick",
-    "haziest",
-    "headier",
-    "headily",
-    "headman",
-    "headmen",
-    "headpin",
-    "hearses",
-    "hearten",
-    "hearths",
-    "hebraic",
-    "heckled",
-    "heckles",
-    "hectors",
-    "hedgers",
-    "heedful",
-    "heehaws",
-    "heelers",
-    "heeling",
-    "heftier",
-    "hefting",
-    "heirdom",
-    "heisted",
-    "helixes",
-    "hellion",
-    "helloed",
-    "hemline",
-    "henbane",
-    "hennaed",
-    "henpeck",
-    "henries",
-    "herbage",
-    "heredes",
-    "heriots",
-    "hertzog",
-    "hexapod",
-    "heydays",
-    "heysham",
-    "hibachi",
-    "hickeys",
-    "hidings",
-    "highboy",
-    "higlers",
-    "hijacks",
-    "hillock",
-    "hinging",
-    "hipbone",
-    "hipline",
-    "hirable",
-    "hitcher",
-    "hitless",
-    "hoarder",
-    "hoarier",
-    "hoarser",
-    "hoaxers",
-    "hoaxing",
-    "hobbles",
-    "hobnail",
-    "hobnobs",
-    "hogback",
-    "hoggish",
-    "hogweed",
-    "holbein",
-    "hollers",
-    "holmium",
-    "homager",
-    "homiest",
-    "homines",
-    "homonym",
-    "honchos",
-    "honeste",
-    "honeyed",
-    "honiara",
-    "honkers",
-    "honkies",
-    "honoris",
-    "hooding",
-    "hoofers",
-    "hoofing",
-    "hookahs",
-    "hooping",
-    "hoopoes",
-    "hoorays",
-    "hooting",
-    "hornier",
-    "horrify",
-    "horsing",
-    "hosiers",
-    "hotbeds",
-    "hotfoot",
-    "hothead",
-    "hotting",
-    "howlers",
-    "hoydens",
-    "hoylake",
-    "hubbies",
-    "hubbubs",
-    "huddles",
-    "huffier",
-    "huffily",
-    "huffing",
-    "hulking",
-    "hulling",
-    "hulloed",
-    "humbler",
-    "humbles",
-    "humbugs",
-    "humdrum",
-    "hummock",
-    "humored",
-    "humours",
-    "hunches",
-    "hungers",
-    "hunkers",
-    "hurdled",
-    "hurdler",
-    "hurlers",
-    "hurrahs",
-    "hurrays",
-    "hurries",
-    "hurtled",
-    "hurtles",
-    "hushing",
-    "huskier",
-    "huskily",
-    "husking",
-    "hussars",
-    "hussies",
-    "hustled",
-    "hustles",
-    "hutment",
-    "huzzahs",
-    "hyaline",
-    "hyalite",
-    "hydroid",
-    "hydrous",
-    "hymnals",
-    "hymning",
-    "hymnody",
-    "hyraces",
-    "hyraxes",
-    "hyssops",
-    "iceboat",
-    "iciness",
-    "ideated",
-    "ideates",
-    "identic",
-    "idolise",
-    "idolize",
-    "idoneum",
-    "idoneus",
-    "iffiest",
-    "ignobly",
-    "ileitis",
-    "illogic",
-    "imagoes",
-    "imbibed",
-    "imbibes",
-    "imbrued",
-    "imbrues",
-    "imbuing",
-    "immured",
-    "immures",
-    "impalas",
-    "impales",
-    "impanel",
-    "imparls",
-    "impends",
-    "imperii",
-    "imperil",
-    "impiety",
-    "imposts",
-    "imprest",
-    "impugns",
-    "imputes",
-    "inanely",
-    "inanity",
-    "inbreed",
-    "incepts",
-    "incerta",
-    "incises",
-    "incisor",
-    "inciter",
-    "incites",
-    "inclose",
-    "incolas",
-    "indicts",
-    "indigos",
-    "indorse",
-    "inducts",
-    "indwell",
-    "ineptly",
-    "inermis",
-    "inertly",
-    "infests",
-    "infixed",
-    "infixes",
-    "inflect",
-    "ingenue",
-    "ingests",
-    "ingrain",
-    "ingrate",
-    "inhales",
-    "inhered",
-    "inheres",
-    "inhumed",
-    "inhumes",
-    "injuria",
-    "inkblot",
-    "inkhorn",
-    "inkiest",
-    "inlayed",
-    "instals",
-    "insteps",
-    "instils",
-    "insulae",
-    "intacta",
-    "intoned",
-    "intones",
-    "introit",
-    "intrust",
-    "intuits",
-    "inuring",
-    "inveigh",
-    "invenit",
-    "invitee",
-    "iodides",
-    "iodised",
-    "iodises",
-    "iodized",
-    "iodizes",
-    "ionesco",
-    "ionians",
-    "ionised",
-    "ionises",
-    "ionizes",
-    "irately",
-    "irksome",
-    "irrupts",
-    "isobars",
-    "itchier",
-    "itemise",
-    "ivories",
-    "jabbers",
-    "jabbing",
-    "jacinth",
-    "jackdaw",
-    "jacobin",
-    "jadeite",
-    "jailers",
-    "jailors",
-    "jangled",
-    "jangles",
-    "jarfuls",
-    "jargons",
-    "jaunted",
-    "jayvees",
-    "jaywalk",
-    "jazzier",
-    "jazzing",
-    "jazzman",
-    "jazzmen",
-    "jeering",
-    "jellaba",
-    "jellied",
-    "jemmied",
-    "jemmies",
-    "jennies",
-    "jerboas",
-    "jerkier",
-    "jerkily",
-    "jerkins",
-    "jerries",
-    "jesting",
-    "jetfoil",
-    "jibbing",
-    "jiggers",
-    "jigging",
-    "jiggled",
-    "jiggles",
-    "jilting",
-    "jimmied",
-    "jimmies",
-    "jingled",
-    "jingoes",
-    "jinxing",
-    "jitneys",
-    "jobbers",
-    "jobbery",
-    "jobbing",
-    "jocular",
-    "joggled",
-    "joggles",
-    "joisted",
-    "jollier",
-    "jollity",
-    "jolting",
-    "jonquil",
-    "joshing",
-    "jostens",
-    "jostled",
-    "jostler",
-    "jostles",
-    "jotters",
-    "jounced",
-    "jounces",
-    "jousted",
-    "joyless",
-    "judders",
-    "judices",
-    "judicia",
-    "judicii",
-    "jugfuls",
-    "jugging",
-    "juggled",
-    "juggles",
-    "juicier",
-    "juicily",
-    "jujubes",
-    "jumbles",
-    "jumpier",
-    "jumpily",
-    "juncoes",
-    "junkets",
-    "junking",
-    "junkman",
-    "junkmen",
-    "jurator",
-    "juryman",
-    "jurymen",
-    "kaftans",
-    "kahawai",
-    "kaisers",
-    "karakul",
-    "katydid",
-    "kayoing",
-    "keelage",
-    "keelson",
-    "keenest",
-    "keening",
-    "kenning",
-    "kermess",
-    "ketches",
-    "ketoses",
-    "ketosis",
-    "khedive",
-    "kidders",
-    "kidnaps",
-    "kidskin",
-    "kilberg",
-    "kilketh",
-    "killjoy",
-    "kilobit",
-    "kiloton",
-    "kindles",
-    "kinfolk",
-    "kinglet",
-    "kinkier",
-    "kintles",
-    "kippers",
-    "kipping",
-    "kissers",
-    "kitting",
-    "klaxons",
-    "kludges",
-    "klutzes",
-    "knacker",
-    "knavery",
-    "knavish",
-    "kneaded",
-    "kneecap",
-    "kneeing",
-    "kneeled",
-    "kneeler",
-    "kneepad",
-    "knelled",
-    "knifing",
-    "knishes",
-    "knobbed",
-    "knobbly",
-    "kookier",
-    "kopecks",
-    "koranic",
-    "koshers",
-    "kuleana",
-    "kumquat",
-    "kylesku",
-    "labials",
-    "laciest",
-    "lackeys",
-    "laconic",
-    "lactase",
-    "lacteal",
-    "lacunae",
-    "lacunas",
-    "ladling",
-    "lagenae",
-    "lagenas",
-    "laggard",
-    "laggers",
-    "lambast",
-    "lambent",
-    "lambing",
-    "lamella",
-    "laminas",
-    "lamming",
-    "landaus",
-    "languor",
-    "lankier",
-    "lapdogs",
-    "lappets",
-    "lappish",
-    "lapsing",
-    "lapwing",
-    "larches",
-    "larders",
-    "larding",
-    "largess",
-    "largish",
-    "lariats",
-    "larking",
-    "lassies",
-    "lassoed",
-    "lassoes",
-    "lateens",
-    "lathers",
-    "lathery",
-    "lauding",
-    "laugher",
-    "laxness",
-    "laziest",
-    "leached",
-    "leaches",
-    "leafage",
-    "leafier",
-    "leafing",
-    "leagued",
-    "leakier",
-    "leanest",
-    "leapers",
-    "leashed",
-    "leavens",
-    "lechers",
-    "lechery",
-    "lectors",
-    "leeched",
-    "leering",
-    "legales",
-    "legalis",
-    "legatee",
-    "legates",
-    "legator",
-    "legatos",
-    "leggier",
-    "legging",
-    "legless",
-    "leonine",
-    "leprous",
-    "levelly",
-    "levered",
-    "leveret",
-    "lewdest",
-    "liaised",
-    "liaises",
-    "libbers",
-    "libeled",
-    "libelee",
-    "libeler",
-    "liberum",
-    "libidos",
-    "libyans",
-    "lidless",
-    "lienees",
-    "ligroin",
-    "lilting",
-    "limbers",
-    "limeade",
-    "limners",
-    "limning",
-    "limpets",
-    "linctus",
-    "lindens",
-    "lingoes",
-    "linnets",
-    "lintels",
-    "lionise",
-    "lionize",
-    "liquefy",
-    "lispers",
-    "lisping",
-    "lissome",
-    "litchis",
-    "literae",
-    "lithely",
-    "litotes",
-    "livened",
-    "lividly",
-    "livings",
-    "loaners",
-    "loathes",
-    "lobbing",
-    "lobular",
-    "lobules",
-    "lockjaw",
-    "lodgers",
-    "loftier",
-    "loftily",
-    "lofting",
-    "loggias",
-    "loiters",
-    "lolling",
-    "loofahs",
-    "loonier",
-    "loonies",
-    "loopier",
-    "loosens",
-    "loosest",
-    "lopping",
-    "lording",
-    "lotting",
-    "lotuses",
-    "lounged",
-    "louring",
-    "lousier",
-    "lousily",
-    "lousing",
-    "loutish",
-    "louvres",
-    "lovably",
-    "lowborn",
-    "lowboys",
-    "lowlier",
-    "lowness",
-    "loyally",
-    "lucidly",
-    "luckier",
-    "luggers",
-    "lulling",
-    "lumbago",
-    "lumbers",
-    "lumpier",
-    "lumping",
-    "lumpish",
-    "lunched",
-    "lunette",
-    "lunging",
-    "lupines",
-    "lurched",
-    "lurcher",
-    "lurches",
-    "luridly",
-    "lustier",
-    "lustily",
-    "lutists",
-    "lyceums",
-    "lychees",
-    "lydford",
-    "lynched",
-    "lynches",
-    "machair",
-    "macrons",
-    "maculae",
-    "maddens",
-    "madders",
-    "maddest",
-    "madding",
-    "maenads",
-    "maesteg",
-    "maestri",
-    "mafiosi",
-    "mafioso",
-    "maggoty",
-    "magmata",
-    "magnums",
-    "magueys",
-    "magyars",
-    "mahouts",
-    "mailmen",
-    "maiming",
-    "maintop",
-    "maitres",
-    "majoris",
-    "malefic",
-    "maligns",
-    "mallaig",
-    "mallows",
-    "malmsey",
-    "malodor",
-    "maltase",
-    "mamboed",
-    "mammies",
-    "manacle",
-    "manches",
-    "mangier",
-    "mangles",
-    "manikin",
-    "manilas",
-    "maniocs",
-    "maniple",
-    "manlier",
-    "manlike",
-    "mannish",
-    "mansard",
-    "mantled",
-    "mantrap",
-    "manumit",
-    "marauds",
-    "marcher",
-    "maritus",
-    "marjory",
-    "markush",
-    "marline",
-    "marling",
-    "marmots",
-    "marring",
-    "marrows",
-    "mashers",
-    "mashies",
-    "maskers",
-    "masseur",
-    "massifs",
-    "mastics",
-    "mastoid",
-    "materna",
-    "mattock",
-    "maturer",
-    "matzoth",
-    "maulers",
-    "mauling",
-    "maunder",
-    "mawkish",
-    "maxilla",
-    "maydays",
-    "mayhems",
-    "mazurka",
-    "mbabane",
-    "meadowy",
-    "mealier",
-    "meanies",
-    "meatier",
-    "meddled",
-    "meddler",
-    "meddles",
-    "medicos",
-    "medlars",
-    "medleys",
-    "medusas",
-    "meekest",
-    "megohms",
-    "megrims",
-    "meioses",
-    "mellows",
-    "membrum",
-    "menaced",
-    "menaces",
-    "menages",
-    "menders",
-    "mendips",
-    "menfolk",
-    "menials",
-    "menisci",
-    "mensaes",
-    "meowing",
-    "mercati",
-    "mercers",
-    "mercian",
-    "merinos",
-    "merlons",
-    "mescals",
-    "messily",
-    "mestizo",
-    "metonym",
-    "metopes",
-    "mettles",
-    "mewling",
-    "miaowed",
-    "miasmal",
-    "miasmas",
-    "miasmic",
-    "micelle",
-    "middies",
-    "middles",
-    "midribs",
-    "midriff",
-    "midways",
-    "miffing",
-    "mildest",
-    "mildews",
-    "milfoil",
-    "milieus",
-    "milieux",
-    "milkier",
-    "milkmen",
-    "milksop",
-    "milldam",
-    "millets",
-    "milting",
-    "mimesis",
-    "mimosas",
-    "mincing",
-    "mingles",
-    "minicab",
-    "minorca",
-    "minoris",
-    "mintage",
-    "minters",
-    "minting",
-    "minuend",
-    "minuets",
-    "minuted",
-    "minutia",
-    "mirages",
-    "miscall",
-    "miscast",
-    "miscued",
-    "miscues",
-    "misdate",
-    "misdeal",
-    "misdeed",
-    "miserly",
-    "misfire",
-    "mishear",
-    "mislaid",
-    "mislays",
-    "misname",
-    "misplay",
-    "misrule",
-    "missals",
-    "missies",
-    "missort",
-    "misstep",
-    "misters",
-    "mistier",
-    "mistily",
-    "mistime",
-    "misuser",
-    "misuses",
-    "mitered",
-    "mitoses",
-    "mitring",
-    "mixable",
-    "mixtion",
-    "mizzens",
-    "moaners",
-    "mobbing",
-    "mobilia",
-    "mockers",
-    "modally",
-    "moiling",
-    "moister",
-    "moistly",
-    "moldier",
-    "molests",
-    "mollies",
-    "mollify",
-    "mollusc",
-    "molting",
-    "moneyed",
-    "monists",
-    "monkish",
-    "monocle",
-    "monolog",
-    "mooched",
-    "moocher",
-    "mooches",
-    "moodier",
-    "moodily",
-    "moonier",
-    "mooning",
-    "moorage",
-    "mooting",
-    "moppets",
-    "mordant",
-    "mordent",
-    "morgues",
-    "morphia",
-    "morrows",
-    "mortice",
-    "mortify",
-    "mortuae",
-    "mortuus",
-    "moseyed",
-    "mossier",
-    "motored",
-    "mottles",
-    "mottoes",
-    "moulted",
-    "mounded",
-    "mountie",
-    "mourner",
-    "mousers",
-    "mousier",
-    "mousing",
-    "moutons",
-    "movably",
-    "muddied",
-    "muddier",
-    "muddies",
-    "muddily",
-    "muddler",
-    "muddles",
-    "mueslis",
-    "muezzin",
-    "muffing",
-    "muffles",
-    "muggers",
-    "muggier",
-    "mukluks",
-    "mulched",
-    "mulcted",
-    "muliers",
-    "mullein",
-    "mullion",
-    "multura",
-    "mummers",
-    "mummery",
-    "mummify",
-    "munched",
-    "munches",
-    "murexes",
-    "murices",
-    "murkier",
-    "murkily",
-    "murrain",
-    "muscovy",
-    "mushier",
-    "mushily",
-    "muskegs",
-    "muskies",
-    "mussing",
-    "musters",
-    "mustier",
-    "mutably",
-    "mutates",
-    "muttons",
-    "mutuals",
-    "muzzier",
-    "muzzled",
-    "muzzles",
-    "myalgia",
-    "mycelia",
-    "mycoses",
-    "mycosis",
-    "myfanwy",
-    "mystify",
-    "nabbing",
-    "nacelle",
-    "naffing",
-    "naggers",
-    "naivety",
-    "nakedly",
-    "namable",
-    "nankeen",
-    "napalms",
-    "narthex",
-    "nasally",
-    "nastier",
-    "nastily",
-    "natters",
-    "nattier",
-    "nattily",
-    "naturae",
-    "nauseam",
-    "nautili",
-    "navahos",
-    "navajos",
-    "navvies",
-    "neatens",
-    "neatest",
-    "nebbish",
-    "nebular",
-    "nebulas",
-    "necking",
-    "nectars",
-    "needier",
-    "needled",
-    "negotii",
-    "negress",
-    "negroid",
-    "neighed",
-    "nektons",
-    "nemeses",
-    "nepalis",
-    "nervier",
-    "nerving",
-    "nescafe",
-    "nesters",
-    "netlike",
-    "nettled",
-    "neurone",
-    "neuters",
-    "newgate",
-    "newsboy",
-    "newsier",
-    "newsmen",
-    "nexuses",
-    "nibbled",
-    "nibbler",
-    "nicking",
-    "niftier",
-    "niggard",
-    "niggled",
-    "niggles",
-    "nimbler",
-    "nimmers",
-    "ninepin",
-    "ninnies",
-    "nippers",
-    "nippier",
-    "nitpick",
-    "nitrify",
-    "nitwits",
-    "nobbled",
-    "nobbles",
-    "noggins",
-    "noisier",
-    "noising",
-    "noisome",
-    "nominis",
-    "nonagon",
-    "nonjury",
-    "nonplus",
-    "nonsane",
-    "nonsuit",
-    "nonuser",
-    "noosing",
-    "nosebag",
-    "nosegay",
-    "noshing",
-    "nosiest",
-    "notelet",
-    "nougats",
-    "noughts",
-    "novenas",
-    "nubbins",
-    "nubians",
-    "nullius",
-    "numbest",
-    "nuncios",
-    "nunquam",
-    "nuptias",
-    "nutlike",
-    "nutmegs",
-    "nutrias",
-    "nuttier",
-    "nuzzled",
-    "nuzzles",
-    "oarlock",
-    "oarsman",
-    "oarsmen",
-    "oatcake",
-    "oblates",
-    "oblongs",
-    "obloquy",
-    "oboists",
-    "obsequy",
-    "obtrude",
-    "obverts",
-    "occlude",
-    "occults",
-    "ocelots",
-    "octants",
-    "octavos",
-    "oculars",
-    "oculist",
-    "oddment",
-    "oddness",
-    "odorous",
-    "oedemas",
-    "oedipal",
-    "oestrus",
-    "offeree",
-    "offerer",
-    "oftener",
-    "oilcake",
-    "oilcans",
-    "oiliest",
-    "oilskin",
-    "okaying",
-    "oldness",
-    "oldster",
-    "omissio",
-    "omissis",
-    "omissus",
-    "omittas",
-    "onanism",
-    "oolongs",
-    "ooziest",
-    "opining",
-    "opposer",
-    "orating",
-    "orators",
-    "oratrix",
-    "orbited",
-    "ordains",
-    "ordeals",
-    "organdy",
-    "orients",
-    "orisons",
-    "orkneys",
-    "ormolus",
-    "orotund",
-    "ortolan",
-    "oscines",
-    "osmoses",
-    "osseous",
-    "ossuary",
-    "ostende",
-    "ostlers",
-    "otology",
-    "ousters",
-    "outbids",
-    "outdate",
-    "outdoes",
-    "outface",
-    "outgoes",
-    "outgrew",
-    "outguns",
-    "outlots",
-    "outmode",
-    "outplay",
-    "outpour",
-    "outrank",
-    "outruns",
-    "outsets",
-    "outsize",
-    "outsold",
-    "outstay",
-    "outtalk",
-    "outvote",
-    "outwear",
-    "outwits",
-    "outwore",
-    "outwork",
-    "outworn",
-    "overact",
-    "overarm",
-    "overate",
-    "overawe",
-    "overbid",
-    "overbuy",
-    "overdid",
-    "overdub",
-    "overeat",
-    "overfed",
-    "overfly",
-    "overlie",
-    "overpay",
-    "overran",
-    "oversew",
-    "overtax",
-    "oviduct",
-    "oviform",
-    "ovulate",
-    "oxblood",
-    "oxcarts",
-    "oxidise",
-    "oxonian",
-    "oxtails",
-    "pabulum",
-    "paddies",
-    "paellas",
-    "pageboy",
-    "paining",
-    "palatal",
-    "palates",
-    "palatii",
-    "palaver",
-    "palings",
-    "palling",
-    "palmate",
-    "palming",
-    "palmist",
-    "palpate",
-    "palsied",
-    "palsies",
-    "palters",
-    "panders",
-    "panfuls",
-    "panicky",
-    "panicle",
-    "papayas",
-    "papered",
-    "papilla",
-    "papists",
-    "papoose",
-    "papuans",
-    "parages",
-    "paraphs",
-    "paratus",
-    "parboil",
-    "parches",
-    "pareses",
-    "paresis",
-    "paretic",
-    "pariahs",
-    "paribus",
-    "parings",
-    "parlays",
-    "parleys",
-    "parlous",
-    "parolee",
-    "parried",
-    "parries",
-    "parsecs",
-    "partite",
-    "partium",
-    "partook",
-    "parvenu",
-    "pashtos",
-    "passant",
-    "passkey",
-    "pastern",
-    "pastier",
-    "paterna",
-    "patiens",
-    "patinas",
-    "patriae",
-    "patsies",
-    "patters",
-    "paunchy",
-    "paupers",
-    "pawnees",
-    "pawning",
-    "pawnors",
-    "pawpaws",
-    "peafowl",
-    "peahens",
-    "pealing",
-    "pearled",
-    "pebbled",
-    "peccary",
-    "peckish",
-    "pecunia",
-    "pedaled",
-    "pedants",
-    "peddled",
-    "peddles",
-    "pedlars",
-    "peelers",
-    "peeress",
-    "peeving",
-    "peevish",
-    "peewees",
-    "pelages",
-    "pelisse",
-    "pelotas",
-    "pelting",
-    "pendens",
-    "pennons",
-    "pentads",
-    "pentane",
-    "penuche",
-    "penults",
-    "peonage",
-    "peplums",
-    "peppier",
-    "pepping",
-    "pepsins",
-    "peptise",
-    "peptize",
-    "peptone",
-    "perdida",
-    "periled",
-    "perinea",
-    "periwig",
-    "perjure",
-    "perkier",
-    "perkily",
-    "perking",
-    "perming",
-    "permute",
-    "perturb",
-    "peruses",
-    "peskier",
-    "pesters",
-    "pestles",
-    "petards",
-    "petcock",
-    "petered",
-    "petitio",
-    "petrels",
-    "petrify",
-    "pettier",
-    "pettily",
-    "pettish",
-    "philter",
-    "philtre",
-    "phlegmy",
-    "phloxes",
-    "phoebes",
-    "phoneys",
-    "phonier",
-    "phonies",
-    "piacles",
-    "pianism",
-    "pianola",
-    "piazzas",
-    "picardy",
-    "pickaxe",
-    "pickier",
-    "piddled",
-    "piddles",
-    "pidgins",
-    "piebald",
-    "pierces",
-    "pieties",
-    "pietism",
-    "piffled",
-    "piffles",
-    "piggery",
-    "pigging",
-    "piggish",
-    "pigmies",
-    "pignuts",
-    "pigpens",
-    "pikemen",
-    "pilaffs",
-    "pilfers",
-    "pillbox",
-    "pillion",
-    "pillory",
-    "pimento",
-    "pimpled",
-    "pincers",
-    "pinions",
-    "pinkest",
-    "pinkies",
-    "pinking",
-    "pinnace",
-    "pinnate",
-    "pintoes",
-    "piously",
-    "pippins",
-    "piquant",
-    "piquing",
-    "pirogue",
-    "piscary",
-    "pismire",
-    "pistils",
-    "pithier",
-    "pithily",
-    "pivoted",
-    "placers",
-    "placita",
-    "plaices",
-    "plainer",
-    "plaints",
-    "plaited",
-    "planked",
-    "plashed",
-    "plashes",
-    "platens",
-    "plaudit",
-    "playlet",
-    "pleader",
-    "plectra",
-    "pledgee",
-    "pledgor",
-    "plegium",
-    "pleurae",
-    "pliancy",
-    "plicate",
-    "plights",
-    "plinths",
-    "plisses",
-    "plodded",
-    "plodder",
-    "plonked",
-    "plopped",
-    "plosive",
-    "ploughs",
-    "pluming",
-    "plumped",
-    "plunked",
-    "plusher",
-    "plusses",
-    "pluvial",
-    "poaches",
-    "poetess",
-    "poetise",
-    "poetize",
-    "pogroms",
-    "poising",
-    "pokiest",
-    "polders",
-    "poleaxe",
-    "polecat",
-    "politer",
-    "polkaed",
-    "pollens",
-    "pomaded",
-    "pomades",
-    "pommels",
-    "pompons",
-    "pongees",
-    "poniard",
-    "pooches",
-    "poolewe",
-    "poplins",
-    "popover",
-    "poppets",
-    "porgies",
-    "porkers",
-    "porlock",
-    "portend",
-    "portree",
-    "poseurs",
-    "postact",
-    "postern",
-    "postmen",
-    "potherb",
-    "pothook",
-    "pottage",
-    "pottier",
-    "potties",
-    "pouched",
-    "pounces",
-    "pouters",
-    "praecox",
-    "praetor",
-    "pranced",
-    "prances",
-    "pranged",
-    "prating",
-    "prattle",
-    "prebend",
-    "precipe",
-    "precook",
-    "predial",
-    "preened",
-    "prefabs",
-    "prelacy",
-    "prelist",
-    "premark",
-    "premeds",
-    "prender",
-    "prepays",
-    "prepuce",
-    "presold",
-    "prestos",
-    "pretium",
-    "pricier",
-    "prickle",
-    "priding",
-    "primage",
-    "primmer",
-    "primped",
-    "prising",
-    "privets",
-    "privies",
-    "privity",
-    "prizing",
-    "probata",
-    "proceri",
-    "prodder",
-    "prolate",
-    "propria",
-    "prorate",
-    "protean",
-    "prouder",
-    "prowled",
-    "proximo",
-    "prudery",
-    "prudish",
-    "prussic",
-    "psyches",
-    "ptyalin",
-    "puckers",
-    "puckish",
-    "pudenda",
-    "pudgier",
-    "puerile",
-    "puffers",
-    "puffery",
-    "puffier",
-    "pullets",
-    "pulpier",
-    "pulpits",
-    "pulsate",
-    "pummels",
-    "puncher",
-    "punctum",
-    "puniest",
-    "punnets",
-    "punning",
-    "punster",
-    "pupated",
-    "pupates",
-    "purbeck",
-    "purdahs",
-    "purlers",
-    "purlieu",
-    "purling",
-    "purloin",
-    "purpart",
-    "purpled",
-    "pursers",
-    "pursing",
-    "pursuer",
-    "purveys",
-    "pushier",
-    "pushily",
-    "pushpin",
-    "pustule",
-    "putrefy",
-    "puttees",
-    "puttied",
-    "putties",
-    "pygmies",
-    "pyloric",
-    "pylorus",
-    "pyretic",
-    "pyrites",
-    "pyrrhic",
-    "quacked",
-    "quadric",
-    "quaeres",
-    "quaffed",
-    "quahogs",
-    "quailed",
-    "quangos",
-    "quartos",
-    "quashes",
-    "quavers",
-    "quavery",
-    "quayage",
-    "queenly",
-    "queered",
-    "queerer",
-    "queerly",
-    "quelled",
-    "querela",
-    "querens",
-    "quested",
-    "quiches",
-    "quieten",
-    "quietus",
-    "quinces",
-    "quintal",
-    "quirked",
-    "quittal",
-    "quitted",
-    "quivery",
-    "quokkas",
-    "quondam",
-    "quonset",
-    "quorate",
-    "quorums",
-    "rabbets",
-    "rabbles",
-    "rabidly",
-    "racemes",
-    "raciest",
-    "rackety",
-    "racoons",
-    "radices",
-    "radioed",
-    "radixes",
-    "raffish",
-    "raffled",
-    "ragbags",
-    "ragging",
-    "raglans",
-    "ragouts",
-    "ragwort",
-    "raisons",
-    "rambled",
-    "ramekin",
-    "ramjets",
-    "ramrods",
-    "ranched",
-    "rancour",
-    "randier",
-    "rangier",
-    "rankers",
-    "rankest",
-    "rankled",
-    "rankles",
-    "rannoch",
-    "ransack",
-    "ransoms",
-    "rapider",
-    "rapiers",
-    "rapines",
-    "rappels",
-    "rarebit",
-    "rashers",
-    "rashest",
-    "raspier",
-    "rasping",
-    "rasters",
-    "rasures",
-    "ratable",
-    "ratably",
-    "ratione",
-    "ratites",
-    "ratline",
-    "rattail",
-    "rattans",
-    "ratters",
-    "rattier",
-    "ratting",
-    "raveled",
-    "razzing",
-    "readapt",
-    "readier",
-    "readmit",
-    "readopt",
-    "realest",
-    "reallot",
-    "reamers",
-    "reargue",
-    "rearmed",
-    "rebated",
-    "rebinds",
-    "rebukes",
-    "rebuses",
-    "recants",
-    "recasts",
-    "recedes",
-    "recking",
-    "recoils",
-    "recolor",
-    "recoups",
-    "recours",
-    "rectors",
-    "rectums",
-    "recused",
-    "recuses",
-    "redacts",
-    "redcaps",
-    "redcoat",
-    "reddens",
-    "reddest",
-    "redeems",
-    "reditus",
-    "redoubt",
-    "redound",
-    "redraft",
-    "redraws",
-    "redskin",
-    "reeboks",
-    "reedier",
-    "reedits",
-    "reefers",
-    "reefing",
-    "reeking",
-    "refolds",
-    "refract",
-    "refries",
-    "refuels",
-    "refuter",
-    "regaled",
-    "regales",
-    "regally",
-    "reggaes",
-    "reginae",
-    "regnant",
-    "regrant",
-    "regrind",
-    "regulae",
-    "reheard",
-    "rehears",
-    "reheats",
-    "rehouse",
-    "reified",
-    "reifies",
-    "rejoins",
-    "relater",
-    "relator",
-    "relents",
-    "relicts",
-    "relined",
-    "relines",
-    "relived",
-    "relives",
-    "remands",
-    "remised",
-    "remises",
-    "remolds",
-    "remoras",
-    "remoter",
-    "remould",
-    "remount",
-    "reneged",
-    "reneges",
-    "rentage",
-    "rentier",
-    "renvois",
-    "reoccur",
-    "repasts",
-    "repents",
-    "repined",
-    "repines",
-    "replant",
-    "replevy",
-    "reposed",
-    "reposes",
-    "reproof",
-    "reprove",
-    "reptant",
-    "reputes",
-    "requite",
-    "rereads",
-    "reseals",
-    "reships",
-    "resiant",
-    "residua",
-    "resizes",
-    "resoled",
-    "resoles",
-    "respell",
-    "respire",
-    "restive",
-    "restudy",
-    "retaken",
-    "retakes",
-    "retched",
-    "retches",
-    "retells",
-    "retinas",
-    "retinue",
-    "retools",
-    "retorna",
-    "retread",
-    "retried",
-    "retsina",
-    "retying",
-    "retyped",
-    "retypes",
-    "reunify",
-    "revalue",
-    "reveled",
-    "reveler",
-    "reveres",
-    "revests",
-    "reviles",
-    "revisal",
-    "reviser",
-    "reviver",
-    "revivor",
-    "rewinds",
-    "rewired",
-    "rewires",
-    "rewords",
-    "reworks",
-    "rewound",
-    "rezoned",
-    "rezones",
-    "rheidol",
-    "rhenish",
-    "rhenium",
-    "rhizoid",
-    "rhodian",
-    "rhombic",
-    "rhymney",
-    "ribauds",
-    "ribcage",
-    "ricking",
-    "ridging",
-    "riffled",
-    "riffles",
-    "rifling",
-    "rifting",
-    "riggers",
-    "righted",
-    "righter",
-    "rigours",
-    "ringlet",
-    "riparia",
-    "riposte",
-    "risible",
-    "risibly",
-    "rissole",
-    "ritzier",
-    "rivaled",
-    "rivulet",
-    "roadbed",
-    "roadies",
-    "rockall",
-    "rockery",
-    "rockier",
-    "rogatio",
-    "roguery",
-    "roguish",
-    "roiling",
-    "roister",
-    "rollick",
-    "romansh",
-    "romanus",
-    "rompers",
-    "romping",
-    "rooking",
-    "roomers",
-    "roomful",
-    "roomier",
-    "roosted",
-    "ropiest",
-    "roseate",
-    "rosiest",
-    "rosined",
-    "rostrum",
-    "rotifer",
-    "rotters",
-    "roughed",
-    "roughen",
-    "rouging",
-    "roulade",
-    "roundel",
-    "rousted",
-    "rowboat",
-    "rowdier",
-    "rowdies",
-    "rowdily",
-    "rowlock",
-    "rubbles",
-    "rubdown",
-    "rucking",
-    "ruction",
-    "rudders",
-    "ruddier",
-    "ruddily",
-    "rugeley",
-    "ruggers",
-    "rummers",
-    "rummest",
-    "rumpled",
-    "rumples",
-    "runlets",
-    "runnier",
-    "rurally",
-    "rushers",
-    "russets",
-    "rustics",
-    "rustier",
-    "rustled",
-    "rustles",
-    "saccade",
-    "sachems",
-    "sackers",
-    "sadists",
-    "sagaman",
-    "sagamen",
-    "sainted",
-    "salaams",
-    "salable",
-    "salamis",
-    "salique",
-    "sallied",
-    "sallies",
-    "salmons",
-    "salsify",
-    "saltier",
-    "salvers",
-    "salvias",
-    "salving",
-    "salvoes",
-    "salvors",
-    "samaras",
-    "samisen",
-    "samosas",
-    "samovar",
-    "sampans",
-    "sandbag",
-    "sandhog",
-    "sandier",
-    "sandmen",
-    "sandpit",
-    "sapient",
-    "sappers",
-    "sappier",
-    "sappily",
-    "sapping",
-    "sapwood",
-    "sashays",
-    "sassier",
-    "sassing",
-    "satiate",
-    "satiety",
-    "satinet",
-    "satires",
-    "satiric",
-    "satraps",
-    "satrapy",
-    "saucily",
-    "saucing",
-    "saunter",
-    "saunton",
-    "saurian",
-    "savable",
-    "savaged",
-    "savants",
-    "saveloy",
-    "savored",
-    "savours",
-    "sawbuck",
-    "scabbed",
-    "scafell",
-    "scalded",
-    "scalene",
-    "scalier",
-    "scalped",
-    "scamper",
-    "scanted",
-    "scantly",
-    "scapula",
-    "scarabs",
-    "scarcer",
-    "scarfed",
-    "scarify",
-    "scarped",
-    "scarper",
-    "scathed",
-    "scathes",
-    "scatted",
-    "schemed",
-    "schemer",
-    "schisms",
-    "schlepp",
-    "schleps",
-    "schmalz",
-    "schnook",
-    "scoffer",
-    "scooted",
-    "scoriae",
-    "scoters",
-    "scourer",
-    "scouted",
-    "scowled",
-    "scraggy",
-    "scrawls",
-    "scrawly",
-    "screeds",
-    "scribal",
-    "scriber",
-    "scrimps",
-    "scrotal",
-    "scrubby",
-    "scruffs",
-    "scrunch",
-    "scruple",
-    "scudded",
-    "sculled",
-    "sculpts",
-    "scupper",
-    "scutter",
-    "scythed",
-    "scythes",
-    "seabees",
-    "seakale",
-    "seamark",
-    "seamier",
-    "seaming",
-    "seances",
-    "seasick",
-    "seaways",
-    "secants",
-    "seceded",
-    "secedes",
-    "seclude",
-    "securer",
-    "sedates",
-    "seducer",
-    "seedbed",
-    "seedier",
-    "seedily",
-    "seesaws",
-    "seethed",
-    "seethes",
-    "seibels",
-    "seining",
-    "seisina",
-    "seisins",
-    "seizins",
-    "selvage",
-    "sensate",
-    "septets",
-    "sequela",
-    "serapes",
-    "seraphs",
-    "serener",
-    "serment",
-    "serrate",
-    "serried",
-    "sesames",
-    "sestets",
-    "sestina",
-    "setoffs",
-    "settees",
-    "severer",
-    "sexists",
-    "sexless",
-    "sextets",
-    "sextons",
-    "shacked",
-    "shadier",
-    "shadily",
-    "shakier",
-    "shakoes",
-    "shallop",
-    "shamble",
-    "shammed",
-    "sharked",
-    "sheathe",
-    "shebeen",
-    "shedder",
-    "sheered",
-    "sheerer",
-    "sheeted",
-    "sheikhs",
-    "sheller",
-    "sheppey",
-    "shiners",
-    "shinier",
-    "shinned",
-    "shirked",
-    "shirker",
-    "shirred",
-    "shitted",
-    "shivery",
-    "shoaled",
-    "shoguns",
-    "shoofly",
-    "shooing",
-    "shouter",
-    "showery",
-    "showier",
-    "showily",
-    "showmen",
-    "shrifts",
-    "shrikes",
-    "shrills",
-    "shrived",
-    "shrivel",
-    "shriven",
-    "shrives",
-    "shrubby",
-    "shticks",
-    "shucked",
-    "shunted",
-    "shunter",
-    "shushed",
-    "shushes",
-    "shyster",
-    "sickbed",
-    "sickens",
-    "sickish",
-    "sidearm",
-    "sideman",
-    "sidemen",
-    "sidling",
-    "siestas",
-    "sieving",
-    "sifters",
-    "sigilli",
-    "signati",
-    "signets",
-    "silkier",
-    "silkily",
-    "sillier",
-    "sillies",
-    "silting",
-    "silvans",
-    "simians",
-    "similes",
-    "simmers",
-    "simpers",
-    "sinkers",
-    "sinters",
-    "siphons",
-    "sippers",
-    "sixfold",
-    "sizzled",
-    "sizzles",
-    "skaldic",
-    "skidded",
-    "skidoos",
-    "skimped",
-    "skinful",
-    "skirled",
-    "skitter",
-    "skittle",
-    "skivers",
-    "skiving",
-    "skulked",
-    "skunked",
-    "skycaps",
-    "skyjack",
-    "skyways",
-    "slacked",
-    "slacken",
-    "slackly",
-    "slaking",
-    "slaloms",
-    "slanged",
-    "slather",
-    "slating",
-    "slavers",
-    "slaving",
-    "slavish",
-    "sleazes",
-    "sledded",
-    "sledges",
-    "sleeked",
-    "sleeker",
-    "sleekly",
-    "sleeted",
-    "sleighs",
-    "slicked",
-    "slights",
-    "slimier",
-    "slimily",
-    "sliming",
-    "slimmed",
-    "slipway",
-    "slitter",
-    "slivery",
-    "slobber",
-    "slogged",
-    "slopped",
-    "sloshed",
-    "sloshes",
-    "slouchy",
-    "sloughs",
-    "slugged",
-    "sluiced",
-    "sluices",
-    "slummed",
-    "slurped",
-    "slyness",
-    "smacker",
-    "smarted",
-    "smarten",
-    "smatter",
-    "smelted",
-    "smidgen",
-    "smiting",
-    "smokier",
-    "smolder",
-    "smudged",
-    "smugger",
-    "smutted",
-    "snacked",
-    "snaffle",
-    "snakier",
-    "snaking",
-    "snaring",
-    "sneezed",
-    "sneezes",
-    "snidely",
-    "snidest",
-    "sniffle",
-    "snifter",
-    "snigger",
-    "snivels",
-    "snooped",
-    "snoozed",
-    "snoozes",
-    "snorers",
-    "snowier",
-    "snuffed",
-    "snuffer",
-    "snuffle",
-    "snugger",
-    "soakage",
-    "soapier",
-    "soaping",
-    "sobered",
-    "soberer",
-    "soberly",
-    "socager",
-    "socages",
-    "socking",
-    "sodding",
-    "softies",
-    "soggier",
-    "soirees",
-    "solaced",
-    "solaces",
-    "solaria",
-    "solatia",
-    "solidum",
-    "solidus",
-    "solvate",
-    "solvere",
-    "sonnies",
-    "sootier",
-    "sophism",
-    "sophist",
-    "soppier",
-    "sopping",
-    "sorbets",
-    "sorbing",
-    "sorrels",
-    "sorrier",
-    "soughed",
-    "soupier",
-    "sourest",
-    "souring",
-    "sousing",
-    "soutane",
-    "sowbane",
-    "sowings",
-    "spading",
-    "spanker",
-    "sparely",
-    "sparest",
-    "sparred",
-    "sparser",
-    "spatter",
-    "speared",
-    "specked",
-    "specula",
-    "sperate",
-    "spicier",
-    "spicily",
-    "spicing",
-    "spidery",
-    "spieled",
-    "spigots",
-    "spikier",
-    "spindly",
-    "spinets",
-    "spinier",
-    "spinout",
-    "spirant",
-    "spitals",
-    "spiting",
-    "spitted",
-    "spittle",
-    "splashy",
-    "spleens",
-    "splotch",
-    "spondee",
-    "sponged",
-    "sponger",
-    "spooned",
-    "spouted",
-    "sprawls",
-    "spruced",
-    "spruces",
-    "spryest",
-    "spumoni",
-    "spurges",
-    "spurted",
-    "squalls",
-    "squally",
-    "squarer",
-    "squashy",
-    "squatty",
-    "squawks",
-    "squawky",
-    "squints",
-    "squinty",
-    "squired",
-    "squirms",
-    "squirmy",
-    "stabile",
-    "stabled",
-    "stagers",
-    "staidly",
-    "stalest",
-    "staling",
-    "stammer",
-    "standee",
-    "stannic",
-    "starker",
-    "starlit",
-    "starves",
-    "stashes",
-    "stators",
-    "staving",
-    "steeled",
-    "steerer",
-    "stemmas",
-    "stetted",
-    "stewing",
-    "stickup",
-    "stifles",
-    "stigmas",
-    "stilled",
-    "stinted",
-    "stirpes",
-    "stoical",
-    "stokers",
-    "stoking",
-    "stomata",
-    "stonier",
-    "stonily",
-    "stooged",
-    "stopgap",
-    "stoutly",
-    "stowing",
-    "strafed",
-    "strafes",
-    "strewed",
-    "striate",
-    "stricti",
-    "striven",
-    "strophe",
-    "stroppy",
-    "stubbed",
-    "stupefy",
-    "stygian",
-    "stylise",
-    "stylize",
-    "stymies",
-    "styptic",
-    "suavely",
-    "suavity",
-    "subbing",
-    "subdues",
-    "subfusc",
-    "subjoin",
-    "suborns",
-    "subsume",
-    "subtend",
-    "succors",
-    "succoth",
-    "succour",
-    "suckled",
-    "suckles",
-    "suffuse",
-    "sugared",
-    "sulfurs",
-    "sulkier",
-    "sulkies",
-    "sulkily",
-    "sulking",
-    "sullied",
-    "sullies",
-    "summate",
-    "sundaes",
-    "sunders",
-    "sunnier",
-    "suntans",
-    "supping",
-    "suppler",
-    "surfeit",
-    "surlier",
-    "surreys",
-    "sursise",
-    "sussing",
-    "sutlers",
-    "suttees",
-    "sutured",
-    "swabbed",
-    "swaddle",
-    "swaging",
-    "swanned",
-    "swarthy",
-    "swathed",
-    "swathes",
-    "swatted",
-    "swatter",
-    "sweated",
-    "swelter",
-    "swerved",
-    "swerves",
-    "swifter",
-    "swigged",
-    "swilled",
-    "swinish",
-    "swiping",
-    "swished",
-    "swishes",
-    "swooned",
-    "swopped",
-    "swotted",
-    "synched",
-    "syndics",
-    "syphons",
-    "systole",
-    "tabards",
-    "tabbies",
-    "tabetic",
-    "tabooed",
-    "tabulae",
-    "tackier",
-    "tackler",
-    "tactual",
-    "taffies",
-    "tailage",
-    "tallage",
-    "tallboy",
-    "tallish",
-    "tallyho",
-    "tamable",
-    "tambour",
-    "tampers",
-    "tamping",
-    "tangelo",
-    "tangoed",
-    "tankage",
-    "tankful",
-    "tanking",
-    "tannest",
-    "tansies",
-    "taoists",
-    "tappets",
-    "taproom",
-    "tarbert",
-    "tardier",
-    "tardily",
-    "tarmacs",
-    "tarpons",
-    "tarried",
-    "tarries",
-    "tarring",
-    "tarsier",
-    "tartars",
-    "tartest",
-    "tartlet",
-    "tasters",
-    "tastier",
-    "tastily",
-    "tattier",
-    "tattled",
-    "tattler",
-    "tattles",
-    "tautens",
-    "tautest",
-    "tawnier",
-    "taxably",
-    "taxiing",
-    "taxless",
-    "taxying",
-    "teacake",
-    "teacart",
-    "teasels",
-    "teashop",
-    "teatime",
-    "teenier",
-    "teepees",
-    "teeters",
-    "teethed",
-    "teethes",
-    "tektite",
-    "telexed",
-    "telexes",
-    "tellies",
-    "templet",
-    "tempora",
-    "tempter",
-    "tenches",
-    "tendril",
-    "tenendi",
-    "tenneco",
-    "tenners",
-    "tenpins",
-    "tensest",
-    "tensing",
-    "tenting",
-    "terbium",
-    "terming",
-    "termino",
-    "termors",
-    "terries",
-    "terrify",
-    "terrine",
-    "tersely",
-    "tertian",
-    "tertium",
-    "tertius",
-    "tessera",
-    "testacy",
-    "testate",
-    "testier",
-    "testily",
-    "tetbury",
-    "tetrads",
-    "teutons",
-    "thalami",
-    "thaxted",
-    "thereat",
-    "thieved",
-    "thirsts",
-    "thralls",
-    "thriven",
-    "throaty",
-    "thrombi",
-    "thudded",
-    "thulium",
-    "thumbed",
-    "thumped",
-    "thwacks",
-    "thwarts",
-    "tidally",
-    "tiddler",
-    "tidiest",
-    "tierces",
-    "timbale",
-    "timbals",
-    "timbrel",
-    "tingled",
-    "tingles",
-    "tinhorn",
-    "tinkers",
-    "tinkled",
-    "tinkles",
-    "tinnier",
-    "tinning",
-    "tinsels",
-    "tintype",
-    "tippees",
-    "tippers",
-    "tippets",
-    "tippled",
-    "tippler",
-    "tipples",
-    "tipsier",
-    "tipsily",
-    "tiptoed",
-    "tiptoes",
-    "tirades",
-    "tiredly",
-    "tisanes",
-    "titbits",
-    "tithers",
-    "titlark",
-    "titmice",
-    "titrate",
-    "titters",
-    "tittles",
-    "titulus",
-    "tizzies",
-    "toadied",
-    "toadies",
-    "tocsins",
-    "toddies",
-    "toddled",
-    "toddles",
-    "toehold",
-    "toeless",
-    "toffees",
-    "togging",
-    "toilers",
-    "tollage",
-    "tollers",
-    "tombola",
-    "tomboys",
-    "tomcats",
-    "tomtits",
-    "tonally",
-    "tonsure",
-    "tontine",
-    "tootled",
-    "tootles",
-    "topazes",
-    "topknot",
-    "topmast",
-    "toponym",
-    "topspin",
-    "toreros",
-    "tossers",
-    "totemic",
-    "totters",
-    "tottery",
-    "totting",
-    "toucans",
-    "toughie",
-    "toughly",
-    "toupees",
-    "tourers",
-    "tousled",
-    "tousles",
-    "towable",
-    "towboat",
-    "toweled",
-    "towered",
-    "towhees",
-    "towline",
-    "townies",
-    "towpath",
-    "towrope",
-    "toxemia",
-    "toxemic",
-    "toxical",
-    "toyshop",
-    "tracery",
-    "traduce",
-    "traipse",
-    "trammel",
-    "tramped",
-    "trances",
-    "trashes",
-    "travois",
-    "trawled",
-    "treacly",
-    "treaded",
-    "treadle",
-    "trebled",
-    "trebles",
-    "treeing",
-    "trekked",
-    "tremens",
-    "trended",
-    "trepans",
-    "triadic",
-    "triages",
-    "tricots",
-    "trifled",
-    "trifler",
-    "trigged",
-    "trilled",
-    "triodes",
-    "trireme",
-    "trisect",
-    "trishaw",
-    "tritely",
-    "tritons",
-    "triunes",
-    "trivets",
-    "trochee",
-    "troches",
-    "troikas",
-    "trollop",
-    "tromped",
-    "trooped",
-    "tropism",
-    "trounce",
-    "trouped",
-    "trouper",
-    "trovers",
-    "trowels",
-    "truants",
-    "trucked",
-    "truckle",
-    "trudged",
-    "trudges",
-    "truisms",
-    "trussed",
-    "tsarina",
-    "tsarist",
-    "tuaregs",
-    "tuatara",
-    "tubbier",
-    "tuckers",
-    "tufting",
-    "tumbrel",
-    "tumbril",
-    "tummies",
-    "tumults",
-    "tumulus",
-    "tuneful",
-    "tunnage",
-    "tunnies",
-    "tupelos",
-    "turbary",
-    "turbots",
-    "tureens",
-    "turfing",
-    "turnery",
-    "tusking",
-    "tussahs",
-    "tussled",
-    "tussles",
-    "tussock",
-    "tutting",
-    "twaddle",
-    "twanged",
-    "tweeted",
-    "tweezed",
-    "tweezes",
-    "twiddle",
-    "twigged",
-    "twilled",
-    "twinges",
-    "twinkly",
-    "twinned",
-    "twirled",
-    "twirler",
-    "twitchy",
-    "twitted",
-    "twitter",
-    "twosome",
-    "tycoons",
-    "tympana",
-    "tyndrum",
-    "tything",
-    "ullages",
-    "ululate",
-    "umbrage",
-    "umlauts",
-    "umpired",
-    "umpteen",
-    "unaimed",
-    "unaired",
-    "unasked",
-    "unbaked",
-    "unbends",
-    "unbinds",
-    "unbolts",
-    "unbowed",
-    "uncaged",
-    "uncared",
-    "uncased",
-    "unchain",
-    "uncials",
-    "unclasp",
-    "unclips",
-    "unclogs",
-    "unclose",
-    "uncoils",
-    "uncorks",
-    "uncowed",
-    "uncrate",
-    "uncross",
-    "unction",
-    "uncured",
-    "uncurls",
-    "undocks",
-    "uneaten",
-    "unfaded",
-    "unfired",
-    "unfixed",
-    "unfound",
-    "unfrock",
-    "unfroze",
-    "unfurls",
-    "unglued",
-    "unglues",
-    "unguent",
-    "unhands",
-    "unhandy",
-    "unhinge",
-    "unhitch",
-    "unhooks",
-    "unhorse",
-    "unifier",
-    "unisons",
-    "unitise",
-    "unitize",
-    "unlaced",
-    "unlaces",
-    "unladen",
-    "unlatch",
-    "unlearn",
-    "unlinks",
-    "unloads",
-    "unloose",
-    "unmakes",
-    "unmanly",
-    "unmasks",
-    "unmated",
-    "unmined",
-    "unmoral",
-    "unnerve",
-    "unowned",
-    "unpacks",
-    "unpaged",
-    "unpicks",
-    "unplugs",
-    "unquiet",
-    "unready",
-    "unreels",
-    "unrolls",
-    "unseals",
-    "unseats",
-    "unsexed",
-    "unsexes",
-    "unsnaps",
-    "unsnarl",
-    "unstick",
-    "unstops",
-    "unstrap",
-    "unstuck",
-    "unswept",
-    "unsworn",
-    "unthaws",
-    "untimed",
-    "untruly",
-    "untruth",
-    "untwine",
-    "untwist",
-    "untying",
-    "unweary",
-    "unwinds",
-    "unwires",
-    "unwound",
-    "unwraps",
-    "unyoked",
-    "unyokes",
-    "upbeats",
-    "upbraid",
-    "upchuck",
-    "upended",
-    "uplifts",
-    "upraise",
-    "uproars",
-    "uproots",
-    "upshots",
-    "upsides",
-    "upstage",
-    "upsweep",
-    "upswept",
-    "uptakes",
-    "uptowns",
-    "uptrend",
-    "upturns",
-    "uraemia",
-    "urgings",
-    "urmston",
-    "usurers",
-    "utopias",
-    "utterer",
-    "uxorial",
-    "vacates",
-    "vacatur",
-    "vacuity",
-    "vaguest",
-    "vainest",
-    "valetta",
-    "valises",
-    "valuate",
-    "vamoose",
-    "vamping",
-    "vanuata",
-    "vapidly",
-    "vaquero",
-    "vassals",
-    "vastest",
-    "vaulter",
-    "vavasor",
-    "vedette",
-    "veiling",
-    "veining",
-    "vellums",
-    "velours",
-    "velvets",
-    "venally",
-    "venatio",
-    "vendees",
-    "venires",
-    "verdure",
-    "vergers",
-    "verging",
-    "verruca",
-    "versant",
-    "versify",
-    "vervain",
-    "vestals",
-    "vestura",
-    "vetches",
-    "vetoing",
-    "viators",
-    "victual",
-    "vicunas",
-    "viduity",
-    "vinculo",
-    "vintner",
-    "violist",
-    "viragos",
-    "virally",
-    "virgata",
-    "virgate",
-    "virgule",
-    "visages",
-    "vitiate",
-    "vitrify",
-    "vivaria",
-    "viziers",
-    "vocable",
-    "vocalic",
-    "volenti",
-    "volleys",
-    "voltaic",
-    "voluble",
-    "volubly",
-    "volunte",
-    "volutes",
-    "voodoos",
-    "vouched",
-    "vouchee",
-    "vouches",
-    "voyaged",
-    "vulpine",
-    "wackier",
-    "wadding",
-    "waddled",
-    "waddles",
-    "wadsets",
-    "waffled",
-    "wafting",
-    "waggish",
-    "waggled",
-    "waggles",
-    "wainage",
-    "wakeful",
-    "wakened",
-    "wallows",
-    "waltzed",
-    "waltzer",
-    "wangled",
-    "wangles",
-    "wantons",
-    "wapitis",
-    "warbled",
-    "warbles",
-    "wardage",
-    "warders",
-    "warding",
-    "wariest",
-    "warless",
-    "warmish",
-    "warpage",
-    "warpath",
-    "warrens",
-    "wasdale",
-    "washtub",
-    "waspish",
-    "wassail",
-    "wastrel",
-    "watchet",
-    "wattles",
-    "waverer",
-    "waviest",
-    "waxwing",
-    "waxwork",
-    "waybill",
-    "waylaid",
-    "waylays",
-    "waymark",
-    "wearier",
-    "wearies",
-    "wedelns",
-    "wedgies",
-    "wedging",
-    "weedier",
-    "weenier",
-    "weenies",
-    "weepier",
-    "weepies",
-    "weevers",
-    "welcher",
-    "welters",
-    "welting",
-    "wenches",
-    "wending",
-    "wenlock",
-    "wensley",
-    "wergild",
-    "wetback",
-    "whammed",
-    "wharfed",
-    "wheedle",
-    "wheezed",
-    "wheezes",
-    "whelped",
-    "whereat",
-    "whereto",
-    "whetted",
-    "whicker",
-    "whiffed",
-    "whiling",
-    "whinged",
-    "whinges",
-    "whinier",
-    "whipsaw",
-    "whirred",
-    "whitely",
-    "whitens",
-    "whitest",
-    "whitlow",
-    "whitsun",
-    "whizzed",
-    "whizzes",
-    "whooped",
-    "whopped",
-    "whorish",
-    "widgeon",
-    "wielder",
-    "wieners",
-    "wigeons",
-    "wigging",
-    "wiggled",
-    "wigwags",
-    "wigwams",
-    "wiliest",
-    "willowy",
-    "wilmcot",
-    "wimpish",
-    "wimples",
-    "winched",
-    "wincing",
-    "windbag",
-    "windier",
-    "windrow",
-    "winging",
-    "winkled",
-    "winkles",
-    "winnows",
-    "wintery",
-    "wiriest",
-    "witched",
-    "witless",
-    "wittier",
-    "wittily",
-    "wizened",
-    "wobbled",
-    "wobbles",
-    "wolfing",
-    "wolfish",
-    "wombats",
-    "wonkier",
-    "woodier",
-    "woodmen",
-    "woolens",
-    "woozier",
-    "wordier",
-    "wordily",
-    "workbox",
-    "wormier",
-    "worming",
-    "worrier",
-    "wraiths",
-    "wreathe",
-    "wrested",
-    "wriggle",
-    "wringer",
-    "wristed",
-    "writhed",
-    "writhes",
-    "wrotham",
-    "wykeham",
-    "xeroxed",
-    "xeroxes",
-    "yachted",
-    "yachter",
-    "yammers",
-    "yapping",
-    "yardarm",
-    "yardies",
-    "yardman",
-    "yardmen",
-    "yarrows",
-    "yashmak",
-    "yelping",
-    "yemenis",
-    "yipping",
-    "yodeled",
-    "yowling",
-    "yummier",
-    "zairian",
-    "zaniest",
-    "zappers",
-    "zebrine",
-    "zeniths",
-    "zephyrs",
-    "zestful",
-    "zetland",
-    "zeugmas",
-    "zigzags",
-    "zilches",
-    "zingers",
-    "zinging",
-    "zinnias",
-    "zippier",
-    "zircons",
-    "zithers",
-    "zonings",
-    "zygotes",
-    "zygotic",
-    "zymurgy",
-]
@@ -1,13301 +0,0 @@
-WORDS = [
-    "business",
-    "services",
-    "products",
-    "software",
-    "research",
-    "comments",
-    "national",
-    "internet",
-    "shipping",
-    "reserved",
-    "security",
-    "american",
-    "computer",
-    "download",
-    "pictures",
-    "personal",
-    "location",
-    "children",
-    "students",
-    "shopping",
-    "previous",
-    "property",
-    "customer",
-    "december",
-    "training",
-    "advanced",
-    "category",
-    "register",
-    "november",
-    "features",
-    "industry",
-    "provided",
-    "required",
-    "articles",
-    "feedback",
-    "complete",
-    "standard",
-    "programs",
-    "language",
-    "password",
-    "question",
-    "building",
-    "february",
-    "analysis",
-    "possible",
-    "problems",
-    "interest",
-    "learning",
-    "delivery",
-    "original",
-    "includes",
-    "messages",
-    "provides",
-    "specific",
-    "director",
-    "planning",
-    "database",
-    "official",
-    "district",
-    "calendar",
-    "resource",
-    "document",
-    "material",
-    "together",
-    "function",
-    "economic",
-    "projects",
-    "included",
-    "received",
-    "archives",
-    "magazine",
-    "policies",
-    "position",
-    "listings",
-    "wireless",
-    "purchase",
-    "response",
-    "practice",
-    "hardware",
-    "designed",
-    "discount",
-    "remember",
-    "increase",
-    "european",
-    "activity",
-    "although",
-    "contents",
-    "regional",
-    "supplies",
-    "exchange",
-    "continue",
-    "benefits",
-    "anything",
-    "mortgage",
-    "solution",
-    "addition",
-    "clothing",
-    "military",
-    "decision",
-    "division",
-    "actually",
-    "saturday",
-    "starting",
-    "thursday",
-    "consumer",
-    "contract",
-    "releases",
-    "virginia",
-    "multiple",
-    "featured",
-    "friendly",
-    "schedule",
-    "everyone",
-    "approach",
-    "physical",
-    "medicine",
-    "evidence",
-    "favorite",
-    "recently",
-    "probably",
-    "networks",
-    "transfer",
-    "carolina",
-    "hospital",
-    "overview",
-    "distance",
-    "involved",
-    "partners",
-    "existing",
-    "selected",
-    "patients",
-    "directly",
-    "searches",
-    "strategy",
-    "teaching",
-    "canadian",
-    "positive",
-    "football",
-    "abstract",
-    "contains",
-    "republic",
-    "vacation",
-    "academic",
-    "graphics",
-    "expected",
-    "mountain",
-    "consider",
-    "northern",
-    "proposed",
-    "reported",
-    "politics",
-    "modified",
-    "released",
-    "internal",
-    "detailed",
-    "japanese",
-    "approved",
-    "southern",
-    "yourself",
-    "pressure",
-    "keywords",
-    "purposes",
-    "external",
-    "teachers",
-    "subjects",
-    "capacity",
-    "requires",
-    "electric",
-    "creative",
-    "progress",
-    "families",
-    "accepted",
-    "agencies",
-    "michigan",
-    "columbia",
-    "critical",
-    "employee",
-    "packages",
-    "colorado",
-    "relevant",
-    "illinois",
-    "elements",
-    "facility",
-    "minister",
-    "visitors",
-    "coverage",
-    "clinical",
-    "sciences",
-    "currency",
-    "commerce",
-    "accounts",
-    "settings",
-    "cultural",
-    "holidays",
-    "graduate",
-    "thinking",
-    "provider",
-    "optional",
-    "sections",
-    "religion",
-    "measures",
-    "chemical",
-    "exercise",
-    "meetings",
-    "congress",
-    "produced",
-    "argument",
-    "creating",
-    "attorney",
-    "auctions",
-    "informed",
-    "thoughts",
-    "quantity",
-    "platform",
-    "machines",
-    "recovery",
-    "merchant",
-    "vehicles",
-    "campaign",
-    "examples",
-    "motorola",
-    "intended",
-    "election",
-    "requests",
-    "separate",
-    "identify",
-    "domestic",
-    "extended",
-    "sequence",
-    "williams",
-    "movement",
-    "printing",
-    "baseball",
-    "approval",
-    "contacts",
-    "matching",
-    "offering",
-    "variable",
-    "compared",
-    "workshop",
-    "lighting",
-    "portable",
-    "returned",
-    "warranty",
-    "assembly",
-    "criminal",
-    "powerful",
-    "obtained",
-    "supplied",
-    "opinions",
-    "maintain",
-    "priority",
-    "payments",
-    "straight",
-    "prepared",
-    "criteria",
-    "behavior",
-    "changing",
-    "festival",
-    "whatever",
-    "maryland",
-    "eligible",
-    "checkout",
-    "handling",
-    "scotland",
-    "followed",
-    "protocol",
-    "designer",
-    "marriage",
-    "negative",
-    "missouri",
-    "ministry",
-    "proposal",
-    "birthday",
-    "slightly",
-    "lingerie",
-    "profiles",
-    "controls",
-    "breaking",
-    "combined",
-    "ultimate",
-    "reviewed",
-    "forecast",
-    "accuracy",
-    "pharmacy",
-    "creation",
-    "chairman",
-    "violence",
-    "oklahoma",
-    "speakers",
-    "cleaning",
-    "concerns",
-    "officers",
-    "referred",
-    "supports",
-    "presence",
-    "majority",
-    "strength",
-    "daughter",
-    "standing",
-    "ordering",
-    "bookmark",
-    "specials",
-    "improved",
-    "exposure",
-    "gambling",
-    "outdoors",
-    "printers",
-    "kentucky",
-    "interior",
-    "relative",
-    "identity",
-    "victoria",
-    "revision",
-    "instance",
-    "licensed",
-    "recorded",
-    "finished",
-    "discover",
-    "patterns",
-    "stations",
-    "greatest",
-    "operator",
-    "tracking",
-    "accurate",
-    "managing",
-    "happened",
-    "lesbians",
-    "managers",
-    "aircraft",
-    "conflict",
-    "versions",
-    "employer",
-    "describe",
-    "citizens",
-    "heritage",
-    "audience",
-    "assigned",
-    "directed",
-    "sporting",
-    "affected",
-    "expenses",
-    "indicate",
-    "anderson",
-    "diseases",
-    "thailand",
-    "advisory",
-    "template",
-    "anywhere",
-    "atlantic",
-    "investor",
-    "wildlife",
-    "speaking",
-    "sponsors",
-    "checking",
-    "guidance",
-    "observed",
-    "glossary",
-    "channels",
-    "appendix",
-    "supplier",
-    "arkansas",
-    "notebook",
-    "explorer",
-    "historic",
-    "attached",
-    "disabled",
-    "upcoming",
-    "constant",
-    "portland",
-    "concepts",
-    "relating",
-    "alliance",
-    "engineer",
-    "becoming",
-    "relation",
-    "colleges",
-    "brothers",
-    "presents",
-    "estimate",
-    "bulletin",
-    "painting",
-    "universe",
-    "watching",
-    "sterling",
-    "sessions",
-    "journals",
-    "jennifer",
-    "terminal",
-    "nebraska",
-    "properly",
-    "hundreds",
-    "tomorrow",
-    "visiting",
-    "downtown",
-    "keyboard",
-    "suitable",
-    "millions",
-    "findings",
-    "clicking",
-    "province",
-    "catholic",
-    "governor",
-    "swimming",
-    "pakistan",
-    "reliable",
-    "symptoms",
-    "memorial",
-    "fighting",
-    "pregnant",
-    "cellular",
-    "normally",
-    "diabetes",
-    "flexible",
-    "numerous",
-    "superior",
-    "spending",
-    "magnetic",
-    "registry",
-    "employed",
-    "displays",
-    "allowing",
-    "earnings",
-    "delaware",
-    "counties",
-    "occurred",
-    "concrete",
-    "accident",
-    "resident",
-    "possibly",
-    "flashing",
-    "malaysia",
-    "antiques",
-    "parallel",
-    "bathroom",
-    "drinking",
-    "reaction",
-    "enhanced",
-    "entitled",
-    "generate",
-    "monitors",
-    "duration",
-    "pursuant",
-    "contrast",
-    "adoption",
-    "measured",
-    "marshall",
-    "thousand",
-    "hamilton",
-    "tutorial",
-    "portugal",
-    "lawrence",
-    "valuable",
-    "airlines",
-    "aviation",
-    "disaster",
-    "commands",
-    "achieved",
-    "injuries",
-    "appeared",
-    "franklin",
-    "exciting",
-    "pleasure",
-    "oriented",
-    "desktops",
-    "columbus",
-    "producer",
-    "semester",
-    "strongly",
-    "proteins",
-    "familiar",
-    "carrying",
-    "editions",
-    "vertical",
-    "absolute",
-    "consists",
-    "soldiers",
-    "guardian",
-    "classics",
-    "bringing",
-    "evaluate",
-    "tropical",
-    "pipeline",
-    "everyday",
-    "handbook",
-    "navigate",
-    "somewhat",
-    "receiver",
-    "scottish",
-    "richmond",
-    "covering",
-    "platinum",
-    "judgment",
-    "bedrooms",
-    "modeling",
-    "spectrum",
-    "emphasis",
-    "princess",
-    "entering",
-    "thompson",
-    "memories",
-    "adequate",
-    "cartoons",
-    "entirely",
-    "replaced",
-    "reducing",
-    "shooting",
-    "launched",
-    "suggests",
-    "operated",
-    "overseas",
-    "surprise",
-    "shoppers",
-    "supposed",
-    "ordinary",
-    "applying",
-    "reporter",
-    "champion",
-    "sentence",
-    "outcomes",
-    "survival",
-    "jonathan",
-    "whenever",
-    "lifetime",
-    "athletic",
-    "campbell",
-    "traveler",
-    "aluminum",
-    "trailers",
-    "syndrome",
-    "expanded",
-    "bulgaria",
-    "believed",
-    "spanking",
-    "catering",
-    "incident",
-    "dynamics",
-    "decrease",
-    "revenues",
-    "emerging",
-    "churches",
-    "reserves",
-    "minority",
-    "recorder",
-    "seminars",
-    "paradise",
-    "compiled",
-    "romantic",
-    "revealed",
-    "margaret",
-    "portions",
-    "equation",
-    "reviewer",
-    "involves",
-    "earrings",
-    "chapters",
-    "literary",
-    "choosing",
-    "boundary",
-    "believes",
-    "deadline",
-    "equipped",
-    "broadway",
-    "acquired",
-    "entrance",
-    "attempts",
-    "answered",
-    "disorder",
-    "firewall",
-    "animated",
-    "judicial",
-    "bachelor",
-    "attitude",
-    "montreal",
-    "genetics",
-    "attended",
-    "mitchell",
-    "embedded",
-    "brochure",
-    "petition",
-    "shoulder",
-    "diameter",
-    "literacy",
-    "moderate",
-    "opposite",
-    "mercedes",
-    "receives",
-    "veterans",
-    "occasion",
-    "sleeping",
-    "moreover",
-    "michelle",
-    "dialogue",
-    "declared",
-    "handheld",
-    "disposal",
-    "florists",
-    "switches",
-    "midnight",
-    "commonly",
-    "pleasant",
-    "announce",
-    "sampling",
-    "inspired",
-    "weddings",
-    "suddenly",
-    "township",
-    "rankings",
-    "robinson",
-    "remained",
-    "entities",
-    "roulette",
-    "medicare",
-    "explains",
-    "feelings",
-    "donation",
-    "targeted",
-    "realized",
-    "climbing",
-    "somebody",
-    "colombia",
-    "archived",
-    "courtesy",
-    "detected",
-    "bracelet",
-    "juvenile",
-    "acoustic",
-    "cassette",
-    "steering",
-    "cemetery",
-    "contests",
-    "berkeley",
-    "adjusted",
-    "seasonal",
-    "counters",
-    "cultures",
-    "coaching",
-    "examined",
-    "encoding",
-    "cosmetic",
-    "resulted",
-    "portrait",
-    "carriers",
-    "mobility",
-    "builders",
-    "struggle",
-    "crossing",
-    "resolved",
-    "branches",
-    "holdings",
-    "zimbabwe",
-    "browsing",
-    "bargains",
-    "frequent",
-    "ensuring",
-    "hispanic",
-    "diamonds",
-    "untitled",
-    "marriott",
-    "starring",
-    "referral",
-    "distinct",
-    "verified",
-    "formerly",
-    "situated",
-    "strictly",
-    "retailer",
-    "vitamins",
-    "brooklyn",
-    "phillips",
-    "interval",
-    "repeated",
-    "filename",
-    "florence",
-    "analyses",
-    "drawings",
-    "scenario",
-    "junction",
-    "weekends",
-    "produces",
-    "kingston",
-    "adapters",
-    "adjacent",
-    "reaching",
-    "receptor",
-    "surgical",
-    "citation",
-    "premises",
-    "imperial",
-    "benjamin",
-    "studying",
-    "upgrades",
-    "offshore",
-    "harrison",
-    "emission",
-    "apparent",
-    "outreach",
-    "mounting",
-    "balanced",
-    "explicit",
-    "precious",
-    "annually",
-    "scanners",
-    "delivers",
-    "necklace",
-    "arranged",
-    "theaters",
-    "advocacy",
-    "threaded",
-    "footwear",
-    "licenses",
-    "removing",
-    "isolated",
-    "assisted",
-    "compound",
-    "abortion",
-    "wellness",
-    "membrane",
-    "previews",
-    "exterior",
-    "greeting",
-    "botswana",
-    "velocity",
-    "composed",
-    "baseline",
-    "honolulu",
-    "electron",
-    "passport",
-    "treasury",
-    "occupied",
-    "observer",
-    "sunshine",
-    "ceremony",
-    "arrested",
-    "homework",
-    "assessed",
-    "enabling",
-    "stronger",
-    "advances",
-    "darkness",
-    "stanford",
-    "rejected",
-    "railroad",
-    "lectures",
-    "cheapest",
-    "salvador",
-    "tanzania",
-    "preserve",
-    "vibrator",
-    "unsigned",
-    "theories",
-    "executed",
-    "showcase",
-    "integral",
-    "synopsis",
-    "composer",
-    "accessed",
-    "imported",
-    "contrary",
-    "focusing",
-    "admitted",
-    "equality",
-    "stickers",
-    "concerts",
-    "cambodia",
-    "updating",
-    "readings",
-    "confused",
-    "compiler",
-    "airports",
-    "brunette",
-    "gathered",
-    "slovenia",
-    "notified",
-    "dramatic",
-    "surfaces",
-    "terrible",
-    "reflects",
-    "taxation",
-    "treasure",
-    "assuming",
-    "monetary",
-    "floating",
-    "plymouth",
-    "warnings",
-    "stunning",
-    "actively",
-    "cookbook",
-    "uploaded",
-    "collapse",
-    "unlikely",
-    "beverage",
-    "forestry",
-    "barriers",
-    "infected",
-    "particle",
-    "minerals",
-    "humidity",
-    "operates",
-    "brisbane",
-    "manitoba",
-    "missions",
-    "costumes",
-    "nickname",
-    "staffing",
-    "statutes",
-    "enrolled",
-    "publicly",
-    "suffered",
-    "informal",
-    "swingers",
-    "mistakes",
-    "defining",
-    "counting",
-    "medieval",
-    "captured",
-    "innocent",
-    "scanning",
-    "cordless",
-    "patricia",
-    "disagree",
-    "episodes",
-    "circular",
-    "mainland",
-    "interact",
-    "auckland",
-    "olympics",
-    "trinidad",
-    "geometry",
-    "slovakia",
-    "gorgeous",
-    "barbados",
-    "chrysler",
-    "mcdonald",
-    "plumbing",
-    "brussels",
-    "shanghai",
-    "davidson",
-    "organize",
-    "triangle",
-    "oriental",
-    "hydrogen",
-    "advocate",
-    "artistic",
-    "detector",
-    "colonial",
-    "proceeds",
-    "indirect",
-    "browsers",
-    "overcome",
-    "brighton",
-    "reminder",
-    "searched",
-    "insights",
-    "sullivan",
-    "exhibits",
-    "bacteria",
-    "moisture",
-    "launches",
-    "latitude",
-    "deposits",
-    "mistress",
-    "trustees",
-    "reprints",
-    "midlands",
-    "analysts",
-    "nicholas",
-    "invasion",
-    "spelling",
-    "medicaid",
-    "infrared",
-    "quarters",
-    "naturals",
-    "fixtures",
-    "flooring",
-    "ethiopia",
-    "athletes",
-    "humanity",
-    "scholars",
-    "snapshot",
-    "segments",
-    "dominant",
-    "minimize",
-    "fraction",
-    "adelaide",
-    "emirates",
-    "promised",
-    "bookings",
-    "fabulous",
-    "maritime",
-    "periodic",
-    "overhead",
-    "prospect",
-    "shipment",
-    "breeding",
-    "envelope",
-    "homeland",
-    "excluded",
-    "emotions",
-    "incoming",
-    "cleaners",
-    "cashiers",
-    "rotation",
-    "premiere",
-    "villages",
-    "symphony",
-    "rational",
-    "fighters",
-    "chambers",
-    "fountain",
-    "regarded",
-    "egyptian",
-    "outlined",
-    "headline",
-    "treating",
-    "enormous",
-    "honduras",
-    "cabinets",
-    "hartford",
-    "wrapping",
-    "infinite",
-    "civilian",
-    "realtors",
-    "wherever",
-    "democrat",
-    "retained",
-    "briefing",
-    "highland",
-    "hawaiian",
-    "consoles",
-    "cylinder",
-    "surround",
-    "finances",
-    "enjoying",
-    "carnival",
-    "promises",
-    "combines",
-    "bradford",
-    "reynolds",
-    "speeches",
-    "savannah",
-    "pointing",
-    "circuits",
-    "handbags",
-    "somerset",
-    "incurred",
-    "roommate",
-    "failures",
-    "theology",
-    "edmonton",
-    "retrieve",
-    "titanium",
-    "deutsche",
-    "postings",
-    "cornwall",
-    "basement",
-    "sandwich",
-    "hearings",
-    "textbook",
-    "frontier",
-    "stopping",
-    "refugees",
-    "peaceful",
-    "doctrine",
-    "trainers",
-    "conclude",
-    "advisors",
-    "pavilion",
-    "talented",
-    "paraguay",
-    "boutique",
-    "peterson",
-    "homeless",
-    "horrible",
-    "metallic",
-    "warriors",
-    "cadillac",
-    "parental",
-    "marathon",
-    "pressing",
-    "gasoline",
-    "catalyst",
-    "analyzed",
-    "remedies",
-    "validity",
-    "weighted",
-    "performs",
-    "plastics",
-    "salaries",
-    "postcard",
-    "elephant",
-    "drainage",
-    "clearing",
-    "routines",
-    "reliance",
-    "striking",
-    "ensemble",
-    "biblical",
-    "prostate",
-    "nitrogen",
-    "softball",
-    "musician",
-    "blocking",
-    "limiting",
-    "dispatch",
-    "restored",
-    "chargers",
-    "rendered",
-    "openings",
-    "councils",
-    "cottages",
-    "develops",
-    "dressing",
-    "drilling",
-    "tomatoes",
-    "clusters",
-    "antibody",
-    "momentum",
-    "grateful",
-    "laughing",
-    "opponent",
-    "mongolia",
-    "manually",
-    "centered",
-    "writings",
-    "charging",
-    "discrete",
-    "beginner",
-    "sapphire",
-    "crawford",
-    "declined",
-    "neighbor",
-    "highways",
-    "intimate",
-    "dentists",
-    "variance",
-    "cameroon",
-    "adaptive",
-    "computed",
-    "generous",
-    "learners",
-    "aberdeen",
-    "educated",
-    "inserted",
-    "suburban",
-    "survivor",
-    "impaired",
-    "ventures",
-    "stranger",
-    "tribunal",
-    "pensions",
-    "mattress",
-    "likewise",
-    "charming",
-    "annoying",
-    "disclose",
-    "restrict",
-    "endorsed",
-    "maximize",
-    "senators",
-    "bleeding",
-    "optimize",
-    "caroline",
-    "engaging",
-    "deferred",
-    "polished",
-    "flashers",
-    "arrivals",
-    "securely",
-    "promoted",
-    "enclosed",
-    "thriller",
-    "transmit",
-    "planners",
-    "disputes",
-    "textiles",
-    "aquarium",
-    "promptly",
-    "sexually",
-    "dividend",
-    "playback",
-    "handmade",
-    "workflow",
-    "switched",
-    "richards",
-    "hardwood",
-    "temporal",
-    "airplane",
-    "istanbul",
-    "asbestos",
-    "throwing",
-    "potatoes",
-    "thorough",
-    "creature",
-    "syracuse",
-    "maldives",
-    "firmware",
-    "shepherd",
-    "canberra",
-    "sympathy",
-    "avoiding",
-    "surgeons",
-    "promotes",
-    "johnston",
-    "prisoner",
-    "earliest",
-    "morrison",
-    "examines",
-    "budapest",
-    "knitting",
-    "attacked",
-    "smallest",
-    "monsters",
-    "cocktail",
-    "prevents",
-    "severity",
-    "licensee",
-    "bisexual",
-    "tourists",
-    "packaged",
-    "seconded",
-    "activate",
-    "crystals",
-    "kathleen",
-    "cardinal",
-    "claiming",
-    "brackets",
-    "wetlands",
-    "twilight",
-    "monterey",
-    "improves",
-    "deciding",
-    "landlord",
-    "assorted",
-    "vouchers",
-    "turnover",
-    "upgraded",
-    "colorful",
-    "matthews",
-    "amateurs",
-    "deployed",
-    "governed",
-    "protects",
-    "crescent",
-    "freshman",
-    "patience",
-    "securing",
-    "tactical",
-    "maturity",
-    "receipts",
-    "formulas",
-    "spacious",
-    "sometime",
-    "faithful",
-    "invested",
-    "numbered",
-    "founding",
-    "planting",
-    "covenant",
-    "dropping",
-    "calories",
-    "fittings",
-    "einstein",
-    "diagrams",
-    "headsets",
-    "vascular",
-    "toxicity",
-    "relaxing",
-    "uniforms",
-    "residual",
-    "asterisk",
-    "probable",
-    "issuance",
-    "arriving",
-    "unstable",
-    "woodland",
-    "inactive",
-    "traveled",
-    "carriage",
-    "postcode",
-    "withdraw",
-    "landmark",
-    "lacrosse",
-    "winnipeg",
-    "unwanted",
-    "defeated",
-    "dwelling",
-    "symbolic",
-    "stocking",
-    "balloons",
-    "welcomed",
-    "infinity",
-    "notation",
-    "chandler",
-    "semantic",
-    "complain",
-    "adhesive",
-    "altitude",
-    "infantry",
-    "renowned",
-    "corridor",
-    "inherent",
-    "alphabet",
-    "tailored",
-    "pendants",
-    "romanian",
-    "backyard",
-    "pathways",
-    "newsroom",
-    "monument",
-    "taxpayer",
-    "formally",
-    "lavender",
-    "doctoral",
-    "backpack",
-    "outgoing",
-    "sheraton",
-    "tendency",
-    "utilized",
-    "initiate",
-    "elevated",
-    "outlines",
-    "steroids",
-    "critique",
-    "honestly",
-    "upstream",
-    "carnegie",
-    "listened",
-    "sediment",
-    "survived",
-    "spinning",
-    "pentagon",
-    "spectral",
-    "diabetic",
-    "stressed",
-    "dominica",
-    "fragment",
-    "finishes",
-    "lecturer",
-    "djibouti",
-    "credited",
-    "cherokee",
-    "recycled",
-    "blankets",
-    "weakness",
-    "reminded",
-    "molecule",
-    "piercing",
-    "antilles",
-    "homemade",
-    "marginal",
-    "efficacy",
-    "prestige",
-    "pinnacle",
-    "unbiased",
-    "suriname",
-    "culinary",
-    "scarface",
-    "auditing",
-    "offender",
-    "waterloo",
-    "boarding",
-    "daylight",
-    "catching",
-    "connects",
-    "explores",
-    "liberals",
-    "aperture",
-    "coupling",
-    "oncology",
-    "orthodox",
-    "ferguson",
-    "holistic",
-    "umbrella",
-    "headache",
-    "feasible",
-    "perfumes",
-    "mechanic",
-    "deletion",
-    "elective",
-    "forensic",
-    "ceramics",
-    "suspense",
-    "drafting",
-    "touching",
-    "elevator",
-    "profound",
-    "laserjet",
-    "balances",
-    "firearms",
-    "capsules",
-    "pursuing",
-    "overtime",
-    "exceeded",
-    "labeling",
-    "deserves",
-    "paradigm",
-    "santiago",
-    "advising",
-    "wondered",
-    "cheshire",
-    "premiums",
-    "lutheran",
-    "syllabus",
-    "valencia",
-    "superman",
-    "activism",
-    "leverage",
-    "anguilla",
-    "mutation",
-    "activist",
-    "proposes",
-    "tasmania",
-    "averages",
-    "bookshop",
-    "severely",
-    "blessing",
-    "prompted",
-    "pasadena",
-    "abnormal",
-    "delicate",
-    "convince",
-    "calculus",
-    "selector",
-    "shifting",
-    "subtotal",
-    "delegate",
-    "analyzer",
-    "nutrient",
-    "underway",
-    "excerpts",
-    "regulate",
-    "trousers",
-    "replaces",
-    "shortage",
-    "goodness",
-    "extracts",
-    "explored",
-    "coronary",
-    "mediated",
-    "buddhist",
-    "coloured",
-    "respects",
-    "granting",
-    "motoring",
-    "randomly",
-    "mentally",
-    "silicone",
-    "welcomes",
-    "consumed",
-    "austrian",
-    "confined",
-    "monopoly",
-    "robotics",
-    "contexts",
-    "troubled",
-    "footnote",
-    "evolving",
-    "organism",
-    "violated",
-    "laughter",
-    "inventor",
-    "residues",
-    "vicinity",
-    "invasive",
-    "rainfall",
-    "helsinki",
-    "hardback",
-    "backward",
-    "charcoal",
-    "glorious",
-    "handsome",
-    "defaults",
-    "grounded",
-    "espresso",
-    "ancestry",
-    "dolphins",
-    "adopting",
-    "detached",
-    "sentinel",
-    "desserts",
-    "grooming",
-    "meridian",
-    "validate",
-    "rotating",
-    "flooding",
-    "panthers",
-    "ignition",
-    "tungsten",
-    "shutdown",
-    "servants",
-    "meanings",
-    "heavenly",
-    "albanian",
-    "overflow",
-    "hastings",
-    "taxonomy",
-    "implicit",
-    "simplify",
-    "schwartz",
-    "terrific",
-    "definite",
-    "regiment",
-    "predator",
-    "deceased",
-    "captures",
-    "coventry",
-    "falkland",
-    "educator",
-    "visually",
-    "obsolete",
-    "wardrobe",
-    "immunity",
-    "cheating",
-    "cookware",
-    "scrutiny",
-    "nonsense",
-    "invented",
-    "gradient",
-    "diazepam",
-    "clerical",
-    "meantime",
-    "patented",
-    "mccarthy",
-    "reversed",
-    "maternal",
-    "specimen",
-    "seamless",
-    "branding",
-    "examiner",
-    "vineyard",
-    "listener",
-    "chloride",
-    "awaiting",
-    "panorama",
-    "demanded",
-    "kiribati",
-    "fidelity",
-    "rhapsody",
-    "freezing",
-    "feminist",
-    "theatres",
-    "coloring",
-    "leukemia",
-    "habitats",
-    "sensible",
-    "unlawful",
-    "swinging",
-    "opposing",
-    "lowering",
-    "cruising",
-    "headings",
-    "deleting",
-    "billions",
-    "stafford",
-    "labrador",
-    "outdated",
-    "distress",
-    "barbecue",
-    "secondly",
-    "cerebral",
-    "indexing",
-    "coatings",
-    "systemic",
-    "abundant",
-    "adaptors",
-    "compares",
-    "hesitate",
-    "pavement",
-    "lifelong",
-    "promoter",
-    "remotely",
-    "fletcher",
-    "curtains",
-    "redirect",
-    "galaxies",
-    "elegance",
-    "volatile",
-    "pointers",
-    "socially",
-    "randolph",
-    "alkaline",
-    "campuses",
-    "readable",
-    "responds",
-    "prepares",
-    "symmetry",
-    "screened",
-    "carlisle",
-    "stockton",
-    "stepping",
-    "topology",
-    "appetite",
-    "airborne",
-    "morality",
-    "handicap",
-    "antennas",
-    "trucking",
-    "defender",
-    "shortcut",
-    "sunlight",
-    "globally",
-    "bearings",
-    "sickness",
-    "prohibit",
-    "auditors",
-    "eternity",
-    "weighing",
-    "currents",
-    "protests",
-    "horizons",
-    "illusion",
-    "enlarged",
-    "stephens",
-    "uniquely",
-    "casualty",
-    "whistler",
-    "mushroom",
-    "principe",
-    "thirteen",
-    "theodore",
-    "sounding",
-    "rebounds",
-    "samantha",
-    "mutually",
-    "brittany",
-    "affinity",
-    "buddhism",
-    "borrower",
-    "warrants",
-    "fairness",
-    "discreet",
-    "misplace",
-    "serviced",
-    "vaccines",
-    "tickling",
-    "advisers",
-    "charters",
-    "croatian",
-    "rhetoric",
-    "surveyed",
-    "ballroom",
-    "ignoring",
-    "coherent",
-    "converts",
-    "majestic",
-    "bicycles",
-    "clifford",
-    "putative",
-    "manifest",
-    "zeppelin",
-    "kimberly",
-    "claimant",
-    "dinosaur",
-    "energies",
-    "repealed",
-    "landfill",
-    "napoleon",
-    "friedman",
-    "patriots",
-    "sergeant",
-    "courtney",
-    "scooters",
-    "reactive",
-    "serenity",
-    "sheridan",
-    "sanitary",
-    "dreaming",
-    "implants",
-    "hormones",
-    "geoffrey",
-    "epidemic",
-    "cinnamon",
-    "variants",
-    "lawsuits",
-    "absorbed",
-    "improper",
-    "tangible",
-    "youngest",
-    "textures",
-    "dominion",
-    "wolfgang",
-    "realised",
-    "eighteen",
-    "singular",
-    "jennings",
-    "outbreak",
-    "scalable",
-    "fourteen",
-    "skeleton",
-    "suspects",
-    "exporter",
-    "thornton",
-    "locating",
-    "monogram",
-    "enhances",
-    "ornament",
-    "graffiti",
-    "houghton",
-    "threaten",
-    "checksum",
-    "stealing",
-    "breeders",
-    "confirms",
-    "vladimir",
-    "rosemary",
-    "archival",
-    "baccarat",
-    "teenager",
-    "averaged",
-    "bellevue",
-    "rigorous",
-    "allocate",
-    "override",
-    "burgundy",
-    "farewell",
-    "vanguard",
-    "evenings",
-    "troubles",
-    "tutoring",
-    "gemstone",
-    "friction",
-    "atlantis",
-    "insurers",
-    "goodwill",
-    "bulldogs",
-    "ideology",
-    "cervical",
-    "starters",
-    "pictured",
-    "feminine",
-    "nautical",
-    "muscular",
-    "prophecy",
-    "cannabis",
-    "comprise",
-    "disposed",
-    "subtitle",
-    "chestnut",
-    "engraved",
-    "pastoral",
-    "locality",
-    "ethereal",
-    "smoothly",
-    "autonomy",
-    "corvette",
-    "christie",
-    "annotate",
-    "enforced",
-    "financed",
-    "surnames",
-    "shocking",
-    "allergic",
-    "overland",
-    "backbone",
-    "uncommon",
-    "metering",
-    "bartlett",
-    "kitchens",
-    "townsend",
-    "speedway",
-    "founders",
-    "sinclair",
-    "diagonal",
-    "excludes",
-    "matrices",
-    "passages",
-    "etiology",
-    "agreeing",
-    "credible",
-    "cultured",
-    "toddlers",
-    "bindings",
-    "jeremiah",
-    "radiator",
-    "murdered",
-    "acronyms",
-    "colonies",
-    "squadron",
-    "veronica",
-    "filtered",
-    "workload",
-    "inviting",
-    "multiply",
-    "humorous",
-    "erection",
-    "saunders",
-    "offences",
-    "armenian",
-    "mentions",
-    "genocide",
-    "heathrow",
-    "giovanni",
-    "authored",
-    "exported",
-    "harmless",
-    "diagnose",
-    "showroom",
-    "missiles",
-    "nominees",
-    "hallmark",
-    "dominate",
-    "damaging",
-    "journeys",
-    "lobbying",
-    "islander",
-    "recalled",
-    "kawasaki",
-    "licences",
-    "epilepsy",
-    "fracture",
-    "foremost",
-    "mahogany",
-    "clarence",
-    "ignorant",
-    "collects",
-    "treaties",
-    "teaspoon",
-    "buchanan",
-    "seminary",
-    "offenses",
-    "fortress",
-    "settlers",
-    "andersen",
-    "withheld",
-    "insisted",
-    "eclectic",
-    "keystone",
-    "inclined",
-    "traction",
-    "caffeine",
-    "verbatim",
-    "sketches",
-    "tertiary",
-    "shelters",
-    "graphite",
-    "stroller",
-    "sweaters",
-    "mandarin",
-    "mosquito",
-    "analogue",
-    "honorary",
-    "borrowed",
-    "prentice",
-    "depicted",
-    "downward",
-    "garfield",
-    "sticking",
-    "stripped",
-    "steadily",
-    "imagined",
-    "creators",
-    "musicals",
-    "massacre",
-    "conquest",
-    "mandated",
-    "workbook",
-    "assemble",
-    "analytic",
-    "amethyst",
-    "woodward",
-    "concerto",
-    "adorable",
-    "ambition",
-    "timeless",
-    "hypnosis",
-    "shortest",
-    "grinding",
-    "pitching",
-    "bordeaux",
-    "manifold",
-    "upstairs",
-    "vauxhall",
-    "dividing",
-    "garments",
-    "lymphoma",
-    "tapestry",
-    "freebies",
-    "converse",
-    "gardener",
-    "polymers",
-    "penguins",
-    "nowadays",
-    "inferior",
-    "stresses",
-    "redesign",
-    "billings",
-    "amending",
-    "georgian",
-    "policing",
-    "cracking",
-    "kindness",
-    "swelling",
-    "spanning",
-    "railways",
-    "approves",
-    "folklore",
-    "perceive",
-    "atkinson",
-    "wildcats",
-    "grouping",
-    "invoices",
-    "estonian",
-    "pedigree",
-    "sherwood",
-    "bethesda",
-    "precinct",
-    "simplest",
-    "peculiar",
-    "commence",
-    "subclass",
-    "attained",
-    "splendid",
-    "leonardo",
-    "scissors",
-    "laurence",
-    "limerick",
-    "sweeping",
-    "galloway",
-    "provence",
-    "conducts",
-    "divorced",
-    "magnolia",
-    "siblings",
-    "pitcairn",
-    "telecoms",
-    "newsweek",
-    "preceded",
-    "gateways",
-    "trekking",
-    "reversal",
-    "dementia",
-    "proverbs",
-    "mistaken",
-    "miracles",
-    "remedial",
-    "barefoot",
-    "bohemian",
-    "imposing",
-    "marching",
-    "thematic",
-    "servings",
-    "declares",
-    "estrogen",
-    "magellan",
-    "addicted",
-    "rockford",
-    "unlocked",
-    "injected",
-    "enlisted",
-    "prophets",
-    "triggers",
-    "manpower",
-    "watchdog",
-    "detained",
-    "luncheon",
-    "refusing",
-    "antigens",
-    "kinetics",
-    "impacted",
-    "prescott",
-    "lebanese",
-    "overload",
-    "tortured",
-    "pioneers",
-    "pussycat",
-    "slippers",
-    "stimulus",
-    "filipino",
-    "devotion",
-    "anterior",
-    "freedoms",
-    "stirling",
-    "clarinet",
-    "gigabyte",
-    "repaired",
-    "obituary",
-    "painters",
-    "purified",
-    "striving",
-    "spoilers",
-    "meredith",
-    "roadside",
-    "feathers",
-    "automate",
-    "harmonic",
-    "emulator",
-    "synonyms",
-    "stranded",
-    "hercules",
-    "browning",
-    "immortal",
-    "mariners",
-    "endeavor",
-    "settling",
-    "mohammed",
-    "partisan",
-    "vitality",
-    "bothered",
-    "traverse",
-    "garrison",
-    "mckenzie",
-    "fashions",
-    "insomnia",
-    "enduring",
-    "overdose",
-    "freezers",
-    "resigned",
-    "enriched",
-    "reptiles",
-    "beaumont",
-    "bouquets",
-    "wrongful",
-    "sidewalk",
-    "asserted",
-    "squirrel",
-    "bridging",
-    "chickens",
-    "canceled",
-    "cheyenne",
-    "surveyor",
-    "obstacle",
-    "driveway",
-    "marketed",
-    "mandrake",
-    "acquires",
-    "galactic",
-    "academia",
-    "volcanic",
-    "swimsuit",
-    "westerns",
-    "unveiled",
-    "handsets",
-    "diarrhea",
-    "rounding",
-    "generals",
-    "organise",
-    "gigantic",
-    "suppress",
-    "deserved",
-    "violates",
-    "getaways",
-    "metaphor",
-    "infusion",
-    "cleavage",
-    "analysed",
-    "brethren",
-    "toilette",
-    "trailing",
-    "lipstick",
-    "punished",
-    "stamford",
-    "downhill",
-    "utilizes",
-    "deprived",
-    "benedict",
-    "tolerant",
-    "laminate",
-    "marietta",
-    "ceilings",
-    "residing",
-    "markings",
-    "tractors",
-    "seasoned",
-    "sorority",
-    "audition",
-    "guessing",
-    "throttle",
-    "infamous",
-    "pleasing",
-    "seizures",
-    "appealed",
-    "figurine",
-    "chlorine",
-    "entirety",
-    "destined",
-    "yearbook",
-    "anglican",
-    "guernsey",
-    "stirring",
-    "decorate",
-    "vomiting",
-    "exposing",
-    "simulate",
-    "thankful",
-    "vertices",
-    "additive",
-    "washable",
-    "teamwork",
-    "worrying",
-    "ontology",
-    "installs",
-    "trillion",
-    "cashmere",
-    "labelled",
-    "prenatal",
-    "contempt",
-    "collagen",
-    "blizzard",
-    "nigerian",
-    "refining",
-    "confront",
-    "watering",
-    "thrilled",
-    "predicts",
-    "salzburg",
-    "needless",
-    "lakeside",
-    "lorraine",
-    "imminent",
-    "affirmed",
-    "communal",
-    "dynamite",
-    "chatting",
-    "arterial",
-    "mystical",
-    "textured",
-    "pedestal",
-    "widening",
-    "importer",
-    "nominate",
-    "relieved",
-    "closures",
-    "reverend",
-    "cabernet",
-    "binaries",
-    "showdown",
-    "ancestor",
-    "russians",
-    "believer",
-    "declines",
-    "skeletal",
-    "rollover",
-    "adequacy",
-    "breakers",
-    "forwards",
-    "exploits",
-    "offended",
-    "terribly",
-    "presumed",
-    "blending",
-    "speeding",
-    "creditor",
-    "mandates",
-    "peptides",
-    "gaussian",
-    "tensions",
-    "linkages",
-    "disputed",
-    "scouting",
-    "instinct",
-    "bullying",
-    "migraine",
-    "omission",
-    "capitals",
-    "quilting",
-    "rewarded",
-    "husbands",
-    "rockwell",
-    "persuade",
-    "burberry",
-    "endpoint",
-    "siberian",
-    "fielding",
-    "yosemite",
-    "migrants",
-    "deficits",
-    "insanity",
-    "embraced",
-    "reformed",
-    "tolerate",
-    "adhesion",
-    "dialysis",
-    "afforded",
-    "altering",
-    "souvenir",
-    "cucumber",
-    "decisive",
-    "dungeons",
-    "trainees",
-    "shelving",
-    "effluent",
-    "bombings",
-    "equities",
-    "crashing",
-    "cautious",
-    "passions",
-    "utensils",
-    "secretly",
-    "magician",
-    "extremes",
-    "obsessed",
-    "flavored",
-    "dealings",
-    "pathetic",
-    "defended",
-    "handlers",
-    "flagship",
-    "bouncing",
-    "cavalier",
-    "emeritus",
-    "toulouse",
-    "brighter",
-    "attacker",
-    "inverter",
-    "motivate",
-    "retreats",
-    "assessor",
-    "amarillo",
-    "humphrey",
-    "belonged",
-    "cushions",
-    "debugger",
-    "eventual",
-    "mitigate",
-    "arguably",
-    "accesses",
-    "nuisance",
-    "drowning",
-    "bullshit",
-    "nicotine",
-    "comeback",
-    "downtime",
-    "outright",
-    "melodies",
-    "spotting",
-    "wagering",
-    "guinness",
-    "integers",
-    "plumbers",
-    "johannes",
-    "biscuits",
-    "outbound",
-    "breakout",
-    "restless",
-    "complies",
-    "mornings",
-    "pretoria",
-    "feminism",
-    "aromatic",
-    "emporium",
-    "soothing",
-    "freshmen",
-    "departed",
-    "israelis",
-    "swapping",
-    "staining",
-    "overture",
-    "hectares",
-    "scrabble",
-    "watchers",
-    "monmouth",
-    "decoding",
-    "kangaroo",
-    "bungalow",
-    "mindless",
-    "purifier",
-    "recruits",
-    "stamping",
-    "societal",
-    "tuesdays",
-    "belgrade",
-    "polaroid",
-    "hardship",
-    "almighty",
-    "openness",
-    "chromium",
-    "slippery",
-    "moroccan",
-    "subgroup",
-    "yielding",
-    "longhorn",
-    "backdrop",
-    "calcutta",
-    "tenerife",
-    "mediator",
-    "commuter",
-    "tyrosine",
-    "stuffing",
-    "canoeing",
-    "reverted",
-    "crackers",
-    "venetian",
-    "preacher",
-    "complied",
-    "reusable",
-    "attracts",
-    "homicide",
-    "pandemic",
-    "mcdowell",
-    "overcast",
-    "inverted",
-    "achieves",
-    "forehead",
-    "maverick",
-    "anabolic",
-    "snippets",
-    "mixtures",
-    "dragging",
-    "flushing",
-    "delights",
-    "foreword",
-    "piedmont",
-    "outlying",
-    "handouts",
-    "deducted",
-    "totaling",
-    "vigorous",
-    "classify",
-    "cheerful",
-    "weymouth",
-    "billiard",
-    "optimism",
-    "mcgregor",
-    "marlboro",
-    "addendum",
-    "redskins",
-    "retiring",
-    "smashing",
-    "pembroke",
-    "splinter",
-    "stripper",
-    "practise",
-    "analyzes",
-    "pristine",
-    "auditory",
-    "applause",
-    "pounding",
-    "wesleyan",
-    "narrator",
-    "hillside",
-    "joystick",
-    "instruct",
-    "westport",
-    "overhaul",
-    "peruvian",
-    "remarked",
-    "mourning",
-    "resistor",
-    "exploded",
-    "silently",
-    "mckinney",
-    "initials",
-    "tackling",
-    "compress",
-    "apostles",
-    "isolates",
-    "sinister",
-    "arteries",
-    "helpless",
-    "neonatal",
-    "clippers",
-    "shilling",
-    "resemble",
-    "spirited",
-    "recharge",
-    "holloway",
-    "sanction",
-    "effected",
-    "paranoid",
-    "hannover",
-    "comedies",
-    "flamingo",
-    "freeport",
-    "solitary",
-    "emmanuel",
-    "acapulco",
-    "knocking",
-    "broccoli",
-    "graceful",
-    "defenses",
-    "vampires",
-    "relocate",
-    "marianne",
-    "hereford",
-    "reliably",
-    "cherries",
-    "shouting",
-    "conserve",
-    "whipping",
-    "skipping",
-    "melanoma",
-    "yugoslav",
-    "plotting",
-    "fibrosis",
-    "overlook",
-    "captains",
-    "awarding",
-    "flatware",
-    "militant",
-    "artworks",
-    "torrents",
-    "doubtful",
-    "ratified",
-    "insecure",
-    "conveyor",
-    "solvents",
-    "beauties",
-    "artifact",
-    "dripping",
-    "coasters",
-    "intimacy",
-    "geologic",
-    "replicas",
-    "reloaded",
-    "riparian",
-    "thriving",
-    "gracious",
-    "conveyed",
-    "trophies",
-    "eastwood",
-    "aquarius",
-    "grandson",
-    "refinery",
-    "removals",
-    "insiders",
-    "jewelers",
-    "dilution",
-    "fortunes",
-    "amounted",
-    "refunded",
-    "honoring",
-    "climatic",
-    "minimise",
-    "salinity",
-    "normandy",
-    "justices",
-    "jamaican",
-    "leaflets",
-    "coincide",
-    "radicals",
-    "doubling",
-    "replying",
-    "shredder",
-    "launcher",
-    "africans",
-    "salesman",
-    "hatfield",
-    "wrangler",
-    "defiance",
-    "breasted",
-    "donating",
-    "mcintosh",
-    "caterers",
-    "convened",
-    "stallion",
-    "reagents",
-    "weekdays",
-    "wineries",
-    "deserted",
-    "caravans",
-    "contends",
-    "luminous",
-    "hardened",
-    "charting",
-    "fixation",
-    "cyrillic",
-    "monoxide",
-    "quantify",
-    "booklets",
-    "narrowed",
-    "turbines",
-    "conforms",
-    "subtract",
-    "prolific",
-    "retarded",
-    "jeopardy",
-    "aspiring",
-    "refereed",
-    "dazzling",
-    "hardness",
-    "socrates",
-    "adapting",
-    "contours",
-    "villains",
-    "parasite",
-    "protease",
-    "preclude",
-    "thinkers",
-    "retirees",
-    "homology",
-    "embossed",
-    "bismarck",
-    "expended",
-    "deputies",
-    "emergent",
-    "aligning",
-    "beaufort",
-    "nautilus",
-    "inferred",
-    "pitchers",
-    "trombone",
-    "disguise",
-    "eleventh",
-    "workouts",
-    "songbook",
-    "copeland",
-    "marjorie",
-    "renegade",
-    "nineteen",
-    "spraying",
-    "invaders",
-    "depleted",
-    "holiness",
-    "divinity",
-    "sherlock",
-    "punitive",
-    "captions",
-    "pamphlet",
-    "assassin",
-    "michelin",
-    "comforts",
-    "appoints",
-    "finalize",
-    "pumpkins",
-    "sudanese",
-    "novelist",
-    "oblivion",
-    "sprinkle",
-    "montrose",
-    "abridged",
-    "sneakers",
-    "realizes",
-    "chilling",
-    "newcomer",
-    "funniest",
-    "scorpion",
-    "mirrored",
-    "aerobics",
-    "comedian",
-    "clitoris",
-    "ordnance",
-    "preamble",
-    "trapping",
-    "diminish",
-    "stitches",
-    "mediocre",
-    "ayrshire",
-    "damascus",
-    "reactors",
-    "kingsley",
-    "gillette",
-    "fluoride",
-    "parishes",
-    "stacking",
-    "monotone",
-    "referees",
-    "debating",
-    "grabbing",
-    "outboard",
-    "lockheed",
-    "pinpoint",
-    "haunting",
-    "blossoms",
-    "succeeds",
-    "grilling",
-    "reunions",
-    "quadrant",
-    "reckless",
-    "coliseum",
-    "spawning",
-    "figuring",
-    "crushing",
-    "ordained",
-    "shooters",
-    "passover",
-    "bacillus",
-    "sideways",
-    "burglary",
-    "subpoena",
-    "bareback",
-    "extender",
-    "nutshell",
-    "arrogant",
-    "vocalist",
-    "youthful",
-    "stumbled",
-    "tempered",
-    "slipping",
-    "solitude",
-    "platelet",
-    "pursuits",
-    "revolver",
-    "rosewood",
-    "existent",
-    "killings",
-    "dictator",
-    "fanatics",
-    "carousel",
-    "hedgehog",
-    "wheeling",
-    "hawthorn",
-    "bankrupt",
-    "southend",
-    "farmland",
-    "pitfalls",
-    "jurassic",
-    "melville",
-    "weakened",
-    "withdrew",
-    "boosting",
-    "faulkner",
-    "scarcely",
-    "catheter",
-    "diplomat",
-    "commando",
-    "motorway",
-    "hinduism",
-    "urgently",
-    "embodied",
-    "yarmouth",
-    "maximise",
-    "escaping",
-    "suicidal",
-    "cruisers",
-    "dyslexia",
-    "hellenic",
-    "dopamine",
-    "battling",
-    "pancreas",
-    "ammonium",
-    "handyman",
-    "gestures",
-    "ambience",
-    "cardigan",
-    "neuronal",
-    "checkers",
-    "logistic",
-    "easement",
-    "darkroom",
-    "destroys",
-    "rockland",
-    "beatrice",
-    "turnpike",
-    "degraded",
-    "goodyear",
-    "shetland",
-    "thoracic",
-    "hopeless",
-    "selenium",
-    "grinders",
-    "revising",
-    "insignia",
-    "factions",
-    "falmouth",
-    "humility",
-    "dissolve",
-    "adrienne",
-    "crawling",
-    "modifier",
-    "cytology",
-    "biennial",
-    "cohesion",
-    "observes",
-    "corporal",
-    "polarity",
-    "bertrand",
-    "daunting",
-    "blooming",
-    "finalist",
-    "kingdoms",
-    "richness",
-    "converge",
-    "workings",
-    "penelope",
-    "radiance",
-    "downside",
-    "quitting",
-    "morphine",
-    "indicted",
-    "blasting",
-    "repeater",
-    "mastered",
-    "grannies",
-    "immature",
-    "mellitus",
-    "executes",
-    "entrants",
-    "conceive",
-    "genotype",
-    "recourse",
-    "stratton",
-    "armchair",
-    "solstice",
-    "murderer",
-    "intruder",
-    "paddling",
-    "necrosis",
-    "pilgrims",
-    "flamenco",
-    "hormonal",
-    "mandolin",
-    "brightly",
-    "flawless",
-    "breaches",
-    "dumfries",
-    "pedagogy",
-    "zanzibar",
-    "numeracy",
-    "tempting",
-    "planters",
-    "chaplain",
-    "occupies",
-    "shielded",
-    "intrigue",
-    "roadster",
-    "confetti",
-    "abrasive",
-    "assuring",
-    "alarming",
-    "narrowly",
-    "ambiance",
-    "suitcase",
-    "bakeries",
-    "wrappers",
-    "mismatch",
-    "inquirer",
-    "battered",
-    "dreadful",
-    "drifting",
-    "absentee",
-    "fearless",
-    "canister",
-    "recessed",
-    "wrinkles",
-    "clubbing",
-    "crashers",
-    "nativity",
-    "tranquil",
-    "paranoia",
-    "despatch",
-    "fugitive",
-    "dietrich",
-    "cyclists",
-    "markedly",
-    "exempted",
-    "scotsman",
-    "secluded",
-    "jealousy",
-    "envision",
-    "squeezed",
-    "gertrude",
-    "adoptive",
-    "mailings",
-    "reindeer",
-    "telegram",
-    "allotted",
-    "escorted",
-    "barracks",
-    "inducing",
-    "antelope",
-    "terminus",
-    "castings",
-    "flanders",
-    "bookcase",
-    "neoprene",
-    "blackout",
-    "maneuver",
-    "vanished",
-    "crafting",
-    "lighters",
-    "shutting",
-    "spartans",
-    "reasoned",
-    "smoother",
-    "withhold",
-    "sheppard",
-    "betrayed",
-    "mckinley",
-    "pancakes",
-    "focussed",
-    "keepsake",
-    "baptized",
-    "expelled",
-    "betrayal",
-    "flourish",
-    "clueless",
-    "stitched",
-    "mcmillan",
-    "budgeted",
-    "trusting",
-    "attaches",
-    "twisting",
-    "mcintyre",
-    "guilford",
-    "mappings",
-    "trimming",
-    "neutrino",
-    "felicity",
-    "splendor",
-    "fragrant",
-    "cortical",
-    "exponent",
-    "glaucoma",
-    "oversees",
-    "toughest",
-    "literate",
-    "harcourt",
-    "disciple",
-    "rhythmic",
-    "starving",
-    "cleanser",
-    "lonsdale",
-    "renewals",
-    "honoured",
-    "yachting",
-    "monarchy",
-    "scandals",
-    "screamed",
-    "pendulum",
-    "gangster",
-    "censored",
-    "nehemiah",
-    "matchbox",
-    "stubborn",
-    "redeemed",
-    "ethylene",
-    "inhibits",
-    "achilles",
-    "schubert",
-    "stricken",
-    "sidekick",
-    "cascades",
-    "outsider",
-    "laborers",
-    "lobbyist",
-    "whispers",
-    "winthrop",
-    "peasants",
-    "sopranos",
-    "closings",
-    "consular",
-    "knockout",
-    "anchored",
-    "mulberry",
-    "bradshaw",
-    "mythical",
-    "anorexia",
-    "clipping",
-    "shutters",
-    "lanterns",
-    "boosters",
-    "concorde",
-    "angelica",
-    "artisans",
-    "bastards",
-    "appended",
-    "alleging",
-    "familial",
-    "implying",
-    "synaptic",
-    "hostages",
-    "fruitful",
-    "pyramids",
-    "depended",
-    "unleaded",
-    "mesquite",
-    "tortoise",
-    "asteroid",
-    "unlisted",
-    "remnants",
-    "comrades",
-    "voltages",
-    "assignee",
-    "yokohama",
-    "tailgate",
-    "scrubbed",
-    "hangover",
-    "wedgwood",
-    "cupboard",
-    "palmetto",
-    "whitaker",
-    "mischief",
-    "soybeans",
-    "waitress",
-    "oversize",
-    "competed",
-    "hatchery",
-    "emitting",
-    "sanskrit",
-    "heirloom",
-    "esoteric",
-    "landings",
-    "thatcher",
-    "scramble",
-    "troopers",
-    "eruption",
-    "preached",
-    "careless",
-    "chemists",
-    "narcotic",
-    "actuator",
-    "sorcerer",
-    "invoking",
-    "methanol",
-    "slowdown",
-    "noticing",
-    "furnaces",
-    "occupant",
-    "juggling",
-    "wildfire",
-    "rambling",
-    "lausanne",
-    "legality",
-    "regulars",
-    "wildcard",
-    "guaranty",
-    "cropping",
-    "diverted",
-    "forgiven",
-    "diplomas",
-    "powdered",
-    "pulitzer",
-    "shredded",
-    "granular",
-    "inflated",
-    "intercom",
-    "splicing",
-    "campfire",
-    "graphing",
-    "diskette",
-    "diaspora",
-    "swimmers",
-    "syllable",
-    "sweating",
-    "lemonade",
-    "absences",
-    "solarium",
-    "persists",
-    "cromwell",
-    "drummond",
-    "survives",
-    "bursting",
-    "epiphany",
-    "moulding",
-    "renaming",
-    "pathogen",
-    "resonant",
-    "expedite",
-    "invading",
-    "strained",
-    "uprising",
-    "stalking",
-    "sturgeon",
-    "smallpox",
-    "waterway",
-    "migrated",
-    "endorses",
-    "critters",
-    "leveling",
-    "stadiums",
-    "cataract",
-    "playable",
-    "virology",
-    "nazareth",
-    "abruptly",
-    "mainline",
-    "anodized",
-    "donnelly",
-    "intrepid",
-    "alerting",
-    "differed",
-    "eyebrows",
-    "inspires",
-    "coauthor",
-    "trenches",
-    "doorstep",
-    "dangling",
-    "drawback",
-    "proofing",
-    "westward",
-    "prefixes",
-    "embraces",
-    "flavours",
-    "isotopes",
-    "auspices",
-    "countess",
-    "pleading",
-    "montague",
-    "snowfall",
-    "summoned",
-    "dictated",
-    "proximal",
-    "suitably",
-    "peroxide",
-    "formulae",
-    "backlash",
-    "frontage",
-    "barclays",
-    "hammered",
-    "caucasus",
-    "therefor",
-    "rochdale",
-    "pastures",
-    "carthage",
-    "leighton",
-    "gripping",
-    "dateline",
-    "wandered",
-    "campsite",
-    "marketer",
-    "shedding",
-    "funerals",
-    "redefine",
-    "proclaim",
-    "recreate",
-    "horrific",
-    "lifeline",
-    "sabotage",
-    "ruthless",
-    "aptitude",
-    "objected",
-    "favoured",
-    "primates",
-    "crockett",
-    "forklift",
-    "guarding",
-    "windmill",
-    "dedicate",
-    "renewing",
-    "embarked",
-    "quickest",
-    "automata",
-    "draining",
-    "punching",
-    "inquired",
-    "accented",
-    "hannibal",
-    "creeping",
-    "kerosene",
-    "freaking",
-    "assaults",
-    "parkland",
-    "werewolf",
-    "swallows",
-    "charisma",
-    "kilkenny",
-    "tweaking",
-    "treatise",
-    "chipping",
-    "spalding",
-    "monsieur",
-    "reacting",
-    "avengers",
-    "pigments",
-    "eighties",
-    "freehold",
-    "forester",
-    "resisted",
-    "injector",
-    "barnsley",
-    "disgrace",
-    "ointment",
-    "tripping",
-    "masthead",
-    "chadwick",
-    "hypnotic",
-    "adultery",
-    "shamrock",
-    "sycamore",
-    "smelling",
-    "polluted",
-    "airbrush",
-    "restores",
-    "dictates",
-    "computes",
-    "blockade",
-    "quotient",
-    "tributes",
-    "thinning",
-    "primrose",
-    "corduroy",
-    "changers",
-    "desiring",
-    "hoffmann",
-    "cuttings",
-    "sculptor",
-    "cyclical",
-    "playmate",
-    "airfield",
-    "flipping",
-    "neoplasm",
-    "weinberg",
-    "elliptic",
-    "drinkers",
-    "affluent",
-    "truckers",
-    "lonesome",
-    "jacquard",
-    "assesses",
-    "labourer",
-    "gauntlet",
-    "beverley",
-    "crusader",
-    "blenders",
-    "drumming",
-    "alistair",
-    "patching",
-    "luscious",
-    "sighting",
-    "solenoid",
-    "underdog",
-    "goldfish",
-    "delaying",
-    "animator",
-    "modelled",
-    "flanagan",
-    "expiring",
-    "whistles",
-    "swearing",
-    "peerless",
-    "atypical",
-    "slimming",
-    "brooches",
-    "mandalay",
-    "climbers",
-    "blinking",
-    "sweetest",
-    "vocation",
-    "dilemmas",
-    "horowitz",
-    "knockers",
-    "modifies",
-    "thanking",
-    "cohesive",
-    "manicure",
-    "reunited",
-    "colossal",
-    "mcdaniel",
-    "shingles",
-    "hanukkah",
-    "immersed",
-    "philemon",
-    "roasting",
-    "hathaway",
-    "narrated",
-    "saucepan",
-    "freshest",
-    "hacienda",
-    "pizzeria",
-    "airspace",
-    "workable",
-    "ordinate",
-    "glaciers",
-    "infringe",
-    "fastener",
-    "symposia",
-    "ailments",
-    "unopened",
-    "brushing",
-    "resolves",
-    "sporadic",
-    "zippered",
-    "brownies",
-    "autistic",
-    "painless",
-    "climates",
-    "reissues",
-    "dredging",
-    "theorems",
-    "samplers",
-    "tamworth",
-    "shrugged",
-    "electors",
-    "hitherto",
-    "fantasia",
-    "camisole",
-    "outraged",
-    "physique",
-    "cheering",
-    "narrower",
-    "hairless",
-    "machined",
-    "eviction",
-    "scarcity",
-    "filament",
-    "abingdon",
-    "dividers",
-    "casanova",
-    "downfall",
-    "parmesan",
-    "stairway",
-    "sewerage",
-    "gamblers",
-    "sardinia",
-    "outweigh",
-    "eggplant",
-    "monaghan",
-    "dressage",
-    "coercion",
-    "truthful",
-    "avionics",
-    "linearly",
-    "poignant",
-    "waterman",
-    "enquirer",
-    "downturn",
-    "cautions",
-    "brighten",
-    "nepalese",
-    "conceded",
-    "postpone",
-    "pheasant",
-    "marrying",
-    "carvings",
-    "choppers",
-    "terriers",
-    "toasters",
-    "politely",
-    "dortmund",
-    "mannheim",
-    "alderman",
-    "lockwood",
-    "coughing",
-    "spurious",
-    "nobility",
-    "shippers",
-    "polygons",
-    "linotype",
-    "buffered",
-    "provoked",
-    "dispense",
-    "accusing",
-    "childish",
-    "midwives",
-    "cyclones",
-    "verbally",
-    "chenille",
-    "thurston",
-    "mobilize",
-    "attendee",
-    "baroness",
-    "winnings",
-    "leapfrog",
-    "terraces",
-    "screwing",
-    "prologue",
-    "accorded",
-    "editable",
-    "strapped",
-    "bolivian",
-    "woodwork",
-    "cavities",
-    "cravings",
-    "retrofit",
-    "infested",
-    "hibiscus",
-    "woodwind",
-    "horribly",
-    "woodside",
-    "naturist",
-    "plethora",
-    "orchards",
-    "pertains",
-    "italians",
-    "bestowed",
-    "emulsion",
-    "rousseau",
-    "deadlock",
-    "placenta",
-    "deriving",
-    "likeness",
-    "nicholls",
-    "habakkuk",
-    "impulses",
-    "interpol",
-    "housings",
-    "leftover",
-    "plugging",
-    "vignette",
-    "fireball",
-    "westerly",
-    "modality",
-    "granules",
-    "deceived",
-    "grantees",
-    "lawfully",
-    "notifies",
-    "baritone",
-    "condemns",
-    "flirting",
-    "poisoned",
-    "abducted",
-    "trolling",
-    "fuselage",
-    "redheads",
-    "crippled",
-    "stampede",
-    "utilised",
-    "mcknight",
-    "fatality",
-    "printout",
-    "follower",
-    "chanting",
-    "wrestler",
-    "behaving",
-    "abrasion",
-    "mustangs",
-    "genitals",
-    "confines",
-    "aversion",
-    "stewards",
-    "retainer",
-    "grieving",
-    "chastity",
-    "surfaced",
-    "nouvelle",
-    "maturing",
-    "awakened",
-    "lodgings",
-    "rumanian",
-    "pullover",
-    "towering",
-    "stemming",
-    "dialects",
-    "casually",
-    "freedman",
-    "packager",
-    "populate",
-    "sluggish",
-    "reginald",
-    "hideaway",
-    "shameful",
-    "deafness",
-    "laureate",
-    "syphilis",
-    "pantheon",
-    "consumes",
-    "lovingly",
-    "untested",
-    "verifies",
-    "artistry",
-    "headlamp",
-    "grandeur",
-    "mansions",
-    "bounding",
-    "ephemera",
-    "atheists",
-    "wearable",
-    "weaponry",
-    "profiler",
-    "essences",
-    "vendetta",
-    "restrain",
-    "clutches",
-    "lettings",
-    "numerals",
-    "zucchini",
-    "fetching",
-    "unmarked",
-    "diocesan",
-    "chisholm",
-    "foursome",
-    "startled",
-    "spitfire",
-    "querying",
-    "fingered",
-    "algerian",
-    "stencils",
-    "orphaned",
-    "prudence",
-    "tasteful",
-    "distract",
-    "sideshow",
-    "pastries",
-    "holsters",
-    "consents",
-    "oddities",
-    "suicides",
-    "tortilla",
-    "unfairly",
-    "colossus",
-    "buckeyes",
-    "bodywork",
-    "indecent",
-    "microbes",
-    "empowers",
-    "phonetic",
-    "compiles",
-    "jackpots",
-    "sizzling",
-    "absorber",
-    "vigilant",
-    "sailboat",
-    "partying",
-    "forested",
-    "roadways",
-    "diligent",
-    "almanacs",
-    "aneurysm",
-    "colognes",
-    "fullness",
-    "brutally",
-    "aquatics",
-    "populace",
-    "cotswold",
-    "habitual",
-    "alhambra",
-    "causeway",
-    "restated",
-    "reopened",
-    "fastened",
-    "tompkins",
-    "innovate",
-    "boroughs",
-    "adhering",
-    "hampered",
-    "gershwin",
-    "mangrove",
-    "arranger",
-    "insuring",
-    "boasting",
-    "carefree",
-    "twenties",
-    "codified",
-    "overlays",
-    "searcher",
-    "unifying",
-    "bluebird",
-    "deformed",
-    "wretched",
-    "decadent",
-    "stoppers",
-    "steaming",
-    "humanist",
-    "obscured",
-    "powering",
-    "butchers",
-    "fiercely",
-    "hysteria",
-    "breached",
-    "shipyard",
-    "distrust",
-    "eloquent",
-    "wondrous",
-    "westbury",
-    "bustling",
-    "breakage",
-    "broadest",
-    "drenched",
-    "foreskin",
-    "capstone",
-    "portrays",
-    "firewood",
-    "serenade",
-    "setbacks",
-    "truffles",
-    "profiled",
-    "gentiles",
-    "branched",
-    "mystique",
-    "sarajevo",
-    "superbly",
-    "solihull",
-    "nazarene",
-    "whomever",
-    "toolbars",
-    "rigidity",
-    "tumbling",
-    "disables",
-    "ridicule",
-    "trimmers",
-    "sculpted",
-    "talisman",
-    "rebuttal",
-    "spinners",
-    "roderick",
-    "perverse",
-    "facelift",
-    "merciful",
-    "euphoria",
-    "assholes",
-    "sniffing",
-    "stringer",
-    "pyrenees",
-    "recovers",
-    "aerosols",
-    "yearning",
-    "esteemed",
-    "antidote",
-    "woodford",
-    "eyepiece",
-    "freehand",
-    "nameless",
-    "voltaire",
-    "mainstay",
-    "indebted",
-    "breathed",
-    "syringes",
-    "transact",
-    "regimens",
-    "puncture",
-    "nineties",
-    "darkened",
-    "smoothie",
-    "loathing",
-    "hammocks",
-    "bottling",
-    "virtuous",
-    "decipher",
-    "overkill",
-    "foraging",
-    "chairmen",
-    "foothill",
-    "layering",
-    "airwaves",
-    "midrange",
-    "recliner",
-    "incision",
-    "adjuster",
-    "grasping",
-    "mortuary",
-    "teletext",
-    "harriers",
-    "rightful",
-    "hesitant",
-    "prevails",
-    "schumann",
-    "mcfadden",
-    "mcgovern",
-    "olivetti",
-    "regained",
-    "stroking",
-    "disallow",
-    "procured",
-    "remanded",
-    "virtuoso",
-    "paraffin",
-    "disjoint",
-    "hijacked",
-    "puzzling",
-    "tunisian",
-    "hologram",
-    "starfish",
-    "bordered",
-    "tectonic",
-    "seedling",
-    "dwellers",
-    "snowball",
-    "revamped",
-    "brandeis",
-    "macaroni",
-    "electing",
-    "evacuate",
-    "softened",
-    "smartest",
-    "scaffold",
-    "dislikes",
-    "tyneside",
-    "bavarian",
-    "mulligan",
-    "canopies",
-    "grantham",
-    "toolkits",
-    "anaconda",
-    "basilica",
-    "hinckley",
-    "sausages",
-    "roundups",
-    "endanger",
-    "rollback",
-    "snowshoe",
-    "backside",
-    "foreseen",
-    "scallops",
-    "happiest",
-    "nagasaki",
-    "indented",
-    "disclaim",
-    "sunburst",
-    "garnered",
-    "meltdown",
-    "ascended",
-    "vesicles",
-    "resizing",
-    "chopping",
-    "enacting",
-    "sideline",
-    "stabbing",
-    "ligament",
-    "wanderer",
-    "spitting",
-    "seacoast",
-    "chancery",
-    "explodes",
-    "executor",
-    "anglesey",
-    "tomahawk",
-    "mongoose",
-    "rallying",
-    "uxbridge",
-    "agnostic",
-    "delusion",
-    "fredrick",
-    "neutrons",
-    "sulphate",
-    "mariposa",
-    "hovering",
-    "obsidian",
-    "dressers",
-    "domicile",
-    "optimise",
-    "fostered",
-    "revolves",
-    "glimpses",
-    "lewisham",
-    "pairings",
-    "exorcism",
-    "diseased",
-    "buttocks",
-    "unmanned",
-    "rainbows",
-    "poseidon",
-    "mexicans",
-    "deported",
-    "decedent",
-    "monorail",
-    "bookworm",
-    "foucault",
-    "fireside",
-    "suffrage",
-    "triumphs",
-    "grenades",
-    "ventured",
-    "kneeling",
-    "negation",
-    "fulfills",
-    "trespass",
-    "glycerol",
-    "impunity",
-    "itemized",
-    "infernal",
-    "pampered",
-    "praising",
-    "holstein",
-    "droplets",
-    "inducted",
-    "hangings",
-    "wrecking",
-    "bankroll",
-    "bioassay",
-    "iroquois",
-    "digested",
-    "trumpets",
-    "majoring",
-    "glitches",
-    "embodies",
-    "sedation",
-    "cannibal",
-    "stricter",
-    "lavatory",
-    "ancients",
-    "snapping",
-    "olympian",
-    "devotees",
-    "memorize",
-    "shuttles",
-    "parodies",
-    "scrapped",
-    "materiel",
-    "slamming",
-    "coenzyme",
-    "worthing",
-    "populous",
-    "spotless",
-    "porosity",
-    "teesside",
-    "ecstatic",
-    "carotene",
-    "skinning",
-    "forsaken",
-    "recounts",
-    "menswear",
-    "wrenches",
-    "brigades",
-    "totality",
-    "boulders",
-    "smoothed",
-    "hounslow",
-    "striping",
-    "clamping",
-    "whiplash",
-    "radiated",
-    "trolleys",
-    "headband",
-    "forcibly",
-    "presided",
-    "calamity",
-    "fandango",
-    "iranians",
-    "platters",
-    "germanic",
-    "harassed",
-    "meditate",
-    "playtime",
-    "deferral",
-    "psychics",
-    "extruded",
-    "muttered",
-    "knitwear",
-    "fillings",
-    "secreted",
-    "personas",
-    "knuckles",
-    "ablation",
-    "buoyancy",
-    "sizeable",
-    "heaviest",
-    "prairies",
-    "hamsters",
-    "fleeting",
-    "evacuees",
-    "unfolded",
-    "trackers",
-    "hindered",
-    "aardvark",
-    "isotopic",
-    "windfall",
-    "decimals",
-    "visceral",
-    "fructose",
-    "skillful",
-    "midfield",
-    "massages",
-    "scraping",
-    "unbroken",
-    "urethane",
-    "crusades",
-    "defences",
-    "elicited",
-    "swirling",
-    "clinging",
-    "sorensen",
-    "racially",
-    "expertly",
-    "sundries",
-    "ridgeway",
-    "verifier",
-    "sleepers",
-    "eurasian",
-    "unloaded",
-    "bandages",
-    "scripted",
-    "spoofing",
-    "precedes",
-    "skeptics",
-    "palatine",
-    "motorist",
-    "analyser",
-    "spreader",
-    "grammars",
-    "overalls",
-    "tattooed",
-    "bitterly",
-    "cleverly",
-    "liberian",
-    "overturn",
-    "tentacle",
-    "motility",
-    "reassure",
-    "inertial",
-    "moveable",
-    "agrarian",
-    "sidestep",
-    "leathers",
-    "banished",
-    "terraced",
-    "operands",
-    "parisian",
-    "humanism",
-    "basildon",
-    "unusable",
-    "skylight",
-    "monarchs",
-    "unsolved",
-    "reckoned",
-    "squarely",
-    "softness",
-    "excepted",
-    "whopping",
-    "corrects",
-    "vanishes",
-    "obedient",
-    "fetishes",
-    "ascribed",
-    "licorice",
-    "strikers",
-    "optimist",
-    "seashore",
-    "marinade",
-    "absinthe",
-    "hegemony",
-    "hygienic",
-    "tahitian",
-    "hokkaido",
-    "emperors",
-    "redeemer",
-    "paternal",
-    "indigent",
-    "romances",
-    "reissued",
-    "circling",
-    "coliform",
-    "blotting",
-    "eastward",
-    "handball",
-    "stylized",
-    "systolic",
-    "chansons",
-    "daybreak",
-    "blisters",
-    "synopses",
-    "sanctity",
-    "pedantic",
-    "dennison",
-    "deadwood",
-    "gleaming",
-    "dominoes",
-    "sledding",
-    "excision",
-    "mustered",
-    "hoosiers",
-    "audacity",
-    "competes",
-    "inasmuch",
-    "plotters",
-    "pedicure",
-    "duplexes",
-    "baptists",
-    "flounder",
-    "epilogue",
-    "clapping",
-    "favoring",
-    "mufflers",
-    "monrovia",
-    "walkways",
-    "heineken",
-    "oxidized",
-    "racquets",
-    "eminence",
-    "liberate",
-    "colophon",
-    "cauldron",
-    "tingling",
-    "idealism",
-    "positron",
-    "throated",
-    "disperse",
-    "binomial",
-    "hardball",
-    "renovate",
-    "blinding",
-    "inaction",
-    "armoured",
-    "inherits",
-    "decoders",
-    "easterly",
-    "rezoning",
-    "licensor",
-    "amritsar",
-    "sicilian",
-    "unearned",
-    "cladding",
-    "overlaps",
-    "mackerel",
-    "jamboree",
-    "geranium",
-    "leaching",
-    "ranchers",
-    "desolate",
-    "expander",
-    "gruesome",
-    "perished",
-    "knickers",
-    "androgen",
-    "kilogram",
-    "standout",
-    "unfunded",
-    "shitting",
-    "ejection",
-    "locators",
-    "marquise",
-    "liaisons",
-    "perforce",
-    "emptying",
-    "reliever",
-    "shearing",
-    "windward",
-    "caseload",
-    "delirium",
-    "glycogen",
-    "detainee",
-    "balearic",
-    "longford",
-    "cynicism",
-    "environs",
-    "platypus",
-    "reverses",
-    "crockery",
-    "legacies",
-    "enticing",
-    "hardwick",
-    "famously",
-    "salaried",
-    "rarities",
-    "artistes",
-    "suburbia",
-    "crucible",
-    "pronouns",
-    "riesling",
-    "silencer",
-    "allergen",
-    "frosting",
-    "marshals",
-    "stagnant",
-    "fairways",
-    "molasses",
-    "schooner",
-    "numbness",
-    "hatching",
-    "follicle",
-    "agitated",
-    "relieves",
-    "linguist",
-    "keypress",
-    "especial",
-    "curators",
-    "precepts",
-    "forceful",
-    "villager",
-    "untimely",
-    "baguette",
-    "orbiting",
-    "resubmit",
-    "couriers",
-    "subtypes",
-    "snatched",
-    "unedited",
-    "eyesight",
-    "handguns",
-    "exhausts",
-    "dreamers",
-    "wreckage",
-    "captives",
-    "despised",
-    "midpoint",
-    "malagasy",
-    "unknowns",
-    "berliner",
-    "ambrosia",
-    "bragging",
-    "grinning",
-    "triplets",
-    "watchful",
-    "appalled",
-    "silenced",
-    "vanities",
-    "dartford",
-    "calipers",
-    "steamers",
-    "bubbling",
-    "horsemen",
-    "reigning",
-    "varicose",
-    "coercive",
-    "escalate",
-    "spotters",
-    "outburst",
-    "mattered",
-    "drummers",
-    "reformer",
-    "solemnly",
-    "aquifers",
-    "rescuers",
-    "arranges",
-    "riveting",
-    "valhalla",
-    "biweekly",
-    "derailed",
-    "decanter",
-    "lightest",
-    "banquets",
-    "removers",
-    "diffuser",
-    "spilling",
-    "podiatry",
-    "kalahari",
-    "blockage",
-    "burdened",
-    "literals",
-    "bosworth",
-    "clitoral",
-    "anointed",
-    "horseman",
-    "decaying",
-    "informer",
-    "overcame",
-    "exertion",
-    "flywheel",
-    "sheriffs",
-    "admiring",
-    "khartoum",
-    "wasteful",
-    "hertford",
-    "penzance",
-    "consults",
-    "convener",
-    "nurtured",
-    "bushings",
-    "typeface",
-    "termites",
-    "imprints",
-    "fallback",
-    "sheepdog",
-    "excesses",
-    "cakewalk",
-    "tendered",
-    "operable",
-    "omitting",
-    "insulted",
-    "alveolar",
-    "anecdote",
-    "exorcist",
-    "honduran",
-    "flathead",
-    "factored",
-    "salivary",
-    "agronomy",
-    "amenable",
-    "emulated",
-    "shotguns",
-    "thirties",
-    "demented",
-    "japonica",
-    "megabyte",
-    "lowlands",
-    "greenery",
-    "etcetera",
-    "monastic",
-    "chanukah",
-    "catchers",
-    "perilous",
-    "quartile",
-    "geodetic",
-    "ascorbic",
-    "covalent",
-    "herewith",
-    "borealis",
-    "plankton",
-    "cleanups",
-    "loophole",
-    "uplifted",
-    "acceptor",
-    "percival",
-    "gossamer",
-    "boneless",
-    "disliked",
-    "impurity",
-    "greenish",
-    "adriatic",
-    "mingling",
-    "bundling",
-    "signaled",
-    "dagenham",
-    "littered",
-    "verdicts",
-    "eyeglass",
-    "earphone",
-    "cowardly",
-    "wielding",
-    "unworthy",
-    "fruition",
-    "enslaved",
-    "headgear",
-    "thurrock",
-    "namibian",
-    "gimmicks",
-    "stumbles",
-    "clematis",
-    "slashing",
-    "demeanor",
-    "paganism",
-    "filigree",
-    "blenheim",
-    "ingested",
-    "entitles",
-    "exacting",
-    "ionizing",
-    "enforces",
-    "notional",
-    "bridgend",
-    "bastille",
-    "populist",
-    "mnemonic",
-    "heraldry",
-    "finisher",
-    "quartets",
-    "viscount",
-    "devolved",
-    "alcatraz",
-    "streamed",
-    "gorillas",
-    "teardrop",
-    "tennyson",
-    "sprocket",
-    "sentient",
-    "olympiad",
-    "strainer",
-    "resuming",
-    "bruising",
-    "flogging",
-    "warlords",
-    "seaboard",
-    "foldable",
-    "vagabond",
-    "isobaric",
-    "adopters",
-    "sneaking",
-    "greening",
-    "overtake",
-    "unbeaten",
-    "sheeting",
-    "hallways",
-    "armament",
-    "grafting",
-    "stylists",
-    "larkspur",
-    "cappella",
-    "moriarty",
-    "obstruct",
-    "saddened",
-    "crowding",
-    "dulcimer",
-    "reflexes",
-    "outlawed",
-    "injuring",
-    "underpin",
-    "baldness",
-    "didactic",
-    "lustrous",
-    "slapping",
-    "heartily",
-    "lobsters",
-    "balsamic",
-    "eventful",
-    "stiletto",
-    "rayleigh",
-    "dropouts",
-    "fractals",
-    "rushmore",
-    "displace",
-    "denoting",
-    "storming",
-    "conduits",
-    "ghanaian",
-    "alluring",
-    "bookends",
-    "reviving",
-    "amersham",
-    "unsorted",
-    "grampian",
-    "hartland",
-    "stinging",
-    "globular",
-    "vintages",
-    "doomsday",
-    "scarring",
-    "daydream",
-    "speedily",
-    "chimneys",
-    "denounce",
-    "bromwich",
-    "odometer",
-    "couplers",
-    "murmured",
-    "undersea",
-    "vanadium",
-    "polygamy",
-    "devising",
-    "sustains",
-    "floppies",
-    "tashkent",
-    "kilowatt",
-    "nematode",
-    "railings",
-    "modestly",
-    "aeration",
-    "antennae",
-    "grievous",
-    "assyrian",
-    "synoptic",
-    "resorted",
-    "windhoek",
-    "warships",
-    "woodbine",
-    "farthest",
-    "iniquity",
-    "militias",
-    "menacing",
-    "solvency",
-    "neurotic",
-    "blowfish",
-    "lombardy",
-    "shackles",
-    "queueing",
-    "sadistic",
-    "takeaway",
-    "hematite",
-    "piloting",
-    "reinvent",
-    "oilfield",
-    "balinese",
-    "biologic",
-    "convicts",
-    "suffixes",
-    "seascape",
-    "sparrows",
-    "bleached",
-    "hazelnut",
-    "ashfield",
-    "antimony",
-    "melamine",
-    "episodic",
-    "divisive",
-    "accruals",
-    "rescuing",
-    "reworked",
-    "catapult",
-    "moorings",
-    "tweezers",
-    "snooping",
-    "prussian",
-    "lifeless",
-    "sobriety",
-    "sprinter",
-    "crickets",
-    "silicate",
-    "alcohols",
-    "flanking",
-    "laziness",
-    "sibelius",
-    "marigold",
-    "tireless",
-    "lollipop",
-    "pastimes",
-    "coolness",
-    "doorbell",
-    "embolism",
-    "highness",
-    "starling",
-    "energize",
-    "inquires",
-    "sprayers",
-    "lattices",
-    "underlie",
-    "clotting",
-    "kinshasa",
-    "haringey",
-    "beatings",
-    "lanyards",
-    "bulkhead",
-    "flagging",
-    "wounding",
-    "birthing",
-    "stemware",
-    "glancing",
-    "bahraini",
-    "inflamed",
-    "beaulieu",
-    "buckland",
-    "baptisms",
-    "doberman",
-    "succinct",
-    "palpable",
-    "modulate",
-    "newscast",
-    "minstrel",
-    "dentures",
-    "nitrates",
-    "shifters",
-    "ringwood",
-    "censuses",
-    "neckline",
-    "wrinkled",
-    "falconer",
-    "watchman",
-    "brooding",
-    "juncture",
-    "panelist",
-    "mailroom",
-    "medalist",
-    "flowered",
-    "reformat",
-    "synapses",
-    "armoires",
-    "behemoth",
-    "crucifix",
-    "crawfish",
-    "centrist",
-    "vultures",
-    "outlooks",
-    "forcible",
-    "lifeboat",
-    "redditch",
-    "luxuries",
-    "heredity",
-    "descends",
-    "sensuous",
-    "shampoos",
-    "balmoral",
-    "misheard",
-    "typology",
-    "unspoken",
-    "sparring",
-    "mindanao",
-    "blurring",
-    "jaundice",
-    "airframe",
-    "dietetic",
-    "redacted",
-    "parallax",
-    "thwarted",
-    "spindles",
-    "preteens",
-    "crossbow",
-    "tenderly",
-    "renounce",
-    "discards",
-    "brasilia",
-    "acrylics",
-    "credence",
-    "lovelace",
-    "footpath",
-    "chiltern",
-    "civility",
-    "thrasher",
-    "unshaved",
-    "softwood",
-    "croupier",
-    "compacts",
-    "blushing",
-    "breathes",
-    "lectured",
-    "dossiers",
-    "worsened",
-    "badlands",
-    "speckled",
-    "resonate",
-    "outfield",
-    "courting",
-    "woodcock",
-    "restarts",
-    "churning",
-    "chariots",
-    "streamer",
-    "reproach",
-    "flurries",
-    "serrated",
-    "cheaters",
-    "upheaval",
-    "biopsies",
-    "mouthful",
-    "unstrung",
-    "toppings",
-    "penchant",
-    "allegory",
-    "harbours",
-    "lymphoid",
-    "insanely",
-    "attested",
-    "undercut",
-    "soloists",
-    "frighten",
-    "headroom",
-    "subtlety",
-    "delicacy",
-    "futility",
-    "blissful",
-    "platonic",
-    "chewable",
-    "whooping",
-    "everyman",
-    "eastland",
-    "convenor",
-    "warheads",
-    "palettes",
-    "sparsely",
-    "guilders",
-    "mistrust",
-    "lordship",
-    "lecithin",
-    "headless",
-    "anatomic",
-    "rattling",
-    "legalize",
-    "divorces",
-    "picayune",
-    "wiretaps",
-    "homespun",
-    "humpback",
-    "wheelers",
-    "postures",
-    "tattered",
-    "harvests",
-    "clemency",
-    "geniuses",
-    "prorated",
-    "whiskers",
-    "huntsman",
-    "saddlery",
-    "admirers",
-    "mustache",
-    "truncate",
-    "overseen",
-    "crayfish",
-    "minotaur",
-    "prodigal",
-    "resolute",
-    "dialling",
-    "recitals",
-    "collages",
-    "dumbbell",
-    "organist",
-    "chuckled",
-    "furthest",
-    "virulent",
-    "barbaric",
-    "glycerin",
-    "tailings",
-    "lifelike",
-    "tumblers",
-    "untapped",
-    "excelled",
-    "pretzels",
-    "enforcer",
-    "bloopers",
-    "scrubber",
-    "yearling",
-    "reaffirm",
-    "rapidity",
-    "airtight",
-    "shoreham",
-    "sparking",
-    "alluvial",
-    "incisive",
-    "tenement",
-    "bypassed",
-    "relaying",
-    "overlord",
-    "daffodil",
-    "suffices",
-    "statuary",
-    "moravian",
-    "notaries",
-    "quagmire",
-    "cleansed",
-    "fainting",
-    "theorist",
-    "entailed",
-    "curative",
-    "traitors",
-    "patently",
-    "fanciful",
-    "dismayed",
-    "remitted",
-    "washroom",
-    "teething",
-    "gardenia",
-    "highgate",
-    "lancelot",
-    "occupier",
-    "clocking",
-    "premiers",
-    "hyacinth",
-    "derelict",
-    "shrouded",
-    "veracity",
-    "tsunamis",
-    "dordogne",
-    "kamikaze",
-    "counsels",
-    "dorothea",
-    "foreplay",
-    "uncovers",
-    "gargoyle",
-    "stomping",
-    "fiddling",
-    "schooled",
-    "loveless",
-    "nostrils",
-    "cambrian",
-    "gridiron",
-    "phantoms",
-    "keighley",
-    "smirking",
-    "begotten",
-    "sparkles",
-    "collared",
-    "stringed",
-    "barnabas",
-    "irritant",
-    "monolith",
-    "crutches",
-    "failings",
-    "gulliver",
-    "hallowed",
-    "lawmaker",
-    "heralded",
-    "clearest",
-    "finchley",
-    "mediates",
-    "phrasing",
-    "quarries",
-    "sensibly",
-    "biathlon",
-    "intently",
-    "tricycle",
-    "trillium",
-    "concedes",
-    "bitching",
-    "humanoid",
-    "breather",
-    "emeralds",
-    "ottomans",
-    "lockable",
-    "airliner",
-    "scouring",
-    "underlay",
-    "plunging",
-    "shambles",
-    "stinking",
-    "porridge",
-    "diffused",
-    "leftists",
-    "unshaven",
-    "cupcakes",
-    "giggling",
-    "barnyard",
-    "camellia",
-    "artifice",
-    "mclennan",
-    "deranged",
-    "rebooted",
-    "offerors",
-    "demolish",
-    "aqueduct",
-    "unicorns",
-    "playroom",
-    "dandruff",
-    "pacifier",
-    "cemented",
-    "crowning",
-    "smuggled",
-    "tripwire",
-    "doubting",
-    "inductor",
-    "libretto",
-    "notables",
-    "snorting",
-    "loyalist",
-    "rhodesia",
-    "bergamot",
-    "bakelite",
-    "clogging",
-    "ladybird",
-    "leggings",
-    "dilation",
-    "droughts",
-    "nocturne",
-    "altruism",
-    "bootlegs",
-    "dutchman",
-    "asturias",
-    "sneezing",
-    "tenacity",
-    "enviable",
-    "carpeted",
-    "accruing",
-    "actuated",
-    "thetford",
-    "lamented",
-    "perfumed",
-    "appraise",
-    "collated",
-    "mccauley",
-    "shadowed",
-    "drooling",
-    "overlaid",
-    "bagpipes",
-    "mcginnis",
-    "wizardry",
-    "headrest",
-    "unneeded",
-    "sketched",
-    "firmness",
-    "selfless",
-    "stowaway",
-    "remedied",
-    "ramblers",
-    "scorched",
-    "stanhope",
-    "persians",
-    "finitely",
-    "woolwich",
-    "sulfuric",
-    "hiawatha",
-    "suspends",
-    "desirous",
-    "exemplar",
-    "unionist",
-    "pennants",
-    "boggling",
-    "priestly",
-    "cubicles",
-    "ribosome",
-    "dinghies",
-    "apparels",
-    "lounging",
-    "athenian",
-    "dyslexic",
-    "overseer",
-    "wishbone",
-    "ganglion",
-    "excreted",
-    "scribble",
-    "firework",
-    "localize",
-    "bullhead",
-    "headland",
-    "hobbyist",
-    "agitator",
-    "heighten",
-    "quotable",
-    "dogmatic",
-    "motioned",
-    "felonies",
-    "casebook",
-    "beheaded",
-    "postmark",
-    "bereaved",
-    "softener",
-    "seraphim",
-    "blunders",
-    "lineages",
-    "approver",
-    "parables",
-    "unproven",
-    "beholder",
-    "hydrated",
-    "sedition",
-    "gremlins",
-    "nuneaton",
-    "ricochet",
-    "aberrant",
-    "ruptured",
-    "doorways",
-    "thrombin",
-    "colliery",
-    "landfall",
-    "prefixed",
-    "freeways",
-    "vitreous",
-    "dolomite",
-    "salvaged",
-    "unmasked",
-    "pipettes",
-    "artefact",
-    "baptised",
-    "stalling",
-    "acquaint",
-    "finnegan",
-    "purports",
-    "spangled",
-    "palomino",
-    "invoiced",
-    "cornered",
-    "eyeliner",
-    "totalled",
-    "vaseline",
-    "cutbacks",
-    "moldings",
-    "overruns",
-    "canaries",
-    "lukewarm",
-    "accolade",
-    "eyeballs",
-    "devoting",
-    "oxymoron",
-    "idolatry",
-    "bahamian",
-    "stipends",
-    "pinching",
-    "ubiquity",
-    "infidels",
-    "diabolic",
-    "pinscher",
-    "irritate",
-    "fellatio",
-    "envisage",
-    "tiverton",
-    "biarritz",
-    "bessemer",
-    "fictions",
-    "geodesic",
-    "trending",
-    "buttered",
-    "toiletry",
-    "stretchy",
-    "pledging",
-    "puddings",
-    "chaining",
-    "defected",
-    "holocene",
-    "skimming",
-    "stomachs",
-    "namesake",
-    "gratuity",
-    "foothold",
-    "sobering",
-    "dioceses",
-    "besieged",
-    "deviance",
-    "fondness",
-    "mercator",
-    "lyricist",
-    "ticklish",
-    "freetown",
-    "alienate",
-    "usefully",
-    "deepened",
-    "gridlock",
-    "pretense",
-    "globulin",
-    "violator",
-    "adsorbed",
-    "shuffled",
-    "shelling",
-    "engulfed",
-    "bequests",
-    "operatic",
-    "lessened",
-    "reciting",
-    "fascists",
-    "curbside",
-    "stoppage",
-    "subsided",
-    "valerian",
-    "frenzied",
-    "enrollee",
-    "adjutant",
-    "pondered",
-    "mannered",
-    "stalwart",
-    "verandah",
-    "isolator",
-    "canvases",
-    "applauds",
-    "barbican",
-    "faceless",
-    "anathema",
-    "quintile",
-    "bouncers",
-    "iterated",
-    "diuretic",
-    "heroines",
-    "unpacked",
-    "clenched",
-    "communes",
-    "devoured",
-    "overpass",
-    "inwardly",
-    "bottomed",
-    "forsythe",
-    "haircuts",
-    "continua",
-    "privates",
-    "skirmish",
-    "anyplace",
-    "dynamism",
-    "crumbled",
-    "rucksack",
-    "overhang",
-    "estoppel",
-    "emigrant",
-    "bassinet",
-    "salesmen",
-    "epistles",
-    "trampled",
-    "atrocity",
-    "tiresome",
-    "splashed",
-    "antonyms",
-    "collided",
-    "boarders",
-    "chivalry",
-    "poaching",
-    "fairport",
-    "sittings",
-    "thatched",
-    "duodenal",
-    "cyclades",
-    "coconuts",
-    "confuses",
-    "hellfire",
-    "hebrides",
-    "havering",
-    "knowsley",
-    "camshaft",
-    "hibernia",
-    "pergamon",
-    "wavelets",
-    "wheezing",
-    "sisyphus",
-    "effusion",
-    "educates",
-    "hydroxyl",
-    "showered",
-    "polishes",
-    "flatiron",
-    "pretends",
-    "disrupts",
-    "deflated",
-    "unsteady",
-    "leopards",
-    "buzzword",
-    "imperium",
-    "brownish",
-    "cropland",
-    "testicle",
-    "rosettes",
-    "volition",
-    "riddance",
-    "ironwood",
-    "allusion",
-    "liqueurs",
-    "unzipped",
-    "winifred",
-    "turmeric",
-    "parietal",
-    "fibroids",
-    "insulate",
-    "babbling",
-    "twinning",
-    "ashtrays",
-    "sedative",
-    "lettered",
-    "hotlines",
-    "apricots",
-    "ranching",
-    "toasting",
-    "whirling",
-    "doghouse",
-    "playgirl",
-    "recesses",
-    "doughnut",
-    "cribbage",
-    "martinis",
-    "flexibly",
-    "linoleum",
-    "culverts",
-    "shrapnel",
-    "bristles",
-    "rollaway",
-    "seagulls",
-    "inhumane",
-    "panicked",
-    "abandons",
-    "phosphor",
-    "roosters",
-    "flapping",
-    "teriyaki",
-    "heretics",
-    "thumping",
-    "eugenics",
-    "starlets",
-    "emphatic",
-    "homeward",
-    "withered",
-    "fluorine",
-    "earpiece",
-    "rooftops",
-    "oncoming",
-    "cloister",
-    "dartmoor",
-    "littoral",
-    "fronting",
-    "outflows",
-    "swatches",
-    "lemmings",
-    "disprove",
-    "urbanism",
-    "eclipses",
-    "keynotes",
-    "hastened",
-    "ripening",
-    "choruses",
-    "scrapers",
-    "rejoined",
-    "impotent",
-    "crawlers",
-    "cloaking",
-    "gratings",
-    "prettier",
-    "haystack",
-    "etchings",
-    "stifling",
-    "realises",
-    "mermaids",
-    "spinster",
-    "brimming",
-    "grommets",
-    "unending",
-    "roughing",
-    "venomous",
-    "tapering",
-    "roasters",
-    "aleutian",
-    "unjustly",
-    "neutered",
-    "rehearse",
-    "seducing",
-    "culpeper",
-    "fearsome",
-    "bruckner",
-    "likeable",
-    "swarming",
-    "chuckles",
-    "grayling",
-    "monomers",
-    "solidify",
-    "anatolia",
-    "abutting",
-    "gunmetal",
-    "garlands",
-    "degrades",
-    "forefoot",
-    "maggiore",
-    "soreness",
-    "boldness",
-    "cramping",
-    "loosened",
-    "virility",
-    "snowbird",
-    "meddling",
-    "odysseus",
-    "tincture",
-    "erecting",
-    "tenderer",
-    "impeller",
-    "southall",
-    "enameled",
-    "vortices",
-    "eateries",
-    "encrypts",
-    "lengthen",
-    "oxbridge",
-    "spoonful",
-    "sociable",
-    "speculum",
-    "illusory",
-    "inspects",
-    "stepwise",
-    "rounders",
-    "seaplane",
-    "methinks",
-    "angeline",
-    "flagrant",
-    "moldavia",
-    "acidosis",
-    "emitters",
-    "loudness",
-    "leanings",
-    "gullible",
-    "smuggler",
-    "imparted",
-    "headlong",
-    "tethered",
-    "perverts",
-    "fluently",
-    "saraband",
-    "trembled",
-    "janitors",
-    "anagrams",
-    "exegesis",
-    "brothels",
-    "futurist",
-    "natively",
-    "sublease",
-    "fondling",
-    "laxative",
-    "rattlers",
-    "carbonyl",
-    "telecast",
-    "breeches",
-    "pacifist",
-    "achiever",
-    "chiswick",
-    "grueling",
-    "downwind",
-    "libelous",
-    "hermetic",
-    "marauder",
-    "showings",
-    "cardamom",
-    "exerting",
-    "tamarack",
-    "backfire",
-    "disarray",
-    "cleanest",
-    "teutonic",
-    "tantalum",
-    "culprits",
-    "trinkets",
-    "admirals",
-    "politico",
-    "deterred",
-    "cossacks",
-    "bluefish",
-    "seething",
-    "burritos",
-    "wingspan",
-    "reappear",
-    "playbill",
-    "espoused",
-    "buckling",
-    "songbird",
-    "amesbury",
-    "redwoods",
-    "deselect",
-    "smelting",
-    "slippage",
-    "dovetail",
-    "orgasmic",
-    "riverbed",
-    "freckles",
-    "chipmunk",
-    "fiscally",
-    "imitated",
-    "optician",
-    "bloating",
-    "slowness",
-    "deptford",
-    "dragster",
-    "sufferer",
-    "peshawar",
-    "baffling",
-    "hopefuls",
-    "atropine",
-    "equating",
-    "aldermen",
-    "commends",
-    "colonels",
-    "squashed",
-    "wisteria",
-    "reassess",
-    "creepers",
-    "splatter",
-    "thievery",
-    "splashes",
-    "homesick",
-    "rainwear",
-    "greenock",
-    "imagines",
-    "unfilled",
-    "obligate",
-    "flocking",
-    "humidors",
-    "crossbar",
-    "llanelli",
-    "flattery",
-    "payrolls",
-    "indulged",
-    "zionists",
-    "barbells",
-    "spoiling",
-    "detritus",
-    "devilish",
-    "scathing",
-    "autobahn",
-    "lethargy",
-    "valletta",
-    "casework",
-    "finality",
-    "wrestled",
-    "sciatica",
-    "caucuses",
-    "receding",
-    "outposts",
-    "treading",
-    "megawatt",
-    "sharpest",
-    "palisade",
-    "moccasin",
-    "resented",
-    "peppered",
-    "cystitis",
-    "prolapse",
-    "sixpence",
-    "repairer",
-    "innuendo",
-    "digitize",
-    "drifters",
-    "prophesy",
-    "percents",
-    "soldered",
-    "neonates",
-    "raincoat",
-    "straddle",
-    "imbedded",
-    "quenched",
-    "conifers",
-    "timbuktu",
-    "colliers",
-    "feldspar",
-    "maharaja",
-    "idealist",
-    "weathers",
-    "depraved",
-    "puppetry",
-    "stopover",
-    "potholes",
-    "smacking",
-    "solvable",
-    "neckties",
-    "levelled",
-    "sorption",
-    "eclipsed",
-    "cationic",
-    "schulman",
-    "punctual",
-    "runaways",
-    "testable",
-    "viennese",
-    "enjoined",
-    "banknote",
-    "pageants",
-    "broadens",
-    "supplant",
-    "bestiary",
-    "cranking",
-    "serpents",
-    "tampered",
-    "sawtooth",
-    "goodwood",
-    "bedstead",
-    "bathtubs",
-    "seabirds",
-    "cofactor",
-    "magdalen",
-    "spillage",
-    "brackish",
-    "revoking",
-    "thiamine",
-    "woefully",
-    "pivoting",
-    "taunting",
-    "etruscan",
-    "outwards",
-    "ramsgate",
-    "ponytail",
-    "pharaohs",
-    "chateaux",
-    "skirting",
-    "gatherer",
-    "slackers",
-    "kindling",
-    "passable",
-    "hilarity",
-    "tamarind",
-    "surabaya",
-    "moorland",
-    "bullfrog",
-    "divinely",
-    "hedonism",
-    "sawmills",
-    "trotting",
-    "ambushed",
-    "pianists",
-    "travesty",
-    "uncoated",
-    "castaway",
-    "tibetans",
-    "amniotic",
-    "scariest",
-    "bathrobe",
-    "daventry",
-    "footwork",
-    "fatigued",
-    "glutamic",
-    "objector",
-    "darlings",
-    "reprieve",
-    "blanking",
-    "flagpole",
-    "lavishly",
-    "foretold",
-    "engraver",
-    "tortures",
-    "flaxseed",
-    "littlest",
-    "cadastre",
-    "trickery",
-    "adherent",
-    "auvergne",
-    "forehand",
-    "bolsters",
-    "loveable",
-    "molested",
-    "lingered",
-    "feasting",
-    "tightens",
-    "paganini",
-    "inequity",
-    "wetherby",
-    "sweepers",
-    "ravished",
-    "creamery",
-    "bypasses",
-    "fissures",
-    "clinched",
-    "fluidity",
-    "creasing",
-    "cabochon",
-    "brokered",
-    "inhaling",
-    "backrest",
-    "irishman",
-    "callable",
-    "pamplona",
-    "chairing",
-    "tradable",
-    "groaning",
-    "rejoiced",
-    "frenetic",
-    "postural",
-    "corrupts",
-    "hoisting",
-    "enthalpy",
-    "javanese",
-    "cypriots",
-    "inciting",
-    "rafferty",
-    "skippers",
-    "revolved",
-    "armature",
-    "gatefold",
-    "jacobian",
-    "paignton",
-    "ellipsis",
-    "marquees",
-    "outhouse",
-    "vanquish",
-    "dextrose",
-    "laudable",
-    "permeate",
-    "deviants",
-    "munching",
-    "fumbling",
-    "uncooked",
-    "placards",
-    "unbelief",
-    "airstrip",
-    "sardines",
-    "duckling",
-    "reprisal",
-    "blighted",
-    "warblers",
-    "tarragon",
-    "rumbling",
-    "freudian",
-    "bouillon",
-    "celibacy",
-    "finalise",
-    "falstaff",
-    "engender",
-    "quandary",
-    "streaked",
-    "emphases",
-    "polisher",
-    "crouched",
-    "impeding",
-    "overpaid",
-    "tracheal",
-    "kickback",
-    "nihilism",
-    "caulking",
-    "mackinaw",
-    "euphoric",
-    "twirling",
-    "deviates",
-    "enquires",
-    "overcoat",
-    "fishbowl",
-    "spouting",
-    "humbling",
-    "martians",
-    "giraffes",
-    "capsicum",
-    "divulged",
-    "shrunken",
-    "provokes",
-    "knitters",
-    "staplers",
-    "referent",
-    "sanguine",
-    "swastika",
-    "backhand",
-    "uprooted",
-    "distorts",
-    "grandmas",
-    "decibels",
-    "mightily",
-    "unwieldy",
-    "penalize",
-    "coarsely",
-    "shallots",
-    "paneling",
-    "thickens",
-    "crumpled",
-    "batching",
-    "rosaries",
-    "preaches",
-    "growling",
-    "ungraded",
-    "weeklies",
-    "toppling",
-    "neurosis",
-    "carboxyl",
-    "sprained",
-    "conclave",
-    "unionism",
-    "boycotts",
-    "solicits",
-    "ugliness",
-    "shavings",
-    "peddling",
-    "stupidly",
-    "buckskin",
-    "protozoa",
-    "remaking",
-    "tabloids",
-    "crosscut",
-    "mandible",
-    "frescoes",
-    "puritans",
-    "knotting",
-    "sundials",
-    "gymnasts",
-    "crimping",
-    "nouveaux",
-    "trotters",
-    "binaural",
-    "latching",
-    "nobleman",
-    "flatness",
-    "buttress",
-    "foregone",
-    "tandoori",
-    "sequined",
-    "newhaven",
-    "refilled",
-    "digester",
-    "strolled",
-    "rewrites",
-    "scratchy",
-    "calmness",
-    "confound",
-    "airedale",
-    "emulates",
-    "tantrums",
-    "christen",
-    "logotype",
-    "afferent",
-    "conquers",
-    "dewsbury",
-    "clashing",
-    "muenster",
-    "finsbury",
-    "unspoilt",
-    "snickers",
-    "dishonor",
-    "hoarding",
-    "underarm",
-    "coquille",
-    "antacids",
-    "enlarger",
-    "lozenges",
-    "dizzying",
-    "smearing",
-    "columnar",
-    "utilises",
-    "raccoons",
-    "poetical",
-    "heraldic",
-    "maladies",
-    "adjudged",
-    "mobilise",
-    "princely",
-    "clevedon",
-    "diatribe",
-    "presumes",
-    "mastitis",
-    "wilmslow",
-    "mournful",
-    "scheming",
-    "trashing",
-    "disarmed",
-    "baseless",
-    "feverish",
-    "neglects",
-    "suckling",
-    "trawling",
-    "flatmate",
-    "cockatoo",
-    "elevates",
-    "poitiers",
-    "bounties",
-    "longboat",
-    "preludes",
-    "weirdest",
-    "farmyard",
-    "condense",
-    "rocketry",
-    "immobile",
-    "musicale",
-    "incubate",
-    "triassic",
-    "deadbeat",
-    "chatters",
-    "amicable",
-    "enclaves",
-    "parakeet",
-    "pressman",
-    "colloquy",
-    "refiners",
-    "scrolled",
-    "retorted",
-    "fiftieth",
-    "groupies",
-    "joyfully",
-    "skittles",
-    "vengeful",
-    "lunatics",
-    "hospices",
-    "subsumed",
-    "pelicans",
-    "stockman",
-    "snatches",
-    "botanist",
-    "timidity",
-    "silences",
-    "transits",
-    "strangle",
-    "plateaus",
-    "spaniard",
-    "honeydew",
-    "terrapin",
-    "easiness",
-    "downbeat",
-    "plantain",
-    "couscous",
-    "annealed",
-    "reassign",
-    "meringue",
-    "crushers",
-    "overused",
-    "tweeters",
-    "mourners",
-    "unsalted",
-    "sulphide",
-    "outcasts",
-    "mortally",
-    "oxidants",
-    "carbonic",
-    "phonemic",
-    "pentacle",
-    "equalize",
-    "grossing",
-    "interred",
-    "leonidas",
-    "harshest",
-    "pigtails",
-    "neutrals",
-    "conspire",
-    "meatball",
-    "spillway",
-    "skegness",
-    "commutes",
-    "denizens",
-    "abetting",
-    "conjures",
-    "drafters",
-    "lynching",
-    "rabbinic",
-    "amaranth",
-    "jokingly",
-    "watchmen",
-    "sakhalin",
-    "corsican",
-    "pacifism",
-    "testator",
-    "distaste",
-    "offshoot",
-    "smithson",
-    "uttering",
-    "construe",
-    "flotilla",
-    "gladness",
-    "workdays",
-    "armorial",
-    "tableaux",
-    "hijacker",
-    "relaxant",
-    "barstool",
-    "monotony",
-    "pyridine",
-    "unabated",
-    "marksman",
-    "rebuilds",
-    "mulching",
-    "rudeness",
-    "thermals",
-    "aborting",
-    "wickedly",
-    "eritrean",
-    "elongate",
-    "unsealed",
-    "moonrise",
-    "duodenum",
-    "apostasy",
-    "lucretia",
-    "vicarage",
-    "cornmeal",
-    "entwined",
-    "striatum",
-    "bilinear",
-    "katowice",
-    "relapsed",
-    "ringside",
-    "artfully",
-    "calliope",
-    "boomtown",
-    "milepost",
-    "lopsided",
-    "flippers",
-    "enriches",
-    "neophyte",
-    "pardoned",
-    "wormwood",
-    "conceals",
-    "satanism",
-    "steinway",
-    "billfold",
-    "shagging",
-    "ringworm",
-    "outgrown",
-    "honorees",
-    "rumoured",
-    "futurism",
-    "coalesce",
-    "brougham",
-    "fruiting",
-    "windings",
-    "burglars",
-    "molluscs",
-    "pectoris",
-    "rochford",
-    "squeezes",
-    "buckaroo",
-    "lilliput",
-    "pinwheel",
-    "bluffing",
-    "ellipses",
-    "nantwich",
-    "airspeed",
-    "normalcy",
-    "bandanas",
-    "backwash",
-    "banshees",
-    "surbiton",
-    "sintered",
-    "hairline",
-    "arousing",
-    "avocados",
-    "taxicabs",
-    "chartres",
-    "honeybee",
-    "disturbs",
-    "barrette",
-    "nymphets",
-    "oleander",
-    "ferocity",
-    "culpable",
-    "wordplay",
-    "cremated",
-    "fullback",
-    "unharmed",
-    "buttoned",
-    "sprouted",
-    "lambskin",
-    "omelette",
-    "unhinged",
-    "primeval",
-    "interned",
-    "operetta",
-    "aviators",
-    "hurrying",
-    "blowouts",
-    "dissuade",
-    "arbroath",
-    "pliocene",
-    "novation",
-    "beautify",
-    "purveyor",
-    "kerbside",
-    "premised",
-    "thallium",
-    "henchmen",
-    "cuddling",
-    "pretence",
-    "fuelling",
-    "scabbard",
-    "rippling",
-    "handrail",
-    "pervades",
-    "alfresco",
-    "charlies",
-    "hashanah",
-    "confided",
-    "mumbling",
-    "paladins",
-    "grimaldi",
-    "toenails",
-    "devonian",
-    "misnomer",
-    "braiding",
-    "odorless",
-    "opulence",
-    "coursing",
-    "operandi",
-    "casement",
-    "serially",
-    "earplugs",
-    "apprised",
-    "buzzards",
-    "marxists",
-    "penumbra",
-    "punishes",
-    "forename",
-    "lapidary",
-    "holyhead",
-    "skimmers",
-    "leftmost",
-    "repaying",
-    "heliport",
-    "carillon",
-    "hydrants",
-    "cowgirls",
-    "popsicle",
-    "decently",
-    "glitters",
-    "comatose",
-    "trappers",
-    "gyration",
-    "alderney",
-    "anorexic",
-    "dockside",
-    "thalamus",
-    "steppers",
-    "escapade",
-    "madrigal",
-    "signpost",
-    "saturate",
-    "reducers",
-    "jacuzzis",
-    "laboring",
-    "overheat",
-    "hydrates",
-    "goodbyes",
-    "perusing",
-    "mesozoic",
-    "terrazzo",
-    "radiates",
-    "emigrate",
-    "alleluia",
-    "simonson",
-    "cheetahs",
-    "rednecks",
-    "creosote",
-    "textural",
-    "gunpoint",
-    "grownups",
-    "telltale",
-    "sequelae",
-    "skinhead",
-    "quarrels",
-    "dihedral",
-    "ravenous",
-    "overplay",
-    "wreckers",
-    "savagery",
-    "thunders",
-    "godspeed",
-    "farthing",
-    "crevices",
-    "wringing",
-    "ardennes",
-    "naturism",
-    "ruminant",
-    "plucking",
-    "rickshaw",
-    "slavonic",
-    "notepads",
-    "rebelled",
-    "encloses",
-    "claymore",
-    "cantatas",
-    "minutiae",
-    "deviated",
-    "drogheda",
-    "coachman",
-    "mastodon",
-    "cerulean",
-    "bilberry",
-    "ligature",
-    "faulting",
-    "bearable",
-    "hothouse",
-    "milkweed",
-    "uprights",
-    "forearms",
-    "quickies",
-    "slurping",
-    "stigmata",
-    "adjuncts",
-    "jeweller",
-    "gangland",
-    "bluebell",
-    "costumed",
-    "perfecto",
-    "dampened",
-    "stalkers",
-    "camborne",
-    "tricking",
-    "shuffles",
-    "dirtiest",
-    "twisters",
-    "icebergs",
-    "skinless",
-    "stealthy",
-    "hooligan",
-    "teledyne",
-    "augments",
-    "fluorite",
-    "convenes",
-    "candidly",
-    "shivered",
-    "artesian",
-    "serology",
-    "superset",
-    "drooping",
-    "screamer",
-    "bakewell",
-    "maligned",
-    "writhing",
-    "malamute",
-    "ironclad",
-    "vestiges",
-    "rustling",
-    "phonemes",
-    "bridport",
-    "pectoral",
-    "hustlers",
-    "derision",
-    "falconry",
-    "lexicons",
-    "marchers",
-    "credenza",
-    "outcrops",
-    "arguable",
-    "demotion",
-    "sailfish",
-    "manatees",
-    "restorer",
-    "botulism",
-    "coldness",
-    "valances",
-    "asuncion",
-    "bayreuth",
-    "clutched",
-    "luckiest",
-    "biannual",
-    "greedily",
-    "padlocks",
-    "argonaut",
-    "wavering",
-    "playboys",
-    "landlady",
-    "vertebra",
-    "absurdly",
-    "disposes",
-    "bumbling",
-    "pickling",
-    "refuting",
-    "scantily",
-    "nestling",
-    "starches",
-    "glasnost",
-    "megabits",
-    "overtook",
-    "triptych",
-    "rifleman",
-    "vagaries",
-    "saracens",
-    "overrule",
-    "monogamy",
-    "revisits",
-    "idleness",
-    "entombed",
-    "diverged",
-    "craziest",
-    "overdone",
-    "socratic",
-    "cleanses",
-    "porpoise",
-    "backless",
-    "elitists",
-    "mycology",
-    "fastback",
-    "misdeeds",
-    "shockers",
-    "steerage",
-    "ecliptic",
-    "schnapps",
-    "essayist",
-    "carports",
-    "pollster",
-    "colloids",
-    "unwashed",
-    "oratorio",
-    "trollope",
-    "theistic",
-    "knapsack",
-    "brachial",
-    "tourneys",
-    "remodels",
-    "staccato",
-    "refusals",
-    "outrages",
-    "mitzvahs",
-    "eventide",
-    "inhalers",
-    "nebulous",
-    "chepstow",
-    "benzoate",
-    "fiddlers",
-    "flicking",
-    "spaniels",
-    "squeegee",
-    "shatters",
-    "worships",
-    "inhabits",
-    "recycles",
-    "treetops",
-    "debunked",
-    "ductwork",
-    "narrates",
-    "lameness",
-    "stockist",
-    "nastiest",
-    "caressed",
-    "windsurf",
-    "croutons",
-    "poachers",
-    "sounders",
-    "galvanic",
-    "parlance",
-    "drunkard",
-    "catalyze",
-    "profited",
-    "algernon",
-    "buckshot",
-    "erasable",
-    "crampons",
-    "meniscus",
-    "massaged",
-    "folkways",
-    "assignor",
-    "raceways",
-    "disburse",
-    "dwindled",
-    "mealtime",
-    "mollusks",
-    "necrotic",
-    "reinvest",
-    "rekindle",
-    "igniting",
-    "frowning",
-    "snacking",
-    "whiskies",
-    "refinish",
-    "broilers",
-    "newlywed",
-    "semiotic",
-    "conjured",
-    "vaulting",
-    "trifling",
-    "enamored",
-    "ulterior",
-    "downplay",
-    "enthused",
-    "pleurisy",
-    "majolica",
-    "kirkwall",
-    "accursed",
-    "joyously",
-    "strident",
-    "dreading",
-    "humorist",
-    "mandamus",
-    "ditching",
-    "detonate",
-    "squaring",
-    "peacocks",
-    "pocketed",
-    "enormity",
-    "molester",
-    "cytosine",
-    "exclaims",
-    "guzzlers",
-    "cobblers",
-    "backache",
-    "dormancy",
-    "griffins",
-    "yuletide",
-    "rephrase",
-    "silkworm",
-    "sombrero",
-    "tornados",
-    "bideford",
-    "imposter",
-    "coverall",
-    "foresees",
-    "aberdare",
-    "shortens",
-    "gaslight",
-    "presides",
-    "divested",
-    "tangents",
-    "forgives",
-    "diluting",
-    "floaters",
-    "didsbury",
-    "typified",
-    "unlinked",
-    "conjoint",
-    "liaising",
-    "provable",
-    "grasmere",
-    "outmoded",
-    "spyglass",
-    "gluttony",
-    "kneading",
-    "utiliser",
-    "windowed",
-    "crumbles",
-    "templars",
-    "enquired",
-    "cascaded",
-    "commoner",
-    "nuclease",
-    "maritima",
-    "assented",
-    "sanctify",
-    "insolent",
-    "chertsey",
-    "nonesuch",
-    "heresies",
-    "birdsong",
-    "flopping",
-    "trawlers",
-    "reactant",
-    "tutelage",
-    "bursitis",
-    "furthers",
-    "decrepit",
-    "liskeard",
-    "assailed",
-    "incensed",
-    "miseries",
-    "minehead",
-    "sardonic",
-    "detoxify",
-    "wimborne",
-    "magister",
-    "crotchet",
-    "fourfold",
-    "populism",
-    "spoilage",
-    "abutment",
-    "parlours",
-    "deforest",
-    "pilotage",
-    "circuses",
-    "spanners",
-    "haitians",
-    "freeborn",
-    "downpour",
-    "tortious",
-    "bothwell",
-    "nothings",
-    "unevenly",
-    "colonist",
-    "guzzling",
-    "ladybugs",
-    "sunspots",
-    "commuted",
-    "sequitur",
-    "vibrancy",
-    "annulled",
-    "covertly",
-    "thimbles",
-    "feedings",
-    "charente",
-    "autumnal",
-    "peddlers",
-    "despotic",
-    "beholden",
-    "apostate",
-    "blacktop",
-    "faltered",
-    "migrates",
-    "smallish",
-    "wilfully",
-    "thinnest",
-    "hitching",
-    "predates",
-    "marinate",
-    "vesuvius",
-    "impolite",
-    "fishpond",
-    "revivals",
-    "irrigate",
-    "whistled",
-    "mccarran",
-    "ticketed",
-    "specious",
-    "adenomas",
-    "deprives",
-    "litigant",
-    "scimitar",
-    "cromarty",
-    "concerti",
-    "barrhead",
-    "alluding",
-    "slugging",
-    "sunrises",
-    "ranchero",
-    "dewberry",
-    "straying",
-    "venereal",
-    "obscures",
-    "befriend",
-    "turndown",
-    "abortive",
-    "cronyism",
-    "anemones",
-    "doldrums",
-    "angstrom",
-    "neomycin",
-    "upwardly",
-    "cetacean",
-    "barnacle",
-    "jubilant",
-    "continuo",
-    "uncorked",
-    "snuggled",
-    "tadpoles",
-    "nepotism",
-    "torments",
-    "tortuous",
-    "repented",
-    "spaceman",
-    "drudgery",
-    "androids",
-    "parabola",
-    "unseemly",
-    "prosodic",
-    "tightest",
-    "repulsed",
-    "replayed",
-    "huntress",
-    "soulless",
-    "dumpling",
-    "deathbed",
-    "tricolor",
-    "flailing",
-    "amputees",
-    "sulfates",
-    "ramparts",
-    "manholes",
-    "yearlong",
-    "frigates",
-    "pendency",
-    "basketry",
-    "flexural",
-    "phantasm",
-    "shorting",
-    "maximums",
-    "imitates",
-    "conjugal",
-    "flaubert",
-    "flinging",
-    "prodding",
-    "chillies",
-    "jugglers",
-    "litigate",
-    "avenging",
-    "unquoted",
-    "ploughed",
-    "severing",
-    "martyred",
-    "vacating",
-    "birdcage",
-    "viridian",
-    "literati",
-    "erupting",
-    "hungrily",
-    "shutouts",
-    "chirping",
-    "skillets",
-    "suborder",
-    "eggshell",
-    "franking",
-    "monaural",
-    "supposes",
-    "runabout",
-    "huguenot",
-    "unicycle",
-    "footrest",
-    "spiteful",
-    "leninist",
-    "colander",
-    "earmarks",
-    "smothers",
-    "porthole",
-    "accompli",
-    "grooving",
-    "grabbers",
-    "mouthing",
-    "colonize",
-    "undertow",
-    "madhouse",
-    "influent",
-    "calabash",
-    "cramming",
-    "crunches",
-    "sphagnum",
-    "hotelier",
-    "bordello",
-    "faintest",
-    "genitive",
-    "uncapped",
-    "imprison",
-    "repelled",
-    "marquess",
-    "emissary",
-    "communis",
-    "southpaw",
-    "belittle",
-    "composes",
-    "overleaf",
-    "whacking",
-    "telethon",
-    "memorise",
-    "albacore",
-    "currants",
-    "steepest",
-    "bolsover",
-    "grandest",
-    "knighton",
-    "neurones",
-    "slitting",
-    "salience",
-    "reshaped",
-    "divisors",
-    "gingerly",
-    "fretting",
-    "acanthus",
-    "footings",
-    "scalping",
-    "autoharp",
-    "leniency",
-    "thinners",
-    "deflator",
-    "paddocks",
-    "woodsman",
-    "coroners",
-    "clumsily",
-    "somerton",
-    "thickets",
-    "esterase",
-    "furlough",
-    "snarling",
-    "creaking",
-    "bequeath",
-    "newsreel",
-    "megalith",
-    "reunites",
-    "vintners",
-    "marjoram",
-    "isotonic",
-    "highball",
-    "thickest",
-    "neckwear",
-    "treeless",
-    "prepping",
-    "saplings",
-    "bayberry",
-    "horology",
-    "stooping",
-    "sickened",
-    "canteens",
-    "kingship",
-    "arcadian",
-    "bollards",
-    "mobsters",
-    "vastness",
-    "chromate",
-    "arsenals",
-    "tramping",
-    "bloomers",
-    "sameness",
-    "disraeli",
-    "scruples",
-    "rebuffed",
-    "grouting",
-    "stirrups",
-    "allspice",
-    "dingwall",
-    "upstarts",
-    "hipsters",
-    "cenozoic",
-    "sidmouth",
-    "nuthatch",
-    "sprawled",
-    "stripers",
-    "condoned",
-    "unsavory",
-    "gangrene",
-    "purplish",
-    "regattas",
-    "hollowed",
-    "submerge",
-    "dismount",
-    "jacketed",
-    "unafraid",
-    "seaports",
-    "coniston",
-    "shackled",
-    "saleable",
-    "recommit",
-    "abattoir",
-    "ironwork",
-    "extruder",
-    "vibrates",
-    "anodised",
-    "reverent",
-    "emanates",
-    "beckoned",
-    "migrator",
-    "scrawled",
-    "savagely",
-    "gunfight",
-    "swappers",
-    "unissued",
-    "grumbled",
-    "moribund",
-    "killdeer",
-    "gamecock",
-    "vehement",
-    "causally",
-    "leotards",
-    "travelog",
-    "excavate",
-    "plasters",
-    "latrines",
-    "lucidity",
-    "invitees",
-    "lateness",
-    "celibate",
-    "heathens",
-    "throwers",
-    "shanklin",
-    "corroded",
-    "funerary",
-    "detracts",
-    "renumber",
-    "entrails",
-    "slinging",
-    "relishes",
-    "subsonic",
-    "thrashed",
-    "masseuse",
-    "sheathed",
-    "encroach",
-    "centaurs",
-    "fritters",
-    "freakish",
-    "dipstick",
-    "raindrop",
-    "showboat",
-    "amperage",
-    "potlatch",
-    "giantess",
-    "clowning",
-    "wickford",
-    "polluter",
-    "dislodge",
-    "voyageur",
-    "lampeter",
-    "divalent",
-    "quietest",
-    "maniacal",
-    "nurtures",
-    "levering",
-    "acceding",
-    "gingival",
-    "scooping",
-    "roosting",
-    "occluded",
-    "squatter",
-    "enlarges",
-    "harbored",
-    "misusing",
-    "sonorous",
-    "draughts",
-    "reliving",
-    "acrobats",
-    "waltzing",
-    "polemics",
-    "armrests",
-    "solidity",
-    "dockyard",
-    "cinnabar",
-    "metrical",
-    "haggling",
-    "fiendish",
-    "wayfarer",
-    "arabians",
-    "expanses",
-    "readying",
-    "typhoons",
-    "magnesia",
-    "freedmen",
-    "obliging",
-    "coleslaw",
-    "absentia",
-    "verbiage",
-    "impelled",
-    "salutary",
-    "foxglove",
-    "bleacher",
-    "formwork",
-    "plaguing",
-    "touristy",
-    "ideation",
-    "stapling",
-    "dampness",
-    "porphyry",
-    "mementos",
-    "ushering",
-    "wallsend",
-    "upturned",
-    "nibbling",
-    "gestured",
-    "meatless",
-    "chutneys",
-    "astonish",
-    "dynastic",
-    "savoring",
-    "nearness",
-    "publican",
-    "handmaid",
-    "chemises",
-    "impostor",
-    "banister",
-    "quixotic",
-    "fatigues",
-    "shallows",
-    "gunsmith",
-    "debugged",
-    "frothing",
-    "coasting",
-    "befallen",
-    "credibly",
-    "schemata",
-    "logbooks",
-    "psalmist",
-    "penitent",
-    "doormats",
-    "basswood",
-    "belgians",
-    "sanitize",
-    "slacking",
-    "alkaloid",
-    "glittery",
-    "oxidizer",
-    "mallards",
-    "thieving",
-    "fiducial",
-    "coverlet",
-    "smoothes",
-    "bromyard",
-    "intermix",
-    "meanders",
-    "furlongs",
-    "tabulate",
-    "humanely",
-    "teletype",
-    "realists",
-    "sheepish",
-    "edifying",
-    "untoward",
-    "chlorite",
-    "patentee",
-    "synonymy",
-    "ilkeston",
-    "saluting",
-    "bayonets",
-    "bandanna",
-    "whodunit",
-    "mistrial",
-    "habsburg",
-    "jewelled",
-    "sureties",
-    "grunting",
-    "marveled",
-    "alginate",
-    "unheated",
-    "julienne",
-    "gazetted",
-    "fathered",
-    "shrieked",
-    "bleeping",
-    "strabane",
-    "aspirant",
-    "germinal",
-    "slumping",
-    "echelons",
-    "fallible",
-    "prolongs",
-    "pompidou",
-    "caresses",
-    "infusing",
-    "indolent",
-    "quayside",
-    "thistles",
-    "halftone",
-    "devalued",
-    "panelled",
-    "clincher",
-    "ascender",
-    "pedaling",
-    "trickier",
-    "radishes",
-    "surmised",
-    "scolding",
-    "leathery",
-    "snorkels",
-    "dejected",
-    "chiseled",
-    "empathic",
-    "iterates",
-    "squander",
-    "bonefish",
-    "dragoons",
-    "spurring",
-    "calfskin",
-    "moderato",
-    "deceiver",
-    "subsides",
-    "blanched",
-    "sulfides",
-    "spacebar",
-    "nauseous",
-    "mesoderm",
-    "whitener",
-    "holywell",
-    "talmudic",
-    "coquette",
-    "vermouth",
-    "inflicts",
-    "formless",
-    "reticent",
-    "dabbling",
-    "negating",
-    "relapses",
-    "plodding",
-    "deserter",
-    "neatness",
-    "grosbeak",
-    "parading",
-    "showgirl",
-    "biphenyl",
-    "listless",
-    "copperas",
-    "downcast",
-    "bondsman",
-    "sportive",
-    "bloodied",
-    "laggards",
-    "marzipan",
-    "friesian",
-    "epithets",
-    "flatland",
-    "macaques",
-    "judicata",
-    "unplayed",
-    "grumbles",
-    "proudest",
-    "fanciers",
-    "warlocks",
-    "hecatomb",
-    "legalese",
-    "glaziers",
-    "grapples",
-    "glimpsed",
-    "fairford",
-    "newsboys",
-    "debuting",
-    "ghosting",
-    "ursuline",
-    "revolted",
-    "thalamic",
-    "anarchic",
-    "londoner",
-    "diatonic",
-    "stickler",
-    "paperboy",
-    "rhizomes",
-    "ablution",
-    "handcuff",
-    "cephalic",
-    "birdbath",
-    "griddles",
-    "parasols",
-    "munition",
-    "greeters",
-    "abrogate",
-    "stockade",
-    "henchman",
-    "basilisk",
-    "tobaccos",
-    "exhorted",
-    "howitzer",
-    "sharpens",
-    "wildness",
-    "novellas",
-    "cryonics",
-    "stingers",
-    "wallasey",
-    "caduceus",
-    "fanzines",
-    "blustery",
-    "courtier",
-    "alaskans",
-    "leaguers",
-    "uncaring",
-    "piranhas",
-    "meteoric",
-    "equalled",
-    "crackpot",
-    "feedlots",
-    "singlets",
-    "bonfires",
-    "diverges",
-    "seedless",
-    "capsular",
-    "appeased",
-    "verboten",
-    "righting",
-    "breakups",
-    "striding",
-    "tuberous",
-    "herrings",
-    "prancing",
-    "floodlit",
-    "mightier",
-    "alacrity",
-    "locative",
-    "sleaford",
-    "hailsham",
-    "woodcuts",
-    "chugging",
-    "calvados",
-    "skipjack",
-    "protrude",
-    "ionising",
-    "ormskirk",
-    "laboured",
-    "clothier",
-    "expunged",
-    "forfeits",
-    "wordless",
-    "sleepily",
-    "prowling",
-    "lettuces",
-    "chambray",
-    "retracts",
-    "mimicked",
-    "icehouse",
-    "backstop",
-    "accusers",
-    "sunshade",
-    "rateable",
-    "tonality",
-    "ruptures",
-    "paralyze",
-    "hereunto",
-    "languish",
-    "feathery",
-    "adorning",
-    "drumbeat",
-    "pastiche",
-    "abeyance",
-    "snagging",
-    "sidereal",
-    "encamped",
-    "intaglio",
-    "doorknob",
-    "pinafore",
-    "necropsy",
-    "farcical",
-    "placebos",
-    "collides",
-    "escapist",
-    "gunshots",
-    "travails",
-    "linesman",
-    "outlived",
-    "basaltic",
-    "middling",
-    "antihero",
-    "freewill",
-    "personae",
-    "fourthly",
-    "skullcap",
-    "knighted",
-    "emanated",
-    "homilies",
-    "moonbeam",
-    "orifices",
-    "longings",
-    "thresher",
-    "alleyway",
-    "helmsman",
-    "robustly",
-    "hedgerow",
-    "immanent",
-    "chattels",
-    "brambles",
-    "striated",
-    "bronzing",
-    "mangling",
-    "filtrate",
-    "debarred",
-    "apologia",
-    "rocketed",
-    "punditry",
-    "cryostat",
-    "spatulas",
-    "bladders",
-    "beetroot",
-    "dutchmen",
-    "extensor",
-    "cesspool",
-    "stirrers",
-    "banality",
-    "questing",
-    "averting",
-    "tapeworm",
-    "frisbees",
-    "faubourg",
-    "sarcomas",
-    "teamster",
-    "culloden",
-    "fringing",
-    "propping",
-    "storable",
-    "cyclamen",
-    "rejoices",
-    "panniers",
-    "carapace",
-    "elastics",
-    "montages",
-    "bailiffs",
-    "singling",
-    "slugfest",
-    "jointing",
-    "jacobite",
-    "freckled",
-    "marooned",
-    "dauphine",
-    "conjunct",
-    "gelatine",
-    "thrombus",
-    "doctored",
-    "hotshots",
-    "chutzpah",
-    "widowers",
-    "encircle",
-    "mustards",
-    "voyagers",
-    "tendrils",
-    "ratchets",
-    "malarial",
-    "dioramas",
-    "simmered",
-    "mainsail",
-    "spooling",
-    "scalding",
-    "witchery",
-    "wingless",
-    "cantonal",
-    "scatters",
-    "escapism",
-    "sandbags",
-    "repartee",
-    "micelles",
-    "knightly",
-    "nibblers",
-    "meekness",
-    "pinochle",
-    "uneasily",
-    "wrestles",
-    "climaxes",
-    "toboggan",
-    "airships",
-    "flickers",
-    "crayford",
-    "abdicate",
-    "wiggling",
-    "toreador",
-    "descents",
-    "dalkeith",
-    "snobbery",
-    "erectors",
-    "witching",
-    "gendarme",
-    "lyricism",
-    "palatial",
-    "flippant",
-    "zodiacal",
-    "grubbing",
-    "unturned",
-    "workroom",
-    "censured",
-    "hayfield",
-    "relished",
-    "missteps",
-    "doubters",
-    "cabbages",
-    "saboteur",
-    "wreaking",
-    "linguine",
-    "kurtosis",
-    "chapbook",
-    "sceptics",
-    "outpaced",
-    "implored",
-    "earthing",
-    "clumping",
-    "bermudan",
-    "quackery",
-    "villainy",
-    "shunting",
-    "hurtling",
-    "squabble",
-    "funneled",
-    "inimical",
-    "bunching",
-    "townsmen",
-    "accredit",
-    "skylines",
-    "unpaired",
-    "handfuls",
-    "asphyxia",
-    "smelters",
-    "oversold",
-    "lacquers",
-    "purifies",
-    "stunting",
-    "sparkled",
-    "arachnid",
-    "equaling",
-    "quibbles",
-    "uncalled",
-    "subplots",
-    "alluvium",
-    "stargaze",
-    "alarmist",
-    "blithely",
-    "amortize",
-    "virginal",
-    "bodleian",
-    "tallying",
-    "backlogs",
-    "lobotomy",
-    "fiercest",
-    "tailback",
-    "grizzled",
-    "fatalism",
-    "despises",
-    "jousting",
-    "ferrules",
-    "blackest",
-    "cathodes",
-    "relented",
-    "domesday",
-    "trekkers",
-    "schizoid",
-    "mutating",
-    "isotherm",
-    "motherly",
-    "coachmen",
-    "atomizer",
-    "bonehead",
-    "rubidium",
-    "granites",
-    "armbands",
-    "skidding",
-    "stylised",
-    "amassing",
-    "consoled",
-    "rearward",
-    "purposed",
-    "hornpipe",
-    "boatyard",
-    "berthing",
-    "peekaboo",
-    "availing",
-    "overtone",
-    "frazzled",
-    "hustling",
-    "cadavers",
-    "milanese",
-    "readjust",
-    "seafarer",
-    "docketed",
-    "platoons",
-    "luminary",
-    "accosted",
-    "umpiring",
-    "morbidly",
-    "swooping",
-    "niceties",
-    "handymen",
-    "signaler",
-    "silurian",
-    "quietude",
-    "wildfowl",
-    "acolytes",
-    "royalist",
-    "synching",
-    "tripling",
-    "windlass",
-    "studious",
-    "patellar",
-    "fineness",
-    "pharisee",
-    "amicably",
-    "nuptials",
-    "satirist",
-    "outliner",
-    "wobbling",
-    "gadgetry",
-    "teahouse",
-    "sagacity",
-    "trickled",
-    "abounded",
-    "disloyal",
-    "staggers",
-    "defector",
-    "stuntman",
-    "zillions",
-    "longleaf",
-    "pervaded",
-    "falsetto",
-    "foxhound",
-    "gloating",
-    "absolved",
-    "snappers",
-    "aperitif",
-    "uppercut",
-    "ticklers",
-    "mutandis",
-    "butyrate",
-    "morpheme",
-    "acreages",
-    "pursuers",
-    "lavished",
-    "defacing",
-    "hangouts",
-    "trioxide",
-    "tinkling",
-    "masterly",
-    "butchery",
-    "wresting",
-    "variably",
-    "cherubim",
-    "nightcap",
-    "kickball",
-    "toggling",
-    "polyglot",
-    "mayflies",
-    "dainties",
-    "bluebook",
-    "disquiet",
-    "deerskin",
-    "sufficed",
-    "corsages",
-    "rebutted",
-    "pickings",
-    "nuclides",
-    "cisterns",
-    "nitrites",
-    "capuchin",
-    "naturale",
-    "twitched",
-    "reticule",
-    "pervious",
-    "longhair",
-    "gondolas",
-    "spenders",
-    "jottings",
-    "unsuited",
-    "gurgling",
-    "illusive",
-    "chucking",
-    "ripeness",
-    "sinkhole",
-    "debaters",
-    "cordials",
-    "bandaged",
-    "copepods",
-    "chippers",
-    "bullocks",
-    "vilified",
-    "caroling",
-    "hogshead",
-    "passives",
-    "provably",
-    "inedible",
-    "deplored",
-    "tunneled",
-    "jacobean",
-    "trapdoor",
-    "backlist",
-    "sneering",
-    "neuritis",
-    "nonstock",
-    "remotest",
-    "fixative",
-    "paraquat",
-    "crunched",
-    "scuttled",
-    "discolor",
-    "bivalves",
-    "outsmart",
-    "riflemen",
-    "blinders",
-    "clasping",
-    "clovelly",
-    "excusing",
-    "slanting",
-    "detested",
-    "immunize",
-    "daiquiri",
-    "broached",
-    "puckered",
-    "shunning",
-    "cleaving",
-    "overwork",
-    "belching",
-    "hauliers",
-    "bellowed",
-    "moieties",
-    "digraphs",
-    "timbered",
-    "gobbling",
-    "moulders",
-    "katmandu",
-    "tranches",
-    "speedier",
-    "slickers",
-    "optionee",
-    "chunking",
-    "deuteron",
-    "unravels",
-    "flossing",
-    "vacuoles",
-    "ghoulish",
-    "prefaced",
-    "yellowed",
-    "dendrite",
-    "calluses",
-    "colorist",
-    "animates",
-    "affixing",
-    "aerators",
-    "efferent",
-    "inclines",
-    "aspirate",
-    "chowders",
-    "shudders",
-    "ardently",
-    "begonias",
-    "clouding",
-    "bronchus",
-    "intruded",
-    "sephardi",
-    "unforced",
-    "hominids",
-    "slayings",
-    "defusing",
-    "latterly",
-    "drizzled",
-    "outfalls",
-    "flagella",
-    "ruminate",
-    "chimeras",
-    "instants",
-    "whoppers",
-    "anaphase",
-    "archduke",
-    "succumbs",
-    "hardener",
-    "reddened",
-    "blinkers",
-    "plummets",
-    "energise",
-    "misogyny",
-    "closeted",
-    "notching",
-    "monomial",
-    "turnouts",
-    "brouhaha",
-    "crannies",
-    "tankards",
-    "familles",
-    "minutely",
-    "pontoons",
-    "silvered",
-    "dairying",
-    "subgenus",
-    "pantries",
-    "theorize",
-    "eruptive",
-    "slotting",
-    "inflates",
-    "divining",
-    "fortieth",
-    "premixed",
-    "scalpers",
-    "moleskin",
-    "holdalls",
-    "ambushes",
-    "cabarets",
-    "satanist",
-    "guttural",
-    "levelers",
-    "caramels",
-    "inverses",
-    "rewiring",
-    "barreled",
-    "capsized",
-    "kilobyte",
-    "ejecting",
-    "matinees",
-    "tubeless",
-    "entendre",
-    "refrains",
-    "furrowed",
-    "hedonist",
-    "hogmanay",
-    "pirating",
-    "machismo",
-    "thumbing",
-    "shimmers",
-    "debonair",
-    "grappled",
-    "sonogram",
-    "quizzing",
-    "ovations",
-    "illiquid",
-    "bleating",
-    "squatted",
-    "reassert",
-    "bettered",
-    "imbecile",
-    "alloying",
-    "pickerel",
-    "sargasso",
-    "beasties",
-    "denarius",
-    "afflicts",
-    "thinness",
-    "ullapool",
-    "dullness",
-    "wrenched",
-    "usurping",
-    "foxholes",
-    "focusses",
-    "revelers",
-    "aquiline",
-    "lockouts",
-    "admonish",
-    "connotes",
-    "sporrans",
-    "smudging",
-    "squealed",
-    "convents",
-    "encumber",
-    "impetigo",
-    "drachmas",
-    "bindweed",
-    "heedless",
-    "indulges",
-    "pergolas",
-    "inductee",
-    "thespian",
-    "jeroboam",
-    "rightist",
-    "graviton",
-    "pwllheli",
-    "meanness",
-    "arboreal",
-    "inhalant",
-    "coercing",
-    "untangle",
-    "gosforth",
-    "engorged",
-    "crediton",
-    "foretell",
-    "colorize",
-    "notarial",
-    "cripples",
-    "cornices",
-    "penciled",
-    "antiphon",
-    "ratifies",
-    "releaser",
-    "gnashing",
-    "issuable",
-    "abactors",
-    "abacuses",
-    "abashing",
-    "abatable",
-    "abbacies",
-    "abbesses",
-    "abdicant",
-    "abdomens",
-    "abductor",
-    "aberavon",
-    "abergele",
-    "aberrate",
-    "abersoch",
-    "abettors",
-    "abhorred",
-    "abhorrer",
-    "abidance",
-    "abjectly",
-    "abjurers",
-    "abjuring",
-    "ablating",
-    "ablative",
-    "abnegate",
-    "abraders",
-    "abrading",
-    "abridger",
-    "abridges",
-    "abscised",
-    "abscises",
-    "abscissa",
-    "absconds",
-    "abseiled",
-    "abseiler",
-    "absented",
-    "absently",
-    "absinths",
-    "absolver",
-    "absolves",
-    "abstains",
-    "abstruse",
-    "absurdum",
-    "abuttals",
-    "abutters",
-    "acceders",
-    "accidens",
-    "acclaims",
-    "accouter",
-    "accoutre",
-    "accreted",
-    "accretes",
-    "accusals",
-    "accustom",
-    "acerbate",
-    "acerbity",
-    "acetates",
-    "acetones",
-    "acquests",
-    "acridity",
-    "acrimony",
-    "acrostic",
-    "actinide",
-    "actinium",
-    "actuates",
-    "adamants",
-    "adducers",
-    "adducing",
-    "adducted",
-    "adductor",
-    "adeeming",
-    "adenines",
-    "adenoids",
-    "adjoined",
-    "adjourns",
-    "adjudges",
-    "adjuring",
-    "admixing",
-    "adorably",
-    "adrenals",
-    "adroitly",
-    "adulated",
-    "adulates",
-    "adulator",
-    "adverted",
-    "advocaat",
-    "advowson",
-    "aeolians",
-    "aerating",
-    "aerofoil",
-    "aeronaut",
-    "aerostat",
-    "aesthete",
-    "affeered",
-    "affiance",
-    "afflatus",
-    "afforest",
-    "affright",
-    "affronts",
-    "afghanis",
-    "aflutter",
-    "ageratum",
-    "aggrieve",
-    "agisters",
-    "agisting",
-    "agistors",
-    "agitates",
-    "aglitter",
-    "agnomens",
-    "agnomina",
-    "agonised",
-    "agonises",
-    "agonized",
-    "agonizes",
-    "agouties",
-    "agraphia",
-    "agrimony",
-    "aigrette",
-    "ailerons",
-    "airbuses",
-    "aircrews",
-    "airdrome",
-    "airfoils",
-    "airiness",
-    "airlifts",
-    "airlocks",
-    "albinism",
-    "alcaldes",
-    "aldburgh",
-    "aldernay",
-    "aleatory",
-    "alehouse",
-    "alembics",
-    "alewives",
-    "alienage",
-    "alienees",
-    "aliening",
-    "alienism",
-    "alienors",
-    "alighted",
-    "alimenta",
-    "aliments",
-    "alizarin",
-    "alkalise",
-    "alkalize",
-    "allaying",
-    "allegata",
-    "allegros",
-    "allodial",
-    "allonges",
-    "allonyms",
-    "allottee",
-    "allusive",
-    "alluvion",
-    "almoigne",
-    "almoners",
-    "alnmouth",
-    "alpinism",
-    "alpinist",
-    "alsatian",
-    "alterius",
-    "alternat",
-    "althorns",
-    "altruist",
-    "alveolus",
-    "alwinton",
-    "alyssums",
-    "amalgams",
-    "amanitas",
-    "ambulant",
-    "ambulate",
-    "ambusher",
-    "amenably",
-    "amercing",
-    "amiantus",
-    "amitosis",
-    "amitotic",
-    "ammeters",
-    "ammoniac",
-    "ammonite",
-    "amnesiac",
-    "amorists",
-    "amortise",
-    "amphorae",
-    "ampoules",
-    "ampthill",
-    "amputate",
-    "amusedly",
-    "amylases",
-    "anaerobe",
-    "anagogic",
-    "anapaest",
-    "anapests",
-    "anaphora",
-    "anaphors",
-    "andantes",
-    "andirons",
-    "angering",
-    "angolans",
-    "angriest",
-    "animists",
-    "aniseeds",
-    "anisette",
-    "annalist",
-    "annelids",
-    "annexing",
-    "anodises",
-    "anodizes",
-    "anodynes",
-    "anorthic",
-    "anteater",
-    "antedate",
-    "anteroom",
-    "anthills",
-    "antinomy",
-    "antipode",
-    "antiriot",
-    "antitank",
-    "antlered",
-    "apanages",
-    "apennine",
-    "aphasiac",
-    "aphasics",
-    "aphelion",
-    "aphorise",
-    "aphorism",
-    "aphorize",
-    "apiaries",
-    "apiarist",
-    "apoplexy",
-    "apothems",
-    "appanage",
-    "appeaser",
-    "appeases",
-    "appestat",
-    "apposers",
-    "apposite",
-    "apprises",
-    "aquanaut",
-    "aquatint",
-    "arapahos",
-    "arbiters",
-    "arboreta",
-    "archaise",
-    "archaism",
-    "archaize",
-    "archways",
-    "areaways",
-    "aristech",
-    "arkansan",
-    "armagnac",
-    "armholes",
-    "armoring",
-    "armourer",
-    "arpeggio",
-    "arraigns",
-    "arraying",
-    "arrester",
-    "arrogate",
-    "arsenate",
-    "arsonist",
-    "articled",
-    "ascetics",
-    "ascribes",
-    "ashberry",
-    "asperity",
-    "aspersed",
-    "asperses",
-    "asphodel",
-    "aspirins",
-    "assayers",
-    "assaying",
-    "assegais",
-    "assonant",
-    "assuaged",
-    "assuages",
-    "assurers",
-    "astatine",
-    "asterism",
-    "asthenia",
-    "astounds",
-    "astragal",
-    "astutely",
-    "ateliers",
-    "atomised",
-    "atomiser",
-    "atomises",
-    "atomized",
-    "atomizes",
-    "atonally",
-    "attaints",
-    "attestor",
-    "attiring",
-    "attorned",
-    "attuning",
-    "atwitter",
-    "auguries",
-    "auguring",
-    "aureoles",
-    "auricles",
-    "autarchy",
-    "autarkic",
-    "autocrat",
-    "autoptic",
-    "averment",
-    "averring",
-    "aversely",
-    "aversive",
-    "aviaries",
-    "aviatrix",
-    "avifauna",
-    "avouched",
-    "avouches",
-    "avowedly",
-    "avulsing",
-    "avulsion",
-    "aysgarth",
-    "azimuths",
-    "azurites",
-    "babblers",
-    "babushka",
-    "babyhood",
-    "babysits",
-    "backbend",
-    "backbite",
-    "backchat",
-    "backcomb",
-    "backdate",
-    "backings",
-    "backslap",
-    "backslid",
-    "backspin",
-    "badgered",
-    "badinage",
-    "badmouth",
-    "bafflers",
-    "baggiest",
-    "bagpiper",
-    "bailable",
-    "bailment",
-    "baklavas",
-    "baldpate",
-    "baldrics",
-    "balkiest",
-    "ballater",
-    "balloted",
-    "ballyhoo",
-    "balmiest",
-    "baluster",
-    "bambinos",
-    "bamburgh",
-    "bandeaux",
-    "banditry",
-    "bandsman",
-    "bandsmen",
-    "bandying",
-    "banishes",
-    "banjoist",
-    "bankable",
-    "bankbook",
-    "banneret",
-    "bannocks",
-    "bantered",
-    "baptises",
-    "baptizes",
-    "barbered",
-    "barberry",
-    "barbital",
-    "bareness",
-    "barflies",
-    "bargeman",
-    "bargemen",
-    "barmaids",
-    "barmiest",
-    "barmouth",
-    "barnabus",
-    "baronets",
-    "baronial",
-    "baronies",
-    "barraged",
-    "barrages",
-    "barrator",
-    "barratry",
-    "barretor",
-    "bartered",
-    "baseness",
-    "basenjis",
-    "bassoons",
-    "bastardy",
-    "bastions",
-    "bathetic",
-    "battened",
-    "battiest",
-    "battings",
-    "batwings",
-    "baulking",
-    "bavarois",
-    "bawdiest",
-    "bazookas",
-    "beaching",
-    "beadiest",
-    "beadsman",
-    "beadsmen",
-    "beanpole",
-    "bearably",
-    "bearding",
-    "bearsden",
-    "bearskin",
-    "beatific",
-    "beatniks",
-    "beavered",
-    "becalmed",
-    "bechamel",
-    "beclouds",
-    "bedaubed",
-    "bedazzle",
-    "bedcover",
-    "bedecked",
-    "bedevils",
-    "bedewing",
-    "bedizens",
-    "bedouins",
-    "bedposts",
-    "bedrolls",
-    "bedsides",
-    "bedsocks",
-    "bedsores",
-    "bedstraw",
-    "bedtimes",
-    "beefcake",
-    "beefiest",
-    "beehives",
-    "beelines",
-    "beetling",
-    "befitted",
-    "befogged",
-    "befouled",
-    "befuddle",
-    "begetter",
-    "beggared",
-    "beggarly",
-    "begrimed",
-    "begrimes",
-    "begrudge",
-    "beguiled",
-    "beguiler",
-    "beguiles",
-    "behalves",
-    "behooved",
-    "behooves",
-    "behoving",
-    "bejewels",
-    "belabors",
-    "belabour",
-    "belaying",
-    "belfries",
-    "bellboys",
-    "bellhops",
-    "bellyful",
-    "bellying",
-    "belmopan",
-    "beltways",
-    "bemiring",
-    "bemoaned",
-    "bemusing",
-    "benching",
-    "benefice",
-    "bengalis",
-    "benignly",
-    "benisons",
-    "benumbed",
-    "berating",
-    "bereaves",
-    "beriberi",
-    "bermudas",
-    "berserks",
-    "besieger",
-    "besieges",
-    "besmears",
-    "besmirch",
-    "besotted",
-    "besought",
-    "bespeaks",
-    "bespoken",
-    "bestowal",
-    "bestrewn",
-    "bestrews",
-    "bestride",
-    "bestrode",
-    "betaking",
-    "betatron",
-    "bethinks",
-    "betiding",
-    "betjeman",
-    "betokens",
-    "betrayer",
-    "betroths",
-    "beveling",
-    "bevelled",
-    "bewailed",
-    "bewaring",
-    "bewilder",
-    "biassing",
-    "bibelots",
-    "bibulous",
-    "bickered",
-    "bicuspid",
-    "bicycled",
-    "biddable",
-    "bifocals",
-    "bigamist",
-    "bigamous",
-    "bigheads",
-    "bighorns",
-    "bikeways",
-    "bilabial",
-    "billeted",
-    "billhook",
-    "billowed",
-    "bingeing",
-    "binnacle",
-    "biograph",
-    "biometry",
-    "bioscopy",
-    "biplanes",
-    "birdcall",
-    "birdlike",
-    "birdseed",
-    "birdying",
-    "bisected",
-    "bisector",
-    "bitchier",
-    "bitchily",
-    "biteable",
-    "bitingly",
-    "bitterer",
-    "bitterns",
-    "bivalent",
-    "bivouacs",
-    "biyearly",
-    "blabbers",
-    "blabbing",
-    "blackcap",
-    "blackens",
-    "blacking",
-    "blackish",
-    "blackleg",
-    "blamable",
-    "blameful",
-    "blanches",
-    "blandest",
-    "blandish",
-    "blankest",
-    "blarneys",
-    "blastula",
-    "blatancy",
-    "blathers",
-    "blazoned",
-    "bleaches",
-    "bleakest",
-    "blearier",
-    "blearing",
-    "bleeders",
-    "bleepers",
-    "blenched",
-    "blenches",
-    "blethers",
-    "blighter",
-    "blindest",
-    "blintzes",
-    "blipping",
-    "blithers",
-    "blithest",
-    "blitzing",
-    "bloaters",
-    "blondest",
-    "bloodier",
-    "bloodies",
-    "blooding",
-    "blotched",
-    "blotches",
-    "blotters",
-    "blousing",
-    "blousons",
-    "blowguns",
-    "blowhard",
-    "blowhole",
-    "blowlamp",
-    "blowpipe",
-    "blowsier",
-    "blowzier",
-    "blubbers",
-    "bluchers",
-    "bludgeon",
-    "bluenose",
-    "bluffers",
-    "bluffest",
-    "bluntest",
-    "blunting",
-    "blurting",
-    "blushers",
-    "blusters",
-    "boasters",
-    "boastful",
-    "boatable",
-    "boatload",
-    "boatsman",
-    "boatsmen",
-    "bobbling",
-    "bobolink",
-    "bobsleds",
-    "bobtails",
-    "bodiless",
-    "bogeyman",
-    "bogeymen",
-    "boggiest",
-    "boilings",
-    "bollixed",
-    "bollixes",
-    "bolougne",
-    "bombards",
-    "bonanzas",
-    "bondsmen",
-    "bonhomie",
-    "bonneted",
-    "bonniest",
-    "boogying",
-    "boohooed",
-    "bootless",
-    "bootlick",
-    "booziest",
-    "boringly",
-    "borrasca",
-    "borstals",
-    "boscalis",
-    "bosporus",
-    "bossiest",
-    "botching",
-    "bottlers",
-    "bottomry",
-    "boudoirs",
-    "bouffant",
-    "bouncier",
-    "bouncily",
-    "bounders",
-    "bourbons",
-    "bowlines",
-    "bowsprit",
-    "boxwoods",
-    "boyishly",
-    "brachium",
-    "brackens",
-    "bradawls",
-    "braggart",
-    "braggers",
-    "brahmans",
-    "brainier",
-    "braining",
-    "braising",
-    "brandied",
-    "brandies",
-    "brandish",
-    "brashest",
-    "brassier",
-    "brassily",
-    "brattier",
-    "bravados",
-    "brawlers",
-    "brawling",
-    "brawnier",
-    "brazened",
-    "brazenly",
-    "braziers",
-    "breading",
-    "breadths",
-    "breezier",
-    "breezily",
-    "breezing",
-    "brehonia",
-    "breughel",
-    "breviary",
-    "breviate",
-    "brickbat",
-    "bricking",
-    "bridling",
-    "briefest",
-    "brigands",
-    "brindled",
-    "bringers",
-    "brioches",
-    "briskest",
-    "briskets",
-    "brisling",
-    "bristled",
-    "britches",
-    "broaches",
-    "brocaded",
-    "brocades",
-    "brocages",
-    "broiling",
-    "brokenly",
-    "brollies",
-    "bromides",
-    "bromidic",
-    "bronchia",
-    "brooders",
-    "broodier",
-    "brooking",
-    "browbeat",
-    "brownout",
-    "broxtowe",
-    "bruchner",
-    "bruisers",
-    "bruiting",
-    "brunches",
-    "brusquer",
-    "bubblier",
-    "bucketed",
-    "bucklers",
-    "buffalos",
-    "buffeted",
-    "buffoons",
-    "bugaboos",
-    "bugbears",
-    "buggered",
-    "bulgiest",
-    "bulkiest",
-    "bulldoze",
-    "bullwhip",
-    "bulwarks",
-    "bumpiest",
-    "bumpkins",
-    "bunglers",
-    "bungling",
-    "bunkered",
-    "buntings",
-    "buntline",
-    "burbling",
-    "burdocks",
-    "burettes",
-    "burgages",
-    "burgeons",
-    "burghers",
-    "burgling",
-    "burliest",
-    "burnoose",
-    "burrowed",
-    "bursaria",
-    "bushiest",
-    "bustards",
-    "busybody",
-    "busyness",
-    "cabbalas",
-    "cableway",
-    "caboodle",
-    "cabooses",
-    "cabotage",
-    "cackling",
-    "cactuses",
-    "caddying",
-    "cadenced",
-    "cadences",
-    "cadenzas",
-    "caducary",
-    "caesurae",
-    "caesuras",
-    "caeterus",
-    "caginess",
-    "cagoules",
-    "caissons",
-    "caitiffs",
-    "cajolery",
-    "cajoling",
-    "caladium",
-    "calamine",
-    "caldrons",
-    "calicoes",
-    "callboys",
-    "callgirl",
-    "callings",
-    "calliper",
-    "callused",
-    "calumets",
-    "calypsos",
-    "cambered",
-    "cambists",
-    "cambiums",
-    "camomile",
-    "canaille",
-    "canalise",
-    "canalize",
-    "candelas",
-    "candling",
-    "canniest",
-    "cannoned",
-    "canoeist",
-    "canonici",
-    "canonise",
-    "canonist",
-    "canonize",
-    "canoodle",
-    "canopied",
-    "cantered",
-    "canticle",
-    "cantinas",
-    "cantreds",
-    "capering",
-    "capitula",
-    "caporals",
-    "caprices",
-    "capsizes",
-    "capslock",
-    "capstans",
-    "captious",
-    "capybara",
-    "caracole",
-    "caravels",
-    "caraways",
-    "carbides",
-    "carbines",
-    "carbolic",
-    "carcanum",
-    "carcatus",
-    "careened",
-    "careered",
-    "careworn",
-    "caribous",
-    "caritate",
-    "carloads",
-    "carnally",
-    "carolers",
-    "carolled",
-    "caroller",
-    "caroming",
-    "carotids",
-    "carousal",
-    "caroused",
-    "carouser",
-    "carouses",
-    "carpools",
-    "carryall",
-    "carrycot",
-    "carucate",
-    "caryatid",
-    "cascaras",
-    "cashable",
-    "cashbook",
-    "cassavas",
-    "cassocks",
-    "castanet",
-    "castling",
-    "castrate",
-    "casuists",
-    "catacomb",
-    "catalans",
-    "catalpas",
-    "catalyse",
-    "catarrhs",
-    "catbirds",
-    "catcalls",
-    "catchall",
-    "catchier",
-    "cathedra",
-    "cattalos",
-    "cattiest",
-    "catwalks",
-    "caucused",
-    "causerie",
-    "caustics",
-    "caviares",
-    "cavilers",
-    "caviling",
-    "cavilled",
-    "caviller",
-    "cavorted",
-    "cedillas",
-    "ceilidhs",
-    "celation",
-    "celeriac",
-    "celerity",
-    "cellists",
-    "cenobite",
-    "cenotaph",
-    "censures",
-    "centavos",
-    "centenas",
-    "centimes",
-    "centring",
-    "ceramist",
-    "cerebrum",
-    "cervices",
-    "cervixes",
-    "cessions",
-    "cesspits",
-    "chaffing",
-    "chagford",
-    "chaldern",
-    "chalders",
-    "chaldron",
-    "chalices",
-    "chalkier",
-    "chalking",
-    "chamfers",
-    "chamotte",
-    "champing",
-    "chancels",
-    "chancers",
-    "chancier",
-    "chancing",
-    "chancres",
-    "chanters",
-    "chanteys",
-    "chapatis",
-    "chapatti",
-    "chapeaux",
-    "chaperon",
-    "chaplets",
-    "chapping",
-    "charades",
-    "chariest",
-    "charmers",
-    "charring",
-    "chartist",
-    "chasidic",
-    "chastely",
-    "chastens",
-    "chastise",
-    "chasuble",
-    "chattier",
-    "chattily",
-    "cheapens",
-    "cheekier",
-    "cheekily",
-    "cheeking",
-    "cheeping",
-    "cheerier",
-    "cheerily",
-    "cheesier",
-    "chequers",
-    "cheroots",
-    "cherubic",
-    "chessman",
-    "chessmen",
-    "chestier",
-    "cheviots",
-    "chevrons",
-    "chewiest",
-    "chicanos",
-    "chiggers",
-    "chignons",
-    "chileans",
-    "chillier",
-    "chinches",
-    "chinking",
-    "chinless",
-    "chinning",
-    "chinooks",
-    "chintzes",
-    "chirpily",
-    "chirrups",
-    "chivvied",
-    "chivvies",
-    "chivying",
-    "chlorate",
-    "choctaws",
-    "choicest",
-    "choirboy",
-    "choleric",
-    "choosers",
-    "choosier",
-    "choppier",
-    "chorales",
-    "chordate",
-    "chorines",
-    "chortled",
-    "chortles",
-    "chorused",
-    "chroming",
-    "chthonic",
-    "chubbier",
-    "chummier",
-    "chumming",
-    "chunkier",
-    "churchly",
-    "churlish",
-    "ciborium",
-    "cicatrix",
-    "cicerone",
-    "ciliated",
-    "ciliates",
-    "cinching",
-    "cinchona",
-    "cincture",
-    "cinerary",
-    "ciphered",
-    "circlets",
-    "circuity",
-    "citadels",
-    "citified",
-    "citifies",
-    "citrates",
-    "citroens",
-    "civilise",
-    "civilize",
-    "clabbers",
-    "clacking",
-    "clambake",
-    "clambers",
-    "clammier",
-    "clammily",
-    "clamming",
-    "clamored",
-    "clamours",
-    "clangers",
-    "clanging",
-    "clangour",
-    "clanking",
-    "clannish",
-    "clansman",
-    "clansmen",
-    "clappers",
-    "claptrap",
-    "clarions",
-    "classici",
-    "classier",
-    "classing",
-    "clatters",
-    "clavicle",
-    "claviers",
-    "clearway",
-    "cleavers",
-    "clenches",
-    "clergies",
-    "clerking",
-    "cleverer",
-    "clickers",
-    "climaxed",
-    "clinches",
-    "clinkers",
-    "clinking",
-    "cliquish",
-    "clobbers",
-    "cloddish",
-    "cloisonn",
-    "clomping",
-    "clopping",
-    "cloudier",
-    "cloudily",
-    "clouting",
-    "clownish",
-    "clubfoot",
-    "clubroom",
-    "clucking",
-    "clumsier",
-    "clutters",
-    "coarsens",
-    "coarsest",
-    "coattail",
-    "cobbling",
-    "coccyges",
-    "cochleae",
-    "cockades",
-    "cockcrow",
-    "cockerel",
-    "cockeyed",
-    "cockiest",
-    "cockneys",
-    "cockpits",
-    "cocksure",
-    "coddling",
-    "codicils",
-    "codifier",
-    "codifies",
-    "codlings",
-    "codpiece",
-    "coequals",
-    "coexists",
-    "coferers",
-    "coffered",
-    "cogently",
-    "cogitate",
-    "cognates",
-    "cognisee",
-    "cognizee",
-    "cognomen",
-    "cognovit",
-    "cohabits",
-    "cohering",
-    "coiffeur",
-    "coiffure",
-    "coinages",
-    "coleuses",
-    "collards",
-    "collates",
-    "collator",
-    "colleens",
-    "collegia",
-    "colluded",
-    "colludes",
-    "colonise",
-    "colonsay",
-    "colorant",
-    "coloreds",
-    "colorise",
-    "combated",
-    "combusts",
-    "comedone",
-    "comedown",
-    "comelier",
-    "comfiest",
-    "comities",
-    "commixed",
-    "commixes",
-    "commodes",
-    "commoted",
-    "commotes",
-    "communed",
-    "compeers",
-    "compered",
-    "comperes",
-    "complice",
-    "comports",
-    "composts",
-    "compotes",
-    "compulsa",
-    "computet",
-    "conceits",
-    "concilia",
-    "concocts",
-    "concords",
-    "conditio",
-    "condoled",
-    "condoles",
-    "condones",
-    "conduced",
-    "conduces",
-    "conferee",
-    "confides",
-    "conflate",
-    "confrere",
-    "confuted",
-    "confutes",
-    "congaing",
-    "congeals",
-    "congener",
-    "congests",
-    "conjoins",
-    "conjurer",
-    "conjuror",
-    "connived",
-    "conniver",
-    "connives",
-    "connoted",
-    "consigns",
-    "consomme",
-    "consomms",
-    "consorts",
-    "constate",
-    "contango",
-    "contemns",
-    "contorts",
-    "contrail",
-    "contrite",
-    "contrive",
-    "contused",
-    "contuses",
-    "conusant",
-    "converso",
-    "conveyer",
-    "convivia",
-    "convoked",
-    "convokes",
-    "convoyed",
-    "convulse",
-    "cookouts",
-    "coolants",
-    "coonskin",
-    "coplanar",
-    "coppices",
-    "copulate",
-    "copybook",
-    "copycats",
-    "copyhold",
-    "copyists",
-    "coquetry",
-    "coquinas",
-    "coracles",
-    "cordiale",
-    "cordoned",
-    "cordovan",
-    "cordwood",
-    "corkages",
-    "corncrib",
-    "corniest",
-    "cornrows",
-    "corodies",
-    "corodium",
-    "corollas",
-    "coronets",
-    "corporis",
-    "corpsman",
-    "corpsmen",
-    "corpuses",
-    "corrodes",
-    "corsairs",
-    "corselet",
-    "corseted",
-    "corsetry",
-    "corteges",
-    "cortices",
-    "cortises",
-    "corundum",
-    "cosecant",
-    "cosenage",
-    "cosinage",
-    "cosiness",
-    "cosmoses",
-    "cosseted",
-    "costlier",
-    "cotarius",
-    "coteries",
-    "cotlands",
-    "cottager",
-    "cottoned",
-    "couchers",
-    "couching",
-    "coulombs",
-    "couplets",
-    "courcher",
-    "coursers",
-    "courtage",
-    "coveting",
-    "covetous",
-    "covinous",
-    "cowbells",
-    "cowbirds",
-    "cowering",
-    "cowhands",
-    "cowherds",
-    "cowhides",
-    "cowlicks",
-    "cowlings",
-    "cowsheds",
-    "cowslips",
-    "coxcombs",
-    "coxswain",
-    "cozening",
-    "crabbier",
-    "crabbily",
-    "crabbing",
-    "crackled",
-    "crackles",
-    "cracknel",
-    "cradling",
-    "craftier",
-    "craftily",
-    "craggier",
-    "crammers",
-    "cranages",
-    "craniums",
-    "crankier",
-    "crankily",
-    "crapping",
-    "crassest",
-    "cravenly",
-    "crayoned",
-    "creakier",
-    "creakily",
-    "creamers",
-    "creamier",
-    "creaming",
-    "creepier",
-    "cremates",
-    "cresting",
-    "cretonne",
-    "crevasse",
-    "cribbing",
-    "criminis",
-    "crimsons",
-    "cringing",
-    "crinkled",
-    "crinkles",
-    "crispers",
-    "crispest",
-    "crispier",
-    "crisping",
-    "croaking",
-    "crochets",
-    "crocking",
-    "crocuses",
-    "crofters",
-    "cromford",
-    "cromlech",
-    "crooking",
-    "crooners",
-    "crooning",
-    "croppers",
-    "croquets",
-    "crosiers",
-    "crotches",
-    "crouches",
-    "crowbars",
-    "crowfoot",
-    "croziers",
-    "cruelest",
-    "crueller",
-    "crullers",
-    "crumbing",
-    "crummier",
-    "crumpets",
-    "crumples",
-    "cruppers",
-    "crusaded",
-    "crustier",
-    "crustily",
-    "crusting",
-    "cruzeiro",
-    "cuckolds",
-    "cuddlier",
-    "cudgeled",
-    "cufflink",
-    "cuillins",
-    "culottes",
-    "culpably",
-    "cultists",
-    "cumbered",
-    "cumbrous",
-    "cumulate",
-    "cumulous",
-    "cunnings",
-    "cupidity",
-    "curatrix",
-    "curdling",
-    "curettes",
-    "curlicue",
-    "curliest",
-    "curnocks",
-    "currying",
-    "cursedly",
-    "cursitor",
-    "curtails",
-    "curtiles",
-    "curtises",
-    "curtness",
-    "curtseys",
-    "curtsied",
-    "curtsies",
-    "cushiest",
-    "cuspidor",
-    "custards",
-    "custodes",
-    "custodia",
-    "cutaways",
-    "cuthreds",
-    "cuticles",
-    "cutpurse",
-    "cutworms",
-    "cyanamid",
-    "cyanided",
-    "cyanides",
-    "cyanosed",
-    "cyanoses",
-    "cyanosis",
-    "cyanotic",
-    "cyclopes",
-    "cynosure",
-    "cyphered",
-    "cypriote",
-    "dabblers",
-    "dactylic",
-    "dadaists",
-    "daintier",
-    "daintily",
-    "dairylea",
-    "dairyman",
-    "dairymen",
-    "dallying",
-    "damnable",
-    "damnably",
-    "damocles",
-    "dandiest",
-    "dandling",
-    "danegeld",
-    "danegelt",
-    "danelage",
-    "danelagh",
-    "dankness",
-    "dapperly",
-    "dappling",
-    "daringly",
-    "darkling",
-    "darnings",
-    "darraign",
-    "dashikis",
-    "dateable",
-    "dauphins",
-    "dawdlers",
-    "dawdling",
-    "daybooks",
-    "daystars",
-    "dazzlers",
-    "deaconry",
-    "deadborn",
-    "deadened",
-    "deadhead",
-    "deadlier",
-    "deadness",
-    "deafened",
-    "debacles",
-    "debarked",
-    "debasing",
-    "debility",
-    "debiting",
-    "debitors",
-    "debriefs",
-    "decagons",
-    "decagram",
-    "decamped",
-    "decanted",
-    "deceives",
-    "decessus",
-    "deciders",
-    "decigram",
-    "decimate",
-    "deckling",
-    "declaims",
-    "decocted",
-    "decorous",
-    "decoying",
-    "decretal",
-    "decrying",
-    "decrypts",
-    "deducing",
-    "deemster",
-    "deepness",
-    "defaming",
-    "defecate",
-    "deferent",
-    "defiling",
-    "definers",
-    "deflates",
-    "deflects",
-    "deflower",
-    "deforced",
-    "deforces",
-    "defrauds",
-    "defrayal",
-    "defrayed",
-    "defrocks",
-    "defrosts",
-    "deftness",
-    "degassed",
-    "degaster",
-    "degrease",
-    "dehisced",
-    "dehisces",
-    "deifying",
-    "deigning",
-    "delators",
-    "delimits",
-    "deloused",
-    "delouses",
-    "delphian",
-    "deluding",
-    "deluging",
-    "delusive",
-    "delusory",
-    "demagogy",
-    "demander",
-    "demeaned",
-    "demerara",
-    "demerits",
-    "demesnes",
-    "demigods",
-    "demijohn",
-    "demising",
-    "demisted",
-    "demister",
-    "demobbed",
-    "demoniac",
-    "demonise",
-    "demonize",
-    "demoting",
-    "demurely",
-    "demurest",
-    "demurred",
-    "demurrer",
-    "denature",
-    "deniable",
-    "deniably",
-    "denizing",
-    "denuding",
-    "depictor",
-    "depilate",
-    "deplaned",
-    "deplanes",
-    "depletes",
-    "deplores",
-    "deponent",
-    "deportee",
-    "deposing",
-    "depraves",
-    "deprival",
-    "depurate",
-    "deputing",
-    "deputise",
-    "deputize",
-    "deraigns",
-    "derailer",
-    "deranges",
-    "deriding",
-    "derisive",
-    "derisory",
-    "derogate",
-    "derricks",
-    "derriere",
-    "desalted",
-    "descants",
-    "descried",
-    "descries",
-    "desisted",
-    "desolder",
-    "despairs",
-    "despitus",
-    "despoils",
-    "destines",
-    "detaches",
-    "detainer",
-    "dethrone",
-    "detinets",
-    "detinues",
-    "detoured",
-    "detrains",
-    "devalues",
-    "devested",
-    "deviancy",
-    "deviling",
-    "devilled",
-    "deviltry",
-    "devisees",
-    "devisors",
-    "devolves",
-    "devoutly",
-    "dewdrops",
-    "dextrous",
-    "diaconus",
-    "diallage",
-    "diallers",
-    "dialysed",
-    "dialyses",
-    "dialyzed",
-    "dianatic",
-    "diapason",
-    "diapered",
-    "diarists",
-    "diastase",
-    "diastole",
-    "diatomic",
-    "dibbling",
-    "dichotic",
-    "dickered",
-    "dictores",
-    "diddling",
-    "didymium",
-    "diereses",
-    "dieresis",
-    "diffract",
-    "diffuses",
-    "digamies",
-    "diggings",
-    "digitise",
-    "dilating",
-    "dilators",
-    "dilatory",
-    "dimities",
-    "dimorphs",
-    "dimpling",
-    "dinarchy",
-    "dinettes",
-    "dingiest",
-    "dinkiest",
-    "dioichia",
-    "dioxides",
-    "diptychs",
-    "dirtying",
-    "disabuse",
-    "disavows",
-    "disbands",
-    "discerns",
-    "discoing",
-    "discords",
-    "discuses",
-    "disdains",
-    "disfavor",
-    "disgorge",
-    "disgusts",
-    "dishevel",
-    "dishiest",
-    "disinter",
-    "disjoins",
-    "dismally",
-    "disobeys",
-    "disowned",
-    "dispirit",
-    "disports",
-    "disproof",
-    "disrated",
-    "disrates",
-    "disrobed",
-    "disrobes",
-    "dissects",
-    "disseise",
-    "dissents",
-    "dissever",
-    "distaffs",
-    "distally",
-    "distends",
-    "distills",
-    "distrain",
-    "disunion",
-    "disunite",
-    "disunity",
-    "ditchers",
-    "dithered",
-    "dittoing",
-    "divagate",
-    "dividivi",
-    "diviners",
-    "divorcee",
-    "divulges",
-    "divvying",
-    "dizziest",
-    "djakarta",
-    "docilely",
-    "docility",
-    "dockhand",
-    "doddered",
-    "dodgiest",
-    "doeskins",
-    "dogcarts",
-    "doggedly",
-    "doggerel",
-    "dogsleds",
-    "dogtrots",
-    "dogwoods",
-    "dolorous",
-    "domesman",
-    "domesmen",
-    "domicils",
-    "domineer",
-    "donative",
-    "donators",
-    "donatory",
-    "doneness",
-    "doodlers",
-    "doodling",
-    "doorjamb",
-    "doornail",
-    "doorstop",
-    "dopiness",
-    "dormouse",
-    "dorsally",
-    "dotation",
-    "dotingly",
-    "dottiest",
-    "doublets",
-    "doubloon",
-    "douching",
-    "dourness",
-    "dovecote",
-    "dovecots",
-    "dovedale",
-    "dowagers",
-    "dowdiest",
-    "doweling",
-    "dowering",
-    "downiest",
-    "doxology",
-    "drabbest",
-    "drabness",
-    "dracaena",
-    "drachmae",
-    "draftees",
-    "draggers",
-    "draggled",
-    "draggles",
-    "dragnets",
-    "dramatis",
-    "drambuie",
-    "draughty",
-    "drawling",
-    "dreamier",
-    "dreamily",
-    "drearier",
-    "drearily",
-    "dredgers",
-    "drenches",
-    "dressier",
-    "dribbled",
-    "dribbles",
-    "driblets",
-    "driveled",
-    "drizzles",
-    "drollery",
-    "drollest",
-    "droopier",
-    "droopily",
-    "droppers",
-    "drowsier",
-    "drowsily",
-    "drowsing",
-    "drubbing",
-    "drudging",
-    "drugging",
-    "druggist",
-    "drumhead",
-    "drumlins",
-    "drunkest",
-    "dubliner",
-    "duckbill",
-    "duckweed",
-    "ductless",
-    "dudgeons",
-    "duelists",
-    "duellers",
-    "duelling",
-    "duellist",
-    "duisberg",
-    "dukedoms",
-    "dullards",
-    "dumbness",
-    "dumfound",
-    "dumpiest",
-    "dungaree",
-    "dunghill",
-    "dunvegan",
-    "durmasts",
-    "duskiest",
-    "dustbins",
-    "dustiest",
-    "dutiable",
-    "dwarfing",
-    "dwarfish",
-    "dwarfism",
-    "dwindles",
-    "dyestuff",
-    "dynamist",
-    "dysgenic",
-    "earaches",
-    "eardrums",
-    "earflaps",
-    "earldoms",
-    "earlobes",
-    "earmuffs",
-    "earthier",
-    "eatables",
-    "echidnas",
-    "eclogues",
-    "ecotypes",
-    "ectoderm",
-    "edentate",
-    "edgeways",
-    "edgewise",
-    "edginess",
-    "edifices",
-    "educable",
-    "educible",
-    "effacing",
-    "effetely",
-    "effigies",
-    "effluvia",
-    "effluxes",
-    "effusing",
-    "effusive",
-    "eggheads",
-    "egoistic",
-    "egotists",
-    "egresses",
-    "ejectors",
-    "elapsing",
-    "elatedly",
-    "elbowing",
-    "elegised",
-    "elegises",
-    "elegized",
-    "elegizes",
-    "elicitor",
-    "elisions",
-    "elkhound",
-    "elusions",
-    "emaciate",
-    "embalmed",
-    "embalmer",
-    "embanked",
-    "embattle",
-    "embezzle",
-    "embitter",
-    "emblazon",
-    "embolden",
-    "embosses",
-    "embowers",
-    "embroils",
-    "emceeing",
-    "emendate",
-    "emending",
-    "eminency",
-    "emissive",
-    "empanels",
-    "emptiest",
-    "emptores",
-    "empyrean",
-    "emulsify",
-    "enactors",
-    "enamours",
-    "encasing",
-    "enceinte",
-    "enchains",
-    "enchants",
-    "encipher",
-    "enclitic",
-    "encomium",
-    "encoring",
-    "encrusts",
-    "endeared",
-    "endgames",
-    "endocarp",
-    "endoderm",
-    "endogamy",
-    "endorsee",
-    "endorser",
-    "endowing",
-    "enervate",
-    "enfeeble",
-    "enfeoffs",
-    "enflamed",
-    "enflames",
-    "enfolded",
-    "engirded",
-    "engorges",
-    "engrafts",
-    "engraves",
-    "enkindle",
-    "enlacing",
-    "enlivens",
-    "enmeshed",
-    "enmeshes",
-    "enmities",
-    "ennobled",
-    "ennobles",
-    "enplaned",
-    "enplanes",
-    "enraging",
-    "enrolees",
-    "ensconce",
-    "ensealed",
-    "enshrine",
-    "enshroud",
-    "ensilage",
-    "ensiling",
-    "enslaves",
-    "ensnared",
-    "ensnares",
-    "entangle",
-    "ententes",
-    "enthrall",
-    "enthrals",
-    "enthrone",
-    "enthuses",
-    "entrains",
-    "entreats",
-    "entreaty",
-    "entrebat",
-    "entrench",
-    "entrepot",
-    "entrusts",
-    "entwines",
-    "enuresis",
-    "envelops",
-    "envenoms",
-    "enviably",
-    "eolithic",
-    "epaulets",
-    "epicures",
-    "epicycle",
-    "epigrams",
-    "epigraph",
-    "epiphyte",
-    "episcope",
-    "epistola",
-    "epitaphs",
-    "epitomes",
-    "epsilons",
-    "equalise",
-    "equators",
-    "equipage",
-    "erasures",
-    "eremites",
-    "erosions",
-    "errantry",
-    "eructing",
-    "escapees",
-    "escargot",
-    "escarole",
-    "escheats",
-    "eschewed",
-    "esophagi",
-    "espalier",
-    "espartos",
-    "espousal",
-    "espouses",
-    "esquires",
-    "essartum",
-    "essaying",
-    "essoined",
-    "estopped",
-    "estovers",
-    "estrange",
-    "estrayed",
-    "estreats",
-    "estreped",
-    "estrepes",
-    "etageres",
-    "ethelred",
-    "ethnical",
-    "etiolate",
-    "eulogies",
-    "eulogise",
-    "eulogize",
-    "euphonic",
-    "eurobond",
-    "eurocrat",
-    "europium",
-    "eutectic",
-    "evanesce",
-    "evasions",
-    "evenness",
-    "evensong",
-    "evicting",
-    "evictors",
-    "evildoer",
-    "evincing",
-    "exaction",
-    "exalting",
-    "excising",
-    "excitant",
-    "excluder",
-    "excretes",
-    "excursus",
-    "execrate",
-    "exegeses",
-    "exegetes",
-    "exegetic",
-    "exemplum",
-    "exhaling",
-    "exhuming",
-    "exigency",
-    "exigible",
-    "exiguous",
-    "exocrine",
-    "exoduses",
-    "exorcise",
-    "expiated",
-    "expiates",
-    "expounds",
-    "expunges",
-    "extolled",
-    "extorted",
-    "extrados",
-    "extremis",
-    "extremum",
-    "extrudes",
-    "exultant",
-    "exulting",
-    "eyebolts",
-    "eyeshade",
-    "eyesores",
-    "eyestalk",
-    "fabliaux",
-    "fabulist",
-    "facially",
-    "facilely",
-    "factious",
-    "factotum",
-    "fadeouts",
-    "fairgoer",
-    "faitours",
-    "fallibly",
-    "fallings",
-    "falloffs",
-    "famished",
-    "fanciest",
-    "fancying",
-    "fanfares",
-    "fanlight",
-    "fantails",
-    "faradays",
-    "farceurs",
-    "farriers",
-    "fascicle",
-    "fastness",
-    "fatalist",
-    "fatherly",
-    "fathomed",
-    "fattened",
-    "fattiest",
-    "fatuitas",
-    "faultier",
-    "faustian",
-    "fauteuil",
-    "favorers",
-    "favourer",
-    "fealties",
-    "feasance",
-    "feasibly",
-    "feckless",
-    "federate",
-    "feeblest",
-    "feigning",
-    "feinting",
-    "feistier",
-    "feoffees",
-    "feoffors",
-    "ferdella",
-    "ferments",
-    "ferrator",
-    "ferreted",
-    "ferriage",
-    "ferrying",
-    "ferryman",
-    "ferrymen",
-    "fervency",
-    "fervidly",
-    "festered",
-    "festoons",
-    "feticide",
-    "fetlocks",
-    "fettered",
-    "fettling",
-    "feudally",
-    "fiancees",
-    "fiascoes",
-    "fibroses",
-    "ficklest",
-    "fidgeted",
-    "fiefdoms",
-    "fielders",
-    "fieldman",
-    "fieldmen",
-    "fieriest",
-    "figments",
-    "filacers",
-    "filberts",
-    "filching",
-    "filiated",
-    "filiates",
-    "filleted",
-    "filliped",
-    "filmgoer",
-    "filmiest",
-    "filthier",
-    "filthily",
-    "finagled",
-    "finagles",
-    "fineable",
-    "fineries",
-    "finessed",
-    "finesses",
-    "fireboat",
-    "firebomb",
-    "firebugs",
-    "firedamp",
-    "firedogs",
-    "firetrap",
-    "fireweed",
-    "firmarii",
-    "fisheyes",
-    "fishiest",
-    "fishmeal",
-    "fishtail",
-    "fishwife",
-    "fissured",
-    "fistfuls",
-    "fistulae",
-    "fistulas",
-    "fitchews",
-    "fitfully",
-    "fitments",
-    "fivefold",
-    "fixating",
-    "fizzling",
-    "flabbier",
-    "flabbily",
-    "flagrans",
-    "flakiest",
-    "flameout",
-    "flanging",
-    "flannels",
-    "flapjack",
-    "flappers",
-    "flashgun",
-    "flashier",
-    "flashily",
-    "flatbeds",
-    "flatboat",
-    "flatcars",
-    "flatfeet",
-    "flatfish",
-    "flatlets",
-    "flattens",
-    "flatters",
-    "flattest",
-    "flatting",
-    "flattops",
-    "flatworm",
-    "flaunted",
-    "flautist",
-    "fleawort",
-    "flecking",
-    "fledging",
-    "fleecier",
-    "fleecing",
-    "fleetest",
-    "fleshier",
-    "fleshing",
-    "flextime",
-    "flexures",
-    "flimsier",
-    "flimsies",
-    "flimsily",
-    "flinched",
-    "flinches",
-    "flintier",
-    "flitting",
-    "floggers",
-    "floozies",
-    "floppier",
-    "flossier",
-    "flounced",
-    "flounces",
-    "flouring",
-    "flouting",
-    "flubbing",
-    "fluffier",
-    "fluffing",
-    "flummery",
-    "flunkeys",
-    "flunkies",
-    "flunking",
-    "flurried",
-    "flusters",
-    "flutings",
-    "flutists",
-    "flutters",
-    "fluttery",
-    "flyblown",
-    "flyovers",
-    "flypaper",
-    "flypasts",
-    "flyspeck",
-    "flytraps",
-    "foamiest",
-    "foetidly",
-    "foetuses",
-    "fogbound",
-    "foggiest",
-    "foghorns",
-    "foisting",
-    "foldaway",
-    "folderol",
-    "foliated",
-    "foliates",
-    "folksier",
-    "fomented",
-    "fomenter",
-    "fondants",
-    "fontanel",
-    "foolscap",
-    "footfall",
-    "footgear",
-    "footless",
-    "footling",
-    "footmark",
-    "footsies",
-    "footsore",
-    "footstep",
-    "foragers",
-    "foramina",
-    "foraying",
-    "forbears",
-    "forborne",
-    "forcipes",
-    "forebear",
-    "forebode",
-    "foredoom",
-    "forefeet",
-    "foregoes",
-    "forelegs",
-    "forelimb",
-    "forelock",
-    "foremast",
-    "forenoon",
-    "forepart",
-    "forepaws",
-    "foresail",
-    "forewarn",
-    "forewent",
-    "forgoing",
-    "forkfuls",
-    "fornices",
-    "forsakes",
-    "forswear",
-    "forswore",
-    "forsworn",
-    "fortiori",
-    "fortuity",
-    "fortyish",
-    "foulards",
-    "foulness",
-    "foxiness",
-    "foxtrots",
-    "fracases",
-    "frailest",
-    "francium",
-    "frankest",
-    "frazzles",
-    "freakier",
-    "freeload",
-    "freesias",
-    "freights",
-    "frensham",
-    "frenzies",
-    "frescoed",
-    "freshens",
-    "freshets",
-    "fretsaws",
-    "fretwork",
-    "frijoles",
-    "frillier",
-    "frippery",
-    "friskier",
-    "friskily",
-    "frisking",
-    "frizzier",
-    "frizzing",
-    "frizzled",
-    "frizzles",
-    "froggatt",
-    "frontons",
-    "frostier",
-    "frostily",
-    "frothier",
-    "frothily",
-    "frowzier",
-    "fructify",
-    "frugally",
-    "fruitier",
-    "frumpier",
-    "frumpish",
-    "frustums",
-    "fuchsias",
-    "fuddling",
-    "fugators",
-    "fulcrums",
-    "fumblers",
-    "fumigant",
-    "fumigate",
-    "funafuti",
-    "fundable",
-    "funereal",
-    "funfairs",
-    "fungible",
-    "funguses",
-    "funkiest",
-    "furbelow",
-    "furiosus",
-    "furriers",
-    "furriest",
-    "fusilier",
-    "fussiest",
-    "fustiest",
-    "futilely",
-    "fuzziest",
-    "gabbiest",
-    "gabbling",
-    "gabelles",
-    "gabfests",
-    "gadabout",
-    "gadflies",
-    "gaieties",
-    "gainsaid",
-    "gainsays",
-    "gallants",
-    "galleons",
-    "galloons",
-    "galloped",
-    "galoshes",
-    "gamboled",
-    "gambrels",
-    "gamester",
-    "gaminess",
-    "ganglier",
-    "gangling",
-    "gangways",
-    "gantlets",
-    "gantlope",
-    "gantries",
-    "gaolbird",
-    "garaging",
-    "garbling",
-    "gardeins",
-    "gardened",
-    "gargling",
-    "garishly",
-    "garlicky",
-    "garroted",
-    "garrotes",
-    "garrotte",
-    "gassiest",
-    "gassings",
-    "gastrula",
-    "gatepost",
-    "gaudiest",
-    "gaullist",
-    "gauntest",
-    "gavelers",
-    "gavelman",
-    "gavelmen",
-    "gavottes",
-    "gawkiest",
-    "gazeboes",
-    "gazelles",
-    "gazettes",
-    "gazumped",
-    "gazunder",
-    "gelatins",
-    "geldable",
-    "geldings",
-    "geminate",
-    "gemology",
-    "gemsboks",
-    "genially",
-    "genitors",
-    "gentians",
-    "gentlest",
-    "gentling",
-    "gentrify",
-    "geometer",
-    "georgics",
-    "geotaxis",
-    "germanus",
-    "gesserit",
-    "gestalts",
-    "gestated",
-    "gestates",
-    "gettable",
-    "gherkins",
-    "gibbered",
-    "gibbeted",
-    "gigabits",
-    "gigavolt",
-    "gigawatt",
-    "gigglers",
-    "gimcrack",
-    "gimmicky",
-    "gingered",
-    "gingkoes",
-    "ginkgoes",
-    "girdling",
-    "girlhood",
-    "gisement",
-    "gizzards",
-    "gladdens",
-    "gladdest",
-    "gladiola",
-    "gladioli",
-    "glassful",
-    "glassier",
-    "glassily",
-    "glassine",
-    "glassing",
-    "gleaning",
-    "glibbest",
-    "glibness",
-    "glimmers",
-    "glinting",
-    "glissade",
-    "glistens",
-    "glisters",
-    "gloaming",
-    "globules",
-    "glomming",
-    "gloomier",
-    "gloomily",
-    "glorying",
-    "glossier",
-    "glossily",
-    "glossing",
-    "glowered",
-    "gloxinia",
-    "gluhwein",
-    "glummest",
-    "glumness",
-    "glutting",
-    "gluttons",
-    "gnarling",
-    "gnostics",
-    "goalpost",
-    "goatskin",
-    "gobblers",
-    "godchild",
-    "godheads",
-    "godsends",
-    "goggling",
-    "goncourt",
-    "gonfalon",
-    "goofiest",
-    "googlies",
-    "gormless",
-    "goshawks",
-    "goslings",
-    "gossiped",
-    "gouaches",
-    "gourmand",
-    "gourmets",
-    "grackles",
-    "gradated",
-    "gradates",
-    "graduals",
-    "graffito",
-    "grafters",
-    "grainage",
-    "grammies",
-    "grandams",
-    "granddad",
-    "grandees",
-    "grandpas",
-    "grangers",
-    "granters",
-    "grantors",
-    "grapheme",
-    "grapnels",
-    "grassers",
-    "grassier",
-    "grassing",
-    "gravamen",
-    "graveled",
-    "graziers",
-    "greasers",
-    "greasier",
-    "greasing",
-    "greedier",
-    "greenest",
-    "greenfly",
-    "gressane",
-    "greylags",
-    "greyness",
-    "grimaced",
-    "grimaces",
-    "grimiest",
-    "grimmest",
-    "grimness",
-    "grislier",
-    "gristles",
-    "grittier",
-    "gritting",
-    "grizzles",
-    "groggier",
-    "groggily",
-    "grossest",
-    "grottier",
-    "grottoes",
-    "grouched",
-    "grouches",
-    "grounder",
-    "groupers",
-    "grousing",
-    "groveled",
-    "grubbier",
-    "grudging",
-    "grumbler",
-    "grumpier",
-    "grumpily",
-    "grumping",
-    "grunions",
-    "guanacos",
-    "guanines",
-    "guardage",
-    "gudgeons",
-    "guffawed",
-    "guileful",
-    "guiltier",
-    "guiltily",
-    "gulfweed",
-    "gullibly",
-    "gumboils",
-    "gumboots",
-    "gumdrops",
-    "gummiest",
-    "gumption",
-    "gumshoes",
-    "gunboats",
-    "gunflint",
-    "gunwales",
-    "gustiest",
-    "guttered",
-    "gymkhana",
-    "gymnasia",
-    "gynarchy",
-    "gyrating",
-    "habitans",
-    "habitant",
-    "habitude",
-    "hackneys",
-    "hacksaws",
-    "hackwork",
-    "haddocks",
-    "haeredes",
-    "hagglers",
-    "hairiest",
-    "hairpins",
-    "halation",
-    "halberds",
-    "haleness",
-    "halfback",
-    "halibuts",
-    "hallooed",
-    "halogens",
-    "haltered",
-    "halyards",
-    "hammiest",
-    "handbill",
-    "handcars",
-    "handcart",
-    "handclap",
-    "handhold",
-    "handiest",
-    "handless",
-    "handsels",
-    "handwork",
-    "hangnail",
-    "hankered",
-    "hansards",
-    "hapsburg",
-    "harangue",
-    "harasser",
-    "harasses",
-    "hardiest",
-    "hardtack",
-    "hardtops",
-    "harebell",
-    "harelips",
-    "haricots",
-    "harlotry",
-    "harpists",
-    "harpoons",
-    "harridan",
-    "harrowed",
-    "harrying",
-    "hasidism",
-    "hassidic",
-    "hassling",
-    "hassocks",
-    "hastiest",
-    "hatbands",
-    "hatboxes",
-    "hatchets",
-    "hatchway",
-    "hatstand",
-    "hauberks",
-    "haunches",
-    "hawkweed",
-    "haybotes",
-    "haylofts",
-    "haymaker",
-    "hayracks",
-    "hayseeds",
-    "hazarded",
-    "haziness",
-    "headachy",
-    "headhunt",
-    "headiest",
-    "headlock",
-    "headnote",
-    "headship",
-    "headsman",
-    "headsmen",
-    "headwall",
-    "headwind",
-    "headword",
-    "headwork",
-    "healable",
-    "hearkens",
-    "heartens",
-    "heartier",
-    "heatedly",
-    "hecklers",
-    "heckling",
-    "hectored",
-    "heehawed",
-    "heftiest",
-    "heirship",
-    "heisting",
-    "helicons",
-    "hellcats",
-    "hellions",
-    "helloing",
-    "helmeted",
-    "helmsmen",
-    "helpings",
-    "helpmate",
-    "helpmeet",
-    "hemlines",
-    "hemlocks",
-    "hemostat",
-    "henbanes",
-    "henpecks",
-    "hepatica",
-    "heptagon",
-    "herbaria",
-    "herdsman",
-    "herdsmen",
-    "hereupon",
-    "hessians",
-    "hexagons",
-    "hexagram",
-    "hexapods",
-    "hiatuses",
-    "hibachis",
-    "hiccough",
-    "hiccuped",
-    "hidalgos",
-    "hideouts",
-    "hieratic",
-    "highborn",
-    "highboys",
-    "highbrow",
-    "highroad",
-    "hightail",
-    "hilliest",
-    "hillmans",
-    "hillocks",
-    "hilltops",
-    "hindmost",
-    "hipbones",
-    "hiplines",
-    "hireable",
-    "hireling",
-    "hoarders",
-    "hoariest",
-    "hoarsely",
-    "hoarsest",
-    "hobbling",
-    "hobnails",
-    "hogbacks",
-    "holdback",
-    "hollered",
-    "hollowly",
-    "homagers",
-    "homebody",
-    "homelier",
-    "homelike",
-    "hominoid",
-    "homonyms",
-    "honestis",
-    "hoodlums",
-    "hoodwink",
-    "hookworm",
-    "hoorayed",
-    "hornbeam",
-    "hornbill",
-    "hornbook",
-    "horniest",
-    "horologe",
-    "horridly",
-    "horsefly",
-    "hosannas",
-    "hospitia",
-    "hostelry",
-    "hotchpot",
-    "hotelman",
-    "hotfoots",
-    "hotheads",
-    "hounding",
-    "housefly",
-    "houseman",
-    "housemen",
-    "housetop",
-    "huckster",
-    "huddling",
-    "huffiest",
-    "hugeness",
-    "hulloing",
-    "humanise",
-    "humanize",
-    "humblest",
-    "humidify",
-    "hummocks",
-    "humoring",
-    "humoured",
-    "hunching",
-    "hungered",
-    "hungrier",
-    "hunkered",
-    "huntsmen",
-    "hurdlers",
-    "hurdling",
-    "hurrahed",
-    "huskiest",
-    "hustings",
-    "huxtable",
-    "hydrides",
-    "hydroids",
-    "hymeneal",
-    "hymnbook",
-    "hyphened",
-    "hypnoses",
-    "hypogeum",
-    "hysteric",
-    "iberians",
-    "iceboxes",
-    "ichthyic",
-    "icknield",
-    "idealise",
-    "idealize",
-    "ideating",
-    "ideogram",
-    "idiocies",
-    "idolater",
-    "idolised",
-    "idolises",
-    "idolized",
-    "idolizes",
-    "idoneare",
-    "ignominy",
-    "ignorare",
-    "illation",
-    "illicite",
-    "illumine",
-    "ilyushin",
-    "imbibing",
-    "imbruing",
-    "imitable",
-    "imitator",
-    "immerses",
-    "immodest",
-    "immolate",
-    "immunise",
-    "immuring",
-    "impaling",
-    "impanels",
-    "imparity",
-    "imparled",
-    "impasses",
-    "impended",
-    "imperils",
-    "impinged",
-    "impinges",
-    "impishly",
-    "impleads",
-    "imploded",
-    "implodes",
-    "implores",
-    "impounds",
-    "impressa",
-    "imprests",
-    "imprimis",
-    "impudent",
-    "impugned",
-    "impurely",
-    "imputing",
-    "inbreeds",
-    "incenses",
-    "incepted",
-    "inceptor",
-    "incertae",
-    "inchoate",
-    "incising",
-    "incisors",
-    "inciters",
-    "incivile",
-    "incivism",
-    "inclosed",
-    "incloses",
-    "incumber",
-    "indentor",
-    "indicium",
-    "indictee",
-    "indicter",
-    "indigoes",
-    "indorsed",
-    "indorses",
-    "induciae",
-    "indument",
-    "indwells",
-    "inedibly",
-    "inexpert",
-    "infamies",
-    "infantes",
-    "infarcts",
-    "infernos",
-    "infields",
-    "infixing",
-    "inflames",
-    "inflects",
-    "influxes",
-    "ingenues",
-    "ingenuus",
-    "ingleton",
-    "ingrains",
-    "ingrates",
-    "inhering",
-    "inhuming",
-    "inkblots",
-    "inkhorns",
-    "inklings",
-    "inkstand",
-    "inkwells",
-    "inlaying",
-    "innately",
-    "inputted",
-    "inquests",
-    "inrushes",
-    "inscribe",
-    "inspirer",
-    "inspirit",
-    "instated",
-    "instates",
-    "instills",
-    "intermit",
-    "internee",
-    "intoning",
-    "intrados",
-    "introits",
-    "intrudes",
-    "intrusts",
-    "intuited",
-    "inundate",
-    "invalids",
-    "inveighs",
-    "inveigle",
-    "iodinate",
-    "iodising",
-    "iodizing",
-    "iraklion",
-    "irefully",
-    "irishmen",
-    "ironical",
-    "ironware",
-    "irrupted",
-    "iscariot",
-    "islamise",
-    "islamize",
-    "isomeric",
-    "isoprene",
-    "isotropy",
-    "issuably",
-    "isthmian",
-    "itchiest",
-    "itemised",
-    "itemises",
-    "itemizes",
-    "izvestia",
-    "jabbered",
-    "jackboot",
-    "jackdaws",
-    "jacobins",
-    "jadeites",
-    "jaggedly",
-    "jalopies",
-    "jalousie",
-    "jangling",
-    "januarys",
-    "japanned",
-    "jasmines",
-    "jauntier",
-    "jauntily",
-    "jaunting",
-    "javelins",
-    "jawbones",
-    "jaywalks",
-    "jazziest",
-    "jedburgh",
-    "jellabas",
-    "jellying",
-    "jemmying",
-    "jeremiad",
-    "jerkiest",
-    "jetfoils",
-    "jetliner",
-    "jettison",
-    "jewesses",
-    "jezebels",
-    "jiggling",
-    "jimmying",
-    "jingling",
-    "jingoish",
-    "jingoism",
-    "jingoist",
-    "jittered",
-    "jockeyed",
-    "jocosity",
-    "jodhpurs",
-    "joggling",
-    "joinders",
-    "jointers",
-    "jointure",
-    "jokester",
-    "jolliest",
-    "jonquils",
-    "jostling",
-    "jouncing",
-    "jovially",
-    "joyrider",
-    "joyrides",
-    "jubilees",
-    "juddered",
-    "jugulars",
-    "juiciest",
-    "jumbling",
-    "jumpiest",
-    "junipers",
-    "junketed",
-    "juristic",
-    "justitia",
-    "justness",
-    "karakuls",
-    "katydids",
-    "kedgeree",
-    "keelages",
-    "keelboat",
-    "keelhaul",
-    "keelsons",
-    "keenness",
-    "kenneled",
-    "kennings",
-    "kerchief",
-    "kerosine",
-    "kestrels",
-    "keyholes",
-    "keynoted",
-    "keypunch",
-    "khedives",
-    "kibitzed",
-    "kibitzer",
-    "kibitzes",
-    "kidwelly",
-    "killable",
-    "killjoys",
-    "kilobits",
-    "kilotons",
-    "kilovolt",
-    "kindlier",
-    "kinfolks",
-    "kingbird",
-    "kinglets",
-    "kingpins",
-    "kinkajou",
-    "kinkiest",
-    "kinsfolk",
-    "kippered",
-    "klansman",
-    "knackers",
-    "knapweed",
-    "kneecaps",
-    "kneehole",
-    "kneelers",
-    "kneepads",
-    "knelling",
-    "knifeman",
-    "knobbier",
-    "knothole",
-    "knottier",
-    "knowable",
-    "knuckled",
-    "knurling",
-    "koestler",
-    "kohlrabi",
-    "kookiest",
-    "koshered",
-    "krakatoa",
-    "kumquats",
-    "kuwaitis",
-    "kyleakin",
-    "labelers",
-    "labeller",
-    "laborite",
-    "laburnum",
-    "lacerate",
-    "laciness",
-    "lactated",
-    "lactates",
-    "laddered",
-    "ladylike",
-    "ladyship",
-    "laetrile",
-    "lamasery",
-    "lambaste",
-    "lambency",
-    "lamellae",
-    "lamellas",
-    "lampoons",
-    "lamppost",
-    "lampreys",
-    "lancelet",
-    "landslip",
-    "langholm",
-    "lankiest",
-    "laotians",
-    "lapwings",
-    "larboard",
-    "larcener",
-    "largesse",
-    "larynges",
-    "larynxes",
-    "lasagnas",
-    "lasagnes",
-    "lashings",
-    "lassoing",
-    "latchkey",
-    "latently",
-    "lathered",
-    "latinate",
-    "latinism",
-    "latinist",
-    "latticed",
-    "latvians",
-    "laudably",
-    "laudanum",
-    "laughers",
-    "launders",
-    "lavishes",
-    "lawgiver",
-    "layabout",
-    "layaways",
-    "layettes",
-    "layovers",
-    "laywoman",
-    "laywomen",
-    "leadsman",
-    "leadsmen",
-    "leafiest",
-    "leafless",
-    "leaguing",
-    "leakages",
-    "leakiest",
-    "leanness",
-    "leashing",
-    "leavened",
-    "leavings",
-    "lecterns",
-    "leeching",
-    "leftward",
-    "legalise",
-    "legalism",
-    "legalist",
-    "legatary",
-    "legatees",
-    "legation",
-    "legators",
-    "leggiest",
-    "legitime",
-    "legitimo",
-    "legrooms",
-    "leisured",
-    "lenience",
-    "leninism",
-    "lenitive",
-    "lethally",
-    "leveller",
-    "leverets",
-    "leviable",
-    "levitate",
-    "lewdness",
-    "libation",
-    "libelant",
-    "libelees",
-    "libelers",
-    "libeling",
-    "libelled",
-    "libeller",
-    "licenser",
-    "liegeman",
-    "liegemen",
-    "lifehold",
-    "lightens",
-    "ligneous",
-    "likelier",
-    "likening",
-    "lilongwe",
-    "limbered",
-    "limonite",
-    "limpness",
-    "linchpin",
-    "lineally",
-    "linefeed",
-    "linesmen",
-    "linguini",
-    "liniment",
-    "linseeds",
-    "linslade",
-    "lionised",
-    "lionises",
-    "lionized",
-    "lionizes",
-    "litanies",
-    "liturgic",
-    "liveable",
-    "livelier",
-    "livelong",
-    "livening",
-    "liveried",
-    "liveries",
-    "liverish",
-    "lividity",
-    "llanaber",
-    "llanrwst",
-    "loadsman",
-    "loadsmen",
-    "loanable",
-    "lobelias",
-    "loblolly",
-    "localise",
-    "localism",
-    "lockstep",
-    "locoweed",
-    "locution",
-    "lodestar",
-    "lodgment",
-    "loftiest",
-    "logician",
-    "loitered",
-    "loiterer",
-    "lonelier",
-    "longbows",
-    "longhand",
-    "longleat",
-    "lookouts",
-    "looniest",
-    "loopiest",
-    "loquitur",
-    "lordlier",
-    "lousiest",
-    "louvered",
-    "lovebird",
-    "lovelier",
-    "lovelies",
-    "lovelorn",
-    "lovesick",
-    "lowbrows",
-    "lowliest",
-    "lubrizol",
-    "luckless",
-    "lulworth",
-    "lumbered",
-    "lummoxes",
-    "lumpfish",
-    "lumpiest",
-    "lunacies",
-    "lunation",
-    "lunching",
-    "lunettes",
-    "lurchers",
-    "lurching",
-    "lushness",
-    "lustiest",
-    "lutetium",
-    "lynmouth",
-    "lysergic",
-    "macaroon",
-    "macerate",
-    "machetes",
-    "maculate",
-    "maddened",
-    "madwoman",
-    "madwomen",
-    "maestros",
-    "magentas",
-    "magnates",
-    "magnetos",
-    "maharani",
-    "mahatmas",
-    "maidenly",
-    "mailable",
-    "mailbags",
-    "mailgram",
-    "mainmast",
-    "maintops",
-    "majorcan",
-    "malarkey",
-    "malawian",
-    "maleness",
-    "malinger",
-    "malmseys",
-    "malodors",
-    "malodour",
-    "maltreat",
-    "malverns",
-    "mamboing",
-    "mammoths",
-    "manacled",
-    "manacles",
-    "mandrels",
-    "mandrill",
-    "manfully",
-    "mangiest",
-    "manhunts",
-    "manikins",
-    "manillas",
-    "maniples",
-    "manliest",
-    "mannerly",
-    "manorial",
-    "mansards",
-    "mantilla",
-    "mantises",
-    "mantissa",
-    "mantling",
-    "mantraps",
-    "manumits",
-    "marabous",
-    "marabout",
-    "marauded",
-    "marazion",
-    "marbling",
-    "margined",
-    "marimbas",
-    "marksmen",
-    "marlines",
-    "marmoset",
-    "marshier",
-    "martinet",
-    "maryport",
-    "masseurs",
-    "mastadon",
-    "mastiffs",
-    "mastoids",
-    "matadors",
-    "materiae",
-    "materiam",
-    "maternis",
-    "matrixes",
-    "matronas",
-    "matronly",
-    "mattocks",
-    "maturate",
-    "maturely",
-    "maturest",
-    "maunches",
-    "maunders",
-    "maxillae",
-    "mayoress",
-    "maypoles",
-    "mazurkas",
-    "meagerly",
-    "meagrely",
-    "mealiest",
-    "measlier",
-    "measurer",
-    "meatiest",
-    "meddlers",
-    "medially",
-    "medicate",
-    "medullae",
-    "medullar",
-    "medullas",
-    "megabuck",
-    "megatons",
-    "megavolt",
-    "melanges",
-    "mellowed",
-    "mellower",
-    "melodeon",
-    "menarche",
-    "menfolks",
-    "menhaden",
-    "menially",
-    "menorahs",
-    "mephitic",
-    "mephitis",
-    "mercable",
-    "mercians",
-    "mercuric",
-    "meriting",
-    "merriest",
-    "mesdames",
-    "messaged",
-    "messiest",
-    "messuage",
-    "mestizos",
-    "metalled",
-    "metayage",
-    "metazoan",
-    "methodic",
-    "metonyms",
-    "metonymy",
-    "mezuzahs",
-    "miaowing",
-    "miasmata",
-    "micawber",
-    "microbus",
-    "microvax",
-    "midriffs",
-    "midships",
-    "midwifes",
-    "milacron",
-    "mildewed",
-    "mildness",
-    "militare",
-    "militate",
-    "milkiest",
-    "milkmaid",
-    "milksops",
-    "milldams",
-    "milliard",
-    "millibar",
-    "milliner",
-    "millings",
-    "millpond",
-    "millrace",
-    "mimicker",
-    "minarets",
-    "minatory",
-    "minicabs",
-    "minidisk",
-    "minified",
-    "minifies",
-    "minorcan",
-    "minuends",
-    "minuting",
-    "mirthful",
-    "misapply",
-    "miscalls",
-    "miscarry",
-    "miscasts",
-    "miscible",
-    "miscount",
-    "miscuing",
-    "misdated",
-    "misdates",
-    "misdeals",
-    "misdealt",
-    "misdoing",
-    "miserere",
-    "misfired",
-    "misfires",
-    "misgauge",
-    "misguide",
-    "mishears",
-    "mishmash",
-    "misjudge",
-    "mislabel",
-    "misleads",
-    "misnamed",
-    "misnames",
-    "misogamy",
-    "misplays",
-    "misprint",
-    "misquote",
-    "misreads",
-    "misruled",
-    "misrules",
-    "missives",
-    "misspeak",
-    "misspell",
-    "misspelt",
-    "misspend",
-    "misspent",
-    "misspoke",
-    "misstate",
-    "mistiest",
-    "mistimed",
-    "mistimes",
-    "mistrals",
-    "mistreat",
-    "misusers",
-    "miswrite",
-    "miswrote",
-    "mitering",
-    "mittimus",
-    "mitzvoth",
-    "mixtions",
-    "mobilier",
-    "modicums",
-    "modishly",
-    "moistens",
-    "moistest",
-    "moldable",
-    "moldered",
-    "moldiest",
-    "molehill",
-    "mombassa",
-    "monazite",
-    "moneybag",
-    "mongrels",
-    "monikers",
-    "moniment",
-    "monistic",
-    "monition",
-    "monitory",
-    "monocles",
-    "monocrat",
-    "monodies",
-    "monogyny",
-    "monologs",
-    "monravia",
-    "monsoons",
-    "moochers",
-    "mooching",
-    "moodiest",
-    "mooncalf",
-    "mooniest",
-    "moonless",
-    "moonlike",
-    "moorhens",
-    "moquette",
-    "moraines",
-    "moralise",
-    "moralism",
-    "moralist",
-    "moralize",
-    "morasses",
-    "mordancy",
-    "mordents",
-    "morellos",
-    "morosely",
-    "mortared",
-    "mortised",
-    "mortises",
-    "mortmain",
-    "moseying",
-    "mossiest",
-    "mothball",
-    "mothered",
-    "motional",
-    "motorcar",
-    "motorise",
-    "motorize",
-    "motorman",
-    "motormen",
-    "mottling",
-    "mouldier",
-    "moulting",
-    "mounding",
-    "mounties",
-    "mousiest",
-    "moussaka",
-    "movables",
-    "moveably",
-    "movingly",
-    "muchness",
-    "mucilage",
-    "muddiest",
-    "muddling",
-    "muddying",
-    "mudguard",
-    "mudslide",
-    "muezzins",
-    "muffling",
-    "muggiest",
-    "muggings",
-    "mulattos",
-    "mulcting",
-    "muleteer",
-    "mulishly",
-    "mulleins",
-    "mullions",
-    "muralist",
-    "murkiest",
-    "murrains",
-    "muscatel",
-    "muscling",
-    "mushiest",
-    "musketry",
-    "muskrats",
-    "musquash",
-    "mustiest",
-    "mutative",
-    "muteness",
-    "mutilate",
-    "mutineer",
-    "mutinied",
-    "mutinies",
-    "mutinous",
-    "mutterer",
-    "muzziest",
-    "muzzling",
-    "mycelium",
-    "myrmidon",
-    "nacelles",
-    "nacreous",
-    "nameable",
-    "nankeens",
-    "nanterre",
-    "narcissi",
-    "narcoses",
-    "narcosis",
-    "narwhals",
-    "nasalise",
-    "nasality",
-    "nasalize",
-    "nascence",
-    "nattered",
-    "natterer",
-    "nattiest",
-    "nauseate",
-    "neatened",
-    "necroses",
-    "neediest",
-    "needling",
-    "negligee",
-    "neighing",
-    "nektonic",
-    "nembutal",
-    "nepenthe",
-    "nephrite",
-    "nerviest",
-    "nettling",
-    "neuroses",
-    "newsiest",
-    "niftiest",
-    "niggards",
-    "niggling",
-    "nighties",
-    "nihilist",
-    "nimblest",
-    "nimbuses",
-    "ninefold",
-    "ninepins",
-    "nippiest",
-    "nirvanas",
-    "nitpicks",
-    "nitrated",
-    "nitrides",
-    "nobbling",
-    "nobelium",
-    "noblemen",
-    "noblesse",
-    "nobodies",
-    "noisiest",
-    "nonagons",
-    "noontide",
-    "noontime",
-    "northiam",
-    "nosebags",
-    "nosegays",
-    "nosiness",
-    "nostrums",
-    "notarise",
-    "notarize",
-    "notelets",
-    "novelise",
-    "novelize",
-    "novellae",
-    "novocain",
-    "nucleate",
-    "nucleoli",
-    "nucleons",
-    "nugatory",
-    "numerate",
-    "numinous",
-    "numskull",
-    "nursling",
-    "nurturer",
-    "nuttiest",
-    "nuzzling",
-    "oarlocks",
-    "oatcakes",
-    "obduracy",
-    "obdurate",
-    "obeisant",
-    "obelisks",
-    "oblation",
-    "obligees",
-    "obligors",
-    "obliquus",
-    "obscener",
-    "obscurer",
-    "obsesses",
-    "obstante",
-    "obtruded",
-    "obtrudes",
-    "obtusely",
-    "obverses",
-    "obverted",
-    "obviated",
-    "obviates",
-    "ocarinas",
-    "occident",
-    "occludes",
-    "occulted",
-    "oceanian",
-    "ockenden",
-    "ocotillo",
-    "octagons",
-    "octobers",
-    "octoroon",
-    "oculists",
-    "oddballs",
-    "oddments",
-    "odysseys",
-    "oenology",
-    "oestrous",
-    "offerers",
-    "offloads",
-    "offstage",
-    "ogresses",
-    "ohmmeter",
-    "oilcakes",
-    "oilcloth",
-    "oiliness",
-    "oilskins",
-    "oilstone",
-    "oldsters",
-    "oligarch",
-    "ollerton",
-    "olograph",
-    "omicrons",
-    "omnivore",
-    "onlooker",
-    "onrushes",
-    "ooziness",
-    "opaquely",
-    "ophidian",
-    "opossums",
-    "opposers",
-    "oracular",
-    "orangery",
-    "orations",
-    "ordainer",
-    "ordinals",
-    "ordinand",
-    "organdie",
-    "originis",
-    "ornately",
-    "ornerier",
-    "orpiment",
-    "orreries",
-    "orthicon",
-    "osculate",
-    "ossified",
-    "ossifies",
-    "otterton",
-    "outclass",
-    "outcries",
-    "outdates",
-    "outdoing",
-    "outfaced",
-    "outfaces",
-    "outfight",
-    "outflank",
-    "outfoxed",
-    "outfoxes",
-    "outgrows",
-    "outguess",
-    "outlands",
-    "outlasts",
-    "outlawry",
-    "outlives",
-    "outmatch",
-    "outmodes",
-    "outpaces",
-    "outplays",
-    "outpours",
-    "outranks",
-    "outrider",
-    "outscore",
-    "outsells",
-    "outshine",
-    "outshone",
-    "outsides",
-    "outsized",
-    "outspend",
-    "outspent",
-    "outstays",
-    "outstrip",
-    "outtalks",
-    "outthink",
-    "outvoted",
-    "outvotes",
-    "outwears",
-    "outworks",
-    "ovenware",
-    "overacts",
-    "overages",
-    "overarch",
-    "overarms",
-    "overawed",
-    "overawes",
-    "overbank",
-    "overbear",
-    "overbids",
-    "overbite",
-    "overbold",
-    "overbook",
-    "overbore",
-    "overbuys",
-    "overcall",
-    "overcook",
-    "overcool",
-    "overdoes",
-    "overdraw",
-    "overdrew",
-    "overdubs",
-    "overeats",
-    "overfeed",
-    "overfill",
-    "overflew",
-    "overfond",
-    "overfund",
-    "overgrew",
-    "overgrow",
-    "overhand",
-    "overhear",
-    "overhung",
-    "overlain",
-    "overleap",
-    "overlies",
-    "overline",
-    "overlong",
-    "overloud",
-    "overmans",
-    "overmuch",
-    "overpays",
-    "overplus",
-    "overrate",
-    "overripe",
-    "overrode",
-    "oversell",
-    "oversewn",
-    "oversews",
-    "overshoe",
-    "overshot",
-    "overstay",
-    "overstep",
-    "overuses",
-    "oviducts",
-    "ovulated",
-    "ovulates",
-    "owelties",
-    "owlishly",
-    "oxalates",
-    "oxalises",
-    "oxidised",
-    "oxidiser",
-    "oxidises",
-    "oxidizes",
-    "oxonians",
-    "pacified",
-    "pacifies",
-    "pageboys",
-    "paginate",
-    "paisleys",
-    "palagium",
-    "palatals",
-    "palavers",
-    "paleface",
-    "paleness",
-    "palfreys",
-    "palimony",
-    "palinode",
-    "palliate",
-    "palmists",
-    "palmtops",
-    "palpably",
-    "palpated",
-    "palpates",
-    "palsgraf",
-    "paltered",
-    "paltrier",
-    "panaceas",
-    "panatela",
-    "pandered",
-    "pandowdy",
-    "pangolin",
-    "panicles",
-    "pantsuit",
-    "papacies",
-    "papering",
-    "papillae",
-    "papooses",
-    "paragium",
-    "paragons",
-    "paralyse",
-    "paramour",
-    "parapets",
-    "paraxial",
-    "parboils",
-    "parceled",
-    "parcener",
-    "parching",
-    "pardoner",
-    "parented",
-    "parentis",
-    "parfaits",
-    "parities",
-    "parkways",
-    "parlayed",
-    "parleyed",
-    "parodied",
-    "parolees",
-    "paroling",
-    "parotids",
-    "paroxysm",
-    "parquets",
-    "parroted",
-    "parrying",
-    "parsnips",
-    "partaken",
-    "partaker",
-    "partakes",
-    "parterre",
-    "partials",
-    "partible",
-    "partings",
-    "partitio",
-    "partitus",
-    "parvenus",
-    "passably",
-    "passkeys",
-    "pasterns",
-    "pastiest",
-    "pastille",
-    "pastrami",
-    "pastured",
-    "patchier",
-    "patchily",
-    "patellae",
-    "pathless",
-    "pattered",
-    "paunches",
-    "pauperis",
-    "pawnshop",
-    "peachier",
-    "pearlier",
-    "pearling",
-    "pebbling",
-    "peculate",
-    "pedalled",
-    "pedantry",
-    "pederast",
-    "pediment",
-    "peelings",
-    "peephole",
-    "peerages",
-    "pegboard",
-    "peignoir",
-    "pekinese",
-    "pelisses",
-    "pellagra",
-    "pellucid",
-    "pelvises",
-    "pemmican",
-    "penalise",
-    "pendenle",
-    "pendente",
-    "pendular",
-    "penknife",
-    "penlight",
-    "pennines",
-    "pennzoil",
-    "penology",
-    "pentanes",
-    "pentiums",
-    "peopling",
-    "peploses",
-    "peppiest",
-    "peptised",
-    "peptises",
-    "peptized",
-    "peptizes",
-    "peptones",
-    "percales",
-    "perching",
-    "perfecta",
-    "perfects",
-    "perfumer",
-    "periculi",
-    "perigees",
-    "periling",
-    "perineum",
-    "perisher",
-    "perishes",
-    "periwigs",
-    "perjured",
-    "perjurer",
-    "perjures",
-    "perkiest",
-    "permuted",
-    "permutes",
-    "pernancy",
-    "perorate",
-    "perpetuo",
-    "personam",
-    "perspire",
-    "perturbs",
-    "perusals",
-    "peskiest",
-    "pestered",
-    "petcocks",
-    "petering",
-    "peterlee",
-    "petioles",
-    "petitory",
-    "pettiest",
-    "pettifog",
-    "petulant",
-    "petunias",
-    "pevensey",
-    "pfennigs",
-    "phaetons",
-    "philters",
-    "philtres",
-    "phoniest",
-    "phosgene",
-    "phrygian",
-    "picadors",
-    "piccolos",
-    "pickaxes",
-    "picketed",
-    "pickiest",
-    "picklock",
-    "piddling",
-    "piecrust",
-    "piffling",
-    "pigskins",
-    "pigsties",
-    "pilaster",
-    "pilchard",
-    "pilfered",
-    "pilferer",
-    "pillaged",
-    "pillager",
-    "pillages",
-    "pillared",
-    "pillions",
-    "pimentos",
-    "pimiento",
-    "pinchers",
-    "pinheads",
-    "pinholes",
-    "pinioned",
-    "pinnaces",
-    "pintails",
-    "pinwales",
-    "piquancy",
-    "piracies",
-    "pirogues",
-    "pismires",
-    "pithiest",
-    "pitiable",
-    "pitiably",
-    "pitiless",
-    "pittance",
-    "placated",
-    "placates",
-    "placidly",
-    "placitum",
-    "plackets",
-    "plagiary",
-    "plainest",
-    "plaiting",
-    "plangent",
-    "planking",
-    "plashing",
-    "plastids",
-    "plastron",
-    "plateaux",
-    "plateful",
-    "platting",
-    "plaudits",
-    "playlets",
-    "playpens",
-    "pleaders",
-    "pleating",
-    "plebeian",
-    "plebeity",
-    "plectrum",
-    "pledgees",
-    "pledgors",
-    "pleonasm",
-    "plexuses",
-    "plighted",
-    "plimsoll",
-    "plodders",
-    "plonking",
-    "plopping",
-    "plosives",
-    "pluckier",
-    "pluckily",
-    "plumaged",
-    "plummier",
-    "plumpest",
-    "plumping",
-    "plunders",
-    "plungers",
-    "plunking",
-    "plushest",
-    "pluvious",
-    "pockmark",
-    "poetised",
-    "poetises",
-    "poetized",
-    "poetizes",
-    "poisoner",
-    "pokeweed",
-    "pokiness",
-    "polarise",
-    "polarize",
-    "polecats",
-    "polestar",
-    "politest",
-    "politick",
-    "polities",
-    "polkaing",
-    "polliwog",
-    "pollutes",
-    "pollywog",
-    "polonium",
-    "polperro",
-    "poltroon",
-    "polymath",
-    "polypoly",
-    "pomading",
-    "pomander",
-    "pompanos",
-    "pondweed",
-    "poniards",
-    "pontiffs",
-    "poolroom",
-    "poorness",
-    "popcorns",
-    "popinjay",
-    "popovers",
-    "poppadam",
-    "portages",
-    "portends",
-    "portents",
-    "porticos",
-    "portlier",
-    "positing",
-    "posology",
-    "posterns",
-    "postlist",
-    "postured",
-    "potables",
-    "potashes",
-    "potation",
-    "potbelly",
-    "potentia",
-    "potently",
-    "potestas",
-    "potherbs",
-    "pothooks",
-    "potlucks",
-    "potsherd",
-    "pottered",
-    "pottiest",
-    "pouching",
-    "poultice",
-    "pouncing",
-    "poundage",
-    "powwowed",
-    "praecipe",
-    "praedial",
-    "praetors",
-    "pralines",
-    "pranging",
-    "pratfall",
-    "prattled",
-    "prattles",
-    "precaria",
-    "precipes",
-    "predated",
-    "preemies",
-    "preening",
-    "prefaces",
-    "prefects",
-    "preheats",
-    "prejudge",
-    "prelates",
-    "premixes",
-    "premolar",
-    "prendres",
-    "prepense",
-    "preppies",
-    "prepuces",
-    "prequels",
-    "presaged",
-    "presages",
-    "presidia",
-    "pressers",
-    "pressmen",
-    "preterit",
-    "pretexts",
-    "pretties",
-    "prettify",
-    "prettily",
-    "priapism",
-    "priciest",
-    "pricking",
-    "prickled",
-    "prickles",
-    "priggish",
-    "primages",
-    "primmest",
-    "primness",
-    "primping",
-    "prioress",
-    "priories",
-    "prissier",
-    "prissily",
-    "probandi",
-    "probated",
-    "probates",
-    "probatum",
-    "procaine",
-    "procerus",
-    "prochain",
-    "prochein",
-    "proctors",
-    "procurer",
-    "procures",
-    "prodders",
-    "proditor",
-    "profaned",
-    "profanes",
-    "proffers",
-    "promisee",
-    "promisor",
-    "prompter",
-    "pronging",
-    "prophase",
-    "propound",
-    "proprius",
-    "prorates",
-    "prorogue",
-    "prosequi",
-    "prospers",
-    "prostyle",
-    "protract",
-    "provisor",
-    "provisos",
-    "provosts",
-    "prowlers",
-    "proximus",
-    "prurient",
-    "pryingly",
-    "psalmody",
-    "psalters",
-    "psaltery",
-    "psyching",
-    "ptomaine",
-    "pudendum",
-    "pudgiest",
-    "pudicity",
-    "puffball",
-    "puffiest",
-    "pugilism",
-    "pugilist",
-    "puissant",
-    "pullmans",
-    "pullouts",
-    "pulpiest",
-    "pulsated",
-    "pulsates",
-    "pulsator",
-    "pummeled",
-    "puncheon",
-    "punchers",
-    "pungency",
-    "puniness",
-    "punitory",
-    "punjabis",
-    "punsters",
-    "pupating",
-    "pupation",
-    "puppyish",
-    "purblind",
-    "pureeing",
-    "pureness",
-    "purlieus",
-    "purloins",
-    "purpling",
-    "purprise",
-    "purulent",
-    "purveyed",
-    "purviews",
-    "pushiest",
-    "pushover",
-    "pushpins",
-    "pustules",
-    "putridly",
-    "putsches",
-    "puttered",
-    "puttying",
-    "puzzlers",
-    "pyorrhea",
-    "pyrenean",
-    "quaalude",
-    "quacking",
-    "quadrate",
-    "quadroon",
-    "quaestio",
-    "quaestus",
-    "quaffing",
-    "quailing",
-    "quainter",
-    "quaintly",
-    "quarried",
-    "quartzes",
-    "quashing",
-    "quatrain",
-    "quavered",
-    "quayages",
-    "queasier",
-    "queasily",
-    "quebecer",
-    "queerest",
-    "queering",
-    "quelling",
-    "quencher",
-    "quenches",
-    "quenelle",
-    "quetzals",
-    "quibbled",
-    "quibbler",
-    "quickens",
-    "quietare",
-    "quietens",
-    "quieting",
-    "quietist",
-    "quincunx",
-    "quinines",
-    "quintals",
-    "quintets",
-    "quipping",
-    "quipster",
-    "quirkier",
-    "quirkily",
-    "quirking",
-    "quisling",
-    "quitrent",
-    "quitters",
-    "quivered",
-    "quonsets",
-    "quotably",
-    "rabelais",
-    "rabidity",
-    "raciness",
-    "racketed",
-    "radioing",
-    "radioman",
-    "radiomen",
-    "radiuses",
-    "raffling",
-    "raggedly",
-    "railcard",
-    "railcars",
-    "railhead",
-    "raillery",
-    "rainiest",
-    "rainless",
-    "rakishly",
-    "ramekins",
-    "ramified",
-    "ramifies",
-    "rampaged",
-    "rampages",
-    "rampancy",
-    "randiest",
-    "rangiest",
-    "rankling",
-    "ransacks",
-    "ransomed",
-    "rapacity",
-    "rapidest",
-    "raptures",
-    "rarebits",
-    "rarefied",
-    "rarefies",
-    "rareness",
-    "rascally",
-    "rashness",
-    "raspiest",
-    "rateably",
-    "rationed",
-    "rationes",
-    "ratlines",
-    "rattiest",
-    "ravaging",
-    "raveling",
-    "ravelled",
-    "ravening",
-    "raviolis",
-    "ravisher",
-    "ravishes",
-    "rawhides",
-    "reabsorb",
-    "readably",
-    "readapts",
-    "readiest",
-    "readmits",
-    "readopts",
-    "realigns",
-    "reallege",
-    "reallots",
-    "realness",
-    "realties",
-    "reargued",
-    "reargues",
-    "rearming",
-    "rearmost",
-    "reassume",
-    "reattach",
-    "reawaken",
-    "rebating",
-    "rebirths",
-    "rebooked",
-    "rebuking",
-    "reburial",
-    "reburied",
-    "reburies",
-    "rebutter",
-    "recanted",
-    "recapped",
-    "rechecks",
-    "recision",
-    "reckoner",
-    "reclaims",
-    "reclined",
-    "reclines",
-    "recluses",
-    "recodify",
-    "recoiled",
-    "recolors",
-    "recolour",
-    "recopied",
-    "recouped",
-    "recreant",
-    "recurred",
-    "recusant",
-    "recusing",
-    "redactor",
-    "redbrick",
-    "redcoats",
-    "reddenda",
-    "reddendo",
-    "redemise",
-    "redeploy",
-    "redlines",
-    "redolent",
-    "redouble",
-    "redoubts",
-    "redounds",
-    "redrafts",
-    "redshank",
-    "redstart",
-    "reductio",
-    "redwings",
-    "reediest",
-    "reedited",
-    "refitted",
-    "refolded",
-    "reforest",
-    "refracts",
-    "refrying",
-    "refueled",
-    "refuters",
-    "regaling",
-    "regicide",
-    "regrants",
-    "regrinds",
-    "reground",
-    "regroups",
-    "rehashed",
-    "rehashes",
-    "reheated",
-    "rehoused",
-    "rehouses",
-    "reifying",
-    "reimport",
-    "reinsert",
-    "reinsure",
-    "rejecter",
-    "rejigged",
-    "relaters",
-    "relators",
-    "relaxare",
-    "relearns",
-    "releasee",
-    "releasor",
-    "relegate",
-    "relining",
-    "remising",
-    "remittal",
-    "remittee",
-    "remitter",
-    "remittor",
-    "remolded",
-    "remoulds",
-    "remounts",
-    "reneging",
-    "renitent",
-    "rentable",
-    "rentages",
-    "rentiers",
-    "reoccupy",
-    "reorders",
-    "reorient",
-    "repaints",
-    "repining",
-    "replants",
-    "replevin",
-    "reposing",
-    "reprised",
-    "reprises",
-    "reproofs",
-    "reproved",
-    "reproves",
-    "repulses",
-    "reputing",
-    "requiems",
-    "requital",
-    "requited",
-    "requites",
-    "rescinds",
-    "rescript",
-    "resealed",
-    "resettle",
-    "reshapes",
-    "resiance",
-    "residuum",
-    "resifted",
-    "resignee",
-    "resinous",
-    "resister",
-    "resoling",
-    "resounds",
-    "respells",
-    "respired",
-    "respires",
-    "respites",
-    "restates",
-    "restocks",
-    "restyled",
-    "retailed",
-    "retaking",
-    "retarget",
-    "retching",
-    "rethinks",
-    "retinnae",
-    "retinues",
-    "retooled",
-    "retraced",
-    "retraces",
-    "retrains",
-    "retreads",
-    "retrench",
-    "retrials",
-    "retrying",
-    "returnee",
-    "retyping",
-    "revalued",
-    "revalues",
-    "reveille",
-    "reveling",
-    "revelled",
-    "reveller",
-    "revenant",
-    "revenged",
-    "revenges",
-    "revenuer",
-    "reveries",
-    "reverify",
-    "revering",
-    "reverter",
-    "revested",
-    "reviling",
-    "revisals",
-    "revisers",
-    "revisors",
-    "revivers",
-    "revivify",
-    "revivors",
-    "reworded",
-    "rhayader",
-    "rheostat",
-    "rhomboid",
-    "rhubarbs",
-    "ribaldry",
-    "ribbings",
-    "ribcages",
-    "riceland",
-    "ricottas",
-    "riddling",
-    "rievauxl",
-    "riffling",
-    "rigatoni",
-    "riggings",
-    "rigidify",
-    "ringlets",
-    "riposted",
-    "ripostes",
-    "riskiest",
-    "riskless",
-    "risottos",
-    "rissoles",
-    "ritually",
-    "ritziest",
-    "rivaling",
-    "rivalled",
-    "rivulets",
-    "roadwork",
-    "rocklike",
-    "roebucks",
-    "roentgen",
-    "rogation",
-    "rogatory",
-    "roisters",
-    "rollicks",
-    "rollmops",
-    "romanced",
-    "romancer",
-    "romanies",
-    "romanist",
-    "roofless",
-    "rooftree",
-    "roomette",
-    "roomfuls",
-    "roomiest",
-    "rootless",
-    "rosebuds",
-    "rosebush",
-    "rosining",
-    "rostrums",
-    "rotarian",
-    "rotaries",
-    "rotators",
-    "rotenone",
-    "rotifers",
-    "rottenly",
-    "rotundas",
-    "roughage",
-    "roughens",
-    "roughest",
-    "roughish",
-    "roulades",
-    "roundels",
-    "roundest",
-    "roundish",
-    "rousting",
-    "routings",
-    "rowboats",
-    "rowdiest",
-    "rowlocks",
-    "rubbings",
-    "rubbishy",
-    "rubdowns",
-    "rubicund",
-    "ruckuses",
-    "ructions",
-    "ruddiest",
-    "rudiment",
-    "ruefully",
-    "ruffians",
-    "ruffling",
-    "ruggedly",
-    "rummaged",
-    "rummager",
-    "rummages",
-    "rumoring",
-    "rumpling",
-    "rumpuses",
-    "runbacks",
-    "runniest",
-    "rusticum",
-    "rustiest",
-    "rustlers",
-    "rutabaga",
-    "rwandans",
-    "sabbaths",
-    "sabulosa",
-    "saccades",
-    "saccadic",
-    "sackings",
-    "sacraria",
-    "sacredly",
-    "sacristy",
-    "saddlers",
-    "saddling",
-    "saevitia",
-    "safeties",
-    "saguaros",
-    "saharans",
-    "salaamed",
-    "salacity",
-    "salcombe",
-    "salesian",
-    "saliency",
-    "salivate",
-    "sallower",
-    "sallying",
-    "saltburn",
-    "saltbush",
-    "saltiest",
-    "saltines",
-    "salvager",
-    "salvages",
-    "samarium",
-    "samisens",
-    "samovars",
-    "samurais",
-    "sanctums",
-    "sandarac",
-    "sandhogs",
-    "sandiest",
-    "saneness",
-    "sangrias",
-    "sanitise",
-    "sapience",
-    "sappiest",
-    "sashayed",
-    "sassiest",
-    "satchels",
-    "satiable",
-    "satiated",
-    "satiates",
-    "satinets",
-    "satirise",
-    "satirize",
-    "satsumas",
-    "sauciest",
-    "saunters",
-    "sauterne",
-    "savaging",
-    "saveable",
-    "saveloys",
-    "saviours",
-    "savories",
-    "savoured",
-    "sawbucks",
-    "scabbier",
-    "scabbing",
-    "scabious",
-    "scabrous",
-    "scalawag",
-    "scaliest",
-    "scallion",
-    "scalpels",
-    "scampers",
-    "scandium",
-    "scansion",
-    "scantier",
-    "scanting",
-    "scapulae",
-    "scapular",
-    "scapulas",
-    "scarcest",
-    "scarfing",
-    "scarpers",
-    "scarping",
-    "scattier",
-    "scatting",
-    "scavenge",
-    "scenting",
-    "scepters",
-    "sceptres",
-    "schemers",
-    "scherzos",
-    "schlepps",
-    "schmaltz",
-    "schmucks",
-    "schnooks",
-    "schussed",
-    "schusses",
-    "scienter",
-    "scilicet",
-    "scillies",
-    "scissile",
-    "scission",
-    "scoffers",
-    "scoffing",
-    "scofflaw",
-    "scooting",
-    "scorcher",
-    "scorches",
-    "scorings",
-    "scornful",
-    "scorning",
-    "scorpios",
-    "scotched",
-    "scotches",
-    "scotsmen",
-    "scotties",
-    "scourers",
-    "scourged",
-    "scourges",
-    "scowling",
-    "scraggly",
-    "scrammed",
-    "scrapple",
-    "screechy",
-    "screwier",
-    "scribers",
-    "scribing",
-    "scrimped",
-    "scriptae",
-    "scrofula",
-    "scrooges",
-    "scrotums",
-    "scrounge",
-    "scrummed",
-    "scrupled",
-    "scudding",
-    "scuffing",
-    "scuffled",
-    "scuffles",
-    "scullery",
-    "sculling",
-    "scullion",
-    "scuppers",
-    "scurried",
-    "scurries",
-    "scutters",
-    "scuttles",
-    "scything",
-    "seagoing",
-    "sealskin",
-    "sealyham",
-    "seamarks",
-    "seamiest",
-    "seaquake",
-    "seawalls",
-    "seawards",
-    "seceding",
-    "secludes",
-    "secretes",
-    "sectored",
-    "seculars",
-    "secundum",
-    "securers",
-    "securest",
-    "sedately",
-    "sedating",
-    "sedbergh",
-    "seducers",
-    "sedulity",
-    "sedulous",
-    "seedbeds",
-    "seedcase",
-    "seediest",
-    "seemlier",
-    "seesawed",
-    "segueing",
-    "seignior",
-    "seizable",
-    "selborne",
-    "selfhood",
-    "selfsame",
-    "sellable",
-    "seltzers",
-    "selvages",
-    "semitone",
-    "semolina",
-    "senility",
-    "sentries",
-    "sequoias",
-    "seraglio",
-    "seraphic",
-    "serbians",
-    "serenely",
-    "serenest",
-    "seriatim",
-    "serjeant",
-    "serments",
-    "sermones",
-    "servient",
-    "servitor",
-    "sestinas",
-    "settlors",
-    "sevenths",
-    "severest",
-    "sexiness",
-    "sexology",
-    "sextants",
-    "sextuple",
-    "shabbier",
-    "shabbily",
-    "shacking",
-    "shadiest",
-    "shadings",
-    "shafting",
-    "shaggier",
-    "shaggily",
-    "shakable",
-    "shakiest",
-    "shakings",
-    "shallops",
-    "shambled",
-    "shammies",
-    "shamming",
-    "shamuses",
-    "shandies",
-    "shanties",
-    "shantung",
-    "sharable",
-    "sharking",
-    "sharpies",
-    "shawnees",
-    "shearers",
-    "sheathes",
-    "shebeens",
-    "shedders",
-    "sheerest",
-    "sheering",
-    "sheikdom",
-    "shelduck",
-    "shellacs",
-    "shelties",
-    "sherbets",
-    "sherries",
-    "shiftier",
-    "shiftily",
-    "shimmied",
-    "shimmies",
-    "shimming",
-    "shinbone",
-    "shindigs",
-    "shingled",
-    "shiniest",
-    "shinnies",
-    "shinning",
-    "shipload",
-    "shipmate",
-    "shirkers",
-    "shirking",
-    "shirring",
-    "shirtier",
-    "shirting",
-    "shoaling",
-    "shoddier",
-    "shoddily",
-    "shoehorn",
-    "shoelace",
-    "shoeless",
-    "shoetree",
-    "shoplift",
-    "shortish",
-    "shouters",
-    "shoveled",
-    "showiest",
-    "shrewder",
-    "shrewdly",
-    "shrewish",
-    "shrilled",
-    "shriller",
-    "shrivels",
-    "shriving",
-    "shucking",
-    "shuddery",
-    "shushing",
-    "shuttled",
-    "shysters",
-    "sibilant",
-    "sicklier",
-    "sickroom",
-    "sideburn",
-    "sidecars",
-    "sidelong",
-    "sidewise",
-    "siegmund",
-    "siftings",
-    "sigillum",
-    "signally",
-    "silentio",
-    "silkiest",
-    "silliest",
-    "simonise",
-    "simonize",
-    "simpered",
-    "sincerer",
-    "sinecure",
-    "sinfully",
-    "singeing",
-    "singings",
-    "singsong",
-    "sinkable",
-    "sinology",
-    "sinusoid",
-    "siphoned",
-    "sirloins",
-    "siroccos",
-    "sisterly",
-    "situates",
-    "sixpenny",
-    "sixtieth",
-    "skewbald",
-    "skewered",
-    "skimpier",
-    "skimpily",
-    "skimping",
-    "skinners",
-    "skinnier",
-    "skirling",
-    "skitters",
-    "skittish",
-    "skivvies",
-    "skulking",
-    "skunking",
-    "skydived",
-    "skydiver",
-    "skydives",
-    "skyjacks",
-    "skylarks",
-    "skywards",
-    "slackens",
-    "slackest",
-    "slagging",
-    "slalomed",
-    "slanders",
-    "slanging",
-    "slattern",
-    "slavered",
-    "sleazier",
-    "sleazily",
-    "sleekest",
-    "sleeking",
-    "sleepier",
-    "sleeting",
-    "sleighed",
-    "sleights",
-    "sleuthed",
-    "slickest",
-    "slicking",
-    "slighted",
-    "slighter",
-    "slimiest",
-    "slimmest",
-    "slimness",
-    "slinkier",
-    "slinking",
-    "slipover",
-    "slipshod",
-    "slipways",
-    "slithers",
-    "slithery",
-    "slitters",
-    "slivered",
-    "slobbers",
-    "slobbery",
-    "slogging",
-    "sloppier",
-    "sloppily",
-    "slopping",
-    "sloshing",
-    "slothful",
-    "slouched",
-    "slouches",
-    "sloughed",
-    "slovenes",
-    "slovenly",
-    "slowpoke",
-    "slowworm",
-    "slugabed",
-    "sluggard",
-    "sluggers",
-    "sluicing",
-    "slumbers",
-    "slumlord",
-    "slumming",
-    "slurries",
-    "slurring",
-    "slushier",
-    "sluttish",
-    "smackers",
-    "smarmier",
-    "smartens",
-    "smarting",
-    "smatters",
-    "smellier",
-    "smidgens",
-    "smilaxes",
-    "smirched",
-    "smirches",
-    "smithery",
-    "smithies",
-    "smocking",
-    "smoggier",
-    "smokiest",
-    "smolders",
-    "smooched",
-    "smooches",
-    "smoothen",
-    "smoulder",
-    "smuggest",
-    "smuggles",
-    "smugness",
-    "smuttier",
-    "smutting",
-    "snaefell",
-    "snaffled",
-    "snaffles",
-    "snakiest",
-    "snapback",
-    "snappier",
-    "snappily",
-    "snappish",
-    "snatcher",
-    "snazzier",
-    "sneakier",
-    "sneakily",
-    "sniffled",
-    "sniffles",
-    "snifters",
-    "sniggers",
-    "snippety",
-    "snippier",
-    "snipping",
-    "snitched",
-    "snitcher",
-    "snitches",
-    "sniveled",
-    "snobbish",
-    "snobbism",
-    "snookers",
-    "snoopers",
-    "snoopier",
-    "snoopily",
-    "snootier",
-    "snootily",
-    "snoozing",
-    "snottier",
-    "snottily",
-    "snowdrop",
-    "snowiest",
-    "snubbing",
-    "snuffbox",
-    "snuffers",
-    "snuffing",
-    "snuffled",
-    "snuffles",
-    "snuggery",
-    "snuggest",
-    "snuggles",
-    "snugness",
-    "soakaway",
-    "soakings",
-    "soapiest",
-    "soapsuds",
-    "soapwort",
-    "soberest",
-    "socagers",
-    "sociably",
-    "societas",
-    "sockeyes",
-    "sodality",
-    "sodomise",
-    "sodomite",
-    "sodomize",
-    "soggiest",
-    "sojourns",
-    "solacing",
-    "solatium",
-    "solderer",
-    "soldiery",
-    "solecism",
-    "solemner",
-    "solidary",
-    "solidest",
-    "solidums",
-    "solvated",
-    "solvates",
-    "solvitur",
-    "somberly",
-    "sombrely",
-    "songfest",
-    "songster",
-    "sonority",
-    "sootiest",
-    "sophisms",
-    "sophists",
-    "soppiest",
-    "sordidly",
-    "sorehead",
-    "sorghums",
-    "sorriest",
-    "sorrowed",
-    "soughing",
-    "soundest",
-    "soupiest",
-    "sourness",
-    "sourpuss",
-    "spacemen",
-    "spandrel",
-    "spangles",
-    "spankers",
-    "sparerib",
-    "sparkler",
-    "sparsest",
-    "spastics",
-    "spatters",
-    "spavined",
-    "spearing",
-    "specking",
-    "speckles",
-    "spectate",
-    "specters",
-    "spectres",
-    "speeders",
-    "spellers",
-    "sphenoid",
-    "spheroid",
-    "sphinxes",
-    "spiciest",
-    "spieling",
-    "spiffier",
-    "spikiest",
-    "spindled",
-    "spiniest",
-    "spinouts",
-    "spiracle",
-    "spiraled",
-    "spirally",
-    "spirants",
-    "spittoon",
-    "splaying",
-    "splodges",
-    "splotchy",
-    "splurged",
-    "splurges",
-    "splutter",
-    "spondaic",
-    "spondees",
-    "spongers",
-    "spongier",
-    "sponging",
-    "sponsion",
-    "spookier",
-    "spookily",
-    "spooking",
-    "spoolers",
-    "spooning",
-    "sportier",
-    "sportily",
-    "spottier",
-    "spottily",
-    "sprigged",
-    "sprinted",
-    "spritzer",
-    "sprucely",
-    "sprucing",
-    "spunkier",
-    "spurning",
-    "spurting",
-    "sputniks",
-    "sputters",
-    "squalled",
-    "squarest",
-    "squashes",
-    "squawked",
-    "squeaked",
-    "squealer",
-    "squeezer",
-    "squelchy",
-    "squiggle",
-    "squiggly",
-    "squinted",
-    "squinter",
-    "squiring",
-    "squirmed",
-    "squirted",
-    "squished",
-    "squishes",
-    "stabiles",
-    "stabling",
-    "stagnate",
-    "staithes",
-    "stallage",
-    "stammers",
-    "stanched",
-    "stanches",
-    "standees",
-    "stannous",
-    "starched",
-    "starkers",
-    "starkest",
-    "starrier",
-    "startles",
-    "stashing",
-    "statists",
-    "statures",
-    "steadied",
-    "steadier",
-    "steadies",
-    "stealers",
-    "steamier",
-    "steamily",
-    "steatite",
-    "steelier",
-    "steeling",
-    "steenbok",
-    "steeping",
-    "steeples",
-    "steerers",
-    "stemmata",
-    "stenches",
-    "stepsons",
-    "sternest",
-    "sternums",
-    "stetsons",
-    "stetting",
-    "stibnite",
-    "stickier",
-    "stickups",
-    "stiffens",
-    "stiffest",
-    "stillest",
-    "stilling",
-    "stingier",
-    "stingily",
-    "stinkers",
-    "stinkpot",
-    "stinting",
-    "stippled",
-    "stipples",
-    "stockier",
-    "stockmen",
-    "stodgier",
-    "stodgily",
-    "stoicism",
-    "stolidly",
-    "stoniest",
-    "stooging",
-    "stopcock",
-    "stormier",
-    "stormily",
-    "strafing",
-    "straggle",
-    "straggly",
-    "straiten",
-    "stratify",
-    "streaker",
-    "strewing",
-    "stridden",
-    "stripier",
-    "strophes",
-    "strophic",
-    "stropped",
-    "strudels",
-    "strummed",
-    "strumpet",
-    "strutted",
-    "stubbier",
-    "stubbing",
-    "stuccoed",
-    "stuccoes",
-    "studding",
-    "stuffier",
-    "stuffily",
-    "stultify",
-    "stumpage",
-    "stumping",
-    "stunners",
-    "stuntmen",
-    "stupider",
-    "sturdier",
-    "sturdily",
-    "stutters",
-    "stylises",
-    "styluses",
-    "styptics",
-    "styrenes",
-    "subagent",
-    "subduing",
-    "subfloor",
-    "subheads",
-    "subhuman",
-    "subjoins",
-    "sublimed",
-    "sublimes",
-    "submerse",
-    "suborned",
-    "suborner",
-    "subphyla",
-    "subsists",
-    "subsumes",
-    "subtends",
-    "subtexts",
-    "subtlest",
-    "subtonic",
-    "subverts",
-    "succored",
-    "succours",
-    "suchlike",
-    "suckered",
-    "suctions",
-    "suffixed",
-    "suffused",
-    "suffuses",
-    "sugaring",
-    "sukiyaki",
-    "sulfites",
-    "sulfured",
-    "sulkiest",
-    "sullener",
-    "sullenly",
-    "sullying",
-    "sulphite",
-    "sulphurs",
-    "sultanas",
-    "sultrier",
-    "sultrily",
-    "sumatran",
-    "sumburgh",
-    "summated",
-    "summates",
-    "summered",
-    "summitry",
-    "sunbaked",
-    "sunbathe",
-    "sunbeams",
-    "sunburns",
-    "sunburnt",
-    "sundered",
-    "sunniest",
-    "sunshiny",
-    "superego",
-    "supermen",
-    "supernal",
-    "supinely",
-    "supplest",
-    "surcease",
-    "sureness",
-    "surfeits",
-    "surliest",
-    "surmises",
-    "surmount",
-    "surnamed",
-    "surplice",
-    "surtaxes",
-    "suturing",
-    "suzerain",
-    "suzettes",
-    "swabbing",
-    "swaddled",
-    "swaddles",
-    "swaggers",
-    "swamping",
-    "swanlike",
-    "swanning",
-    "swathing",
-    "swatters",
-    "swatting",
-    "sweatier",
-    "sweetens",
-    "sweetish",
-    "swelters",
-    "swerving",
-    "swiftest",
-    "swigging",
-    "swilling",
-    "swindled",
-    "swindler",
-    "swindles",
-    "swishing",
-    "swissair",
-    "swiveled",
-    "swizzles",
-    "swooning",
-    "swopping",
-    "swotting",
-    "sybarite",
-    "syllabic",
-    "syllabub",
-    "syncline",
-    "syngraph",
-    "syringed",
-    "systoles",
-    "szechwan",
-    "tabooing",
-    "taciturn",
-    "tackiest",
-    "tacklers",
-    "taconite",
-    "tactless",
-    "taffetas",
-    "tagalong",
-    "tailbone",
-    "tailcoat",
-    "tailwind",
-    "tainting",
-    "takeoffs",
-    "talesman",
-    "talesmen",
-    "talionis",
-    "tallages",
-    "tallboys",
-    "tallness",
-    "talyllyn",
-    "tamarisk",
-    "tambours",
-    "tameable",
-    "tameness",
-    "tanagers",
-    "tangelos",
-    "tangency",
-    "tangibly",
-    "tangiers",
-    "tangiest",
-    "tangling",
-    "tangoing",
-    "tankages",
-    "tankfuls",
-    "tantalus",
-    "tapiocas",
-    "taprooms",
-    "taproots",
-    "tardiest",
-    "tarlatan",
-    "tarrying",
-    "tarsiers",
-    "tartaric",
-    "tartlets",
-    "tartness",
-    "taskwork",
-    "tasseled",
-    "tastiest",
-    "tattiest",
-    "tattlers",
-    "tattling",
-    "tautened",
-    "tautness",
-    "taverner",
-    "tawdrier",
-    "tawdrily",
-    "tawniest",
-    "taxingly",
-    "teacakes",
-    "teakwood",
-    "tearaway",
-    "tearless",
-    "teaseled",
-    "teashops",
-    "teeniest",
-    "teetered",
-    "teetotal",
-    "tektites",
-    "televise",
-    "telexing",
-    "temerity",
-    "tempests",
-    "templets",
-    "temporis",
-    "tempters",
-    "tempuras",
-    "tenanted",
-    "tenendum",
-    "tepidity",
-    "tequilas",
-    "terminer",
-    "terminum",
-    "termless",
-    "terrines",
-    "testandi",
-    "testatum",
-    "testatus",
-    "testiest",
-    "tetchier",
-    "tetrarch",
-    "thatches",
-    "theocrat",
-    "theorise",
-    "thermion",
-    "thickset",
-    "thievish",
-    "thirsted",
-    "thoraces",
-    "thoraxes",
-    "thornaby",
-    "thornier",
-    "thraldom",
-    "thrashes",
-    "threnody",
-    "threshed",
-    "threshes",
-    "throbbed",
-    "thronged",
-    "thrummed",
-    "thrushes",
-    "thruways",
-    "thudding",
-    "thumbnut",
-    "thwacked",
-    "thymuses",
-    "thyroids",
-    "thyroxin",
-    "tiddlers",
-    "tideland",
-    "tidemark",
-    "tidesmen",
-    "tidiness",
-    "tightwad",
-    "timbales",
-    "timelier",
-    "timeworn",
-    "timorous",
-    "tinewald",
-    "tingeing",
-    "tinhorns",
-    "tinkered",
-    "tinkerer",
-    "tinniest",
-    "tinseled",
-    "tinselly",
-    "tinsmith",
-    "tintagel",
-    "tintypes",
-    "tipplers",
-    "tippling",
-    "tipsiest",
-    "tipstaff",
-    "tipsters",
-    "titivate",
-    "titlarks",
-    "titmouse",
-    "tittered",
-    "toadfish",
-    "toadflax",
-    "toadying",
-    "toadyism",
-    "toccatas",
-    "toddling",
-    "toilsome",
-    "tokenism",
-    "tollages",
-    "tollgate",
-    "tomalley",
-    "tomblike",
-    "toneless",
-    "tonguing",
-    "tonsured",
-    "tonsures",
-    "tontines",
-    "toothier",
-    "toothily",
-    "tootling",
-    "topcoats",
-    "topmasts",
-    "toponymy",
-    "topsails",
-    "topsides",
-    "torching",
-    "torpidly",
-    "torridge",
-    "torridly",
-    "torshavn",
-    "torturer",
-    "totalise",
-    "totalize",
-    "tottered",
-    "touchier",
-    "toughens",
-    "toughies",
-    "toughing",
-    "tousling",
-    "towboats",
-    "toweling",
-    "towelled",
-    "towheads",
-    "towlines",
-    "townsman",
-    "towpaths",
-    "towropes",
-    "toxaemia",
-    "toxaemic",
-    "toxicant",
-    "toxified",
-    "toxifies",
-    "toyshops",
-    "tracheae",
-    "trachoma",
-    "tracings",
-    "traditio",
-    "traduced",
-    "traducer",
-    "traduces",
-    "traffics",
-    "tragical",
-    "traipsed",
-    "traipses",
-    "traminer",
-    "tramline",
-    "trammels",
-    "tramples",
-    "tramroad",
-    "tramways",
-    "transept",
-    "transfix",
-    "tranship",
-    "transire",
-    "transitu",
-    "transoms",
-    "trapezes",
-    "trappist",
-    "trashier",
-    "traumata",
-    "treadgar",
-    "treadles",
-    "trebling",
-    "treelike",
-    "trefoils",
-    "tregaron",
-    "trembler",
-    "trembles",
-    "tremolos",
-    "trenched",
-    "trencher",
-    "trendier",
-    "trendies",
-    "trephine",
-    "trestles",
-    "tribally",
-    "tribunes",
-    "trichina",
-    "trickily",
-    "trickles",
-    "tridents",
-    "triennia",
-    "triflers",
-    "trifocal",
-    "trigging",
-    "triglyph",
-    "trigonal",
-    "trilbies",
-    "trilling",
-    "trimaran",
-    "trimmest",
-    "trimness",
-    "trippers",
-    "triremes",
-    "trisects",
-    "trishaws",
-    "triumvir",
-    "trochees",
-    "trollops",
-    "tromping",
-    "trooping",
-    "trounced",
-    "trounces",
-    "troupers",
-    "trouping",
-    "truanted",
-    "truckled",
-    "truckles",
-    "truckman",
-    "truckmen",
-    "trudging",
-    "trueness",
-    "trumpery",
-    "trumping",
-    "trundled",
-    "trundles",
-    "trussing",
-    "trustful",
-    "trustier",
-    "trusties",
-    "trustors",
-    "tryingly",
-    "tsarinas",
-    "tsarists",
-    "tuataras",
-    "tubbiest",
-    "tubercle",
-    "tuberose",
-    "tuckered",
-    "tugboats",
-    "tumbrels",
-    "tumorous",
-    "tuneable",
-    "tuneless",
-    "tunnages",
-    "tuppence",
-    "turbaned",
-    "turbidly",
-    "turbofan",
-    "turbojet",
-    "turgidly",
-    "turncoat",
-    "turnings",
-    "turnkeys",
-    "turreted",
-    "tussling",
-    "tussocks",
-    "tutelary",
-    "tutrices",
-    "tuxedoed",
-    "tuxedoes",
-    "twanging",
-    "tweedier",
-    "tweeting",
-    "tweezing",
-    "twelfths",
-    "twiddled",
-    "twiddles",
-    "twigging",
-    "twilling",
-    "twinkled",
-    "twinkles",
-    "twirlers",
-    "twitcher",
-    "twitches",
-    "twitters",
-    "twitting",
-    "twosomes",
-    "tympanum",
-    "typecast",
-    "typesets",
-    "typifies",
-    "tyrolese",
-    "uberrima",
-    "ugandans",
-    "ukuleles",
-    "ulcerate",
-    "ulcerous",
-    "ultimata",
-    "ultraism",
-    "ululated",
-    "ululates",
-    "umbilici",
-    "umlauted",
-    "umpirage",
-    "unagreed",
-    "unamused",
-    "unatoned",
-    "unaverse",
-    "unawares",
-    "unbacked",
-    "unbanked",
-    "unbarred",
-    "unbelted",
-    "unbidden",
-    "unbilled",
-    "unbitten",
-    "unblocks",
-    "unbolted",
-    "unbought",
-    "unbridle",
-    "unbuckle",
-    "unbundle",
-    "unburden",
-    "unburied",
-    "unburned",
-    "unbutton",
-    "uncashed",
-    "uncaught",
-    "uncaused",
-    "unchains",
-    "unchaste",
-    "unclasps",
-    "unclench",
-    "unclosed",
-    "uncloses",
-    "unclothe",
-    "uncoiled",
-    "uncombed",
-    "uncooled",
-    "uncopied",
-    "uncouple",
-    "unctuous",
-    "uncurled",
-    "uncurved",
-    "underbid",
-    "underfed",
-    "underlet",
-    "underpay",
-    "undimmed",
-    "undoable",
-    "undocked",
-    "undraped",
-    "undrapes",
-    "undreamt",
-    "undulant",
-    "undulate",
-    "unearths",
-    "uneasier",
-    "unenvied",
-    "unerased",
-    "uneroded",
-    "unerring",
-    "unfasten",
-    "unfenced",
-    "unfitted",
-    "unflawed",
-    "unformed",
-    "unfreeze",
-    "unfrocks",
-    "unfrozen",
-    "unfurled",
-    "ungainly",
-    "ungifted",
-    "unglazed",
-    "ungluing",
-    "unguents",
-    "unguided",
-    "ungulate",
-    "unhanded",
-    "unhealed",
-    "unheeded",
-    "unhidden",
-    "unhinges",
-    "unhooked",
-    "unhorsed",
-    "unhorses",
-    "unifiers",
-    "unionise",
-    "unionize",
-    "unironed",
-    "unitised",
-    "unitises",
-    "unitized",
-    "unitizes",
-    "univalve",
-    "univocal",
-    "unjudged",
-    "unkindly",
-    "unkissed",
-    "unlacing",
-    "unlashed",
-    "unlashes",
-    "unlearns",
-    "unlearnt",
-    "unlimber",
-    "unloosed",
-    "unloosen",
-    "unlooses",
-    "unlovely",
-    "unloving",
-    "unmaking",
-    "unmapped",
-    "unmarred",
-    "unmelted",
-    "unmended",
-    "unmeshed",
-    "unmoving",
-    "unnerved",
-    "unnerves",
-    "unpadded",
-    "unpicked",
-    "unpinned",
-    "unplaced",
-    "unpooled",
-    "unpriced",
-    "unprimed",
-    "unproved",
-    "unpumped",
-    "unpurged",
-    "unreason",
-    "unreeled",
-    "unrhymed",
-    "unrifled",
-    "unrolled",
-    "unrulier",
-    "unsaddle",
-    "unsaying",
-    "unscaled",
-    "unscrews",
-    "unseated",
-    "unseeing",
-    "unsettle",
-    "unsexing",
-    "unshaded",
-    "unshaken",
-    "unshaped",
-    "unsliced",
-    "unsnarls",
-    "unsocial",
-    "unsoiled",
-    "unsolder",
-    "unsolemn",
-    "unsought",
-    "unstaged",
-    "unsticks",
-    "unstraps",
-    "unstring",
-    "unstuffy",
-    "unsubtle",
-    "untaught",
-    "untended",
-    "unthawed",
-    "unthread",
-    "unthrift",
-    "untidier",
-    "untidily",
-    "untiring",
-    "untruths",
-    "untwists",
-    "unvalued",
-    "unversed",
-    "unviewed",
-    "unvoiced",
-    "unwarily",
-    "unwarmed",
-    "unwasted",
-    "unwedded",
-    "unweeded",
-    "unwiring",
-    "unwisely",
-    "unwonted",
-    "unworked",
-    "unyoking",
-    "upbraids",
-    "upchucks",
-    "upending",
-    "upholder",
-    "upraised",
-    "upraises",
-    "upstaged",
-    "upstages",
-    "upstroke",
-    "upsurges",
-    "upsweeps",
-    "upswings",
-    "upthrust",
-    "uptrends",
-    "urbanely",
-    "urbanise",
-    "urbanist",
-    "urbanite",
-    "urbanity",
-    "urbanize",
-    "urethras",
-    "urinated",
-    "urinates",
-    "usufruct",
-    "usurious",
-    "usurpers",
-    "uteruses",
-    "utilizer",
-    "utopians",
-    "uxorious",
-    "vacantly",
-    "vacentia",
-    "vacuumed",
-    "vaginnae",
-    "vagrancy",
-    "vagrants",
-    "vainness",
-    "valences",
-    "valiancy",
-    "valorise",
-    "valorize",
-    "valorous",
-    "valuably",
-    "valuated",
-    "valuates",
-    "valuator",
-    "vamoosed",
-    "vamooses",
-    "vanillas",
-    "vanillin",
-    "vantages",
-    "vapidity",
-    "vaporise",
-    "vaporize",
-    "vaporous",
-    "vaqueros",
-    "variedly",
-    "variorum",
-    "varitype",
-    "varmints",
-    "vatersay",
-    "vaunting",
-    "vavasors",
-    "vavasour",
-    "vectored",
-    "vedettes",
-    "vegetate",
-    "venality",
-    "venation",
-    "vendible",
-    "veneered",
-    "venerate",
-    "veneries",
-    "venially",
-    "ventiane",
-    "venusian",
-    "verandas",
-    "verbenas",
-    "verdancy",
-    "verderer",
-    "verderor",
-    "verities",
-    "vermeils",
-    "vernally",
-    "verrucae",
-    "versants",
-    "vertexes",
-    "vervains",
-    "vestigia",
-    "vestment",
-    "vestries",
-    "vexation",
-    "vexingly",
-    "viaducts",
-    "viaticum",
-    "vibrated",
-    "vibratos",
-    "vicarial",
-    "vicelike",
-    "viceroys",
-    "victuals",
-    "vietminh",
-    "viewdata",
-    "viewless",
-    "vileness",
-    "vilifies",
-    "vindaloo",
-    "vinegary",
-    "violable",
-    "violists",
-    "viperous",
-    "viragoes",
-    "virgules",
-    "viricide",
-    "virtuosi",
-    "viselike",
-    "visitant",
-    "vitalise",
-    "vitalize",
-    "vitiated",
-    "vitiates",
-    "vivacity",
-    "vivaries",
-    "vivarium",
-    "vivified",
-    "vivifies",
-    "vivisect",
-    "vocabula",
-    "vocalise",
-    "vocalism",
-    "vocalize",
-    "vocative",
-    "voidable",
-    "voidance",
-    "volcanos",
-    "volendam",
-    "volitive",
-    "volleyed",
-    "voracity",
-    "vortexes",
-    "votaries",
-    "vouchees",
-    "vouching",
-    "voyaging",
-    "vulgarly",
-    "vulgates",
-    "wackiest",
-    "waddling",
-    "waffling",
-    "wageless",
-    "waggling",
-    "wagonage",
-    "wagtails",
-    "wainable",
-    "wainages",
-    "wainscot",
-    "wakening",
-    "walkover",
-    "walleyed",
-    "walleyes",
-    "walloped",
-    "wallowed",
-    "walruses",
-    "wangling",
-    "wanstead",
-    "wantonly",
-    "warbling",
-    "wardress",
-    "wardroom",
-    "wardship",
-    "warhorse",
-    "wariness",
-    "warmness",
-    "warpages",
-    "warpaths",
-    "warplane",
-    "warranto",
-    "warthogs",
-    "washbowl",
-    "washings",
-    "washouts",
-    "wassails",
-    "wastrels",
-    "waterier",
-    "waveband",
-    "wavelike",
-    "waviness",
-    "waxwings",
-    "waxworks",
-    "waybills",
-    "waygoing",
-    "waymarks",
-    "waysides",
-    "weakfish",
-    "weakling",
-    "weariest",
-    "wearying",
-    "weaseled",
-    "weavings",
-    "weediest",
-    "weeniest",
-    "weepiest",
-    "weighage",
-    "weirdoes",
-    "welchers",
-    "wellnigh",
-    "welshman",
-    "welshmen",
-    "weltered",
-    "wergilds",
-    "wetbacks",
-    "wettings",
-    "whamming",
-    "wharfing",
-    "whatnots",
-    "wheatear",
-    "wheedled",
-    "wheedler",
-    "wheedles",
-    "wheelies",
-    "wheezier",
-    "whelping",
-    "wherefor",
-    "whetting",
-    "whiffing",
-    "whimpers",
-    "whimsies",
-    "whinging",
-    "whiniest",
-    "whinnied",
-    "whinnies",
-    "whipcord",
-    "whippets",
-    "whipsaws",
-    "whirring",
-    "whiskery",
-    "whiskeys",
-    "whisking",
-    "whitecap",
-    "whitened",
-    "whiteout",
-    "whitings",
-    "whittled",
-    "whittler",
-    "whittles",
-    "whizzing",
-    "whooshed",
-    "whooshes",
-    "wickeder",
-    "wideness",
-    "widgeons",
-    "widowing",
-    "wielders",
-    "wigmaker",
-    "wiliness",
-    "winching",
-    "windbags",
-    "windburn",
-    "windiest",
-    "windless",
-    "windpipe",
-    "windrows",
-    "windsock",
-    "wineskin",
-    "winkling",
-    "winnable",
-    "winnowed",
-    "wintered",
-    "wiriness",
-    "wiseacre",
-    "wistaria",
-    "wittiest",
-    "wizening",
-    "wobblier",
-    "wolframs",
-    "womanise",
-    "womanish",
-    "womanize",
-    "wonkiest",
-    "woodenly",
-    "woodiest",
-    "woodpile",
-    "woodshed",
-    "woodsmen",
-    "woodworm",
-    "woodyard",
-    "woollens",
-    "woollier",
-    "woollies",
-    "wooziest",
-    "wordbook",
-    "wordiest",
-    "wordings",
-    "workably",
-    "workaday",
-    "workmate",
-    "wormiest",
-    "worriers",
-    "worsteds",
-    "worthier",
-    "worthies",
-    "worthily",
-    "wracking",
-    "wrangled",
-    "wrangles",
-    "wrathful",
-    "wreathed",
-    "wreathes",
-    "wretches",
-    "wriggled",
-    "wriggles",
-    "wringers",
-    "wronging",
-    "xeroxing",
-    "yachters",
-    "yammered",
-    "yarmulke",
-    "yeomanry",
-    "yeshivas",
-    "yodeling",
-    "yodelled",
-    "yodeller",
-    "yoghourt",
-    "yoghurts",
-    "youngish",
-    "yummiest",
-    "zairians",
-    "zambians",
-    "zealotry",
-    "zibeline",
-    "ziggurat",
-    "zippiest",
-    "zoophyte",
-    "zoospore",
-    "zwieback",
-    "zymology",
-]
@@ -1,4032 +0,0 @@
-WORDS = [
-    "that",
-    "this",
-    "with",
-    "from",
-    "your",
-    "have",
-    "more",
-    "will",
-    "home",
-    "page",
-    "free",
-    "time",
-    "they",
-    "site",
-    "what",
-    "news",
-    "only",
-    "when",
-    "here",
-    "also",
-    "help",
-    "view",
-    "been",
-    "were",
-    "some",
-    "like",
-    "than",
-    "find",
-    "date",
-    "back",
-    "list",
-    "name",
-    "just",
-    "over",
-    "year",
-    "into",
-    "next",
-    "used",
-    "work",
-    "last",
-    "most",
-    "data",
-    "make",
-    "them",
-    "post",
-    "city",
-    "such",
-    "best",
-    "then",
-    "good",
-    "well",
-    "info",
-    "high",
-    "each",
-    "very",
-    "book",
-    "read",
-    "need",
-    "many",
-    "user",
-    "said",
-    "does",
-    "mail",
-    "full",
-    "life",
-    "know",
-    "days",
-    "part",
-    "real",
-    "item",
-    "must",
-    "made",
-    "line",
-    "send",
-    "type",
-    "take",
-    "area",
-    "want",
-    "long",
-    "code",
-    "show",
-    "even",
-    "much",
-    "sign",
-    "file",
-    "link",
-    "open",
-    "case",
-    "same",
-    "both",
-    "game",
-    "care",
-    "down",
-    "size",
-    "shop",
-    "text",
-    "rate",
-    "form",
-    "love",
-    "john",
-    "main",
-    "call",
-    "save",
-    "card",
-    "jobs",
-    "food",
-    "sale",
-    "teen",
-    "room",
-    "join",
-    "west",
-    "look",
-    "left",
-    "team",
-    "week",
-    "note",
-    "live",
-    "plan",
-    "cost",
-    "test",
-    "come",
-    "cart",
-    "play",
-    "less",
-    "blog",
-    "park",
-    "side",
-    "give",
-    "sell",
-    "body",
-    "east",
-    "club",
-    "road",
-    "gift",
-    "hard",
-    "four",
-    "blue",
-    "easy",
-    "star",
-    "hand",
-    "keep",
-    "porn",
-    "baby",
-    "term",
-    "film",
-    "head",
-    "cell",
-    "self",
-    "away",
-    "once",
-    "sure",
-    "cars",
-    "tell",
-    "able",
-    "gold",
-    "arts",
-    "past",
-    "five",
-    "upon",
-    "says",
-    "land",
-    "done",
-    "ever",
-    "word",
-    "bill",
-    "talk",
-    "nude",
-    "kids",
-    "true",
-    "else",
-    "mark",
-    "rock",
-    "tips",
-    "plus",
-    "auto",
-    "edit",
-    "fast",
-    "fact",
-    "unit",
-    "tech",
-    "meet",
-    "feel",
-    "bank",
-    "risk",
-    "town",
-    "girl",
-    "toys",
-    "golf",
-    "loan",
-    "wide",
-    "sort",
-    "half",
-    "step",
-    "none",
-    "lake",
-    "fire",
-    "chat",
-    "loss",
-    "face",
-    "base",
-    "near",
-    "stay",
-    "turn",
-    "mean",
-    "king",
-    "copy",
-    "drug",
-    "pics",
-    "cash",
-    "seen",
-    "port",
-    "stop",
-    "soon",
-    "held",
-    "mind",
-    "lost",
-    "tour",
-    "menu",
-    "hope",
-    "wish",
-    "role",
-    "came",
-    "fine",
-    "hour",
-    "bush",
-    "huge",
-    "kind",
-    "move",
-    "logo",
-    "nice",
-    "sent",
-    "band",
-    "lead",
-    "went",
-    "mode",
-    "fund",
-    "male",
-    "took",
-    "song",
-    "late",
-    "fall",
-    "idea",
-    "tool",
-    "hill",
-    "maps",
-    "deal",
-    "hold",
-    "safe",
-    "feed",
-    "hall",
-    "anti",
-    "ship",
-    "paid",
-    "hair",
-    "anal",
-    "tree",
-    "thus",
-    "wall",
-    "wine",
-    "vote",
-    "ways",
-    "rule",
-    "told",
-    "feet",
-    "sexy",
-    "door",
-    "cool",
-    "uses",
-    "java",
-    "pass",
-    "fees",
-    "skin",
-    "ring",
-    "boys",
-    "deep",
-    "rest",
-    "pool",
-    "mini",
-    "fish",
-    "pack",
-    "born",
-    "race",
-    "rape",
-    "debt",
-    "core",
-    "sets",
-    "wood",
-    "rent",
-    "dark",
-    "host",
-    "fair",
-    "gets",
-    "dead",
-    "mike",
-    "trip",
-    "poor",
-    "eyes",
-    "farm",
-    "lord",
-    "hear",
-    "goes",
-    "wife",
-    "hits",
-    "zone",
-    "jack",
-    "flat",
-    "flow",
-    "path",
-    "laws",
-    "skip",
-    "diet",
-    "army",
-    "gear",
-    "lots",
-    "firm",
-    "jump",
-    "ball",
-    "goal",
-    "sold",
-    "wind",
-    "palm",
-    "pain",
-    "oral",
-    "ford",
-    "edge",
-    "root",
-    "pink",
-    "shot",
-    "cold",
-    "foot",
-    "mass",
-    "heat",
-    "wild",
-    "miss",
-    "task",
-    "soft",
-    "fuel",
-    "walk",
-    "fuck",
-    "wait",
-    "rose",
-    "pick",
-    "load",
-    "tags",
-    "guys",
-    "cock",
-    "drop",
-    "rich",
-    "seem",
-    "hire",
-    "gave",
-    "ones",
-    "tits",
-    "rank",
-    "died",
-    "inch",
-    "snow",
-    "camp",
-    "fill",
-    "gone",
-    "fort",
-    "gene",
-    "disc",
-    "boat",
-    "icon",
-    "ends",
-    "cast",
-    "felt",
-    "soul",
-    "aids",
-    "flag",
-    "atom",
-    "iron",
-    "void",
-    "disk",
-    "desk",
-    "hong",
-    "vice",
-    "duty",
-    "bear",
-    "gain",
-    "lack",
-    "knew",
-    "zoom",
-    "blow",
-    "clip",
-    "wire",
-    "tape",
-    "spam",
-    "acid",
-    "cent",
-    "null",
-    "zero",
-    "roll",
-    "bath",
-    "font",
-    "beta",
-    "fail",
-    "jazz",
-    "bags",
-    "wear",
-    "rare",
-    "bars",
-    "dual",
-    "rise",
-    "bird",
-    "lady",
-    "fans",
-    "dell",
-    "seat",
-    "bids",
-    "toll",
-    "cape",
-    "mine",
-    "whom",
-    "math",
-    "dogs",
-    "moon",
-    "fear",
-    "wars",
-    "kept",
-    "beat",
-    "arms",
-    "hide",
-    "slow",
-    "nine",
-    "spot",
-    "grow",
-    "rain",
-    "onto",
-    "diff",
-    "bass",
-    "hole",
-    "pets",
-    "ride",
-    "pair",
-    "runs",
-    "yeah",
-    "evil",
-    "euro",
-    "peak",
-    "dick",
-    "salt",
-    "bell",
-    "lane",
-    "kill",
-    "ages",
-    "plug",
-    "cook",
-    "bike",
-    "lose",
-    "seek",
-    "tony",
-    "kits",
-    "soil",
-    "matt",
-    "exit",
-    "keys",
-    "wave",
-    "holy",
-    "acts",
-    "mesh",
-    "dean",
-    "poll",
-    "bond",
-    "jean",
-    "visa",
-    "pure",
-    "hell",
-    "lens",
-    "draw",
-    "warm",
-    "suck",
-    "babe",
-    "crew",
-    "legs",
-    "rear",
-    "node",
-    "lock",
-    "mile",
-    "bowl",
-    "tank",
-    "navy",
-    "dish",
-    "slot",
-    "gray",
-    "demo",
-    "hate",
-    "rice",
-    "loop",
-    "vary",
-    "milk",
-    "boot",
-    "push",
-    "alan",
-    "dear",
-    "beer",
-    "jane",
-    "earn",
-    "twin",
-    "bits",
-    "suit",
-    "chip",
-    "char",
-    "echo",
-    "grid",
-    "pull",
-    "nick",
-    "plot",
-    "pump",
-    "exam",
-    "beds",
-    "grey",
-    "bold",
-    "scan",
-    "aged",
-    "bulk",
-    "cute",
-    "para",
-    "seed",
-    "peer",
-    "meat",
-    "bang",
-    "bone",
-    "bugs",
-    "gate",
-    "tone",
-    "busy",
-    "neck",
-    "wing",
-    "tiny",
-    "rail",
-    "tube",
-    "belt",
-    "luck",
-    "dial",
-    "gang",
-    "cake",
-    "semi",
-    "cafe",
-    "till",
-    "shoe",
-    "sand",
-    "seal",
-    "lies",
-    "pipe",
-    "deck",
-    "thin",
-    "sick",
-    "dose",
-    "lets",
-    "cats",
-    "folk",
-    "okay",
-    "hist",
-    "lift",
-    "mall",
-    "fell",
-    "yard",
-    "pour",
-    "dust",
-    "butt",
-    "kent",
-    "adds",
-    "ward",
-    "roof",
-    "kiss",
-    "rush",
-    "yoga",
-    "lamp",
-    "glad",
-    "wins",
-    "rack",
-    "boss",
-    "anna",
-    "solo",
-    "tall",
-    "nova",
-    "wake",
-    "shit",
-    "drum",
-    "ease",
-    "orgy",
-    "tabs",
-    "pine",
-    "tend",
-    "gulf",
-    "rick",
-    "hunt",
-    "mill",
-    "burn",
-    "labs",
-    "sole",
-    "laid",
-    "clay",
-    "weak",
-    "wise",
-    "odds",
-    "marc",
-    "sons",
-    "leaf",
-    "silk",
-    "wolf",
-    "fits",
-    "kick",
-    "meal",
-    "hurt",
-    "slip",
-    "cuts",
-    "mars",
-    "caps",
-    "pill",
-    "meta",
-    "mint",
-    "spin",
-    "wash",
-    "aims",
-    "soap",
-    "axis",
-    "guns",
-    "hero",
-    "punk",
-    "duke",
-    "pace",
-    "wage",
-    "dawn",
-    "carl",
-    "coat",
-    "doll",
-    "reed",
-    "mice",
-    "temp",
-    "vast",
-    "wrap",
-    "mood",
-    "quiz",
-    "beam",
-    "tops",
-    "shut",
-    "thou",
-    "mask",
-    "coal",
-    "lion",
-    "beef",
-    "hats",
-    "surf",
-    "hook",
-    "cord",
-    "crop",
-    "lite",
-    "sing",
-    "tons",
-    "hang",
-    "damn",
-    "hood",
-    "fame",
-    "eggs",
-    "ruby",
-    "stem",
-    "drew",
-    "tune",
-    "corn",
-    "puts",
-    "grew",
-    "trek",
-    "ties",
-    "brad",
-    "jury",
-    "tail",
-    "lawn",
-    "soup",
-    "byte",
-    "nose",
-    "thru",
-    "jews",
-    "trim",
-    "quit",
-    "lung",
-    "sees",
-    "bull",
-    "cole",
-    "mart",
-    "tale",
-    "docs",
-    "coin",
-    "fake",
-    "cure",
-    "arch",
-    "bomb",
-    "harm",
-    "deer",
-    "oven",
-    "noon",
-    "cams",
-    "piss",
-    "mate",
-    "chef",
-    "isle",
-    "slim",
-    "comp",
-    "spec",
-    "midi",
-    "tied",
-    "dale",
-    "boob",
-    "oils",
-    "sept",
-    "unto",
-    "pays",
-    "lang",
-    "stud",
-    "fold",
-    "slut",
-    "pole",
-    "mega",
-    "bend",
-    "moms",
-    "glen",
-    "lips",
-    "pond",
-    "tire",
-    "chad",
-    "josh",
-    "drag",
-    "ripe",
-    "rely",
-    "nuts",
-    "nail",
-    "span",
-    "joke",
-    "pads",
-    "inns",
-    "cups",
-    "foam",
-    "poem",
-    "asks",
-    "bean",
-    "bias",
-    "swim",
-    "loud",
-    "rats",
-    "stat",
-    "bios",
-    "thee",
-    "ruth",
-    "pray",
-    "pope",
-    "jeep",
-    "bare",
-    "hung",
-    "mono",
-    "tile",
-    "apps",
-    "ciao",
-    "knee",
-    "prep",
-    "pros",
-    "cant",
-    "duck",
-    "dive",
-    "raid",
-    "volt",
-    "dirt",
-    "geek",
-    "sink",
-    "grip",
-    "watt",
-    "pins",
-    "polo",
-    "horn",
-    "frog",
-    "logs",
-    "snap",
-    "swap",
-    "flip",
-    "buzz",
-    "nuke",
-    "boom",
-    "calm",
-    "fork",
-    "troy",
-    "sims",
-    "tray",
-    "sage",
-    "cave",
-    "wool",
-    "eyed",
-    "grab",
-    "oops",
-    "trap",
-    "fool",
-    "dies",
-    "jail",
-    "lace",
-    "ugly",
-    "hart",
-    "rows",
-    "gods",
-    "poly",
-    "ears",
-    "fist",
-    "mere",
-    "cons",
-    "taxi",
-    "worn",
-    "shaw",
-    "expo",
-    "deny",
-    "trio",
-    "cube",
-    "rugs",
-    "crap",
-    "fate",
-    "oval",
-    "soma",
-    "tier",
-    "earl",
-    "cite",
-    "mess",
-    "rope",
-    "dump",
-    "hose",
-    "pubs",
-    "mild",
-    "clan",
-    "sync",
-    "mesa",
-    "hull",
-    "shed",
-    "memo",
-    "tide",
-    "funk",
-    "reel",
-    "bind",
-    "rand",
-    "buck",
-    "acre",
-    "lows",
-    "aqua",
-    "pest",
-    "reef",
-    "beth",
-    "jill",
-    "sofa",
-    "dans",
-    "tent",
-    "hack",
-    "dare",
-    "hawk",
-    "lamb",
-    "junk",
-    "poet",
-    "epic",
-    "sake",
-    "sans",
-    "lean",
-    "dude",
-    "alto",
-    "gore",
-    "cult",
-    "dash",
-    "cage",
-    "jake",
-    "ping",
-    "flux",
-    "rage",
-    "rays",
-    "acne",
-    "libs",
-    "undo",
-    "halo",
-    "gays",
-    "exec",
-    "vids",
-    "doom",
-    "bite",
-    "myth",
-    "weed",
-    "dice",
-    "quad",
-    "dock",
-    "mods",
-    "hint",
-    "buys",
-    "pork",
-    "barn",
-    "fare",
-    "bald",
-    "fuji",
-    "mold",
-    "dame",
-    "herb",
-    "idle",
-    "cove",
-    "casa",
-    "flex",
-    "hash",
-    "lazy",
-    "carb",
-    "pens",
-    "worm",
-    "deaf",
-    "mats",
-    "blah",
-    "mime",
-    "cunt",
-    "keen",
-    "peas",
-    "owns",
-    "zinc",
-    "guru",
-    "levy",
-    "grad",
-    "bras",
-    "pale",
-    "gaps",
-    "tear",
-    "nest",
-    "gale",
-    "idol",
-    "moss",
-    "cork",
-    "dome",
-    "heel",
-    "yang",
-    "dumb",
-    "feat",
-    "glow",
-    "oaks",
-    "norm",
-    "ware",
-    "jade",
-    "foul",
-    "keno",
-    "seas",
-    "pose",
-    "goat",
-    "sail",
-    "bolt",
-    "gage",
-    "urge",
-    "neon",
-    "ours",
-    "lone",
-    "cope",
-    "lime",
-    "kirk",
-    "spas",
-    "jets",
-    "yarn",
-    "knit",
-    "pike",
-    "bent",
-    "mama",
-    "coil",
-    "lily",
-    "joey",
-    "tilt",
-    "bead",
-    "leak",
-    "bulb",
-    "iris",
-    "bach",
-    "khan",
-    "stir",
-    "pile",
-    "wade",
-    "pony",
-    "leap",
-    "swan",
-    "scat",
-    "nets",
-    "bash",
-    "neat",
-    "bump",
-    "aunt",
-    "crow",
-    "gram",
-    "sits",
-    "toes",
-    "bust",
-    "cola",
-    "gems",
-    "outs",
-    "foil",
-    "amps",
-    "tick",
-    "vans",
-    "glue",
-    "cone",
-    "gals",
-    "olds",
-    "ramp",
-    "pear",
-    "clue",
-    "duff",
-    "scam",
-    "beck",
-    "tome",
-    "prof",
-    "sins",
-    "hath",
-    "prop",
-    "maid",
-    "haha",
-    "rods",
-    "pigs",
-    "maya",
-    "fest",
-    "deed",
-    "papa",
-    "warn",
-    "cops",
-    "peso",
-    "vent",
-    "dots",
-    "mugs",
-    "vase",
-    "vera",
-    "napa",
-    "homo",
-    "pier",
-    "nazi",
-    "cote",
-    "saga",
-    "gran",
-    "mayo",
-    "lisp",
-    "chin",
-    "wont",
-    "hubs",
-    "soda",
-    "tomb",
-    "prom",
-    "cubs",
-    "pulp",
-    "pots",
-    "slam",
-    "lowe",
-    "crib",
-    "coca",
-    "noun",
-    "crab",
-    "hike",
-    "bore",
-    "cows",
-    "peel",
-    "bake",
-    "fave",
-    "heal",
-    "tote",
-    "alfa",
-    "sour",
-    "sock",
-    "bail",
-    "tees",
-    "mist",
-    "verb",
-    "chic",
-    "vest",
-    "tens",
-    "puma",
-    "rant",
-    "gill",
-    "rude",
-    "sang",
-    "curl",
-    "deli",
-    "vine",
-    "vale",
-    "limo",
-    "rust",
-    "avid",
-    "bets",
-    "carr",
-    "fade",
-    "monk",
-    "pooh",
-    "torn",
-    "heck",
-    "bark",
-    "lynx",
-    "roms",
-    "kane",
-    "odor",
-    "flew",
-    "apex",
-    "curb",
-    "deco",
-    "coke",
-    "webs",
-    "prod",
-    "cane",
-    "fury",
-    "wore",
-    "lima",
-    "dues",
-    "gigs",
-    "plea",
-    "prey",
-    "lick",
-    "ness",
-    "whip",
-    "prog",
-    "bins",
-    "bout",
-    "hank",
-    "fond",
-    "sore",
-    "fiat",
-    "noel",
-    "cans",
-    "aide",
-    "lieu",
-    "reds",
-    "noir",
-    "knob",
-    "dove",
-    "mack",
-    "sung",
-    "ally",
-    "alma",
-    "holt",
-    "dull",
-    "bees",
-    "sigh",
-    "mock",
-    "bats",
-    "melt",
-    "faux",
-    "pant",
-    "hype",
-    "rite",
-    "alba",
-    "dong",
-    "turf",
-    "berg",
-    "muse",
-    "tyne",
-    "lust",
-    "luna",
-    "lien",
-    "vein",
-    "hale",
-    "tiff",
-    "bait",
-    "dent",
-    "macs",
-    "sums",
-    "lame",
-    "fuse",
-    "pops",
-    "amid",
-    "knot",
-    "acta",
-    "yuan",
-    "tate",
-    "coop",
-    "kris",
-    "regs",
-    "plum",
-    "loft",
-    "lump",
-    "halt",
-    "aero",
-    "bury",
-    "duct",
-    "lend",
-    "pans",
-    "ions",
-    "rams",
-    "gown",
-    "ruin",
-    "otto",
-    "tuna",
-    "wipe",
-    "haul",
-    "duly",
-    "mick",
-    "obey",
-    "mare",
-    "kite",
-    "heap",
-    "eats",
-    "flea",
-    "pals",
-    "hail",
-    "herd",
-    "calf",
-    "rave",
-    "jerk",
-    "flap",
-    "diva",
-    "taps",
-    "oath",
-    "gala",
-    "tang",
-    "riot",
-    "fats",
-    "ritz",
-    "lush",
-    "grim",
-    "flop",
-    "toss",
-    "pity",
-    "woke",
-    "cuff",
-    "reps",
-    "eddy",
-    "cues",
-    "colt",
-    "offs",
-    "jars",
-    "hips",
-    "wigs",
-    "hunk",
-    "chap",
-    "tele",
-    "harp",
-    "phat",
-    "tack",
-    "sack",
-    "peek",
-    "secs",
-    "sued",
-    "toby",
-    "axle",
-    "cobb",
-    "opal",
-    "toon",
-    "lars",
-    "viva",
-    "blew",
-    "howe",
-    "lava",
-    "vail",
-    "envy",
-    "shah",
-    "bots",
-    "meds",
-    "stag",
-    "rash",
-    "mips",
-    "boil",
-    "vain",
-    "maze",
-    "rode",
-    "amen",
-    "warp",
-    "zeta",
-    "brew",
-    "kern",
-    "coup",
-    "fore",
-    "alps",
-    "subs",
-    "limb",
-    "limp",
-    "mute",
-    "dart",
-    "robe",
-    "mast",
-    "goth",
-    "cozy",
-    "comb",
-    "alas",
-    "chop",
-    "onyx",
-    "hoop",
-    "nope",
-    "dire",
-    "gull",
-    "brit",
-    "rims",
-    "shin",
-    "flaw",
-    "pane",
-    "vibe",
-    "meth",
-    "teas",
-    "anon",
-    "ribs",
-    "nite",
-    "barb",
-    "huns",
-    "aura",
-    "sect",
-    "nous",
-    "mole",
-    "owed",
-    "buff",
-    "clad",
-    "fled",
-    "bros",
-    "aces",
-    "lied",
-    "bloc",
-    "hugs",
-    "owls",
-    "pimp",
-    "gimp",
-    "hemp",
-    "inks",
-    "wink",
-    "fife",
-    "stub",
-    "tort",
-    "dams",
-    "mach",
-    "zine",
-    "conn",
-    "spur",
-    "sith",
-    "skis",
-    "pact",
-    "lulu",
-    "vita",
-    "ibis",
-    "coed",
-    "mule",
-    "kiwi",
-    "duel",
-    "mead",
-    "gong",
-    "bays",
-    "gaze",
-    "hulk",
-    "cyan",
-    "cory",
-    "axes",
-    "haze",
-    "pits",
-    "ants",
-    "tuck",
-    "slab",
-    "lure",
-    "kart",
-    "ling",
-    "tubs",
-    "mags",
-    "hers",
-    "grin",
-    "spit",
-    "acme",
-    "rove",
-    "chow",
-    "aria",
-    "dirk",
-    "scar",
-    "dorm",
-    "pies",
-    "saws",
-    "cain",
-    "coco",
-    "dine",
-    "slap",
-    "jaws",
-    "ante",
-    "bred",
-    "shea",
-    "tout",
-    "hare",
-    "plat",
-    "tory",
-    "veil",
-    "peck",
-    "tres",
-    "helm",
-    "jess",
-    "jays",
-    "saul",
-    "chew",
-    "teak",
-    "sane",
-    "dune",
-    "mana",
-    "lest",
-    "blur",
-    "punt",
-    "mojo",
-    "tori",
-    "dime",
-    "carp",
-    "dusk",
-    "lent",
-    "aloe",
-    "puff",
-    "claw",
-    "tyre",
-    "wand",
-    "taco",
-    "weld",
-    "writ",
-    "typo",
-    "damp",
-    "fern",
-    "lore",
-    "gyms",
-    "arid",
-    "jive",
-    "spun",
-    "loch",
-    "balm",
-    "figs",
-    "chit",
-    "lays",
-    "drip",
-    "mans",
-    "pint",
-    "maxi",
-    "liar",
-    "ares",
-    "opus",
-    "mage",
-    "teal",
-    "bard",
-    "reap",
-    "hast",
-    "tidy",
-    "vets",
-    "bows",
-    "beau",
-    "rang",
-    "jeux",
-    "laps",
-    "pong",
-    "vows",
-    "soar",
-    "tiki",
-    "flee",
-    "woes",
-    "stew",
-    "hush",
-    "lama",
-    "akin",
-    "dads",
-    "hays",
-    "soak",
-    "baht",
-    "hymn",
-    "quay",
-    "weir",
-    "dram",
-    "mara",
-    "abba",
-    "burr",
-    "slug",
-    "lira",
-    "jams",
-    "dyes",
-    "yell",
-    "fins",
-    "rake",
-    "suns",
-    "bunk",
-    "stab",
-    "dyer",
-    "dyke",
-    "dino",
-    "seam",
-    "omit",
-    "darn",
-    "ammo",
-    "linn",
-    "veto",
-    "clam",
-    "nerd",
-    "guts",
-    "axel",
-    "alec",
-    "bans",
-    "buds",
-    "sire",
-    "ding",
-    "coma",
-    "thug",
-    "sham",
-    "loaf",
-    "skid",
-    "poop",
-    "whey",
-    "curt",
-    "moth",
-    "mash",
-    "germ",
-    "atop",
-    "kemp",
-    "puck",
-    "moor",
-    "lube",
-    "sway",
-    "toad",
-    "eros",
-    "malt",
-    "pods",
-    "clap",
-    "sera",
-    "paws",
-    "poke",
-    "dope",
-    "kiln",
-    "sous",
-    "jock",
-    "dyed",
-    "wasp",
-    "fuss",
-    "swat",
-    "anus",
-    "sine",
-    "exon",
-    "toro",
-    "bray",
-    "roar",
-    "gall",
-    "meme",
-    "jugs",
-    "apes",
-    "slit",
-    "cine",
-    "beep",
-    "camo",
-    "toms",
-    "slid",
-    "hons",
-    "nana",
-    "raft",
-    "brow",
-    "gels",
-    "vars",
-    "fink",
-    "deem",
-    "flax",
-    "tart",
-    "tram",
-    "iced",
-    "bile",
-    "shri",
-    "heir",
-    "loco",
-    "feds",
-    "baba",
-    "loom",
-    "grub",
-    "slew",
-    "duet",
-    "topo",
-    "ohms",
-    "taos",
-    "tong",
-    "muck",
-    "hoax",
-    "wary",
-    "riff",
-    "nada",
-    "chai",
-    "mace",
-    "dahl",
-    "lids",
-    "pore",
-    "oily",
-    "whoa",
-    "joys",
-    "lear",
-    "grit",
-    "nays",
-    "sinh",
-    "sues",
-    "tame",
-    "oats",
-    "wilt",
-    "ting",
-    "rolf",
-    "emit",
-    "rink",
-    "numb",
-    "scot",
-    "pave",
-    "airy",
-    "hobo",
-    "hops",
-    "emmy",
-    "chez",
-    "airs",
-    "dole",
-    "wick",
-    "owes",
-    "peat",
-    "tofu",
-    "twat",
-    "sunk",
-    "perm",
-    "lair",
-    "lacy",
-    "wren",
-    "arcs",
-    "ayes",
-    "heed",
-    "bora",
-    "boon",
-    "pawn",
-    "tore",
-    "dunk",
-    "snip",
-    "diss",
-    "mutt",
-    "vide",
-    "ouch",
-    "dips",
-    "digs",
-    "womb",
-    "joss",
-    "kohl",
-    "pups",
-    "lido",
-    "daft",
-    "gilt",
-    "trad",
-    "taxa",
-    "sled",
-    "elan",
-    "milo",
-    "refs",
-    "rees",
-    "coax",
-    "lees",
-    "alum",
-    "doth",
-    "plow",
-    "smut",
-    "dang",
-    "foes",
-    "blot",
-    "imam",
-    "hove",
-    "rial",
-    "sewn",
-    "rift",
-    "turk",
-    "peep",
-    "arse",
-    "judo",
-    "curr",
-    "luxe",
-    "mays",
-    "oboe",
-    "lobe",
-    "wynn",
-    "gosh",
-    "mica",
-    "lads",
-    "sumo",
-    "urea",
-    "zeal",
-    "lutz",
-    "bong",
-    "gent",
-    "hind",
-    "ache",
-    "yoke",
-    "tins",
-    "loot",
-    "gasp",
-    "tint",
-    "vert",
-    "silt",
-    "lint",
-    "blob",
-    "roam",
-    "stun",
-    "trey",
-    "fang",
-    "weep",
-    "kata",
-    "giga",
-    "lilo",
-    "ergo",
-    "moan",
-    "sank",
-    "bale",
-    "smog",
-    "mics",
-    "keel",
-    "fart",
-    "mems",
-    "cosy",
-    "shes",
-    "seer",
-    "vial",
-    "chao",
-    "huff",
-    "gust",
-    "cate",
-    "amir",
-    "musk",
-    "lice",
-    "skim",
-    "rune",
-    "welt",
-    "veal",
-    "rags",
-    "posh",
-    "mink",
-    "itch",
-    "dill",
-    "rigs",
-    "moot",
-    "agar",
-    "rein",
-    "buoy",
-    "hive",
-    "newt",
-    "dung",
-    "lark",
-    "hoes",
-    "ruff",
-    "zoos",
-    "scum",
-    "bran",
-    "faro",
-    "giro",
-    "cots",
-    "fret",
-    "haut",
-    "gums",
-    "tung",
-    "glib",
-    "gees",
-    "vile",
-    "brio",
-    "pima",
-    "peri",
-    "loci",
-    "hula",
-    "foxy",
-    "putt",
-    "coon",
-    "yeas",
-    "cram",
-    "hens",
-    "hogs",
-    "fray",
-    "zona",
-    "gags",
-    "rips",
-    "sash",
-    "lire",
-    "raja",
-    "boar",
-    "mite",
-    "mina",
-    "spar",
-    "arco",
-    "redo",
-    "nome",
-    "brat",
-    "aeon",
-    "wits",
-    "anew",
-    "loon",
-    "hone",
-    "sips",
-    "wort",
-    "nuns",
-    "tuba",
-    "jest",
-    "luce",
-    "mort",
-    "repo",
-    "gnus",
-    "hoya",
-    "jolt",
-    "skew",
-    "muni",
-    "cyst",
-    "mott",
-    "fowl",
-    "pate",
-    "snug",
-    "orca",
-    "nema",
-    "nook",
-    "koss",
-    "maud",
-    "dido",
-    "rosy",
-    "howl",
-    "hobs",
-    "ogre",
-    "baud",
-    "sped",
-    "yogi",
-    "pats",
-    "mora",
-    "dojo",
-    "gait",
-    "meek",
-    "stow",
-    "eide",
-    "bibs",
-    "cabs",
-    "hump",
-    "glam",
-    "eyre",
-    "beet",
-    "geld",
-    "pegs",
-    "anil",
-    "shay",
-    "meow",
-    "lash",
-    "ills",
-    "omen",
-    "amin",
-    "pacs",
-    "brig",
-    "tuff",
-    "fila",
-    "coda",
-    "defy",
-    "kays",
-    "crit",
-    "foss",
-    "kilt",
-    "mise",
-    "whit",
-    "coos",
-    "vino",
-    "clog",
-    "yeti",
-    "sill",
-    "dura",
-    "frat",
-    "buns",
-    "dada",
-    "nils",
-    "lain",
-    "holm",
-    "tots",
-    "tors",
-    "furl",
-    "hogg",
-    "hora",
-    "muon",
-    "afar",
-    "cess",
-    "guid",
-    "leas",
-    "fora",
-    "fawn",
-    "reis",
-    "scop",
-    "etch",
-    "wank",
-    "flue",
-    "emir",
-    "mobs",
-    "cris",
-    "gout",
-    "rubs",
-    "bobs",
-    "bane",
-    "rudd",
-    "thaw",
-    "bene",
-    "eels",
-    "shun",
-    "megs",
-    "daze",
-    "trot",
-    "woof",
-    "davy",
-    "wham",
-    "barm",
-    "begs",
-    "mull",
-    "bode",
-    "roto",
-    "urns",
-    "poco",
-    "kors",
-    "quid",
-    "kilo",
-    "slay",
-    "nods",
-    "chia",
-    "parr",
-    "leno",
-    "bree",
-    "maar",
-    "dork",
-    "kava",
-    "sari",
-    "mitt",
-    "yawn",
-    "feud",
-    "brut",
-    "gist",
-    "lobo",
-    "zips",
-    "tact",
-    "rife",
-    "huts",
-    "silo",
-    "eras",
-    "bock",
-    "pugh",
-    "mend",
-    "riel",
-    "capo",
-    "mums",
-    "tern",
-    "lass",
-    "rota",
-    "jute",
-    "prim",
-    "pang",
-    "swag",
-    "opts",
-    "padi",
-    "mano",
-    "furs",
-    "whim",
-    "pied",
-    "nigh",
-    "ales",
-    "sump",
-    "zest",
-    "wich",
-    "dona",
-    "wisp",
-    "sift",
-    "ooze",
-    "fume",
-    "brag",
-    "muff",
-    "snag",
-    "plex",
-    "yank",
-    "shag",
-    "kuna",
-    "hues",
-    "bute",
-    "lakh",
-    "lags",
-    "hajj",
-    "spat",
-    "ices",
-    "ahem",
-    "shad",
-    "kino",
-    "wavy",
-    "crux",
-    "obit",
-    "slag",
-    "skit",
-    "kelp",
-    "batt",
-    "vamp",
-    "iota",
-    "helo",
-    "bled",
-    "duma",
-    "pita",
-    "slum",
-    "amis",
-    "doit",
-    "duro",
-    "fuzz",
-    "toil",
-    "klik",
-    "garb",
-    "pars",
-    "loca",
-    "twig",
-    "wept",
-    "edgy",
-    "bunn",
-    "jigs",
-    "merc",
-    "burg",
-    "rook",
-    "pall",
-    "trig",
-    "moat",
-    "swam",
-    "hazy",
-    "hoof",
-    "frag",
-    "sola",
-    "trop",
-    "vise",
-    "pere",
-    "lute",
-    "pram",
-    "luau",
-    "brim",
-    "chum",
-    "glut",
-    "neve",
-    "sacs",
-    "soot",
-    "whiz",
-    "roux",
-    "tain",
-    "vane",
-    "mane",
-    "kink",
-    "rhea",
-    "puri",
-    "sown",
-    "beak",
-    "rung",
-    "geez",
-    "twas",
-    "loam",
-    "acyl",
-    "romp",
-    "czar",
-    "mush",
-    "foal",
-    "gogo",
-    "noes",
-    "dost",
-    "cred",
-    "whew",
-    "pail",
-    "fico",
-    "loin",
-    "leer",
-    "nave",
-    "hows",
-    "leek",
-    "puss",
-    "taka",
-    "oars",
-    "smit",
-    "clot",
-    "pard",
-    "pyro",
-    "soya",
-    "joes",
-    "morn",
-    "glug",
-    "sass",
-    "rout",
-    "ploy",
-    "magi",
-    "puke",
-    "glee",
-    "coho",
-    "hams",
-    "hoot",
-    "sade",
-    "pina",
-    "bott",
-    "vive",
-    "kale",
-    "huck",
-    "juke",
-    "jinx",
-    "tics",
-    "jura",
-    "tora",
-    "fido",
-    "auld",
-    "pias",
-    "aver",
-    "pugs",
-    "sima",
-    "tala",
-    "kami",
-    "cols",
-    "mons",
-    "milt",
-    "dike",
-    "wart",
-    "naps",
-    "toyo",
-    "gush",
-    "reif",
-    "ogle",
-    "pula",
-    "buss",
-    "hiss",
-    "utes",
-    "rusk",
-    "gory",
-    "bony",
-    "moll",
-    "mews",
-    "cask",
-    "brie",
-    "oxen",
-    "bums",
-    "mops",
-    "nota",
-    "fend",
-    "veer",
-    "recs",
-    "nips",
-    "bola",
-    "debs",
-    "glob",
-    "ream",
-    "ores",
-    "boll",
-    "shim",
-    "ides",
-    "gnat",
-    "amok",
-    "arty",
-    "smug",
-    "dons",
-    "awol",
-    "lats",
-    "yule",
-    "orcs",
-    "lugs",
-    "bate",
-    "pert",
-    "tsar",
-    "cade",
-    "neem",
-    "cosh",
-    "kain",
-    "simp",
-    "burp",
-    "wert",
-    "cusp",
-    "bade",
-    "revs",
-    "yolk",
-    "boos",
-    "cull",
-    "maul",
-    "ahoy",
-    "haar",
-    "poms",
-    "yelp",
-    "gree",
-    "gyro",
-    "luge",
-    "deva",
-    "rete",
-    "heme",
-    "sear",
-    "gaby",
-    "egos",
-    "pare",
-    "axon",
-    "pols",
-    "viol",
-    "tarp",
-    "puny",
-    "miso",
-    "fizz",
-    "foci",
-    "drab",
-    "keck",
-    "prez",
-    "flak",
-    "yuck",
-    "etna",
-    "quod",
-    "ably",
-    "jeez",
-    "redd",
-    "lard",
-    "hypo",
-    "mils",
-    "jota",
-    "swab",
-    "rind",
-    "burl",
-    "rote",
-    "ruse",
-    "muss",
-    "spud",
-    "croc",
-    "elms",
-    "feta",
-    "ikon",
-    "onus",
-    "cham",
-    "bier",
-    "lull",
-    "boho",
-    "lino",
-    "gats",
-    "shew",
-    "taro",
-    "elks",
-    "tutu",
-    "lacs",
-    "raps",
-    "pion",
-    "alms",
-    "raya",
-    "biff",
-    "swot",
-    "omer",
-    "vill",
-    "birr",
-    "gama",
-    "mako",
-    "rath",
-    "asps",
-    "dato",
-    "bibb",
-    "mote",
-    "wold",
-    "boas",
-    "idem",
-    "hark",
-    "aves",
-    "baal",
-    "thud",
-    "weds",
-    "epos",
-    "perk",
-    "firs",
-    "mosh",
-    "rump",
-    "modi",
-    "vela",
-    "pent",
-    "sago",
-    "rive",
-    "tabu",
-    "gawk",
-    "raia",
-    "seta",
-    "hock",
-    "heft",
-    "pons",
-    "lewd",
-    "dupe",
-    "bogs",
-    "tosh",
-    "loup",
-    "pele",
-    "rani",
-    "babu",
-    "swig",
-    "ilia",
-    "dore",
-    "bunt",
-    "fete",
-    "hoke",
-    "vatu",
-    "guan",
-    "pows",
-    "duns",
-    "fain",
-    "pips",
-    "sirs",
-    "cowl",
-    "fils",
-    "slat",
-    "maes",
-    "goon",
-    "pica",
-    "taut",
-    "kola",
-    "heil",
-    "bidi",
-    "snob",
-    "crud",
-    "sora",
-    "quai",
-    "duce",
-    "tine",
-    "nolo",
-    "leis",
-    "racy",
-    "awry",
-    "celt",
-    "lode",
-    "spay",
-    "toke",
-    "koji",
-    "masa",
-    "clef",
-    "pelt",
-    "wadi",
-    "goof",
-    "ankh",
-    "ager",
-    "kana",
-    "dank",
-    "zany",
-    "rebs",
-    "loti",
-    "toga",
-    "keto",
-    "puns",
-    "hilt",
-    "roan",
-    "nags",
-    "wily",
-    "devs",
-    "puja",
-    "dodo",
-    "torr",
-    "bork",
-    "lune",
-    "brin",
-    "mots",
-    "cogs",
-    "talc",
-    "pomp",
-    "noms",
-    "spew",
-    "gulp",
-    "lurk",
-    "pend",
-    "bosh",
-    "toot",
-    "snot",
-    "wack",
-    "hurl",
-    "dory",
-    "nary",
-    "ibex",
-    "orbs",
-    "razz",
-    "zing",
-    "toed",
-    "mibs",
-    "fino",
-    "scab",
-    "vara",
-    "phew",
-    "wail",
-    "crag",
-    "tass",
-    "eves",
-    "minx",
-    "lech",
-    "dens",
-    "quin",
-    "purr",
-    "nits",
-    "vena",
-    "bund",
-    "oust",
-    "bask",
-    "berk",
-    "kore",
-    "gash",
-    "dita",
-    "dubs",
-    "bolo",
-    "anas",
-    "odes",
-    "kyat",
-    "wane",
-    "oyez",
-    "poof",
-    "fads",
-    "gens",
-    "oped",
-    "samp",
-    "soca",
-    "ovum",
-    "dene",
-    "wale",
-    "abbe",
-    "pled",
-    "slaw",
-    "nabs",
-    "mair",
-    "whig",
-    "tugs",
-    "meld",
-    "lyre",
-    "deft",
-    "husk",
-    "hick",
-    "honk",
-    "turd",
-    "haji",
-    "cuss",
-    "vina",
-    "pout",
-    "mire",
-    "bice",
-    "nett",
-    "isms",
-    "saps",
-    "kats",
-    "shiv",
-    "balk",
-    "amie",
-    "sark",
-    "robs",
-    "idly",
-    "cedi",
-    "fere",
-    "ewes",
-    "gast",
-    "tach",
-    "waxy",
-    "loos",
-    "mien",
-    "rede",
-    "abet",
-    "kerb",
-    "curd",
-    "barf",
-    "piso",
-    "doty",
-    "blip",
-    "bast",
-    "icky",
-    "toit",
-    "doss",
-    "sows",
-    "yagi",
-    "cels",
-    "wimp",
-    "wats",
-    "marl",
-    "moos",
-    "guar",
-    "oryx",
-    "yams",
-    "ates",
-    "ween",
-    "rend",
-    "kine",
-    "rots",
-    "rood",
-    "mads",
-    "chub",
-    "bens",
-    "vang",
-    "thro",
-    "dado",
-    "loge",
-    "sura",
-    "soph",
-    "whet",
-    "sics",
-    "doer",
-    "seep",
-    "peds",
-    "oses",
-    "poon",
-    "mids",
-    "sods",
-    "filo",
-    "leal",
-    "raga",
-    "ecru",
-    "aryl",
-    "sobs",
-    "zouk",
-    "purl",
-    "vier",
-    "sawn",
-    "muds",
-    "gies",
-    "tole",
-    "wean",
-    "juju",
-    "dink",
-    "nene",
-    "imps",
-    "pupa",
-    "suds",
-    "gams",
-    "okra",
-    "bren",
-    "gest",
-    "snub",
-    "raff",
-    "prat",
-    "haps",
-    "dims",
-    "agee",
-    "derm",
-    "scud",
-    "sops",
-    "dees",
-    "slur",
-    "uric",
-    "tusk",
-    "dree",
-    "sain",
-    "dorr",
-    "twee",
-    "ceil",
-    "shoo",
-    "sate",
-    "yore",
-    "fabs",
-    "slop",
-    "weer",
-    "nims",
-    "bozo",
-    "twos",
-    "berm",
-    "hake",
-    "gaol",
-    "tarn",
-    "unde",
-    "phot",
-    "fags",
-    "rami",
-    "mura",
-    "tare",
-    "gaga",
-    "flay",
-    "sols",
-    "fess",
-    "hots",
-    "sett",
-    "ilex",
-    "whee",
-    "meno",
-    "buhl",
-    "awed",
-    "inti",
-    "herm",
-    "lunt",
-    "twit",
-    "gite",
-    "narc",
-    "ruck",
-    "kina",
-    "slog",
-    "pecs",
-    "nona",
-    "flog",
-    "topi",
-    "deni",
-    "wile",
-    "jell",
-    "yous",
-    "duds",
-    "jinn",
-    "deet",
-    "mony",
-    "rime",
-    "goad",
-    "spry",
-    "grok",
-    "coot",
-    "maun",
-    "jabs",
-    "oink",
-    "dyne",
-    "pews",
-    "brae",
-    "peps",
-    "jots",
-    "bris",
-    "koto",
-    "ursa",
-    "plop",
-    "defi",
-    "tans",
-    "seis",
-    "grog",
-    "mell",
-    "runt",
-    "cede",
-    "teem",
-    "bonk",
-    "duos",
-    "suet",
-    "lich",
-    "inky",
-    "hewn",
-    "alga",
-    "vole",
-    "ands",
-    "syne",
-    "puna",
-    "flan",
-    "axed",
-    "jags",
-    "mumm",
-    "quip",
-    "shod",
-    "dels",
-    "iffy",
-    "kiva",
-    "saki",
-    "wove",
-    "bide",
-    "bevy",
-    "nori",
-    "flit",
-    "wast",
-    "doms",
-    "dour",
-    "kegs",
-    "nosy",
-    "soli",
-    "keir",
-    "alls",
-    "dabs",
-    "posy",
-    "rube",
-    "carn",
-    "erst",
-    "lehr",
-    "ghee",
-    "raws",
-    "vend",
-    "bani",
-    "anta",
-    "abut",
-    "eons",
-    "luff",
-    "teat",
-    "dais",
-    "mocs",
-    "pith",
-    "eaux",
-    "gaff",
-    "biro",
-    "mola",
-    "chug",
-    "echt",
-    "laud",
-    "buts",
-    "goer",
-    "peed",
-    "sulu",
-    "psst",
-    "bods",
-    "dere",
-    "peal",
-    "baas",
-    "udon",
-    "miri",
-    "molt",
-    "coir",
-    "cors",
-    "atma",
-    "kook",
-    "nobs",
-    "fons",
-    "vats",
-    "trod",
-    "coff",
-    "wans",
-    "ordo",
-    "nape",
-    "hols",
-    "leva",
-    "weft",
-    "phon",
-    "teds",
-    "lase",
-    "goos",
-    "gins",
-    "reek",
-    "wets",
-    "kier",
-    "kame",
-    "kens",
-    "perp",
-    "pomo",
-    "lipa",
-    "weet",
-    "supe",
-    "hums",
-    "vacs",
-    "bung",
-    "pika",
-    "rapt",
-    "gobo",
-    "otic",
-    "leet",
-    "pees",
-    "rasp",
-    "doze",
-    "lier",
-    "wonk",
-    "tats",
-    "raku",
-    "shul",
-    "dint",
-    "puls",
-    "fice",
-    "ells",
-    "gape",
-    "fems",
-    "opes",
-    "hwan",
-    "blam",
-    "dopa",
-    "gane",
-    "sone",
-    "wows",
-    "dure",
-    "tali",
-    "vasa",
-    "sers",
-    "moly",
-    "bole",
-    "craw",
-    "tuft",
-    "toft",
-    "kudo",
-    "tams",
-    "dele",
-    "flam",
-    "nibs",
-    "ails",
-    "gorp",
-    "buna",
-    "soba",
-    "cued",
-    "slob",
-    "jefe",
-    "ansa",
-    "glum",
-    "sabe",
-    "kayo",
-    "doge",
-    "hems",
-    "kaon",
-    "egal",
-    "serf",
-    "boxy",
-    "cigs",
-    "luma",
-    "woks",
-    "pois",
-    "hued",
-    "tela",
-    "hoar",
-    "jiao",
-    "blat",
-    "noma",
-    "jamb",
-    "rads",
-    "whys",
-    "fens",
-    "cads",
-    "lave",
-    "abed",
-    "chay",
-    "cees",
-    "shat",
-    "dows",
-    "girt",
-    "forb",
-    "ebon",
-    "fash",
-    "ruts",
-    "ulan",
-    "arvo",
-    "prow",
-    "asci",
-    "suss",
-    "scad",
-    "dace",
-    "wags",
-    "maim",
-    "sati",
-    "spaz",
-    "fugu",
-    "fava",
-    "teel",
-    "kudu",
-    "aper",
-    "tush",
-    "obis",
-    "espy",
-    "rums",
-    "jeon",
-    "deke",
-    "tipi",
-    "curs",
-    "zits",
-    "chon",
-    "bint",
-    "caca",
-    "karn",
-    "gunk",
-    "perv",
-    "vies",
-    "roti",
-    "nisi",
-    "tapa",
-    "lope",
-    "errs",
-    "roup",
-    "azan",
-    "faze",
-    "ajar",
-    "toph",
-    "fobs",
-    "irks",
-    "taus",
-    "nosh",
-    "diol",
-    "boor",
-    "bigs",
-    "byes",
-    "alts",
-    "rias",
-    "kora",
-    "gids",
-    "agha",
-    "ires",
-    "lout",
-    "tref",
-    "wark",
-    "gude",
-    "pixy",
-    "sall",
-    "sika",
-    "mete",
-    "lief",
-    "wads",
-    "swop",
-    "togs",
-    "flic",
-    "pams",
-    "tels",
-    "anis",
-    "jibe",
-    "chis",
-    "eger",
-    "goby",
-    "coni",
-    "haws",
-    "weel",
-    "gobs",
-    "raze",
-    "hasp",
-    "wain",
-    "ayah",
-    "lins",
-    "paik",
-    "durr",
-    "lari",
-    "biog",
-    "pyre",
-    "rais",
-    "illy",
-    "fado",
-    "apse",
-    "alef",
-    "cods",
-    "souk",
-    "dors",
-    "merk",
-    "tope",
-    "pean",
-    "lorn",
-    "nala",
-    "nock",
-    "tows",
-    "dewy",
-    "agin",
-    "weal",
-    "koan",
-    "flir",
-    "puce",
-    "peon",
-    "epee",
-    "stet",
-    "tods",
-    "tars",
-    "amyl",
-    "wuss",
-    "bort",
-    "pili",
-    "teed",
-    "leys",
-    "mabe",
-    "yobs",
-    "dibs",
-    "delt",
-    "emus",
-    "tiro",
-    "kaka",
-    "yurt",
-    "caws",
-    "kolo",
-    "lade",
-    "bubu",
-    "wend",
-    "mors",
-    "rhus",
-    "daps",
-    "burd",
-    "wiry",
-    "lory",
-    "birk",
-    "snog",
-    "tuts",
-    "exes",
-    "olio",
-    "tule",
-    "glia",
-    "putz",
-    "kune",
-    "sunn",
-    "dray",
-    "wiss",
-    "haft",
-    "gits",
-    "pone",
-    "hade",
-    "iglu",
-    "fogs",
-    "sook",
-    "fano",
-    "oleo",
-    "mumu",
-    "migs",
-    "paca",
-    "kaki",
-    "haku",
-    "oles",
-    "hame",
-    "kist",
-    "daws",
-    "axil",
-    "mosk",
-    "naan",
-    "yoni",
-    "luvs",
-    "weka",
-    "gook",
-    "loth",
-    "trow",
-    "tyee",
-    "eave",
-    "sibs",
-    "blab",
-    "gyre",
-    "stoa",
-    "kuru",
-    "grat",
-    "frit",
-    "fane",
-    "anes",
-    "achy",
-    "arum",
-    "pase",
-    "abri",
-    "cays",
-    "dyad",
-    "sags",
-    "lath",
-    "woos",
-    "mure",
-    "fuze",
-    "gild",
-    "amia",
-    "titi",
-    "kaas",
-    "wino",
-    "bine",
-    "wyle",
-    "gadi",
-    "lank",
-    "olla",
-    "cere",
-    "agon",
-    "apos",
-    "skat",
-    "aced",
-    "whir",
-    "moxa",
-    "juba",
-    "merl",
-    "burs",
-    "plod",
-    "aahs",
-    "aals",
-    "abas",
-    "abos",
-    "abye",
-    "abys",
-    "adit",
-    "ados",
-    "adze",
-    "aery",
-    "agas",
-    "agio",
-    "agly",
-    "agma",
-    "agog",
-    "ague",
-    "ahed",
-    "ahis",
-    "ains",
-    "airn",
-    "airt",
-    "aits",
-    "ajee",
-    "akee",
-    "alae",
-    "alar",
-    "albs",
-    "alee",
-    "alif",
-    "alit",
-    "alky",
-    "alme",
-    "alow",
-    "amah",
-    "amas",
-    "ambo",
-    "amus",
-    "anga",
-    "anoa",
-    "aped",
-    "apod",
-    "arak",
-    "arbs",
-    "arfs",
-    "aril",
-    "arks",
-    "asea",
-    "ashy",
-    "atap",
-    "auks",
-    "avos",
-    "avow",
-    "awee",
-    "awes",
-    "awls",
-    "awns",
-    "awny",
-    "axal",
-    "ayin",
-    "azon",
-    "bads",
-    "baff",
-    "bals",
-    "bams",
-    "baps",
-    "bawd",
-    "bawl",
-    "bedu",
-    "bels",
-    "bema",
-    "beys",
-    "bhut",
-    "bilk",
-    "bima",
-    "birl",
-    "bise",
-    "bisk",
-    "bitt",
-    "bize",
-    "blae",
-    "blaw",
-    "bleb",
-    "blet",
-    "blin",
-    "blub",
-    "boff",
-    "bogy",
-    "bops",
-    "bosk",
-    "bota",
-    "boyo",
-    "braw",
-    "broo",
-    "brrr",
-    "brux",
-    "bubo",
-    "bubs",
-    "buhr",
-    "bumf",
-    "bura",
-    "burb",
-    "busk",
-    "byre",
-    "byrl",
-    "cadi",
-    "caff",
-    "cagy",
-    "caid",
-    "caky",
-    "calk",
-    "calo",
-    "calx",
-    "caph",
-    "cark",
-    "caul",
-    "cavy",
-    "ceca",
-    "cepe",
-    "ceps",
-    "cero",
-    "cete",
-    "chaw",
-    "chid",
-    "cion",
-    "cire",
-    "cist",
-    "clag",
-    "clew",
-    "clod",
-    "clon",
-    "clop",
-    "cloy",
-    "cobs",
-    "coft",
-    "coif",
-    "coky",
-    "coly",
-    "conk",
-    "cony",
-    "coof",
-    "corf",
-    "corm",
-    "coss",
-    "cowy",
-    "coxa",
-    "coys",
-    "crus",
-    "cuds",
-    "cuif",
-    "cuke",
-    "culm",
-    "curf",
-    "curn",
-    "cusk",
-    "cwms",
-    "cyma",
-    "cyme",
-    "daff",
-    "dago",
-    "dags",
-    "dahs",
-    "daks",
-    "dals",
-    "darb",
-    "daub",
-    "daut",
-    "dawk",
-    "dawt",
-    "deil",
-    "delf",
-    "deme",
-    "demy",
-    "dews",
-    "dexy",
-    "deys",
-    "dhak",
-    "dhal",
-    "dhow",
-    "didy",
-    "diel",
-    "difs",
-    "dins",
-    "dipt",
-    "dirl",
-    "dite",
-    "dits",
-    "ditz",
-    "djin",
-    "doat",
-    "doby",
-    "doff",
-    "dogy",
-    "dols",
-    "dolt",
-    "dopy",
-    "dorp",
-    "dote",
-    "doum",
-    "doux",
-    "doxy",
-    "dozy",
-    "drat",
-    "dreg",
-    "drek",
-    "drib",
-    "drub",
-    "drys",
-    "duad",
-    "duci",
-    "dugs",
-    "duit",
-    "dunt",
-    "dups",
-    "durn",
-    "eath",
-    "ebbs",
-    "eche",
-    "ecus",
-    "eddo",
-    "edhs",
-    "eely",
-    "eery",
-    "effs",
-    "efts",
-    "egad",
-    "eggy",
-    "egis",
-    "eked",
-    "ekes",
-    "elds",
-    "elhi",
-    "elmy",
-    "emes",
-    "emeu",
-    "emic",
-    "emyd",
-    "engs",
-    "enol",
-    "enow",
-    "enuf",
-    "epha",
-    "ergs",
-    "erne",
-    "erns",
-    "eses",
-    "esne",
-    "etas",
-    "eths",
-    "etic",
-    "etui",
-    "ewer",
-    "exed",
-    "eyas",
-    "eyen",
-    "eyer",
-    "eyne",
-    "eyra",
-    "eyry",
-    "falx",
-    "fard",
-    "farl",
-    "faun",
-    "fays",
-    "feal",
-    "feck",
-    "feeb",
-    "fehs",
-    "feme",
-    "feod",
-    "fets",
-    "feus",
-    "fiar",
-    "fibs",
-    "fids",
-    "fief",
-    "firn",
-    "fisc",
-    "fixt",
-    "flab",
-    "fley",
-    "floc",
-    "floe",
-    "flub",
-    "flus",
-    "fogy",
-    "fohn",
-    "foin",
-    "fops",
-    "foys",
-    "fozy",
-    "frae",
-    "frap",
-    "frig",
-    "friz",
-    "froe",
-    "frow",
-    "frug",
-    "fubs",
-    "fuci",
-    "fuds",
-    "fugs",
-    "fumy",
-    "funs",
-    "futz",
-    "fyce",
-    "fyke",
-    "gabs",
-    "gads",
-    "gaed",
-    "gaen",
-    "gaes",
-    "gamb",
-    "gamp",
-    "gamy",
-    "gapy",
-    "gars",
-    "gaud",
-    "gaum",
-    "gaun",
-    "gaur",
-    "gawp",
-    "geck",
-    "geds",
-    "geed",
-    "gelt",
-    "genu",
-    "geta",
-    "geum",
-    "ghat",
-    "ghis",
-    "gibe",
-    "gibs",
-    "gied",
-    "gien",
-    "gink",
-    "gips",
-    "gird",
-    "girn",
-    "gled",
-    "gleg",
-    "gley",
-    "glim",
-    "glom",
-    "glop",
-    "gnar",
-    "gnaw",
-    "goas",
-    "goop",
-    "gorm",
-    "gowd",
-    "gowk",
-    "goys",
-    "grig",
-    "grot",
-    "grue",
-    "grum",
-    "guck",
-    "guff",
-    "guls",
-    "guvs",
-    "gybe",
-    "gyps",
-    "gyri",
-    "gyve",
-    "haaf",
-    "habu",
-    "hadj",
-    "haed",
-    "haem",
-    "haen",
-    "haes",
-    "haet",
-    "hags",
-    "hahs",
-    "haik",
-    "halm",
-    "hant",
-    "harl",
-    "hebe",
-    "hehs",
-    "hent",
-    "herl",
-    "hern",
-    "hest",
-    "heth",
-    "hets",
-    "hews",
-    "hied",
-    "hies",
-    "hila",
-    "hili",
-    "hims",
-    "hins",
-    "hisn",
-    "hods",
-    "hoed",
-    "hoer",
-    "holk",
-    "holp",
-    "homy",
-    "howf",
-    "howk",
-    "hoys",
-    "huic",
-    "hunh",
-    "hyla",
-    "hyps",
-    "hyte",
-    "iamb",
-    "ichs",
-    "idyl",
-    "iggs",
-    "ikat",
-    "ilea",
-    "ilka",
-    "ilks",
-    "imid",
-    "immy",
-    "impi",
-    "inby",
-    "inia",
-    "inly",
-    "inro",
-    "ired",
-    "irid",
-    "isba",
-    "iwis",
-    "ixia",
-    "izar",
-    "jagg",
-    "jape",
-    "jarl",
-    "jato",
-    "jauk",
-    "jaup",
-    "jeed",
-    "jeer",
-    "jees",
-    "jehu",
-    "jete",
-    "jibb",
-    "jibs",
-    "jiff",
-    "jilt",
-    "jimp",
-    "jink",
-    "jins",
-    "jism",
-    "jivy",
-    "jogs",
-    "joky",
-    "jole",
-    "jouk",
-    "jowl",
-    "jows",
-    "jube",
-    "juco",
-    "juga",
-    "juku",
-    "jupe",
-    "juts",
-    "kabs",
-    "kadi",
-    "kaes",
-    "kafs",
-    "kagu",
-    "kaif",
-    "kail",
-    "kapa",
-    "kaph",
-    "kbar",
-    "keas",
-    "keef",
-    "keek",
-    "keet",
-    "kefs",
-    "kelt",
-    "kepi",
-    "keps",
-    "kerf",
-    "khaf",
-    "khat",
-    "khet",
-    "khis",
-    "kibe",
-    "kief",
-    "kifs",
-    "kike",
-    "kins",
-    "kips",
-    "kirn",
-    "kirs",
-    "kith",
-    "knap",
-    "knar",
-    "knop",
-    "knur",
-    "koas",
-    "kobo",
-    "kobs",
-    "koel",
-    "kois",
-    "konk",
-    "koph",
-    "kops",
-    "kues",
-    "kufi",
-    "kvas",
-    "kyak",
-    "kyar",
-    "kyes",
-    "kyte",
-    "laic",
-    "laky",
-    "lall",
-    "lams",
-    "lati",
-    "latu",
-    "lavs",
-    "laze",
-    "leke",
-    "leks",
-    "leku",
-    "lept",
-    "leud",
-    "levo",
-    "lilt",
-    "limn",
-    "limy",
-    "liny",
-    "lipe",
-    "liri",
-    "lits",
-    "litu",
-    "lobs",
-    "logy",
-    "loid",
-    "loll",
-    "loof",
-    "lops",
-    "lota",
-    "lour",
-    "lown",
-    "lude",
-    "lues",
-    "lums",
-    "lunk",
-    "luny",
-    "lwei",
-    "lych",
-    "lyes",
-    "lyse",
-    "malm",
-    "maut",
-    "mawn",
-    "maws",
-    "mazy",
-    "meed",
-    "mels",
-    "meou",
-    "mewl",
-    "meze",
-    "mhos",
-    "miff",
-    "migg",
-    "mirk",
-    "mirs",
-    "miry",
-    "mity",
-    "mixt",
-    "moas",
-    "mogs",
-    "moil",
-    "moke",
-    "mols",
-    "mome",
-    "momi",
-    "mool",
-    "mope",
-    "mopy",
-    "moue",
-    "mown",
-    "mows",
-    "mozo",
-    "mugg",
-    "mump",
-    "muns",
-    "murk",
-    "murr",
-    "muts",
-    "mycs",
-    "myna",
-    "nabe",
-    "naff",
-    "naif",
-    "nans",
-    "naoi",
-    "naos",
-    "nard",
-    "nark",
-    "neap",
-    "nebs",
-    "neep",
-    "negs",
-    "neif",
-    "neuk",
-    "neum",
-    "nevi",
-    "nide",
-    "nidi",
-    "nill",
-    "nipa",
-    "nixe",
-    "nixy",
-    "nodi",
-    "nogg",
-    "nogs",
-    "noil",
-    "nows",
-    "nowt",
-    "nubs",
-    "nurd",
-    "nurl",
-    "oafs",
-    "oaky",
-    "oast",
-    "obas",
-    "obes",
-    "obia",
-    "obol",
-    "ocas",
-    "odah",
-    "odas",
-    "odea",
-    "odic",
-    "odyl",
-    "ofay",
-    "ogam",
-    "ogee",
-    "ohed",
-    "ohia",
-    "okas",
-    "okeh",
-    "okes",
-    "oldy",
-    "olea",
-    "onos",
-    "oohs",
-    "oots",
-    "oozy",
-    "opah",
-    "orad",
-    "orby",
-    "orle",
-    "orra",
-    "orts",
-    "orzo",
-    "osar",
-    "ossa",
-    "ouds",
-    "ouph",
-    "ouzo",
-    "owse",
-    "oxes",
-    "oxid",
-    "oxim",
-    "oyer",
-    "oyes",
-    "pacy",
-    "palp",
-    "paly",
-    "paps",
-    "pash",
-    "paty",
-    "pawl",
-    "peag",
-    "pech",
-    "peen",
-    "pehs",
-    "pein",
-    "peke",
-    "pelf",
-    "pepo",
-    "pfft",
-    "pfui",
-    "phis",
-    "phiz",
-    "phut",
-    "pial",
-    "pian",
-    "pice",
-    "piki",
-    "pily",
-    "piny",
-    "pipy",
-    "pirn",
-    "pish",
-    "pleb",
-    "plew",
-    "plie",
-    "pock",
-    "pogy",
-    "poky",
-    "pome",
-    "pood",
-    "poos",
-    "pouf",
-    "poxy",
-    "prao",
-    "prau",
-    "pree",
-    "prex",
-    "prig",
-    "proa",
-    "psis",
-    "ptui",
-    "puds",
-    "pule",
-    "puli",
-    "pung",
-    "pupu",
-    "purs",
-    "pyas",
-    "pyes",
-    "pyic",
-    "pyin",
-    "qadi",
-    "qaid",
-    "qats",
-    "qoph",
-    "quag",
-    "quey",
-    "ragg",
-    "ragi",
-    "raki",
-    "rale",
-    "rase",
-    "rato",
-    "reck",
-    "reft",
-    "rems",
-    "repp",
-    "resh",
-    "rets",
-    "rhos",
-    "rids",
-    "rifs",
-    "rile",
-    "rill",
-    "rimy",
-    "rins",
-    "rocs",
-    "roes",
-    "roil",
-    "ropy",
-    "rotl",
-    "roue",
-    "rued",
-    "ruer",
-    "rues",
-    "ruga",
-    "ruly",
-    "ryas",
-    "ryes",
-    "ryke",
-    "rynd",
-    "ryot",
-    "sabs",
-    "sadi",
-    "sagy",
-    "salp",
-    "sals",
-    "sard",
-    "scag",
-    "scow",
-    "scry",
-    "scup",
-    "scut",
-    "seel",
-    "sego",
-    "segs",
-    "seif",
-    "sels",
-    "seme",
-    "sene",
-    "sere",
-    "sews",
-    "sext",
-    "shmo",
-    "shog",
-    "shwa",
-    "sial",
-    "sibb",
-    "sice",
-    "sidh",
-    "sike",
-    "sild",
-    "sipe",
-    "sizy",
-    "skag",
-    "skas",
-    "skee",
-    "skeg",
-    "skep",
-    "skua",
-    "sloe",
-    "slub",
-    "slue",
-    "smew",
-    "snaw",
-    "sned",
-    "snib",
-    "snit",
-    "snye",
-    "soja",
-    "soke",
-    "soms",
-    "sorb",
-    "sord",
-    "sori",
-    "sorn",
-    "soth",
-    "sots",
-    "soys",
-    "spae",
-    "spic",
-    "spik",
-    "spiv",
-    "spue",
-    "sris",
-    "staw",
-    "stey",
-    "stob",
-    "stot",
-    "stum",
-    "stye",
-    "suba",
-    "sudd",
-    "suer",
-    "sugh",
-    "suks",
-    "sulk",
-    "sups",
-    "suqs",
-    "surd",
-    "swob",
-    "swum",
-    "sybo",
-    "syce",
-    "syke",
-    "syli",
-    "syph",
-    "tace",
-    "tads",
-    "tael",
-    "tahr",
-    "tamp",
-    "tavs",
-    "taws",
-    "teff",
-    "tegg",
-    "tegs",
-    "tepa",
-    "teth",
-    "tets",
-    "tews",
-    "thae",
-    "thew",
-    "thio",
-    "thir",
-    "tike",
-    "tils",
-    "tirl",
-    "tivy",
-    "tody",
-    "toea",
-    "toff",
-    "tola",
-    "tolu",
-    "toom",
-    "torc",
-    "tost",
-    "towy",
-    "tret",
-    "trog",
-    "trug",
-    "tsks",
-    "tufa",
-    "tuis",
-    "tump",
-    "tuns",
-    "tups",
-    "twae",
-    "tyer",
-    "tyes",
-    "tyin",
-    "tyke",
-    "typp",
-    "typy",
-    "tyro",
-    "tzar",
-    "udos",
-    "ughs",
-    "ukes",
-    "ulna",
-    "ulus",
-    "ulva",
-    "umbo",
-    "umps",
-    "unai",
-    "unau",
-    "unbe",
-    "unci",
-    "unco",
-    "undy",
-    "upas",
-    "upby",
-    "updo",
-    "urbs",
-    "urds",
-    "urps",
-    "urus",
-    "utas",
-    "uvea",
-    "vagi",
-    "vair",
-    "vaus",
-    "vavs",
-    "vaws",
-    "veep",
-    "vees",
-    "veld",
-    "vext",
-    "vied",
-    "viga",
-    "vigs",
-    "vims",
-    "viny",
-    "virl",
-    "voes",
-    "vrow",
-    "vugg",
-    "vugh",
-    "vugs",
-    "wabs",
-    "wady",
-    "waes",
-    "waff",
-    "waft",
-    "waif",
-    "wair",
-    "waly",
-    "wame",
-    "wany",
-    "waps",
-    "wauk",
-    "waul",
-    "waur",
-    "wawl",
-    "waws",
-    "wees",
-    "wens",
-    "whap",
-    "whid",
-    "whin",
-    "whop",
-    "whup",
-    "winy",
-    "wist",
-    "wite",
-    "wive",
-    "woad",
-    "wogs",
-    "wons",
-    "wops",
-    "wost",
-    "wots",
-    "wych",
-    "wyes",
-    "wynd",
-    "wyns",
-    "wyte",
-    "xyst",
-    "yack",
-    "yaff",
-    "yags",
-    "yaks",
-    "yald",
-    "yaps",
-    "yare",
-    "yaud",
-    "yaup",
-    "yawl",
-    "yawp",
-    "yaws",
-    "yays",
-    "yean",
-    "yech",
-    "yegg",
-    "yeld",
-    "yelk",
-    "yens",
-    "yeps",
-    "yerk",
-    "yett",
-    "yeuk",
-    "yews",
-    "yids",
-    "yill",
-    "yins",
-    "yipe",
-    "yips",
-    "yird",
-    "yirr",
-    "ylem",
-    "yock",
-    "yodh",
-    "yods",
-    "yogh",
-    "yoks",
-    "yond",
-    "yowe",
-    "yowl",
-    "yows",
-    "yuca",
-    "yuch",
-    "yuga",
-    "yuks",
-    "yups",
-    "yutz",
-    "ywis",
-    "zags",
-    "zaps",
-    "zarf",
-    "zebu",
-    "zeds",
-    "zees",
-    "zein",
-    "zeks",
-    "zeps",
-    "zerk",
-    "zigs",
-    "zill",
-    "zins",
-    "ziti",
-    "zoea",
-    "zoic",
-    "zonk",
-    "zoon",
-    "zori",
-    "zyme",
-]
@@ -1,8940 +0,0 @@
-WORDS = [
-    "about",
-    "other",
-    "which",
-    "their",
-    "there",
-    "first",
-    "would",
-    "these",
-    "click",
-    "price",
-    "state",
-    "email",
-    "world",
-    "music",
-    "after",
-    "video",
-    "where",
-    "books",
-    "links",
-    "years",
-    "order",
-    "items",
-    "group",
-    "under",
-    "games",
-    "could",
-    "great",
-    "hotel",
-    "store",
-    "terms",
-    "right",
-    "local",
-    "those",
-    "using",
-    "phone",
-    "forum",
-    "based",
-    "black",
-    "check",
-    "index",
-    "being",
-    "women",
-    "today",
-    "south",
-    "pages",
-    "found",
-    "house",
-    "photo",
-    "power",
-    "while",
-    "three",
-    "total",
-    "place",
-    "think",
-    "north",
-    "posts",
-    "media",
-    "water",
-    "since",
-    "guide",
-    "board",
-    "white",
-    "small",
-    "times",
-    "sites",
-    "level",
-    "hours",
-    "image",
-    "title",
-    "shall",
-    "class",
-    "still",
-    "money",
-    "every",
-    "visit",
-    "tools",
-    "reply",
-    "value",
-    "press",
-    "learn",
-    "print",
-    "stock",
-    "point",
-    "sales",
-    "large",
-    "table",
-    "start",
-    "model",
-    "human",
-    "movie",
-    "march",
-    "yahoo",
-    "going",
-    "study",
-    "staff",
-    "again",
-    "never",
-    "users",
-    "topic",
-    "below",
-    "party",
-    "login",
-    "legal",
-    "above",
-    "quote",
-    "story",
-    "rates",
-    "young",
-    "field",
-    "paper",
-    "girls",
-    "night",
-    "texas",
-    "poker",
-    "issue",
-    "range",
-    "court",
-    "audio",
-    "light",
-    "write",
-    "offer",
-    "given",
-    "files",
-    "event",
-    "china",
-    "needs",
-    "might",
-    "month",
-    "major",
-    "areas",
-    "space",
-    "cards",
-    "child",
-    "enter",
-    "share",
-    "added",
-    "radio",
-    "until",
-    "color",
-    "track",
-    "least",
-    "trade",
-    "green",
-    "close",
-    "drive",
-    "short",
-    "means",
-    "daily",
-    "beach",
-    "costs",
-    "style",
-    "front",
-    "parts",
-    "early",
-    "miles",
-    "sound",
-    "works",
-    "rules",
-    "final",
-    "adult",
-    "thing",
-    "cheap",
-    "third",
-    "gifts",
-    "cover",
-    "often",
-    "watch",
-    "deals",
-    "words",
-    "heart",
-    "error",
-    "clear",
-    "makes",
-    "taken",
-    "known",
-    "cases",
-    "quick",
-    "whole",
-    "later",
-    "basic",
-    "shows",
-    "along",
-    "among",
-    "death",
-    "speed",
-    "brand",
-    "stuff",
-    "japan",
-    "doing",
-    "loans",
-    "shoes",
-    "entry",
-    "notes",
-    "force",
-    "river",
-    "album",
-    "views",
-    "plans",
-    "build",
-    "types",
-    "lines",
-    "apply",
-    "asked",
-    "cross",
-    "weeks",
-    "lower",
-    "union",
-    "names",
-    "leave",
-    "teens",
-    "woman",
-    "cable",
-    "score",
-    "shown",
-    "flash",
-    "ideas",
-    "allow",
-    "homes",
-    "super",
-    "cause",
-    "focus",
-    "rooms",
-    "voice",
-    "comes",
-    "brown",
-    "forms",
-    "glass",
-    "happy",
-    "smith",
-    "thank",
-    "prior",
-    "sport",
-    "ready",
-    "round",
-    "built",
-    "blood",
-    "earth",
-    "basis",
-    "award",
-    "peter",
-    "extra",
-    "pussy",
-    "rated",
-    "quite",
-    "horse",
-    "stars",
-    "lists",
-    "owner",
-    "takes",
-    "bring",
-    "input",
-    "agent",
-    "valid",
-    "grand",
-    "trial",
-    "units",
-    "wrote",
-    "ships",
-    "metal",
-    "funds",
-    "guest",
-    "seems",
-    "trust",
-    "grade",
-    "panel",
-    "floor",
-    "match",
-    "plant",
-    "sense",
-    "stage",
-    "goods",
-    "maybe",
-    "youth",
-    "break",
-    "dance",
-    "apple",
-    "enjoy",
-    "block",
-    "civil",
-    "steel",
-    "songs",
-    "fixed",
-    "wrong",
-    "hands",
-    "paris",
-    "fully",
-    "worth",
-    "peace",
-    "coast",
-    "grant",
-    "agree",
-    "blogs",
-    "scale",
-    "stand",
-    "frame",
-    "chief",
-    "gives",
-    "heard",
-    "begin",
-    "royal",
-    "clean",
-    "bible",
-    "suite",
-    "piece",
-    "sheet",
-    "seven",
-    "older",
-    "cells",
-    "looks",
-    "calls",
-    "whose",
-    "naked",
-    "lives",
-    "stone",
-    "tests",
-    "buyer",
-    "label",
-    "canon",
-    "waste",
-    "chair",
-    "phase",
-    "motor",
-    "shirt",
-    "crime",
-    "count",
-    "claim",
-    "patch",
-    "alone",
-    "jones",
-    "saint",
-    "drugs",
-    "joint",
-    "fresh",
-    "dates",
-    "upper",
-    "prime",
-    "limit",
-    "began",
-    "louis",
-    "steps",
-    "shops",
-    "creek",
-    "urban",
-    "tours",
-    "labor",
-    "heavy",
-    "solid",
-    "theme",
-    "porno",
-    "touch",
-    "goals",
-    "serve",
-    "magic",
-    "mount",
-    "smart",
-    "avoid",
-    "birth",
-    "virus",
-    "abuse",
-    "facts",
-    "faith",
-    "chain",
-    "moved",
-    "reach",
-    "sorry",
-    "gamma",
-    "truth",
-    "films",
-    "owned",
-    "draft",
-    "chart",
-    "clubs",
-    "equal",
-    "codes",
-    "kinds",
-    "teams",
-    "funny",
-    "tried",
-    "named",
-    "laser",
-    "harry",
-    "taxes",
-    "mouse",
-    "brain",
-    "dream",
-    "false",
-    "falls",
-    "stats",
-    "carry",
-    "hello",
-    "clips",
-    "brief",
-    "ended",
-    "eight",
-    "wants",
-    "alert",
-    "queen",
-    "sweet",
-    "truck",
-    "votes",
-    "ocean",
-    "signs",
-    "depth",
-    "train",
-    "feeds",
-    "route",
-    "frank",
-    "anime",
-    "speak",
-    "query",
-    "rural",
-    "judge",
-    "bytes",
-    "fight",
-    "filed",
-    "banks",
-    "kelly",
-    "leads",
-    "wales",
-    "minor",
-    "noted",
-    "spent",
-    "helps",
-    "cycle",
-    "sleep",
-    "scene",
-    "drink",
-    "rings",
-    "henry",
-    "guess",
-    "ahead",
-    "devel",
-    "delta",
-    "cisco",
-    "alpha",
-    "bonus",
-    "adobe",
-    "trees",
-    "dress",
-    "refer",
-    "babes",
-    "layer",
-    "spend",
-    "clock",
-    "ratio",
-    "proof",
-    "empty",
-    "ideal",
-    "specs",
-    "parks",
-    "cream",
-    "boxes",
-    "hills",
-    "aware",
-    "shape",
-    "firms",
-    "usage",
-    "mixed",
-    "exist",
-    "wheel",
-    "angel",
-    "width",
-    "noise",
-    "array",
-    "greek",
-    "sharp",
-    "occur",
-    "knows",
-    "coach",
-    "plate",
-    "logic",
-    "sizes",
-    "plain",
-    "costa",
-    "trail",
-    "buddy",
-    "setup",
-    "blues",
-    "scope",
-    "crazy",
-    "bears",
-    "mouth",
-    "meter",
-    "fruit",
-    "lewis",
-    "sugar",
-    "stick",
-    "genre",
-    "slide",
-    "exact",
-    "bound",
-    "storm",
-    "micro",
-    "dolls",
-    "paint",
-    "delay",
-    "pilot",
-    "novel",
-    "ultra",
-    "plays",
-    "truly",
-    "lodge",
-    "boobs",
-    "broad",
-    "swiss",
-    "foods",
-    "guard",
-    "newly",
-    "raise",
-    "drama",
-    "bands",
-    "lunch",
-    "dildo",
-    "audit",
-    "polls",
-    "tower",
-    "yours",
-    "shell",
-    "solar",
-    "catch",
-    "doubt",
-    "tasks",
-    "doors",
-    "forth",
-    "split",
-    "twice",
-    "shift",
-    "marks",
-    "loved",
-    "birds",
-    "saved",
-    "shots",
-    "treat",
-    "piano",
-    "risks",
-    "ports",
-    "teach",
-    "rapid",
-    "hairy",
-    "dutch",
-    "boots",
-    "holds",
-    "pulse",
-    "metro",
-    "strip",
-    "pearl",
-    "penis",
-    "heads",
-    "logos",
-    "honda",
-    "bills",
-    "opera",
-    "asset",
-    "blank",
-    "humor",
-    "lived",
-    "tight",
-    "meant",
-    "plane",
-    "meets",
-    "grace",
-    "villa",
-    "inner",
-    "roman",
-    "taste",
-    "trips",
-    "sides",
-    "turns",
-    "cache",
-    "lease",
-    "proud",
-    "giant",
-    "seats",
-    "alarm",
-    "usual",
-    "angle",
-    "vinyl",
-    "worst",
-    "honor",
-    "eagle",
-    "pants",
-    "nurse",
-    "quiet",
-    "comic",
-    "crown",
-    "maker",
-    "crack",
-    "picks",
-    "smoke",
-    "craft",
-    "apart",
-    "blind",
-    "coins",
-    "gross",
-    "actor",
-    "finds",
-    "fifth",
-    "prize",
-    "dirty",
-    "alive",
-    "prove",
-    "wings",
-    "ridge",
-    "modem",
-    "skill",
-    "moves",
-    "throw",
-    "trend",
-    "busty",
-    "worse",
-    "boats",
-    "tells",
-    "fiber",
-    "graph",
-    "talks",
-    "bonds",
-    "fraud",
-    "roger",
-    "crash",
-    "inter",
-    "grove",
-    "spray",
-    "roads",
-    "faces",
-    "cocks",
-    "mayor",
-    "yield",
-    "hence",
-    "radar",
-    "lakes",
-    "diary",
-    "kings",
-    "flags",
-    "baker",
-    "shock",
-    "walls",
-    "ebony",
-    "drawn",
-    "beast",
-    "dodge",
-    "pizza",
-    "yards",
-    "woods",
-    "jokes",
-    "globe",
-    "kerry",
-    "ghost",
-    "pride",
-    "chile",
-    "maria",
-    "brass",
-    "plaza",
-    "quest",
-    "trans",
-    "booty",
-    "acres",
-    "venue",
-    "vital",
-    "excel",
-    "modes",
-    "enemy",
-    "wells",
-    "opens",
-    "lucky",
-    "thick",
-    "vista",
-    "chips",
-    "terry",
-    "flood",
-    "arena",
-    "grown",
-    "jerry",
-    "smile",
-    "lands",
-    "armed",
-    "laura",
-    "candy",
-    "pills",
-    "tiger",
-    "folks",
-    "balls",
-    "boost",
-    "icons",
-    "moral",
-    "keeps",
-    "pound",
-    "roses",
-    "bread",
-    "tough",
-    "chest",
-    "billy",
-    "solve",
-    "nancy",
-    "tones",
-    "sight",
-    "towns",
-    "worry",
-    "reads",
-    "roles",
-    "glory",
-    "fault",
-    "jimmy",
-    "rugby",
-    "fluid",
-    "devil",
-    "grass",
-    "sized",
-    "manga",
-    "theft",
-    "swing",
-    "dated",
-    "shoot",
-    "elite",
-    "poems",
-    "robot",
-    "winds",
-    "gnome",
-    "roots",
-    "noble",
-    "shore",
-    "loves",
-    "loose",
-    "slots",
-    "rocks",
-    "genes",
-    "horny",
-    "hosts",
-    "atlas",
-    "feels",
-    "ralph",
-    "corps",
-    "liver",
-    "decor",
-    "texts",
-    "fails",
-    "aging",
-    "intro",
-    "clerk",
-    "mills",
-    "jeans",
-    "fonts",
-    "favor",
-    "sigma",
-    "aside",
-    "essay",
-    "camps",
-    "trace",
-    "packs",
-    "spoke",
-    "arrow",
-    "rough",
-    "weird",
-    "holes",
-    "blade",
-    "meals",
-    "robin",
-    "strap",
-    "crowd",
-    "cloud",
-    "valve",
-    "knife",
-    "shelf",
-    "liked",
-    "adopt",
-    "outer",
-    "tales",
-    "nodes",
-    "seeds",
-    "cited",
-    "tired",
-    "steam",
-    "acute",
-    "stood",
-    "carol",
-    "stack",
-    "curve",
-    "amber",
-    "trunk",
-    "waves",
-    "camel",
-    "lamps",
-    "juice",
-    "chase",
-    "sauce",
-    "beads",
-    "flows",
-    "fewer",
-    "proxy",
-    "voted",
-    "bikes",
-    "gates",
-    "slave",
-    "combo",
-    "haven",
-    "charm",
-    "basin",
-    "ranch",
-    "drunk",
-    "toner",
-    "latex",
-    "alien",
-    "broke",
-    "nylon",
-    "discs",
-    "rocky",
-    "fleet",
-    "bunch",
-    "cents",
-    "omega",
-    "civic",
-    "saver",
-    "grill",
-    "grain",
-    "seeks",
-    "gains",
-    "spots",
-    "salon",
-    "turbo",
-    "aimed",
-    "reset",
-    "brush",
-    "spare",
-    "skirt",
-    "honey",
-    "gauge",
-    "faced",
-    "sixth",
-    "farms",
-    "cheat",
-    "sandy",
-    "macro",
-    "laugh",
-    "pitch",
-    "autos",
-    "perry",
-    "dozen",
-    "teeth",
-    "cloth",
-    "stamp",
-    "lotus",
-    "cargo",
-    "likes",
-    "tapes",
-    "zones",
-    "races",
-    "maple",
-    "depot",
-    "blend",
-    "probe",
-    "debug",
-    "chuck",
-    "ebook",
-    "bingo",
-    "minds",
-    "sunny",
-    "cedar",
-    "hopes",
-    "mason",
-    "burns",
-    "pumps",
-    "pairs",
-    "chose",
-    "blast",
-    "tommy",
-    "brake",
-    "congo",
-    "olive",
-    "cyber",
-    "clone",
-    "dicks",
-    "relay",
-    "tears",
-    "oasis",
-    "angry",
-    "lover",
-    "rolls",
-    "daddy",
-    "ferry",
-    "loads",
-    "motel",
-    "rally",
-    "dying",
-    "stuck",
-    "stops",
-    "vocal",
-    "organ",
-    "lemon",
-    "toxic",
-    "bench",
-    "rider",
-    "butts",
-    "bobby",
-    "sheep",
-    "wines",
-    "salad",
-    "paste",
-    "relax",
-    "sword",
-    "sells",
-    "coral",
-    "pixel",
-    "float",
-    "colin",
-    "paths",
-    "acids",
-    "dairy",
-    "admit",
-    "fancy",
-    "squad",
-    "wages",
-    "males",
-    "chaos",
-    "wheat",
-    "bases",
-    "unity",
-    "bride",
-    "begun",
-    "socks",
-    "fever",
-    "drums",
-    "rover",
-    "flame",
-    "tanks",
-    "spell",
-    "annex",
-    "sluts",
-    "hints",
-    "wired",
-    "argue",
-    "arise",
-    "bitch",
-    "chess",
-    "menus",
-    "canal",
-    "amino",
-    "herbs",
-    "lying",
-    "drill",
-    "hobby",
-    "tries",
-    "trick",
-    "drops",
-    "wider",
-    "screw",
-    "blame",
-    "fifty",
-    "uncle",
-    "randy",
-    "brick",
-    "naval",
-    "donna",
-    "cabin",
-    "fired",
-    "tires",
-    "retro",
-    "anger",
-    "suits",
-    "handy",
-    "crops",
-    "guild",
-    "tribe",
-    "batch",
-    "alter",
-    "edges",
-    "twins",
-    "amend",
-    "chick",
-    "thong",
-    "medal",
-    "walks",
-    "sucks",
-    "booth",
-    "indie",
-    "bones",
-    "breed",
-    "polar",
-    "patio",
-    "beans",
-    "snake",
-    "berry",
-    "ought",
-    "fixes",
-    "sends",
-    "timer",
-    "verse",
-    "highs",
-    "racks",
-    "nasty",
-    "tumor",
-    "watts",
-    "forty",
-    "tubes",
-    "queue",
-    "skins",
-    "exams",
-    "welsh",
-    "belly",
-    "elder",
-    "sonic",
-    "thumb",
-    "twist",
-    "ranks",
-    "debut",
-    "penny",
-    "ivory",
-    "remix",
-    "alias",
-    "newer",
-    "spice",
-    "donor",
-    "trash",
-    "manor",
-    "disco",
-    "minus",
-    "shade",
-    "digit",
-    "lions",
-    "pools",
-    "lyric",
-    "grave",
-    "devon",
-    "saves",
-    "lobby",
-    "punch",
-    "karma",
-    "shake",
-    "holly",
-    "silly",
-    "mercy",
-    "fence",
-    "shame",
-    "fatal",
-    "flesh",
-    "jesse",
-    "sheer",
-    "witch",
-    "puppy",
-    "smell",
-    "satin",
-    "promo",
-    "tunes",
-    "nerve",
-    "renew",
-    "locks",
-    "euros",
-    "rebel",
-    "hired",
-    "kills",
-    "slope",
-    "nails",
-    "whats",
-    "rides",
-    "rehab",
-    "merit",
-    "disks",
-    "condo",
-    "fairy",
-    "shaft",
-    "kitty",
-    "drain",
-    "monte",
-    "fires",
-    "panic",
-    "leone",
-    "onion",
-    "beats",
-    "merry",
-    "scuba",
-    "dried",
-    "derby",
-    "steal",
-    "fears",
-    "tuner",
-    "alike",
-    "scout",
-    "dealt",
-    "bucks",
-    "badge",
-    "wrist",
-    "heath",
-    "realm",
-    "jenny",
-    "buses",
-    "rouge",
-    "yeast",
-    "brook",
-    "wives",
-    "xerox",
-    "sorts",
-    "armor",
-    "viral",
-    "pipes",
-    "laden",
-    "merge",
-    "sperm",
-    "craps",
-    "frost",
-    "sally",
-    "yacht",
-    "whale",
-    "shark",
-    "grows",
-    "cliff",
-    "tract",
-    "shine",
-    "diffs",
-    "ozone",
-    "pasta",
-    "serum",
-    "swift",
-    "focal",
-    "samba",
-    "wound",
-    "belle",
-    "lined",
-    "boxed",
-    "cubic",
-    "spies",
-    "elect",
-    "bunny",
-    "chevy",
-    "flyer",
-    "baths",
-    "climb",
-    "token",
-    "belts",
-    "burke",
-    "flush",
-    "johns",
-    "jewel",
-    "teddy",
-    "dryer",
-    "ruled",
-    "funky",
-    "joins",
-    "scary",
-    "cakes",
-    "mixer",
-    "tooth",
-    "stays",
-    "drove",
-    "upset",
-    "mines",
-    "logan",
-    "lance",
-    "colon",
-    "lanes",
-    "purse",
-    "align",
-    "bless",
-    "crest",
-    "alloy",
-    "plots",
-    "draws",
-    "bloom",
-    "loops",
-    "surge",
-    "souls",
-    "spank",
-    "vault",
-    "wires",
-    "mails",
-    "orbit",
-    "bacon",
-    "spine",
-    "trout",
-    "fatty",
-    "oxide",
-    "badly",
-    "scoop",
-    "blink",
-    "tiles",
-    "fuzzy",
-    "grams",
-    "forge",
-    "dense",
-    "brave",
-    "awful",
-    "whore",
-    "wagon",
-    "knock",
-    "peers",
-    "quilt",
-    "mambo",
-    "flour",
-    "choir",
-    "blond",
-    "burst",
-    "fibre",
-    "daisy",
-    "crude",
-    "bored",
-    "fares",
-    "hoped",
-    "safer",
-    "marsh",
-    "theta",
-    "stake",
-    "arbor",
-    "rifle",
-    "bulbs",
-    "waist",
-    "sewer",
-    "romeo",
-    "turks",
-    "demos",
-    "sided",
-    "resin",
-    "linen",
-    "seals",
-    "decay",
-    "usher",
-    "skate",
-    "lynch",
-    "franc",
-    "flats",
-    "heels",
-    "voter",
-    "urine",
-    "towel",
-    "sears",
-    "flies",
-    "crane",
-    "habit",
-    "coupe",
-    "lords",
-    "tends",
-    "sixty",
-    "spark",
-    "spike",
-    "tonga",
-    "backs",
-    "soils",
-    "hunks",
-    "sedan",
-    "cares",
-    "flora",
-    "hardy",
-    "bells",
-    "denim",
-    "doses",
-    "baked",
-    "glove",
-    "plush",
-    "weber",
-    "nelly",
-    "urged",
-    "brent",
-    "adapt",
-    "fuels",
-    "stern",
-    "shawn",
-    "tutor",
-    "idiot",
-    "debit",
-    "edits",
-    "raven",
-    "slice",
-    "aspen",
-    "lemma",
-    "venus",
-    "halls",
-    "pause",
-    "demon",
-    "asses",
-    "couch",
-    "downs",
-    "rogue",
-    "optic",
-    "chili",
-    "grief",
-    "sweat",
-    "masks",
-    "celeb",
-    "quake",
-    "alley",
-    "twain",
-    "buffy",
-    "loyal",
-    "renal",
-    "spite",
-    "imply",
-    "chill",
-    "liner",
-    "lifts",
-    "vivid",
-    "acted",
-    "skull",
-    "riley",
-    "ninja",
-    "sands",
-    "steak",
-    "cobra",
-    "threw",
-    "ninth",
-    "marry",
-    "wills",
-    "atoms",
-    "drake",
-    "rails",
-    "fried",
-    "malls",
-    "woody",
-    "cried",
-    "plugs",
-    "coded",
-    "supra",
-    "molly",
-    "rival",
-    "beige",
-    "homer",
-    "gases",
-    "genus",
-    "debts",
-    "myths",
-    "knees",
-    "poets",
-    "woven",
-    "pedro",
-    "rigid",
-    "salsa",
-    "blown",
-    "baton",
-    "abbey",
-    "evite",
-    "diets",
-    "sauna",
-    "bowls",
-    "cruel",
-    "eager",
-    "chang",
-    "pupil",
-    "feast",
-    "fedex",
-    "ankle",
-    "decks",
-    "blunt",
-    "react",
-    "rises",
-    "coats",
-    "fairs",
-    "flute",
-    "harsh",
-    "cease",
-    "poles",
-    "equip",
-    "hedge",
-    "curry",
-    "worms",
-    "pouch",
-    "hooks",
-    "peaks",
-    "spoon",
-    "bombs",
-    "niche",
-    "cigar",
-    "curse",
-    "titan",
-    "shout",
-    "nudes",
-    "straw",
-    "reuse",
-    "loses",
-    "suede",
-    "peach",
-    "uncut",
-    "stove",
-    "freak",
-    "bluff",
-    "sadly",
-    "avail",
-    "hatch",
-    "stein",
-    "spill",
-    "drift",
-    "crisp",
-    "scans",
-    "onset",
-    "assay",
-    "tents",
-    "snack",
-    "pulls",
-    "squid",
-    "maxim",
-    "slate",
-    "pagan",
-    "widow",
-    "skies",
-    "kicks",
-    "canoe",
-    "juicy",
-    "moody",
-    "pedal",
-    "tuned",
-    "scrap",
-    "terra",
-    "vapor",
-    "aloud",
-    "goose",
-    "hydro",
-    "playa",
-    "noisy",
-    "abide",
-    "bliss",
-    "parse",
-    "jelly",
-    "mania",
-    "bolts",
-    "typed",
-    "cheer",
-    "clamp",
-    "grape",
-    "deeds",
-    "traps",
-    "racer",
-    "guilt",
-    "sweep",
-    "ducks",
-    "lunar",
-    "posed",
-    "forks",
-    "boxer",
-    "weigh",
-    "rodeo",
-    "moose",
-    "crush",
-    "lever",
-    "tasty",
-    "rants",
-    "tarot",
-    "carts",
-    "cocoa",
-    "mixes",
-    "panty",
-    "bulls",
-    "hurry",
-    "clash",
-    "biker",
-    "stain",
-    "reign",
-    "baron",
-    "bates",
-    "stiff",
-    "rabbi",
-    "sushi",
-    "puffy",
-    "elbow",
-    "stark",
-    "circa",
-    "razor",
-    "cough",
-    "isles",
-    "ovens",
-    "inlet",
-    "gloss",
-    "panda",
-    "porch",
-    "eaten",
-    "sinks",
-    "steep",
-    "dinar",
-    "creed",
-    "carat",
-    "faxes",
-    "plump",
-    "midst",
-    "borne",
-    "tempo",
-    "torch",
-    "hacks",
-    "attic",
-    "piper",
-    "stems",
-    "toons",
-    "tenth",
-    "desks",
-    "aided",
-    "cutie",
-    "notch",
-    "lacks",
-    "poses",
-    "scent",
-    "fines",
-    "grasp",
-    "ounce",
-    "toast",
-    "kinky",
-    "quota",
-    "jumbo",
-    "maths",
-    "flint",
-    "dummy",
-    "awake",
-    "burnt",
-    "studs",
-    "roast",
-    "petty",
-    "shiny",
-    "smash",
-    "ample",
-    "scarf",
-    "hated",
-    "spicy",
-    "fools",
-    "beard",
-    "wedge",
-    "ruins",
-    "hyper",
-    "cites",
-    "gamer",
-    "savvy",
-    "norms",
-    "silva",
-    "prima",
-    "fetal",
-    "palms",
-    "chord",
-    "hawks",
-    "irons",
-    "comet",
-    "lotto",
-    "syrup",
-    "erase",
-    "bites",
-    "prose",
-    "swear",
-    "clown",
-    "taboo",
-    "dwarf",
-    "pines",
-    "fucks",
-    "urges",
-    "codec",
-    "beams",
-    "props",
-    "dough",
-    "stool",
-    "welch",
-    "horde",
-    "mommy",
-    "nanny",
-    "roach",
-    "ashes",
-    "natal",
-    "locus",
-    "prone",
-    "clues",
-    "crews",
-    "timed",
-    "scare",
-    "thief",
-    "motif",
-    "hurts",
-    "spear",
-    "birch",
-    "slash",
-    "mikes",
-    "helix",
-    "shook",
-    "matte",
-    "zebra",
-    "fetch",
-    "logon",
-    "unite",
-    "shear",
-    "ponds",
-    "trump",
-    "mates",
-    "avian",
-    "visas",
-    "champ",
-    "recap",
-    "crawl",
-    "flaws",
-    "hazel",
-    "messy",
-    "rupee",
-    "lungs",
-    "jacks",
-    "stole",
-    "quasi",
-    "exile",
-    "anglo",
-    "knots",
-    "kappa",
-    "jumps",
-    "snoop",
-    "vague",
-    "wraps",
-    "rusty",
-    "warns",
-    "sting",
-    "bravo",
-    "liter",
-    "basil",
-    "paced",
-    "shack",
-    "sleek",
-    "ariel",
-    "cafes",
-    "hitch",
-    "nexus",
-    "tango",
-    "sings",
-    "carte",
-    "queer",
-    "pains",
-    "comma",
-    "geeks",
-    "avant",
-    "torah",
-    "freed",
-    "cheek",
-    "lasts",
-    "bowel",
-    "chats",
-    "mafia",
-    "shire",
-    "scams",
-    "lipid",
-    "mains",
-    "misty",
-    "prism",
-    "rests",
-    "vegan",
-    "groom",
-    "weeds",
-    "beers",
-    "fills",
-    "grips",
-    "kayak",
-    "altar",
-    "gears",
-    "risen",
-    "rhino",
-    "ruler",
-    "swept",
-    "troop",
-    "arose",
-    "lesbo",
-    "hogan",
-    "slips",
-    "trays",
-    "flock",
-    "shave",
-    "swamp",
-    "faint",
-    "gland",
-    "blows",
-    "stoke",
-    "nasal",
-    "nitro",
-    "loser",
-    "jolly",
-    "femme",
-    "siege",
-    "tyres",
-    "butte",
-    "hicks",
-    "chalk",
-    "wrath",
-    "grind",
-    "blitz",
-    "cooks",
-    "rainy",
-    "viola",
-    "rumor",
-    "volts",
-    "diver",
-    "blaze",
-    "wreck",
-    "brock",
-    "hoops",
-    "macon",
-    "horns",
-    "risky",
-    "tulip",
-    "owing",
-    "benny",
-    "ropes",
-    "morse",
-    "cords",
-    "ditch",
-    "slick",
-    "chunk",
-    "reels",
-    "slept",
-    "waits",
-    "tenor",
-    "scrub",
-    "cello",
-    "caves",
-    "cocos",
-    "metre",
-    "topaz",
-    "soaps",
-    "dusty",
-    "patty",
-    "crate",
-    "cared",
-    "sworn",
-    "beech",
-    "frogs",
-    "expat",
-    "tense",
-    "foley",
-    "decal",
-    "temps",
-    "fritz",
-    "mover",
-    "erica",
-    "fauna",
-    "detox",
-    "spurs",
-    "ortho",
-    "darts",
-    "tails",
-    "hangs",
-    "quark",
-    "dolce",
-    "veins",
-    "folds",
-    "sneak",
-    "octet",
-    "willy",
-    "tidal",
-    "crust",
-    "dolly",
-    "miner",
-    "diner",
-    "mound",
-    "chefs",
-    "scion",
-    "hoods",
-    "wears",
-    "regal",
-    "curly",
-    "hound",
-    "wharf",
-    "flick",
-    "datum",
-    "maize",
-    "psalm",
-    "gowns",
-    "leaks",
-    "swell",
-    "chico",
-    "irony",
-    "levin",
-    "amiga",
-    "viper",
-    "gypsy",
-    "litre",
-    "binds",
-    "flare",
-    "wight",
-    "crank",
-    "goats",
-    "rains",
-    "brace",
-    "garth",
-    "argus",
-    "mango",
-    "thigh",
-    "meats",
-    "windy",
-    "alamo",
-    "steer",
-    "vogue",
-    "aired",
-    "vodka",
-    "zaire",
-    "knobs",
-    "salts",
-    "soups",
-    "moist",
-    "pests",
-    "petit",
-    "fries",
-    "stall",
-    "serif",
-    "monks",
-    "aloha",
-    "utter",
-    "rents",
-    "cater",
-    "colts",
-    "dunes",
-    "pinch",
-    "troll",
-    "filth",
-    "kraft",
-    "algae",
-    "shady",
-    "erect",
-    "vests",
-    "valet",
-    "jihad",
-    "raped",
-    "taxis",
-    "hates",
-    "tammy",
-    "madam",
-    "tease",
-    "aroma",
-    "rowan",
-    "dwell",
-    "stair",
-    "sonny",
-    "rotor",
-    "quart",
-    "bison",
-    "fungi",
-    "greed",
-    "bleed",
-    "incur",
-    "cores",
-    "nifty",
-    "infos",
-    "dukes",
-    "fudge",
-    "weave",
-    "exits",
-    "cured",
-    "buggy",
-    "recon",
-    "slack",
-    "vines",
-    "gorge",
-    "liens",
-    "cages",
-    "pager",
-    "banjo",
-    "stout",
-    "stare",
-    "missy",
-    "flair",
-    "aisle",
-    "limbs",
-    "paved",
-    "scots",
-    "seize",
-    "spawn",
-    "epoxy",
-    "stony",
-    "crypt",
-    "bogus",
-    "faded",
-    "tying",
-    "diode",
-    "motto",
-    "deter",
-    "furry",
-    "cubes",
-    "rinse",
-    "tides",
-    "venom",
-    "mummy",
-    "cries",
-    "ether",
-    "sheds",
-    "sofas",
-    "boing",
-    "techs",
-    "haute",
-    "wacky",
-    "muddy",
-    "shalt",
-    "visor",
-    "naive",
-    "hires",
-    "folio",
-    "barre",
-    "fiery",
-    "fakes",
-    "acorn",
-    "basal",
-    "smoky",
-    "flirt",
-    "slang",
-    "finch",
-    "largo",
-    "tally",
-    "creep",
-    "agile",
-    "sacks",
-    "kiosk",
-    "ionic",
-    "stray",
-    "poppy",
-    "forte",
-    "waive",
-    "greet",
-    "lymph",
-    "latch",
-    "verbs",
-    "drank",
-    "santo",
-    "torso",
-    "grabs",
-    "wards",
-    "hinge",
-    "stunt",
-    "maven",
-    "vitae",
-    "witty",
-    "hertz",
-    "flown",
-    "silky",
-    "repay",
-    "await",
-    "fetus",
-    "cider",
-    "gangs",
-    "lilac",
-    "sinus",
-    "hears",
-    "pivot",
-    "glide",
-    "creme",
-    "waltz",
-    "blush",
-    "monde",
-    "modal",
-    "cadet",
-    "carbs",
-    "opted",
-    "tweak",
-    "trait",
-    "eater",
-    "hides",
-    "synth",
-    "layup",
-    "nazis",
-    "piles",
-    "bezel",
-    "havoc",
-    "sling",
-    "tummy",
-    "axial",
-    "epoch",
-    "plaid",
-    "fable",
-    "scars",
-    "pesos",
-    "spans",
-    "obese",
-    "sober",
-    "tread",
-    "wigan",
-    "paddy",
-    "mondo",
-    "otter",
-    "earns",
-    "sassy",
-    "vases",
-    "ramps",
-    "dread",
-    "casts",
-    "needy",
-    "weary",
-    "tweed",
-    "snowy",
-    "genie",
-    "chars",
-    "fined",
-    "apron",
-    "aides",
-    "yummy",
-    "momma",
-    "sexes",
-    "husky",
-    "bland",
-    "sails",
-    "robes",
-    "adept",
-    "kudos",
-    "krona",
-    "ester",
-    "servo",
-    "snail",
-    "sutra",
-    "mower",
-    "swine",
-    "heron",
-    "graft",
-    "envoy",
-    "clans",
-    "abort",
-    "edged",
-    "duvet",
-    "spade",
-    "glare",
-    "grids",
-    "haiku",
-    "wafer",
-    "stash",
-    "roofs",
-    "reefs",
-    "semen",
-    "hover",
-    "molds",
-    "genoa",
-    "leafs",
-    "agony",
-    "lacey",
-    "cones",
-    "lupus",
-    "taxed",
-    "gator",
-    "walla",
-    "taped",
-    "docks",
-    "bully",
-    "rhyme",
-    "snort",
-    "triad",
-    "fitch",
-    "cameo",
-    "leach",
-    "fanny",
-    "milky",
-    "combs",
-    "snaps",
-    "hurst",
-    "coils",
-    "navel",
-    "bumps",
-    "sable",
-    "spool",
-    "annoy",
-    "toxin",
-    "axiom",
-    "vents",
-    "mater",
-    "humps",
-    "joker",
-    "hikes",
-    "wiped",
-    "heirs",
-    "twill",
-    "cures",
-    "brink",
-    "truss",
-    "pinot",
-    "khaki",
-    "mould",
-    "gimme",
-    "croft",
-    "penal",
-    "riots",
-    "lapse",
-    "wally",
-    "shrub",
-    "finer",
-    "smack",
-    "cloak",
-    "manic",
-    "choke",
-    "gravy",
-    "payer",
-    "abbas",
-    "moods",
-    "glaze",
-    "infra",
-    "gated",
-    "dizzy",
-    "cribs",
-    "psych",
-    "verge",
-    "nomad",
-    "thorn",
-    "spins",
-    "spoil",
-    "phono",
-    "hoses",
-    "lycra",
-    "sissy",
-    "hymns",
-    "palsy",
-    "cuffs",
-    "xenon",
-    "bayou",
-    "tonic",
-    "potty",
-    "rites",
-    "colby",
-    "ditto",
-    "oddly",
-    "undue",
-    "elves",
-    "chant",
-    "hutch",
-    "tufts",
-    "parry",
-    "raves",
-    "mamma",
-    "folly",
-    "mural",
-    "wager",
-    "purge",
-    "comix",
-    "poser",
-    "perky",
-    "fused",
-    "stump",
-    "scalp",
-    "actin",
-    "melon",
-    "siren",
-    "clasp",
-    "wipes",
-    "krone",
-    "aegis",
-    "derry",
-    "amour",
-    "totes",
-    "thugs",
-    "sonar",
-    "ethyl",
-    "lambs",
-    "ulcer",
-    "ethic",
-    "taxon",
-    "thine",
-    "genet",
-    "opium",
-    "enema",
-    "seams",
-    "barge",
-    "famed",
-    "resid",
-    "slant",
-    "chops",
-    "broom",
-    "snare",
-    "shank",
-    "leash",
-    "hunts",
-    "cunts",
-    "deems",
-    "geese",
-    "polio",
-    "mecca",
-    "broth",
-    "crows",
-    "taper",
-    "revue",
-    "smear",
-    "memos",
-    "serge",
-    "slain",
-    "quail",
-    "mayan",
-    "futon",
-    "icing",
-    "strut",
-    "plume",
-    "plank",
-    "enact",
-    "deity",
-    "claws",
-    "manly",
-    "pings",
-    "peril",
-    "hairs",
-    "quads",
-    "maids",
-    "louie",
-    "swirl",
-    "emery",
-    "abode",
-    "savoy",
-    "comfy",
-    "campo",
-    "polka",
-    "wiper",
-    "nicer",
-    "boast",
-    "gents",
-    "perch",
-    "angst",
-    "gecko",
-    "codex",
-    "judas",
-    "barns",
-    "raids",
-    "solos",
-    "facet",
-    "wares",
-    "verve",
-    "spree",
-    "embed",
-    "gurus",
-    "brute",
-    "butch",
-    "scart",
-    "yarns",
-    "defer",
-    "liars",
-    "saith",
-    "deans",
-    "kites",
-    "dumps",
-    "hanks",
-    "crave",
-    "salty",
-    "zeros",
-    "valor",
-    "sabre",
-    "banda",
-    "goofy",
-    "mimic",
-    "ticks",
-    "vigil",
-    "crore",
-    "banco",
-    "itchy",
-    "bulky",
-    "booze",
-    "widen",
-    "bubba",
-    "adore",
-    "colds",
-    "fluke",
-    "stomp",
-    "glade",
-    "licks",
-    "caste",
-    "libra",
-    "lures",
-    "slows",
-    "flaps",
-    "inset",
-    "druid",
-    "swarm",
-    "ledge",
-    "drown",
-    "bangs",
-    "radon",
-    "abyss",
-    "coder",
-    "niece",
-    "pleas",
-    "flask",
-    "idols",
-    "gusts",
-    "hippo",
-    "dudes",
-    "altos",
-    "overs",
-    "nests",
-    "seton",
-    "tesla",
-    "padre",
-    "plead",
-    "sheen",
-    "warts",
-    "medic",
-    "grail",
-    "seine",
-    "lapel",
-    "pecan",
-    "aches",
-    "telco",
-    "chime",
-    "remit",
-    "exert",
-    "pinto",
-    "pears",
-    "heats",
-    "lucid",
-    "shiva",
-    "infer",
-    "dandy",
-    "swaps",
-    "synod",
-    "lousy",
-    "amigo",
-    "caddy",
-    "brits",
-    "bleak",
-    "tramp",
-    "minis",
-    "stang",
-    "hubby",
-    "safes",
-    "stubs",
-    "dents",
-    "perks",
-    "punto",
-    "vibes",
-    "moons",
-    "lathe",
-    "bylaw",
-    "trims",
-    "leaps",
-    "lends",
-    "crook",
-    "typos",
-    "dives",
-    "stale",
-    "putty",
-    "patsy",
-    "corgi",
-    "swans",
-    "cupid",
-    "cline",
-    "piers",
-    "dykes",
-    "haste",
-    "prong",
-    "expos",
-    "berth",
-    "crabs",
-    "lingo",
-    "piggy",
-    "saber",
-    "lexis",
-    "folic",
-    "lager",
-    "wicca",
-    "doggy",
-    "divas",
-    "babel",
-    "gonzo",
-    "foyer",
-    "brood",
-    "azure",
-    "sniff",
-    "posse",
-    "pixie",
-    "unset",
-    "coles",
-    "melee",
-    "llama",
-    "vowel",
-    "fecal",
-    "humid",
-    "guile",
-    "tutti",
-    "mined",
-    "sores",
-    "titty",
-    "reeds",
-    "lofty",
-    "kanji",
-    "moron",
-    "dogma",
-    "winch",
-    "evils",
-    "limos",
-    "jocks",
-    "unzip",
-    "floss",
-    "sarge",
-    "shawl",
-    "bends",
-    "pence",
-    "thyme",
-    "chino",
-    "zines",
-    "ovary",
-    "bebop",
-    "merle",
-    "flops",
-    "vices",
-    "karat",
-    "ginny",
-    "tolls",
-    "abbot",
-    "magma",
-    "arson",
-    "geeky",
-    "haunt",
-    "fuses",
-    "britt",
-    "braid",
-    "fists",
-    "chimp",
-    "lefty",
-    "heres",
-    "vigor",
-    "tween",
-    "glued",
-    "shuts",
-    "alder",
-    "lawns",
-    "raced",
-    "deuce",
-    "riser",
-    "redux",
-    "quits",
-    "knoll",
-    "inlay",
-    "craze",
-    "roper",
-    "volta",
-    "fumes",
-    "totem",
-    "harms",
-    "carve",
-    "apnea",
-    "swish",
-    "asker",
-    "relic",
-    "ethos",
-    "cling",
-    "toned",
-    "erred",
-    "dared",
-    "nudge",
-    "doves",
-    "skunk",
-    "heaps",
-    "hydra",
-    "anvil",
-    "stalk",
-    "inert",
-    "eject",
-    "rayon",
-    "mocha",
-    "nouns",
-    "tonne",
-    "faxed",
-    "firth",
-    "slams",
-    "cadre",
-    "squat",
-    "zoned",
-    "pubic",
-    "tiara",
-    "hives",
-    "koala",
-    "crock",
-    "retry",
-    "telex",
-    "bowed",
-    "trois",
-    "primo",
-    "clogs",
-    "flank",
-    "looms",
-    "atoll",
-    "ducts",
-    "mules",
-    "spoof",
-    "spout",
-    "hefty",
-    "hoist",
-    "ceres",
-    "sault",
-    "slabs",
-    "agate",
-    "swami",
-    "lofts",
-    "feral",
-    "truce",
-    "laird",
-    "petal",
-    "odors",
-    "dries",
-    "peeps",
-    "waugh",
-    "tiers",
-    "pluck",
-    "prick",
-    "herds",
-    "adder",
-    "ascot",
-    "germs",
-    "grays",
-    "frees",
-    "vixen",
-    "whips",
-    "bally",
-    "fades",
-    "bulge",
-    "slump",
-    "nerds",
-    "enrol",
-    "gloom",
-    "wakes",
-    "marge",
-    "aland",
-    "comps",
-    "edema",
-    "stink",
-    "overt",
-    "slime",
-    "swung",
-    "waved",
-    "libel",
-    "fryer",
-    "garda",
-    "boron",
-    "riffs",
-    "tetra",
-    "vowed",
-    "skier",
-    "tiled",
-    "snuff",
-    "flied",
-    "talon",
-    "sorta",
-    "stint",
-    "liang",
-    "homie",
-    "shred",
-    "sieve",
-    "binge",
-    "jazzy",
-    "limbo",
-    "shove",
-    "sykes",
-    "flake",
-    "mucho",
-    "dumas",
-    "wiser",
-    "flung",
-    "fiche",
-    "juror",
-    "grads",
-    "donut",
-    "paseo",
-    "tabor",
-    "tenet",
-    "chute",
-    "fonds",
-    "mulch",
-    "whine",
-    "fouls",
-    "canes",
-    "diced",
-    "vicar",
-    "prank",
-    "kinks",
-    "delft",
-    "suing",
-    "brine",
-    "piled",
-    "fluff",
-    "unfit",
-    "rouse",
-    "appel",
-    "yucca",
-    "spiel",
-    "gizmo",
-    "scamp",
-    "cysts",
-    "helms",
-    "moths",
-    "evoke",
-    "foxes",
-    "gully",
-    "brill",
-    "gauss",
-    "mites",
-    "agora",
-    "macho",
-    "reeve",
-    "keyed",
-    "jerks",
-    "bagel",
-    "wists",
-    "cults",
-    "amaze",
-    "easel",
-    "carer",
-    "gable",
-    "laced",
-    "quill",
-    "mares",
-    "chaps",
-    "lanai",
-    "fermi",
-    "dimes",
-    "verso",
-    "cleft",
-    "groin",
-    "bower",
-    "latte",
-    "longs",
-    "repro",
-    "swain",
-    "mourn",
-    "girly",
-    "pores",
-    "oiled",
-    "blurb",
-    "moray",
-    "horst",
-    "noses",
-    "erode",
-    "reals",
-    "brisk",
-    "ponce",
-    "eerie",
-    "butyl",
-    "shale",
-    "varna",
-    "anode",
-    "torts",
-    "crepe",
-    "snell",
-    "avert",
-    "guise",
-    "vomit",
-    "bongo",
-    "shaky",
-    "bloke",
-    "necks",
-    "calif",
-    "levee",
-    "chews",
-    "phony",
-    "soles",
-    "jetty",
-    "nukes",
-    "rerun",
-    "jerky",
-    "codon",
-    "argon",
-    "morph",
-    "clams",
-    "speck",
-    "papal",
-    "duets",
-    "labia",
-    "mogul",
-    "vials",
-    "droit",
-    "teeny",
-    "reins",
-    "massa",
-    "aural",
-    "tombs",
-    "frown",
-    "privy",
-    "sepia",
-    "brava",
-    "forts",
-    "hoyle",
-    "levis",
-    "goody",
-    "polos",
-    "jails",
-    "brant",
-    "stork",
-    "tunic",
-    "farce",
-    "howdy",
-    "whack",
-    "drone",
-    "godly",
-    "spire",
-    "stead",
-    "nicks",
-    "shrug",
-    "boils",
-    "covey",
-    "donne",
-    "dials",
-    "aster",
-    "ferns",
-    "curls",
-    "wince",
-    "melts",
-    "wasps",
-    "mitre",
-    "mille",
-    "bosom",
-    "bales",
-    "rapes",
-    "picky",
-    "busts",
-    "lumen",
-    "pious",
-    "tonal",
-    "tarts",
-    "nance",
-    "foggy",
-    "shone",
-    "leafy",
-    "dolor",
-    "trove",
-    "eased",
-    "filer",
-    "lusty",
-    "arias",
-    "steed",
-    "hasty",
-    "munch",
-    "clove",
-    "chica",
-    "preps",
-    "leech",
-    "mylar",
-    "giver",
-    "nymph",
-    "frail",
-    "tikes",
-    "swank",
-    "churn",
-    "madre",
-    "muted",
-    "feats",
-    "bumpy",
-    "aleph",
-    "amine",
-    "spake",
-    "awoke",
-    "parka",
-    "prune",
-    "cairn",
-    "berks",
-    "knits",
-    "kroon",
-    "nutty",
-    "sever",
-    "jello",
-    "toric",
-    "titre",
-    "bonne",
-    "fling",
-    "lindy",
-    "drier",
-    "auger",
-    "dales",
-    "domes",
-    "execs",
-    "hiker",
-    "zloty",
-    "leary",
-    "coeds",
-    "crumb",
-    "pinky",
-    "mints",
-    "yikes",
-    "grate",
-    "fiend",
-    "baits",
-    "wicks",
-    "fleas",
-    "taupe",
-    "heals",
-    "pyrex",
-    "runes",
-    "pique",
-    "swore",
-    "trier",
-    "memes",
-    "wilco",
-    "livre",
-    "cools",
-    "legit",
-    "wands",
-    "fishy",
-    "filmy",
-    "timid",
-    "veils",
-    "cajon",
-    "corby",
-    "lobos",
-    "leaky",
-    "molar",
-    "mamas",
-    "earls",
-    "hyped",
-    "batik",
-    "odour",
-    "gulch",
-    "hoody",
-    "axles",
-    "henna",
-    "bribe",
-    "doped",
-    "towed",
-    "lisle",
-    "canto",
-    "aorta",
-    "delve",
-    "crimp",
-    "lumps",
-    "clout",
-    "feces",
-    "fella",
-    "phage",
-    "alkyl",
-    "paces",
-    "glyph",
-    "plumb",
-    "unify",
-    "briar",
-    "stent",
-    "junta",
-    "grout",
-    "curie",
-    "taker",
-    "janes",
-    "sages",
-    "scorn",
-    "whirl",
-    "hinds",
-    "tibia",
-    "conte",
-    "pesky",
-    "moles",
-    "obits",
-    "shams",
-    "lowes",
-    "knack",
-    "rivet",
-    "aggie",
-    "grunt",
-    "eases",
-    "buffs",
-    "rabid",
-    "cumin",
-    "payee",
-    "nosed",
-    "laces",
-    "aunts",
-    "gemma",
-    "hippy",
-    "strep",
-    "roost",
-    "mitts",
-    "nappy",
-    "evade",
-    "coffs",
-    "lapis",
-    "webby",
-    "shunt",
-    "synch",
-    "sects",
-    "tawny",
-    "mucus",
-    "flips",
-    "aptly",
-    "liege",
-    "sheik",
-    "pints",
-    "piety",
-    "goofs",
-    "froze",
-    "tacit",
-    "modus",
-    "whisk",
-    "unmet",
-    "hails",
-    "mauve",
-    "spore",
-    "crept",
-    "canna",
-    "punks",
-    "frith",
-    "bugle",
-    "fours",
-    "avion",
-    "comer",
-    "tapas",
-    "calla",
-    "redox",
-    "bimbo",
-    "moors",
-    "waged",
-    "waxed",
-    "jaded",
-    "radii",
-    "roomy",
-    "heros",
-    "nears",
-    "lasso",
-    "waxes",
-    "bevel",
-    "coden",
-    "dodgy",
-    "neath",
-    "sucre",
-    "ender",
-    "coney",
-    "brawl",
-    "datos",
-    "tubal",
-    "holla",
-    "chore",
-    "sighs",
-    "wifes",
-    "mises",
-    "karts",
-    "piped",
-    "dells",
-    "boson",
-    "anima",
-    "trams",
-    "octal",
-    "gauze",
-    "gazed",
-    "skips",
-    "moira",
-    "amuse",
-    "fixer",
-    "haves",
-    "idiom",
-    "saggy",
-    "merch",
-    "trawl",
-    "gamut",
-    "pease",
-    "paras",
-    "manta",
-    "compo",
-    "filet",
-    "lorry",
-    "beryl",
-    "saute",
-    "revel",
-    "madly",
-    "gripe",
-    "summa",
-    "forme",
-    "lowly",
-    "scant",
-    "flier",
-    "pours",
-    "amity",
-    "drool",
-    "casas",
-    "lupin",
-    "eidos",
-    "hallo",
-    "tolar",
-    "hades",
-    "zonal",
-    "chemo",
-    "honky",
-    "muses",
-    "freer",
-    "leans",
-    "foils",
-    "buoys",
-    "murky",
-    "tongs",
-    "yanks",
-    "cabal",
-    "poked",
-    "passe",
-    "gnats",
-    "solon",
-    "sysop",
-    "dares",
-    "cynic",
-    "booms",
-    "swipe",
-    "faves",
-    "clays",
-    "pesto",
-    "tanto",
-    "lubes",
-    "bough",
-    "radix",
-    "grist",
-    "sloth",
-    "fates",
-    "stews",
-    "tacky",
-    "drags",
-    "mumps",
-    "chasm",
-    "styli",
-    "masse",
-    "quant",
-    "ravel",
-    "decoy",
-    "grime",
-    "eared",
-    "rigor",
-    "gusto",
-    "footy",
-    "tacos",
-    "dwelt",
-    "hilly",
-    "sager",
-    "caged",
-    "prawn",
-    "algal",
-    "rowdy",
-    "popes",
-    "leger",
-    "torus",
-    "cotta",
-    "chock",
-    "emits",
-    "curio",
-    "voila",
-    "savor",
-    "anion",
-    "tabby",
-    "therm",
-    "hants",
-    "dazed",
-    "sited",
-    "puffs",
-    "fleer",
-    "gourd",
-    "moped",
-    "foray",
-    "filly",
-    "vulva",
-    "libri",
-    "amici",
-    "nodal",
-    "aloft",
-    "mated",
-    "plums",
-    "telly",
-    "slurp",
-    "arles",
-    "tempt",
-    "bathe",
-    "vrouw",
-    "girth",
-    "molto",
-    "lobes",
-    "coals",
-    "brunt",
-    "glens",
-    "ember",
-    "islet",
-    "spode",
-    "gulls",
-    "balsa",
-    "caper",
-    "quack",
-    "drape",
-    "mezzo",
-    "silos",
-    "giddy",
-    "oaths",
-    "hells",
-    "broil",
-    "cacti",
-    "curbs",
-    "cates",
-    "jiffy",
-    "colic",
-    "warms",
-    "saucy",
-    "askew",
-    "groan",
-    "touts",
-    "toile",
-    "antes",
-    "ducky",
-    "abate",
-    "voids",
-    "mossy",
-    "droid",
-    "clots",
-    "hater",
-    "expel",
-    "swoop",
-    "gumbo",
-    "lated",
-    "mavis",
-    "lured",
-    "manna",
-    "soars",
-    "adorn",
-    "dorms",
-    "pimps",
-    "pared",
-    "slums",
-    "squaw",
-    "bouts",
-    "epics",
-    "larva",
-    "growl",
-    "brash",
-    "fader",
-    "slits",
-    "chard",
-    "sully",
-    "inept",
-    "divan",
-    "snark",
-    "papas",
-    "thump",
-    "decaf",
-    "minas",
-    "bruin",
-    "dimer",
-    "dewar",
-    "capes",
-    "salvo",
-    "twigs",
-    "nicol",
-    "degas",
-    "joked",
-    "fared",
-    "fleck",
-    "mists",
-    "zippy",
-    "odeon",
-    "goers",
-    "slugs",
-    "miter",
-    "rafts",
-    "avast",
-    "moans",
-    "eaves",
-    "alibi",
-    "pikes",
-    "peels",
-    "trike",
-    "credo",
-    "femur",
-    "bushy",
-    "grits",
-    "golem",
-    "faked",
-    "affix",
-    "quirk",
-    "flaky",
-    "flite",
-    "domed",
-    "morro",
-    "panes",
-    "treks",
-    "beets",
-    "betta",
-    "repel",
-    "emmet",
-    "litas",
-    "hakim",
-    "puree",
-    "stott",
-    "bonny",
-    "swath",
-    "rouen",
-    "prods",
-    "harem",
-    "fussy",
-    "shoal",
-    "exons",
-    "biota",
-    "heady",
-    "celts",
-    "fives",
-    "hoard",
-    "meson",
-    "senna",
-    "leben",
-    "spelt",
-    "barks",
-    "nerdy",
-    "karoo",
-    "knelt",
-    "glues",
-    "fated",
-    "halts",
-    "yerba",
-    "cinch",
-    "cubed",
-    "dinky",
-    "stirs",
-    "honed",
-    "scrum",
-    "lopes",
-    "snipe",
-    "mirza",
-    "beaux",
-    "litho",
-    "thane",
-    "salve",
-    "winks",
-    "hulls",
-    "friar",
-    "pygmy",
-    "progs",
-    "blume",
-    "pansy",
-    "tabla",
-    "dingo",
-    "baggy",
-    "heist",
-    "wield",
-    "adage",
-    "morel",
-    "budge",
-    "tenge",
-    "silks",
-    "kneel",
-    "masts",
-    "peony",
-    "lense",
-    "batty",
-    "bongs",
-    "twine",
-    "peres",
-    "agape",
-    "comte",
-    "bilge",
-    "chewy",
-    "grins",
-    "busby",
-    "cheep",
-    "pasha",
-    "scour",
-    "leapt",
-    "riyal",
-    "taffy",
-    "boney",
-    "brows",
-    "pacer",
-    "bitty",
-    "flack",
-    "lidar",
-    "crass",
-    "yells",
-    "paisa",
-    "vocab",
-    "durst",
-    "prion",
-    "inked",
-    "licht",
-    "carle",
-    "objet",
-    "rumba",
-    "spunk",
-    "stung",
-    "smirk",
-    "toads",
-    "liber",
-    "lossy",
-    "cramp",
-    "sodom",
-    "conus",
-    "moxie",
-    "gills",
-    "fugue",
-    "speer",
-    "hoary",
-    "penne",
-    "corse",
-    "bleep",
-    "sills",
-    "igloo",
-    "rakes",
-    "burgh",
-    "dikes",
-    "allot",
-    "vesta",
-    "jacky",
-    "meaty",
-    "gages",
-    "egret",
-    "piney",
-    "felon",
-    "nacho",
-    "swims",
-    "spasm",
-    "rimes",
-    "dusky",
-    "proms",
-    "gluon",
-    "slush",
-    "selva",
-    "aphis",
-    "lough",
-    "trios",
-    "vouch",
-    "gales",
-    "gipsy",
-    "ruddy",
-    "fjord",
-    "basso",
-    "fords",
-    "axons",
-    "sorel",
-    "boned",
-    "junky",
-    "dirge",
-    "dames",
-    "runny",
-    "edict",
-    "shrew",
-    "foals",
-    "cased",
-    "prays",
-    "nonce",
-    "plage",
-    "kilns",
-    "karst",
-    "dongs",
-    "mirth",
-    "kilts",
-    "lysis",
-    "booby",
-    "conch",
-    "corny",
-    "noose",
-    "recur",
-    "howes",
-    "takin",
-    "camas",
-    "zooms",
-    "halal",
-    "taint",
-    "chine",
-    "crier",
-    "hamza",
-    "nappa",
-    "beset",
-    "swede",
-    "ramen",
-    "glows",
-    "ladle",
-    "pinks",
-    "surly",
-    "cleat",
-    "sabin",
-    "glebe",
-    "motte",
-    "brews",
-    "laity",
-    "hales",
-    "soyuz",
-    "beefy",
-    "skits",
-    "bursa",
-    "welds",
-    "spiny",
-    "wahoo",
-    "bazar",
-    "clung",
-    "maxis",
-    "iliad",
-    "graze",
-    "afoot",
-    "woken",
-    "hotly",
-    "glitz",
-    "stave",
-    "vertu",
-    "shins",
-    "punts",
-    "crick",
-    "sedge",
-    "rummy",
-    "finca",
-    "stoop",
-    "curvy",
-    "jeeps",
-    "rages",
-    "tithe",
-    "cocky",
-    "beano",
-    "scape",
-    "idler",
-    "dumbo",
-    "slaps",
-    "spate",
-    "semis",
-    "gleam",
-    "halos",
-    "metis",
-    "kilos",
-    "tamer",
-    "trice",
-    "aviso",
-    "pilar",
-    "thorp",
-    "stile",
-    "xenia",
-    "nadir",
-    "gavel",
-    "sahib",
-    "senor",
-    "profs",
-    "foams",
-    "facia",
-    "feist",
-    "spitz",
-    "splat",
-    "snows",
-    "bogey",
-    "nitty",
-    "mages",
-    "vying",
-    "pooch",
-    "glace",
-    "adios",
-    "fatwa",
-    "stade",
-    "whims",
-    "fangs",
-    "rabat",
-    "wiles",
-    "ensue",
-    "conto",
-    "pekin",
-    "slimy",
-    "borer",
-    "clump",
-    "mensa",
-    "tarps",
-    "tilde",
-    "midis",
-    "skids",
-    "skeet",
-    "prowl",
-    "taber",
-    "hoyas",
-    "dimly",
-    "naira",
-    "bijou",
-    "razer",
-    "hymen",
-    "barca",
-    "forgo",
-    "tacks",
-    "brats",
-    "lakhs",
-    "faery",
-    "poise",
-    "duchy",
-    "etude",
-    "gaunt",
-    "rioja",
-    "suave",
-    "tulle",
-    "gabby",
-    "gooey",
-    "bidet",
-    "didst",
-    "carex",
-    "manos",
-    "kendo",
-    "tangy",
-    "artsy",
-    "wilds",
-    "golds",
-    "mache",
-    "brads",
-    "grebe",
-    "blobs",
-    "payed",
-    "rondo",
-    "piste",
-    "whoop",
-    "cacao",
-    "soggy",
-    "linac",
-    "repos",
-    "beret",
-    "golly",
-    "snips",
-    "scrip",
-    "crump",
-    "cyclo",
-    "mince",
-    "frets",
-    "fluor",
-    "hunch",
-    "spurt",
-    "rater",
-    "mazes",
-    "farts",
-    "anise",
-    "rebbe",
-    "pinup",
-    "surah",
-    "spams",
-    "dixit",
-    "swabs",
-    "prise",
-    "terns",
-    "raged",
-    "hosta",
-    "lazar",
-    "hiked",
-    "umbra",
-    "amply",
-    "spits",
-    "loony",
-    "duped",
-    "rumps",
-    "inane",
-    "corky",
-    "yolks",
-    "spook",
-    "amped",
-    "snags",
-    "olden",
-    "tatar",
-    "lyase",
-    "llano",
-    "reedy",
-    "ceded",
-    "amide",
-    "sleds",
-    "wreak",
-    "bloat",
-    "kiwis",
-    "seder",
-    "kylix",
-    "conga",
-    "agave",
-    "beeps",
-    "greys",
-    "wench",
-    "pawns",
-    "quint",
-    "loins",
-    "midge",
-    "glial",
-    "milos",
-    "bream",
-    "imago",
-    "orcas",
-    "jakes",
-    "betas",
-    "omits",
-    "selle",
-    "penna",
-    "ricks",
-    "sleet",
-    "drips",
-    "saree",
-    "polis",
-    "fille",
-    "soapy",
-    "savin",
-    "tardy",
-    "harps",
-    "boner",
-    "smelt",
-    "porns",
-    "renin",
-    "yearn",
-    "paged",
-    "erupt",
-    "loris",
-    "sodas",
-    "dobro",
-    "plats",
-    "daman",
-    "mamie",
-    "upped",
-    "trine",
-    "belay",
-    "slats",
-    "lumpy",
-    "galls",
-    "unary",
-    "heave",
-    "rarer",
-    "ahold",
-    "dobra",
-    "snook",
-    "coven",
-    "mores",
-    "elegy",
-    "sloop",
-    "taunt",
-    "aphid",
-    "myrrh",
-    "chaff",
-    "showy",
-    "emcee",
-    "spied",
-    "aloof",
-    "snore",
-    "silty",
-    "duper",
-    "ochre",
-    "quell",
-    "posit",
-    "clary",
-    "duomo",
-    "dined",
-    "orang",
-    "hijab",
-    "magus",
-    "bores",
-    "silex",
-    "vireo",
-    "gites",
-    "umber",
-    "goths",
-    "areal",
-    "downy",
-    "kudzu",
-    "lemur",
-    "terse",
-    "utile",
-    "trite",
-    "shard",
-    "hanky",
-    "nicad",
-    "kiddy",
-    "sires",
-    "roque",
-    "dowel",
-    "bards",
-    "stags",
-    "pylon",
-    "seedy",
-    "sturt",
-    "caret",
-    "vichy",
-    "weeps",
-    "quoth",
-    "combe",
-    "apres",
-    "testa",
-    "ditty",
-    "skiff",
-    "gummy",
-    "hight",
-    "varia",
-    "rebar",
-    "toney",
-    "sisal",
-    "clave",
-    "pokes",
-    "hunky",
-    "tipsy",
-    "atria",
-    "sagas",
-    "cress",
-    "ficus",
-    "culpa",
-    "froth",
-    "derma",
-    "tubby",
-    "mired",
-    "breve",
-    "rinks",
-    "raver",
-    "smote",
-    "axion",
-    "bolus",
-    "mushy",
-    "dozer",
-    "dowry",
-    "adieu",
-    "snuck",
-    "campy",
-    "awash",
-    "barbs",
-    "clift",
-    "locum",
-    "payor",
-    "aback",
-    "griff",
-    "scaly",
-    "esker",
-    "glint",
-    "stoic",
-    "alums",
-    "amiss",
-    "carbo",
-    "livid",
-    "hares",
-    "pokey",
-    "smite",
-    "alist",
-    "sarin",
-    "chump",
-    "scoot",
-    "ingle",
-    "hyena",
-    "daffy",
-    "blurs",
-    "stabs",
-    "lurks",
-    "klick",
-    "larch",
-    "situs",
-    "boles",
-    "aline",
-    "byway",
-    "pleat",
-    "swash",
-    "tanga",
-    "clank",
-    "marts",
-    "locos",
-    "ruble",
-    "brier",
-    "coves",
-    "noddy",
-    "doers",
-    "blimp",
-    "loopy",
-    "chomp",
-    "rosin",
-    "wilts",
-    "gulag",
-    "macaw",
-    "jager",
-    "opals",
-    "kooks",
-    "dived",
-    "baldy",
-    "crocs",
-    "plier",
-    "loner",
-    "writs",
-    "banal",
-    "rears",
-    "lolly",
-    "guava",
-    "clade",
-    "holed",
-    "wimpy",
-    "snout",
-    "bigot",
-    "goons",
-    "titer",
-    "paves",
-    "balms",
-    "wooly",
-    "irate",
-    "sitar",
-    "pushy",
-    "sheaf",
-    "roars",
-    "bilbo",
-    "dingy",
-    "horas",
-    "lotte",
-    "duals",
-    "azide",
-    "rands",
-    "truer",
-    "limes",
-    "kraut",
-    "reams",
-    "quays",
-    "slung",
-    "bight",
-    "fells",
-    "tucks",
-    "ables",
-    "oxbow",
-    "calyx",
-    "wacko",
-    "copay",
-    "pails",
-    "burly",
-    "mange",
-    "dings",
-    "mowed",
-    "evert",
-    "helio",
-    "leeks",
-    "lusts",
-    "blots",
-    "raked",
-    "gaudy",
-    "swoon",
-    "frosh",
-    "kebab",
-    "yeahs",
-    "ambit",
-    "ghoul",
-    "clack",
-    "whiff",
-    "maile",
-    "caulk",
-    "tilts",
-    "limba",
-    "claro",
-    "flees",
-    "blocs",
-    "sayer",
-    "tarry",
-    "joule",
-    "tuber",
-    "vexed",
-    "micra",
-    "plied",
-    "twang",
-    "ombre",
-    "calms",
-    "obeys",
-    "voile",
-    "kilim",
-    "layed",
-    "ghazi",
-    "whorl",
-    "gouge",
-    "chirp",
-    "gyrus",
-    "ganja",
-    "halve",
-    "tamed",
-    "rower",
-    "aunty",
-    "snafu",
-    "shaul",
-    "prams",
-    "monad",
-    "bandy",
-    "shits",
-    "snide",
-    "satis",
-    "dusts",
-    "gruff",
-    "buxom",
-    "musty",
-    "knead",
-    "lamas",
-    "rebut",
-    "coups",
-    "segue",
-    "dotty",
-    "twirl",
-    "ingot",
-    "mimeo",
-    "guppy",
-    "signa",
-    "rooks",
-    "telia",
-    "homey",
-    "glean",
-    "sayed",
-    "bogle",
-    "poppa",
-    "dinos",
-    "pasty",
-    "paver",
-    "shoji",
-    "agios",
-    "ovals",
-    "crone",
-    "pubes",
-    "tical",
-    "matts",
-    "thunk",
-    "laver",
-    "peeks",
-    "creel",
-    "delis",
-    "fosse",
-    "stull",
-    "pater",
-    "mused",
-    "shays",
-    "skank",
-    "rebus",
-    "luger",
-    "foamy",
-    "lurid",
-    "hansa",
-    "pampa",
-    "mulls",
-    "hoots",
-    "whiny",
-    "huffy",
-    "qubit",
-    "bests",
-    "tinge",
-    "scuff",
-    "quips",
-    "loran",
-    "cruse",
-    "evens",
-    "muffs",
-    "telos",
-    "chums",
-    "tomes",
-    "pisos",
-    "miser",
-    "phlox",
-    "sakes",
-    "tepid",
-    "slurs",
-    "doula",
-    "smock",
-    "sired",
-    "sooty",
-    "cubby",
-    "porky",
-    "bourg",
-    "covet",
-    "gyros",
-    "minty",
-    "loons",
-    "cuddy",
-    "cored",
-    "parle",
-    "dears",
-    "tints",
-    "waver",
-    "conic",
-    "bares",
-    "strum",
-    "omens",
-    "rheum",
-    "vanes",
-    "sappy",
-    "mocks",
-    "natty",
-    "pinko",
-    "elude",
-    "tripe",
-    "gault",
-    "becks",
-    "saran",
-    "bento",
-    "bromo",
-    "liven",
-    "spilt",
-    "dunks",
-    "bunks",
-    "feria",
-    "peeve",
-    "gutsy",
-    "nooks",
-    "selah",
-    "shyly",
-    "scone",
-    "throb",
-    "duels",
-    "kalam",
-    "shims",
-    "miler",
-    "evict",
-    "neigh",
-    "balmy",
-    "toots",
-    "zesty",
-    "murry",
-    "canny",
-    "rifts",
-    "vroom",
-    "taiga",
-    "rumen",
-    "deoxy",
-    "krill",
-    "skein",
-    "moldy",
-    "matin",
-    "oriel",
-    "nines",
-    "aught",
-    "unban",
-    "narco",
-    "gules",
-    "corks",
-    "plows",
-    "waker",
-    "chins",
-    "rance",
-    "perms",
-    "tryst",
-    "fossa",
-    "cotes",
-    "lurch",
-    "allee",
-    "quash",
-    "hokey",
-    "mufti",
-    "gasps",
-    "septa",
-    "spars",
-    "frise",
-    "howls",
-    "sneer",
-    "curia",
-    "allay",
-    "decry",
-    "sizer",
-    "gusty",
-    "sucky",
-    "usury",
-    "redes",
-    "hooch",
-    "alway",
-    "steno",
-    "plies",
-    "leper",
-    "foram",
-    "oldie",
-    "tater",
-    "maxed",
-    "canst",
-    "muons",
-    "lunge",
-    "swale",
-    "hosed",
-    "rives",
-    "wrens",
-    "tenon",
-    "novae",
-    "yager",
-    "polyp",
-    "refit",
-    "dosed",
-    "boite",
-    "pucks",
-    "kerns",
-    "trapt",
-    "slink",
-    "droll",
-    "endow",
-    "razed",
-    "manus",
-    "sokol",
-    "klutz",
-    "joist",
-    "fizzy",
-    "mongo",
-    "offal",
-    "dawns",
-    "mungo",
-    "staid",
-    "pithy",
-    "shirk",
-    "pangs",
-    "knell",
-    "exalt",
-    "liana",
-    "wisps",
-    "oaten",
-    "burbs",
-    "zingy",
-    "laker",
-    "durum",
-    "guano",
-    "boars",
-    "afore",
-    "begat",
-    "ripen",
-    "brawn",
-    "pacts",
-    "putts",
-    "stipe",
-    "doody",
-    "batts",
-    "sunna",
-    "flyby",
-    "wring",
-    "stilt",
-    "pavan",
-    "seeps",
-    "slims",
-    "roped",
-    "clang",
-    "djinn",
-    "coble",
-    "saris",
-    "bared",
-    "humus",
-    "lauds",
-    "pales",
-    "blain",
-    "felts",
-    "tykes",
-    "solus",
-    "frock",
-    "wrest",
-    "runic",
-    "shute",
-    "copes",
-    "recto",
-    "ashen",
-    "thiol",
-    "snarl",
-    "waned",
-    "punky",
-    "kemps",
-    "finis",
-    "rishi",
-    "leggy",
-    "halon",
-    "nulls",
-    "caved",
-    "corns",
-    "wushu",
-    "dados",
-    "bocce",
-    "amass",
-    "iliac",
-    "arete",
-    "techy",
-    "spiky",
-    "bogan",
-    "sumac",
-    "dower",
-    "ricin",
-    "wordy",
-    "reeks",
-    "bogie",
-    "jaunt",
-    "agers",
-    "spier",
-    "wifey",
-    "rares",
-    "oleic",
-    "octyl",
-    "imams",
-    "dicky",
-    "hoppy",
-    "gorse",
-    "louse",
-    "burro",
-    "ileum",
-    "bassi",
-    "scoff",
-    "maser",
-    "musky",
-    "furor",
-    "oomph",
-    "casks",
-    "wader",
-    "sixes",
-    "frere",
-    "tikka",
-    "dregs",
-    "udder",
-    "asana",
-    "sewed",
-    "tushy",
-    "rubel",
-    "malts",
-    "sabra",
-    "biome",
-    "echos",
-    "scull",
-    "flume",
-    "manas",
-    "bakes",
-    "pacha",
-    "aedes",
-    "hafiz",
-    "atman",
-    "rungs",
-    "lytic",
-    "seely",
-    "edger",
-    "garni",
-    "mamba",
-    "trill",
-    "borax",
-    "wimps",
-    "coped",
-    "fubar",
-    "chiao",
-    "lowed",
-    "usurp",
-    "staph",
-    "chubs",
-    "galax",
-    "aggro",
-    "gilly",
-    "kapok",
-    "crags",
-    "bodes",
-    "homed",
-    "tates",
-    "scold",
-    "dewan",
-    "tress",
-    "folia",
-    "sawed",
-    "croak",
-    "abhor",
-    "peart",
-    "reman",
-    "dopey",
-    "tweet",
-    "leery",
-    "rowed",
-    "elfin",
-    "emote",
-    "meads",
-    "loupe",
-    "jumpy",
-    "poons",
-    "frags",
-    "testy",
-    "pasts",
-    "loach",
-    "infix",
-    "liras",
-    "geode",
-    "minim",
-    "riven",
-    "jeers",
-    "soaks",
-    "kurta",
-    "kamik",
-    "snobs",
-    "taxol",
-    "dicta",
-    "clink",
-    "weirs",
-    "whigs",
-    "shill",
-    "bossy",
-    "arras",
-    "whist",
-    "sayid",
-    "ketch",
-    "dobie",
-    "bicep",
-    "softs",
-    "lunes",
-    "dural",
-    "lapin",
-    "manes",
-    "swart",
-    "vanda",
-    "weald",
-    "dicey",
-    "hocus",
-    "dowdy",
-    "rials",
-    "dungy",
-    "dilly",
-    "gamba",
-    "folky",
-    "prost",
-    "dobby",
-    "stuns",
-    "cuvee",
-    "sikes",
-    "bawdy",
-    "beaut",
-    "joust",
-    "weedy",
-    "sacra",
-    "grope",
-    "booed",
-    "ghast",
-    "afoul",
-    "hames",
-    "hance",
-    "ology",
-    "altho",
-    "blest",
-    "mesas",
-    "feuds",
-    "toque",
-    "primi",
-    "milks",
-    "tains",
-    "cilia",
-    "pinon",
-    "torte",
-    "rajah",
-    "outed",
-    "comal",
-    "gazes",
-    "twats",
-    "peppy",
-    "loess",
-    "humic",
-    "sulky",
-    "egger",
-    "sylva",
-    "droop",
-    "waded",
-    "cuppa",
-    "liane",
-    "grubs",
-    "flail",
-    "eland",
-    "ardor",
-    "tinny",
-    "sexed",
-    "talus",
-    "dures",
-    "apace",
-    "loral",
-    "carob",
-    "andro",
-    "auxin",
-    "boric",
-    "dross",
-    "yucky",
-    "lurex",
-    "hauls",
-    "lunas",
-    "dorky",
-    "baler",
-    "mutes",
-    "kooky",
-    "bundt",
-    "ached",
-    "xylem",
-    "atone",
-    "valse",
-    "douce",
-    "paler",
-    "cuter",
-    "frisk",
-    "oiler",
-    "cella",
-    "pumas",
-    "loath",
-    "remap",
-    "neves",
-    "bindi",
-    "exult",
-    "claps",
-    "pipet",
-    "nomen",
-    "rubus",
-    "gomer",
-    "spews",
-    "galas",
-    "vetch",
-    "carrs",
-    "stour",
-    "toyed",
-    "extol",
-    "knave",
-    "croup",
-    "quire",
-    "brags",
-    "bails",
-    "moats",
-    "dirks",
-    "ratty",
-    "pilaf",
-    "scree",
-    "lamer",
-    "gunny",
-    "antic",
-    "hirer",
-    "fowls",
-    "coons",
-    "berms",
-    "nudie",
-    "leman",
-    "genom",
-    "cushy",
-    "husks",
-    "raved",
-    "reaps",
-    "recut",
-    "cesta",
-    "scrim",
-    "gilts",
-    "nihil",
-    "ovine",
-    "untie",
-    "annul",
-    "lanky",
-    "vises",
-    "outdo",
-    "dorks",
-    "stich",
-    "mammy",
-    "beaks",
-    "hexes",
-    "banns",
-    "ennui",
-    "purer",
-    "trave",
-    "porgy",
-    "colas",
-    "perse",
-    "bleat",
-    "coops",
-    "thins",
-    "pappy",
-    "tanka",
-    "fasts",
-    "sprig",
-    "ovate",
-    "tinea",
-    "danio",
-    "dally",
-    "spica",
-    "duces",
-    "tings",
-    "linky",
-    "cobbs",
-    "shorn",
-    "jebel",
-    "orals",
-    "exude",
-    "gamin",
-    "surfs",
-    "jiggy",
-    "amble",
-    "fiver",
-    "aurum",
-    "ducal",
-    "sooth",
-    "aider",
-    "campi",
-    "tuxes",
-    "sabot",
-    "ceiba",
-    "scram",
-    "jawed",
-    "ulnar",
-    "lobed",
-    "vagus",
-    "yogic",
-    "grimy",
-    "demic",
-    "burrs",
-    "toros",
-    "loamy",
-    "jinks",
-    "biddy",
-    "crony",
-    "sambo",
-    "swags",
-    "duffs",
-    "teary",
-    "sower",
-    "kiddo",
-    "bombe",
-    "nuked",
-    "satyr",
-    "pares",
-    "yokes",
-    "drams",
-    "graal",
-    "fount",
-    "meany",
-    "lithe",
-    "tusks",
-    "bitsy",
-    "robed",
-    "pelts",
-    "auras",
-    "skied",
-    "panto",
-    "seers",
-    "begum",
-    "klong",
-    "cluck",
-    "marly",
-    "pions",
-    "cutty",
-    "tasse",
-    "pates",
-    "cubit",
-    "brome",
-    "vinca",
-    "kazoo",
-    "gaffe",
-    "liken",
-    "nosey",
-    "kauri",
-    "toddy",
-    "malic",
-    "mesic",
-    "spoor",
-    "disci",
-    "doily",
-    "wowed",
-    "chink",
-    "satay",
-    "gaily",
-    "harts",
-    "allyl",
-    "henge",
-    "oozes",
-    "kluge",
-    "tatty",
-    "divot",
-    "sutta",
-    "tines",
-    "gazer",
-    "chics",
-    "chert",
-    "arcus",
-    "frizz",
-    "pipit",
-    "eider",
-    "junto",
-    "novas",
-    "emmys",
-    "wooed",
-    "glans",
-    "pulps",
-    "biter",
-    "doeth",
-    "belga",
-    "warps",
-    "wonks",
-    "sedum",
-    "undid",
-    "purrs",
-    "brees",
-    "betel",
-    "wonky",
-    "unwed",
-    "syncs",
-    "clued",
-    "boggy",
-    "tunas",
-    "lifer",
-    "meted",
-    "outre",
-    "mucin",
-    "creak",
-    "benni",
-    "splay",
-    "dupes",
-    "larks",
-    "voles",
-    "eclat",
-    "mutts",
-    "ghyll",
-    "irked",
-    "monos",
-    "chiro",
-    "toils",
-    "minke",
-    "scabs",
-    "ostia",
-    "abled",
-    "stoma",
-    "nates",
-    "ravin",
-    "jukes",
-    "gongs",
-    "raper",
-    "cully",
-    "wrung",
-    "manse",
-    "wests",
-    "augur",
-    "hosen",
-    "motes",
-    "idyll",
-    "birks",
-    "frits",
-    "riled",
-    "pacey",
-    "kyrie",
-    "veers",
-    "beget",
-    "diwan",
-    "wispy",
-    "inure",
-    "dryad",
-    "chafe",
-    "tapis",
-    "deary",
-    "kohls",
-    "nobly",
-    "bunko",
-    "fixit",
-    "skint",
-    "nobby",
-    "sigil",
-    "bulla",
-    "tippy",
-    "serfs",
-    "jammy",
-    "stupa",
-    "womyn",
-    "feign",
-    "mealy",
-    "boule",
-    "zilch",
-    "pupae",
-    "shuck",
-    "neons",
-    "annas",
-    "mafic",
-    "haply",
-    "scowl",
-    "belch",
-    "limey",
-    "liger",
-    "torii",
-    "sidhe",
-    "nisus",
-    "plonk",
-    "ohmic",
-    "dices",
-    "pitta",
-    "shive",
-    "dines",
-    "whizz",
-    "capon",
-    "afire",
-    "sowed",
-    "gloat",
-    "joram",
-    "thuja",
-    "tames",
-    "nites",
-    "squib",
-    "topos",
-    "gowan",
-    "coots",
-    "dunce",
-    "lagan",
-    "massy",
-    "hoofs",
-    "drawl",
-    "chive",
-    "setae",
-    "barbe",
-    "sibyl",
-    "smolt",
-    "kissy",
-    "noirs",
-    "warty",
-    "clefs",
-    "mucky",
-    "sangh",
-    "vinos",
-    "moire",
-    "canty",
-    "vapid",
-    "aglow",
-    "fetes",
-    "skeen",
-    "swamy",
-    "sprue",
-    "trope",
-    "avers",
-    "groks",
-    "quale",
-    "fumed",
-    "kloof",
-    "nieve",
-    "segno",
-    "washy",
-    "welly",
-    "teats",
-    "verts",
-    "junco",
-    "netop",
-    "catty",
-    "crake",
-    "devas",
-    "skimp",
-    "caned",
-    "aerie",
-    "harpy",
-    "chela",
-    "singe",
-    "plunk",
-    "veena",
-    "donee",
-    "mutch",
-    "abuts",
-    "whoso",
-    "beefs",
-    "picot",
-    "fores",
-    "beton",
-    "caput",
-    "peavy",
-    "routh",
-    "deism",
-    "fests",
-    "yogis",
-    "raspy",
-    "ovoid",
-    "imbue",
-    "slags",
-    "ogres",
-    "ambos",
-    "acrid",
-    "matey",
-    "snarf",
-    "volte",
-    "comas",
-    "vagal",
-    "inker",
-    "youse",
-    "jolts",
-    "forbs",
-    "belie",
-    "slyly",
-    "shied",
-    "opine",
-    "thein",
-    "lutes",
-    "plait",
-    "namer",
-    "lysed",
-    "soled",
-    "ileal",
-    "geoid",
-    "oping",
-    "turds",
-    "zooey",
-    "wails",
-    "fazed",
-    "fagin",
-    "dolci",
-    "abuzz",
-    "alkyd",
-    "spuds",
-    "scald",
-    "tilak",
-    "tyers",
-    "lader",
-    "skink",
-    "ramie",
-    "hadst",
-    "rowen",
-    "leant",
-    "ergot",
-    "hards",
-    "siver",
-    "trots",
-    "grama",
-    "stank",
-    "mazer",
-    "tills",
-    "bahts",
-    "culex",
-    "botts",
-    "yawns",
-    "frill",
-    "vamps",
-    "dooms",
-    "macks",
-    "aahed",
-    "aalii",
-    "aargh",
-    "abaca",
-    "abaci",
-    "abaft",
-    "abaka",
-    "abamp",
-    "abase",
-    "abash",
-    "abaya",
-    "abbes",
-    "abeam",
-    "abele",
-    "abets",
-    "abler",
-    "abmho",
-    "abohm",
-    "aboil",
-    "aboma",
-    "aboon",
-    "abris",
-    "abyes",
-    "abysm",
-    "acari",
-    "acerb",
-    "aceta",
-    "achoo",
-    "acidy",
-    "acing",
-    "acini",
-    "ackee",
-    "acmes",
-    "acmic",
-    "acned",
-    "acnes",
-    "acock",
-    "acold",
-    "acred",
-    "acyls",
-    "addax",
-    "addle",
-    "adeem",
-    "adits",
-    "adman",
-    "admen",
-    "admix",
-    "adobo",
-    "adown",
-    "adoze",
-    "adunc",
-    "adust",
-    "adyta",
-    "adzed",
-    "adzes",
-    "aecia",
-    "aeons",
-    "afars",
-    "afrit",
-    "agama",
-    "agars",
-    "agaze",
-    "agene",
-    "agger",
-    "aghas",
-    "agism",
-    "agist",
-    "agita",
-    "aglee",
-    "aglet",
-    "agley",
-    "agmas",
-    "agone",
-    "agons",
-    "agria",
-    "agues",
-    "ahing",
-    "ahull",
-    "ailed",
-    "aimer",
-    "aioli",
-    "airer",
-    "airns",
-    "airth",
-    "airts",
-    "aitch",
-    "aiver",
-    "ajiva",
-    "ajuga",
-    "akees",
-    "akela",
-    "akene",
-    "alack",
-    "alane",
-    "alang",
-    "alans",
-    "alant",
-    "alary",
-    "alate",
-    "albas",
-    "alcid",
-    "aldol",
-    "alecs",
-    "alefs",
-    "alfas",
-    "algas",
-    "algid",
-    "algin",
-    "algor",
-    "algum",
-    "alifs",
-    "aliya",
-    "alkie",
-    "allod",
-    "almah",
-    "almas",
-    "almeh",
-    "almes",
-    "almud",
-    "almug",
-    "aloes",
-    "aloin",
-    "alula",
-    "amahs",
-    "amain",
-    "ambry",
-    "ameba",
-    "ameer",
-    "amens",
-    "ament",
-    "amias",
-    "amice",
-    "amido",
-    "amids",
-    "amies",
-    "amins",
-    "amirs",
-    "ammos",
-    "amnia",
-    "amnic",
-    "amnio",
-    "amoks",
-    "amole",
-    "amort",
-    "ampul",
-    "amuck",
-    "amyls",
-    "ancho",
-    "ancon",
-    "anear",
-    "anele",
-    "anent",
-    "angas",
-    "anile",
-    "anils",
-    "animi",
-    "ankhs",
-    "ankus",
-    "anlas",
-    "annal",
-    "anoas",
-    "anole",
-    "anomy",
-    "ansae",
-    "antae",
-    "antas",
-    "anted",
-    "antis",
-    "antra",
-    "antre",
-    "antsy",
-    "anyon",
-    "apeak",
-    "apeek",
-    "apers",
-    "apery",
-    "apian",
-    "aping",
-    "apish",
-    "apods",
-    "aport",
-    "appal",
-    "apses",
-    "apsis",
-    "apter",
-    "aquae",
-    "aquas",
-    "araks",
-    "arame",
-    "arced",
-    "ardeb",
-    "areae",
-    "areca",
-    "areic",
-    "arene",
-    "arepa",
-    "argal",
-    "argil",
-    "argle",
-    "argol",
-    "argot",
-    "arhat",
-    "arils",
-    "armer",
-    "armet",
-    "aroid",
-    "arpen",
-    "arris",
-    "arses",
-    "arsis",
-    "artal",
-    "artel",
-    "arums",
-    "arval",
-    "arvos",
-    "aryls",
-    "ascus",
-    "asdic",
-    "ashed",
-    "askoi",
-    "askos",
-    "asper",
-    "aspic",
-    "aspis",
-    "assai",
-    "astir",
-    "asyla",
-    "ataps",
-    "ataxy",
-    "atilt",
-    "atmas",
-    "atomy",
-    "atony",
-    "atopy",
-    "atrip",
-    "attar",
-    "audad",
-    "aulic",
-    "aurae",
-    "aurar",
-    "aurei",
-    "aures",
-    "auric",
-    "auris",
-    "avens",
-    "avgas",
-    "avows",
-    "awing",
-    "awned",
-    "awols",
-    "axels",
-    "axile",
-    "axils",
-    "axing",
-    "axite",
-    "axled",
-    "axman",
-    "axmen",
-    "axone",
-    "ayahs",
-    "ayins",
-    "azans",
-    "azido",
-    "azine",
-    "azlon",
-    "azoic",
-    "azole",
-    "azons",
-    "azote",
-    "azoth",
-    "azuki",
-    "baaed",
-    "baals",
-    "babas",
-    "babka",
-    "baboo",
-    "babul",
-    "babus",
-    "bacca",
-    "baddy",
-    "baffs",
-    "baffy",
-    "bairn",
-    "baith",
-    "baiza",
-    "baize",
-    "balas",
-    "balds",
-    "baled",
-    "balks",
-    "balky",
-    "baned",
-    "banes",
-    "banty",
-    "barde",
-    "barer",
-    "barfs",
-    "baric",
-    "barky",
-    "barms",
-    "barmy",
-    "barny",
-    "barye",
-    "baser",
-    "basks",
-    "bassy",
-    "baste",
-    "basts",
-    "bated",
-    "battu",
-    "bauds",
-    "baulk",
-    "bawds",
-    "bawls",
-    "bawty",
-    "bayed",
-    "bazoo",
-    "beady",
-    "beaky",
-    "beamy",
-    "beaus",
-    "becap",
-    "bedel",
-    "bedew",
-    "bedim",
-    "beedi",
-    "beery",
-    "befit",
-    "befog",
-    "begot",
-    "beigy",
-    "belon",
-    "bemas",
-    "bemix",
-    "bendy",
-    "benes",
-    "benne",
-    "bents",
-    "bergs",
-    "berme",
-    "beses",
-    "besom",
-    "besot",
-    "beths",
-    "bevor",
-    "bewig",
-    "bezil",
-    "bhang",
-    "bhoot",
-    "bhuts",
-    "biali",
-    "bialy",
-    "bibbs",
-    "bices",
-    "bided",
-    "bider",
-    "bides",
-    "bidis",
-    "bield",
-    "biers",
-    "biffs",
-    "biffy",
-    "bifid",
-    "biggy",
-    "bigly",
-    "bigos",
-    "biked",
-    "bikie",
-    "bilby",
-    "biles",
-    "bilgy",
-    "bilks",
-    "bimah",
-    "bimas",
-    "binal",
-    "biner",
-    "bines",
-    "binit",
-    "bints",
-    "biogs",
-    "biont",
-    "biped",
-    "bipod",
-    "birle",
-    "birls",
-    "biros",
-    "birrs",
-    "birse",
-    "bises",
-    "bisks",
-    "bitts",
-    "bizes",
-    "blabs",
-    "blaff",
-    "blahs",
-    "blams",
-    "blare",
-    "blase",
-    "blate",
-    "blats",
-    "blawn",
-    "blaws",
-    "blear",
-    "blebs",
-    "blent",
-    "blets",
-    "blimy",
-    "blini",
-    "blips",
-    "blite",
-    "bloop",
-    "blowy",
-    "blubs",
-    "blued",
-    "bluer",
-    "bluet",
-    "bluey",
-    "blurt",
-    "blype",
-    "boart",
-    "bocci",
-    "boche",
-    "bocks",
-    "boded",
-    "boffo",
-    "boffs",
-    "bohea",
-    "bohos",
-    "boink",
-    "bolar",
-    "bolas",
-    "bolds",
-    "bolls",
-    "bolos",
-    "bonks",
-    "bonze",
-    "boody",
-    "boogy",
-    "boomy",
-    "boons",
-    "boors",
-    "boozy",
-    "boral",
-    "boras",
-    "borks",
-    "borts",
-    "borty",
-    "bortz",
-    "bosks",
-    "bosky",
-    "bosun",
-    "botas",
-    "botch",
-    "botel",
-    "bothy",
-    "bourn",
-    "bouse",
-    "bousy",
-    "bovid",
-    "bowse",
-    "boyar",
-    "boyla",
-    "boyos",
-    "bozos",
-    "brach",
-    "bract",
-    "braes",
-    "brail",
-    "braky",
-    "brank",
-    "brans",
-    "bravi",
-    "braws",
-    "braxy",
-    "brays",
-    "braza",
-    "braze",
-    "brede",
-    "brens",
-    "bries",
-    "brigs",
-    "brims",
-    "brins",
-    "briny",
-    "brios",
-    "briss",
-    "brith",
-    "bronc",
-    "broos",
-    "brose",
-    "brosy",
-    "brugh",
-    "bruit",
-    "brume",
-    "brung",
-    "brusk",
-    "bruts",
-    "bubal",
-    "bubby",
-    "bubus",
-    "bucko",
-    "buffi",
-    "buffo",
-    "buhls",
-    "buhrs",
-    "bulgy",
-    "bulks",
-    "bumfs",
-    "bumph",
-    "bunas",
-    "bunco",
-    "bunds",
-    "bungs",
-    "bunns",
-    "bunts",
-    "bunya",
-    "buppy",
-    "buran",
-    "buras",
-    "burds",
-    "buret",
-    "burgs",
-    "burin",
-    "burka",
-    "burls",
-    "burps",
-    "burqa",
-    "burry",
-    "burse",
-    "bused",
-    "busks",
-    "buteo",
-    "butes",
-    "butle",
-    "butty",
-    "butut",
-    "bwana",
-    "byres",
-    "byrls",
-    "byssi",
-    "cabby",
-    "caber",
-    "cabob",
-    "cacas",
-    "cades",
-    "cadge",
-    "cadgy",
-    "cadis",
-    "caeca",
-    "caffs",
-    "cager",
-    "cagey",
-    "cahow",
-    "caids",
-    "cains",
-    "caird",
-    "caked",
-    "cakey",
-    "calfs",
-    "calix",
-    "calks",
-    "calos",
-    "calve",
-    "cames",
-    "camos",
-    "caner",
-    "canid",
-    "canso",
-    "cants",
-    "caped",
-    "caphs",
-    "capiz",
-    "capos",
-    "carks",
-    "carls",
-    "carns",
-    "carny",
-    "carom",
-    "carpi",
-    "carps",
-    "carse",
-    "casky",
-    "casus",
-    "cauld",
-    "cauls",
-    "caver",
-    "cavie",
-    "cavil",
-    "cawed",
-    "cebid",
-    "cecal",
-    "cecum",
-    "ceder",
-    "cedes",
-    "cedis",
-    "ceili",
-    "ceils",
-    "celli",
-    "celom",
-    "cense",
-    "cento",
-    "centu",
-    "ceorl",
-    "cepes",
-    "cerci",
-    "cered",
-    "ceria",
-    "ceric",
-    "ceros",
-    "cesti",
-    "cetes",
-    "chads",
-    "chais",
-    "chams",
-    "chape",
-    "chapt",
-    "chare",
-    "chark",
-    "charr",
-    "chary",
-    "chaws",
-    "chays",
-    "cheth",
-    "chias",
-    "chide",
-    "chiel",
-    "chimb",
-    "chirk",
-    "chirm",
-    "chirr",
-    "chiru",
-    "chits",
-    "chivy",
-    "choky",
-    "chola",
-    "cholo",
-    "chook",
-    "chott",
-    "chows",
-    "chufa",
-    "chuff",
-    "chugs",
-    "churl",
-    "churr",
-    "chyle",
-    "chyme",
-    "cibol",
-    "cimex",
-    "cines",
-    "cions",
-    "cires",
-    "cirri",
-    "cissy",
-    "cists",
-    "citer",
-    "civet",
-    "civie",
-    "civvy",
-    "clach",
-    "clads",
-    "clags",
-    "clapt",
-    "clast",
-    "clavi",
-    "cleek",
-    "clepe",
-    "clept",
-    "clews",
-    "clime",
-    "clipt",
-    "clods",
-    "clomb",
-    "clomp",
-    "clonk",
-    "clons",
-    "cloot",
-    "clops",
-    "clour",
-    "cloys",
-    "cloze",
-    "clunk",
-    "cnida",
-    "coact",
-    "coala",
-    "coaly",
-    "coapt",
-    "coati",
-    "cobby",
-    "cobia",
-    "cocas",
-    "cocci",
-    "codas",
-    "cogon",
-    "cohog",
-    "cohos",
-    "coifs",
-    "coign",
-    "coirs",
-    "coked",
-    "cokes",
-    "coled",
-    "colly",
-    "colog",
-    "colza",
-    "comae",
-    "commy",
-    "compt",
-    "coned",
-    "conge",
-    "conin",
-    "conks",
-    "conky",
-    "conns",
-    "cooch",
-    "cooed",
-    "cooee",
-    "cooer",
-    "cooey",
-    "coofs",
-    "cooky",
-    "cooly",
-    "coomb",
-    "coopt",
-    "copal",
-    "copen",
-    "coper",
-    "copra",
-    "copse",
-    "corer",
-    "coria",
-    "corms",
-    "cornu",
-    "cosec",
-    "coses",
-    "coset",
-    "cosey",
-    "cosie",
-    "cotan",
-    "coted",
-    "coude",
-    "couth",
-    "coved",
-    "covin",
-    "cowed",
-    "cower",
-    "cowls",
-    "cowry",
-    "coxae",
-    "coxal",
-    "coxed",
-    "coxes",
-    "coyed",
-    "coyer",
-    "coyly",
-    "coypu",
-    "cozen",
-    "cozes",
-    "cozey",
-    "cozie",
-    "craal",
-    "crams",
-    "crape",
-    "craws",
-    "creds",
-    "crepy",
-    "cripe",
-    "crits",
-    "croci",
-    "croon",
-    "croze",
-    "cruck",
-    "cruds",
-    "cruet",
-    "cruor",
-    "crura",
-    "crwth",
-    "cubeb",
-    "cuber",
-    "cuifs",
-    "cuing",
-    "cuish",
-    "cukes",
-    "culch",
-    "culet",
-    "culls",
-    "culms",
-    "culti",
-    "cupel",
-    "cuppy",
-    "curch",
-    "curds",
-    "curdy",
-    "curer",
-    "curet",
-    "curfs",
-    "curns",
-    "currs",
-    "curst",
-    "cusec",
-    "cusks",
-    "cusps",
-    "cusso",
-    "cutch",
-    "cutes",
-    "cutey",
-    "cutin",
-    "cutis",
-    "cutup",
-    "cyano",
-    "cyans",
-    "cycad",
-    "cycas",
-    "cyder",
-    "cylix",
-    "cymae",
-    "cymar",
-    "cymas",
-    "cymes",
-    "cymol",
-    "cyton",
-    "czars",
-    "daces",
-    "dacha",
-    "dadas",
-    "daffs",
-    "dagga",
-    "dagos",
-    "dahls",
-    "damar",
-    "damns",
-    "damps",
-    "dangs",
-    "darbs",
-    "darer",
-    "daric",
-    "darks",
-    "darky",
-    "darns",
-    "dashi",
-    "dashy",
-    "dater",
-    "datto",
-    "daube",
-    "daubs",
-    "dauby",
-    "daunt",
-    "dauts",
-    "daven",
-    "davit",
-    "dawed",
-    "dawen",
-    "dawks",
-    "dawts",
-    "dazes",
-    "deads",
-    "deair",
-    "deash",
-    "deave",
-    "debag",
-    "debar",
-    "debye",
-    "decos",
-    "dedal",
-    "deedy",
-    "deeps",
-    "deers",
-    "deets",
-    "defat",
-    "defis",
-    "defog",
-    "degum",
-    "deice",
-    "deify",
-    "deign",
-    "deils",
-    "deist",
-    "deked",
-    "dekes",
-    "dekko",
-    "deled",
-    "deles",
-    "delfs",
-    "delly",
-    "delts",
-    "demes",
-    "demit",
-    "demob",
-    "demur",
-    "denar",
-    "denes",
-    "derat",
-    "deray",
-    "derms",
-    "desex",
-    "dewax",
-    "dewed",
-    "dexes",
-    "dexie",
-    "dhaks",
-    "dhals",
-    "dhobi",
-    "dhole",
-    "dhoti",
-    "dhows",
-    "dhuti",
-    "diazo",
-    "dicer",
-    "dicot",
-    "dicty",
-    "didie",
-    "didos",
-    "diene",
-    "dight",
-    "diked",
-    "diker",
-    "dikey",
-    "dills",
-    "dinge",
-    "dinks",
-    "dints",
-    "diols",
-    "dippy",
-    "dipso",
-    "diram",
-    "direr",
-    "dirls",
-    "dirts",
-    "dishy",
-    "disme",
-    "ditas",
-    "dites",
-    "ditsy",
-    "ditzy",
-    "divvy",
-    "dizen",
-    "djins",
-    "doats",
-    "dobla",
-    "dodos",
-    "doest",
-    "doffs",
-    "doges",
-    "dogey",
-    "doggo",
-    "dogie",
-    "doits",
-    "dojos",
-    "doled",
-    "doles",
-    "dolma",
-    "dolts",
-    "domal",
-    "domic",
-    "donas",
-    "donga",
-    "donsy",
-    "dooly",
-    "doomy",
-    "doozy",
-    "dopas",
-    "doper",
-    "dopes",
-    "dormy",
-    "dorps",
-    "dorrs",
-    "dorsa",
-    "dorty",
-    "doser",
-    "dotal",
-    "doted",
-    "doter",
-    "dotes",
-    "douma",
-    "doums",
-    "doura",
-    "douse",
-    "doven",
-    "dowed",
-    "dowie",
-    "dowse",
-    "doxie",
-    "doyen",
-    "doyly",
-    "dozed",
-    "dozes",
-    "drabs",
-    "draff",
-    "drail",
-    "drats",
-    "drave",
-    "drays",
-    "drear",
-    "dreck",
-    "dreed",
-    "drees",
-    "dreks",
-    "drest",
-    "dribs",
-    "drily",
-    "dript",
-    "dropt",
-    "drouk",
-    "drubs",
-    "drupe",
-    "druse",
-    "dryly",
-    "duads",
-    "ducat",
-    "duddy",
-    "duded",
-    "dufus",
-    "duits",
-    "duked",
-    "dulia",
-    "dulls",
-    "dully",
-    "dulse",
-    "dumbs",
-    "dumka",
-    "dumky",
-    "dumpy",
-    "dunam",
-    "dunch",
-    "dungs",
-    "dunts",
-    "duomi",
-    "duple",
-    "duras",
-    "dured",
-    "durns",
-    "duroc",
-    "duros",
-    "durra",
-    "durrs",
-    "dusks",
-    "dweeb",
-    "dwine",
-    "dyads",
-    "dyers",
-    "dyked",
-    "dykey",
-    "dynel",
-    "dynes",
-    "eagre",
-    "easts",
-    "eaved",
-    "ebbed",
-    "ebbet",
-    "ebons",
-    "eched",
-    "eches",
-    "ecrus",
-    "edify",
-    "edile",
-    "educe",
-    "educt",
-    "egads",
-    "egers",
-    "egest",
-    "eggar",
-    "egged",
-    "eikon",
-    "eking",
-    "elain",
-    "elans",
-    "elate",
-    "elemi",
-    "elide",
-    "elint",
-    "eloin",
-    "elope",
-    "elute",
-    "elver",
-    "embar",
-    "embay",
-    "embow",
-    "emeer",
-    "emend",
-    "emeus",
-    "emirs",
-    "emmer",
-    "emyde",
-    "emyds",
-    "enate",
-    "endue",
-    "enoki",
-    "enols",
-    "enorm",
-    "enows",
-    "ensky",
-    "entia",
-    "enure",
-    "envoi",
-    "enzym",
-    "eosin",
-    "epact",
-    "epees",
-    "ephah",
-    "ephas",
-    "ephod",
-    "ephor",
-    "epode",
-    "equid",
-    "ernes",
-    "erose",
-    "erses",
-    "eruct",
-    "erugo",
-    "ervil",
-    "escar",
-    "escot",
-    "eskar",
-    "esnes",
-    "esses",
-    "estop",
-    "etape",
-    "etnas",
-    "etuis",
-    "etwee",
-    "etyma",
-    "ewers",
-    "exine",
-    "exing",
-    "exurb",
-    "eyass",
-    "eyers",
-    "eying",
-    "eyras",
-    "eyres",
-    "eyrie",
-    "eyrir",
-    "facer",
-    "faddy",
-    "fadge",
-    "fados",
-    "faena",
-    "faggy",
-    "fagot",
-    "faker",
-    "fakey",
-    "fakir",
-    "fames",
-    "fanes",
-    "fanga",
-    "fanon",
-    "fanos",
-    "fanum",
-    "faqir",
-    "farad",
-    "farci",
-    "farcy",
-    "fards",
-    "farer",
-    "farle",
-    "farls",
-    "faros",
-    "fatly",
-    "fatso",
-    "faugh",
-    "fauld",
-    "fauns",
-    "fauve",
-    "favas",
-    "favus",
-    "fawns",
-    "fawny",
-    "fayed",
-    "fazes",
-    "fease",
-    "feaze",
-    "fecks",
-    "feebs",
-    "feeze",
-    "feint",
-    "felid",
-    "felly",
-    "femes",
-    "fends",
-    "fenny",
-    "feods",
-    "feoff",
-    "feres",
-    "ferly",
-    "ferny",
-    "fesse",
-    "fetas",
-    "feted",
-    "fetid",
-    "fetor",
-    "feuar",
-    "feued",
-    "feyer",
-    "feyly",
-    "fezes",
-    "fezzy",
-    "fiars",
-    "fiats",
-    "fices",
-    "fichu",
-    "ficin",
-    "fidge",
-    "fidos",
-    "fiefs",
-    "fifed",
-    "fifer",
-    "fifes",
-    "filar",
-    "filch",
-    "fillo",
-    "filmi",
-    "filos",
-    "filum",
-    "finks",
-    "finny",
-    "finos",
-    "fiord",
-    "fique",
-    "firer",
-    "firns",
-    "firry",
-    "fiscs",
-    "fitly",
-    "fjeld",
-    "flabs",
-    "flams",
-    "flamy",
-    "flans",
-    "flawy",
-    "flaxy",
-    "flays",
-    "fleam",
-    "flews",
-    "fleys",
-    "flics",
-    "flirs",
-    "flits",
-    "flocs",
-    "floes",
-    "flogs",
-    "flong",
-    "flota",
-    "flout",
-    "flubs",
-    "flued",
-    "flues",
-    "fluky",
-    "flump",
-    "flunk",
-    "fluty",
-    "fluyt",
-    "flyte",
-    "foehn",
-    "fogey",
-    "fogie",
-    "fohns",
-    "foins",
-    "foist",
-    "fondu",
-    "foots",
-    "forby",
-    "fordo",
-    "forky",
-    "fovea",
-    "foxed",
-    "fraps",
-    "frass",
-    "frats",
-    "frays",
-    "fremd",
-    "frena",
-    "frier",
-    "frigs",
-    "fritt",
-    "froes",
-    "frond",
-    "frons",
-    "frore",
-    "frows",
-    "frugs",
-    "frump",
-    "fubsy",
-    "fucus",
-    "fuddy",
-    "fugal",
-    "fuggy",
-    "fugio",
-    "fugle",
-    "fugus",
-    "fujis",
-    "fulls",
-    "fumer",
-    "fumet",
-    "fundi",
-    "fungo",
-    "funks",
-    "furan",
-    "furls",
-    "furze",
-    "furzy",
-    "fusee",
-    "fusel",
-    "fusil",
-    "fusty",
-    "fuzed",
-    "fuzee",
-    "fuzes",
-    "fuzil",
-    "fyces",
-    "fykes",
-    "fytte",
-    "gaddi",
-    "gadid",
-    "gadis",
-    "gadje",
-    "gadjo",
-    "gaffs",
-    "gaged",
-    "gager",
-    "gaits",
-    "galah",
-    "galea",
-    "gally",
-    "galop",
-    "gamas",
-    "gamay",
-    "gambe",
-    "gambs",
-    "gamed",
-    "gamey",
-    "gamic",
-    "gammy",
-    "gamps",
-    "ganef",
-    "ganev",
-    "ganof",
-    "gaols",
-    "gaped",
-    "gaper",
-    "gapes",
-    "gappy",
-    "garbs",
-    "gassy",
-    "gasts",
-    "gater",
-    "gauds",
-    "gaums",
-    "gaurs",
-    "gauzy",
-    "gavot",
-    "gawks",
-    "gawky",
-    "gawps",
-    "gawsy",
-    "gayal",
-    "gayer",
-    "gayly",
-    "gazar",
-    "gazoo",
-    "gecks",
-    "geest",
-    "gelds",
-    "gelee",
-    "gelid",
-    "gelts",
-    "gemmy",
-    "gemot",
-    "genic",
-    "genii",
-    "genip",
-    "genro",
-    "genua",
-    "gerah",
-    "germy",
-    "gesso",
-    "geste",
-    "gests",
-    "getas",
-    "getup",
-    "geums",
-    "ghats",
-    "ghaut",
-    "ghees",
-    "gibed",
-    "giber",
-    "gibes",
-    "gigas",
-    "gighe",
-    "gigot",
-    "gigue",
-    "gilds",
-    "gimel",
-    "gimps",
-    "gimpy",
-    "ginks",
-    "ginzo",
-    "gipon",
-    "girds",
-    "girns",
-    "giron",
-    "giros",
-    "girsh",
-    "girts",
-    "gismo",
-    "gists",
-    "glads",
-    "glady",
-    "glair",
-    "glams",
-    "glary",
-    "glazy",
-    "gleba",
-    "glede",
-    "gleds",
-    "gleed",
-    "gleek",
-    "glees",
-    "gleet",
-    "gleys",
-    "glias",
-    "gliff",
-    "glime",
-    "glims",
-    "gloam",
-    "globs",
-    "glogg",
-    "gloms",
-    "glops",
-    "glost",
-    "glout",
-    "gloze",
-    "gluer",
-    "gluey",
-    "glugs",
-    "glume",
-    "glums",
-    "glute",
-    "gluts",
-    "gnarl",
-    "gnarr",
-    "gnars",
-    "gnash",
-    "gnawn",
-    "gnaws",
-    "goads",
-    "goban",
-    "gobos",
-    "godet",
-    "gofer",
-    "gogos",
-    "golfs",
-    "gombo",
-    "gonad",
-    "gonef",
-    "goner",
-    "gonia",
-    "gonif",
-    "gonof",
-    "gooks",
-    "gooky",
-    "goony",
-    "goops",
-    "goopy",
-    "goosy",
-    "gopik",
-    "goral",
-    "gored",
-    "gores",
-    "gorms",
-    "gorps",
-    "gorsy",
-    "gouts",
-    "gouty",
-    "gowds",
-    "gowks",
-    "goxes",
-    "goyim",
-    "gramp",
-    "grana",
-    "grans",
-    "grapy",
-    "grees",
-    "grego",
-    "gride",
-    "grift",
-    "grigs",
-    "griot",
-    "gript",
-    "gripy",
-    "grith",
-    "groat",
-    "grody",
-    "grogs",
-    "grosz",
-    "grots",
-    "gruel",
-    "grues",
-    "grume",
-    "grump",
-    "guaco",
-    "guans",
-    "guars",
-    "gucks",
-    "gudes",
-    "guffs",
-    "guids",
-    "guiro",
-    "gular",
-    "gulfs",
-    "gulfy",
-    "gulps",
-    "gulpy",
-    "gumma",
-    "gunks",
-    "gunky",
-    "gurge",
-    "gurry",
-    "gursh",
-    "gushy",
-    "gussy",
-    "gutta",
-    "gutty",
-    "guyed",
-    "guyot",
-    "gwine",
-    "gybed",
-    "gybes",
-    "gyoza",
-    "gyral",
-    "gyred",
-    "gyres",
-    "gyron",
-    "gyved",
-    "gyves",
-    "haafs",
-    "haars",
-    "habus",
-    "hacek",
-    "hadal",
-    "haded",
-    "hadji",
-    "haems",
-    "haets",
-    "hafts",
-    "hahas",
-    "haika",
-    "haiks",
-    "haint",
-    "hajes",
-    "hajis",
-    "hajji",
-    "hakes",
-    "hakus",
-    "haled",
-    "haler",
-    "halid",
-    "halma",
-    "halms",
-    "halva",
-    "hamal",
-    "hammy",
-    "hanse",
-    "haole",
-    "hapax",
-    "hared",
-    "harks",
-    "harls",
-    "hasps",
-    "haugh",
-    "haulm",
-    "haver",
-    "hawed",
-    "hawse",
-    "hayed",
-    "hayer",
-    "hayey",
-    "hazan",
-    "hazed",
-    "hazer",
-    "hazes",
-    "heapy",
-    "hebes",
-    "hecks",
-    "heder",
-    "hedgy",
-    "heeds",
-    "heeze",
-    "hefts",
-    "heigh",
-    "heils",
-    "helos",
-    "helot",
-    "helve",
-    "hemal",
-    "hemes",
-    "hemic",
-    "hemin",
-    "hemps",
-    "hempy",
-    "hents",
-    "herby",
-    "herls",
-    "herma",
-    "herms",
-    "herns",
-    "herry",
-    "hests",
-    "heths",
-    "heuch",
-    "heugh",
-    "hewed",
-    "hewer",
-    "hexad",
-    "hexed",
-    "hexer",
-    "hexyl",
-    "hided",
-    "hider",
-    "hijra",
-    "hilar",
-    "hillo",
-    "hilts",
-    "hilum",
-    "hilus",
-    "hinky",
-    "hinny",
-    "hiply",
-    "hiree",
-    "hissy",
-    "hists",
-    "hived",
-    "hoagy",
-    "hoars",
-    "hobos",
-    "hocks",
-    "hodad",
-    "hoers",
-    "hoggs",
-    "hoick",
-    "hoise",
-    "hoked",
-    "hokes",
-    "hokku",
-    "hokum",
-    "holey",
-    "holks",
-    "hollo",
-    "holms",
-    "holts",
-    "homos",
-    "honan",
-    "honer",
-    "hones",
-    "hongi",
-    "hongs",
-    "honks",
-    "hooey",
-    "hooka",
-    "hooky",
-    "hooly",
-    "hooty",
-    "hoper",
-    "horah",
-    "horal",
-    "horsy",
-    "hosel",
-    "hoser",
-    "hosey",
-    "hotch",
-    "houri",
-    "hovel",
-    "howff",
-    "howfs",
-    "howks",
-    "hucks",
-    "huffs",
-    "huger",
-    "hulas",
-    "hulks",
-    "hulky",
-    "hullo",
-    "humph",
-    "humpy",
-    "hurds",
-    "hurls",
-    "hurly",
-    "hussy",
-    "huzza",
-    "hying",
-    "hylas",
-    "hyoid",
-    "hypes",
-    "hypha",
-    "hypos",
-    "hyrax",
-    "hyson",
-    "iambi",
-    "iambs",
-    "ichor",
-    "icier",
-    "icily",
-    "icker",
-    "ictic",
-    "ictus",
-    "idled",
-    "idles",
-    "idyls",
-    "igged",
-    "iglus",
-    "ihram",
-    "ikats",
-    "ikons",
-    "ileac",
-    "ileus",
-    "ilial",
-    "ilium",
-    "iller",
-    "imaum",
-    "imbed",
-    "imide",
-    "imido",
-    "imids",
-    "imine",
-    "imino",
-    "immix",
-    "imped",
-    "impel",
-    "impis",
-    "inapt",
-    "inarm",
-    "inbye",
-    "incog",
-    "incus",
-    "indol",
-    "indow",
-    "indri",
-    "indue",
-    "inion",
-    "inkle",
-    "inned",
-    "inrun",
-    "intis",
-    "inurn",
-    "invar",
-    "iodic",
-    "iodid",
-    "iodin",
-    "iotas",
-    "irade",
-    "irids",
-    "iring",
-    "iroko",
-    "irone",
-    "isbas",
-    "isled",
-    "issei",
-    "istle",
-    "ither",
-    "ivied",
-    "ivies",
-    "ixias",
-    "ixora",
-    "ixtle",
-    "izars",
-    "jabot",
-    "jacal",
-    "jades",
-    "jaggs",
-    "jaggy",
-    "jagra",
-    "jalap",
-    "jalop",
-    "jambe",
-    "jambs",
-    "janty",
-    "japed",
-    "japer",
-    "japes",
-    "jarls",
-    "jatos",
-    "jauks",
-    "jaups",
-    "javas",
-    "jawan",
-    "jefes",
-    "jehad",
-    "jehus",
-    "jells",
-    "jemmy",
-    "jerid",
-    "jests",
-    "jetes",
-    "jeton",
-    "jewed",
-    "jibbs",
-    "jibed",
-    "jiber",
-    "jibes",
-    "jiffs",
-    "jills",
-    "jilts",
-    "jimpy",
-    "jingo",
-    "jinni",
-    "jinns",
-    "jisms",
-    "jived",
-    "jiver",
-    "jives",
-    "jivey",
-    "jnana",
-    "jocko",
-    "joeys",
-    "jokey",
-    "joles",
-    "jolty",
-    "jomon",
-    "jorum",
-    "jotas",
-    "jotty",
-    "joual",
-    "jouks",
-    "jowar",
-    "jowed",
-    "jowls",
-    "jowly",
-    "joyed",
-    "jubas",
-    "jubes",
-    "jucos",
-    "judos",
-    "jugal",
-    "jugum",
-    "jujus",
-    "juked",
-    "jukus",
-    "julep",
-    "junks",
-    "jupes",
-    "jupon",
-    "jural",
-    "jurat",
-    "jurel",
-    "justs",
-    "jutes",
-    "jutty",
-    "kabab",
-    "kabar",
-    "kabob",
-    "kadis",
-    "kafir",
-    "kagus",
-    "kaiak",
-    "kaifs",
-    "kails",
-    "kains",
-    "kakas",
-    "kakis",
-    "kales",
-    "kalif",
-    "kalpa",
-    "kames",
-    "kanas",
-    "kanes",
-    "kanzu",
-    "kaons",
-    "kapas",
-    "kaphs",
-    "kaput",
-    "karns",
-    "kasha",
-    "katas",
-    "kaury",
-    "kavas",
-    "kayos",
-    "kbars",
-    "kebar",
-    "kebob",
-    "kecks",
-    "kedge",
-    "keefs",
-    "keeks",
-    "keels",
-    "keens",
-    "keets",
-    "keeve",
-    "kefir",
-    "keirs",
-    "kelep",
-    "kelim",
-    "kelps",
-    "kelpy",
-    "kelts",
-    "kempt",
-    "kenaf",
-    "kench",
-    "kenos",
-    "kente",
-    "kepis",
-    "kerbs",
-    "kerfs",
-    "kerne",
-    "ketol",
-    "kevel",
-    "kevil",
-    "kexes",
-    "khadi",
-    "khafs",
-    "khans",
-    "khaph",
-    "khats",
-    "kheda",
-    "kheth",
-    "khets",
-    "khoum",
-    "kiang",
-    "kibbe",
-    "kibbi",
-    "kibei",
-    "kibes",
-    "kibla",
-    "kicky",
-    "kiefs",
-    "kiers",
-    "kikes",
-    "kilty",
-    "kinas",
-    "kines",
-    "kinin",
-    "kinos",
-    "kirks",
-    "kirns",
-    "kists",
-    "kited",
-    "kiter",
-    "kithe",
-    "kiths",
-    "kivas",
-    "kliks",
-    "knaps",
-    "knars",
-    "knaur",
-    "knawe",
-    "kneed",
-    "knish",
-    "knops",
-    "knosp",
-    "knout",
-    "knurl",
-    "knurs",
-    "koans",
-    "kobos",
-    "koels",
-    "koine",
-    "kojis",
-    "kolas",
-    "kolos",
-    "kombu",
-    "konks",
-    "kopek",
-    "kophs",
-    "kopje",
-    "koppa",
-    "korai",
-    "koras",
-    "korat",
-    "korma",
-    "korun",
-    "kotos",
-    "kotow",
-    "kraal",
-    "krait",
-    "kreep",
-    "krewe",
-    "krubi",
-    "kudus",
-    "kufis",
-    "kugel",
-    "kukri",
-    "kulak",
-    "kumys",
-    "kurus",
-    "kusso",
-    "kvass",
-    "kvell",
-    "kyack",
-    "kyaks",
-    "kyars",
-    "kyats",
-    "kytes",
-    "kythe",
-    "laari",
-    "labra",
-    "lacer",
-    "laded",
-    "lades",
-    "laevo",
-    "lahar",
-    "laich",
-    "laics",
-    "laigh",
-    "lairs",
-    "laith",
-    "laked",
-    "lalls",
-    "lamby",
-    "lamed",
-    "lames",
-    "lamia",
-    "lards",
-    "lardy",
-    "laree",
-    "lares",
-    "laris",
-    "larky",
-    "larum",
-    "lased",
-    "lases",
-    "lassi",
-    "laten",
-    "lathi",
-    "laths",
-    "lathy",
-    "latke",
-    "lauan",
-    "lavas",
-    "laved",
-    "laves",
-    "lawed",
-    "lawny",
-    "laxer",
-    "laxes",
-    "laxly",
-    "layin",
-    "lazed",
-    "lazes",
-    "leady",
-    "lears",
-    "leavy",
-    "ledgy",
-    "leers",
-    "leets",
-    "lefts",
-    "leges",
-    "lehrs",
-    "lehua",
-    "lenes",
-    "lenis",
-    "lenos",
-    "lento",
-    "lepta",
-    "leses",
-    "letch",
-    "lethe",
-    "letup",
-    "leuds",
-    "lexes",
-    "lezzy",
-    "liard",
-    "lichi",
-    "licit",
-    "lidos",
-    "liers",
-    "lieus",
-    "lieve",
-    "ligan",
-    "liker",
-    "lilos",
-    "lilts",
-    "liman",
-    "limas",
-    "limbi",
-    "limby",
-    "limed",
-    "limen",
-    "limns",
-    "limpa",
-    "limps",
-    "liney",
-    "linga",
-    "lings",
-    "lingy",
-    "linin",
-    "linns",
-    "linos",
-    "lints",
-    "linty",
-    "linum",
-    "lipin",
-    "lippy",
-    "lirot",
-    "lisps",
-    "litai",
-    "loafs",
-    "loams",
-    "lobar",
-    "lochs",
-    "loden",
-    "lodes",
-    "loges",
-    "loggy",
-    "logia",
-    "logoi",
-    "loids",
-    "lolls",
-    "longe",
-    "looby",
-    "looed",
-    "looey",
-    "loofa",
-    "loofs",
-    "looie",
-    "loots",
-    "loped",
-    "loper",
-    "loppy",
-    "lores",
-    "losel",
-    "lotah",
-    "lotas",
-    "lotic",
-    "lotos",
-    "louma",
-    "loups",
-    "lours",
-    "loury",
-    "louts",
-    "lovat",
-    "lowse",
-    "loxed",
-    "loxes",
-    "luaus",
-    "lubed",
-    "luces",
-    "lucks",
-    "lucre",
-    "ludes",
-    "ludic",
-    "luffa",
-    "luffs",
-    "luged",
-    "luges",
-    "lulls",
-    "lulus",
-    "lumas",
-    "lunet",
-    "lungi",
-    "lunks",
-    "lunts",
-    "lurer",
-    "lusus",
-    "lutea",
-    "luted",
-    "luxes",
-    "lweis",
-    "lyard",
-    "lyart",
-    "lycea",
-    "lycee",
-    "lyres",
-    "lyses",
-    "lysin",
-    "lyssa",
-    "lytta",
-    "maars",
-    "mabes",
-    "maced",
-    "macer",
-    "maces",
-    "machs",
-    "macle",
-    "magot",
-    "mahoe",
-    "maill",
-    "maims",
-    "mairs",
-    "maist",
-    "makar",
-    "makos",
-    "malar",
-    "malms",
-    "malmy",
-    "malty",
-    "mamey",
-    "manat",
-    "maned",
-    "mangy",
-    "maqui",
-    "maras",
-    "marcs",
-    "marka",
-    "marls",
-    "marse",
-    "marvy",
-    "masas",
-    "mashy",
-    "matza",
-    "matzo",
-    "mauds",
-    "mauls",
-    "maund",
-    "mauts",
-    "mavie",
-    "mavin",
-    "mawed",
-    "maxes",
-    "mayas",
-    "mayed",
-    "mayos",
-    "mayst",
-    "mazed",
-    "mbira",
-    "medii",
-    "meeds",
-    "meiny",
-    "melds",
-    "melic",
-    "mells",
-    "melty",
-    "menad",
-    "mends",
-    "mense",
-    "mensh",
-    "menta",
-    "meous",
-    "meows",
-    "mercs",
-    "merde",
-    "merer",
-    "meres",
-    "merks",
-    "merls",
-    "meshy",
-    "mesne",
-    "metes",
-    "meths",
-    "metol",
-    "mewed",
-    "mewls",
-    "mezes",
-    "miaou",
-    "miaow",
-    "miasm",
-    "miaul",
-    "micas",
-    "miche",
-    "micks",
-    "middy",
-    "miens",
-    "miffs",
-    "miffy",
-    "miggs",
-    "miked",
-    "mikra",
-    "milch",
-    "milds",
-    "milia",
-    "milpa",
-    "milts",
-    "milty",
-    "mimed",
-    "mimer",
-    "mimes",
-    "minae",
-    "mincy",
-    "mingy",
-    "minks",
-    "minny",
-    "mires",
-    "mirex",
-    "mirin",
-    "mirks",
-    "mirky",
-    "misdo",
-    "misos",
-    "mitis",
-    "mixup",
-    "mizen",
-    "moggy",
-    "mohel",
-    "mohur",
-    "moils",
-    "mojos",
-    "mokes",
-    "molal",
-    "molas",
-    "molls",
-    "molts",
-    "momes",
-    "momus",
-    "monas",
-    "monie",
-    "mooch",
-    "mooed",
-    "moola",
-    "mools",
-    "moony",
-    "moory",
-    "moots",
-    "moper",
-    "mopes",
-    "mopey",
-    "morae",
-    "moras",
-    "morns",
-    "morts",
-    "mosey",
-    "mosks",
-    "mosso",
-    "moste",
-    "mosts",
-    "motet",
-    "motey",
-    "mothy",
-    "motts",
-    "mouch",
-    "moues",
-    "moult",
-    "mousy",
-    "moxas",
-    "mozos",
-    "mucid",
-    "mucks",
-    "mucor",
-    "mucro",
-    "mudra",
-    "muggs",
-    "muggy",
-    "muhly",
-    "mujik",
-    "mulct",
-    "muled",
-    "muley",
-    "mulla",
-    "mumms",
-    "mumus",
-    "munis",
-    "muras",
-    "mured",
-    "mures",
-    "murex",
-    "murid",
-    "murks",
-    "murra",
-    "murre",
-    "murrs",
-    "musca",
-    "muser",
-    "musks",
-    "mussy",
-    "musth",
-    "musts",
-    "muter",
-    "muton",
-    "muzzy",
-    "mynah",
-    "mynas",
-    "myoid",
-    "myoma",
-    "myope",
-    "myopy",
-    "mysid",
-    "mythy",
-    "naans",
-    "nabes",
-    "nabis",
-    "nabob",
-    "nacre",
-    "nadas",
-    "naevi",
-    "naffs",
-    "naggy",
-    "naiad",
-    "naifs",
-    "nairu",
-    "nakfa",
-    "nalas",
-    "naled",
-    "nanas",
-    "napas",
-    "napes",
-    "nappe",
-    "narcs",
-    "nards",
-    "nares",
-    "naric",
-    "naris",
-    "narks",
-    "narky",
-    "natch",
-    "navar",
-    "naves",
-    "navvy",
-    "nawab",
-    "neaps",
-    "neats",
-    "neddy",
-    "neems",
-    "neeps",
-    "negus",
-    "neifs",
-    "neist",
-    "nemas",
-    "nenes",
-    "nerol",
-    "nerts",
-    "nertz",
-    "nervy",
-    "netts",
-    "netty",
-    "neuks",
-    "neume",
-    "neums",
-    "nevus",
-    "newel",
-    "newie",
-    "newsy",
-    "newts",
-    "ngwee",
-    "nidal",
-    "nided",
-    "nides",
-    "nidus",
-    "nighs",
-    "nills",
-    "nimbi",
-    "ninny",
-    "ninon",
-    "nipas",
-    "nippy",
-    "nisei",
-    "niter",
-    "nitid",
-    "niton",
-    "nitre",
-    "nival",
-    "nixed",
-    "nixes",
-    "nixie",
-    "nizam",
-    "nocks",
-    "nodus",
-    "noels",
-    "noggs",
-    "nohow",
-    "noils",
-    "noily",
-    "nolos",
-    "nomas",
-    "nomes",
-    "nomoi",
-    "nomos",
-    "nonas",
-    "nones",
-    "nonet",
-    "nonyl",
-    "nooky",
-    "noons",
-    "nopal",
-    "noria",
-    "noris",
-    "notal",
-    "noter",
-    "notum",
-    "noway",
-    "nowts",
-    "nubby",
-    "nubia",
-    "nucha",
-    "nuder",
-    "nudzh",
-    "numbs",
-    "numen",
-    "nurds",
-    "nurls",
-    "nutsy",
-    "nyala",
-    "oaken",
-    "oakum",
-    "oared",
-    "oases",
-    "oasts",
-    "oater",
-    "oaves",
-    "obeah",
-    "obeli",
-    "obias",
-    "oboes",
-    "obole",
-    "oboli",
-    "obols",
-    "ocher",
-    "ochry",
-    "ocker",
-    "ocrea",
-    "octad",
-    "octan",
-    "oculi",
-    "odahs",
-    "odder",
-    "odeum",
-    "odist",
-    "odium",
-    "odyle",
-    "odyls",
-    "ofays",
-    "offed",
-    "ofter",
-    "ogams",
-    "ogees",
-    "ogham",
-    "ogive",
-    "ogled",
-    "ogler",
-    "ogles",
-    "ohias",
-    "ohing",
-    "oidia",
-    "oinks",
-    "okapi",
-    "okays",
-    "okehs",
-    "okras",
-    "olein",
-    "oleos",
-    "oleum",
-    "olios",
-    "ollas",
-    "omasa",
-    "omber",
-    "omers",
-    "oncet",
-    "onery",
-    "onium",
-    "onlay",
-    "ontic",
-    "oohed",
-    "oorie",
-    "ootid",
-    "oozed",
-    "opahs",
-    "opsin",
-    "orach",
-    "orate",
-    "orbed",
-    "orcin",
-    "ordos",
-    "oread",
-    "orgic",
-    "oribi",
-    "orles",
-    "orlon",
-    "orlop",
-    "ormer",
-    "ornis",
-    "orpin",
-    "orris",
-    "orzos",
-    "osier",
-    "osmic",
-    "osmol",
-    "ossia",
-    "ottar",
-    "ottos",
-    "ouphe",
-    "ouphs",
-    "ourie",
-    "ousel",
-    "ousts",
-    "outby",
-    "outgo",
-    "ouzel",
-    "ouzos",
-    "ovoli",
-    "ovolo",
-    "ovule",
-    "owlet",
-    "owsen",
-    "oxeye",
-    "oxids",
-    "oxime",
-    "oxims",
-    "oxlip",
-    "oxter",
-    "oyers",
-    "pacas",
-    "padis",
-    "padle",
-    "padri",
-    "paean",
-    "paeon",
-    "pagod",
-    "paiks",
-    "paise",
-    "palea",
-    "paled",
-    "palet",
-    "palls",
-    "pally",
-    "palmy",
-    "palpi",
-    "palps",
-    "pandy",
-    "paned",
-    "panga",
-    "panne",
-    "papaw",
-    "pappi",
-    "parae",
-    "parch",
-    "pardi",
-    "pards",
-    "pardy",
-    "pareo",
-    "parer",
-    "pareu",
-    "parge",
-    "pargo",
-    "parol",
-    "parrs",
-    "parve",
-    "parvo",
-    "pases",
-    "pated",
-    "paten",
-    "patin",
-    "patly",
-    "pavid",
-    "pavin",
-    "pavis",
-    "pawed",
-    "pawer",
-    "pawky",
-    "pawls",
-    "paxes",
-    "peage",
-    "peags",
-    "peaky",
-    "peals",
-    "peans",
-    "peats",
-    "peaty",
-    "pechs",
-    "pecks",
-    "pecky",
-    "pedes",
-    "peens",
-    "peery",
-    "peins",
-    "peise",
-    "pekan",
-    "pekes",
-    "pekoe",
-    "peles",
-    "pelfs",
-    "pelon",
-    "pends",
-    "penes",
-    "pengo",
-    "penni",
-    "peons",
-    "pepla",
-    "pepos",
-    "perdu",
-    "perdy",
-    "perea",
-    "peris",
-    "perps",
-    "pervs",
-    "pesty",
-    "petti",
-    "petto",
-    "pewee",
-    "pewit",
-    "phial",
-    "phons",
-    "phots",
-    "phpht",
-    "phuts",
-    "phyla",
-    "phyle",
-    "pians",
-    "pibal",
-    "pical",
-    "picas",
-    "picul",
-    "pieta",
-    "pigmy",
-    "piing",
-    "pikas",
-    "piked",
-    "piker",
-    "pikis",
-    "pilau",
-    "pilaw",
-    "pilea",
-    "pilei",
-    "pilis",
-    "pilus",
-    "pimas",
-    "pinas",
-    "pined",
-    "pingo",
-    "pinna",
-    "pinny",
-    "pinta",
-    "pipal",
-    "pirns",
-    "pirog",
-    "pisco",
-    "pitas",
-    "piths",
-    "piton",
-    "pixes",
-    "plack",
-    "plash",
-    "plasm",
-    "platy",
-    "plebe",
-    "plebs",
-    "plena",
-    "pleon",
-    "plews",
-    "plica",
-    "plink",
-    "plods",
-    "plops",
-    "plotz",
-    "ploys",
-    "plumy",
-    "plyer",
-    "poach",
-    "poboy",
-    "pocks",
-    "pocky",
-    "podgy",
-    "podia",
-    "poesy",
-    "pogey",
-    "poilu",
-    "poind",
-    "poled",
-    "poler",
-    "polys",
-    "pomes",
-    "pommy",
-    "pomos",
-    "pomps",
-    "pones",
-    "pongs",
-    "poods",
-    "pooed",
-    "poofs",
-    "poofy",
-    "poohs",
-    "poops",
-    "poori",
-    "poove",
-    "popsy",
-    "pored",
-    "porks",
-    "porny",
-    "potsy",
-    "potto",
-    "pouff",
-    "poufs",
-    "poult",
-    "pouts",
-    "pouty",
-    "poxed",
-    "poxes",
-    "poyou",
-    "praam",
-    "prahu",
-    "prang",
-    "praos",
-    "prase",
-    "prate",
-    "prats",
-    "praus",
-    "preed",
-    "preen",
-    "prees",
-    "preop",
-    "presa",
-    "prese",
-    "prest",
-    "prexy",
-    "preys",
-    "pricy",
-    "pried",
-    "prier",
-    "pries",
-    "prigs",
-    "prill",
-    "primp",
-    "prims",
-    "prink",
-    "priss",
-    "proas",
-    "proem",
-    "prole",
-    "proso",
-    "pross",
-    "prosy",
-    "prows",
-    "prude",
-    "pruta",
-    "pryer",
-    "pseud",
-    "pshaw",
-    "psoae",
-    "psoai",
-    "psoas",
-    "pubis",
-    "puces",
-    "pucka",
-    "pudgy",
-    "pudic",
-    "puggy",
-    "pujah",
-    "pujas",
-    "puked",
-    "pukes",
-    "pukka",
-    "puled",
-    "puler",
-    "pules",
-    "pulik",
-    "pulis",
-    "pulpy",
-    "punas",
-    "pungs",
-    "punji",
-    "punka",
-    "punny",
-    "punty",
-    "pupal",
-    "pupas",
-    "pupus",
-    "purda",
-    "purin",
-    "puris",
-    "purls",
-    "pursy",
-    "purty",
-    "puses",
-    "puton",
-    "putti",
-    "putto",
-    "pyins",
-    "pyoid",
-    "pyran",
-    "pyres",
-    "pyric",
-    "pyros",
-    "pyxes",
-    "pyxie",
-    "pyxis",
-    "qadis",
-    "qaids",
-    "qanat",
-    "qophs",
-    "quaff",
-    "quags",
-    "quais",
-    "quaky",
-    "qualm",
-    "quare",
-    "quass",
-    "quate",
-    "quean",
-    "quern",
-    "queys",
-    "quids",
-    "quiff",
-    "quins",
-    "quipu",
-    "quirt",
-    "quods",
-    "quoin",
-    "quoit",
-    "quoll",
-    "qursh",
-    "rabic",
-    "racon",
-    "raffs",
-    "ragas",
-    "ragee",
-    "raggs",
-    "raggy",
-    "ragis",
-    "raias",
-    "raita",
-    "rajas",
-    "rajes",
-    "rakee",
-    "raker",
-    "rakis",
-    "rakus",
-    "rales",
-    "ramal",
-    "ramee",
-    "ramet",
-    "rammy",
-    "ramus",
-    "ranee",
-    "rangy",
-    "ranid",
-    "ranis",
-    "raphe",
-    "rared",
-    "rased",
-    "raser",
-    "rases",
-    "rasps",
-    "ratal",
-    "ratan",
-    "ratch",
-    "ratel",
-    "rathe",
-    "ratos",
-    "rawer",
-    "rawin",
-    "rawly",
-    "raxed",
-    "raxes",
-    "rayah",
-    "rayas",
-    "rayed",
-    "razee",
-    "razes",
-    "readd",
-    "rearm",
-    "reata",
-    "reave",
-    "rebec",
-    "rebid",
-    "rebop",
-    "rebuy",
-    "recce",
-    "recit",
-    "recks",
-    "recta",
-    "recti",
-    "redan",
-    "redds",
-    "reded",
-    "redia",
-    "redid",
-    "redip",
-    "redly",
-    "redon",
-    "redos",
-    "redry",
-    "redub",
-    "redye",
-    "reefy",
-    "reeky",
-    "reest",
-    "refed",
-    "refel",
-    "refix",
-    "refly",
-    "refry",
-    "reges",
-    "regma",
-    "regna",
-    "rehem",
-    "reifs",
-    "reify",
-    "reink",
-    "reive",
-    "rejig",
-    "rekey",
-    "relet",
-    "relit",
-    "remet",
-    "remex",
-    "rends",
-    "renig",
-    "rente",
-    "reoil",
-    "repeg",
-    "repin",
-    "repot",
-    "repps",
-    "reran",
-    "rerig",
-    "resat",
-    "resaw",
-    "resay",
-    "resee",
-    "resew",
-    "resit",
-    "resod",
-    "resow",
-    "retag",
-    "retax",
-    "retch",
-    "retem",
-    "retia",
-    "retie",
-    "revet",
-    "rewan",
-    "rewax",
-    "rewed",
-    "rewet",
-    "rewin",
-    "rewon",
-    "rexes",
-    "rheas",
-    "rheme",
-    "rhomb",
-    "rhumb",
-    "rhyta",
-    "riant",
-    "riata",
-    "ribby",
-    "ribes",
-    "riced",
-    "ricer",
-    "rices",
-    "ridgy",
-    "riels",
-    "rifer",
-    "riles",
-    "rille",
-    "rills",
-    "rimed",
-    "rimer",
-    "rinds",
-    "rindy",
-    "riped",
-    "riper",
-    "ripes",
-    "risus",
-    "ritzy",
-    "rived",
-    "roams",
-    "roans",
-    "roble",
-    "rodes",
-    "roils",
-    "roily",
-    "rolfs",
-    "romps",
-    "roods",
-    "rooky",
-    "roose",
-    "rooty",
-    "ropey",
-    "rosed",
-    "roset",
-    "roshi",
-    "rotas",
-    "rotch",
-    "rotes",
-    "rotis",
-    "rotls",
-    "rotos",
-    "rotte",
-    "roues",
-    "roups",
-    "roupy",
-    "roust",
-    "routs",
-    "roved",
-    "roven",
-    "roves",
-    "rowel",
-    "rowth",
-    "ruana",
-    "rubby",
-    "rubes",
-    "ruche",
-    "rucks",
-    "rudds",
-    "ruder",
-    "ruers",
-    "ruffe",
-    "ruffs",
-    "rugae",
-    "rugal",
-    "ruing",
-    "runts",
-    "runty",
-    "ruses",
-    "rushy",
-    "rusks",
-    "rusts",
-    "ruths",
-    "rutin",
-    "rutty",
-    "ryked",
-    "rykes",
-    "rynds",
-    "ryots",
-    "sabal",
-    "sabed",
-    "sabes",
-    "sabir",
-    "sades",
-    "sadhe",
-    "sadhu",
-    "sadis",
-    "sagos",
-    "sagum",
-    "saice",
-    "saids",
-    "saiga",
-    "sains",
-    "sajou",
-    "saker",
-    "sakis",
-    "salal",
-    "salep",
-    "salic",
-    "salmi",
-    "salol",
-    "salpa",
-    "salps",
-    "samek",
-    "samps",
-    "saned",
-    "saner",
-    "sanes",
-    "sanga",
-    "sapid",
-    "sapor",
-    "sards",
-    "sargo",
-    "sarks",
-    "sarky",
-    "sarod",
-    "saros",
-    "sasin",
-    "sated",
-    "satem",
-    "sates",
-    "sauch",
-    "saugh",
-    "sauls",
-    "saury",
-    "sawer",
-    "saxes",
-    "sayst",
-    "scads",
-    "scags",
-    "scall",
-    "scarp",
-    "scats",
-    "scatt",
-    "scaup",
-    "scaur",
-    "scena",
-    "scend",
-    "schav",
-    "schmo",
-    "schul",
-    "schwa",
-    "scops",
-    "scows",
-    "scrag",
-    "scrod",
-    "scudi",
-    "scudo",
-    "scuds",
-    "sculk",
-    "sculp",
-    "scums",
-    "scups",
-    "scurf",
-    "scuta",
-    "scute",
-    "scuts",
-    "scuzz",
-    "seamy",
-    "sebum",
-    "secco",
-    "sedgy",
-    "seels",
-    "seepy",
-    "segni",
-    "segos",
-    "seifs",
-    "seise",
-    "seism",
-    "selfs",
-    "semes",
-    "sengi",
-    "sensa",
-    "sente",
-    "senti",
-    "sepal",
-    "sepic",
-    "sepoy",
-    "septs",
-    "serac",
-    "serai",
-    "seral",
-    "sered",
-    "serer",
-    "seres",
-    "serin",
-    "serow",
-    "serry",
-    "setal",
-    "setts",
-    "sewan",
-    "sewar",
-    "sexto",
-    "sexts",
-    "shads",
-    "shags",
-    "shahs",
-    "shako",
-    "shaly",
-    "sharn",
-    "shawm",
-    "shaws",
-    "sheal",
-    "sheas",
-    "shend",
-    "shent",
-    "sheol",
-    "sherd",
-    "shewn",
-    "shews",
-    "shiel",
-    "shier",
-    "shies",
-    "shily",
-    "shirr",
-    "shist",
-    "shivs",
-    "shlep",
-    "shlub",
-    "shoat",
-    "shoed",
-    "shoer",
-    "shogi",
-    "shogs",
-    "shool",
-    "shoon",
-    "shoos",
-    "shorl",
-    "shote",
-    "shott",
-    "shoyu",
-    "shris",
-    "shtik",
-    "shuln",
-    "shuls",
-    "shuns",
-    "shush",
-    "shwas",
-    "shyer",
-    "sials",
-    "sibbs",
-    "sices",
-    "sicko",
-    "sicks",
-    "sidle",
-    "sieur",
-    "sifts",
-    "sigla",
-    "sikas",
-    "siker",
-    "silds",
-    "silts",
-    "simar",
-    "simas",
-    "simps",
-    "sines",
-    "sinew",
-    "sinhs",
-    "siped",
-    "sipes",
-    "siree",
-    "sirra",
-    "sirup",
-    "sises",
-    "situp",
-    "sixmo",
-    "sixte",
-    "sizar",
-    "skags",
-    "skald",
-    "skats",
-    "skean",
-    "skeed",
-    "skees",
-    "skegs",
-    "skell",
-    "skelm",
-    "skelp",
-    "skene",
-    "skeps",
-    "skews",
-    "skiey",
-    "skimo",
-    "skims",
-    "skirl",
-    "skirr",
-    "skite",
-    "skive",
-    "skoal",
-    "skort",
-    "skosh",
-    "skuas",
-    "skulk",
-    "skyed",
-    "skyey",
-    "slake",
-    "slank",
-    "slaty",
-    "slaws",
-    "slays",
-    "slews",
-    "slier",
-    "slily",
-    "slipe",
-    "slipt",
-    "slobs",
-    "sloes",
-    "slogs",
-    "sloid",
-    "slojd",
-    "slops",
-    "slosh",
-    "sloyd",
-    "slubs",
-    "slued",
-    "slues",
-    "sluff",
-    "slunk",
-    "slurb",
-    "slyer",
-    "slype",
-    "smalt",
-    "smarm",
-    "smaze",
-    "smeek",
-    "smerk",
-    "smews",
-    "smogs",
-    "smush",
-    "smuts",
-    "snaky",
-    "snash",
-    "snath",
-    "snaws",
-    "sneap",
-    "sneck",
-    "sneds",
-    "snibs",
-    "snick",
-    "snits",
-    "snogs",
-    "snood",
-    "snool",
-    "snoot",
-    "snots",
-    "snubs",
-    "snugs",
-    "snyes",
-    "soave",
-    "sobas",
-    "socas",
-    "socko",
-    "socle",
-    "soddy",
-    "sodic",
-    "sofar",
-    "softa",
-    "softy",
-    "sojas",
-    "sokes",
-    "solan",
-    "soldi",
-    "soldo",
-    "solei",
-    "solum",
-    "soman",
-    "somas",
-    "sonde",
-    "sones",
-    "sonly",
-    "sonsy",
-    "sooey",
-    "sooks",
-    "soots",
-    "sophs",
-    "sophy",
-    "sopor",
-    "soppy",
-    "soras",
-    "sorbs",
-    "sords",
-    "sored",
-    "sorer",
-    "sorgo",
-    "sorns",
-    "sorus",
-    "soths",
-    "sotol",
-    "sough",
-    "souks",
-    "soupy",
-    "sours",
-    "souse",
-    "sowar",
-    "soyas",
-    "sozin",
-    "spacy",
-    "spado",
-    "spaed",
-    "spaes",
-    "spahi",
-    "spail",
-    "spait",
-    "spale",
-    "spall",
-    "spang",
-    "spats",
-    "spays",
-    "spazz",
-    "spean",
-    "speel",
-    "speil",
-    "speir",
-    "spick",
-    "spics",
-    "spiff",
-    "spiks",
-    "spile",
-    "spirt",
-    "spiry",
-    "spivs",
-    "sprag",
-    "sprat",
-    "sprit",
-    "sprug",
-    "spued",
-    "spues",
-    "spume",
-    "spumy",
-    "spurn",
-    "sputa",
-    "squab",
-    "squeg",
-    "stagy",
-    "staig",
-    "stane",
-    "steek",
-    "stela",
-    "stele",
-    "stere",
-    "stets",
-    "stewy",
-    "stied",
-    "sties",
-    "stime",
-    "stimy",
-    "stirk",
-    "stirp",
-    "stoae",
-    "stoai",
-    "stoas",
-    "stoat",
-    "stobs",
-    "stogy",
-    "stook",
-    "stope",
-    "stopt",
-    "stoss",
-    "stots",
-    "stoup",
-    "stowp",
-    "stows",
-    "strew",
-    "stria",
-    "strop",
-    "strow",
-    "stroy",
-    "stums",
-    "stunk",
-    "stupe",
-    "styed",
-    "styes",
-    "stymy",
-    "subah",
-    "subas",
-    "suber",
-    "sudds",
-    "sudor",
-    "sudsy",
-    "suers",
-    "suets",
-    "suety",
-    "sughs",
-    "suint",
-    "sulci",
-    "sulfa",
-    "sulfo",
-    "sulks",
-    "sulus",
-    "sumos",
-    "sumps",
-    "sunns",
-    "sunup",
-    "supes",
-    "sural",
-    "suras",
-    "surds",
-    "surer",
-    "surfy",
-    "surgy",
-    "surra",
-    "swage",
-    "swail",
-    "swang",
-    "sward",
-    "sware",
-    "swarf",
-    "swats",
-    "sways",
-    "sweer",
-    "swigs",
-    "swill",
-    "swink",
-    "swith",
-    "swive",
-    "swobs",
-    "swops",
-    "swots",
-    "swoun",
-    "sycee",
-    "syces",
-    "sylis",
-    "sylph",
-    "syphs",
-    "syren",
-    "tabes",
-    "tabid",
-    "tabun",
-    "tabus",
-    "taces",
-    "tacet",
-    "tache",
-    "tachs",
-    "tacts",
-    "taels",
-    "tafia",
-    "tahrs",
-    "tajes",
-    "takas",
-    "talar",
-    "talas",
-    "talcs",
-    "taler",
-    "talky",
-    "talls",
-    "taluk",
-    "tamal",
-    "tamis",
-    "tamps",
-    "tangs",
-    "tansy",
-    "tapir",
-    "tardo",
-    "tared",
-    "tares",
-    "targe",
-    "tarns",
-    "taroc",
-    "tarok",
-    "taros",
-    "tarre",
-    "tarsi",
-    "tarty",
-    "tauon",
-    "tauts",
-    "tawed",
-    "tawer",
-    "tawie",
-    "tawse",
-    "taxer",
-    "taxus",
-    "tazza",
-    "tazze",
-    "teaks",
-    "teals",
-    "tecta",
-    "teels",
-    "teems",
-    "teffs",
-    "teggs",
-    "tegua",
-    "teiid",
-    "teind",
-    "telae",
-    "teles",
-    "telic",
-    "teloi",
-    "tempi",
-    "tench",
-    "tendu",
-    "tenia",
-    "tenty",
-    "tepal",
-    "tepas",
-    "tepee",
-    "tepoy",
-    "terai",
-    "terce",
-    "terga",
-    "terne",
-    "teths",
-    "tetri",
-    "teuch",
-    "teugh",
-    "tewed",
-    "thack",
-    "tharm",
-    "thaws",
-    "thebe",
-    "theca",
-    "thegn",
-    "thens",
-    "thesp",
-    "thews",
-    "thewy",
-    "thill",
-    "thirl",
-    "thole",
-    "thoro",
-    "thous",
-    "thraw",
-    "thrip",
-    "throe",
-    "thrum",
-    "thuds",
-    "thurl",
-    "thuya",
-    "thymi",
-    "thymy",
-    "tided",
-    "tiffs",
-    "tigon",
-    "tikis",
-    "tiler",
-    "tilth",
-    "tinct",
-    "tined",
-    "tipis",
-    "tirls",
-    "tiros",
-    "titis",
-    "tizzy",
-    "toady",
-    "toeas",
-    "toffs",
-    "toffy",
-    "tofts",
-    "tofus",
-    "togae",
-    "togas",
-    "togue",
-    "toits",
-    "tokay",
-    "toked",
-    "toker",
-    "tokes",
-    "tolan",
-    "tolas",
-    "toled",
-    "toles",
-    "tolus",
-    "tolyl",
-    "toman",
-    "tondi",
-    "tondo",
-    "tonus",
-    "toped",
-    "topee",
-    "toper",
-    "topes",
-    "tophe",
-    "tophi",
-    "tophs",
-    "topis",
-    "topoi",
-    "toras",
-    "torcs",
-    "tores",
-    "torot",
-    "torrs",
-    "torse",
-    "torsi",
-    "torsk",
-    "torta",
-    "toted",
-    "toter",
-    "touse",
-    "towie",
-    "towny",
-    "toyer",
-    "toyon",
-    "toyos",
-    "tragi",
-    "traik",
-    "trank",
-    "tranq",
-    "trass",
-    "treed",
-    "treen",
-    "trets",
-    "trews",
-    "treys",
-    "triac",
-    "trigo",
-    "trigs",
-    "triol",
-    "troak",
-    "trock",
-    "trode",
-    "trogs",
-    "troke",
-    "tromp",
-    "trona",
-    "trone",
-    "trooz",
-    "troth",
-    "trows",
-    "troys",
-    "trued",
-    "trues",
-    "trugs",
-    "trull",
-    "tryma",
-    "tsade",
-    "tsadi",
-    "tsars",
-    "tsked",
-    "tsuba",
-    "tubae",
-    "tubas",
-    "tubed",
-    "tufas",
-    "tuffs",
-    "tufty",
-    "tules",
-    "tumid",
-    "tumps",
-    "tungs",
-    "tunny",
-    "tupik",
-    "tuque",
-    "turfs",
-    "turfy",
-    "turps",
-    "tutee",
-    "tutty",
-    "tutus",
-    "tuyer",
-    "twaes",
-    "twerp",
-    "twier",
-    "twiny",
-    "twirp",
-    "twits",
-    "twixt",
-    "twyer",
-    "tyees",
-    "tyiyn",
-    "tyned",
-    "tynes",
-    "typal",
-    "typey",
-    "typic",
-    "typps",
-    "tyred",
-    "tyros",
-    "tythe",
-    "tzars",
-    "udons",
-    "uhlan",
-    "ukase",
-    "ulama",
-    "ulans",
-    "ulema",
-    "ulnad",
-    "ulnae",
-    "ulnas",
-    "ulpan",
-    "ulvas",
-    "umami",
-    "umbel",
-    "umbos",
-    "umiac",
-    "umiak",
-    "umiaq",
-    "umped",
-    "unais",
-    "unapt",
-    "unarm",
-    "unaus",
-    "unbar",
-    "unbid",
-    "unbox",
-    "uncap",
-    "uncia",
-    "uncos",
-    "uncoy",
-    "uncus",
-    "undee",
-    "unfed",
-    "unfix",
-    "ungot",
-    "unhat",
-    "unhip",
-    "unjam",
-    "unlay",
-    "unled",
-    "unlet",
-    "unlit",
-    "unman",
-    "unmew",
-    "unmix",
-    "unpeg",
-    "unpen",
-    "unpin",
-    "unrig",
-    "unrip",
-    "unsay",
-    "unsew",
-    "unsex",
-    "unwet",
-    "unwit",
-    "unwon",
-    "upbow",
-    "upbye",
-    "updos",
-    "updry",
-    "upend",
-    "uplit",
-    "uraei",
-    "urare",
-    "urari",
-    "urase",
-    "urate",
-    "urbia",
-    "ureal",
-    "ureas",
-    "uredo",
-    "ureic",
-    "urger",
-    "urial",
-    "urped",
-    "ursae",
-    "ursid",
-    "usnea",
-    "usque",
-    "uteri",
-    "uveal",
-    "uveas",
-    "uvula",
-    "vacua",
-    "vails",
-    "vairs",
-    "vakil",
-    "vales",
-    "vampy",
-    "vaned",
-    "vangs",
-    "varas",
-    "varix",
-    "varus",
-    "varve",
-    "vasal",
-    "vasts",
-    "vasty",
-    "vatic",
-    "vatus",
-    "vaunt",
-    "veals",
-    "vealy",
-    "veeps",
-    "veery",
-    "veges",
-    "vegie",
-    "veiny",
-    "velar",
-    "velds",
-    "veldt",
-    "velum",
-    "venae",
-    "venal",
-    "vends",
-    "venge",
-    "venin",
-    "verst",
-    "vexer",
-    "vexes",
-    "vexil",
-    "viand",
-    "viced",
-    "viers",
-    "viewy",
-    "vigas",
-    "vigia",
-    "viler",
-    "villi",
-    "vills",
-    "vimen",
-    "vinal",
-    "vinas",
-    "vined",
-    "vinic",
-    "viols",
-    "vires",
-    "virga",
-    "virid",
-    "virls",
-    "virtu",
-    "vised",
-    "vitta",
-    "vivas",
-    "vizir",
-    "vizor",
-    "voces",
-    "vodou",
-    "vodun",
-    "vogie",
-    "volar",
-    "voled",
-    "volti",
-    "volva",
-    "vomer",
-    "vower",
-    "vrows",
-    "vuggs",
-    "vuggy",
-    "vughs",
-    "vulgo",
-    "wacke",
-    "wacks",
-    "waddy",
-    "wades",
-    "wadis",
-    "waffs",
-    "wafts",
-    "waifs",
-    "wains",
-    "wairs",
-    "waked",
-    "waken",
-    "waled",
-    "waler",
-    "wames",
-    "wamus",
-    "wanes",
-    "waney",
-    "wanks",
-    "wanly",
-    "wared",
-    "warks",
-    "waspy",
-    "wasts",
-    "watap",
-    "wauks",
-    "wauls",
-    "wavey",
-    "wawls",
-    "waxen",
-    "waxer",
-    "wazoo",
-    "weals",
-    "weans",
-    "wecht",
-    "wedel",
-    "wedgy",
-    "weens",
-    "weeny",
-    "weepy",
-    "weest",
-    "weets",
-    "wefts",
-    "wekas",
-    "welts",
-    "wends",
-    "wenny",
-    "wetly",
-    "whamo",
-    "whams",
-    "whang",
-    "whaps",
-    "whaup",
-    "wheal",
-    "wheen",
-    "wheep",
-    "whelk",
-    "whelm",
-    "whelp",
-    "whens",
-    "whets",
-    "whews",
-    "wheys",
-    "whids",
-    "whins",
-    "whipt",
-    "whirr",
-    "whirs",
-    "whish",
-    "whits",
-    "whity",
-    "whomp",
-    "whoof",
-    "whops",
-    "whort",
-    "whump",
-    "whups",
-    "widdy",
-    "wides",
-    "wifed",
-    "wifty",
-    "wiggy",
-    "wiled",
-    "wined",
-    "winey",
-    "wingy",
-    "winos",
-    "winze",
-    "wirer",
-    "wirra",
-    "wised",
-    "wises",
-    "wisha",
-    "witan",
-    "wited",
-    "wites",
-    "withe",
-    "withy",
-    "wived",
-    "wiver",
-    "wizen",
-    "wizes",
-    "woads",
-    "woald",
-    "wodge",
-    "woful",
-    "wolds",
-    "wolfs",
-    "wombs",
-    "womby",
-    "wonts",
-    "wooer",
-    "woofs",
-    "wools",
-    "woops",
-    "woosh",
-    "woozy",
-    "wormy",
-    "worts",
-    "wrack",
-    "wrang",
-    "wrapt",
-    "wrick",
-    "wried",
-    "wrier",
-    "wries",
-    "wroth",
-    "wryer",
-    "wryly",
-    "wurst",
-    "wussy",
-    "wyled",
-    "wyles",
-    "wynds",
-    "wynns",
-    "wyted",
-    "wytes",
-    "xebec",
-    "xenic",
-    "xeric",
-    "xerus",
-    "xylan",
-    "xylol",
-    "xylyl",
-    "xysti",
-    "xysts",
-    "yabby",
-    "yacks",
-    "yaffs",
-    "yagis",
-    "yaird",
-    "yamen",
-    "yamun",
-    "yangs",
-    "yapok",
-    "yapon",
-    "yarer",
-    "yauds",
-    "yauld",
-    "yaups",
-    "yawed",
-    "yawey",
-    "yawls",
-    "yawps",
-    "yclad",
-    "yeans",
-    "yecch",
-    "yechs",
-    "yechy",
-    "yeggs",
-    "yelks",
-    "yelps",
-    "yenta",
-    "yente",
-    "yerks",
-    "yeses",
-    "yetis",
-    "yetts",
-    "yeuks",
-    "yeuky",
-    "yills",
-    "yince",
-    "yipes",
-    "yirds",
-    "yirrs",
-    "yirth",
-    "ylems",
-    "yobbo",
-    "yocks",
-    "yodel",
-    "yodhs",
-    "yodle",
-    "yogas",
-    "yogee",
-    "yoghs",
-    "yogin",
-    "yoked",
-    "yokel",
-    "yolky",
-    "yomim",
-    "yonic",
-    "yonis",
-    "yores",
-    "yourn",
-    "yowed",
-    "yowes",
-    "yowie",
-    "yowls",
-    "yuans",
-    "yucas",
-    "yucch",
-    "yucks",
-    "yugas",
-    "yukky",
-    "yulan",
-    "yules",
-    "yupon",
-    "yuppy",
-    "yurta",
-    "yurts",
-    "zamia",
-    "zanza",
-    "zappy",
-    "zarfs",
-    "zaxes",
-    "zayin",
-    "zazen",
-    "zeals",
-    "zebec",
-    "zebus",
-    "zeins",
-    "zerks",
-    "zests",
-    "zetas",
-    "zibet",
-    "zills",
-    "zincs",
-    "zincy",
-    "zineb",
-    "zings",
-    "zinky",
-    "ziram",
-    "zitis",
-    "zizit",
-    "zlote",
-    "zoeae",
-    "zoeal",
-    "zoeas",
-    "zombi",
-    "zonae",
-    "zoner",
-    "zonks",
-    "zooid",
-    "zooks",
-    "zoons",
-    "zooty",
-    "zoril",
-    "zoris",
-    "zouks",
-    "zowie",
-    "zuzim",
-    "zymes",
-]
@@ -1,15790 +0,0 @@
-WORDS = [
-    "search",
-    "online",
-    "people",
-    "health",
-    "should",
-    "system",
-    "policy",
-    "number",
-    "please",
-    "rights",
-    "public",
-    "school",
-    "review",
-    "united",
-    "center",
-    "travel",
-    "report",
-    "member",
-    "before",
-    "hotels",
-    "office",
-    "design",
-    "posted",
-    "within",
-    "states",
-    "family",
-    "prices",
-    "sports",
-    "county",
-    "access",
-    "change",
-    "rating",
-    "during",
-    "return",
-    "events",
-    "little",
-    "movies",
-    "source",
-    "author",
-    "around",
-    "course",
-    "credit",
-    "estate",
-    "select",
-    "photos",
-    "thread",
-    "market",
-    "really",
-    "action",
-    "series",
-    "second",
-    "forums",
-    "better",
-    "friend",
-    "server",
-    "issues",
-    "street",
-    "things",
-    "person",
-    "mobile",
-    "offers",
-    "recent",
-    "stores",
-    "memory",
-    "social",
-    "august",
-    "create",
-    "single",
-    "latest",
-    "status",
-    "browse",
-    "seller",
-    "always",
-    "result",
-    "groups",
-    "making",
-    "future",
-    "become",
-    "garden",
-    "listed",
-    "energy",
-    "images",
-    "notice",
-    "others",
-    "format",
-    "months",
-    "safety",
-    "having",
-    "common",
-    "living",
-    "called",
-    "period",
-    "window",
-    "region",
-    "island",
-    "record",
-    "direct",
-    "update",
-    "either",
-    "centre",
-    "topics",
-    "videos",
-    "global",
-    "player",
-    "lyrics",
-    "submit",
-    "amount",
-    "though",
-    "thanks",
-    "weight",
-    "choose",
-    "points",
-    "camera",
-    "domain",
-    "beauty",
-    "models",
-    "simple",
-    "annual",
-    "church",
-    "method",
-    "active",
-    "figure",
-    "enough",
-    "higher",
-    "yellow",
-    "french",
-    "nature",
-    "orders",
-    "growth",
-    "agency",
-    "income",
-    "engine",
-    "double",
-    "screen",
-    "across",
-    "needed",
-    "season",
-    "effect",
-    "casino",
-    "volume",
-    "anyone",
-    "silver",
-    "inside",
-    "mature",
-    "rather",
-    "supply",
-    "skills",
-    "advice",
-    "career",
-    "rental",
-    "middle",
-    "taking",
-    "values",
-    "coming",
-    "object",
-    "length",
-    "client",
-    "follow",
-    "sample",
-    "choice",
-    "artist",
-    "levels",
-    "letter",
-    "phones",
-    "summer",
-    "degree",
-    "button",
-    "matter",
-    "custom",
-    "almost",
-    "editor",
-    "female",
-    "cancer",
-    "reason",
-    "spring",
-    "answer",
-    "police",
-    "wanted",
-    "unique",
-    "survey",
-    "animal",
-    "secure",
-    "simply",
-    "option",
-    "master",
-    "valley",
-    "larger",
-    "impact",
-    "strong",
-    "ground",
-    "owners",
-    "cities",
-    "ensure",
-    "budget",
-    "guides",
-    "amazon",
-    "retail",
-    "useful",
-    "trying",
-    "mother",
-    "joined",
-    "modern",
-    "senior",
-    "charge",
-    "normal",
-    "entire",
-    "output",
-    "likely",
-    "dating",
-    "filter",
-    "longer",
-    "behind",
-    "german",
-    "buying",
-    "allows",
-    "boards",
-    "string",
-    "unless",
-    "target",
-    "except",
-    "moving",
-    "brands",
-    "places",
-    "pretty",
-    "winter",
-    "boston",
-    "incest",
-    "medium",
-    "itself",
-    "papers",
-    "awards",
-    "studio",
-    "reader",
-    "device",
-    "remote",
-    "theory",
-    "remove",
-    "visual",
-    "martin",
-    "manual",
-    "agents",
-    "repair",
-    "sector",
-    "jersey",
-    "father",
-    "quotes",
-    "driver",
-    "campus",
-    "beyond",
-    "museum",
-    "former",
-    "parent",
-    "bottom",
-    "detail",
-    "switch",
-    "titles",
-    "basket",
-    "weekly",
-    "demand",
-    "square",
-    "nation",
-    "module",
-    "resort",
-    "random",
-    "motion",
-    "forest",
-    "couple",
-    "giving",
-    "chance",
-    "vision",
-    "ending",
-    "listen",
-    "accept",
-    "lowest",
-    "highly",
-    "appear",
-    "actual",
-    "coffee",
-    "easily",
-    "poster",
-    "closed",
-    "league",
-    "minute",
-    "effort",
-    "fields",
-    "breast",
-    "doctor",
-    "reduce",
-    "enable",
-    "leader",
-    "flight",
-    "pocket",
-    "factor",
-    "stream",
-    "signed",
-    "errors",
-    "worked",
-    "sorted",
-    "myself",
-    "expert",
-    "became",
-    "orange",
-    "marine",
-    "guitar",
-    "saying",
-    "spirit",
-    "claims",
-    "branch",
-    "manage",
-    "corner",
-    "tables",
-    "define",
-    "racing",
-    "column",
-    "plants",
-    "avenue",
-    "mental",
-    "viewed",
-    "moment",
-    "attack",
-    "damage",
-    "placed",
-    "dollar",
-    "bridge",
-    "native",
-    "played",
-    "shirts",
-    "profit",
-    "expect",
-    "golden",
-    "senate",
-    "forces",
-    "turned",
-    "delete",
-    "signal",
-    "issued",
-    "sexual",
-    "flower",
-    "passed",
-    "stated",
-    "covers",
-    "adults",
-    "script",
-    "served",
-    "dining",
-    "handle",
-    "looked",
-    "logged",
-    "laptop",
-    "nearly",
-    "forgot",
-    "origin",
-    "gaming",
-    "faster",
-    "bought",
-    "broken",
-    "alaska",
-    "battle",
-    "equity",
-    "speech",
-    "shared",
-    "sounds",
-    "forced",
-    "height",
-    "obtain",
-    "remain",
-    "failed",
-    "secret",
-    "assets",
-    "injury",
-    "joseph",
-    "lawyer",
-    "portal",
-    "gratis",
-    "toward",
-    "assist",
-    "comics",
-    "houses",
-    "postal",
-    "finish",
-    "brazil",
-    "static",
-    "hunter",
-    "famous",
-    "writer",
-    "gender",
-    "colour",
-    "vendor",
-    "junior",
-    "ladies",
-    "ticket",
-    "agreed",
-    "soccer",
-    "import",
-    "scheme",
-    "manner",
-    "matrix",
-    "turkey",
-    "proper",
-    "inches",
-    "shares",
-    "voyeur",
-    "colors",
-    "appeal",
-    "cruise",
-    "drives",
-    "dealer",
-    "nearby",
-    "happen",
-    "miller",
-    "caused",
-    "luxury",
-    "frames",
-    "indeed",
-    "easier",
-    "adding",
-    "mostly",
-    "prints",
-    "suites",
-    "hidden",
-    "serial",
-    "relief",
-    "planet",
-    "copies",
-    "recipe",
-    "permit",
-    "seeing",
-    "tennis",
-    "bureau",
-    "pieces",
-    "dinner",
-    "stress",
-    "trends",
-    "fourth",
-    "charts",
-    "census",
-    "poetry",
-    "lights",
-    "forget",
-    "sister",
-    "newest",
-    "extent",
-    "export",
-    "backup",
-    "spread",
-    "expand",
-    "jordan",
-    "affect",
-    "virgin",
-    "raised",
-    "blonde",
-    "albums",
-    "cheats",
-    "guests",
-    "hosted",
-    "agenda",
-    "anyway",
-    "tracks",
-    "prince",
-    "circle",
-    "grants",
-    "launch",
-    "symbol",
-    "crafts",
-    "fiscal",
-    "styles",
-    "filled",
-    "notify",
-    "cables",
-    "cotton",
-    "dental",
-    "killed",
-    "border",
-    "debate",
-    "starts",
-    "causes",
-    "opened",
-    "scores",
-    "comedy",
-    "weblog",
-    "linear",
-    "edited",
-    "linked",
-    "wonder",
-    "begins",
-    "reform",
-    "alerts",
-    "assume",
-    "leaves",
-    "checks",
-    "safari",
-    "tested",
-    "formal",
-    "hockey",
-    "showed",
-    "cancel",
-    "limits",
-    "outlet",
-    "winner",
-    "potter",
-    "modify",
-    "oxford",
-    "patent",
-    "eating",
-    "mirror",
-    "kernel",
-    "stocks",
-    "buyers",
-    "chosen",
-    "labour",
-    "nights",
-    "behalf",
-    "liquid",
-    "salary",
-    "saving",
-    "empire",
-    "resume",
-    "twenty",
-    "avatar",
-    "helped",
-    "decide",
-    "guinea",
-    "muscle",
-    "attend",
-    "shower",
-    "seemed",
-    "finder",
-    "unable",
-    "insert",
-    "alumni",
-    "themes",
-    "powers",
-    "heaven",
-    "asking",
-    "blocks",
-    "bodies",
-    "paying",
-    "carbon",
-    "crisis",
-    "bright",
-    "header",
-    "formed",
-    "sheets",
-    "plasma",
-    "banner",
-    "dreams",
-    "stands",
-    "latina",
-    "wheels",
-    "router",
-    "folder",
-    "upload",
-    "voting",
-    "courts",
-    "regard",
-    "exists",
-    "smooth",
-    "strike",
-    "narrow",
-    "threat",
-    "castle",
-    "missed",
-    "labels",
-    "acting",
-    "stored",
-    "stable",
-    "lesson",
-    "cinema",
-    "severe",
-    "deluxe",
-    "fabric",
-    "visits",
-    "flying",
-    "berlin",
-    "pounds",
-    "desire",
-    "caught",
-    "marked",
-    "driven",
-    "bottle",
-    "rubber",
-    "legend",
-    "python",
-    "entity",
-    "holder",
-    "duties",
-    "erotic",
-    "ethics",
-    "dragon",
-    "brings",
-    "stereo",
-    "commit",
-    "jacket",
-    "oracle",
-    "excess",
-    "stamps",
-    "mining",
-    "garage",
-    "thongs",
-    "morgan",
-    "prayer",
-    "cheese",
-    "fetish",
-    "apache",
-    "fellow",
-    "lounge",
-    "horror",
-    "mainly",
-    "ethnic",
-    "occurs",
-    "layout",
-    "horses",
-    "donate",
-    "taught",
-    "worker",
-    "temple",
-    "breaks",
-    "waters",
-    "prefer",
-    "vector",
-    "shaved",
-    "buffer",
-    "purple",
-    "mutual",
-    "syntax",
-    "prison",
-    "chairs",
-    "sierra",
-    "desert",
-    "oldest",
-    "summit",
-    "spaces",
-    "escape",
-    "glance",
-    "arcade",
-    "filing",
-    "foster",
-    "trials",
-    "tissue",
-    "aspect",
-    "counts",
-    "priced",
-    "closer",
-    "shadow",
-    "riding",
-    "clinic",
-    "packet",
-    "funded",
-    "extend",
-    "nelson",
-    "murder",
-    "grades",
-    "digest",
-    "rescue",
-    "losses",
-    "combat",
-    "abroad",
-    "walker",
-    "serves",
-    "palace",
-    "verify",
-    "copper",
-    "nobody",
-    "cloudy",
-    "plenty",
-    "throat",
-    "ignore",
-    "wealth",
-    "vacuum",
-    "writes",
-    "plates",
-    "essays",
-    "fairly",
-    "stupid",
-    "harbor",
-    "puzzle",
-    "rising",
-    "latter",
-    "repeat",
-    "pupils",
-    "casual",
-    "polish",
-    "lovely",
-    "extras",
-    "clause",
-    "troops",
-    "indoor",
-    "broker",
-    "trucks",
-    "partly",
-    "sensor",
-    "angels",
-    "deputy",
-    "sealed",
-    "loaded",
-    "scenes",
-    "tranny",
-    "finger",
-    "locate",
-    "wooden",
-    "motors",
-    "shorts",
-    "johnny",
-    "facing",
-    "refund",
-    "emails",
-    "cyprus",
-    "makers",
-    "hearts",
-    "carter",
-    "legacy",
-    "danger",
-    "widely",
-    "phrase",
-    "hybrid",
-    "bigger",
-    "diesel",
-    "versus",
-    "exceed",
-    "babies",
-    "graham",
-    "slowly",
-    "infant",
-    "unlike",
-    "wright",
-    "proven",
-    "cached",
-    "warren",
-    "comply",
-    "cherry",
-    "webcam",
-    "socket",
-    "silent",
-    "humans",
-    "analog",
-    "facial",
-    "talent",
-    "seeker",
-    "wisdom",
-    "offset",
-    "payday",
-    "stages",
-    "powder",
-    "assess",
-    "stones",
-    "losing",
-    "gospel",
-    "knight",
-    "earned",
-    "parker",
-    "triple",
-    "cooper",
-    "titans",
-    "sought",
-    "median",
-    "herein",
-    "basics",
-    "carpet",
-    "lenses",
-    "binary",
-    "warner",
-    "inkjet",
-    "wizard",
-    "actors",
-    "liable",
-    "morris",
-    "recall",
-    "picked",
-    "belief",
-    "bikini",
-    "lookup",
-    "refine",
-    "bidder",
-    "singer",
-    "herald",
-    "diving",
-    "invite",
-    "terror",
-    "thirty",
-    "refers",
-    "victim",
-    "arrive",
-    "sunset",
-    "framed",
-    "inform",
-    "intent",
-    "oxygen",
-    "cookie",
-    "canyon",
-    "meters",
-    "merely",
-    "passes",
-    "sleeve",
-    "stroke",
-    "gloves",
-    "skiing",
-    "timing",
-    "denied",
-    "fucked",
-    "deaths",
-    "rivers",
-    "thumbs",
-    "twelve",
-    "decade",
-    "drinks",
-    "voices",
-    "honest",
-    "coding",
-    "hiking",
-    "panama",
-    "judges",
-    "walked",
-    "afraid",
-    "locked",
-    "fusion",
-    "canvas",
-    "parish",
-    "coupon",
-    "nurses",
-    "tagged",
-    "killer",
-    "bishop",
-    "pulled",
-    "shaped",
-    "farmer",
-    "heroes",
-    "floral",
-    "fisher",
-    "spears",
-    "dildos",
-    "worlds",
-    "guilty",
-    "tablet",
-    "crimes",
-    "thesis",
-    "pixels",
-    "totals",
-    "afford",
-    "turner",
-    "spoken",
-    "stayed",
-    "redeem",
-    "rogers",
-    "regime",
-    "wishes",
-    "depend",
-    "differ",
-    "breath",
-    "candle",
-    "herbal",
-    "loving",
-    "deemed",
-    "hacker",
-    "margin",
-    "solely",
-    "headed",
-    "voters",
-    "murphy",
-    "thinks",
-    "tricks",
-    "panels",
-    "tongue",
-    "danish",
-    "monkey",
-    "invest",
-    "lovers",
-    "atomic",
-    "arabic",
-    "chains",
-    "engage",
-    "quoted",
-    "bronze",
-    "sender",
-    "spouse",
-    "exotic",
-    "viewer",
-    "proved",
-    "salmon",
-    "butter",
-    "pepper",
-    "weapon",
-    "burden",
-    "finest",
-    "realty",
-    "autumn",
-    "toilet",
-    "ranked",
-    "routes",
-    "packed",
-    "timely",
-    "talked",
-    "villas",
-    "peeing",
-    "brooks",
-    "newton",
-    "whilst",
-    "prompt",
-    "ebooks",
-    "victor",
-    "attach",
-    "spider",
-    "ranges",
-    "trails",
-    "divine",
-    "dialog",
-    "venues",
-    "shield",
-    "pickup",
-    "sacred",
-    "chrome",
-    "delays",
-    "scored",
-    "lambda",
-    "belong",
-    "escort",
-    "rabbit",
-    "unions",
-    "frozen",
-    "scales",
-    "strain",
-    "gained",
-    "adjust",
-    "soviet",
-    "treaty",
-    "chapel",
-    "layers",
-    "guided",
-    "radius",
-    "harder",
-    "tender",
-    "clouds",
-    "easter",
-    "praise",
-    "hardly",
-    "absent",
-    "hoping",
-    "bubble",
-    "vessel",
-    "scroll",
-    "relate",
-    "suffer",
-    "retain",
-    "tunnel",
-    "genres",
-    "beaver",
-    "eagles",
-    "anchor",
-    "parade",
-    "hiring",
-    "clocks",
-    "surely",
-    "stylus",
-    "chicks",
-    "cattle",
-    "reload",
-    "struck",
-    "bridal",
-    "tribal",
-    "rebate",
-    "cycles",
-    "detect",
-    "butler",
-    "techno",
-    "immune",
-    "rarely",
-    "trains",
-    "metals",
-    "advise",
-    "boxing",
-    "reveal",
-    "strict",
-    "timber",
-    "ruling",
-    "steady",
-    "hourly",
-    "geneva",
-    "handed",
-    "intake",
-    "assure",
-    "sodium",
-    "decent",
-    "trivia",
-    "hazard",
-    "fruits",
-    "ribbon",
-    "exempt",
-    "dishes",
-    "refuse",
-    "trades",
-    "superb",
-    "floors",
-    "speaks",
-    "burton",
-    "copied",
-    "scotia",
-    "gibson",
-    "roller",
-    "latino",
-    "mixing",
-    "fitted",
-    "asthma",
-    "reward",
-    "sprint",
-    "inputs",
-    "genome",
-    "knives",
-    "honors",
-    "fallen",
-    "gather",
-    "backed",
-    "motels",
-    "slight",
-    "arrest",
-    "deeply",
-    "marina",
-    "prizes",
-    "optics",
-    "pursue",
-    "nipple",
-    "plains",
-    "lonely",
-    "hereby",
-    "collar",
-    "racial",
-    "novels",
-    "safely",
-    "finite",
-    "kidney",
-    "allied",
-    "throws",
-    "roster",
-    "tuning",
-    "gotten",
-    "rocket",
-    "bullet",
-    "towers",
-    "priest",
-    "trance",
-    "locale",
-    "bundle",
-    "hammer",
-    "runner",
-    "notion",
-    "mailed",
-    "arctic",
-    "defend",
-    "stolen",
-    "agrees",
-    "cheers",
-    "zoning",
-    "mighty",
-    "galaxy",
-    "caring",
-    "buried",
-    "newbie",
-    "marker",
-    "robust",
-    "porter",
-    "jungle",
-    "alpine",
-    "cooler",
-    "shapes",
-    "breeds",
-    "rapids",
-    "bailey",
-    "metric",
-    "varied",
-    "assign",
-    "tigers",
-    "aurora",
-    "slides",
-    "lender",
-    "chorus",
-    "rhythm",
-    "argued",
-    "sudden",
-    "speeds",
-    "vocals",
-    "chubby",
-    "burner",
-    "gentle",
-    "deeper",
-    "worthy",
-    "saints",
-    "cowboy",
-    "queens",
-    "tribes",
-    "defeat",
-    "clicks",
-    "harper",
-    "tenant",
-    "tattoo",
-    "freely",
-    "nudist",
-    "remedy",
-    "genius",
-    "barely",
-    "marble",
-    "surrey",
-    "giants",
-    "solved",
-    "magnet",
-    "cayman",
-    "jaguar",
-    "posing",
-    "urgent",
-    "gothic",
-    "graphs",
-    "patrol",
-    "divide",
-    "boring",
-    "schema",
-    "prefix",
-    "barrel",
-    "typing",
-    "floppy",
-    "namely",
-    "aerial",
-    "makeup",
-    "wicked",
-    "pushed",
-    "reggae",
-    "enzyme",
-    "planes",
-    "tackle",
-    "builds",
-    "favors",
-    "potato",
-    "sticks",
-    "excuse",
-    "strand",
-    "cheque",
-    "reject",
-    "italic",
-    "valued",
-    "batman",
-    "settle",
-    "palmer",
-    "scenic",
-    "sewing",
-    "celebs",
-    "trusts",
-    "pillow",
-    "finals",
-    "parcel",
-    "rolled",
-    "flavor",
-    "hungry",
-    "lesser",
-    "charms",
-    "trader",
-    "denial",
-    "thrown",
-    "raises",
-    "ballot",
-    "squirt",
-    "helmet",
-    "nickel",
-    "wallet",
-    "coated",
-    "intend",
-    "beings",
-    "habits",
-    "accent",
-    "eleven",
-    "auburn",
-    "unlock",
-    "pledge",
-    "merger",
-    "riders",
-    "remark",
-    "dozens",
-    "varies",
-    "guards",
-    "nudity",
-    "granny",
-    "fleece",
-    "pierce",
-    "breach",
-    "wiring",
-    "pastor",
-    "phases",
-    "ballet",
-    "bumper",
-    "garlic",
-    "banned",
-    "briefs",
-    "radios",
-    "tariff",
-    "vagina",
-    "hostel",
-    "employ",
-    "yearly",
-    "marvel",
-    "petite",
-    "strips",
-    "gossip",
-    "rotary",
-    "kinase",
-    "skirts",
-    "deadly",
-    "rounds",
-    "dosage",
-    "baking",
-    "needle",
-    "brakes",
-    "sticky",
-    "heated",
-    "brutal",
-    "yields",
-    "suited",
-    "blacks",
-    "curves",
-    "vertex",
-    "tomato",
-    "waiver",
-    "valves",
-    "donors",
-    "velvet",
-    "lately",
-    "banana",
-    "bloody",
-    "remind",
-    "affair",
-    "washer",
-    "beside",
-    "mentor",
-    "fought",
-    "metres",
-    "pencil",
-    "freeze",
-    "titled",
-    "sphere",
-    "ratios",
-    "walnut",
-    "ladder",
-    "orgasm",
-    "condos",
-    "gently",
-    "fridge",
-    "blades",
-    "trauma",
-    "advert",
-    "picnic",
-    "hollow",
-    "groove",
-    "sleeps",
-    "heater",
-    "colony",
-    "cannon",
-    "circus",
-    "cooked",
-    "hunger",
-    "cement",
-    "closes",
-    "violin",
-    "modems",
-    "turtle",
-    "warned",
-    "neural",
-    "fossil",
-    "apollo",
-    "robots",
-    "nested",
-    "movers",
-    "verbal",
-    "render",
-    "carmen",
-    "impose",
-    "enters",
-    "savage",
-    "willow",
-    "barbie",
-    "favour",
-    "mounts",
-    "subtle",
-    "cradle",
-    "virtue",
-    "corpus",
-    "shades",
-    "cursor",
-    "maiden",
-    "viking",
-    "myrtle",
-    "bother",
-    "mating",
-    "unwrap",
-    "resist",
-    "ranger",
-    "scared",
-    "asylum",
-    "poison",
-    "costly",
-    "stitch",
-    "inland",
-    "racism",
-    "accord",
-    "modest",
-    "gamers",
-    "unused",
-    "insure",
-    "treats",
-    "gallon",
-    "bitter",
-    "burned",
-    "depart",
-    "minded",
-    "allies",
-    "quartz",
-    "eighth",
-    "buffet",
-    "masses",
-    "ginger",
-    "crying",
-    "rotten",
-    "garnet",
-    "honour",
-    "peters",
-    "clever",
-    "primer",
-    "bypass",
-    "orgies",
-    "plated",
-    "drawer",
-    "davies",
-    "pilots",
-    "humour",
-    "caller",
-    "viable",
-    "defect",
-    "poorly",
-    "argues",
-    "organs",
-    "refill",
-    "sailor",
-    "lining",
-    "statue",
-    "equals",
-    "jumper",
-    "majors",
-    "trophy",
-    "sights",
-    "liquor",
-    "spinal",
-    "sooner",
-    "tenure",
-    "shifts",
-    "greens",
-    "naming",
-    "slaves",
-    "mickey",
-    "aliens",
-    "domino",
-    "gambia",
-    "angles",
-    "flames",
-    "toledo",
-    "closet",
-    "unfair",
-    "vacant",
-    "fixing",
-    "hiding",
-    "insect",
-    "breeze",
-    "snacks",
-    "saddle",
-    "fedora",
-    "capita",
-    "wholly",
-    "manila",
-    "purely",
-    "enroll",
-    "daemon",
-    "alarms",
-    "stairs",
-    "falcon",
-    "critic",
-    "bucket",
-    "subset",
-    "zombie",
-    "mutant",
-    "bounce",
-    "spiral",
-    "nicely",
-    "laurel",
-    "traded",
-    "shrimp",
-    "chords",
-    "cracks",
-    "lotion",
-    "beaten",
-    "tucker",
-    "chiefs",
-    "lodges",
-    "scream",
-    "biking",
-    "pirate",
-    "senses",
-    "willie",
-    "slower",
-    "vanity",
-    "cutter",
-    "melody",
-    "cousin",
-    "torque",
-    "burial",
-    "emerge",
-    "clutch",
-    "towels",
-    "barber",
-    "straps",
-    "romans",
-    "shores",
-    "cosmic",
-    "beacon",
-    "hoover",
-    "firing",
-    "gloria",
-    "canton",
-    "bonnie",
-    "laying",
-    "strive",
-    "shells",
-    "cooker",
-    "digits",
-    "banker",
-    "borrow",
-    "bamboo",
-    "insane",
-    "buddha",
-    "voyage",
-    "sketch",
-    "dancer",
-    "firmly",
-    "washed",
-    "mosaic",
-    "fiesta",
-    "sizing",
-    "outfit",
-    "aboard",
-    "joints",
-    "bounds",
-    "devils",
-    "arrays",
-    "splash",
-    "fender",
-    "violet",
-    "pearls",
-    "apples",
-    "advent",
-    "screws",
-    "enjoys",
-    "stripe",
-    "locker",
-    "squash",
-    "tumors",
-    "booked",
-    "lumber",
-    "asleep",
-    "subway",
-    "lifted",
-    "citrus",
-    "bakery",
-    "orchid",
-    "widget",
-    "waited",
-    "diaper",
-    "ounces",
-    "intact",
-    "noting",
-    "duplex",
-    "refuge",
-    "carved",
-    "jasper",
-    "deploy",
-    "regina",
-    "autism",
-    "fuller",
-    "keeper",
-    "spells",
-    "rookie",
-    "births",
-    "ritual",
-    "parser",
-    "plaque",
-    "drying",
-    "proves",
-    "debris",
-    "audits",
-    "grains",
-    "jumped",
-    "rename",
-    "markup",
-    "copier",
-    "beware",
-    "gifted",
-    "esteem",
-    "landed",
-    "scouts",
-    "warsaw",
-    "regret",
-    "stakes",
-    "litter",
-    "rugged",
-    "humble",
-    "petrol",
-    "midway",
-    "flyers",
-    "whites",
-    "locals",
-    "fringe",
-    "citing",
-    "hassle",
-    "docket",
-    "nordic",
-    "thirds",
-    "intern",
-    "oppose",
-    "sparks",
-    "madden",
-    "lively",
-    "tripod",
-    "laguna",
-    "paints",
-    "tastes",
-    "storms",
-    "smiled",
-    "expose",
-    "arises",
-    "mystic",
-    "afghan",
-    "wasted",
-    "footer",
-    "graves",
-    "ghetto",
-    "meadow",
-    "feeder",
-    "mercer",
-    "wastes",
-    "telnet",
-    "parked",
-    "peanut",
-    "holden",
-    "kaiser",
-    "retire",
-    "rumors",
-    "wished",
-    "kicked",
-    "gadget",
-    "ticker",
-    "brasil",
-    "thrust",
-    "novice",
-    "traces",
-    "fights",
-    "padded",
-    "applet",
-    "revise",
-    "weaver",
-    "macros",
-    "pewter",
-    "oceans",
-    "arrows",
-    "eureka",
-    "zodiac",
-    "tubing",
-    "artery",
-    "fluids",
-    "canopy",
-    "fibers",
-    "brains",
-    "indigo",
-    "excite",
-    "rebels",
-    "pseudo",
-    "throne",
-    "slopes",
-    "seized",
-    "leases",
-    "expire",
-    "methyl",
-    "ramada",
-    "usable",
-    "denote",
-    "slayer",
-    "tester",
-    "relies",
-    "spares",
-    "salons",
-    "helper",
-    "rancho",
-    "skinny",
-    "sewage",
-    "wretch",
-    "racist",
-    "convey",
-    "govern",
-    "reboot",
-    "blinds",
-    "traits",
-    "graded",
-    "abused",
-    "billed",
-    "smiles",
-    "merged",
-    "relied",
-    "kindly",
-    "sharks",
-    "minors",
-    "dances",
-    "mapped",
-    "decree",
-    "gamble",
-    "gravel",
-    "judged",
-    "assert",
-    "thrice",
-    "sequel",
-    "wolves",
-    "herpes",
-    "upward",
-    "streak",
-    "tragic",
-    "hooked",
-    "shrink",
-    "stance",
-    "beaded",
-    "exodus",
-    "derive",
-    "opener",
-    "jigsaw",
-    "unreal",
-    "wounds",
-    "probes",
-    "swivel",
-    "medals",
-    "proton",
-    "lister",
-    "cabins",
-    "linens",
-    "beetle",
-    "hummer",
-    "hatred",
-    "behave",
-    "encore",
-    "unsure",
-    "merits",
-    "sheila",
-    "ripper",
-    "burger",
-    "tailor",
-    "pascal",
-    "faults",
-    "grease",
-    "cairns",
-    "seated",
-    "replay",
-    "smoked",
-    "fowler",
-    "warmth",
-    "verses",
-    "toggle",
-    "barker",
-    "solids",
-    "demons",
-    "coping",
-    "curved",
-    "amazed",
-    "shocks",
-    "lasers",
-    "candid",
-    "caesar",
-    "savers",
-    "decker",
-    "extern",
-    "badges",
-    "kitten",
-    "brides",
-    "glossy",
-    "haired",
-    "lethal",
-    "cavity",
-    "molded",
-    "decals",
-    "towing",
-    "suburb",
-    "cohort",
-    "lineup",
-    "pueblo",
-    "nylons",
-    "misses",
-    "purity",
-    "cellar",
-    "onions",
-    "issuer",
-    "swords",
-    "evolve",
-    "leased",
-    "sweets",
-    "saloon",
-    "unisex",
-    "folded",
-    "unpaid",
-    "ghosts",
-    "doubts",
-    "insist",
-    "resale",
-    "scalar",
-    "sesame",
-    "yachts",
-    "misuse",
-    "cosmos",
-    "legion",
-    "addict",
-    "pistol",
-    "runway",
-    "admits",
-    "buckle",
-    "divers",
-    "upside",
-    "patron",
-    "boiler",
-    "induce",
-    "debtor",
-    "mortal",
-    "stella",
-    "cereal",
-    "drills",
-    "rented",
-    "openly",
-    "jabber",
-    "rotate",
-    "behold",
-    "ledger",
-    "laughs",
-    "depths",
-    "spices",
-    "loader",
-    "themed",
-    "felony",
-    "gentoo",
-    "strait",
-    "donkey",
-    "boasts",
-    "radial",
-    "armour",
-    "tonnes",
-    "corona",
-    "bylaws",
-    "reside",
-    "seldom",
-    "morrow",
-    "lasted",
-    "awhile",
-    "winery",
-    "scaled",
-    "photon",
-    "coarse",
-    "archer",
-    "warmer",
-    "dryers",
-    "orient",
-    "contra",
-    "cigars",
-    "maroon",
-    "drafts",
-    "marrow",
-    "tavern",
-    "clones",
-    "runoff",
-    "garner",
-    "buster",
-    "karate",
-    "sorrow",
-    "canned",
-    "supper",
-    "hooded",
-    "sonata",
-    "stools",
-    "stacks",
-    "owning",
-    "sermon",
-    "thrill",
-    "lagoon",
-    "pigeon",
-    "rivals",
-    "binder",
-    "parrot",
-    "magnum",
-    "attain",
-    "sulfur",
-    "corpse",
-    "speedy",
-    "stills",
-    "biased",
-    "brewer",
-    "adhere",
-    "whales",
-    "parity",
-    "grapes",
-    "ripped",
-    "cobalt",
-    "aspire",
-    "jewels",
-    "bonded",
-    "canary",
-    "clergy",
-    "oyster",
-    "sturdy",
-    "tokens",
-    "piping",
-    "elders",
-    "heroin",
-    "oldies",
-    "parole",
-    "ninety",
-    "kisses",
-    "learns",
-    "slices",
-    "damned",
-    "fierce",
-    "blends",
-    "grills",
-    "escrow",
-    "anthem",
-    "abuses",
-    "jockey",
-    "housed",
-    "ranged",
-    "spruce",
-    "cortex",
-    "mixers",
-    "braves",
-    "shoots",
-    "clover",
-    "snakes",
-    "truths",
-    "enamel",
-    "bomber",
-    "reeves",
-    "spends",
-    "almond",
-    "puppet",
-    "pillar",
-    "mirage",
-    "piracy",
-    "rowing",
-    "siding",
-    "albeit",
-    "freaks",
-    "tended",
-    "cactus",
-    "sucked",
-    "regent",
-    "misery",
-    "mailer",
-    "liners",
-    "unread",
-    "quinta",
-    "forged",
-    "bistro",
-    "voodoo",
-    "rustic",
-    "rushed",
-    "weighs",
-    "dexter",
-    "ringer",
-    "zipper",
-    "crowds",
-    "uptake",
-    "geared",
-    "ideals",
-    "tycoon",
-    "lawful",
-    "tandem",
-    "gagged",
-    "barley",
-    "potent",
-    "nerves",
-    "sherry",
-    "indies",
-    "madame",
-    "dalton",
-    "denies",
-    "draper",
-    "bowman",
-    "spires",
-    "barney",
-    "champs",
-    "salads",
-    "eighty",
-    "scarce",
-    "plague",
-    "canine",
-    "gladly",
-    "piston",
-    "topped",
-    "absorb",
-    "feared",
-    "overly",
-    "chalet",
-    "hopper",
-    "filler",
-    "smiley",
-    "zenith",
-    "browns",
-    "softly",
-    "occupy",
-    "merlin",
-    "aiming",
-    "beanie",
-    "tricky",
-    "spaced",
-    "psycho",
-    "tutors",
-    "kettle",
-    "satire",
-    "humane",
-    "raider",
-    "timers",
-    "miners",
-    "rocker",
-    "sawyer",
-    "cooled",
-    "invoke",
-    "paddle",
-    "rooted",
-    "finale",
-    "weaker",
-    "nausea",
-    "floods",
-    "sleepy",
-    "shrine",
-    "memoir",
-    "cliffs",
-    "smells",
-    "waking",
-    "reflex",
-    "carers",
-    "keypad",
-    "bibles",
-    "sauces",
-    "creole",
-    "trendy",
-    "badger",
-    "quilts",
-    "ageing",
-    "splits",
-    "tomcat",
-    "clerks",
-    "pissed",
-    "sponge",
-    "snatch",
-    "kissed",
-    "psalms",
-    "hamlet",
-    "grange",
-    "brandy",
-    "swings",
-    "vortex",
-    "purses",
-    "bodily",
-    "equine",
-    "lizard",
-    "encode",
-    "sliced",
-    "learnt",
-    "gauges",
-    "spying",
-    "kosher",
-    "mantle",
-    "armies",
-    "santos",
-    "camper",
-    "ceased",
-    "pastry",
-    "repeal",
-    "cyclic",
-    "condom",
-    "admire",
-    "poured",
-    "suffix",
-    "mister",
-    "creamy",
-    "mayhem",
-    "octave",
-    "struts",
-    "proofs",
-    "alloys",
-    "polite",
-    "paving",
-    "boogie",
-    "lesbos",
-    "bricks",
-    "jingle",
-    "bounty",
-    "fishes",
-    "absurd",
-    "stoves",
-    "embryo",
-    "unsafe",
-    "sheikh",
-    "append",
-    "motive",
-    "bethel",
-    "stokes",
-    "lakers",
-    "resets",
-    "faulty",
-    "brunch",
-    "pundit",
-    "expiry",
-    "inning",
-    "monies",
-    "pointe",
-    "marcel",
-    "storey",
-    "scotch",
-    "galore",
-    "theirs",
-    "todays",
-    "emblem",
-    "medina",
-    "sniper",
-    "scopes",
-    "braces",
-    "skates",
-    "crises",
-    "darker",
-    "globes",
-    "choral",
-    "edible",
-    "evenly",
-    "rhymes",
-    "coyote",
-    "pollen",
-    "shrubs",
-    "barrow",
-    "rifles",
-    "excise",
-    "poetic",
-    "mortar",
-    "blamed",
-    "inmate",
-    "septic",
-    "armada",
-    "wrench",
-    "flawed",
-    "fences",
-    "carton",
-    "outlaw",
-    "bovine",
-    "tights",
-    "motley",
-    "punish",
-    "causal",
-    "hacked",
-    "classy",
-    "saline",
-    "botany",
-    "theres",
-    "dreamy",
-    "gasket",
-    "lastly",
-    "wander",
-    "micron",
-    "pantie",
-    "covert",
-    "crater",
-    "thence",
-    "goblet",
-    "fronts",
-    "nodded",
-    "utmost",
-    "cheeks",
-    "beasts",
-    "planar",
-    "quorum",
-    "muller",
-    "mosque",
-    "vested",
-    "sander",
-    "climax",
-    "pardon",
-    "teller",
-    "biopsy",
-    "quarry",
-    "seneca",
-    "insult",
-    "scraps",
-    "waived",
-    "kennel",
-    "royals",
-    "pastel",
-    "carrot",
-    "opaque",
-    "hurley",
-    "pedals",
-    "bitmap",
-    "shaker",
-    "relays",
-    "fading",
-    "endure",
-    "cursed",
-    "youths",
-    "tumble",
-    "helium",
-    "finely",
-    "filmed",
-    "smoker",
-    "benign",
-    "sludge",
-    "crypto",
-    "tanned",
-    "bunker",
-    "blanks",
-    "annals",
-    "losers",
-    "barred",
-    "urging",
-    "melted",
-    "whores",
-    "staple",
-    "rulers",
-    "grille",
-    "pushes",
-    "ulster",
-    "tailed",
-    "winged",
-    "ruined",
-    "sanity",
-    "rumble",
-    "heroic",
-    "bonsai",
-    "faucet",
-    "midget",
-    "boiled",
-    "anemia",
-    "biting",
-    "idiots",
-    "paging",
-    "spikes",
-    "latent",
-    "hector",
-    "wicker",
-    "nephew",
-    "traced",
-    "myriad",
-    "stains",
-    "sandal",
-    "hanger",
-    "echoes",
-    "blazer",
-    "linden",
-    "dumped",
-    "convex",
-    "richer",
-    "surfer",
-    "paired",
-    "vaults",
-    "yogurt",
-    "tossed",
-    "caucus",
-    "salute",
-    "shoppe",
-    "parody",
-    "lacked",
-    "bosses",
-    "cation",
-    "thrive",
-    "bruins",
-    "clamps",
-    "plural",
-    "shaded",
-    "hoodie",
-    "payout",
-    "frenzy",
-    "jargon",
-    "bazaar",
-    "greedy",
-    "termed",
-    "basque",
-    "dorado",
-    "daring",
-    "realms",
-    "fiddle",
-    "crunch",
-    "styled",
-    "cardio",
-    "logger",
-    "pumped",
-    "grower",
-    "litres",
-    "raging",
-    "assays",
-    "occult",
-    "hooker",
-    "lilies",
-    "fulfil",
-    "lucent",
-    "marlin",
-    "pulses",
-    "theses",
-    "ironic",
-    "ultima",
-    "staged",
-    "hustle",
-    "capped",
-    "liking",
-    "blower",
-    "dubbed",
-    "groovy",
-    "sparse",
-    "remake",
-    "clears",
-    "blooms",
-    "slogan",
-    "menace",
-    "dramas",
-    "geisha",
-    "unseen",
-    "silica",
-    "widest",
-    "medley",
-    "temper",
-    "juices",
-    "morale",
-    "solder",
-    "trench",
-    "hottie",
-    "lodged",
-    "revolt",
-    "shines",
-    "regain",
-    "resize",
-    "popped",
-    "busted",
-    "basins",
-    "tuners",
-    "utopia",
-    "slider",
-    "manure",
-    "savior",
-    "hinges",
-    "creepy",
-    "filthy",
-    "piazza",
-    "stroll",
-    "thighs",
-    "infect",
-    "dotted",
-    "doomed",
-    "francs",
-    "ballad",
-    "billie",
-    "ravens",
-    "uptime",
-    "nuclei",
-    "slowed",
-    "outing",
-    "affirm",
-    "padres",
-    "whisky",
-    "uptown",
-    "batter",
-    "rectal",
-    "shakes",
-    "pallet",
-    "tanner",
-    "steals",
-    "velcro",
-    "plunge",
-    "chaser",
-    "crosse",
-    "spades",
-    "coffin",
-    "recess",
-    "stared",
-    "coward",
-    "teamed",
-    "preset",
-    "riches",
-    "resign",
-    "poised",
-    "tactic",
-    "tapped",
-    "wisely",
-    "steaks",
-    "toxins",
-    "avoids",
-    "larvae",
-    "fungal",
-    "ligand",
-    "riddle",
-    "nozzle",
-    "diners",
-    "slater",
-    "orphan",
-    "linker",
-    "tetris",
-    "carver",
-    "shouts",
-    "stalls",
-    "inward",
-    "starch",
-    "fluffy",
-    "bender",
-    "glazed",
-    "dashed",
-    "wilder",
-    "routed",
-    "shaver",
-    "ported",
-    "fungus",
-    "chunks",
-    "bourne",
-    "revert",
-    "enigma",
-    "glands",
-    "arenas",
-    "outset",
-    "trunks",
-    "strata",
-    "solver",
-    "creams",
-    "scrubs",
-    "devote",
-    "facets",
-    "noises",
-    "booths",
-    "demise",
-    "faxing",
-    "warden",
-    "notary",
-    "indent",
-    "barlow",
-    "decode",
-    "looney",
-    "sultan",
-    "masked",
-    "casing",
-    "spacer",
-    "spills",
-    "reaper",
-    "bushes",
-    "cutoff",
-    "nitric",
-    "breads",
-    "glover",
-    "floats",
-    "flange",
-    "hearth",
-    "stride",
-    "bleach",
-    "ferret",
-    "taller",
-    "enrich",
-    "raffle",
-    "mascot",
-    "preach",
-    "petals",
-    "heller",
-    "fluent",
-    "renter",
-    "booker",
-    "airway",
-    "commas",
-    "anyhow",
-    "primal",
-    "upheld",
-    "alamos",
-    "attire",
-    "upland",
-    "outage",
-    "chunky",
-    "adopts",
-    "raptor",
-    "gluten",
-    "ascent",
-    "crappy",
-    "golfer",
-    "welded",
-    "cirque",
-    "depict",
-    "quotas",
-    "sucker",
-    "wildly",
-    "neatly",
-    "rovers",
-    "voiced",
-    "abound",
-    "curing",
-    "confer",
-    "cranes",
-    "prayed",
-    "kicker",
-    "loudly",
-    "racers",
-    "drains",
-    "maxima",
-    "slough",
-    "blasts",
-    "poorer",
-    "rubbed",
-    "uterus",
-    "trashy",
-    "chimes",
-    "shaman",
-    "henley",
-    "tracts",
-    "mohawk",
-    "nestle",
-    "boxers",
-    "awaits",
-    "amends",
-    "shafts",
-    "shelly",
-    "brooch",
-    "motifs",
-    "etched",
-    "tuxedo",
-    "mouths",
-    "halter",
-    "lumens",
-    "packer",
-    "arroyo",
-    "tipped",
-    "amidst",
-    "resins",
-    "cougar",
-    "dobson",
-    "soaked",
-    "raster",
-    "quirky",
-    "palate",
-    "quests",
-    "fueled",
-    "pelvic",
-    "phased",
-    "airbus",
-    "condor",
-    "rascal",
-    "ransom",
-    "dagger",
-    "lauder",
-    "invade",
-    "invent",
-    "famine",
-    "orally",
-    "bearer",
-    "morals",
-    "pickle",
-    "quaker",
-    "waving",
-    "uneven",
-    "queues",
-    "louder",
-    "trough",
-    "leaned",
-    "resell",
-    "harrow",
-    "thorpe",
-    "saucer",
-    "spooky",
-    "waiter",
-    "thrift",
-    "stunts",
-    "cystic",
-    "weakly",
-    "smiths",
-    "groves",
-    "reflux",
-    "culver",
-    "sprays",
-    "crowns",
-    "matted",
-    "mantra",
-    "tundra",
-    "skater",
-    "cavern",
-    "solves",
-    "spoons",
-    "fibres",
-    "vastly",
-    "olives",
-    "porous",
-    "freaky",
-    "merlot",
-    "thirst",
-    "iodine",
-    "phoebe",
-    "legged",
-    "subnet",
-    "sailed",
-    "forage",
-    "payoff",
-    "pebble",
-    "staffs",
-    "lesion",
-    "tickle",
-    "bandit",
-    "blouse",
-    "chests",
-    "feline",
-    "canals",
-    "zephyr",
-    "atrium",
-    "devise",
-    "toying",
-    "wreath",
-    "plight",
-    "goalie",
-    "arches",
-    "lowers",
-    "metros",
-    "jurors",
-    "gutter",
-    "ulcers",
-    "sloppy",
-    "jailed",
-    "ridden",
-    "bonita",
-    "lessee",
-    "tasted",
-    "licked",
-    "banged",
-    "safest",
-    "daphne",
-    "serine",
-    "meteor",
-    "boosts",
-    "veneer",
-    "uphold",
-    "glider",
-    "kinder",
-    "deduct",
-    "tweaks",
-    "beagle",
-    "speedo",
-    "locust",
-    "bursts",
-    "rested",
-    "paused",
-    "widths",
-    "nebula",
-    "junkie",
-    "sugars",
-    "allure",
-    "pianos",
-    "ponder",
-    "messed",
-    "fooled",
-    "combos",
-    "cloned",
-    "fulham",
-    "tensor",
-    "tracer",
-    "nearer",
-    "tanker",
-    "rector",
-    "taxing",
-    "pinned",
-    "gables",
-    "bantam",
-    "rewind",
-    "poplar",
-    "hinder",
-    "pantry",
-    "billet",
-    "revoke",
-    "slated",
-    "wagons",
-    "lumbar",
-    "osprey",
-    "teaser",
-    "promos",
-    "neuron",
-    "pulsar",
-    "celery",
-    "offend",
-    "caviar",
-    "retina",
-    "bouncy",
-    "sheath",
-    "mammal",
-    "twists",
-    "allele",
-    "eczema",
-    "danced",
-    "revive",
-    "veggie",
-    "dharma",
-    "hooper",
-    "koruna",
-    "amused",
-    "fucker",
-    "oxides",
-    "smokey",
-    "ritter",
-    "mellow",
-    "rapper",
-    "craven",
-    "homage",
-    "surety",
-    "cutler",
-    "resent",
-    "podium",
-    "tucked",
-    "seeded",
-    "unjust",
-    "picker",
-    "dialer",
-    "noodle",
-    "scents",
-    "bangle",
-    "bertha",
-    "levied",
-    "intuit",
-    "shaken",
-    "onward",
-    "dipped",
-    "lancet",
-    "deacon",
-    "sweeps",
-    "chores",
-    "ridder",
-    "mowers",
-    "sienna",
-    "calves",
-    "astral",
-    "yelled",
-    "hamper",
-    "aortic",
-    "lipids",
-    "romano",
-    "joyful",
-    "dosing",
-    "strobe",
-    "waffle",
-    "ripple",
-    "upbeat",
-    "donuts",
-    "rupees",
-    "sporty",
-    "tumour",
-    "pooled",
-    "healed",
-    "ceases",
-    "dorsal",
-    "collie",
-    "spleen",
-    "orbits",
-    "whence",
-    "stigma",
-    "inject",
-    "tartan",
-    "prolog",
-    "stormy",
-    "raglan",
-    "vulgar",
-    "serene",
-    "codecs",
-    "forbid",
-    "robbed",
-    "hotter",
-    "parlor",
-    "setter",
-    "facade",
-    "bikers",
-    "cipher",
-    "hearty",
-    "triton",
-    "venous",
-    "moneys",
-    "teflon",
-    "cleans",
-    "chilly",
-    "corset",
-    "hinged",
-    "gopher",
-    "distal",
-    "robins",
-    "cramps",
-    "digger",
-    "caches",
-    "acidic",
-    "psyche",
-    "eraser",
-    "sighed",
-    "rattle",
-    "unrest",
-    "poodle",
-    "sitter",
-    "colder",
-    "kelvin",
-    "nectar",
-    "strife",
-    "esprit",
-    "reckon",
-    "murals",
-    "sinful",
-    "softer",
-    "tarzan",
-    "arisen",
-    "femmes",
-    "ribbed",
-    "hereof",
-    "untold",
-    "tulips",
-    "nugget",
-    "wooded",
-    "bodied",
-    "rosary",
-    "pulley",
-    "catchy",
-    "hugely",
-    "chicas",
-    "franks",
-    "influx",
-    "convoy",
-    "kroner",
-    "nailed",
-    "cocoon",
-    "bowers",
-    "breezy",
-    "cloths",
-    "clowns",
-    "barren",
-    "currie",
-    "assent",
-    "harmed",
-    "tabled",
-    "flowed",
-    "youngs",
-    "tinted",
-    "topper",
-    "leaked",
-    "genera",
-    "idioms",
-    "spence",
-    "conner",
-    "argent",
-    "mildly",
-    "bonnet",
-    "unborn",
-    "coasts",
-    "cheesy",
-    "concur",
-    "wedges",
-    "corded",
-    "bakers",
-    "toners",
-    "quaint",
-    "revere",
-    "solemn",
-    "gentry",
-    "cadets",
-    "moulin",
-    "lander",
-    "lancer",
-    "muffin",
-    "fruity",
-    "summed",
-    "chopin",
-    "joiner",
-    "pliers",
-    "kayaks",
-    "drudge",
-    "saliva",
-    "lessen",
-    "embark",
-    "manned",
-    "slutty",
-    "sphinx",
-    "glitch",
-    "sonnet",
-    "sprung",
-    "hedges",
-    "splice",
-    "crooks",
-    "walled",
-    "improv",
-    "debuts",
-    "rocked",
-    "rancid",
-    "malice",
-    "funnel",
-    "hippie",
-    "shabby",
-    "airbag",
-    "halves",
-    "teapot",
-    "squire",
-    "melton",
-    "levers",
-    "eldest",
-    "climbs",
-    "tories",
-    "malkin",
-    "weaken",
-    "flakes",
-    "argyll",
-    "joking",
-    "simmer",
-    "atrial",
-    "reacts",
-    "undead",
-    "midday",
-    "innate",
-    "impair",
-    "bluffs",
-    "goblin",
-    "tiered",
-    "optima",
-    "accuse",
-    "hunted",
-    "hurdle",
-    "errata",
-    "ridley",
-    "zipped",
-    "cuckoo",
-    "acacia",
-    "compel",
-    "sabine",
-    "dieter",
-    "unwind",
-    "halted",
-    "crotch",
-    "diodes",
-    "dipole",
-    "frying",
-    "impala",
-    "flicks",
-    "waxing",
-    "sinner",
-    "crafty",
-    "pacers",
-    "parton",
-    "treble",
-    "galley",
-    "shovel",
-    "entail",
-    "mashed",
-    "pacing",
-    "fluxes",
-    "jimmie",
-    "cicero",
-    "scribe",
-    "nellie",
-    "sleigh",
-    "ration",
-    "unfold",
-    "selves",
-    "sprite",
-    "praxis",
-    "angler",
-    "resend",
-    "flares",
-    "swatch",
-    "bumped",
-    "divert",
-    "abacus",
-    "richly",
-    "melons",
-    "guilds",
-    "ridges",
-    "pornos",
-    "angled",
-    "grimes",
-    "unison",
-    "dongle",
-    "crouch",
-    "placid",
-    "napkin",
-    "caveat",
-    "garter",
-    "footed",
-    "touche",
-    "payers",
-    "gritty",
-    "hailed",
-    "hounds",
-    "reborn",
-    "dazzle",
-    "dangle",
-    "eaters",
-    "bronco",
-    "chased",
-    "savory",
-    "murine",
-    "rodent",
-    "racket",
-    "putter",
-    "sickle",
-    "attest",
-    "sentry",
-    "maniac",
-    "antics",
-    "consul",
-    "aiding",
-    "chilli",
-    "canoes",
-    "fodder",
-    "peeled",
-    "inbred",
-    "rabies",
-    "angina",
-    "seaman",
-    "skulls",
-    "balboa",
-    "biases",
-    "sprawl",
-    "reopen",
-    "erased",
-    "madras",
-    "faiths",
-    "tinker",
-    "echoed",
-    "gazing",
-    "awning",
-    "stroud",
-    "squads",
-    "parsed",
-    "healer",
-    "weiner",
-    "ocular",
-    "scoops",
-    "castor",
-    "evoked",
-    "cleric",
-    "spared",
-    "ensign",
-    "warped",
-    "octets",
-    "hereto",
-    "grated",
-    "banded",
-    "toured",
-    "bobble",
-    "widows",
-    "pellet",
-    "doggie",
-    "inflow",
-    "futile",
-    "fenced",
-    "aggies",
-    "muster",
-    "hitter",
-    "sylvan",
-    "argyle",
-    "quasar",
-    "liters",
-    "comets",
-    "ramona",
-    "rumour",
-    "ragged",
-    "pulsed",
-    "ignite",
-    "hornet",
-    "jesuit",
-    "mounds",
-    "devoid",
-    "parted",
-    "elites",
-    "placer",
-    "doping",
-    "smarty",
-    "saunas",
-    "jitter",
-    "barter",
-    "frugal",
-    "starry",
-    "hobbit",
-    "mayors",
-    "caster",
-    "wicket",
-    "glycol",
-    "medial",
-    "pixies",
-    "accrue",
-    "vented",
-    "outlay",
-    "airing",
-    "crates",
-    "jaeger",
-    "coders",
-    "velour",
-    "martyr",
-    "discus",
-    "gaping",
-    "abrupt",
-    "landau",
-    "amigos",
-    "boldly",
-    "gazebo",
-    "cocker",
-    "cloves",
-    "presto",
-    "harden",
-    "molten",
-    "aureus",
-    "repaid",
-    "warmly",
-    "penang",
-    "lessor",
-    "reused",
-    "uneasy",
-    "shalom",
-    "cartel",
-    "wiener",
-    "sexton",
-    "washes",
-    "frosty",
-    "marmot",
-    "remand",
-    "ponies",
-    "blight",
-    "grader",
-    "perish",
-    "relics",
-    "relish",
-    "knocks",
-    "primes",
-    "thrash",
-    "trolls",
-    "scorer",
-    "oilers",
-    "gators",
-    "cruces",
-    "vanish",
-    "elbows",
-    "kiosks",
-    "amicus",
-    "cervix",
-    "elixir",
-    "mantis",
-    "intron",
-    "carpal",
-    "vapour",
-    "morbid",
-    "rubble",
-    "cheeky",
-    "censor",
-    "shorty",
-    "begged",
-    "lavish",
-    "roscoe",
-    "scarab",
-    "skiers",
-    "weasel",
-    "octane",
-    "carols",
-    "taping",
-    "hiatus",
-    "louvre",
-    "aikido",
-    "ashore",
-    "unload",
-    "seater",
-    "stoned",
-    "fables",
-    "crumbs",
-    "squish",
-    "jagged",
-    "squeak",
-    "dearly",
-    "gypsum",
-    "lament",
-    "banked",
-    "dismal",
-    "cochin",
-    "cirrus",
-    "hijack",
-    "dammit",
-    "greats",
-    "phobia",
-    "apathy",
-    "peaked",
-    "greasy",
-    "creeks",
-    "rattan",
-    "hectic",
-    "raiser",
-    "sanger",
-    "mullen",
-    "calmly",
-    "dilute",
-    "gloomy",
-    "dinghy",
-    "chakra",
-    "grassy",
-    "aprons",
-    "clumsy",
-    "uphill",
-    "warmed",
-    "bumble",
-    "elects",
-    "alpaca",
-    "tented",
-    "pleads",
-    "horned",
-    "centos",
-    "rarity",
-    "hating",
-    "sewers",
-    "spores",
-    "shears",
-    "flutes",
-    "minced",
-    "ornate",
-    "dirham",
-    "jester",
-    "wipers",
-    "snoopy",
-    "bowler",
-    "rotors",
-    "bagels",
-    "spline",
-    "uplink",
-    "goggle",
-    "banter",
-    "awaken",
-    "alters",
-    "fleets",
-    "libido",
-    "shoals",
-    "clique",
-    "curran",
-    "acetyl",
-    "boomer",
-    "curses",
-    "undies",
-    "prepay",
-    "ankles",
-    "spiked",
-    "duffel",
-    "strung",
-    "hermit",
-    "deepen",
-    "crease",
-    "cantor",
-    "impede",
-    "clasps",
-    "tilted",
-    "repent",
-    "pulpit",
-    "ambush",
-    "stiles",
-    "elicit",
-    "bitten",
-    "doodle",
-    "dynamo",
-    "summon",
-    "lingua",
-    "loosen",
-    "sneaky",
-    "smarts",
-    "grunge",
-    "carney",
-    "fright",
-    "decays",
-    "easing",
-    "picket",
-    "waning",
-    "queued",
-    "supple",
-    "shaggy",
-    "ordeal",
-    "hernia",
-    "operas",
-    "arcane",
-    "peavey",
-    "sacked",
-    "amulet",
-    "bombed",
-    "sherpa",
-    "grouse",
-    "pasted",
-    "mousse",
-    "mapper",
-    "thrush",
-    "smokes",
-    "ascend",
-    "reverb",
-    "nutmeg",
-    "livres",
-    "wrists",
-    "rubric",
-    "puddle",
-    "plough",
-    "smelly",
-    "hangar",
-    "umpire",
-    "primus",
-    "moline",
-    "takers",
-    "lemons",
-    "potion",
-    "tendon",
-    "chiral",
-    "cuddly",
-    "deceit",
-    "joyous",
-    "pricey",
-    "shekel",
-    "gunner",
-    "cranky",
-    "untrue",
-    "larval",
-    "drapes",
-    "womans",
-    "booted",
-    "sitcom",
-    "grumpy",
-    "sirens",
-    "soften",
-    "caters",
-    "troupe",
-    "calico",
-    "wrongs",
-    "coined",
-    "birdie",
-    "pagers",
-    "corral",
-    "hickey",
-    "lysine",
-    "pronto",
-    "vistas",
-    "imager",
-    "salaam",
-    "exited",
-    "crispy",
-    "priory",
-    "sequin",
-    "wiping",
-    "siting",
-    "egress",
-    "eroded",
-    "heresy",
-    "armory",
-    "nicest",
-    "slalom",
-    "lurker",
-    "luster",
-    "undone",
-    "hitman",
-    "uplift",
-    "perils",
-    "pylori",
-    "welder",
-    "juicer",
-    "sensed",
-    "hooray",
-    "biotin",
-    "salter",
-    "tantra",
-    "nobles",
-    "fumble",
-    "discos",
-    "robles",
-    "wiccan",
-    "levies",
-    "rudder",
-    "scares",
-    "tyrant",
-    "skewed",
-    "sprang",
-    "palais",
-    "aromas",
-    "logins",
-    "sadism",
-    "plenum",
-    "axioms",
-    "sweaty",
-    "rectum",
-    "bogart",
-    "carlin",
-    "stoner",
-    "bisque",
-    "solano",
-    "grieve",
-    "reigns",
-    "fiasco",
-    "slings",
-    "dwarfs",
-    "sweats",
-    "sensei",
-    "fresco",
-    "auteur",
-    "gizmos",
-    "mildew",
-    "steels",
-    "feeble",
-    "droits",
-    "unpack",
-    "damper",
-    "madman",
-    "pelvis",
-    "gunmen",
-    "dugout",
-    "giggle",
-    "casket",
-    "dickey",
-    "detour",
-    "dioxin",
-    "unveil",
-    "layoff",
-    "shitty",
-    "dodger",
-    "acuity",
-    "popper",
-    "chants",
-    "manger",
-    "chills",
-    "edging",
-    "salina",
-    "shroud",
-    "aching",
-    "recoil",
-    "raisin",
-    "bobcat",
-    "mucosa",
-    "misled",
-    "stoney",
-    "canola",
-    "spiced",
-    "pamper",
-    "tabbed",
-    "poking",
-    "buyout",
-    "techie",
-    "snails",
-    "rushes",
-    "airman",
-    "sabres",
-    "cyclin",
-    "corals",
-    "opioid",
-    "grudge",
-    "fondue",
-    "fascia",
-    "fryers",
-    "expats",
-    "jagger",
-    "setups",
-    "jumble",
-    "cognac",
-    "wading",
-    "gawker",
-    "thorns",
-    "basalt",
-    "votive",
-    "wafers",
-    "modulo",
-    "antler",
-    "babble",
-    "niches",
-    "hikers",
-    "cuties",
-    "camels",
-    "unites",
-    "cleats",
-    "millet",
-    "invert",
-    "carats",
-    "dieses",
-    "nigger",
-    "scrape",
-    "prized",
-    "hombre",
-    "mallet",
-    "equate",
-    "pajama",
-    "toning",
-    "arched",
-    "curfew",
-    "enlist",
-    "robber",
-    "roving",
-    "linger",
-    "fillet",
-    "nimbus",
-    "impart",
-    "touted",
-    "masons",
-    "surges",
-    "piling",
-    "burley",
-    "woofer",
-    "scouse",
-    "galena",
-    "thinly",
-    "arable",
-    "alkali",
-    "mowing",
-    "expend",
-    "auntie",
-    "blames",
-    "merino",
-    "barium",
-    "adagio",
-    "flocks",
-    "havens",
-    "raving",
-    "panzer",
-    "poncho",
-    "choirs",
-    "faerie",
-    "projet",
-    "shoved",
-    "papaya",
-    "iconic",
-    "gambit",
-    "polled",
-    "jogger",
-    "verity",
-    "turret",
-    "caribe",
-    "vowels",
-    "soothe",
-    "slurry",
-    "tamper",
-    "unduly",
-    "winger",
-    "rigged",
-    "logics",
-    "sealer",
-    "sleazy",
-    "armpit",
-    "ratify",
-    "ginkgo",
-    "muzzle",
-    "basing",
-    "toxics",
-    "opting",
-    "hauled",
-    "hookup",
-    "recite",
-    "dismay",
-    "sunken",
-    "reared",
-    "mangas",
-    "sedans",
-    "sundry",
-    "boreal",
-    "flashy",
-    "signet",
-    "qwerty",
-    "feudal",
-    "basses",
-    "fathom",
-    "extant",
-    "unmask",
-    "chisel",
-    "preamp",
-    "pauses",
-    "radars",
-    "barbed",
-    "lustre",
-    "hadith",
-    "pagans",
-    "dinars",
-    "capote",
-    "afloat",
-    "dashes",
-    "forint",
-    "nudism",
-    "moaned",
-    "wiggle",
-    "propel",
-    "verily",
-    "ardent",
-    "tremor",
-    "loaned",
-    "astute",
-    "salted",
-    "tiling",
-    "doubly",
-    "brewed",
-    "fiance",
-    "retard",
-    "iguana",
-    "choker",
-    "harass",
-    "tunica",
-    "fished",
-    "hetero",
-    "unholy",
-    "nubuck",
-    "caving",
-    "livery",
-    "milieu",
-    "injure",
-    "esters",
-    "medusa",
-    "pagoda",
-    "primed",
-    "hazmat",
-    "ensued",
-    "justly",
-    "curled",
-    "dermal",
-    "lashes",
-    "allege",
-    "draped",
-    "subtly",
-    "niacin",
-    "tooled",
-    "moulds",
-    "pranks",
-    "mantel",
-    "winder",
-    "shrunk",
-    "farmed",
-    "tupelo",
-    "watery",
-    "kwacha",
-    "coiled",
-    "sledge",
-    "gilded",
-    "tropic",
-    "sprout",
-    "campos",
-    "bagged",
-    "stinky",
-    "penned",
-    "kiddie",
-    "solace",
-    "salvia",
-    "stucco",
-    "posada",
-    "shawls",
-    "intros",
-    "ruffle",
-    "ailing",
-    "obeyed",
-    "mutiny",
-    "cornea",
-    "sonics",
-    "dengue",
-    "shanks",
-    "deduce",
-    "bolted",
-    "probed",
-    "jammed",
-    "cymbal",
-    "shogun",
-    "quanta",
-    "uppers",
-    "pitman",
-    "minima",
-    "hugged",
-    "flurry",
-    "testis",
-    "vapors",
-    "rupiah",
-    "tenets",
-    "dialed",
-    "muscat",
-    "crayon",
-    "marque",
-    "rework",
-    "detach",
-    "apogee",
-    "worsen",
-    "patten",
-    "ingles",
-    "steamy",
-    "acetic",
-    "dyeing",
-    "layman",
-    "bungee",
-    "vellum",
-    "stalks",
-    "stanza",
-    "morons",
-    "pharos",
-    "florin",
-    "chaise",
-    "rained",
-    "merges",
-    "mythic",
-    "tasked",
-    "nieces",
-    "synths",
-    "girdle",
-    "veiled",
-    "phenol",
-    "stares",
-    "byline",
-    "bedlam",
-    "entree",
-    "desist",
-    "embody",
-    "folate",
-    "soiled",
-    "plexus",
-    "disarm",
-    "waring",
-    "astray",
-    "patios",
-    "hinted",
-    "lemony",
-    "basset",
-    "exiled",
-    "flared",
-    "artful",
-    "caress",
-    "downed",
-    "twitch",
-    "combed",
-    "swamps",
-    "exiles",
-    "quarks",
-    "seduce",
-    "kimono",
-    "sharif",
-    "hanged",
-    "dimmer",
-    "dredge",
-    "patchy",
-    "haters",
-    "penile",
-    "spokes",
-    "mullet",
-    "devout",
-    "pizzas",
-    "lagged",
-    "hawker",
-    "trumps",
-    "thwart",
-    "potted",
-    "goings",
-    "clinch",
-    "cometh",
-    "fitter",
-    "fasten",
-    "mingle",
-    "enviro",
-    "purify",
-    "choked",
-    "oblong",
-    "wearer",
-    "capers",
-    "entice",
-    "yonder",
-    "cabana",
-    "gasped",
-    "blurry",
-    "greets",
-    "thymus",
-    "belive",
-    "vacate",
-    "eyelid",
-    "taming",
-    "snider",
-    "barons",
-    "affine",
-    "stuffs",
-    "blurbs",
-    "sowing",
-    "frills",
-    "pinion",
-    "haunts",
-    "oblast",
-    "saxony",
-    "possum",
-    "mohair",
-    "steers",
-    "juries",
-    "crazed",
-    "fondly",
-    "flasks",
-    "phenyl",
-    "raided",
-    "visors",
-    "bonobo",
-    "evokes",
-    "spoils",
-    "sexist",
-    "triage",
-    "rabble",
-    "sconce",
-    "lactic",
-    "milled",
-    "meshes",
-    "firsts",
-    "grotto",
-    "buzzer",
-    "rivets",
-    "graces",
-    "sorter",
-    "betray",
-    "fandom",
-    "bennet",
-    "sodomy",
-    "tangle",
-    "upsets",
-    "rialto",
-    "bustle",
-    "risers",
-    "refute",
-    "spicer",
-    "parson",
-    "slinky",
-    "dreary",
-    "duffle",
-    "horrid",
-    "relist",
-    "volley",
-    "carnal",
-    "versed",
-    "recaps",
-    "bridle",
-    "revamp",
-    "arista",
-    "tiller",
-    "hordes",
-    "cutout",
-    "garvey",
-    "peruse",
-    "alleys",
-    "suture",
-    "bribes",
-    "kidnap",
-    "mitral",
-    "sorely",
-    "dahlia",
-    "ravine",
-    "napalm",
-    "starve",
-    "skimpy",
-    "sepsis",
-    "trikes",
-    "rouble",
-    "keying",
-    "spines",
-    "acumen",
-    "shiver",
-    "chicos",
-    "cliche",
-    "civics",
-    "nuance",
-    "myosin",
-    "levees",
-    "fennel",
-    "weaves",
-    "futons",
-    "tassel",
-    "phoned",
-    "burnie",
-    "renown",
-    "cyborg",
-    "beggar",
-    "cuddle",
-    "downer",
-    "mucous",
-    "stinks",
-    "slicer",
-    "repose",
-    "hasten",
-    "risque",
-    "earthy",
-    "rabbis",
-    "adored",
-    "rapist",
-    "douche",
-    "sparky",
-    "pitted",
-    "wrecks",
-    "siesta",
-    "rubies",
-    "snappy",
-    "zircon",
-    "upkeep",
-    "inseam",
-    "denier",
-    "uncles",
-    "soared",
-    "nestor",
-    "mouser",
-    "whoops",
-    "nether",
-    "helios",
-    "nomads",
-    "ramble",
-    "tarpon",
-    "duster",
-    "signer",
-    "steely",
-    "relive",
-    "quirks",
-    "plover",
-    "solute",
-    "haggis",
-    "razors",
-    "worded",
-    "fleshy",
-    "balsam",
-    "outcry",
-    "pecans",
-    "cordon",
-    "humbly",
-    "langue",
-    "azalea",
-    "halide",
-    "insole",
-    "aisles",
-    "slacks",
-    "trusty",
-    "radium",
-    "phylum",
-    "waging",
-    "phenix",
-    "puffin",
-    "shaper",
-    "raping",
-    "stench",
-    "thefts",
-    "polity",
-    "celiac",
-    "wanton",
-    "airmen",
-    "locket",
-    "gander",
-    "darkly",
-    "vernal",
-    "fanfic",
-    "deuces",
-    "keenly",
-    "fliers",
-    "negate",
-    "defies",
-    "ligase",
-    "purest",
-    "bodice",
-    "opiate",
-    "fortis",
-    "honeys",
-    "croton",
-    "depots",
-    "jasmin",
-    "bubbly",
-    "cedars",
-    "snooze",
-    "prawns",
-    "fairer",
-    "prides",
-    "rogues",
-    "neocon",
-    "mussel",
-    "unruly",
-    "cutest",
-    "etudes",
-    "gurney",
-    "lifter",
-    "bellow",
-    "inlaid",
-    "busses",
-    "crests",
-    "toffee",
-    "pippin",
-    "frauds",
-    "hoaxes",
-    "shader",
-    "grafts",
-    "carina",
-    "necked",
-    "feasts",
-    "teacup",
-    "toques",
-    "adapts",
-    "rodman",
-    "vetoed",
-    "simian",
-    "apiece",
-    "gammon",
-    "friars",
-    "maples",
-    "cobble",
-    "cranks",
-    "lowery",
-    "burrow",
-    "hyphen",
-    "teased",
-    "detain",
-    "legals",
-    "savant",
-    "leaded",
-    "sultry",
-    "sinned",
-    "enduro",
-    "givens",
-    "sharps",
-    "grooms",
-    "otters",
-    "ousted",
-    "grocer",
-    "chases",
-    "hither",
-    "druids",
-    "patina",
-    "gibbon",
-    "urchin",
-    "cartes",
-    "spasms",
-    "uproar",
-    "tenths",
-    "quench",
-    "passer",
-    "hurrah",
-    "barges",
-    "walrus",
-    "apical",
-    "jokers",
-    "piglet",
-    "gotcha",
-    "netted",
-    "dispel",
-    "prelim",
-    "masala",
-    "masque",
-    "girlie",
-    "creeps",
-    "stoker",
-    "nymphs",
-    "jurist",
-    "vestal",
-    "tiring",
-    "usages",
-    "bowels",
-    "cornet",
-    "unplug",
-    "lodger",
-    "minnow",
-    "neuter",
-    "visage",
-    "beheld",
-    "belles",
-    "baffle",
-    "albino",
-    "burnet",
-    "sexism",
-    "murmur",
-    "cotter",
-    "zydeco",
-    "bionic",
-    "chroma",
-    "gorges",
-    "canons",
-    "bugger",
-    "imaged",
-    "crusty",
-    "drones",
-    "camped",
-    "parlay",
-    "strewn",
-    "rubles",
-    "wining",
-    "sleuth",
-    "willed",
-    "magpie",
-    "docked",
-    "clough",
-    "unlink",
-    "homers",
-    "pointy",
-    "eyeing",
-    "stover",
-    "wombat",
-    "inhale",
-    "dreamt",
-    "lichen",
-    "lapsed",
-    "gallop",
-    "barrio",
-    "caries",
-    "talkie",
-    "longed",
-    "rammed",
-    "shrugs",
-    "polyps",
-    "marred",
-    "hashes",
-    "meager",
-    "reread",
-    "iodide",
-    "nettle",
-    "eyelet",
-    "kitsch",
-    "banyan",
-    "blinks",
-    "sawing",
-    "hopped",
-    "bowing",
-    "cogent",
-    "mollie",
-    "tufted",
-    "tiaras",
-    "jammer",
-    "adonis",
-    "nympho",
-    "medics",
-    "dainty",
-    "beater",
-    "planks",
-    "plumes",
-    "lumina",
-    "cosine",
-    "argosy",
-    "stumps",
-    "fouled",
-    "incite",
-    "tampon",
-    "easels",
-    "sublet",
-    "deluge",
-    "goodie",
-    "fluted",
-    "smears",
-    "reseal",
-    "bathed",
-    "lading",
-    "crocus",
-    "cherub",
-    "lieder",
-    "straws",
-    "cringe",
-    "gauche",
-    "minion",
-    "sheesh",
-    "drivel",
-    "roared",
-    "unwise",
-    "stifle",
-    "devour",
-    "arouse",
-    "wobble",
-    "ticked",
-    "purged",
-    "hauler",
-    "sayers",
-    "averse",
-    "afield",
-    "casein",
-    "mishap",
-    "lackey",
-    "labors",
-    "musing",
-    "gunman",
-    "spacey",
-    "legato",
-    "badass",
-    "singly",
-    "fusing",
-    "abuser",
-    "sevens",
-    "hadron",
-    "grates",
-    "talker",
-    "bestow",
-    "surged",
-    "woolly",
-    "tapers",
-    "beaker",
-    "dickie",
-    "quiver",
-    "getter",
-    "mimics",
-    "coombs",
-    "wetter",
-    "adrift",
-    "stings",
-    "citric",
-    "liaise",
-    "excels",
-    "garret",
-    "otitis",
-    "eatery",
-    "culled",
-    "moduli",
-    "sarees",
-    "hoists",
-    "drifts",
-    "recode",
-    "cleave",
-    "flimsy",
-    "bedded",
-    "graced",
-    "ultimo",
-    "silage",
-    "chewed",
-    "corrie",
-    "fallow",
-    "jackal",
-    "rinsed",
-    "bogged",
-    "lacing",
-    "tiffin",
-    "lapses",
-    "dwells",
-    "kahuna",
-    "shrewd",
-    "micros",
-    "biotic",
-    "shaven",
-    "pavers",
-    "euchre",
-    "quarts",
-    "wraith",
-    "crores",
-    "nimble",
-    "biggie",
-    "brazen",
-    "brahma",
-    "pipers",
-    "butane",
-    "angers",
-    "bodega",
-    "gigolo",
-    "sliver",
-    "leptin",
-    "bummer",
-    "grinch",
-    "impure",
-    "retort",
-    "ninjas",
-    "incase",
-    "syrups",
-    "chiles",
-    "grands",
-    "pawnee",
-    "oblige",
-    "anklet",
-    "samara",
-    "unsung",
-    "tryout",
-    "pandas",
-    "braids",
-    "milder",
-    "carman",
-    "lathes",
-    "beamed",
-    "wasabi",
-    "sateen",
-    "marten",
-    "howler",
-    "carded",
-    "ambler",
-    "firmer",
-    "arcana",
-    "glides",
-    "hurled",
-    "splint",
-    "llamas",
-    "touchy",
-    "decoys",
-    "pariah",
-    "fellas",
-    "leaved",
-    "gallus",
-    "filers",
-    "scones",
-    "belted",
-    "sizzle",
-    "fifths",
-    "zander",
-    "daybed",
-    "kultur",
-    "loaves",
-    "heeled",
-    "cheery",
-    "feisty",
-    "etoile",
-    "mutton",
-    "zigzag",
-    "batten",
-    "wether",
-    "larynx",
-    "perdue",
-    "meeker",
-    "dusted",
-    "inlets",
-    "mutter",
-    "chitty",
-    "ataxia",
-    "bourse",
-    "catnip",
-    "renews",
-    "lowing",
-    "bluish",
-    "pusher",
-    "tingle",
-    "typist",
-    "bruise",
-    "rebuke",
-    "swayed",
-    "lipase",
-    "seamen",
-    "sculpt",
-    "pauper",
-    "brooms",
-    "instep",
-    "septum",
-    "escudo",
-    "petter",
-    "pastas",
-    "alexia",
-    "mignon",
-    "thorax",
-    "parses",
-    "homing",
-    "weevil",
-    "morgue",
-    "juggle",
-    "errant",
-    "heifer",
-    "operon",
-    "surfed",
-    "steins",
-    "rarest",
-    "rashes",
-    "looser",
-    "bookie",
-    "lauded",
-    "peptic",
-    "risked",
-    "bowled",
-    "pearly",
-    "kirsch",
-    "islets",
-    "looted",
-    "wagers",
-    "heyday",
-    "lemans",
-    "protea",
-    "lipper",
-    "livers",
-    "glassy",
-    "mimosa",
-    "shrill",
-    "halved",
-    "swedes",
-    "puller",
-    "misfit",
-    "asides",
-    "rusted",
-    "ballon",
-    "zeroes",
-    "candor",
-    "vibrio",
-    "wigwam",
-    "gnomes",
-    "mocked",
-    "holler",
-    "furrow",
-    "fewest",
-    "drowsy",
-    "cashew",
-    "bushel",
-    "cypher",
-    "examen",
-    "bolero",
-    "dumber",
-    "earner",
-    "zoomed",
-    "forked",
-    "camber",
-    "gutted",
-    "arming",
-    "felons",
-    "dearth",
-    "homies",
-    "tarmac",
-    "decors",
-    "rickey",
-    "swells",
-    "bobbin",
-    "doings",
-    "dumper",
-    "arriba",
-    "silken",
-    "fogdog",
-    "seabed",
-    "looped",
-    "myelin",
-    "hangul",
-    "oddity",
-    "aphids",
-    "puffed",
-    "leaped",
-    "embers",
-    "peseta",
-    "sordid",
-    "bleeds",
-    "avenge",
-    "yarrow",
-    "fickle",
-    "wacker",
-    "zapper",
-    "roping",
-    "decked",
-    "choppy",
-    "vandal",
-    "romper",
-    "nimrod",
-    "beards",
-    "canter",
-    "facile",
-    "sneeze",
-    "somber",
-    "shards",
-    "whimsy",
-    "iceman",
-    "clumps",
-    "pegged",
-    "ketone",
-    "glazer",
-    "baboon",
-    "ensues",
-    "elated",
-    "lentil",
-    "albedo",
-    "backer",
-    "angora",
-    "stuffy",
-    "clings",
-    "hubris",
-    "swirls",
-    "dawned",
-    "seidel",
-    "bayard",
-    "farrow",
-    "dingle",
-    "biceps",
-    "rococo",
-    "seared",
-    "tinged",
-    "amines",
-    "tugrik",
-    "faking",
-    "shreds",
-    "boxcar",
-    "kronor",
-    "cinder",
-    "glyphs",
-    "aligns",
-    "recoup",
-    "naught",
-    "prisms",
-    "planer",
-    "defray",
-    "oeuvre",
-    "idiocy",
-    "vermin",
-    "ischia",
-    "incurs",
-    "sorbet",
-    "sharia",
-    "lariat",
-    "redraw",
-    "trifle",
-    "berths",
-    "retake",
-    "quiche",
-    "maduro",
-    "bosque",
-    "eulogy",
-    "fabled",
-    "defied",
-    "errand",
-    "yeoman",
-    "coerce",
-    "annexe",
-    "muslin",
-    "hugger",
-    "thorny",
-    "earbud",
-    "testes",
-    "oriole",
-    "shiner",
-    "rhesus",
-    "givers",
-    "ostomy",
-    "ingest",
-    "potash",
-    "wyvern",
-    "inlays",
-    "whitey",
-    "foiled",
-    "tether",
-    "toucan",
-    "karats",
-    "urinal",
-    "tubers",
-    "cloner",
-    "jerked",
-    "waders",
-    "squall",
-    "chokes",
-    "cinque",
-    "bowery",
-    "fervor",
-    "reefer",
-    "exerts",
-    "idling",
-    "lepton",
-    "comers",
-    "lunacy",
-    "loathe",
-    "centra",
-    "huddle",
-    "coughs",
-    "rooter",
-    "gating",
-    "widens",
-    "ringed",
-    "telcos",
-    "infill",
-    "braced",
-    "spigot",
-    "nailer",
-    "coupes",
-    "baring",
-    "jacked",
-    "tartar",
-    "rejoin",
-    "harken",
-    "crawls",
-    "smudge",
-    "herder",
-    "atopic",
-    "stingy",
-    "zealot",
-    "shanti",
-    "vigour",
-    "snares",
-    "wither",
-    "seamed",
-    "calmed",
-    "pisses",
-    "vipers",
-    "taster",
-    "arbors",
-    "chucky",
-    "forego",
-    "farina",
-    "bygone",
-    "exhale",
-    "altars",
-    "cashed",
-    "ushers",
-    "barfly",
-    "annoys",
-    "ducted",
-    "crisps",
-    "dressy",
-    "mosher",
-    "frayed",
-    "woolen",
-    "spunky",
-    "litany",
-    "nutter",
-    "larder",
-    "claret",
-    "wobbly",
-    "lockup",
-    "tosses",
-    "throng",
-    "resold",
-    "turnip",
-    "gusset",
-    "banish",
-    "schism",
-    "tidbit",
-    "dogged",
-    "pinyin",
-    "messes",
-    "topple",
-    "waives",
-    "radish",
-    "retype",
-    "feller",
-    "enmity",
-    "souter",
-    "boater",
-    "weirdo",
-    "racked",
-    "spoilt",
-    "strode",
-    "grainy",
-    "swears",
-    "paring",
-    "humbug",
-    "homely",
-    "dinero",
-    "mensch",
-    "froggy",
-    "cocked",
-    "gobble",
-    "mythos",
-    "defrag",
-    "breech",
-    "pyrite",
-    "drunks",
-    "kidder",
-    "damask",
-    "batted",
-    "papacy",
-    "ablaze",
-    "spotty",
-    "tannoy",
-    "thawed",
-    "loafer",
-    "fjords",
-    "dipper",
-    "byways",
-    "becket",
-    "derail",
-    "clonal",
-    "amazes",
-    "prater",
-    "enders",
-    "gripes",
-    "spiffy",
-    "curiae",
-    "dampen",
-    "imbued",
-    "looper",
-    "callas",
-    "mouton",
-    "cameos",
-    "sputum",
-    "mongol",
-    "peeler",
-    "fantom",
-    "radian",
-    "juried",
-    "geyser",
-    "shoddy",
-    "mended",
-    "abject",
-    "kismet",
-    "deejay",
-    "hookah",
-    "ethers",
-    "treads",
-    "mayday",
-    "honing",
-    "deftly",
-    "curios",
-    "toasts",
-    "litmus",
-    "spools",
-    "medico",
-    "grinds",
-    "coulee",
-    "bugged",
-    "ribose",
-    "faggot",
-    "sarong",
-    "lumped",
-    "frigid",
-    "musick",
-    "ashram",
-    "carafe",
-    "peachy",
-    "myopia",
-    "winded",
-    "blunts",
-    "sempre",
-    "collet",
-    "flirty",
-    "eggers",
-    "clothe",
-    "snipes",
-    "staked",
-    "simile",
-    "sloped",
-    "baller",
-    "groans",
-    "canker",
-    "keener",
-    "audios",
-    "turion",
-    "busily",
-    "gluing",
-    "captor",
-    "grazed",
-    "joules",
-    "smacks",
-    "bolder",
-    "xylene",
-    "girder",
-    "pruned",
-    "wedded",
-    "lashed",
-    "whaler",
-    "zoster",
-    "playas",
-    "alcove",
-    "hazing",
-    "montes",
-    "skyway",
-    "matron",
-    "nibble",
-    "pecker",
-    "panini",
-    "hedged",
-    "minter",
-    "tapeta",
-    "powter",
-    "trowel",
-    "doobie",
-    "benzyl",
-    "stiffs",
-    "earths",
-    "tenors",
-    "rapier",
-    "salami",
-    "prunes",
-    "redone",
-    "mallow",
-    "duress",
-    "herons",
-    "banger",
-    "kwanza",
-    "doable",
-    "quatre",
-    "stoked",
-    "glades",
-    "crutch",
-    "ardour",
-    "levant",
-    "hiller",
-    "sleaze",
-    "sundae",
-    "rhinos",
-    "leeway",
-    "wisest",
-    "kabuki",
-    "cesium",
-    "yippee",
-    "siphon",
-    "aviary",
-    "hushed",
-    "cadres",
-    "markka",
-    "sanded",
-    "medias",
-    "venter",
-    "maggot",
-    "houser",
-    "infuse",
-    "pathos",
-    "roused",
-    "chutes",
-    "hatter",
-    "linsey",
-    "stents",
-    "sorrel",
-    "phonon",
-    "gainer",
-    "mughal",
-    "gringo",
-    "beluga",
-    "diatom",
-    "legume",
-    "redial",
-    "damsel",
-    "statin",
-    "rimmed",
-    "efflux",
-    "moored",
-    "peered",
-    "bonito",
-    "maxims",
-    "purine",
-    "frolic",
-    "cassia",
-    "lamina",
-    "reruns",
-    "plazas",
-    "witney",
-    "roasts",
-    "erupts",
-    "swarms",
-    "chives",
-    "septal",
-    "hander",
-    "masjid",
-    "fisted",
-    "squats",
-    "stubby",
-    "forays",
-    "flanks",
-    "sickly",
-    "curbed",
-    "retest",
-    "banjos",
-    "minder",
-    "orator",
-    "pinata",
-    "mopeds",
-    "steppe",
-    "plowed",
-    "recast",
-    "bursar",
-    "chaste",
-    "oozing",
-    "subdue",
-    "raking",
-    "bowyer",
-    "ruckus",
-    "juiced",
-    "amoeba",
-    "duvets",
-    "sortie",
-    "withal",
-    "barman",
-    "mourns",
-    "ferric",
-    "thatch",
-    "emboss",
-    "grunts",
-    "prying",
-    "rudely",
-    "lacuna",
-    "lutein",
-    "queers",
-    "yanked",
-    "minted",
-    "lectin",
-    "peeves",
-    "animas",
-    "citron",
-    "tacked",
-    "slates",
-    "andros",
-    "timbre",
-    "whiter",
-    "taboos",
-    "funder",
-    "boning",
-    "mosses",
-    "wattle",
-    "stoles",
-    "glioma",
-    "tinsel",
-    "adverb",
-    "prunus",
-    "lazily",
-    "foliar",
-    "cuesta",
-    "hakeem",
-    "nachos",
-    "shandy",
-    "castes",
-    "massif",
-    "shrike",
-    "biogas",
-    "servos",
-    "darken",
-    "mitten",
-    "dalasi",
-    "heriot",
-    "moiety",
-    "darned",
-    "ampere",
-    "denser",
-    "lignin",
-    "debits",
-    "lassie",
-    "loreal",
-    "pumice",
-    "stator",
-    "indium",
-    "heaped",
-    "untied",
-    "quince",
-    "hansel",
-    "quarto",
-    "creeds",
-    "outrun",
-    "shanty",
-    "voided",
-    "geezer",
-    "crusts",
-    "tibial",
-    "unsold",
-    "opined",
-    "falter",
-    "chatty",
-    "pataca",
-    "titres",
-    "styler",
-    "obtuse",
-    "caudal",
-    "sextet",
-    "savour",
-    "lupine",
-    "gourde",
-    "gelato",
-    "tenses",
-    "spooks",
-    "pyrene",
-    "prefab",
-    "yeasts",
-    "teched",
-    "seizes",
-    "thebes",
-    "cohosh",
-    "fescue",
-    "flamed",
-    "swoosh",
-    "subsea",
-    "strays",
-    "foetus",
-    "punter",
-    "damped",
-    "leaner",
-    "batons",
-    "calmer",
-    "paltry",
-    "threes",
-    "turban",
-    "zebras",
-    "scoped",
-    "allium",
-    "toasty",
-    "weaned",
-    "pectin",
-    "musics",
-    "flatly",
-    "tipper",
-    "alight",
-    "epochs",
-    "genial",
-    "snowed",
-    "cachet",
-    "fleury",
-    "pumper",
-    "infamy",
-    "dapper",
-    "belfry",
-    "odious",
-    "wheres",
-    "cycled",
-    "strang",
-    "broads",
-    "deport",
-    "lemmas",
-    "karmic",
-    "inking",
-    "delves",
-    "bosons",
-    "callan",
-    "facies",
-    "bacula",
-    "mantua",
-    "chucks",
-    "lucite",
-    "rafter",
-    "hexane",
-    "blazes",
-    "goodly",
-    "dalles",
-    "rimmer",
-    "enacts",
-    "lather",
-    "quakes",
-    "gapped",
-    "pastes",
-    "gerbil",
-    "cloaks",
-    "finial",
-    "glazes",
-    "posses",
-    "remade",
-    "grisly",
-    "tramps",
-    "winkle",
-    "mesons",
-    "brogan",
-    "omelet",
-    "quired",
-    "folios",
-    "lazuli",
-    "dictum",
-    "ledges",
-    "catlin",
-    "scaler",
-    "gabber",
-    "frieze",
-    "clunky",
-    "yuppie",
-    "baryon",
-    "sunnah",
-    "sullen",
-    "crouse",
-    "beeper",
-    "donnas",
-    "rallye",
-    "pieced",
-    "oocyte",
-    "gourds",
-    "acorns",
-    "rowers",
-    "morgen",
-    "dormer",
-    "stasis",
-    "panics",
-    "arnica",
-    "talons",
-    "pounce",
-    "panier",
-    "dually",
-    "valour",
-    "weenie",
-    "tweedy",
-    "jojoba",
-    "behest",
-    "lipped",
-    "infirm",
-    "quagga",
-    "menage",
-    "bouton",
-    "divest",
-    "abated",
-    "poplin",
-    "lyceum",
-    "harlot",
-    "glared",
-    "mikado",
-    "gunned",
-    "throes",
-    "sunray",
-    "theism",
-    "troika",
-    "brainy",
-    "patted",
-    "revels",
-    "sugary",
-    "droves",
-    "penner",
-    "defuse",
-    "rigors",
-    "boobed",
-    "blokes",
-    "spawns",
-    "sombre",
-    "hearse",
-    "roamed",
-    "fatter",
-    "gaucho",
-    "chasse",
-    "crepes",
-    "senile",
-    "graver",
-    "torrid",
-    "pluses",
-    "myopic",
-    "snugly",
-    "fevers",
-    "eocene",
-    "codons",
-    "hoarse",
-    "haggle",
-    "phonic",
-    "gantry",
-    "mockup",
-    "teases",
-    "scythe",
-    "homily",
-    "upshot",
-    "sifted",
-    "rufous",
-    "busier",
-    "phenom",
-    "warmup",
-    "foodie",
-    "dimmed",
-    "bulges",
-    "scurry",
-    "outbox",
-    "toting",
-    "fiends",
-    "tallow",
-    "anions",
-    "unkind",
-    "spoofs",
-    "horsey",
-    "eerily",
-    "slouch",
-    "biopic",
-    "eddies",
-    "joists",
-    "alumna",
-    "humvee",
-    "irises",
-    "kitbag",
-    "nickle",
-    "teeter",
-    "gadfly",
-    "barony",
-    "caddie",
-    "isomer",
-    "droids",
-    "swerve",
-    "pandit",
-    "lector",
-    "capris",
-    "vegans",
-    "prewar",
-    "bateau",
-    "cassis",
-    "prover",
-    "sacral",
-    "wilful",
-    "twisty",
-    "wester",
-    "bitchy",
-    "sprain",
-    "platen",
-    "abides",
-    "strove",
-    "copter",
-    "beadle",
-    "nodule",
-    "paella",
-    "mullah",
-    "spayed",
-    "tourer",
-    "icicle",
-    "hooves",
-    "hotdog",
-    "priors",
-    "wanker",
-    "chimps",
-    "frisky",
-    "racoon",
-    "fibrin",
-    "caliph",
-    "cuffed",
-    "tumult",
-    "curate",
-    "donned",
-    "vixens",
-    "tarsus",
-    "bhakti",
-    "truest",
-    "ghouls",
-    "snitch",
-    "felled",
-    "tinned",
-    "patter",
-    "commie",
-    "bootie",
-    "snarky",
-    "bummed",
-    "wintry",
-    "anemic",
-    "shamed",
-    "eluded",
-    "milter",
-    "banzai",
-    "bereft",
-    "seaway",
-    "vestry",
-    "globin",
-    "taille",
-    "thrall",
-    "barked",
-    "blazed",
-    "cupped",
-    "maimed",
-    "petrel",
-    "lavage",
-    "hymnal",
-    "axonal",
-    "vinyls",
-    "shrank",
-    "pineal",
-    "budgie",
-    "upping",
-    "knolls",
-    "unwell",
-    "wedged",
-    "deltas",
-    "cubism",
-    "glucan",
-    "curlew",
-    "salsas",
-    "thaler",
-    "snazzy",
-    "husker",
-    "vining",
-    "moguls",
-    "lapped",
-    "clawed",
-    "nabbed",
-    "capsid",
-    "gasses",
-    "quills",
-    "erases",
-    "haring",
-    "ethane",
-    "puffer",
-    "iolite",
-    "heeded",
-    "whammy",
-    "sachet",
-    "drakes",
-    "rouser",
-    "vetted",
-    "titers",
-    "shriek",
-    "posits",
-    "faecal",
-    "yakuza",
-    "rehabs",
-    "bungle",
-    "probit",
-    "pokers",
-    "tagger",
-    "mutate",
-    "qualms",
-    "stilts",
-    "haptic",
-    "roofed",
-    "instal",
-    "hotbed",
-    "gusher",
-    "hemmed",
-    "malate",
-    "musket",
-    "repute",
-    "faeces",
-    "hissed",
-    "tirade",
-    "prongs",
-    "raters",
-    "peewee",
-    "conger",
-    "unease",
-    "barret",
-    "satori",
-    "upturn",
-    "muddle",
-    "bladed",
-    "bailed",
-    "boggle",
-    "exudes",
-    "recede",
-    "swanky",
-    "sterol",
-    "objets",
-    "mastic",
-    "bongos",
-    "caning",
-    "docent",
-    "manors",
-    "sailer",
-    "turbos",
-    "eights",
-    "filial",
-    "borage",
-    "regnum",
-    "posers",
-    "sneaks",
-    "diktat",
-    "reaped",
-    "cicada",
-    "enjoin",
-    "boyish",
-    "neared",
-    "cobras",
-    "grater",
-    "peyote",
-    "rigour",
-    "aristo",
-    "afresh",
-    "muskie",
-    "ducked",
-    "loomed",
-    "clamor",
-    "reseda",
-    "gallet",
-    "hiccup",
-    "flavin",
-    "stewed",
-    "stowed",
-    "pidgin",
-    "squeal",
-    "scorch",
-    "hemmer",
-    "arbour",
-    "valine",
-    "dimers",
-    "skeins",
-    "semple",
-    "hummus",
-    "forges",
-    "loosed",
-    "madcap",
-    "crabby",
-    "burlap",
-    "propyl",
-    "equips",
-    "blonds",
-    "dozier",
-    "causey",
-    "kamala",
-    "massed",
-    "shires",
-    "wiggly",
-    "tricot",
-    "bigots",
-    "concho",
-    "hovers",
-    "mulled",
-    "inborn",
-    "russet",
-    "specie",
-    "gilder",
-    "reflow",
-    "morphs",
-    "mettle",
-    "bulger",
-    "insets",
-    "lysate",
-    "lilacs",
-    "buoyed",
-    "malady",
-    "olefin",
-    "parkas",
-    "fester",
-    "nonfat",
-    "grubby",
-    "wooing",
-    "hippos",
-    "hoopla",
-    "lithia",
-    "aborts",
-    "envied",
-    "coring",
-    "rezone",
-    "nursed",
-    "squirm",
-    "althea",
-    "trippy",
-    "driest",
-    "settee",
-    "flaunt",
-    "dasher",
-    "reaver",
-    "callus",
-    "shifty",
-    "upwind",
-    "jetway",
-    "missus",
-    "hashed",
-    "darted",
-    "colons",
-    "gauged",
-    "nought",
-    "sinker",
-    "eggnog",
-    "rehash",
-    "enlace",
-    "purist",
-    "dished",
-    "corned",
-    "octavo",
-    "luring",
-    "flirts",
-    "witted",
-    "coldly",
-    "envoys",
-    "staves",
-    "avowed",
-    "oodles",
-    "archon",
-    "docile",
-    "subito",
-    "sexier",
-    "decile",
-    "mumble",
-    "vizier",
-    "roadie",
-    "smalls",
-    "blanch",
-    "mugger",
-    "crewed",
-    "anonym",
-    "sabers",
-    "ductal",
-    "animus",
-    "dimple",
-    "supine",
-    "squint",
-    "vitals",
-    "khakis",
-    "scanty",
-    "laymen",
-    "drench",
-    "cupola",
-    "minuet",
-    "spouts",
-    "glided",
-    "ripoff",
-    "largos",
-    "soleus",
-    "fanned",
-    "wetted",
-    "wallop",
-    "leaver",
-    "befall",
-    "anodes",
-    "mallee",
-    "trogon",
-    "dodged",
-    "finned",
-    "looses",
-    "bloods",
-    "odours",
-    "meagre",
-    "chintz",
-    "lineal",
-    "aldrin",
-    "spinel",
-    "pretax",
-    "gelder",
-    "knotty",
-    "ironed",
-    "bluesy",
-    "retold",
-    "photog",
-    "embeds",
-    "volant",
-    "tapper",
-    "smithy",
-    "gratin",
-    "suitor",
-    "creche",
-    "ghibli",
-    "urbane",
-    "stupor",
-    "sexing",
-    "pleats",
-    "accede",
-    "measly",
-    "swampy",
-    "camisa",
-    "datura",
-    "stably",
-    "lifers",
-    "ouster",
-    "aether",
-    "sardar",
-    "tugged",
-    "detest",
-    "cuatro",
-    "scapes",
-    "nipper",
-    "passim",
-    "jovial",
-    "bagger",
-    "meddle",
-    "tomboy",
-    "aliyah",
-    "wampum",
-    "sutras",
-    "canard",
-    "winked",
-    "scurvy",
-    "lenten",
-    "pattie",
-    "gramps",
-    "shimmy",
-    "taunts",
-    "pivots",
-    "glowed",
-    "sunlit",
-    "rigger",
-    "gaggle",
-    "callow",
-    "edicts",
-    "pimple",
-    "bashed",
-    "tannin",
-    "boughs",
-    "dermis",
-    "sprigs",
-    "animes",
-    "nookie",
-    "stymie",
-    "virago",
-    "thresh",
-    "snooty",
-    "foetal",
-    "pinole",
-    "congas",
-    "robbin",
-    "fuming",
-    "gnosis",
-    "powwow",
-    "framer",
-    "vigils",
-    "dented",
-    "pardee",
-    "raunch",
-    "skewer",
-    "pained",
-    "looker",
-    "ramjet",
-    "peddle",
-    "utters",
-    "panned",
-    "faders",
-    "riffle",
-    "pucker",
-    "specks",
-    "suntan",
-    "kaolin",
-    "shazam",
-    "fincas",
-    "adroit",
-    "belies",
-    "duckie",
-    "faring",
-    "oolong",
-    "repack",
-    "datums",
-    "effigy",
-    "shaves",
-    "broach",
-    "aghast",
-    "vetter",
-    "reheat",
-    "biomes",
-    "wallow",
-    "anally",
-    "cereus",
-    "brunet",
-    "cubits",
-    "frothy",
-    "geckos",
-    "biller",
-    "mangle",
-    "footie",
-    "shined",
-    "precis",
-    "rapped",
-    "hurray",
-    "amoral",
-    "limbic",
-    "oedema",
-    "flexed",
-    "kindle",
-    "pricks",
-    "viator",
-    "tithes",
-    "sipped",
-    "rodeos",
-    "vivace",
-    "milked",
-    "stater",
-    "domine",
-    "sluice",
-    "rundle",
-    "craves",
-    "soiree",
-    "grimly",
-    "cogito",
-    "cabled",
-    "spongy",
-    "monger",
-    "storer",
-    "pinder",
-    "rustle",
-    "thrips",
-    "carnet",
-    "bezels",
-    "vainly",
-    "malign",
-    "buzzed",
-    "pinner",
-    "indole",
-    "eluted",
-    "crofts",
-    "tercel",
-    "redden",
-    "fizzle",
-    "sobbed",
-    "syphon",
-    "surest",
-    "bribed",
-    "bopper",
-    "diddle",
-    "perron",
-    "pestle",
-    "elapse",
-    "faunal",
-    "goring",
-    "plinth",
-    "buccal",
-    "mooted",
-    "tweens",
-    "concha",
-    "enemas",
-    "navies",
-    "izzard",
-    "pinker",
-    "rotted",
-    "elvish",
-    "abbots",
-    "redeye",
-    "dogmas",
-    "waddle",
-    "debunk",
-    "crummy",
-    "goatee",
-    "baited",
-    "veined",
-    "vesper",
-    "filles",
-    "ferrum",
-    "seiner",
-    "fronds",
-    "fletch",
-    "nieves",
-    "foxing",
-    "consol",
-    "thusly",
-    "stints",
-    "sicker",
-    "carper",
-    "winced",
-    "gaffer",
-    "amrita",
-    "glitzy",
-    "ordain",
-    "sedate",
-    "coombe",
-    "engulf",
-    "frilly",
-    "defame",
-    "stadia",
-    "spurts",
-    "cubist",
-    "bijoux",
-    "coolly",
-    "triads",
-    "gramma",
-    "punchy",
-    "ingots",
-    "skunks",
-    "jiggle",
-    "pylons",
-    "bidets",
-    "noggin",
-    "skated",
-    "berets",
-    "tallis",
-    "icebox",
-    "caiman",
-    "tuneup",
-    "kersey",
-    "taxman",
-    "preppy",
-    "webbed",
-    "gingko",
-    "uracil",
-    "meshed",
-    "nicked",
-    "fetter",
-    "jarred",
-    "lidded",
-    "attics",
-    "qubits",
-    "morsel",
-    "gaddis",
-    "gambas",
-    "cussed",
-    "evaded",
-    "vender",
-    "veloce",
-    "deeded",
-    "titian",
-    "cynics",
-    "dither",
-    "physic",
-    "polder",
-    "codify",
-    "adores",
-    "gasser",
-    "boucle",
-    "costed",
-    "screed",
-    "eschew",
-    "swifts",
-    "romaji",
-    "gloved",
-    "dodges",
-    "finery",
-    "dibble",
-    "stoops",
-    "spurge",
-    "workup",
-    "allude",
-    "scuffs",
-    "exacta",
-    "vowing",
-    "plying",
-    "conker",
-    "graven",
-    "craved",
-    "fracas",
-    "jetted",
-    "cheapo",
-    "celled",
-    "boomed",
-    "vulvar",
-    "hooter",
-    "yantra",
-    "shacks",
-    "pimped",
-    "jailer",
-    "braved",
-    "hoodoo",
-    "prions",
-    "estrus",
-    "labret",
-    "ersatz",
-    "menial",
-    "clayey",
-    "flinch",
-    "despot",
-    "koalas",
-    "privet",
-    "planed",
-    "flexor",
-    "raffia",
-    "kipper",
-    "begone",
-    "suiter",
-    "bigwig",
-    "supers",
-    "quinte",
-    "snotty",
-    "remiss",
-    "oilily",
-    "mutuel",
-    "ureter",
-    "birder",
-    "felted",
-    "fasted",
-    "eunuch",
-    "dicker",
-    "costar",
-    "roomie",
-    "areola",
-    "woeful",
-    "indict",
-    "carven",
-    "bonnes",
-    "slicks",
-    "nester",
-    "hearer",
-    "awakes",
-    "molars",
-    "choses",
-    "jobber",
-    "flabby",
-    "anorak",
-    "beefed",
-    "heaved",
-    "gallic",
-    "phobic",
-    "tubule",
-    "recurs",
-    "refuel",
-    "spiers",
-    "levity",
-    "tussle",
-    "reamer",
-    "tempos",
-    "wilted",
-    "conned",
-    "skybox",
-    "outwit",
-    "buries",
-    "boozer",
-    "phlegm",
-    "signor",
-    "scruff",
-    "nudged",
-    "asters",
-    "deform",
-    "frosts",
-    "ipecac",
-    "defile",
-    "reales",
-    "pallid",
-    "borzoi",
-    "cornel",
-    "cesses",
-    "offing",
-    "infest",
-    "crikey",
-    "tonics",
-    "booger",
-    "milage",
-    "honcho",
-    "shofar",
-    "sieves",
-    "vexing",
-    "piquet",
-    "casbah",
-    "boobie",
-    "seraph",
-    "kebabs",
-    "thymic",
-    "dicked",
-    "scampi",
-    "nother",
-    "plucky",
-    "loggia",
-    "untidy",
-    "baobab",
-    "scarfs",
-    "tablas",
-    "growls",
-    "minish",
-    "goiter",
-    "mentee",
-    "harmer",
-    "witchy",
-    "oiling",
-    "saluki",
-    "spewed",
-    "disuse",
-    "reeled",
-    "garish",
-    "stroma",
-    "gaiety",
-    "azonic",
-    "cerise",
-    "frowns",
-    "phoney",
-    "alphas",
-    "nubile",
-    "sadder",
-    "ravage",
-    "uncool",
-    "mugged",
-    "dentin",
-    "gaskin",
-    "peeked",
-    "juster",
-    "gaging",
-    "puntos",
-    "labile",
-    "trompe",
-    "beckon",
-    "grappa",
-    "delish",
-    "dabble",
-    "tonner",
-    "buttes",
-    "chitin",
-    "unsaid",
-    "vizsla",
-    "reaves",
-    "shewed",
-    "truant",
-    "ermine",
-    "shales",
-    "swiped",
-    "gaijin",
-    "sukkot",
-    "squids",
-    "zeroed",
-    "drowns",
-    "onload",
-    "swales",
-    "midcap",
-    "flours",
-    "caddis",
-    "steeds",
-    "waster",
-    "overdo",
-    "driers",
-    "putrid",
-    "verges",
-    "cooter",
-    "mayest",
-    "ridged",
-    "adders",
-    "comely",
-    "puking",
-    "wields",
-    "dreads",
-    "pander",
-    "totems",
-    "riyals",
-    "nobler",
-    "howled",
-    "gullet",
-    "chrism",
-    "bedell",
-    "cicely",
-    "aubade",
-    "cabbie",
-    "estrin",
-    "vetoes",
-    "menses",
-    "dobbin",
-    "cobweb",
-    "avocet",
-    "gassed",
-    "acetal",
-    "typhus",
-    "welter",
-    "brushy",
-    "valuer",
-    "biogen",
-    "zapped",
-    "cahoot",
-    "zinger",
-    "corder",
-    "purges",
-    "sowers",
-    "groggy",
-    "dander",
-    "madmen",
-    "shelve",
-    "dyadic",
-    "tedium",
-    "miffed",
-    "ramped",
-    "sirdar",
-    "knifes",
-    "kilter",
-    "diadem",
-    "anoxic",
-    "tittle",
-    "obsess",
-    "nannie",
-    "cumbia",
-    "poling",
-    "hallow",
-    "sashes",
-    "whined",
-    "assail",
-    "tensed",
-    "posies",
-    "glamor",
-    "madder",
-    "vestas",
-    "casita",
-    "virion",
-    "brevet",
-    "herded",
-    "endive",
-    "lemurs",
-    "severs",
-    "furies",
-    "piqued",
-    "instar",
-    "valuta",
-    "hamada",
-    "brinks",
-    "palmar",
-    "demure",
-    "capper",
-    "veered",
-    "scarry",
-    "cygnet",
-    "tonsil",
-    "huzzah",
-    "tempts",
-    "penman",
-    "tempeh",
-    "basher",
-    "pampas",
-    "grayed",
-    "nesses",
-    "stocky",
-    "octroi",
-    "laxity",
-    "balked",
-    "kibble",
-    "kisser",
-    "busing",
-    "jarrah",
-    "railed",
-    "ocelot",
-    "payola",
-    "revved",
-    "likens",
-    "hubbub",
-    "droopy",
-    "macaws",
-    "dative",
-    "quinoa",
-    "sherif",
-    "skanky",
-    "chromo",
-    "whines",
-    "trivet",
-    "egoism",
-    "mattes",
-    "coaxed",
-    "triste",
-    "chimed",
-    "morass",
-    "kobold",
-    "pinkie",
-    "slumps",
-    "bashes",
-    "leaven",
-    "unwary",
-    "begets",
-    "reamed",
-    "anoxia",
-    "holier",
-    "dolmen",
-    "gonads",
-    "brutes",
-    "sniffs",
-    "dilate",
-    "ceding",
-    "lasses",
-    "netter",
-    "twiggy",
-    "uppity",
-    "eludes",
-    "deface",
-    "rivage",
-    "beaked",
-    "colter",
-    "dozing",
-    "revues",
-    "shoves",
-    "blithe",
-    "retell",
-    "storks",
-    "hangup",
-    "arcing",
-    "wackos",
-    "woodie",
-    "kludge",
-    "molest",
-    "egrets",
-    "whoosh",
-    "licker",
-    "lawman",
-    "ruched",
-    "soaker",
-    "hotrod",
-    "intima",
-    "amigas",
-    "bimbos",
-    "toiled",
-    "guises",
-    "borate",
-    "kouros",
-    "tammie",
-    "deters",
-    "tamale",
-    "hinter",
-    "costal",
-    "qualia",
-    "fundus",
-    "butted",
-    "chalks",
-    "binned",
-    "synced",
-    "zygote",
-    "shucks",
-    "adduct",
-    "ashman",
-    "befell",
-    "formic",
-    "covens",
-    "secede",
-    "prises",
-    "grungy",
-    "marshy",
-    "wormer",
-    "grasps",
-    "guider",
-    "zinnia",
-    "callee",
-    "avions",
-    "morose",
-    "abbeys",
-    "ponent",
-    "neroli",
-    "flaked",
-    "sheave",
-    "pedant",
-    "grouch",
-    "cellos",
-    "erodes",
-    "queasy",
-    "chalky",
-    "ageism",
-    "hiatal",
-    "demean",
-    "broods",
-    "limber",
-    "bardic",
-    "doulas",
-    "sweeny",
-    "walkup",
-    "rinses",
-    "gaydar",
-    "clevis",
-    "jolted",
-    "maglev",
-    "tenner",
-    "darter",
-    "abduct",
-    "wedgie",
-    "muting",
-    "violas",
-    "soured",
-    "blimey",
-    "exhort",
-    "ramrod",
-    "herbed",
-    "riprap",
-    "rusher",
-    "bucked",
-    "reding",
-    "stumpy",
-    "gramme",
-    "dowels",
-    "cosmid",
-    "uglier",
-    "climes",
-    "addled",
-    "anoint",
-    "braver",
-    "sayyid",
-    "founds",
-    "blocky",
-    "soffit",
-    "jaunty",
-    "dollop",
-    "screwy",
-    "cockle",
-    "loaner",
-    "minyan",
-    "pooler",
-    "unseat",
-    "linkup",
-    "atolls",
-    "parley",
-    "adorns",
-    "cantus",
-    "paulin",
-    "kimchi",
-    "mummer",
-    "craggy",
-    "gushed",
-    "fuhrer",
-    "aplomb",
-    "wahine",
-    "centum",
-    "truism",
-    "exeunt",
-    "telfer",
-    "turbid",
-    "sterna",
-    "strick",
-    "righty",
-    "defers",
-    "subpar",
-    "buffed",
-    "rappel",
-    "cerium",
-    "curler",
-    "squawk",
-    "liming",
-    "cornus",
-    "outbid",
-    "furans",
-    "lulled",
-    "repels",
-    "pliant",
-    "pyjama",
-    "vassal",
-    "cantos",
-    "pining",
-    "labial",
-    "hyssop",
-    "kiting",
-    "limped",
-    "sulcus",
-    "flexes",
-    "depose",
-    "pacify",
-    "sunder",
-    "vodkas",
-    "florid",
-    "toxoid",
-    "quacks",
-    "steric",
-    "catena",
-    "hubcap",
-    "tarred",
-    "lactam",
-    "nipped",
-    "gnarly",
-    "koruny",
-    "lattes",
-    "premix",
-    "pleura",
-    "pester",
-    "fencer",
-    "triune",
-    "hairdo",
-    "chines",
-    "shunts",
-    "induct",
-    "dynein",
-    "manche",
-    "bracts",
-    "furore",
-    "sharer",
-    "delved",
-    "luteal",
-    "venoms",
-    "nighty",
-    "dumbed",
-    "gluons",
-    "stoped",
-    "oddest",
-    "evince",
-    "hyenas",
-    "pinang",
-    "spanks",
-    "chilis",
-    "seesaw",
-    "carvel",
-    "hosing",
-    "morpho",
-    "flings",
-    "tassie",
-    "cueing",
-    "coleus",
-    "meekly",
-    "wailed",
-    "wrasse",
-    "serous",
-    "dement",
-    "marron",
-    "firmed",
-    "scrawl",
-    "manana",
-    "foamed",
-    "yearns",
-    "purser",
-    "coster",
-    "durian",
-    "googol",
-    "groped",
-    "warder",
-    "sialic",
-    "rumpus",
-    "braked",
-    "sadist",
-    "warily",
-    "aflame",
-    "aright",
-    "googly",
-    "infers",
-    "urania",
-    "tureen",
-    "uproot",
-    "flints",
-    "logjam",
-    "extort",
-    "carves",
-    "roofer",
-    "pooped",
-    "tinder",
-    "leaden",
-    "bisons",
-    "coking",
-    "spader",
-    "tatami",
-    "cutesy",
-    "wholes",
-    "lasher",
-    "lanner",
-    "skidoo",
-    "tunics",
-    "muesli",
-    "osmium",
-    "lepers",
-    "meaner",
-    "spikey",
-    "roamer",
-    "teepee",
-    "merman",
-    "fajita",
-    "grampa",
-    "missal",
-    "louver",
-    "spinor",
-    "gneiss",
-    "unroll",
-    "phages",
-    "novena",
-    "tropes",
-    "sabbat",
-    "junket",
-    "prissy",
-    "kabobs",
-    "dieing",
-    "menhir",
-    "drools",
-    "zlotys",
-    "boreas",
-    "schist",
-    "lances",
-    "macula",
-    "dacron",
-    "impute",
-    "mauled",
-    "blimps",
-    "pepsin",
-    "payors",
-    "porker",
-    "fining",
-    "pitied",
-    "erring",
-    "plaids",
-    "souped",
-    "unworn",
-    "panted",
-    "fondle",
-    "bulbul",
-    "umlaut",
-    "silane",
-    "slaved",
-    "junker",
-    "tsetse",
-    "dinger",
-    "midden",
-    "mommas",
-    "kneels",
-    "pinged",
-    "sepals",
-    "iambic",
-    "bicker",
-    "faller",
-    "hassel",
-    "gorgon",
-    "childe",
-    "theist",
-    "coitus",
-    "ravers",
-    "gavage",
-    "redder",
-    "golder",
-    "tiptoe",
-    "frater",
-    "chinos",
-    "kilims",
-    "flyway",
-    "yawned",
-    "rewire",
-    "anther",
-    "stomps",
-    "rammer",
-    "gulped",
-    "cupids",
-    "thumps",
-    "augers",
-    "lychee",
-    "amides",
-    "lunged",
-    "cranny",
-    "goober",
-    "wavers",
-    "recept",
-    "syndic",
-    "holdup",
-    "pommel",
-    "pileup",
-    "linnet",
-    "dicing",
-    "gaiter",
-    "laddie",
-    "tallit",
-    "yahoos",
-    "stooge",
-    "dulled",
-    "kingly",
-    "chided",
-    "acquit",
-    "smooch",
-    "akimbo",
-    "motile",
-    "rectus",
-    "pruner",
-    "smalto",
-    "flecks",
-    "chesty",
-    "cayuse",
-    "lunges",
-    "fealty",
-    "biggin",
-    "vendee",
-    "leafed",
-    "cowpea",
-    "balled",
-    "seeped",
-    "cycler",
-    "beachy",
-    "greyed",
-    "clammy",
-    "rifled",
-    "browed",
-    "bogeys",
-    "gaited",
-    "knacks",
-    "chinas",
-    "befits",
-    "svelte",
-    "wheeze",
-    "yarder",
-    "avidly",
-    "tilled",
-    "weeded",
-    "brassy",
-    "smolts",
-    "amadou",
-    "hondas",
-    "rutile",
-    "papyri",
-    "fibula",
-    "hostas",
-    "dearer",
-    "inched",
-    "crista",
-    "apnoea",
-    "milady",
-    "erbium",
-    "dugong",
-    "weaved",
-    "ligure",
-    "hellos",
-    "woodsy",
-    "normed",
-    "hyphae",
-    "silvan",
-    "phloem",
-    "tarter",
-    "ladles",
-    "prided",
-    "malted",
-    "clades",
-    "ejecta",
-    "vadose",
-    "ambers",
-    "hotbox",
-    "whiten",
-    "mogged",
-    "virile",
-    "shrift",
-    "jilted",
-    "poring",
-    "whited",
-    "docker",
-    "peeped",
-    "doused",
-    "triode",
-    "cahier",
-    "booing",
-    "ruffed",
-    "carder",
-    "comber",
-    "tittie",
-    "gulley",
-    "serger",
-    "dauber",
-    "relict",
-    "fatten",
-    "tailer",
-    "tolled",
-    "midair",
-    "papain",
-    "rancor",
-    "baling",
-    "cresol",
-    "cashes",
-    "xylose",
-    "whiles",
-    "payees",
-    "combes",
-    "lurked",
-    "masher",
-    "hobble",
-    "plater",
-    "trawls",
-    "biding",
-    "mammon",
-    "mehndi",
-    "opines",
-    "tinkle",
-    "wormed",
-    "hitmen",
-    "unhurt",
-    "burros",
-    "pistes",
-    "briard",
-    "hoards",
-    "toupee",
-    "tannic",
-    "sacrum",
-    "silvas",
-    "dammed",
-    "aahing",
-    "aaliis",
-    "aarrgh",
-    "abacas",
-    "abakas",
-    "abamps",
-    "abased",
-    "abaser",
-    "abases",
-    "abasia",
-    "abater",
-    "abates",
-    "abatis",
-    "abator",
-    "abayas",
-    "abbacy",
-    "abbess",
-    "abduce",
-    "abeles",
-    "abelia",
-    "abhors",
-    "abided",
-    "abider",
-    "abjure",
-    "ablate",
-    "ablaut",
-    "ablest",
-    "ablins",
-    "abloom",
-    "ablush",
-    "abmhos",
-    "aboded",
-    "abodes",
-    "abohms",
-    "abolla",
-    "abomas",
-    "aboral",
-    "aboves",
-    "abrade",
-    "abseil",
-    "abulia",
-    "abulic",
-    "abvolt",
-    "abwatt",
-    "abying",
-    "abysms",
-    "acajou",
-    "acarid",
-    "acarus",
-    "accost",
-    "acedia",
-    "acetin",
-    "acetum",
-    "achene",
-    "achier",
-    "acidly",
-    "acinar",
-    "acinic",
-    "acinus",
-    "ackees",
-    "acnode",
-    "actins",
-    "acuate",
-    "aculei",
-    "acuter",
-    "acutes",
-    "adages",
-    "addend",
-    "addles",
-    "adduce",
-    "adeems",
-    "adenyl",
-    "adepts",
-    "adieus",
-    "adieux",
-    "adipic",
-    "adjoin",
-    "adjure",
-    "admass",
-    "admixt",
-    "adnate",
-    "adnexa",
-    "adnoun",
-    "adobes",
-    "adobos",
-    "adorer",
-    "adsorb",
-    "advect",
-    "adytum",
-    "adzing",
-    "adzuki",
-    "aecial",
-    "aecium",
-    "aedile",
-    "aedine",
-    "aeneus",
-    "aeonic",
-    "aerate",
-    "aeried",
-    "aerier",
-    "aeries",
-    "aerify",
-    "aerily",
-    "aerobe",
-    "aerugo",
-    "afeard",
-    "afflux",
-    "affray",
-    "afreet",
-    "afrits",
-    "afters",
-    "aftosa",
-    "agamas",
-    "agamic",
-    "agamid",
-    "agapae",
-    "agapai",
-    "agapes",
-    "agaric",
-    "agates",
-    "agaves",
-    "agedly",
-    "ageist",
-    "agenes",
-    "aggada",
-    "aggers",
-    "aggros",
-    "agings",
-    "agisms",
-    "agists",
-    "agitas",
-    "aglare",
-    "agleam",
-    "aglets",
-    "agnail",
-    "agnate",
-    "agnize",
-    "agonal",
-    "agones",
-    "agonic",
-    "agorae",
-    "agoras",
-    "agorot",
-    "agouti",
-    "agouty",
-    "agrafe",
-    "agrias",
-    "aguish",
-    "ahchoo",
-    "ahimsa",
-    "aholds",
-    "ahorse",
-    "aiders",
-    "aidful",
-    "aidman",
-    "aidmen",
-    "aiglet",
-    "aigret",
-    "aimers",
-    "aimful",
-    "aiolis",
-    "airers",
-    "airest",
-    "airier",
-    "airily",
-    "airted",
-    "airths",
-    "aisled",
-    "aivers",
-    "ajivas",
-    "ajowan",
-    "ajugas",
-    "akelas",
-    "akenes",
-    "alands",
-    "alanin",
-    "alants",
-    "alanyl",
-    "alarum",
-    "alated",
-    "alates",
-    "albata",
-    "albite",
-    "alcade",
-    "alcaic",
-    "alcids",
-    "alders",
-    "aldols",
-    "aldose",
-    "alegar",
-    "alephs",
-    "alevin",
-    "alexin",
-    "alfaki",
-    "algins",
-    "algoid",
-    "algors",
-    "algums",
-    "alibis",
-    "alible",
-    "alidad",
-    "alined",
-    "aliner",
-    "alines",
-    "aliped",
-    "aliyas",
-    "aliyos",
-    "aliyot",
-    "alkane",
-    "alkene",
-    "alkies",
-    "alkine",
-    "alkoxy",
-    "alkyds",
-    "alkyls",
-    "alkyne",
-    "allays",
-    "allees",
-    "allods",
-    "allots",
-    "allyls",
-    "almahs",
-    "almehs",
-    "almner",
-    "almuce",
-    "almude",
-    "almuds",
-    "almugs",
-    "alnico",
-    "alodia",
-    "alohas",
-    "aloins",
-    "alphyl",
-    "alsike",
-    "aludel",
-    "alulae",
-    "alular",
-    "alumin",
-    "alvine",
-    "amarna",
-    "amatol",
-    "ambage",
-    "ambari",
-    "ambary",
-    "ambeer",
-    "ambery",
-    "ambits",
-    "ambled",
-    "ambles",
-    "amebae",
-    "ameban",
-    "amebas",
-    "amebic",
-    "ameers",
-    "aments",
-    "amerce",
-    "amices",
-    "amidic",
-    "amidin",
-    "amidol",
-    "aminic",
-    "ammine",
-    "ammino",
-    "ammono",
-    "amnion",
-    "amnios",
-    "amoles",
-    "amours",
-    "amping",
-    "ampler",
-    "ampule",
-    "ampuls",
-    "amtrac",
-    "amucks",
-    "amuser",
-    "amuses",
-    "amusia",
-    "amylic",
-    "amylum",
-    "anabas",
-    "anadem",
-    "ananke",
-    "anarch",
-    "anatto",
-    "anchos",
-    "ancone",
-    "anears",
-    "aneled",
-    "aneles",
-    "anenst",
-    "anergy",
-    "angary",
-    "anglos",
-    "angsts",
-    "anilin",
-    "animis",
-    "anises",
-    "anisic",
-    "ankled",
-    "ankush",
-    "anlace",
-    "anlage",
-    "anneal",
-    "annona",
-    "annuli",
-    "annuls",
-    "anodal",
-    "anodic",
-    "anoles",
-    "anomic",
-    "anomie",
-    "anopia",
-    "ansate",
-    "anteed",
-    "antiar",
-    "antick",
-    "anting",
-    "antral",
-    "antres",
-    "antrum",
-    "anural",
-    "anuran",
-    "anuria",
-    "anuric",
-    "anuses",
-    "anvils",
-    "anyons",
-    "aorist",
-    "aortae",
-    "aortal",
-    "aortas",
-    "aoudad",
-    "apercu",
-    "apexes",
-    "aphtha",
-    "apiary",
-    "apices",
-    "aplite",
-    "apneal",
-    "apneas",
-    "apneic",
-    "apodal",
-    "apolog",
-    "aporia",
-    "appall",
-    "appals",
-    "appels",
-    "appose",
-    "aptest",
-    "arames",
-    "aramid",
-    "arbute",
-    "archil",
-    "archly",
-    "arcked",
-    "ardebs",
-    "ardors",
-    "arecas",
-    "arenes",
-    "areole",
-    "arepas",
-    "aretes",
-    "argala",
-    "argali",
-    "argals",
-    "argils",
-    "argled",
-    "argles",
-    "argols",
-    "argons",
-    "argots",
-    "arguer",
-    "argufy",
-    "arhats",
-    "ariary",
-    "arider",
-    "aridly",
-    "ariels",
-    "ariled",
-    "ariose",
-    "ariosi",
-    "arioso",
-    "arkose",
-    "armers",
-    "armets",
-    "armful",
-    "armlet",
-    "armors",
-    "armure",
-    "aroids",
-    "aroint",
-    "aroynt",
-    "arpens",
-    "arpent",
-    "arrack",
-    "arrant",
-    "arrear",
-    "arroba",
-    "arrowy",
-    "arseno",
-    "arshin",
-    "arsine",
-    "arsino",
-    "arsons",
-    "artels",
-    "artier",
-    "artily",
-    "asanas",
-    "asarum",
-    "ascots",
-    "asdics",
-    "ashcan",
-    "ashier",
-    "ashing",
-    "ashlar",
-    "ashler",
-    "ashmen",
-    "askant",
-    "askers",
-    "aslant",
-    "aslope",
-    "aslosh",
-    "aspens",
-    "aspers",
-    "aspics",
-    "aspish",
-    "asrama",
-    "assais",
-    "assize",
-    "assoil",
-    "assort",
-    "astern",
-    "astony",
-    "aswarm",
-    "aswirl",
-    "aswoon",
-    "atabal",
-    "ataman",
-    "atavic",
-    "ataxic",
-    "atelic",
-    "atlatl",
-    "atmans",
-    "atonal",
-    "atoned",
-    "atoner",
-    "atones",
-    "atonia",
-    "atonic",
-    "attars",
-    "attent",
-    "attorn",
-    "attrit",
-    "attune",
-    "atwain",
-    "atween",
-    "atypic",
-    "aucuba",
-    "audads",
-    "audial",
-    "audile",
-    "auding",
-    "augend",
-    "aughts",
-    "augite",
-    "augurs",
-    "augury",
-    "auklet",
-    "aulder",
-    "auntly",
-    "aurate",
-    "aurist",
-    "aurous",
-    "aurums",
-    "auspex",
-    "ausubo",
-    "autist",
-    "autoed",
-    "auxins",
-    "avails",
-    "avaunt",
-    "averts",
-    "avians",
-    "aviate",
-    "avidin",
-    "avisos",
-    "avoset",
-    "avouch",
-    "avowal",
-    "avower",
-    "avulse",
-    "awaked",
-    "aweary",
-    "aweigh",
-    "aweing",
-    "awhirl",
-    "awless",
-    "awmous",
-    "awoken",
-    "axeman",
-    "axemen",
-    "axenic",
-    "axilla",
-    "axions",
-    "axised",
-    "axises",
-    "axites",
-    "axlike",
-    "axones",
-    "axonic",
-    "axseed",
-    "azides",
-    "azines",
-    "azlons",
-    "azoles",
-    "azonal",
-    "azoted",
-    "azotes",
-    "azoths",
-    "azotic",
-    "azukis",
-    "azures",
-    "azygos",
-    "baaing",
-    "baalim",
-    "baases",
-    "babels",
-    "babied",
-    "babier",
-    "babkas",
-    "babool",
-    "baboos",
-    "babuls",
-    "baccae",
-    "bached",
-    "baches",
-    "bacons",
-    "badder",
-    "baddie",
-    "badged",
-    "badman",
-    "badmen",
-    "baffed",
-    "bagass",
-    "bagful",
-    "baggie",
-    "bagman",
-    "bagmen",
-    "bagnio",
-    "baguet",
-    "bagwig",
-    "bailee",
-    "bailer",
-    "bailie",
-    "bailor",
-    "bairns",
-    "baiter",
-    "baizas",
-    "baizes",
-    "balata",
-    "balded",
-    "balder",
-    "baldly",
-    "baleen",
-    "balers",
-    "balker",
-    "ballsy",
-    "balsas",
-    "bammed",
-    "bancos",
-    "bandas",
-    "bander",
-    "bandog",
-    "banian",
-    "baning",
-    "banjax",
-    "bankit",
-    "bannet",
-    "barbal",
-    "barbel",
-    "barbes",
-    "barbet",
-    "barbut",
-    "barcas",
-    "barded",
-    "bardes",
-    "barege",
-    "barest",
-    "barfed",
-    "barged",
-    "bargee",
-    "barhop",
-    "barite",
-    "barmen",
-    "barmie",
-    "barned",
-    "barong",
-    "barque",
-    "barres",
-    "baryes",
-    "baryta",
-    "baryte",
-    "basely",
-    "basest",
-    "bashaw",
-    "basify",
-    "basils",
-    "basion",
-    "basked",
-    "bassly",
-    "bassos",
-    "basted",
-    "baster",
-    "bastes",
-    "batboy",
-    "bather",
-    "bathes",
-    "bathos",
-    "batiks",
-    "bating",
-    "batmen",
-    "battik",
-    "battue",
-    "baubee",
-    "bauble",
-    "baulks",
-    "baulky",
-    "bawbee",
-    "bawdry",
-    "bawled",
-    "bawler",
-    "bawtie",
-    "bayamo",
-    "baying",
-    "bayman",
-    "baymen",
-    "bayous",
-    "bazars",
-    "bazoos",
-    "beader",
-    "beaned",
-    "beanos",
-    "beauts",
-    "bebops",
-    "becalm",
-    "becaps",
-    "becked",
-    "beclog",
-    "bedamn",
-    "bedaub",
-    "bedbug",
-    "bedder",
-    "bedeck",
-    "bedels",
-    "bedews",
-    "bedims",
-    "bedpan",
-    "bedrid",
-    "bedrug",
-    "bedsit",
-    "beduin",
-    "bedumb",
-    "beebee",
-    "beechy",
-    "beeped",
-    "beeves",
-    "beezer",
-    "beflag",
-    "beflea",
-    "befogs",
-    "befool",
-    "befoul",
-    "befret",
-    "begall",
-    "begaze",
-    "begird",
-    "begirt",
-    "beglad",
-    "begrim",
-    "begulf",
-    "begums",
-    "behead",
-    "behoof",
-    "behove",
-    "behowl",
-    "beiges",
-    "beigne",
-    "bekiss",
-    "beknot",
-    "belady",
-    "belaud",
-    "belays",
-    "beldam",
-    "beleap",
-    "belgas",
-    "belied",
-    "belier",
-    "belike",
-    "belled",
-    "belons",
-    "belows",
-    "belter",
-    "bemata",
-    "bemean",
-    "bemire",
-    "bemist",
-    "bemixt",
-    "bemoan",
-    "bemock",
-    "bemuse",
-    "bename",
-    "benday",
-    "bended",
-    "bendee",
-    "bendys",
-    "bennes",
-    "bennis",
-    "bentos",
-    "benumb",
-    "benzal",
-    "benzin",
-    "benzol",
-    "berake",
-    "berate",
-    "berime",
-    "bermed",
-    "bermes",
-    "beryls",
-    "beseem",
-    "besets",
-    "besmut",
-    "besnow",
-    "besoms",
-    "besots",
-    "bested",
-    "bestir",
-    "bestud",
-    "betake",
-    "betels",
-    "betide",
-    "betime",
-    "betise",
-    "betons",
-    "betony",
-    "betook",
-    "bettas",
-    "betted",
-    "bettor",
-    "bevels",
-    "bevies",
-    "bevors",
-    "bewail",
-    "beweep",
-    "bewept",
-    "bewigs",
-    "beworm",
-    "bewrap",
-    "bewray",
-    "beylic",
-    "beylik",
-    "bezant",
-    "bezazz",
-    "bezils",
-    "bezoar",
-    "bhakta",
-    "bhangs",
-    "bharal",
-    "bhoots",
-    "bialis",
-    "bialys",
-    "biaxal",
-    "bibbed",
-    "bibber",
-    "bicarb",
-    "bicorn",
-    "bicron",
-    "bidden",
-    "biders",
-    "bields",
-    "biface",
-    "biffed",
-    "biffin",
-    "biflex",
-    "bifold",
-    "biform",
-    "bigamy",
-    "bigeye",
-    "bights",
-    "bijous",
-    "bikies",
-    "bilboa",
-    "bilbos",
-    "bilged",
-    "bilges",
-    "bilked",
-    "bilker",
-    "billon",
-    "billow",
-    "bimahs",
-    "binate",
-    "bindis",
-    "bindle",
-    "biners",
-    "binged",
-    "binger",
-    "binges",
-    "bingos",
-    "binits",
-    "binocs",
-    "bionts",
-    "biotas",
-    "bipack",
-    "bipeds",
-    "bipods",
-    "birded",
-    "bireme",
-    "birkie",
-    "birled",
-    "birler",
-    "birles",
-    "birred",
-    "birses",
-    "bisect",
-    "bister",
-    "bistre",
-    "biters",
-    "bitted",
-    "bizone",
-    "bizzes",
-    "blabby",
-    "blader",
-    "blaffs",
-    "blains",
-    "blamer",
-    "blared",
-    "blares",
-    "blasty",
-    "blawed",
-    "blazon",
-    "bleaks",
-    "blears",
-    "bleary",
-    "bleats",
-    "blebby",
-    "bleeps",
-    "blench",
-    "blende",
-    "blenny",
-    "blinis",
-    "blintz",
-    "blites",
-    "bloats",
-    "blooey",
-    "blooie",
-    "bloomy",
-    "bloops",
-    "blotch",
-    "blotto",
-    "blotty",
-    "blousy",
-    "blowby",
-    "blowed",
-    "blowsy",
-    "blowup",
-    "blowzy",
-    "bludge",
-    "bluely",
-    "bluest",
-    "bluets",
-    "blueys",
-    "bluing",
-    "blumed",
-    "blumes",
-    "blunge",
-    "blurts",
-    "blypes",
-    "boarts",
-    "boated",
-    "boatel",
-    "bobbed",
-    "bobber",
-    "bocces",
-    "boccia",
-    "boccie",
-    "boccis",
-    "boches",
-    "boding",
-    "bodkin",
-    "boffed",
-    "boffin",
-    "boffos",
-    "bogans",
-    "bogies",
-    "bogles",
-    "boheas",
-    "bohunk",
-    "boings",
-    "boinks",
-    "boites",
-    "bolete",
-    "boleti",
-    "bolide",
-    "bolled",
-    "bollix",
-    "bollox",
-    "bolshy",
-    "bolson",
-    "bolter",
-    "bombax",
-    "bombes",
-    "bombyx",
-    "bonaci",
-    "bonbon",
-    "bonder",
-    "bonduc",
-    "boners",
-    "bonged",
-    "bonier",
-    "bonked",
-    "bonzer",
-    "bonzes",
-    "booboo",
-    "boocoo",
-    "boodle",
-    "boogey",
-    "boohoo",
-    "boojum",
-    "bookoo",
-    "bootee",
-    "boozed",
-    "boozes",
-    "bopeep",
-    "bopped",
-    "borals",
-    "borane",
-    "bordel",
-    "boreen",
-    "borers",
-    "boride",
-    "borked",
-    "borons",
-    "borsch",
-    "borsht",
-    "boshes",
-    "bosker",
-    "bosket",
-    "bosoms",
-    "bosomy",
-    "bossed",
-    "bosuns",
-    "botchy",
-    "botels",
-    "botfly",
-    "boubou",
-    "boudin",
-    "bouffe",
-    "bougie",
-    "boules",
-    "boulle",
-    "bourgs",
-    "bourns",
-    "boused",
-    "bouses",
-    "bovids",
-    "bowfin",
-    "bowleg",
-    "bowmen",
-    "bowpot",
-    "bowsed",
-    "bowses",
-    "bowwow",
-    "boxful",
-    "boxier",
-    "boxily",
-    "boyard",
-    "boyars",
-    "boylas",
-    "bracer",
-    "brachs",
-    "braggy",
-    "brails",
-    "braise",
-    "braize",
-    "branks",
-    "branny",
-    "brants",
-    "brashy",
-    "bratty",
-    "bravas",
-    "bravos",
-    "brawer",
-    "brawls",
-    "brawly",
-    "brawns",
-    "brawny",
-    "brayed",
-    "brayer",
-    "brazas",
-    "brazed",
-    "brazer",
-    "brazes",
-    "bready",
-    "breams",
-    "bredes",
-    "breeks",
-    "bregma",
-    "brents",
-    "breves",
-    "brewis",
-    "briars",
-    "briary",
-    "bribee",
-    "briber",
-    "bricky",
-    "briers",
-    "briery",
-    "brillo",
-    "brills",
-    "brined",
-    "briner",
-    "brines",
-    "briony",
-    "brises",
-    "brisks",
-    "briths",
-    "britts",
-    "broche",
-    "brocks",
-    "brogue",
-    "broils",
-    "brolly",
-    "bromal",
-    "bromes",
-    "bromic",
-    "bromid",
-    "bromin",
-    "bromos",
-    "broncs",
-    "bronzy",
-    "broody",
-    "broomy",
-    "broses",
-    "broths",
-    "brothy",
-    "browny",
-    "brucin",
-    "brughs",
-    "bruits",
-    "brulot",
-    "brumal",
-    "brumby",
-    "brumes",
-    "brunts",
-    "bruted",
-    "bruxed",
-    "bruxes",
-    "bryony",
-    "bubale",
-    "bubals",
-    "bubbas",
-    "bubkes",
-    "buboed",
-    "buboes",
-    "bucker",
-    "buckos",
-    "buckra",
-    "budded",
-    "budder",
-    "buddle",
-    "budged",
-    "budger",
-    "budges",
-    "buffos",
-    "bugeye",
-    "bugled",
-    "bugler",
-    "bugles",
-    "bugout",
-    "bugsha",
-    "bulbar",
-    "bulbed",
-    "bulbel",
-    "bulbil",
-    "bulged",
-    "bulgur",
-    "bulked",
-    "bullae",
-    "bulled",
-    "bumkin",
-    "bumphs",
-    "bunchy",
-    "buncos",
-    "bundts",
-    "bunged",
-    "bunion",
-    "bunked",
-    "bunkos",
-    "bunkum",
-    "bunted",
-    "bunter",
-    "bunyas",
-    "bupkes",
-    "bupkus",
-    "buppie",
-    "buqsha",
-    "burans",
-    "burble",
-    "burbly",
-    "burbot",
-    "burdie",
-    "burets",
-    "burgee",
-    "burghs",
-    "burgle",
-    "burgoo",
-    "burier",
-    "burins",
-    "burkas",
-    "burked",
-    "burker",
-    "burkes",
-    "burled",
-    "burler",
-    "burped",
-    "burqas",
-    "burred",
-    "burrer",
-    "bursae",
-    "bursal",
-    "bursas",
-    "burses",
-    "busbar",
-    "busboy",
-    "bushed",
-    "busher",
-    "bushwa",
-    "busied",
-    "busies",
-    "busked",
-    "busker",
-    "buskin",
-    "busman",
-    "busmen",
-    "bussed",
-    "bustic",
-    "butene",
-    "buteos",
-    "butled",
-    "butles",
-    "bututs",
-    "butyls",
-    "buyoff",
-    "buzuki",
-    "buzzes",
-    "bwanas",
-    "byelaw",
-    "byname",
-    "bypast",
-    "bypath",
-    "byplay",
-    "byrled",
-    "byrnie",
-    "byroad",
-    "byssal",
-    "byssus",
-    "bytalk",
-    "byword",
-    "bywork",
-    "byzant",
-    "cabala",
-    "cabals",
-    "cabbed",
-    "cabers",
-    "cabler",
-    "cablet",
-    "cabman",
-    "cabmen",
-    "cabobs",
-    "cacaos",
-    "cachou",
-    "cackle",
-    "cadent",
-    "cadged",
-    "cadger",
-    "cadges",
-    "cadmic",
-    "caecal",
-    "caecum",
-    "caeoma",
-    "caftan",
-    "cagers",
-    "cagier",
-    "cagily",
-    "caging",
-    "cahows",
-    "caique",
-    "cairds",
-    "cairny",
-    "cajole",
-    "cakier",
-    "caking",
-    "calami",
-    "calash",
-    "calcar",
-    "calces",
-    "calcic",
-    "calesa",
-    "califs",
-    "calked",
-    "calker",
-    "calkin",
-    "callet",
-    "calory",
-    "calpac",
-    "calque",
-    "calved",
-    "calxes",
-    "camail",
-    "camass",
-    "cambia",
-    "camion",
-    "camise",
-    "camlet",
-    "cammie",
-    "canape",
-    "cancan",
-    "cancha",
-    "caners",
-    "canful",
-    "cangue",
-    "canids",
-    "cannas",
-    "cannel",
-    "canner",
-    "cannie",
-    "cannot",
-    "canoed",
-    "canoer",
-    "cansos",
-    "cantal",
-    "canted",
-    "canthi",
-    "cantic",
-    "cantle",
-    "canula",
-    "capful",
-    "capias",
-    "caplet",
-    "caplin",
-    "capons",
-    "capric",
-    "captan",
-    "carack",
-    "carate",
-    "carbos",
-    "carboy",
-    "carcel",
-    "cardia",
-    "cardon",
-    "careen",
-    "carets",
-    "carful",
-    "cargos",
-    "carhop",
-    "caried",
-    "carked",
-    "carles",
-    "carnie",
-    "carobs",
-    "caroch",
-    "caroli",
-    "caroms",
-    "carped",
-    "carpel",
-    "carpus",
-    "carrel",
-    "carrom",
-    "carses",
-    "carted",
-    "cartop",
-    "casaba",
-    "casava",
-    "casefy",
-    "caseic",
-    "casern",
-    "cashaw",
-    "cashoo",
-    "casini",
-    "casked",
-    "casque",
-    "catalo",
-    "catgut",
-    "catkin",
-    "catnap",
-    "catsup",
-    "catted",
-    "cattie",
-    "caudad",
-    "caudex",
-    "caudle",
-    "caulds",
-    "caules",
-    "caulis",
-    "caulks",
-    "causer",
-    "cavers",
-    "cavies",
-    "cavils",
-    "cavort",
-    "cawing",
-    "cebids",
-    "ceboid",
-    "cecity",
-    "cedarn",
-    "cedary",
-    "ceders",
-    "cedula",
-    "ceibas",
-    "ceiled",
-    "ceiler",
-    "ceilis",
-    "cellae",
-    "celoms",
-    "cenote",
-    "censed",
-    "censer",
-    "censes",
-    "centai",
-    "cental",
-    "centas",
-    "ceorls",
-    "cerate",
-    "cercal",
-    "cercis",
-    "cercus",
-    "cerias",
-    "cering",
-    "ceriph",
-    "cerite",
-    "cermet",
-    "cerous",
-    "certes",
-    "ceruse",
-    "cervid",
-    "cessed",
-    "cestas",
-    "cestoi",
-    "cestos",
-    "cestus",
-    "cesura",
-    "cetane",
-    "chabuk",
-    "chacma",
-    "chadar",
-    "chador",
-    "chadri",
-    "chaeta",
-    "chafed",
-    "chafer",
-    "chafes",
-    "chaffs",
-    "chaffy",
-    "chaine",
-    "chalah",
-    "chaleh",
-    "challa",
-    "chally",
-    "chalot",
-    "chammy",
-    "champy",
-    "chancy",
-    "changs",
-    "chanty",
-    "chapes",
-    "charas",
-    "chards",
-    "chared",
-    "chares",
-    "charka",
-    "charks",
-    "charro",
-    "charrs",
-    "charry",
-    "chasms",
-    "chasmy",
-    "chaunt",
-    "chawed",
-    "chawer",
-    "chazan",
-    "cheaps",
-    "chebec",
-    "cheder",
-    "cheeps",
-    "cheero",
-    "chefed",
-    "chegoe",
-    "chelae",
-    "chelas",
-    "chemic",
-    "chemos",
-    "cherts",
-    "cherty",
-    "chetah",
-    "cheths",
-    "chevre",
-    "chewer",
-    "chiasm",
-    "chiaus",
-    "chicer",
-    "chichi",
-    "chicle",
-    "chicly",
-    "chider",
-    "chides",
-    "chield",
-    "chiels",
-    "chigoe",
-    "chimar",
-    "chimbs",
-    "chimer",
-    "chimla",
-    "chinch",
-    "chined",
-    "chinks",
-    "chinky",
-    "chints",
-    "chippy",
-    "chirks",
-    "chirms",
-    "chiros",
-    "chirps",
-    "chirpy",
-    "chirre",
-    "chirrs",
-    "chirus",
-    "chital",
-    "chiton",
-    "chivvy",
-    "choana",
-    "chocks",
-    "chokey",
-    "cholas",
-    "choler",
-    "cholla",
-    "cholos",
-    "chomps",
-    "chooks",
-    "choosy",
-    "chorea",
-    "chored",
-    "choric",
-    "chotts",
-    "chough",
-    "chouse",
-    "choush",
-    "chowed",
-    "chowse",
-    "chromy",
-    "chufas",
-    "chuffs",
-    "chuffy",
-    "chukar",
-    "chukka",
-    "chummy",
-    "chumps",
-    "chuppa",
-    "churls",
-    "churns",
-    "churro",
-    "churrs",
-    "chuted",
-    "chyles",
-    "chymes",
-    "chymic",
-    "cibols",
-    "cicala",
-    "cicale",
-    "ciders",
-    "cilice",
-    "cilium",
-    "cineol",
-    "ciscos",
-    "cisted",
-    "cistus",
-    "citers",
-    "cither",
-    "citied",
-    "citify",
-    "citola",
-    "citole",
-    "citral",
-    "citrin",
-    "civets",
-    "civies",
-    "civism",
-    "clachs",
-    "clacks",
-    "clangs",
-    "clanks",
-    "clanky",
-    "claque",
-    "claros",
-    "claspt",
-    "clasts",
-    "claver",
-    "claves",
-    "clavus",
-    "clawer",
-    "claxon",
-    "clayed",
-    "cleeks",
-    "clefts",
-    "clench",
-    "cleome",
-    "cleped",
-    "clepes",
-    "clerid",
-    "clewed",
-    "cliffy",
-    "clifts",
-    "clinal",
-    "clines",
-    "clingy",
-    "clinks",
-    "cliquy",
-    "clitic",
-    "clivia",
-    "cloaca",
-    "cloche",
-    "cloddy",
-    "cloggy",
-    "clomps",
-    "clonic",
-    "clonks",
-    "clonus",
-    "cloots",
-    "cloque",
-    "clotty",
-    "clours",
-    "clouts",
-    "cloven",
-    "cloyed",
-    "clozes",
-    "clubby",
-    "clucks",
-    "cluing",
-    "clumpy",
-    "clunks",
-    "clypei",
-    "cnidae",
-    "coacts",
-    "coalas",
-    "coaled",
-    "coaler",
-    "coapts",
-    "coatee",
-    "coater",
-    "coatis",
-    "coaxal",
-    "coaxer",
-    "coaxes",
-    "cobber",
-    "cobias",
-    "cobles",
-    "cobnut",
-    "cocain",
-    "coccal",
-    "coccic",
-    "coccid",
-    "coccus",
-    "coccyx",
-    "cockup",
-    "cocoas",
-    "codded",
-    "codder",
-    "coddle",
-    "codeia",
-    "codein",
-    "codens",
-    "codger",
-    "codlin",
-    "coedit",
-    "coelom",
-    "coempt",
-    "coeval",
-    "coffer",
-    "coffle",
-    "cogged",
-    "cogons",
-    "cogway",
-    "cohead",
-    "coheir",
-    "cohere",
-    "cohogs",
-    "cohost",
-    "cohune",
-    "coifed",
-    "coiffe",
-    "coigne",
-    "coigns",
-    "coiler",
-    "coiner",
-    "coital",
-    "cojoin",
-    "colbys",
-    "colead",
-    "colics",
-    "colies",
-    "colins",
-    "collop",
-    "colobi",
-    "cologs",
-    "colone",
-    "coloni",
-    "colugo",
-    "colure",
-    "colzas",
-    "comade",
-    "comake",
-    "comate",
-    "comedo",
-    "comfit",
-    "comity",
-    "commix",
-    "comose",
-    "comous",
-    "compas",
-    "comped",
-    "compos",
-    "compts",
-    "comtes",
-    "conchs",
-    "conchy",
-    "coneys",
-    "confab",
-    "confit",
-    "congee",
-    "conges",
-    "congii",
-    "congos",
-    "congou",
-    "conics",
-    "conies",
-    "conine",
-    "coning",
-    "conins",
-    "conium",
-    "conked",
-    "conoid",
-    "contes",
-    "contos",
-    "coocoo",
-    "cooeed",
-    "cooees",
-    "cooers",
-    "cooeys",
-    "cooing",
-    "cookey",
-    "coolie",
-    "coolth",
-    "cooped",
-    "coopts",
-    "cootie",
-    "copalm",
-    "copals",
-    "copays",
-    "copeck",
-    "copens",
-    "copers",
-    "coplot",
-    "copout",
-    "copped",
-    "coppra",
-    "coprah",
-    "copras",
-    "copses",
-    "copula",
-    "coquet",
-    "corban",
-    "corbel",
-    "corbie",
-    "corers",
-    "corgis",
-    "corium",
-    "corked",
-    "corker",
-    "cormel",
-    "cornua",
-    "corody",
-    "corsac",
-    "corses",
-    "cortin",
-    "corvee",
-    "corves",
-    "corvet",
-    "corvid",
-    "corymb",
-    "coryza",
-    "cosecs",
-    "cosets",
-    "coseys",
-    "coshed",
-    "cosher",
-    "coshes",
-    "cosied",
-    "cosier",
-    "cosies",
-    "cosign",
-    "cosily",
-    "cosset",
-    "costae",
-    "cotans",
-    "coteau",
-    "coting",
-    "cottae",
-    "cottar",
-    "cottas",
-    "cotype",
-    "coulis",
-    "couped",
-    "couter",
-    "couths",
-    "covary",
-    "covets",
-    "coveys",
-    "coving",
-    "covins",
-    "cowage",
-    "cowers",
-    "cowier",
-    "cowing",
-    "cowled",
-    "cowman",
-    "cowmen",
-    "cowpat",
-    "cowpie",
-    "cowpox",
-    "cowrie",
-    "coxing",
-    "coydog",
-    "coyest",
-    "coying",
-    "coyish",
-    "coypou",
-    "coypus",
-    "cozens",
-    "cozeys",
-    "cozied",
-    "cozier",
-    "cozies",
-    "cozily",
-    "cozzes",
-    "craals",
-    "cracky",
-    "crakes",
-    "crambe",
-    "crambo",
-    "crampy",
-    "cranch",
-    "craned",
-    "crania",
-    "craped",
-    "crapes",
-    "crases",
-    "crasis",
-    "cratch",
-    "crated",
-    "craton",
-    "cravat",
-    "craver",
-    "crawly",
-    "crazes",
-    "creaks",
-    "creaky",
-    "creasy",
-    "credal",
-    "credos",
-    "creels",
-    "creese",
-    "creesh",
-    "cremes",
-    "crenel",
-    "creped",
-    "crepey",
-    "crepon",
-    "cressy",
-    "cresyl",
-    "cretic",
-    "cretin",
-    "crewel",
-    "cricks",
-    "criers",
-    "crimps",
-    "crimpy",
-    "crinum",
-    "cripes",
-    "crisic",
-    "crissa",
-    "croaks",
-    "croaky",
-    "crocks",
-    "crojik",
-    "crones",
-    "croons",
-    "croupe",
-    "croups",
-    "croupy",
-    "croute",
-    "crowdy",
-    "crowed",
-    "crower",
-    "crozer",
-    "crozes",
-    "crucks",
-    "cruddy",
-    "cruder",
-    "crudes",
-    "cruets",
-    "crumby",
-    "crumps",
-    "cruors",
-    "crural",
-    "cruses",
-    "cruset",
-    "cruxes",
-    "crwths",
-    "crypts",
-    "cubage",
-    "cubebs",
-    "cubers",
-    "cubics",
-    "cubing",
-    "cubiti",
-    "cuboid",
-    "cuddie",
-    "cudgel",
-    "cuisse",
-    "culets",
-    "cullay",
-    "culler",
-    "cullet",
-    "cullis",
-    "culmed",
-    "culpae",
-    "cultch",
-    "cultic",
-    "cultus",
-    "cumber",
-    "cumins",
-    "cummer",
-    "cummin",
-    "cumuli",
-    "cundum",
-    "cuneal",
-    "cunner",
-    "cupels",
-    "cupful",
-    "cuppas",
-    "cupper",
-    "cupric",
-    "cuprum",
-    "cupula",
-    "cupule",
-    "curacy",
-    "curagh",
-    "curara",
-    "curare",
-    "curari",
-    "curber",
-    "curded",
-    "curdle",
-    "curers",
-    "curets",
-    "curial",
-    "curies",
-    "curite",
-    "curium",
-    "curred",
-    "curser",
-    "curtal",
-    "curter",
-    "curtly",
-    "curtsy",
-    "curule",
-    "curvet",
-    "curvey",
-    "cuscus",
-    "cusecs",
-    "cushat",
-    "cushaw",
-    "cuspal",
-    "cusped",
-    "cuspid",
-    "cuspis",
-    "cusser",
-    "cusses",
-    "cussos",
-    "custos",
-    "cutely",
-    "cuteys",
-    "cutins",
-    "cutlas",
-    "cutlet",
-    "cuttle",
-    "cutups",
-    "cuvees",
-    "cyanic",
-    "cyanid",
-    "cyanin",
-    "cycads",
-    "cyclos",
-    "cyders",
-    "cyeses",
-    "cyesis",
-    "cymars",
-    "cymene",
-    "cymlin",
-    "cymoid",
-    "cymols",
-    "cymose",
-    "cymous",
-    "cypres",
-    "cytons",
-    "dabbed",
-    "dabber",
-    "dachas",
-    "dacite",
-    "dacker",
-    "dacoit",
-    "dactyl",
-    "daddle",
-    "dadgum",
-    "dadoed",
-    "dadoes",
-    "daedal",
-    "daffed",
-    "dafter",
-    "daftly",
-    "daggas",
-    "daggle",
-    "dagoba",
-    "dagoes",
-    "dahoon",
-    "daiker",
-    "daikon",
-    "daimen",
-    "daimio",
-    "daimon",
-    "daimyo",
-    "daises",
-    "dakoit",
-    "daledh",
-    "daleth",
-    "damans",
-    "damars",
-    "dammar",
-    "dammer",
-    "damner",
-    "damply",
-    "damson",
-    "dandle",
-    "danged",
-    "dangly",
-    "danios",
-    "danker",
-    "dankly",
-    "dapped",
-    "dapple",
-    "darbar",
-    "darers",
-    "darics",
-    "darked",
-    "darkey",
-    "darkie",
-    "darkle",
-    "darnel",
-    "darner",
-    "dartle",
-    "dashis",
-    "dassie",
-    "datary",
-    "datcha",
-    "daters",
-    "dattos",
-    "daubed",
-    "daubes",
-    "daubry",
-    "daunts",
-    "dauted",
-    "dautie",
-    "davens",
-    "davits",
-    "dawdle",
-    "dawing",
-    "dawted",
-    "dawtie",
-    "dayfly",
-    "daylit",
-    "dazing",
-    "deaden",
-    "deader",
-    "deafen",
-    "deafer",
-    "deafly",
-    "deairs",
-    "deaned",
-    "dearie",
-    "deasil",
-    "deathy",
-    "deaved",
-    "deaves",
-    "debags",
-    "debark",
-    "debars",
-    "debase",
-    "debeak",
-    "debone",
-    "debugs",
-    "debyes",
-    "decafs",
-    "decamp",
-    "decane",
-    "decant",
-    "decare",
-    "decern",
-    "deckel",
-    "deckle",
-    "declaw",
-    "decoct",
-    "decury",
-    "dedans",
-    "deewan",
-    "defang",
-    "defats",
-    "deffer",
-    "defier",
-    "deflea",
-    "defoam",
-    "defogs",
-    "defter",
-    "defuel",
-    "defund",
-    "defuze",
-    "degage",
-    "degame",
-    "degami",
-    "degerm",
-    "degums",
-    "degust",
-    "dehorn",
-    "dehort",
-    "deiced",
-    "deicer",
-    "deices",
-    "deific",
-    "deigns",
-    "deisms",
-    "deists",
-    "deixis",
-    "deject",
-    "dekare",
-    "deking",
-    "dekkos",
-    "delate",
-    "delead",
-    "delfts",
-    "delict",
-    "delime",
-    "delist",
-    "deltic",
-    "delude",
-    "delver",
-    "demark",
-    "demast",
-    "demies",
-    "demits",
-    "demobs",
-    "demode",
-    "demoed",
-    "demote",
-    "demurs",
-    "denari",
-    "denars",
-    "denary",
-    "denims",
-    "denned",
-    "dentil",
-    "denude",
-    "deodar",
-    "deperm",
-    "depone",
-    "depute",
-    "derate",
-    "derats",
-    "derays",
-    "deride",
-    "dermas",
-    "dermic",
-    "derris",
-    "desalt",
-    "desand",
-    "descry",
-    "desman",
-    "desmid",
-    "desorb",
-    "desoxy",
-    "detent",
-    "detick",
-    "deuced",
-    "devein",
-    "devels",
-    "devest",
-    "devoir",
-    "devons",
-    "dewans",
-    "dewars",
-    "dewier",
-    "dewily",
-    "dewing",
-    "dewlap",
-    "dewool",
-    "deworm",
-    "dexies",
-    "dextro",
-    "dezinc",
-    "dharna",
-    "dhobis",
-    "dholes",
-    "dhooly",
-    "dhoora",
-    "dhooti",
-    "dhotis",
-    "dhurna",
-    "dhutis",
-    "diacid",
-    "diamin",
-    "diapir",
-    "diazin",
-    "dibbed",
-    "dibber",
-    "dibbuk",
-    "dicast",
-    "dicers",
-    "dicier",
-    "dicots",
-    "didact",
-    "diddly",
-    "didies",
-    "didoes",
-    "dienes",
-    "dieoff",
-    "diesis",
-    "dieted",
-    "digamy",
-    "digged",
-    "dights",
-    "diglot",
-    "dikdik",
-    "dikers",
-    "diking",
-    "dildoe",
-    "dilled",
-    "dimity",
-    "dimout",
-    "dimply",
-    "dimwit",
-    "dindle",
-    "dinged",
-    "dinges",
-    "dingey",
-    "dingus",
-    "dinked",
-    "dinkey",
-    "dinkly",
-    "dinkum",
-    "dinned",
-    "dinted",
-    "diobol",
-    "dioecy",
-    "dioxan",
-    "dioxid",
-    "diplex",
-    "diploe",
-    "dipnet",
-    "dipody",
-    "dipsas",
-    "dipsos",
-    "diquat",
-    "dirams",
-    "dirdum",
-    "direly",
-    "direst",
-    "dirges",
-    "dirked",
-    "dirled",
-    "dirndl",
-    "disbar",
-    "disbud",
-    "disced",
-    "diseur",
-    "disked",
-    "dismes",
-    "disown",
-    "dissed",
-    "disses",
-    "distil",
-    "dittos",
-    "ditzes",
-    "diuron",
-    "divans",
-    "divots",
-    "diwans",
-    "dixits",
-    "dizens",
-    "djebel",
-    "djinni",
-    "djinns",
-    "djinny",
-    "doated",
-    "dobber",
-    "dobies",
-    "doblas",
-    "doblon",
-    "dobras",
-    "dobros",
-    "dodder",
-    "dodgem",
-    "dodoes",
-    "doffed",
-    "doffer",
-    "dogdom",
-    "dogear",
-    "dogeys",
-    "dogger",
-    "dogies",
-    "dogleg",
-    "dognap",
-    "doiled",
-    "doited",
-    "doling",
-    "dolled",
-    "dolman",
-    "dolmas",
-    "dolors",
-    "dolour",
-    "doming",
-    "donees",
-    "dongas",
-    "donjon",
-    "donnee",
-    "donsie",
-    "donzel",
-    "doodad",
-    "doodoo",
-    "doofus",
-    "doolee",
-    "doolie",
-    "doowop",
-    "doozer",
-    "doozie",
-    "dopant",
-    "dopers",
-    "dopier",
-    "dopily",
-    "dorbug",
-    "dories",
-    "dormie",
-    "dormin",
-    "dorper",
-    "dorsad",
-    "dorsel",
-    "dorser",
-    "dorsum",
-    "dosers",
-    "dossal",
-    "dossed",
-    "dossel",
-    "dosser",
-    "dosses",
-    "dossil",
-    "dotage",
-    "dotard",
-    "doters",
-    "dotier",
-    "doting",
-    "dottel",
-    "dotter",
-    "dottle",
-    "doughs",
-    "dought",
-    "doughy",
-    "doumas",
-    "dourah",
-    "douras",
-    "dourer",
-    "dourly",
-    "douser",
-    "douses",
-    "dovens",
-    "dovish",
-    "dowers",
-    "dowery",
-    "dowing",
-    "dowsed",
-    "dowser",
-    "dowses",
-    "doxies",
-    "doyens",
-    "doyley",
-    "dozers",
-    "dozily",
-    "drably",
-    "drachm",
-    "draffs",
-    "draffy",
-    "drafty",
-    "dragee",
-    "draggy",
-    "drails",
-    "drapey",
-    "drawee",
-    "drawls",
-    "drawly",
-    "drayed",
-    "drears",
-    "drecks",
-    "drecky",
-    "dreggy",
-    "dreich",
-    "dreidl",
-    "dreigh",
-    "driegh",
-    "drifty",
-    "drippy",
-    "drogue",
-    "drolls",
-    "drolly",
-    "dromon",
-    "droned",
-    "droner",
-    "drongo",
-    "drooly",
-    "droops",
-    "dropsy",
-    "drosky",
-    "drossy",
-    "drouks",
-    "drouth",
-    "droved",
-    "drover",
-    "drownd",
-    "drowse",
-    "druggy",
-    "drumly",
-    "drupes",
-    "druses",
-    "dryads",
-    "dryest",
-    "dryish",
-    "drylot",
-    "dubber",
-    "dubbin",
-    "ducats",
-    "ducker",
-    "duddie",
-    "dudeen",
-    "duding",
-    "dudish",
-    "dueled",
-    "dueler",
-    "duelli",
-    "duello",
-    "duende",
-    "duenna",
-    "dueted",
-    "duffer",
-    "duiker",
-    "duking",
-    "dulcet",
-    "dulias",
-    "duller",
-    "dulses",
-    "dumbly",
-    "dumbos",
-    "dumdum",
-    "dunams",
-    "dunces",
-    "dunged",
-    "dunite",
-    "dunked",
-    "dunker",
-    "dunlin",
-    "dunned",
-    "dunner",
-    "dunted",
-    "duolog",
-    "duomos",
-    "dupers",
-    "dupery",
-    "duping",
-    "dupped",
-    "durbar",
-    "durion",
-    "durned",
-    "durocs",
-    "durras",
-    "durrie",
-    "durums",
-    "dusked",
-    "dustup",
-    "dweebs",
-    "dweeby",
-    "dwined",
-    "dwines",
-    "dyable",
-    "dybbuk",
-    "dyings",
-    "dyking",
-    "dynast",
-    "dynels",
-    "dynode",
-    "dyvour",
-    "eagers",
-    "eagled",
-    "eaglet",
-    "eagres",
-    "earful",
-    "earing",
-    "earlap",
-    "earwax",
-    "earwig",
-    "easies",
-    "ebbets",
-    "ebbing",
-    "ecarte",
-    "ecesic",
-    "ecesis",
-    "echard",
-    "eching",
-    "echini",
-    "echoer",
-    "echoey",
-    "echoic",
-    "eclair",
-    "eclats",
-    "ectype",
-    "eddied",
-    "eddoes",
-    "edemas",
-    "edenic",
-    "edgers",
-    "edgier",
-    "edgily",
-    "ediles",
-    "educed",
-    "educes",
-    "educts",
-    "eelier",
-    "eerier",
-    "efface",
-    "effete",
-    "effuse",
-    "egesta",
-    "egests",
-    "eggars",
-    "eggcup",
-    "egging",
-    "egises",
-    "egoist",
-    "eiders",
-    "eidola",
-    "eikons",
-    "ejects",
-    "ekuele",
-    "elains",
-    "elands",
-    "elapid",
-    "elater",
-    "elates",
-    "elegit",
-    "elemis",
-    "elevon",
-    "elfins",
-    "elfish",
-    "elided",
-    "elides",
-    "elints",
-    "elmier",
-    "elodea",
-    "eloign",
-    "eloins",
-    "eloped",
-    "eloper",
-    "elopes",
-    "eluant",
-    "eluate",
-    "eluder",
-    "eluent",
-    "elutes",
-    "eluvia",
-    "elvers",
-    "elytra",
-    "embalm",
-    "embank",
-    "embars",
-    "embays",
-    "emboli",
-    "emboly",
-    "embosk",
-    "embows",
-    "embrue",
-    "emceed",
-    "emcees",
-    "emdash",
-    "emeers",
-    "emends",
-    "emerod",
-    "emeses",
-    "emesis",
-    "emetic",
-    "emetin",
-    "emeute",
-    "emigre",
-    "emmers",
-    "emmets",
-    "emodin",
-    "emoted",
-    "emoter",
-    "emotes",
-    "empale",
-    "empery",
-    "emydes",
-    "enamor",
-    "enates",
-    "enatic",
-    "encage",
-    "encamp",
-    "encase",
-    "encash",
-    "encina",
-    "encyst",
-    "endash",
-    "endear",
-    "endite",
-    "endows",
-    "endrin",
-    "endued",
-    "endues",
-    "enface",
-    "enfold",
-    "engild",
-    "engird",
-    "engirt",
-    "englut",
-    "engram",
-    "enhalo",
-    "enisle",
-    "enmesh",
-    "ennead",
-    "ennuis",
-    "ennuye",
-    "enokis",
-    "enolic",
-    "enosis",
-    "enrage",
-    "enrapt",
-    "enrobe",
-    "enrols",
-    "enroot",
-    "enserf",
-    "ensile",
-    "ensoul",
-    "entera",
-    "entoil",
-    "entomb",
-    "entrap",
-    "enured",
-    "enures",
-    "envier",
-    "envies",
-    "envois",
-    "enwind",
-    "enwomb",
-    "enwrap",
-    "enzyms",
-    "eolian",
-    "eolith",
-    "eonian",
-    "eonism",
-    "eosine",
-    "eosins",
-    "epacts",
-    "eparch",
-    "ephahs",
-    "ephebe",
-    "ephebi",
-    "ephods",
-    "ephori",
-    "ephors",
-    "epical",
-    "epigon",
-    "epilog",
-    "epimer",
-    "epizoa",
-    "epodes",
-    "eponym",
-    "epopee",
-    "eposes",
-    "equids",
-    "erects",
-    "erenow",
-    "ergate",
-    "ergots",
-    "ericas",
-    "eringo",
-    "eroses",
-    "eructs",
-    "erugos",
-    "ervils",
-    "eryngo",
-    "escarp",
-    "escars",
-    "eschar",
-    "escots",
-    "eskars",
-    "eskers",
-    "espial",
-    "espied",
-    "espies",
-    "essoin",
-    "estops",
-    "estral",
-    "estray",
-    "estrum",
-    "etalon",
-    "etamin",
-    "etapes",
-    "etcher",
-    "etches",
-    "eterne",
-    "ethene",
-    "ethion",
-    "ethnos",
-    "ethoxy",
-    "ethyls",
-    "ethyne",
-    "etwees",
-    "etymon",
-    "eupnea",
-    "euripi",
-    "euroky",
-    "eutaxy",
-    "evader",
-    "evades",
-    "evened",
-    "evener",
-    "everts",
-    "evicts",
-    "eviler",
-    "evilly",
-    "evited",
-    "evites",
-    "evoker",
-    "evulse",
-    "evzone",
-    "exacts",
-    "exalts",
-    "exarch",
-    "excide",
-    "exedra",
-    "exequy",
-    "exhume",
-    "exiler",
-    "exilic",
-    "exines",
-    "exodoi",
-    "exodos",
-    "exogen",
-    "exonic",
-    "exonym",
-    "expels",
-    "exsect",
-    "exsert",
-    "extoll",
-    "extols",
-    "exuded",
-    "exults",
-    "exurbs",
-    "exuvia",
-    "eyases",
-    "eyebar",
-    "eyecup",
-    "eyeful",
-    "eyries",
-    "fabber",
-    "fabler",
-    "facers",
-    "facete",
-    "faceup",
-    "faciae",
-    "facias",
-    "facula",
-    "fadein",
-    "fadged",
-    "fadges",
-    "faenas",
-    "fagged",
-    "fagins",
-    "fagots",
-    "faille",
-    "fainer",
-    "faints",
-    "faired",
-    "fakeer",
-    "fakers",
-    "fakery",
-    "fakirs",
-    "falces",
-    "fallal",
-    "falser",
-    "falsie",
-    "faming",
-    "famish",
-    "famuli",
-    "fanega",
-    "fangas",
-    "fanged",
-    "fanion",
-    "fanjet",
-    "fanner",
-    "fanons",
-    "fantod",
-    "fanums",
-    "faqirs",
-    "faquir",
-    "farads",
-    "farced",
-    "farcer",
-    "farces",
-    "farcie",
-    "farded",
-    "fardel",
-    "farers",
-    "farfal",
-    "farfel",
-    "farles",
-    "farted",
-    "fasces",
-    "fashed",
-    "fashes",
-    "fating",
-    "fatsos",
-    "fatted",
-    "fatwas",
-    "faucal",
-    "fauces",
-    "faulds",
-    "faunae",
-    "faunas",
-    "fauves",
-    "favela",
-    "favism",
-    "fawned",
-    "fawner",
-    "faying",
-    "fazing",
-    "fearer",
-    "feased",
-    "feases",
-    "feater",
-    "featly",
-    "feazed",
-    "feazes",
-    "fecial",
-    "feckly",
-    "fecula",
-    "fecund",
-    "feebly",
-    "feeing",
-    "feeler",
-    "feezed",
-    "feezes",
-    "feigns",
-    "feijoa",
-    "feints",
-    "feirie",
-    "feists",
-    "felids",
-    "fellah",
-    "felloe",
-    "felsic",
-    "femora",
-    "femurs",
-    "fended",
-    "fennec",
-    "feoffs",
-    "ferals",
-    "ferbam",
-    "feriae",
-    "ferial",
-    "ferias",
-    "ferine",
-    "ferity",
-    "ferlie",
-    "fermis",
-    "ferrel",
-    "ferula",
-    "ferule",
-    "fervid",
-    "fessed",
-    "fesses",
-    "festal",
-    "fetial",
-    "fetich",
-    "feting",
-    "fetors",
-    "fetted",
-    "fettle",
-    "feuars",
-    "feuded",
-    "feuing",
-    "feyest",
-    "fezzed",
-    "fezzes",
-    "fiacre",
-    "fibbed",
-    "fibber",
-    "fibril",
-    "fiches",
-    "fichus",
-    "ficins",
-    "fickly",
-    "ficoes",
-    "fiddly",
-    "fidged",
-    "fidges",
-    "fidget",
-    "fifers",
-    "fifing",
-    "figged",
-    "filets",
-    "fillip",
-    "fillos",
-    "filmer",
-    "filmic",
-    "filmis",
-    "filose",
-    "filths",
-    "fimble",
-    "finito",
-    "finked",
-    "fiords",
-    "fipple",
-    "fiques",
-    "firers",
-    "firkin",
-    "firman",
-    "firths",
-    "fistic",
-    "fitchy",
-    "fitful",
-    "fivers",
-    "fixate",
-    "fixers",
-    "fixity",
-    "fixure",
-    "fizgig",
-    "fizzed",
-    "fizzer",
-    "fizzes",
-    "fjelds",
-    "flacks",
-    "flacon",
-    "flaggy",
-    "flagon",
-    "flails",
-    "flairs",
-    "flaker",
-    "flakey",
-    "flambe",
-    "flamen",
-    "flamer",
-    "flanes",
-    "flappy",
-    "flatus",
-    "flauta",
-    "flaxen",
-    "flaxes",
-    "flayed",
-    "flayer",
-    "fleams",
-    "fleche",
-    "flecky",
-    "fledge",
-    "fledgy",
-    "fleech",
-    "fleecy",
-    "fleers",
-    "flench",
-    "flense",
-    "fleyed",
-    "fliest",
-    "flinty",
-    "flippy",
-    "flitch",
-    "flited",
-    "flites",
-    "floaty",
-    "flocci",
-    "flocky",
-    "flongs",
-    "flooey",
-    "flooie",
-    "floosy",
-    "floozy",
-    "florae",
-    "floras",
-    "floret",
-    "flossy",
-    "flotas",
-    "floury",
-    "flouts",
-    "fluffs",
-    "fluish",
-    "fluked",
-    "flukes",
-    "flukey",
-    "flumed",
-    "flumes",
-    "flumps",
-    "flunks",
-    "flunky",
-    "fluors",
-    "fluter",
-    "flutey",
-    "fluxed",
-    "fluyts",
-    "flyboy",
-    "flybys",
-    "flyman",
-    "flymen",
-    "flyoff",
-    "flysch",
-    "flyted",
-    "flytes",
-    "foaled",
-    "foamer",
-    "fobbed",
-    "fodgel",
-    "foehns",
-    "foeman",
-    "foemen",
-    "foetid",
-    "foetor",
-    "fogbow",
-    "fogeys",
-    "fogged",
-    "fogger",
-    "fogies",
-    "foible",
-    "foined",
-    "foison",
-    "foists",
-    "foldup",
-    "foleys",
-    "folium",
-    "folkie",
-    "folksy",
-    "folles",
-    "follis",
-    "foment",
-    "fomite",
-    "fonded",
-    "fonder",
-    "fondus",
-    "fontal",
-    "footle",
-    "footsy",
-    "foozle",
-    "fopped",
-    "forams",
-    "forbad",
-    "forbye",
-    "forcer",
-    "forded",
-    "fordid",
-    "foreby",
-    "foredo",
-    "forgat",
-    "forger",
-    "forker",
-    "formee",
-    "formes",
-    "formol",
-    "formyl",
-    "fornix",
-    "forrit",
-    "fortes",
-    "forwhy",
-    "fossae",
-    "fossas",
-    "fosses",
-    "fouler",
-    "foully",
-    "founts",
-    "foveae",
-    "foveal",
-    "foveas",
-    "fowled",
-    "foxier",
-    "foxily",
-    "foyers",
-    "fozier",
-    "fracti",
-    "fraena",
-    "frails",
-    "fraise",
-    "frappe",
-    "frazil",
-    "freers",
-    "freest",
-    "frenum",
-    "freres",
-    "fretty",
-    "friary",
-    "friers",
-    "friges",
-    "frijol",
-    "fringy",
-    "frisee",
-    "frises",
-    "frisks",
-    "frites",
-    "friths",
-    "fritts",
-    "frivol",
-    "frized",
-    "frizer",
-    "frizes",
-    "frizzy",
-    "frocks",
-    "froths",
-    "frouzy",
-    "frowst",
-    "frowsy",
-    "frowzy",
-    "frumps",
-    "frumpy",
-    "frusta",
-    "frypan",
-    "fubbed",
-    "fuckup",
-    "fucoid",
-    "fucose",
-    "fucous",
-    "fuddle",
-    "fudged",
-    "fudges",
-    "fueler",
-    "fugato",
-    "fugged",
-    "fugios",
-    "fugled",
-    "fugles",
-    "fugued",
-    "fugues",
-    "fulcra",
-    "fulgid",
-    "fullam",
-    "fulled",
-    "fulmar",
-    "fumers",
-    "fumets",
-    "fumier",
-    "fumuli",
-    "fundic",
-    "funest",
-    "fungic",
-    "funked",
-    "funker",
-    "funkia",
-    "funned",
-    "funner",
-    "furane",
-    "furfur",
-    "furled",
-    "furler",
-    "furors",
-    "furred",
-    "furzes",
-    "fusain",
-    "fusees",
-    "fusels",
-    "fusile",
-    "fusils",
-    "fussed",
-    "fusser",
-    "fusses",
-    "fustic",
-    "fusuma",
-    "futzed",
-    "futzes",
-    "fuzees",
-    "fuzils",
-    "fuzing",
-    "fuzzed",
-    "fuzzes",
-    "fylfot",
-    "fynbos",
-    "fyttes",
-    "gabbed",
-    "gabble",
-    "gabbro",
-    "gabies",
-    "gabion",
-    "gabled",
-    "gaboon",
-    "gadded",
-    "gadder",
-    "gadids",
-    "gadoid",
-    "gaeing",
-    "gaffed",
-    "gaffes",
-    "gagaku",
-    "gagers",
-    "gagger",
-    "gagman",
-    "gagmen",
-    "gainly",
-    "gainst",
-    "galago",
-    "galahs",
-    "galeae",
-    "galeas",
-    "galere",
-    "galiot",
-    "galled",
-    "galoot",
-    "galops",
-    "galosh",
-    "galyac",
-    "galyak",
-    "gamays",
-    "gambes",
-    "gambir",
-    "gambol",
-    "gamely",
-    "gamest",
-    "gamete",
-    "gamier",
-    "gamily",
-    "gamine",
-    "gamins",
-    "gammas",
-    "gammed",
-    "gammer",
-    "gamuts",
-    "ganefs",
-    "ganevs",
-    "ganged",
-    "ganger",
-    "gangly",
-    "gangue",
-    "ganjah",
-    "ganjas",
-    "gannet",
-    "ganofs",
-    "ganoid",
-    "gaoled",
-    "gaoler",
-    "gapers",
-    "garbed",
-    "garble",
-    "garcon",
-    "gardai",
-    "garget",
-    "gargle",
-    "garote",
-    "garred",
-    "garron",
-    "garths",
-    "gasbag",
-    "gascon",
-    "gashed",
-    "gasher",
-    "gashes",
-    "gasify",
-    "gaslit",
-    "gasman",
-    "gasmen",
-    "gasper",
-    "gasted",
-    "gaster",
-    "gateau",
-    "gaters",
-    "gauger",
-    "gaults",
-    "gaumed",
-    "gauzes",
-    "gavels",
-    "gavial",
-    "gavots",
-    "gawked",
-    "gawped",
-    "gawper",
-    "gawsie",
-    "gayals",
-    "gayest",
-    "gayety",
-    "gazabo",
-    "gazars",
-    "gazers",
-    "gazoos",
-    "gazump",
-    "gecked",
-    "geegaw",
-    "geeing",
-    "geeked",
-    "geests",
-    "gelada",
-    "gelant",
-    "gelate",
-    "gelati",
-    "gelcap",
-    "gelded",
-    "gelees",
-    "gelled",
-    "gemmae",
-    "gemmed",
-    "gemote",
-    "gemots",
-    "genets",
-    "genies",
-    "genips",
-    "genoas",
-    "genoms",
-    "genros",
-    "gentes",
-    "gentil",
-    "geodes",
-    "geodic",
-    "geoids",
-    "gerahs",
-    "gerent",
-    "germen",
-    "gerund",
-    "gestes",
-    "gestic",
-    "getups",
-    "gewgaw",
-    "gharri",
-    "gharry",
-    "ghauts",
-    "ghazis",
-    "gherao",
-    "ghosty",
-    "ghylls",
-    "giaour",
-    "gibbed",
-    "gibber",
-    "gibbet",
-    "gibers",
-    "gibing",
-    "giblet",
-    "giddap",
-    "gieing",
-    "giftee",
-    "gigged",
-    "giggly",
-    "giglet",
-    "giglot",
-    "gigots",
-    "gigues",
-    "gilled",
-    "giller",
-    "gillie",
-    "gimbal",
-    "gimels",
-    "gimlet",
-    "gimmal",
-    "gimmes",
-    "gimmie",
-    "gimped",
-    "gingal",
-    "ginned",
-    "ginner",
-    "gipons",
-    "gipped",
-    "gipper",
-    "girded",
-    "girned",
-    "girons",
-    "girted",
-    "girths",
-    "gismos",
-    "gitano",
-    "gitted",
-    "gittin",
-    "glaces",
-    "glacis",
-    "glaire",
-    "glairs",
-    "glairy",
-    "glaive",
-    "glares",
-    "gleams",
-    "gleamy",
-    "gleans",
-    "glebae",
-    "glebes",
-    "gledes",
-    "gleeds",
-    "gleeks",
-    "gleets",
-    "gleety",
-    "glegly",
-    "gleyed",
-    "glibly",
-    "gliffs",
-    "glimed",
-    "glimes",
-    "glints",
-    "glinty",
-    "gloams",
-    "gloats",
-    "globby",
-    "globed",
-    "gloggs",
-    "glomus",
-    "glooms",
-    "gloppy",
-    "glossa",
-    "glosts",
-    "glouts",
-    "glower",
-    "glozed",
-    "glozes",
-    "gluers",
-    "gluier",
-    "gluily",
-    "glumes",
-    "glumly",
-    "glumpy",
-    "glunch",
-    "glutei",
-    "glutes",
-    "glycan",
-    "glycin",
-    "glycyl",
-    "gnarls",
-    "gnarrs",
-    "gnatty",
-    "gnawed",
-    "gnawer",
-    "gnomic",
-    "gnomon",
-    "gnoses",
-    "goaded",
-    "goaled",
-    "goanna",
-    "gobang",
-    "gobans",
-    "gobbed",
-    "gobbet",
-    "gobies",
-    "goboes",
-    "gobony",
-    "goddam",
-    "godded",
-    "godets",
-    "godown",
-    "godson",
-    "godwit",
-    "gofers",
-    "goffer",
-    "goggly",
-    "goglet",
-    "goitre",
-    "golems",
-    "golfed",
-    "golosh",
-    "gombos",
-    "gomers",
-    "gomuti",
-    "gonefs",
-    "goners",
-    "gonged",
-    "goniff",
-    "gonifs",
-    "gonion",
-    "gonium",
-    "gonofs",
-    "gonoph",
-    "goodby",
-    "goofed",
-    "gooier",
-    "gooney",
-    "goonie",
-    "gooral",
-    "goosed",
-    "gooses",
-    "goosey",
-    "gorals",
-    "gorged",
-    "gorger",
-    "gorget",
-    "gorhen",
-    "gorier",
-    "gorily",
-    "gormed",
-    "gorses",
-    "gossan",
-    "gouged",
-    "gouger",
-    "gouges",
-    "gowans",
-    "gowany",
-    "gowned",
-    "goyish",
-    "graals",
-    "grabby",
-    "graben",
-    "gradin",
-    "gradus",
-    "grails",
-    "gramas",
-    "granum",
-    "grapey",
-    "graved",
-    "gravid",
-    "grayer",
-    "grayly",
-    "grazer",
-    "grazes",
-    "greave",
-    "grebes",
-    "greeds",
-    "greeny",
-    "gregos",
-    "greige",
-    "gremmy",
-    "greyer",
-    "greyly",
-    "grided",
-    "grides",
-    "griefs",
-    "griffe",
-    "griffs",
-    "grifts",
-    "grigri",
-    "grilse",
-    "grimed",
-    "gringa",
-    "griots",
-    "griped",
-    "griper",
-    "gripey",
-    "grippe",
-    "grippy",
-    "grison",
-    "grists",
-    "griths",
-    "grivet",
-    "groats",
-    "groins",
-    "groper",
-    "gropes",
-    "grosze",
-    "groszy",
-    "grotty",
-    "grouts",
-    "grouty",
-    "groved",
-    "grovel",
-    "growly",
-    "groyne",
-    "gruels",
-    "gruffs",
-    "gruffy",
-    "grugru",
-    "grumes",
-    "grumps",
-    "grutch",
-    "guacos",
-    "guaiac",
-    "guanay",
-    "guanin",
-    "guanos",
-    "guavas",
-    "guenon",
-    "guffaw",
-    "guggle",
-    "guglet",
-    "guidon",
-    "guiled",
-    "guiles",
-    "guilts",
-    "guimpe",
-    "guiros",
-    "guised",
-    "gulags",
-    "gulden",
-    "gulfed",
-    "gulled",
-    "gulper",
-    "gumbos",
-    "gummas",
-    "gummed",
-    "gummer",
-    "gundog",
-    "gunite",
-    "gunnel",
-    "gunnen",
-    "gunsel",
-    "gurged",
-    "gurges",
-    "gurgle",
-    "gurnet",
-    "gushes",
-    "gussie",
-    "gusted",
-    "guttae",
-    "guttle",
-    "guying",
-    "guyots",
-    "guzzle",
-    "gweduc",
-    "gybing",
-    "gyozas",
-    "gypped",
-    "gypper",
-    "gyrase",
-    "gyrate",
-    "gyrene",
-    "gyring",
-    "gyrons",
-    "gyrose",
-    "gyttja",
-    "gyving",
-    "habile",
-    "haboob",
-    "haceks",
-    "hackee",
-    "hackie",
-    "hackle",
-    "hackly",
-    "hading",
-    "hadjee",
-    "hadjes",
-    "hadjis",
-    "haeing",
-    "haemal",
-    "haemic",
-    "haemin",
-    "haeres",
-    "haffet",
-    "haffit",
-    "hafted",
-    "hafter",
-    "hagbut",
-    "hagdon",
-    "hagged",
-    "haikus",
-    "hailer",
-    "haints",
-    "hajjes",
-    "hajjis",
-    "hakims",
-    "halala",
-    "halals",
-    "halers",
-    "haleru",
-    "halest",
-    "halids",
-    "haling",
-    "halite",
-    "hallah",
-    "hallal",
-    "hallel",
-    "halloa",
-    "halloo",
-    "hallos",
-    "hallot",
-    "hallux",
-    "halmas",
-    "haloed",
-    "haloes",
-    "haloid",
-    "halons",
-    "halutz",
-    "halvah",
-    "halvas",
-    "hamals",
-    "hamate",
-    "hamaul",
-    "hammal",
-    "hammam",
-    "hammed",
-    "hamuli",
-    "hamzah",
-    "hamzas",
-    "hances",
-    "handax",
-    "haniwa",
-    "hanked",
-    "hanker",
-    "hankie",
-    "hansas",
-    "hanses",
-    "hansom",
-    "hanted",
-    "hantle",
-    "haoles",
-    "happed",
-    "hapten",
-    "hareem",
-    "harems",
-    "harked",
-    "harmin",
-    "harped",
-    "harpin",
-    "hartal",
-    "haslet",
-    "hasped",
-    "hasted",
-    "hastes",
-    "hatbox",
-    "hatful",
-    "hatpin",
-    "hatted",
-    "haughs",
-    "haulms",
-    "haulmy",
-    "haunch",
-    "hausen",
-    "havers",
-    "havior",
-    "havocs",
-    "hawala",
-    "hawing",
-    "hawked",
-    "hawkey",
-    "hawkie",
-    "hawser",
-    "hawses",
-    "hayers",
-    "haying",
-    "haymow",
-    "hazans",
-    "hazels",
-    "hazers",
-    "hazier",
-    "hazily",
-    "hazzan",
-    "heaper",
-    "heaths",
-    "heathy",
-    "heaume",
-    "heaver",
-    "heaves",
-    "heckle",
-    "heddle",
-    "heders",
-    "hedger",
-    "heeder",
-    "heehaw",
-    "heeler",
-    "heezed",
-    "heezes",
-    "hefted",
-    "hefter",
-    "hegari",
-    "hegira",
-    "heiled",
-    "heinie",
-    "heired",
-    "heishi",
-    "heists",
-    "hejira",
-    "heliac",
-    "helled",
-    "helmed",
-    "helots",
-    "helved",
-    "helves",
-    "hemins",
-    "hemoid",
-    "hempen",
-    "hempie",
-    "henbit",
-    "henges",
-    "hennas",
-    "henrys",
-    "hented",
-    "hepcat",
-    "hepper",
-    "heptad",
-    "herdic",
-    "hereat",
-    "hereon",
-    "hermae",
-    "hermai",
-    "hetman",
-    "heuchs",
-    "heughs",
-    "hewers",
-    "hewing",
-    "hexade",
-    "hexads",
-    "hexers",
-    "hexing",
-    "hexone",
-    "hexose",
-    "hexyls",
-    "heydey",
-    "hickie",
-    "hiders",
-    "hieing",
-    "hiemal",
-    "higgle",
-    "highth",
-    "hights",
-    "hijabs",
-    "hijrah",
-    "hijras",
-    "hilled",
-    "hilloa",
-    "hillos",
-    "hilted",
-    "hinger",
-    "hipped",
-    "hipper",
-    "hirees",
-    "hirers",
-    "hirple",
-    "hirsel",
-    "hirsle",
-    "hispid",
-    "hisser",
-    "hisses",
-    "histed",
-    "hiving",
-    "hoagie",
-    "hoaxed",
-    "hoaxer",
-    "hobbed",
-    "hobber",
-    "hobnob",
-    "hoboed",
-    "hoboes",
-    "hocked",
-    "hocker",
-    "hodads",
-    "hodden",
-    "hoddin",
-    "hoeing",
-    "hogans",
-    "hogged",
-    "hogger",
-    "hogget",
-    "hognut",
-    "hogtie",
-    "hoicks",
-    "hoiden",
-    "hoised",
-    "hoises",
-    "hokier",
-    "hokily",
-    "hoking",
-    "hokums",
-    "holard",
-    "holies",
-    "holily",
-    "holing",
-    "holism",
-    "holist",
-    "holked",
-    "hollas",
-    "holloa",
-    "holloo",
-    "hollos",
-    "holmic",
-    "holpen",
-    "homeys",
-    "homier",
-    "hominy",
-    "hommos",
-    "honans",
-    "hondle",
-    "honers",
-    "honied",
-    "honked",
-    "honker",
-    "honkey",
-    "honkie",
-    "hooeys",
-    "hoofed",
-    "hoofer",
-    "hookas",
-    "hookey",
-    "hoolie",
-    "hooped",
-    "hoopoe",
-    "hoopoo",
-    "hoorah",
-    "hootch",
-    "hooted",
-    "hooved",
-    "hopers",
-    "hopple",
-    "horahs",
-    "horary",
-    "horded",
-    "horsed",
-    "horste",
-    "horsts",
-    "hosels",
-    "hosers",
-    "hoseys",
-    "hosier",
-    "hostly",
-    "hotted",
-    "houdah",
-    "houris",
-    "housel",
-    "hovels",
-    "howdah",
-    "howdie",
-    "howffs",
-    "howked",
-    "howlet",
-    "hoyden",
-    "hoyles",
-    "hryvna",
-    "hubbly",
-    "huckle",
-    "huffed",
-    "hugest",
-    "huipil",
-    "hulked",
-    "hulled",
-    "huller",
-    "hulloa",
-    "hulloo",
-    "hullos",
-    "humate",
-    "humeri",
-    "hummed",
-    "humors",
-    "humped",
-    "humper",
-    "humphs",
-    "hunker",
-    "hunkey",
-    "hunkie",
-    "huppah",
-    "hurler",
-    "hursts",
-    "hurter",
-    "hurtle",
-    "hushes",
-    "husked",
-    "hussar",
-    "hutted",
-    "hutzpa",
-    "huzzas",
-    "hyaena",
-    "hyalin",
-    "hybris",
-    "hydrae",
-    "hydras",
-    "hydria",
-    "hydric",
-    "hydrid",
-    "hydros",
-    "hyenic",
-    "hyetal",
-    "hymens",
-    "hymned",
-    "hyoids",
-    "hypers",
-    "hyphal",
-    "hyping",
-    "hypnic",
-    "hypoed",
-    "hysons",
-    "iambus",
-    "iatric",
-    "ibexes",
-    "ibices",
-    "ibidem",
-    "ibises",
-    "icecap",
-    "icemen",
-    "ichors",
-    "iciest",
-    "icings",
-    "ickers",
-    "ickier",
-    "ickily",
-    "icones",
-    "ideate",
-    "idlers",
-    "idlest",
-    "idylls",
-    "iffier",
-    "igging",
-    "igloos",
-    "ignify",
-    "ihrams",
-    "ilexes",
-    "iliads",
-    "illest",
-    "illite",
-    "illude",
-    "illume",
-    "imagos",
-    "imaret",
-    "imaums",
-    "imbalm",
-    "imbark",
-    "imbeds",
-    "imbibe",
-    "imbody",
-    "imbrue",
-    "imbues",
-    "imides",
-    "imidic",
-    "imines",
-    "immane",
-    "immesh",
-    "immies",
-    "immure",
-    "impale",
-    "impark",
-    "impawn",
-    "impels",
-    "impend",
-    "imphee",
-    "imping",
-    "impish",
-    "impled",
-    "impone",
-    "impost",
-    "impugn",
-    "inaner",
-    "inanes",
-    "inarch",
-    "inarms",
-    "incage",
-    "incant",
-    "incent",
-    "incept",
-    "incher",
-    "incise",
-    "inclip",
-    "incogs",
-    "incony",
-    "incubi",
-    "incult",
-    "incuse",
-    "indaba",
-    "indene",
-    "indign",
-    "indite",
-    "indols",
-    "indows",
-    "indris",
-    "indued",
-    "indues",
-    "indult",
-    "inerts",
-    "infall",
-    "infare",
-    "infold",
-    "ingate",
-    "ingulf",
-    "inhaul",
-    "inhere",
-    "inhume",
-    "inions",
-    "inkers",
-    "inkier",
-    "inkles",
-    "inkpot",
-    "inlace",
-    "inlier",
-    "inmesh",
-    "inmost",
-    "innage",
-    "inners",
-    "inpour",
-    "inroad",
-    "inruns",
-    "inrush",
-    "insoul",
-    "inspan",
-    "instil",
-    "inters",
-    "intime",
-    "intine",
-    "intomb",
-    "intone",
-    "intort",
-    "intown",
-    "inturn",
-    "inulin",
-    "inured",
-    "inures",
-    "inurns",
-    "invars",
-    "inwall",
-    "inwind",
-    "inwove",
-    "inwrap",
-    "iodate",
-    "iodids",
-    "iodins",
-    "iodise",
-    "iodism",
-    "iodize",
-    "iodous",
-    "ionics",
-    "ionise",
-    "ionium",
-    "ionize",
-    "ionone",
-    "irades",
-    "irater",
-    "ireful",
-    "irenic",
-    "irides",
-    "iridic",
-    "irised",
-    "iritic",
-    "iritis",
-    "irking",
-    "irokos",
-    "ironer",
-    "irones",
-    "irreal",
-    "irrupt",
-    "isatin",
-    "isling",
-    "isobar",
-    "isogon",
-    "isohel",
-    "isolog",
-    "isopod",
-    "isseis",
-    "isthmi",
-    "istles",
-    "itched",
-    "itches",
-    "itemed",
-    "iterum",
-    "ixodid",
-    "ixoras",
-    "ixtles",
-    "jabbed",
-    "jabiru",
-    "jabots",
-    "jacals",
-    "jacana",
-    "jacker",
-    "jading",
-    "jadish",
-    "jagers",
-    "jagras",
-    "jailor",
-    "jalaps",
-    "jalops",
-    "jalopy",
-    "jambed",
-    "jambes",
-    "jangle",
-    "jangly",
-    "japans",
-    "japers",
-    "japery",
-    "japing",
-    "jarful",
-    "jarina",
-    "jarvey",
-    "jassid",
-    "jauked",
-    "jaunce",
-    "jaunts",
-    "jauped",
-    "jawans",
-    "jawing",
-    "jaygee",
-    "jayvee",
-    "jazzbo",
-    "jazzed",
-    "jazzer",
-    "jazzes",
-    "jeaned",
-    "jebels",
-    "jeeing",
-    "jeeped",
-    "jeered",
-    "jeerer",
-    "jehads",
-    "jejuna",
-    "jejune",
-    "jelled",
-    "jellos",
-    "jennet",
-    "jerboa",
-    "jereed",
-    "jerids",
-    "jerker",
-    "jerkin",
-    "jerrid",
-    "jessed",
-    "jesses",
-    "jested",
-    "jetlag",
-    "jetons",
-    "jetsam",
-    "jetsom",
-    "jetton",
-    "jewing",
-    "jezail",
-    "jibbed",
-    "jibber",
-    "jibers",
-    "jibing",
-    "jicama",
-    "jigged",
-    "jigger",
-    "jiggly",
-    "jihads",
-    "jilter",
-    "jiminy",
-    "jimper",
-    "jimply",
-    "jingal",
-    "jingko",
-    "jingly",
-    "jinked",
-    "jinker",
-    "jinnee",
-    "jinnis",
-    "jinxed",
-    "jinxes",
-    "jitney",
-    "jivers",
-    "jivier",
-    "jiving",
-    "jnanas",
-    "jobbed",
-    "jockos",
-    "jocose",
-    "jocund",
-    "jogged",
-    "joggle",
-    "jokier",
-    "jokily",
-    "jolter",
-    "jorams",
-    "jorums",
-    "joshed",
-    "josher",
-    "joshes",
-    "josses",
-    "jostle",
-    "jotted",
-    "jotter",
-    "jouals",
-    "jouked",
-    "jounce",
-    "jouncy",
-    "journo",
-    "jousts",
-    "jowars",
-    "jowing",
-    "jowled",
-    "joying",
-    "joypop",
-    "jubbah",
-    "jubhah",
-    "jubile",
-    "judder",
-    "judger",
-    "judoka",
-    "jugate",
-    "jugful",
-    "jugged",
-    "jugula",
-    "jugums",
-    "jujube",
-    "juking",
-    "juleps",
-    "jumbal",
-    "jumbos",
-    "juncos",
-    "jungly",
-    "junked",
-    "juntas",
-    "juntos",
-    "jupons",
-    "jurant",
-    "jurats",
-    "jurels",
-    "justed",
-    "justle",
-    "jutted",
-    "kababs",
-    "kabaka",
-    "kabala",
-    "kabars",
-    "kabaya",
-    "kabiki",
-    "kaffir",
-    "kafirs",
-    "kaftan",
-    "kaiaks",
-    "kainit",
-    "kakapo",
-    "kalams",
-    "kalian",
-    "kalifs",
-    "kaliph",
-    "kalium",
-    "kalmia",
-    "kalong",
-    "kalpac",
-    "kalpak",
-    "kalpas",
-    "kamiks",
-    "kamsin",
-    "kanaka",
-    "kanban",
-    "kanjis",
-    "kantar",
-    "kanzus",
-    "kaonic",
-    "kapoks",
-    "kappas",
-    "kaputt",
-    "karmas",
-    "karoos",
-    "kaross",
-    "karroo",
-    "karsts",
-    "kasbah",
-    "kashas",
-    "kasher",
-    "kation",
-    "kauris",
-    "kavass",
-    "kayles",
-    "kayoed",
-    "kayoes",
-    "kazoos",
-    "kebars",
-    "kebbie",
-    "keblah",
-    "kebobs",
-    "kecked",
-    "keckle",
-    "keddah",
-    "kedged",
-    "kedges",
-    "keeked",
-    "keeled",
-    "keened",
-    "keeves",
-    "kefirs",
-    "kegged",
-    "kegger",
-    "kegler",
-    "keleps",
-    "kelims",
-    "keloid",
-    "kelped",
-    "kelpie",
-    "kelson",
-    "kelter",
-    "kenafs",
-    "kendos",
-    "kenned",
-    "kentes",
-    "kepped",
-    "keppen",
-    "kerbed",
-    "kerfed",
-    "kermes",
-    "kermis",
-    "kerned",
-    "kernes",
-    "kerria",
-    "ketene",
-    "ketols",
-    "ketose",
-    "kevels",
-    "kevils",
-    "kewpie",
-    "keypal",
-    "keyset",
-    "keyway",
-    "khadis",
-    "khalif",
-    "khaphs",
-    "khazen",
-    "khedah",
-    "khedas",
-    "kheths",
-    "khoums",
-    "kiangs",
-    "kiaugh",
-    "kibbeh",
-    "kibbes",
-    "kibbis",
-    "kibeis",
-    "kibitz",
-    "kiblah",
-    "kiblas",
-    "kibosh",
-    "kickup",
-    "kidded",
-    "kiddos",
-    "kidvid",
-    "killie",
-    "kilned",
-    "kilted",
-    "kiltie",
-    "kinara",
-    "kinema",
-    "kinged",
-    "kinins",
-    "kinked",
-    "kipped",
-    "kippen",
-    "kirned",
-    "kirtle",
-    "kishka",
-    "kishke",
-    "kismat",
-    "kiters",
-    "kithed",
-    "kithes",
-    "kitted",
-    "kittel",
-    "kittle",
-    "klatch",
-    "klaxon",
-    "klepht",
-    "klepto",
-    "klicks",
-    "klongs",
-    "kloofs",
-    "kludgy",
-    "kluged",
-    "kluges",
-    "klutzy",
-    "knarry",
-    "knaurs",
-    "knaves",
-    "knawel",
-    "knawes",
-    "kneads",
-    "knells",
-    "knifed",
-    "knifer",
-    "knobby",
-    "knolly",
-    "knosps",
-    "knouts",
-    "knower",
-    "knowns",
-    "knubby",
-    "knurls",
-    "knurly",
-    "koines",
-    "kolhoz",
-    "kolkoz",
-    "kombus",
-    "konked",
-    "koodoo",
-    "kookie",
-    "kopeck",
-    "kopeks",
-    "kopjes",
-    "koppas",
-    "koppie",
-    "korats",
-    "kormas",
-    "kotows",
-    "koumis",
-    "koumys",
-    "kouroi",
-    "kousso",
-    "kowtow",
-    "kraals",
-    "krafts",
-    "kraits",
-    "kraken",
-    "krater",
-    "krauts",
-    "kreeps",
-    "krewes",
-    "krills",
-    "krises",
-    "kronen",
-    "kronur",
-    "krooni",
-    "kroons",
-    "krubis",
-    "krubut",
-    "kuchen",
-    "kudzus",
-    "kugels",
-    "kukris",
-    "kulaki",
-    "kulaks",
-    "kumiss",
-    "kummel",
-    "kurgan",
-    "kurtas",
-    "kussos",
-    "kuvasz",
-    "kvases",
-    "kvells",
-    "kvetch",
-    "kyacks",
-    "kybosh",
-    "kyries",
-    "kythed",
-    "kythes",
-    "laager",
-    "labara",
-    "labium",
-    "labrum",
-    "lacers",
-    "laches",
-    "lacier",
-    "lacily",
-    "lacker",
-    "lacune",
-    "ladens",
-    "laders",
-    "ladino",
-    "ladled",
-    "ladler",
-    "ladron",
-    "lagans",
-    "lagend",
-    "lagers",
-    "lagger",
-    "lagune",
-    "lahars",
-    "laical",
-    "laichs",
-    "laighs",
-    "lairds",
-    "laired",
-    "lakier",
-    "laking",
-    "lallan",
-    "lalled",
-    "lambed",
-    "lamber",
-    "lambie",
-    "lamedh",
-    "lameds",
-    "lamely",
-    "lamest",
-    "lamiae",
-    "lamias",
-    "laming",
-    "lammed",
-    "lampad",
-    "lampas",
-    "lamped",
-    "lanais",
-    "lanate",
-    "lanced",
-    "lanely",
-    "langur",
-    "lanker",
-    "lankly",
-    "lanose",
-    "lanugo",
-    "laogai",
-    "lapdog",
-    "lapels",
-    "lapful",
-    "lapins",
-    "lapper",
-    "lappet",
-    "lapser",
-    "lapsus",
-    "larded",
-    "lardon",
-    "larees",
-    "larges",
-    "larine",
-    "larked",
-    "larker",
-    "larrup",
-    "larums",
-    "larvas",
-    "lascar",
-    "lasing",
-    "lassis",
-    "lassos",
-    "laster",
-    "lateen",
-    "latens",
-    "lathed",
-    "lathis",
-    "latigo",
-    "latish",
-    "latkes",
-    "latria",
-    "latten",
-    "lattin",
-    "lauans",
-    "launce",
-    "laurae",
-    "lauras",
-    "lavabo",
-    "lavash",
-    "laveer",
-    "lavers",
-    "laving",
-    "lawine",
-    "lawing",
-    "lawmen",
-    "laxest",
-    "layins",
-    "layups",
-    "lazars",
-    "lazied",
-    "lazier",
-    "lazies",
-    "lazing",
-    "leachy",
-    "leaker",
-    "leally",
-    "lealty",
-    "leanly",
-    "leaper",
-    "leaser",
-    "leasts",
-    "lebens",
-    "leched",
-    "lecher",
-    "leches",
-    "lechwe",
-    "leered",
-    "lefter",
-    "legate",
-    "legers",
-    "leggin",
-    "legist",
-    "legits",
-    "legman",
-    "legmen",
-    "legong",
-    "lehuas",
-    "lekked",
-    "lekvar",
-    "lenite",
-    "lenity",
-    "lensed",
-    "lentic",
-    "lentos",
-    "leones",
-    "lethes",
-    "letted",
-    "letups",
-    "leucin",
-    "leudes",
-    "leukon",
-    "leveed",
-    "levier",
-    "levins",
-    "lewder",
-    "lewdly",
-    "lexeme",
-    "lexica",
-    "lezzes",
-    "lezzie",
-    "lianas",
-    "lianes",
-    "liangs",
-    "liards",
-    "libber",
-    "libels",
-    "libers",
-    "liblab",
-    "librae",
-    "libras",
-    "lichee",
-    "liches",
-    "lichis",
-    "lichts",
-    "lictor",
-    "lidars",
-    "liefer",
-    "liefly",
-    "lieges",
-    "lienal",
-    "lierne",
-    "liever",
-    "ligans",
-    "ligate",
-    "ligers",
-    "lignan",
-    "ligula",
-    "ligule",
-    "likers",
-    "likest",
-    "likuta",
-    "lilied",
-    "lilted",
-    "limans",
-    "limbas",
-    "limbed",
-    "limbos",
-    "limbus",
-    "limens",
-    "limeys",
-    "limier",
-    "limina",
-    "limmer",
-    "limned",
-    "limner",
-    "limnic",
-    "limpas",
-    "limper",
-    "limpet",
-    "limpid",
-    "limply",
-    "limpsy",
-    "limuli",
-    "linacs",
-    "linage",
-    "lineny",
-    "lingam",
-    "lingas",
-    "linier",
-    "linins",
-    "linted",
-    "lintel",
-    "linter",
-    "lintol",
-    "linums",
-    "lipide",
-    "lipins",
-    "lipoid",
-    "lipoma",
-    "lippen",
-    "liroth",
-    "lisles",
-    "lisped",
-    "lisper",
-    "lissom",
-    "listee",
-    "listel",
-    "litchi",
-    "lither",
-    "lithic",
-    "lithos",
-    "litten",
-    "livens",
-    "livest",
-    "livier",
-    "livyer",
-    "llanos",
-    "loafed",
-    "loamed",
-    "lobate",
-    "lobbed",
-    "lobber",
-    "lobule",
-    "lochan",
-    "lochia",
-    "locoed",
-    "locoes",
-    "locule",
-    "loculi",
-    "locums",
-    "lodens",
-    "lofted",
-    "lofter",
-    "logans",
-    "loggie",
-    "logier",
-    "logily",
-    "logion",
-    "logons",
-    "logway",
-    "loided",
-    "loiter",
-    "lolled",
-    "loller",
-    "lollop",
-    "lomein",
-    "loment",
-    "loners",
-    "longan",
-    "longes",
-    "longly",
-    "looeys",
-    "loofah",
-    "loofas",
-    "looies",
-    "looing",
-    "loonie",
-    "looter",
-    "lopers",
-    "loping",
-    "lopped",
-    "lopper",
-    "loquat",
-    "lorans",
-    "lorded",
-    "lordly",
-    "lorica",
-    "lories",
-    "losels",
-    "lotahs",
-    "lotted",
-    "lotter",
-    "lottes",
-    "lottos",
-    "louche",
-    "louden",
-    "loughs",
-    "louies",
-    "loumas",
-    "loungy",
-    "louped",
-    "loupen",
-    "loupes",
-    "loured",
-    "loused",
-    "louses",
-    "louted",
-    "lovage",
-    "lovats",
-    "lowboy",
-    "lowish",
-    "loxing",
-    "lubber",
-    "lubing",
-    "lubric",
-    "lucern",
-    "lucked",
-    "luckie",
-    "lucres",
-    "luetic",
-    "luffas",
-    "luffed",
-    "lugers",
-    "lugged",
-    "lugger",
-    "luggie",
-    "luging",
-    "luller",
-    "lummox",
-    "lumpen",
-    "lumper",
-    "lunars",
-    "lunate",
-    "lunets",
-    "lungan",
-    "lungee",
-    "lunger",
-    "lungis",
-    "lungyi",
-    "lunier",
-    "lunies",
-    "lunker",
-    "lunted",
-    "lunula",
-    "lunule",
-    "lupins",
-    "lupous",
-    "lurdan",
-    "lurers",
-    "lushed",
-    "lusher",
-    "lushes",
-    "lushly",
-    "lusted",
-    "lustra",
-    "luteum",
-    "luting",
-    "lutist",
-    "lutzes",
-    "luxate",
-    "lyases",
-    "lycees",
-    "lyches",
-    "lycras",
-    "lyings",
-    "lymphs",
-    "lynxes",
-    "lyrate",
-    "lyrism",
-    "lyrist",
-    "lysing",
-    "lysins",
-    "lyssas",
-    "lyttae",
-    "lyttas",
-    "macaco",
-    "macers",
-    "maches",
-    "machos",
-    "macing",
-    "mackle",
-    "macled",
-    "macles",
-    "macons",
-    "macron",
-    "macule",
-    "madams",
-    "madded",
-    "madres",
-    "madtom",
-    "maenad",
-    "maffia",
-    "mafias",
-    "maftir",
-    "magian",
-    "magics",
-    "magilp",
-    "magmas",
-    "magots",
-    "maguey",
-    "mahoes",
-    "mahout",
-    "mahzor",
-    "maigre",
-    "maihem",
-    "mailes",
-    "maills",
-    "maimer",
-    "maists",
-    "maizes",
-    "makars",
-    "makuta",
-    "malars",
-    "malfed",
-    "malgre",
-    "maline",
-    "malled",
-    "mallei",
-    "maloti",
-    "maltha",
-    "maltol",
-    "mambas",
-    "mambos",
-    "mameys",
-    "mamies",
-    "mamluk",
-    "mammae",
-    "mammas",
-    "mammee",
-    "mammer",
-    "mammet",
-    "mammey",
-    "mammie",
-    "mamzer",
-    "manats",
-    "manege",
-    "manful",
-    "mangel",
-    "manges",
-    "mangey",
-    "mangos",
-    "manias",
-    "manics",
-    "manioc",
-    "manito",
-    "manitu",
-    "mannan",
-    "mannas",
-    "manque",
-    "manses",
-    "mantas",
-    "mantes",
-    "mantic",
-    "mantid",
-    "maquis",
-    "maraca",
-    "maraud",
-    "marbly",
-    "margay",
-    "marges",
-    "marish",
-    "markas",
-    "marled",
-    "marram",
-    "marrer",
-    "marses",
-    "marted",
-    "mascon",
-    "masers",
-    "mashes",
-    "mashie",
-    "maskeg",
-    "masker",
-    "massas",
-    "masted",
-    "mastix",
-    "maters",
-    "mateys",
-    "matier",
-    "matins",
-    "matres",
-    "matsah",
-    "mattin",
-    "matzah",
-    "matzas",
-    "matzoh",
-    "matzos",
-    "matzot",
-    "mauger",
-    "maugre",
-    "mauler",
-    "maumet",
-    "maunds",
-    "maundy",
-    "mauves",
-    "mavens",
-    "mavies",
-    "mavins",
-    "mawing",
-    "maxing",
-    "maxixe",
-    "maybes",
-    "mayfly",
-    "mayhap",
-    "maying",
-    "maypop",
-    "mayvin",
-    "mazard",
-    "mazers",
-    "mazier",
-    "mazily",
-    "mazing",
-    "mazuma",
-    "mbiras",
-    "mealie",
-    "meanie",
-    "meanly",
-    "measle",
-    "meatal",
-    "meated",
-    "meatus",
-    "meccas",
-    "medaka",
-    "medfly",
-    "mediad",
-    "mediae",
-    "medick",
-    "medius",
-    "medlar",
-    "meeter",
-    "meetly",
-    "megara",
-    "megass",
-    "megilp",
-    "megohm",
-    "megrim",
-    "meikle",
-    "meinie",
-    "melded",
-    "melder",
-    "melees",
-    "melena",
-    "melled",
-    "meloid",
-    "melter",
-    "menads",
-    "mender",
-    "meninx",
-    "mensae",
-    "mensal",
-    "mensas",
-    "mensed",
-    "mentum",
-    "menudo",
-    "meoued",
-    "meowed",
-    "merces",
-    "merdes",
-    "merest",
-    "mergee",
-    "merles",
-    "merlon",
-    "mermen",
-    "mescal",
-    "mesial",
-    "mesian",
-    "mesnes",
-    "messan",
-    "mestee",
-    "metage",
-    "metate",
-    "metepa",
-    "metier",
-    "meting",
-    "metols",
-    "metope",
-    "metred",
-    "metump",
-    "mewing",
-    "mewled",
-    "mewler",
-    "mezcal",
-    "mezuza",
-    "mezzos",
-    "miaous",
-    "miaows",
-    "miasma",
-    "miasms",
-    "miauls",
-    "micell",
-    "miched",
-    "miches",
-    "mickle",
-    "midges",
-    "midgut",
-    "midleg",
-    "midrib",
-    "midsts",
-    "miggle",
-    "mights",
-    "mihrab",
-    "miking",
-    "mikron",
-    "mikvah",
-    "mikveh",
-    "mikvos",
-    "mikvot",
-    "miladi",
-    "milded",
-    "milden",
-    "milers",
-    "milium",
-    "milker",
-    "milles",
-    "milneb",
-    "milord",
-    "milpas",
-    "milted",
-    "mimbar",
-    "mimeos",
-    "mimers",
-    "miming",
-    "mincer",
-    "minces",
-    "minify",
-    "minims",
-    "minium",
-    "minkes",
-    "minxes",
-    "mioses",
-    "miosis",
-    "miotic",
-    "mirier",
-    "miring",
-    "mirins",
-    "mirker",
-    "mirths",
-    "mirzas",
-    "misact",
-    "misadd",
-    "misaim",
-    "misate",
-    "miscue",
-    "miscut",
-    "misdid",
-    "miseat",
-    "misers",
-    "misfed",
-    "mishit",
-    "miskal",
-    "mislay",
-    "mislie",
-    "mislit",
-    "mismet",
-    "mispen",
-    "missay",
-    "missel",
-    "misset",
-    "missis",
-    "misted",
-    "miters",
-    "mither",
-    "mitier",
-    "mitred",
-    "mitres",
-    "mixups",
-    "mizens",
-    "mizuna",
-    "mizzen",
-    "mizzle",
-    "mizzly",
-    "moaner",
-    "moated",
-    "mobbed",
-    "mobber",
-    "mobcap",
-    "mobled",
-    "mochas",
-    "mocker",
-    "modals",
-    "modica",
-    "modish",
-    "moggie",
-    "moghul",
-    "mohels",
-    "mohurs",
-    "moiled",
-    "moiler",
-    "moirai",
-    "moires",
-    "mojoes",
-    "molder",
-    "molies",
-    "mollah",
-    "moloch",
-    "molted",
-    "molter",
-    "momism",
-    "momser",
-    "momzer",
-    "monads",
-    "mondes",
-    "mondos",
-    "mongoe",
-    "mongos",
-    "mongst",
-    "monied",
-    "monish",
-    "monism",
-    "monist",
-    "monody",
-    "mooing",
-    "moolah",
-    "moolas",
-    "mooley",
-    "mooned",
-    "mooner",
-    "mooter",
-    "mopers",
-    "mopery",
-    "mopier",
-    "moping",
-    "mopish",
-    "mopoke",
-    "mopped",
-    "mopper",
-    "moppet",
-    "morays",
-    "moreen",
-    "morels",
-    "morion",
-    "morros",
-    "morula",
-    "moseys",
-    "moshav",
-    "moshed",
-    "moshes",
-    "mossed",
-    "mosser",
-    "motets",
-    "motmot",
-    "mottes",
-    "mottle",
-    "mottos",
-    "moujik",
-    "mouldy",
-    "moults",
-    "moused",
-    "mouses",
-    "mousey",
-    "mouthy",
-    "moxies",
-    "muches",
-    "muchly",
-    "mucins",
-    "mucked",
-    "mucker",
-    "muckle",
-    "mucluc",
-    "mucoid",
-    "mucors",
-    "mucose",
-    "mudbug",
-    "mudcap",
-    "mudcat",
-    "mudded",
-    "mudder",
-    "muddly",
-    "mudhen",
-    "mudras",
-    "muffed",
-    "muffle",
-    "muftis",
-    "mugful",
-    "muggar",
-    "muggee",
-    "muggur",
-    "mujiks",
-    "mukluk",
-    "muktuk",
-    "mulcts",
-    "muleta",
-    "muleys",
-    "muling",
-    "mulish",
-    "mullas",
-    "mulley",
-    "mumbly",
-    "mummed",
-    "mumped",
-    "mumper",
-    "mungos",
-    "muntin",
-    "muonic",
-    "murein",
-    "murids",
-    "muring",
-    "murker",
-    "murkly",
-    "murras",
-    "murres",
-    "murrey",
-    "murrha",
-    "muscae",
-    "muscid",
-    "muscly",
-    "musers",
-    "mushed",
-    "musher",
-    "mushes",
-    "musjid",
-    "muskeg",
-    "muskit",
-    "muskox",
-    "mussed",
-    "musses",
-    "musted",
-    "mustee",
-    "musths",
-    "mutase",
-    "mutely",
-    "mutest",
-    "mutine",
-    "mutism",
-    "mutons",
-    "mutule",
-    "muumuu",
-    "muzhik",
-    "muzjik",
-    "myases",
-    "myasis",
-    "mycele",
-    "mylars",
-    "mynahs",
-    "myomas",
-    "myopes",
-    "myoses",
-    "myosis",
-    "myotic",
-    "myrica",
-    "myrrhs",
-    "mysids",
-    "mysost",
-    "mythoi",
-    "myxoid",
-    "myxoma",
-    "nabber",
-    "nabobs",
-    "nachas",
-    "naches",
-    "nacred",
-    "nacres",
-    "nadirs",
-    "naevus",
-    "naffed",
-    "nagana",
-    "nagged",
-    "nagger",
-    "naiads",
-    "nairas",
-    "nairus",
-    "naiver",
-    "naives",
-    "nakfas",
-    "naleds",
-    "namers",
-    "nances",
-    "nandin",
-    "nanism",
-    "nankin",
-    "napery",
-    "nappas",
-    "napped",
-    "napper",
-    "nappes",
-    "nappie",
-    "narcos",
-    "narial",
-    "narine",
-    "narked",
-    "narwal",
-    "nasals",
-    "nasial",
-    "nasion",
-    "nastic",
-    "natant",
-    "natron",
-    "natter",
-    "nautch",
-    "navaid",
-    "navars",
-    "navels",
-    "nawabs",
-    "naysay",
-    "nazify",
-    "neaten",
-    "neater",
-    "nebule",
-    "nebuly",
-    "necker",
-    "needer",
-    "neighs",
-    "nekton",
-    "neoned",
-    "nepeta",
-    "nereid",
-    "nereis",
-    "nerols",
-    "nerved",
-    "netops",
-    "nettly",
-    "neumes",
-    "neumic",
-    "nevoid",
-    "newels",
-    "newies",
-    "newish",
-    "newsie",
-    "nibbed",
-    "nicads",
-    "nicety",
-    "niched",
-    "nicker",
-    "nicols",
-    "nidate",
-    "nidget",
-    "nidify",
-    "niding",
-    "nielli",
-    "niello",
-    "niffer",
-    "niggle",
-    "niggly",
-    "nighed",
-    "nigher",
-    "nihils",
-    "nilgai",
-    "nilgau",
-    "nilled",
-    "nimbly",
-    "nimmed",
-    "ninons",
-    "ninths",
-    "niobic",
-    "niseis",
-    "niters",
-    "nitery",
-    "nitons",
-    "nitres",
-    "nitrid",
-    "nitril",
-    "nitros",
-    "nitwit",
-    "nixies",
-    "nixing",
-    "nizams",
-    "nobble",
-    "nocent",
-    "nocked",
-    "nodder",
-    "noddle",
-    "nodose",
-    "nodous",
-    "noesis",
-    "noetic",
-    "nogged",
-    "noised",
-    "nomina",
-    "nomism",
-    "nonage",
-    "nonart",
-    "nonces",
-    "noncom",
-    "nonego",
-    "nonets",
-    "nonfan",
-    "nongay",
-    "nonman",
-    "nonmen",
-    "nonpar",
-    "nontax",
-    "nonuse",
-    "nonwar",
-    "nonyls",
-    "noodge",
-    "noogie",
-    "noosed",
-    "nooser",
-    "nooses",
-    "nopals",
-    "norias",
-    "norite",
-    "norths",
-    "noshed",
-    "nosher",
-    "noshes",
-    "nosier",
-    "nosily",
-    "nosing",
-    "nostoc",
-    "notate",
-    "noters",
-    "nougat",
-    "nounal",
-    "nouses",
-    "noways",
-    "nowise",
-    "noyade",
-    "nubbin",
-    "nubble",
-    "nubbly",
-    "nubias",
-    "nuchae",
-    "nuchal",
-    "nudely",
-    "nudest",
-    "nudger",
-    "nudges",
-    "nudies",
-    "nudnik",
-    "nuking",
-    "nullah",
-    "nulled",
-    "numbat",
-    "numbed",
-    "numbly",
-    "numina",
-    "nuncio",
-    "nuncle",
-    "nurled",
-    "nurser",
-    "nutant",
-    "nutate",
-    "nutlet",
-    "nutria",
-    "nutted",
-    "nuzzle",
-    "nyalas",
-    "nympha",
-    "oafish",
-    "oakier",
-    "oakums",
-    "oaring",
-    "oaters",
-    "obeahs",
-    "obelia",
-    "obelus",
-    "obento",
-    "obeyer",
-    "obiism",
-    "oblate",
-    "oboist",
-    "oboles",
-    "obolus",
-    "obtect",
-    "obtest",
-    "obtund",
-    "obvert",
-    "ocelli",
-    "ochers",
-    "ochery",
-    "ochone",
-    "ochrea",
-    "ochred",
-    "ochres",
-    "ocicat",
-    "ockers",
-    "ocreae",
-    "octads",
-    "octans",
-    "octant",
-    "octopi",
-    "octyls",
-    "oculus",
-    "oddish",
-    "odeons",
-    "odeums",
-    "odists",
-    "odiums",
-    "odored",
-    "odyles",
-    "offals",
-    "offcut",
-    "offish",
-    "offkey",
-    "oftest",
-    "ogdoad",
-    "oghams",
-    "ogival",
-    "ogives",
-    "oglers",
-    "ogling",
-    "ogress",
-    "ogrish",
-    "ogrism",
-    "ohmage",
-    "oidium",
-    "oilcan",
-    "oilcup",
-    "oilier",
-    "oilman",
-    "oilmen",
-    "oilway",
-    "oinked",
-    "okapis",
-    "okayed",
-    "oldish",
-    "oleate",
-    "oleine",
-    "oleins",
-    "oleums",
-    "olingo",
-    "omasum",
-    "ombers",
-    "ombres",
-    "omegas",
-    "omened",
-    "omenta",
-    "onager",
-    "onagri",
-    "oniony",
-    "onlays",
-    "onrush",
-    "onsets",
-    "onside",
-    "onuses",
-    "onyxes",
-    "oocyst",
-    "oogamy",
-    "oogeny",
-    "oohing",
-    "oolite",
-    "oolith",
-    "oology",
-    "oomiac",
-    "oomiak",
-    "oompah",
-    "oomphs",
-    "oorali",
-    "ootids",
-    "oozier",
-    "oozily",
-    "ophite",
-    "opiums",
-    "oppugn",
-    "opsins",
-    "optime",
-    "opuses",
-    "orache",
-    "orangs",
-    "orangy",
-    "orated",
-    "orates",
-    "orbier",
-    "orbing",
-    "orcein",
-    "orchil",
-    "orchis",
-    "orcins",
-    "ordure",
-    "oreads",
-    "oreide",
-    "orfray",
-    "organa",
-    "orgeat",
-    "orgiac",
-    "orgone",
-    "oribis",
-    "oriels",
-    "origan",
-    "orisha",
-    "orison",
-    "orlons",
-    "orlops",
-    "ormers",
-    "ormolu",
-    "ornery",
-    "oroide",
-    "orphic",
-    "orpine",
-    "orpins",
-    "orrery",
-    "orrice",
-    "oryxes",
-    "oscine",
-    "oscula",
-    "oscule",
-    "osetra",
-    "osiers",
-    "osmics",
-    "osmole",
-    "osmols",
-    "osmose",
-    "osmous",
-    "osmund",
-    "ossein",
-    "ossify",
-    "osteal",
-    "ostium",
-    "ostler",
-    "otalgy",
-    "otiose",
-    "otitic",
-    "ottars",
-    "ottava",
-    "ouched",
-    "ouches",
-    "oughts",
-    "ouphes",
-    "ourang",
-    "ourari",
-    "ourebi",
-    "ousels",
-    "outact",
-    "outadd",
-    "outask",
-    "outate",
-    "outbeg",
-    "outbuy",
-    "outbye",
-    "outdid",
-    "outeat",
-    "outers",
-    "outfly",
-    "outfox",
-    "outgas",
-    "outgun",
-    "outhit",
-    "outjut",
-    "outled",
-    "outlie",
-    "outman",
-    "outran",
-    "outrig",
-    "outrow",
-    "outsat",
-    "outsaw",
-    "outsay",
-    "outsee",
-    "outsin",
-    "outsit",
-    "outvie",
-    "outwar",
-    "ouzels",
-    "ovally",
-    "overed",
-    "ovibos",
-    "ovines",
-    "ovisac",
-    "ovoids",
-    "ovolos",
-    "ovonic",
-    "ovular",
-    "ovules",
-    "owlets",
-    "owlish",
-    "oxalic",
-    "oxalis",
-    "oxbows",
-    "oxcart",
-    "oxeyes",
-    "oxidic",
-    "oximes",
-    "oxlike",
-    "oxlips",
-    "oxtail",
-    "oxters",
-    "oyezes",
-    "ozalid",
-    "ozones",
-    "ozonic",
-    "pablum",
-    "pachas",
-    "pacier",
-    "packly",
-    "padauk",
-    "padder",
-    "padles",
-    "padnag",
-    "padouk",
-    "paeans",
-    "paeons",
-    "paesan",
-    "pagods",
-    "paiked",
-    "painch",
-    "painty",
-    "paisan",
-    "paisas",
-    "pakeha",
-    "pakora",
-    "palapa",
-    "paleae",
-    "paleal",
-    "palely",
-    "palest",
-    "palets",
-    "palier",
-    "paling",
-    "palish",
-    "palled",
-    "pallia",
-    "pallor",
-    "palmed",
-    "palpal",
-    "palped",
-    "palpus",
-    "palter",
-    "panada",
-    "panfry",
-    "panful",
-    "pangas",
-    "panged",
-    "pangen",
-    "panino",
-    "panner",
-    "pannes",
-    "pantos",
-    "papaws",
-    "papery",
-    "papism",
-    "papist",
-    "pappus",
-    "papula",
-    "papule",
-    "paramo",
-    "parang",
-    "paraph",
-    "pardah",
-    "pardie",
-    "pareos",
-    "parers",
-    "pareus",
-    "pareve",
-    "parged",
-    "parges",
-    "parget",
-    "pargos",
-    "parian",
-    "paries",
-    "parled",
-    "parles",
-    "parols",
-    "parous",
-    "parral",
-    "parred",
-    "parrel",
-    "parsec",
-    "partan",
-    "parura",
-    "parure",
-    "parvis",
-    "parvos",
-    "paseos",
-    "pashas",
-    "pashed",
-    "pashes",
-    "passee",
-    "passel",
-    "passus",
-    "paster",
-    "pastie",
-    "pastil",
-    "pastis",
-    "patens",
-    "paters",
-    "patine",
-    "patins",
-    "patois",
-    "pattee",
-    "patzer",
-    "paunch",
-    "pausal",
-    "pauser",
-    "pavane",
-    "pavans",
-    "paveed",
-    "pavins",
-    "pavior",
-    "pavise",
-    "pawers",
-    "pawing",
-    "pawned",
-    "pawner",
-    "pawnor",
-    "pawpaw",
-    "paxwax",
-    "paynim",
-    "pazazz",
-    "peaced",
-    "peaces",
-    "peages",
-    "peahen",
-    "pealed",
-    "peasen",
-    "peases",
-    "pebbly",
-    "pechan",
-    "peched",
-    "pecked",
-    "pecten",
-    "pectic",
-    "pedalo",
-    "pedate",
-    "pedlar",
-    "pedler",
-    "pedros",
-    "peened",
-    "peeper",
-    "peepul",
-    "peerie",
-    "peeved",
-    "peewit",
-    "pegbox",
-    "peined",
-    "peised",
-    "peises",
-    "pekans",
-    "pekins",
-    "pekoes",
-    "pelage",
-    "pelite",
-    "pelmet",
-    "pelota",
-    "pelted",
-    "pelter",
-    "peltry",
-    "pelves",
-    "pencel",
-    "pended",
-    "pengos",
-    "penial",
-    "penmen",
-    "pennae",
-    "pennia",
-    "pennis",
-    "pennon",
-    "pensee",
-    "pensil",
-    "pentad",
-    "pentyl",
-    "penult",
-    "penury",
-    "peones",
-    "pepino",
-    "peplos",
-    "peplum",
-    "peplus",
-    "pepped",
-    "peptid",
-    "perdie",
-    "perdus",
-    "pereia",
-    "pereon",
-    "periti",
-    "perked",
-    "permed",
-    "pernio",
-    "pernod",
-    "peroxy",
-    "perses",
-    "perter",
-    "pertly",
-    "peruke",
-    "pesade",
-    "pesewa",
-    "pestos",
-    "petard",
-    "petnap",
-    "petsai",
-    "petted",
-    "pettle",
-    "pewees",
-    "pewits",
-    "peyotl",
-    "phalli",
-    "phasic",
-    "phasis",
-    "phatic",
-    "phials",
-    "phizes",
-    "phonal",
-    "phonos",
-    "phooey",
-    "photic",
-    "phreak",
-    "phylae",
-    "phylar",
-    "phylic",
-    "phyllo",
-    "phylon",
-    "physed",
-    "physes",
-    "physis",
-    "phytin",
-    "phytol",
-    "phyton",
-    "piaffe",
-    "pianic",
-    "piazze",
-    "pibals",
-    "picara",
-    "picaro",
-    "pickax",
-    "picots",
-    "picric",
-    "piculs",
-    "piddle",
-    "piddly",
-    "piecer",
-    "pieing",
-    "pietas",
-    "piffle",
-    "pigged",
-    "piggie",
-    "piggin",
-    "pignus",
-    "pignut",
-    "pigout",
-    "pigpen",
-    "pigsty",
-    "pikake",
-    "pikers",
-    "piking",
-    "pilaff",
-    "pilafs",
-    "pilaus",
-    "pilaws",
-    "pileum",
-    "pileus",
-    "pilfer",
-    "pilled",
-    "pilose",
-    "pilous",
-    "pilule",
-    "pimply",
-    "pincer",
-    "pinene",
-    "pinery",
-    "pineta",
-    "pinger",
-    "pingos",
-    "pinier",
-    "pinite",
-    "pinked",
-    "pinken",
-    "pinkey",
-    "pinkly",
-    "pinkos",
-    "pinnae",
-    "pinnal",
-    "pinnas",
-    "pinons",
-    "pinots",
-    "pintas",
-    "pintle",
-    "pintos",
-    "pinups",
-    "pinyon",
-    "piolet",
-    "pionic",
-    "pipage",
-    "pipals",
-    "pipets",
-    "pipier",
-    "pipits",
-    "pipkin",
-    "pipped",
-    "piques",
-    "pirana",
-    "piraya",
-    "pirogi",
-    "piscos",
-    "pished",
-    "pisher",
-    "pishes",
-    "pisser",
-    "pistil",
-    "pistou",
-    "pitaya",
-    "pitchy",
-    "pithed",
-    "pitier",
-    "pities",
-    "pitmen",
-    "pitons",
-    "pitsaw",
-    "pittas",
-    "pizazz",
-    "pizzaz",
-    "pizzle",
-    "placet",
-    "placks",
-    "plagal",
-    "plages",
-    "plaguy",
-    "plaice",
-    "plaint",
-    "plaits",
-    "planch",
-    "plashy",
-    "plasms",
-    "platan",
-    "platys",
-    "pleach",
-    "plebes",
-    "pleiad",
-    "plench",
-    "pleons",
-    "plexal",
-    "plexes",
-    "plexor",
-    "plicae",
-    "plical",
-    "plinks",
-    "plisky",
-    "plisse",
-    "ploidy",
-    "plonks",
-    "plotty",
-    "plower",
-    "ployed",
-    "plucks",
-    "plumbs",
-    "plumed",
-    "plummy",
-    "plumps",
-    "plunks",
-    "plunky",
-    "plushy",
-    "plutei",
-    "pluton",
-    "plyers",
-    "pneuma",
-    "poachy",
-    "poboys",
-    "pocked",
-    "podded",
-    "podite",
-    "podsol",
-    "podzol",
-    "pogeys",
-    "pogies",
-    "pogrom",
-    "poilus",
-    "poinds",
-    "poiser",
-    "poises",
-    "poisha",
-    "pokeys",
-    "pokier",
-    "pokies",
-    "pokily",
-    "polars",
-    "poleax",
-    "poleis",
-    "polers",
-    "poleyn",
-    "polies",
-    "polios",
-    "polkas",
-    "pollee",
-    "poller",
-    "pollex",
-    "polyol",
-    "polypi",
-    "pomace",
-    "pomade",
-    "pomelo",
-    "pommee",
-    "pommie",
-    "pompom",
-    "pompon",
-    "ponced",
-    "ponces",
-    "ponded",
-    "ponged",
-    "pongee",
-    "pongid",
-    "ponied",
-    "pontes",
-    "pontil",
-    "ponton",
-    "poohed",
-    "pooing",
-    "pooris",
-    "pooves",
-    "popery",
-    "popgun",
-    "popish",
-    "poppas",
-    "poppet",
-    "popple",
-    "popsie",
-    "porism",
-    "porked",
-    "porose",
-    "portly",
-    "poseur",
-    "posher",
-    "poshly",
-    "posole",
-    "posset",
-    "postie",
-    "postin",
-    "postop",
-    "potage",
-    "potboy",
-    "poteen",
-    "potful",
-    "pother",
-    "pothos",
-    "potman",
-    "potmen",
-    "potpie",
-    "potsie",
-    "pottle",
-    "pottos",
-    "potzer",
-    "pouchy",
-    "poufed",
-    "pouffe",
-    "pouffs",
-    "pouffy",
-    "poults",
-    "pourer",
-    "pouted",
-    "pouter",
-    "poxier",
-    "poxing",
-    "poyous",
-    "pozole",
-    "praams",
-    "prahus",
-    "prajna",
-    "prance",
-    "prangs",
-    "prases",
-    "prated",
-    "prates",
-    "praxes",
-    "preact",
-    "prearm",
-    "prebid",
-    "prebuy",
-    "precut",
-    "predry",
-    "preens",
-    "prelaw",
-    "preman",
-    "premed",
-    "premen",
-    "premie",
-    "preops",
-    "prests",
-    "pretor",
-    "prevue",
-    "prexes",
-    "preyed",
-    "preyer",
-    "prezes",
-    "priapi",
-    "pricer",
-    "pricky",
-    "priers",
-    "prills",
-    "primas",
-    "primly",
-    "primos",
-    "primps",
-    "prinks",
-    "prised",
-    "prizer",
-    "prober",
-    "proems",
-    "progun",
-    "prolan",
-    "proleg",
-    "proles",
-    "prolix",
-    "prosed",
-    "proser",
-    "proses",
-    "prosit",
-    "prosos",
-    "protei",
-    "protyl",
-    "prowar",
-    "prower",
-    "prowls",
-    "prudes",
-    "prutah",
-    "prutot",
-    "pryers",
-    "pseuds",
-    "pshaws",
-    "psocid",
-    "psychs",
-    "psylla",
-    "psyops",
-    "psywar",
-    "pterin",
-    "ptisan",
-    "ptooey",
-    "ptoses",
-    "ptosis",
-    "ptotic",
-    "puddly",
-    "pugged",
-    "puggry",
-    "pugree",
-    "puisne",
-    "pujahs",
-    "pulers",
-    "puling",
-    "pullet",
-    "pullup",
-    "pulpal",
-    "pulped",
-    "pulper",
-    "pulque",
-    "pulser",
-    "pumelo",
-    "pummel",
-    "pungle",
-    "punier",
-    "punily",
-    "punjis",
-    "punkah",
-    "punkas",
-    "punker",
-    "punkey",
-    "punkie",
-    "punkin",
-    "punned",
-    "punner",
-    "punnet",
-    "punted",
-    "pupate",
-    "pupped",
-    "purana",
-    "purdah",
-    "purdas",
-    "pureed",
-    "purees",
-    "purfle",
-    "purger",
-    "purins",
-    "purism",
-    "purled",
-    "purlin",
-    "purply",
-    "purred",
-    "pursed",
-    "purvey",
-    "pushup",
-    "pusley",
-    "pusses",
-    "pussly",
-    "putlog",
-    "putoff",
-    "putons",
-    "putout",
-    "putsch",
-    "putted",
-    "puttee",
-    "puttie",
-    "putzed",
-    "putzes",
-    "pyemia",
-    "pyemic",
-    "pyknic",
-    "pyoses",
-    "pyosis",
-    "pyrans",
-    "pyrola",
-    "pyrone",
-    "pyrope",
-    "pyrrol",
-    "pyuria",
-    "pyxies",
-    "qabala",
-    "qanats",
-    "qindar",
-    "qintar",
-    "qiviut",
-    "quacky",
-    "quaere",
-    "quaffs",
-    "quaggy",
-    "quahog",
-    "quaich",
-    "quaigh",
-    "quails",
-    "quaked",
-    "qualmy",
-    "quango",
-    "quants",
-    "quarte",
-    "quaver",
-    "qubyte",
-    "queans",
-    "queazy",
-    "quelea",
-    "quells",
-    "querns",
-    "queuer",
-    "quezal",
-    "quicks",
-    "quiets",
-    "quiffs",
-    "quinic",
-    "quinin",
-    "quinol",
-    "quinsy",
-    "quints",
-    "quippu",
-    "quippy",
-    "quipus",
-    "quires",
-    "quirts",
-    "quitch",
-    "quohog",
-    "quoins",
-    "quoits",
-    "quokka",
-    "quolls",
-    "quoter",
-    "quotha",
-    "qurush",
-    "rabato",
-    "rabats",
-    "rabbet",
-    "rabbin",
-    "raceme",
-    "rachet",
-    "rachis",
-    "racier",
-    "racily",
-    "racker",
-    "rackle",
-    "racons",
-    "radded",
-    "raddle",
-    "radome",
-    "radons",
-    "radula",
-    "rafted",
-    "ragbag",
-    "ragees",
-    "raggee",
-    "raggle",
-    "ragman",
-    "ragmen",
-    "ragout",
-    "ragtag",
-    "ragtop",
-    "railer",
-    "raitas",
-    "rajahs",
-    "rakees",
-    "rakers",
-    "rakish",
-    "ralphs",
-    "ramate",
-    "rambla",
-    "ramees",
-    "ramets",
-    "ramies",
-    "ramify",
-    "ramose",
-    "ramous",
-    "ramson",
-    "ramtil",
-    "rances",
-    "randan",
-    "ranees",
-    "ranids",
-    "ranker",
-    "rankle",
-    "rankly",
-    "ranted",
-    "ranter",
-    "ranula",
-    "rapers",
-    "raphae",
-    "raphes",
-    "raphia",
-    "raphis",
-    "rapine",
-    "rapini",
-    "rappee",
-    "rappen",
-    "raptly",
-    "rarefy",
-    "rarify",
-    "raring",
-    "rasers",
-    "rasher",
-    "rashly",
-    "rasing",
-    "rasped",
-    "rasper",
-    "rassle",
-    "rasure",
-    "ratals",
-    "ratans",
-    "ratany",
-    "ratbag",
-    "ratels",
-    "ratine",
-    "ratite",
-    "ratlin",
-    "ratoon",
-    "ratted",
-    "ratten",
-    "ratter",
-    "rattly",
-    "ratton",
-    "ravels",
-    "ravins",
-    "ravish",
-    "rawest",
-    "rawins",
-    "rawish",
-    "raxing",
-    "rayahs",
-    "raying",
-    "rayons",
-    "razeed",
-    "razees",
-    "razers",
-    "razing",
-    "razzed",
-    "razzes",
-    "readds",
-    "reagin",
-    "realer",
-    "realia",
-    "rearer",
-    "rearms",
-    "reatas",
-    "reaved",
-    "reavow",
-    "rebait",
-    "rebars",
-    "rebato",
-    "rebbes",
-    "rebeck",
-    "rebecs",
-    "rebids",
-    "rebill",
-    "rebind",
-    "rebody",
-    "reboil",
-    "rebook",
-    "rebops",
-    "rebore",
-    "rebozo",
-    "rebred",
-    "rebuff",
-    "rebury",
-    "rebuts",
-    "rebuys",
-    "recane",
-    "recant",
-    "recces",
-    "rechew",
-    "recits",
-    "recked",
-    "reclad",
-    "recoal",
-    "recoat",
-    "recock",
-    "recoin",
-    "recomb",
-    "recons",
-    "recook",
-    "recopy",
-    "recork",
-    "rectos",
-    "recuse",
-    "recuts",
-    "redact",
-    "redans",
-    "redate",
-    "redbay",
-    "redbud",
-    "redbug",
-    "redcap",
-    "redded",
-    "reddle",
-    "redear",
-    "redefy",
-    "redeny",
-    "redfin",
-    "rediae",
-    "redias",
-    "redips",
-    "redipt",
-    "redleg",
-    "redock",
-    "redoes",
-    "redons",
-    "redout",
-    "redowa",
-    "redrew",
-    "redtop",
-    "redubs",
-    "redyed",
-    "redyes",
-    "reearn",
-    "reecho",
-    "reechy",
-    "reeded",
-    "reedit",
-    "reefed",
-    "reeked",
-    "reeker",
-    "reeler",
-    "reemit",
-    "reests",
-    "reeved",
-    "reface",
-    "refall",
-    "refect",
-    "refeed",
-    "refeel",
-    "refell",
-    "refels",
-    "refelt",
-    "reffed",
-    "refile",
-    "refilm",
-    "refind",
-    "refire",
-    "refits",
-    "reflag",
-    "reflet",
-    "reflew",
-    "refold",
-    "regale",
-    "regave",
-    "regear",
-    "regild",
-    "regilt",
-    "regius",
-    "regive",
-    "reglet",
-    "reglow",
-    "reglue",
-    "regnal",
-    "regrew",
-    "regrow",
-    "reguli",
-    "rehang",
-    "rehear",
-    "reheel",
-    "rehems",
-    "rehire",
-    "rehung",
-    "reined",
-    "reinks",
-    "reived",
-    "reiver",
-    "reives",
-    "rejigs",
-    "rekeys",
-    "reknit",
-    "reknot",
-    "relace",
-    "relaid",
-    "reland",
-    "relend",
-    "relent",
-    "relets",
-    "releve",
-    "relier",
-    "reline",
-    "relink",
-    "reloan",
-    "relock",
-    "relook",
-    "reluct",
-    "relume",
-    "remail",
-    "remans",
-    "remaps",
-    "remate",
-    "remeet",
-    "remelt",
-    "remend",
-    "remint",
-    "remise",
-    "remits",
-    "remixt",
-    "remold",
-    "remora",
-    "remuda",
-    "renail",
-    "rended",
-    "renege",
-    "renest",
-    "renigs",
-    "renins",
-    "rennet",
-    "rennin",
-    "rentes",
-    "renvoi",
-    "reoils",
-    "repand",
-    "repark",
-    "repass",
-    "repast",
-    "repave",
-    "repays",
-    "repegs",
-    "reperk",
-    "repine",
-    "repins",
-    "replan",
-    "repled",
-    "replot",
-    "replow",
-    "repoll",
-    "repots",
-    "repour",
-    "repped",
-    "repros",
-    "repugn",
-    "repump",
-    "requin",
-    "rerack",
-    "rerent",
-    "rerigs",
-    "rerise",
-    "reroll",
-    "reroof",
-    "rerose",
-    "resaid",
-    "resail",
-    "resawn",
-    "resaws",
-    "resays",
-    "reseat",
-    "reseau",
-    "resect",
-    "reseed",
-    "reseek",
-    "reseen",
-    "resees",
-    "resewn",
-    "resews",
-    "reshes",
-    "reship",
-    "reshod",
-    "reshoe",
-    "reshot",
-    "reshow",
-    "resids",
-    "resift",
-    "resile",
-    "resiny",
-    "resite",
-    "resits",
-    "resoak",
-    "resods",
-    "resole",
-    "resorb",
-    "resown",
-    "resows",
-    "respot",
-    "rester",
-    "retack",
-    "retags",
-    "retape",
-    "reteam",
-    "retear",
-    "retems",
-    "retene",
-    "retial",
-    "retied",
-    "reties",
-    "retile",
-    "retime",
-    "retine",
-    "retint",
-    "retook",
-    "retool",
-    "retore",
-    "retorn",
-    "retral",
-    "retrim",
-    "retros",
-    "retted",
-    "retune",
-    "retuse",
-    "reuses",
-    "revers",
-    "revery",
-    "revest",
-    "revets",
-    "revile",
-    "revote",
-    "rewake",
-    "rewarm",
-    "rewash",
-    "rewear",
-    "reweds",
-    "reweld",
-    "rewets",
-    "rewins",
-    "rewoke",
-    "reword",
-    "rewore",
-    "reworn",
-    "rewove",
-    "rewrap",
-    "rexine",
-    "rezero",
-    "rhaphe",
-    "rhebok",
-    "rhemes",
-    "rhetor",
-    "rheums",
-    "rheumy",
-    "rhinal",
-    "rhodic",
-    "rhombi",
-    "rhombs",
-    "rhotic",
-    "rhumba",
-    "rhumbs",
-    "rhuses",
-    "rhymed",
-    "rhymer",
-    "rhyton",
-    "riatas",
-    "ribald",
-    "riband",
-    "ribber",
-    "ribier",
-    "riblet",
-    "ricers",
-    "richen",
-    "ricing",
-    "ricins",
-    "ricked",
-    "ricrac",
-    "rictal",
-    "rictus",
-    "ridded",
-    "rident",
-    "ridgel",
-    "ridgil",
-    "riever",
-    "rifely",
-    "rifest",
-    "riffed",
-    "rifler",
-    "riflip",
-    "rifted",
-    "righto",
-    "riling",
-    "rilled",
-    "rilles",
-    "rillet",
-    "rimers",
-    "rimier",
-    "riming",
-    "rimose",
-    "rimous",
-    "rimple",
-    "rinded",
-    "rinser",
-    "riojas",
-    "rioted",
-    "rioter",
-    "ripely",
-    "ripens",
-    "ripest",
-    "riping",
-    "ripost",
-    "ripply",
-    "ripsaw",
-    "rishis",
-    "risker",
-    "ristra",
-    "ritard",
-    "ritzes",
-    "riving",
-    "roadeo",
-    "roarer",
-    "robalo",
-    "roband",
-    "robing",
-    "rochet",
-    "rodded",
-    "rodmen",
-    "rogued",
-    "roiled",
-    "rolfed",
-    "rolfer",
-    "romeos",
-    "romped",
-    "rondel",
-    "rondos",
-    "ronion",
-    "ronnel",
-    "ronyon",
-    "roofie",
-    "rooked",
-    "roomed",
-    "roomer",
-    "roosed",
-    "rooser",
-    "rooses",
-    "roosts",
-    "rootle",
-    "ropers",
-    "ropery",
-    "ropier",
-    "ropily",
-    "roques",
-    "roquet",
-    "rosery",
-    "rosets",
-    "roshis",
-    "rosier",
-    "rosily",
-    "rosing",
-    "rosins",
-    "rosiny",
-    "rostra",
-    "rotche",
-    "rotgut",
-    "rotter",
-    "rottes",
-    "rotund",
-    "rouche",
-    "rouens",
-    "rouged",
-    "rouges",
-    "roughs",
-    "roughy",
-    "rouped",
-    "roupet",
-    "rouses",
-    "rousts",
-    "rouths",
-    "rowans",
-    "rowels",
-    "rowens",
-    "rowths",
-    "rozzer",
-    "ruanas",
-    "rubace",
-    "rubati",
-    "rubato",
-    "rubbly",
-    "rubels",
-    "rubied",
-    "rubier",
-    "rubigo",
-    "ruboff",
-    "rubout",
-    "ruches",
-    "rucked",
-    "ruckle",
-    "ruddle",
-    "rudery",
-    "rudest",
-    "rueful",
-    "ruffes",
-    "ruffly",
-    "rugate",
-    "rugger",
-    "rugola",
-    "rugosa",
-    "rugose",
-    "rugous",
-    "ruiner",
-    "rulier",
-    "rumaki",
-    "rumbas",
-    "rumbly",
-    "rumens",
-    "rumina",
-    "rummer",
-    "rumple",
-    "rumply",
-    "runkle",
-    "runlet",
-    "runnel",
-    "runout",
-    "rurban",
-    "rushee",
-    "rusine",
-    "rutins",
-    "rutted",
-    "ryking",
-    "ryokan",
-    "sabals",
-    "sabbed",
-    "sabins",
-    "sabirs",
-    "sables",
-    "sabots",
-    "sabras",
-    "sabred",
-    "sacbut",
-    "sachem",
-    "sacker",
-    "sacque",
-    "sadden",
-    "saddhu",
-    "sadhes",
-    "sadhus",
-    "safrol",
-    "sagbut",
-    "sagely",
-    "sagest",
-    "saggar",
-    "sagged",
-    "sagger",
-    "sagier",
-    "sahibs",
-    "saices",
-    "saigas",
-    "saimin",
-    "sained",
-    "saithe",
-    "saiyid",
-    "sajous",
-    "sakers",
-    "salals",
-    "saleps",
-    "salify",
-    "sallet",
-    "sallow",
-    "salmis",
-    "salols",
-    "saloop",
-    "salpae",
-    "salpas",
-    "salpid",
-    "saltie",
-    "salved",
-    "salver",
-    "salves",
-    "salvor",
-    "salvos",
-    "sambal",
-    "sambar",
-    "sambas",
-    "sambos",
-    "sambur",
-    "samech",
-    "samekh",
-    "sameks",
-    "samiel",
-    "samite",
-    "samlet",
-    "samosa",
-    "sampan",
-    "samshu",
-    "sancta",
-    "sandhi",
-    "sanely",
-    "sanest",
-    "sangar",
-    "sangas",
-    "sanghs",
-    "sanies",
-    "saning",
-    "sanjak",
-    "sannop",
-    "sannup",
-    "sansar",
-    "sansei",
-    "santir",
-    "santol",
-    "santur",
-    "sapors",
-    "sapota",
-    "sapote",
-    "sapour",
-    "sapped",
-    "sapper",
-    "sarans",
-    "sarape",
-    "sarges",
-    "sargos",
-    "sarins",
-    "sarode",
-    "sarods",
-    "sarsar",
-    "sarsen",
-    "sartor",
-    "sashay",
-    "sashed",
-    "sasins",
-    "sassed",
-    "sasses",
-    "satang",
-    "satara",
-    "satays",
-    "sating",
-    "satins",
-    "satiny",
-    "satrap",
-    "satyrs",
-    "sauced",
-    "sauchs",
-    "sauger",
-    "saughs",
-    "saughy",
-    "saults",
-    "saurel",
-    "sauted",
-    "sautes",
-    "savate",
-    "savine",
-    "savins",
-    "savors",
-    "savoys",
-    "sawers",
-    "sawfly",
-    "sawlog",
-    "sawney",
-    "sayeds",
-    "sayest",
-    "sayids",
-    "scabby",
-    "scalds",
-    "scalls",
-    "scalps",
-    "scamps",
-    "scants",
-    "scaped",
-    "scarer",
-    "scarey",
-    "scarph",
-    "scarps",
-    "scarts",
-    "scathe",
-    "scatts",
-    "scatty",
-    "scaups",
-    "scaurs",
-    "scenas",
-    "scends",
-    "schavs",
-    "schizo",
-    "schizy",
-    "schlep",
-    "schlub",
-    "schmoe",
-    "schmos",
-    "schnoz",
-    "schorl",
-    "schrik",
-    "schrod",
-    "schtik",
-    "schuit",
-    "schuln",
-    "schuls",
-    "schuss",
-    "schwas",
-    "scilla",
-    "scions",
-    "sclaff",
-    "sclera",
-    "scoffs",
-    "scolds",
-    "scolex",
-    "scooch",
-    "scoots",
-    "scoria",
-    "scorns",
-    "scoter",
-    "scours",
-    "scouth",
-    "scowed",
-    "scowls",
-    "scrags",
-    "scrams",
-    "screak",
-    "screes",
-    "scried",
-    "scries",
-    "scrimp",
-    "scrims",
-    "scrips",
-    "scrive",
-    "scrods",
-    "scroop",
-    "scrota",
-    "scrums",
-    "scubas",
-    "sculch",
-    "sculks",
-    "sculls",
-    "sculps",
-    "scummy",
-    "scurfs",
-    "scurfy",
-    "scutch",
-    "scutes",
-    "scutum",
-    "scuzzy",
-    "scyphi",
-    "seabag",
-    "seadog",
-    "seamer",
-    "seance",
-    "searer",
-    "seawan",
-    "sebums",
-    "secant",
-    "seccos",
-    "secern",
-    "secpar",
-    "secund",
-    "seders",
-    "sedges",
-    "sedile",
-    "sedums",
-    "seeder",
-    "seeled",
-    "seemer",
-    "seemly",
-    "seethe",
-    "seggar",
-    "segnos",
-    "segued",
-    "segues",
-    "seiche",
-    "seined",
-    "seines",
-    "seised",
-    "seiser",
-    "seises",
-    "seisin",
-    "seisms",
-    "seisor",
-    "seitan",
-    "seizer",
-    "seizin",
-    "seizor",
-    "sejant",
-    "selahs",
-    "selfed",
-    "selkie",
-    "selles",
-    "selsyn",
-    "selvas",
-    "sememe",
-    "semens",
-    "semina",
-    "senary",
-    "sendal",
-    "sended",
-    "sendup",
-    "senega",
-    "senhor",
-    "seniti",
-    "sennas",
-    "sennet",
-    "sennit",
-    "senora",
-    "senors",
-    "senryu",
-    "sensum",
-    "sepias",
-    "sepoys",
-    "sepses",
-    "septet",
-    "seracs",
-    "serail",
-    "serais",
-    "serape",
-    "serdab",
-    "serein",
-    "serest",
-    "serged",
-    "serges",
-    "serifs",
-    "sering",
-    "serins",
-    "serosa",
-    "serows",
-    "serums",
-    "serval",
-    "sestet",
-    "setoff",
-    "setons",
-    "setose",
-    "setous",
-    "setout",
-    "sewans",
-    "sewars",
-    "sexily",
-    "sexpot",
-    "sextan",
-    "sextos",
-    "shacko",
-    "shaduf",
-    "shaird",
-    "shairn",
-    "shakos",
-    "shaled",
-    "shaley",
-    "shamas",
-    "shames",
-    "shammy",
-    "shamos",
-    "shamoy",
-    "shamus",
-    "shanny",
-    "shapen",
-    "sharns",
-    "sharny",
-    "sharpy",
-    "shaugh",
-    "shauls",
-    "shavie",
-    "shawed",
-    "shawms",
-    "sheafs",
-    "sheals",
-    "sheens",
-    "sheeny",
-    "sheers",
-    "sheeve",
-    "sheiks",
-    "shelta",
-    "shelty",
-    "shelvy",
-    "shends",
-    "sheols",
-    "sheqel",
-    "sherds",
-    "sheuch",
-    "sheugh",
-    "shewer",
-    "shibah",
-    "shiels",
-    "shiers",
-    "shiest",
-    "shikar",
-    "shiksa",
-    "shikse",
-    "shills",
-    "shindy",
-    "shinny",
-    "shirks",
-    "shirrs",
-    "shirty",
-    "shists",
-    "shivah",
-    "shivas",
-    "shives",
-    "shlepp",
-    "shleps",
-    "shlock",
-    "shlubs",
-    "shlump",
-    "shmear",
-    "shmoes",
-    "shmuck",
-    "shnaps",
-    "shnook",
-    "shoaly",
-    "shoats",
-    "shoers",
-    "shogis",
-    "shojis",
-    "sholom",
-    "shooed",
-    "shooks",
-    "shools",
-    "shoran",
-    "shored",
-    "shorls",
-    "shotes",
-    "shotts",
-    "shover",
-    "shoyus",
-    "shrews",
-    "shrive",
-    "shroff",
-    "shrove",
-    "shtetl",
-    "shtick",
-    "shtiks",
-    "shuted",
-    "shutes",
-    "shyers",
-    "shyest",
-    "shying",
-    "sialid",
-    "sibyls",
-    "siccan",
-    "sicced",
-    "sicked",
-    "sickee",
-    "sicken",
-    "sickie",
-    "sickos",
-    "siddur",
-    "sidled",
-    "sidler",
-    "sidles",
-    "sieged",
-    "sieges",
-    "sieurs",
-    "sieved",
-    "sifaka",
-    "sifter",
-    "sigher",
-    "sigils",
-    "sigloi",
-    "siglos",
-    "siglum",
-    "sigmas",
-    "signee",
-    "sileni",
-    "silked",
-    "silkie",
-    "siller",
-    "siloed",
-    "silted",
-    "silvae",
-    "silvex",
-    "simars",
-    "simlin",
-    "simnel",
-    "simony",
-    "simoom",
-    "simoon",
-    "simper",
-    "sinews",
-    "sinewy",
-    "singed",
-    "singes",
-    "sinter",
-    "siping",
-    "sipper",
-    "sippet",
-    "sirees",
-    "siring",
-    "sirrah",
-    "sirras",
-    "sirree",
-    "sirups",
-    "sirupy",
-    "sisals",
-    "siskin",
-    "sisses",
-    "sistra",
-    "sitars",
-    "sitten",
-    "situps",
-    "sivers",
-    "sixmos",
-    "sixtes",
-    "sixths",
-    "sizars",
-    "sizers",
-    "sizier",
-    "skalds",
-    "skanks",
-    "skatol",
-    "skeane",
-    "skeans",
-    "skeens",
-    "skeets",
-    "skeigh",
-    "skells",
-    "skelms",
-    "skelps",
-    "skenes",
-    "skerry",
-    "skibob",
-    "skiddy",
-    "skiffs",
-    "skimos",
-    "skimps",
-    "skinks",
-    "skirls",
-    "skirrs",
-    "skited",
-    "skites",
-    "skived",
-    "skiver",
-    "skives",
-    "skivvy",
-    "sklent",
-    "skoals",
-    "skorts",
-    "skulks",
-    "skunky",
-    "skycap",
-    "skying",
-    "skylit",
-    "skyman",
-    "skymen",
-    "slaggy",
-    "slaked",
-    "slaker",
-    "slakes",
-    "slangs",
-    "slangy",
-    "slants",
-    "slanty",
-    "slatch",
-    "slatey",
-    "slaver",
-    "slavey",
-    "slayed",
-    "sleave",
-    "sleazo",
-    "sleeks",
-    "sleeky",
-    "sleets",
-    "sleety",
-    "slewed",
-    "sliest",
-    "slieve",
-    "slimed",
-    "slimes",
-    "slimly",
-    "slimsy",
-    "slinks",
-    "sliped",
-    "slipes",
-    "slippy",
-    "slipup",
-    "slitty",
-    "slobby",
-    "sloids",
-    "slojds",
-    "sloops",
-    "sloper",
-    "sloshy",
-    "sloths",
-    "sloven",
-    "sloyds",
-    "sludgy",
-    "sluffs",
-    "sluicy",
-    "sluing",
-    "slummy",
-    "slurbs",
-    "slurps",
-    "slushy",
-    "slyest",
-    "slypes",
-    "smalti",
-    "smalts",
-    "smarms",
-    "smarmy",
-    "smazes",
-    "smeary",
-    "smeeks",
-    "smegma",
-    "smelts",
-    "smerks",
-    "smidge",
-    "smilax",
-    "smiler",
-    "smirch",
-    "smirks",
-    "smirky",
-    "smiter",
-    "smites",
-    "smocks",
-    "smoggy",
-    "smoosh",
-    "smudgy",
-    "smugly",
-    "smutch",
-    "smutty",
-    "snafus",
-    "snaggy",
-    "snaked",
-    "snakey",
-    "snared",
-    "snarer",
-    "snarfs",
-    "snarks",
-    "snarls",
-    "snarly",
-    "snathe",
-    "snaths",
-    "snawed",
-    "sneaps",
-    "snecks",
-    "sneers",
-    "sneery",
-    "sneesh",
-    "sneezy",
-    "snells",
-    "snicks",
-    "sniffy",
-    "sniped",
-    "snippy",
-    "snivel",
-    "snobby",
-    "snoods",
-    "snooks",
-    "snools",
-    "snoops",
-    "snoots",
-    "snoozy",
-    "snored",
-    "snorer",
-    "snores",
-    "snorts",
-    "snouts",
-    "snouty",
-    "snubby",
-    "snuffs",
-    "snuffy",
-    "soaped",
-    "soaper",
-    "soarer",
-    "soaves",
-    "sobber",
-    "sobeit",
-    "sobers",
-    "sobful",
-    "socage",
-    "socked",
-    "socles",
-    "socman",
-    "socmen",
-    "sodded",
-    "sodden",
-    "sodoms",
-    "soever",
-    "sofars",
-    "softas",
-    "softie",
-    "sogged",
-    "soigne",
-    "sokols",
-    "soland",
-    "solans",
-    "solate",
-    "soldan",
-    "solgel",
-    "solidi",
-    "soling",
-    "solion",
-    "soloed",
-    "solons",
-    "solums",
-    "somans",
-    "somata",
-    "somite",
-    "somoni",
-    "sonant",
-    "sonars",
-    "sonder",
-    "sondes",
-    "sonsie",
-    "sooted",
-    "sooths",
-    "sopite",
-    "sopors",
-    "sopped",
-    "sorbed",
-    "sorbic",
-    "sordor",
-    "sorels",
-    "sorest",
-    "sorgho",
-    "sorgos",
-    "soring",
-    "sorned",
-    "sorner",
-    "sotols",
-    "sotted",
-    "souari",
-    "soucar",
-    "soudan",
-    "soughs",
-    "souled",
-    "sourer",
-    "sourly",
-    "soused",
-    "souses",
-    "souths",
-    "sovran",
-    "sowans",
-    "sowars",
-    "sowcar",
-    "sowens",
-    "sozine",
-    "sozins",
-    "spaded",
-    "spadix",
-    "spahee",
-    "spahis",
-    "spails",
-    "spaits",
-    "spales",
-    "spalls",
-    "sparer",
-    "sparge",
-    "sparid",
-    "sparry",
-    "spates",
-    "spathe",
-    "spavie",
-    "spavin",
-    "speans",
-    "speels",
-    "speers",
-    "speils",
-    "speirs",
-    "speise",
-    "speiss",
-    "spelts",
-    "speltz",
-    "spendy",
-    "spense",
-    "sperms",
-    "spewer",
-    "sphene",
-    "sphery",
-    "sphynx",
-    "spicae",
-    "spicas",
-    "spicey",
-    "spicks",
-    "spiels",
-    "spiffs",
-    "spiker",
-    "spiled",
-    "spiles",
-    "spilth",
-    "spined",
-    "spinet",
-    "spinny",
-    "spinto",
-    "spirea",
-    "spired",
-    "spirem",
-    "spirts",
-    "spital",
-    "spited",
-    "spites",
-    "spivvy",
-    "splake",
-    "splats",
-    "splays",
-    "splent",
-    "spliff",
-    "splore",
-    "splosh",
-    "spodes",
-    "spoked",
-    "spoofy",
-    "spoony",
-    "spoors",
-    "sporal",
-    "spored",
-    "sprags",
-    "sprats",
-    "sprees",
-    "sprent",
-    "sprier",
-    "sprits",
-    "spritz",
-    "sprucy",
-    "sprues",
-    "sprugs",
-    "spryer",
-    "spryly",
-    "spuing",
-    "spumed",
-    "spumes",
-    "spunks",
-    "spurns",
-    "spurry",
-    "squabs",
-    "squama",
-    "squark",
-    "squaws",
-    "squegs",
-    "squibs",
-    "squill",
-    "squush",
-    "sradha",
-    "stacte",
-    "stades",
-    "stager",
-    "stagey",
-    "staggy",
-    "staigs",
-    "stalag",
-    "staled",
-    "staler",
-    "stales",
-    "stalky",
-    "stamen",
-    "stanch",
-    "staned",
-    "stanes",
-    "stangs",
-    "stanks",
-    "stanol",
-    "stapes",
-    "staphs",
-    "starer",
-    "stases",
-    "statal",
-    "staved",
-    "stayer",
-    "steads",
-    "steams",
-    "steeks",
-    "steeps",
-    "steeve",
-    "stelae",
-    "stelai",
-    "stelar",
-    "steles",
-    "stelic",
-    "stemma",
-    "stemmy",
-    "stenos",
-    "steres",
-    "sterns",
-    "stichs",
-    "stilly",
-    "stimes",
-    "stingo",
-    "stinko",
-    "stiped",
-    "stipel",
-    "stipes",
-    "stirks",
-    "stirps",
-    "stithy",
-    "stiver",
-    "stoats",
-    "stodge",
-    "stodgy",
-    "stogey",
-    "stogie",
-    "stoics",
-    "stoled",
-    "stolid",
-    "stolon",
-    "stomal",
-    "stomas",
-    "stooks",
-    "stoper",
-    "stopes",
-    "storax",
-    "stotin",
-    "stotts",
-    "stound",
-    "stoups",
-    "stoure",
-    "stours",
-    "stoury",
-    "stouts",
-    "stowps",
-    "strafe",
-    "strake",
-    "strass",
-    "strath",
-    "strati",
-    "strawy",
-    "streek",
-    "streel",
-    "streps",
-    "strews",
-    "striae",
-    "stript",
-    "stripy",
-    "strook",
-    "strops",
-    "strown",
-    "strows",
-    "stroys",
-    "struma",
-    "strums",
-    "strunt",
-    "studly",
-    "stulls",
-    "stupas",
-    "stupes",
-    "sturts",
-    "stying",
-    "stylar",
-    "stylet",
-    "styrax",
-    "suable",
-    "suably",
-    "suaver",
-    "subahs",
-    "subbed",
-    "subdeb",
-    "subers",
-    "subfix",
-    "subgum",
-    "sublot",
-    "suborn",
-    "succah",
-    "succor",
-    "suckle",
-    "sucres",
-    "sudary",
-    "sudors",
-    "sudsed",
-    "sudser",
-    "sudses",
-    "sueded",
-    "suedes",
-    "sughed",
-    "suints",
-    "sukkah",
-    "sulcal",
-    "suldan",
-    "sulfas",
-    "sulfid",
-    "sulked",
-    "sulker",
-    "sulpha",
-    "sumach",
-    "sumacs",
-    "summae",
-    "summas",
-    "sunbow",
-    "sundew",
-    "sundog",
-    "sunket",
-    "sunnas",
-    "sunned",
-    "sunups",
-    "supped",
-    "surahs",
-    "surger",
-    "surimi",
-    "surras",
-    "surtax",
-    "sushis",
-    "suslik",
-    "sussed",
-    "susses",
-    "sutler",
-    "suttas",
-    "suttee",
-    "svaraj",
-    "swabby",
-    "swaged",
-    "swager",
-    "swages",
-    "swails",
-    "swains",
-    "swamis",
-    "swanks",
-    "swanny",
-    "swaraj",
-    "swards",
-    "swarfs",
-    "swarth",
-    "swarty",
-    "swathe",
-    "swaths",
-    "swayer",
-    "sweepy",
-    "sweven",
-    "swills",
-    "swimmy",
-    "swinge",
-    "swingy",
-    "swinks",
-    "swipes",
-    "swiple",
-    "swirly",
-    "swishy",
-    "swithe",
-    "swived",
-    "swives",
-    "swivet",
-    "swoons",
-    "swoony",
-    "swoops",
-    "swoopy",
-    "swound",
-    "swouns",
-    "syboes",
-    "sycees",
-    "sylphs",
-    "sylphy",
-    "sylvae",
-    "sylvas",
-    "sylvin",
-    "synchs",
-    "syncom",
-    "syndet",
-    "syngas",
-    "synods",
-    "synura",
-    "sypher",
-    "syrens",
-    "syrinx",
-    "syrupy",
-    "sysops",
-    "syzygy",
-    "tabard",
-    "tabbis",
-    "tabers",
-    "tabors",
-    "tabour",
-    "tabued",
-    "tabuli",
-    "tabuns",
-    "taches",
-    "tacker",
-    "tacket",
-    "tackey",
-    "taenia",
-    "taffia",
-    "tafias",
-    "tagrag",
-    "tahini",
-    "tahsil",
-    "taigas",
-    "taints",
-    "taipan",
-    "takahe",
-    "takeup",
-    "takins",
-    "talars",
-    "talced",
-    "talcky",
-    "talcum",
-    "talers",
-    "talion",
-    "tallol",
-    "taluka",
-    "taluks",
-    "tamals",
-    "tamari",
-    "tambac",
-    "tambak",
-    "tambur",
-    "tamein",
-    "tamely",
-    "tamers",
-    "tamest",
-    "tampan",
-    "tamped",
-    "tanged",
-    "tangly",
-    "tangos",
-    "tanist",
-    "tankas",
-    "tanked",
-    "tanrec",
-    "tanuki",
-    "tapalo",
-    "tapirs",
-    "tappet",
-    "tarama",
-    "targes",
-    "taring",
-    "tarnal",
-    "tarocs",
-    "taroks",
-    "tarots",
-    "tarpan",
-    "tarres",
-    "tarsal",
-    "tarsia",
-    "tarted",
-    "tartly",
-    "tasses",
-    "tasset",
-    "tatars",
-    "taters",
-    "tatsoi",
-    "tatted",
-    "tatter",
-    "tattie",
-    "tattle",
-    "tauons",
-    "taupes",
-    "tauted",
-    "tauten",
-    "tauter",
-    "tautly",
-    "tautog",
-    "tawdry",
-    "tawers",
-    "tawing",
-    "tawney",
-    "tawpie",
-    "tawsed",
-    "tawses",
-    "taxeme",
-    "taxers",
-    "taxied",
-    "taxies",
-    "taxite",
-    "taxmen",
-    "taxols",
-    "taxons",
-    "tazzas",
-    "teabox",
-    "teapoy",
-    "teared",
-    "tearer",
-    "teasel",
-    "teated",
-    "teazel",
-    "teazle",
-    "tectal",
-    "tectum",
-    "tedded",
-    "tedder",
-    "teeing",
-    "teemed",
-    "teemer",
-    "teener",
-    "teensy",
-    "teethe",
-    "tegmen",
-    "teguas",
-    "teiids",
-    "teinds",
-    "tekkie",
-    "teledu",
-    "telega",
-    "telial",
-    "telium",
-    "tellys",
-    "telome",
-    "telson",
-    "temped",
-    "tenace",
-    "tenail",
-    "tendus",
-    "teniae",
-    "tenias",
-    "tenons",
-    "tenour",
-    "tenpin",
-    "tenrec",
-    "tenser",
-    "tenter",
-    "tentie",
-    "tenues",
-    "tenuis",
-    "tenuti",
-    "tenuto",
-    "teopan",
-    "tepals",
-    "tepees",
-    "tepefy",
-    "tephra",
-    "tepoys",
-    "terais",
-    "teraph",
-    "terbia",
-    "terbic",
-    "terces",
-    "tercet",
-    "teredo",
-    "terete",
-    "tergal",
-    "tergum",
-    "termer",
-    "termly",
-    "termor",
-    "ternes",
-    "terrae",
-    "terras",
-    "terret",
-    "territ",
-    "terser",
-    "teslas",
-    "testae",
-    "testee",
-    "teston",
-    "tetany",
-    "tetchy",
-    "tetrad",
-    "tetras",
-    "tetryl",
-    "tetter",
-    "tewing",
-    "thacks",
-    "thairm",
-    "thalli",
-    "thanes",
-    "tharms",
-    "thawer",
-    "thecae",
-    "thecal",
-    "thegns",
-    "theine",
-    "theins",
-    "thenal",
-    "thenar",
-    "therme",
-    "therms",
-    "thesps",
-    "thetas",
-    "thetic",
-    "thicks",
-    "thieve",
-    "thills",
-    "thiols",
-    "thiram",
-    "thirls",
-    "tholed",
-    "tholes",
-    "tholoi",
-    "tholos",
-    "thoria",
-    "thoric",
-    "thoron",
-    "thorps",
-    "thoued",
-    "thrave",
-    "thrawn",
-    "thraws",
-    "threap",
-    "threep",
-    "throbs",
-    "throve",
-    "thrums",
-    "thujas",
-    "thulia",
-    "thunks",
-    "thurls",
-    "thuyas",
-    "thwack",
-    "thymes",
-    "thymey",
-    "thymol",
-    "thyrse",
-    "thyrsi",
-    "tibiae",
-    "tibias",
-    "ticals",
-    "ticced",
-    "tictac",
-    "tictoc",
-    "tiddly",
-    "tidied",
-    "tidier",
-    "tidies",
-    "tidily",
-    "tiding",
-    "tieing",
-    "tiepin",
-    "tierce",
-    "tiffed",
-    "tiglon",
-    "tigons",
-    "tikkas",
-    "tilaks",
-    "tildes",
-    "tilers",
-    "tilter",
-    "tilths",
-    "timbal",
-    "tincal",
-    "tincts",
-    "tineal",
-    "tineas",
-    "tineid",
-    "tinful",
-    "tinges",
-    "tingly",
-    "tinier",
-    "tinily",
-    "tining",
-    "tinkly",
-    "tinman",
-    "tinmen",
-    "tinner",
-    "tinpot",
-    "tinter",
-    "tipcat",
-    "tipoff",
-    "tippet",
-    "tipple",
-    "tiptop",
-    "tirled",
-    "tisane",
-    "titbit",
-    "titfer",
-    "tithed",
-    "tither",
-    "titman",
-    "titmen",
-    "titter",
-    "tittup",
-    "tmeses",
-    "tmesis",
-    "tobies",
-    "tocher",
-    "tocsin",
-    "toddle",
-    "todies",
-    "toecap",
-    "toeing",
-    "togaed",
-    "togate",
-    "togged",
-    "togues",
-    "toiler",
-    "toiles",
-    "toited",
-    "tokays",
-    "tokers",
-    "toking",
-    "tolane",
-    "tolans",
-    "tolars",
-    "toling",
-    "toller",
-    "toluic",
-    "toluid",
-    "toluol",
-    "toluyl",
-    "tolyls",
-    "tomans",
-    "tombac",
-    "tombak",
-    "tombal",
-    "tombed",
-    "tomcod",
-    "tommed",
-    "tomtit",
-    "tondos",
-    "toneme",
-    "tongas",
-    "tonged",
-    "tonger",
-    "tonier",
-    "tonish",
-    "tonlet",
-    "tooler",
-    "toonie",
-    "tooted",
-    "tooter",
-    "tooths",
-    "toothy",
-    "tootle",
-    "tootsy",
-    "topees",
-    "topers",
-    "topful",
-    "tophes",
-    "tophus",
-    "toping",
-    "toquet",
-    "torahs",
-    "torchy",
-    "torero",
-    "torics",
-    "toroid",
-    "torose",
-    "toroth",
-    "torous",
-    "torpid",
-    "torpor",
-    "torses",
-    "torsks",
-    "torsos",
-    "tortas",
-    "torten",
-    "tortes",
-    "torula",
-    "toshes",
-    "tosser",
-    "tossup",
-    "toters",
-    "tother",
-    "totted",
-    "totter",
-    "toughs",
-    "toughy",
-    "toused",
-    "touses",
-    "tousle",
-    "touter",
-    "touzle",
-    "towage",
-    "towery",
-    "towhee",
-    "towies",
-    "townee",
-    "townie",
-    "toxine",
-    "toyers",
-    "toyish",
-    "toyons",
-    "tragus",
-    "traiks",
-    "tramel",
-    "trampy",
-    "tranks",
-    "tranqs",
-    "trapan",
-    "trapes",
-    "traves",
-    "trebly",
-    "treens",
-    "trefah",
-    "trepan",
-    "trepid",
-    "tressy",
-    "trevet",
-    "triacs",
-    "triced",
-    "tricep",
-    "trices",
-    "triene",
-    "triens",
-    "triers",
-    "trifid",
-    "trigly",
-    "trigon",
-    "trigos",
-    "trijet",
-    "trilby",
-    "trills",
-    "trimer",
-    "trimly",
-    "trinal",
-    "trined",
-    "trines",
-    "triols",
-    "triose",
-    "tripes",
-    "triply",
-    "tripos",
-    "triter",
-    "troaks",
-    "trocar",
-    "troche",
-    "trocks",
-    "troked",
-    "trokes",
-    "trolly",
-    "tromps",
-    "tronas",
-    "trones",
-    "tropin",
-    "troths",
-    "trotyl",
-    "trouts",
-    "trouty",
-    "trover",
-    "troves",
-    "trowed",
-    "trowth",
-    "truced",
-    "truces",
-    "trudge",
-    "truffe",
-    "truing",
-    "trulls",
-    "tryste",
-    "trysts",
-    "tsades",
-    "tsadis",
-    "tsking",
-    "tsktsk",
-    "tsores",
-    "tsoris",
-    "tsuris",
-    "tubate",
-    "tubbed",
-    "tubber",
-    "tubful",
-    "tubist",
-    "tuchun",
-    "tucket",
-    "tuffet",
-    "tufoli",
-    "tufter",
-    "tugger",
-    "tuille",
-    "tuladi",
-    "tulles",
-    "tumefy",
-    "tumped",
-    "tumuli",
-    "tunned",
-    "tupiks",
-    "tupped",
-    "tuques",
-    "turaco",
-    "turbit",
-    "turbot",
-    "turfed",
-    "turgid",
-    "turgor",
-    "turnon",
-    "turnup",
-    "turves",
-    "tusche",
-    "tushed",
-    "tushes",
-    "tushie",
-    "tusked",
-    "tusker",
-    "tussah",
-    "tussal",
-    "tussar",
-    "tusseh",
-    "tusser",
-    "tusses",
-    "tussis",
-    "tussor",
-    "tussur",
-    "tutees",
-    "tutted",
-    "tuttis",
-    "tutued",
-    "tuyere",
-    "tuyers",
-    "twains",
-    "twangs",
-    "twangy",
-    "twanky",
-    "tweaky",
-    "tweeds",
-    "tweeny",
-    "tweets",
-    "tweeze",
-    "twerps",
-    "twibil",
-    "twiers",
-    "twilit",
-    "twills",
-    "twined",
-    "twiner",
-    "twines",
-    "twinge",
-    "twirls",
-    "twirly",
-    "twirps",
-    "twofer",
-    "twyers",
-    "tymbal",
-    "tympan",
-    "tyning",
-    "typhon",
-    "typier",
-    "typify",
-    "tyring",
-    "tythed",
-    "tythes",
-    "tzetze",
-    "tzuris",
-    "uakari",
-    "ubiety",
-    "ubique",
-    "udders",
-    "uglies",
-    "uglify",
-    "uglily",
-    "ugsome",
-    "uhlans",
-    "ukases",
-    "ulamas",
-    "ulemas",
-    "ullage",
-    "ultras",
-    "umamis",
-    "umbels",
-    "umbers",
-    "umbles",
-    "umbrae",
-    "umbral",
-    "umbras",
-    "umiack",
-    "umiacs",
-    "umiaks",
-    "umiaqs",
-    "umping",
-    "unaged",
-    "unakin",
-    "unarms",
-    "unawed",
-    "unaxed",
-    "unbale",
-    "unbans",
-    "unbars",
-    "unbear",
-    "unbelt",
-    "unbend",
-    "unbent",
-    "unbind",
-    "unbolt",
-    "unbred",
-    "unbusy",
-    "uncage",
-    "uncake",
-    "uncaps",
-    "uncase",
-    "uncast",
-    "unchic",
-    "unciae",
-    "uncial",
-    "uncini",
-    "unclad",
-    "unclip",
-    "unclog",
-    "uncock",
-    "uncoil",
-    "uncork",
-    "uncuff",
-    "uncurb",
-    "uncurl",
-    "uncute",
-    "undine",
-    "undock",
-    "undoer",
-    "undoes",
-    "undraw",
-    "undrew",
-    "undyed",
-    "unfelt",
-    "unfits",
-    "unfixt",
-    "unfond",
-    "unfree",
-    "unfurl",
-    "ungird",
-    "ungirt",
-    "unglue",
-    "ungual",
-    "ungues",
-    "unguis",
-    "ungula",
-    "unhair",
-    "unhand",
-    "unhang",
-    "unhats",
-    "unhelm",
-    "unhewn",
-    "unhood",
-    "unhook",
-    "unhung",
-    "unhusk",
-    "unific",
-    "unipod",
-    "uniter",
-    "unjams",
-    "unkend",
-    "unkent",
-    "unkept",
-    "unkink",
-    "unknit",
-    "unknot",
-    "unlace",
-    "unlade",
-    "unlaid",
-    "unlash",
-    "unlays",
-    "unlead",
-    "unlive",
-    "unmade",
-    "unmake",
-    "unmans",
-    "unmeet",
-    "unmesh",
-    "unmews",
-    "unmixt",
-    "unmold",
-    "unmoor",
-    "unmown",
-    "unnail",
-    "unopen",
-    "unpegs",
-    "unpens",
-    "unpent",
-    "unpick",
-    "unpile",
-    "unpins",
-    "unpure",
-    "unreel",
-    "unrent",
-    "unrigs",
-    "unripe",
-    "unrips",
-    "unrobe",
-    "unroof",
-    "unroot",
-    "unrove",
-    "unsawn",
-    "unsays",
-    "unseal",
-    "unseam",
-    "unsell",
-    "unsent",
-    "unsets",
-    "unsewn",
-    "unsews",
-    "unsexy",
-    "unshed",
-    "unship",
-    "unshod",
-    "unshut",
-    "unsnag",
-    "unsnap",
-    "unsown",
-    "unspun",
-    "unstep",
-    "unstop",
-    "unsunk",
-    "untack",
-    "untame",
-    "unties",
-    "untorn",
-    "untrim",
-    "untrod",
-    "untuck",
-    "untune",
-    "unvext",
-    "unwept",
-    "unwish",
-    "unwits",
-    "unwove",
-    "unyoke",
-    "unzips",
-    "upases",
-    "upbear",
-    "upbind",
-    "upboil",
-    "upbore",
-    "upbows",
-    "upcast",
-    "upcoil",
-    "upcurl",
-    "updart",
-    "updive",
-    "updove",
-    "upends",
-    "upflow",
-    "upfold",
-    "upgaze",
-    "upgird",
-    "upgirt",
-    "upgrew",
-    "upgrow",
-    "upheap",
-    "uphove",
-    "uphroe",
-    "upleap",
-    "upmost",
-    "uppile",
-    "uppish",
-    "upprop",
-    "uprate",
-    "uprear",
-    "uprise",
-    "uprose",
-    "uprush",
-    "upsend",
-    "upsent",
-    "upsize",
-    "upsoar",
-    "upstep",
-    "upstir",
-    "uptalk",
-    "uptear",
-    "uptick",
-    "uptilt",
-    "uptore",
-    "uptorn",
-    "uptoss",
-    "upwaft",
-    "upwell",
-    "uraeus",
-    "uranic",
-    "uranyl",
-    "urares",
-    "uraris",
-    "urases",
-    "urates",
-    "uratic",
-    "urbias",
-    "urease",
-    "uredia",
-    "uredos",
-    "ureide",
-    "uremia",
-    "uremic",
-    "uretic",
-    "urgers",
-    "urials",
-    "urines",
-    "uropod",
-    "urping",
-    "ursids",
-    "ursine",
-    "urtext",
-    "uruses",
-    "usably",
-    "usance",
-    "usneas",
-    "usques",
-    "usuals",
-    "usurer",
-    "usurps",
-    "uveous",
-    "uvulae",
-    "uvular",
-    "uvulas",
-    "vagary",
-    "vagile",
-    "vagrom",
-    "vaguer",
-    "vahine",
-    "vailed",
-    "vainer",
-    "vakeel",
-    "vakils",
-    "valets",
-    "valgus",
-    "valise",
-    "valkyr",
-    "valors",
-    "valses",
-    "valval",
-    "valvar",
-    "valved",
-    "vamose",
-    "vamped",
-    "vamper",
-    "vandas",
-    "vanman",
-    "vanmen",
-    "vanned",
-    "vanner",
-    "vapory",
-    "varias",
-    "varier",
-    "varlet",
-    "varnas",
-    "varoom",
-    "varved",
-    "varves",
-    "vaster",
-    "vatful",
-    "vatted",
-    "vaulty",
-    "vaunts",
-    "vaunty",
-    "vaward",
-    "vealed",
-    "vealer",
-    "veejay",
-    "veenas",
-    "veepee",
-    "vegete",
-    "vegged",
-    "vegies",
-    "veiler",
-    "veinal",
-    "veiner",
-    "velars",
-    "velate",
-    "veldts",
-    "velure",
-    "vended",
-    "vendue",
-    "venene",
-    "venery",
-    "venged",
-    "venges",
-    "venial",
-    "venine",
-    "venins",
-    "venire",
-    "venose",
-    "venule",
-    "verbid",
-    "verdin",
-    "verged",
-    "verger",
-    "verier",
-    "verism",
-    "verist",
-    "verite",
-    "vermes",
-    "vermis",
-    "vernix",
-    "versal",
-    "verser",
-    "verset",
-    "versos",
-    "verste",
-    "versts",
-    "vertus",
-    "verves",
-    "vervet",
-    "vesica",
-    "vespid",
-    "vestee",
-    "vetoer",
-    "vexers",
-    "vexils",
-    "viably",
-    "vialed",
-    "viands",
-    "viatic",
-    "vibist",
-    "vicars",
-    "vicing",
-    "vicuna",
-    "vigias",
-    "vigors",
-    "vilely",
-    "vilest",
-    "vilify",
-    "villae",
-    "villus",
-    "vimina",
-    "vinals",
-    "vincas",
-    "vineal",
-    "vinery",
-    "vinier",
-    "vinify",
-    "vinous",
-    "vireos",
-    "virgas",
-    "viroid",
-    "virtus",
-    "visaed",
-    "visard",
-    "viscid",
-    "viscus",
-    "viseed",
-    "vising",
-    "visive",
-    "vitric",
-    "vittae",
-    "vittle",
-    "vivary",
-    "vivers",
-    "vivify",
-    "vizard",
-    "vizirs",
-    "vizors",
-    "vocabs",
-    "vodoun",
-    "vodous",
-    "voduns",
-    "vogued",
-    "voguer",
-    "vogues",
-    "voicer",
-    "voider",
-    "voiles",
-    "volery",
-    "voling",
-    "volost",
-    "voltes",
-    "volute",
-    "volvas",
-    "volvox",
-    "vomers",
-    "vomica",
-    "vomito",
-    "vomits",
-    "votary",
-    "voudon",
-    "vowers",
-    "vrooms",
-    "vrouws",
-    "vulgus",
-    "vulvae",
-    "vulval",
-    "vulvas",
-    "wabble",
-    "wabbly",
-    "wackes",
-    "wadded",
-    "wadder",
-    "waddie",
-    "waddly",
-    "wadies",
-    "wadmal",
-    "wadmel",
-    "wadmol",
-    "wadset",
-    "waeful",
-    "wafery",
-    "waffed",
-    "waffie",
-    "waffly",
-    "wafted",
-    "wafter",
-    "wagged",
-    "wagger",
-    "waggle",
-    "waggly",
-    "waggon",
-    "wahoos",
-    "waifed",
-    "wailer",
-    "waired",
-    "waists",
-    "wakame",
-    "wakens",
-    "wakers",
-    "wakiki",
-    "walers",
-    "walies",
-    "waling",
-    "wallah",
-    "wallas",
-    "wallie",
-    "wamble",
-    "wambly",
-    "wammus",
-    "wampus",
-    "wandle",
-    "wangan",
-    "wangle",
-    "wangun",
-    "wanier",
-    "wanion",
-    "wanked",
-    "wanned",
-    "wanner",
-    "wanter",
-    "wapiti",
-    "wapped",
-    "warble",
-    "warded",
-    "warier",
-    "warked",
-    "warper",
-    "warred",
-    "warsle",
-    "warted",
-    "washup",
-    "wastry",
-    "watape",
-    "wataps",
-    "watter",
-    "waucht",
-    "waught",
-    "wauked",
-    "wauled",
-    "wavery",
-    "waveys",
-    "wavier",
-    "wavies",
-    "wavily",
-    "wawled",
-    "waxers",
-    "waxier",
-    "waxily",
-    "waylay",
-    "wazoos",
-    "weakon",
-    "wealds",
-    "weaner",
-    "weason",
-    "webers",
-    "webfed",
-    "wechts",
-    "wedder",
-    "wedeln",
-    "wedels",
-    "weeder",
-    "weened",
-    "weensy",
-    "weeper",
-    "weepie",
-    "weeted",
-    "weever",
-    "weewee",
-    "weirds",
-    "weirdy",
-    "weldor",
-    "welkin",
-    "welled",
-    "wellie",
-    "welted",
-    "wended",
-    "weskit",
-    "whacko",
-    "whacks",
-    "whacky",
-    "whaled",
-    "whammo",
-    "whangs",
-    "wharfs",
-    "wharve",
-    "whaups",
-    "wheals",
-    "wheats",
-    "wheens",
-    "wheeps",
-    "wheezy",
-    "whelks",
-    "whelky",
-    "whelms",
-    "whelps",
-    "whenas",
-    "wherry",
-    "wherve",
-    "wheyey",
-    "whidah",
-    "whiffs",
-    "whiled",
-    "whilom",
-    "whiner",
-    "whiney",
-    "whinge",
-    "whinny",
-    "whippy",
-    "whirls",
-    "whirly",
-    "whirrs",
-    "whirry",
-    "whisht",
-    "whisks",
-    "whists",
-    "whizzy",
-    "whomps",
-    "whomso",
-    "whoofs",
-    "whored",
-    "whorls",
-    "whorts",
-    "whosis",
-    "whumps",
-    "whydah",
-    "wiccas",
-    "wiches",
-    "wicopy",
-    "widder",
-    "widdie",
-    "widdle",
-    "widish",
-    "wieldy",
-    "wienie",
-    "wifely",
-    "wifeys",
-    "wifing",
-    "wigans",
-    "wigeon",
-    "wigged",
-    "wights",
-    "wiglet",
-    "wigwag",
-    "wikiup",
-    "wilded",
-    "wilier",
-    "wilily",
-    "wiling",
-    "willer",
-    "willet",
-    "wimble",
-    "wimmin",
-    "wimped",
-    "wimple",
-    "wincer",
-    "winces",
-    "wincey",
-    "windle",
-    "windup",
-    "winier",
-    "winish",
-    "winker",
-    "winned",
-    "winnow",
-    "winoes",
-    "wintle",
-    "winzes",
-    "wirers",
-    "wirier",
-    "wirily",
-    "wisent",
-    "wisher",
-    "wising",
-    "wisped",
-    "wissed",
-    "wisses",
-    "wisted",
-    "witans",
-    "withed",
-    "withes",
-    "witing",
-    "wittol",
-    "wivern",
-    "wivers",
-    "wiving",
-    "wizens",
-    "wizzen",
-    "wizzes",
-    "woaded",
-    "woalds",
-    "wodges",
-    "wolfed",
-    "wolfer",
-    "wolver",
-    "wombed",
-    "womera",
-    "wonned",
-    "wonner",
-    "wonted",
-    "wonton",
-    "wooers",
-    "woofed",
-    "wooled",
-    "wooler",
-    "woolie",
-    "wormil",
-    "worrit",
-    "worser",
-    "worses",
-    "worset",
-    "worsts",
-    "worths",
-    "wotted",
-    "wovens",
-    "wowing",
-    "wowser",
-    "wracks",
-    "wrangs",
-    "wraths",
-    "wrathy",
-    "wreaks",
-    "wrests",
-    "wricks",
-    "wriest",
-    "wrings",
-    "wristy",
-    "writhe",
-    "wryest",
-    "wrying",
-    "wursts",
-    "wurzel",
-    "wusses",
-    "wuther",
-    "wyches",
-    "wyling",
-    "wyting",
-    "xebecs",
-    "xenial",
-    "xenias",
-    "xenons",
-    "xylans",
-    "xylems",
-    "xyloid",
-    "xylols",
-    "xylyls",
-    "xyster",
-    "xystoi",
-    "xystos",
-    "xystus",
-    "yabber",
-    "yabbie",
-    "yacked",
-    "yaffed",
-    "yagers",
-    "yairds",
-    "yakked",
-    "yakker",
-    "yamens",
-    "yammer",
-    "yamuns",
-    "yanqui",
-    "yapock",
-    "yapoks",
-    "yapons",
-    "yapped",
-    "yapper",
-    "yarded",
-    "yarely",
-    "yarest",
-    "yarned",
-    "yarner",
-    "yasmak",
-    "yatter",
-    "yauped",
-    "yauper",
-    "yaupon",
-    "yautia",
-    "yawing",
-    "yawled",
-    "yawner",
-    "yawped",
-    "yawper",
-    "yclept",
-    "yeaned",
-    "yeasty",
-    "yecchs",
-    "yeelin",
-    "yeller",
-    "yelped",
-    "yelper",
-    "yenned",
-    "yentas",
-    "yentes",
-    "yeomen",
-    "yerbas",
-    "yerked",
-    "yessed",
-    "yesses",
-    "yester",
-    "yeuked",
-    "yipped",
-    "yippie",
-    "yirred",
-    "yirths",
-    "yobbos",
-    "yocked",
-    "yodels",
-    "yodled",
-    "yodler",
-    "yodles",
-    "yogees",
-    "yogini",
-    "yogins",
-    "yoicks",
-    "yokels",
-    "yoking",
-    "yolked",
-    "yonker",
-    "youpon",
-    "yowies",
-    "yowing",
-    "yowled",
-    "yowler",
-    "yttria",
-    "yttric",
-    "yuccas",
-    "yucked",
-    "yukked",
-    "yulans",
-    "yupons",
-    "yutzes",
-    "zaddik",
-    "zaffar",
-    "zaffer",
-    "zaffir",
-    "zaffre",
-    "zaftig",
-    "zagged",
-    "zaikai",
-    "zaires",
-    "zamias",
-    "zanana",
-    "zanier",
-    "zanies",
-    "zanily",
-    "zanzas",
-    "zareba",
-    "zariba",
-    "zayins",
-    "zazens",
-    "zeatin",
-    "zebeck",
-    "zebecs",
-    "zechin",
-    "zenana",
-    "zeroth",
-    "zested",
-    "zester",
-    "zeugma",
-    "zibeth",
-    "zibets",
-    "zigged",
-    "zillah",
-    "zinced",
-    "zincic",
-    "zincky",
-    "zinebs",
-    "zinged",
-    "zirams",
-    "zither",
-    "zizith",
-    "zizzle",
-    "zoaria",
-    "zocalo",
-    "zoecia",
-    "zoftig",
-    "zombis",
-    "zonary",
-    "zonate",
-    "zoners",
-    "zonked",
-    "zonula",
-    "zonule",
-    "zooids",
-    "zooier",
-    "zoonal",
-    "zooned",
-    "zorils",
-    "zouave",
-    "zounds",
-    "zoysia",
-    "zygoid",
-    "zygoma",
-    "zygose",
-    "zymase",
-]
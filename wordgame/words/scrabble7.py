@@ -1,24031 +0,0 @@
-WORDS = [
-    "contact",
-    "service",
-    "product",
-    "support",
-    "message",
-    "through",
-    "privacy",
-    "company",
-    "general",
-    "reviews",
-    "program",
-    "details",
-    "because",
-    "results",
-    "address",
-    "subject",
-    "between",
-    "special",
-    "website",
-    "project",
-    "version",
-    "section",
-    "related",
-    "members",
-    "network",
-    "systems",
-    "without",
-    "current",
-    "control",
-    "history",
-    "account",
-    "digital",
-    "profile",
-    "another",
-    "quality",
-    "listing",
-    "content",
-    "country",
-    "private",
-    "compare",
-    "include",
-    "college",
-    "article",
-    "provide",
-    "process",
-    "science",
-    "english",
-    "windows",
-    "gallery",
-    "however",
-    "library",
-    "medical",
-    "looking",
-    "comment",
-    "working",
-    "against",
-    "payment",
-    "student",
-    "problem",
-    "options",
-    "example",
-    "changes",
-    "release",
-    "request",
-    "picture",
-    "meeting",
-    "similar",
-    "schools",
-    "million",
-    "popular",
-    "stories",
-    "journal",
-    "reports",
-    "welcome",
-    "central",
-    "council",
-    "archive",
-    "society",
-    "friends",
-    "edition",
-    "further",
-    "updated",
-    "already",
-    "studies",
-    "several",
-    "display",
-    "limited",
-    "powered",
-    "natural",
-    "whether",
-    "weather",
-    "average",
-    "records",
-    "present",
-    "written",
-    "federal",
-    "hosting",
-    "tickets",
-    "finance",
-    "minutes",
-    "reading",
-    "usually",
-    "percent",
-    "getting",
-    "various",
-    "receive",
-    "methods",
-    "chapter",
-    "manager",
-    "license",
-    "holiday",
-    "writing",
-    "effects",
-    "created",
-    "kingdom",
-    "thought",
-    "storage",
-    "summary",
-    "western",
-    "overall",
-    "package",
-    "players",
-    "started",
-    "someone",
-    "printer",
-    "believe",
-    "nothing",
-    "certain",
-    "running",
-    "jewelry",
-    "islands",
-    "sellers",
-    "lesbian",
-    "machine",
-    "returns",
-    "capital",
-    "culture",
-    "courses",
-    "airport",
-    "foreign",
-    "outside",
-    "channel",
-    "located",
-    "primary",
-    "numbers",
-    "browser",
-    "purpose",
-    "feature",
-    "cameras",
-    "ratings",
-    "sources",
-    "regular",
-    "station",
-    "rentals",
-    "improve",
-    "parents",
-    "kitchen",
-    "wedding",
-    "disease",
-    "perfect",
-    "classic",
-    "command",
-    "express",
-    "success",
-    "maximum",
-    "warning",
-    "forward",
-    "flowers",
-    "animals",
-    "housing",
-    "catalog",
-    "traffic",
-    "testing",
-    "instead",
-    "leading",
-    "fitness",
-    "opinion",
-    "greater",
-    "develop",
-    "artists",
-    "session",
-    "century",
-    "pacific",
-    "mailing",
-    "vehicle",
-    "default",
-    "require",
-    "outdoor",
-    "morning",
-    "protein",
-    "partner",
-    "authors",
-    "faculty",
-    "parties",
-    "mission",
-    "ability",
-    "battery",
-    "defined",
-    "playing",
-    "virtual",
-    "answers",
-    "offered",
-    "surface",
-    "minimum",
-    "variety",
-    "finally",
-    "updates",
-    "desktop",
-    "classes",
-    "officer",
-    "respect",
-    "unknown",
-    "teacher",
-    "workers",
-    "fucking",
-    "showing",
-    "benefit",
-    "funding",
-    "devices",
-    "fiction",
-    "watches",
-    "careers",
-    "complex",
-    "setting",
-    "economy",
-    "highest",
-    "helpful",
-    "monthly",
-    "musical",
-    "changed",
-    "largest",
-    "justice",
-    "connect",
-    "applied",
-    "advance",
-    "auction",
-    "allowed",
-    "correct",
-    "selling",
-    "species",
-    "pricing",
-    "fashion",
-    "monitor",
-    "trading",
-    "clients",
-    "actions",
-    "discuss",
-    "markets",
-    "leather",
-    "patient",
-    "perhaps",
-    "persons",
-    "village",
-    "amateur",
-    "factors",
-    "balance",
-    "replies",
-    "initial",
-    "fishing",
-    "fantasy",
-    "letters",
-    "context",
-    "install",
-    "apparel",
-    "johnson",
-    "quickly",
-    "dollars",
-    "driving",
-    "surgery",
-    "brought",
-    "himself",
-    "diamond",
-    "servers",
-    "seconds",
-    "keyword",
-    "freedom",
-    "premium",
-    "upgrade",
-    "growing",
-    "hearing",
-    "eastern",
-    "therapy",
-    "entries",
-    "serious",
-    "bondage",
-    "efforts",
-    "nursing",
-    "defense",
-    "covered",
-    "protect",
-    "prevent",
-    "finding",
-    "affairs",
-    "towards",
-    "suggest",
-    "charges",
-    "reasons",
-    "talking",
-    "element",
-    "quarter",
-    "missing",
-    "centers",
-    "opening",
-    "reserve",
-    "recipes",
-    "plastic",
-    "produce",
-    "counter",
-    "failure",
-    "follows",
-    "weekend",
-    "readers",
-    "leaders",
-    "posters",
-    "parking",
-    "brother",
-    "pattern",
-    "theatre",
-    "earlier",
-    "sponsor",
-    "objects",
-    "evening",
-    "nuclear",
-    "promote",
-    "appears",
-    "decided",
-    "designs",
-    "tourism",
-    "savings",
-    "graphic",
-    "binding",
-    "winning",
-    "credits",
-    "clearly",
-    "enlarge",
-    "revenue",
-    "measure",
-    "flights",
-    "experts",
-    "vintage",
-    "exactly",
-    "explore",
-    "concept",
-    "reality",
-    "billion",
-    "nations",
-    "speaker",
-    "offices",
-    "managed",
-    "theater",
-    "springs",
-    "perform",
-    "healthy",
-    "drivers",
-    "figures",
-    "married",
-    "sharing",
-    "waiting",
-    "banking",
-    "conduct",
-    "calling",
-    "serving",
-    "matters",
-    "reduced",
-    "physics",
-    "extreme",
-    "samples",
-    "removed",
-    "singles",
-    "amounts",
-    "contain",
-    "crystal",
-    "academy",
-    "dynamic",
-    "regions",
-    "meaning",
-    "posting",
-    "instant",
-    "viewing",
-    "aspects",
-    "utility",
-    "preview",
-    "despite",
-    "degrees",
-    "seeking",
-    "phoenix",
-    "comfort",
-    "smoking",
-    "becomes",
-    "achieve",
-    "carried",
-    "clothes",
-    "circuit",
-    "printed",
-    "removal",
-    "factory",
-    "revised",
-    "optical",
-    "amazing",
-    "feeling",
-    "bedroom",
-    "lawyers",
-    "advisor",
-    "remains",
-    "generic",
-    "transit",
-    "compact",
-    "keeping",
-    "attempt",
-    "matches",
-    "engines",
-    "climate",
-    "alcohol",
-    "walking",
-    "explain",
-    "smaller",
-    "modules",
-    "concern",
-    "holding",
-    "trouble",
-    "dealers",
-    "helping",
-    "totally",
-    "organic",
-    "leaving",
-    "cooking",
-    "respond",
-    "entered",
-    "highway",
-    "booking",
-    "portion",
-    "biology",
-    "ancient",
-    "leisure",
-    "learned",
-    "husband",
-    "concert",
-    "adopted",
-    "carrier",
-    "reflect",
-    "deliver",
-    "lessons",
-    "treated",
-    "confirm",
-    "neither",
-    "offline",
-    "replace",
-    "reached",
-    "blowjob",
-    "enabled",
-    "enhance",
-    "adapter",
-    "laptops",
-    "editors",
-    "threads",
-    "supreme",
-    "weapons",
-    "episode",
-    "planned",
-    "charged",
-    "gourmet",
-    "prepare",
-    "illegal",
-    "premier",
-    "consent",
-    "contest",
-    "chamber",
-    "typical",
-    "chicken",
-    "sending",
-    "tonight",
-    "formula",
-    "periods",
-    "attacks",
-    "resorts",
-    "biggest",
-    "visitor",
-    "gateway",
-    "drawing",
-    "ordered",
-    "happens",
-    "romance",
-    "focused",
-    "bargain",
-    "hunting",
-    "cutting",
-    "writers",
-    "mapping",
-    "indexed",
-    "cartoon",
-    "granted",
-    "choices",
-    "outlook",
-    "massive",
-    "poverty",
-    "mystery",
-    "journey",
-    "bidding",
-    "charter",
-    "blogger",
-    "reverse",
-    "deposit",
-    "seminar",
-    "specify",
-    "formats",
-    "depends",
-    "editing",
-    "notices",
-    "airline",
-    "surveys",
-    "sitting",
-    "putting",
-    "trailer",
-    "gardens",
-    "antique",
-    "willing",
-    "density",
-    "hundred",
-    "strange",
-    "breasts",
-    "mention",
-    "amended",
-    "operate",
-    "doctors",
-    "domains",
-    "siemens",
-    "capture",
-    "buffalo",
-    "camping",
-    "welfare",
-    "massage",
-    "closing",
-    "monster",
-    "columns",
-    "cookies",
-    "cruises",
-    "forever",
-    "captain",
-    "imagine",
-    "heating",
-    "scripts",
-    "dealing",
-    "liberal",
-    "hobbies",
-    "console",
-    "shipped",
-    "voltage",
-    "loading",
-    "ongoing",
-    "imaging",
-    "betting",
-    "liberty",
-    "convert",
-    "analyst",
-    "derived",
-    "postage",
-    "applies",
-    "casinos",
-    "filters",
-    "capable",
-    "elected",
-    "victory",
-    "citizen",
-    "anytime",
-    "lecture",
-    "genetic",
-    "promise",
-    "cabinet",
-    "tiffany",
-    "collect",
-    "streets",
-    "turning",
-    "inquiry",
-    "checked",
-    "exhibit",
-    "visible",
-    "mercury",
-    "victims",
-    "burning",
-    "coupons",
-    "obvious",
-    "passing",
-    "awarded",
-    "masters",
-    "commons",
-    "arrival",
-    "pottery",
-    "awesome",
-    "desired",
-    "assumes",
-    "heights",
-    "expense",
-    "venture",
-    "healing",
-    "studios",
-    "buttons",
-    "winners",
-    "rolling",
-    "arrived",
-    "creates",
-    "tourist",
-    "senator",
-    "lodging",
-    "stopped",
-    "closely",
-    "visited",
-    "targets",
-    "counsel",
-    "invited",
-    "farmers",
-    "queries",
-    "absence",
-    "nearest",
-    "cluster",
-    "vendors",
-    "whereas",
-    "partial",
-    "couples",
-    "ranking",
-    "sublime",
-    "trusted",
-    "receipt",
-    "knowing",
-    "uniform",
-    "dancing",
-    "publish",
-    "pioneer",
-    "acrobat",
-    "thermal",
-    "telling",
-    "coastal",
-    "charity",
-    "segment",
-    "realize",
-    "insight",
-    "secrets",
-    "penalty",
-    "glasses",
-    "enables",
-    "builder",
-    "outcome",
-    "centres",
-    "charger",
-    "cooling",
-    "divorce",
-    "shopper",
-    "exposed",
-    "telecom",
-    "founded",
-    "chronic",
-    "trained",
-    "tobacco",
-    "pension",
-    "worship",
-    "herself",
-    "damages",
-    "diverse",
-    "passion",
-    "defence",
-    "patches",
-    "divided",
-    "insider",
-    "pleased",
-    "vitamin",
-    "genuine",
-    "raising",
-    "billing",
-    "combine",
-    "examine",
-    "bristol",
-    "sectors",
-    "grounds",
-    "regards",
-    "baskets",
-    "studied",
-    "profits",
-    "florist",
-    "funeral",
-    "enjoyed",
-    "charlie",
-    "nipples",
-    "noticed",
-    "signals",
-    "symbols",
-    "holders",
-    "witness",
-    "collins",
-    "gadgets",
-    "impacts",
-    "induced",
-    "linking",
-    "appeals",
-    "illness",
-    "pending",
-    "teenage",
-    "secured",
-    "unusual",
-    "routine",
-    "toolbar",
-    "wearing",
-    "mounted",
-    "habitat",
-    "scanner",
-    "integer",
-    "engaged",
-    "falling",
-    "dropped",
-    "besides",
-    "moments",
-    "strings",
-    "torture",
-    "deleted",
-    "antenna",
-    "assumed",
-    "killing",
-    "brokers",
-    "seasons",
-    "pissing",
-    "latinas",
-    "suppose",
-    "involve",
-    "younger",
-    "rapidly",
-    "fisting",
-    "outline",
-    "holland",
-    "demands",
-    "careful",
-    "tracked",
-    "minimal",
-    "lottery",
-    "licence",
-    "consult",
-    "greatly",
-    "cycling",
-    "quantum",
-    "largely",
-    "pointer",
-    "stretch",
-    "permits",
-    "cleaner",
-    "cricket",
-    "feeding",
-    "customs",
-    "rainbow",
-    "decline",
-    "proceed",
-    "founder",
-    "dispute",
-    "adverse",
-    "excerpt",
-    "perfume",
-    "restore",
-    "creator",
-    "museums",
-    "tracker",
-    "passage",
-    "headset",
-    "suicide",
-    "logical",
-    "extract",
-    "payable",
-    "retired",
-    "remarks",
-    "decades",
-    "arising",
-    "railway",
-    "pointed",
-    "causing",
-    "mistake",
-    "mineral",
-    "fortune",
-    "claimed",
-    "screens",
-    "planner",
-    "stadium",
-    "costume",
-    "painted",
-    "artwork",
-    "ethical",
-    "schemes",
-    "neutral",
-    "bedding",
-    "joining",
-    "heading",
-    "equally",
-    "bearing",
-    "seniors",
-    "violent",
-    "cottage",
-    "anymore",
-    "locator",
-    "resolve",
-    "ceiling",
-    "anybody",
-    "singing",
-    "optimal",
-    "sucking",
-    "manuals",
-    "watched",
-    "thereof",
-    "ranging",
-    "repairs",
-    "hanging",
-    "colored",
-    "routing",
-    "elegant",
-    "renewal",
-    "opposed",
-    "scoring",
-    "panties",
-    "sisters",
-    "critics",
-    "madonna",
-    "soldier",
-    "mirrors",
-    "assault",
-    "bowling",
-    "solving",
-    "deviant",
-    "imports",
-    "suspect",
-    "crucial",
-    "tuition",
-    "threats",
-    "puzzles",
-    "damaged",
-    "destroy",
-    "starter",
-    "luggage",
-    "stylish",
-    "grocery",
-    "jackets",
-    "excited",
-    "recover",
-    "delayed",
-    "exclude",
-    "anxiety",
-    "spatial",
-    "ceramic",
-    "fingers",
-    "qualify",
-    "diagram",
-    "peoples",
-    "advised",
-    "interim",
-    "approve",
-    "calcium",
-    "harvest",
-    "locally",
-    "mothers",
-    "candles",
-    "sailing",
-    "morocco",
-    "refused",
-    "ecology",
-    "silicon",
-    "compete",
-    "seating",
-    "exports",
-    "heather",
-    "warrant",
-    "royalty",
-    "somehow",
-    "laundry",
-    "placing",
-    "filling",
-    "imposed",
-    "silence",
-    "focuses",
-    "trainer",
-    "volumes",
-    "implied",
-    "packing",
-    "statute",
-    "satisfy",
-    "shelter",
-    "mixture",
-    "logging",
-    "borders",
-    "nursery",
-    "staying",
-    "veteran",
-    "streams",
-    "landing",
-    "signing",
-    "prairie",
-    "reunion",
-    "spirits",
-    "acquire",
-    "tribune",
-    "viruses",
-    "cheaper",
-    "leasing",
-    "beliefs",
-    "analyze",
-    "forests",
-    "invalid",
-    "martial",
-    "colours",
-    "execute",
-    "patents",
-    "accused",
-    "defines",
-    "packets",
-    "trigger",
-    "beaches",
-    "folders",
-    "routers",
-    "pendant",
-    "dresses",
-    "baptist",
-    "females",
-    "cuisine",
-    "theorem",
-    "topless",
-    "radical",
-    "elderly",
-    "bolivia",
-    "hottest",
-    "alleged",
-    "compile",
-    "webster",
-    "curious",
-    "freight",
-    "eclipse",
-    "shuttle",
-    "affects",
-    "fastest",
-    "injured",
-    "payroll",
-    "courier",
-    "tribute",
-    "genesis",
-    "barrier",
-    "bicycle",
-    "letting",
-    "thereby",
-    "bottles",
-    "bangkok",
-    "survive",
-    "clinics",
-    "offense",
-    "protest",
-    "washing",
-    "enquiry",
-    "closure",
-    "intense",
-    "showers",
-    "sensors",
-    "heavily",
-    "headers",
-    "devoted",
-    "hormone",
-    "timothy",
-    "bridges",
-    "casting",
-    "shortly",
-    "warrior",
-    "diploma",
-    "copying",
-    "grammar",
-    "chances",
-    "bizarre",
-    "startup",
-    "kissing",
-    "reduces",
-    "capitol",
-    "nervous",
-    "extends",
-    "replica",
-    "trinity",
-    "handled",
-    "legends",
-    "exhaust",
-    "farming",
-    "handles",
-    "skilled",
-    "harmony",
-    "escorts",
-    "coaches",
-    "vessels",
-    "harbour",
-    "arrange",
-    "unified",
-    "ignored",
-    "precise",
-    "invoice",
-    "forming",
-    "embassy",
-    "amongst",
-    "horizon",
-    "toolbox",
-    "surfing",
-    "attract",
-    "disable",
-    "succeed",
-    "lending",
-    "karaoke",
-    "observe",
-    "mobiles",
-    "terrace",
-    "replied",
-    "seafood",
-    "playboy",
-    "durable",
-    "spencer",
-    "tablets",
-    "futures",
-    "wanting",
-    "custody",
-    "scratch",
-    "rewards",
-    "beneath",
-    "seventh",
-    "soonest",
-    "lenders",
-    "fitting",
-    "surplus",
-    "gravity",
-    "guitars",
-    "essence",
-    "stomach",
-    "anatomy",
-    "defects",
-    "clarity",
-    "settled",
-    "folding",
-    "airfare",
-    "vaccine",
-    "implies",
-    "tension",
-    "eternal",
-    "closest",
-    "actress",
-    "dietary",
-    "matched",
-    "warming",
-    "footage",
-    "reveals",
-    "carries",
-    "consist",
-    "naughty",
-    "hazards",
-    "insured",
-    "algebra",
-    "shadows",
-    "sunrise",
-    "weblogs",
-    "belongs",
-    "readily",
-    "ensures",
-    "legally",
-    "briefly",
-    "fighter",
-    "retreat",
-    "adapted",
-    "estates",
-    "borough",
-    "failing",
-    "modular",
-    "balloon",
-    "infants",
-    "revenge",
-    "expires",
-    "enemies",
-    "accepts",
-    "roughly",
-    "sticker",
-    "deserve",
-    "worried",
-    "garbage",
-    "phrases",
-    "reaches",
-    "quizzes",
-    "planets",
-    "deficit",
-    "boulder",
-    "coupled",
-    "texture",
-    "thunder",
-    "caution",
-    "pirates",
-    "origins",
-    "textile",
-    "indexes",
-    "licking",
-    "markers",
-    "weights",
-    "lasting",
-    "webcams",
-    "surname",
-    "evident",
-    "allergy",
-    "twisted",
-    "blessed",
-    "reforms",
-    "lawsuit",
-    "banners",
-    "circles",
-    "passive",
-    "courage",
-    "gazette",
-    "knights",
-    "altered",
-    "propose",
-    "lighter",
-    "tactics",
-    "shorter",
-    "relying",
-    "refined",
-    "fifteen",
-    "predict",
-    "acrylic",
-    "toddler",
-    "blocked",
-    "strikes",
-    "dressed",
-    "prepaid",
-    "electro",
-    "varying",
-    "trustee",
-    "tsunami",
-    "scholar",
-    "geology",
-    "coating",
-    "cleared",
-    "boating",
-    "corners",
-    "broader",
-    "hitting",
-    "aquatic",
-    "gilbert",
-    "outputs",
-    "insulin",
-    "assured",
-    "ambient",
-    "utilize",
-    "mileage",
-    "adaptor",
-    "vampire",
-    "relates",
-    "framing",
-    "picking",
-    "pockets",
-    "inquire",
-    "realtor",
-    "chassis",
-    "pushing",
-    "prefers",
-    "mustang",
-    "emerald",
-    "webpage",
-    "hostels",
-    "muscles",
-    "wrapped",
-    "distant",
-    "decimal",
-    "penguin",
-    "magical",
-    "miracle",
-    "reprint",
-    "hamburg",
-    "fathers",
-    "terrain",
-    "rangers",
-    "labeled",
-    "marking",
-    "sheriff",
-    "griffin",
-    "longest",
-    "nirvana",
-    "destiny",
-    "madness",
-    "blowing",
-    "cardiac",
-    "seekers",
-    "numeric",
-    "skating",
-    "emperor",
-    "rebates",
-    "proudly",
-    "pulling",
-    "obesity",
-    "touring",
-    "expired",
-    "travels",
-    "delight",
-    "counted",
-    "declare",
-    "teaches",
-    "tragedy",
-    "painful",
-    "prayers",
-    "nowhere",
-    "rebound",
-    "concord",
-    "workout",
-    "stating",
-    "triumph",
-    "welding",
-    "locking",
-    "blanket",
-    "justify",
-    "possess",
-    "vanilla",
-    "pursuit",
-    "backing",
-    "endless",
-    "figured",
-    "pressed",
-    "scanned",
-    "surgeon",
-    "missile",
-    "assists",
-    "auditor",
-    "prophet",
-    "bracket",
-    "harmful",
-    "glucose",
-    "phantom",
-    "earning",
-    "mailman",
-    "novelty",
-    "budgets",
-    "erotica",
-    "viewers",
-    "resumes",
-    "existed",
-    "optimum",
-    "refresh",
-    "webcast",
-    "stripes",
-    "expects",
-    "jumping",
-    "fabrics",
-    "polymer",
-    "hygiene",
-    "poultry",
-    "bouquet",
-    "mandate",
-    "indices",
-    "donated",
-    "stuffed",
-    "insects",
-    "cleanup",
-    "compute",
-    "redhead",
-    "arrives",
-    "tractor",
-    "touched",
-    "cologne",
-    "wishing",
-    "outlets",
-    "notable",
-    "warfare",
-    "sorting",
-    "liaison",
-    "sandals",
-    "clarify",
-    "fatigue",
-    "patriot",
-    "exceeds",
-    "battles",
-    "traders",
-    "dragons",
-    "grading",
-    "tenants",
-    "crossed",
-    "nominal",
-    "hackers",
-    "granite",
-    "athlete",
-    "enforce",
-    "adviser",
-    "booklet",
-    "suburbs",
-    "imagery",
-    "useless",
-    "manages",
-    "erosion",
-    "handbag",
-    "exploit",
-    "hogtied",
-    "pathway",
-    "shallow",
-    "spectra",
-    "lifting",
-    "curtain",
-    "mailbox",
-    "imprint",
-    "goodbye",
-    "emerged",
-    "goddess",
-    "magnets",
-    "chapman",
-    "loyalty",
-    "beloved",
-    "beating",
-    "offence",
-    "expands",
-    "lithium",
-    "facials",
-    "airways",
-    "banquet",
-    "caravan",
-    "harness",
-    "freeman",
-    "puppies",
-    "emotion",
-    "wounded",
-    "educate",
-    "enacted",
-    "biotech",
-    "fulfill",
-    "gaining",
-    "therein",
-    "dentist",
-    "crafted",
-    "strains",
-    "tanning",
-    "lacking",
-    "sensing",
-    "cowboys",
-    "relaxed",
-    "handler",
-    "decides",
-    "caption",
-    "compass",
-    "evolved",
-    "rebuild",
-    "shelves",
-    "cleaned",
-    "honored",
-    "diaries",
-    "dolphin",
-    "wonders",
-    "lateral",
-    "sanders",
-    "refunds",
-    "debates",
-    "booster",
-    "taxable",
-    "malaria",
-    "torrent",
-    "odyssey",
-    "freezer",
-    "embrace",
-    "buddies",
-    "hunters",
-    "crashes",
-    "hotline",
-    "servant",
-    "jointly",
-    "avoided",
-    "terrier",
-    "renewed",
-    "variant",
-    "squares",
-    "voucher",
-    "margins",
-    "commits",
-    "recruit",
-    "bidders",
-    "wherein",
-    "dessert",
-    "tissues",
-    "scooter",
-    "desires",
-    "psychic",
-    "visions",
-    "topical",
-    "cocaine",
-    "omitted",
-    "parkway",
-    "scandal",
-    "dangers",
-    "bonuses",
-    "timeout",
-    "repeats",
-    "restart",
-    "rounded",
-    "dioxide",
-    "roofing",
-    "elastic",
-    "recalls",
-    "renting",
-    "balcony",
-    "neglect",
-    "jerseys",
-    "refugee",
-    "stained",
-    "marital",
-    "slavery",
-    "flowing",
-    "sustain",
-    "lengths",
-    "quartet",
-    "conform",
-    "helmets",
-    "vacancy",
-    "painter",
-    "leagues",
-    "monkeys",
-    "easiest",
-    "denotes",
-    "vectors",
-    "stepped",
-    "issuing",
-    "heaters",
-    "accents",
-    "colonel",
-    "nightly",
-    "filings",
-    "forcing",
-    "meadows",
-    "dignity",
-    "sliding",
-    "fellows",
-    "ideally",
-    "dancers",
-    "handset",
-    "maxwell",
-    "oblique",
-    "singers",
-    "mansion",
-    "arsenal",
-    "pyramid",
-    "hacking",
-    "keynote",
-    "planted",
-    "spotted",
-    "coconut",
-    "removes",
-    "pillows",
-    "portals",
-    "whoever",
-    "mankind",
-    "upright",
-    "shocked",
-    "breathe",
-    "smiling",
-    "samurai",
-    "lightly",
-    "runners",
-    "talents",
-    "newborn",
-    "laughed",
-    "orchard",
-    "bombing",
-    "metrics",
-    "vaginal",
-    "environ",
-    "wheeler",
-    "enzymes",
-    "jacuzzi",
-    "beavers",
-    "styling",
-    "quietly",
-    "scenery",
-    "learner",
-    "swallow",
-    "marines",
-    "trilogy",
-    "chopped",
-    "sleeves",
-    "vibrant",
-    "sweater",
-    "burners",
-    "reminds",
-    "corrupt",
-    "drought",
-    "symptom",
-    "scaling",
-    "thyroid",
-    "wizards",
-    "storing",
-    "staples",
-    "blondes",
-    "literal",
-    "guiding",
-    "overlap",
-    "cruiser",
-    "cascade",
-    "endorse",
-    "strokes",
-    "nucleus",
-    "brigade",
-    "movable",
-    "doubles",
-    "appoint",
-    "hostile",
-    "trapped",
-    "tattoos",
-    "peptide",
-    "regents",
-    "darling",
-    "clutter",
-    "whereby",
-    "simpler",
-    "mammals",
-    "cloning",
-    "peppers",
-    "alright",
-    "aligned",
-    "shuffle",
-    "bladder",
-    "shooter",
-    "shields",
-    "inserts",
-    "tasting",
-    "branded",
-    "manning",
-    "shining",
-    "voyager",
-    "sampler",
-    "checker",
-    "shaping",
-    "inspire",
-    "pumping",
-    "revival",
-    "regency",
-    "midland",
-    "invites",
-    "cushion",
-    "panther",
-    "goodman",
-    "subunit",
-    "reactor",
-    "trumpet",
-    "neurons",
-    "crimson",
-    "needing",
-    "trivial",
-    "clauses",
-    "remover",
-    "proving",
-    "encoded",
-    "uranium",
-    "honours",
-    "antigen",
-    "refusal",
-    "secular",
-    "majesty",
-    "fishery",
-    "pumpkin",
-    "notably",
-    "intends",
-    "garment",
-    "grandma",
-    "bundles",
-    "priests",
-    "fencing",
-    "violate",
-    "realise",
-    "stealth",
-    "emailed",
-    "concise",
-    "handful",
-    "motions",
-    "shampoo",
-    "quoting",
-    "dynasty",
-    "raiders",
-    "spreads",
-    "sensory",
-    "dummies",
-    "roundup",
-    "memoirs",
-    "forgive",
-    "almanac",
-    "polling",
-    "selects",
-    "haunted",
-    "adverts",
-    "unclear",
-    "wealthy",
-    "feather",
-    "sixteen",
-    "tightly",
-    "brushes",
-    "capsule",
-    "suspend",
-    "daytime",
-    "contour",
-    "descent",
-    "analyse",
-    "shutter",
-    "residue",
-    "goodies",
-    "inspect",
-    "musings",
-    "layouts",
-    "titanic",
-    "judging",
-    "kicking",
-    "happily",
-    "pretend",
-    "amnesty",
-    "needles",
-    "chooses",
-    "crowded",
-    "turbine",
-    "varsity",
-    "insurer",
-    "inverse",
-    "verdict",
-    "nominee",
-    "incubus",
-    "impulse",
-    "testers",
-    "getaway",
-    "robbins",
-    "sockets",
-    "abusive",
-    "garland",
-    "riviera",
-    "obscure",
-    "glamour",
-    "trolley",
-    "blocker",
-    "frankly",
-    "linkage",
-    "chateau",
-    "changer",
-    "cypress",
-    "uploads",
-    "gallons",
-    "urinary",
-    "premise",
-    "condoms",
-    "lattice",
-    "asphalt",
-    "flavors",
-    "dilemma",
-    "shifted",
-    "placebo",
-    "probing",
-    "solvent",
-    "spacing",
-    "mergers",
-    "certify",
-    "arguing",
-    "summers",
-    "wetland",
-    "consume",
-    "volcano",
-    "someday",
-    "sounded",
-    "honesty",
-    "killers",
-    "stellar",
-    "pussies",
-    "bullets",
-    "probate",
-    "incense",
-    "seismic",
-    "smokers",
-    "hotspot",
-    "glacier",
-    "gigabit",
-    "relieve",
-    "clarion",
-    "squeeze",
-    "factual",
-    "shaking",
-    "lobster",
-    "preteen",
-    "bonding",
-    "crosses",
-    "furnace",
-    "doubled",
-    "rabbits",
-    "anxious",
-    "tariffs",
-    "baptism",
-    "cutlery",
-    "differs",
-    "brewing",
-    "blossom",
-    "lowered",
-    "prisons",
-    "grabbed",
-    "rocking",
-    "employs",
-    "bubbles",
-    "pitcher",
-    "standby",
-    "wallets",
-    "ethanol",
-    "worries",
-    "rejects",
-    "referee",
-    "swinger",
-    "broadly",
-    "parsons",
-    "bounded",
-    "touches",
-    "pursued",
-    "biomass",
-    "lesions",
-    "sausage",
-    "juniors",
-    "rockets",
-    "asshole",
-    "admiral",
-    "padding",
-    "popcorn",
-    "espanol",
-    "cracked",
-    "genomic",
-    "archery",
-    "refuses",
-    "sabbath",
-    "escaped",
-    "anyways",
-    "hospice",
-    "brushed",
-    "annuity",
-    "tracing",
-    "incomes",
-    "fragile",
-    "sapiens",
-    "rushing",
-    "trainee",
-    "scarlet",
-    "crushed",
-    "statues",
-    "latency",
-    "subsidy",
-    "growers",
-    "roasted",
-    "tenders",
-    "mustard",
-    "praying",
-    "shaving",
-    "bishops",
-    "ribbons",
-    "cashier",
-    "blender",
-    "blaster",
-    "wasting",
-    "decoder",
-    "glitter",
-    "sidebar",
-    "overlay",
-    "bitches",
-    "trivium",
-    "resting",
-    "carpets",
-    "grouped",
-    "boiling",
-    "parsing",
-    "abandon",
-    "cinemas",
-    "encoder",
-    "bathing",
-    "lambert",
-    "goggles",
-    "unhappy",
-    "jukebox",
-    "cancers",
-    "melting",
-    "wrapper",
-    "drummer",
-    "unrated",
-    "lengthy",
-    "agendas",
-    "bipolar",
-    "inbound",
-    "regimes",
-    "invoked",
-    "utterly",
-    "kinetic",
-    "glimpse",
-    "quicker",
-    "smarter",
-    "calorie",
-    "farther",
-    "dungeon",
-    "germans",
-    "kashmir",
-    "skyline",
-    "barrels",
-    "cabling",
-    "playoff",
-    "payload",
-    "grilled",
-    "enquire",
-    "toilets",
-    "rewrite",
-    "vending",
-    "chasing",
-    "batting",
-    "winding",
-    "synergy",
-    "doughty",
-    "fixture",
-    "salvage",
-    "orbital",
-    "empires",
-    "undergo",
-    "blended",
-    "digging",
-    "lantern",
-    "catches",
-    "kidding",
-    "airmail",
-    "staring",
-    "seventy",
-    "whistle",
-    "sulfate",
-    "spouses",
-    "subpart",
-    "bending",
-    "denying",
-    "recycle",
-    "furnish",
-    "rubbish",
-    "knocked",
-    "tornado",
-    "turtles",
-    "hickory",
-    "inmates",
-    "rebuilt",
-    "striped",
-    "surfers",
-    "monarch",
-    "costing",
-    "paradox",
-    "jackpot",
-    "halfway",
-    "neutron",
-    "directs",
-    "resides",
-    "wording",
-    "obliged",
-    "redwood",
-    "thereto",
-    "radiant",
-    "virgins",
-    "firstly",
-    "martini",
-    "bastard",
-    "coaster",
-    "grazing",
-    "seaside",
-    "renamed",
-    "soluble",
-    "hardest",
-    "freeway",
-    "patrons",
-    "bankers",
-    "sampled",
-    "sincere",
-    "broncos",
-    "sharply",
-    "vinegar",
-    "rafting",
-    "safaris",
-    "preface",
-    "pencils",
-    "caching",
-    "castles",
-    "notions",
-    "plateau",
-    "palette",
-    "onboard",
-    "robbery",
-    "jasmine",
-    "crochet",
-    "stamped",
-    "dismiss",
-    "presses",
-    "amusing",
-    "retains",
-    "docking",
-    "chimney",
-    "packers",
-    "carving",
-    "slipped",
-    "realism",
-    "bologna",
-    "implant",
-    "buffers",
-    "masonry",
-    "accrued",
-    "temples",
-    "indoors",
-    "staging",
-    "spiders",
-    "diluted",
-    "brewery",
-    "lineage",
-    "sealing",
-    "despair",
-    "dumping",
-    "magenta",
-    "tagging",
-    "prelude",
-    "drafted",
-    "layered",
-    "copiers",
-    "ovarian",
-    "plenary",
-    "suffers",
-    "midtown",
-    "immense",
-    "seizure",
-    "wrought",
-    "captive",
-    "baggage",
-    "vikings",
-    "vicious",
-    "hayward",
-    "liquids",
-    "migrant",
-    "leaning",
-    "eyewear",
-    "benches",
-    "foolish",
-    "compose",
-    "clearer",
-    "modeled",
-    "diocese",
-    "thistle",
-    "aspirin",
-    "dispose",
-    "falcons",
-    "crashed",
-    "urgency",
-    "flashes",
-    "angular",
-    "grinder",
-    "conquer",
-    "filming",
-    "impress",
-    "eminent",
-    "cheques",
-    "aliases",
-    "screwed",
-    "ballots",
-    "testify",
-    "boycott",
-    "genital",
-    "analogy",
-    "winters",
-    "orgasms",
-    "butcher",
-    "cabbage",
-    "arrests",
-    "signage",
-    "breaker",
-    "collage",
-    "jealous",
-    "rhythms",
-    "shotgun",
-    "langley",
-    "unaware",
-    "scented",
-    "sandbox",
-    "gesture",
-    "cutters",
-    "merging",
-    "plaques",
-    "breadth",
-    "mammoth",
-    "innings",
-    "parcels",
-    "manners",
-    "thieves",
-    "pelican",
-    "cousins",
-    "dodgers",
-    "textual",
-    "spindle",
-    "heavens",
-    "couture",
-    "foliage",
-    "backups",
-    "washers",
-    "jubilee",
-    "cyclone",
-    "bulldog",
-    "gradual",
-    "mastery",
-    "nesting",
-    "outward",
-    "whisper",
-    "molding",
-    "leopard",
-    "arcadia",
-    "ringing",
-    "whiskey",
-    "earring",
-    "furious",
-    "refills",
-    "drained",
-    "acreage",
-    "stocked",
-    "motives",
-    "provost",
-    "steroid",
-    "isolate",
-    "acronym",
-    "veritas",
-    "messiah",
-    "mutants",
-    "sensual",
-    "burgess",
-    "freshly",
-    "foundry",
-    "acetate",
-    "portage",
-    "alameda",
-    "aerosol",
-    "hostage",
-    "cracker",
-    "sermons",
-    "coolers",
-    "audited",
-    "adjunct",
-    "postfix",
-    "bottled",
-    "gastric",
-    "christy",
-    "toaster",
-    "roadway",
-    "serials",
-    "murders",
-    "bottoms",
-    "widgets",
-    "chopper",
-    "nitrate",
-    "pinball",
-    "tunnels",
-    "heavier",
-    "dissent",
-    "maximal",
-    "anarchy",
-    "clicked",
-    "drawers",
-    "leakage",
-    "chemist",
-    "propane",
-    "praised",
-    "breeder",
-    "drunken",
-    "spoiler",
-    "baroque",
-    "posture",
-    "thereon",
-    "valleys",
-    "thanked",
-    "apology",
-    "collars",
-    "pudding",
-    "squared",
-    "cookers",
-    "luckily",
-    "lighted",
-    "erected",
-    "dialing",
-    "migrate",
-    "mentors",
-    "ammonia",
-    "dislike",
-    "soybean",
-    "brewers",
-    "pierced",
-    "awkward",
-    "weaving",
-    "lookout",
-    "ironing",
-    "entropy",
-    "snooker",
-    "sterile",
-    "orioles",
-    "allegro",
-    "scrolls",
-    "fairies",
-    "sparkle",
-    "refrain",
-    "firearm",
-    "bundled",
-    "bombers",
-    "favored",
-    "unveils",
-    "peacock",
-    "helpers",
-    "elapsed",
-    "anthrax",
-    "hopeful",
-    "spinach",
-    "peanuts",
-    "discard",
-    "cavalry",
-    "trimmed",
-    "ferries",
-    "earnest",
-    "outback",
-    "oceanic",
-    "festive",
-    "hustler",
-    "drilled",
-    "pilgrim",
-    "flaming",
-    "empower",
-    "prevail",
-    "methane",
-    "natives",
-    "deepest",
-    "climbed",
-    "roaming",
-    "sibling",
-    "weighed",
-    "ashamed",
-    "gorilla",
-    "inhibit",
-    "dickens",
-    "juniper",
-    "blowout",
-    "oversee",
-    "clement",
-    "robotic",
-    "pasture",
-    "richest",
-    "cruelty",
-    "plugged",
-    "marshal",
-    "rituals",
-    "sailors",
-    "sadness",
-    "flavour",
-    "onwards",
-    "prompts",
-    "witches",
-    "skinner",
-    "nouveau",
-    "feeders",
-    "singled",
-    "centric",
-    "militia",
-    "bananas",
-    "golfing",
-    "kittens",
-    "scarves",
-    "outfits",
-    "puppets",
-    "tapping",
-    "explode",
-    "escapes",
-    "berries",
-    "happier",
-    "stacked",
-    "catcher",
-    "suction",
-    "crusade",
-    "spheres",
-    "assigns",
-    "whipped",
-    "dinners",
-    "selfish",
-    "herring",
-    "savanna",
-    "nudists",
-    "keeling",
-    "yielded",
-    "sparrow",
-    "poorest",
-    "milling",
-    "sinking",
-    "sulphur",
-    "confess",
-    "chaotic",
-    "rubbing",
-    "detects",
-    "dragged",
-    "foreman",
-    "conduit",
-    "ladders",
-    "prudent",
-    "glowing",
-    "alchemy",
-    "audible",
-    "colleen",
-    "lexicon",
-    "diapers",
-    "pillars",
-    "pistons",
-    "rightly",
-    "paragon",
-    "turnout",
-    "persist",
-    "illicit",
-    "firefly",
-    "pledged",
-    "curling",
-    "princes",
-    "skipped",
-    "tempted",
-    "plaster",
-    "hearted",
-    "agility",
-    "upscale",
-    "runaway",
-    "slowing",
-    "sleeper",
-    "unnamed",
-    "jerking",
-    "sharper",
-    "coolest",
-    "downing",
-    "halogen",
-    "maestro",
-    "coaxial",
-    "tipping",
-    "holster",
-    "faucets",
-    "payouts",
-    "caliber",
-    "apostle",
-    "playful",
-    "soprano",
-    "marquis",
-    "acclaim",
-    "birding",
-    "rollers",
-    "weekday",
-    "revoked",
-    "outpost",
-    "chatter",
-    "lettuce",
-    "aerobic",
-    "ecstasy",
-    "strands",
-    "compost",
-    "flooded",
-    "corsair",
-    "cockpit",
-    "carrots",
-    "resumed",
-    "excuses",
-    "commute",
-    "stimuli",
-    "upwards",
-    "loosely",
-    "anchors",
-    "atheist",
-    "fuckers",
-    "grizzly",
-    "chaired",
-    "hurting",
-    "fossils",
-    "crooked",
-    "braille",
-    "charmed",
-    "soaring",
-    "virtues",
-    "banning",
-    "jacking",
-    "biscuit",
-    "submits",
-    "emerges",
-    "leaflet",
-    "informs",
-    "asserts",
-    "mariner",
-    "collier",
-    "artisan",
-    "aqueous",
-    "morales",
-    "renders",
-    "ottoman",
-    "graders",
-    "insists",
-    "pouring",
-    "secrecy",
-    "dreamed",
-    "fertile",
-    "sweeney",
-    "denoted",
-    "oneself",
-    "newbies",
-    "vaginas",
-    "anomaly",
-    "avatars",
-    "frontal",
-    "arsenic",
-    "synonym",
-    "applets",
-    "devised",
-    "obscene",
-    "burgers",
-    "campers",
-    "spelled",
-    "rescued",
-    "nuggets",
-    "embryos",
-    "pistols",
-    "garages",
-    "avenues",
-    "urology",
-    "zoology",
-    "huskies",
-    "vantage",
-    "diffuse",
-    "boredom",
-    "flatbed",
-    "golfers",
-    "shouted",
-    "advises",
-    "dresser",
-    "tackles",
-    "barking",
-    "serpent",
-    "pitched",
-    "daycare",
-    "tubular",
-    "kernels",
-    "fainter",
-    "cabaret",
-    "awaited",
-    "wheeled",
-    "noodles",
-    "corning",
-    "armored",
-    "pianist",
-    "pigment",
-    "faction",
-    "rulings",
-    "epsilon",
-    "annoyed",
-    "greeted",
-    "glazing",
-    "tyranny",
-    "regimen",
-    "slender",
-    "bullock",
-    "mermaid",
-    "centred",
-    "uncover",
-    "abigail",
-    "ignores",
-    "popping",
-    "pandora",
-    "latinos",
-    "inferno",
-    "confuse",
-    "lounges",
-    "hybrids",
-    "ensured",
-    "cereals",
-    "outrage",
-    "elusive",
-    "madeira",
-    "hallway",
-    "ripping",
-    "polygon",
-    "hampers",
-    "curator",
-    "grooves",
-    "quicken",
-    "derrick",
-    "stencil",
-    "doorway",
-    "redding",
-    "pledges",
-    "plotted",
-    "broaden",
-    "begging",
-    "handout",
-    "contend",
-    "paisley",
-    "gibbons",
-    "visuals",
-    "unicorn",
-    "orderly",
-    "chilled",
-    "citadel",
-    "wrinkle",
-    "indulge",
-    "melodic",
-    "primers",
-    "remixes",
-    "valiant",
-    "banging",
-    "vertigo",
-    "suffice",
-    "debated",
-    "walkers",
-    "keepers",
-    "oranges",
-    "obtains",
-    "straits",
-    "subsets",
-    "blazers",
-    "endowed",
-    "coulter",
-    "defends",
-    "depicts",
-    "spanked",
-    "notepad",
-    "tedious",
-    "chewing",
-    "callers",
-    "interns",
-    "bikinis",
-    "addicts",
-    "spaniel",
-    "grandpa",
-    "guessed",
-    "kennels",
-    "stamina",
-    "crowned",
-    "rooster",
-    "proctor",
-    "dictate",
-    "trimmer",
-    "kickoff",
-    "abdomen",
-    "fractal",
-    "fasting",
-    "recital",
-    "pairing",
-    "bedtime",
-    "rapport",
-    "catfish",
-    "peaches",
-    "skipper",
-    "prodigy",
-    "shakers",
-    "bourbon",
-    "lexical",
-    "platter",
-    "pageant",
-    "plywood",
-    "binders",
-    "morally",
-    "hosiery",
-    "reptile",
-    "overdue",
-    "showbiz",
-    "teasing",
-    "unbound",
-    "hepatic",
-    "kindred",
-    "aquifer",
-    "condemn",
-    "fullest",
-    "marlins",
-    "burdens",
-    "exiting",
-    "swollen",
-    "grasses",
-    "scatter",
-    "steward",
-    "codeine",
-    "tougher",
-    "clipper",
-    "cynical",
-    "hamster",
-    "etching",
-    "inherit",
-    "handing",
-    "laborer",
-    "watcher",
-    "surreal",
-    "encrypt",
-    "pajamas",
-    "sayings",
-    "plasmid",
-    "upstate",
-    "topping",
-    "simplex",
-    "reliant",
-    "twelfth",
-    "solicit",
-    "orchids",
-    "buckets",
-    "blazing",
-    "grantee",
-    "anglers",
-    "snapped",
-    "strives",
-    "pivotal",
-    "plating",
-    "eagerly",
-    "trooper",
-    "jogging",
-    "horrors",
-    "pastors",
-    "pitches",
-    "invaded",
-    "spoiled",
-    "dieting",
-    "tangent",
-    "tempest",
-    "rockers",
-    "staffed",
-    "orphans",
-    "boilers",
-    "yelling",
-    "burnout",
-    "raining",
-    "peasant",
-    "ephedra",
-    "citrate",
-    "snowman",
-    "chinook",
-    "devious",
-    "dreamer",
-    "estuary",
-    "pouches",
-    "typhoon",
-    "induces",
-    "tooling",
-    "admired",
-    "tidbits",
-    "fairway",
-    "emitted",
-    "spinner",
-    "braking",
-    "parsley",
-    "setback",
-    "stunned",
-    "turnkey",
-    "renters",
-    "tighten",
-    "apricot",
-    "cuckold",
-    "tongues",
-    "sourced",
-    "entails",
-    "disrupt",
-    "rampage",
-    "imposes",
-    "persona",
-    "excused",
-    "roaring",
-    "stopper",
-    "crested",
-    "summons",
-    "bathtub",
-    "salinas",
-    "exposes",
-    "natures",
-    "verbose",
-    "chalets",
-    "craving",
-    "leaking",
-    "masonic",
-    "flasher",
-    "patched",
-    "caramel",
-    "octopus",
-    "zombies",
-    "titties",
-    "hornets",
-    "spandex",
-    "tearing",
-    "muffins",
-    "cougars",
-    "nemesis",
-    "tripods",
-    "cookery",
-    "hangers",
-    "pleaded",
-    "flannel",
-    "steamer",
-    "spartan",
-    "rumours",
-    "respite",
-    "pollock",
-    "schemas",
-    "pollard",
-    "plainly",
-    "punches",
-    "nurture",
-    "lotions",
-    "adrenal",
-    "sixties",
-    "booting",
-    "engages",
-    "carbide",
-    "pullman",
-    "cadmium",
-    "villain",
-    "waivers",
-    "secures",
-    "rejoice",
-    "plumper",
-    "uterine",
-    "hurdles",
-    "candies",
-    "regatta",
-    "martins",
-    "telford",
-    "topples",
-    "fallout",
-    "stalker",
-    "reclaim",
-    "extinct",
-    "lunches",
-    "rigging",
-    "derives",
-    "praises",
-    "reissue",
-    "striker",
-    "screams",
-    "masking",
-    "jaguars",
-    "assures",
-    "chiefly",
-    "autopsy",
-    "powders",
-    "debtors",
-    "wartime",
-    "ballast",
-    "rallies",
-    "earthly",
-    "proxies",
-    "issuers",
-    "martian",
-    "equinox",
-    "presume",
-    "candida",
-    "adjusts",
-    "pickups",
-    "calypso",
-    "italics",
-    "porting",
-    "hammock",
-    "chevron",
-    "wolfram",
-    "bonanza",
-    "longing",
-    "inertia",
-    "pruning",
-    "swiftly",
-    "fearful",
-    "potency",
-    "nestled",
-    "drastic",
-    "catered",
-    "guarded",
-    "bureaus",
-    "voyages",
-    "retinal",
-    "dubious",
-    "listens",
-    "dialect",
-    "fanatic",
-    "raptors",
-    "corolla",
-    "knitted",
-    "quintet",
-    "rampant",
-    "vacuums",
-    "attends",
-    "hooters",
-    "tighter",
-    "thrifty",
-    "canning",
-    "totaled",
-    "shipper",
-    "unitary",
-    "liturgy",
-    "sweetie",
-    "cradles",
-    "opposes",
-    "faceted",
-    "turmoil",
-    "disturb",
-    "bounced",
-    "saddles",
-    "gushing",
-    "iceberg",
-    "plumber",
-    "humping",
-    "redneck",
-    "planter",
-    "rivalry",
-    "charley",
-    "bespoke",
-    "drowned",
-    "kidneys",
-    "warbler",
-    "snippet",
-    "pellets",
-    "starred",
-    "skillet",
-    "offeror",
-    "ginseng",
-    "grenade",
-    "enclose",
-    "sinners",
-    "pharaoh",
-    "itching",
-    "endemic",
-    "tourney",
-    "blurred",
-    "martens",
-    "duality",
-    "cordoba",
-    "buckles",
-    "sweeper",
-    "measles",
-    "amenity",
-    "hawking",
-    "divides",
-    "gathers",
-    "messing",
-    "empress",
-    "slogans",
-    "mindset",
-    "fascism",
-    "isotope",
-    "locales",
-    "rebirth",
-    "stirred",
-    "subtype",
-    "arrears",
-    "thicker",
-    "weeping",
-    "closeup",
-    "infancy",
-    "cleanse",
-    "rosters",
-    "bolivar",
-    "cheddar",
-    "cummins",
-    "booming",
-    "atlases",
-    "avenged",
-    "bounces",
-    "fascist",
-    "thinner",
-    "angling",
-    "requiem",
-    "heroine",
-    "outsole",
-    "cadence",
-    "frosted",
-    "openers",
-    "insults",
-    "oatmeal",
-    "raceway",
-    "monsoon",
-    "hotties",
-    "treason",
-    "prosper",
-    "cheeses",
-    "empathy",
-    "omnibus",
-    "stables",
-    "mitzvah",
-    "bashing",
-    "tenancy",
-    "rupture",
-    "lyrical",
-    "braided",
-    "sleeved",
-    "bassett",
-    "cathode",
-    "slammed",
-    "aviator",
-    "paladin",
-    "marched",
-    "rotated",
-    "sighted",
-    "hopping",
-    "platoon",
-    "regrets",
-    "twister",
-    "sequoia",
-    "marquee",
-    "darkest",
-    "ballads",
-    "bobcats",
-    "thinker",
-    "phonics",
-    "endings",
-    "reagent",
-    "frantic",
-    "valance",
-    "mundane",
-    "matador",
-    "deletes",
-    "behaved",
-    "embargo",
-    "specter",
-    "shading",
-    "conceal",
-    "saviour",
-    "boomers",
-    "benzene",
-    "sparked",
-    "forging",
-    "caribou",
-    "footing",
-    "cheetah",
-    "stumble",
-    "fridges",
-    "hammers",
-    "worldly",
-    "portray",
-    "napkins",
-    "upfront",
-    "hauling",
-    "dipping",
-    "domaine",
-    "celeste",
-    "rambler",
-    "drywall",
-    "endured",
-    "lockers",
-    "lookups",
-    "fishers",
-    "burrows",
-    "bedside",
-    "homolog",
-    "stratus",
-    "bumpers",
-    "torches",
-    "procure",
-    "sunsets",
-    "damping",
-    "bootleg",
-    "syringe",
-    "leftist",
-    "tequila",
-    "granger",
-    "glacial",
-    "tapered",
-    "alleges",
-    "blaming",
-    "spiegel",
-    "gearbox",
-    "tensile",
-    "quilted",
-    "relapse",
-    "commend",
-    "descend",
-    "bolster",
-    "racquet",
-    "trident",
-    "calming",
-    "lingual",
-    "thirsty",
-    "punched",
-    "marbles",
-    "conveys",
-    "rearing",
-    "pooling",
-    "coyotes",
-    "reacted",
-    "sunless",
-    "puzzled",
-    "gaskets",
-    "nonstop",
-    "remnant",
-    "immoral",
-    "unequal",
-    "backlog",
-    "ensuing",
-    "revived",
-    "alfalfa",
-    "cherish",
-    "budding",
-    "hackney",
-    "tunning",
-    "glanced",
-    "rapture",
-    "sunbeam",
-    "beetles",
-    "beading",
-    "ratchet",
-    "parrots",
-    "anthems",
-    "photons",
-    "emulate",
-    "insofar",
-    "smileys",
-    "primate",
-    "dickies",
-    "revisit",
-    "whiting",
-    "netting",
-    "offsets",
-    "palaces",
-    "airflow",
-    "gliding",
-    "outings",
-    "wavelet",
-    "hostess",
-    "tangled",
-    "pundits",
-    "grabber",
-    "peridot",
-    "fearing",
-    "dossier",
-    "finders",
-    "deserts",
-    "milking",
-    "outages",
-    "blister",
-    "opacity",
-    "veggies",
-    "lacquer",
-    "fishnet",
-    "thrills",
-    "oxidase",
-    "atheism",
-    "cellars",
-    "caterer",
-    "tainted",
-    "midterm",
-    "augment",
-    "gelatin",
-    "cursors",
-    "cripple",
-    "dropout",
-    "cropped",
-    "lockout",
-    "vaguely",
-    "almonds",
-    "equator",
-    "blatant",
-    "endnote",
-    "oysters",
-    "puberty",
-    "crawler",
-    "shorten",
-    "tabular",
-    "dormant",
-    "tropics",
-    "soaking",
-    "ferrous",
-    "zillion",
-    "abusing",
-    "bedrock",
-    "badgers",
-    "accrual",
-    "smashed",
-    "paroles",
-    "seeding",
-    "botanic",
-    "bassist",
-    "stature",
-    "skaters",
-    "bangles",
-    "stereos",
-    "fireman",
-    "wrongly",
-    "falsely",
-    "plagued",
-    "suckers",
-    "matilda",
-    "impetus",
-    "whining",
-    "modulus",
-    "boosted",
-    "sprayed",
-    "gearing",
-    "freeing",
-    "redress",
-    "settles",
-    "coupler",
-    "cayenne",
-    "defeats",
-    "montage",
-    "alfredo",
-    "hedging",
-    "inhaled",
-    "collide",
-    "blinded",
-    "grained",
-    "mediate",
-    "cunning",
-    "divider",
-    "pennies",
-    "minivan",
-    "giraffe",
-    "spilled",
-    "azimuth",
-    "chariot",
-    "payback",
-    "coolant",
-    "warmers",
-    "alleles",
-    "sandman",
-    "lullaby",
-    "trucker",
-    "choking",
-    "stately",
-    "studded",
-    "brownie",
-    "nearing",
-    "burglar",
-    "freezes",
-    "wildcat",
-    "parting",
-    "avocado",
-    "torpedo",
-    "muffler",
-    "jumpers",
-    "curacao",
-    "provoke",
-    "calvary",
-    "invests",
-    "adjourn",
-    "citrine",
-    "mediums",
-    "calumet",
-    "discern",
-    "animate",
-    "agonist",
-    "rethink",
-    "closets",
-    "junkies",
-    "pertain",
-    "martyrs",
-    "shavers",
-    "aborted",
-    "booties",
-    "abiding",
-    "cancels",
-    "gangsta",
-    "slipper",
-    "clashes",
-    "commune",
-    "snoring",
-    "governs",
-    "rooftop",
-    "seeming",
-    "rosebud",
-    "intakes",
-    "saffron",
-    "munster",
-    "casters",
-    "mailbag",
-    "postwar",
-    "favours",
-    "evasion",
-    "gospels",
-    "karting",
-    "blasted",
-    "triples",
-    "pancake",
-    "dreaded",
-    "looping",
-    "undated",
-    "exalted",
-    "tabloid",
-    "hatcher",
-    "nitrous",
-    "genomes",
-    "skinned",
-    "rodents",
-    "seminal",
-    "sexiest",
-    "gambler",
-    "fosters",
-    "fillers",
-    "beltway",
-    "eyebrow",
-    "kinases",
-    "hydroxy",
-    "applaud",
-    "abolish",
-    "busiest",
-    "spawned",
-    "departs",
-    "mindful",
-    "lurking",
-    "spectre",
-    "smother",
-    "ironman",
-    "moaning",
-    "spammer",
-    "presets",
-    "duchess",
-    "rainier",
-    "snapper",
-    "bravery",
-    "lizards",
-    "flagged",
-    "offbeat",
-    "protons",
-    "fleeing",
-    "fluency",
-    "uniting",
-    "behaves",
-    "incline",
-    "listers",
-    "oneness",
-    "climber",
-    "lactose",
-    "strides",
-    "ringgit",
-    "hooking",
-    "resigns",
-    "anguish",
-    "bangers",
-    "handgun",
-    "clipped",
-    "grating",
-    "alerted",
-    "remodel",
-    "bunting",
-    "avenger",
-    "piranha",
-    "weakest",
-    "salient",
-    "beehive",
-    "fission",
-    "widowed",
-    "flushed",
-    "scoping",
-    "marches",
-    "bunnies",
-    "outflow",
-    "resided",
-    "raunchy",
-    "toasted",
-    "funders",
-    "brittle",
-    "bandits",
-    "soapbox",
-    "wanking",
-    "somatic",
-    "fetched",
-    "batches",
-    "angelic",
-    "workman",
-    "swimmer",
-    "jockeys",
-    "badness",
-    "sanding",
-    "vulgate",
-    "carotid",
-    "convent",
-    "adhered",
-    "haircut",
-    "dialogs",
-    "bromide",
-    "summing",
-    "canyons",
-    "disgust",
-    "ranches",
-    "encodes",
-    "whaling",
-    "patrols",
-    "outlaws",
-    "ellipse",
-    "alarmed",
-    "caesars",
-    "stalled",
-    "infused",
-    "bearded",
-    "tactile",
-    "wannabe",
-    "carnage",
-    "coroner",
-    "convene",
-    "gaseous",
-    "airbags",
-    "retiree",
-    "buckeye",
-    "marques",
-    "clothed",
-    "plummer",
-    "blowers",
-    "sorcery",
-    "abstain",
-    "barring",
-    "fielder",
-    "pounded",
-    "sarcasm",
-    "colitis",
-    "hassles",
-    "parable",
-    "affords",
-    "rhodium",
-    "sarcoma",
-    "sniffer",
-    "degrade",
-    "flemish",
-    "mailers",
-    "steamed",
-    "aroused",
-    "reddish",
-    "scissor",
-    "goliath",
-    "caprice",
-    "cations",
-    "cohorts",
-    "torsion",
-    "utilise",
-    "midwife",
-    "rollout",
-    "coveted",
-    "moulded",
-    "convict",
-    "albumin",
-    "tossing",
-    "potable",
-    "recount",
-    "mascara",
-    "proline",
-    "dearest",
-    "unleash",
-    "gallant",
-    "jeweler",
-    "ostrich",
-    "pallets",
-    "warlock",
-    "breakup",
-    "railing",
-    "pigeons",
-    "signify",
-    "progeny",
-    "tackled",
-    "satanic",
-    "torment",
-    "mussels",
-    "hilltop",
-    "bohemia",
-    "pickles",
-    "marinas",
-    "looming",
-    "soulful",
-    "mosques",
-    "alumina",
-    "evolves",
-    "locates",
-    "analogs",
-    "ringers",
-    "cartons",
-    "centrum",
-    "riddles",
-    "marshes",
-    "bellies",
-    "palazzo",
-    "heparin",
-    "bonfire",
-    "plotter",
-    "slapped",
-    "stacker",
-    "forfeit",
-    "paddles",
-    "plasmas",
-    "barbell",
-    "imputed",
-    "coached",
-    "cheated",
-    "willows",
-    "flipped",
-    "harbors",
-    "adorned",
-    "cowgirl",
-    "layoffs",
-    "matures",
-    "thrones",
-    "sneaker",
-    "armoire",
-    "twinkle",
-    "shifter",
-    "uttered",
-    "tending",
-    "flicker",
-    "midsize",
-    "beastie",
-    "briefed",
-    "carcass",
-    "reprise",
-    "pebbles",
-    "stipend",
-    "snorkel",
-    "iridium",
-    "toppers",
-    "isoform",
-    "daisies",
-    "sorrows",
-    "boobies",
-    "ligands",
-    "sorghum",
-    "slotted",
-    "decking",
-    "cyanide",
-    "chiffon",
-    "fanfare",
-    "archaic",
-    "elevate",
-    "palmyra",
-    "affixed",
-    "ticking",
-    "webbing",
-    "bribery",
-    "kettles",
-    "chained",
-    "magnify",
-    "travail",
-    "fiddler",
-    "severed",
-    "operand",
-    "willful",
-    "busting",
-    "annexed",
-    "carling",
-    "buildup",
-    "esquire",
-    "cryptic",
-    "entrees",
-    "corpora",
-    "cholera",
-    "bullion",
-    "hateful",
-    "walleye",
-    "stratum",
-    "walkway",
-    "ovation",
-    "paddock",
-    "johnnie",
-    "bellows",
-    "venting",
-    "readout",
-    "grossly",
-    "stabbed",
-    "banding",
-    "origami",
-    "awnings",
-    "donates",
-    "hurried",
-    "vacated",
-    "manatee",
-    "sprouts",
-    "shopped",
-    "puritan",
-    "forearm",
-    "seaport",
-    "flashed",
-    "deceive",
-    "starved",
-    "scorers",
-    "hastily",
-    "invader",
-    "orbiter",
-    "thirdly",
-    "keyless",
-    "sharpen",
-    "caveats",
-    "lanyard",
-    "plunged",
-    "defiant",
-    "termite",
-    "perjury",
-    "busters",
-    "hectare",
-    "jackass",
-    "coffees",
-    "corpses",
-    "howling",
-    "nozzles",
-    "raisins",
-    "turkeys",
-    "pasting",
-    "caliper",
-    "concave",
-    "pennant",
-    "hoodies",
-    "overrun",
-    "inhabit",
-    "pleated",
-    "digests",
-    "resists",
-    "subdued",
-    "acidity",
-    "echelon",
-    "narrows",
-    "queuing",
-    "valuing",
-    "stetson",
-    "accuses",
-    "calibre",
-    "proverb",
-    "gutters",
-    "microns",
-    "mahjong",
-    "surpass",
-    "hideous",
-    "abreast",
-    "pompano",
-    "decency",
-    "teaming",
-    "glycine",
-    "varnish",
-    "rounder",
-    "perched",
-    "sunroof",
-    "densely",
-    "raffles",
-    "benthic",
-    "decrees",
-    "redline",
-    "solvers",
-    "lucerne",
-    "deacons",
-    "tumours",
-    "midgets",
-    "hidalgo",
-    "lawless",
-    "inhuman",
-    "bigfoot",
-    "despise",
-    "floated",
-    "rundown",
-    "custard",
-    "accords",
-    "gentile",
-    "loaders",
-    "trouser",
-    "annuals",
-    "valence",
-    "chianti",
-    "hombres",
-    "peering",
-    "slumber",
-    "chipped",
-    "potluck",
-    "creamer",
-    "fledged",
-    "pollack",
-    "arousal",
-    "vandals",
-    "mammary",
-    "garnish",
-    "peeling",
-    "blindly",
-    "halibut",
-    "fifties",
-    "alumnus",
-    "fenders",
-    "frisbee",
-    "seagull",
-    "streaks",
-    "visibly",
-    "defunct",
-    "decoded",
-    "kinship",
-    "blouses",
-    "hemlock",
-    "uncanny",
-    "concede",
-    "curated",
-    "fallacy",
-    "noxious",
-    "lunatic",
-    "haggard",
-    "reorder",
-    "breezes",
-    "cymbals",
-    "emblems",
-    "jamming",
-    "poisons",
-    "culprit",
-    "slicing",
-    "lighten",
-    "canteen",
-    "ominous",
-    "misfits",
-    "parlour",
-    "quieter",
-    "replays",
-    "caldera",
-    "baseman",
-    "tallest",
-    "wrestle",
-    "rectify",
-    "mittens",
-    "cranial",
-    "wrecked",
-    "deities",
-    "trickle",
-    "erratic",
-    "cashing",
-    "spousal",
-    "abusers",
-    "drifted",
-    "mallard",
-    "corsets",
-    "tonnage",
-    "histone",
-    "greener",
-    "helical",
-    "wetting",
-    "maniacs",
-    "remotes",
-    "critter",
-    "mooring",
-    "porters",
-    "forgery",
-    "gagging",
-    "imitate",
-    "cyclist",
-    "magneto",
-    "crunchy",
-    "sealant",
-    "mosaics",
-    "unfolds",
-    "brocade",
-    "ashtray",
-    "seaweed",
-    "hugging",
-    "postman",
-    "preheat",
-    "rookies",
-    "jarhead",
-    "matured",
-    "shoebox",
-    "lowdown",
-    "deprive",
-    "kremlin",
-    "buzzing",
-    "dauphin",
-    "grinned",
-    "macular",
-    "traitor",
-    "widened",
-    "fueling",
-    "crayons",
-    "awfully",
-    "corneal",
-    "profane",
-    "crusher",
-    "drinker",
-    "modeler",
-    "nonzero",
-    "hangman",
-    "sloping",
-    "unlucky",
-    "distort",
-    "ketchup",
-    "alimony",
-    "viscous",
-    "loosing",
-    "soloist",
-    "robbers",
-    "lowland",
-    "unheard",
-    "nomadic",
-    "prolong",
-    "weaning",
-    "myeloma",
-    "afghans",
-    "vividly",
-    "stooges",
-    "looting",
-    "humming",
-    "shearer",
-    "exerted",
-    "tumbler",
-    "ranting",
-    "erupted",
-    "comrade",
-    "piccolo",
-    "bushing",
-    "soviets",
-    "tweeter",
-    "stinger",
-    "wreaths",
-    "absorbs",
-    "bothers",
-    "parades",
-    "cubicle",
-    "invokes",
-    "cannons",
-    "sulfide",
-    "emptied",
-    "precede",
-    "jodhpur",
-    "tetanus",
-    "wildest",
-    "outlays",
-    "osmosis",
-    "priming",
-    "beretta",
-    "heathen",
-    "fanning",
-    "spurred",
-    "guilder",
-    "onstage",
-    "grilles",
-    "demonic",
-    "deduced",
-    "burials",
-    "drapery",
-    "entrant",
-    "phasing",
-    "lactate",
-    "skeptic",
-    "backlit",
-    "slander",
-    "onshore",
-    "florals",
-    "potions",
-    "squirts",
-    "watered",
-    "smelled",
-    "groomed",
-    "leaping",
-    "sliders",
-    "quickie",
-    "prowess",
-    "dogwood",
-    "manhood",
-    "nephews",
-    "boarded",
-    "syllabi",
-    "yonkers",
-    "taskbar",
-    "umpires",
-    "wayward",
-    "redness",
-    "erasure",
-    "glimmer",
-    "blooded",
-    "teddies",
-    "upsilon",
-    "sizable",
-    "weavers",
-    "thyself",
-    "chiller",
-    "rooting",
-    "sucrose",
-    "modesty",
-    "banshee",
-    "fisheye",
-    "wayside",
-    "aerials",
-    "summits",
-    "stylist",
-    "sprayer",
-    "gliders",
-    "legions",
-    "juicers",
-    "hangout",
-    "amnesia",
-    "bigotry",
-    "actuate",
-    "bruised",
-    "impeach",
-    "atrophy",
-    "bullpen",
-    "utopian",
-    "confers",
-    "decrypt",
-    "fringes",
-    "affirms",
-    "dildoes",
-    "takeoff",
-    "hitters",
-    "wickets",
-    "shimmer",
-    "violins",
-    "logbook",
-    "inflict",
-    "rotates",
-    "legible",
-    "rescues",
-    "waffles",
-    "annexes",
-    "vulture",
-    "mislead",
-    "ventral",
-    "welders",
-    "sponges",
-    "revered",
-    "shingle",
-    "timbers",
-    "glaring",
-    "tilting",
-    "oregano",
-    "drizzle",
-    "boaters",
-    "bracing",
-    "remorse",
-    "spacers",
-    "metered",
-    "lucifer",
-    "fatties",
-    "inflows",
-    "dosages",
-    "recited",
-    "throats",
-    "barrage",
-    "peeping",
-    "earners",
-    "walnuts",
-    "conical",
-    "mocking",
-    "tricked",
-    "raccoon",
-    "cheaply",
-    "consort",
-    "serrano",
-    "matchup",
-    "chuckle",
-    "swapped",
-    "bloated",
-    "armband",
-    "belated",
-    "stemmed",
-    "crammed",
-    "hatchet",
-    "pastels",
-    "creeper",
-    "hocking",
-    "femoral",
-    "zooming",
-    "nuances",
-    "knuckle",
-    "bastion",
-    "gypsies",
-    "submenu",
-    "sipping",
-    "stepper",
-    "realist",
-    "midsole",
-    "pervert",
-    "retails",
-    "circled",
-    "withers",
-    "bunches",
-    "deviate",
-    "atelier",
-    "veneers",
-    "venturi",
-    "cheered",
-    "beanies",
-    "beacons",
-    "bruises",
-    "freebie",
-    "bulimia",
-    "ladybug",
-    "bassoon",
-    "doubted",
-    "ravaged",
-    "ghostly",
-    "foresee",
-    "rations",
-    "minibar",
-    "barware",
-    "triplet",
-    "risking",
-    "ingress",
-    "barbers",
-    "retires",
-    "organza",
-    "funnies",
-    "hamlets",
-    "setters",
-    "lovable",
-    "synapse",
-    "airplay",
-    "sawmill",
-    "warmest",
-    "capping",
-    "hipster",
-    "bullish",
-    "mutated",
-    "amyloid",
-    "fuchsia",
-    "queried",
-    "rotting",
-    "sooners",
-    "ditches",
-    "scourge",
-    "bandage",
-    "tankers",
-    "cramped",
-    "racking",
-    "enclave",
-    "senders",
-    "updater",
-    "unarmed",
-    "sconces",
-    "novices",
-    "grasped",
-    "bequest",
-    "beggars",
-    "quixote",
-    "timings",
-    "trellis",
-    "marries",
-    "echoing",
-    "useable",
-    "papyrus",
-    "wiggles",
-    "siamese",
-    "javelin",
-    "bouncer",
-    "petites",
-    "crawled",
-    "manitou",
-    "rallied",
-    "quakers",
-    "putters",
-    "firebox",
-    "sonatas",
-    "bullies",
-    "caustic",
-    "emporia",
-    "limiter",
-    "pretext",
-    "catawba",
-    "ordinal",
-    "fibrous",
-    "epistle",
-    "acetone",
-    "alanine",
-    "finesse",
-    "nickels",
-    "reputed",
-    "bearers",
-    "guesses",
-    "courant",
-    "potters",
-    "flatter",
-    "cordial",
-    "quarrel",
-    "remixed",
-    "hypoxia",
-    "liqueur",
-    "pastime",
-    "pursues",
-    "healers",
-    "actuary",
-    "latches",
-    "emitter",
-    "trotter",
-    "winders",
-    "mortals",
-    "tillage",
-    "lasagna",
-    "landers",
-    "debuted",
-    "lagging",
-    "rosette",
-    "sequels",
-    "twofold",
-    "chanson",
-    "leprosy",
-    "goddamn",
-    "daggers",
-    "pleases",
-    "tritium",
-    "revolve",
-    "confine",
-    "yardage",
-    "whereof",
-    "wetsuit",
-    "defying",
-    "outcast",
-    "faraday",
-    "macabre",
-    "spotter",
-    "hearsay",
-    "matting",
-    "heretic",
-    "draught",
-    "comical",
-    "waiters",
-    "catwalk",
-    "caverns",
-    "boarder",
-    "minibus",
-    "bumping",
-    "amplify",
-    "seduced",
-    "angrily",
-    "croquet",
-    "burrito",
-    "backers",
-    "warlord",
-    "shocker",
-    "ruining",
-    "heroism",
-    "xenopus",
-    "toluene",
-    "tonneau",
-    "rosacea",
-    "bayonet",
-    "janitor",
-    "reunite",
-    "whither",
-    "flipper",
-    "eyeball",
-    "telefax",
-    "bossier",
-    "culvert",
-    "spanner",
-    "battled",
-    "styrene",
-    "alumnae",
-    "protege",
-    "settler",
-    "ovaries",
-    "daddies",
-    "follies",
-    "cleanly",
-    "unclean",
-    "seizing",
-    "ferrets",
-    "leveled",
-    "adheres",
-    "rawhide",
-    "downers",
-    "knotted",
-    "misused",
-    "debacle",
-    "undress",
-    "tenured",
-    "rumored",
-    "grantor",
-    "sceptre",
-    "matinee",
-    "plunder",
-    "midweek",
-    "inhaler",
-    "shudder",
-    "firemen",
-    "tuxedos",
-    "batters",
-    "scraper",
-    "dryness",
-    "gophers",
-    "dockers",
-    "infidel",
-    "larceny",
-    "unravel",
-    "android",
-    "galilee",
-    "orifice",
-    "rubella",
-    "sapphic",
-    "leucine",
-    "jobless",
-    "slashed",
-    "idyllic",
-    "satchel",
-    "giggles",
-    "stiller",
-    "loggers",
-    "steeped",
-    "eyelids",
-    "archers",
-    "forbids",
-    "disdain",
-    "daemons",
-    "enlaces",
-    "mastiff",
-    "pirated",
-    "leavers",
-    "fronted",
-    "picnics",
-    "broiler",
-    "lickers",
-    "abscess",
-    "memento",
-    "tumbled",
-    "choline",
-    "sweeter",
-    "tallied",
-    "saucers",
-    "gondola",
-    "truffle",
-    "flutter",
-    "shatter",
-    "pickled",
-    "rotator",
-    "carpool",
-    "armpits",
-    "slacker",
-    "bandana",
-    "padlock",
-    "classed",
-    "solidly",
-    "chimera",
-    "foaming",
-    "tailors",
-    "fixings",
-    "baffled",
-    "tripoli",
-    "fillets",
-    "dailies",
-    "retract",
-    "tinting",
-    "abelian",
-    "slashes",
-    "dwarves",
-    "artiste",
-    "centaur",
-    "pinhole",
-    "partake",
-    "snooper",
-    "rancher",
-    "grocers",
-    "vesting",
-    "panache",
-    "detract",
-    "pelagic",
-    "runways",
-    "frowned",
-    "tasking",
-    "tweaked",
-    "hatched",
-    "trample",
-    "colonic",
-    "wattage",
-    "biliary",
-    "resized",
-    "forgets",
-    "grapple",
-    "fumbles",
-    "nitrite",
-    "violets",
-    "monomer",
-    "hexagon",
-    "idiotic",
-    "workmen",
-    "pronoun",
-    "pulleys",
-    "sublets",
-    "antiwar",
-    "shadowy",
-    "liquors",
-    "abalone",
-    "creases",
-    "nourish",
-    "gingham",
-    "teasers",
-    "beveled",
-    "ejected",
-    "scribes",
-    "browsed",
-    "acutely",
-    "profess",
-    "legumes",
-    "inflate",
-    "sundown",
-    "workday",
-    "cutlass",
-    "maidens",
-    "joinery",
-    "octagon",
-    "equates",
-    "genders",
-    "harming",
-    "fatally",
-    "bravely",
-    "cheater",
-    "clogged",
-    "leashes",
-    "sounder",
-    "cursing",
-    "messier",
-    "flanges",
-    "bowlers",
-    "keypads",
-    "regress",
-    "spanned",
-    "rappers",
-    "cumulus",
-    "reigned",
-    "hookers",
-    "amalgam",
-    "pleural",
-    "dilated",
-    "angered",
-    "condone",
-    "thermos",
-    "garters",
-    "adamant",
-    "pontoon",
-    "tableau",
-    "numeral",
-    "myeloid",
-    "frigate",
-    "harrier",
-    "entrust",
-    "tripled",
-    "burying",
-    "chicano",
-    "erasing",
-    "cyclops",
-    "gunfire",
-    "groaned",
-    "voicing",
-    "grouper",
-    "bunkers",
-    "precast",
-    "caritas",
-    "rhubarb",
-    "ragtime",
-    "mayoral",
-    "tidings",
-    "silvery",
-    "nodding",
-    "templar",
-    "kestrel",
-    "ruffled",
-    "hoppers",
-    "trinket",
-    "wishful",
-    "trailed",
-    "expanse",
-    "hippies",
-    "preside",
-    "oeuvres",
-    "stapler",
-    "encased",
-    "scarred",
-    "ignited",
-    "coronal",
-    "tantric",
-    "scrooge",
-    "nagging",
-    "millers",
-    "clerics",
-    "poppies",
-    "notched",
-    "pullout",
-    "reeling",
-    "rimming",
-    "loafers",
-    "fuelled",
-    "squires",
-    "insures",
-    "slaying",
-    "mahatma",
-    "winches",
-    "moderne",
-    "chapels",
-    "tryouts",
-    "minions",
-    "iterate",
-    "proteus",
-    "ganglia",
-    "headway",
-    "buzzard",
-    "plunger",
-    "halting",
-    "veranda",
-    "cytosol",
-    "hatches",
-    "eyelets",
-    "flatten",
-    "mucosal",
-    "lentils",
-    "auberge",
-    "paprika",
-    "novella",
-    "diggers",
-    "glances",
-    "tyrants",
-    "ripples",
-    "griddle",
-    "nascent",
-    "precept",
-    "woodman",
-    "gravely",
-    "errands",
-    "savages",
-    "craters",
-    "mockery",
-    "epitaph",
-    "trypsin",
-    "bursary",
-    "bugaboo",
-    "chowder",
-    "freaked",
-    "mascots",
-    "comedic",
-    "crumble",
-    "spatula",
-    "drifter",
-    "stardom",
-    "exotics",
-    "immerse",
-    "envious",
-    "hirsute",
-    "fooling",
-    "vaulted",
-    "ectopic",
-    "coulomb",
-    "gleaned",
-    "flowery",
-    "sunburn",
-    "elector",
-    "fielded",
-    "dusting",
-    "shrines",
-    "bridged",
-    "sitcoms",
-    "ukulele",
-    "bracken",
-    "couches",
-    "arduous",
-    "slugger",
-    "fulcrum",
-    "gripped",
-    "sprites",
-    "dashing",
-    "shipman",
-    "bellied",
-    "decreed",
-    "addenda",
-    "keyhole",
-    "shiatsu",
-    "porcine",
-    "inshore",
-    "reducer",
-    "tremors",
-    "apropos",
-    "pitiful",
-    "linings",
-    "cortina",
-    "arbiter",
-    "buoyant",
-    "airtime",
-    "gryphon",
-    "meister",
-    "montero",
-    "vitally",
-    "chatted",
-    "hurling",
-    "brevity",
-    "epitope",
-    "prickly",
-    "whittle",
-    "elitist",
-    "copycat",
-    "denials",
-    "projets",
-    "anklets",
-    "impasse",
-    "piloted",
-    "squeaky",
-    "attache",
-    "bulging",
-    "chemise",
-    "hydrate",
-    "diurnal",
-    "subways",
-    "roebuck",
-    "typhoid",
-    "afghani",
-    "haulers",
-    "scallop",
-    "singlet",
-    "kiddies",
-    "minster",
-    "instill",
-    "fraught",
-    "droplet",
-    "slowest",
-    "revises",
-    "coexist",
-    "tripped",
-    "belling",
-    "copious",
-    "tremble",
-    "alluded",
-    "sojourn",
-    "zippers",
-    "caloric",
-    "surging",
-    "greased",
-    "yoghurt",
-    "robbing",
-    "epitome",
-    "breaths",
-    "flanked",
-    "primacy",
-    "carmine",
-    "chipper",
-    "fiancee",
-    "rhyming",
-    "stroked",
-    "buggies",
-    "speedup",
-    "cranium",
-    "politic",
-    "mitotic",
-    "pleaser",
-    "mingled",
-    "metazoa",
-    "shelved",
-    "wailing",
-    "buffets",
-    "poetics",
-    "entitle",
-    "relayed",
-    "jellies",
-    "airlift",
-    "nodules",
-    "tunable",
-    "plucked",
-    "rippers",
-    "discord",
-    "infield",
-    "preterm",
-    "stances",
-    "hashing",
-    "thrower",
-    "funnier",
-    "stormed",
-    "gifting",
-    "fistula",
-    "censure",
-    "carbine",
-    "porches",
-    "glorify",
-    "lineman",
-    "cleaver",
-    "overuse",
-    "haulage",
-    "conifer",
-    "fateful",
-    "beeswax",
-    "sprints",
-    "insular",
-    "lagoons",
-    "tellers",
-    "herding",
-    "functor",
-    "halcyon",
-    "cantina",
-    "nappies",
-    "sundial",
-    "preamps",
-    "gestalt",
-    "chorale",
-    "cyclase",
-    "gelding",
-    "cooktop",
-    "tagline",
-    "crackle",
-    "splices",
-    "belcher",
-    "spirals",
-    "onerous",
-    "haddock",
-    "pyjamas",
-    "copilot",
-    "phobias",
-    "clouded",
-    "bighorn",
-    "gimmick",
-    "wiretap",
-    "moniker",
-    "welling",
-    "divulge",
-    "wardens",
-    "guarani",
-    "peaking",
-    "seltzer",
-    "venison",
-    "basking",
-    "pinging",
-    "coopers",
-    "deploys",
-    "creamed",
-    "nannies",
-    "dodging",
-    "browned",
-    "unearth",
-    "hookups",
-    "gazelle",
-    "harpers",
-    "tendons",
-    "thrives",
-    "refuges",
-    "rousing",
-    "petting",
-    "roaster",
-    "warring",
-    "parsers",
-    "upholds",
-    "inroads",
-    "boasted",
-    "donkeys",
-    "synchro",
-    "chutney",
-    "normals",
-    "sonnets",
-    "inquest",
-    "hapless",
-    "hitches",
-    "shrinks",
-    "indexer",
-    "lalique",
-    "phoning",
-    "agarose",
-    "fissure",
-    "curtail",
-    "transom",
-    "vitesse",
-    "enraged",
-    "blotter",
-    "sitters",
-    "clamped",
-    "creased",
-    "trapper",
-    "slanted",
-    "plagues",
-    "adipose",
-    "potting",
-    "natured",
-    "blemish",
-    "bushels",
-    "boombox",
-    "evicted",
-    "digress",
-    "fetuses",
-    "arcades",
-    "jeweled",
-    "repaint",
-    "spastic",
-    "cutouts",
-    "coronet",
-    "taverns",
-    "conjure",
-    "enabler",
-    "herbals",
-    "sequins",
-    "chasers",
-    "fringed",
-    "goblins",
-    "nitride",
-    "caveman",
-    "nucleon",
-    "hideout",
-    "calcite",
-    "gunshot",
-    "zealous",
-    "ocarina",
-    "payoffs",
-    "defrost",
-    "meteors",
-    "diction",
-    "reentry",
-    "granola",
-    "ferrite",
-    "lampoon",
-    "firming",
-    "annular",
-    "chalice",
-    "prefect",
-    "sweetly",
-    "statins",
-    "kingpin",
-    "vermeil",
-    "moraine",
-    "sunbelt",
-    "dueling",
-    "reshape",
-    "gainers",
-    "widower",
-    "purging",
-    "scaring",
-    "strider",
-    "igneous",
-    "bitmaps",
-    "tempera",
-    "mystics",
-    "teapots",
-    "fresher",
-    "skimmer",
-    "technic",
-    "sketchy",
-    "steered",
-    "whatnot",
-    "eugenia",
-    "crowder",
-    "mangled",
-    "staunch",
-    "viscose",
-    "manhunt",
-    "mitosis",
-    "skylark",
-    "jigsaws",
-    "dockets",
-    "buyback",
-    "dunning",
-    "pinning",
-    "raisers",
-    "anemone",
-    "weeding",
-    "evasive",
-    "pausing",
-    "replete",
-    "glories",
-    "prelims",
-    "mandala",
-    "bristle",
-    "terrors",
-    "nonfarm",
-    "panacea",
-    "vibrate",
-    "deflect",
-    "chakras",
-    "mitogen",
-    "stumped",
-    "appease",
-    "furlong",
-    "shovels",
-    "mouthed",
-    "andante",
-    "overtly",
-    "tubulin",
-    "scraped",
-    "chagrin",
-    "panning",
-    "tickled",
-    "sparing",
-    "heifers",
-    "wanders",
-    "restful",
-    "pinched",
-    "granule",
-    "purport",
-    "ageless",
-    "hardtop",
-    "swaying",
-    "backhoe",
-    "trashed",
-    "lobbies",
-    "coldest",
-    "proviso",
-    "bazooka",
-    "gerbera",
-    "rescind",
-    "dioxins",
-    "gymnast",
-    "forceps",
-    "adjoint",
-    "rafters",
-    "jordans",
-    "blitzer",
-    "framers",
-    "humbled",
-    "radiate",
-    "attains",
-    "oocytes",
-    "blunder",
-    "antlers",
-    "powwows",
-    "reaping",
-    "dumbest",
-    "prowler",
-    "dredged",
-    "carport",
-    "dubbing",
-    "cobbler",
-    "heinous",
-    "manhole",
-    "eroding",
-    "shutout",
-    "quibble",
-    "curbing",
-    "harshly",
-    "blinked",
-    "snuggle",
-    "dragoon",
-    "merrily",
-    "griffon",
-    "exabyte",
-    "ceasing",
-    "eyelash",
-    "clicker",
-    "academe",
-    "obeying",
-    "gunners",
-    "gosling",
-    "mishaps",
-    "fouling",
-    "litters",
-    "brothel",
-    "shelled",
-    "planing",
-    "abysmal",
-    "termini",
-    "denture",
-    "fourths",
-    "wagoner",
-    "minding",
-    "bizarro",
-    "bullied",
-    "gnostic",
-    "parlors",
-    "scottie",
-    "fistful",
-    "staffer",
-    "thither",
-    "vesicle",
-    "gauging",
-    "censors",
-    "voyeurs",
-    "boyhood",
-    "campion",
-    "fervent",
-    "likened",
-    "hydride",
-    "livable",
-    "ushered",
-    "adenine",
-    "checkup",
-    "ionized",
-    "warship",
-    "rattles",
-    "trophic",
-    "marvels",
-    "quetzal",
-    "kickers",
-    "yeshiva",
-    "earthen",
-    "uplands",
-    "shivers",
-    "smitten",
-    "averted",
-    "equated",
-    "clocked",
-    "skewers",
-    "miocene",
-    "steeple",
-    "nailing",
-    "tannins",
-    "penance",
-    "charted",
-    "ravioli",
-    "walling",
-    "jointed",
-    "topsoil",
-    "isomers",
-    "beaming",
-    "chooser",
-    "bugging",
-    "chested",
-    "adoptee",
-    "plowing",
-    "riddled",
-    "hryvnia",
-    "utensil",
-    "dinning",
-    "mistral",
-    "admirer",
-    "divisor",
-    "searing",
-    "bustier",
-    "drugged",
-    "marbled",
-    "guanine",
-    "cruelly",
-    "tapioca",
-    "cursive",
-    "forties",
-    "ghastly",
-    "tongued",
-    "succumb",
-    "insoles",
-    "starlet",
-    "groupie",
-    "laminar",
-    "cowards",
-    "captors",
-    "amassed",
-    "charade",
-    "anagram",
-    "seepage",
-    "poppers",
-    "rapists",
-    "rectory",
-    "diptera",
-    "currant",
-    "crustal",
-    "hackman",
-    "seduces",
-    "sawdust",
-    "analyte",
-    "ballets",
-    "snowing",
-    "sportif",
-    "polices",
-    "dogging",
-    "rotunda",
-    "faintly",
-    "dweller",
-    "bitumen",
-    "spliced",
-    "gunning",
-    "tadpole",
-    "berserk",
-    "coerced",
-    "billets",
-    "advices",
-    "coffers",
-    "bhangra",
-    "deposed",
-    "forsake",
-    "swamped",
-    "tenuous",
-    "depress",
-    "kitties",
-    "waiving",
-    "dampers",
-    "relaxes",
-    "malaise",
-    "postdoc",
-    "hydrant",
-    "presser",
-    "chamois",
-    "urethra",
-    "leeward",
-    "risotto",
-    "anaemia",
-    "jungles",
-    "permian",
-    "pounder",
-    "archway",
-    "oversaw",
-    "loudest",
-    "viaduct",
-    "laurels",
-    "trekker",
-    "warhead",
-    "coinage",
-    "endgame",
-    "dimming",
-    "zealots",
-    "weighty",
-    "gasping",
-    "revisor",
-    "pendent",
-    "klezmer",
-    "edifice",
-    "lobbied",
-    "gallium",
-    "steeper",
-    "topiary",
-    "buttery",
-    "cronies",
-    "pipette",
-    "soundly",
-    "wicking",
-    "austral",
-    "weakens",
-    "pooping",
-    "marengo",
-    "resales",
-    "neocons",
-    "undoing",
-    "cassava",
-    "gripper",
-    "negated",
-    "purview",
-    "babbitt",
-    "gallows",
-    "devotee",
-    "smelter",
-    "manmade",
-    "sagging",
-    "statics",
-    "cupcake",
-    "raggedy",
-    "sobbing",
-    "prequel",
-    "shekels",
-    "ponders",
-    "sealers",
-    "erratum",
-    "foxtrot",
-    "reusing",
-    "thrusts",
-    "faraway",
-    "gazebos",
-    "sirloin",
-    "abounds",
-    "salutes",
-    "lapping",
-    "muffled",
-    "lockets",
-    "flocked",
-    "dialers",
-    "roselle",
-    "pulsing",
-    "obligor",
-    "matcher",
-    "heralds",
-    "lessors",
-    "amiable",
-    "hinders",
-    "opulent",
-    "outlier",
-    "exotica",
-    "scooped",
-    "cursory",
-    "batsman",
-    "refuted",
-    "penises",
-    "velvety",
-    "ternary",
-    "teeming",
-    "panting",
-    "romaine",
-    "signers",
-    "earbuds",
-    "adenoma",
-    "truancy",
-    "taxicab",
-    "midlife",
-    "widener",
-    "onetime",
-    "bagging",
-    "huddled",
-    "malacca",
-    "carrion",
-    "plantar",
-    "braised",
-    "pollute",
-    "charing",
-    "pretzel",
-    "warping",
-    "pronged",
-    "snipers",
-    "gosport",
-    "rubrics",
-    "greaves",
-    "patties",
-    "gambier",
-    "smeared",
-    "outfall",
-    "parasol",
-    "concurs",
-    "farting",
-    "culling",
-    "devotes",
-    "mortars",
-    "ductile",
-    "punters",
-    "dropper",
-    "krypton",
-    "bushman",
-    "ricotta",
-    "humidor",
-    "broiled",
-    "insides",
-    "cutaway",
-    "defraud",
-    "toothed",
-    "cliches",
-    "likable",
-    "standup",
-    "flexion",
-    "kinsman",
-    "footers",
-    "mutable",
-    "sputnik",
-    "coffins",
-    "rackets",
-    "heiress",
-    "godhead",
-    "shyness",
-    "pickers",
-    "angelus",
-    "momento",
-    "cuticle",
-    "pimples",
-    "shorted",
-    "readies",
-    "fairest",
-    "syncing",
-    "obelisk",
-    "canzoni",
-    "denning",
-    "jesuits",
-    "mottled",
-    "publics",
-    "unlocks",
-    "rinsing",
-    "preempt",
-    "shunned",
-    "wipeout",
-    "crushes",
-    "punting",
-    "fermion",
-    "pungent",
-    "reboots",
-    "fanzine",
-    "techies",
-    "canvass",
-    "baiting",
-    "sunspot",
-    "elation",
-    "cowbell",
-    "tranche",
-    "sanctum",
-    "stapled",
-    "fancied",
-    "crafter",
-    "giggled",
-    "titular",
-    "trapeze",
-    "extents",
-    "sunbird",
-    "damning",
-    "ailment",
-    "sharpie",
-    "currier",
-    "taproot",
-    "shoving",
-    "menthol",
-    "subnets",
-    "bagpipe",
-    "dribble",
-    "colloid",
-    "oxidant",
-    "parquet",
-    "emotive",
-    "thimble",
-    "racists",
-    "skydive",
-    "retinol",
-    "fairing",
-    "swisher",
-    "hotspur",
-    "collate",
-    "invades",
-    "talkers",
-    "sockeye",
-    "bluntly",
-    "assayed",
-    "goblets",
-    "touting",
-    "crappie",
-    "digoxin",
-    "diorama",
-    "nuanced",
-    "rattled",
-    "tramway",
-    "slayers",
-    "reapply",
-    "snowmen",
-    "rhizome",
-    "bureaux",
-    "leotard",
-    "impeded",
-    "pompous",
-    "subvert",
-    "muscled",
-    "takings",
-    "triplex",
-    "casings",
-    "sparkly",
-    "repeals",
-    "ducting",
-    "alpacas",
-    "powdery",
-    "diverge",
-    "untamed",
-    "notches",
-    "riveted",
-    "drafter",
-    "pitting",
-    "fittest",
-    "tarnish",
-    "isthmus",
-    "barista",
-    "raucous",
-    "hairpin",
-    "tootsie",
-    "blushed",
-    "saddest",
-    "exempts",
-    "batgirl",
-    "lefties",
-    "bloomer",
-    "barrows",
-    "scribed",
-    "borrows",
-    "butters",
-    "armrest",
-    "woollen",
-    "impairs",
-    "enteric",
-    "marimba",
-    "hotlink",
-    "rambles",
-    "diatoms",
-    "interne",
-    "dawning",
-    "caplets",
-    "wingers",
-    "trachea",
-    "numbing",
-    "osmotic",
-    "knitter",
-    "swelled",
-    "belting",
-    "rigidly",
-    "phalanx",
-    "sifting",
-    "meander",
-    "poached",
-    "hailing",
-    "slumped",
-    "thrived",
-    "ascribe",
-    "stalked",
-    "deluded",
-    "nitrile",
-    "labored",
-    "troughs",
-    "piscine",
-    "skilful",
-    "biofuel",
-    "endures",
-    "bismuth",
-    "intents",
-    "lantana",
-    "shriver",
-    "smacked",
-    "trusses",
-    "grooved",
-    "intitle",
-    "ungodly",
-    "felling",
-    "botched",
-    "microbe",
-    "necktie",
-    "seaward",
-    "ciphers",
-    "fleeces",
-    "adopter",
-    "decayed",
-    "sauteed",
-    "oddball",
-    "viceroy",
-    "yellows",
-    "driller",
-    "mummies",
-    "pretest",
-    "beseech",
-    "hitched",
-    "enchant",
-    "austere",
-    "cowhide",
-    "plumage",
-    "haughty",
-    "opiates",
-    "cadaver",
-    "yawning",
-    "airshow",
-    "attuned",
-    "raiding",
-    "ramming",
-    "strappy",
-    "reenter",
-    "inboard",
-    "caboose",
-    "fitters",
-    "cements",
-    "boudoir",
-    "rioting",
-    "amylase",
-    "unpaved",
-    "dinette",
-    "turners",
-    "dimples",
-    "hessian",
-    "petunia",
-    "gremlin",
-    "lifters",
-    "offends",
-    "shackle",
-    "itemize",
-    "splints",
-    "airship",
-    "scandic",
-    "trundle",
-    "cognate",
-    "flushes",
-    "restate",
-    "bouvier",
-    "godless",
-    "birders",
-    "brazing",
-    "hinting",
-    "omicron",
-    "bailiff",
-    "defaced",
-    "pampers",
-    "moorish",
-    "bobbing",
-    "machete",
-    "smartly",
-    "laments",
-    "menorah",
-    "charred",
-    "validly",
-    "rematch",
-    "unsound",
-    "takeout",
-    "bearish",
-    "reverie",
-    "callous",
-    "jingles",
-    "softens",
-    "flanged",
-    "sinuses",
-    "amputee",
-    "undying",
-    "stubble",
-    "caddies",
-    "knesset",
-    "splines",
-    "uptight",
-    "actives",
-    "doodles",
-    "hatters",
-    "soothes",
-    "compels",
-    "bobsled",
-    "decorum",
-    "taffeta",
-    "lenient",
-    "hyphens",
-    "medulla",
-    "zeolite",
-    "scrappy",
-    "stromal",
-    "jezebel",
-    "reverts",
-    "toppled",
-    "mending",
-    "hurtful",
-    "strayer",
-    "oratory",
-    "sprains",
-    "growled",
-    "nebulae",
-    "gentler",
-    "infects",
-    "impaled",
-    "diesels",
-    "geodesy",
-    "valuers",
-    "pitfall",
-    "lingers",
-    "lempira",
-    "bestial",
-    "restock",
-    "lineups",
-    "buddhas",
-    "bookish",
-    "gillies",
-    "grommet",
-    "wetness",
-    "bindery",
-    "bycatch",
-    "tantrum",
-    "flexing",
-    "tracers",
-    "awakens",
-    "methoxy",
-    "bromine",
-    "rampart",
-    "facades",
-    "conceit",
-    "needful",
-    "locusts",
-    "bambini",
-    "meiosis",
-    "thicket",
-    "rascals",
-    "stocker",
-    "birdies",
-    "radians",
-    "flaring",
-    "preload",
-    "tilapia",
-    "slasher",
-    "oxfords",
-    "grafted",
-    "propped",
-    "staking",
-    "bedouin",
-    "fancies",
-    "accuser",
-    "sultans",
-    "finches",
-    "basques",
-    "mullahs",
-    "lowball",
-    "grosses",
-    "oilseed",
-    "stiffer",
-    "allelic",
-    "birdman",
-    "layette",
-    "clasped",
-    "scrotum",
-    "pecking",
-    "grieved",
-    "tallies",
-    "sniping",
-    "enteral",
-    "reliefs",
-    "tassels",
-    "regalia",
-    "peerage",
-    "storied",
-    "verbena",
-    "doublet",
-    "typeset",
-    "subside",
-    "jarring",
-    "mumbled",
-    "cattery",
-    "jeepers",
-    "cantata",
-    "hillier",
-    "diploid",
-    "toggles",
-    "calving",
-    "offside",
-    "dairies",
-    "plunges",
-    "aseptic",
-    "defamer",
-    "shapers",
-    "gouging",
-    "acyclic",
-    "fulfils",
-    "rufiyaa",
-    "repress",
-    "steeply",
-    "peeking",
-    "gushers",
-    "skimmed",
-    "spewing",
-    "erasers",
-    "combing",
-    "dovecot",
-    "gumball",
-    "deepens",
-    "blather",
-    "oracles",
-    "palmtop",
-    "daylily",
-    "cranked",
-    "montane",
-    "piecing",
-    "helices",
-    "brindle",
-    "benders",
-    "taurine",
-    "rapping",
-    "diehard",
-    "swivels",
-    "bravado",
-    "ravings",
-    "saddled",
-    "trawler",
-    "bifocal",
-    "binning",
-    "sachets",
-    "scalpel",
-    "faeries",
-    "fascias",
-    "wedlock",
-    "sternly",
-    "chanted",
-    "softest",
-    "sniffed",
-    "babbler",
-    "rewrote",
-    "buffing",
-    "aphasia",
-    "icicles",
-    "godsend",
-    "doorman",
-    "rubbers",
-    "injures",
-    "pigtail",
-    "reloads",
-    "dollies",
-    "indicia",
-    "excised",
-    "forlorn",
-    "whacked",
-    "metical",
-    "slimmer",
-    "socials",
-    "yohimbe",
-    "passers",
-    "screech",
-    "fetches",
-    "clobber",
-    "fanfics",
-    "tremolo",
-    "goulash",
-    "beckons",
-    "goonies",
-    "ruffles",
-    "gaiters",
-    "curving",
-    "tankard",
-    "amorous",
-    "shaders",
-    "scenics",
-    "dryland",
-    "grumble",
-    "wronged",
-    "labours",
-    "harsher",
-    "langues",
-    "fortify",
-    "cherubs",
-    "canzone",
-    "tolling",
-    "bucking",
-    "baffles",
-    "obverse",
-    "elysian",
-    "sutures",
-    "cobbled",
-    "imparts",
-    "joggers",
-    "quilter",
-    "luminal",
-    "thawing",
-    "hovered",
-    "stunted",
-    "portico",
-    "excites",
-    "weasels",
-    "placard",
-    "slammer",
-    "jitters",
-    "dobbins",
-    "perusal",
-    "cloaked",
-    "lichens",
-    "fresnel",
-    "carters",
-    "titling",
-    "sunfish",
-    "bellman",
-    "pliable",
-    "dissect",
-    "olivine",
-    "gestapo",
-    "bramble",
-    "hollies",
-    "canasta",
-    "tooting",
-    "scalars",
-    "anthill",
-    "balding",
-    "quasars",
-    "strayed",
-    "webwork",
-    "plucker",
-    "hiccups",
-    "silvers",
-    "jurists",
-    "perches",
-    "candler",
-    "scrapes",
-    "warthog",
-    "vetting",
-    "goalies",
-    "joiners",
-    "mantras",
-    "figural",
-    "piscina",
-    "kleenex",
-    "thorium",
-    "lorries",
-    "swindle",
-    "candied",
-    "poodles",
-    "unboxed",
-    "wrecker",
-    "upstart",
-    "refocus",
-    "remakes",
-    "sequent",
-    "retries",
-    "wailers",
-    "forbade",
-    "woofers",
-    "arching",
-    "worsted",
-    "vagrant",
-    "empties",
-    "dominos",
-    "decibel",
-    "josephs",
-    "pythons",
-    "barrios",
-    "embarks",
-    "dualism",
-    "factoid",
-    "arrayed",
-    "stamper",
-    "hissing",
-    "outcrop",
-    "intrude",
-    "topmost",
-    "opioids",
-    "charmer",
-    "pontiff",
-    "scabies",
-    "napping",
-    "momenta",
-    "wingman",
-    "tiniest",
-    "caskets",
-    "auroral",
-    "urinate",
-    "ravages",
-    "unlined",
-    "humanly",
-    "abiotic",
-    "peddler",
-    "adverbs",
-    "hobbits",
-    "crowbar",
-    "nettles",
-    "cruised",
-    "lashing",
-    "tabling",
-    "floater",
-    "recluse",
-    "stoning",
-    "blacker",
-    "aspires",
-    "isotype",
-    "cloture",
-    "calculi",
-    "victors",
-    "wiseguy",
-    "bookman",
-    "phrased",
-    "puddles",
-    "pardons",
-    "whisker",
-    "latched",
-    "cravers",
-    "clashed",
-    "holdall",
-    "harpoon",
-    "reining",
-    "deflate",
-    "cannery",
-    "mannose",
-    "cobwebs",
-    "hellish",
-    "hominid",
-    "ugliest",
-    "trumped",
-    "keratin",
-    "tilbury",
-    "hutches",
-    "engrave",
-    "bauxite",
-    "barrack",
-    "gouache",
-    "lysates",
-    "muddled",
-    "evoking",
-    "curries",
-    "slinger",
-    "cliques",
-    "delving",
-    "mallets",
-    "floored",
-    "midline",
-    "beaters",
-    "implode",
-    "stagger",
-    "crusted",
-    "turrets",
-    "slither",
-    "juggler",
-    "worsens",
-    "stifled",
-    "formica",
-    "urinals",
-    "samsara",
-    "lioness",
-    "heaving",
-    "pensive",
-    "paschal",
-    "showoff",
-    "cowling",
-    "ferment",
-    "thinned",
-    "flapper",
-    "aircrew",
-    "seabird",
-    "hoisted",
-    "auteurs",
-    "wastage",
-    "mommies",
-    "growths",
-    "garbled",
-    "stroker",
-    "tickers",
-    "introns",
-    "dimmers",
-    "misread",
-    "affiche",
-    "paucity",
-    "thumper",
-    "amulets",
-    "cargoes",
-    "eyebeam",
-    "disobey",
-    "chromed",
-    "savoury",
-    "cleaved",
-    "blarney",
-    "magnate",
-    "pillage",
-    "scruffy",
-    "vibrato",
-    "ejector",
-    "votives",
-    "tampons",
-    "curable",
-    "guineas",
-    "brisket",
-    "ramping",
-    "plummet",
-    "deplete",
-    "casuals",
-    "bambino",
-    "tubules",
-    "frailty",
-    "tangier",
-    "ouguiya",
-    "ragweed",
-    "vetiver",
-    "reopens",
-    "boxwood",
-    "stentor",
-    "broking",
-    "erudite",
-    "chisels",
-    "phoneme",
-    "spoofed",
-    "talkies",
-    "stutter",
-    "reticle",
-    "bonkers",
-    "verdant",
-    "secrete",
-    "lounger",
-    "cockney",
-    "penning",
-    "gammons",
-    "handoff",
-    "leeches",
-    "convoys",
-    "ospreys",
-    "shapely",
-    "wheelie",
-    "preemie",
-    "refiner",
-    "galleon",
-    "ketones",
-    "chafing",
-    "betrays",
-    "sunroom",
-    "inwards",
-    "regroup",
-    "scammed",
-    "soiling",
-    "germane",
-    "jacobus",
-    "mourned",
-    "woodcut",
-    "thickly",
-    "cistern",
-    "phaeton",
-    "purists",
-    "speedos",
-    "funnels",
-    "amazons",
-    "canines",
-    "strobes",
-    "beanbag",
-    "sidecar",
-    "bilayer",
-    "skeeter",
-    "cartels",
-    "squelch",
-    "vitriol",
-    "rumbles",
-    "ascites",
-    "febrile",
-    "mercies",
-    "manilla",
-    "airfoil",
-    "lignite",
-    "scorned",
-    "thicken",
-    "morphed",
-    "dernier",
-    "puffing",
-    "wielded",
-    "castors",
-    "finials",
-    "trestle",
-    "souffle",
-    "spiking",
-    "mulling",
-    "sighing",
-    "pergola",
-    "cupping",
-    "earache",
-    "ionizer",
-    "evading",
-    "striper",
-    "redfish",
-    "shrimps",
-    "stirrup",
-    "flopped",
-    "subtext",
-    "looters",
-    "stuffer",
-    "minnows",
-    "giardia",
-    "coffret",
-    "briskly",
-    "humoral",
-    "subplot",
-    "ingrown",
-    "affront",
-    "baileys",
-    "outturn",
-    "ripstop",
-    "murmurs",
-    "gleaner",
-    "ridings",
-    "chokers",
-    "tanager",
-    "winsome",
-    "equaled",
-    "emerita",
-    "longbow",
-    "scalper",
-    "tartans",
-    "grayish",
-    "homered",
-    "recline",
-    "fluvial",
-    "candela",
-    "collard",
-    "typists",
-    "ledgers",
-    "deicide",
-    "crozier",
-    "soliton",
-    "cropper",
-    "groping",
-    "cabanas",
-    "shoring",
-    "medians",
-    "asunder",
-    "statist",
-    "sheaves",
-    "polemic",
-    "armoury",
-    "hubcaps",
-    "knocker",
-    "storeys",
-    "sherbet",
-    "vernier",
-    "cahiers",
-    "breaded",
-    "pomfret",
-    "nibbles",
-    "cornice",
-    "tannery",
-    "buckled",
-    "kindled",
-    "spinoff",
-    "biofilm",
-    "rimless",
-    "wistful",
-    "twinkie",
-    "admires",
-    "moronic",
-    "sellout",
-    "fumbled",
-    "lancers",
-    "marsala",
-    "upsurge",
-    "tugging",
-    "fissile",
-    "heckler",
-    "parkers",
-    "whippet",
-    "chicane",
-    "feedlot",
-    "gamelan",
-    "sheared",
-    "unaided",
-    "curried",
-    "clapped",
-    "squishy",
-    "shamans",
-    "smocked",
-    "faulted",
-    "maggots",
-    "snagged",
-    "caraway",
-    "earshot",
-    "batsmen",
-    "coughed",
-    "niggers",
-    "thiamin",
-    "tugboat",
-    "slewing",
-    "deanery",
-    "kibbutz",
-    "midrash",
-    "commode",
-    "adoring",
-    "trodden",
-    "huskers",
-    "debited",
-    "saguaro",
-    "reaming",
-    "carvers",
-    "aniline",
-    "decodes",
-    "oxalate",
-    "evinced",
-    "freesia",
-    "situate",
-    "devises",
-    "ditched",
-    "whalers",
-    "wrester",
-    "smuggle",
-    "accrues",
-    "titania",
-    "plasmon",
-    "nickles",
-    "ducking",
-    "cellist",
-    "rusting",
-    "slicker",
-    "bolling",
-    "falsify",
-    "swagger",
-    "flicked",
-    "hadrons",
-    "hellcat",
-    "mandrel",
-    "actinic",
-    "offload",
-    "ponchos",
-    "detours",
-    "bravest",
-    "crevice",
-    "foxtail",
-    "hypoxic",
-    "rescuer",
-    "epithet",
-    "elution",
-    "camphor",
-    "mongols",
-    "ruddock",
-    "comings",
-    "crinkle",
-    "edibles",
-    "tearful",
-    "betwixt",
-    "purpura",
-    "dyspnea",
-    "mantels",
-    "stomper",
-    "sorties",
-    "revives",
-    "suitors",
-    "forking",
-    "sleight",
-    "shutoff",
-    "skirted",
-    "kirkman",
-    "daybook",
-    "reckons",
-    "puzzler",
-    "fainted",
-    "fleshed",
-    "winking",
-    "wallaby",
-    "grossed",
-    "cottons",
-    "dazzled",
-    "consuls",
-    "newness",
-    "ascetic",
-    "khalifa",
-    "patella",
-    "slicers",
-    "placket",
-    "formate",
-    "bigoted",
-    "formers",
-    "levying",
-    "taverna",
-    "tempers",
-    "quinine",
-    "retards",
-    "saintly",
-    "moonlit",
-    "melange",
-    "demoted",
-    "nullify",
-    "refines",
-    "infarct",
-    "sacking",
-    "clapper",
-    "upswing",
-    "gunnery",
-    "snorted",
-    "nymphos",
-    "fitment",
-    "lemming",
-    "appends",
-    "laminin",
-    "buttock",
-    "ergodic",
-    "retrace",
-    "splurge",
-    "bombard",
-    "magpies",
-    "swirled",
-    "warlike",
-    "fretted",
-    "begonia",
-    "dieters",
-    "roaches",
-    "pulsars",
-    "cording",
-    "scepter",
-    "scrapie",
-    "enticed",
-    "schmuck",
-    "exclaim",
-    "clavier",
-    "honoree",
-    "bailout",
-    "bicolor",
-    "annulus",
-    "newtons",
-    "whisked",
-    "signore",
-    "grouchy",
-    "mobster",
-    "riviere",
-    "brazier",
-    "cantons",
-    "wrights",
-    "tangles",
-    "parador",
-    "meanest",
-    "refutes",
-    "hollows",
-    "minimax",
-    "oppress",
-    "coverup",
-    "nostril",
-    "impedes",
-    "surmise",
-    "groomer",
-    "saluted",
-    "polenta",
-    "octaves",
-    "emanate",
-    "rummage",
-    "makings",
-    "noblest",
-    "bobbins",
-    "splenic",
-    "tankini",
-    "marmite",
-    "hemming",
-    "defiled",
-    "triceps",
-    "neonate",
-    "roofers",
-    "deadman",
-    "combats",
-    "aquaria",
-    "legibly",
-    "closers",
-    "spammed",
-    "doormat",
-    "areolas",
-    "celadon",
-    "timpani",
-    "wagging",
-    "farrier",
-    "ballers",
-    "granary",
-    "whitish",
-    "melanin",
-    "blacked",
-    "dowsing",
-    "bookies",
-    "figment",
-    "wearily",
-    "glazier",
-    "playpen",
-    "anchovy",
-    "earings",
-    "hotshot",
-    "sunland",
-    "linseed",
-    "lectern",
-    "mongrel",
-    "hashish",
-    "mopping",
-    "gainful",
-    "lessees",
-    "whimper",
-    "incised",
-    "elicits",
-    "invents",
-    "wantage",
-    "tenfold",
-    "bluefin",
-    "jammers",
-    "scoured",
-    "bushido",
-    "layaway",
-    "pilsner",
-    "chancel",
-    "lamprey",
-    "washout",
-    "darshan",
-    "pigskin",
-    "airwave",
-    "fusions",
-    "naphtha",
-    "oversea",
-    "girdles",
-    "bannock",
-    "crating",
-    "ferrule",
-    "ignites",
-    "enrolls",
-    "fulness",
-    "majored",
-    "calkins",
-    "bronzes",
-    "baywood",
-    "startle",
-    "smashes",
-    "erector",
-    "cichlid",
-    "awardee",
-    "rooming",
-    "spiller",
-    "bearcat",
-    "excimer",
-    "cashews",
-    "opossum",
-    "tickles",
-    "outdraw",
-    "lurkers",
-    "sardine",
-    "meshing",
-    "aimless",
-    "parfait",
-    "cuddles",
-    "sorters",
-    "sangria",
-    "turnips",
-    "bahadur",
-    "sextant",
-    "stomped",
-    "donning",
-    "planers",
-    "lustful",
-    "grandad",
-    "rebuked",
-    "buyouts",
-    "phenols",
-    "presage",
-    "tidying",
-    "maypole",
-    "liftoff",
-    "lensing",
-    "piglets",
-    "mongers",
-    "gibsons",
-    "greases",
-    "morgans",
-    "boatman",
-    "negates",
-    "syncope",
-    "freshen",
-    "outdone",
-    "sternum",
-    "iguanas",
-    "hamming",
-    "paraded",
-    "inbuilt",
-    "whirled",
-    "reclame",
-    "enlists",
-    "nailers",
-    "blaring",
-    "engined",
-    "spooler",
-    "heaping",
-    "oration",
-    "grunted",
-    "benzoyl",
-    "batched",
-    "posited",
-    "pennine",
-    "fiestas",
-    "wouldst",
-    "coarser",
-    "markups",
-    "challis",
-    "aliquot",
-    "outsell",
-    "regains",
-    "lessens",
-    "warners",
-    "ripened",
-    "madrona",
-    "bandsaw",
-    "toenail",
-    "waltzes",
-    "attests",
-    "parched",
-    "stanzas",
-    "tonsils",
-    "asexual",
-    "kindest",
-    "bonnets",
-    "paneled",
-    "sciatic",
-    "sheaths",
-    "jugular",
-    "bemused",
-    "hacksaw",
-    "confide",
-    "sweeten",
-    "macaque",
-    "palmers",
-    "outcall",
-    "chilies",
-    "spender",
-    "chicory",
-    "subsoil",
-    "chablis",
-    "unifies",
-    "elitism",
-    "helicon",
-    "carwash",
-    "hearken",
-    "tachyon",
-    "braless",
-    "patting",
-    "niobium",
-    "traumas",
-    "doilies",
-    "dusters",
-    "psyched",
-    "chattel",
-    "butlers",
-    "paddled",
-    "trisomy",
-    "inkling",
-    "garcons",
-    "ramblas",
-    "arbutus",
-    "darting",
-    "tripper",
-    "blunted",
-    "pushers",
-    "limping",
-    "anionic",
-    "archaea",
-    "forages",
-    "volante",
-    "noisily",
-    "wearers",
-    "beastly",
-    "letdown",
-    "matrons",
-    "arcanum",
-    "solanum",
-    "buckler",
-    "flyover",
-    "lorimer",
-    "melding",
-    "pinkish",
-    "blurted",
-    "merited",
-    "beatnik",
-    "shellac",
-    "helluva",
-    "saloons",
-    "meiotic",
-    "scuttle",
-    "rougher",
-    "raiment",
-    "disused",
-    "stooped",
-    "carbons",
-    "bolting",
-    "fixated",
-    "skelter",
-    "forgave",
-    "homeric",
-    "biplane",
-    "barrens",
-    "lifeway",
-    "outlast",
-    "dangles",
-    "adduced",
-    "alludes",
-    "lectins",
-    "realign",
-    "nigella",
-    "tailing",
-    "walkout",
-    "tensors",
-    "pharynx",
-    "dishing",
-    "vespers",
-    "lobelia",
-    "belleek",
-    "urchins",
-    "kinesis",
-    "implore",
-    "dragnet",
-    "hedonic",
-    "mangoes",
-    "lancing",
-    "enslave",
-    "espouse",
-    "sumpter",
-    "subarea",
-    "bitters",
-    "dirhams",
-    "avarice",
-    "hanuman",
-    "exciter",
-    "insipid",
-    "biasing",
-    "holiest",
-    "compote",
-    "pansies",
-    "acceded",
-    "millage",
-    "foresaw",
-    "hunched",
-    "pickets",
-    "soothed",
-    "finfish",
-    "floured",
-    "herders",
-    "pueblos",
-    "tenable",
-    "jumbled",
-    "pembina",
-    "scolded",
-    "fetters",
-    "tokamak",
-    "samadhi",
-    "silesia",
-    "tipster",
-    "monopod",
-    "diluent",
-    "pinatas",
-    "brights",
-    "scammer",
-    "falsity",
-    "sapling",
-    "baboons",
-    "propels",
-    "jittery",
-    "godlike",
-    "unblock",
-    "littles",
-    "bailing",
-    "renames",
-    "brutish",
-    "extrema",
-    "gridded",
-    "disband",
-    "joyride",
-    "megabit",
-    "hearers",
-    "availed",
-    "damsels",
-    "sashimi",
-    "morsels",
-    "snicker",
-    "ghettos",
-    "aerated",
-    "boldest",
-    "impound",
-    "unsaved",
-    "parapet",
-    "dogfish",
-    "duelist",
-    "recheck",
-    "apatite",
-    "proofed",
-    "glosses",
-    "swapper",
-    "beeping",
-    "airless",
-    "cyborgs",
-    "naively",
-    "cleaves",
-    "enamels",
-    "fillies",
-    "linemen",
-    "afflict",
-    "ceilidh",
-    "adducts",
-    "doubler",
-    "mimicry",
-    "perigee",
-    "trotted",
-    "vaunted",
-    "astride",
-    "alcazar",
-    "receded",
-    "halters",
-    "impinge",
-    "genteel",
-    "speeder",
-    "theists",
-    "toiling",
-    "airhead",
-    "voiding",
-    "collies",
-    "cannula",
-    "betaine",
-    "gravure",
-    "prosody",
-    "ridding",
-    "pinhead",
-    "exhaled",
-    "snipped",
-    "sextile",
-    "rioters",
-    "duffels",
-    "amperes",
-    "citable",
-    "girders",
-    "wasters",
-    "arabica",
-    "dextran",
-    "cookout",
-    "sharers",
-    "labeler",
-    "dipoles",
-    "guarana",
-    "barbies",
-    "brewpub",
-    "mortise",
-    "scouter",
-    "gaggers",
-    "sleuths",
-    "gonadal",
-    "stymied",
-    "muskrat",
-    "mumbles",
-    "brained",
-    "tempura",
-    "peonies",
-    "seeders",
-    "stealer",
-    "offhand",
-    "bashful",
-    "sailers",
-    "absolve",
-    "barkers",
-    "purples",
-    "kinsmen",
-    "morello",
-    "pimping",
-    "tacitly",
-    "sawfish",
-    "mistook",
-    "zipping",
-    "exhumed",
-    "infante",
-    "subzero",
-    "baloney",
-    "omelets",
-    "hermits",
-    "gullies",
-    "fajitas",
-    "falafel",
-    "whopper",
-    "pothole",
-    "felines",
-    "pizzazz",
-    "hegemon",
-    "ethinyl",
-    "yuppies",
-    "thruway",
-    "banksia",
-    "reenact",
-    "jetting",
-    "felting",
-    "injects",
-    "nodular",
-    "juicing",
-    "aplenty",
-    "epitaxy",
-    "fathoms",
-    "nuptial",
-    "externe",
-    "daphnia",
-    "bulbous",
-    "expound",
-    "chanced",
-    "lockbox",
-    "comfrey",
-    "milkman",
-    "inexact",
-    "eidolon",
-    "samoyed",
-    "stearic",
-    "aground",
-    "redwing",
-    "sinning",
-    "gnawing",
-    "mucking",
-    "crudely",
-    "ciliary",
-    "profuse",
-    "couched",
-    "maroons",
-    "bestows",
-    "rickets",
-    "pullers",
-    "blesses",
-    "burdock",
-    "scherzo",
-    "pierrot",
-    "hotness",
-    "decadal",
-    "cheviot",
-    "coranto",
-    "lindane",
-    "brasher",
-    "daybeds",
-    "tanners",
-    "sofabed",
-    "netsuke",
-    "courted",
-    "uveitis",
-    "earmark",
-    "enliven",
-    "envelop",
-    "dustbin",
-    "stamens",
-    "launder",
-    "aerator",
-    "basmati",
-    "grander",
-    "airdate",
-    "gladden",
-    "geysers",
-    "usurped",
-    "inkwell",
-    "xylitol",
-    "tillers",
-    "uridine",
-    "dutiful",
-    "unquote",
-    "pasties",
-    "buggers",
-    "affaire",
-    "rupiahs",
-    "gauchos",
-    "distill",
-    "leptons",
-    "nunnery",
-    "epoxies",
-    "jiffies",
-    "clatter",
-    "beamish",
-    "trefoil",
-    "riptide",
-    "vapours",
-    "firings",
-    "quipped",
-    "speckle",
-    "cossack",
-    "sultana",
-    "topsail",
-    "modicum",
-    "steppes",
-    "derided",
-    "vocally",
-    "retrial",
-    "seeping",
-    "flotsam",
-    "hummers",
-    "readied",
-    "antacid",
-    "stashed",
-    "unmoved",
-    "stunner",
-    "fancier",
-    "gumtree",
-    "hangars",
-    "skyward",
-    "heroics",
-    "tithing",
-    "gerbils",
-    "speeded",
-    "outgrow",
-    "medigap",
-    "flaking",
-    "probity",
-    "affable",
-    "sterols",
-    "missive",
-    "serovar",
-    "ascends",
-    "loafing",
-    "foibles",
-    "slurred",
-    "stepson",
-    "bulwark",
-    "sheltie",
-    "mangold",
-    "stringy",
-    "churned",
-    "ironies",
-    "tribals",
-    "dappled",
-    "azaleas",
-    "tacking",
-    "feigned",
-    "dripped",
-    "epicure",
-    "sorbent",
-    "speller",
-    "sierras",
-    "tamales",
-    "imperia",
-    "satsuma",
-    "dervish",
-    "tangram",
-    "tinfoil",
-    "hoodlum",
-    "chelate",
-    "midyear",
-    "subtask",
-    "revamps",
-    "paddler",
-    "flanker",
-    "dwarfed",
-    "moonset",
-    "debrief",
-    "ribbing",
-    "diddley",
-    "lozenge",
-    "scarier",
-    "topside",
-    "hardens",
-    "paroled",
-    "imagers",
-    "uniques",
-    "obliges",
-    "mulatto",
-    "emeriti",
-    "courtly",
-    "kampong",
-    "phallic",
-    "pigweed",
-    "taunted",
-    "bubbled",
-    "soloing",
-    "cordage",
-    "hobbled",
-    "nightie",
-    "topline",
-    "jesters",
-    "tutored",
-    "leftism",
-    "misting",
-    "sarongs",
-    "aileron",
-    "rebuffs",
-    "sputter",
-    "handily",
-    "presale",
-    "shoppes",
-    "baptize",
-    "panicum",
-    "relaxer",
-    "horning",
-    "subsist",
-    "nutters",
-    "beagles",
-    "sundeck",
-    "saucier",
-    "sported",
-    "quaking",
-    "nuclide",
-    "riskier",
-    "animism",
-    "stiffen",
-    "louvers",
-    "showman",
-    "aspired",
-    "runnels",
-    "seawall",
-    "curlers",
-    "amanita",
-    "solider",
-    "gusting",
-    "quintin",
-    "leveler",
-    "balling",
-    "layover",
-    "baronet",
-    "atresia",
-    "turnoff",
-    "scoffed",
-    "snarled",
-    "regulus",
-    "premade",
-    "languid",
-    "reviled",
-    "starkly",
-    "fiddles",
-    "fogging",
-    "gilding",
-    "twining",
-    "sickest",
-    "outland",
-    "phrasal",
-    "sigmoid",
-    "acolyte",
-    "aeolian",
-    "sedated",
-    "obviate",
-    "getters",
-    "primero",
-    "wilding",
-    "redrawn",
-    "lanolin",
-    "baubles",
-    "bacilli",
-    "crimper",
-    "crucify",
-    "mirador",
-    "cassino",
-    "maleate",
-    "blushes",
-    "pregame",
-    "axially",
-    "emirate",
-    "wiccans",
-    "ikebana",
-    "organon",
-    "bittern",
-    "abetted",
-    "daystar",
-    "outpace",
-    "revving",
-    "exigent",
-    "deadpan",
-    "sneaked",
-    "squalor",
-    "bulking",
-    "chaplet",
-    "narrate",
-    "legwork",
-    "gleamed",
-    "reroute",
-    "airpark",
-    "quashed",
-    "comport",
-    "deeming",
-    "flaccid",
-    "prodded",
-    "sterner",
-    "womanly",
-    "chorizo",
-    "outwith",
-    "fibroid",
-    "dimpled",
-    "massing",
-    "grimace",
-    "bribing",
-    "comping",
-    "bridles",
-    "pannier",
-    "virions",
-    "parotid",
-    "pilling",
-    "bistros",
-    "blanked",
-    "swarmed",
-    "shafted",
-    "cradled",
-    "trolled",
-    "basting",
-    "inducer",
-    "merrier",
-    "simples",
-    "vegetal",
-    "mimetic",
-    "catsuit",
-    "rubbery",
-    "spooked",
-    "crewman",
-    "settlor",
-    "redbird",
-    "fraktur",
-    "cochlea",
-    "innards",
-    "biotics",
-    "marabou",
-    "whoring",
-    "gassing",
-    "sulfite",
-    "rending",
-    "consign",
-    "mantles",
-    "breccia",
-    "supremo",
-    "honking",
-    "crazies",
-    "gapping",
-    "candids",
-    "halides",
-    "chunked",
-    "uptempo",
-    "halving",
-    "wheaten",
-    "arugula",
-    "faggots",
-    "epoxide",
-    "baddest",
-    "malling",
-    "lasagne",
-    "latrine",
-    "tweezer",
-    "gulping",
-    "beeline",
-    "gametes",
-    "subhead",
-    "servile",
-    "pintail",
-    "benzoic",
-    "rickety",
-    "secondo",
-    "panzers",
-    "prosaic",
-    "bimodal",
-    "taxiway",
-    "snubbed",
-    "humerus",
-    "revolts",
-    "wharves",
-    "homeboy",
-    "maduros",
-    "kerning",
-    "bruiser",
-    "stowage",
-    "contras",
-    "trunked",
-    "spurned",
-    "percale",
-    "viscera",
-    "smirked",
-    "unscrew",
-    "bronzed",
-    "basenji",
-    "gobbles",
-    "dumbing",
-    "bringer",
-    "wettest",
-    "conners",
-    "bunched",
-    "fusible",
-    "kimonos",
-    "baklava",
-    "diopter",
-    "unspent",
-    "automat",
-    "garnets",
-    "haploid",
-    "shrieks",
-    "vacuous",
-    "peloton",
-    "greeter",
-    "serfdom",
-    "gossips",
-    "kiddush",
-    "scuffle",
-    "tollway",
-    "riotous",
-    "florets",
-    "clinker",
-    "bushmen",
-    "devolve",
-    "sandbar",
-    "weirder",
-    "suppers",
-    "recurve",
-    "ravines",
-    "diverts",
-    "bazaars",
-    "elastin",
-    "deathly",
-    "unloved",
-    "railcar",
-    "gunship",
-    "entreat",
-    "placate",
-    "cessing",
-    "cocking",
-    "damiana",
-    "crisper",
-    "beakers",
-    "poacher",
-    "hosanna",
-    "linkers",
-    "blotted",
-    "grammes",
-    "shrouds",
-    "choroid",
-    "tatting",
-    "recites",
-    "palabra",
-    "royally",
-    "retrain",
-    "garners",
-    "minders",
-    "eyewash",
-    "topcoat",
-    "bracers",
-    "guzzler",
-    "maltose",
-    "rookery",
-    "blankly",
-    "chantry",
-    "fondant",
-    "vestige",
-    "shoeing",
-    "harried",
-    "blubber",
-    "scumbag",
-    "stirrer",
-    "braving",
-    "perspex",
-    "torched",
-    "gliomas",
-    "tucking",
-    "bivalve",
-    "decried",
-    "dwindle",
-    "quizzed",
-    "cutoffs",
-    "mugging",
-    "uncivil",
-    "nelsons",
-    "pegging",
-    "boggles",
-    "commies",
-    "jointer",
-    "plurals",
-    "tandems",
-    "corsage",
-    "spambot",
-    "cession",
-    "heeding",
-    "dissing",
-    "revelry",
-    "hogging",
-    "haywire",
-    "ligated",
-    "ruinous",
-    "overage",
-    "lugging",
-    "leadoff",
-    "furrows",
-    "throngs",
-    "toccata",
-    "foodies",
-    "harpist",
-    "tilling",
-    "crimped",
-    "sidings",
-    "salukis",
-    "zeroing",
-    "purring",
-    "strolls",
-    "gentian",
-    "cicadas",
-    "shagged",
-    "phallus",
-    "nasties",
-    "foramen",
-    "trifles",
-    "lockups",
-    "hotdogs",
-    "suiting",
-    "asinine",
-    "upriver",
-    "galleys",
-    "chapped",
-    "bodegas",
-    "sunning",
-    "indents",
-    "incited",
-    "shebang",
-    "rippled",
-    "cystine",
-    "tresses",
-    "cheeked",
-    "curfews",
-    "repulse",
-    "challah",
-    "foxfire",
-    "zapping",
-    "formals",
-    "glossed",
-    "hounded",
-    "evangel",
-    "chordal",
-    "jutting",
-    "yttrium",
-    "unfunny",
-    "bosonic",
-    "dipolar",
-    "sneered",
-    "vacuole",
-    "pincher",
-    "gambles",
-    "unmixed",
-    "grieves",
-    "doggies",
-    "dahlias",
-    "tumbles",
-    "frogman",
-    "flyaway",
-    "exciton",
-    "coaxing",
-    "preying",
-    "strived",
-    "olefins",
-    "praline",
-    "agitate",
-    "shindig",
-    "aligner",
-    "rattler",
-    "ballade",
-    "eyesore",
-    "dyeable",
-    "piggies",
-    "shallot",
-    "beached",
-    "flexure",
-    "solutes",
-    "weirdly",
-    "summery",
-    "eardrum",
-    "resells",
-    "spieler",
-    "vandyke",
-    "chalked",
-    "basalts",
-    "baddies",
-    "grannie",
-    "gambled",
-    "inverts",
-    "gratify",
-    "alkanes",
-    "biotite",
-    "carding",
-    "operant",
-    "goshawk",
-    "possums",
-    "moisten",
-    "forints",
-    "moorhen",
-    "pavlova",
-    "peopled",
-    "maracas",
-    "swooped",
-    "sludges",
-    "flanger",
-    "quieted",
-    "albumen",
-    "stemmer",
-    "jujitsu",
-    "peepers",
-    "weevils",
-    "retouch",
-    "lection",
-    "senates",
-    "whereon",
-    "entente",
-    "falters",
-    "muskets",
-    "gibbous",
-    "wavered",
-    "hayseed",
-    "eluting",
-    "ballons",
-    "chiming",
-    "poplars",
-    "debater",
-    "mousses",
-    "finicky",
-    "ousting",
-    "audibly",
-    "saltire",
-    "starchy",
-    "bronchi",
-    "bleeder",
-    "baggies",
-    "waisted",
-    "cussing",
-    "noncash",
-    "kachina",
-    "expunge",
-    "externs",
-    "plovers",
-    "grudges",
-    "wankers",
-    "inflame",
-    "bluster",
-    "fattest",
-    "prelate",
-    "plastid",
-    "preform",
-    "spooled",
-    "biocide",
-    "phoebus",
-    "feuding",
-    "saviors",
-    "bubbler",
-    "maudlin",
-    "landman",
-    "lowbrow",
-    "deplore",
-    "swizzle",
-    "macadam",
-    "employe",
-    "fervour",
-    "tickler",
-    "plowman",
-    "bathers",
-    "digraph",
-    "legroom",
-    "mashing",
-    "ebonite",
-    "mangers",
-    "laminae",
-    "crooner",
-    "redoing",
-    "couplet",
-    "erosive",
-    "mezuzah",
-    "bedbugs",
-    "woodies",
-    "loaning",
-    "formant",
-    "bashers",
-    "riffing",
-    "whoopee",
-    "dentate",
-    "attired",
-    "platted",
-    "picador",
-    "bronzer",
-    "squeaks",
-    "moderns",
-    "coeliac",
-    "stipple",
-    "schlock",
-    "chapeau",
-    "etheric",
-    "partied",
-    "assuage",
-    "yearned",
-    "fondest",
-    "coining",
-    "loathed",
-    "weirdos",
-    "chanter",
-    "roubles",
-    "solders",
-    "mutagen",
-    "bandeau",
-    "babysit",
-    "sirocco",
-    "teacups",
-    "nudging",
-    "blinder",
-    "girlish",
-    "encores",
-    "foremen",
-    "ranchos",
-    "bragged",
-    "riddler",
-    "sawyers",
-    "harries",
-    "welches",
-    "footman",
-    "tailers",
-    "saddler",
-    "prepped",
-    "allover",
-    "sinless",
-    "moulder",
-    "delimit",
-    "grosser",
-    "crybaby",
-    "wilting",
-    "resound",
-    "jaspers",
-    "exacted",
-    "fraters",
-    "crasher",
-    "hoarded",
-    "refried",
-    "noonday",
-    "sinuous",
-    "wilders",
-    "briefer",
-    "effendi",
-    "homburg",
-    "revokes",
-    "adjoins",
-    "slatted",
-    "bloomed",
-    "gigging",
-    "rhombus",
-    "bigtime",
-    "forbear",
-    "quitter",
-    "ignitor",
-    "furtive",
-    "conning",
-    "dippers",
-    "gnocchi",
-    "igniter",
-    "palfrey",
-    "wobbler",
-    "jawbone",
-    "jejunum",
-    "jackals",
-    "outlive",
-    "bollard",
-    "hapkido",
-    "clubman",
-    "evacuee",
-    "shariah",
-    "roundly",
-    "winless",
-    "mollusk",
-    "flirted",
-    "toggled",
-    "scuffed",
-    "vanpool",
-    "alveoli",
-    "wellies",
-    "visiter",
-    "clumber",
-    "devalue",
-    "gleeful",
-    "cobbles",
-    "quinone",
-    "proffer",
-    "fussing",
-    "neuroma",
-    "shakily",
-    "pounced",
-    "famines",
-    "halbert",
-    "oxidize",
-    "cyprian",
-    "policed",
-    "nipping",
-    "baryons",
-    "graphed",
-    "trifold",
-    "sessile",
-    "fondled",
-    "sporran",
-    "troilus",
-    "wrinkly",
-    "parsnip",
-    "crewmen",
-    "toughen",
-    "wracked",
-    "dabbled",
-    "piteous",
-    "inching",
-    "tatters",
-    "percept",
-    "perfidy",
-    "psalter",
-    "isozyme",
-    "diabolo",
-    "impious",
-    "robusta",
-    "deejays",
-    "stilted",
-    "cliched",
-    "stiffly",
-    "blading",
-    "calpain",
-    "clawing",
-    "luthier",
-    "wrangle",
-    "halacha",
-    "posadas",
-    "hogwash",
-    "unkempt",
-    "jotting",
-    "ascents",
-    "draping",
-    "meerkat",
-    "porcini",
-    "hallows",
-    "decease",
-    "pruners",
-    "tactful",
-    "friable",
-    "nutting",
-    "ziplock",
-    "monadic",
-    "yanking",
-    "fawning",
-    "huggers",
-    "psychos",
-    "littler",
-    "funnily",
-    "resents",
-    "nostrum",
-    "torques",
-    "treacle",
-    "corrode",
-    "blooper",
-    "amphora",
-    "bourses",
-    "macrame",
-    "fannies",
-    "filbert",
-    "stoping",
-    "gastrin",
-    "cutlets",
-    "condors",
-    "leaguer",
-    "scandia",
-    "picante",
-    "plumbed",
-    "drainer",
-    "leghorn",
-    "glutton",
-    "graying",
-    "wearied",
-    "dimeric",
-    "panoply",
-    "maillot",
-    "humvees",
-    "astound",
-    "coiling",
-    "minuses",
-    "narwhal",
-    "calamus",
-    "headend",
-    "whiners",
-    "pitying",
-    "easting",
-    "overman",
-    "nullity",
-    "hawkers",
-    "deltoid",
-    "coombes",
-    "cuddled",
-    "fending",
-    "nematic",
-    "heavies",
-    "betters",
-    "remarry",
-    "pesetas",
-    "petiole",
-    "veering",
-    "tabbing",
-    "streaky",
-    "rutting",
-    "bourdon",
-    "primula",
-    "fevered",
-    "pinches",
-    "chucked",
-    "bugbear",
-    "wreaked",
-    "masques",
-    "gravels",
-    "rondeau",
-    "treetop",
-    "maremma",
-    "tethers",
-    "sceptic",
-    "fibrils",
-    "eunuchs",
-    "wagered",
-    "wallies",
-    "cocoons",
-    "shaming",
-    "opuntia",
-    "cutback",
-    "retorts",
-    "mappers",
-    "troupes",
-    "bungled",
-    "crowing",
-    "hijinks",
-    "birches",
-    "patency",
-    "droning",
-    "junkers",
-    "impresa",
-    "deviled",
-    "subtler",
-    "thymine",
-    "predate",
-    "mullets",
-    "lusting",
-    "brimmed",
-    "thrifts",
-    "tardive",
-    "cistron",
-    "podiums",
-    "phonons",
-    "salting",
-    "scrawny",
-    "peppery",
-    "splodge",
-    "perlite",
-    "nymphet",
-    "hernias",
-    "vomited",
-    "dunking",
-    "pouting",
-    "springy",
-    "perplex",
-    "tenures",
-    "ammeter",
-    "squalid",
-    "hippest",
-    "cinders",
-    "smudges",
-    "autobus",
-    "preachy",
-    "pilings",
-    "blitzed",
-    "wishers",
-    "sissies",
-    "gutting",
-    "gillnet",
-    "freemen",
-    "duopoly",
-    "butanol",
-    "shrilly",
-    "basilar",
-    "turbans",
-    "vocoder",
-    "harping",
-    "beeches",
-    "gaucher",
-    "tensely",
-    "clamour",
-    "slivers",
-    "soother",
-    "radials",
-    "souther",
-    "ruffian",
-    "newsman",
-    "ourself",
-    "clubber",
-    "partita",
-    "varmint",
-    "bikeway",
-    "ciliate",
-    "bubonic",
-    "crumbly",
-    "untried",
-    "spaying",
-    "scrying",
-    "borings",
-    "coppice",
-    "nestles",
-    "jammies",
-    "boppers",
-    "xanthan",
-    "goofing",
-    "acerbic",
-    "withing",
-    "flogged",
-    "drabble",
-    "dispels",
-    "subitem",
-    "wagtail",
-    "casitas",
-    "someway",
-    "cattail",
-    "flutist",
-    "pervade",
-    "scalers",
-    "apaches",
-    "myriads",
-    "diarist",
-    "egotism",
-    "wapping",
-    "foghorn",
-    "affixes",
-    "smasher",
-    "wallops",
-    "longish",
-    "varices",
-    "buffoon",
-    "rumbled",
-    "isospin",
-    "focuser",
-    "pricked",
-    "coppers",
-    "derails",
-    "airwise",
-    "hawkish",
-    "lollies",
-    "deckers",
-    "glycols",
-    "timbres",
-    "strudel",
-    "grassed",
-    "fromage",
-    "gunboat",
-    "saddens",
-    "spangle",
-    "unfazed",
-    "malting",
-    "airboat",
-    "browner",
-    "packman",
-    "coterie",
-    "puffins",
-    "caudate",
-    "jailing",
-    "carting",
-    "durning",
-    "benzine",
-    "corrida",
-    "reynard",
-    "perused",
-    "manures",
-    "sizzler",
-    "joinder",
-    "stinker",
-    "redbone",
-    "quivers",
-    "mulches",
-    "fraying",
-    "cockles",
-    "bucolic",
-    "mentees",
-    "infuses",
-    "impaler",
-    "decries",
-    "gruyere",
-    "tigress",
-    "girlies",
-    "lancets",
-    "gravest",
-    "butting",
-    "gobbled",
-    "minaret",
-    "cupolas",
-    "skewing",
-    "arouses",
-    "fiddled",
-    "gotchas",
-    "reapers",
-    "molders",
-    "uncouth",
-    "timolol",
-    "portent",
-    "crossly",
-    "blabber",
-    "gribble",
-    "dowager",
-    "usurper",
-    "grahams",
-    "crazier",
-    "daresay",
-    "footbag",
-    "knurled",
-    "instate",
-    "bettors",
-    "flossie",
-    "subtest",
-    "gutless",
-    "pulping",
-    "odorant",
-    "mohawks",
-    "ignoble",
-    "timidly",
-    "greyish",
-    "grimmer",
-    "lookers",
-    "pagodas",
-    "woodlot",
-    "willies",
-    "sickles",
-    "mutters",
-    "squeals",
-    "recency",
-    "pfennig",
-    "rustler",
-    "jetties",
-    "ligases",
-    "civilly",
-    "untaxed",
-    "obligee",
-    "royster",
-    "subsite",
-    "megaton",
-    "netizen",
-    "spacial",
-    "temping",
-    "shylock",
-    "hoovers",
-    "handers",
-    "theming",
-    "nutcase",
-    "gnarled",
-    "splayed",
-    "barneys",
-    "aarrghh",
-    "abasers",
-    "abashed",
-    "abashes",
-    "abasias",
-    "abasing",
-    "abaters",
-    "abating",
-    "abators",
-    "abattis",
-    "abaxial",
-    "abaxile",
-    "abbotcy",
-    "abduced",
-    "abduces",
-    "abducts",
-    "abelias",
-    "abettal",
-    "abetter",
-    "abettor",
-    "abeyant",
-    "abfarad",
-    "abhenry",
-    "abiders",
-    "abioses",
-    "abiosis",
-    "abjured",
-    "abjurer",
-    "abjures",
-    "ablated",
-    "ablates",
-    "ablator",
-    "ablauts",
-    "ableism",
-    "ableist",
-    "ablings",
-    "abluent",
-    "abluted",
-    "aboding",
-    "abollae",
-    "abomasa",
-    "abomasi",
-    "aborter",
-    "abortus",
-    "abought",
-    "aboulia",
-    "aboulic",
-    "abraded",
-    "abrader",
-    "abrades",
-    "abreact",
-    "abridge",
-    "abroach",
-    "abrosia",
-    "abscise",
-    "abscond",
-    "abseils",
-    "absents",
-    "absinth",
-    "absurds",
-    "abubble",
-    "abulias",
-    "abuttal",
-    "abutted",
-    "abutter",
-    "abvolts",
-    "abwatts",
-    "abyssal",
-    "abysses",
-    "acacias",
-    "acajous",
-    "acaleph",
-    "acantha",
-    "acanthi",
-    "acapnia",
-    "acarids",
-    "acarine",
-    "acaroid",
-    "acaudal",
-    "acceder",
-    "accedes",
-    "accidia",
-    "accidie",
-    "accosts",
-    "accrete",
-    "accurst",
-    "accusal",
-    "acedias",
-    "acequia",
-    "acerate",
-    "acerber",
-    "acerola",
-    "acerose",
-    "acerous",
-    "acetals",
-    "acetify",
-    "acetins",
-    "acetose",
-    "acetous",
-    "acetyls",
-    "achenes",
-    "achiest",
-    "achiote",
-    "achiral",
-    "acholia",
-    "acicula",
-    "acidify",
-    "aciform",
-    "acinose",
-    "acinous",
-    "aclinic",
-    "acmatic",
-    "acnodes",
-    "aconite",
-    "acorned",
-    "acquest",
-    "acquits",
-    "acrasia",
-    "acrasin",
-    "acrider",
-    "acridly",
-    "acrogen",
-    "acromia",
-    "acronic",
-    "acrotic",
-    "actable",
-    "actinal",
-    "actings",
-    "actinia",
-    "actinon",
-    "actorly",
-    "aculeus",
-    "acumens",
-    "acutest",
-    "acylate",
-    "acyloin",
-    "adagial",
-    "adagios",
-    "adaxial",
-    "addable",
-    "addaxes",
-    "addedly",
-    "addends",
-    "addible",
-    "addling",
-    "addrest",
-    "adducer",
-    "adduces",
-    "adeemed",
-    "adenoid",
-    "adenyls",
-    "adepter",
-    "adeptly",
-    "adherer",
-    "adhibit",
-    "adipous",
-    "adjudge",
-    "adjured",
-    "adjurer",
-    "adjures",
-    "adjuror",
-    "admixed",
-    "admixes",
-    "adnexal",
-    "adnouns",
-    "adorers",
-    "adorner",
-    "adsorbs",
-    "adulate",
-    "adultly",
-    "advects",
-    "advents",
-    "advisee",
-    "adwoman",
-    "adwomen",
-    "adzukis",
-    "aecidia",
-    "aediles",
-    "aegises",
-    "aeneous",
-    "aeonian",
-    "aerates",
-    "aeriest",
-    "aerobat",
-    "aerobes",
-    "aerobia",
-    "aerogel",
-    "aerosat",
-    "aerugos",
-    "aethers",
-    "afeared",
-    "affably",
-    "affiant",
-    "affinal",
-    "affined",
-    "affines",
-    "affixal",
-    "affixer",
-    "affrays",
-    "afreets",
-    "aftmost",
-    "aftosas",
-    "agamete",
-    "agamids",
-    "agamous",
-    "agapeic",
-    "agarics",
-    "agatize",
-    "agatoid",
-    "ageings",
-    "ageisms",
-    "ageists",
-    "agelong",
-    "agemate",
-    "agendum",
-    "agenize",
-    "agented",
-    "agentry",
-    "aggadah",
-    "aggadas",
-    "aggadic",
-    "aggadot",
-    "aggrade",
-    "aggress",
-    "agilely",
-    "aginner",
-    "agisted",
-    "agitato",
-    "aglycon",
-    "agnails",
-    "agnates",
-    "agnatic",
-    "agnized",
-    "agnizes",
-    "agnomen",
-    "agnosia",
-    "agonies",
-    "agonise",
-    "agonize",
-    "agoroth",
-    "agoutis",
-    "agrafes",
-    "agraffe",
-    "agrapha",
-    "agravic",
-    "ahimsas",
-    "aiblins",
-    "aidless",
-    "aiglets",
-    "aigrets",
-    "aikidos",
-    "ainsell",
-    "airdrop",
-    "airglow",
-    "airhole",
-    "airiest",
-    "airings",
-    "airlike",
-    "airpost",
-    "airshed",
-    "airshot",
-    "airsick",
-    "airthed",
-    "airting",
-    "airward",
-    "aitches",
-    "ajowans",
-    "akvavit",
-    "alamode",
-    "alanins",
-    "alanyls",
-    "alarums",
-    "alaskas",
-    "alastor",
-    "alation",
-    "albatas",
-    "albedos",
-    "albinal",
-    "albinic",
-    "albinos",
-    "albites",
-    "albitic",
-    "albizia",
-    "alcades",
-    "alcaics",
-    "alcaide",
-    "alcalde",
-    "alcayde",
-    "alchymy",
-    "alcoved",
-    "alcoves",
-    "aldoses",
-    "aldrins",
-    "alegars",
-    "alembic",
-    "alencon",
-    "alerter",
-    "alertly",
-    "aleuron",
-    "alevins",
-    "alewife",
-    "alexias",
-    "alexine",
-    "alexins",
-    "alfakis",
-    "alfaqui",
-    "alforja",
-    "alibied",
-    "alibies",
-    "alidade",
-    "alidads",
-    "aliened",
-    "alienee",
-    "aliener",
-    "alienly",
-    "alienor",
-    "aliform",
-    "alights",
-    "aliment",
-    "aliners",
-    "alining",
-    "alipeds",
-    "aliunde",
-    "aliyahs",
-    "alkalic",
-    "alkalin",
-    "alkalis",
-    "alkanet",
-    "alkenes",
-    "alkines",
-    "alkylic",
-    "alkynes",
-    "allayed",
-    "allayer",
-    "alleger",
-    "allheal",
-    "allicin",
-    "alliums",
-    "allobar",
-    "allodia",
-    "allonge",
-    "allonym",
-    "alloxan",
-    "alloyed",
-    "allseed",
-    "allured",
-    "allurer",
-    "allures",
-    "alluvia",
-    "allying",
-    "allylic",
-    "almemar",
-    "almners",
-    "almondy",
-    "almoner",
-    "almonry",
-    "almsman",
-    "almsmen",
-    "almuces",
-    "almudes",
-    "alnicos",
-    "alodial",
-    "alodium",
-    "aloetic",
-    "aloofly",
-    "alphorn",
-    "alphyls",
-    "alpines",
-    "alsikes",
-    "alterer",
-    "althaea",
-    "altheas",
-    "althorn",
-    "altoist",
-    "aludels",
-    "alumine",
-    "alumins",
-    "alunite",
-    "alyssum",
-    "amadous",
-    "amarone",
-    "amasser",
-    "amasses",
-    "amative",
-    "amatols",
-    "amatory",
-    "ambages",
-    "ambaris",
-    "ambeers",
-    "amblers",
-    "ambling",
-    "amboina",
-    "ambones",
-    "amboyna",
-    "ambries",
-    "ambroid",
-    "ambsace",
-    "amebean",
-    "ameboid",
-    "amender",
-    "amentia",
-    "amerced",
-    "amercer",
-    "amerces",
-    "amesace",
-    "amiably",
-    "amidase",
-    "amidine",
-    "amidins",
-    "amidols",
-    "amidone",
-    "aminity",
-    "amirate",
-    "amities",
-    "ammines",
-    "ammonal",
-    "ammonic",
-    "amnesic",
-    "amnions",
-    "amniote",
-    "amoebae",
-    "amoeban",
-    "amoebas",
-    "amoebic",
-    "amorini",
-    "amorino",
-    "amorist",
-    "amoroso",
-    "amosite",
-    "amotion",
-    "amplest",
-    "ampoule",
-    "ampules",
-    "ampulla",
-    "amreeta",
-    "amritas",
-    "amtrack",
-    "amtracs",
-    "amusers",
-    "amusias",
-    "amusive",
-    "amylene",
-    "amylose",
-    "amylums",
-    "anadems",
-    "anaemic",
-    "anagoge",
-    "anagogy",
-    "analgia",
-    "anality",
-    "anankes",
-    "anapest",
-    "anaphor",
-    "anarchs",
-    "anatase",
-    "anattos",
-    "anchusa",
-    "ancilla",
-    "anconal",
-    "ancones",
-    "ancress",
-    "andiron",
-    "aneared",
-    "aneling",
-    "anemias",
-    "anergia",
-    "anergic",
-    "aneroid",
-    "anestri",
-    "anethol",
-    "aneurin",
-    "angakok",
-    "angaria",
-    "angeled",
-    "angerly",
-    "anginal",
-    "anginas",
-    "angioma",
-    "anglice",
-    "angoras",
-    "angrier",
-    "anguine",
-    "anhinga",
-    "anilins",
-    "anility",
-    "animacy",
-    "animato",
-    "animist",
-    "aniseed",
-    "anisole",
-    "ankling",
-    "ankuses",
-    "anlaces",
-    "anlagen",
-    "anlages",
-    "anlases",
-    "annates",
-    "annatto",
-    "anneals",
-    "annelid",
-    "annonas",
-    "annoyer",
-    "annulet",
-    "anodize",
-    "anodyne",
-    "anoints",
-    "anolyte",
-    "anomies",
-    "anonyms",
-    "anopias",
-    "anopsia",
-    "anoraks",
-    "anorexy",
-    "anosmia",
-    "anosmic",
-    "anoxias",
-    "ansated",
-    "antbear",
-    "antefix",
-    "anteing",
-    "anthers",
-    "anthoid",
-    "antiair",
-    "antiars",
-    "antibug",
-    "anticar",
-    "anticks",
-    "anticly",
-    "antifat",
-    "antiflu",
-    "antifog",
-    "antifur",
-    "antigay",
-    "antigun",
-    "antijam",
-    "antilog",
-    "antiman",
-    "antings",
-    "antipot",
-    "antired",
-    "antisag",
-    "antisex",
-    "antitax",
-    "antlike",
-    "antlion",
-    "antonym",
-    "antrums",
-    "antsier",
-    "anurans",
-    "anurias",
-    "anurous",
-    "anviled",
-    "anywise",
-    "aorists",
-    "aoudads",
-    "apagoge",
-    "apanage",
-    "aparejo",
-    "apelike",
-    "apercus",
-    "aperies",
-    "apetaly",
-    "aphagia",
-    "aphasic",
-    "aphelia",
-    "apheses",
-    "aphesis",
-    "aphetic",
-    "aphides",
-    "aphonia",
-    "aphonic",
-    "aphotic",
-    "aphthae",
-    "aphylly",
-    "apicals",
-    "apiculi",
-    "apishly",
-    "aplasia",
-    "aplites",
-    "aplitic",
-    "aplombs",
-    "apnoeal",
-    "apnoeas",
-    "apnoeic",
-    "apocarp",
-    "apocope",
-    "apodous",
-    "apogamy",
-    "apogeal",
-    "apogean",
-    "apogees",
-    "apogeic",
-    "apollos",
-    "apologs",
-    "apolune",
-    "apomict",
-    "aporias",
-    "apostil",
-    "apothem",
-    "appalls",
-    "apparat",
-    "applier",
-    "apposed",
-    "apposer",
-    "apposes",
-    "apprise",
-    "apprize",
-    "appulse",
-    "apraxia",
-    "apraxic",
-    "aproned",
-    "aprotic",
-    "apsidal",
-    "apsides",
-    "apteral",
-    "apteria",
-    "apteryx",
-    "aptness",
-    "apyrase",
-    "aquavit",
-    "aquiver",
-    "arabesk",
-    "arabize",
-    "arables",
-    "aramids",
-    "araneid",
-    "araroba",
-    "arbored",
-    "arbores",
-    "arbours",
-    "arbutes",
-    "arcaded",
-    "archean",
-    "archfoe",
-    "archils",
-    "archine",
-    "archons",
-    "arcking",
-    "arcsine",
-    "arctics",
-    "arcuate",
-    "arcuses",
-    "ardency",
-    "ardours",
-    "areally",
-    "areaway",
-    "arenite",
-    "arenose",
-    "arenous",
-    "areolae",
-    "areolar",
-    "areoles",
-    "argalas",
-    "argalis",
-    "argents",
-    "argling",
-    "argotic",
-    "arguers",
-    "arguses",
-    "argyles",
-    "argylls",
-    "aridest",
-    "aridity",
-    "arietta",
-    "ariette",
-    "ariosos",
-    "aristae",
-    "aristas",
-    "aristos",
-    "arkoses",
-    "arkosic",
-    "armadas",
-    "armfuls",
-    "armhole",
-    "armiger",
-    "armilla",
-    "armings",
-    "armless",
-    "armlets",
-    "armlike",
-    "armload",
-    "armlock",
-    "armorer",
-    "armours",
-    "armsful",
-    "armures",
-    "arnatto",
-    "arnicas",
-    "arnotto",
-    "aroints",
-    "arouser",
-    "aroynts",
-    "arpents",
-    "arracks",
-    "arraign",
-    "arrased",
-    "arrases",
-    "arrayal",
-    "arrayer",
-    "arrises",
-    "arriver",
-    "arrobas",
-    "arrowed",
-    "arroyos",
-    "arshins",
-    "arsines",
-    "artiest",
-    "artless",
-    "artsier",
-    "arugola",
-    "aruspex",
-    "asarums",
-    "ascared",
-    "ascarid",
-    "ascaris",
-    "asceses",
-    "ascesis",
-    "ascidia",
-    "ascitic",
-    "asepses",
-    "asepsis",
-    "ashcake",
-    "ashcans",
-    "ashfall",
-    "ashiest",
-    "ashlars",
-    "ashlers",
-    "ashless",
-    "ashrams",
-    "askance",
-    "askeses",
-    "askesis",
-    "askings",
-    "asocial",
-    "asperse",
-    "asphyxy",
-    "aspirer",
-    "aspises",
-    "asquint",
-    "asramas",
-    "assagai",
-    "assails",
-    "assayer",
-    "assegai",
-    "assents",
-    "assizes",
-    "asslike",
-    "assoils",
-    "assorts",
-    "assumer",
-    "assurer",
-    "assuror",
-    "asswage",
-    "astasia",
-    "astatic",
-    "asteria",
-    "astheny",
-    "asthmas",
-    "astilbe",
-    "astrals",
-    "astrict",
-    "astylar",
-    "asylums",
-    "atabals",
-    "atactic",
-    "ataghan",
-    "atalaya",
-    "atamans",
-    "ataraxy",
-    "atavism",
-    "atavist",
-    "ataxias",
-    "ataxics",
-    "ataxies",
-    "atemoya",
-    "athirst",
-    "athodyd",
-    "athwart",
-    "atingle",
-    "atlatls",
-    "atomics",
-    "atomies",
-    "atomise",
-    "atomism",
-    "atomist",
-    "atomize",
-    "atoners",
-    "atonias",
-    "atonics",
-    "atonies",
-    "atoning",
-    "atopies",
-    "atresic",
-    "atretic",
-    "atriums",
-    "atropin",
-    "attaboy",
-    "attaint",
-    "attires",
-    "attorns",
-    "attrite",
-    "attrits",
-    "attunes",
-    "aubades",
-    "auburns",
-    "aucubas",
-    "audient",
-    "audiles",
-    "audings",
-    "auditee",
-    "augends",
-    "augites",
-    "augitic",
-    "augural",
-    "augured",
-    "augurer",
-    "auklets",
-    "auldest",
-    "aunties",
-    "aurally",
-    "aurated",
-    "aureate",
-    "aureola",
-    "aureole",
-    "auricle",
-    "aurists",
-    "aurochs",
-    "aurorae",
-    "auroras",
-    "ausform",
-    "auspice",
-    "ausubos",
-    "autarch",
-    "autarky",
-    "autisms",
-    "autists",
-    "autoing",
-    "automan",
-    "automen",
-    "autonym",
-    "autopen",
-    "autumns",
-    "auxeses",
-    "auxesis",
-    "auxetic",
-    "auxinic",
-    "avellan",
-    "avenges",
-    "avenses",
-    "averred",
-    "averter",
-    "avgases",
-    "aviated",
-    "aviates",
-    "aviatic",
-    "avidins",
-    "avidity",
-    "avionic",
-    "avocets",
-    "avodire",
-    "avoider",
-    "avosets",
-    "avowals",
-    "avowers",
-    "avowing",
-    "avulsed",
-    "avulses",
-    "awaiter",
-    "awaking",
-    "awarder",
-    "aweless",
-    "awlwort",
-    "awnless",
-    "axillae",
-    "axillar",
-    "axillas",
-    "axolotl",
-    "axoneme",
-    "axseeds",
-    "azotise",
-    "azotize",
-    "azulejo",
-    "azurite",
-    "azygous",
-    "baalism",
-    "baaskap",
-    "babassu",
-    "babbled",
-    "babbles",
-    "babesia",
-    "babiche",
-    "babiest",
-    "babools",
-    "babying",
-    "babyish",
-    "babysat",
-    "bacalao",
-    "baccara",
-    "baccate",
-    "bacchic",
-    "bacchii",
-    "baching",
-    "backbit",
-    "backfit",
-    "backout",
-    "backsaw",
-    "backset",
-    "baculum",
-    "badging",
-    "badland",
-    "baffies",
-    "baffing",
-    "baffler",
-    "bagasse",
-    "bagfuls",
-    "baggers",
-    "baggier",
-    "baggily",
-    "baglike",
-    "bagnios",
-    "bagsful",
-    "baguets",
-    "bagwigs",
-    "bagworm",
-    "bailees",
-    "bailers",
-    "bailies",
-    "bailors",
-    "bairnly",
-    "baiters",
-    "bakings",
-    "baklawa",
-    "balases",
-    "balatas",
-    "balboas",
-    "baldest",
-    "baldies",
-    "baldish",
-    "baldric",
-    "baleens",
-    "baleful",
-    "balkers",
-    "balkier",
-    "balkily",
-    "balking",
-    "ballies",
-    "ballute",
-    "balmier",
-    "balmily",
-    "balneal",
-    "balsams",
-    "bamboos",
-    "bamming",
-    "banally",
-    "bandaid",
-    "bandbox",
-    "banders",
-    "bandied",
-    "bandies",
-    "bandito",
-    "bandogs",
-    "bandora",
-    "bandore",
-    "baneful",
-    "banians",
-    "banjoes",
-    "bankits",
-    "bannets",
-    "banshie",
-    "bantams",
-    "banteng",
-    "banters",
-    "banties",
-    "banyans",
-    "banzais",
-    "baobabs",
-    "baptise",
-    "barbate",
-    "barbels",
-    "barbets",
-    "barbing",
-    "barbule",
-    "barbuts",
-    "barchan",
-    "barding",
-    "barefit",
-    "bareges",
-    "barfing",
-    "bargees",
-    "barging",
-    "barhops",
-    "barilla",
-    "barites",
-    "bariums",
-    "barkeep",
-    "barkier",
-    "barless",
-    "barleys",
-    "barlows",
-    "barmaid",
-    "barmier",
-    "barnier",
-    "barning",
-    "barongs",
-    "baronne",
-    "barques",
-    "barrets",
-    "barroom",
-    "bartend",
-    "barters",
-    "barytas",
-    "barytes",
-    "barytic",
-    "baryton",
-    "basally",
-    "bascule",
-    "basemen",
-    "bashaws",
-    "bashlyk",
-    "basidia",
-    "basilic",
-    "basinal",
-    "basined",
-    "basinet",
-    "basions",
-    "bassets",
-    "basters",
-    "bastile",
-    "batboys",
-    "batcher",
-    "bateaux",
-    "batfish",
-    "batfowl",
-    "bathmat",
-    "bathyal",
-    "batiked",
-    "batiste",
-    "batlike",
-    "batteau",
-    "battens",
-    "battier",
-    "battiks",
-    "battler",
-    "battues",
-    "batwing",
-    "baubees",
-    "baulked",
-    "bausond",
-    "bawbees",
-    "bawcock",
-    "bawdier",
-    "bawdies",
-    "bawdily",
-    "bawdric",
-    "bawlers",
-    "bawling",
-    "bawsunt",
-    "bawties",
-    "bayamos",
-    "bayards",
-    "bazooms",
-    "beaders",
-    "beadier",
-    "beadily",
-    "beadles",
-    "beadman",
-    "beadmen",
-    "beakier",
-    "beamier",
-    "beamily",
-    "beanery",
-    "beaning",
-    "bearhug",
-    "beatify",
-    "beauish",
-    "bebeeru",
-    "beblood",
-    "becalms",
-    "bechalk",
-    "becharm",
-    "beckets",
-    "becking",
-    "beclasp",
-    "becloak",
-    "beclogs",
-    "becloud",
-    "beclown",
-    "becrawl",
-    "becrime",
-    "becrowd",
-    "becrust",
-    "becurse",
-    "becurst",
-    "bedamns",
-    "bedaubs",
-    "bedders",
-    "bedecks",
-    "bedells",
-    "bedeman",
-    "bedemen",
-    "bedevil",
-    "bedewed",
-    "bedfast",
-    "bedgown",
-    "bedight",
-    "bedirty",
-    "bedizen",
-    "bedlamp",
-    "bedlams",
-    "bedless",
-    "bedlike",
-    "bedmate",
-    "bedpans",
-    "bedpost",
-    "bedrail",
-    "bedrape",
-    "bedroll",
-    "bedrugs",
-    "bedsits",
-    "bedsore",
-    "bedtick",
-    "beduins",
-    "bedumbs",
-    "bedunce",
-    "bedward",
-    "bedwarf",
-    "beebees",
-    "beechen",
-    "beedies",
-    "beefalo",
-    "beefier",
-    "beefily",
-    "beefing",
-    "beelike",
-    "beepers",
-    "beerier",
-    "beetled",
-    "beetler",
-    "beeyard",
-    "beezers",
-    "befalls",
-    "beflags",
-    "befleas",
-    "befleck",
-    "befools",
-    "befouls",
-    "befrets",
-    "begalls",
-    "begazed",
-    "begazes",
-    "beggary",
-    "begirds",
-    "beglads",
-    "begloom",
-    "begorah",
-    "begorra",
-    "begrime",
-    "begrims",
-    "begroan",
-    "beguile",
-    "beguine",
-    "begulfs",
-    "behaver",
-    "beheads",
-    "behests",
-    "behinds",
-    "beholds",
-    "behoove",
-    "behoved",
-    "behoves",
-    "behowls",
-    "beignes",
-    "beignet",
-    "bejesus",
-    "bejewel",
-    "beknots",
-    "belabor",
-    "belaced",
-    "belauds",
-    "belayed",
-    "belayer",
-    "belched",
-    "belches",
-    "beldame",
-    "beldams",
-    "beleaps",
-    "beleapt",
-    "beliers",
-    "bellboy",
-    "bellhop",
-    "bellmen",
-    "belters",
-    "belugas",
-    "belying",
-    "bemadam",
-    "bemeans",
-    "bemired",
-    "bemires",
-    "bemists",
-    "bemixed",
-    "bemixes",
-    "bemoans",
-    "bemocks",
-    "bemuses",
-    "benamed",
-    "benames",
-    "benched",
-    "bencher",
-    "bendays",
-    "bendees",
-    "bendier",
-    "benefic",
-    "benempt",
-    "benison",
-    "bennets",
-    "bennies",
-    "benomyl",
-    "benthal",
-    "benthon",
-    "benthos",
-    "benumbs",
-    "benzins",
-    "benzoin",
-    "benzole",
-    "benzols",
-    "benzyls",
-    "bepaint",
-    "beraked",
-    "berakes",
-    "berated",
-    "berates",
-    "bereave",
-    "bergere",
-    "berhyme",
-    "berimed",
-    "berimes",
-    "berline",
-    "berlins",
-    "berming",
-    "berobed",
-    "berried",
-    "berseem",
-    "berthas",
-    "berthed",
-    "bescour",
-    "beseems",
-    "beshame",
-    "beshout",
-    "beshrew",
-    "besiege",
-    "beslime",
-    "besmear",
-    "besmile",
-    "besmoke",
-    "besmuts",
-    "besnows",
-    "bespake",
-    "bespeak",
-    "bestead",
-    "besting",
-    "bestirs",
-    "bestrew",
-    "bestrid",
-    "bestrow",
-    "bestuds",
-    "beswarm",
-    "betaken",
-    "betakes",
-    "betaxed",
-    "bethank",
-    "bethels",
-    "bethink",
-    "bethorn",
-    "bethump",
-    "betided",
-    "betides",
-    "betimes",
-    "betises",
-    "betoken",
-    "betroth",
-    "beveler",
-    "bevomit",
-    "bewails",
-    "bewared",
-    "bewares",
-    "beweary",
-    "beweeps",
-    "bewitch",
-    "beworms",
-    "beworry",
-    "bewraps",
-    "bewrapt",
-    "bewrays",
-    "beylics",
-    "beyliks",
-    "beyonds",
-    "bezants",
-    "bezique",
-    "bezoars",
-    "bezzant",
-    "bhaktas",
-    "bhaktis",
-    "bharals",
-    "bheesty",
-    "bhistie",
-    "bialies",
-    "biassed",
-    "biasses",
-    "biaxial",
-    "bibasic",
-    "bibbers",
-    "bibbery",
-    "bibbing",
-    "bibcock",
-    "bibelot",
-    "bibless",
-    "biblike",
-    "biblist",
-    "bicarbs",
-    "bickers",
-    "bicorne",
-    "bicorns",
-    "bicrons",
-    "bidarka",
-    "biddies",
-    "bielded",
-    "biennia",
-    "bifaces",
-    "biffies",
-    "biffing",
-    "biffins",
-    "bifidly",
-    "bifilar",
-    "bigeyes",
-    "bigfeet",
-    "biggety",
-    "biggies",
-    "bigging",
-    "biggins",
-    "biggish",
-    "biggity",
-    "bighead",
-    "bighted",
-    "bigness",
-    "bigoses",
-    "bigwigs",
-    "bilbies",
-    "bilboas",
-    "bilboes",
-    "bilevel",
-    "bilgier",
-    "bilging",
-    "bilious",
-    "bilkers",
-    "bilking",
-    "billbug",
-    "billers",
-    "billies",
-    "billons",
-    "billows",
-    "billowy",
-    "bilobed",
-    "bilsted",
-    "biltong",
-    "bimboes",
-    "bimetal",
-    "bimorph",
-    "bindles",
-    "bingers",
-    "binging",
-    "bingoes",
-    "binocle",
-    "biochip",
-    "biogens",
-    "biogeny",
-    "bioherm",
-    "bionics",
-    "bionomy",
-    "biontic",
-    "biopics",
-    "biopsic",
-    "bioptic",
-    "biotins",
-    "biotope",
-    "biotron",
-    "biotype",
-    "bipacks",
-    "biparty",
-    "bipedal",
-    "birched",
-    "birchen",
-    "birddog",
-    "birdied",
-    "birdmen",
-    "biremes",
-    "biretta",
-    "biriani",
-    "birkies",
-    "birlers",
-    "birling",
-    "birring",
-    "birthed",
-    "biryani",
-    "bisects",
-    "bisnaga",
-    "bisques",
-    "bistate",
-    "bisters",
-    "bistort",
-    "bistred",
-    "bistres",
-    "bitable",
-    "bitched",
-    "bitchen",
-    "bitsier",
-    "bittier",
-    "bitting",
-    "bittock",
-    "bivinyl",
-    "bivouac",
-    "biznaga",
-    "bizonal",
-    "bizones",
-    "blabbed",
-    "blacken",
-    "blackly",
-    "bladers",
-    "blamers",
-    "blander",
-    "blandly",
-    "blanker",
-    "blastie",
-    "blatted",
-    "blatter",
-    "blaubok",
-    "blawing",
-    "blazons",
-    "bleaker",
-    "bleakly",
-    "bleared",
-    "bleated",
-    "bleater",
-    "bleeped",
-    "bleeper",
-    "blellum",
-    "blendes",
-    "blesbok",
-    "blesser",
-    "blether",
-    "blights",
-    "blighty",
-    "blinker",
-    "blintze",
-    "blipped",
-    "blissed",
-    "blisses",
-    "blither",
-    "blitzes",
-    "bloater",
-    "blobbed",
-    "blonder",
-    "blooped",
-    "blotchy",
-    "bloused",
-    "blouson",
-    "blowbys",
-    "blowfly",
-    "blowgun",
-    "blowier",
-    "blowoff",
-    "blowsed",
-    "blowups",
-    "blowzed",
-    "blubbed",
-    "blucher",
-    "bludged",
-    "bludger",
-    "bludges",
-    "bluecap",
-    "bluegum",
-    "blueing",
-    "blueish",
-    "bluejay",
-    "bluffed",
-    "bluffer",
-    "bluffly",
-    "bluings",
-    "bluming",
-    "blunged",
-    "blunger",
-    "blunges",
-    "blunter",
-    "blurbed",
-    "blurter",
-    "blusher",
-    "boarish",
-    "boaster",
-    "boatels",
-    "boatful",
-    "boatmen",
-    "bobbers",
-    "bobbery",
-    "bobbies",
-    "bobbled",
-    "bobbles",
-    "bobeche",
-    "bobstay",
-    "bobtail",
-    "boccias",
-    "boccies",
-    "bodhran",
-    "bodices",
-    "bodings",
-    "bodkins",
-    "bodying",
-    "boffing",
-    "boffins",
-    "boffola",
-    "bogarts",
-    "bogbean",
-    "bogeyed",
-    "boggier",
-    "bogging",
-    "boggish",
-    "boggled",
-    "boggler",
-    "bogusly",
-    "bogwood",
-    "bogyism",
-    "bogyman",
-    "bogymen",
-    "bohrium",
-    "bohunks",
-    "boiloff",
-    "boinked",
-    "bolases",
-    "boleros",
-    "boletes",
-    "boletus",
-    "bolides",
-    "boloney",
-    "bolshie",
-    "bolsons",
-    "bolters",
-    "boluses",
-    "bombast",
-    "bomblet",
-    "bonacis",
-    "bonbons",
-    "bonders",
-    "bondman",
-    "bondmen",
-    "bonducs",
-    "boneset",
-    "boneyer",
-    "bonging",
-    "bongoes",
-    "boniato",
-    "boniest",
-    "bonitas",
-    "bonitos",
-    "bonking",
-    "bonnier",
-    "bonnily",
-    "bonnock",
-    "bonobos",
-    "boobing",
-    "boobird",
-    "boobish",
-    "booboos",
-    "boocoos",
-    "boodies",
-    "boodled",
-    "boodler",
-    "boodles",
-    "boogers",
-    "boogeys",
-    "boogied",
-    "boogies",
-    "boohoos",
-    "boojums",
-    "bookend",
-    "bookers",
-    "bookful",
-    "bookmen",
-    "bookoos",
-    "boomier",
-    "boomkin",
-    "boomlet",
-    "boonies",
-    "boorish",
-    "bootees",
-    "bootery",
-    "boozers",
-    "boozier",
-    "boozily",
-    "boozing",
-    "bopeeps",
-    "bopping",
-    "boraces",
-    "boracic",
-    "borages",
-    "boranes",
-    "borated",
-    "borates",
-    "boraxes",
-    "bordels",
-    "bordure",
-    "boreens",
-    "borides",
-    "borking",
-    "borneol",
-    "bornite",
-    "boronic",
-    "borscht",
-    "borshts",
-    "borstal",
-    "bortzes",
-    "borzois",
-    "boscage",
-    "boshbok",
-    "boskage",
-    "boskets",
-    "boskier",
-    "bosomed",
-    "bosques",
-    "bosquet",
-    "bossdom",
-    "bossies",
-    "bossily",
-    "bossing",
-    "bossism",
-    "bostons",
-    "botcher",
-    "botches",
-    "bothies",
-    "bothria",
-    "botonee",
-    "bottler",
-    "botulin",
-    "boubous",
-    "bouchee",
-    "boucles",
-    "boudins",
-    "bouffes",
-    "boughed",
-    "bougies",
-    "boulles",
-    "bounden",
-    "bounder",
-    "bournes",
-    "bourree",
-    "boursin",
-    "bousing",
-    "boutons",
-    "bovines",
-    "boweled",
-    "bowered",
-    "bowfins",
-    "bowhead",
-    "bowings",
-    "bowknot",
-    "bowlder",
-    "bowlegs",
-    "bowless",
-    "bowlful",
-    "bowlike",
-    "bowline",
-    "bowpots",
-    "bowshot",
-    "bowsing",
-    "bowwows",
-    "bowyers",
-    "boxball",
-    "boxcars",
-    "boxfish",
-    "boxfuls",
-    "boxhaul",
-    "boxiest",
-    "boxings",
-    "boxlike",
-    "boyards",
-    "boychik",
-    "brabble",
-    "bracero",
-    "braches",
-    "brachet",
-    "brachia",
-    "bracted",
-    "bradawl",
-    "bradded",
-    "bradoon",
-    "bragger",
-    "brahmas",
-    "braider",
-    "brailed",
-    "braises",
-    "braizes",
-    "brakier",
-    "brambly",
-    "branchy",
-    "brander",
-    "branned",
-    "branner",
-    "brashes",
-    "brashly",
-    "brasier",
-    "brasils",
-    "brassed",
-    "brasses",
-    "brassie",
-    "brattle",
-    "bravers",
-    "bravoed",
-    "bravoes",
-    "bravura",
-    "bravure",
-    "brawest",
-    "brawled",
-    "brawler",
-    "brawlie",
-    "braxies",
-    "brayers",
-    "braying",
-    "brazens",
-    "brazers",
-    "brazils",
-    "breamed",
-    "breathy",
-    "brecham",
-    "brechan",
-    "breezed",
-    "brevets",
-    "brevier",
-    "brewage",
-    "brewski",
-    "briards",
-    "bribees",
-    "bribers",
-    "bricked",
-    "brickle",
-    "bricole",
-    "bridals",
-    "bridled",
-    "bridler",
-    "bridoon",
-    "brigand",
-    "brillos",
-    "brimful",
-    "brimmer",
-    "brinded",
-    "briners",
-    "brinier",
-    "brinies",
-    "brining",
-    "brinish",
-    "brioche",
-    "briquet",
-    "brisant",
-    "brisked",
-    "brisker",
-    "brisses",
-    "bristly",
-    "britska",
-    "brittly",
-    "britzka",
-    "broadax",
-    "brocket",
-    "brocoli",
-    "brogans",
-    "brogues",
-    "broider",
-    "brokage",
-    "bromals",
-    "bromate",
-    "bromids",
-    "bromins",
-    "bromism",
-    "bromize",
-    "broncho",
-    "brooded",
-    "brooder",
-    "brooked",
-    "brookie",
-    "broomed",
-    "browses",
-    "brucine",
-    "brucins",
-    "bruited",
-    "bruiter",
-    "brulots",
-    "brulyie",
-    "brulzie",
-    "brumous",
-    "brunets",
-    "brusher",
-    "brushup",
-    "brusker",
-    "brusque",
-    "brutely",
-    "brutify",
-    "bruting",
-    "brutism",
-    "bruxing",
-    "bruxism",
-    "bubales",
-    "bubalis",
-    "bubbies",
-    "bubinga",
-    "buckeen",
-    "buckers",
-    "buckish",
-    "buckoes",
-    "buckram",
-    "buckras",
-    "bucksaw",
-    "budders",
-    "buddied",
-    "buddles",
-    "budgers",
-    "budgies",
-    "budging",
-    "budless",
-    "budlike",
-    "budworm",
-    "buffest",
-    "buffier",
-    "bugbane",
-    "bugeyes",
-    "buggery",
-    "buggier",
-    "buglers",
-    "bugling",
-    "bugloss",
-    "bugouts",
-    "bugseed",
-    "bugshas",
-    "builded",
-    "buirdly",
-    "bulbels",
-    "bulbils",
-    "bulblet",
-    "bulbuls",
-    "bulgers",
-    "bulghur",
-    "bulgier",
-    "bulgurs",
-    "bulimic",
-    "bulkage",
-    "bulkier",
-    "bulkily",
-    "bullace",
-    "bullate",
-    "bullbat",
-    "bullier",
-    "bulling",
-    "bullous",
-    "bulrush",
-    "bumbled",
-    "bumbler",
-    "bumbles",
-    "bumboat",
-    "bumelia",
-    "bumkins",
-    "bummalo",
-    "bummers",
-    "bummest",
-    "bumming",
-    "bumpier",
-    "bumpily",
-    "bumpkin",
-    "buncoed",
-    "bundist",
-    "bundler",
-    "bungees",
-    "bunging",
-    "bungler",
-    "bungles",
-    "bunions",
-    "bunking",
-    "bunkoed",
-    "bunkums",
-    "bunraku",
-    "bunters",
-    "buoyage",
-    "buoying",
-    "buppies",
-    "buqshas",
-    "burbled",
-    "burbler",
-    "burbles",
-    "burbots",
-    "burdies",
-    "burette",
-    "burgage",
-    "burgees",
-    "burgeon",
-    "burghal",
-    "burgher",
-    "burgled",
-    "burgles",
-    "burgoos",
-    "burgout",
-    "buriers",
-    "burkers",
-    "burking",
-    "burkite",
-    "burlaps",
-    "burlers",
-    "burlesk",
-    "burleys",
-    "burlier",
-    "burlily",
-    "burling",
-    "burnets",
-    "burnies",
-    "burnish",
-    "burnous",
-    "burping",
-    "burrers",
-    "burrier",
-    "burring",
-    "bursars",
-    "bursate",
-    "burseed",
-    "bursera",
-    "bursted",
-    "burster",
-    "burthen",
-    "burtons",
-    "burweed",
-    "busbars",
-    "busbies",
-    "busboys",
-    "busgirl",
-    "bushers",
-    "bushier",
-    "bushily",
-    "bushpig",
-    "bushtit",
-    "bushwah",
-    "bushwas",
-    "busings",
-    "buskers",
-    "busking",
-    "buskins",
-    "busload",
-    "bussing",
-    "bustard",
-    "bustics",
-    "bustled",
-    "bustler",
-    "bustles",
-    "busying",
-    "butanes",
-    "butches",
-    "butenes",
-    "butlery",
-    "butling",
-    "buttals",
-    "butties",
-    "buttony",
-    "butyral",
-    "butyric",
-    "butyrin",
-    "butyryl",
-    "buxomer",
-    "buxomly",
-    "buyable",
-    "buyoffs",
-    "buzukia",
-    "buzukis",
-    "buzzcut",
-    "buzzers",
-    "buzzwig",
-    "byelaws",
-    "bygones",
-    "bylined",
-    "byliner",
-    "bylines",
-    "bynames",
-    "bypaths",
-    "byplays",
-    "byrling",
-    "byrnies",
-    "byroads",
-    "bytalks",
-    "bywords",
-    "byworks",
-    "byzants",
-    "cabalas",
-    "cabbagy",
-    "cabbala",
-    "cabbies",
-    "cabbing",
-    "cabezon",
-    "cabildo",
-    "cabined",
-    "cablers",
-    "cablets",
-    "cabomba",
-    "cachets",
-    "cachexy",
-    "cachous",
-    "cacique",
-    "cackled",
-    "cackler",
-    "cackles",
-    "cacodyl",
-    "caconym",
-    "cactoid",
-    "caddice",
-    "caddied",
-    "caddish",
-    "cadelle",
-    "cadency",
-    "cadenza",
-    "cadgers",
-    "cadging",
-    "caducei",
-    "caeomas",
-    "caesium",
-    "caestus",
-    "caesura",
-    "caffein",
-    "caftans",
-    "cageful",
-    "cagiest",
-    "cahoots",
-    "caimans",
-    "caiques",
-    "cairned",
-    "caisson",
-    "caitiff",
-    "cajaput",
-    "cajeput",
-    "cajoled",
-    "cajoler",
-    "cajoles",
-    "cajones",
-    "cajuput",
-    "cakiest",
-    "calamar",
-    "calando",
-    "calathi",
-    "calcars",
-    "calcify",
-    "calcine",
-    "caldron",
-    "caleche",
-    "calends",
-    "calesas",
-    "calices",
-    "caliche",
-    "calicle",
-    "calicos",
-    "calipee",
-    "caliphs",
-    "calkers",
-    "calking",
-    "callans",
-    "callant",
-    "callboy",
-    "callees",
-    "callets",
-    "callose",
-    "calmest",
-    "calomel",
-    "calotte",
-    "caloyer",
-    "calpack",
-    "calpacs",
-    "calqued",
-    "calques",
-    "caltrap",
-    "caltrop",
-    "calumny",
-    "calyces",
-    "calycle",
-    "calyxes",
-    "calzone",
-    "camails",
-    "camases",
-    "cambers",
-    "cambial",
-    "cambism",
-    "cambist",
-    "cambium",
-    "cambric",
-    "camelia",
-    "camelid",
-    "cameoed",
-    "camerae",
-    "cameral",
-    "camions",
-    "camisas",
-    "camises",
-    "camisia",
-    "camlets",
-    "cammies",
-    "camorra",
-    "camphol",
-    "campier",
-    "campily",
-    "campong",
-    "campout",
-    "canakin",
-    "canaled",
-    "canapes",
-    "canards",
-    "cancans",
-    "canchas",
-    "candent",
-    "candled",
-    "candors",
-    "candour",
-    "canella",
-    "canfuls",
-    "cangues",
-    "canikin",
-    "cankers",
-    "cannels",
-    "canners",
-    "cannier",
-    "cannily",
-    "cannoli",
-    "canoers",
-    "canolas",
-    "canonic",
-    "canonry",
-    "canopic",
-    "cansful",
-    "cantala",
-    "cantals",
-    "cantdog",
-    "canters",
-    "canthal",
-    "canthus",
-    "canting",
-    "cantles",
-    "cantors",
-    "cantrap",
-    "cantrip",
-    "canulae",
-    "canular",
-    "canulas",
-    "canzona",
-    "capably",
-    "capelan",
-    "capelet",
-    "capelin",
-    "capered",
-    "caperer",
-    "capfuls",
-    "capizes",
-    "capless",
-    "caplins",
-    "caporal",
-    "capotes",
-    "capouch",
-    "cappers",
-    "caprine",
-    "caprock",
-    "capsids",
-    "capsize",
-    "capstan",
-    "captans",
-    "capuche",
-    "carabao",
-    "carabid",
-    "carabin",
-    "caracal",
-    "caracks",
-    "caracol",
-    "caracul",
-    "carafes",
-    "caramba",
-    "carapax",
-    "carates",
-    "caravel",
-    "carbarn",
-    "carbora",
-    "carboys",
-    "carcase",
-    "carcels",
-    "carders",
-    "cardiae",
-    "cardias",
-    "cardons",
-    "cardoon",
-    "careens",
-    "carfare",
-    "carfuls",
-    "carhops",
-    "caribes",
-    "carices",
-    "carinae",
-    "carinal",
-    "carinas",
-    "carioca",
-    "cariole",
-    "carious",
-    "carjack",
-    "carking",
-    "carless",
-    "carline",
-    "carlins",
-    "carlish",
-    "carload",
-    "carnets",
-    "carneys",
-    "carnies",
-    "carnify",
-    "caroach",
-    "caroche",
-    "caroled",
-    "caroler",
-    "carolus",
-    "caromed",
-    "carotin",
-    "carouse",
-    "carpale",
-    "carpals",
-    "carpels",
-    "carpers",
-    "carping",
-    "carrack",
-    "carrell",
-    "carrels",
-    "carroch",
-    "carroms",
-    "carroty",
-    "carryon",
-    "carsick",
-    "cartage",
-    "carvels",
-    "casabas",
-    "casavas",
-    "casbahs",
-    "cascara",
-    "casease",
-    "caseate",
-    "caseins",
-    "caseose",
-    "caseous",
-    "caserne",
-    "caserns",
-    "casette",
-    "cashaws",
-    "cashbox",
-    "cashoos",
-    "casking",
-    "casqued",
-    "casques",
-    "cassaba",
-    "cassata",
-    "cassena",
-    "cassene",
-    "cassias",
-    "cassina",
-    "cassine",
-    "cassock",
-    "castled",
-    "castoff",
-    "casuist",
-    "catalos",
-    "catalpa",
-    "catarrh",
-    "catbird",
-    "catboat",
-    "catcall",
-    "catchup",
-    "catclaw",
-    "catechu",
-    "catenae",
-    "catenas",
-    "cateran",
-    "catface",
-    "catfall",
-    "catguts",
-    "cathead",
-    "cathect",
-    "catjang",
-    "catkins",
-    "catlike",
-    "catling",
-    "catlins",
-    "catmint",
-    "catnaps",
-    "catnips",
-    "catspaw",
-    "catsups",
-    "cattalo",
-    "cattier",
-    "catties",
-    "cattily",
-    "catting",
-    "cattish",
-    "caudles",
-    "cauline",
-    "caulked",
-    "caulker",
-    "causals",
-    "causers",
-    "causeys",
-    "cautery",
-    "cavalla",
-    "cavally",
-    "cavemen",
-    "cavetti",
-    "cavetto",
-    "caviare",
-    "caviars",
-    "caviled",
-    "caviler",
-    "cavings",
-    "cavorts",
-    "caymans",
-    "cayuses",
-    "cazique",
-    "ceboids",
-    "cecally",
-    "cedilla",
-    "cedulas",
-    "ceilers",
-    "celesta",
-    "celiacs",
-    "celling",
-    "cellule",
-    "celosia",
-    "celotex",
-    "cembali",
-    "cembalo",
-    "cementa",
-    "cenacle",
-    "cenotes",
-    "censers",
-    "censing",
-    "censual",
-    "centals",
-    "centare",
-    "centavo",
-    "centile",
-    "centime",
-    "centimo",
-    "centner",
-    "centums",
-    "cepheid",
-    "ceramal",
-    "cerated",
-    "cerates",
-    "ceratin",
-    "cerebra",
-    "ceriphs",
-    "cerises",
-    "cerites",
-    "ceriums",
-    "cermets",
-    "cerotic",
-    "cerumen",
-    "ceruses",
-    "cerveza",
-    "cervine",
-    "cesiums",
-    "cesspit",
-    "cestode",
-    "cestoid",
-    "cesurae",
-    "cesuras",
-    "cetanes",
-    "ceviche",
-    "chabouk",
-    "chabuks",
-    "chachka",
-    "chacmas",
-    "chadars",
-    "chadors",
-    "chaebol",
-    "chaetae",
-    "chaetal",
-    "chafers",
-    "chaffed",
-    "chaffer",
-    "chaines",
-    "chaises",
-    "chalahs",
-    "chalaza",
-    "chalcid",
-    "chalehs",
-    "challas",
-    "challie",
-    "challot",
-    "chalone",
-    "chaloth",
-    "chalupa",
-    "chalutz",
-    "chamade",
-    "chamfer",
-    "chamisa",
-    "chamise",
-    "chamiso",
-    "chamoix",
-    "champac",
-    "champak",
-    "champed",
-    "champer",
-    "chancer",
-    "chancre",
-    "chanoyu",
-    "chantey",
-    "chantor",
-    "chaoses",
-    "chapati",
-    "chapmen",
-    "chappie",
-    "charier",
-    "charily",
-    "charism",
-    "charkas",
-    "charked",
-    "charkha",
-    "charnel",
-    "charpai",
-    "charpoy",
-    "charqui",
-    "charros",
-    "chasmal",
-    "chasmed",
-    "chasmic",
-    "chassed",
-    "chasses",
-    "chasten",
-    "chaster",
-    "chaufer",
-    "chaunts",
-    "chawers",
-    "chawing",
-    "chayote",
-    "chazans",
-    "chazzan",
-    "chazzen",
-    "cheapen",
-    "cheapie",
-    "cheapos",
-    "chebecs",
-    "cheders",
-    "chedite",
-    "cheeped",
-    "cheeper",
-    "cheerer",
-    "cheerio",
-    "cheerly",
-    "cheeros",
-    "cheesed",
-    "chefdom",
-    "cheffed",
-    "chefing",
-    "chegoes",
-    "cheloid",
-    "chemics",
-    "chemism",
-    "chequer",
-    "cheroot",
-    "chervil",
-    "chesses",
-    "chetahs",
-    "chetrum",
-    "chevied",
-    "chevies",
-    "chevres",
-    "chevret",
-    "chewers",
-    "chewier",
-    "chewink",
-    "chiasma",
-    "chiasmi",
-    "chiasms",
-    "chibouk",
-    "chicest",
-    "chichis",
-    "chickee",
-    "chicles",
-    "chidden",
-    "chiders",
-    "chiding",
-    "chiefer",
-    "chields",
-    "chigger",
-    "chignon",
-    "chigoes",
-    "childes",
-    "childly",
-    "chiliad",
-    "chillis",
-    "chillum",
-    "chimars",
-    "chimbly",
-    "chimere",
-    "chimers",
-    "chimlas",
-    "chimley",
-    "chinchy",
-    "chining",
-    "chinked",
-    "chinned",
-    "chinone",
-    "chintzy",
-    "chinwag",
-    "chippie",
-    "chirked",
-    "chirker",
-    "chirmed",
-    "chirped",
-    "chirper",
-    "chirred",
-    "chirren",
-    "chirres",
-    "chirrup",
-    "chitins",
-    "chitlin",
-    "chitons",
-    "chitter",
-    "chivari",
-    "chivied",
-    "chivies",
-    "chlamys",
-    "chloral",
-    "chloric",
-    "chlorid",
-    "chlorin",
-    "choanae",
-    "chocked",
-    "choicer",
-    "choired",
-    "chokier",
-    "cholate",
-    "cholent",
-    "cholers",
-    "chollas",
-    "chomped",
-    "chomper",
-    "choosey",
-    "chopine",
-    "chopins",
-    "choragi",
-    "chorals",
-    "chorded",
-    "choreal",
-    "choreas",
-    "choregi",
-    "choreic",
-    "chorial",
-    "chorine",
-    "choring",
-    "chorion",
-    "chorten",
-    "chortle",
-    "choughs",
-    "choused",
-    "chouser",
-    "chouses",
-    "chowing",
-    "chowsed",
-    "chowses",
-    "chrisma",
-    "chrisms",
-    "chrisom",
-    "chromas",
-    "chromes",
-    "chromic",
-    "chromos",
-    "chromyl",
-    "chronon",
-    "chuddah",
-    "chuddar",
-    "chudder",
-    "chuffed",
-    "chuffer",
-    "chugged",
-    "chugger",
-    "chukars",
-    "chukkar",
-    "chukkas",
-    "chukker",
-    "chummed",
-    "chumped",
-    "chunnel",
-    "chunter",
-    "chuppah",
-    "chuppas",
-    "churchy",
-    "churner",
-    "churred",
-    "churros",
-    "chuting",
-    "chutist",
-    "chutnee",
-    "chutzpa",
-    "chylous",
-    "chymics",
-    "chymist",
-    "chymous",
-    "chytrid",
-    "ciboria",
-    "ciboule",
-    "cicadae",
-    "cicalas",
-    "ciceros",
-    "cicoree",
-    "cigaret",
-    "cilices",
-    "cimices",
-    "cinched",
-    "cinches",
-    "cindery",
-    "cineast",
-    "cineole",
-    "cineols",
-    "cinerin",
-    "cingula",
-    "cinques",
-    "ciphony",
-    "cipolin",
-    "circler",
-    "circlet",
-    "circusy",
-    "cirques",
-    "cirrate",
-    "cirrose",
-    "cirrous",
-    "cirsoid",
-    "ciscoes",
-    "cissies",
-    "cissoid",
-    "citator",
-    "cithara",
-    "cithern",
-    "cithers",
-    "cithren",
-    "citolas",
-    "citoles",
-    "citrals",
-    "citrins",
-    "citrons",
-    "citrous",
-    "citrusy",
-    "cittern",
-    "civisms",
-    "civvies",
-    "clabber",
-    "clachan",
-    "clacked",
-    "clacker",
-    "cladded",
-    "cladism",
-    "cladist",
-    "cladode",
-    "clagged",
-    "claimer",
-    "clamant",
-    "clamber",
-    "clammed",
-    "clammer",
-    "clamors",
-    "clamper",
-    "clanged",
-    "clanger",
-    "clangor",
-    "clanked",
-    "claquer",
-    "claques",
-    "clarets",
-    "claries",
-    "clarkia",
-    "claroes",
-    "clasher",
-    "clasper",
-    "classer",
-    "classis",
-    "classon",
-    "clastic",
-    "claucht",
-    "claught",
-    "clausal",
-    "clavate",
-    "clavers",
-    "clawers",
-    "claxons",
-    "clayier",
-    "claying",
-    "clayish",
-    "claypan",
-    "cleated",
-    "cleeked",
-    "clefted",
-    "cleomes",
-    "cleping",
-    "clerids",
-    "clerisy",
-    "clerked",
-    "clerkly",
-    "clewing",
-    "clinged",
-    "clinger",
-    "clinked",
-    "cliqued",
-    "cliquey",
-    "clitics",
-    "clivers",
-    "clivias",
-    "cloacae",
-    "cloacal",
-    "cloacas",
-    "cloches",
-    "clocker",
-    "clogger",
-    "clomped",
-    "cloners",
-    "clonism",
-    "clonked",
-    "clopped",
-    "cloques",
-    "clotted",
-    "cloughs",
-    "cloured",
-    "clouted",
-    "clouter",
-    "clovers",
-    "clovery",
-    "clowder",
-    "clowned",
-    "cloying",
-    "clubbed",
-    "clubmen",
-    "clucked",
-    "clueing",
-    "clumped",
-    "clunked",
-    "clunker",
-    "clupeid",
-    "clutchy",
-    "clypeal",
-    "clypeus",
-    "clyster",
-    "coacher",
-    "coacted",
-    "coactor",
-    "coadmit",
-    "coaeval",
-    "coagent",
-    "coagula",
-    "coalbin",
-    "coalbox",
-    "coalers",
-    "coalier",
-    "coalify",
-    "coaling",
-    "coalpit",
-    "coaming",
-    "coannex",
-    "coapted",
-    "coarsen",
-    "coasted",
-    "coatees",
-    "coaters",
-    "coaxers",
-    "cobalts",
-    "cobbers",
-    "cobbier",
-    "cobnuts",
-    "cocains",
-    "coccids",
-    "coccoid",
-    "coccous",
-    "cochair",
-    "cochins",
-    "cockade",
-    "cockers",
-    "cockeye",
-    "cockier",
-    "cockily",
-    "cockish",
-    "cockled",
-    "cockshy",
-    "cockups",
-    "cocomat",
-    "cocotte",
-    "cocoyam",
-    "codable",
-    "codders",
-    "codding",
-    "coddled",
-    "coddler",
-    "coddles",
-    "codeias",
-    "codeina",
-    "codeins",
-    "codfish",
-    "codgers",
-    "codices",
-    "codicil",
-    "codling",
-    "codlins",
-    "codrive",
-    "codrove",
-    "coedits",
-    "coelome",
-    "coeloms",
-    "coempts",
-    "coenact",
-    "coenure",
-    "coenuri",
-    "coequal",
-    "coercer",
-    "coerces",
-    "coerect",
-    "coesite",
-    "coevals",
-    "coexert",
-    "coffing",
-    "coffled",
-    "coffles",
-    "cofound",
-    "cogency",
-    "cogging",
-    "cogitos",
-    "cognacs",
-    "cognise",
-    "cognize",
-    "cogways",
-    "cohabit",
-    "coheads",
-    "coheirs",
-    "cohered",
-    "coherer",
-    "coheres",
-    "cohosts",
-    "cohunes",
-    "coiffed",
-    "coiffes",
-    "coifing",
-    "coigned",
-    "coignes",
-    "coilers",
-    "coiners",
-    "coinfer",
-    "cointer",
-    "coition",
-    "cojoins",
-    "cojones",
-    "coldish",
-    "coleads",
-    "colicin",
-    "colicky",
-    "colitic",
-    "collets",
-    "collied",
-    "collops",
-    "collude",
-    "colobus",
-    "colones",
-    "colonus",
-    "colorer",
-    "colossi",
-    "colters",
-    "coltish",
-    "colugos",
-    "columel",
-    "colures",
-    "comaker",
-    "comakes",
-    "comates",
-    "comatic",
-    "comatik",
-    "combers",
-    "combust",
-    "comedos",
-    "cometic",
-    "comfier",
-    "comfits",
-    "comitia",
-    "commata",
-    "commixt",
-    "commove",
-    "compart",
-    "compeer",
-    "compend",
-    "compere",
-    "complin",
-    "complot",
-    "compone",
-    "compony",
-    "compted",
-    "comsymp",
-    "conatus",
-    "concent",
-    "conchae",
-    "conchal",
-    "conchas",
-    "conches",
-    "conchie",
-    "conchos",
-    "concoct",
-    "concuss",
-    "condign",
-    "condoes",
-    "condole",
-    "conduce",
-    "condyle",
-    "confabs",
-    "confect",
-    "confits",
-    "conflux",
-    "confute",
-    "congaed",
-    "congeal",
-    "congeed",
-    "congees",
-    "congers",
-    "congest",
-    "congius",
-    "congoes",
-    "congous",
-    "conidia",
-    "coniine",
-    "conines",
-    "coniums",
-    "conjoin",
-    "conkers",
-    "conking",
-    "connate",
-    "connive",
-    "connote",
-    "conoids",
-    "consols",
-    "contemn",
-    "contort",
-    "contuse",
-    "convect",
-    "convoke",
-    "cooches",
-    "cooeyed",
-    "cookeys",
-    "cookoff",
-    "coolies",
-    "coolish",
-    "coolths",
-    "cooncan",
-    "coontie",
-    "coopery",
-    "cooping",
-    "coopted",
-    "cooters",
-    "cooties",
-    "copaiba",
-    "copalms",
-    "copecks",
-    "copepod",
-    "copihue",
-    "copings",
-    "coplots",
-    "copouts",
-    "coppery",
-    "copping",
-    "coppras",
-    "coprahs",
-    "copters",
-    "copulae",
-    "copular",
-    "copulas",
-    "copyboy",
-    "copyist",
-    "coquets",
-    "coquina",
-    "coquito",
-    "coracle",
-    "corbans",
-    "corbeil",
-    "corbels",
-    "corbies",
-    "corbina",
-    "cordate",
-    "corders",
-    "cordite",
-    "cordons",
-    "coreign",
-    "coremia",
-    "corkage",
-    "corkers",
-    "corkier",
-    "corking",
-    "cormels",
-    "cormoid",
-    "cormous",
-    "corncob",
-    "corneas",
-    "cornels",
-    "cornets",
-    "cornfed",
-    "cornier",
-    "cornify",
-    "cornily",
-    "cornrow",
-    "cornual",
-    "cornute",
-    "cornuto",
-    "coronae",
-    "coronas",
-    "coronel",
-    "corrade",
-    "corrals",
-    "corries",
-    "corrody",
-    "corsacs",
-    "corslet",
-    "cortege",
-    "cortins",
-    "coruler",
-    "corvees",
-    "corvets",
-    "corvids",
-    "corvina",
-    "corvine",
-    "corymbs",
-    "coryzal",
-    "coryzas",
-    "coshers",
-    "coshing",
-    "cosiest",
-    "cosigns",
-    "cosines",
-    "cosmids",
-    "cosmism",
-    "cosmist",
-    "cossets",
-    "costard",
-    "costars",
-    "costate",
-    "costers",
-    "costive",
-    "costrel",
-    "cosying",
-    "coteaux",
-    "cothurn",
-    "cotidal",
-    "cotinga",
-    "cottars",
-    "cotters",
-    "cottier",
-    "cottony",
-    "cotypes",
-    "coucher",
-    "cougher",
-    "couldst",
-    "coulees",
-    "couloir",
-    "couping",
-    "courlan",
-    "coursed",
-    "courser",
-    "courter",
-    "couteau",
-    "couters",
-    "couther",
-    "couthie",
-    "couvade",
-    "coverer",
-    "coverts",
-    "coveter",
-    "covings",
-    "cowages",
-    "cowbane",
-    "cowbind",
-    "cowbird",
-    "cowedly",
-    "cowered",
-    "cowfish",
-    "cowflap",
-    "cowflop",
-    "cowhage",
-    "cowhand",
-    "cowherb",
-    "cowherd",
-    "cowiest",
-    "cowlick",
-    "cowpats",
-    "cowpeas",
-    "cowpies",
-    "cowplop",
-    "cowpoke",
-    "cowries",
-    "cowrite",
-    "cowrote",
-    "cowshed",
-    "cowskin",
-    "cowslip",
-    "coxalgy",
-    "coxcomb",
-    "coxitis",
-    "coxless",
-    "coydogs",
-    "coyness",
-    "coypous",
-    "cozened",
-    "cozener",
-    "coziest",
-    "cozying",
-    "craaled",
-    "crabbed",
-    "crabber",
-    "crackly",
-    "crackup",
-    "cradler",
-    "cragged",
-    "crambes",
-    "crambos",
-    "crammer",
-    "crampit",
-    "crampon",
-    "craning",
-    "cranker",
-    "crankle",
-    "crankly",
-    "crannog",
-    "craping",
-    "crapola",
-    "crapped",
-    "crapper",
-    "crasser",
-    "crassly",
-    "cratons",
-    "craunch",
-    "cravats",
-    "cravens",
-    "crawdad",
-    "crazily",
-    "crazing",
-    "creaked",
-    "creaser",
-    "creatin",
-    "creches",
-    "credent",
-    "creedal",
-    "creeled",
-    "creeped",
-    "creepie",
-    "creeses",
-    "cremate",
-    "cremini",
-    "crenate",
-    "crenels",
-    "creoles",
-    "creosol",
-    "crepier",
-    "creping",
-    "crepons",
-    "cresols",
-    "cresses",
-    "cresset",
-    "crestal",
-    "cresyls",
-    "cretics",
-    "cretins",
-    "crewcut",
-    "crewels",
-    "crewing",
-    "cribbed",
-    "cribber",
-    "cricked",
-    "crickey",
-    "cricoid",
-    "crimine",
-    "crimini",
-    "criminy",
-    "crimmer",
-    "crimple",
-    "cringed",
-    "cringer",
-    "cringes",
-    "cringle",
-    "crinite",
-    "crinkly",
-    "crinoid",
-    "crinums",
-    "criollo",
-    "crisped",
-    "crispen",
-    "crisply",
-    "crissal",
-    "crissum",
-    "cristae",
-    "crittur",
-    "croaked",
-    "croaker",
-    "crocein",
-    "crocine",
-    "crocked",
-    "crocket",
-    "crofter",
-    "crojiks",
-    "cronish",
-    "crooker",
-    "crooned",
-    "croppie",
-    "croquis",
-    "crosier",
-    "crosser",
-    "crotons",
-    "croupes",
-    "croutes",
-    "crouton",
-    "crowdie",
-    "crowers",
-    "crowner",
-    "crownet",
-    "crozers",
-    "crucian",
-    "crudded",
-    "crudest",
-    "crudity",
-    "crueler",
-    "cruller",
-    "crumbed",
-    "crumber",
-    "crumbum",
-    "crummie",
-    "crumped",
-    "crumpet",
-    "crumple",
-    "crumply",
-    "crunode",
-    "crupper",
-    "crusado",
-    "crusets",
-    "crusily",
-    "cruzado",
-    "cryogen",
-    "cryonic",
-    "cryptal",
-    "cryptos",
-    "ctenoid",
-    "cuatros",
-    "cubages",
-    "cubbies",
-    "cubbish",
-    "cubical",
-    "cubicly",
-    "cubisms",
-    "cubists",
-    "cubital",
-    "cubitus",
-    "cuboids",
-    "cuckoos",
-    "cudbear",
-    "cuddies",
-    "cuddler",
-    "cudgels",
-    "cudweed",
-    "cuestas",
-    "cuffing",
-    "cuirass",
-    "cuishes",
-    "cuisses",
-    "cuittle",
-    "culches",
-    "culexes",
-    "culices",
-    "culicid",
-    "cullays",
-    "cullers",
-    "cullets",
-    "cullied",
-    "cullies",
-    "cullion",
-    "culming",
-    "culotte",
-    "cultish",
-    "cultism",
-    "cultist",
-    "culvers",
-    "cumarin",
-    "cumbers",
-    "cumbias",
-    "cummers",
-    "cumquat",
-    "cumshaw",
-    "cundums",
-    "cuneate",
-    "cunners",
-    "cupeled",
-    "cupeler",
-    "cupfuls",
-    "cuplike",
-    "cuppers",
-    "cuppier",
-    "cuprite",
-    "cuprous",
-    "cuprums",
-    "cupsful",
-    "cupulae",
-    "cupular",
-    "cupules",
-    "curably",
-    "curacoa",
-    "curaghs",
-    "curaras",
-    "curares",
-    "curaris",
-    "curates",
-    "curbers",
-    "curches",
-    "curcuma",
-    "curdier",
-    "curding",
-    "curdled",
-    "curdler",
-    "curdles",
-    "curette",
-    "curiosa",
-    "curites",
-    "curiums",
-    "curlews",
-    "curlier",
-    "curlily",
-    "currach",
-    "curragh",
-    "currans",
-    "curring",
-    "currish",
-    "cursers",
-    "curtals",
-    "curtate",
-    "curtest",
-    "curtesy",
-    "curtsey",
-    "curvets",
-    "curvier",
-    "cushats",
-    "cushaws",
-    "cushier",
-    "cushily",
-    "cuspate",
-    "cuspids",
-    "cussers",
-    "cutbank",
-    "cutches",
-    "cutdown",
-    "cutesie",
-    "cutises",
-    "cutlers",
-    "cutline",
-    "cutover",
-    "cuttage",
-    "cutties",
-    "cuttled",
-    "cuttles",
-    "cutwork",
-    "cutworm",
-    "cuvette",
-    "cyanate",
-    "cyanids",
-    "cyanine",
-    "cyanins",
-    "cyanite",
-    "cycases",
-    "cycasin",
-    "cyclers",
-    "cyclery",
-    "cyclins",
-    "cyclize",
-    "cycloid",
-    "cygnets",
-    "cylices",
-    "cymatia",
-    "cymenes",
-    "cymling",
-    "cymlins",
-    "cyphers",
-    "cypsela",
-    "cystein",
-    "cystoid",
-    "czardas",
-    "czardom",
-    "czarina",
-    "czarism",
-    "czarist",
-    "dabbers",
-    "dabbing",
-    "dabbler",
-    "dabbles",
-    "dabster",
-    "dacites",
-    "dackers",
-    "dacoits",
-    "dacoity",
-    "dacrons",
-    "dactyli",
-    "dactyls",
-    "dadaism",
-    "dadaist",
-    "daddled",
-    "daddles",
-    "dadoing",
-    "daffier",
-    "daffily",
-    "daffing",
-    "daftest",
-    "daggled",
-    "daggles",
-    "daglock",
-    "dagobas",
-    "dagwood",
-    "dahoons",
-    "daikers",
-    "daikons",
-    "daimios",
-    "daimons",
-    "daimyos",
-    "daisied",
-    "dakoits",
-    "dakoity",
-    "dalapon",
-    "dalasis",
-    "daledhs",
-    "daleths",
-    "dallied",
-    "dallier",
-    "dallies",
-    "daltons",
-    "damager",
-    "damasks",
-    "dammars",
-    "dammers",
-    "damming",
-    "damners",
-    "damnify",
-    "damosel",
-    "damozel",
-    "dampens",
-    "dampest",
-    "dampish",
-    "damsons",
-    "danazol",
-    "danders",
-    "dandier",
-    "dandies",
-    "dandify",
-    "dandily",
-    "dandled",
-    "dandler",
-    "dandles",
-    "danging",
-    "dangled",
-    "dangler",
-    "dankest",
-    "danseur",
-    "daphnes",
-    "dapping",
-    "dapples",
-    "dapsone",
-    "darbars",
-    "darbies",
-    "dareful",
-    "darings",
-    "dariole",
-    "darkens",
-    "darkeys",
-    "darkies",
-    "darking",
-    "darkish",
-    "darkled",
-    "darkles",
-    "darnels",
-    "darners",
-    "darning",
-    "darters",
-    "dartled",
-    "dartles",
-    "dasheen",
-    "dashers",
-    "dashier",
-    "dashiki",
-    "dashpot",
-    "dassies",
-    "dastard",
-    "dasyure",
-    "datable",
-    "datchas",
-    "datedly",
-    "datival",
-    "datives",
-    "daturas",
-    "daturic",
-    "daubers",
-    "daubery",
-    "daubier",
-    "daubing",
-    "daunder",
-    "daunted",
-    "daunter",
-    "dauties",
-    "dauting",
-    "davened",
-    "dawdled",
-    "dawdler",
-    "dawdles",
-    "dawties",
-    "dawting",
-    "dayglow",
-    "daylong",
-    "daymare",
-    "dayroom",
-    "dayside",
-    "daysman",
-    "daysmen",
-    "daywork",
-    "dazedly",
-    "dazzler",
-    "dazzles",
-    "deadens",
-    "deadest",
-    "deadeye",
-    "deadmen",
-    "deafens",
-    "deafest",
-    "deafish",
-    "deaired",
-    "dealate",
-    "deaning",
-    "dearies",
-    "dearths",
-    "deashed",
-    "deashes",
-    "deaving",
-    "debarks",
-    "debased",
-    "debaser",
-    "debases",
-    "debauch",
-    "debeaks",
-    "debeard",
-    "deboned",
-    "deboner",
-    "debones",
-    "debouch",
-    "debride",
-    "debunks",
-    "decagon",
-    "decalog",
-    "decamps",
-    "decanal",
-    "decanes",
-    "decants",
-    "decapod",
-    "decares",
-    "decayer",
-    "deceits",
-    "decerns",
-    "deciare",
-    "decider",
-    "decidua",
-    "deciles",
-    "deckels",
-    "deckles",
-    "declaim",
-    "declass",
-    "declaws",
-    "decocts",
-    "decolor",
-    "decoyed",
-    "decoyer",
-    "decreer",
-    "decrial",
-    "decrier",
-    "decrown",
-    "decuman",
-    "decuple",
-    "decurve",
-    "deduces",
-    "deducts",
-    "deedier",
-    "deeding",
-    "deerfly",
-    "deewans",
-    "defacer",
-    "defaces",
-    "defamed",
-    "defames",
-    "defangs",
-    "deffest",
-    "defiers",
-    "defiler",
-    "defiles",
-    "definer",
-    "defleas",
-    "defoams",
-    "defocus",
-    "deforce",
-    "deforms",
-    "defrags",
-    "defrays",
-    "defrock",
-    "deftest",
-    "defuels",
-    "defunds",
-    "defused",
-    "defuser",
-    "defuses",
-    "defuzed",
-    "defuzes",
-    "degames",
-    "degamis",
-    "degases",
-    "degauss",
-    "degerms",
-    "deglaze",
-    "degreed",
-    "degusts",
-    "dehisce",
-    "dehorns",
-    "dehorts",
-    "deicers",
-    "deicing",
-    "deictic",
-    "deified",
-    "deifier",
-    "deifies",
-    "deiform",
-    "deigned",
-    "deistic",
-    "dejecta",
-    "dejects",
-    "dekares",
-    "dekeing",
-    "delaine",
-    "delated",
-    "delates",
-    "delator",
-    "delayer",
-    "deleads",
-    "deleave",
-    "deleing",
-    "delicts",
-    "delimed",
-    "delimes",
-    "deliria",
-    "delists",
-    "dellies",
-    "delouse",
-    "delphic",
-    "deltaic",
-    "deluder",
-    "deludes",
-    "deluged",
-    "deluges",
-    "delvers",
-    "demagog",
-    "demarks",
-    "demasts",
-    "demeans",
-    "dements",
-    "demerge",
-    "demerit",
-    "demesne",
-    "demeton",
-    "demigod",
-    "demirep",
-    "demised",
-    "demises",
-    "demoded",
-    "demoing",
-    "demoses",
-    "demotes",
-    "demotic",
-    "demount",
-    "demurer",
-    "denarii",
-    "dendron",
-    "dengues",
-    "deniers",
-    "denimed",
-    "denizen",
-    "densest",
-    "densify",
-    "dentals",
-    "dentils",
-    "dentine",
-    "denting",
-    "dentins",
-    "dentoid",
-    "denuded",
-    "denuder",
-    "denudes",
-    "deodand",
-    "deodara",
-    "deodars",
-    "deontic",
-    "deorbit",
-    "depaint",
-    "deperms",
-    "deplane",
-    "deplume",
-    "deponed",
-    "depones",
-    "deports",
-    "deposal",
-    "deposer",
-    "deposes",
-    "deprave",
-    "depside",
-    "deputed",
-    "deputes",
-    "deraign",
-    "derange",
-    "derated",
-    "derates",
-    "derbies",
-    "derider",
-    "derides",
-    "deriver",
-    "dermoid",
-    "derries",
-    "desalts",
-    "desands",
-    "descant",
-    "desexed",
-    "desexes",
-    "desirer",
-    "desists",
-    "deskman",
-    "deskmen",
-    "desmans",
-    "desmids",
-    "desmoid",
-    "desorbs",
-    "despoil",
-    "despond",
-    "despots",
-    "destain",
-    "destine",
-    "desugar",
-    "detains",
-    "detente",
-    "detents",
-    "deterge",
-    "detests",
-    "deticks",
-    "detinue",
-    "detoxed",
-    "detoxes",
-    "detrain",
-    "detrude",
-    "deucing",
-    "deutzia",
-    "deveins",
-    "develed",
-    "devests",
-    "devilry",
-    "devisal",
-    "devisee",
-    "deviser",
-    "devisor",
-    "devoice",
-    "devoirs",
-    "devours",
-    "dewater",
-    "dewaxed",
-    "dewaxes",
-    "dewclaw",
-    "dewdrop",
-    "dewfall",
-    "dewiest",
-    "dewlaps",
-    "dewless",
-    "dewools",
-    "deworms",
-    "dextral",
-    "dextrin",
-    "dezincs",
-    "dharmas",
-    "dharmic",
-    "dharnas",
-    "dhooras",
-    "dhootie",
-    "dhootis",
-    "dhourra",
-    "dhurnas",
-    "dhurrie",
-    "diabase",
-    "diacids",
-    "diadems",
-    "dialist",
-    "dialled",
-    "diallel",
-    "dialler",
-    "dialyse",
-    "dialyze",
-    "diamide",
-    "diamine",
-    "diamins",
-    "diapirs",
-    "diapsid",
-    "diarchy",
-    "diastem",
-    "diaster",
-    "diatron",
-    "diazine",
-    "diazins",
-    "diazole",
-    "dibasic",
-    "dibbers",
-    "dibbing",
-    "dibbled",
-    "dibbler",
-    "dibbles",
-    "dibbuks",
-    "dicamba",
-    "dicasts",
-    "diciest",
-    "dickers",
-    "dickeys",
-    "dickier",
-    "dicking",
-    "dicliny",
-    "dicotyl",
-    "dictier",
-    "dictums",
-    "dicycly",
-    "didacts",
-    "diddled",
-    "diddler",
-    "diddles",
-    "dieback",
-    "dieoffs",
-    "diester",
-    "diether",
-    "digamma",
-    "dighted",
-    "diglots",
-    "dignify",
-    "dikdiks",
-    "diktats",
-    "dilater",
-    "dilates",
-    "dilator",
-    "dillies",
-    "diluter",
-    "dilutes",
-    "dilutor",
-    "diluvia",
-    "dimeter",
-    "dimmest",
-    "dimness",
-    "dimorph",
-    "dimouts",
-    "dimwits",
-    "dindled",
-    "dindles",
-    "dineric",
-    "dineros",
-    "dingbat",
-    "dingers",
-    "dingeys",
-    "dingier",
-    "dingies",
-    "dingily",
-    "dinging",
-    "dingles",
-    "dingoes",
-    "dinitro",
-    "dinkeys",
-    "dinkier",
-    "dinkies",
-    "dinking",
-    "dinkums",
-    "dinting",
-    "diobols",
-    "dioptre",
-    "diorite",
-    "dioxane",
-    "dioxans",
-    "dioxids",
-    "diphase",
-    "diploes",
-    "diploic",
-    "diplont",
-    "dipnets",
-    "dipnoan",
-    "dipodic",
-    "dippier",
-    "dipshit",
-    "diptyca",
-    "diptych",
-    "diquats",
-    "dirdums",
-    "direful",
-    "dirking",
-    "dirling",
-    "dirndls",
-    "dirtbag",
-    "dirtied",
-    "dirtier",
-    "dirties",
-    "dirtily",
-    "disarms",
-    "disavow",
-    "disbars",
-    "disbuds",
-    "discant",
-    "discase",
-    "discept",
-    "discing",
-    "discoed",
-    "discoid",
-    "diseurs",
-    "diseuse",
-    "dishelm",
-    "dishful",
-    "dishier",
-    "dishpan",
-    "dishrag",
-    "disject",
-    "disjoin",
-    "disking",
-    "dislimn",
-    "dismals",
-    "dismast",
-    "dismays",
-    "disomic",
-    "disowns",
-    "dispart",
-    "dispend",
-    "disport",
-    "disrate",
-    "disrobe",
-    "disroot",
-    "dissave",
-    "disseat",
-    "dissert",
-    "distaff",
-    "distain",
-    "distend",
-    "distent",
-    "distich",
-    "distils",
-    "distome",
-    "disuses",
-    "disyoke",
-    "ditcher",
-    "dithers",
-    "dithery",
-    "dithiol",
-    "ditsier",
-    "dittany",
-    "ditties",
-    "dittoed",
-    "ditzier",
-    "diurons",
-    "divests",
-    "divined",
-    "diviner",
-    "divines",
-    "divulse",
-    "divvied",
-    "divvies",
-    "dizened",
-    "dizzied",
-    "dizzier",
-    "dizzies",
-    "dizzily",
-    "djebels",
-    "doating",
-    "dobbers",
-    "dobbies",
-    "doblons",
-    "dobsons",
-    "docents",
-    "docetic",
-    "dockage",
-    "dodders",
-    "doddery",
-    "dodgems",
-    "dodgery",
-    "dodgier",
-    "dodoism",
-    "doeskin",
-    "doffers",
-    "doffing",
-    "dogbane",
-    "dogcart",
-    "dogdoms",
-    "dogears",
-    "dogedom",
-    "dogface",
-    "doggers",
-    "doggery",
-    "doggier",
-    "doggish",
-    "doggone",
-    "doggrel",
-    "doglegs",
-    "doglike",
-    "dogmata",
-    "dognaps",
-    "dogsled",
-    "dogtrot",
-    "dogvane",
-    "doleful",
-    "dollied",
-    "dolling",
-    "dollish",
-    "dollops",
-    "dolmans",
-    "dolmens",
-    "dolours",
-    "doltish",
-    "domical",
-    "domicil",
-    "domines",
-    "dominie",
-    "donator",
-    "dongles",
-    "dongola",
-    "donjons",
-    "donnees",
-    "donnerd",
-    "donnert",
-    "donnish",
-    "donzels",
-    "doobies",
-    "doodads",
-    "doodies",
-    "doodled",
-    "doodler",
-    "doodoos",
-    "doolees",
-    "doolies",
-    "doomful",
-    "doomier",
-    "doomily",
-    "dooming",
-    "doormen",
-    "doowops",
-    "doozers",
-    "doozies",
-    "dopants",
-    "dopiest",
-    "dopings",
-    "dorados",
-    "dorbugs",
-    "dorhawk",
-    "dorkier",
-    "dormers",
-    "dormice",
-    "dormins",
-    "dorneck",
-    "dornick",
-    "dornock",
-    "dorpers",
-    "dorsals",
-    "dorsels",
-    "dorsers",
-    "dossals",
-    "dossels",
-    "dossers",
-    "dossils",
-    "dossing",
-    "dotages",
-    "dotards",
-    "dotiest",
-    "dottels",
-    "dotters",
-    "dottier",
-    "dottily",
-    "dotting",
-    "dottles",
-    "dottrel",
-    "doubter",
-    "doucely",
-    "douceur",
-    "douched",
-    "douches",
-    "dourahs",
-    "dourest",
-    "dourine",
-    "dousers",
-    "dousing",
-    "dovekey",
-    "dovekie",
-    "dovened",
-    "dowable",
-    "dowdier",
-    "dowdies",
-    "dowdily",
-    "doweled",
-    "dowered",
-    "downbow",
-    "downier",
-    "dowries",
-    "dowsers",
-    "doyenne",
-    "doyleys",
-    "doylies",
-    "dozened",
-    "dozenth",
-    "doziest",
-    "drabbed",
-    "drabber",
-    "drabbet",
-    "dracena",
-    "drachma",
-    "drachms",
-    "draftee",
-    "dragees",
-    "dragger",
-    "draggle",
-    "dramady",
-    "dramedy",
-    "drammed",
-    "drapers",
-    "dratted",
-    "drawbar",
-    "drawees",
-    "drawled",
-    "drawler",
-    "drayage",
-    "draying",
-    "drayman",
-    "draymen",
-    "dredger",
-    "dredges",
-    "dreeing",
-    "dreidel",
-    "dreidls",
-    "dribbed",
-    "dribbly",
-    "driblet",
-    "dripper",
-    "drivels",
-    "drizzly",
-    "drogues",
-    "drolled",
-    "droller",
-    "dromond",
-    "dromons",
-    "droners",
-    "drongos",
-    "dronish",
-    "drooled",
-    "drooped",
-    "drosera",
-    "droshky",
-    "drosses",
-    "drouked",
-    "drouths",
-    "drouthy",
-    "drovers",
-    "droving",
-    "drownds",
-    "drowner",
-    "drowsed",
-    "drowses",
-    "drubbed",
-    "drubber",
-    "drudged",
-    "drudger",
-    "drudges",
-    "drugget",
-    "druggie",
-    "druidic",
-    "drumble",
-    "drumlin",
-    "drummed",
-    "drunker",
-    "dryable",
-    "dryades",
-    "dryadic",
-    "drylots",
-    "drywell",
-    "dualist",
-    "dualize",
-    "dubbers",
-    "dubbins",
-    "dubiety",
-    "dubnium",
-    "ducally",
-    "duchies",
-    "duckers",
-    "duckier",
-    "duckies",
-    "duckpin",
-    "ductule",
-    "dudeens",
-    "dudgeon",
-    "duelers",
-    "duelled",
-    "dueller",
-    "duellos",
-    "duendes",
-    "dueness",
-    "duennas",
-    "dueting",
-    "duetted",
-    "duffers",
-    "duffles",
-    "dufuses",
-    "dugongs",
-    "dugouts",
-    "duikers",
-    "dukedom",
-    "dulcets",
-    "dulcify",
-    "dullard",
-    "dullest",
-    "dulling",
-    "dullish",
-    "dulness",
-    "dumdums",
-    "dummied",
-    "dumpers",
-    "dumpier",
-    "dumpily",
-    "dumpish",
-    "dunches",
-    "duncish",
-    "dungier",
-    "dunging",
-    "dunites",
-    "dunitic",
-    "dunkers",
-    "dunlins",
-    "dunnage",
-    "dunness",
-    "dunnest",
-    "dunnite",
-    "dunting",
-    "duodena",
-    "duologs",
-    "duotone",
-    "dupable",
-    "dupping",
-    "durably",
-    "duramen",
-    "durance",
-    "durbars",
-    "durians",
-    "durions",
-    "durmast",
-    "durries",
-    "duskier",
-    "duskily",
-    "dusking",
-    "duskish",
-    "dustier",
-    "dustily",
-    "dustman",
-    "dustmen",
-    "dustoff",
-    "dustpan",
-    "dustrag",
-    "dustups",
-    "duteous",
-    "duumvir",
-    "duvetyn",
-    "dwarfer",
-    "dwelled",
-    "dwining",
-    "dyadics",
-    "dyarchy",
-    "dybbuks",
-    "dyeings",
-    "dyeweed",
-    "dyewood",
-    "dynamos",
-    "dynasts",
-    "dyneins",
-    "dynodes",
-    "dysuria",
-    "dysuric",
-    "dyvours",
-    "eagerer",
-    "eaglets",
-    "eagling",
-    "eanling",
-    "eardrop",
-    "earflap",
-    "earfuls",
-    "earlaps",
-    "earldom",
-    "earless",
-    "earlobe",
-    "earlock",
-    "earmuff",
-    "earplug",
-    "earthed",
-    "earwigs",
-    "earworm",
-    "easeful",
-    "easeled",
-    "easters",
-    "eatable",
-    "eatings",
-    "ebonics",
-    "ebonies",
-    "ebonise",
-    "ebonize",
-    "ecartes",
-    "ecbolic",
-    "eccrine",
-    "ecdyses",
-    "ecdysis",
-    "ecdyson",
-    "echards",
-    "echelle",
-    "echidna",
-    "echinus",
-    "echoers",
-    "echoism",
-    "eclairs",
-    "eclogue",
-    "ecocide",
-    "ecotage",
-    "ecotone",
-    "ecotour",
-    "ecotype",
-    "ectases",
-    "ectasis",
-    "ectatic",
-    "ecthyma",
-    "ectopia",
-    "ectozoa",
-    "ectypal",
-    "ectypes",
-    "eczemas",
-    "edacity",
-    "edaphic",
-    "eddying",
-    "edemata",
-    "edgiest",
-    "edgings",
-    "edictal",
-    "edified",
-    "edifier",
-    "edifies",
-    "editrix",
-    "educing",
-    "eductor",
-    "eeliest",
-    "eellike",
-    "eelpout",
-    "eelworm",
-    "eeriest",
-    "effable",
-    "effaced",
-    "effacer",
-    "effaces",
-    "effulge",
-    "effused",
-    "effuses",
-    "eftsoon",
-    "egalite",
-    "egested",
-    "eggcups",
-    "egghead",
-    "eggless",
-    "eggnogs",
-    "egoisms",
-    "egoists",
-    "egoless",
-    "egotist",
-    "eidetic",
-    "eidolic",
-    "eighths",
-    "eightvo",
-    "eikones",
-    "einkorn",
-    "eirenic",
-    "eiswein",
-    "ekistic",
-    "ekpwele",
-    "elapids",
-    "elapine",
-    "elapses",
-    "elaters",
-    "elating",
-    "elative",
-    "elbowed",
-    "eldress",
-    "eldrich",
-    "electee",
-    "elegiac",
-    "elegies",
-    "elegise",
-    "elegist",
-    "elegits",
-    "elegize",
-    "elenchi",
-    "elevens",
-    "elevons",
-    "elflike",
-    "elflock",
-    "eliding",
-    "elision",
-    "elixirs",
-    "elmiest",
-    "elodeas",
-    "eloigns",
-    "eloined",
-    "eloiner",
-    "elopers",
-    "eloping",
-    "eluants",
-    "eluates",
-    "eluders",
-    "eluding",
-    "eluents",
-    "elusion",
-    "elusory",
-    "eluvial",
-    "eluvium",
-    "elytron",
-    "elytrum",
-    "emanant",
-    "embalms",
-    "embanks",
-    "embayed",
-    "emblaze",
-    "embolic",
-    "embolus",
-    "embosks",
-    "embosom",
-    "embowed",
-    "embowel",
-    "embower",
-    "embroil",
-    "embrown",
-    "embrued",
-    "embrues",
-    "embrute",
-    "embryon",
-    "emended",
-    "emender",
-    "emeries",
-    "emerods",
-    "emeroid",
-    "emersed",
-    "emetics",
-    "emetine",
-    "emetins",
-    "emeutes",
-    "emigres",
-    "emodins",
-    "emoters",
-    "emoting",
-    "empaled",
-    "empaler",
-    "empales",
-    "empanel",
-    "empiric",
-    "emplace",
-    "emplane",
-    "emprise",
-    "emprize",
-    "emptier",
-    "emptily",
-    "emptins",
-    "empyema",
-    "emulous",
-    "enactor",
-    "enamine",
-    "enamors",
-    "enamour",
-    "enation",
-    "encaged",
-    "encages",
-    "encamps",
-    "encases",
-    "enchain",
-    "enchase",
-    "encinal",
-    "encinas",
-    "enclasp",
-    "encomia",
-    "encored",
-    "encrust",
-    "encysts",
-    "endarch",
-    "endears",
-    "endited",
-    "endites",
-    "endives",
-    "endleaf",
-    "endlong",
-    "endmost",
-    "endogen",
-    "endopod",
-    "endower",
-    "endplay",
-    "endrins",
-    "enduing",
-    "endurer",
-    "enduros",
-    "endways",
-    "endwise",
-    "enemata",
-    "energid",
-    "enfaced",
-    "enfaces",
-    "enfeoff",
-    "enfever",
-    "enflame",
-    "enfolds",
-    "enframe",
-    "engager",
-    "engilds",
-    "engirds",
-    "engluts",
-    "engorge",
-    "engraft",
-    "engrail",
-    "engrain",
-    "engrams",
-    "engross",
-    "engulfs",
-    "enhalos",
-    "enigmas",
-    "enisled",
-    "enisles",
-    "enjoins",
-    "enjoyer",
-    "enlaced",
-    "enneads",
-    "ennoble",
-    "ennuyee",
-    "enolase",
-    "enology",
-    "enoughs",
-    "enounce",
-    "enplane",
-    "enrages",
-    "enrobed",
-    "enrober",
-    "enrobes",
-    "enroots",
-    "enserfs",
-    "ensigns",
-    "ensiled",
-    "ensiles",
-    "enskied",
-    "enskies",
-    "enskyed",
-    "ensnare",
-    "ensnarl",
-    "ensouls",
-    "ensurer",
-    "entases",
-    "entasia",
-    "entasis",
-    "enterer",
-    "enteron",
-    "enthral",
-    "enthuse",
-    "enticer",
-    "entices",
-    "entires",
-    "entoils",
-    "entombs",
-    "entopic",
-    "entozoa",
-    "entrain",
-    "entraps",
-    "entwine",
-    "entwist",
-    "enuring",
-    "envenom",
-    "enviers",
-    "enviros",
-    "envying",
-    "enwheel",
-    "enwinds",
-    "enwombs",
-    "enwound",
-    "enwraps",
-    "enzymic",
-    "eobiont",
-    "eoliths",
-    "eonisms",
-    "eosines",
-    "eosinic",
-    "eparchs",
-    "eparchy",
-    "epaulet",
-    "epazote",
-    "epeeist",
-    "epeiric",
-    "epergne",
-    "ephebes",
-    "ephebic",
-    "epheboi",
-    "ephebos",
-    "ephebus",
-    "ephoral",
-    "epiboly",
-    "epicarp",
-    "epicene",
-    "epiderm",
-    "epidote",
-    "epigeal",
-    "epigean",
-    "epigeic",
-    "epigene",
-    "epigone",
-    "epigoni",
-    "epigons",
-    "epigram",
-    "epigyny",
-    "epilate",
-    "epilogs",
-    "epimere",
-    "epimers",
-    "epinaoi",
-    "epinaos",
-    "episcia",
-    "episome",
-    "epizoic",
-    "epizoon",
-    "epochal",
-    "eponyms",
-    "eponymy",
-    "epopees",
-    "epoxied",
-    "epoxyed",
-    "equable",
-    "equably",
-    "equerry",
-    "equines",
-    "equites",
-    "erasion",
-    "erbiums",
-    "erecter",
-    "erectly",
-    "erelong",
-    "eremite",
-    "eremuri",
-    "erepsin",
-    "erethic",
-    "ergates",
-    "ergotic",
-    "ericoid",
-    "eringos",
-    "eristic",
-    "erlking",
-    "ermined",
-    "ermines",
-    "erodent",
-    "erosely",
-    "erotics",
-    "erotism",
-    "erotize",
-    "errable",
-    "errancy",
-    "errants",
-    "erratas",
-    "errhine",
-    "eructed",
-    "eryngos",
-    "escalop",
-    "escapee",
-    "escaper",
-    "escarps",
-    "eschars",
-    "escheat",
-    "eschews",
-    "escolar",
-    "escoted",
-    "escrows",
-    "escuage",
-    "escudos",
-    "eserine",
-    "esparto",
-    "espials",
-    "esprits",
-    "espying",
-    "essayed",
-    "essayer",
-    "essoins",
-    "estated",
-    "esteems",
-    "esthete",
-    "estival",
-    "estrays",
-    "estreat",
-    "estrins",
-    "estriol",
-    "estrone",
-    "estrous",
-    "estrual",
-    "estrums",
-    "etagere",
-    "etalons",
-    "etamine",
-    "etamins",
-    "etatism",
-    "etatist",
-    "etchant",
-    "etchers",
-    "etesian",
-    "ethanes",
-    "ethenes",
-    "ethions",
-    "ethmoid",
-    "ethnics",
-    "ethoses",
-    "ethoxyl",
-    "ethylic",
-    "ethynes",
-    "ethynyl",
-    "etoiles",
-    "etymons",
-    "eucaine",
-    "euchred",
-    "euchres",
-    "euclase",
-    "eucrite",
-    "eudemon",
-    "eugenic",
-    "eugenol",
-    "euglena",
-    "eulogia",
-    "eupepsy",
-    "euphony",
-    "euphroe",
-    "euploid",
-    "eupneas",
-    "eupneic",
-    "eupnoea",
-    "euripus",
-    "euryoky",
-    "eustacy",
-    "eustasy",
-    "eustele",
-    "evaders",
-    "evanish",
-    "eveners",
-    "evenest",
-    "everted",
-    "evertor",
-    "evictee",
-    "evictor",
-    "evilest",
-    "eviller",
-    "evinces",
-    "eviting",
-    "evokers",
-    "evolute",
-    "evolver",
-    "evulsed",
-    "evulses",
-    "evzones",
-    "exactas",
-    "exacter",
-    "exactor",
-    "exalter",
-    "examens",
-    "exapted",
-    "exarchs",
-    "exarchy",
-    "excepts",
-    "excided",
-    "excides",
-    "exciple",
-    "excises",
-    "excitor",
-    "exclave",
-    "excreta",
-    "excrete",
-    "excuser",
-    "exedrae",
-    "exegete",
-    "exempla",
-    "exergue",
-    "exhales",
-    "exhedra",
-    "exhorts",
-    "exhumer",
-    "exhumes",
-    "exilers",
-    "exilian",
-    "exiling",
-    "exocarp",
-    "exoderm",
-    "exogamy",
-    "exogens",
-    "exonyms",
-    "exordia",
-    "exosmic",
-    "exotism",
-    "expends",
-    "expiate",
-    "expirer",
-    "explant",
-    "exposal",
-    "exposer",
-    "exposit",
-    "expulse",
-    "exscind",
-    "exsects",
-    "exserts",
-    "extolls",
-    "extorts",
-    "extrude",
-    "exudate",
-    "exuding",
-    "exulted",
-    "exurban",
-    "exurbia",
-    "exuviae",
-    "exuvial",
-    "exuvium",
-    "eyasses",
-    "eyeable",
-    "eyebars",
-    "eyebolt",
-    "eyecups",
-    "eyefold",
-    "eyefuls",
-    "eyehole",
-    "eyehook",
-    "eyeless",
-    "eyelift",
-    "eyelike",
-    "eyeshot",
-    "eyesome",
-    "eyespot",
-    "eyewink",
-    "fabbest",
-    "fablers",
-    "fabliau",
-    "fabling",
-    "fabular",
-    "faciend",
-    "facings",
-    "factful",
-    "facture",
-    "faculae",
-    "facular",
-    "fadable",
-    "faddier",
-    "faddish",
-    "faddism",
-    "faddist",
-    "fadedly",
-    "fadeins",
-    "fadeout",
-    "fadging",
-    "fadings",
-    "fadlike",
-    "faggier",
-    "fagging",
-    "faggoty",
-    "fagoted",
-    "fagoter",
-    "faience",
-    "failles",
-    "fainest",
-    "fairish",
-    "faithed",
-    "faitour",
-    "fakeers",
-    "falbala",
-    "falcate",
-    "fallals",
-    "fallers",
-    "falloff",
-    "fallows",
-    "falsest",
-    "falsies",
-    "famulus",
-    "fancify",
-    "fancily",
-    "fandoms",
-    "fanegas",
-    "fanfold",
-    "fanions",
-    "fanjets",
-    "fanlike",
-    "fanners",
-    "fantail",
-    "fantasm",
-    "fantast",
-    "fantods",
-    "fantoms",
-    "fanwise",
-    "fanwort",
-    "faquirs",
-    "faradic",
-    "farcers",
-    "farceur",
-    "farcies",
-    "farcing",
-    "fardels",
-    "farding",
-    "farebox",
-    "farfals",
-    "farfels",
-    "farinas",
-    "farinha",
-    "farness",
-    "farrago",
-    "farrows",
-    "farside",
-    "fartlek",
-    "fasciae",
-    "fascial",
-    "fascine",
-    "fashing",
-    "fastens",
-    "fatback",
-    "fatbird",
-    "fathead",
-    "fatidic",
-    "fatless",
-    "fatlike",
-    "fatling",
-    "fatness",
-    "fatsoes",
-    "fattens",
-    "fattier",
-    "fattily",
-    "fatting",
-    "fattish",
-    "fatuity",
-    "fatuous",
-    "fatwood",
-    "faucals",
-    "faucial",
-    "fauvism",
-    "fauvist",
-    "favelas",
-    "favella",
-    "favisms",
-    "favorer",
-    "favuses",
-    "fawners",
-    "fawnier",
-    "fazenda",
-    "fearers",
-    "feasing",
-    "feasted",
-    "feaster",
-    "featest",
-    "feazing",
-    "fecials",
-    "feculae",
-    "fedayee",
-    "fedexed",
-    "fedexes",
-    "fedoras",
-    "feebler",
-    "feedbag",
-    "feedbox",
-    "feelers",
-    "feeless",
-    "feezing",
-    "feigner",
-    "feijoas",
-    "feinted",
-    "felafel",
-    "fellahs",
-    "fellate",
-    "fellers",
-    "fellest",
-    "fellies",
-    "felloes",
-    "felonry",
-    "felsite",
-    "felspar",
-    "felucca",
-    "felwort",
-    "feminie",
-    "fenagle",
-    "fencers",
-    "fenland",
-    "fennecs",
-    "fennels",
-    "fennier",
-    "fenuron",
-    "feodary",
-    "feoffed",
-    "feoffee",
-    "feoffer",
-    "feoffor",
-    "ferbams",
-    "ferlies",
-    "fermata",
-    "fermate",
-    "fermium",
-    "fernery",
-    "fernier",
-    "ferrate",
-    "ferrels",
-    "ferrety",
-    "ferried",
-    "ferrums",
-    "ferulae",
-    "ferulas",
-    "feruled",
-    "ferules",
-    "fervors",
-    "fescues",
-    "fessing",
-    "festers",
-    "festoon",
-    "fetcher",
-    "fetials",
-    "fetidly",
-    "fetlock",
-    "fetting",
-    "fettled",
-    "fettles",
-    "feudary",
-    "feudist",
-    "fewness",
-    "feyness",
-    "fiacres",
-    "fiances",
-    "fiaschi",
-    "fiascos",
-    "fibbers",
-    "fibbing",
-    "fibered",
-    "fibrins",
-    "fibroin",
-    "fibroma",
-    "fibster",
-    "fibulae",
-    "fibular",
-    "fibulas",
-    "fickler",
-    "fictile",
-    "fictive",
-    "ficuses",
-    "fideism",
-    "fideist",
-    "fidgets",
-    "fidgety",
-    "fidging",
-    "fiefdom",
-    "fiercer",
-    "fierier",
-    "fierily",
-    "fifthly",
-    "figging",
-    "figurer",
-    "figwort",
-    "filaree",
-    "filaria",
-    "filched",
-    "filcher",
-    "filches",
-    "filemot",
-    "fileted",
-    "filiate",
-    "filibeg",
-    "fillips",
-    "filmdom",
-    "filmers",
-    "filmier",
-    "filmily",
-    "filmset",
-    "fimbles",
-    "fimbria",
-    "finable",
-    "finagle",
-    "finales",
-    "finalis",
-    "finback",
-    "finfoot",
-    "finical",
-    "finikin",
-    "finings",
-    "finises",
-    "finites",
-    "finking",
-    "finless",
-    "finlike",
-    "finmark",
-    "finnier",
-    "finning",
-    "fipples",
-    "firebug",
-    "firedog",
-    "firelit",
-    "firepan",
-    "firepot",
-    "firkins",
-    "firmans",
-    "firmers",
-    "firmest",
-    "firrier",
-    "fiscals",
-    "fishgig",
-    "fishier",
-    "fishily",
-    "fishway",
-    "fissate",
-    "fitchee",
-    "fitches",
-    "fitchet",
-    "fitchew",
-    "fixable",
-    "fixates",
-    "fixatif",
-    "fixedly",
-    "fixures",
-    "fizgigs",
-    "fizzers",
-    "fizzier",
-    "fizzing",
-    "fizzled",
-    "fizzles",
-    "fjordic",
-    "flacked",
-    "flacons",
-    "flagger",
-    "flagman",
-    "flagmen",
-    "flagons",
-    "flailed",
-    "flakers",
-    "flakier",
-    "flakily",
-    "flambee",
-    "flambes",
-    "flamens",
-    "flamers",
-    "flamier",
-    "flammed",
-    "flaneur",
-    "flanken",
-    "flapped",
-    "flareup",
-    "flasket",
-    "flatcap",
-    "flatcar",
-    "flatlet",
-    "flatted",
-    "flattop",
-    "flaunts",
-    "flaunty",
-    "flautas",
-    "flavine",
-    "flavins",
-    "flavone",
-    "flavory",
-    "flawier",
-    "flawing",
-    "flaxier",
-    "flayers",
-    "flaying",
-    "fleabag",
-    "fleapit",
-    "fleches",
-    "flecked",
-    "fledges",
-    "fleeced",
-    "fleecer",
-    "fleered",
-    "fleeted",
-    "fleeter",
-    "fleetly",
-    "flehmen",
-    "flensed",
-    "flenser",
-    "flenses",
-    "flesher",
-    "fleshes",
-    "fleshly",
-    "fleuron",
-    "flexile",
-    "flexors",
-    "fleying",
-    "flighty",
-    "flinder",
-    "flinger",
-    "flinted",
-    "flirter",
-    "fliting",
-    "flitted",
-    "flitter",
-    "flivver",
-    "floatel",
-    "flocced",
-    "floccus",
-    "flogger",
-    "flokati",
-    "flooder",
-    "floorer",
-    "floosie",
-    "floozie",
-    "flopper",
-    "florins",
-    "floruit",
-    "flossed",
-    "flosser",
-    "flosses",
-    "flotage",
-    "flounce",
-    "flouncy",
-    "flouted",
-    "flouter",
-    "flowage",
-    "flubbed",
-    "flubber",
-    "flubdub",
-    "flueric",
-    "fluffed",
-    "fluffer",
-    "fluidal",
-    "fluidic",
-    "fluidly",
-    "flukier",
-    "flukily",
-    "fluking",
-    "fluming",
-    "flummox",
-    "flumped",
-    "flunked",
-    "flunker",
-    "flunkey",
-    "flunkie",
-    "fluoric",
-    "fluorid",
-    "fluorin",
-    "flusher",
-    "fluster",
-    "fluters",
-    "flutier",
-    "fluting",
-    "fluxing",
-    "fluxion",
-    "flyable",
-    "flybelt",
-    "flyblew",
-    "flyblow",
-    "flyboat",
-    "flyboys",
-    "flyings",
-    "flyleaf",
-    "flyless",
-    "flyoffs",
-    "flypast",
-    "flytier",
-    "flyting",
-    "flytrap",
-    "flyways",
-    "foaling",
-    "foamers",
-    "foamier",
-    "foamily",
-    "fobbing",
-    "focally",
-    "fodders",
-    "foetors",
-    "fogbows",
-    "fogdogs",
-    "foggage",
-    "foggers",
-    "foggier",
-    "foggily",
-    "fogless",
-    "fogyish",
-    "fogyism",
-    "foiling",
-    "foining",
-    "foisons",
-    "foisted",
-    "folacin",
-    "folates",
-    "foldout",
-    "foldups",
-    "foliate",
-    "folioed",
-    "foliose",
-    "folious",
-    "foliums",
-    "folkier",
-    "folkies",
-    "folkish",
-    "folkmot",
-    "folkway",
-    "foments",
-    "fomites",
-    "fonding",
-    "fondler",
-    "fondles",
-    "fondued",
-    "fondues",
-    "fontina",
-    "foolery",
-    "footboy",
-    "footier",
-    "footies",
-    "footled",
-    "footler",
-    "footles",
-    "footmen",
-    "footpad",
-    "footsie",
-    "footway",
-    "foozled",
-    "foozler",
-    "foozles",
-    "foppery",
-    "fopping",
-    "foppish",
-    "foraged",
-    "forager",
-    "forayed",
-    "forayer",
-    "forbare",
-    "forbode",
-    "forbore",
-    "forcers",
-    "fording",
-    "fordoes",
-    "fordone",
-    "forebay",
-    "forebye",
-    "foredid",
-    "foregut",
-    "foreleg",
-    "forepaw",
-    "foreran",
-    "forerun",
-    "foretop",
-    "forfend",
-    "forgers",
-    "forgoer",
-    "forgoes",
-    "forgone",
-    "forkers",
-    "forkful",
-    "forkier",
-    "formful",
-    "formols",
-    "formyls",
-    "fornent",
-    "forsook",
-    "forwent",
-    "forworn",
-    "fossate",
-    "fossick",
-    "fouette",
-    "foulard",
-    "foulest",
-    "fourgon",
-    "foveate",
-    "foveola",
-    "foveole",
-    "fowlers",
-    "fowling",
-    "fowlpox",
-    "foxfish",
-    "foxhole",
-    "foxhunt",
-    "foxiest",
-    "foxings",
-    "foxlike",
-    "foxskin",
-    "foziest",
-    "fracted",
-    "fractur",
-    "fractus",
-    "fraenum",
-    "fragged",
-    "frailer",
-    "frailly",
-    "fraises",
-    "franked",
-    "franker",
-    "frapped",
-    "frappes",
-    "frasses",
-    "frazils",
-    "frazzle",
-    "freckle",
-    "freckly",
-    "freebee",
-    "frenula",
-    "frenums",
-    "frescos",
-    "freshed",
-    "freshes",
-    "freshet",
-    "fretful",
-    "fretsaw",
-    "fretter",
-    "friarly",
-    "fribble",
-    "friezes",
-    "frigged",
-    "frights",
-    "frijole",
-    "frilled",
-    "friller",
-    "frisees",
-    "friseur",
-    "frisked",
-    "frisker",
-    "frisket",
-    "frisson",
-    "fritted",
-    "fritter",
-    "fritzes",
-    "frivols",
-    "frizers",
-    "frizing",
-    "frizzed",
-    "frizzer",
-    "frizzes",
-    "frizzle",
-    "frizzly",
-    "frocked",
-    "frogeye",
-    "frogged",
-    "froglet",
-    "frogmen",
-    "frolics",
-    "fronded",
-    "fronter",
-    "frontes",
-    "fronton",
-    "frothed",
-    "frother",
-    "frounce",
-    "froward",
-    "frowner",
-    "frowsts",
-    "frowsty",
-    "frugged",
-    "fruited",
-    "fruiter",
-    "frustum",
-    "fryable",
-    "frypans",
-    "fubbing",
-    "fubsier",
-    "fuchsin",
-    "fuckoff",
-    "fuckups",
-    "fucoids",
-    "fucoses",
-    "fucuses",
-    "fuddies",
-    "fuddled",
-    "fuddles",
-    "fudging",
-    "fuehrer",
-    "fuelers",
-    "fueller",
-    "fugally",
-    "fugatos",
-    "fuggier",
-    "fuggily",
-    "fugging",
-    "fugling",
-    "fuguing",
-    "fuguist",
-    "fuhrers",
-    "fulgent",
-    "fulhams",
-    "fullams",
-    "fullers",
-    "fullery",
-    "fulling",
-    "fulmars",
-    "fulmine",
-    "fulsome",
-    "fulvous",
-    "fumaric",
-    "fumbler",
-    "fumette",
-    "fumiest",
-    "fumulus",
-    "funfair",
-    "funfest",
-    "fungals",
-    "fungoes",
-    "fungoid",
-    "fungous",
-    "funicle",
-    "funkers",
-    "funkias",
-    "funkier",
-    "funkily",
-    "funking",
-    "funnest",
-    "funning",
-    "funplex",
-    "furanes",
-    "furbish",
-    "furcate",
-    "furcula",
-    "furioso",
-    "furlers",
-    "furless",
-    "furling",
-    "furmety",
-    "furmity",
-    "furores",
-    "furrier",
-    "furrily",
-    "furring",
-    "furrowy",
-    "furzier",
-    "fusains",
-    "fusaria",
-    "fuscous",
-    "fusibly",
-    "fusilli",
-    "fussers",
-    "fussier",
-    "fussily",
-    "fusspot",
-    "fustian",
-    "fustics",
-    "fustier",
-    "fustily",
-    "futharc",
-    "futhark",
-    "futhorc",
-    "futhork",
-    "futtock",
-    "futural",
-    "futzing",
-    "fuzzier",
-    "fuzzily",
-    "fuzzing",
-    "fylfots",
-    "gabbard",
-    "gabbart",
-    "gabbers",
-    "gabbier",
-    "gabbing",
-    "gabbled",
-    "gabbler",
-    "gabbles",
-    "gabbros",
-    "gabelle",
-    "gabfest",
-    "gabions",
-    "gabling",
-    "gaboons",
-    "gadders",
-    "gadding",
-    "gadgety",
-    "gadoids",
-    "gadroon",
-    "gadwall",
-    "gaffers",
-    "gaffing",
-    "gagakus",
-    "gaggled",
-    "gaggles",
-    "gagster",
-    "gahnite",
-    "gainsay",
-    "gaiting",
-    "galabia",
-    "galagos",
-    "galanga",
-    "galatea",
-    "galaxes",
-    "galeate",
-    "galenas",
-    "galenic",
-    "galeres",
-    "galette",
-    "galiots",
-    "galipot",
-    "gallate",
-    "gallein",
-    "galleta",
-    "gallets",
-    "gallfly",
-    "gallica",
-    "gallied",
-    "gallies",
-    "galling",
-    "galliot",
-    "gallnut",
-    "galloon",
-    "galloot",
-    "gallops",
-    "gallous",
-    "galoots",
-    "galoped",
-    "galores",
-    "galoshe",
-    "galumph",
-    "galyacs",
-    "galyaks",
-    "gambade",
-    "gambado",
-    "gambias",
-    "gambirs",
-    "gambits",
-    "gamboge",
-    "gambols",
-    "gambrel",
-    "gametal",
-    "gametic",
-    "gamiest",
-    "gamines",
-    "gamings",
-    "gammers",
-    "gammier",
-    "gamming",
-    "ganache",
-    "ganders",
-    "gangers",
-    "ganging",
-    "gangrel",
-    "gangues",
-    "gangway",
-    "ganjahs",
-    "gannets",
-    "ganoids",
-    "gantlet",
-    "gaolers",
-    "gaoling",
-    "gapless",
-    "gaposis",
-    "gappier",
-    "garaged",
-    "garbagy",
-    "garbing",
-    "garbler",
-    "garbles",
-    "garboil",
-    "gardant",
-    "garfish",
-    "gargets",
-    "gargety",
-    "gargled",
-    "gargler",
-    "gargles",
-    "garigue",
-    "garlics",
-    "garoted",
-    "garotes",
-    "garotte",
-    "garpike",
-    "garrets",
-    "garring",
-    "garrons",
-    "garrote",
-    "garveys",
-    "gasbags",
-    "gascons",
-    "gaseity",
-    "gashest",
-    "gashing",
-    "gasking",
-    "gaskins",
-    "gasless",
-    "gasohol",
-    "gaspers",
-    "gassers",
-    "gassier",
-    "gassily",
-    "gasters",
-    "gasting",
-    "gastral",
-    "gastrea",
-    "gateaus",
-    "gateaux",
-    "gateman",
-    "gatemen",
-    "gatings",
-    "gaudery",
-    "gaudier",
-    "gaudies",
-    "gaudily",
-    "gauffer",
-    "gaugers",
-    "gauming",
-    "gaunter",
-    "gauntly",
-    "gauntry",
-    "gausses",
-    "gauzier",
-    "gauzily",
-    "gavages",
-    "gaveled",
-    "gavials",
-    "gavotte",
-    "gawkers",
-    "gawkier",
-    "gawkies",
-    "gawkily",
-    "gawking",
-    "gawkish",
-    "gawpers",
-    "gawping",
-    "gaydars",
-    "gayness",
-    "gazabos",
-    "gazania",
-    "gazumps",
-    "gecking",
-    "geckoes",
-    "geegaws",
-    "geekdom",
-    "geekier",
-    "geezers",
-    "geishas",
-    "gelable",
-    "geladas",
-    "gelants",
-    "gelated",
-    "gelates",
-    "gelatis",
-    "gelatos",
-    "gelcaps",
-    "gelders",
-    "gelidly",
-    "gellant",
-    "gelling",
-    "geminal",
-    "gemlike",
-    "gemmate",
-    "gemmier",
-    "gemmily",
-    "gemming",
-    "gemmule",
-    "gemotes",
-    "gemsbok",
-    "geneses",
-    "genette",
-    "genevas",
-    "genipap",
-    "genitor",
-    "genoise",
-    "genseng",
-    "gentled",
-    "gentles",
-    "gentoos",
-    "genuses",
-    "geoduck",
-    "geoidal",
-    "georgic",
-    "gerents",
-    "gerenuk",
-    "germens",
-    "germier",
-    "germina",
-    "gerunds",
-    "gessoed",
-    "gessoes",
-    "gestate",
-    "getable",
-    "gewgaws",
-    "gharial",
-    "gharris",
-    "ghazies",
-    "gherkin",
-    "ghiblis",
-    "ghillie",
-    "ghosted",
-    "ghoulie",
-    "giaours",
-    "gibbers",
-    "gibbets",
-    "gibbing",
-    "gibbose",
-    "giblets",
-    "giddied",
-    "giddier",
-    "giddies",
-    "giddily",
-    "giddyap",
-    "giddyup",
-    "giftees",
-    "gigaton",
-    "giggler",
-    "giglets",
-    "giglots",
-    "gigolos",
-    "gilders",
-    "gillers",
-    "gillied",
-    "gilling",
-    "gimbals",
-    "gimlets",
-    "gimmals",
-    "gimmies",
-    "gimpier",
-    "gimping",
-    "gingall",
-    "gingals",
-    "gingeli",
-    "gingely",
-    "gingers",
-    "gingery",
-    "gingili",
-    "gingiva",
-    "gingkos",
-    "ginkgos",
-    "ginners",
-    "ginnier",
-    "ginning",
-    "ginzoes",
-    "gippers",
-    "gipping",
-    "gipsied",
-    "gipsies",
-    "girasol",
-    "girding",
-    "girdled",
-    "girdler",
-    "girlier",
-    "girning",
-    "girolle",
-    "girosol",
-    "girshes",
-    "girthed",
-    "girting",
-    "gisarme",
-    "gitanos",
-    "gittern",
-    "gitting",
-    "gizzard",
-    "gjetost",
-    "glaceed",
-    "gladded",
-    "gladder",
-    "gladier",
-    "glaiket",
-    "glaikit",
-    "glaired",
-    "glaires",
-    "glaived",
-    "glaives",
-    "glamors",
-    "glancer",
-    "glandes",
-    "glarier",
-    "glassed",
-    "glassie",
-    "glazers",
-    "glazily",
-    "gleamer",
-    "gleeked",
-    "gleeman",
-    "gleemen",
-    "gleeted",
-    "glenoid",
-    "gleying",
-    "gliadin",
-    "glibber",
-    "gliming",
-    "glinted",
-    "glisten",
-    "glister",
-    "glitchy",
-    "glitzed",
-    "glitzes",
-    "gloated",
-    "gloater",
-    "globate",
-    "globing",
-    "globins",
-    "globoid",
-    "globose",
-    "globous",
-    "globule",
-    "glochid",
-    "glomera",
-    "glommed",
-    "glonoin",
-    "gloomed",
-    "glopped",
-    "glorias",
-    "gloried",
-    "glossae",
-    "glossal",
-    "glossas",
-    "glosser",
-    "glottal",
-    "glottic",
-    "glottis",
-    "glouted",
-    "glovers",
-    "gloving",
-    "glowers",
-    "glowfly",
-    "glozing",
-    "glucans",
-    "glueing",
-    "gluepot",
-    "glugged",
-    "gluiest",
-    "glummer",
-    "gluteal",
-    "glutens",
-    "gluteus",
-    "glutted",
-    "glycans",
-    "glycins",
-    "glycyls",
-    "glyphic",
-    "glyptic",
-    "gnarred",
-    "gnashed",
-    "gnashes",
-    "gnathal",
-    "gnathic",
-    "gnawers",
-    "gnomish",
-    "gnomist",
-    "gnomons",
-    "goading",
-    "goaling",
-    "goannas",
-    "goateed",
-    "goatees",
-    "goatish",
-    "gobangs",
-    "gobbets",
-    "gobbing",
-    "gobbler",
-    "gobioid",
-    "gobonee",
-    "goddams",
-    "godding",
-    "godetia",
-    "godhood",
-    "godlier",
-    "godlily",
-    "godling",
-    "godowns",
-    "godroon",
-    "godship",
-    "godsons",
-    "godwits",
-    "goffers",
-    "goggled",
-    "goggler",
-    "goglets",
-    "goiters",
-    "goitres",
-    "goldarn",
-    "goldbug",
-    "goldest",
-    "goldeye",
-    "goldurn",
-    "goliard",
-    "goloshe",
-    "gombeen",
-    "gomeral",
-    "gomerel",
-    "gomeril",
-    "gomutis",
-    "gonadic",
-    "gonging",
-    "gonidia",
-    "gonidic",
-    "goniffs",
-    "gonophs",
-    "goobers",
-    "goodbys",
-    "goodish",
-    "goodmen",
-    "goofier",
-    "goofily",
-    "googols",
-    "gooiest",
-    "goombah",
-    "goombay",
-    "gooneys",
-    "goonier",
-    "goopier",
-    "goorals",
-    "goosier",
-    "goosing",
-    "gorcock",
-    "gordita",
-    "gorgers",
-    "gorgets",
-    "gorging",
-    "gorgons",
-    "gorhens",
-    "goriest",
-    "gormand",
-    "gorming",
-    "gorsier",
-    "gossans",
-    "gossipy",
-    "gossoon",
-    "gothics",
-    "gothite",
-    "gougers",
-    "gourami",
-    "gourdes",
-    "goutier",
-    "goutily",
-    "gowaned",
-    "gowning",
-    "grabble",
-    "grabens",
-    "gracile",
-    "gracing",
-    "grackle",
-    "gradate",
-    "gradine",
-    "gradins",
-    "grafter",
-    "grainer",
-    "gramary",
-    "grammas",
-    "grampas",
-    "grampus",
-    "grandam",
-    "grandee",
-    "grandly",
-    "granges",
-    "granita",
-    "granter",
-    "grapery",
-    "grapier",
-    "graplin",
-    "grapnel",
-    "grappas",
-    "grasper",
-    "graters",
-    "gratine",
-    "gratins",
-    "graupel",
-    "gravers",
-    "gravida",
-    "gravies",
-    "graving",
-    "gravlax",
-    "grayest",
-    "graylag",
-    "grayout",
-    "grazers",
-    "grazier",
-    "greaser",
-    "greaten",
-    "greaved",
-    "grecize",
-    "greeing",
-    "greened",
-    "greenie",
-    "greenly",
-    "greenth",
-    "greiges",
-    "greisen",
-    "gremial",
-    "gremmie",
-    "greyest",
-    "greyhen",
-    "greying",
-    "greylag",
-    "gridder",
-    "griding",
-    "griever",
-    "griffes",
-    "grifted",
-    "grifter",
-    "grigris",
-    "griller",
-    "grilses",
-    "grimier",
-    "grimily",
-    "griming",
-    "grinded",
-    "gringas",
-    "gringos",
-    "grinner",
-    "gripers",
-    "gripier",
-    "griping",
-    "gripman",
-    "gripmen",
-    "grippes",
-    "gripple",
-    "griskin",
-    "grisons",
-    "grister",
-    "gristle",
-    "gristly",
-    "gritted",
-    "gritter",
-    "grivets",
-    "grizzle",
-    "groaner",
-    "grodier",
-    "grogram",
-    "groined",
-    "grokked",
-    "groover",
-    "gropers",
-    "grottos",
-    "groused",
-    "grouser",
-    "grouses",
-    "grouted",
-    "grouter",
-    "grovels",
-    "growler",
-    "grownup",
-    "growthy",
-    "groynes",
-    "grubbed",
-    "grubber",
-    "grudged",
-    "grudger",
-    "grueled",
-    "grueler",
-    "gruffed",
-    "gruffer",
-    "gruffly",
-    "grugrus",
-    "grumbly",
-    "grummer",
-    "grummet",
-    "grumose",
-    "grumous",
-    "grumped",
-    "grumphy",
-    "grunger",
-    "grunges",
-    "grunion",
-    "grunter",
-    "gruntle",
-    "grushie",
-    "grutten",
-    "guaiacs",
-    "guanaco",
-    "guanase",
-    "guanays",
-    "guanins",
-    "guarder",
-    "guayule",
-    "gudgeon",
-    "guenons",
-    "guerdon",
-    "guesser",
-    "guested",
-    "guffaws",
-    "guggled",
-    "guggles",
-    "guglets",
-    "guiders",
-    "guidons",
-    "guiling",
-    "guimpes",
-    "guipure",
-    "guisard",
-    "guising",
-    "gulches",
-    "guldens",
-    "gulfier",
-    "gulfing",
-    "gullets",
-    "gulleys",
-    "gullied",
-    "gulling",
-    "gulpers",
-    "gulpier",
-    "gumboil",
-    "gumboot",
-    "gumdrop",
-    "gumless",
-    "gumlike",
-    "gumline",
-    "gummata",
-    "gummers",
-    "gummier",
-    "gumming",
-    "gummite",
-    "gummose",
-    "gummous",
-    "gumshoe",
-    "gumweed",
-    "gumwood",
-    "gundogs",
-    "gunites",
-    "gunkier",
-    "gunless",
-    "gunlock",
-    "gunnels",
-    "gunnies",
-    "gunplay",
-    "gunroom",
-    "gunsels",
-    "gunwale",
-    "guppies",
-    "gurging",
-    "gurgled",
-    "gurgles",
-    "gurglet",
-    "gurnard",
-    "gurnets",
-    "gurneys",
-    "gurries",
-    "gurshes",
-    "gushier",
-    "gushily",
-    "gussets",
-    "gussied",
-    "gussies",
-    "gustier",
-    "gustily",
-    "gustoes",
-    "gutlike",
-    "gutsier",
-    "gutsily",
-    "guttate",
-    "guttery",
-    "guttier",
-    "guttled",
-    "guttler",
-    "guttles",
-    "guyline",
-    "guzzled",
-    "guzzles",
-    "gweduck",
-    "gweducs",
-    "gynecia",
-    "gynecic",
-    "gyplure",
-    "gyppers",
-    "gypping",
-    "gypsied",
-    "gypster",
-    "gypsums",
-    "gyrally",
-    "gyrases",
-    "gyrated",
-    "gyrates",
-    "gyrator",
-    "gyrenes",
-    "gyttjas",
-    "habitan",
-    "habited",
-    "habitue",
-    "habitus",
-    "haboobs",
-    "hachure",
-    "hackbut",
-    "hackees",
-    "hackies",
-    "hackled",
-    "hackler",
-    "hackles",
-    "hackmen",
-    "hadarim",
-    "haddest",
-    "hadiths",
-    "hadjees",
-    "haemins",
-    "haemoid",
-    "haffets",
-    "haffits",
-    "hafizes",
-    "hafnium",
-    "haftara",
-    "hafters",
-    "hafting",
-    "hagadic",
-    "hagborn",
-    "hagbush",
-    "hagbuts",
-    "hagdons",
-    "hagfish",
-    "haggada",
-    "hagging",
-    "haggish",
-    "haggled",
-    "haggler",
-    "haggles",
-    "hagride",
-    "hagrode",
-    "hahnium",
-    "hailers",
-    "haimish",
-    "haircap",
-    "hairdos",
-    "hairier",
-    "hairnet",
-    "hakeems",
-    "halakah",
-    "halakha",
-    "halakic",
-    "halalah",
-    "halalas",
-    "halavah",
-    "halberd",
-    "halidom",
-    "halites",
-    "halitus",
-    "hallahs",
-    "hallels",
-    "halloas",
-    "halloed",
-    "halloes",
-    "halloos",
-    "halloth",
-    "haloids",
-    "haloing",
-    "haltere",
-    "halvahs",
-    "halvers",
-    "halyard",
-    "hamadas",
-    "hamates",
-    "hamauls",
-    "hambone",
-    "hammada",
-    "hammals",
-    "hammams",
-    "hammier",
-    "hammily",
-    "hamular",
-    "hamulus",
-    "hamzahs",
-    "hanaper",
-    "handcar",
-    "handier",
-    "handsaw",
-    "handsel",
-    "hangdog",
-    "hangmen",
-    "hangtag",
-    "hangups",
-    "hankers",
-    "hankies",
-    "hanking",
-    "hansels",
-    "hansoms",
-    "hanting",
-    "hantles",
-    "hapaxes",
-    "haplite",
-    "haplont",
-    "happing",
-    "haptene",
-    "haptens",
-    "hardass",
-    "hardhat",
-    "hardier",
-    "hardies",
-    "hardily",
-    "hardpan",
-    "hardset",
-    "hareems",
-    "harelip",
-    "hariana",
-    "haricot",
-    "harijan",
-    "harissa",
-    "harkens",
-    "harking",
-    "harlots",
-    "harmers",
-    "harmine",
-    "harmins",
-    "harpies",
-    "harpins",
-    "harrows",
-    "harshen",
-    "harslet",
-    "hartals",
-    "harumph",
-    "haslets",
-    "hasping",
-    "hassels",
-    "hassium",
-    "hassled",
-    "hassock",
-    "hastate",
-    "hastens",
-    "hastier",
-    "hasting",
-    "hatable",
-    "hatband",
-    "hatchel",
-    "hatfuls",
-    "hatless",
-    "hatlike",
-    "hatpins",
-    "hatrack",
-    "hatreds",
-    "hatsful",
-    "hatting",
-    "hauberk",
-    "haulier",
-    "haunter",
-    "hausens",
-    "hautboy",
-    "hauteur",
-    "havarti",
-    "havened",
-    "havered",
-    "haverel",
-    "haviors",
-    "haviour",
-    "hawalas",
-    "hawkeys",
-    "hawkies",
-    "hawsers",
-    "haycock",
-    "hayfork",
-    "hayings",
-    "haylage",
-    "hayloft",
-    "haymows",
-    "hayrack",
-    "hayrick",
-    "hayride",
-    "hazanim",
-    "hazelly",
-    "haziest",
-    "hazings",
-    "hazmats",
-    "hazzans",
-    "headful",
-    "headier",
-    "headily",
-    "headman",
-    "headmen",
-    "headpin",
-    "healths",
-    "heapers",
-    "hearsed",
-    "hearses",
-    "hearten",
-    "hearths",
-    "heaumes",
-    "heavers",
-    "hebetic",
-    "heckled",
-    "heckles",
-    "hectors",
-    "heddles",
-    "hedgers",
-    "hedgier",
-    "heeders",
-    "heedful",
-    "heehaws",
-    "heelers",
-    "heeling",
-    "heeltap",
-    "heezing",
-    "hefters",
-    "heftier",
-    "heftily",
-    "hefting",
-    "hegaris",
-    "hegiras",
-    "hegumen",
-    "heighth",
-    "heiling",
-    "heimish",
-    "heinies",
-    "heirdom",
-    "heiring",
-    "heisted",
-    "heister",
-    "hejiras",
-    "hektare",
-    "heliast",
-    "helipad",
-    "heliums",
-    "helixes",
-    "hellbox",
-    "helleri",
-    "hellers",
-    "hellery",
-    "helling",
-    "hellion",
-    "helloed",
-    "helloes",
-    "helming",
-    "helotry",
-    "helving",
-    "hemagog",
-    "hematal",
-    "hematic",
-    "hematin",
-    "hemiola",
-    "hemline",
-    "hemmers",
-    "hempier",
-    "henbane",
-    "henbits",
-    "hencoop",
-    "henleys",
-    "henlike",
-    "hennaed",
-    "hennery",
-    "hennish",
-    "henpeck",
-    "henries",
-    "henting",
-    "hepcats",
-    "heppest",
-    "heptads",
-    "heptane",
-    "heptose",
-    "herbage",
-    "herbier",
-    "herdics",
-    "herdman",
-    "herdmen",
-    "heredes",
-    "heriots",
-    "heritor",
-    "herniae",
-    "hernial",
-    "heroins",
-    "heroize",
-    "heronry",
-    "herried",
-    "herries",
-    "hertzes",
-    "hessite",
-    "hetaera",
-    "hetaira",
-    "heteros",
-    "hetmans",
-    "hewable",
-    "hexades",
-    "hexadic",
-    "hexanes",
-    "hexapla",
-    "hexapod",
-    "hexerei",
-    "hexones",
-    "hexosan",
-    "hexoses",
-    "hexylic",
-    "heydays",
-    "heydeys",
-    "hibachi",
-    "hickeys",
-    "hickies",
-    "hickish",
-    "hidable",
-    "hidings",
-    "higgled",
-    "higgler",
-    "higgles",
-    "highboy",
-    "highted",
-    "highths",
-    "hightop",
-    "hijacks",
-    "hijrahs",
-    "hilding",
-    "hillers",
-    "hilling",
-    "hilloas",
-    "hillock",
-    "hilloed",
-    "hilloes",
-    "hilting",
-    "himatia",
-    "hindgut",
-    "hingers",
-    "hinging",
-    "hinkier",
-    "hinnied",
-    "hinnies",
-    "hinters",
-    "hipbone",
-    "hipless",
-    "hiplike",
-    "hipline",
-    "hipness",
-    "hippier",
-    "hipping",
-    "hippish",
-    "hipshot",
-    "hirable",
-    "hircine",
-    "hirpled",
-    "hirples",
-    "hirsels",
-    "hirsled",
-    "hirsles",
-    "hirudin",
-    "hisself",
-    "hissers",
-    "hissier",
-    "hissies",
-    "histing",
-    "histoid",
-    "hitcher",
-    "hitless",
-    "hoagies",
-    "hoarder",
-    "hoarier",
-    "hoarily",
-    "hoarsen",
-    "hoarser",
-    "hoatzin",
-    "hoaxers",
-    "hoaxing",
-    "hobbers",
-    "hobbing",
-    "hobbler",
-    "hobbles",
-    "hoblike",
-    "hobnail",
-    "hobnobs",
-    "hoboing",
-    "hoboism",
-    "hockers",
-    "hockeys",
-    "hocused",
-    "hocuses",
-    "hodaddy",
-    "hoddens",
-    "hoddins",
-    "hoecake",
-    "hoedown",
-    "hoelike",
-    "hogback",
-    "hogfish",
-    "hoggers",
-    "hoggets",
-    "hoggish",
-    "hoglike",
-    "hogmane",
-    "hognose",
-    "hognuts",
-    "hogties",
-    "hogweed",
-    "hoicked",
-    "hoidens",
-    "hoising",
-    "hoister",
-    "hokiest",
-    "holards",
-    "holdout",
-    "holdups",
-    "holibut",
-    "holisms",
-    "holists",
-    "holking",
-    "hollaed",
-    "hollers",
-    "holloas",
-    "holloed",
-    "holloes",
-    "holloos",
-    "holmium",
-    "holyday",
-    "homaged",
-    "homager",
-    "homages",
-    "homiest",
-    "homines",
-    "hommock",
-    "homonym",
-    "homosex",
-    "honchos",
-    "hondled",
-    "hondles",
-    "honeyed",
-    "hongied",
-    "hongies",
-    "honkers",
-    "honkeys",
-    "honkies",
-    "honorer",
-    "hooches",
-    "hoochie",
-    "hoodier",
-    "hooding",
-    "hoodoos",
-    "hoofers",
-    "hoofing",
-    "hookahs",
-    "hookeys",
-    "hookier",
-    "hookies",
-    "hooklet",
-    "hoopers",
-    "hooping",
-    "hooplas",
-    "hoopoes",
-    "hoopoos",
-    "hoorahs",
-    "hoorays",
-    "hoosgow",
-    "hootier",
-    "hooting",
-    "hophead",
-    "hoplite",
-    "hoppier",
-    "hoppled",
-    "hopples",
-    "hopsack",
-    "hoptoad",
-    "hordein",
-    "hording",
-    "hornier",
-    "hornily",
-    "hornist",
-    "hornito",
-    "horrent",
-    "horrify",
-    "horsier",
-    "horsily",
-    "horsing",
-    "horstes",
-    "hoseyed",
-    "hosiers",
-    "hostler",
-    "hotbeds",
-    "hotcake",
-    "hotched",
-    "hotches",
-    "hotfoot",
-    "hothead",
-    "hotrods",
-    "hotting",
-    "hottish",
-    "houdahs",
-    "hounder",
-    "housels",
-    "housers",
-    "hoveled",
-    "hoverer",
-    "howbeit",
-    "howdahs",
-    "howdied",
-    "howdies",
-    "howking",
-    "howlers",
-    "howlets",
-    "hoydens",
-    "hryvnas",
-    "hubbies",
-    "hubbubs",
-    "huckles",
-    "huddler",
-    "huddles",
-    "hueless",
-    "huffier",
-    "huffily",
-    "huffing",
-    "huffish",
-    "hugeous",
-    "huipils",
-    "hulkier",
-    "hulking",
-    "hullers",
-    "hulling",
-    "hulloas",
-    "hulloed",
-    "hulloes",
-    "hulloos",
-    "humaner",
-    "humates",
-    "humbler",
-    "humbles",
-    "humbugs",
-    "humdrum",
-    "humeral",
-    "humidex",
-    "humidly",
-    "hummock",
-    "humored",
-    "humours",
-    "humpers",
-    "humphed",
-    "humpier",
-    "humuses",
-    "hunches",
-    "hungers",
-    "hunkers",
-    "hunkeys",
-    "hunkier",
-    "hunkies",
-    "hunnish",
-    "huppahs",
-    "hurdies",
-    "hurdled",
-    "hurdler",
-    "hurlers",
-    "hurleys",
-    "hurlies",
-    "hurrahs",
-    "hurrays",
-    "hurrier",
-    "hurries",
-    "hurters",
-    "hurtled",
-    "hurtles",
-    "hushaby",
-    "hushful",
-    "hushing",
-    "huskier",
-    "huskily",
-    "husking",
-    "hussars",
-    "hussies",
-    "hustled",
-    "hustles",
-    "huswife",
-    "hutched",
-    "hutlike",
-    "hutment",
-    "hutting",
-    "hutzpah",
-    "hutzpas",
-    "huzzaed",
-    "huzzahs",
-    "hyaenas",
-    "hyaenic",
-    "hyaline",
-    "hyalins",
-    "hyalite",
-    "hyaloid",
-    "hydatid",
-    "hydrase",
-    "hydriae",
-    "hydrids",
-    "hydroid",
-    "hydrops",
-    "hydrous",
-    "hyenine",
-    "hyenoid",
-    "hygeist",
-    "hymenal",
-    "hymenia",
-    "hymnals",
-    "hymnary",
-    "hymning",
-    "hymnist",
-    "hymnody",
-    "hyoidal",
-    "hyperon",
-    "hypnoid",
-    "hypogea",
-    "hypoing",
-    "hyponea",
-    "hyponym",
-    "hyraces",
-    "hyraxes",
-    "hyssops",
-    "iambics",
-    "iceboat",
-    "icecaps",
-    "icefall",
-    "iceless",
-    "icelike",
-    "ichnite",
-    "icicled",
-    "iciness",
-    "ickiest",
-    "icteric",
-    "icterus",
-    "ictuses",
-    "ideated",
-    "ideates",
-    "identic",
-    "idlesse",
-    "idolise",
-    "idolism",
-    "idolize",
-    "idylist",
-    "iffiest",
-    "ignatia",
-    "ignobly",
-    "ignorer",
-    "iguanid",
-    "ileitis",
-    "ileuses",
-    "illites",
-    "illitic",
-    "illogic",
-    "illuded",
-    "illudes",
-    "illumed",
-    "illumes",
-    "illuvia",
-    "imagism",
-    "imagist",
-    "imagoes",
-    "imamate",
-    "imarets",
-    "imbalms",
-    "imbarks",
-    "imbibed",
-    "imbiber",
-    "imbibes",
-    "imblaze",
-    "imbosom",
-    "imbower",
-    "imbrown",
-    "imbrued",
-    "imbrues",
-    "imbrute",
-    "imbuing",
-    "immerge",
-    "immixed",
-    "immixes",
-    "immunes",
-    "immured",
-    "immures",
-    "impaint",
-    "impalas",
-    "impales",
-    "impanel",
-    "imparks",
-    "impaste",
-    "impasto",
-    "impavid",
-    "impawns",
-    "impearl",
-    "impeder",
-    "impends",
-    "imperil",
-    "imphees",
-    "impiety",
-    "impings",
-    "implead",
-    "imponed",
-    "impones",
-    "imposer",
-    "imposts",
-    "impower",
-    "impregn",
-    "imprese",
-    "imprest",
-    "improvs",
-    "impugns",
-    "impurer",
-    "imputer",
-    "imputes",
-    "inanely",
-    "inanest",
-    "inanity",
-    "inaptly",
-    "inarmed",
-    "inbeing",
-    "inbreds",
-    "inbreed",
-    "inburst",
-    "incaged",
-    "incages",
-    "incants",
-    "incased",
-    "incases",
-    "incents",
-    "incepts",
-    "incests",
-    "inchers",
-    "incipit",
-    "incisal",
-    "incises",
-    "incisor",
-    "inciter",
-    "incites",
-    "incivil",
-    "inclasp",
-    "inclips",
-    "inclose",
-    "incomer",
-    "inconnu",
-    "incross",
-    "incrust",
-    "incudal",
-    "incudes",
-    "incurve",
-    "incused",
-    "incuses",
-    "indabas",
-    "indamin",
-    "indenes",
-    "indican",
-    "indicts",
-    "indigen",
-    "indigos",
-    "indited",
-    "inditer",
-    "indites",
-    "indiums",
-    "indoles",
-    "indorse",
-    "indowed",
-    "indoxyl",
-    "indraft",
-    "indrawn",
-    "inducts",
-    "induing",
-    "indulin",
-    "indults",
-    "indusia",
-    "indwell",
-    "indwelt",
-    "inearth",
-    "inedita",
-    "ineptly",
-    "inertly",
-    "infalls",
-    "infanta",
-    "infares",
-    "infauna",
-    "infeoff",
-    "infests",
-    "infight",
-    "infirms",
-    "infixed",
-    "infixes",
-    "inflect",
-    "infolds",
-    "infract",
-    "infuser",
-    "ingates",
-    "ingenue",
-    "ingesta",
-    "ingests",
-    "ingoing",
-    "ingoted",
-    "ingraft",
-    "ingrain",
-    "ingrate",
-    "ingroup",
-    "ingulfs",
-    "inhales",
-    "inhauls",
-    "inhered",
-    "inheres",
-    "inhibin",
-    "inhumed",
-    "inhumer",
-    "inhumes",
-    "injurer",
-    "inkblot",
-    "inkhorn",
-    "inkiest",
-    "inkless",
-    "inklike",
-    "inkpots",
-    "inkwood",
-    "inlaced",
-    "inlaces",
-    "inlands",
-    "inlayer",
-    "inliers",
-    "inlying",
-    "innages",
-    "innerly",
-    "innerve",
-    "innless",
-    "inocula",
-    "inosine",
-    "inosite",
-    "inphase",
-    "inpours",
-    "inquiet",
-    "insaner",
-    "inscape",
-    "insculp",
-    "inseams",
-    "insigne",
-    "insnare",
-    "insouls",
-    "inspans",
-    "instals",
-    "instars",
-    "insteps",
-    "instils",
-    "inswept",
-    "intagli",
-    "inthral",
-    "intimae",
-    "intimal",
-    "intimas",
-    "intines",
-    "intombs",
-    "intoned",
-    "intoner",
-    "intones",
-    "intorts",
-    "intrant",
-    "intreat",
-    "introfy",
-    "introit",
-    "intrust",
-    "intuits",
-    "inturns",
-    "intwine",
-    "intwist",
-    "inulase",
-    "inulins",
-    "inuring",
-    "inurned",
-    "inutile",
-    "inveigh",
-    "invital",
-    "invitee",
-    "inviter",
-    "invoker",
-    "inwalls",
-    "inweave",
-    "inwinds",
-    "inwound",
-    "inwoven",
-    "inwraps",
-    "iodated",
-    "iodates",
-    "iodides",
-    "iodines",
-    "iodised",
-    "iodises",
-    "iodisms",
-    "iodized",
-    "iodizer",
-    "iodizes",
-    "iolites",
-    "ionised",
-    "ionises",
-    "ioniums",
-    "ionizes",
-    "ionogen",
-    "ionomer",
-    "ionones",
-    "ipecacs",
-    "ipomoea",
-    "iracund",
-    "irately",
-    "iratest",
-    "ireless",
-    "irenics",
-    "irising",
-    "irksome",
-    "ironers",
-    "ironist",
-    "ironize",
-    "ironmen",
-    "irrupts",
-    "isagoge",
-    "isatine",
-    "isatins",
-    "ischial",
-    "ischium",
-    "isleted",
-    "isobare",
-    "isobars",
-    "isobath",
-    "isochor",
-    "isodose",
-    "isogamy",
-    "isogeny",
-    "isogone",
-    "isogons",
-    "isogony",
-    "isogram",
-    "isogriv",
-    "isohels",
-    "isohyet",
-    "isolead",
-    "isoline",
-    "isologs",
-    "isonomy",
-    "isopach",
-    "isopods",
-    "isotach",
-    "isotone",
-    "isotopy",
-    "issuant",
-    "isthmic",
-    "itchier",
-    "itchily",
-    "iteming",
-    "itemise",
-    "iterant",
-    "ivories",
-    "ivylike",
-    "ixodids",
-    "izzards",
-    "jabbers",
-    "jabbing",
-    "jabirus",
-    "jacales",
-    "jacamar",
-    "jacanas",
-    "jacinth",
-    "jackdaw",
-    "jackers",
-    "jackies",
-    "jackleg",
-    "jacobin",
-    "jaconet",
-    "jadedly",
-    "jadeite",
-    "jaditic",
-    "jaegers",
-    "jaggary",
-    "jaggers",
-    "jaggery",
-    "jaggier",
-    "jaggies",
-    "jagging",
-    "jagless",
-    "jailers",
-    "jailors",
-    "jalapic",
-    "jalapin",
-    "jaloppy",
-    "jambeau",
-    "jambing",
-    "jamlike",
-    "jammier",
-    "jangled",
-    "jangler",
-    "jangles",
-    "jarfuls",
-    "jargons",
-    "jargony",
-    "jargoon",
-    "jarinas",
-    "jarldom",
-    "jarrahs",
-    "jarsful",
-    "jarveys",
-    "jasmins",
-    "jaspery",
-    "jassids",
-    "jauking",
-    "jaunced",
-    "jaunces",
-    "jaunted",
-    "jauping",
-    "jawless",
-    "jawlike",
-    "jawline",
-    "jaybird",
-    "jaygees",
-    "jayvees",
-    "jaywalk",
-    "jazzbos",
-    "jazzers",
-    "jazzier",
-    "jazzily",
-    "jazzing",
-    "jazzman",
-    "jazzmen",
-    "jeeping",
-    "jeepney",
-    "jeerers",
-    "jeering",
-    "jejunal",
-    "jellaba",
-    "jellied",
-    "jellify",
-    "jelling",
-    "jemadar",
-    "jemidar",
-    "jemmied",
-    "jemmies",
-    "jennets",
-    "jennies",
-    "jeopard",
-    "jerboas",
-    "jereeds",
-    "jerkers",
-    "jerkier",
-    "jerkies",
-    "jerkily",
-    "jerkins",
-    "jerreed",
-    "jerrids",
-    "jerries",
-    "jessant",
-    "jessing",
-    "jestful",
-    "jesting",
-    "jetbead",
-    "jetfoil",
-    "jetlags",
-    "jetlike",
-    "jetport",
-    "jetsams",
-    "jetsoms",
-    "jettied",
-    "jettier",
-    "jettons",
-    "jetways",
-    "jewfish",
-    "jezails",
-    "jibbers",
-    "jibbing",
-    "jibboom",
-    "jicamas",
-    "jigaboo",
-    "jiggers",
-    "jiggier",
-    "jigging",
-    "jiggish",
-    "jiggled",
-    "jiggles",
-    "jiglike",
-    "jigsawn",
-    "jillion",
-    "jilters",
-    "jilting",
-    "jimjams",
-    "jimmied",
-    "jimmies",
-    "jimminy",
-    "jimpest",
-    "jingall",
-    "jingals",
-    "jingled",
-    "jingler",
-    "jingoes",
-    "jinkers",
-    "jinking",
-    "jinxing",
-    "jitneys",
-    "jiveass",
-    "jiviest",
-    "joannes",
-    "jobbers",
-    "jobbery",
-    "jobbing",
-    "jobname",
-    "jocular",
-    "joggled",
-    "joggler",
-    "joggles",
-    "joisted",
-    "jojobas",
-    "jokiest",
-    "jollied",
-    "jollier",
-    "jollies",
-    "jollify",
-    "jollily",
-    "jollity",
-    "jolters",
-    "joltier",
-    "joltily",
-    "jolting",
-    "jonesed",
-    "joneses",
-    "jonquil",
-    "joshers",
-    "joshing",
-    "jostled",
-    "jostler",
-    "jostles",
-    "jotters",
-    "jouking",
-    "jounced",
-    "jounces",
-    "journos",
-    "jousted",
-    "jouster",
-    "jowlier",
-    "joyance",
-    "joyless",
-    "joypops",
-    "joyrode",
-    "jubbahs",
-    "jubhahs",
-    "jubiles",
-    "judases",
-    "judders",
-    "judgers",
-    "judoist",
-    "judokas",
-    "jugfuls",
-    "jugging",
-    "juggled",
-    "juggles",
-    "jughead",
-    "jugsful",
-    "jugulum",
-    "juicier",
-    "juicily",
-    "jujubes",
-    "jujuism",
-    "jujuist",
-    "jujutsu",
-    "jumbals",
-    "jumbler",
-    "jumbles",
-    "jumbuck",
-    "jumpier",
-    "jumpily",
-    "jumpoff",
-    "juncoes",
-    "jungled",
-    "junkets",
-    "junkier",
-    "junking",
-    "junkman",
-    "junkmen",
-    "jurally",
-    "jurants",
-    "juridic",
-    "jurying",
-    "juryman",
-    "jurymen",
-    "jussive",
-    "justers",
-    "justest",
-    "justing",
-    "justled",
-    "justles",
-    "juttied",
-    "jutties",
-    "juvenal",
-    "kabakas",
-    "kabalas",
-    "kabayas",
-    "kabbala",
-    "kabikis",
-    "kabukis",
-    "kaddish",
-    "kaffirs",
-    "kaftans",
-    "kahunas",
-    "kainite",
-    "kainits",
-    "kaisers",
-    "kajeput",
-    "kakapos",
-    "kalends",
-    "kalians",
-    "kalimba",
-    "kaliphs",
-    "kaliums",
-    "kalmias",
-    "kalongs",
-    "kalpacs",
-    "kalpaks",
-    "kamalas",
-    "kamseen",
-    "kamsins",
-    "kanakas",
-    "kanbans",
-    "kantars",
-    "kantele",
-    "kaoline",
-    "kaolins",
-    "karakul",
-    "karates",
-    "karroos",
-    "karstic",
-    "kasbahs",
-    "kashers",
-    "kashrut",
-    "katcina",
-    "kathode",
-    "kations",
-    "katsura",
-    "katydid",
-    "kauries",
-    "kayaked",
-    "kayaker",
-    "kayoing",
-    "kebbies",
-    "kebbock",
-    "kebbuck",
-    "keblahs",
-    "kecking",
-    "keckled",
-    "keckles",
-    "keddahs",
-    "kedging",
-    "keeking",
-    "keelage",
-    "keelson",
-    "keeners",
-    "keenest",
-    "keening",
-    "keester",
-    "kegeler",
-    "keggers",
-    "kegging",
-    "keglers",
-    "kegling",
-    "keister",
-    "keitloa",
-    "kellies",
-    "keloids",
-    "kelpies",
-    "kelping",
-    "kelsons",
-    "kelters",
-    "kelvins",
-    "kenches",
-    "kenning",
-    "kenosis",
-    "kenotic",
-    "kepping",
-    "keramic",
-    "kerbing",
-    "kerchoo",
-    "kerfing",
-    "kermess",
-    "kernite",
-    "kerogen",
-    "kerrias",
-    "kerries",
-    "kerseys",
-    "kerygma",
-    "ketches",
-    "ketenes",
-    "ketonic",
-    "ketoses",
-    "ketosis",
-    "ketotic",
-    "kewpies",
-    "keycard",
-    "keypals",
-    "keysets",
-    "keyster",
-    "keyways",
-    "khaddar",
-    "khalifs",
-    "khamsin",
-    "khanate",
-    "khazens",
-    "khedahs",
-    "khedive",
-    "khirkah",
-    "kiaughs",
-    "kibbehs",
-    "kibbitz",
-    "kibbled",
-    "kibbles",
-    "kiblahs",
-    "kickbox",
-    "kickier",
-    "kickups",
-    "kidders",
-    "kiddish",
-    "kiddoes",
-    "kidlike",
-    "kidnaps",
-    "kidskin",
-    "kidvids",
-    "kiester",
-    "killdee",
-    "killick",
-    "killies",
-    "killjoy",
-    "killock",
-    "kilning",
-    "kilobar",
-    "kilobit",
-    "kilorad",
-    "kiloton",
-    "kilters",
-    "kilties",
-    "kilting",
-    "kimchee",
-    "kimchis",
-    "kinaras",
-    "kindler",
-    "kindles",
-    "kinemas",
-    "kineses",
-    "kinesic",
-    "kinetin",
-    "kinfolk",
-    "kingcup",
-    "kinging",
-    "kinglet",
-    "kinkier",
-    "kinkily",
-    "kinking",
-    "kinless",
-    "kippers",
-    "kipping",
-    "kipskin",
-    "kirkmen",
-    "kirmess",
-    "kirning",
-    "kirtled",
-    "kirtles",
-    "kishkas",
-    "kishkes",
-    "kismats",
-    "kismets",
-    "kissers",
-    "kistful",
-    "kitbags",
-    "kithara",
-    "kithing",
-    "kitling",
-    "kitschy",
-    "kitting",
-    "kittled",
-    "kittler",
-    "kittles",
-    "klatsch",
-    "klavern",
-    "klaxons",
-    "kleagle",
-    "klephts",
-    "kleptos",
-    "klister",
-    "kludged",
-    "kludges",
-    "kludgey",
-    "kluging",
-    "klutzes",
-    "knacked",
-    "knacker",
-    "knapped",
-    "knapper",
-    "knarred",
-    "knavery",
-    "knavish",
-    "knawels",
-    "kneaded",
-    "kneader",
-    "kneecap",
-    "kneeing",
-    "kneeled",
-    "kneeler",
-    "kneepad",
-    "kneepan",
-    "knelled",
-    "knifers",
-    "knifing",
-    "knishes",
-    "knobbed",
-    "knobbly",
-    "knolled",
-    "knoller",
-    "knopped",
-    "knotter",
-    "knouted",
-    "knowers",
-    "knuckly",
-    "kobolds",
-    "kokanee",
-    "kolacky",
-    "kolbasi",
-    "kolhozy",
-    "kolkhos",
-    "kolkhoz",
-    "kolkozy",
-    "komatik",
-    "konking",
-    "koodoos",
-    "kookier",
-    "kopecks",
-    "kopiyka",
-    "koppies",
-    "korunas",
-    "koshers",
-    "kotowed",
-    "kotower",
-    "koumiss",
-    "koumyss",
-    "kouprey",
-    "koussos",
-    "kowtows",
-    "kraaled",
-    "krakens",
-    "kraters",
-    "kreuzer",
-    "krimmer",
-    "krubuts",
-    "kruller",
-    "kuchens",
-    "kulturs",
-    "kummels",
-    "kumquat",
-    "kumyses",
-    "kunzite",
-    "kurbash",
-    "kurgans",
-    "kvasses",
-    "kvelled",
-    "kvetchy",
-    "kwachas",
-    "kwanzas",
-    "kyanise",
-    "kyanite",
-    "kyanize",
-    "kylikes",
-    "kything",
-    "laagers",
-    "labarum",
-    "labella",
-    "labials",
-    "labiate",
-    "labrets",
-    "labroid",
-    "labrums",
-    "laciest",
-    "lacings",
-    "lackers",
-    "lackeys",
-    "laconic",
-    "lacquey",
-    "lactams",
-    "lactary",
-    "lactase",
-    "lacteal",
-    "lactean",
-    "lactone",
-    "lacunae",
-    "lacunal",
-    "lacunar",
-    "lacunas",
-    "lacunes",
-    "ladanum",
-    "laddies",
-    "laddish",
-    "ladened",
-    "ladhood",
-    "ladings",
-    "ladinos",
-    "ladlers",
-    "ladling",
-    "ladrone",
-    "ladrons",
-    "ladyish",
-    "ladykin",
-    "lagends",
-    "lagered",
-    "laggard",
-    "laggers",
-    "lagunas",
-    "lagunes",
-    "laicise",
-    "laicism",
-    "laicize",
-    "lairdly",
-    "lairing",
-    "laithly",
-    "laities",
-    "lakebed",
-    "lakiest",
-    "lakings",
-    "lalland",
-    "lallans",
-    "lalling",
-    "lambada",
-    "lambast",
-    "lambdas",
-    "lambent",
-    "lambers",
-    "lambier",
-    "lambies",
-    "lambing",
-    "lambkin",
-    "lamedhs",
-    "lamella",
-    "laminal",
-    "laminas",
-    "lamming",
-    "lampads",
-    "lampers",
-    "lamping",
-    "lampion",
-    "lamster",
-    "lanated",
-    "landaus",
-    "landler",
-    "landmen",
-    "laneway",
-    "langrel",
-    "languet",
-    "languor",
-    "langurs",
-    "laniard",
-    "laniary",
-    "lanital",
-    "lankest",
-    "lankier",
-    "lankily",
-    "lanners",
-    "lanugos",
-    "laogais",
-    "lapdogs",
-    "lapeled",
-    "lapfuls",
-    "lapides",
-    "lapilli",
-    "lapises",
-    "lappers",
-    "lappets",
-    "lapsers",
-    "lapsing",
-    "lapwing",
-    "larchen",
-    "larches",
-    "larders",
-    "lardier",
-    "larding",
-    "lardons",
-    "lardoon",
-    "largess",
-    "largish",
-    "lariats",
-    "larkers",
-    "larkier",
-    "larking",
-    "larkish",
-    "larrups",
-    "lascars",
-    "lashers",
-    "lashins",
-    "lashkar",
-    "lassies",
-    "lassoed",
-    "lassoer",
-    "lassoes",
-    "lasters",
-    "latakia",
-    "latchet",
-    "lateens",
-    "latened",
-    "latents",
-    "laterad",
-    "latests",
-    "latexes",
-    "lathers",
-    "lathery",
-    "lathier",
-    "lathing",
-    "latices",
-    "latigos",
-    "latilla",
-    "latosol",
-    "latrias",
-    "lattens",
-    "lattins",
-    "lauders",
-    "lauding",
-    "laugher",
-    "launces",
-    "lauwine",
-    "lavabos",
-    "lavages",
-    "laveers",
-    "lavrock",
-    "lawbook",
-    "lawines",
-    "lawings",
-    "lawlike",
-    "laxness",
-    "lazaret",
-    "laziest",
-    "lazulis",
-    "lazying",
-    "lazyish",
-    "leached",
-    "leacher",
-    "leaches",
-    "leadens",
-    "leadier",
-    "leadman",
-    "leadmen",
-    "leafage",
-    "leafier",
-    "leafing",
-    "leagued",
-    "leakers",
-    "leakier",
-    "leakily",
-    "leaners",
-    "leanest",
-    "leapers",
-    "learier",
-    "leasers",
-    "leashed",
-    "leavens",
-    "leavier",
-    "lechers",
-    "lechery",
-    "leching",
-    "lechwes",
-    "lectors",
-    "lecythi",
-    "ledgier",
-    "leeched",
-    "leerier",
-    "leerily",
-    "leering",
-    "leeways",
-    "leftest",
-    "leftish",
-    "legated",
-    "legatee",
-    "legates",
-    "legator",
-    "legatos",
-    "leggier",
-    "legging",
-    "leggins",
-    "legists",
-    "legless",
-    "leglike",
-    "legongs",
-    "legumin",
-    "lehayim",
-    "leister",
-    "lekking",
-    "lekvars",
-    "lekythi",
-    "lemmata",
-    "lemures",
-    "lenited",
-    "lenites",
-    "lensman",
-    "lensmen",
-    "lentigo",
-    "lentisk",
-    "lentoid",
-    "leonine",
-    "leporid",
-    "leprose",
-    "leprous",
-    "leptins",
-    "letched",
-    "letches",
-    "lethals",
-    "lethean",
-    "leucins",
-    "leucite",
-    "leucoma",
-    "leukoma",
-    "leukons",
-    "levants",
-    "levator",
-    "levelly",
-    "levered",
-    "leveret",
-    "leviers",
-    "levulin",
-    "lewdest",
-    "lewises",
-    "lexemes",
-    "lexemic",
-    "lezzies",
-    "liaised",
-    "liaises",
-    "lianoid",
-    "libbers",
-    "libeled",
-    "libelee",
-    "libeler",
-    "libidos",
-    "liblabs",
-    "librate",
-    "licente",
-    "lichees",
-    "lichted",
-    "lichtly",
-    "licitly",
-    "lictors",
-    "lidding",
-    "lidless",
-    "liefest",
-    "liernes",
-    "lievest",
-    "lifeful",
-    "liftman",
-    "liftmen",
-    "ligates",
-    "lignans",
-    "lignify",
-    "lignins",
-    "ligroin",
-    "ligulae",
-    "ligular",
-    "ligulas",
-    "ligules",
-    "ligures",
-    "likings",
-    "lilting",
-    "limacon",
-    "limbate",
-    "limbeck",
-    "limbers",
-    "limbier",
-    "limbing",
-    "limeade",
-    "limiest",
-    "liminal",
-    "limites",
-    "limmers",
-    "limners",
-    "limning",
-    "limpers",
-    "limpest",
-    "limpets",
-    "limpkin",
-    "limpsey",
-    "limulus",
-    "linable",
-    "linages",
-    "linalol",
-    "lindens",
-    "lindies",
-    "lineate",
-    "linecut",
-    "lingams",
-    "lingcod",
-    "lingier",
-    "lingoes",
-    "linguae",
-    "lingula",
-    "liniest",
-    "linkboy",
-    "linkman",
-    "linkmen",
-    "linkups",
-    "linnets",
-    "linocut",
-    "linsang",
-    "linseys",
-    "lintels",
-    "linters",
-    "lintier",
-    "linting",
-    "lintols",
-    "linuron",
-    "lionise",
-    "lionize",
-    "lipases",
-    "lipides",
-    "lipidic",
-    "lipless",
-    "liplike",
-    "lipoids",
-    "lipomas",
-    "lippens",
-    "lippers",
-    "lippier",
-    "lipping",
-    "lipread",
-    "liquate",
-    "liquefy",
-    "liquify",
-    "liriope",
-    "lisente",
-    "lispers",
-    "lisping",
-    "lissome",
-    "listees",
-    "listels",
-    "litchis",
-    "lithely",
-    "lithest",
-    "lithias",
-    "lithify",
-    "lithoed",
-    "lithoid",
-    "lithops",
-    "litoral",
-    "litotes",
-    "litotic",
-    "littery",
-    "livened",
-    "livener",
-    "livered",
-    "lividly",
-    "liviers",
-    "livings",
-    "livyers",
-    "lixivia",
-    "loaches",
-    "loamier",
-    "loaming",
-    "loaners",
-    "loather",
-    "loathes",
-    "loathly",
-    "lobated",
-    "lobbers",
-    "lobbing",
-    "lobbyer",
-    "lobefin",
-    "lobular",
-    "lobules",
-    "lobworm",
-    "locater",
-    "lochans",
-    "lochial",
-    "lockage",
-    "lockjaw",
-    "locknut",
-    "lockram",
-    "lockset",
-    "locoing",
-    "locoism",
-    "locular",
-    "loculed",
-    "locules",
-    "loculus",
-    "locusta",
-    "lodgers",
-    "loessal",
-    "loesses",
-    "lofters",
-    "loftier",
-    "loftily",
-    "lofting",
-    "logania",
-    "loggats",
-    "loggets",
-    "loggias",
-    "loggier",
-    "loggish",
-    "logiest",
-    "logions",
-    "logjams",
-    "logroll",
-    "logways",
-    "logwood",
-    "loiding",
-    "loiters",
-    "lollers",
-    "lolling",
-    "lollops",
-    "lollopy",
-    "lomeins",
-    "lomenta",
-    "loments",
-    "longans",
-    "longers",
-    "longies",
-    "loobies",
-    "loofahs",
-    "lookism",
-    "lookist",
-    "looneys",
-    "loonier",
-    "loonies",
-    "loonily",
-    "loopers",
-    "loopier",
-    "loopily",
-    "loosens",
-    "loosest",
-    "loppers",
-    "loppier",
-    "lopping",
-    "loquats",
-    "lording",
-    "lordoma",
-    "lorgnon",
-    "loricae",
-    "loriner",
-    "lorises",
-    "losable",
-    "losings",
-    "lotoses",
-    "lotters",
-    "lotting",
-    "lotuses",
-    "loudens",
-    "loudish",
-    "lounged",
-    "louping",
-    "louring",
-    "lousier",
-    "lousily",
-    "lousing",
-    "louting",
-    "loutish",
-    "louvred",
-    "louvres",
-    "lovably",
-    "lovages",
-    "lovebug",
-    "loverly",
-    "lowborn",
-    "lowboys",
-    "lowbred",
-    "lowings",
-    "lowlier",
-    "lowlife",
-    "lowlily",
-    "lowness",
-    "loyaler",
-    "loyally",
-    "lubbers",
-    "lucarne",
-    "lucence",
-    "lucency",
-    "lucerns",
-    "lucidly",
-    "lucites",
-    "luckier",
-    "luckies",
-    "lucking",
-    "luetics",
-    "luffing",
-    "lugeing",
-    "luggers",
-    "luggies",
-    "lugsail",
-    "lugworm",
-    "lullers",
-    "lulling",
-    "lumbago",
-    "lumbars",
-    "lumbers",
-    "lumenal",
-    "lumpens",
-    "lumpers",
-    "lumpier",
-    "lumpily",
-    "lumping",
-    "lumpish",
-    "lunated",
-    "lunched",
-    "luncher",
-    "lunette",
-    "lungans",
-    "lungees",
-    "lungers",
-    "lungful",
-    "lunging",
-    "lungyis",
-    "luniest",
-    "lunkers",
-    "lunting",
-    "lunulae",
-    "lunular",
-    "lunules",
-    "lupanar",
-    "lupines",
-    "lupulin",
-    "lupuses",
-    "lurched",
-    "lurcher",
-    "lurches",
-    "lurdane",
-    "lurdans",
-    "lurexes",
-    "luridly",
-    "lushest",
-    "lushing",
-    "lusters",
-    "lustier",
-    "lustily",
-    "lustral",
-    "lustred",
-    "lustres",
-    "lustrum",
-    "lususes",
-    "luteins",
-    "luteous",
-    "lutfisk",
-    "luthern",
-    "lutings",
-    "lutists",
-    "luxated",
-    "luxates",
-    "lyceums",
-    "lychees",
-    "lychnis",
-    "lycopod",
-    "lyddite",
-    "lyingly",
-    "lyncean",
-    "lynched",
-    "lyncher",
-    "lynches",
-    "lyrated",
-    "lyricon",
-    "lyrisms",
-    "lyrists",
-    "lysines",
-    "lysogen",
-    "macaber",
-    "macacos",
-    "macchia",
-    "macchie",
-    "machree",
-    "machzor",
-    "mackled",
-    "mackles",
-    "macrons",
-    "maculae",
-    "maculas",
-    "maculed",
-    "macules",
-    "macumba",
-    "madames",
-    "madcaps",
-    "maddens",
-    "madders",
-    "maddest",
-    "madding",
-    "maddish",
-    "madrasa",
-    "madrone",
-    "madrono",
-    "madtoms",
-    "madwort",
-    "madzoon",
-    "maenads",
-    "maestri",
-    "maffias",
-    "maffick",
-    "mafiosi",
-    "mafioso",
-    "maftirs",
-    "magalog",
-    "maggoty",
-    "magians",
-    "magilps",
-    "maglevs",
-    "magmata",
-    "magnums",
-    "magueys",
-    "mahonia",
-    "mahouts",
-    "mahuang",
-    "mahzors",
-    "maidish",
-    "maihems",
-    "mailmen",
-    "maimers",
-    "maiming",
-    "maintop",
-    "majagua",
-    "majorly",
-    "makable",
-    "makeups",
-    "malanga",
-    "malarky",
-    "malates",
-    "malefic",
-    "malices",
-    "maligns",
-    "malines",
-    "malison",
-    "malkins",
-    "mallees",
-    "malleus",
-    "mallows",
-    "malmier",
-    "malmsey",
-    "malodor",
-    "maltase",
-    "malteds",
-    "malthas",
-    "maltier",
-    "maltols",
-    "mamboed",
-    "mamboes",
-    "mameyes",
-    "mamluks",
-    "mammate",
-    "mammati",
-    "mammees",
-    "mammers",
-    "mammets",
-    "mammeys",
-    "mammies",
-    "mammock",
-    "mammons",
-    "mamzers",
-    "manacle",
-    "manakin",
-    "mananas",
-    "manches",
-    "manchet",
-    "mandola",
-    "mandril",
-    "maneges",
-    "mangaby",
-    "mangels",
-    "mangier",
-    "mangily",
-    "mangler",
-    "mangles",
-    "manihot",
-    "manikin",
-    "manilas",
-    "manille",
-    "manioca",
-    "maniocs",
-    "maniple",
-    "manitos",
-    "manitus",
-    "manless",
-    "manlier",
-    "manlike",
-    "manlily",
-    "mannans",
-    "mannish",
-    "mannite",
-    "manpack",
-    "manrope",
-    "mansard",
-    "manteau",
-    "mantids",
-    "mantled",
-    "mantlet",
-    "mantram",
-    "mantrap",
-    "mantric",
-    "mantuas",
-    "manuary",
-    "manumit",
-    "manured",
-    "manurer",
-    "manward",
-    "manwise",
-    "maplike",
-    "maquila",
-    "maranta",
-    "marasca",
-    "marauds",
-    "marbler",
-    "marcato",
-    "marcels",
-    "marchen",
-    "marcher",
-    "maremme",
-    "margays",
-    "margent",
-    "markhor",
-    "markkaa",
-    "markkas",
-    "marlier",
-    "marline",
-    "marling",
-    "marlite",
-    "marmots",
-    "marplot",
-    "marrams",
-    "marrano",
-    "marrers",
-    "marrier",
-    "marring",
-    "marrons",
-    "marrows",
-    "marrowy",
-    "marting",
-    "martlet",
-    "martyry",
-    "masalas",
-    "mascons",
-    "mashers",
-    "mashies",
-    "masjids",
-    "maskegs",
-    "maskers",
-    "masoned",
-    "masquer",
-    "masseur",
-    "massier",
-    "massifs",
-    "mastaba",
-    "mastics",
-    "masting",
-    "mastoid",
-    "matelot",
-    "matiest",
-    "matinal",
-    "matings",
-    "matless",
-    "matrass",
-    "matsahs",
-    "mattery",
-    "mattins",
-    "mattock",
-    "mattoid",
-    "maturer",
-    "matzahs",
-    "matzohs",
-    "matzoon",
-    "matzoth",
-    "maulers",
-    "mauling",
-    "maumets",
-    "maunder",
-    "mavises",
-    "mawkish",
-    "maxilla",
-    "maximin",
-    "maxixes",
-    "maybird",
-    "maybush",
-    "maydays",
-    "mayhems",
-    "mayings",
-    "maypops",
-    "mayvins",
-    "mayweed",
-    "mazards",
-    "mazedly",
-    "maziest",
-    "mazumas",
-    "mazurka",
-    "mazzard",
-    "meadowy",
-    "mealier",
-    "mealies",
-    "meaners",
-    "meanies",
-    "measled",
-    "meatier",
-    "meatily",
-    "meatman",
-    "meatmen",
-    "medakas",
-    "medaled",
-    "meddled",
-    "meddler",
-    "meddles",
-    "medevac",
-    "mediacy",
-    "medials",
-    "mediant",
-    "medicks",
-    "medicos",
-    "medinas",
-    "medivac",
-    "medlars",
-    "medleys",
-    "medusae",
-    "medusal",
-    "medusan",
-    "medusas",
-    "meekest",
-    "meeters",
-    "megabar",
-    "megahit",
-    "megapod",
-    "megaron",
-    "megasse",
-    "megilla",
-    "megilph",
-    "megilps",
-    "megohms",
-    "megrims",
-    "mehndis",
-    "meinies",
-    "meioses",
-    "melamed",
-    "melanic",
-    "melders",
-    "melenas",
-    "melilot",
-    "melisma",
-    "melling",
-    "mellows",
-    "melodia",
-    "meloids",
-    "meltage",
-    "melters",
-    "meltons",
-    "menaced",
-    "menacer",
-    "menaces",
-    "menages",
-    "menazon",
-    "menders",
-    "mendigo",
-    "menfolk",
-    "menhirs",
-    "menials",
-    "menisci",
-    "menschy",
-    "menshen",
-    "menshes",
-    "mensing",
-    "menudos",
-    "meouing",
-    "meowing",
-    "mercers",
-    "mercery",
-    "merches",
-    "mergees",
-    "merinos",
-    "merises",
-    "merisis",
-    "merlins",
-    "merlons",
-    "merlots",
-    "meropia",
-    "meropic",
-    "mesally",
-    "mesarch",
-    "mescals",
-    "mesclun",
-    "meseems",
-    "meshier",
-    "meshuga",
-    "mesonic",
-    "mesquit",
-    "messans",
-    "messily",
-    "messman",
-    "messmen",
-    "mestees",
-    "mesteso",
-    "mestino",
-    "mestiza",
-    "mestizo",
-    "metages",
-    "metaled",
-    "metamer",
-    "metatag",
-    "metates",
-    "metepas",
-    "methyls",
-    "metiers",
-    "metisse",
-    "metonym",
-    "metopae",
-    "metopes",
-    "metopic",
-    "metopon",
-    "metrify",
-    "metring",
-    "metrist",
-    "mettled",
-    "mettles",
-    "metumps",
-    "mewlers",
-    "mewling",
-    "mezcals",
-    "mezquit",
-    "mezuzas",
-    "mezuzot",
-    "miaoued",
-    "miaowed",
-    "miasmal",
-    "miasmas",
-    "miasmic",
-    "miauled",
-    "micella",
-    "micelle",
-    "micells",
-    "miching",
-    "mickeys",
-    "mickler",
-    "mickles",
-    "micrify",
-    "microhm",
-    "midairs",
-    "midcult",
-    "middays",
-    "middens",
-    "middies",
-    "middled",
-    "middler",
-    "middles",
-    "midguts",
-    "midiron",
-    "midlegs",
-    "midlist",
-    "midmost",
-    "midnoon",
-    "midribs",
-    "midriff",
-    "midship",
-    "midways",
-    "miffier",
-    "miffing",
-    "miggles",
-    "mignons",
-    "mihrabs",
-    "mikados",
-    "mikrons",
-    "mikvahs",
-    "mikvehs",
-    "mikvoth",
-    "miladis",
-    "milages",
-    "milchig",
-    "mildens",
-    "mildest",
-    "mildews",
-    "mildewy",
-    "milding",
-    "milfoil",
-    "miliary",
-    "milieus",
-    "milieux",
-    "milkers",
-    "milkier",
-    "milkily",
-    "milkmen",
-    "milksop",
-    "milldam",
-    "millets",
-    "millier",
-    "millime",
-    "milline",
-    "millrun",
-    "milnebs",
-    "milords",
-    "milreis",
-    "milters",
-    "miltier",
-    "milting",
-    "mimbars",
-    "mimeoed",
-    "mimeses",
-    "mimesis",
-    "mimical",
-    "mimosas",
-    "minable",
-    "mincers",
-    "mincier",
-    "mincing",
-    "mingier",
-    "mingler",
-    "mingles",
-    "minicab",
-    "minicam",
-    "minicar",
-    "minikin",
-    "minilab",
-    "minings",
-    "miniski",
-    "miniums",
-    "miniver",
-    "minnies",
-    "minorca",
-    "minored",
-    "mintage",
-    "minters",
-    "mintier",
-    "minting",
-    "minuend",
-    "minuets",
-    "minuted",
-    "minuter",
-    "minutia",
-    "minxish",
-    "minyans",
-    "miotics",
-    "mirages",
-    "mirexes",
-    "miriest",
-    "mirkest",
-    "mirkier",
-    "mirkily",
-    "misacts",
-    "misadds",
-    "misaims",
-    "misally",
-    "misaver",
-    "misbias",
-    "misbill",
-    "misbind",
-    "miscall",
-    "miscast",
-    "miscite",
-    "miscode",
-    "miscoin",
-    "miscook",
-    "miscopy",
-    "miscued",
-    "miscues",
-    "miscuts",
-    "misdate",
-    "misdeal",
-    "misdeed",
-    "misdeem",
-    "misdial",
-    "misdoer",
-    "misdoes",
-    "misdone",
-    "misdraw",
-    "misdrew",
-    "misease",
-    "miseats",
-    "misedit",
-    "miserly",
-    "misfeed",
-    "misfile",
-    "misfire",
-    "misform",
-    "misgave",
-    "misgive",
-    "misgrew",
-    "misgrow",
-    "mishear",
-    "mishits",
-    "misjoin",
-    "miskals",
-    "miskeep",
-    "miskept",
-    "miskick",
-    "misknew",
-    "misknow",
-    "mislaid",
-    "mislain",
-    "mislays",
-    "mislies",
-    "mislike",
-    "mislive",
-    "mismade",
-    "mismake",
-    "mismark",
-    "mismate",
-    "mismeet",
-    "mismove",
-    "misname",
-    "mispage",
-    "mispart",
-    "mispens",
-    "misplan",
-    "misplay",
-    "mispled",
-    "misrate",
-    "misrely",
-    "misrule",
-    "missaid",
-    "missals",
-    "missays",
-    "misseat",
-    "missels",
-    "missend",
-    "missent",
-    "missets",
-    "misshod",
-    "missies",
-    "missort",
-    "missout",
-    "misstep",
-    "misstop",
-    "missuit",
-    "mistbow",
-    "mistend",
-    "misterm",
-    "misters",
-    "misteuk",
-    "mistier",
-    "mistily",
-    "mistime",
-    "mistune",
-    "mistype",
-    "misuser",
-    "misuses",
-    "misword",
-    "miswrit",
-    "misyoke",
-    "mitered",
-    "miterer",
-    "mithers",
-    "mitiest",
-    "mitises",
-    "mitoses",
-    "mitring",
-    "mitsvah",
-    "mixable",
-    "mixedly",
-    "mixible",
-    "mizunas",
-    "mizzens",
-    "mizzled",
-    "mizzles",
-    "moaners",
-    "moanful",
-    "moating",
-    "mobbers",
-    "mobbing",
-    "mobbish",
-    "mobbism",
-    "mobcaps",
-    "mochila",
-    "mockers",
-    "mockups",
-    "modally",
-    "modemed",
-    "modioli",
-    "modiste",
-    "mofette",
-    "moggies",
-    "mogging",
-    "moghuls",
-    "moguled",
-    "mohairs",
-    "mohalim",
-    "mohelim",
-    "moidore",
-    "moilers",
-    "moiling",
-    "moister",
-    "moistly",
-    "mojarra",
-    "moldier",
-    "molests",
-    "mollahs",
-    "mollies",
-    "mollify",
-    "mollusc",
-    "molochs",
-    "molters",
-    "molting",
-    "momisms",
-    "momsers",
-    "momuses",
-    "momzers",
-    "monacid",
-    "monadal",
-    "monades",
-    "monarda",
-    "monaxon",
-    "moneran",
-    "moneyed",
-    "moneyer",
-    "mongoes",
-    "monisms",
-    "monists",
-    "monkery",
-    "monkish",
-    "monocle",
-    "monocot",
-    "monodic",
-    "monoecy",
-    "monofil",
-    "monolog",
-    "monuron",
-    "mooched",
-    "moocher",
-    "mooches",
-    "moodier",
-    "moodily",
-    "moolahs",
-    "mooleys",
-    "moonbow",
-    "mooners",
-    "mooneye",
-    "moonier",
-    "moonily",
-    "mooning",
-    "moonish",
-    "moonlet",
-    "moorage",
-    "moorier",
-    "mooters",
-    "mooting",
-    "mopiest",
-    "mopokes",
-    "moppers",
-    "moppets",
-    "morassy",
-    "morceau",
-    "mordant",
-    "mordent",
-    "moreens",
-    "morelle",
-    "morgens",
-    "morgues",
-    "morions",
-    "morphia",
-    "morphic",
-    "morphin",
-    "morphos",
-    "morrion",
-    "morrows",
-    "mortary",
-    "mortice",
-    "mortify",
-    "morulae",
-    "morular",
-    "morulas",
-    "moseyed",
-    "moshers",
-    "moshing",
-    "mossers",
-    "mossier",
-    "mossing",
-    "mostest",
-    "mothery",
-    "mothier",
-    "motific",
-    "motiles",
-    "motived",
-    "motivic",
-    "motleys",
-    "motlier",
-    "motmots",
-    "motored",
-    "motoric",
-    "mottler",
-    "mottles",
-    "mottoes",
-    "mouched",
-    "mouches",
-    "mouflon",
-    "mouille",
-    "moujiks",
-    "moulage",
-    "moulins",
-    "moulted",
-    "moulter",
-    "mounded",
-    "mounter",
-    "mourner",
-    "mousaka",
-    "mousers",
-    "mousier",
-    "mousily",
-    "mousing",
-    "moussed",
-    "mouther",
-    "moutons",
-    "movably",
-    "moviola",
-    "mowings",
-    "mozetta",
-    "mozette",
-    "muckers",
-    "muckier",
-    "muckily",
-    "muckles",
-    "muclucs",
-    "mucoids",
-    "mucosae",
-    "mucosas",
-    "mucuses",
-    "mudbugs",
-    "mudcaps",
-    "mudcats",
-    "mudders",
-    "muddied",
-    "muddier",
-    "muddies",
-    "muddily",
-    "mudding",
-    "muddler",
-    "muddles",
-    "mudfish",
-    "mudflap",
-    "mudflat",
-    "mudflow",
-    "mudhens",
-    "mudhole",
-    "mudlark",
-    "mudpack",
-    "mudrock",
-    "mudroom",
-    "mudsill",
-    "mueddin",
-    "mueslis",
-    "muezzin",
-    "muffing",
-    "muffles",
-    "mugfuls",
-    "muggars",
-    "muggees",
-    "muggers",
-    "muggier",
-    "muggily",
-    "muggins",
-    "muggurs",
-    "mughals",
-    "mugwort",
-    "mugwump",
-    "muhlies",
-    "mukluks",
-    "muktuks",
-    "mulched",
-    "mulcted",
-    "muletas",
-    "mullein",
-    "mullens",
-    "mullers",
-    "mulleys",
-    "mullion",
-    "mullite",
-    "mullock",
-    "multure",
-    "mumbler",
-    "mummers",
-    "mummery",
-    "mummied",
-    "mummify",
-    "mumming",
-    "mumpers",
-    "mumping",
-    "munched",
-    "muncher",
-    "munches",
-    "mungoes",
-    "munnion",
-    "munting",
-    "muntins",
-    "muntjac",
-    "muntjak",
-    "muonium",
-    "muraled",
-    "mureins",
-    "murexes",
-    "muriate",
-    "murices",
-    "murines",
-    "murkest",
-    "murkier",
-    "murkily",
-    "murrain",
-    "murreys",
-    "murrhas",
-    "murries",
-    "murrine",
-    "murther",
-    "muscats",
-    "muscids",
-    "museful",
-    "musette",
-    "mushers",
-    "mushier",
-    "mushily",
-    "mushing",
-    "musicks",
-    "musjids",
-    "muskegs",
-    "muskier",
-    "muskies",
-    "muskily",
-    "muskits",
-    "muslins",
-    "muspike",
-    "mussier",
-    "mussily",
-    "mussing",
-    "mustees",
-    "musters",
-    "mustier",
-    "mustily",
-    "musting",
-    "mutably",
-    "mutases",
-    "mutates",
-    "mutches",
-    "mutedly",
-    "mutined",
-    "mutines",
-    "mutisms",
-    "muttons",
-    "muttony",
-    "mutuals",
-    "mutuels",
-    "mutular",
-    "mutules",
-    "muumuus",
-    "muzhiks",
-    "muzjiks",
-    "muzzier",
-    "muzzily",
-    "muzzled",
-    "muzzler",
-    "muzzles",
-    "myalgia",
-    "myalgic",
-    "myceles",
-    "mycelia",
-    "mycoses",
-    "mycosis",
-    "mycotic",
-    "myeline",
-    "myelins",
-    "myiases",
-    "myiasis",
-    "mynheer",
-    "myology",
-    "myomata",
-    "myopias",
-    "myopies",
-    "myosins",
-    "myosote",
-    "myotics",
-    "myotome",
-    "myricas",
-    "myrrhic",
-    "myrtles",
-    "mysosts",
-    "mystify",
-    "mythier",
-    "myxomas",
-    "nabbers",
-    "nabbing",
-    "nacelle",
-    "nadiral",
-    "naevoid",
-    "naffing",
-    "naganas",
-    "naggers",
-    "naggier",
-    "naiades",
-    "nailset",
-    "naivest",
-    "naivete",
-    "naivety",
-    "nakeder",
-    "nakedly",
-    "namable",
-    "nametag",
-    "nancies",
-    "nandina",
-    "nandins",
-    "nanisms",
-    "nankeen",
-    "nankins",
-    "napalms",
-    "naphtol",
-    "napless",
-    "nappers",
-    "nappier",
-    "narcein",
-    "narcism",
-    "narcist",
-    "narcoma",
-    "narcose",
-    "nardine",
-    "nargile",
-    "narking",
-    "narthex",
-    "narwals",
-    "nasally",
-    "nasions",
-    "nastier",
-    "nastily",
-    "natrium",
-    "natrons",
-    "natters",
-    "nattier",
-    "nattily",
-    "naughts",
-    "nauplii",
-    "nauseas",
-    "nautili",
-    "navaids",
-    "navally",
-    "navette",
-    "navvies",
-    "naysaid",
-    "naysays",
-    "neatens",
-    "neatest",
-    "neatnik",
-    "nebbish",
-    "nebular",
-    "nebulas",
-    "neckers",
-    "necking",
-    "necrose",
-    "nectars",
-    "nectary",
-    "neddies",
-    "needers",
-    "needier",
-    "needily",
-    "needled",
-    "needler",
-    "negater",
-    "negaton",
-    "negator",
-    "neglige",
-    "negroid",
-    "negroni",
-    "neguses",
-    "neighed",
-    "nektons",
-    "nellies",
-    "nelumbo",
-    "nemeses",
-    "neogene",
-    "neolith",
-    "neology",
-    "neoteny",
-    "neotype",
-    "nepetas",
-    "nephric",
-    "nephron",
-    "nepotic",
-    "nerdier",
-    "nerdish",
-    "nereids",
-    "neritic",
-    "nerolis",
-    "nervate",
-    "nervier",
-    "nervily",
-    "nervine",
-    "nerving",
-    "nervule",
-    "nervure",
-    "nesters",
-    "nestler",
-    "nestors",
-    "netless",
-    "netlike",
-    "netters",
-    "nettier",
-    "nettled",
-    "nettler",
-    "neurine",
-    "neuroid",
-    "neurone",
-    "neurula",
-    "neustic",
-    "neuston",
-    "neuters",
-    "newmown",
-    "newsboy",
-    "newsier",
-    "newsies",
-    "newsmen",
-    "nexuses",
-    "niacins",
-    "nibbing",
-    "nibbled",
-    "nibbler",
-    "niblick",
-    "niblike",
-    "niching",
-    "nickers",
-    "nicking",
-    "nickled",
-    "nicoise",
-    "nicotin",
-    "nictate",
-    "nidated",
-    "nidates",
-    "nidgets",
-    "niduses",
-    "niellos",
-    "niffers",
-    "niftier",
-    "nifties",
-    "niftily",
-    "niggard",
-    "niggled",
-    "niggler",
-    "niggles",
-    "nighest",
-    "nighing",
-    "nigrify",
-    "nilgais",
-    "nilgaus",
-    "nilghai",
-    "nilghau",
-    "nilling",
-    "nimbler",
-    "nimiety",
-    "nimious",
-    "nimming",
-    "nimrods",
-    "ninepin",
-    "ninnies",
-    "ninthly",
-    "niobate",
-    "niobite",
-    "niobous",
-    "nippers",
-    "nippier",
-    "nippily",
-    "nippled",
-    "nitchie",
-    "niterie",
-    "nitinol",
-    "nitpick",
-    "nitrids",
-    "nitrify",
-    "nitrils",
-    "nitroso",
-    "nittier",
-    "nitwits",
-    "niveous",
-    "nobbier",
-    "nobbily",
-    "nobbled",
-    "nobbler",
-    "nobbles",
-    "nocking",
-    "noctuid",
-    "noctule",
-    "nocturn",
-    "nocuous",
-    "nodally",
-    "nodders",
-    "noddies",
-    "noddled",
-    "noddles",
-    "nodical",
-    "nogging",
-    "noggins",
-    "noirish",
-    "noisier",
-    "noising",
-    "noisome",
-    "nomarch",
-    "nombles",
-    "nombril",
-    "nomisms",
-    "nonacid",
-    "nonages",
-    "nonagon",
-    "nonarts",
-    "nonbank",
-    "nonbody",
-    "nonbook",
-    "noncola",
-    "noncoms",
-    "noncore",
-    "nondrip",
-    "nondrug",
-    "nonegos",
-    "nonfact",
-    "nonfans",
-    "nonfood",
-    "nonfuel",
-    "nongame",
-    "nongays",
-    "nonheme",
-    "nonhero",
-    "nonhome",
-    "noniron",
-    "nonjury",
-    "nonlife",
-    "nonmeat",
-    "nonnews",
-    "nonoily",
-    "nonoral",
-    "nonpaid",
-    "nonpast",
-    "nonpeak",
-    "nonplay",
-    "nonplus",
-    "nonpoor",
-    "nonpros",
-    "nonself",
-    "nonsked",
-    "nonskid",
-    "nonslip",
-    "nonsuch",
-    "nonsuit",
-    "nonuple",
-    "nonuser",
-    "nonuses",
-    "nonwage",
-    "nonwars",
-    "nonwool",
-    "nonword",
-    "nonwork",
-    "noodged",
-    "noodges",
-    "noodled",
-    "noogies",
-    "nookies",
-    "nooning",
-    "noosers",
-    "noosing",
-    "nopales",
-    "noplace",
-    "norites",
-    "noritic",
-    "norland",
-    "norther",
-    "nosebag",
-    "nosegay",
-    "noshers",
-    "noshing",
-    "nosiest",
-    "nosings",
-    "nostocs",
-    "notated",
-    "notates",
-    "notcher",
-    "notedly",
-    "noticer",
-    "nougats",
-    "noughts",
-    "noumena",
-    "novelle",
-    "novelly",
-    "novenae",
-    "novenas",
-    "nowness",
-    "noyades",
-    "nubbier",
-    "nubbins",
-    "nubbles",
-    "nubucks",
-    "nucelli",
-    "nuchals",
-    "nucleal",
-    "nuclein",
-    "nudgers",
-    "nudisms",
-    "nudnick",
-    "nudniks",
-    "nudzhed",
-    "nudzhes",
-    "nuggety",
-    "nullahs",
-    "nulling",
-    "numbats",
-    "numbest",
-    "numbles",
-    "nummary",
-    "nunatak",
-    "nuncios",
-    "nuncles",
-    "nunlike",
-    "nunnish",
-    "nurling",
-    "nursers",
-    "nutated",
-    "nutates",
-    "nutgall",
-    "nutlets",
-    "nutlike",
-    "nutmeat",
-    "nutmegs",
-    "nutpick",
-    "nutrias",
-    "nutsier",
-    "nuttier",
-    "nuttily",
-    "nutwood",
-    "nuzzled",
-    "nuzzler",
-    "nuzzles",
-    "nylghai",
-    "nylghau",
-    "nymphae",
-    "nymphal",
-    "oakiest",
-    "oaklike",
-    "oakmoss",
-    "oarfish",
-    "oarless",
-    "oarlike",
-    "oarlock",
-    "oarsman",
-    "oarsmen",
-    "oatcake",
-    "oatlike",
-    "obconic",
-    "obelias",
-    "obelise",
-    "obelism",
-    "obelize",
-    "obentos",
-    "obesely",
-    "obeyers",
-    "obiisms",
-    "oblasti",
-    "oblasts",
-    "oblates",
-    "obliger",
-    "oblongs",
-    "obloquy",
-    "oboists",
-    "obovate",
-    "obovoid",
-    "obsequy",
-    "obtests",
-    "obtrude",
-    "obtunds",
-    "obtuser",
-    "obverts",
-    "occiput",
-    "occlude",
-    "occults",
-    "ocellar",
-    "ocellus",
-    "oceloid",
-    "ocelots",
-    "ochered",
-    "ochreae",
-    "ochring",
-    "ochroid",
-    "ochrous",
-    "ocicats",
-    "ocreate",
-    "octadic",
-    "octanes",
-    "octanol",
-    "octants",
-    "octaval",
-    "octavos",
-    "octette",
-    "octopod",
-    "octrois",
-    "octuple",
-    "octuply",
-    "oculars",
-    "oculist",
-    "odalisk",
-    "oddment",
-    "oddness",
-    "odonate",
-    "odorful",
-    "odorize",
-    "odorous",
-    "oedemas",
-    "oedipal",
-    "oenomel",
-    "oersted",
-    "oestrin",
-    "oestrum",
-    "oestrus",
-    "offcast",
-    "offcuts",
-    "offerer",
-    "offings",
-    "offramp",
-    "oftener",
-    "ogdoads",
-    "oghamic",
-    "ogreish",
-    "ogreism",
-    "ogrisms",
-    "ohmages",
-    "oidioid",
-    "oilbird",
-    "oilcamp",
-    "oilcans",
-    "oilcups",
-    "oilhole",
-    "oiliest",
-    "oilskin",
-    "oilways",
-    "oinking",
-    "oinomel",
-    "okaying",
-    "oldness",
-    "oldster",
-    "oldwife",
-    "oleates",
-    "olefine",
-    "oleines",
-    "olestra",
-    "olicook",
-    "olingos",
-    "olivary",
-    "ologies",
-    "ologist",
-    "oloroso",
-    "omening",
-    "omental",
-    "omentum",
-    "omikron",
-    "omitter",
-    "omnific",
-    "omphali",
-    "onagers",
-    "onanism",
-    "onanist",
-    "onefold",
-    "oneiric",
-    "onerier",
-    "onloads",
-    "oocysts",
-    "oodlins",
-    "oogonia",
-    "oolites",
-    "ooliths",
-    "oolitic",
-    "oologic",
-    "oolongs",
-    "oomiack",
-    "oomiacs",
-    "oomiaks",
-    "oompahs",
-    "oophyte",
-    "ooralis",
-    "oosperm",
-    "oospore",
-    "ootheca",
-    "ooziest",
-    "opacify",
-    "opaline",
-    "opaqued",
-    "opaquer",
-    "opaques",
-    "openest",
-    "operons",
-    "operose",
-    "ophites",
-    "ophitic",
-    "opiated",
-    "opining",
-    "oppidan",
-    "opposer",
-    "oppugns",
-    "opsonic",
-    "opsonin",
-    "optimes",
-    "oquassa",
-    "oraches",
-    "oralism",
-    "oralist",
-    "orality",
-    "orangey",
-    "orating",
-    "orators",
-    "oratrix",
-    "orbiest",
-    "orbited",
-    "orbless",
-    "orceins",
-    "orchils",
-    "orcinol",
-    "ordains",
-    "ordeals",
-    "orderer",
-    "ordines",
-    "ordures",
-    "orectic",
-    "oreides",
-    "orfrays",
-    "organdy",
-    "organum",
-    "orgeats",
-    "orgiast",
-    "orgones",
-    "orients",
-    "origans",
-    "orishas",
-    "orisons",
-    "ormolus",
-    "orogeny",
-    "oroides",
-    "orology",
-    "orotund",
-    "orphism",
-    "orphrey",
-    "orpines",
-    "orrices",
-    "orrises",
-    "ortolan",
-    "oscines",
-    "oscular",
-    "oscules",
-    "osculum",
-    "osetras",
-    "osiered",
-    "osmatic",
-    "osmious",
-    "osmiums",
-    "osmolal",
-    "osmolar",
-    "osmoles",
-    "osmosed",
-    "osmoses",
-    "osmunda",
-    "osmunds",
-    "osseins",
-    "osseous",
-    "ossetra",
-    "ossicle",
-    "ossific",
-    "ossuary",
-    "osteoid",
-    "osteoma",
-    "ostiary",
-    "ostiole",
-    "ostlers",
-    "ostmark",
-    "ostoses",
-    "ostosis",
-    "ostraca",
-    "ostraka",
-    "otalgia",
-    "otalgic",
-    "otocyst",
-    "otolith",
-    "otology",
-    "ottavas",
-    "ouabain",
-    "ouching",
-    "oughted",
-    "ourangs",
-    "ouraris",
-    "ourebis",
-    "ousters",
-    "outacts",
-    "outadds",
-    "outasks",
-    "outbake",
-    "outbark",
-    "outbawl",
-    "outbeam",
-    "outbegs",
-    "outbids",
-    "outbrag",
-    "outbred",
-    "outbulk",
-    "outburn",
-    "outbuys",
-    "outchid",
-    "outcity",
-    "outcook",
-    "outcrow",
-    "outdare",
-    "outdate",
-    "outdoer",
-    "outdoes",
-    "outdrag",
-    "outdrew",
-    "outdrop",
-    "outduel",
-    "outearn",
-    "outeats",
-    "outecho",
-    "outface",
-    "outfast",
-    "outfawn",
-    "outfeel",
-    "outfelt",
-    "outfind",
-    "outfire",
-    "outfish",
-    "outflew",
-    "outfool",
-    "outfoot",
-    "outgain",
-    "outgave",
-    "outgaze",
-    "outgive",
-    "outglow",
-    "outgnaw",
-    "outgoes",
-    "outgone",
-    "outgrew",
-    "outgrin",
-    "outguns",
-    "outgush",
-    "outhaul",
-    "outhear",
-    "outhits",
-    "outhowl",
-    "outhunt",
-    "outjinx",
-    "outjump",
-    "outjuts",
-    "outkeep",
-    "outkept",
-    "outkick",
-    "outkill",
-    "outkiss",
-    "outlaid",
-    "outlain",
-    "outlead",
-    "outleap",
-    "outlies",
-    "outlove",
-    "outmans",
-    "outmode",
-    "outmost",
-    "outmove",
-    "outpass",
-    "outpity",
-    "outplan",
-    "outplay",
-    "outplod",
-    "outplot",
-    "outpoll",
-    "outport",
-    "outpour",
-    "outpray",
-    "outpull",
-    "outpush",
-    "outrace",
-    "outrang",
-    "outrank",
-    "outrate",
-    "outrave",
-    "outread",
-    "outride",
-    "outrigs",
-    "outring",
-    "outroar",
-    "outrock",
-    "outrode",
-    "outroll",
-    "outroot",
-    "outrows",
-    "outrung",
-    "outruns",
-    "outrush",
-    "outsaid",
-    "outsail",
-    "outsang",
-    "outsays",
-    "outseen",
-    "outsees",
-    "outsert",
-    "outsets",
-    "outshot",
-    "outsing",
-    "outsins",
-    "outsits",
-    "outsize",
-    "outsoar",
-    "outsold",
-    "outspan",
-    "outsped",
-    "outstay",
-    "outsulk",
-    "outsung",
-    "outswam",
-    "outswim",
-    "outswum",
-    "outtake",
-    "outtalk",
-    "outtask",
-    "outtell",
-    "outtold",
-    "outtrot",
-    "outvied",
-    "outvies",
-    "outvote",
-    "outwait",
-    "outwalk",
-    "outwars",
-    "outwash",
-    "outwear",
-    "outweep",
-    "outwent",
-    "outwept",
-    "outwile",
-    "outwill",
-    "outwind",
-    "outwish",
-    "outwits",
-    "outwore",
-    "outwork",
-    "outworn",
-    "outwrit",
-    "outyell",
-    "outyelp",
-    "ovality",
-    "ovarial",
-    "ovately",
-    "overact",
-    "overapt",
-    "overarm",
-    "overate",
-    "overawe",
-    "overbed",
-    "overbet",
-    "overbid",
-    "overbig",
-    "overbuy",
-    "overcoy",
-    "overcut",
-    "overdid",
-    "overdog",
-    "overdry",
-    "overdub",
-    "overdye",
-    "overeat",
-    "overfar",
-    "overfat",
-    "overfed",
-    "overfit",
-    "overfly",
-    "overhot",
-    "overing",
-    "overjoy",
-    "overlax",
-    "overlet",
-    "overlie",
-    "overlit",
-    "overmen",
-    "overmix",
-    "overnew",
-    "overpay",
-    "overply",
-    "overran",
-    "oversad",
-    "overset",
-    "oversew",
-    "oversup",
-    "overtax",
-    "overtip",
-    "overtop",
-    "overwet",
-    "ovicide",
-    "oviduct",
-    "oviform",
-    "ovipara",
-    "ovisacs",
-    "ovoidal",
-    "ovonics",
-    "ovulary",
-    "ovulate",
-    "owllike",
-    "ownable",
-    "oxazine",
-    "oxblood",
-    "oxcarts",
-    "oxheart",
-    "oxidate",
-    "oxidise",
-    "oxtails",
-    "oxyacid",
-    "oxygens",
-    "oxymora",
-    "oxyphil",
-    "oxysalt",
-    "oxysome",
-    "oxytone",
-    "oyesses",
-    "ozalids",
-    "ozonate",
-    "ozonide",
-    "ozonise",
-    "ozonize",
-    "ozonous",
-    "pablums",
-    "pabular",
-    "pabulum",
-    "pachisi",
-    "pachuco",
-    "paciest",
-    "packmen",
-    "packwax",
-    "paction",
-    "padauks",
-    "padders",
-    "paddies",
-    "padnags",
-    "padouks",
-    "padrone",
-    "padroni",
-    "padshah",
-    "paellas",
-    "paesani",
-    "paesano",
-    "paesans",
-    "pageboy",
-    "pageful",
-    "paginal",
-    "pagings",
-    "pagurid",
-    "pahlavi",
-    "paiking",
-    "pailful",
-    "paining",
-    "paisana",
-    "paisano",
-    "paisans",
-    "pakehas",
-    "pakoras",
-    "palaced",
-    "palapas",
-    "palatal",
-    "palates",
-    "palaver",
-    "palazzi",
-    "paleate",
-    "paletot",
-    "paliest",
-    "palikar",
-    "palings",
-    "pallial",
-    "pallier",
-    "palling",
-    "pallium",
-    "pallors",
-    "palmary",
-    "palmate",
-    "palmful",
-    "palmier",
-    "palming",
-    "palmist",
-    "palooka",
-    "palpate",
-    "palping",
-    "palship",
-    "palsied",
-    "palsies",
-    "palters",
-    "paludal",
-    "pampean",
-    "pampero",
-    "panadas",
-    "panamas",
-    "panchax",
-    "pandani",
-    "pandect",
-    "panders",
-    "pandied",
-    "pandies",
-    "pandits",
-    "pandoor",
-    "pandore",
-    "pandour",
-    "pandura",
-    "panfish",
-    "panfuls",
-    "pangene",
-    "pangens",
-    "panging",
-    "pangram",
-    "panicky",
-    "panicle",
-    "paniers",
-    "panners",
-    "panocha",
-    "panoche",
-    "panpipe",
-    "pantile",
-    "pantoum",
-    "papadam",
-    "papadom",
-    "papadum",
-    "papains",
-    "papally",
-    "papayan",
-    "papayas",
-    "papered",
-    "paperer",
-    "paphian",
-    "papilla",
-    "papisms",
-    "papists",
-    "papoose",
-    "pappier",
-    "pappies",
-    "pappose",
-    "pappous",
-    "paprica",
-    "papulae",
-    "papular",
-    "papules",
-    "papyral",
-    "parader",
-    "parados",
-    "paramos",
-    "parangs",
-    "paraphs",
-    "parbake",
-    "parboil",
-    "parches",
-    "pardahs",
-    "pardine",
-    "pardner",
-    "pareira",
-    "parerga",
-    "pareses",
-    "paresis",
-    "paretic",
-    "pargets",
-    "parging",
-    "pariahs",
-    "parians",
-    "parings",
-    "parises",
-    "parkade",
-    "parlays",
-    "parleys",
-    "parling",
-    "parlous",
-    "parodic",
-    "parodoi",
-    "parodos",
-    "parolee",
-    "paronym",
-    "parotic",
-    "parrals",
-    "parrels",
-    "parried",
-    "parrier",
-    "parries",
-    "parring",
-    "parroty",
-    "parsecs",
-    "partans",
-    "partier",
-    "partite",
-    "partlet",
-    "partons",
-    "partook",
-    "partway",
-    "partyer",
-    "paruras",
-    "parures",
-    "parvenu",
-    "parvise",
-    "pascals",
-    "pashing",
-    "pasquil",
-    "passade",
-    "passado",
-    "passant",
-    "passels",
-    "passkey",
-    "pastern",
-    "pasters",
-    "pasteup",
-    "pastier",
-    "pastils",
-    "pastina",
-    "patacas",
-    "patagia",
-    "patamar",
-    "patcher",
-    "patinae",
-    "patinas",
-    "patined",
-    "patines",
-    "patness",
-    "patroon",
-    "patsies",
-    "pattens",
-    "patters",
-    "patzers",
-    "paughty",
-    "paulins",
-    "paunchy",
-    "paupers",
-    "pausers",
-    "pavanes",
-    "pavings",
-    "paviors",
-    "paviour",
-    "paviser",
-    "pavises",
-    "pavisse",
-    "pawkier",
-    "pawkily",
-    "pawnage",
-    "pawnees",
-    "pawners",
-    "pawning",
-    "pawnors",
-    "pawpaws",
-    "payably",
-    "paydays",
-    "paynims",
-    "payolas",
-    "peached",
-    "peacher",
-    "peacing",
-    "peacoat",
-    "peafowl",
-    "peahens",
-    "peakier",
-    "peakish",
-    "pealike",
-    "pealing",
-    "pearled",
-    "pearler",
-    "pearter",
-    "peartly",
-    "peascod",
-    "peatier",
-    "peaveys",
-    "peavies",
-    "pebbled",
-    "peccant",
-    "peccary",
-    "peccavi",
-    "pechans",
-    "peching",
-    "peckers",
-    "peckier",
-    "peckish",
-    "pectase",
-    "pectate",
-    "pectens",
-    "pectins",
-    "pectize",
-    "peculia",
-    "pedagog",
-    "pedaled",
-    "pedaler",
-    "pedalos",
-    "pedants",
-    "peddled",
-    "peddles",
-    "pedicab",
-    "pedicel",
-    "pedicle",
-    "pedlars",
-    "pedlary",
-    "pedlers",
-    "pedlery",
-    "pedocal",
-    "peebeen",
-    "peelers",
-    "peening",
-    "peepuls",
-    "peeress",
-    "peeries",
-    "peeving",
-    "peevish",
-    "peewees",
-    "peewits",
-    "pegless",
-    "peglike",
-    "peining",
-    "peising",
-    "pekepoo",
-    "pelages",
-    "pelisse",
-    "pelites",
-    "pelitic",
-    "pelmets",
-    "peloria",
-    "peloric",
-    "pelorus",
-    "pelotas",
-    "peltast",
-    "peltate",
-    "pelters",
-    "pelting",
-    "pelvics",
-    "pemican",
-    "pemphix",
-    "penally",
-    "penangs",
-    "penates",
-    "pencels",
-    "penicil",
-    "penlite",
-    "penname",
-    "pennate",
-    "penners",
-    "pennons",
-    "penoche",
-    "pensees",
-    "pensile",
-    "pensils",
-    "penster",
-    "pentads",
-    "pentane",
-    "pentene",
-    "pentode",
-    "pentose",
-    "pentyls",
-    "penuche",
-    "penuchi",
-    "penults",
-    "peonage",
-    "peonism",
-    "peopler",
-    "pepinos",
-    "peplums",
-    "peppier",
-    "peppily",
-    "pepping",
-    "pepsine",
-    "pepsins",
-    "peptalk",
-    "peptics",
-    "peptids",
-    "peptize",
-    "peptone",
-    "peracid",
-    "percher",
-    "percoid",
-    "percuss",
-    "perdues",
-    "perdure",
-    "pereion",
-    "pereons",
-    "perfumy",
-    "perfuse",
-    "periapt",
-    "peridia",
-    "perigon",
-    "periled",
-    "perilla",
-    "perinea",
-    "perique",
-    "peritus",
-    "periwig",
-    "perjure",
-    "perkier",
-    "perkily",
-    "perking",
-    "perkish",
-    "perming",
-    "permute",
-    "pernods",
-    "peroral",
-    "peroxid",
-    "perpend",
-    "perpent",
-    "perries",
-    "perrons",
-    "persalt",
-    "pertest",
-    "perturb",
-    "peruked",
-    "perukes",
-    "peruser",
-    "peruses",
-    "pesades",
-    "pesewas",
-    "peskier",
-    "peskily",
-    "pessary",
-    "pesters",
-    "pestier",
-    "pestled",
-    "pestles",
-    "petaled",
-    "petards",
-    "petasos",
-    "petasus",
-    "petcock",
-    "petered",
-    "petnaps",
-    "petrale",
-    "petrels",
-    "petrify",
-    "petrols",
-    "petrous",
-    "petsais",
-    "petters",
-    "pettier",
-    "pettily",
-    "pettish",
-    "pettled",
-    "pettles",
-    "pewters",
-    "peyotes",
-    "peyotls",
-    "peytral",
-    "peytrel",
-    "phaseal",
-    "phasmid",
-    "phatter",
-    "phellem",
-    "phenate",
-    "phenoms",
-    "phenoxy",
-    "phenyls",
-    "philter",
-    "philtra",
-    "philtre",
-    "phlegms",
-    "phlegmy",
-    "phloems",
-    "phloxes",
-    "phobics",
-    "phocine",
-    "phoebes",
-    "phonate",
-    "phoneys",
-    "phonied",
-    "phonier",
-    "phonies",
-    "phonily",
-    "phorate",
-    "phoresy",
-    "photics",
-    "photoed",
-    "photogs",
-    "phratry",
-    "phreaks",
-    "phrenic",
-    "phrensy",
-    "phyllos",
-    "physeds",
-    "phytane",
-    "phytins",
-    "phytoid",
-    "phytols",
-    "phytons",
-    "piaffed",
-    "piaffer",
-    "piaffes",
-    "pianism",
-    "piasaba",
-    "piasava",
-    "piaster",
-    "piastre",
-    "piazzas",
-    "pibroch",
-    "picacho",
-    "picaras",
-    "picaros",
-    "piccata",
-    "piceous",
-    "pickaxe",
-    "pickeer",
-    "pickier",
-    "pickoff",
-    "picolin",
-    "picoted",
-    "picotee",
-    "picquet",
-    "picrate",
-    "picrite",
-    "piddled",
-    "piddler",
-    "piddles",
-    "piddock",
-    "pidgins",
-    "piebald",
-    "piecers",
-    "piefort",
-    "piehole",
-    "piercer",
-    "pierces",
-    "pierogi",
-    "pieties",
-    "pietism",
-    "pietist",
-    "piffled",
-    "piffles",
-    "pigboat",
-    "pigfish",
-    "piggery",
-    "piggier",
-    "pigging",
-    "piggins",
-    "piggish",
-    "piglike",
-    "pigmies",
-    "pignoli",
-    "pignora",
-    "pignuts",
-    "pigouts",
-    "pigpens",
-    "pigsney",
-    "pikakes",
-    "pikeman",
-    "pikemen",
-    "pilaffs",
-    "pileate",
-    "pileous",
-    "pileups",
-    "pilfers",
-    "pillbox",
-    "pillion",
-    "pillory",
-    "pillowy",
-    "pilular",
-    "pilules",
-    "pimento",
-    "pimpled",
-    "pinangs",
-    "pinbone",
-    "pincers",
-    "pinders",
-    "pineals",
-    "pinenes",
-    "pinesap",
-    "pinetum",
-    "pinfish",
-    "pinfold",
-    "pingers",
-    "pingoes",
-    "pinguid",
-    "piniest",
-    "pinions",
-    "pinites",
-    "pinitol",
-    "pinkens",
-    "pinkers",
-    "pinkest",
-    "pinkeye",
-    "pinkeys",
-    "pinkies",
-    "pinking",
-    "pinkoes",
-    "pinnace",
-    "pinnate",
-    "pinners",
-    "pinnies",
-    "pinnula",
-    "pinnule",
-    "pinocle",
-    "pinoles",
-    "pinones",
-    "pintada",
-    "pintado",
-    "pintano",
-    "pintles",
-    "pintoes",
-    "pinwale",
-    "pinweed",
-    "pinwork",
-    "pinworm",
-    "pinyons",
-    "piolets",
-    "piosity",
-    "piously",
-    "pipages",
-    "pipeage",
-    "pipeful",
-    "pipiest",
-    "pipings",
-    "pipkins",
-    "pipping",
-    "pippins",
-    "piquant",
-    "piquets",
-    "piquing",
-    "piragua",
-    "piranas",
-    "piratic",
-    "pirayas",
-    "pirogen",
-    "piroghi",
-    "pirogue",
-    "pirojki",
-    "piroque",
-    "piscary",
-    "pishers",
-    "pishing",
-    "pishoge",
-    "pismire",
-    "pissant",
-    "pissers",
-    "pissoir",
-    "pistils",
-    "pistole",
-    "pistous",
-    "pitapat",
-    "pitayas",
-    "pithead",
-    "pithier",
-    "pithily",
-    "pithing",
-    "pitiers",
-    "pitmans",
-    "pitsaws",
-    "pivoted",
-    "pixyish",
-    "pizazzy",
-    "pizzles",
-    "placers",
-    "placets",
-    "placoid",
-    "plafond",
-    "plaguer",
-    "plaguey",
-    "plaices",
-    "plaided",
-    "plained",
-    "plainer",
-    "plaints",
-    "plaited",
-    "plaiter",
-    "planate",
-    "planche",
-    "planish",
-    "planked",
-    "planula",
-    "plashed",
-    "plasher",
-    "plashes",
-    "plasmic",
-    "plasmin",
-    "platane",
-    "platans",
-    "platens",
-    "platers",
-    "platier",
-    "platies",
-    "platina",
-    "platypi",
-    "plaudit",
-    "playact",
-    "playday",
-    "playlet",
-    "pleader",
-    "pleater",
-    "plectra",
-    "pledgee",
-    "pledger",
-    "pledget",
-    "pledgor",
-    "pleiads",
-    "plenish",
-    "plenism",
-    "plenist",
-    "plenums",
-    "pleonal",
-    "pleonic",
-    "pleopod",
-    "plessor",
-    "pleurae",
-    "pleuras",
-    "pleuron",
-    "plexors",
-    "pliably",
-    "pliancy",
-    "plicate",
-    "plights",
-    "plimsol",
-    "plinked",
-    "plinker",
-    "plinths",
-    "pliskie",
-    "plisses",
-    "plodded",
-    "plodder",
-    "plonked",
-    "plopped",
-    "plosion",
-    "plosive",
-    "plotzed",
-    "plotzes",
-    "ploughs",
-    "plowboy",
-    "plowers",
-    "plowmen",
-    "ploying",
-    "plugger",
-    "plugola",
-    "plumate",
-    "plumbic",
-    "plumbum",
-    "plumier",
-    "pluming",
-    "plumose",
-    "plumped",
-    "plumpen",
-    "plumply",
-    "plumule",
-    "plunked",
-    "plunker",
-    "plusher",
-    "plushes",
-    "plushly",
-    "plusses",
-    "pluteus",
-    "plutons",
-    "pluvial",
-    "pluvian",
-    "pneumas",
-    "poaches",
-    "poblano",
-    "pochard",
-    "pockier",
-    "pockily",
-    "pocking",
-    "pocosen",
-    "pocosin",
-    "pocoson",
-    "podagra",
-    "podding",
-    "podesta",
-    "podgier",
-    "podgily",
-    "podites",
-    "poditic",
-    "podlike",
-    "podsols",
-    "podzols",
-    "poesies",
-    "poetess",
-    "poetise",
-    "poetize",
-    "pogonia",
-    "pogonip",
-    "pogroms",
-    "poinded",
-    "pointes",
-    "poisers",
-    "poising",
-    "poitrel",
-    "pokable",
-    "pokiest",
-    "polaron",
-    "polders",
-    "poleaxe",
-    "polecat",
-    "poleyns",
-    "policer",
-    "politer",
-    "polkaed",
-    "pollees",
-    "pollens",
-    "pollers",
-    "pollist",
-    "poloist",
-    "polycot",
-    "polyene",
-    "polynya",
-    "polynyi",
-    "polyols",
-    "polyoma",
-    "polyped",
-    "polypod",
-    "polypus",
-    "pomaces",
-    "pomaded",
-    "pomades",
-    "pomatum",
-    "pomelos",
-    "pommels",
-    "pommies",
-    "pompoms",
-    "pompons",
-    "poncing",
-    "ponding",
-    "pongees",
-    "pongids",
-    "ponging",
-    "poniard",
-    "pontils",
-    "pontine",
-    "pontons",
-    "ponying",
-    "pooched",
-    "pooches",
-    "pooftah",
-    "poofter",
-    "poohing",
-    "poolers",
-    "poorish",
-    "popedom",
-    "popeyed",
-    "popguns",
-    "poplins",
-    "popover",
-    "poppets",
-    "poppied",
-    "poppled",
-    "popples",
-    "popsies",
-    "porcino",
-    "porgies",
-    "porisms",
-    "porkers",
-    "porkier",
-    "porkies",
-    "porking",
-    "porkpie",
-    "pornier",
-    "porrect",
-    "portend",
-    "posable",
-    "poseurs",
-    "poshest",
-    "posoles",
-    "possets",
-    "postals",
-    "postbag",
-    "postbox",
-    "postboy",
-    "posteen",
-    "postern",
-    "posties",
-    "postins",
-    "postmen",
-    "postops",
-    "posttax",
-    "potages",
-    "potamic",
-    "potboil",
-    "potboys",
-    "poteens",
-    "potence",
-    "potfuls",
-    "pothead",
-    "potheen",
-    "potherb",
-    "pothers",
-    "pothook",
-    "potiche",
-    "potlach",
-    "potlike",
-    "potline",
-    "potpies",
-    "potshot",
-    "potsies",
-    "pottage",
-    "potteen",
-    "pottier",
-    "potties",
-    "pottles",
-    "potzers",
-    "pouched",
-    "pouffed",
-    "pouffes",
-    "poulard",
-    "poulter",
-    "pouncer",
-    "pounces",
-    "poundal",
-    "pourers",
-    "poussie",
-    "pouters",
-    "poutful",
-    "poutier",
-    "poutine",
-    "powters",
-    "poxiest",
-    "pozoles",
-    "practic",
-    "praetor",
-    "praiser",
-    "prajnas",
-    "pranced",
-    "prancer",
-    "prances",
-    "pranged",
-    "pranked",
-    "praters",
-    "prating",
-    "prattle",
-    "prawned",
-    "prawner",
-    "preacts",
-    "preaged",
-    "preanal",
-    "prearms",
-    "preaver",
-    "prebade",
-    "prebake",
-    "prebend",
-    "prebids",
-    "prebill",
-    "prebind",
-    "preboil",
-    "prebook",
-    "preboom",
-    "prebuys",
-    "precava",
-    "precent",
-    "precess",
-    "precipe",
-    "precode",
-    "precook",
-    "precool",
-    "precoup",
-    "precure",
-    "precuts",
-    "predawn",
-    "predial",
-    "predive",
-    "predusk",
-    "preedit",
-    "preeing",
-    "preened",
-    "preener",
-    "prefabs",
-    "prefade",
-    "prefile",
-    "prefire",
-    "prefund",
-    "prelacy",
-    "prelect",
-    "prelife",
-    "premeal",
-    "premeds",
-    "premeet",
-    "premies",
-    "premiss",
-    "premixt",
-    "premold",
-    "premolt",
-    "premune",
-    "prename",
-    "prenoon",
-    "preoral",
-    "prepack",
-    "prepave",
-    "prepays",
-    "prepill",
-    "preplan",
-    "preppie",
-    "prepreg",
-    "prepuce",
-    "prepupa",
-    "prerace",
-    "preriot",
-    "prerock",
-    "presell",
-    "preship",
-    "preshow",
-    "presift",
-    "presoak",
-    "presold",
-    "presong",
-    "presort",
-    "pressor",
-    "prester",
-    "prestos",
-    "pretape",
-    "pretell",
-    "pretold",
-    "pretors",
-    "pretrim",
-    "pretype",
-    "preverb",
-    "previse",
-    "prevued",
-    "prevues",
-    "prewarm",
-    "prewarn",
-    "prewash",
-    "prewire",
-    "prework",
-    "preworn",
-    "prewrap",
-    "prexies",
-    "preyers",
-    "priapic",
-    "priapus",
-    "pricers",
-    "pricier",
-    "pricily",
-    "pricker",
-    "pricket",
-    "prickle",
-    "priding",
-    "prigged",
-    "prilled",
-    "primage",
-    "primely",
-    "primine",
-    "primmed",
-    "primmer",
-    "primped",
-    "primsie",
-    "princox",
-    "prinked",
-    "prinker",
-    "priorly",
-    "prisere",
-    "prising",
-    "prissed",
-    "prisses",
-    "prithee",
-    "privets",
-    "privier",
-    "privies",
-    "privily",
-    "privity",
-    "prizers",
-    "prizing",
-    "proband",
-    "probang",
-    "probers",
-    "probits",
-    "procarp",
-    "prodder",
-    "prodrug",
-    "proette",
-    "progged",
-    "progger",
-    "prolans",
-    "prolate",
-    "prolegs",
-    "prologs",
-    "promine",
-    "promoed",
-    "pronate",
-    "pronely",
-    "pronota",
-    "proofer",
-    "propend",
-    "propene",
-    "propers",
-    "propine",
-    "propjet",
-    "propman",
-    "propmen",
-    "propone",
-    "propria",
-    "propyla",
-    "propyls",
-    "prorate",
-    "prosect",
-    "prosers",
-    "prosier",
-    "prosily",
-    "prosing",
-    "prosoma",
-    "prosses",
-    "prossie",
-    "prostie",
-    "protean",
-    "proteas",
-    "proteid",
-    "protend",
-    "protist",
-    "protium",
-    "protyle",
-    "protyls",
-    "prouder",
-    "provers",
-    "prowest",
-    "prowled",
-    "proximo",
-    "prudery",
-    "prudish",
-    "prurigo",
-    "prussic",
-    "prutoth",
-    "prythee",
-    "psalmed",
-    "psalmic",
-    "psaltry",
-    "psammon",
-    "pschent",
-    "pseudos",
-    "pshawed",
-    "psoatic",
-    "psocids",
-    "psyches",
-    "psyllas",
-    "psyllid",
-    "psywars",
-    "pterins",
-    "pteryla",
-    "ptisans",
-    "ptomain",
-    "ptyalin",
-    "puberal",
-    "puccoon",
-    "puckers",
-    "puckery",
-    "puckish",
-    "puddled",
-    "puddler",
-    "pudency",
-    "pudenda",
-    "pudgier",
-    "pudgily",
-    "puerile",
-    "puffers",
-    "puffery",
-    "puffier",
-    "puffily",
-    "pugaree",
-    "puggier",
-    "pugging",
-    "puggish",
-    "puggree",
-    "pugmark",
-    "pugrees",
-    "puisnes",
-    "pulings",
-    "pullets",
-    "pullups",
-    "pulpers",
-    "pulpier",
-    "pulpily",
-    "pulpits",
-    "pulpous",
-    "pulques",
-    "pulsant",
-    "pulsate",
-    "pulsers",
-    "pulsion",
-    "pulvini",
-    "pumelos",
-    "pumiced",
-    "pumicer",
-    "pumices",
-    "pummelo",
-    "pummels",
-    "pumpers",
-    "puncher",
-    "pungled",
-    "pungles",
-    "puniest",
-    "punkahs",
-    "punkers",
-    "punkest",
-    "punkeys",
-    "punkier",
-    "punkies",
-    "punkins",
-    "punkish",
-    "punners",
-    "punnets",
-    "punnier",
-    "punning",
-    "punster",
-    "punties",
-    "puparia",
-    "pupated",
-    "pupates",
-    "pupfish",
-    "pupilar",
-    "pupping",
-    "puranas",
-    "puranic",
-    "purdahs",
-    "purfled",
-    "purfler",
-    "purfles",
-    "purgers",
-    "purines",
-    "purisms",
-    "purlieu",
-    "purline",
-    "purling",
-    "purlins",
-    "purloin",
-    "purpled",
-    "purpler",
-    "purpure",
-    "pursers",
-    "pursier",
-    "pursily",
-    "pursing",
-    "pursuer",
-    "purtier",
-    "purveys",
-    "pushful",
-    "pushier",
-    "pushily",
-    "pushpin",
-    "pushrod",
-    "pushups",
-    "pusleys",
-    "puslike",
-    "pussier",
-    "pussley",
-    "pustule",
-    "putamen",
-    "putdown",
-    "putlogs",
-    "putoffs",
-    "putouts",
-    "putrefy",
-    "puttees",
-    "puttied",
-    "puttier",
-    "putties",
-    "putzing",
-    "pyaemia",
-    "pyaemic",
-    "pyemias",
-    "pygidia",
-    "pygmean",
-    "pygmies",
-    "pygmoid",
-    "pyknics",
-    "pyloric",
-    "pylorus",
-    "pyralid",
-    "pyrenes",
-    "pyretic",
-    "pyrexes",
-    "pyrexia",
-    "pyrexic",
-    "pyridic",
-    "pyrites",
-    "pyritic",
-    "pyrogen",
-    "pyrolas",
-    "pyrones",
-    "pyropes",
-    "pyrosis",
-    "pyrrhic",
-    "pyrrole",
-    "pyrrols",
-    "pyurias",
-    "pyxides",
-    "pyxidia",
-    "qabalah",
-    "qabalas",
-    "qindars",
-    "qintars",
-    "qiviuts",
-    "quacked",
-    "quadded",
-    "quadrat",
-    "quadric",
-    "quaeres",
-    "quaffed",
-    "quaffer",
-    "quaggas",
-    "quahaug",
-    "quahogs",
-    "quaichs",
-    "quaighs",
-    "quailed",
-    "quakier",
-    "quakily",
-    "quamash",
-    "quangos",
-    "quantal",
-    "quanted",
-    "quantic",
-    "quartan",
-    "quartes",
-    "quartic",
-    "quartos",
-    "quasher",
-    "quashes",
-    "quasses",
-    "quassia",
-    "quassin",
-    "quatres",
-    "quavers",
-    "quavery",
-    "quayage",
-    "qubytes",
-    "queened",
-    "queenly",
-    "queered",
-    "queerer",
-    "queerly",
-    "queleas",
-    "quelled",
-    "queller",
-    "querida",
-    "querier",
-    "querist",
-    "quested",
-    "quester",
-    "questor",
-    "queuers",
-    "quezals",
-    "quiches",
-    "quieten",
-    "quietus",
-    "quillai",
-    "quilled",
-    "quillet",
-    "quinary",
-    "quinate",
-    "quinces",
-    "quinela",
-    "quinina",
-    "quinins",
-    "quinnat",
-    "quinoas",
-    "quinoid",
-    "quinols",
-    "quintal",
-    "quintan",
-    "quintar",
-    "quintas",
-    "quintes",
-    "quintic",
-    "quipper",
-    "quippus",
-    "quiring",
-    "quirked",
-    "quirted",
-    "quitted",
-    "quittor",
-    "quivery",
-    "quizzer",
-    "quohogs",
-    "quoined",
-    "quoited",
-    "quokkas",
-    "quomodo",
-    "quondam",
-    "quorums",
-    "quoters",
-    "qurshes",
-    "qwertys",
-    "rabatos",
-    "rabbets",
-    "rabbies",
-    "rabbins",
-    "rabbity",
-    "rabbled",
-    "rabbler",
-    "rabbles",
-    "rabboni",
-    "rabidly",
-    "racemed",
-    "racemes",
-    "racemic",
-    "rachets",
-    "rachial",
-    "raciest",
-    "racings",
-    "racisms",
-    "rackers",
-    "rackety",
-    "rackful",
-    "racoons",
-    "radding",
-    "raddled",
-    "raddles",
-    "radiale",
-    "radicel",
-    "radices",
-    "radicle",
-    "radioed",
-    "radiums",
-    "radixes",
-    "radomes",
-    "radulae",
-    "radular",
-    "radulas",
-    "raffias",
-    "raffish",
-    "raffled",
-    "raffler",
-    "ragbags",
-    "raggees",
-    "raggies",
-    "ragging",
-    "raggles",
-    "raglans",
-    "ragouts",
-    "ragtags",
-    "ragtops",
-    "ragwort",
-    "railbus",
-    "railers",
-    "rainily",
-    "rainout",
-    "raisiny",
-    "rakeoff",
-    "rallier",
-    "ralline",
-    "rallyes",
-    "ralphed",
-    "ramadas",
-    "rambled",
-    "ramekin",
-    "ramenta",
-    "ramilie",
-    "ramjets",
-    "rammers",
-    "rammier",
-    "rammish",
-    "ramonas",
-    "rampike",
-    "rampion",
-    "rampole",
-    "ramrods",
-    "ramsons",
-    "ramtils",
-    "ranched",
-    "rancors",
-    "rancour",
-    "randans",
-    "randier",
-    "randies",
-    "randoms",
-    "rangier",
-    "rankers",
-    "rankest",
-    "rankish",
-    "rankled",
-    "rankles",
-    "ranpike",
-    "ransack",
-    "ransoms",
-    "ranters",
-    "ranular",
-    "ranulas",
-    "raphias",
-    "raphide",
-    "rapider",
-    "rapiers",
-    "rapines",
-    "rappees",
-    "rappels",
-    "rappini",
-    "rarebit",
-    "rasbora",
-    "rashers",
-    "rashest",
-    "raspers",
-    "raspier",
-    "rasping",
-    "raspish",
-    "rassled",
-    "rassles",
-    "rasters",
-    "rasures",
-    "ratable",
-    "ratably",
-    "ratafee",
-    "ratafia",
-    "ratatat",
-    "ratbags",
-    "ratches",
-    "ratfink",
-    "ratfish",
-    "rathole",
-    "ratines",
-    "ratites",
-    "ratlike",
-    "ratline",
-    "ratlins",
-    "ratoons",
-    "rattail",
-    "rattans",
-    "ratteen",
-    "rattens",
-    "ratters",
-    "rattier",
-    "ratting",
-    "rattish",
-    "rattons",
-    "rattoon",
-    "rattrap",
-    "raucity",
-    "ravager",
-    "raveled",
-    "raveler",
-    "ravelin",
-    "ravelly",
-    "ravened",
-    "ravener",
-    "ravined",
-    "rawness",
-    "rayless",
-    "raylike",
-    "razored",
-    "razzing",
-    "reacher",
-    "readapt",
-    "readded",
-    "readier",
-    "readmit",
-    "readopt",
-    "readorn",
-    "reaffix",
-    "reagins",
-    "realest",
-    "realgar",
-    "reallot",
-    "realter",
-    "reamers",
-    "reannex",
-    "rearers",
-    "reargue",
-    "rearmed",
-    "reavail",
-    "reavers",
-    "reaving",
-    "reavows",
-    "reawake",
-    "reawoke",
-    "rebaits",
-    "rebated",
-    "rebater",
-    "rebatos",
-    "rebecks",
-    "rebegan",
-    "rebegin",
-    "rebegun",
-    "rebills",
-    "rebinds",
-    "reblend",
-    "reblent",
-    "rebloom",
-    "reboant",
-    "reboard",
-    "reboils",
-    "rebooks",
-    "rebored",
-    "rebores",
-    "rebozos",
-    "rebreed",
-    "rebuker",
-    "rebukes",
-    "rebuses",
-    "recaned",
-    "recanes",
-    "recants",
-    "recarry",
-    "recasts",
-    "recedes",
-    "recepts",
-    "rechart",
-    "recheat",
-    "rechews",
-    "rechose",
-    "reciter",
-    "recking",
-    "reclads",
-    "reclasp",
-    "reclean",
-    "recoals",
-    "recoats",
-    "recocks",
-    "recoded",
-    "recodes",
-    "recoils",
-    "recoins",
-    "recolor",
-    "recombs",
-    "recooks",
-    "recorks",
-    "recoupe",
-    "recoups",
-    "recrate",
-    "recross",
-    "recrown",
-    "rectors",
-    "rectrix",
-    "rectums",
-    "recusal",
-    "recused",
-    "recuses",
-    "redacts",
-    "redated",
-    "redates",
-    "redbait",
-    "redbays",
-    "redbuds",
-    "redbugs",
-    "redcaps",
-    "redcoat",
-    "reddens",
-    "redders",
-    "reddest",
-    "reddled",
-    "reddles",
-    "redears",
-    "redeems",
-    "redeyes",
-    "redfins",
-    "redials",
-    "redlegs",
-    "redocks",
-    "redoubt",
-    "redound",
-    "redouts",
-    "redowas",
-    "redoxes",
-    "redpoll",
-    "redraft",
-    "redraws",
-    "redream",
-    "redried",
-    "redries",
-    "redrill",
-    "redrive",
-    "redroot",
-    "redrove",
-    "redskin",
-    "redtail",
-    "redtops",
-    "redware",
-    "reearns",
-    "reedier",
-    "reedify",
-    "reedily",
-    "reeding",
-    "reedits",
-    "reedman",
-    "reedmen",
-    "reefers",
-    "reefier",
-    "reefing",
-    "reeject",
-    "reekers",
-    "reekier",
-    "reeking",
-    "reelect",
-    "reelers",
-    "reemits",
-    "reendow",
-    "reenjoy",
-    "reequip",
-    "reerect",
-    "reested",
-    "reeving",
-    "reevoke",
-    "reexpel",
-    "refaced",
-    "refaces",
-    "refalls",
-    "refects",
-    "refeeds",
-    "refeels",
-    "refence",
-    "reffing",
-    "refight",
-    "refiled",
-    "refiles",
-    "refilms",
-    "refinds",
-    "refired",
-    "refires",
-    "refixed",
-    "refixes",
-    "reflags",
-    "reflate",
-    "reflets",
-    "reflies",
-    "refloat",
-    "reflood",
-    "reflown",
-    "reflows",
-    "refolds",
-    "reforge",
-    "refound",
-    "refract",
-    "reframe",
-    "refries",
-    "refront",
-    "refroze",
-    "refuels",
-    "refuged",
-    "refugia",
-    "refuser",
-    "refutal",
-    "refuter",
-    "regaled",
-    "regaler",
-    "regales",
-    "regally",
-    "regauge",
-    "regears",
-    "reggaes",
-    "regilds",
-    "reginae",
-    "reginal",
-    "reginas",
-    "regiven",
-    "regives",
-    "reglaze",
-    "reglets",
-    "regloss",
-    "reglows",
-    "reglued",
-    "reglues",
-    "regmata",
-    "regnant",
-    "regorge",
-    "regosol",
-    "regrade",
-    "regraft",
-    "regrant",
-    "regrate",
-    "regreen",
-    "regreet",
-    "regrind",
-    "regroom",
-    "regrown",
-    "regrows",
-    "rehangs",
-    "reheard",
-    "rehears",
-    "reheats",
-    "reheels",
-    "rehinge",
-    "rehired",
-    "rehires",
-    "rehouse",
-    "reified",
-    "reifier",
-    "reifies",
-    "reimage",
-    "reincur",
-    "reindex",
-    "reinked",
-    "reinter",
-    "reitbok",
-    "reivers",
-    "reiving",
-    "rejoins",
-    "rejudge",
-    "rekeyed",
-    "reknits",
-    "reknots",
-    "relabel",
-    "relaced",
-    "relaces",
-    "relands",
-    "relater",
-    "relator",
-    "relaxin",
-    "relearn",
-    "relends",
-    "relents",
-    "releves",
-    "relicts",
-    "reliers",
-    "relievo",
-    "relight",
-    "relined",
-    "relines",
-    "relinks",
-    "relique",
-    "relists",
-    "relived",
-    "relives",
-    "relleno",
-    "reloans",
-    "relocks",
-    "relooks",
-    "relucts",
-    "relumed",
-    "relumes",
-    "remails",
-    "remaker",
-    "remands",
-    "remated",
-    "remates",
-    "remeets",
-    "remelts",
-    "remends",
-    "remerge",
-    "remiges",
-    "remints",
-    "remised",
-    "remises",
-    "remolds",
-    "remoras",
-    "remorid",
-    "remoter",
-    "remount",
-    "remudas",
-    "renails",
-    "reneged",
-    "reneger",
-    "reneges",
-    "renests",
-    "renewer",
-    "rennase",
-    "rennets",
-    "rennins",
-    "renowns",
-    "rentier",
-    "renvois",
-    "reoccur",
-    "reoffer",
-    "reoiled",
-    "repacks",
-    "repanel",
-    "repaper",
-    "reparks",
-    "repasts",
-    "repatch",
-    "repaved",
-    "repaves",
-    "repents",
-    "reperks",
-    "repined",
-    "repiner",
-    "repines",
-    "replans",
-    "replant",
-    "replate",
-    "replead",
-    "replevy",
-    "replier",
-    "replots",
-    "replows",
-    "replumb",
-    "repolls",
-    "reposal",
-    "reposed",
-    "reposer",
-    "reposes",
-    "reposit",
-    "repours",
-    "repower",
-    "repping",
-    "reprice",
-    "reprobe",
-    "reproof",
-    "reprove",
-    "reptant",
-    "repugns",
-    "repumps",
-    "reputes",
-    "requins",
-    "requite",
-    "reracks",
-    "reraise",
-    "rereads",
-    "reredos",
-    "rerents",
-    "rerisen",
-    "rerises",
-    "rerolls",
-    "reroofs",
-    "resails",
-    "resawed",
-    "rescale",
-    "rescore",
-    "reseals",
-    "reseats",
-    "reseaus",
-    "reseaux",
-    "resects",
-    "resedas",
-    "reseeds",
-    "reseeks",
-    "reseize",
-    "resends",
-    "resewed",
-    "reshave",
-    "reshine",
-    "reships",
-    "reshoed",
-    "reshoes",
-    "reshone",
-    "reshoot",
-    "reshown",
-    "reshows",
-    "resider",
-    "residua",
-    "resifts",
-    "resight",
-    "resiled",
-    "resiles",
-    "resilin",
-    "resined",
-    "resited",
-    "resites",
-    "resizes",
-    "reslate",
-    "resmelt",
-    "resoaks",
-    "resojet",
-    "resoled",
-    "resoles",
-    "resorbs",
-    "resowed",
-    "respace",
-    "respade",
-    "respeak",
-    "respell",
-    "respelt",
-    "respire",
-    "resplit",
-    "respoke",
-    "respool",
-    "respots",
-    "respray",
-    "restack",
-    "restaff",
-    "restage",
-    "restamp",
-    "resters",
-    "restive",
-    "restoke",
-    "restudy",
-    "restuff",
-    "restyle",
-    "resumer",
-    "resurge",
-    "retable",
-    "retacks",
-    "retaken",
-    "retaker",
-    "retakes",
-    "retally",
-    "retaped",
-    "retapes",
-    "retaste",
-    "retaxed",
-    "retaxes",
-    "retched",
-    "retches",
-    "reteach",
-    "reteams",
-    "retears",
-    "retells",
-    "retenes",
-    "retests",
-    "retiary",
-    "retiled",
-    "retiles",
-    "retimed",
-    "retimes",
-    "retinae",
-    "retinas",
-    "retines",
-    "retints",
-    "retinue",
-    "retirer",
-    "retitle",
-    "retools",
-    "retotal",
-    "retrack",
-    "retread",
-    "retried",
-    "retrims",
-    "retsina",
-    "retting",
-    "retuned",
-    "retunes",
-    "retwist",
-    "retying",
-    "retyped",
-    "retypes",
-    "reunify",
-    "reutter",
-    "revalue",
-    "reveled",
-    "reveler",
-    "reverbs",
-    "reverer",
-    "reveres",
-    "reverso",
-    "revests",
-    "reviler",
-    "reviles",
-    "revisal",
-    "reviser",
-    "reviver",
-    "revoice",
-    "revoker",
-    "revoted",
-    "revotes",
-    "revuist",
-    "rewaked",
-    "rewaken",
-    "rewakes",
-    "rewarms",
-    "rewaxed",
-    "rewaxes",
-    "rewears",
-    "reweave",
-    "reweigh",
-    "rewelds",
-    "rewiden",
-    "rewinds",
-    "rewired",
-    "rewires",
-    "rewoken",
-    "rewords",
-    "reworks",
-    "rewound",
-    "rewoven",
-    "rewraps",
-    "rewrapt",
-    "rexines",
-    "rezeros",
-    "rezoned",
-    "rezones",
-    "rhabdom",
-    "rhachis",
-    "rhamnus",
-    "rhaphae",
-    "rhaphes",
-    "rhatany",
-    "rheboks",
-    "rhenium",
-    "rhetors",
-    "rheumic",
-    "rhizoid",
-    "rhizoma",
-    "rhizopi",
-    "rhodora",
-    "rhombic",
-    "rhonchi",
-    "rhumbas",
-    "rhymers",
-    "rhytons",
-    "rialtos",
-    "riantly",
-    "ribalds",
-    "ribands",
-    "ribband",
-    "ribbers",
-    "ribbier",
-    "ribbony",
-    "ribiers",
-    "ribless",
-    "riblets",
-    "riblike",
-    "riboses",
-    "ribwort",
-    "richens",
-    "ricinus",
-    "rickeys",
-    "ricking",
-    "ricksha",
-    "ricracs",
-    "ridable",
-    "ridders",
-    "ridgels",
-    "ridgier",
-    "ridgils",
-    "ridging",
-    "ridleys",
-    "ridotto",
-    "rievers",
-    "riffled",
-    "riffler",
-    "riffles",
-    "riflers",
-    "riflery",
-    "rifling",
-    "riflips",
-    "rifting",
-    "riggers",
-    "righted",
-    "righter",
-    "rigours",
-    "rikisha",
-    "rikshaw",
-    "rilievi",
-    "rilievo",
-    "rillets",
-    "rilling",
-    "rimfire",
-    "rimiest",
-    "rimland",
-    "rimmers",
-    "rimpled",
-    "rimples",
-    "rimrock",
-    "rimshot",
-    "ringent",
-    "ringlet",
-    "ringtaw",
-    "rinning",
-    "rinsers",
-    "ripcord",
-    "ripener",
-    "ripieni",
-    "ripieno",
-    "ripoffs",
-    "riposte",
-    "riposts",
-    "rippler",
-    "ripplet",
-    "ripraps",
-    "ripsawn",
-    "ripsaws",
-    "risible",
-    "risibly",
-    "risings",
-    "riskers",
-    "riskily",
-    "rissole",
-    "ristras",
-    "risuses",
-    "ritards",
-    "ritters",
-    "ritzier",
-    "ritzily",
-    "rivages",
-    "rivaled",
-    "riveter",
-    "rivulet",
-    "roached",
-    "roadbed",
-    "roadeos",
-    "roadies",
-    "roamers",
-    "roarers",
-    "robalos",
-    "robands",
-    "robotry",
-    "rochets",
-    "rockaby",
-    "rockery",
-    "rockier",
-    "rockoon",
-    "rococos",
-    "rodding",
-    "rodeoed",
-    "rodless",
-    "rodlike",
-    "rodsman",
-    "rodsmen",
-    "rogered",
-    "roguery",
-    "roguing",
-    "roguish",
-    "roilier",
-    "roiling",
-    "roister",
-    "rolfers",
-    "rolfing",
-    "rollick",
-    "rollmop",
-    "rolltop",
-    "rollway",
-    "romajis",
-    "romanos",
-    "romaunt",
-    "rompers",
-    "romping",
-    "rompish",
-    "rondels",
-    "rondure",
-    "ronions",
-    "ronnels",
-    "rontgen",
-    "ronyons",
-    "roofies",
-    "rookier",
-    "rooking",
-    "roomers",
-    "roomful",
-    "roomier",
-    "roomies",
-    "roomily",
-    "roosers",
-    "roosing",
-    "roosted",
-    "rootage",
-    "rootcap",
-    "rooters",
-    "rootier",
-    "rootled",
-    "rootles",
-    "rootlet",
-    "ropable",
-    "ropeway",
-    "ropiest",
-    "roquets",
-    "rorqual",
-    "rosaria",
-    "roscoes",
-    "roseate",
-    "rosebay",
-    "rosehip",
-    "roseola",
-    "rosiest",
-    "rosined",
-    "rosinol",
-    "rosolio",
-    "rostral",
-    "rostrum",
-    "rotches",
-    "rotguts",
-    "rotifer",
-    "rotters",
-    "rouches",
-    "roughed",
-    "roughen",
-    "rouging",
-    "rouille",
-    "roulade",
-    "rouleau",
-    "roundel",
-    "roupier",
-    "roupily",
-    "rouping",
-    "rousers",
-    "rousted",
-    "rouster",
-    "rovings",
-    "rowable",
-    "rowboat",
-    "rowdier",
-    "rowdies",
-    "rowdily",
-    "roweled",
-    "rowings",
-    "rowlock",
-    "rozzers",
-    "rubaboo",
-    "rubaces",
-    "rubasse",
-    "rubatos",
-    "rubbies",
-    "rubbled",
-    "rubbles",
-    "rubdown",
-    "rubeola",
-    "rubidic",
-    "rubiest",
-    "rubigos",
-    "rubious",
-    "ruboffs",
-    "rubouts",
-    "rubying",
-    "ruching",
-    "rucking",
-    "ruckled",
-    "ruckles",
-    "ruction",
-    "rudders",
-    "ruddier",
-    "ruddily",
-    "ruddled",
-    "ruddles",
-    "ruderal",
-    "rudesby",
-    "ruffing",
-    "ruffler",
-    "rugbies",
-    "ruggers",
-    "rugging",
-    "ruglike",
-    "rugolas",
-    "rugosas",
-    "ruinate",
-    "ruiners",
-    "rulable",
-    "ruliest",
-    "rumakis",
-    "rumbaed",
-    "rumbler",
-    "ruminal",
-    "rummers",
-    "rummest",
-    "rummier",
-    "rummies",
-    "rumpled",
-    "rumples",
-    "runback",
-    "rundles",
-    "rundlet",
-    "runkled",
-    "runkles",
-    "runless",
-    "runlets",
-    "runnier",
-    "runoffs",
-    "runouts",
-    "runover",
-    "runtier",
-    "runtish",
-    "rurally",
-    "rushees",
-    "rushers",
-    "rushier",
-    "russets",
-    "russety",
-    "russify",
-    "rustics",
-    "rustier",
-    "rustily",
-    "rustled",
-    "rustles",
-    "ruthful",
-    "rutiles",
-    "ruttier",
-    "ruttily",
-    "ruttish",
-    "ryokans",
-    "sabaton",
-    "sabayon",
-    "sabbats",
-    "sabbing",
-    "sabeing",
-    "sabered",
-    "sabines",
-    "sabring",
-    "sacaton",
-    "sacbuts",
-    "saccade",
-    "saccate",
-    "saccule",
-    "sacculi",
-    "sachems",
-    "sackbut",
-    "sackers",
-    "sackful",
-    "saclike",
-    "sacques",
-    "sacrals",
-    "sacring",
-    "sacrist",
-    "sacrums",
-    "saddhus",
-    "sadiron",
-    "sadisms",
-    "sadists",
-    "safrole",
-    "safrols",
-    "sagaman",
-    "sagamen",
-    "sagbuts",
-    "saggard",
-    "saggars",
-    "saggers",
-    "saggier",
-    "sagiest",
-    "sahiwal",
-    "sahuaro",
-    "saimins",
-    "saining",
-    "sainted",
-    "saiyids",
-    "salaams",
-    "salable",
-    "salably",
-    "salamis",
-    "salchow",
-    "salicin",
-    "salines",
-    "salivas",
-    "sallets",
-    "sallied",
-    "sallier",
-    "sallies",
-    "sallows",
-    "sallowy",
-    "salmons",
-    "saloops",
-    "salpian",
-    "salpids",
-    "salpinx",
-    "salsify",
-    "saltant",
-    "saltbox",
-    "saltern",
-    "salters",
-    "saltest",
-    "saltier",
-    "salties",
-    "saltily",
-    "saltine",
-    "saltish",
-    "saltpan",
-    "saluter",
-    "salvers",
-    "salvias",
-    "salving",
-    "salvoed",
-    "salvoes",
-    "salvors",
-    "samaras",
-    "sambaed",
-    "sambals",
-    "sambars",
-    "sambhar",
-    "sambhur",
-    "sambuca",
-    "sambuke",
-    "samburs",
-    "samechs",
-    "samekhs",
-    "samiels",
-    "samisen",
-    "samites",
-    "samlets",
-    "samosas",
-    "samovar",
-    "sampans",
-    "samshus",
-    "sandbag",
-    "sandbur",
-    "sanddab",
-    "sandfly",
-    "sandhis",
-    "sandhog",
-    "sandier",
-    "sandlot",
-    "sandmen",
-    "sandpit",
-    "sangars",
-    "sangers",
-    "sanicle",
-    "sanious",
-    "sanjaks",
-    "sannops",
-    "sannups",
-    "sansars",
-    "sanseis",
-    "santera",
-    "santero",
-    "santimi",
-    "santims",
-    "santimu",
-    "santirs",
-    "santols",
-    "santoor",
-    "santour",
-    "santurs",
-    "sapajou",
-    "saphead",
-    "saphena",
-    "sapient",
-    "sapless",
-    "saponin",
-    "sapotas",
-    "sapotes",
-    "sapours",
-    "sappers",
-    "sappier",
-    "sappily",
-    "sapping",
-    "saprobe",
-    "sapsago",
-    "sapwood",
-    "sarapes",
-    "sarcina",
-    "sarcoid",
-    "sarcous",
-    "sardana",
-    "sardars",
-    "sardius",
-    "sarkier",
-    "sarment",
-    "sarodes",
-    "saroses",
-    "sarsars",
-    "sarsens",
-    "sarsnet",
-    "sartors",
-    "sashays",
-    "sashing",
-    "sassaby",
-    "sassier",
-    "sassies",
-    "sassily",
-    "sassing",
-    "satangs",
-    "sataras",
-    "sateens",
-    "satiate",
-    "satiety",
-    "satinet",
-    "satires",
-    "satiric",
-    "satoris",
-    "satraps",
-    "satrapy",
-    "satyric",
-    "satyrid",
-    "saucily",
-    "saucing",
-    "saugers",
-    "saunaed",
-    "saunter",
-    "saurels",
-    "saurian",
-    "sauries",
-    "sautoir",
-    "savable",
-    "savaged",
-    "savager",
-    "savants",
-    "savarin",
-    "savates",
-    "saveloy",
-    "savines",
-    "savored",
-    "savorer",
-    "savours",
-    "savvied",
-    "savvier",
-    "savvies",
-    "savvily",
-    "sawbill",
-    "sawbuck",
-    "sawlike",
-    "sawlogs",
-    "sawneys",
-    "saxhorn",
-    "saxtuba",
-    "sayable",
-    "sayyids",
-    "scabbed",
-    "scabble",
-    "scalade",
-    "scalado",
-    "scalage",
-    "scalare",
-    "scalded",
-    "scaldic",
-    "scalene",
-    "scaleni",
-    "scaleup",
-    "scalier",
-    "scalped",
-    "scamped",
-    "scamper",
-    "scanted",
-    "scanter",
-    "scantly",
-    "scaping",
-    "scapose",
-    "scapula",
-    "scarabs",
-    "scarcer",
-    "scarers",
-    "scarfed",
-    "scarfer",
-    "scarify",
-    "scarily",
-    "scarped",
-    "scarper",
-    "scarphs",
-    "scarted",
-    "scathed",
-    "scathes",
-    "scatted",
-    "scauper",
-    "scended",
-    "schappe",
-    "schemed",
-    "schemer",
-    "scherzi",
-    "schisms",
-    "schists",
-    "schizos",
-    "schizzy",
-    "schlepp",
-    "schleps",
-    "schlubs",
-    "schlump",
-    "schmalz",
-    "schmear",
-    "schmeer",
-    "schmoes",
-    "schmoos",
-    "schnaps",
-    "schnook",
-    "schnozz",
-    "scholia",
-    "schorls",
-    "schriks",
-    "schrods",
-    "schtick",
-    "schtiks",
-    "schuits",
-    "scillas",
-    "scirrhi",
-    "sciurid",
-    "sclaffs",
-    "sclerae",
-    "scleral",
-    "scleras",
-    "scoffer",
-    "scolder",
-    "scollop",
-    "sconced",
-    "scooper",
-    "scootch",
-    "scooted",
-    "scopula",
-    "scoriae",
-    "scorify",
-    "scorner",
-    "scoters",
-    "scotias",
-    "scotoma",
-    "scourer",
-    "scouses",
-    "scouted",
-    "scouths",
-    "scowder",
-    "scowing",
-    "scowled",
-    "scowler",
-    "scraggy",
-    "scraich",
-    "scraigh",
-    "scrawls",
-    "scrawly",
-    "screaks",
-    "screaky",
-    "screeds",
-    "screwer",
-    "screwup",
-    "scribal",
-    "scriber",
-    "scrieve",
-    "scrimps",
-    "scrimpy",
-    "scrived",
-    "scrives",
-    "scroggy",
-    "scrooch",
-    "scroops",
-    "scrotal",
-    "scrouge",
-    "scrubby",
-    "scruffs",
-    "scrunch",
-    "scruple",
-    "scubaed",
-    "scudded",
-    "scuffer",
-    "sculked",
-    "sculker",
-    "sculled",
-    "sculler",
-    "sculped",
-    "sculpin",
-    "sculpts",
-    "scultch",
-    "scumble",
-    "scummed",
-    "scummer",
-    "scunner",
-    "scupper",
-    "scurril",
-    "scutage",
-    "scutate",
-    "scutter",
-    "scuzzes",
-    "scyphus",
-    "scythed",
-    "scythes",
-    "seabags",
-    "seabeds",
-    "seaboot",
-    "seacock",
-    "seadogs",
-    "seafowl",
-    "seagirt",
-    "sealery",
-    "sealift",
-    "seamark",
-    "seamers",
-    "seamier",
-    "seaming",
-    "seances",
-    "searest",
-    "seasick",
-    "seaters",
-    "seawans",
-    "seawant",
-    "seaware",
-    "seaways",
-    "sebacic",
-    "sebasic",
-    "secants",
-    "seceded",
-    "seceder",
-    "secedes",
-    "secerns",
-    "seclude",
-    "seconal",
-    "seconde",
-    "secondi",
-    "secpars",
-    "sectary",
-    "sectile",
-    "securer",
-    "sedarim",
-    "sedater",
-    "sedates",
-    "sedgier",
-    "sedilia",
-    "seducer",
-    "seeable",
-    "seedbed",
-    "seedier",
-    "seedily",
-    "seedman",
-    "seedmen",
-    "seedpod",
-    "seeings",
-    "seeling",
-    "seemers",
-    "seepier",
-    "seeress",
-    "seesaws",
-    "seethed",
-    "seethes",
-    "segetal",
-    "seggars",
-    "seiches",
-    "seidels",
-    "seiners",
-    "seining",
-    "seisers",
-    "seising",
-    "seisins",
-    "seismal",
-    "seisors",
-    "seisure",
-    "seitans",
-    "seizers",
-    "seizins",
-    "seizors",
-    "sejeant",
-    "selenic",
-    "selfdom",
-    "selfing",
-    "selkies",
-    "selloff",
-    "selsyns",
-    "selvage",
-    "sematic",
-    "sememes",
-    "sememic",
-    "semidry",
-    "semifit",
-    "semilog",
-    "semimat",
-    "semipro",
-    "semiraw",
-    "semises",
-    "senarii",
-    "sendals",
-    "sendoff",
-    "sendups",
-    "senecas",
-    "senecio",
-    "senegas",
-    "senhora",
-    "senhors",
-    "seniles",
-    "sennets",
-    "sennits",
-    "senopia",
-    "senoras",
-    "senores",
-    "sensate",
-    "senseis",
-    "sentimo",
-    "sepaled",
-    "seppuku",
-    "septage",
-    "septate",
-    "septets",
-    "septics",
-    "septime",
-    "septums",
-    "sequela",
-    "serails",
-    "serapes",
-    "seraphs",
-    "serdabs",
-    "sereins",
-    "serener",
-    "serenes",
-    "serfage",
-    "serfish",
-    "sergers",
-    "serging",
-    "seriate",
-    "sericin",
-    "seriema",
-    "serifed",
-    "serines",
-    "seringa",
-    "serosae",
-    "serosal",
-    "serosas",
-    "serpigo",
-    "serrate",
-    "serried",
-    "serries",
-    "serumal",
-    "servals",
-    "sesames",
-    "sestets",
-    "sestina",
-    "sestine",
-    "setline",
-    "setoffs",
-    "setouts",
-    "settees",
-    "severer",
-    "seviche",
-    "sevruga",
-    "sewable",
-    "sewages",
-    "sewered",
-    "sewings",
-    "sexisms",
-    "sexists",
-    "sexless",
-    "sexpots",
-    "sextain",
-    "sextans",
-    "sextets",
-    "sextons",
-    "sferics",
-    "sfumato",
-    "shacked",
-    "shackos",
-    "shadfly",
-    "shadier",
-    "shadily",
-    "shadoof",
-    "shadufs",
-    "shahdom",
-    "shairds",
-    "shairns",
-    "shaitan",
-    "shakeup",
-    "shakier",
-    "shakoes",
-    "shalier",
-    "shallop",
-    "shaloms",
-    "shamble",
-    "shammas",
-    "shammed",
-    "shammer",
-    "shammes",
-    "shammos",
-    "shamois",
-    "shamoys",
-    "shanked",
-    "shantey",
-    "shantih",
-    "shantis",
-    "shapeup",
-    "sharias",
-    "sharifs",
-    "sharked",
-    "sharker",
-    "sharped",
-    "shaslik",
-    "shaughs",
-    "shauled",
-    "shavies",
-    "shawing",
-    "shawled",
-    "sheafed",
-    "sheathe",
-    "sheaved",
-    "shebean",
-    "shebeen",
-    "shedded",
-    "shedder",
-    "sheened",
-    "sheeney",
-    "sheenie",
-    "sheered",
-    "sheerer",
-    "sheerly",
-    "sheeted",
-    "sheeter",
-    "sheeves",
-    "shegetz",
-    "sheikhs",
-    "sheilas",
-    "sheitan",
-    "sheller",
-    "sheltas",
-    "shelver",
-    "sheqels",
-    "shereef",
-    "sherifs",
-    "sheroot",
-    "sherpas",
-    "sherris",
-    "sheuchs",
-    "sheughs",
-    "shewers",
-    "shewing",
-    "shiatzu",
-    "shibahs",
-    "shicker",
-    "shicksa",
-    "shikari",
-    "shikars",
-    "shikker",
-    "shiksas",
-    "shikseh",
-    "shikses",
-    "shilled",
-    "shilpit",
-    "shimmed",
-    "shindys",
-    "shiners",
-    "shingly",
-    "shinier",
-    "shinily",
-    "shinned",
-    "shinney",
-    "shiplap",
-    "shipmen",
-    "shippen",
-    "shippon",
-    "shipway",
-    "shirked",
-    "shirker",
-    "shirred",
-    "shitake",
-    "shittah",
-    "shitted",
-    "shittim",
-    "shivahs",
-    "shivery",
-    "shiviti",
-    "shlepps",
-    "shlocks",
-    "shlocky",
-    "shlumps",
-    "shlumpy",
-    "shmaltz",
-    "shmears",
-    "shmooze",
-    "shmucks",
-    "shnapps",
-    "shnooks",
-    "shoaled",
-    "shoaler",
-    "shodden",
-    "shoepac",
-    "shofars",
-    "shogged",
-    "shoguns",
-    "sholoms",
-    "shoofly",
-    "shooing",
-    "shooled",
-    "shopboy",
-    "shophar",
-    "shopman",
-    "shopmen",
-    "shorans",
-    "shortia",
-    "shortie",
-    "shotted",
-    "shotten",
-    "shouter",
-    "shovers",
-    "showery",
-    "showier",
-    "showily",
-    "showmen",
-    "shrewed",
-    "shrieky",
-    "shrieve",
-    "shrifts",
-    "shrikes",
-    "shrills",
-    "shrimpy",
-    "shrined",
-    "shrived",
-    "shrivel",
-    "shriven",
-    "shrives",
-    "shroffs",
-    "shrubby",
-    "shtetel",
-    "shtetls",
-    "shticks",
-    "shticky",
-    "shucked",
-    "shucker",
-    "shunner",
-    "shunted",
-    "shunter",
-    "shushed",
-    "shusher",
-    "shushes",
-    "shuteye",
-    "shuting",
-    "shyster",
-    "sialids",
-    "sialoid",
-    "siamang",
-    "sibylic",
-    "siccing",
-    "sickbay",
-    "sickbed",
-    "sickees",
-    "sickens",
-    "sickies",
-    "sicking",
-    "sickish",
-    "sickled",
-    "sickout",
-    "siddurs",
-    "sidearm",
-    "sideman",
-    "sidemen",
-    "sideway",
-    "sidlers",
-    "sidling",
-    "sieging",
-    "sienite",
-    "siennas",
-    "sierran",
-    "siestas",
-    "sievert",
-    "sieving",
-    "sifakas",
-    "sifters",
-    "siganid",
-    "sighers",
-    "sighter",
-    "sightly",
-    "sigmate",
-    "signees",
-    "signets",
-    "signior",
-    "signora",
-    "signori",
-    "signors",
-    "signory",
-    "silages",
-    "silanes",
-    "silents",
-    "silenus",
-    "silexes",
-    "silicas",
-    "silicic",
-    "silicle",
-    "siliqua",
-    "silique",
-    "silkier",
-    "silkies",
-    "silkily",
-    "silking",
-    "sillers",
-    "sillier",
-    "sillies",
-    "sillily",
-    "siloing",
-    "siltier",
-    "silting",
-    "silurid",
-    "silvans",
-    "silvern",
-    "silvics",
-    "simians",
-    "similes",
-    "simioid",
-    "simious",
-    "simitar",
-    "simlins",
-    "simmers",
-    "simnels",
-    "simooms",
-    "simoons",
-    "simpers",
-    "simular",
-    "sinewed",
-    "sinkage",
-    "sinkers",
-    "sinopia",
-    "sinopie",
-    "sinsyne",
-    "sinters",
-    "sinuate",
-    "siphons",
-    "sippers",
-    "sippets",
-    "sirdars",
-    "sirrahs",
-    "sirrees",
-    "siruped",
-    "siskins",
-    "sissier",
-    "sistrum",
-    "sithens",
-    "situses",
-    "sixfold",
-    "sixthly",
-    "sizably",
-    "siziest",
-    "sizings",
-    "sizzled",
-    "sizzles",
-    "sjambok",
-    "skaldic",
-    "skanked",
-    "skanker",
-    "skatole",
-    "skatols",
-    "skeanes",
-    "skeeing",
-    "skeined",
-    "skellum",
-    "skelped",
-    "skelpit",
-    "skepsis",
-    "skiable",
-    "skibobs",
-    "skidded",
-    "skidder",
-    "skiddoo",
-    "skidoos",
-    "skidway",
-    "skiffle",
-    "skiings",
-    "skimped",
-    "skinful",
-    "skinked",
-    "skinker",
-    "skippet",
-    "skirled",
-    "skirred",
-    "skirret",
-    "skirter",
-    "skiting",
-    "skitter",
-    "skittle",
-    "skivers",
-    "skiving",
-    "skiwear",
-    "sklents",
-    "skoaled",
-    "skookum",
-    "skoshes",
-    "skreegh",
-    "skreigh",
-    "skulked",
-    "skulker",
-    "skulled",
-    "skunked",
-    "skycaps",
-    "skydove",
-    "skyhook",
-    "skyjack",
-    "skylike",
-    "skyphoi",
-    "skyphos",
-    "skysail",
-    "skysurf",
-    "skywalk",
-    "skyways",
-    "slabbed",
-    "slabber",
-    "slacked",
-    "slacken",
-    "slackly",
-    "slagged",
-    "slainte",
-    "slakers",
-    "slaking",
-    "slaloms",
-    "slanged",
-    "slantly",
-    "slapper",
-    "slaters",
-    "slather",
-    "slatier",
-    "slating",
-    "slavers",
-    "slaveys",
-    "slaving",
-    "slavish",
-    "sleaved",
-    "sleaves",
-    "sleazes",
-    "sledded",
-    "sledder",
-    "sledged",
-    "sledges",
-    "sleeked",
-    "sleeken",
-    "sleeker",
-    "sleekit",
-    "sleekly",
-    "sleeted",
-    "sleighs",
-    "slicked",
-    "slicken",
-    "slickly",
-    "slidden",
-    "slieves",
-    "slights",
-    "slimier",
-    "slimily",
-    "sliming",
-    "slimmed",
-    "slimpsy",
-    "slinked",
-    "sliping",
-    "slipout",
-    "slipups",
-    "slipway",
-    "slitted",
-    "slitter",
-    "slobber",
-    "slogged",
-    "slogger",
-    "slopers",
-    "slopped",
-    "sloshed",
-    "sloshes",
-    "slotter",
-    "slouchy",
-    "sloughs",
-    "sloughy",
-    "slovens",
-    "slowish",
-    "slubbed",
-    "slubber",
-    "sludged",
-    "sluffed",
-    "slugged",
-    "sluiced",
-    "sluices",
-    "slumgum",
-    "slumism",
-    "slummed",
-    "slummer",
-    "slurban",
-    "slurped",
-    "slushed",
-    "slushes",
-    "slyness",
-    "smacker",
-    "smaltos",
-    "smaragd",
-    "smarted",
-    "smarten",
-    "smartie",
-    "smashup",
-    "smatter",
-    "smearer",
-    "smectic",
-    "smeddum",
-    "smeeked",
-    "smegmas",
-    "smeller",
-    "smelted",
-    "smerked",
-    "smidgen",
-    "smidges",
-    "smidgin",
-    "smilers",
-    "smirker",
-    "smiters",
-    "smiting",
-    "smokier",
-    "smokily",
-    "smolder",
-    "smoochy",
-    "smooths",
-    "smoothy",
-    "smudged",
-    "smugger",
-    "smushed",
-    "smushes",
-    "smutchy",
-    "smutted",
-    "snacked",
-    "snacker",
-    "snaffle",
-    "snafued",
-    "snailed",
-    "snakier",
-    "snakily",
-    "snaking",
-    "snarers",
-    "snarfed",
-    "snaring",
-    "snarler",
-    "snashes",
-    "snatchy",
-    "snathes",
-    "snawing",
-    "sneaped",
-    "snedded",
-    "sneerer",
-    "sneezed",
-    "sneezer",
-    "sneezes",
-    "snelled",
-    "sneller",
-    "snibbed",
-    "snicked",
-    "snidely",
-    "snidest",
-    "sniffle",
-    "sniffly",
-    "snifter",
-    "snigger",
-    "sniggle",
-    "sniglet",
-    "snipper",
-    "snivels",
-    "snogged",
-    "snooded",
-    "snooked",
-    "snooled",
-    "snooped",
-    "snooted",
-    "snoozed",
-    "snoozer",
-    "snoozes",
-    "snoozle",
-    "snorers",
-    "snorter",
-    "snouted",
-    "snowcap",
-    "snowcat",
-    "snowier",
-    "snowily",
-    "snubber",
-    "snuffed",
-    "snuffer",
-    "snuffle",
-    "snuffly",
-    "snugged",
-    "snugger",
-    "soakage",
-    "soakers",
-    "soapers",
-    "soapier",
-    "soapily",
-    "soaping",
-    "soarers",
-    "sobbers",
-    "sobered",
-    "soberer",
-    "soberly",
-    "socager",
-    "socages",
-    "soccage",
-    "soccers",
-    "socking",
-    "sockman",
-    "sockmen",
-    "soddens",
-    "soddies",
-    "sodding",
-    "sodiums",
-    "soffits",
-    "softies",
-    "softish",
-    "soggier",
-    "soggily",
-    "soignee",
-    "soilage",
-    "soilure",
-    "soirees",
-    "sokeman",
-    "sokemen",
-    "solaced",
-    "solacer",
-    "solaces",
-    "solands",
-    "solanin",
-    "solanos",
-    "solaria",
-    "solated",
-    "solates",
-    "solatia",
-    "soldans",
-    "soleret",
-    "solfege",
-    "solidus",
-    "solions",
-    "solubly",
-    "solunar",
-    "solvate",
-    "somital",
-    "somites",
-    "somitic",
-    "sonance",
-    "sonants",
-    "sonders",
-    "songful",
-    "sonhood",
-    "sonless",
-    "sonlike",
-    "sonnies",
-    "sonovox",
-    "sonship",
-    "sonsier",
-    "soothly",
-    "sootier",
-    "sootily",
-    "sooting",
-    "sophies",
-    "sophism",
-    "sophist",
-    "sopited",
-    "sopites",
-    "soppier",
-    "sopping",
-    "soprani",
-    "sorbate",
-    "sorbets",
-    "sorbing",
-    "sorbose",
-    "sordine",
-    "sordini",
-    "sordino",
-    "sordors",
-    "sorghos",
-    "sorings",
-    "sorites",
-    "soritic",
-    "sorners",
-    "sorning",
-    "soroche",
-    "sororal",
-    "soroses",
-    "sorosis",
-    "sorrels",
-    "sorrier",
-    "sorrily",
-    "sortied",
-    "sottish",
-    "souaris",
-    "soubise",
-    "soucars",
-    "soudans",
-    "soughed",
-    "soukous",
-    "soupcon",
-    "soupier",
-    "souping",
-    "sourest",
-    "souring",
-    "sourish",
-    "soursop",
-    "sousing",
-    "souslik",
-    "soutane",
-    "souters",
-    "southed",
-    "sovkhoz",
-    "sovrans",
-    "sowable",
-    "sowcars",
-    "soymilk",
-    "soyuzes",
-    "sozines",
-    "sozzled",
-    "spacier",
-    "spackle",
-    "spaders",
-    "spading",
-    "spaeing",
-    "spahees",
-    "spalled",
-    "spaller",
-    "spancel",
-    "spangly",
-    "spanker",
-    "sparely",
-    "sparers",
-    "sparest",
-    "sparged",
-    "sparger",
-    "sparges",
-    "sparids",
-    "sparker",
-    "sparoid",
-    "sparred",
-    "sparser",
-    "spasmed",
-    "spathal",
-    "spathed",
-    "spathes",
-    "spathic",
-    "spatted",
-    "spatter",
-    "spatzle",
-    "spavies",
-    "spaviet",
-    "spavins",
-    "spawner",
-    "spazzes",
-    "speaned",
-    "speared",
-    "spearer",
-    "specced",
-    "specked",
-    "specula",
-    "speeled",
-    "speered",
-    "speiled",
-    "speired",
-    "speises",
-    "spelean",
-    "spelter",
-    "spelunk",
-    "spences",
-    "spenses",
-    "spermic",
-    "spewers",
-    "sphenes",
-    "sphenic",
-    "spheral",
-    "sphered",
-    "spheric",
-    "spicate",
-    "spicers",
-    "spicery",
-    "spicier",
-    "spicily",
-    "spicing",
-    "spicula",
-    "spicule",
-    "spidery",
-    "spieled",
-    "spiered",
-    "spiffed",
-    "spigots",
-    "spikers",
-    "spikier",
-    "spikily",
-    "spiling",
-    "spilths",
-    "spinage",
-    "spinals",
-    "spinate",
-    "spindly",
-    "spinels",
-    "spinets",
-    "spinier",
-    "spinney",
-    "spinors",
-    "spinose",
-    "spinous",
-    "spinout",
-    "spintos",
-    "spinula",
-    "spinule",
-    "spiraea",
-    "spirant",
-    "spireas",
-    "spireme",
-    "spirems",
-    "spirier",
-    "spiring",
-    "spiroid",
-    "spirted",
-    "spirula",
-    "spitals",
-    "spiting",
-    "spitted",
-    "spitter",
-    "spittle",
-    "spitzes",
-    "splakes",
-    "splashy",
-    "spleens",
-    "spleeny",
-    "splenia",
-    "splenii",
-    "splents",
-    "splicer",
-    "spliffs",
-    "splined",
-    "splores",
-    "splotch",
-    "splurgy",
-    "spoking",
-    "spondee",
-    "sponged",
-    "sponger",
-    "spongin",
-    "sponsal",
-    "sponson",
-    "spoofer",
-    "spooned",
-    "spooney",
-    "spoored",
-    "sporing",
-    "sporoid",
-    "sporter",
-    "sporule",
-    "spotlit",
-    "spoused",
-    "spouted",
-    "spouter",
-    "sprangs",
-    "sprawls",
-    "sprawly",
-    "spriest",
-    "spriggy",
-    "spright",
-    "springe",
-    "spruced",
-    "sprucer",
-    "spruces",
-    "spryest",
-    "spudded",
-    "spudder",
-    "spumier",
-    "spuming",
-    "spumone",
-    "spumoni",
-    "spumous",
-    "spunked",
-    "spunkie",
-    "spurges",
-    "spurner",
-    "spurrer",
-    "spurrey",
-    "spurted",
-    "spurter",
-    "spurtle",
-    "squabby",
-    "squalls",
-    "squally",
-    "squamae",
-    "squarer",
-    "squarks",
-    "squashy",
-    "squatly",
-    "squatty",
-    "squawks",
-    "squiffy",
-    "squilla",
-    "squills",
-    "squinch",
-    "squinny",
-    "squints",
-    "squinty",
-    "squired",
-    "squirms",
-    "squirmy",
-    "squoosh",
-    "sraddha",
-    "sradhas",
-    "stabber",
-    "stabile",
-    "stabled",
-    "stabler",
-    "stackup",
-    "stactes",
-    "staddle",
-    "stadias",
-    "stagers",
-    "stagged",
-    "staggie",
-    "stagier",
-    "stagily",
-    "staider",
-    "staidly",
-    "stainer",
-    "staithe",
-    "stalags",
-    "stalely",
-    "stalest",
-    "staling",
-    "stammel",
-    "stammer",
-    "standee",
-    "stander",
-    "stanged",
-    "stanine",
-    "staning",
-    "stannic",
-    "stannum",
-    "stanols",
-    "starers",
-    "starets",
-    "starker",
-    "starlit",
-    "startsy",
-    "starver",
-    "starves",
-    "stashes",
-    "stasima",
-    "statant",
-    "staters",
-    "statice",
-    "statism",
-    "stative",
-    "stators",
-    "statued",
-    "statusy",
-    "staving",
-    "stayers",
-    "steaded",
-    "stearin",
-    "steeked",
-    "steeled",
-    "steelie",
-    "steepen",
-    "steerer",
-    "steeved",
-    "steeves",
-    "stelene",
-    "stellas",
-    "stemmas",
-    "stemson",
-    "stenchy",
-    "stengah",
-    "stenoky",
-    "sterlet",
-    "sternal",
-    "stertor",
-    "stetted",
-    "stewbum",
-    "stewing",
-    "stewpan",
-    "sthenia",
-    "sthenic",
-    "stibial",
-    "stibine",
-    "stibium",
-    "stichic",
-    "sticked",
-    "stickit",
-    "stickle",
-    "stickum",
-    "stickup",
-    "stiffed",
-    "stiffie",
-    "stifler",
-    "stifles",
-    "stigmal",
-    "stigmas",
-    "stilled",
-    "stimied",
-    "stimies",
-    "stingos",
-    "stinted",
-    "stinter",
-    "stipels",
-    "stipule",
-    "stirpes",
-    "stivers",
-    "stobbed",
-    "stodged",
-    "stodges",
-    "stogeys",
-    "stogies",
-    "stoical",
-    "stokers",
-    "stoking",
-    "stollen",
-    "stolons",
-    "stomata",
-    "stomate",
-    "stoners",
-    "stonier",
-    "stonily",
-    "stonish",
-    "stooged",
-    "stooked",
-    "stooker",
-    "stooled",
-    "stoolie",
-    "stooper",
-    "stopers",
-    "stopgap",
-    "stopoff",
-    "stopple",
-    "storers",
-    "stotins",
-    "stotted",
-    "stounds",
-    "stoures",
-    "stourie",
-    "stouten",
-    "stouter",
-    "stoutly",
-    "stovers",
-    "stowing",
-    "strafed",
-    "strafer",
-    "strafes",
-    "straked",
-    "strakes",
-    "stratal",
-    "stratas",
-    "straths",
-    "strawed",
-    "streamy",
-    "streeks",
-    "streels",
-    "stretta",
-    "strette",
-    "stretti",
-    "stretto",
-    "strewed",
-    "strewer",
-    "striata",
-    "striate",
-    "stricks",
-    "stridor",
-    "strifes",
-    "strigil",
-    "striven",
-    "striver",
-    "strobic",
-    "strobil",
-    "strophe",
-    "stroppy",
-    "strouds",
-    "strowed",
-    "stroyed",
-    "stroyer",
-    "strumae",
-    "strumas",
-    "strunts",
-    "stubbed",
-    "stubbly",
-    "stuccos",
-    "studdie",
-    "studier",
-    "stuiver",
-    "stummed",
-    "stumper",
-    "stupefy",
-    "stupids",
-    "stupors",
-    "stygian",
-    "stylate",
-    "stylers",
-    "stylets",
-    "stylise",
-    "stylite",
-    "stylize",
-    "styloid",
-    "stymies",
-    "stypsis",
-    "styptic",
-    "suasion",
-    "suasive",
-    "suasory",
-    "suavely",
-    "suavest",
-    "suavity",
-    "subacid",
-    "subadar",
-    "subalar",
-    "subarid",
-    "subatom",
-    "subbase",
-    "subbass",
-    "subbing",
-    "subcell",
-    "subclan",
-    "subcode",
-    "subcool",
-    "subcult",
-    "subdean",
-    "subdebs",
-    "subdual",
-    "subduce",
-    "subduct",
-    "subduer",
-    "subdues",
-    "subecho",
-    "subedit",
-    "suberic",
-    "suberin",
-    "subfile",
-    "subfusc",
-    "subgoal",
-    "subgums",
-    "subidea",
-    "subjoin",
-    "sublate",
-    "subline",
-    "sublots",
-    "submiss",
-    "suboral",
-    "suborns",
-    "suboval",
-    "subpena",
-    "subrace",
-    "subrent",
-    "subring",
-    "subrule",
-    "subsale",
-    "subsect",
-    "subsere",
-    "subsume",
-    "subtaxa",
-    "subteen",
-    "subtend",
-    "subtile",
-    "subtone",
-    "subvene",
-    "subzone",
-    "succahs",
-    "succors",
-    "succory",
-    "succoth",
-    "succour",
-    "succuba",
-    "succubi",
-    "succuss",
-    "suckier",
-    "suckled",
-    "suckler",
-    "suckles",
-    "sucrase",
-    "sudaria",
-    "suddens",
-    "sudoral",
-    "sudsers",
-    "sudsier",
-    "sudsing",
-    "sueding",
-    "suffari",
-    "suffuse",
-    "sugared",
-    "sugarer",
-    "sughing",
-    "suiters",
-    "sukkahs",
-    "sukkoth",
-    "sulcate",
-    "suldans",
-    "sulfids",
-    "sulfone",
-    "sulfurs",
-    "sulfury",
-    "sulkers",
-    "sulkier",
-    "sulkies",
-    "sulkily",
-    "sulking",
-    "sullage",
-    "sullied",
-    "sullies",
-    "sulphas",
-    "sulphid",
-    "sumachs",
-    "sumless",
-    "summand",
-    "summate",
-    "sumoist",
-    "sunback",
-    "sunbath",
-    "sunbows",
-    "sundaes",
-    "sunders",
-    "sundews",
-    "sundogs",
-    "sunfast",
-    "sunglow",
-    "sunkets",
-    "sunlamp",
-    "sunlike",
-    "sunnahs",
-    "sunnier",
-    "sunnily",
-    "sunrays",
-    "sunsuit",
-    "suntans",
-    "sunward",
-    "sunwise",
-    "supered",
-    "supines",
-    "supping",
-    "suppled",
-    "suppler",
-    "supples",
-    "surbase",
-    "surcoat",
-    "surfeit",
-    "surfier",
-    "surfman",
-    "surfmen",
-    "surgers",
-    "surimis",
-    "surlier",
-    "surlily",
-    "surreys",
-    "surtout",
-    "surveil",
-    "susliks",
-    "suspire",
-    "sussing",
-    "sutlers",
-    "suttees",
-    "sutural",
-    "sutured",
-    "svelter",
-    "swabbed",
-    "swabber",
-    "swabbie",
-    "swacked",
-    "swaddle",
-    "swagers",
-    "swagged",
-    "swaggie",
-    "swaging",
-    "swagman",
-    "swagmen",
-    "swamies",
-    "swamper",
-    "swanked",
-    "swanker",
-    "swanned",
-    "swanpan",
-    "swarded",
-    "swarmer",
-    "swarths",
-    "swarthy",
-    "swashed",
-    "swasher",
-    "swashes",
-    "swathed",
-    "swather",
-    "swathes",
-    "swatted",
-    "swatter",
-    "swayers",
-    "swayful",
-    "swearer",
-    "sweated",
-    "sweller",
-    "swelter",
-    "sweltry",
-    "swerved",
-    "swerver",
-    "swerves",
-    "swevens",
-    "swidden",
-    "swifter",
-    "swigged",
-    "swigger",
-    "swilled",
-    "swiller",
-    "swingby",
-    "swinged",
-    "swinges",
-    "swingle",
-    "swinish",
-    "swinked",
-    "swinney",
-    "swiping",
-    "swiples",
-    "swipple",
-    "swished",
-    "swishes",
-    "swisses",
-    "swither",
-    "swithly",
-    "swivets",
-    "swiving",
-    "swobbed",
-    "swobber",
-    "swooned",
-    "swooner",
-    "swooper",
-    "swopped",
-    "swotted",
-    "swotter",
-    "swounds",
-    "swouned",
-    "syconia",
-    "sycoses",
-    "sycosis",
-    "syenite",
-    "sylphic",
-    "sylphid",
-    "sylvans",
-    "sylvine",
-    "sylvins",
-    "sylvite",
-    "symbion",
-    "symbiot",
-    "synagog",
-    "synanon",
-    "syncarp",
-    "synched",
-    "syncoms",
-    "syndets",
-    "syndics",
-    "synesis",
-    "synfuel",
-    "syngamy",
-    "synodal",
-    "synodic",
-    "synovia",
-    "syntagm",
-    "syntony",
-    "synurae",
-    "syphers",
-    "syphons",
-    "syrette",
-    "syringa",
-    "syrphid",
-    "syruped",
-    "systole",
-    "syzygal",
-    "tabanid",
-    "tabards",
-    "tabaret",
-    "tabbied",
-    "tabbies",
-    "tabered",
-    "tabetic",
-    "tabooed",
-    "tabored",
-    "taborer",
-    "taboret",
-    "taborin",
-    "tabouli",
-    "tabours",
-    "tabuing",
-    "tabulis",
-    "tachism",
-    "tachist",
-    "tackers",
-    "tackets",
-    "tackier",
-    "tackify",
-    "tackily",
-    "tackler",
-    "tacnode",
-    "tacrine",
-    "taction",
-    "tactual",
-    "taeniae",
-    "taenias",
-    "taffias",
-    "taffies",
-    "taggant",
-    "taggers",
-    "taglike",
-    "tagmeme",
-    "tagrags",
-    "tahinis",
-    "tahsils",
-    "tailfan",
-    "tailfin",
-    "tailles",
-    "taipans",
-    "takable",
-    "takahes",
-    "takeups",
-    "talaria",
-    "talcing",
-    "talcked",
-    "talcose",
-    "talcous",
-    "talcums",
-    "talions",
-    "taliped",
-    "talipes",
-    "talipot",
-    "talkier",
-    "tallage",
-    "tallboy",
-    "tallier",
-    "tallish",
-    "tallith",
-    "tallits",
-    "tallols",
-    "tallows",
-    "tallowy",
-    "tallyho",
-    "taloned",
-    "talooka",
-    "talukas",
-    "taluses",
-    "tamable",
-    "tamandu",
-    "tamarao",
-    "tamarau",
-    "tamarin",
-    "tamaris",
-    "tamasha",
-    "tambacs",
-    "tambaks",
-    "tambala",
-    "tambour",
-    "tambura",
-    "tamburs",
-    "tameins",
-    "tamises",
-    "tammies",
-    "tampala",
-    "tampans",
-    "tampers",
-    "tamping",
-    "tampion",
-    "tanbark",
-    "tandoor",
-    "tangelo",
-    "tanging",
-    "tangler",
-    "tangoed",
-    "tanists",
-    "tankage",
-    "tankful",
-    "tanking",
-    "tannage",
-    "tannate",
-    "tannest",
-    "tannish",
-    "tannoys",
-    "tanrecs",
-    "tansies",
-    "tantara",
-    "tantivy",
-    "tantras",
-    "tanukis",
-    "tanyard",
-    "tapalos",
-    "taperer",
-    "tapetal",
-    "tapetum",
-    "taphole",
-    "tapises",
-    "tappers",
-    "tappets",
-    "taproom",
-    "tapster",
-    "taramas",
-    "tarbush",
-    "tardier",
-    "tardies",
-    "tardily",
-    "tardyon",
-    "tarmacs",
-    "tarpans",
-    "tarpons",
-    "tarried",
-    "tarrier",
-    "tarries",
-    "tarring",
-    "tarsals",
-    "tarsias",
-    "tarsier",
-    "tartana",
-    "tartare",
-    "tartars",
-    "tartest",
-    "tartier",
-    "tartily",
-    "tarting",
-    "tartish",
-    "tartlet",
-    "tartufe",
-    "tarweed",
-    "tarzans",
-    "tassets",
-    "tassies",
-    "tasters",
-    "tastier",
-    "tastily",
-    "tatamis",
-    "tatouay",
-    "tatsois",
-    "tattier",
-    "tatties",
-    "tattily",
-    "tattled",
-    "tattler",
-    "tattles",
-    "taunter",
-    "tautaug",
-    "tautens",
-    "tautest",
-    "tauting",
-    "tautogs",
-    "tawneys",
-    "tawnier",
-    "tawnies",
-    "tawnily",
-    "tawpies",
-    "tawsing",
-    "taxably",
-    "taxemes",
-    "taxemic",
-    "taxiing",
-    "taximan",
-    "taximen",
-    "taxites",
-    "taxitic",
-    "taxless",
-    "taxpaid",
-    "taxwise",
-    "taxying",
-    "teabowl",
-    "teacake",
-    "teacart",
-    "tealike",
-    "teapoys",
-    "tearers",
-    "teargas",
-    "tearier",
-    "tearily",
-    "tearoom",
-    "teasels",
-    "teashop",
-    "teatime",
-    "teaware",
-    "teazels",
-    "teazled",
-    "teazles",
-    "techier",
-    "techily",
-    "technos",
-    "tectite",
-    "tectrix",
-    "tectums",
-    "tedders",
-    "tedding",
-    "tediums",
-    "teemers",
-    "teeners",
-    "teenful",
-    "teenier",
-    "teentsy",
-    "teepees",
-    "teeters",
-    "teethed",
-    "teether",
-    "teethes",
-    "teflons",
-    "tegmina",
-    "tegular",
-    "tegumen",
-    "tekkies",
-    "tektite",
-    "telamon",
-    "teledus",
-    "telegas",
-    "teleman",
-    "telemen",
-    "teleost",
-    "teleran",
-    "teleses",
-    "telesis",
-    "telexed",
-    "telexes",
-    "telfers",
-    "tellies",
-    "telnets",
-    "telomes",
-    "telomic",
-    "telpher",
-    "telsons",
-    "temblor",
-    "tempehs",
-    "templed",
-    "templet",
-    "tempter",
-    "tenably",
-    "tenaces",
-    "tenails",
-    "tenches",
-    "tendril",
-    "tenners",
-    "tennies",
-    "tennist",
-    "tenoned",
-    "tenoner",
-    "tenours",
-    "tenpins",
-    "tenrecs",
-    "tensest",
-    "tensing",
-    "tensity",
-    "tensive",
-    "tentage",
-    "tenters",
-    "tenthly",
-    "tentier",
-    "tenting",
-    "tenuity",
-    "tenutos",
-    "teopans",
-    "tephras",
-    "tepidly",
-    "teraohm",
-    "terbias",
-    "terbium",
-    "tercels",
-    "tercets",
-    "terebic",
-    "teredos",
-    "terefah",
-    "tergite",
-    "termers",
-    "terming",
-    "termors",
-    "ternate",
-    "ternion",
-    "terpene",
-    "terrane",
-    "terreen",
-    "terrene",
-    "terrets",
-    "terries",
-    "terrify",
-    "terrine",
-    "territs",
-    "tersely",
-    "tersest",
-    "tertial",
-    "tertian",
-    "tessera",
-    "testacy",
-    "testate",
-    "testees",
-    "testier",
-    "testily",
-    "testons",
-    "testoon",
-    "testudo",
-    "tetanal",
-    "tetanic",
-    "tetched",
-    "tetotum",
-    "tetrads",
-    "tetrode",
-    "tetryls",
-    "tetters",
-    "teughly",
-    "texases",
-    "thacked",
-    "thairms",
-    "thalami",
-    "thalers",
-    "thallic",
-    "thallus",
-    "thalweg",
-    "thanage",
-    "thanker",
-    "thatchy",
-    "thawers",
-    "thecate",
-    "theelin",
-    "theelol",
-    "thegnly",
-    "theines",
-    "theisms",
-    "thenage",
-    "thenars",
-    "theolog",
-    "theorbo",
-    "thereat",
-    "theriac",
-    "therian",
-    "thermae",
-    "thermel",
-    "thermes",
-    "thermic",
-    "thermit",
-    "theroid",
-    "theurgy",
-    "thewier",
-    "thiazin",
-    "thiazol",
-    "thieved",
-    "thighed",
-    "thiolic",
-    "thionic",
-    "thionin",
-    "thionyl",
-    "thirams",
-    "thirled",
-    "thirsts",
-    "thistly",
-    "tholing",
-    "thonged",
-    "thorias",
-    "thorite",
-    "thorned",
-    "thorons",
-    "thorpes",
-    "thouing",
-    "thralls",
-    "thraves",
-    "thrawed",
-    "thready",
-    "threaps",
-    "threeps",
-    "thriven",
-    "thriver",
-    "throaty",
-    "thrombi",
-    "throned",
-    "thrummy",
-    "thruput",
-    "thudded",
-    "thuggee",
-    "thulias",
-    "thulium",
-    "thumbed",
-    "thumped",
-    "thunked",
-    "thwacks",
-    "thwarts",
-    "thymier",
-    "thymols",
-    "thyrses",
-    "thyrsus",
-    "tiaraed",
-    "ticcing",
-    "tictacs",
-    "tictocs",
-    "tidally",
-    "tiddler",
-    "tiderip",
-    "tideway",
-    "tidiers",
-    "tidiest",
-    "tieback",
-    "tieless",
-    "tiepins",
-    "tierced",
-    "tiercel",
-    "tierces",
-    "tiering",
-    "tiffing",
-    "tiffins",
-    "tiglons",
-    "tigrish",
-    "tilings",
-    "tillite",
-    "tilters",
-    "timarau",
-    "timbale",
-    "timbals",
-    "timbery",
-    "timbral",
-    "timbrel",
-    "timeous",
-    "timider",
-    "timpana",
-    "timpano",
-    "tinamou",
-    "tincals",
-    "tincted",
-    "tinders",
-    "tindery",
-    "tineids",
-    "tinfuls",
-    "tinging",
-    "tingled",
-    "tingler",
-    "tingles",
-    "tinhorn",
-    "tinkers",
-    "tinkled",
-    "tinkler",
-    "tinkles",
-    "tinlike",
-    "tinners",
-    "tinnier",
-    "tinnily",
-    "tinning",
-    "tinsels",
-    "tinters",
-    "tintype",
-    "tinware",
-    "tinwork",
-    "tipcart",
-    "tipcats",
-    "tipless",
-    "tipoffs",
-    "tippers",
-    "tippets",
-    "tippier",
-    "tippled",
-    "tippler",
-    "tipples",
-    "tipsier",
-    "tipsily",
-    "tiptoed",
-    "tiptoes",
-    "tiptops",
-    "tirades",
-    "tireder",
-    "tiredly",
-    "tirling",
-    "tisanes",
-    "tissual",
-    "tissued",
-    "tissuey",
-    "titbits",
-    "titfers",
-    "tithers",
-    "titians",
-    "titlark",
-    "titlist",
-    "titmice",
-    "titrant",
-    "titrate",
-    "titters",
-    "tittles",
-    "tittups",
-    "tizzies",
-    "toadied",
-    "toadies",
-    "toadish",
-    "toccate",
-    "tochers",
-    "tocsins",
-    "toddies",
-    "toddled",
-    "toddles",
-    "toecaps",
-    "toehold",
-    "toeless",
-    "toelike",
-    "toeshoe",
-    "toffees",
-    "toffies",
-    "tofutti",
-    "togated",
-    "toggery",
-    "togging",
-    "toggler",
-    "toilers",
-    "toilful",
-    "toiting",
-    "tokened",
-    "tokomak",
-    "tolanes",
-    "toledos",
-    "tolidin",
-    "tollage",
-    "tollbar",
-    "tollers",
-    "tollman",
-    "tollmen",
-    "toluate",
-    "toluide",
-    "toluids",
-    "toluole",
-    "toluols",
-    "toluyls",
-    "tomback",
-    "tombacs",
-    "tombaks",
-    "tombing",
-    "tombola",
-    "tombolo",
-    "tomboys",
-    "tomcats",
-    "tomcods",
-    "tomenta",
-    "tomfool",
-    "tommies",
-    "tomming",
-    "tompion",
-    "tomtits",
-    "tonally",
-    "tonearm",
-    "tonemes",
-    "tonemic",
-    "tonetic",
-    "tonette",
-    "tongers",
-    "tonging",
-    "tongman",
-    "tongmen",
-    "toniest",
-    "tonlets",
-    "tonners",
-    "tonnish",
-    "tonsure",
-    "tontine",
-    "tonuses",
-    "toolers",
-    "toonies",
-    "tooters",
-    "tootled",
-    "tootler",
-    "tootles",
-    "tootses",
-    "topazes",
-    "topfull",
-    "topkick",
-    "topknot",
-    "topmast",
-    "toponym",
-    "topspin",
-    "topwork",
-    "toquets",
-    "torchon",
-    "toreros",
-    "toroids",
-    "torpids",
-    "torpors",
-    "torqued",
-    "torquer",
-    "torrefy",
-    "torrify",
-    "torsade",
-    "tortile",
-    "tortoni",
-    "tortrix",
-    "torulae",
-    "torulas",
-    "tossers",
-    "tosspot",
-    "tossups",
-    "tostada",
-    "tostado",
-    "totable",
-    "totemic",
-    "totters",
-    "tottery",
-    "totting",
-    "toucans",
-    "toucher",
-    "touchup",
-    "toughed",
-    "toughie",
-    "toughly",
-    "toupees",
-    "touraco",
-    "tourers",
-    "tousing",
-    "tousled",
-    "tousles",
-    "touters",
-    "touzled",
-    "touzles",
-    "towable",
-    "towages",
-    "towaway",
-    "towboat",
-    "toweled",
-    "towered",
-    "towhead",
-    "towhees",
-    "towline",
-    "towmond",
-    "towmont",
-    "townees",
-    "townies",
-    "townish",
-    "townlet",
-    "towpath",
-    "towrope",
-    "towsack",
-    "toxemia",
-    "toxemic",
-    "toxical",
-    "toxines",
-    "toxoids",
-    "toyless",
-    "toylike",
-    "toyshop",
-    "tracery",
-    "trachle",
-    "traduce",
-    "tragics",
-    "traiked",
-    "traipse",
-    "traject",
-    "tramcar",
-    "tramell",
-    "tramels",
-    "trammed",
-    "trammel",
-    "tramped",
-    "tramper",
-    "tranced",
-    "trances",
-    "trangam",
-    "trapans",
-    "trasher",
-    "trashes",
-    "trasses",
-    "travois",
-    "trawled",
-    "trawley",
-    "trayful",
-    "treacly",
-    "treaded",
-    "treader",
-    "treadle",
-    "treater",
-    "trebled",
-    "trebles",
-    "treddle",
-    "treeing",
-    "trehala",
-    "trekked",
-    "trembly",
-    "trenail",
-    "trended",
-    "trepang",
-    "trepans",
-    "tressed",
-    "tressel",
-    "trevets",
-    "triable",
-    "triacid",
-    "triadic",
-    "triaged",
-    "triages",
-    "triazin",
-    "tribade",
-    "tricing",
-    "tricker",
-    "trickie",
-    "trickly",
-    "tricksy",
-    "triclad",
-    "tricorn",
-    "tricots",
-    "triduum",
-    "trienes",
-    "trifled",
-    "trifler",
-    "triform",
-    "trigged",
-    "trigons",
-    "trigram",
-    "trijets",
-    "trilith",
-    "trilled",
-    "triller",
-    "trimers",
-    "trinary",
-    "trindle",
-    "trining",
-    "triodes",
-    "triolet",
-    "trioses",
-    "trioxid",
-    "tripack",
-    "tripart",
-    "tripody",
-    "trippet",
-    "triptan",
-    "trireme",
-    "trisect",
-    "triseme",
-    "trishaw",
-    "trismic",
-    "trismus",
-    "trisome",
-    "tritely",
-    "tritest",
-    "tritoma",
-    "tritone",
-    "tritons",
-    "triunes",
-    "trivets",
-    "troaked",
-    "trocars",
-    "trochal",
-    "trochar",
-    "trochee",
-    "troches",
-    "trochil",
-    "trocked",
-    "troffer",
-    "trogons",
-    "troikas",
-    "troking",
-    "troland",
-    "troller",
-    "trollop",
-    "trommel",
-    "tromped",
-    "trompes",
-    "trooped",
-    "tropine",
-    "tropins",
-    "tropism",
-    "trothed",
-    "trotyls",
-    "trounce",
-    "trouped",
-    "trouper",
-    "trovers",
-    "trowels",
-    "trowing",
-    "trowths",
-    "truants",
-    "trucing",
-    "trucked",
-    "truckle",
-    "trudged",
-    "trudgen",
-    "trudger",
-    "trudges",
-    "trueing",
-    "truffes",
-    "truisms",
-    "trumeau",
-    "trunnel",
-    "trussed",
-    "trusser",
-    "truster",
-    "trustor",
-    "trymata",
-    "tryptic",
-    "trysail",
-    "trysted",
-    "tryster",
-    "trystes",
-    "tsaddik",
-    "tsardom",
-    "tsarina",
-    "tsarism",
-    "tsarist",
-    "tsatske",
-    "tsetses",
-    "tsimmes",
-    "tsktsks",
-    "tsooris",
-    "tsouris",
-    "tuatara",
-    "tuatera",
-    "tubaist",
-    "tubbers",
-    "tubbier",
-    "tubbing",
-    "tubfuls",
-    "tubifex",
-    "tubings",
-    "tubists",
-    "tublike",
-    "tuchuns",
-    "tuckers",
-    "tuckets",
-    "tuffets",
-    "tufters",
-    "tuftier",
-    "tuftily",
-    "tufting",
-    "tuggers",
-    "tughrik",
-    "tugless",
-    "tugriks",
-    "tuilles",
-    "tuladis",
-    "tumbrel",
-    "tumbril",
-    "tumesce",
-    "tumidly",
-    "tummies",
-    "tummler",
-    "tumoral",
-    "tumping",
-    "tumular",
-    "tumults",
-    "tumulus",
-    "tunably",
-    "tundish",
-    "tundras",
-    "tuneful",
-    "tuneups",
-    "tunicae",
-    "tunicle",
-    "tunnage",
-    "tunnies",
-    "tupelos",
-    "tupping",
-    "turacos",
-    "turacou",
-    "turbary",
-    "turbeth",
-    "turbith",
-    "turbits",
-    "turbots",
-    "turdine",
-    "tureens",
-    "turfier",
-    "turfing",
-    "turfman",
-    "turfmen",
-    "turfski",
-    "turgent",
-    "turgite",
-    "turgors",
-    "turions",
-    "turista",
-    "turkois",
-    "turnery",
-    "turnons",
-    "turnups",
-    "turpeth",
-    "turtled",
-    "turtler",
-    "tusches",
-    "tushery",
-    "tushies",
-    "tushing",
-    "tuskers",
-    "tusking",
-    "tussahs",
-    "tussars",
-    "tussehs",
-    "tussers",
-    "tussive",
-    "tussled",
-    "tussles",
-    "tussock",
-    "tussore",
-    "tussors",
-    "tussuck",
-    "tussurs",
-    "tutelar",
-    "tutoyed",
-    "tutoyer",
-    "tutties",
-    "tutting",
-    "tuyeres",
-    "twaddle",
-    "twanged",
-    "twanger",
-    "twangle",
-    "twasome",
-    "twattle",
-    "tweedle",
-    "tweener",
-    "tweeted",
-    "tweezed",
-    "tweezes",
-    "twelves",
-    "twibill",
-    "twibils",
-    "twiddle",
-    "twiddly",
-    "twigged",
-    "twiggen",
-    "twilled",
-    "twiners",
-    "twinged",
-    "twinges",
-    "twinier",
-    "twinjet",
-    "twinkly",
-    "twinned",
-    "twinset",
-    "twirled",
-    "twirler",
-    "twitchy",
-    "twitted",
-    "twitter",
-    "twofers",
-    "twoonie",
-    "twosome",
-    "tycoons",
-    "tylosin",
-    "tymbals",
-    "tympana",
-    "tympani",
-    "tympano",
-    "tympans",
-    "tympany",
-    "typable",
-    "typebar",
-    "typhons",
-    "typhose",
-    "typhous",
-    "typiest",
-    "tyronic",
-    "tything",
-    "tzaddik",
-    "tzardom",
-    "tzarina",
-    "tzarism",
-    "tzarist",
-    "tzetzes",
-    "tzigane",
-    "tzimmes",
-    "tzitzis",
-    "tzitzit",
-    "uakaris",
-    "ufology",
-    "ukelele",
-    "ulcered",
-    "ulexite",
-    "ullaged",
-    "ullages",
-    "ulpanim",
-    "ulsters",
-    "ultimas",
-    "ululant",
-    "ululate",
-    "umbeled",
-    "umbered",
-    "umbonal",
-    "umbones",
-    "umbonic",
-    "umbrage",
-    "umiacks",
-    "umlauts",
-    "umpired",
-    "umpteen",
-    "unacted",
-    "unadded",
-    "unadept",
-    "unadult",
-    "unagile",
-    "unaging",
-    "unaimed",
-    "unaired",
-    "unakite",
-    "unalike",
-    "unaptly",
-    "unasked",
-    "unawake",
-    "unbaked",
-    "unbaled",
-    "unbales",
-    "unbased",
-    "unbated",
-    "unbears",
-    "unbeing",
-    "unbelts",
-    "unbends",
-    "unbinds",
-    "unblest",
-    "unbolts",
-    "unboned",
-    "unbosom",
-    "unbowed",
-    "unboxes",
-    "unbrace",
-    "unbraid",
-    "unbrake",
-    "unbroke",
-    "unbuild",
-    "unbuilt",
-    "unbulky",
-    "unburnt",
-    "uncaged",
-    "uncages",
-    "uncaked",
-    "uncakes",
-    "uncased",
-    "uncases",
-    "unceded",
-    "unchain",
-    "unchair",
-    "unchary",
-    "unchoke",
-    "uncials",
-    "uncinal",
-    "uncinus",
-    "unclamp",
-    "unclasp",
-    "uncleft",
-    "unclips",
-    "uncloak",
-    "unclogs",
-    "unclose",
-    "uncloud",
-    "uncocks",
-    "uncoded",
-    "uncoils",
-    "uncomic",
-    "uncorks",
-    "uncrate",
-    "uncrazy",
-    "uncross",
-    "uncrown",
-    "unction",
-    "uncuffs",
-    "uncurbs",
-    "uncured",
-    "uncurls",
-    "underdo",
-    "undines",
-    "undocks",
-    "undoers",
-    "undrape",
-    "undrawn",
-    "undraws",
-    "undrest",
-    "undried",
-    "undrunk",
-    "undular",
-    "uneager",
-    "uneases",
-    "uneaten",
-    "unended",
-    "unfaded",
-    "unfaith",
-    "unfaked",
-    "unfancy",
-    "unfence",
-    "unfired",
-    "unfitly",
-    "unfixed",
-    "unfixes",
-    "unfound",
-    "unfreed",
-    "unfrees",
-    "unfrock",
-    "unfroze",
-    "unfurls",
-    "unfused",
-    "unfussy",
-    "ungated",
-    "ungirds",
-    "unglove",
-    "unglued",
-    "unglues",
-    "unguard",
-    "unguent",
-    "ungulae",
-    "ungular",
-    "unhairs",
-    "unhands",
-    "unhandy",
-    "unhangs",
-    "unhasty",
-    "unhelms",
-    "unhinge",
-    "unhired",
-    "unhitch",
-    "unhoods",
-    "unhooks",
-    "unhoped",
-    "unhorse",
-    "unhouse",
-    "unhuman",
-    "unhusks",
-    "unibody",
-    "unideal",
-    "uniface",
-    "unifier",
-    "unipods",
-    "uniquer",
-    "unisize",
-    "unisons",
-    "unitage",
-    "unitard",
-    "uniters",
-    "unities",
-    "unitive",
-    "unitize",
-    "unjaded",
-    "unjoint",
-    "unkinks",
-    "unknits",
-    "unknots",
-    "unlaced",
-    "unlaces",
-    "unladed",
-    "unladen",
-    "unlades",
-    "unlatch",
-    "unleads",
-    "unlearn",
-    "unlevel",
-    "unliked",
-    "unlinks",
-    "unlived",
-    "unlives",
-    "unloads",
-    "unlobed",
-    "unloose",
-    "unmacho",
-    "unmaker",
-    "unmakes",
-    "unmanly",
-    "unmasks",
-    "unmated",
-    "unmeant",
-    "unmerry",
-    "unmewed",
-    "unmined",
-    "unmiter",
-    "unmitre",
-    "unmixes",
-    "unmolds",
-    "unmoors",
-    "unmoral",
-    "unnails",
-    "unnerve",
-    "unnoisy",
-    "unnoted",
-    "unoiled",
-    "unowned",
-    "unpacks",
-    "unpaged",
-    "unpicks",
-    "unpiled",
-    "unpiles",
-    "unplait",
-    "unplugs",
-    "unposed",
-    "unquiet",
-    "unraked",
-    "unrazed",
-    "unready",
-    "unreels",
-    "unreeve",
-    "unrests",
-    "unrimed",
-    "unriper",
-    "unrisen",
-    "unrobed",
-    "unrobes",
-    "unrolls",
-    "unroofs",
-    "unroots",
-    "unroped",
-    "unrough",
-    "unround",
-    "unroven",
-    "unruled",
-    "unsated",
-    "unsawed",
-    "unseals",
-    "unseams",
-    "unseats",
-    "unsells",
-    "unsewed",
-    "unsexed",
-    "unsexes",
-    "unsharp",
-    "unshell",
-    "unshift",
-    "unships",
-    "unshorn",
-    "unshowy",
-    "unsight",
-    "unsized",
-    "unslick",
-    "unsling",
-    "unslung",
-    "unsmart",
-    "unsnags",
-    "unsnaps",
-    "unsnarl",
-    "unsober",
-    "unsolid",
-    "unsoncy",
-    "unsonsy",
-    "unsowed",
-    "unspeak",
-    "unspilt",
-    "unsplit",
-    "unspoke",
-    "unspool",
-    "unstack",
-    "unstate",
-    "unsteel",
-    "unsteps",
-    "unstick",
-    "unstops",
-    "unstrap",
-    "unstuck",
-    "unstung",
-    "unswear",
-    "unswept",
-    "unswore",
-    "unsworn",
-    "untacks",
-    "untaken",
-    "unteach",
-    "unthink",
-    "untimed",
-    "untired",
-    "untrack",
-    "untread",
-    "untrims",
-    "untruer",
-    "untruly",
-    "untruss",
-    "untruth",
-    "untucks",
-    "untuned",
-    "untunes",
-    "untwine",
-    "untwist",
-    "untying",
-    "unurged",
-    "unvexed",
-    "unvocal",
-    "unvoice",
-    "unwaxed",
-    "unweary",
-    "unweave",
-    "unwhite",
-    "unwinds",
-    "unwiser",
-    "unwooed",
-    "unwound",
-    "unwoven",
-    "unwraps",
-    "unwrung",
-    "unyoked",
-    "unyokes",
-    "unyoung",
-    "unzoned",
-    "upbears",
-    "upbeats",
-    "upbinds",
-    "upboils",
-    "upborne",
-    "upbound",
-    "upbraid",
-    "upbuild",
-    "upbuilt",
-    "upcasts",
-    "upchuck",
-    "upclimb",
-    "upcoast",
-    "upcoils",
-    "upcourt",
-    "upcurls",
-    "upcurve",
-    "updarts",
-    "updived",
-    "updives",
-    "updraft",
-    "updried",
-    "updries",
-    "upended",
-    "upfield",
-    "upfling",
-    "upflows",
-    "upflung",
-    "upfolds",
-    "upgazed",
-    "upgazes",
-    "upgirds",
-    "upgoing",
-    "upgrown",
-    "upgrows",
-    "upheaps",
-    "upheave",
-    "uphills",
-    "uphoard",
-    "uphroes",
-    "upkeeps",
-    "upleaps",
-    "upleapt",
-    "uplifts",
-    "uplight",
-    "uplinks",
-    "uppiled",
-    "uppiles",
-    "uppings",
-    "upprops",
-    "upraise",
-    "uprated",
-    "uprates",
-    "upreach",
-    "uprears",
-    "uprisen",
-    "upriser",
-    "uprises",
-    "uproars",
-    "uproots",
-    "uprouse",
-    "upsends",
-    "upshift",
-    "upshoot",
-    "upshots",
-    "upsides",
-    "upsized",
-    "upsizes",
-    "upslope",
-    "upsoars",
-    "upstage",
-    "upstair",
-    "upstand",
-    "upstare",
-    "upsteps",
-    "upstirs",
-    "upstood",
-    "upsweep",
-    "upswell",
-    "upswept",
-    "upswung",
-    "uptakes",
-    "uptalks",
-    "uptears",
-    "upthrew",
-    "upthrow",
-    "upticks",
-    "uptilts",
-    "uptimes",
-    "uptowns",
-    "uptrend",
-    "upturns",
-    "upwafts",
-    "upwells",
-    "upwinds",
-    "uracils",
-    "uraemia",
-    "uraemic",
-    "uralite",
-    "uranias",
-    "uranide",
-    "uranism",
-    "uranite",
-    "uranous",
-    "uranyls",
-    "urbaner",
-    "ureases",
-    "uredial",
-    "uredium",
-    "ureides",
-    "uremias",
-    "ureters",
-    "urethan",
-    "urinose",
-    "urinous",
-    "urnlike",
-    "urodele",
-    "urolith",
-    "uropods",
-    "urtexts",
-    "usances",
-    "usaunce",
-    "useably",
-    "usurers",
-    "usuries",
-    "utmosts",
-    "utopias",
-    "utopism",
-    "utopist",
-    "utricle",
-    "utterer",
-    "uveitic",
-    "uvulars",
-    "uxorial",
-    "vacates",
-    "vaccina",
-    "vacuity",
-    "vagally",
-    "vaginae",
-    "vaguest",
-    "vahines",
-    "vailing",
-    "vainest",
-    "vakeels",
-    "valency",
-    "valeric",
-    "valeted",
-    "valgoid",
-    "valines",
-    "valises",
-    "valkyrs",
-    "vallate",
-    "valonia",
-    "valours",
-    "valuate",
-    "valutas",
-    "valvate",
-    "valving",
-    "valvula",
-    "valvule",
-    "vamoose",
-    "vamosed",
-    "vamoses",
-    "vampers",
-    "vampier",
-    "vamping",
-    "vampish",
-    "vanadic",
-    "vanload",
-    "vanners",
-    "vanning",
-    "vanward",
-    "vapidly",
-    "vapored",
-    "vaporer",
-    "vapoury",
-    "vaquero",
-    "variate",
-    "variers",
-    "variola",
-    "variole",
-    "varlets",
-    "varment",
-    "varooms",
-    "varuses",
-    "vascula",
-    "vassals",
-    "vastest",
-    "vastier",
-    "vastity",
-    "vatfuls",
-    "vatical",
-    "vatting",
-    "vaulter",
-    "vaunter",
-    "vauntie",
-    "vavasor",
-    "vawards",
-    "vawntie",
-    "vealers",
-    "vealier",
-    "vealing",
-    "vedalia",
-    "vedette",
-    "veejays",
-    "veepees",
-    "veeries",
-    "vegging",
-    "veilers",
-    "veiling",
-    "veiners",
-    "veinier",
-    "veining",
-    "veinlet",
-    "veinule",
-    "velamen",
-    "velaria",
-    "velcros",
-    "veliger",
-    "velites",
-    "vellums",
-    "velours",
-    "veloute",
-    "velured",
-    "velures",
-    "velvets",
-    "venally",
-    "venatic",
-    "vendace",
-    "vendees",
-    "venders",
-    "vendues",
-    "venenes",
-    "venging",
-    "venines",
-    "venires",
-    "venomed",
-    "venomer",
-    "ventage",
-    "ventail",
-    "venters",
-    "venular",
-    "venules",
-    "venuses",
-    "verbals",
-    "verbids",
-    "verbify",
-    "verbile",
-    "verdins",
-    "verdure",
-    "vergers",
-    "verging",
-    "verglas",
-    "veridic",
-    "veriest",
-    "verismo",
-    "verisms",
-    "verists",
-    "verites",
-    "vermian",
-    "vermuth",
-    "verruca",
-    "versant",
-    "versers",
-    "versets",
-    "versify",
-    "versine",
-    "versing",
-    "verstes",
-    "vervain",
-    "vervets",
-    "vesicae",
-    "vesical",
-    "vespids",
-    "vespine",
-    "vestals",
-    "vestees",
-    "vestral",
-    "vesture",
-    "vetches",
-    "vetoers",
-    "vetoing",
-    "vetters",
-    "vexedly",
-    "vexilla",
-    "vialing",
-    "vialled",
-    "viatica",
-    "viators",
-    "vibists",
-    "vibrion",
-    "vibrios",
-    "vicarly",
-    "vichies",
-    "vicinal",
-    "vicomte",
-    "victual",
-    "vicugna",
-    "vicunas",
-    "vidette",
-    "vidicon",
-    "viduity",
-    "viewier",
-    "vigours",
-    "vilayet",
-    "villein",
-    "villose",
-    "villous",
-    "viminal",
-    "vinasse",
-    "vincula",
-    "viniest",
-    "vintner",
-    "vinylic",
-    "violist",
-    "violone",
-    "viragos",
-    "virally",
-    "virelai",
-    "virelay",
-    "viremia",
-    "viremic",
-    "virgate",
-    "virgule",
-    "viroids",
-    "viroses",
-    "virosis",
-    "visaged",
-    "visages",
-    "visaing",
-    "visards",
-    "viscoid",
-    "viseing",
-    "visored",
-    "vistaed",
-    "vitamer",
-    "vitiate",
-    "vitrain",
-    "vitrics",
-    "vitrify",
-    "vitrine",
-    "vittate",
-    "vittled",
-    "vittles",
-    "vivaces",
-    "vivaria",
-    "vivider",
-    "vivific",
-    "vixenly",
-    "vizards",
-    "viziers",
-    "vizored",
-    "vizslas",
-    "vocable",
-    "vocably",
-    "vocalic",
-    "vodouns",
-    "voguers",
-    "voguing",
-    "voguish",
-    "voicers",
-    "voiders",
-    "volleys",
-    "volosts",
-    "voltaic",
-    "voluble",
-    "volubly",
-    "volumed",
-    "voluted",
-    "volutes",
-    "volutin",
-    "volvate",
-    "volvuli",
-    "vomicae",
-    "vomiter",
-    "vomitos",
-    "vomitus",
-    "voodoos",
-    "vorlage",
-    "votable",
-    "votress",
-    "vouched",
-    "vouchee",
-    "vouches",
-    "voudons",
-    "voudoun",
-    "vouvray",
-    "vowless",
-    "voyaged",
-    "vroomed",
-    "vuggier",
-    "vulgars",
-    "vulpine",
-    "vulvate",
-    "vyingly",
-    "wabbled",
-    "wabbler",
-    "wabbles",
-    "wackest",
-    "wackier",
-    "wackily",
-    "wadable",
-    "wadders",
-    "waddied",
-    "waddies",
-    "wadding",
-    "waddled",
-    "waddler",
-    "waddles",
-    "wadmaal",
-    "wadmals",
-    "wadmels",
-    "wadmoll",
-    "wadmols",
-    "wadsets",
-    "waeness",
-    "waesuck",
-    "wafered",
-    "waffies",
-    "waffing",
-    "waffled",
-    "waffler",
-    "waftage",
-    "wafters",
-    "wafting",
-    "wafture",
-    "wagerer",
-    "waggers",
-    "waggery",
-    "waggish",
-    "waggled",
-    "waggles",
-    "waggons",
-    "wagoned",
-    "wagsome",
-    "wahines",
-    "waifing",
-    "waifish",
-    "wailful",
-    "wairing",
-    "waister",
-    "waitron",
-    "wakames",
-    "wakanda",
-    "wakeful",
-    "wakened",
-    "wakener",
-    "wakikis",
-    "walkups",
-    "wallahs",
-    "wallows",
-    "waltzed",
-    "waltzer",
-    "wambled",
-    "wambles",
-    "wamefou",
-    "wameful",
-    "wampish",
-    "wampums",
-    "wamuses",
-    "wangans",
-    "wangled",
-    "wangler",
-    "wangles",
-    "wanguns",
-    "waniest",
-    "wanigan",
-    "wanions",
-    "wanness",
-    "wannest",
-    "wanning",
-    "wanters",
-    "wantons",
-    "wapitis",
-    "warbled",
-    "warbles",
-    "warders",
-    "warding",
-    "wariest",
-    "warison",
-    "warking",
-    "warless",
-    "warmish",
-    "warmths",
-    "warmups",
-    "warpage",
-    "warpath",
-    "warpers",
-    "warrens",
-    "warsaws",
-    "warsled",
-    "warsler",
-    "warsles",
-    "warstle",
-    "wartier",
-    "warwork",
-    "warworn",
-    "wasabis",
-    "washday",
-    "washier",
-    "washrag",
-    "washtub",
-    "washups",
-    "waspier",
-    "waspily",
-    "waspish",
-    "wassail",
-    "wastery",
-    "wastrel",
-    "wastrie",
-    "watapes",
-    "waterer",
-    "wattape",
-    "wattest",
-    "wattled",
-    "wattles",
-    "wauchts",
-    "waughts",
-    "wauking",
-    "wauling",
-    "waveoff",
-    "waverer",
-    "wavicle",
-    "waviest",
-    "wawling",
-    "waxable",
-    "waxbill",
-    "waxiest",
-    "waxings",
-    "waxlike",
-    "waxweed",
-    "waxwing",
-    "waxwork",
-    "waxworm",
-    "waybill",
-    "waylaid",
-    "waylays",
-    "wayless",
-    "wayworn",
-    "weakish",
-    "weakons",
-    "wealths",
-    "weaners",
-    "wearier",
-    "wearies",
-    "wearish",
-    "weasand",
-    "weasely",
-    "weasons",
-    "weazand",
-    "webbier",
-    "webfeet",
-    "webfoot",
-    "webless",
-    "weblike",
-    "webworm",
-    "wedders",
-    "wedeled",
-    "wedelns",
-    "wedgier",
-    "wedgies",
-    "wedging",
-    "weeders",
-    "weedier",
-    "weedily",
-    "weenier",
-    "weenies",
-    "weening",
-    "weepers",
-    "weepier",
-    "weepies",
-    "weeting",
-    "weevers",
-    "weevily",
-    "weeweed",
-    "weewees",
-    "weigela",
-    "weigher",
-    "weiners",
-    "weirded",
-    "weirdie",
-    "welched",
-    "welcher",
-    "weldors",
-    "welkins",
-    "welshed",
-    "welsher",
-    "welshes",
-    "welters",
-    "welting",
-    "wenched",
-    "wencher",
-    "wenches",
-    "wendigo",
-    "wending",
-    "wennier",
-    "wennish",
-    "wergeld",
-    "wergelt",
-    "wergild",
-    "werwolf",
-    "weskits",
-    "wessand",
-    "westers",
-    "westing",
-    "wetback",
-    "wethers",
-    "wetters",
-    "wettish",
-    "wetware",
-    "whacker",
-    "whackos",
-    "whammed",
-    "whanged",
-    "whangee",
-    "whapped",
-    "whapper",
-    "wharfed",
-    "whatsis",
-    "whatsit",
-    "wheedle",
-    "wheeped",
-    "wheeple",
-    "wheezed",
-    "wheezer",
-    "wheezes",
-    "whelmed",
-    "whelped",
-    "whereat",
-    "whereto",
-    "wherves",
-    "whetted",
-    "whetter",
-    "wheyish",
-    "whicker",
-    "whidahs",
-    "whidded",
-    "whiffed",
-    "whiffer",
-    "whiffet",
-    "whiffle",
-    "whiling",
-    "whimsey",
-    "whinged",
-    "whinger",
-    "whinges",
-    "whinier",
-    "whipper",
-    "whipray",
-    "whipsaw",
-    "whirler",
-    "whirred",
-    "whished",
-    "whishes",
-    "whishts",
-    "whisted",
-    "whitely",
-    "whitens",
-    "whitest",
-    "whiteys",
-    "whitier",
-    "whities",
-    "whitlow",
-    "whitter",
-    "whizzed",
-    "whizzer",
-    "whizzes",
-    "wholism",
-    "whomped",
-    "whoofed",
-    "whooped",
-    "whooper",
-    "whoopie",
-    "whoopla",
-    "whoosis",
-    "whopped",
-    "whorish",
-    "whorled",
-    "whortle",
-    "whumped",
-    "whupped",
-    "whydahs",
-    "wickape",
-    "wickers",
-    "wickiup",
-    "wickyup",
-    "widders",
-    "widdies",
-    "widdled",
-    "widdles",
-    "wideout",
-    "widgeon",
-    "wielder",
-    "wieners",
-    "wienies",
-    "wifedom",
-    "wiftier",
-    "wigeons",
-    "wiggery",
-    "wiggier",
-    "wigging",
-    "wiggled",
-    "wiggler",
-    "wigless",
-    "wiglets",
-    "wiglike",
-    "wigwags",
-    "wigwams",
-    "wikiups",
-    "wildish",
-    "wiliest",
-    "willers",
-    "willets",
-    "willied",
-    "willowy",
-    "wimbled",
-    "wimbles",
-    "wimpier",
-    "wimping",
-    "wimpish",
-    "wimpled",
-    "wimples",
-    "wincers",
-    "winceys",
-    "winched",
-    "wincher",
-    "wincing",
-    "windage",
-    "windbag",
-    "windier",
-    "windigo",
-    "windily",
-    "windled",
-    "windles",
-    "windowy",
-    "windrow",
-    "windups",
-    "windway",
-    "winesap",
-    "winesop",
-    "wingbow",
-    "wingier",
-    "winging",
-    "winglet",
-    "wingmen",
-    "wingtip",
-    "winiest",
-    "winkers",
-    "winkled",
-    "winkles",
-    "winnock",
-    "winnows",
-    "wintery",
-    "wintled",
-    "wintles",
-    "wirable",
-    "wireman",
-    "wiremen",
-    "wireway",
-    "wiriest",
-    "wirings",
-    "wisdoms",
-    "wiseass",
-    "wisents",
-    "wispier",
-    "wispily",
-    "wisping",
-    "wispish",
-    "wissing",
-    "wisting",
-    "witched",
-    "withier",
-    "withies",
-    "withins",
-    "witless",
-    "witling",
-    "witloof",
-    "witneys",
-    "wittier",
-    "wittily",
-    "witting",
-    "wittols",
-    "wiverns",
-    "wizened",
-    "wizzens",
-    "woadwax",
-    "wobbled",
-    "wobbles",
-    "woeness",
-    "woesome",
-    "wofully",
-    "woggish",
-    "wolfers",
-    "wolfing",
-    "wolfish",
-    "wolvers",
-    "womaned",
-    "wombats",
-    "wombier",
-    "womeras",
-    "wommera",
-    "wonkier",
-    "wonners",
-    "wonning",
-    "wonting",
-    "wontons",
-    "woodbin",
-    "woodbox",
-    "woodhen",
-    "woodier",
-    "wooding",
-    "woodmen",
-    "woodsia",
-    "woodwax",
-    "woofing",
-    "woolens",
-    "woolers",
-    "woolhat",
-    "woolier",
-    "woolies",
-    "woolled",
-    "woolman",
-    "woolmen",
-    "woomera",
-    "woopsed",
-    "woopses",
-    "woorali",
-    "woorari",
-    "wooshed",
-    "wooshes",
-    "woozier",
-    "woozily",
-    "wordage",
-    "wordier",
-    "wordily",
-    "workbag",
-    "workbox",
-    "workups",
-    "wormers",
-    "wormier",
-    "wormils",
-    "worming",
-    "wormish",
-    "worrier",
-    "worrits",
-    "worsets",
-    "worthed",
-    "wotting",
-    "wowsers",
-    "wraiths",
-    "wrasses",
-    "wrassle",
-    "wrastle",
-    "wrathed",
-    "wreaker",
-    "wreathe",
-    "wreathy",
-    "wrested",
-    "wricked",
-    "wriggle",
-    "wriggly",
-    "wringed",
-    "wringer",
-    "writhed",
-    "writhen",
-    "writher",
-    "writhes",
-    "wronger",
-    "wryneck",
-    "wryness",
-    "wurzels",
-    "wussier",
-    "wussies",
-    "wuthers",
-    "wyverns",
-    "xanthic",
-    "xanthin",
-    "xerarch",
-    "xeroses",
-    "xerosis",
-    "xerotic",
-    "xeroxed",
-    "xeroxes",
-    "xeruses",
-    "xiphoid",
-    "xylenes",
-    "xylidin",
-    "xyloses",
-    "xysters",
-    "yabbers",
-    "yabbies",
-    "yachted",
-    "yachter",
-    "yacking",
-    "yaffing",
-    "yakkers",
-    "yakking",
-    "yamalka",
-    "yammers",
-    "yamulka",
-    "yanquis",
-    "yantras",
-    "yapocks",
-    "yappers",
-    "yapping",
-    "yardarm",
-    "yarders",
-    "yarding",
-    "yardman",
-    "yardmen",
-    "yarners",
-    "yarning",
-    "yarrows",
-    "yashmac",
-    "yashmak",
-    "yasmaks",
-    "yatagan",
-    "yatters",
-    "yaupers",
-    "yauping",
-    "yaupons",
-    "yautias",
-    "yawling",
-    "yawners",
-    "yawpers",
-    "yawping",
-    "ycleped",
-    "yealing",
-    "yeaning",
-    "yearend",
-    "yearner",
-    "yeasted",
-    "yeelins",
-    "yeggman",
-    "yeggmen",
-    "yellers",
-    "yellowy",
-    "yelpers",
-    "yelping",
-    "yenning",
-    "yerking",
-    "yessing",
-    "yestern",
-    "yeuking",
-    "yielder",
-    "yippies",
-    "yipping",
-    "yirring",
-    "yobboes",
-    "yocking",
-    "yodeled",
-    "yodeler",
-    "yodlers",
-    "yodling",
-    "yoginis",
-    "yogurts",
-    "yolkier",
-    "younker",
-    "youpons",
-    "youthen",
-    "yowlers",
-    "yowling",
-    "yperite",
-    "yttrias",
-    "yuckier",
-    "yucking",
-    "yukkier",
-    "yukking",
-    "yummier",
-    "yummies",
-    "yuppify",
-    "zacaton",
-    "zaddick",
-    "zaffars",
-    "zaffers",
-    "zaffirs",
-    "zaffres",
-    "zagging",
-    "zaikais",
-    "zamarra",
-    "zamarro",
-    "zananas",
-    "zanders",
-    "zaniest",
-    "zanyish",
-    "zapateo",
-    "zappers",
-    "zappier",
-    "zaptiah",
-    "zaptieh",
-    "zarebas",
-    "zareeba",
-    "zaribas",
-    "zeatins",
-    "zebecks",
-    "zebraic",
-    "zebrano",
-    "zebrass",
-    "zebrine",
-    "zebroid",
-    "zecchin",
-    "zechins",
-    "zedoary",
-    "zelkova",
-    "zemstva",
-    "zemstvo",
-    "zenaida",
-    "zenanas",
-    "zeniths",
-    "zephyrs",
-    "zeppole",
-    "zeppoli",
-    "zesters",
-    "zestful",
-    "zestier",
-    "zestily",
-    "zesting",
-    "zeugmas",
-    "zibeths",
-    "zigging",
-    "zigzags",
-    "zikurat",
-    "zilches",
-    "zillahs",
-    "zincate",
-    "zincify",
-    "zincing",
-    "zincite",
-    "zincked",
-    "zincoid",
-    "zincous",
-    "zingani",
-    "zingano",
-    "zingara",
-    "zingare",
-    "zingari",
-    "zingaro",
-    "zingers",
-    "zingier",
-    "zinging",
-    "zinkify",
-    "zinnias",
-    "zipless",
-    "zippier",
-    "zircons",
-    "zithern",
-    "zithers",
-    "zizzled",
-    "zizzles",
-    "zloties",
-    "zlotych",
-    "zoarial",
-    "zoarium",
-    "zocalos",
-    "zodiacs",
-    "zoecium",
-    "zoisite",
-    "zombify",
-    "zonally",
-    "zonated",
-    "zonking",
-    "zonulae",
-    "zonular",
-    "zonulas",
-    "zonules",
-    "zooecia",
-    "zoogeny",
-    "zooglea",
-    "zooidal",
-    "zooiest",
-    "zooning",
-    "zootier",
-    "zootomy",
-    "zorilla",
-    "zorille",
-    "zorillo",
-    "zosters",
-    "zouaves",
-    "zoysias",
-    "zydecos",
-    "zygomas",
-    "zygoses",
-    "zygosis",
-    "zygotes",
-    "zygotic",
-    "zymases",
-    "zymogen",
-    "zymosan",
-    "zymoses",
-    "zymosis",
-    "zymotic",
-    "zymurgy",
-    "zyzzyva",
-]
@@ -1,29768 +0,0 @@
-WORDS = [
-    "business",
-    "services",
-    "products",
-    "software",
-    "research",
-    "comments",
-    "national",
-    "shipping",
-    "reserved",
-    "security",
-    "computer",
-    "download",
-    "pictures",
-    "personal",
-    "location",
-    "children",
-    "students",
-    "shopping",
-    "previous",
-    "property",
-    "customer",
-    "training",
-    "advanced",
-    "category",
-    "register",
-    "features",
-    "industry",
-    "provided",
-    "required",
-    "articles",
-    "feedback",
-    "complete",
-    "standard",
-    "programs",
-    "language",
-    "password",
-    "question",
-    "building",
-    "analysis",
-    "possible",
-    "problems",
-    "interest",
-    "learning",
-    "delivery",
-    "original",
-    "includes",
-    "messages",
-    "provides",
-    "specific",
-    "director",
-    "planning",
-    "database",
-    "official",
-    "district",
-    "calendar",
-    "resource",
-    "document",
-    "material",
-    "together",
-    "function",
-    "economic",
-    "projects",
-    "included",
-    "received",
-    "archives",
-    "magazine",
-    "policies",
-    "position",
-    "listings",
-    "wireless",
-    "purchase",
-    "response",
-    "practice",
-    "hardware",
-    "designed",
-    "discount",
-    "remember",
-    "increase",
-    "activity",
-    "although",
-    "contents",
-    "regional",
-    "supplies",
-    "exchange",
-    "continue",
-    "benefits",
-    "anything",
-    "mortgage",
-    "solution",
-    "addition",
-    "clothing",
-    "homepage",
-    "military",
-    "decision",
-    "division",
-    "actually",
-    "starting",
-    "consumer",
-    "contract",
-    "releases",
-    "multiple",
-    "featured",
-    "friendly",
-    "schedule",
-    "everyone",
-    "approach",
-    "physical",
-    "medicine",
-    "evidence",
-    "favorite",
-    "recently",
-    "probably",
-    "networks",
-    "transfer",
-    "hospital",
-    "overview",
-    "distance",
-    "involved",
-    "partners",
-    "existing",
-    "selected",
-    "patients",
-    "directly",
-    "searches",
-    "strategy",
-    "teaching",
-    "positive",
-    "football",
-    "abstract",
-    "contains",
-    "republic",
-    "vacation",
-    "academic",
-    "graphics",
-    "expected",
-    "mountain",
-    "consider",
-    "northern",
-    "proposed",
-    "reported",
-    "politics",
-    "modified",
-    "released",
-    "internal",
-    "detailed",
-    "approved",
-    "southern",
-    "yourself",
-    "pressure",
-    "keywords",
-    "purposes",
-    "external",
-    "teachers",
-    "subjects",
-    "capacity",
-    "requires",
-    "electric",
-    "creative",
-    "progress",
-    "families",
-    "accepted",
-    "agencies",
-    "critical",
-    "employee",
-    "packages",
-    "colorado",
-    "relevant",
-    "elements",
-    "facility",
-    "minister",
-    "visitors",
-    "coverage",
-    "clinical",
-    "sciences",
-    "currency",
-    "commerce",
-    "accounts",
-    "settings",
-    "cultural",
-    "holidays",
-    "graduate",
-    "thinking",
-    "hardcore",
-    "provider",
-    "optional",
-    "sections",
-    "websites",
-    "religion",
-    "measures",
-    "chemical",
-    "exercise",
-    "meetings",
-    "congress",
-    "username",
-    "produced",
-    "argument",
-    "creating",
-    "attorney",
-    "auctions",
-    "informed",
-    "thoughts",
-    "quantity",
-    "platform",
-    "machines",
-    "recovery",
-    "merchant",
-    "vehicles",
-    "campaign",
-    "examples",
-    "intended",
-    "election",
-    "requests",
-    "separate",
-    "identify",
-    "domestic",
-    "extended",
-    "sequence",
-    "movement",
-    "printing",
-    "baseball",
-    "approval",
-    "contacts",
-    "matching",
-    "offering",
-    "variable",
-    "compared",
-    "workshop",
-    "lighting",
-    "portable",
-    "returned",
-    "warranty",
-    "assembly",
-    "criminal",
-    "powerful",
-    "obtained",
-    "supplied",
-    "opinions",
-    "maintain",
-    "priority",
-    "payments",
-    "straight",
-    "prepared",
-    "criteria",
-    "behavior",
-    "changing",
-    "festival",
-    "whatever",
-    "eligible",
-    "checkout",
-    "handling",
-    "followed",
-    "protocol",
-    "designer",
-    "marriage",
-    "negative",
-    "ministry",
-    "proposal",
-    "birthday",
-    "slightly",
-    "lingerie",
-    "profiles",
-    "controls",
-    "breaking",
-    "combined",
-    "ultimate",
-    "reviewed",
-    "forecast",
-    "accuracy",
-    "pharmacy",
-    "creation",
-    "chairman",
-    "violence",
-    "speakers",
-    "cleaning",
-    "concerns",
-    "officers",
-    "referred",
-    "supports",
-    "presence",
-    "majority",
-    "strength",
-    "daughter",
-    "standing",
-    "ordering",
-    "bookmark",
-    "specials",
-    "improved",
-    "exposure",
-    "gambling",
-    "outdoors",
-    "printers",
-    "interior",
-    "relative",
-    "identity",
-    "victoria",
-    "revision",
-    "instance",
-    "licensed",
-    "recorded",
-    "finished",
-    "discover",
-    "patterns",
-    "stations",
-    "greatest",
-    "operator",
-    "tracking",
-    "accurate",
-    "managing",
-    "happened",
-    "lesbians",
-    "managers",
-    "aircraft",
-    "conflict",
-    "versions",
-    "employer",
-    "describe",
-    "citizens",
-    "heritage",
-    "audience",
-    "assigned",
-    "directed",
-    "sporting",
-    "affected",
-    "expenses",
-    "indicate",
-    "diseases",
-    "advisory",
-    "template",
-    "anywhere",
-    "investor",
-    "wildlife",
-    "speaking",
-    "sponsors",
-    "checking",
-    "guidance",
-    "observed",
-    "glossary",
-    "channels",
-    "appendix",
-    "supplier",
-    "notebook",
-    "explorer",
-    "historic",
-    "attached",
-    "disabled",
-    "upcoming",
-    "constant",
-    "concepts",
-    "relating",
-    "alliance",
-    "engineer",
-    "becoming",
-    "relation",
-    "colleges",
-    "brothers",
-    "presents",
-    "estimate",
-    "bulletin",
-    "painting",
-    "universe",
-    "watching",
-    "sterling",
-    "sessions",
-    "journals",
-    "terminal",
-    "properly",
-    "hundreds",
-    "tomorrow",
-    "visiting",
-    "downtown",
-    "keyboard",
-    "suitable",
-    "millions",
-    "findings",
-    "clicking",
-    "province",
-    "catholic",
-    "governor",
-    "swimming",
-    "reliable",
-    "symptoms",
-    "memorial",
-    "fighting",
-    "pregnant",
-    "cellular",
-    "normally",
-    "diabetes",
-    "flexible",
-    "numerous",
-    "superior",
-    "spending",
-    "magnetic",
-    "registry",
-    "employed",
-    "displays",
-    "allowing",
-    "earnings",
-    "counties",
-    "occurred",
-    "concrete",
-    "accident",
-    "resident",
-    "possibly",
-    "flashing",
-    "antiques",
-    "parallel",
-    "bathroom",
-    "drinking",
-    "blowjobs",
-    "reaction",
-    "enhanced",
-    "entitled",
-    "generate",
-    "monitors",
-    "duration",
-    "pursuant",
-    "contrast",
-    "adoption",
-    "measured",
-    "marshall",
-    "thousand",
-    "tutorial",
-    "valuable",
-    "airlines",
-    "aviation",
-    "disaster",
-    "commands",
-    "achieved",
-    "injuries",
-    "appeared",
-    "franklin",
-    "exciting",
-    "pleasure",
-    "oriented",
-    "desktops",
-    "producer",
-    "semester",
-    "strongly",
-    "proteins",
-    "familiar",
-    "carrying",
-    "editions",
-    "vertical",
-    "absolute",
-    "consists",
-    "soldiers",
-    "guardian",
-    "classics",
-    "bringing",
-    "evaluate",
-    "tropical",
-    "pipeline",
-    "everyday",
-    "handbook",
-    "navigate",
-    "somewhat",
-    "receiver",
-    "covering",
-    "platinum",
-    "judgment",
-    "bedrooms",
-    "modeling",
-    "spectrum",
-    "emphasis",
-    "princess",
-    "entering",
-    "memories",
-    "adequate",
-    "cartoons",
-    "entirely",
-    "replaced",
-    "reducing",
-    "shooting",
-    "launched",
-    "suggests",
-    "operated",
-    "overseas",
-    "surprise",
-    "shoppers",
-    "supposed",
-    "ordinary",
-    "applying",
-    "reporter",
-    "champion",
-    "sentence",
-    "outcomes",
-    "survival",
-    "whenever",
-    "lifetime",
-    "athletic",
-    "traveler",
-    "aluminum",
-    "trailers",
-    "syndrome",
-    "expanded",
-    "believed",
-    "spanking",
-    "catering",
-    "incident",
-    "dynamics",
-    "decrease",
-    "revenues",
-    "emerging",
-    "churches",
-    "reserves",
-    "minority",
-    "recorder",
-    "seminars",
-    "paradise",
-    "compiled",
-    "romantic",
-    "revealed",
-    "portions",
-    "equation",
-    "reviewer",
-    "involves",
-    "earrings",
-    "chapters",
-    "literary",
-    "choosing",
-    "boundary",
-    "believes",
-    "deadline",
-    "equipped",
-    "acquired",
-    "entrance",
-    "attempts",
-    "answered",
-    "disorder",
-    "firewall",
-    "animated",
-    "judicial",
-    "bachelor",
-    "attitude",
-    "genetics",
-    "attended",
-    "embedded",
-    "brochure",
-    "petition",
-    "shoulder",
-    "diameter",
-    "literacy",
-    "moderate",
-    "opposite",
-    "receives",
-    "veterans",
-    "occasion",
-    "sleeping",
-    "moreover",
-    "dialogue",
-    "declared",
-    "handheld",
-    "disposal",
-    "florists",
-    "switches",
-    "blogging",
-    "midnight",
-    "commonly",
-    "pleasant",
-    "announce",
-    "sampling",
-    "inspired",
-    "weddings",
-    "suddenly",
-    "township",
-    "rankings",
-    "remained",
-    "entities",
-    "roulette",
-    "medicare",
-    "explains",
-    "feelings",
-    "freeware",
-    "donation",
-    "targeted",
-    "realized",
-    "climbing",
-    "somebody",
-    "archived",
-    "courtesy",
-    "detected",
-    "bracelet",
-    "juvenile",
-    "acoustic",
-    "cassette",
-    "steering",
-    "cemetery",
-    "gangbang",
-    "contests",
-    "adjusted",
-    "seasonal",
-    "counters",
-    "cultures",
-    "coaching",
-    "examined",
-    "encoding",
-    "cosmetic",
-    "resulted",
-    "portrait",
-    "carriers",
-    "mobility",
-    "builders",
-    "struggle",
-    "crossing",
-    "resolved",
-    "branches",
-    "holdings",
-    "browsing",
-    "bargains",
-    "frequent",
-    "ensuring",
-    "diamonds",
-    "untitled",
-    "starring",
-    "referral",
-    "distinct",
-    "verified",
-    "formerly",
-    "situated",
-    "strictly",
-    "retailer",
-    "vitamins",
-    "interval",
-    "repeated",
-    "filename",
-    "florence",
-    "analyses",
-    "drawings",
-    "scenario",
-    "junction",
-    "weekends",
-    "produces",
-    "adapters",
-    "adjacent",
-    "reaching",
-    "receptor",
-    "surgical",
-    "citation",
-    "premises",
-    "imperial",
-    "benjamin",
-    "studying",
-    "upgrades",
-    "offshore",
-    "emission",
-    "apparent",
-    "outreach",
-    "mounting",
-    "balanced",
-    "explicit",
-    "precious",
-    "annually",
-    "scanners",
-    "delivers",
-    "necklace",
-    "arranged",
-    "theaters",
-    "advocacy",
-    "threaded",
-    "footwear",
-    "licenses",
-    "removing",
-    "isolated",
-    "assisted",
-    "compound",
-    "abortion",
-    "wellness",
-    "membrane",
-    "previews",
-    "exterior",
-    "greeting",
-    "velocity",
-    "composed",
-    "baseline",
-    "electron",
-    "passport",
-    "treasury",
-    "occupied",
-    "observer",
-    "sunshine",
-    "ceremony",
-    "arrested",
-    "homework",
-    "assessed",
-    "enabling",
-    "stronger",
-    "advances",
-    "darkness",
-    "rejected",
-    "railroad",
-    "lectures",
-    "cheapest",
-    "preserve",
-    "vibrator",
-    "unsigned",
-    "theories",
-    "executed",
-    "showcase",
-    "integral",
-    "synopsis",
-    "composer",
-    "accessed",
-    "imported",
-    "contrary",
-    "focusing",
-    "admitted",
-    "equality",
-    "stickers",
-    "concerts",
-    "updating",
-    "readings",
-    "confused",
-    "compiler",
-    "airports",
-    "brunette",
-    "gathered",
-    "notified",
-    "dramatic",
-    "surfaces",
-    "terrible",
-    "reflects",
-    "taxation",
-    "treasure",
-    "assuming",
-    "monetary",
-    "floating",
-    "warnings",
-    "stunning",
-    "actively",
-    "cookbook",
-    "uploaded",
-    "collapse",
-    "unlikely",
-    "beverage",
-    "forestry",
-    "barriers",
-    "infected",
-    "particle",
-    "minerals",
-    "humidity",
-    "operates",
-    "missions",
-    "costumes",
-    "nickname",
-    "staffing",
-    "playlist",
-    "statutes",
-    "enrolled",
-    "publicly",
-    "reseller",
-    "suffered",
-    "informal",
-    "swingers",
-    "mistakes",
-    "defining",
-    "counting",
-    "medieval",
-    "captured",
-    "innocent",
-    "scanning",
-    "cordless",
-    "disagree",
-    "episodes",
-    "circular",
-    "mainland",
-    "interact",
-    "geometry",
-    "gorgeous",
-    "plumbing",
-    "shanghai",
-    "organize",
-    "triangle",
-    "oriental",
-    "hydrogen",
-    "advocate",
-    "artistic",
-    "detector",
-    "colonial",
-    "proceeds",
-    "indirect",
-    "browsers",
-    "overcome",
-    "reminder",
-    "searched",
-    "insights",
-    "exhibits",
-    "bacteria",
-    "moisture",
-    "launches",
-    "latitude",
-    "deposits",
-    "mistress",
-    "trustees",
-    "reprints",
-    "midlands",
-    "analysts",
-    "invasion",
-    "spelling",
-    "medicaid",
-    "infrared",
-    "quarters",
-    "naturals",
-    "fixtures",
-    "bloggers",
-    "flooring",
-    "athletes",
-    "humanity",
-    "scholars",
-    "snapshot",
-    "segments",
-    "dominant",
-    "minimize",
-    "fraction",
-    "emirates",
-    "promised",
-    "bookings",
-    "fabulous",
-    "maritime",
-    "periodic",
-    "overhead",
-    "prospect",
-    "shipment",
-    "breeding",
-    "envelope",
-    "homeland",
-    "excluded",
-    "emotions",
-    "incoming",
-    "cleaners",
-    "cashiers",
-    "rotation",
-    "premiere",
-    "villages",
-    "symphony",
-    "rational",
-    "fighters",
-    "chambers",
-    "fountain",
-    "regarded",
-    "egyptian",
-    "outlined",
-    "headline",
-    "treating",
-    "enormous",
-    "cabinets",
-    "wrapping",
-    "timeline",
-    "infinite",
-    "civilian",
-    "realtors",
-    "wherever",
-    "democrat",
-    "retained",
-    "briefing",
-    "highland",
-    "consoles",
-    "cylinder",
-    "surround",
-    "finances",
-    "enjoying",
-    "carnival",
-    "promises",
-    "combines",
-    "speeches",
-    "catalogs",
-    "savannah",
-    "pointing",
-    "circuits",
-    "handbags",
-    "somerset",
-    "incurred",
-    "roommate",
-    "failures",
-    "theology",
-    "retrieve",
-    "titanium",
-    "postings",
-    "basement",
-    "sandwich",
-    "hearings",
-    "textbook",
-    "frontier",
-    "stopping",
-    "refugees",
-    "peaceful",
-    "doctrine",
-    "trainers",
-    "conclude",
-    "advisors",
-    "pavilion",
-    "talented",
-    "boutique",
-    "homeless",
-    "horrible",
-    "metallic",
-    "warriors",
-    "parental",
-    "marathon",
-    "pressing",
-    "gasoline",
-    "warcraft",
-    "catalyst",
-    "analyzed",
-    "remedies",
-    "validity",
-    "weighted",
-    "performs",
-    "plastics",
-    "salaries",
-    "postcard",
-    "elephant",
-    "drainage",
-    "clearing",
-    "routines",
-    "reliance",
-    "striking",
-    "ensemble",
-    "biblical",
-    "prostate",
-    "nitrogen",
-    "softball",
-    "musician",
-    "blocking",
-    "limiting",
-    "dispatch",
-    "restored",
-    "chargers",
-    "rendered",
-    "openings",
-    "councils",
-    "cottages",
-    "develops",
-    "dressing",
-    "drilling",
-    "tomatoes",
-    "clusters",
-    "antibody",
-    "momentum",
-    "grateful",
-    "laughing",
-    "opponent",
-    "manually",
-    "centered",
-    "writings",
-    "charging",
-    "discrete",
-    "beginner",
-    "sapphire",
-    "declined",
-    "neighbor",
-    "highways",
-    "intimate",
-    "dentists",
-    "variance",
-    "adaptive",
-    "computed",
-    "generous",
-    "learners",
-    "educated",
-    "inserted",
-    "suburban",
-    "survivor",
-    "cingular",
-    "impaired",
-    "ventures",
-    "stranger",
-    "tribunal",
-    "pensions",
-    "mattress",
-    "likewise",
-    "charming",
-    "annoying",
-    "disclose",
-    "restrict",
-    "springer",
-    "endorsed",
-    "maximize",
-    "senators",
-    "bleeding",
-    "optimize",
-    "engaging",
-    "deferred",
-    "polished",
-    "flashers",
-    "arrivals",
-    "securely",
-    "promoted",
-    "enclosed",
-    "thriller",
-    "transmit",
-    "planners",
-    "disputes",
-    "textiles",
-    "intranet",
-    "aquarium",
-    "promptly",
-    "sexually",
-    "dividend",
-    "playback",
-    "hometown",
-    "handmade",
-    "workflow",
-    "switched",
-    "hardwood",
-    "temporal",
-    "airplane",
-    "asbestos",
-    "throwing",
-    "potatoes",
-    "thorough",
-    "creature",
-    "firmware",
-    "shepherd",
-    "sympathy",
-    "avoiding",
-    "surgeons",
-    "promotes",
-    "prisoner",
-    "earliest",
-    "examines",
-    "knitting",
-    "attacked",
-    "smallest",
-    "monsters",
-    "cocktail",
-    "prevents",
-    "severity",
-    "licensee",
-    "bisexual",
-    "tourists",
-    "packaged",
-    "seconded",
-    "activate",
-    "crystals",
-    "cardinal",
-    "claiming",
-    "brackets",
-    "wetlands",
-    "twilight",
-    "improves",
-    "deciding",
-    "landlord",
-    "assorted",
-    "vouchers",
-    "turnover",
-    "upgraded",
-    "colorful",
-    "amateurs",
-    "deployed",
-    "governed",
-    "protects",
-    "crescent",
-    "freshman",
-    "patience",
-    "securing",
-    "tactical",
-    "maturity",
-    "receipts",
-    "formulas",
-    "spacious",
-    "sometime",
-    "faithful",
-    "invested",
-    "numbered",
-    "founding",
-    "planting",
-    "covenant",
-    "dropping",
-    "calories",
-    "fittings",
-    "einstein",
-    "diagrams",
-    "headsets",
-    "vascular",
-    "toxicity",
-    "relaxing",
-    "slipknot",
-    "uniforms",
-    "residual",
-    "asterisk",
-    "probable",
-    "issuance",
-    "arriving",
-    "unstable",
-    "woodland",
-    "inactive",
-    "traveled",
-    "carriage",
-    "postcode",
-    "withdraw",
-    "landmark",
-    "lacrosse",
-    "unwanted",
-    "defeated",
-    "dwelling",
-    "symbolic",
-    "stocking",
-    "balloons",
-    "welcomed",
-    "infinity",
-    "notation",
-    "chandler",
-    "semantic",
-    "complain",
-    "adhesive",
-    "altitude",
-    "infantry",
-    "renowned",
-    "corridor",
-    "inherent",
-    "alphabet",
-    "tailored",
-    "pendants",
-    "backyard",
-    "pathways",
-    "newsroom",
-    "monument",
-    "taxpayer",
-    "formally",
-    "lavender",
-    "doctoral",
-    "backpack",
-    "outgoing",
-    "tendency",
-    "utilized",
-    "initiate",
-    "elevated",
-    "outlines",
-    "steroids",
-    "critique",
-    "honestly",
-    "upstream",
-    "listened",
-    "sediment",
-    "survived",
-    "spinning",
-    "pentagon",
-    "spectral",
-    "diabetic",
-    "stressed",
-    "fragment",
-    "finishes",
-    "lecturer",
-    "credited",
-    "recycled",
-    "followup",
-    "blankets",
-    "weakness",
-    "reminded",
-    "molecule",
-    "piercing",
-    "homemade",
-    "marginal",
-    "efficacy",
-    "prestige",
-    "pinnacle",
-    "unbiased",
-    "culinary",
-    "auditing",
-    "offender",
-    "waterloo",
-    "boarding",
-    "daylight",
-    "catching",
-    "connects",
-    "explores",
-    "liberals",
-    "aperture",
-    "coupling",
-    "oncology",
-    "orthodox",
-    "holistic",
-    "umbrella",
-    "headache",
-    "feasible",
-    "perfumes",
-    "mechanic",
-    "deletion",
-    "elective",
-    "forensic",
-    "ceramics",
-    "suspense",
-    "drafting",
-    "touching",
-    "elevator",
-    "profound",
-    "balances",
-    "firearms",
-    "capsules",
-    "pursuing",
-    "newswire",
-    "overtime",
-    "sourcing",
-    "exceeded",
-    "labeling",
-    "deserves",
-    "paradigm",
-    "advising",
-    "wondered",
-    "cheshire",
-    "premiums",
-    "syllabus",
-    "valencia",
-    "superman",
-    "activism",
-    "leverage",
-    "mutation",
-    "activist",
-    "proposes",
-    "averages",
-    "bookshop",
-    "severely",
-    "blessing",
-    "prompted",
-    "abnormal",
-    "delicate",
-    "convince",
-    "calculus",
-    "selector",
-    "shifting",
-    "subtotal",
-    "delegate",
-    "analyzer",
-    "nutrient",
-    "underway",
-    "excerpts",
-    "regulate",
-    "trousers",
-    "replaces",
-    "shortage",
-    "goodness",
-    "extracts",
-    "explored",
-    "coronary",
-    "mediated",
-    "coloured",
-    "respects",
-    "granting",
-    "motoring",
-    "randomly",
-    "mentally",
-    "silicone",
-    "welcomes",
-    "consumed",
-    "confined",
-    "monopoly",
-    "robotics",
-    "contexts",
-    "troubled",
-    "footnote",
-    "evolving",
-    "organism",
-    "violated",
-    "laughter",
-    "inventor",
-    "residues",
-    "vicinity",
-    "invasive",
-    "rainfall",
-    "hardback",
-    "backward",
-    "charcoal",
-    "glorious",
-    "handsome",
-    "defaults",
-    "grounded",
-    "espresso",
-    "ancestry",
-    "dolphins",
-    "adopting",
-    "detached",
-    "sentinel",
-    "desserts",
-    "grooming",
-    "meridian",
-    "validate",
-    "rotating",
-    "flooding",
-    "panthers",
-    "ignition",
-    "webcasts",
-    "tungsten",
-    "shutdown",
-    "servants",
-    "meanings",
-    "heavenly",
-    "overflow",
-    "taxonomy",
-    "implicit",
-    "simplify",
-    "terrific",
-    "definite",
-    "regiment",
-    "predator",
-    "deceased",
-    "captures",
-    "educator",
-    "visually",
-    "obsolete",
-    "wardrobe",
-    "immunity",
-    "cheating",
-    "cookware",
-    "scrutiny",
-    "nonsense",
-    "invented",
-    "gradient",
-    "diazepam",
-    "clerical",
-    "meantime",
-    "patented",
-    "reversed",
-    "maternal",
-    "specimen",
-    "seamless",
-    "branding",
-    "examiner",
-    "vineyard",
-    "listener",
-    "chloride",
-    "awaiting",
-    "panorama",
-    "demanded",
-    "fidelity",
-    "rhapsody",
-    "freezing",
-    "feminist",
-    "theatres",
-    "coloring",
-    "leukemia",
-    "habitats",
-    "sensible",
-    "unlawful",
-    "swinging",
-    "opposing",
-    "lowering",
-    "cruising",
-    "headings",
-    "deleting",
-    "swimwear",
-    "billions",
-    "labrador",
-    "outdated",
-    "distress",
-    "barbecue",
-    "secondly",
-    "cerebral",
-    "indexing",
-    "coatings",
-    "systemic",
-    "playoffs",
-    "abundant",
-    "adaptors",
-    "compares",
-    "hesitate",
-    "pavement",
-    "lifelong",
-    "promoter",
-    "remotely",
-    "fletcher",
-    "curtains",
-    "redirect",
-    "galaxies",
-    "elegance",
-    "volatile",
-    "pointers",
-    "socially",
-    "alkaline",
-    "campuses",
-    "readable",
-    "responds",
-    "prepares",
-    "symmetry",
-    "screened",
-    "stepping",
-    "topology",
-    "appetite",
-    "airborne",
-    "morality",
-    "handicap",
-    "antennas",
-    "trucking",
-    "defender",
-    "shortcut",
-    "sunlight",
-    "globally",
-    "bearings",
-    "sickness",
-    "prohibit",
-    "auditors",
-    "eternity",
-    "weighing",
-    "currents",
-    "protests",
-    "horizons",
-    "illusion",
-    "enlarged",
-    "uniquely",
-    "casualty",
-    "whistler",
-    "airfares",
-    "mushroom",
-    "principe",
-    "thirteen",
-    "sounding",
-    "rebounds",
-    "mutually",
-    "affinity",
-    "borrower",
-    "warrants",
-    "fairness",
-    "discreet",
-    "misplace",
-    "serviced",
-    "vaccines",
-    "tickling",
-    "advisers",
-    "charters",
-    "rhetoric",
-    "surveyed",
-    "ballroom",
-    "ignoring",
-    "coherent",
-    "converts",
-    "majestic",
-    "bicycles",
-    "putative",
-    "manifest",
-    "zeppelin",
-    "claimant",
-    "dinosaur",
-    "energies",
-    "repealed",
-    "landfill",
-    "napoleon",
-    "patriots",
-    "sergeant",
-    "scooters",
-    "reactive",
-    "serenity",
-    "sanitary",
-    "dreaming",
-    "implants",
-    "hormones",
-    "epidemic",
-    "cinnamon",
-    "variants",
-    "lawsuits",
-    "absorbed",
-    "improper",
-    "tangible",
-    "youngest",
-    "textures",
-    "dominion",
-    "realised",
-    "eighteen",
-    "singular",
-    "outbreak",
-    "scalable",
-    "fourteen",
-    "skeleton",
-    "suspects",
-    "exporter",
-    "locating",
-    "monogram",
-    "enhances",
-    "ornament",
-    "graffiti",
-    "threaten",
-    "checksum",
-    "stealing",
-    "breeders",
-    "confirms",
-    "rosemary",
-    "archival",
-    "baccarat",
-    "teenager",
-    "averaged",
-    "rigorous",
-    "allocate",
-    "override",
-    "burgundy",
-    "farewell",
-    "vanguard",
-    "evenings",
-    "troubles",
-    "tutoring",
-    "gemstone",
-    "friction",
-    "insurers",
-    "goodwill",
-    "bulldogs",
-    "ideology",
-    "cervical",
-    "starters",
-    "pictured",
-    "feminine",
-    "nautical",
-    "muscular",
-    "prophecy",
-    "cannabis",
-    "comprise",
-    "disposed",
-    "subtitle",
-    "chestnut",
-    "engraved",
-    "pastoral",
-    "locality",
-    "ethereal",
-    "smoothly",
-    "autonomy",
-    "corvette",
-    "christie",
-    "annotate",
-    "enforced",
-    "financed",
-    "surnames",
-    "shocking",
-    "allergic",
-    "overland",
-    "backbone",
-    "uncommon",
-    "metering",
-    "kitchens",
-    "speedway",
-    "founders",
-    "diagonal",
-    "excludes",
-    "matrices",
-    "passages",
-    "etiology",
-    "agreeing",
-    "credible",
-    "cultured",
-    "toddlers",
-    "bindings",
-    "radiator",
-    "hotspots",
-    "murdered",
-    "acronyms",
-    "colonies",
-    "squadron",
-    "veronica",
-    "filtered",
-    "workload",
-    "inviting",
-    "multiply",
-    "humorous",
-    "erection",
-    "offences",
-    "mentions",
-    "genocide",
-    "authored",
-    "exported",
-    "harmless",
-    "diagnose",
-    "showroom",
-    "missiles",
-    "nominees",
-    "hallmark",
-    "dominate",
-    "damaging",
-    "journeys",
-    "lobbying",
-    "islander",
-    "recalled",
-    "licences",
-    "epilepsy",
-    "fracture",
-    "foremost",
-    "mahogany",
-    "clarence",
-    "ignorant",
-    "collects",
-    "treaties",
-    "teaspoon",
-    "seminary",
-    "offenses",
-    "fortress",
-    "settlers",
-    "withheld",
-    "insisted",
-    "eclectic",
-    "keystone",
-    "inclined",
-    "traction",
-    "caffeine",
-    "verbatim",
-    "sketches",
-    "tertiary",
-    "shelters",
-    "graphite",
-    "stroller",
-    "sweaters",
-    "mandarin",
-    "mosquito",
-    "analogue",
-    "honorary",
-    "borrowed",
-    "prentice",
-    "depicted",
-    "downward",
-    "closeout",
-    "kayaking",
-    "sticking",
-    "stripped",
-    "steadily",
-    "imagined",
-    "creators",
-    "musicals",
-    "massacre",
-    "conquest",
-    "mandated",
-    "workbook",
-    "assemble",
-    "analytic",
-    "amethyst",
-    "concerto",
-    "adorable",
-    "ambition",
-    "timeless",
-    "hypnosis",
-    "shortest",
-    "grinding",
-    "pitching",
-    "bordeaux",
-    "manifold",
-    "upstairs",
-    "dividing",
-    "garments",
-    "lymphoma",
-    "tapestry",
-    "freebies",
-    "converse",
-    "gardener",
-    "polymers",
-    "penguins",
-    "nowadays",
-    "inferior",
-    "stresses",
-    "redesign",
-    "billings",
-    "amending",
-    "policing",
-    "cracking",
-    "kindness",
-    "swelling",
-    "spanning",
-    "railways",
-    "approves",
-    "folklore",
-    "perceive",
-    "wildcats",
-    "grouping",
-    "invoices",
-    "pedigree",
-    "bethesda",
-    "precinct",
-    "simplest",
-    "peculiar",
-    "commence",
-    "subclass",
-    "attained",
-    "splendid",
-    "scissors",
-    "limerick",
-    "sweeping",
-    "conducts",
-    "divorced",
-    "magnolia",
-    "siblings",
-    "telecoms",
-    "preceded",
-    "gateways",
-    "trekking",
-    "reversal",
-    "dementia",
-    "proverbs",
-    "mistaken",
-    "miracles",
-    "remedial",
-    "barefoot",
-    "bohemian",
-    "imposing",
-    "marching",
-    "thematic",
-    "talkback",
-    "servings",
-    "declares",
-    "estrogen",
-    "addicted",
-    "unlocked",
-    "injected",
-    "enlisted",
-    "prophets",
-    "triggers",
-    "manpower",
-    "watchdog",
-    "detained",
-    "luncheon",
-    "genomics",
-    "refusing",
-    "antigens",
-    "kinetics",
-    "impacted",
-    "overload",
-    "tortured",
-    "pioneers",
-    "pussycat",
-    "slippers",
-    "stimulus",
-    "devotion",
-    "anterior",
-    "freedoms",
-    "clarinet",
-    "gigabyte",
-    "repaired",
-    "obituary",
-    "painters",
-    "purified",
-    "striving",
-    "spoilers",
-    "roadside",
-    "feathers",
-    "automate",
-    "harmonic",
-    "emulator",
-    "synonyms",
-    "stranded",
-    "hercules",
-    "browning",
-    "immortal",
-    "mariners",
-    "endeavor",
-    "settling",
-    "partisan",
-    "vitality",
-    "bothered",
-    "traverse",
-    "garrison",
-    "fashions",
-    "insomnia",
-    "enduring",
-    "overdose",
-    "freezers",
-    "resigned",
-    "enriched",
-    "reptiles",
-    "bouquets",
-    "wrongful",
-    "sidewalk",
-    "asserted",
-    "squirrel",
-    "bridging",
-    "chickens",
-    "canceled",
-    "surveyor",
-    "obstacle",
-    "driveway",
-    "marketed",
-    "mandrake",
-    "acquires",
-    "galactic",
-    "academia",
-    "volcanic",
-    "swimsuit",
-    "westerns",
-    "unveiled",
-    "handsets",
-    "diarrhea",
-    "rounding",
-    "generals",
-    "organise",
-    "gigantic",
-    "suppress",
-    "deserved",
-    "violates",
-    "getaways",
-    "metaphor",
-    "infusion",
-    "cleavage",
-    "analysed",
-    "brethren",
-    "toilette",
-    "trailing",
-    "lipstick",
-    "punished",
-    "downhill",
-    "utilizes",
-    "deprived",
-    "benedict",
-    "tolerant",
-    "laminate",
-    "ceilings",
-    "residing",
-    "markings",
-    "tractors",
-    "seasoned",
-    "sorority",
-    "audition",
-    "guessing",
-    "throttle",
-    "infamous",
-    "pleasing",
-    "seizures",
-    "appealed",
-    "figurine",
-    "chlorine",
-    "entirety",
-    "destined",
-    "yearbook",
-    "guernsey",
-    "stirring",
-    "decorate",
-    "vomiting",
-    "exposing",
-    "simulate",
-    "thankful",
-    "vertices",
-    "additive",
-    "washable",
-    "teamwork",
-    "worrying",
-    "ontology",
-    "installs",
-    "trillion",
-    "cashmere",
-    "labelled",
-    "prenatal",
-    "contempt",
-    "collagen",
-    "blizzard",
-    "refining",
-    "confront",
-    "makeover",
-    "watering",
-    "thrilled",
-    "predicts",
-    "needless",
-    "lakeside",
-    "imminent",
-    "affirmed",
-    "communal",
-    "dynamite",
-    "chatting",
-    "congrats",
-    "splitter",
-    "arterial",
-    "mystical",
-    "textured",
-    "pedestal",
-    "widening",
-    "importer",
-    "nominate",
-    "relieved",
-    "closures",
-    "reverend",
-    "cabernet",
-    "binaries",
-    "showdown",
-    "ancestor",
-    "believer",
-    "declines",
-    "skeletal",
-    "rollover",
-    "adequacy",
-    "breakers",
-    "forwards",
-    "exploits",
-    "offended",
-    "terribly",
-    "callback",
-    "presumed",
-    "blending",
-    "speeding",
-    "creditor",
-    "mandates",
-    "peptides",
-    "tensions",
-    "linkages",
-    "disputed",
-    "scouting",
-    "instinct",
-    "bullying",
-    "migraine",
-    "omission",
-    "capitals",
-    "quilting",
-    "rewarded",
-    "husbands",
-    "persuade",
-    "endpoint",
-    "fielding",
-    "migrants",
-    "waveform",
-    "deficits",
-    "insanity",
-    "embraced",
-    "reformed",
-    "tolerate",
-    "adhesion",
-    "dialysis",
-    "afforded",
-    "altering",
-    "creatine",
-    "souvenir",
-    "cucumber",
-    "decisive",
-    "dungeons",
-    "trainees",
-    "shelving",
-    "effluent",
-    "bombings",
-    "equities",
-    "crashing",
-    "cautious",
-    "passions",
-    "utensils",
-    "secretly",
-    "magician",
-    "extremes",
-    "obsessed",
-    "flavored",
-    "dealings",
-    "pathetic",
-    "defended",
-    "handlers",
-    "flagship",
-    "bouncing",
-    "cavalier",
-    "emeritus",
-    "brighter",
-    "attacker",
-    "inverter",
-    "motivate",
-    "retreats",
-    "assessor",
-    "belonged",
-    "cushions",
-    "debugger",
-    "eventual",
-    "mitigate",
-    "arguably",
-    "accesses",
-    "nuisance",
-    "drowning",
-    "bullshit",
-    "nicotine",
-    "comeback",
-    "downtime",
-    "takeover",
-    "outright",
-    "melodies",
-    "spotting",
-    "wagering",
-    "integers",
-    "zirconia",
-    "plumbers",
-    "johannes",
-    "biscuits",
-    "outbound",
-    "breakout",
-    "restless",
-    "complies",
-    "mornings",
-    "feminism",
-    "tabletop",
-    "aromatic",
-    "emporium",
-    "soothing",
-    "freshmen",
-    "departed",
-    "swapping",
-    "staining",
-    "overture",
-    "hectares",
-    "scrabble",
-    "watchers",
-    "decoding",
-    "kangaroo",
-    "bungalow",
-    "mindless",
-    "purifier",
-    "recruits",
-    "stamping",
-    "societal",
-    "underage",
-    "hardship",
-    "almighty",
-    "openness",
-    "chromium",
-    "slippery",
-    "subgroup",
-    "yielding",
-    "longhorn",
-    "backdrop",
-    "mediator",
-    "commuter",
-    "tyrosine",
-    "stuffing",
-    "canoeing",
-    "reverted",
-    "crackers",
-    "venetian",
-    "preacher",
-    "complied",
-    "reusable",
-    "attracts",
-    "erectile",
-    "homicide",
-    "pandemic",
-    "overcast",
-    "inverted",
-    "achieves",
-    "forehead",
-    "maverick",
-    "anabolic",
-    "snippets",
-    "mixtures",
-    "dragging",
-    "flushing",
-    "delights",
-    "foreword",
-    "piedmont",
-    "outlying",
-    "handouts",
-    "deducted",
-    "totaling",
-    "vigorous",
-    "classify",
-    "cheerful",
-    "billiard",
-    "optimism",
-    "addendum",
-    "redskins",
-    "retiring",
-    "smashing",
-    "splinter",
-    "stripper",
-    "practise",
-    "analyzes",
-    "pristine",
-    "auditory",
-    "applause",
-    "pounding",
-    "narrator",
-    "hillside",
-    "joystick",
-    "spammers",
-    "instruct",
-    "overhaul",
-    "remarked",
-    "mourning",
-    "resistor",
-    "exploded",
-    "silently",
-    "initials",
-    "tackling",
-    "compress",
-    "apostles",
-    "isolates",
-    "sinister",
-    "arteries",
-    "helpless",
-    "neonatal",
-    "technics",
-    "clippers",
-    "shilling",
-    "resemble",
-    "spirited",
-    "recharge",
-    "sanction",
-    "effected",
-    "paranoid",
-    "comedies",
-    "flamingo",
-    "solitary",
-    "knocking",
-    "broccoli",
-    "graceful",
-    "defenses",
-    "vampires",
-    "relocate",
-    "reliably",
-    "cherries",
-    "shouting",
-    "conserve",
-    "whipping",
-    "skipping",
-    "melanoma",
-    "plotting",
-    "fibrosis",
-    "overlook",
-    "captains",
-    "awarding",
-    "flatware",
-    "militant",
-    "artworks",
-    "torrents",
-    "doubtful",
-    "ratified",
-    "insecure",
-    "conveyor",
-    "longtime",
-    "solvents",
-    "beauties",
-    "artifact",
-    "dripping",
-    "coasters",
-    "intimacy",
-    "geologic",
-    "replicas",
-    "reloaded",
-    "riparian",
-    "thriving",
-    "gracious",
-    "conveyed",
-    "trophies",
-    "extranet",
-    "grandson",
-    "refinery",
-    "removals",
-    "insiders",
-    "jewelers",
-    "dilution",
-    "fortunes",
-    "amounted",
-    "refunded",
-    "honoring",
-    "climatic",
-    "minimise",
-    "salinity",
-    "justices",
-    "blockers",
-    "showtime",
-    "leaflets",
-    "coincide",
-    "radicals",
-    "doubling",
-    "replying",
-    "shredder",
-    "launcher",
-    "salesman",
-    "wrangler",
-    "defiance",
-    "breasted",
-    "donating",
-    "giveaway",
-    "caterers",
-    "convened",
-    "stallion",
-    "reagents",
-    "weekdays",
-    "wineries",
-    "deserted",
-    "caravans",
-    "contends",
-    "luminous",
-    "hardened",
-    "webpages",
-    "charting",
-    "fixation",
-    "designee",
-    "monoxide",
-    "quantify",
-    "galleria",
-    "booklets",
-    "narrowed",
-    "turbines",
-    "conforms",
-    "subtract",
-    "prolific",
-    "retarded",
-    "jeopardy",
-    "aspiring",
-    "refereed",
-    "dazzling",
-    "hardness",
-    "adapting",
-    "contours",
-    "villains",
-    "parasite",
-    "protease",
-    "preclude",
-    "thinkers",
-    "retirees",
-    "homology",
-    "embossed",
-    "expended",
-    "deputies",
-    "emergent",
-    "aligning",
-    "nautilus",
-    "inferred",
-    "pitchers",
-    "sectoral",
-    "trombone",
-    "firebird",
-    "disguise",
-    "eleventh",
-    "barbeque",
-    "workouts",
-    "songbook",
-    "renegade",
-    "nineteen",
-    "spraying",
-    "invaders",
-    "depleted",
-    "holiness",
-    "divinity",
-    "sherlock",
-    "punitive",
-    "captions",
-    "pamphlet",
-    "assassin",
-    "emailing",
-    "comforts",
-    "appoints",
-    "finalize",
-    "pumpkins",
-    "novelist",
-    "oblivion",
-    "sprinkle",
-    "softcore",
-    "abridged",
-    "sneakers",
-    "realizes",
-    "chilling",
-    "newcomer",
-    "funniest",
-    "scorpion",
-    "mirrored",
-    "aerobics",
-    "comedian",
-    "clitoris",
-    "ordnance",
-    "preamble",
-    "enhancer",
-    "trapping",
-    "diminish",
-    "stitches",
-    "mediocre",
-    "reactors",
-    "fluoride",
-    "parishes",
-    "stacking",
-    "monotone",
-    "referees",
-    "debating",
-    "grabbing",
-    "outboard",
-    "pinpoint",
-    "haunting",
-    "relisted",
-    "blossoms",
-    "succeeds",
-    "grilling",
-    "reunions",
-    "quadrant",
-    "reckless",
-    "coliseum",
-    "spawning",
-    "figuring",
-    "crushing",
-    "ordained",
-    "shooters",
-    "passover",
-    "bacillus",
-    "sideways",
-    "burglary",
-    "subpoena",
-    "bareback",
-    "extender",
-    "referrer",
-    "nutshell",
-    "arrogant",
-    "vocalist",
-    "youthful",
-    "stumbled",
-    "tempered",
-    "slipping",
-    "solitude",
-    "platelet",
-    "pursuits",
-    "revolver",
-    "rosewood",
-    "existent",
-    "killings",
-    "dictator",
-    "fanatics",
-    "carousel",
-    "hedgehog",
-    "wheeling",
-    "hawthorn",
-    "bankrupt",
-    "farmland",
-    "pitfalls",
-    "jurassic",
-    "weakened",
-    "withdrew",
-    "aliasing",
-    "boosting",
-    "scarcely",
-    "catheter",
-    "diplomat",
-    "stardust",
-    "commando",
-    "motorway",
-    "urgently",
-    "embodied",
-    "viewable",
-    "maximise",
-    "escaping",
-    "suicidal",
-    "cruisers",
-    "dyslexia",
-    "organics",
-    "dopamine",
-    "battling",
-    "pancreas",
-    "ammonium",
-    "handyman",
-    "gestures",
-    "ambience",
-    "cardigan",
-    "neuronal",
-    "checkers",
-    "logistic",
-    "easement",
-    "darkroom",
-    "destroys",
-    "turnpike",
-    "degraded",
-    "shetland",
-    "thoracic",
-    "hopeless",
-    "selenium",
-    "grinders",
-    "revising",
-    "insignia",
-    "factions",
-    "humility",
-    "dissolve",
-    "crawling",
-    "modifier",
-    "cytology",
-    "biennial",
-    "cohesion",
-    "observes",
-    "corporal",
-    "chatroom",
-    "polarity",
-    "daunting",
-    "blooming",
-    "finalist",
-    "kingdoms",
-    "richness",
-    "converge",
-    "workings",
-    "minidisc",
-    "radiance",
-    "downside",
-    "quitting",
-    "morphine",
-    "indicted",
-    "blasting",
-    "repeater",
-    "mastered",
-    "spamming",
-    "grannies",
-    "immature",
-    "executes",
-    "entrants",
-    "conceive",
-    "genotype",
-    "recourse",
-    "armchair",
-    "solstice",
-    "murderer",
-    "shootout",
-    "intruder",
-    "paddling",
-    "necrosis",
-    "pilgrims",
-    "flamenco",
-    "hormonal",
-    "mandolin",
-    "calender",
-    "brightly",
-    "flawless",
-    "breaches",
-    "pedagogy",
-    "numeracy",
-    "tempting",
-    "planters",
-    "chaplain",
-    "occupies",
-    "shielded",
-    "intrigue",
-    "roadster",
-    "confetti",
-    "abrasive",
-    "assuring",
-    "alarming",
-    "narrowly",
-    "ambiance",
-    "suitcase",
-    "bakeries",
-    "wrappers",
-    "mismatch",
-    "inquirer",
-    "battered",
-    "dreadful",
-    "drifting",
-    "absentee",
-    "fearless",
-    "canister",
-    "recessed",
-    "wrinkles",
-    "clubbing",
-    "crashers",
-    "nativity",
-    "tranquil",
-    "paranoia",
-    "despatch",
-    "fugitive",
-    "starship",
-    "cyclists",
-    "markedly",
-    "exempted",
-    "secluded",
-    "jealousy",
-    "envision",
-    "squeezed",
-    "adoptive",
-    "matchups",
-    "mailings",
-    "reindeer",
-    "telegram",
-    "allotted",
-    "escorted",
-    "barracks",
-    "inducing",
-    "antelope",
-    "terminus",
-    "castings",
-    "bookcase",
-    "neoprene",
-    "blackout",
-    "maneuver",
-    "vanished",
-    "crafting",
-    "lighters",
-    "shutting",
-    "reasoned",
-    "smoother",
-    "withhold",
-    "betrayed",
-    "pancakes",
-    "focussed",
-    "paycheck",
-    "keepsake",
-    "baptized",
-    "expelled",
-    "betrayal",
-    "flourish",
-    "clueless",
-    "woodruff",
-    "stitched",
-    "budgeted",
-    "trusting",
-    "attaches",
-    "twisting",
-    "mappings",
-    "trimming",
-    "neutrino",
-    "felicity",
-    "splendor",
-    "fragrant",
-    "cortical",
-    "exponent",
-    "glaucoma",
-    "oversees",
-    "toughest",
-    "literate",
-    "disciple",
-    "rhythmic",
-    "bakeware",
-    "starving",
-    "cleanser",
-    "renewals",
-    "honoured",
-    "yachting",
-    "monarchy",
-    "scandals",
-    "screamed",
-    "pendulum",
-    "gangster",
-    "censored",
-    "matchbox",
-    "stubborn",
-    "redeemed",
-    "ethylene",
-    "inhibits",
-    "stricken",
-    "sidekick",
-    "cascades",
-    "outsider",
-    "laborers",
-    "lobbyist",
-    "whispers",
-    "peasants",
-    "sopranos",
-    "closings",
-    "consular",
-    "knockout",
-    "anchored",
-    "mulberry",
-    "mythical",
-    "anorexia",
-    "clipping",
-    "shutters",
-    "lanterns",
-    "boosters",
-    "angelica",
-    "artisans",
-    "bastards",
-    "appended",
-    "alleging",
-    "familial",
-    "implying",
-    "synaptic",
-    "hostages",
-    "fruitful",
-    "pyramids",
-    "depended",
-    "unleaded",
-    "mesquite",
-    "tortoise",
-    "asteroid",
-    "unlisted",
-    "remnants",
-    "comrades",
-    "voltages",
-    "assignee",
-    "tailgate",
-    "scrubbed",
-    "hangover",
-    "cupboard",
-    "palmetto",
-    "mischief",
-    "soybeans",
-    "waitress",
-    "oversize",
-    "competed",
-    "hatchery",
-    "emitting",
-    "heirloom",
-    "esoteric",
-    "landings",
-    "thatcher",
-    "scramble",
-    "troopers",
-    "eruption",
-    "preached",
-    "careless",
-    "chemists",
-    "narcotic",
-    "actuator",
-    "sorcerer",
-    "invoking",
-    "methanol",
-    "slowdown",
-    "noticing",
-    "furnaces",
-    "occupant",
-    "juggling",
-    "wildfire",
-    "rambling",
-    "legality",
-    "regulars",
-    "wildcard",
-    "guaranty",
-    "cropping",
-    "diverted",
-    "forgiven",
-    "diplomas",
-    "powdered",
-    "wildwood",
-    "shredded",
-    "granular",
-    "chainsaw",
-    "inflated",
-    "intercom",
-    "splicing",
-    "campfire",
-    "graphing",
-    "diskette",
-    "diaspora",
-    "swimmers",
-    "syllable",
-    "sweating",
-    "lemonade",
-    "absences",
-    "solarium",
-    "persists",
-    "unframed",
-    "survives",
-    "bursting",
-    "epiphany",
-    "moulding",
-    "renaming",
-    "pathogen",
-    "resonant",
-    "expedite",
-    "invading",
-    "strained",
-    "uprising",
-    "stalking",
-    "sturgeon",
-    "smallpox",
-    "waterway",
-    "migrated",
-    "endorses",
-    "critters",
-    "leveling",
-    "stadiums",
-    "cataract",
-    "playable",
-    "virology",
-    "abruptly",
-    "ayurveda",
-    "mainline",
-    "anodized",
-    "intrepid",
-    "alerting",
-    "differed",
-    "eyebrows",
-    "inspires",
-    "coauthor",
-    "trenches",
-    "doorstep",
-    "dangling",
-    "drawback",
-    "proofing",
-    "westward",
-    "prefixes",
-    "embraces",
-    "flavours",
-    "isotopes",
-    "auspices",
-    "countess",
-    "pleading",
-    "snowfall",
-    "summoned",
-    "dictated",
-    "proximal",
-    "suitably",
-    "peroxide",
-    "formulae",
-    "backlash",
-    "frontage",
-    "hammered",
-    "therefor",
-    "pastures",
-    "gripping",
-    "dateline",
-    "wandered",
-    "campsite",
-    "marketer",
-    "shedding",
-    "funerals",
-    "redefine",
-    "backdoor",
-    "proclaim",
-    "recreate",
-    "horrific",
-    "lifeline",
-    "sabotage",
-    "ruthless",
-    "aptitude",
-    "objected",
-    "favoured",
-    "primates",
-    "forklift",
-    "guarding",
-    "windmill",
-    "dedicate",
-    "renewing",
-    "embarked",
-    "quickest",
-    "automata",
-    "draining",
-    "punching",
-    "inquired",
-    "accented",
-    "creeping",
-    "kerosene",
-    "freaking",
-    "assaults",
-    "parkland",
-    "werewolf",
-    "swallows",
-    "charisma",
-    "cuisines",
-    "tweaking",
-    "treatise",
-    "chipping",
-    "monsieur",
-    "reacting",
-    "avengers",
-    "pigments",
-    "arginine",
-    "eighties",
-    "freehold",
-    "forester",
-    "resisted",
-    "injector",
-    "disgrace",
-    "ointment",
-    "tripping",
-    "masthead",
-    "hypnotic",
-    "adultery",
-    "shamrock",
-    "sycamore",
-    "halftime",
-    "smelling",
-    "polluted",
-    "airbrush",
-    "restores",
-    "dictates",
-    "computes",
-    "blockade",
-    "algebras",
-    "quotient",
-    "tributes",
-    "thinning",
-    "primrose",
-    "corduroy",
-    "massager",
-    "changers",
-    "desiring",
-    "cuttings",
-    "sculptor",
-    "cyclical",
-    "playmate",
-    "airfield",
-    "flipping",
-    "neoplasm",
-    "elliptic",
-    "drinkers",
-    "affluent",
-    "truckers",
-    "lonesome",
-    "jacquard",
-    "assesses",
-    "labourer",
-    "gauntlet",
-    "crusader",
-    "blenders",
-    "drumming",
-    "patching",
-    "luscious",
-    "sighting",
-    "solenoid",
-    "underdog",
-    "goldfish",
-    "delaying",
-    "animator",
-    "modelled",
-    "expiring",
-    "whistles",
-    "swearing",
-    "peerless",
-    "atypical",
-    "slimming",
-    "brooches",
-    "climbers",
-    "blinking",
-    "sweetest",
-    "vocation",
-    "dilemmas",
-    "knockers",
-    "modifies",
-    "thanking",
-    "cohesive",
-    "manicure",
-    "reunited",
-    "colossal",
-    "shingles",
-    "screener",
-    "immersed",
-    "roasting",
-    "narrated",
-    "saucepan",
-    "freshest",
-    "hacienda",
-    "pizzeria",
-    "airspace",
-    "workable",
-    "ordinate",
-    "glaciers",
-    "giftware",
-    "nanotech",
-    "subunits",
-    "infringe",
-    "fastener",
-    "symposia",
-    "ailments",
-    "unopened",
-    "brushing",
-    "resolves",
-    "preprint",
-    "sporadic",
-    "zippered",
-    "brownies",
-    "autistic",
-    "painless",
-    "climates",
-    "reissues",
-    "dredging",
-    "theorems",
-    "samplers",
-    "shrugged",
-    "electors",
-    "lifespan",
-    "hitherto",
-    "cysteine",
-    "fantasia",
-    "camisole",
-    "outraged",
-    "physique",
-    "cheering",
-    "narrower",
-    "hairless",
-    "machined",
-    "eviction",
-    "scarcity",
-    "filament",
-    "dividers",
-    "intraday",
-    "downfall",
-    "parmesan",
-    "stairway",
-    "sewerage",
-    "gamblers",
-    "outweigh",
-    "eggplant",
-    "dressage",
-    "coercion",
-    "truthful",
-    "avionics",
-    "linearly",
-    "poignant",
-    "waterman",
-    "downturn",
-    "cautions",
-    "brighten",
-    "conceded",
-    "postpone",
-    "pheasant",
-    "marrying",
-    "carvings",
-    "choppers",
-    "terriers",
-    "toasters",
-    "politely",
-    "alderman",
-    "coughing",
-    "spurious",
-    "nobility",
-    "shippers",
-    "polygons",
-    "linotype",
-    "buffered",
-    "provoked",
-    "dispense",
-    "accusing",
-    "childish",
-    "midwives",
-    "cyclones",
-    "verbally",
-    "chenille",
-    "mobilize",
-    "attendee",
-    "baroness",
-    "winnings",
-    "leapfrog",
-    "terraces",
-    "screwing",
-    "prologue",
-    "accorded",
-    "editable",
-    "strapped",
-    "woodwork",
-    "cavities",
-    "cravings",
-    "retrofit",
-    "cytokine",
-    "ischemia",
-    "infested",
-    "hibiscus",
-    "woodwind",
-    "horribly",
-    "naturist",
-    "plethora",
-    "orchards",
-    "escalade",
-    "sealants",
-    "pertains",
-    "bestowed",
-    "wetsuits",
-    "emulsion",
-    "plumpers",
-    "rousseau",
-    "antispam",
-    "deadlock",
-    "placenta",
-    "deriving",
-    "likeness",
-    "hollands",
-    "impulses",
-    "housings",
-    "leftover",
-    "ischemic",
-    "plugging",
-    "vignette",
-    "homebrew",
-    "fireball",
-    "westerly",
-    "modality",
-    "appellee",
-    "granules",
-    "deceived",
-    "grantees",
-    "lawfully",
-    "oncogene",
-    "notifies",
-    "ballpark",
-    "schiller",
-    "baritone",
-    "condemns",
-    "flirting",
-    "poisoned",
-    "abducted",
-    "trolling",
-    "fuselage",
-    "redheads",
-    "crippled",
-    "stampede",
-    "utilised",
-    "fatality",
-    "printout",
-    "guerilla",
-    "follower",
-    "chanting",
-    "wrestler",
-    "behaving",
-    "stenosis",
-    "abrasion",
-    "mustangs",
-    "genitals",
-    "confines",
-    "aversion",
-    "stewards",
-    "retainer",
-    "restroom",
-    "grieving",
-    "chastity",
-    "surfaced",
-    "nouvelle",
-    "maturing",
-    "awakened",
-    "lodgings",
-    "pullover",
-    "towering",
-    "stemming",
-    "dialects",
-    "casually",
-    "freedman",
-    "newborns",
-    "packager",
-    "populate",
-    "sluggish",
-    "hideaway",
-    "shameful",
-    "deafness",
-    "laureate",
-    "syphilis",
-    "pantheon",
-    "consumes",
-    "lovingly",
-    "untested",
-    "flinders",
-    "verifies",
-    "artistry",
-    "headlamp",
-    "grandeur",
-    "mansions",
-    "bounding",
-    "ephemera",
-    "atheists",
-    "wearable",
-    "weaponry",
-    "landline",
-    "profiler",
-    "essences",
-    "vendetta",
-    "restrain",
-    "clutches",
-    "numerals",
-    "zucchini",
-    "fetching",
-    "unmarked",
-    "diocesan",
-    "nonstick",
-    "foursome",
-    "startled",
-    "spitfire",
-    "querying",
-    "fingered",
-    "greenway",
-    "stencils",
-    "orphaned",
-    "prudence",
-    "tasteful",
-    "distract",
-    "sideshow",
-    "pastries",
-    "holsters",
-    "consents",
-    "oddities",
-    "suicides",
-    "tortilla",
-    "unfairly",
-    "colossus",
-    "buckeyes",
-    "bodywork",
-    "applique",
-    "indecent",
-    "microbes",
-    "empowers",
-    "phonetic",
-    "compiles",
-    "encoders",
-    "jackpots",
-    "sizzling",
-    "absorber",
-    "vigilant",
-    "sailboat",
-    "partying",
-    "forested",
-    "roadways",
-    "diligent",
-    "almanacs",
-    "aneurysm",
-    "closeups",
-    "colognes",
-    "fullness",
-    "brutally",
-    "aquatics",
-    "populace",
-    "habitual",
-    "causeway",
-    "restated",
-    "reopened",
-    "fastened",
-    "innovate",
-    "boroughs",
-    "adhering",
-    "hampered",
-    "switcher",
-    "mangrove",
-    "arranger",
-    "insuring",
-    "boasting",
-    "carefree",
-    "twenties",
-    "codified",
-    "overlays",
-    "searcher",
-    "unifying",
-    "bluebird",
-    "deformed",
-    "wretched",
-    "decadent",
-    "stoppers",
-    "steaming",
-    "humanist",
-    "obscured",
-    "powering",
-    "butchers",
-    "fiercely",
-    "hysteria",
-    "breached",
-    "shipyard",
-    "answerer",
-    "distrust",
-    "eloquent",
-    "wondrous",
-    "standoff",
-    "bustling",
-    "breakage",
-    "broadest",
-    "drenched",
-    "foreskin",
-    "capstone",
-    "portrays",
-    "firewood",
-    "serenade",
-    "setbacks",
-    "truffles",
-    "profiled",
-    "gentiles",
-    "branched",
-    "mystique",
-    "roadshow",
-    "squamous",
-    "superbly",
-    "whomever",
-    "toolbars",
-    "rigidity",
-    "tumbling",
-    "disables",
-    "ridicule",
-    "trimmers",
-    "sculpted",
-    "talisman",
-    "rebuttal",
-    "spinners",
-    "perverse",
-    "facelift",
-    "merciful",
-    "euphoria",
-    "lockdown",
-    "assholes",
-    "sniffing",
-    "stringer",
-    "recovers",
-    "aerosols",
-    "yearning",
-    "esteemed",
-    "antidote",
-    "eyepiece",
-    "freehand",
-    "nameless",
-    "mainstay",
-    "indebted",
-    "breathed",
-    "syringes",
-    "transact",
-    "regimens",
-    "puncture",
-    "trannies",
-    "nineties",
-    "darkened",
-    "smoothie",
-    "punisher",
-    "loathing",
-    "hammocks",
-    "bottling",
-    "virtuous",
-    "decipher",
-    "overkill",
-    "diamante",
-    "foraging",
-    "chairmen",
-    "sysadmin",
-    "foothill",
-    "layering",
-    "airwaves",
-    "midrange",
-    "recliner",
-    "incision",
-    "adjuster",
-    "grasping",
-    "generics",
-    "mortuary",
-    "teletext",
-    "harriers",
-    "rightful",
-    "hesitant",
-    "prevails",
-    "regained",
-    "stroking",
-    "minimums",
-    "disallow",
-    "procured",
-    "remanded",
-    "virtuoso",
-    "paraffin",
-    "subspace",
-    "disjoint",
-    "hijacked",
-    "puzzling",
-    "hologram",
-    "starfish",
-    "bordered",
-    "tectonic",
-    "seedling",
-    "dwellers",
-    "snowball",
-    "revamped",
-    "macaroni",
-    "electing",
-    "evacuate",
-    "softened",
-    "smartest",
-    "scaffold",
-    "dislikes",
-    "adjuvant",
-    "mulligan",
-    "canopies",
-    "anaconda",
-    "basilica",
-    "plasmids",
-    "sausages",
-    "roundups",
-    "endanger",
-    "rollback",
-    "crockpot",
-    "snowshoe",
-    "backside",
-    "foreseen",
-    "scallops",
-    "happiest",
-    "indented",
-    "disclaim",
-    "sunburst",
-    "startups",
-    "garnered",
-    "meltdown",
-    "ascended",
-    "vesicles",
-    "resizing",
-    "chopping",
-    "enacting",
-    "sideline",
-    "stabbing",
-    "ligament",
-    "wanderer",
-    "spitting",
-    "seacoast",
-    "chancery",
-    "explodes",
-    "executor",
-    "tomahawk",
-    "mongoose",
-    "rallying",
-    "agnostic",
-    "delusion",
-    "neutrons",
-    "sulphate",
-    "mariposa",
-    "hovering",
-    "obsidian",
-    "dressers",
-    "domicile",
-    "optimise",
-    "fostered",
-    "revolves",
-    "glimpses",
-    "pairings",
-    "exorcism",
-    "cultivar",
-    "teammate",
-    "diseased",
-    "buttocks",
-    "unmanned",
-    "rainbows",
-    "lossless",
-    "deported",
-    "decedent",
-    "dimethyl",
-    "monorail",
-    "bookworm",
-    "fireside",
-    "suffrage",
-    "triumphs",
-    "grenades",
-    "ventured",
-    "seawater",
-    "kneeling",
-    "negation",
-    "fulfills",
-    "trespass",
-    "glycerol",
-    "impunity",
-    "itemized",
-    "infernal",
-    "renminbi",
-    "pampered",
-    "praising",
-    "holstein",
-    "droplets",
-    "inducted",
-    "hangings",
-    "wrecking",
-    "bankroll",
-    "bioassay",
-    "digested",
-    "trumpets",
-    "majoring",
-    "glitches",
-    "embodies",
-    "sedation",
-    "cannibal",
-    "stricter",
-    "lavatory",
-    "ancients",
-    "snapping",
-    "devotees",
-    "memorize",
-    "shuttles",
-    "parodies",
-    "scrapped",
-    "materiel",
-    "slamming",
-    "staffers",
-    "coenzyme",
-    "worthing",
-    "populous",
-    "cortisol",
-    "spotless",
-    "porosity",
-    "ecstatic",
-    "carotene",
-    "skinning",
-    "forsaken",
-    "recounts",
-    "menswear",
-    "wrenches",
-    "databank",
-    "sunglass",
-    "brigades",
-    "totality",
-    "boulders",
-    "smoothed",
-    "striping",
-    "clamping",
-    "whiplash",
-    "radiated",
-    "trolleys",
-    "headband",
-    "forcibly",
-    "presided",
-    "wideband",
-    "calamity",
-    "fandango",
-    "platters",
-    "germanic",
-    "harassed",
-    "meditate",
-    "mousepad",
-    "playtime",
-    "deferral",
-    "psychics",
-    "extruded",
-    "muttered",
-    "knitwear",
-    "fillings",
-    "secreted",
-    "personas",
-    "knuckles",
-    "ablation",
-    "buoyancy",
-    "sizeable",
-    "heaviest",
-    "prairies",
-    "hamsters",
-    "fleeting",
-    "evacuees",
-    "unfolded",
-    "trackers",
-    "hindered",
-    "aardvark",
-    "isotopic",
-    "windfall",
-    "bootable",
-    "decimals",
-    "visceral",
-    "fructose",
-    "skillful",
-    "midfield",
-    "redshift",
-    "massages",
-    "scraping",
-    "backseat",
-    "unbroken",
-    "urethane",
-    "crusades",
-    "defences",
-    "elicited",
-    "swirling",
-    "clinging",
-    "racially",
-    "expertly",
-    "sundries",
-    "verifier",
-    "sleepers",
-    "unloaded",
-    "bandages",
-    "scripted",
-    "spoofing",
-    "poolside",
-    "precedes",
-    "skeptics",
-    "palatine",
-    "motorist",
-    "analyser",
-    "spreader",
-    "grammars",
-    "overalls",
-    "tattooed",
-    "bitterly",
-    "overfull",
-    "cleverly",
-    "overturn",
-    "tentacle",
-    "motility",
-    "reassure",
-    "inertial",
-    "preorder",
-    "moveable",
-    "agrarian",
-    "sidestep",
-    "leathers",
-    "banished",
-    "terraced",
-    "naproxen",
-    "operands",
-    "humanism",
-    "unusable",
-    "skylight",
-    "monarchs",
-    "unsolved",
-    "reckoned",
-    "handover",
-    "squarely",
-    "softness",
-    "excepted",
-    "renderer",
-    "whopping",
-    "corrects",
-    "vanishes",
-    "obedient",
-    "fetishes",
-    "ascribed",
-    "licorice",
-    "strikers",
-    "optimist",
-    "seashore",
-    "marinade",
-    "absinthe",
-    "hegemony",
-    "hygienic",
-    "emperors",
-    "redeemer",
-    "paternal",
-    "indigent",
-    "romances",
-    "reissued",
-    "writable",
-    "circling",
-    "coliform",
-    "nonpoint",
-    "blotting",
-    "eastward",
-    "handball",
-    "stylized",
-    "systolic",
-    "chansons",
-    "daybreak",
-    "waypoint",
-    "blisters",
-    "synopses",
-    "sanctity",
-    "pedantic",
-    "deadwood",
-    "gleaming",
-    "dominoes",
-    "sledding",
-    "excision",
-    "mustered",
-    "audacity",
-    "competes",
-    "plotters",
-    "pedicure",
-    "duplexes",
-    "baptists",
-    "flounder",
-    "epilogue",
-    "clapping",
-    "favoring",
-    "mufflers",
-    "walkways",
-    "oxidized",
-    "racquets",
-    "eminence",
-    "liberate",
-    "colophon",
-    "thesauri",
-    "cauldron",
-    "tingling",
-    "kabbalah",
-    "idealism",
-    "positron",
-    "throated",
-    "disperse",
-    "binomial",
-    "canfield",
-    "hardball",
-    "renovate",
-    "blinding",
-    "inaction",
-    "armoured",
-    "inherits",
-    "decoders",
-    "easterly",
-    "rezoning",
-    "licensor",
-    "unearned",
-    "cladding",
-    "overlaps",
-    "mackerel",
-    "jamboree",
-    "geranium",
-    "leaching",
-    "ranchers",
-    "desolate",
-    "expander",
-    "gruesome",
-    "perished",
-    "recycler",
-    "tristate",
-    "knickers",
-    "androgen",
-    "kilogram",
-    "standout",
-    "homesite",
-    "unfunded",
-    "shitting",
-    "ejection",
-    "locators",
-    "marquise",
-    "affaires",
-    "liaisons",
-    "perforce",
-    "wildland",
-    "emptying",
-    "reliever",
-    "shearing",
-    "presidio",
-    "windward",
-    "caseload",
-    "delirium",
-    "glycogen",
-    "detainee",
-    "photonic",
-    "cynicism",
-    "environs",
-    "platypus",
-    "reverses",
-    "crockery",
-    "legacies",
-    "enticing",
-    "famously",
-    "salaried",
-    "rarities",
-    "artistes",
-    "suburbia",
-    "crucible",
-    "pronouns",
-    "riesling",
-    "silencer",
-    "allergen",
-    "frosting",
-    "marshals",
-    "stagnant",
-    "fairways",
-    "molasses",
-    "schooner",
-    "numbness",
-    "agonists",
-    "hatching",
-    "tinnitus",
-    "inositol",
-    "follicle",
-    "agitated",
-    "relieves",
-    "linguist",
-    "especial",
-    "curators",
-    "precepts",
-    "forceful",
-    "villager",
-    "untimely",
-    "baguette",
-    "orbiting",
-    "resubmit",
-    "couriers",
-    "subtypes",
-    "uplinked",
-    "taglines",
-    "snatched",
-    "unedited",
-    "eyesight",
-    "handguns",
-    "papillon",
-    "exhausts",
-    "dreamers",
-    "citywide",
-    "stingray",
-    "minivans",
-    "wreckage",
-    "captives",
-    "despised",
-    "midpoint",
-    "resolver",
-    "unknowns",
-    "ambrosia",
-    "bragging",
-    "grinning",
-    "triplets",
-    "watchful",
-    "appalled",
-    "silenced",
-    "vanities",
-    "cilantro",
-    "calipers",
-    "pyruvate",
-    "steamers",
-    "bubbling",
-    "horsemen",
-    "reigning",
-    "varicose",
-    "coercive",
-    "escalate",
-    "spotters",
-    "outburst",
-    "mattered",
-    "drummers",
-    "reformer",
-    "solemnly",
-    "aquifers",
-    "rescuers",
-    "atenolol",
-    "arranges",
-    "riveting",
-    "biweekly",
-    "derailed",
-    "decanter",
-    "lightest",
-    "banquets",
-    "removers",
-    "diffuser",
-    "spilling",
-    "podiatry",
-    "blockage",
-    "burdened",
-    "literals",
-    "pretrial",
-    "clitoral",
-    "anointed",
-    "horseman",
-    "decaying",
-    "informer",
-    "telemark",
-    "overcame",
-    "exertion",
-    "flywheel",
-    "sheriffs",
-    "admiring",
-    "wasteful",
-    "consults",
-    "convener",
-    "nurtured",
-    "bushings",
-    "typeface",
-    "termites",
-    "imprints",
-    "fallback",
-    "sheepdog",
-    "excesses",
-    "cakewalk",
-    "tendered",
-    "operable",
-    "omitting",
-    "insulted",
-    "alveolar",
-    "anecdote",
-    "exorcist",
-    "flathead",
-    "factored",
-    "salivary",
-    "agronomy",
-    "amenable",
-    "emulated",
-    "shotguns",
-    "thirties",
-    "demented",
-    "dumpster",
-    "japonica",
-    "megabyte",
-    "lowlands",
-    "greenery",
-    "etcetera",
-    "monastic",
-    "catchers",
-    "perilous",
-    "biennium",
-    "quartile",
-    "geodetic",
-    "ascorbic",
-    "covalent",
-    "herewith",
-    "plankton",
-    "cleanups",
-    "loophole",
-    "uplifted",
-    "acceptor",
-    "batterie",
-    "gossamer",
-    "boneless",
-    "disliked",
-    "impurity",
-    "greenish",
-    "rockaway",
-    "mingling",
-    "bundling",
-    "signaled",
-    "littered",
-    "warfarin",
-    "verdicts",
-    "eyeglass",
-    "earphone",
-    "cowardly",
-    "wielding",
-    "unworthy",
-    "fruition",
-    "enslaved",
-    "headgear",
-    "gimmicks",
-    "stumbles",
-    "clematis",
-    "slashing",
-    "demeanor",
-    "babydoll",
-    "paganism",
-    "filigree",
-    "ingested",
-    "entitles",
-    "exacting",
-    "ionizing",
-    "enforces",
-    "notional",
-    "bastille",
-    "populist",
-    "mnemonic",
-    "heraldry",
-    "finisher",
-    "quartets",
-    "viscount",
-    "devolved",
-    "varietal",
-    "streamed",
-    "gorillas",
-    "epidural",
-    "teardrop",
-    "claddagh",
-    "sprocket",
-    "sentient",
-    "olympiad",
-    "strainer",
-    "resuming",
-    "bruising",
-    "flogging",
-    "warlords",
-    "cochlear",
-    "seaboard",
-    "foldable",
-    "vagabond",
-    "isobaric",
-    "adopters",
-    "sneaking",
-    "greening",
-    "overtake",
-    "unbeaten",
-    "sheeting",
-    "hallways",
-    "armament",
-    "onscreen",
-    "grafting",
-    "stylists",
-    "larkspur",
-    "obstruct",
-    "saddened",
-    "crowding",
-    "dulcimer",
-    "freeform",
-    "reflexes",
-    "outlawed",
-    "injuring",
-    "underpin",
-    "baldness",
-    "didactic",
-    "lustrous",
-    "slapping",
-    "isoforms",
-    "boardman",
-    "heartily",
-    "intifada",
-    "lobsters",
-    "balsamic",
-    "eventful",
-    "stiletto",
-    "dropouts",
-    "fractals",
-    "displace",
-    "endnotes",
-    "denoting",
-    "storming",
-    "conduits",
-    "alluring",
-    "bookends",
-    "reviving",
-    "crafters",
-    "unsorted",
-    "stinging",
-    "globular",
-    "peepshow",
-    "vintages",
-    "doomsday",
-    "scarring",
-    "daydream",
-    "speedily",
-    "chimneys",
-    "denounce",
-    "odometer",
-    "couplers",
-    "murmured",
-    "undersea",
-    "vanadium",
-    "polygamy",
-    "devising",
-    "sustains",
-    "floppies",
-    "kilowatt",
-    "nematode",
-    "railings",
-    "chillers",
-    "modestly",
-    "aeration",
-    "antennae",
-    "grievous",
-    "synoptic",
-    "resorted",
-    "warships",
-    "woodbine",
-    "farthest",
-    "iniquity",
-    "prepress",
-    "militias",
-    "menacing",
-    "solvency",
-    "neurotic",
-    "blowfish",
-    "shackles",
-    "queueing",
-    "sadistic",
-    "takeaway",
-    "timeouts",
-    "recenter",
-    "hematite",
-    "piloting",
-    "reinvent",
-    "biologic",
-    "convicts",
-    "suffixes",
-    "seascape",
-    "sparrows",
-    "bleached",
-    "hazelnut",
-    "antimony",
-    "melamine",
-    "episodic",
-    "divisive",
-    "accruals",
-    "crenshaw",
-    "rescuing",
-    "reworked",
-    "catapult",
-    "moorings",
-    "tweezers",
-    "bearcats",
-    "snooping",
-    "lifeless",
-    "sobriety",
-    "sprinter",
-    "crickets",
-    "silicate",
-    "alcohols",
-    "flanking",
-    "laziness",
-    "marigold",
-    "tireless",
-    "lollipop",
-    "pastimes",
-    "coolness",
-    "doorbell",
-    "embolism",
-    "highness",
-    "starling",
-    "energize",
-    "inquires",
-    "sprayers",
-    "phantasy",
-    "lattices",
-    "underlie",
-    "clotting",
-    "tradeoff",
-    "homestay",
-    "concours",
-    "beatings",
-    "newfound",
-    "collider",
-    "lanyards",
-    "bulkhead",
-    "flagging",
-    "wounding",
-    "birthing",
-    "stemware",
-    "proposer",
-    "glancing",
-    "inflamed",
-    "baptisms",
-    "melodias",
-    "succinct",
-    "palpable",
-    "townhome",
-    "modulate",
-    "newscast",
-    "outtakes",
-    "minstrel",
-    "dentures",
-    "nitrates",
-    "outliers",
-    "shifters",
-    "censuses",
-    "neckline",
-    "classico",
-    "wrinkled",
-    "falconer",
-    "watchman",
-    "brooding",
-    "downlink",
-    "juncture",
-    "borehole",
-    "panelist",
-    "mailroom",
-    "medalist",
-    "flowered",
-    "reformat",
-    "synapses",
-    "armoires",
-    "behemoth",
-    "crucifix",
-    "crawfish",
-    "centrist",
-    "vultures",
-    "outlooks",
-    "forcible",
-    "lifeboat",
-    "luxuries",
-    "inflight",
-    "heredity",
-    "descends",
-    "sensuous",
-    "shampoos",
-    "balmoral",
-    "misheard",
-    "typology",
-    "unspoken",
-    "sparring",
-    "blurring",
-    "jaundice",
-    "airframe",
-    "preowned",
-    "dietetic",
-    "redacted",
-    "parallax",
-    "thwarted",
-    "spindles",
-    "preteens",
-    "crossbow",
-    "tenderly",
-    "renounce",
-    "effector",
-    "discards",
-    "stillman",
-    "acrylics",
-    "credence",
-    "footpath",
-    "civility",
-    "thrasher",
-    "unshaved",
-    "softwood",
-    "croupier",
-    "compacts",
-    "rhinitis",
-    "blushing",
-    "breathes",
-    "mariachi",
-    "lectured",
-    "dossiers",
-    "worsened",
-    "badlands",
-    "speckled",
-    "resonate",
-    "outfield",
-    "phenolic",
-    "courting",
-    "woodcock",
-    "restarts",
-    "churning",
-    "chariots",
-    "streamer",
-    "reproach",
-    "flurries",
-    "serrated",
-    "cheaters",
-    "upheaval",
-    "biopsies",
-    "mouthful",
-    "epitopes",
-    "unstrung",
-    "toppings",
-    "penchant",
-    "allegory",
-    "harbours",
-    "lymphoid",
-    "insanely",
-    "pashmina",
-    "attested",
-    "undercut",
-    "transect",
-    "soloists",
-    "frighten",
-    "headroom",
-    "subtlety",
-    "delicacy",
-    "futility",
-    "blissful",
-    "platonic",
-    "chewable",
-    "whooping",
-    "everyman",
-    "convenor",
-    "proteome",
-    "warheads",
-    "palettes",
-    "sparsely",
-    "guilders",
-    "mistrust",
-    "lordship",
-    "lecithin",
-    "headless",
-    "anatomic",
-    "rattling",
-    "legalize",
-    "divorces",
-    "picayune",
-    "frontman",
-    "wiretaps",
-    "homespun",
-    "humpback",
-    "wheelers",
-    "preparer",
-    "postures",
-    "tattered",
-    "harvests",
-    "clemency",
-    "ligation",
-    "teleport",
-    "geniuses",
-    "prorated",
-    "whiskers",
-    "huntsman",
-    "saddlery",
-    "admirers",
-    "mustache",
-    "truncate",
-    "overseen",
-    "crayfish",
-    "prodigal",
-    "resolute",
-    "cesarean",
-    "dialling",
-    "recitals",
-    "collages",
-    "seatbelt",
-    "dumbbell",
-    "lowrider",
-    "organist",
-    "unbonded",
-    "chuckled",
-    "furthest",
-    "virulent",
-    "barbaric",
-    "glycerin",
-    "tailings",
-    "lifelike",
-    "tumblers",
-    "untapped",
-    "excelled",
-    "pretzels",
-    "enforcer",
-    "bloopers",
-    "scrubber",
-    "yearling",
-    "reaffirm",
-    "rapidity",
-    "airtight",
-    "sparking",
-    "alluvial",
-    "incisive",
-    "tenement",
-    "bypassed",
-    "relaying",
-    "overlord",
-    "daffodil",
-    "suffices",
-    "statuary",
-    "smithers",
-    "amygdala",
-    "notaries",
-    "photoset",
-    "quagmire",
-    "cleansed",
-    "fainting",
-    "theorist",
-    "entailed",
-    "curative",
-    "traitors",
-    "patently",
-    "fanciful",
-    "dismayed",
-    "remitted",
-    "washroom",
-    "teething",
-    "gardenia",
-    "occupier",
-    "lunchbox",
-    "clocking",
-    "premiers",
-    "hyacinth",
-    "derelict",
-    "shrouded",
-    "veracity",
-    "surfside",
-    "tsunamis",
-    "hotlinks",
-    "kamikaze",
-    "counsels",
-    "gramercy",
-    "foreplay",
-    "uncovers",
-    "gargoyle",
-    "stomping",
-    "fiddling",
-    "schooled",
-    "kingwood",
-    "loveless",
-    "nostrils",
-    "gridiron",
-    "jalapeno",
-    "touchpad",
-    "confocal",
-    "phantoms",
-    "smirking",
-    "begotten",
-    "sparkles",
-    "collared",
-    "stringed",
-    "irritant",
-    "monolith",
-    "crutches",
-    "failings",
-    "hallowed",
-    "listeria",
-    "lawmaker",
-    "heralded",
-    "clearest",
-    "mediates",
-    "phrasing",
-    "standish",
-    "quarries",
-    "sensibly",
-    "biathlon",
-    "intently",
-    "morphing",
-    "tricycle",
-    "trillium",
-    "concedes",
-    "bitching",
-    "humanoid",
-    "breather",
-    "emeralds",
-    "ottomans",
-    "lockable",
-    "airliner",
-    "scouring",
-    "underlay",
-    "plunging",
-    "shambles",
-    "stinking",
-    "porridge",
-    "dominick",
-    "diffused",
-    "leftists",
-    "unshaven",
-    "cupcakes",
-    "giggling",
-    "barnyard",
-    "camellia",
-    "artifice",
-    "deranged",
-    "rebooted",
-    "offerors",
-    "demolish",
-    "aqueduct",
-    "unicorns",
-    "playroom",
-    "dandruff",
-    "pacifier",
-    "cemented",
-    "crowning",
-    "smuggled",
-    "tripwire",
-    "junkyard",
-    "doubting",
-    "inductor",
-    "libretto",
-    "loadings",
-    "notables",
-    "snorting",
-    "loyalist",
-    "purebred",
-    "bergamot",
-    "bakelite",
-    "klondike",
-    "clogging",
-    "ladybird",
-    "leggings",
-    "dilation",
-    "droughts",
-    "nocturne",
-    "altruism",
-    "bootlegs",
-    "dutchman",
-    "contessa",
-    "knockoff",
-    "sneezing",
-    "payables",
-    "tenacity",
-    "enviable",
-    "carpeted",
-    "ballasts",
-    "accruing",
-    "actuated",
-    "lamented",
-    "perfumed",
-    "appraise",
-    "collated",
-    "stuffers",
-    "shadowed",
-    "drooling",
-    "overlaid",
-    "bagpipes",
-    "wizardry",
-    "headrest",
-    "unneeded",
-    "sketched",
-    "firmness",
-    "selfless",
-    "stowaway",
-    "blasters",
-    "remedied",
-    "ramblers",
-    "scorched",
-    "botanica",
-    "nanotube",
-    "stanhope",
-    "finitely",
-    "sulfuric",
-    "bulleted",
-    "suspends",
-    "desirous",
-    "exemplar",
-    "surefire",
-    "unionist",
-    "pennants",
-    "boggling",
-    "newsdesk",
-    "foosball",
-    "priestly",
-    "cubicles",
-    "ribosome",
-    "balancer",
-    "dinghies",
-    "apparels",
-    "lounging",
-    "dyslexic",
-    "overseer",
-    "wishbone",
-    "licenced",
-    "squirter",
-    "ganglion",
-    "excreted",
-    "scribble",
-    "firework",
-    "localize",
-    "vigorish",
-    "copyleft",
-    "bullhead",
-    "headland",
-    "hobbyist",
-    "agitator",
-    "heighten",
-    "quotable",
-    "dogmatic",
-    "motioned",
-    "felonies",
-    "casebook",
-    "beheaded",
-    "postmark",
-    "pinewood",
-    "bereaved",
-    "seahorse",
-    "softener",
-    "seraphim",
-    "alopecia",
-    "blunders",
-    "lineages",
-    "approver",
-    "parables",
-    "valkyrie",
-    "unproven",
-    "beholder",
-    "hydrated",
-    "sedition",
-    "gremlins",
-    "ricochet",
-    "aberrant",
-    "ruptured",
-    "doorways",
-    "thrombin",
-    "colliery",
-    "sweeties",
-    "landfall",
-    "prefixed",
-    "freeways",
-    "vitreous",
-    "dolomite",
-    "salvaged",
-    "millwork",
-    "takedown",
-    "unmasked",
-    "pipettes",
-    "artefact",
-    "baptised",
-    "stalling",
-    "hausfrau",
-    "acquaint",
-    "havelock",
-    "mahjongg",
-    "dropkick",
-    "purports",
-    "soulmate",
-    "datebook",
-    "spangled",
-    "palomino",
-    "invoiced",
-    "moorcock",
-    "cornered",
-    "eyeliner",
-    "totalled",
-    "vaseline",
-    "cutbacks",
-    "moldings",
-    "overruns",
-    "canaries",
-    "meatloaf",
-    "lukewarm",
-    "accolade",
-    "eyeballs",
-    "devoting",
-    "oxymoron",
-    "idolatry",
-    "stipends",
-    "pinching",
-    "ubiquity",
-    "infidels",
-    "diabolic",
-    "pinscher",
-    "irritate",
-    "fellatio",
-    "remaster",
-    "envisage",
-    "fictions",
-    "geodesic",
-    "trending",
-    "buttered",
-    "toiletry",
-    "stretchy",
-    "pledging",
-    "puddings",
-    "chaining",
-    "defected",
-    "holocene",
-    "skimming",
-    "stomachs",
-    "namesake",
-    "gratuity",
-    "foothold",
-    "sobering",
-    "leachate",
-    "dioceses",
-    "besieged",
-    "deviance",
-    "fondness",
-    "emoticon",
-    "lyricist",
-    "ticklish",
-    "alienate",
-    "monotype",
-    "usefully",
-    "deepened",
-    "gridlock",
-    "unranked",
-    "pretense",
-    "standups",
-    "globulin",
-    "violator",
-    "adsorbed",
-    "shuffled",
-    "shelling",
-    "engulfed",
-    "bequests",
-    "operatic",
-    "lessened",
-    "reciting",
-    "backfill",
-    "fascists",
-    "curbside",
-    "stoppage",
-    "subsided",
-    "notifier",
-    "valerian",
-    "frenzied",
-    "enrollee",
-    "orbitals",
-    "adjutant",
-    "pondered",
-    "mannered",
-    "stalwart",
-    "verandah",
-    "isolator",
-    "canvases",
-    "applauds",
-    "barbican",
-    "faceless",
-    "anathema",
-    "quintile",
-    "bouncers",
-    "iterated",
-    "diuretic",
-    "biscotti",
-    "heroines",
-    "unpacked",
-    "clenched",
-    "communes",
-    "devoured",
-    "overpass",
-    "inwardly",
-    "bottomed",
-    "haircuts",
-    "crewneck",
-    "continua",
-    "privates",
-    "skirmish",
-    "anyplace",
-    "dynamism",
-    "crumbled",
-    "rucksack",
-    "payloads",
-    "overhang",
-    "estoppel",
-    "emigrant",
-    "bassinet",
-    "salesmen",
-    "epistles",
-    "trampled",
-    "chipotle",
-    "atrocity",
-    "billable",
-    "tiresome",
-    "splashed",
-    "antonyms",
-    "biofuels",
-    "collided",
-    "boarders",
-    "chivalry",
-    "playbook",
-    "poaching",
-    "hadronic",
-    "sittings",
-    "thatched",
-    "rockfish",
-    "duodenal",
-    "coworker",
-    "coconuts",
-    "confuses",
-    "hellfire",
-    "havering",
-    "camshaft",
-    "wavelets",
-    "wheezing",
-    "someones",
-    "effusion",
-    "educates",
-    "hydroxyl",
-    "showered",
-    "polishes",
-    "flatiron",
-    "pretends",
-    "disrupts",
-    "deflated",
-    "unsteady",
-    "leopards",
-    "skilling",
-    "buzzword",
-    "imperium",
-    "aldehyde",
-    "brownish",
-    "cropland",
-    "testicle",
-    "rosettes",
-    "volition",
-    "riddance",
-    "ironwood",
-    "allusion",
-    "liqueurs",
-    "unzipped",
-    "turmeric",
-    "parietal",
-    "fibroids",
-    "insulate",
-    "babbling",
-    "twinning",
-    "ashtrays",
-    "sedative",
-    "lettered",
-    "hotlines",
-    "apricots",
-    "ranching",
-    "toasting",
-    "whirling",
-    "doghouse",
-    "playgirl",
-    "recesses",
-    "loveseat",
-    "regrowth",
-    "cybersex",
-    "doughnut",
-    "cribbage",
-    "martinis",
-    "flexibly",
-    "gendered",
-    "linoleum",
-    "culverts",
-    "shrapnel",
-    "bristles",
-    "rollaway",
-    "grievant",
-    "seagulls",
-    "centroid",
-    "inhumane",
-    "panicked",
-    "abandons",
-    "phosphor",
-    "roosters",
-    "flapping",
-    "teriyaki",
-    "heretics",
-    "cyclonic",
-    "thumping",
-    "eugenics",
-    "johnsons",
-    "supremes",
-    "starlets",
-    "emphatic",
-    "homeward",
-    "withered",
-    "fluorine",
-    "earpiece",
-    "rooftops",
-    "oncoming",
-    "cloister",
-    "littoral",
-    "fronting",
-    "outflows",
-    "swatches",
-    "lemmings",
-    "disprove",
-    "urbanism",
-    "eclipses",
-    "keynotes",
-    "hastened",
-    "ripening",
-    "choruses",
-    "scrapers",
-    "rejoined",
-    "urologic",
-    "impotent",
-    "crawlers",
-    "cloaking",
-    "dichroic",
-    "gratings",
-    "prettier",
-    "haystack",
-    "etchings",
-    "stifling",
-    "realises",
-    "mermaids",
-    "spinster",
-    "brimming",
-    "grommets",
-    "unending",
-    "roughing",
-    "venomous",
-    "tapering",
-    "roasters",
-    "unjustly",
-    "neutered",
-    "rehearse",
-    "seducing",
-    "fearsome",
-    "likeable",
-    "swarming",
-    "capoeira",
-    "chuckles",
-    "grayling",
-    "monomers",
-    "solidify",
-    "abutting",
-    "venturer",
-    "gunmetal",
-    "garlands",
-    "degrades",
-    "forefoot",
-    "soreness",
-    "boldness",
-    "cramping",
-    "loosened",
-    "virility",
-    "snowbird",
-    "meddling",
-    "expresso",
-    "tincture",
-    "erecting",
-    "tenderer",
-    "impeller",
-    "enameled",
-    "vortices",
-    "eateries",
-    "drawdown",
-    "encrypts",
-    "lengthen",
-    "spoonful",
-    "sociable",
-    "speculum",
-    "illusory",
-    "inspects",
-    "stepwise",
-    "rounders",
-    "seaplane",
-    "methinks",
-    "flagrant",
-    "acidosis",
-    "emitters",
-    "glucagon",
-    "loudness",
-    "leanings",
-    "gullible",
-    "smuggler",
-    "synovial",
-    "imparted",
-    "headlong",
-    "tethered",
-    "perverts",
-    "fluently",
-    "saraband",
-    "trembled",
-    "janitors",
-    "anagrams",
-    "exegesis",
-    "brothels",
-    "futurist",
-    "lycopene",
-    "natively",
-    "homologs",
-    "sublease",
-    "menschen",
-    "fondling",
-    "laxative",
-    "funhouse",
-    "rattlers",
-    "carbonyl",
-    "telecast",
-    "breeches",
-    "seashell",
-    "pacifist",
-    "brassica",
-    "achiever",
-    "grueling",
-    "downwind",
-    "libelous",
-    "hermetic",
-    "marauder",
-    "showings",
-    "cardamom",
-    "exerting",
-    "birdlife",
-    "tamarack",
-    "backfire",
-    "disarray",
-    "cleanest",
-    "tantalum",
-    "culprits",
-    "trinkets",
-    "admirals",
-    "politico",
-    "deterred",
-    "biennale",
-    "cossacks",
-    "bluefish",
-    "seething",
-    "burritos",
-    "wingspan",
-    "buncombe",
-    "reappear",
-    "playbill",
-    "espoused",
-    "buckling",
-    "songbird",
-    "seafront",
-    "sunblock",
-    "redwoods",
-    "deselect",
-    "smelting",
-    "slippage",
-    "dovetail",
-    "orgasmic",
-    "riverbed",
-    "freckles",
-    "chipmunk",
-    "destruct",
-    "fiscally",
-    "imitated",
-    "optician",
-    "fantasie",
-    "bloating",
-    "slowness",
-    "backroom",
-    "dragster",
-    "snelling",
-    "sufferer",
-    "shamanic",
-    "shopgirl",
-    "servicer",
-    "bollocks",
-    "baffling",
-    "hopefuls",
-    "atropine",
-    "equating",
-    "backflow",
-    "aldermen",
-    "commends",
-    "colonels",
-    "squashed",
-    "wisteria",
-    "reassess",
-    "supercar",
-    "creepers",
-    "splatter",
-    "quilters",
-    "thievery",
-    "splashes",
-    "homesick",
-    "rainwear",
-    "imagines",
-    "unfilled",
-    "obligate",
-    "flocking",
-    "humidors",
-    "postgrad",
-    "crossbar",
-    "chimeric",
-    "flattery",
-    "payrolls",
-    "indulged",
-    "barbells",
-    "spoiling",
-    "detritus",
-    "bustiers",
-    "pickwick",
-    "devilish",
-    "scathing",
-    "ketamine",
-    "autobahn",
-    "stearate",
-    "lethargy",
-    "casework",
-    "finality",
-    "wrestled",
-    "sciatica",
-    "caucuses",
-    "receding",
-    "outposts",
-    "treading",
-    "toroidal",
-    "megawatt",
-    "sharpest",
-    "palisade",
-    "moccasin",
-    "resented",
-    "peppered",
-    "cystitis",
-    "proforma",
-    "prolapse",
-    "sixpence",
-    "repairer",
-    "innuendo",
-    "digitize",
-    "drifters",
-    "calamari",
-    "prophesy",
-    "percents",
-    "soldered",
-    "neonates",
-    "raincoat",
-    "scammers",
-    "straddle",
-    "imbedded",
-    "quenched",
-    "conifers",
-    "colliers",
-    "feldspar",
-    "maharaja",
-    "idealist",
-    "weathers",
-    "depraved",
-    "puppetry",
-    "stopover",
-    "potholes",
-    "smacking",
-    "solvable",
-    "neckties",
-    "levelled",
-    "sorption",
-    "dempster",
-    "eclipsed",
-    "cationic",
-    "munchkin",
-    "punctual",
-    "runaways",
-    "boniface",
-    "testable",
-    "bookable",
-    "ganymede",
-    "enjoined",
-    "banknote",
-    "pageants",
-    "broadens",
-    "supplant",
-    "fusarium",
-    "bestiary",
-    "cranking",
-    "serpents",
-    "tampered",
-    "sawtooth",
-    "bedstead",
-    "bathtubs",
-    "antiqued",
-    "chitosan",
-    "seabirds",
-    "cofactor",
-    "magdalen",
-    "spillage",
-    "brackish",
-    "revoking",
-    "thiamine",
-    "woefully",
-    "pivoting",
-    "taunting",
-    "outwards",
-    "dialogic",
-    "permease",
-    "ponytail",
-    "pharaohs",
-    "arbitral",
-    "chateaux",
-    "skirting",
-    "gatherer",
-    "slackers",
-    "kindling",
-    "serotype",
-    "passable",
-    "hilarity",
-    "tamarind",
-    "moorland",
-    "bullfrog",
-    "divinely",
-    "hedonism",
-    "sawmills",
-    "trotting",
-    "ambushed",
-    "pianists",
-    "travesty",
-    "uncoated",
-    "castaway",
-    "amniotic",
-    "scariest",
-    "bathrobe",
-    "ngultrum",
-    "footwork",
-    "fatigued",
-    "objector",
-    "darlings",
-    "reprieve",
-    "relaunch",
-    "blanking",
-    "flagpole",
-    "illegals",
-    "orthotic",
-    "lavishly",
-    "foretold",
-    "engraver",
-    "tortures",
-    "flaxseed",
-    "littlest",
-    "cadastre",
-    "trickery",
-    "adherent",
-    "rheology",
-    "forehand",
-    "bolsters",
-    "loveable",
-    "urethral",
-    "molested",
-    "modeller",
-    "lingered",
-    "feasting",
-    "tightens",
-    "beadwork",
-    "seafloor",
-    "inequity",
-    "sweepers",
-    "ravished",
-    "spearman",
-    "fentanyl",
-    "creamery",
-    "bypasses",
-    "atrazine",
-    "fissures",
-    "clinched",
-    "riverine",
-    "fluidity",
-    "creasing",
-    "cabochon",
-    "brokered",
-    "fermions",
-    "evermore",
-    "inhaling",
-    "backrest",
-    "callable",
-    "bareboat",
-    "chairing",
-    "tradable",
-    "axillary",
-    "cooktops",
-    "groaning",
-    "rejoiced",
-    "frenetic",
-    "postural",
-    "corrupts",
-    "merengue",
-    "hoisting",
-    "enthalpy",
-    "tankless",
-    "inciting",
-    "skippers",
-    "revolved",
-    "armature",
-    "gatefold",
-    "durables",
-    "ellipsis",
-    "marquees",
-    "outhouse",
-    "vanquish",
-    "dextrose",
-    "laudable",
-    "permeate",
-    "deviants",
-    "munching",
-    "fumbling",
-    "uncooked",
-    "placards",
-    "nonfatal",
-    "unbelief",
-    "airstrip",
-    "sardines",
-    "sidewall",
-    "duckling",
-    "reprisal",
-    "blighted",
-    "warblers",
-    "tarragon",
-    "rumbling",
-    "bouillon",
-    "celibacy",
-    "beaucoup",
-    "finalise",
-    "engender",
-    "quandary",
-    "streaked",
-    "emphases",
-    "polisher",
-    "crouched",
-    "impeding",
-    "erythema",
-    "jumpsuit",
-    "overpaid",
-    "shigella",
-    "tracheal",
-    "kickback",
-    "boldface",
-    "nihilism",
-    "caulking",
-    "mackinaw",
-    "euphoric",
-    "twirling",
-    "deviates",
-    "subbasin",
-    "enquires",
-    "strokers",
-    "overcoat",
-    "fishbowl",
-    "spouting",
-    "humbling",
-    "mentored",
-    "martians",
-    "giraffes",
-    "capsicum",
-    "divulged",
-    "shrunken",
-    "subfield",
-    "provokes",
-    "knitters",
-    "staplers",
-    "referent",
-    "specular",
-    "sanguine",
-    "amaretto",
-    "swastika",
-    "backhand",
-    "uprooted",
-    "distorts",
-    "sinfonia",
-    "grandmas",
-    "oxytocin",
-    "decibels",
-    "mightily",
-    "unwieldy",
-    "penalize",
-    "coarsely",
-    "shallots",
-    "paneling",
-    "thickens",
-    "crumpled",
-    "batching",
-    "rosaries",
-    "preaches",
-    "growling",
-    "ungraded",
-    "weeklies",
-    "toppling",
-    "workweek",
-    "psyllium",
-    "neurosis",
-    "carboxyl",
-    "sprained",
-    "awardees",
-    "conclave",
-    "unionism",
-    "aventail",
-    "boycotts",
-    "subacute",
-    "solicits",
-    "ugliness",
-    "shavings",
-    "peddling",
-    "stupidly",
-    "buckskin",
-    "protozoa",
-    "remaking",
-    "tabloids",
-    "crosscut",
-    "mandible",
-    "frescoes",
-    "puritans",
-    "subgraph",
-    "knotting",
-    "sundials",
-    "gymnasts",
-    "crimping",
-    "trotters",
-    "binaural",
-    "latching",
-    "nobleman",
-    "dystopia",
-    "flatness",
-    "buttress",
-    "foregone",
-    "tandoori",
-    "sequined",
-    "fastball",
-    "refilled",
-    "digester",
-    "strolled",
-    "rewrites",
-    "scratchy",
-    "calmness",
-    "confound",
-    "emulates",
-    "tantrums",
-    "glassman",
-    "christen",
-    "logotype",
-    "afferent",
-    "conquers",
-    "clashing",
-    "muenster",
-    "catalase",
-    "unspoilt",
-    "snickers",
-    "dishonor",
-    "hoarding",
-    "roadless",
-    "underarm",
-    "coquille",
-    "antacids",
-    "enlarger",
-    "lozenges",
-    "dizzying",
-    "smearing",
-    "columnar",
-    "terabyte",
-    "utilises",
-    "enablers",
-    "raccoons",
-    "poetical",
-    "heraldic",
-    "maladies",
-    "adjudged",
-    "mobilise",
-    "princely",
-    "diatribe",
-    "presumes",
-    "mastitis",
-    "subgenre",
-    "mournful",
-    "scheming",
-    "trashing",
-    "disarmed",
-    "baseless",
-    "feverish",
-    "pavillon",
-    "neglects",
-    "suckling",
-    "trawling",
-    "flatmate",
-    "cockatoo",
-    "elevates",
-    "bounties",
-    "longboat",
-    "preludes",
-    "weirdest",
-    "acquirer",
-    "webworks",
-    "farmyard",
-    "condense",
-    "rocketry",
-    "immobile",
-    "musicale",
-    "incubate",
-    "waggoner",
-    "triassic",
-    "deadbeat",
-    "chatters",
-    "amicable",
-    "enclaves",
-    "parakeet",
-    "pressman",
-    "colloquy",
-    "refiners",
-    "scrolled",
-    "retorted",
-    "fiftieth",
-    "groupies",
-    "joyfully",
-    "skittles",
-    "vengeful",
-    "lunatics",
-    "hospices",
-    "subsumed",
-    "pelicans",
-    "stockman",
-    "snatches",
-    "bankcard",
-    "botanist",
-    "glycolic",
-    "timidity",
-    "silences",
-    "transits",
-    "strangle",
-    "propolis",
-    "plateaus",
-    "honeydew",
-    "terrapin",
-    "easiness",
-    "downbeat",
-    "plantain",
-    "couscous",
-    "annealed",
-    "reassign",
-    "meringue",
-    "crushers",
-    "overused",
-    "tweeters",
-    "mourners",
-    "unsalted",
-    "paddlers",
-    "longline",
-    "sulphide",
-    "outcasts",
-    "mortally",
-    "oxidants",
-    "carbonic",
-    "bushveld",
-    "thruster",
-    "phonemic",
-    "pentacle",
-    "equalize",
-    "grossing",
-    "interred",
-    "harshest",
-    "pigtails",
-    "neutrals",
-    "conspire",
-    "meatball",
-    "aquarian",
-    "spillway",
-    "commutes",
-    "denizens",
-    "abetting",
-    "modelers",
-    "codebook",
-    "conjures",
-    "drafters",
-    "lynching",
-    "rabbinic",
-    "amaranth",
-    "jokingly",
-    "watchmen",
-    "pacifism",
-    "esthetic",
-    "testator",
-    "distaste",
-    "offshoot",
-    "uttering",
-    "construe",
-    "flotilla",
-    "gladness",
-    "workdays",
-    "armorial",
-    "tableaux",
-    "hijacker",
-    "relaxant",
-    "barstool",
-    "lysozyme",
-    "monotony",
-    "pyridine",
-    "wellhead",
-    "unabated",
-    "marksman",
-    "rebuilds",
-    "mulching",
-    "rudeness",
-    "thermals",
-    "aborting",
-    "cichlids",
-    "viewings",
-    "wickedly",
-    "butthead",
-    "elongate",
-    "landless",
-    "unsealed",
-    "moonrise",
-    "duodenum",
-    "apostasy",
-    "vicarage",
-    "cornmeal",
-    "entwined",
-    "striatum",
-    "bilinear",
-    "tagboard",
-    "relapsed",
-    "ringside",
-    "artfully",
-    "inground",
-    "marinara",
-    "calliope",
-    "boomtown",
-    "milepost",
-    "formalin",
-    "futurity",
-    "lopsided",
-    "flippers",
-    "enriches",
-    "neophyte",
-    "goldtone",
-    "pardoned",
-    "wormwood",
-    "oilseeds",
-    "conceals",
-    "satanism",
-    "billfold",
-    "shagging",
-    "ringworm",
-    "outgrown",
-    "honorees",
-    "rumoured",
-    "futurism",
-    "coalesce",
-    "brougham",
-    "fruiting",
-    "windings",
-    "burglars",
-    "molluscs",
-    "viatical",
-    "squeezes",
-    "buckaroo",
-    "adoptees",
-    "lilliput",
-    "pinwheel",
-    "bluffing",
-    "ellipses",
-    "airspeed",
-    "normalcy",
-    "bandanas",
-    "backwash",
-    "banshees",
-    "wormhole",
-    "sintered",
-    "hairline",
-    "arousing",
-    "avocados",
-    "taxicabs",
-    "honeybee",
-    "upmarket",
-    "disturbs",
-    "barrette",
-    "nymphets",
-    "oleander",
-    "ferocity",
-    "culpable",
-    "entryway",
-    "sidebars",
-    "wordplay",
-    "cremated",
-    "fullback",
-    "slipcase",
-    "unharmed",
-    "buttoned",
-    "sprouted",
-    "lambskin",
-    "omelette",
-    "unhinged",
-    "primeval",
-    "interned",
-    "operetta",
-    "aviators",
-    "hardline",
-    "hurrying",
-    "blowouts",
-    "dissuade",
-    "pliocene",
-    "novation",
-    "beautify",
-    "purveyor",
-    "telomere",
-    "premised",
-    "thallium",
-    "henchmen",
-    "cuddling",
-    "naloxone",
-    "pretence",
-    "fuelling",
-    "scabbard",
-    "rippling",
-    "handrail",
-    "pervades",
-    "alfresco",
-    "charlies",
-    "confided",
-    "mumbling",
-    "redbirds",
-    "paladins",
-    "toenails",
-    "wannabes",
-    "devonian",
-    "misnomer",
-    "braiding",
-    "odorless",
-    "opulence",
-    "coursing",
-    "palabras",
-    "casement",
-    "serially",
-    "earplugs",
-    "apprised",
-    "comparer",
-    "munchies",
-    "greenies",
-    "buzzards",
-    "penumbra",
-    "punishes",
-    "trifecta",
-    "forename",
-    "lapidary",
-    "skimmers",
-    "ferritin",
-    "leftmost",
-    "repaying",
-    "heliport",
-    "carillon",
-    "hydrants",
-    "cowgirls",
-    "popsicle",
-    "decently",
-    "glitters",
-    "comatose",
-    "trappers",
-    "gyration",
-    "anorexic",
-    "bushfire",
-    "dockside",
-    "thalamus",
-    "steppers",
-    "vaccinia",
-    "escapade",
-    "madrigal",
-    "signpost",
-    "saturate",
-    "reducers",
-    "jacuzzis",
-    "laboring",
-    "teenaged",
-    "overheat",
-    "hydrates",
-    "roadkill",
-    "goodbyes",
-    "perusing",
-    "mesozoic",
-    "terrazzo",
-    "radiates",
-    "lovelock",
-    "emigrate",
-    "alleluia",
-    "homeobox",
-    "cheetahs",
-    "monocyte",
-    "rednecks",
-    "creosote",
-    "textural",
-    "waitlist",
-    "gunpoint",
-    "biogenic",
-    "grownups",
-    "telltale",
-    "sequelae",
-    "aqualung",
-    "skinhead",
-    "quarrels",
-    "hematoma",
-    "dihedral",
-    "ravenous",
-    "overplay",
-    "wreckers",
-    "savagery",
-    "thunders",
-    "farthing",
-    "crevices",
-    "wringing",
-    "naturism",
-    "ruminant",
-    "plucking",
-    "rickshaw",
-    "notepads",
-    "rebelled",
-    "encloses",
-    "claymore",
-    "cantatas",
-    "minutiae",
-    "deviated",
-    "solitons",
-    "coachman",
-    "reuptake",
-    "haywards",
-    "mastodon",
-    "cerulean",
-    "bilberry",
-    "ligature",
-    "sagittal",
-    "weeklong",
-    "faulting",
-    "bearable",
-    "hothouse",
-    "milkweed",
-    "nonhuman",
-    "bodysuit",
-    "levodopa",
-    "uprights",
-    "forearms",
-    "quickies",
-    "nonempty",
-    "slurping",
-    "radially",
-    "stigmata",
-    "bushland",
-    "adjuncts",
-    "jeweller",
-    "gangland",
-    "bluebell",
-    "costumed",
-    "vacuolar",
-    "perfecto",
-    "dampened",
-    "stalkers",
-    "tricking",
-    "shuffles",
-    "folklife",
-    "dirtiest",
-    "benadryl",
-    "twisters",
-    "icebergs",
-    "skinless",
-    "stealthy",
-    "hooligan",
-    "augments",
-    "fluorite",
-    "convenes",
-    "tartrate",
-    "candidly",
-    "shivered",
-    "massless",
-    "serology",
-    "drooping",
-    "screamer",
-    "rifampin",
-    "maligned",
-    "writhing",
-    "malamute",
-    "backhaul",
-    "ironclad",
-    "vestiges",
-    "rustling",
-    "phonemes",
-    "pectoral",
-    "hustlers",
-    "derision",
-    "vitamine",
-    "nontoxic",
-    "falconry",
-    "lexicons",
-    "marchers",
-    "credenza",
-    "outcrops",
-    "katakana",
-    "arguable",
-    "demotion",
-    "sailfish",
-    "manatees",
-    "restorer",
-    "botulism",
-    "coldness",
-    "valances",
-    "clutched",
-    "cardioid",
-    "luckiest",
-    "biannual",
-    "greedily",
-    "padlocks",
-    "argonaut",
-    "wavering",
-    "playboys",
-    "campagne",
-    "landlady",
-    "vertebra",
-    "absurdly",
-    "disposes",
-    "bumbling",
-    "pickling",
-    "refuting",
-    "scantily",
-    "nestling",
-    "starches",
-    "mistyped",
-    "glasnost",
-    "megabits",
-    "overtook",
-    "triptych",
-    "rifleman",
-    "vagaries",
-    "overrule",
-    "monogamy",
-    "revisits",
-    "idleness",
-    "entombed",
-    "diverged",
-    "craziest",
-    "overdone",
-    "cleanses",
-    "porpoise",
-    "backless",
-    "inguinal",
-    "elitists",
-    "mycology",
-    "ryegrass",
-    "fastback",
-    "misdeeds",
-    "shockers",
-    "steerage",
-    "ecliptic",
-    "statuses",
-    "schnapps",
-    "essayist",
-    "carports",
-    "pollster",
-    "colloids",
-    "terrains",
-    "unwashed",
-    "oratorio",
-    "theistic",
-    "knapsack",
-    "brachial",
-    "tourneys",
-    "remodels",
-    "staccato",
-    "refusals",
-    "outrages",
-    "mitzvahs",
-    "catfight",
-    "eventide",
-    "analytes",
-    "inhalers",
-    "almanack",
-    "giftwrap",
-    "nebulous",
-    "benzoate",
-    "fiddlers",
-    "loungers",
-    "unitrust",
-    "flicking",
-    "spaniels",
-    "squeegee",
-    "shatters",
-    "diverter",
-    "worships",
-    "sheetfed",
-    "inhabits",
-    "recycles",
-    "treetops",
-    "debunked",
-    "ductwork",
-    "narrates",
-    "lameness",
-    "stockist",
-    "nastiest",
-    "caressed",
-    "windsurf",
-    "croutons",
-    "poachers",
-    "sounders",
-    "galvanic",
-    "parlance",
-    "drunkard",
-    "monopole",
-    "catalyze",
-    "profited",
-    "buckshot",
-    "erasable",
-    "cruciate",
-    "gravelly",
-    "forgings",
-    "crampons",
-    "meniscus",
-    "sagamore",
-    "massaged",
-    "folkways",
-    "assignor",
-    "antilock",
-    "raceways",
-    "waterbed",
-    "disburse",
-    "dwindled",
-    "estancia",
-    "viburnum",
-    "mealtime",
-    "mollusks",
-    "necrotic",
-    "reinvest",
-    "salmonid",
-    "serenata",
-    "birdseye",
-    "sorbitol",
-    "rekindle",
-    "igniting",
-    "frowning",
-    "snacking",
-    "whiskies",
-    "refinish",
-    "broilers",
-    "newlywed",
-    "semiotic",
-    "conjured",
-    "acrylate",
-    "holotype",
-    "vaulting",
-    "cheerios",
-    "trifling",
-    "enamored",
-    "ulterior",
-    "downplay",
-    "enthused",
-    "lakeport",
-    "teardown",
-    "pleurisy",
-    "majolica",
-    "accursed",
-    "detrital",
-    "joyously",
-    "strident",
-    "dreading",
-    "beltline",
-    "humorist",
-    "brucella",
-    "mandamus",
-    "ditching",
-    "detonate",
-    "squaring",
-    "plumeria",
-    "peacocks",
-    "pocketed",
-    "enormity",
-    "molester",
-    "cytosine",
-    "exclaims",
-    "guzzlers",
-    "cobblers",
-    "backache",
-    "adaption",
-    "subtopic",
-    "refacing",
-    "dormancy",
-    "griffins",
-    "yuletide",
-    "rephrase",
-    "silkworm",
-    "cathodic",
-    "sombrero",
-    "tornados",
-    "insureds",
-    "imposter",
-    "summoner",
-    "coverall",
-    "habanero",
-    "foresees",
-    "shortens",
-    "inoculum",
-    "gaslight",
-    "presides",
-    "divested",
-    "gearhead",
-    "flambeau",
-    "fishkill",
-    "tangents",
-    "forgives",
-    "skewness",
-    "diluting",
-    "floaters",
-    "strummer",
-    "typified",
-    "unlinked",
-    "conjoint",
-    "liaising",
-    "provable",
-    "outmoded",
-    "markdown",
-    "spyglass",
-    "gluttony",
-    "kneading",
-    "tiramisu",
-    "utiliser",
-    "windowed",
-    "crumbles",
-    "templars",
-    "enquired",
-    "cascaded",
-    "compleat",
-    "commoner",
-    "nuclease",
-    "assented",
-    "sanctify",
-    "insolent",
-    "dystonia",
-    "brewpubs",
-    "nonesuch",
-    "pensione",
-    "corridas",
-    "heresies",
-    "birdsong",
-    "flopping",
-    "trawlers",
-    "fishnets",
-    "perfused",
-    "stickman",
-    "benchtop",
-    "reactant",
-    "tutelage",
-    "stitcher",
-    "bursitis",
-    "furthers",
-    "decrepit",
-    "stumbler",
-    "assailed",
-    "incensed",
-    "miseries",
-    "sardonic",
-    "detoxify",
-    "striders",
-    "magister",
-    "crotchet",
-    "fourfold",
-    "populism",
-    "spoilage",
-    "seafoods",
-    "abutment",
-    "parlours",
-    "deforest",
-    "pilotage",
-    "quartier",
-    "circuses",
-    "spanners",
-    "freeborn",
-    "downpour",
-    "functors",
-    "tortious",
-    "aliquots",
-    "nothings",
-    "unevenly",
-    "helicity",
-    "colonist",
-    "guzzling",
-    "ladybugs",
-    "sunspots",
-    "commuted",
-    "sequitur",
-    "vibrancy",
-    "annulled",
-    "covertly",
-    "thimbles",
-    "autumnal",
-    "peddlers",
-    "despotic",
-    "beholden",
-    "apostate",
-    "blacktop",
-    "faltered",
-    "migrates",
-    "smallish",
-    "wilfully",
-    "sailings",
-    "thinnest",
-    "hitching",
-    "predates",
-    "marinate",
-    "impolite",
-    "fishpond",
-    "revivals",
-    "irrigate",
-    "whistled",
-    "mannitol",
-    "troponin",
-    "ticketed",
-    "specious",
-    "adenomas",
-    "deprives",
-    "litigant",
-    "scimitar",
-    "fishbone",
-    "concerti",
-    "tevatron",
-    "alluding",
-    "slugging",
-    "sunrises",
-    "ranchero",
-    "sortable",
-    "dewberry",
-    "straying",
-    "venereal",
-    "obscures",
-    "befriend",
-    "turndown",
-    "abortive",
-    "cronyism",
-    "anemones",
-    "doldrums",
-    "angstrom",
-    "neomycin",
-    "upwardly",
-    "cetacean",
-    "barnacle",
-    "dingbats",
-    "shiitake",
-    "jubilant",
-    "continuo",
-    "uncorked",
-    "snuggled",
-    "hiragana",
-    "tadpoles",
-    "nepotism",
-    "torments",
-    "tortuous",
-    "ecclesia",
-    "repented",
-    "spaceman",
-    "drudgery",
-    "androids",
-    "smarties",
-    "parabola",
-    "unseemly",
-    "prosodic",
-    "tightest",
-    "repulsed",
-    "replayed",
-    "huntress",
-    "soulless",
-    "dumpling",
-    "forsooth",
-    "deathbed",
-    "tricolor",
-    "quantile",
-    "flailing",
-    "amputees",
-    "sulfates",
-    "stampers",
-    "ramparts",
-    "manholes",
-    "yearlong",
-    "frigates",
-    "pendency",
-    "basketry",
-    "flexural",
-    "phantasm",
-    "shorting",
-    "expensed",
-    "maximums",
-    "imitates",
-    "conjugal",
-    "flinging",
-    "prodding",
-    "chillies",
-    "jugglers",
-    "ballgame",
-    "sleeving",
-    "litigate",
-    "avenging",
-    "unquoted",
-    "ploughed",
-    "severing",
-    "martyred",
-    "vacating",
-    "birdcage",
-    "viridian",
-    "literati",
-    "erupting",
-    "hungrily",
-    "shutouts",
-    "chirping",
-    "skillets",
-    "spencers",
-    "suborder",
-    "eggshell",
-    "franking",
-    "monaural",
-    "supposes",
-    "runabout",
-    "rapeseed",
-    "unipolar",
-    "unicycle",
-    "homeroom",
-    "footrest",
-    "spiteful",
-    "colander",
-    "earmarks",
-    "smothers",
-    "porthole",
-    "grooving",
-    "stylings",
-    "theremin",
-    "grabbers",
-    "mouthing",
-    "colonize",
-    "undertow",
-    "madhouse",
-    "influent",
-    "pratique",
-    "calabash",
-    "vinegars",
-    "cramming",
-    "crunches",
-    "sphagnum",
-    "hotelier",
-    "auberges",
-    "bordello",
-    "faintest",
-    "genitive",
-    "uncapped",
-    "cuteness",
-    "swingman",
-    "imprison",
-    "repelled",
-    "marquess",
-    "emissary",
-    "southpaw",
-    "belittle",
-    "composes",
-    "overleaf",
-    "whacking",
-    "telethon",
-    "memorise",
-    "albacore",
-    "currants",
-    "steepest",
-    "grandest",
-    "neurones",
-    "slitting",
-    "factoids",
-    "salience",
-    "reshaped",
-    "gerberas",
-    "divisors",
-    "gingerly",
-    "intersex",
-    "fretting",
-    "moonroof",
-    "kingfish",
-    "acanthus",
-    "nextdoor",
-    "footings",
-    "scalping",
-    "autoharp",
-    "leniency",
-    "thinners",
-    "deflator",
-    "paddocks",
-    "woodsman",
-    "coroners",
-    "conjunto",
-    "clumsily",
-    "borrelia",
-    "thickets",
-    "esterase",
-    "furlough",
-    "snarling",
-    "creaking",
-    "bequeath",
-    "newsreel",
-    "megalith",
-    "reunites",
-    "vintners",
-    "marjoram",
-    "isotonic",
-    "highball",
-    "thickest",
-    "storages",
-    "neckwear",
-    "treeless",
-    "untagged",
-    "prepping",
-    "saplings",
-    "bayberry",
-    "horology",
-    "stooping",
-    "sickened",
-    "canteens",
-    "kingship",
-    "arcadian",
-    "bollards",
-    "mobsters",
-    "vastness",
-    "chromate",
-    "arsenals",
-    "tramping",
-    "bloomers",
-    "sameness",
-    "scruples",
-    "rebuffed",
-    "grouting",
-    "stirrups",
-    "allspice",
-    "pleiades",
-    "clubbers",
-    "upstarts",
-    "hipsters",
-    "cenozoic",
-    "nuthatch",
-    "subparts",
-    "sprawled",
-    "biocides",
-    "stripers",
-    "condoned",
-    "unsavory",
-    "bluegill",
-    "gangrene",
-    "purplish",
-    "regattas",
-    "hollowed",
-    "submerge",
-    "dismount",
-    "myopathy",
-    "jacketed",
-    "unafraid",
-    "seaports",
-    "shackled",
-    "saleable",
-    "recommit",
-    "abattoir",
-    "ironwork",
-    "extruder",
-    "backflip",
-    "vibrates",
-    "reverent",
-    "emanates",
-    "beckoned",
-    "migrator",
-    "scrawled",
-    "savagely",
-    "gunfight",
-    "swappers",
-    "unissued",
-    "grumbled",
-    "moribund",
-    "killdeer",
-    "hydronic",
-    "gamecock",
-    "vehement",
-    "causally",
-    "leotards",
-    "travelog",
-    "excavate",
-    "plasters",
-    "latrines",
-    "eldritch",
-    "numerics",
-    "lucidity",
-    "diazinon",
-    "invitees",
-    "lateness",
-    "celibate",
-    "heathens",
-    "ringgits",
-    "relaxers",
-    "throwers",
-    "corroded",
-    "postdocs",
-    "seigneur",
-    "funerary",
-    "detracts",
-    "nonwoven",
-    "develope",
-    "renumber",
-    "entrails",
-    "slinging",
-    "relishes",
-    "subsonic",
-    "thrashed",
-    "masseuse",
-    "sheathed",
-    "encroach",
-    "centaurs",
-    "fritters",
-    "kalamata",
-    "freakish",
-    "dipstick",
-    "raindrop",
-    "showboat",
-    "amperage",
-    "potlatch",
-    "giantess",
-    "clowning",
-    "polluter",
-    "dislodge",
-    "voyageur",
-    "divalent",
-    "groomers",
-    "quietest",
-    "maniacal",
-    "nurtures",
-    "declarer",
-    "brainiac",
-    "levering",
-    "acceding",
-    "semillon",
-    "nonlocal",
-    "gingival",
-    "scooping",
-    "roosting",
-    "occluded",
-    "squatter",
-    "limiters",
-    "enlarges",
-    "harbored",
-    "misusing",
-    "sonorous",
-    "draughts",
-    "resupply",
-    "reliving",
-    "acrobats",
-    "waltzing",
-    "polemics",
-    "armrests",
-    "solidity",
-    "campagna",
-    "dockyard",
-    "cinnabar",
-    "metrical",
-    "haggling",
-    "fiendish",
-    "wayfarer",
-    "expanses",
-    "readying",
-    "typhoons",
-    "magnesia",
-    "freedmen",
-    "obliging",
-    "coleslaw",
-    "quinones",
-    "verbiage",
-    "impelled",
-    "salutary",
-    "foxglove",
-    "glabrous",
-    "bleacher",
-    "formwork",
-    "honeypot",
-    "plaguing",
-    "touristy",
-    "ideation",
-    "stapling",
-    "multiage",
-    "dampness",
-    "downsize",
-    "porphyry",
-    "mementos",
-    "ushering",
-    "upturned",
-    "sunrooms",
-    "nibbling",
-    "gestured",
-    "meatless",
-    "chutneys",
-    "antisera",
-    "astonish",
-    "dynastic",
-    "savoring",
-    "nearness",
-    "landform",
-    "publican",
-    "handmaid",
-    "chemises",
-    "impostor",
-    "banister",
-    "checkups",
-    "quixotic",
-    "fatigues",
-    "delisted",
-    "shallows",
-    "gunsmith",
-    "debugged",
-    "frothing",
-    "coasting",
-    "rivieres",
-    "befallen",
-    "credibly",
-    "schemata",
-    "logbooks",
-    "psalmist",
-    "bilayers",
-    "penitent",
-    "monteith",
-    "doormats",
-    "basswood",
-    "sanitize",
-    "snowpack",
-    "slacking",
-    "alkaloid",
-    "glittery",
-    "oxidizer",
-    "mallards",
-    "thieving",
-    "combiner",
-    "blowback",
-    "fiducial",
-    "notecard",
-    "histones",
-    "coverlet",
-    "smoothes",
-    "midsized",
-    "intermix",
-    "meanders",
-    "furlongs",
-    "tabulate",
-    "fumarate",
-    "humanely",
-    "poontang",
-    "teletype",
-    "realists",
-    "sheepish",
-    "edifying",
-    "untoward",
-    "chlorite",
-    "patentee",
-    "synonymy",
-    "saluting",
-    "bayonets",
-    "taqueria",
-    "bandanna",
-    "whodunit",
-    "mistrial",
-    "mollusca",
-    "jewelled",
-    "sureties",
-    "grunting",
-    "marveled",
-    "alginate",
-    "unheated",
-    "julienne",
-    "gazetted",
-    "fathered",
-    "shrieked",
-    "bleeping",
-    "aspirant",
-    "germinal",
-    "remixing",
-    "slumping",
-    "echelons",
-    "fallible",
-    "prolongs",
-    "caresses",
-    "infusing",
-    "veganism",
-    "indolent",
-    "stackers",
-    "quayside",
-    "thistles",
-    "halftone",
-    "devalued",
-    "spacings",
-    "drawable",
-    "munsters",
-    "panelled",
-    "gracilis",
-    "clincher",
-    "ascender",
-    "triticum",
-    "pedaling",
-    "trickier",
-    "radishes",
-    "surmised",
-    "scolding",
-    "leathery",
-    "snorkels",
-    "packings",
-    "dejected",
-    "zeolites",
-    "chiseled",
-    "empathic",
-    "iterates",
-    "squander",
-    "bonefish",
-    "dragoons",
-    "gazpacho",
-    "spurring",
-    "calfskin",
-    "campings",
-    "moderato",
-    "deceiver",
-    "scirocco",
-    "subsides",
-    "blanched",
-    "sulfides",
-    "ironside",
-    "nauseous",
-    "mesoderm",
-    "tailpipe",
-    "pullback",
-    "whitener",
-    "talmudic",
-    "aldolase",
-    "coquette",
-    "vermouth",
-    "inflicts",
-    "formless",
-    "reticent",
-    "dabbling",
-    "negating",
-    "relapses",
-    "plodding",
-    "deserter",
-    "neatness",
-    "grosbeak",
-    "parading",
-    "crabmeat",
-    "showgirl",
-    "biphenyl",
-    "valvular",
-    "listless",
-    "copperas",
-    "ceramide",
-    "downcast",
-    "bondsman",
-    "sportive",
-    "bloodied",
-    "chickpea",
-    "laggards",
-    "marzipan",
-    "rewriter",
-    "epithets",
-    "sniffers",
-    "flatland",
-    "macaques",
-    "unplayed",
-    "anabaena",
-    "grumbles",
-    "proudest",
-    "fanciers",
-    "postgame",
-    "stonefly",
-    "warlocks",
-    "hecatomb",
-    "legalese",
-    "glaziers",
-    "postpaid",
-    "costumer",
-    "grapples",
-    "aplastic",
-    "maryjane",
-    "drillers",
-    "glimpsed",
-    "newsboys",
-    "debuting",
-    "ghosting",
-    "revolted",
-    "thalamic",
-    "anarchic",
-    "corniche",
-    "halflife",
-    "walkable",
-    "diatonic",
-    "stickler",
-    "paperboy",
-    "rhizomes",
-    "ablution",
-    "handcuff",
-    "cephalic",
-    "birdbath",
-    "griddles",
-    "parasols",
-    "munition",
-    "comorbid",
-    "greeters",
-    "abrogate",
-    "stockade",
-    "biphasic",
-    "henchman",
-    "basilisk",
-    "tobaccos",
-    "exhorted",
-    "howitzer",
-    "sharpens",
-    "wildness",
-    "novellas",
-    "cryonics",
-    "glycosyl",
-    "stingers",
-    "cathouse",
-    "floodway",
-    "caduceus",
-    "biofilms",
-    "fanzines",
-    "subgrade",
-    "ontogeny",
-    "blustery",
-    "courtier",
-    "snowmelt",
-    "leaguers",
-    "arborist",
-    "uncaring",
-    "piranhas",
-    "meteoric",
-    "equalled",
-    "crackpot",
-    "stockpot",
-    "feedlots",
-    "singlets",
-    "bonfires",
-    "diverges",
-    "atheneum",
-    "seedless",
-    "baclofen",
-    "redshirt",
-    "capsular",
-    "appeased",
-    "verboten",
-    "righting",
-    "fuelwood",
-    "breakups",
-    "striding",
-    "tuberous",
-    "herrings",
-    "prancing",
-    "floodlit",
-    "mightier",
-    "alacrity",
-    "locative",
-    "heathers",
-    "employes",
-    "checkoff",
-    "woodcuts",
-    "chugging",
-    "endpaper",
-    "calvados",
-    "skipjack",
-    "protrude",
-    "ionising",
-    "fadeaway",
-    "scrapper",
-    "laboured",
-    "clothier",
-    "expunged",
-    "forfeits",
-    "magmatic",
-    "wordless",
-    "flipbook",
-    "sleepily",
-    "prowling",
-    "lettuces",
-    "chambray",
-    "retracts",
-    "mimicked",
-    "icehouse",
-    "backstop",
-    "accusers",
-    "sunshade",
-    "rateable",
-    "tonality",
-    "ruptures",
-    "paralyze",
-    "hereunto",
-    "languish",
-    "feathery",
-    "reasoner",
-    "adorning",
-    "drumbeat",
-    "pastiche",
-    "abeyance",
-    "snagging",
-    "sidereal",
-    "websters",
-    "encamped",
-    "intaglio",
-    "doorknob",
-    "ethology",
-    "pinafore",
-    "disposer",
-    "feverfew",
-    "necropsy",
-    "farcical",
-    "tweenies",
-    "placebos",
-    "dilutive",
-    "collides",
-    "escapist",
-    "gunshots",
-    "travails",
-    "linesman",
-    "outlived",
-    "basaltic",
-    "dogfight",
-    "middling",
-    "ureteral",
-    "antihero",
-    "freewill",
-    "personae",
-    "fourthly",
-    "skullcap",
-    "knighted",
-    "emanated",
-    "homilies",
-    "moonbeam",
-    "orifices",
-    "longings",
-    "sideband",
-    "thresher",
-    "alleyway",
-    "helmsman",
-    "robustly",
-    "recoding",
-    "hedgerow",
-    "immanent",
-    "chattels",
-    "brambles",
-    "vitiligo",
-    "striated",
-    "bronzing",
-    "mangling",
-    "filtrate",
-    "debarred",
-    "apologia",
-    "rocketed",
-    "punditry",
-    "cryostat",
-    "spatulas",
-    "bladders",
-    "elastase",
-    "beetroot",
-    "dutchmen",
-    "airpower",
-    "marchese",
-    "replacer",
-    "extensor",
-    "cesspool",
-    "stirrers",
-    "banality",
-    "questing",
-    "pinecone",
-    "averting",
-    "tapeworm",
-    "frisbees",
-    "faubourg",
-    "sarcomas",
-    "teamster",
-    "fringing",
-    "bendable",
-    "propping",
-    "storable",
-    "stressor",
-    "cyclamen",
-    "rejoices",
-    "midterms",
-    "panniers",
-    "carapace",
-    "elastics",
-    "montages",
-    "bailiffs",
-    "singling",
-    "slugfest",
-    "diphenyl",
-    "jointing",
-    "spinoffs",
-    "freckled",
-    "marooned",
-    "dauphine",
-    "conjunct",
-    "gelatine",
-    "thrombus",
-    "doctored",
-    "hotshots",
-    "chutzpah",
-    "inflator",
-    "widowers",
-    "encircle",
-    "mustards",
-    "voyagers",
-    "tendrils",
-    "ratchets",
-    "malarial",
-    "dioramas",
-    "liveness",
-    "simmered",
-    "mainsail",
-    "spooling",
-    "scalding",
-    "witchery",
-    "wingless",
-    "cantonal",
-    "scatters",
-    "escapism",
-    "sandbags",
-    "repartee",
-    "crossway",
-    "revealer",
-    "micelles",
-    "knightly",
-    "ethicist",
-    "bouzouki",
-    "rapports",
-    "nibblers",
-    "meekness",
-    "pinochle",
-    "uneasily",
-    "lamellar",
-    "wrestles",
-    "climaxes",
-    "toboggan",
-    "nystatin",
-    "airships",
-    "flickers",
-    "abdicate",
-    "wiggling",
-    "toreador",
-    "spurrier",
-    "descents",
-    "posttest",
-    "snobbery",
-    "leukemic",
-    "erectors",
-    "witching",
-    "gendarme",
-    "lyricism",
-    "palatial",
-    "flippant",
-    "zodiacal",
-    "grubbing",
-    "cruncher",
-    "unturned",
-    "workroom",
-    "censured",
-    "hayfield",
-    "relished",
-    "membered",
-    "kayakers",
-    "missteps",
-    "doubters",
-    "cabbages",
-    "saboteur",
-    "wreaking",
-    "cometary",
-    "linguine",
-    "kurtosis",
-    "waterjet",
-    "chapbook",
-    "sceptics",
-    "outpaced",
-    "implored",
-    "earthing",
-    "clumping",
-    "quackery",
-    "villainy",
-    "shunting",
-    "hurtling",
-    "squabble",
-    "funneled",
-    "inimical",
-    "bunching",
-    "townsmen",
-    "accredit",
-    "skylines",
-    "unpaired",
-    "handfuls",
-    "asphyxia",
-    "smelters",
-    "oversold",
-    "lacquers",
-    "purifies",
-    "stunting",
-    "sparkled",
-    "arachnid",
-    "equaling",
-    "quibbles",
-    "uncalled",
-    "memetics",
-    "subplots",
-    "backbeat",
-    "alluvium",
-    "stargaze",
-    "alarmist",
-    "blithely",
-    "amortize",
-    "virginal",
-    "contempo",
-    "tallying",
-    "billfish",
-    "backlogs",
-    "lobotomy",
-    "fiercest",
-    "meristem",
-    "tailback",
-    "grizzled",
-    "fatalism",
-    "despises",
-    "jousting",
-    "ferrules",
-    "nonunion",
-    "blackest",
-    "cathodes",
-    "relented",
-    "domesday",
-    "mudstone",
-    "trekkers",
-    "schizoid",
-    "mutating",
-    "threader",
-    "isotherm",
-    "motherly",
-    "savannas",
-    "boondock",
-    "coachmen",
-    "atomizer",
-    "botrytis",
-    "bonehead",
-    "monopods",
-    "offsides",
-    "rubidium",
-    "attender",
-    "halfpipe",
-    "granites",
-    "armbands",
-    "skidding",
-    "stylised",
-    "optioned",
-    "amassing",
-    "consoled",
-    "rearward",
-    "doughboy",
-    "purposed",
-    "hornpipe",
-    "tuckahoe",
-    "boatyard",
-    "berthing",
-    "laterals",
-    "sparsity",
-    "peekaboo",
-    "availing",
-    "overtone",
-    "golgotha",
-    "frazzled",
-    "hustling",
-    "cadavers",
-    "readjust",
-    "affiches",
-    "seafarer",
-    "repeller",
-    "docketed",
-    "platoons",
-    "luminary",
-    "accosted",
-    "umpiring",
-    "pruritus",
-    "demersal",
-    "morbidly",
-    "swooping",
-    "blueline",
-    "niceties",
-    "handymen",
-    "signaler",
-    "silurian",
-    "sayonara",
-    "quietude",
-    "wildfowl",
-    "syntaxes",
-    "acolytes",
-    "fretless",
-    "royalist",
-    "hierarch",
-    "shuffler",
-    "synching",
-    "tripling",
-    "resected",
-    "windlass",
-    "studious",
-    "patellar",
-    "fineness",
-    "pharisee",
-    "dieldrin",
-    "amicably",
-    "ecologic",
-    "nuptials",
-    "munchers",
-    "satirist",
-    "outliner",
-    "wobbling",
-    "gadgetry",
-    "teahouse",
-    "domaines",
-    "xanthine",
-    "liposome",
-    "sagacity",
-    "fillable",
-    "agitprop",
-    "trickled",
-    "abounded",
-    "disloyal",
-    "staggers",
-    "defector",
-    "stuntman",
-    "zillions",
-    "longleaf",
-    "pervaded",
-    "falsetto",
-    "foxhound",
-    "gloating",
-    "deadbolt",
-    "maquette",
-    "absolved",
-    "hydrogel",
-    "snappers",
-    "aperitif",
-    "monetize",
-    "lacrimal",
-    "uppercut",
-    "ticklers",
-    "megastar",
-    "butyrate",
-    "morpheme",
-    "acreages",
-    "pursuers",
-    "mutagens",
-    "lavished",
-    "defacing",
-    "hangouts",
-    "trioxide",
-    "teethers",
-    "zoonotic",
-    "tinkling",
-    "masterly",
-    "butchery",
-    "wresting",
-    "variably",
-    "cherubim",
-    "nightcap",
-    "kickball",
-    "dianthus",
-    "toggling",
-    "polyglot",
-    "mayflies",
-    "dainties",
-    "bluebook",
-    "disquiet",
-    "deerskin",
-    "midbrain",
-    "sufficed",
-    "corsages",
-    "rebutted",
-    "missense",
-    "pickings",
-    "nuclides",
-    "cisterns",
-    "nitrites",
-    "capuchin",
-    "highrise",
-    "twitched",
-    "lavalier",
-    "reticule",
-    "pervious",
-    "longhair",
-    "gondolas",
-    "spenders",
-    "samizdat",
-    "jottings",
-    "unsuited",
-    "gurgling",
-    "tinplate",
-    "gusseted",
-    "hardcase",
-    "illusive",
-    "chucking",
-    "ripeness",
-    "sinkhole",
-    "debaters",
-    "hairball",
-    "cordials",
-    "bandaged",
-    "copepods",
-    "chippers",
-    "slimmers",
-    "bullocks",
-    "vilified",
-    "telefilm",
-    "caroling",
-    "hogshead",
-    "passives",
-    "provably",
-    "inedible",
-    "deplored",
-    "tunneled",
-    "ideative",
-    "trapdoor",
-    "backlist",
-    "sneering",
-    "huggable",
-    "neuritis",
-    "perineal",
-    "remotest",
-    "fixative",
-    "paraquat",
-    "submenus",
-    "principi",
-    "crunched",
-    "returner",
-    "scuttled",
-    "discolor",
-    "masonite",
-    "bivalves",
-    "entropic",
-    "keeshond",
-    "outsmart",
-    "senorita",
-    "riflemen",
-    "blinders",
-    "clasping",
-    "seamount",
-    "unstated",
-    "occlusal",
-    "excusing",
-    "uplander",
-    "slanting",
-    "detested",
-    "slashers",
-    "synthpop",
-    "immunize",
-    "boneyard",
-    "kickoffs",
-    "daiquiri",
-    "squalene",
-    "readouts",
-    "broached",
-    "puckered",
-    "shunning",
-    "passband",
-    "cleaving",
-    "overwork",
-    "belching",
-    "hauliers",
-    "playland",
-    "aquarist",
-    "chimaera",
-    "bellowed",
-    "moieties",
-    "restrike",
-    "tonights",
-    "digraphs",
-    "cashless",
-    "timbered",
-    "gobbling",
-    "analogic",
-    "moulders",
-    "tranches",
-    "valeting",
-    "flatline",
-    "speedier",
-    "cooldown",
-    "hepatoma",
-    "slickers",
-    "optionee",
-    "chunking",
-    "deuteron",
-    "unravels",
-    "electret",
-    "flossing",
-    "vacuoles",
-    "ghoulish",
-    "prefaced",
-    "yellowed",
-    "dendrite",
-    "calluses",
-    "sunstone",
-    "colorist",
-    "animates",
-    "leftwing",
-    "affixing",
-    "aerators",
-    "efferent",
-    "inclines",
-    "aspirate",
-    "chowders",
-    "shudders",
-    "ardently",
-    "granitic",
-    "begonias",
-    "clouding",
-    "bronchus",
-    "intruded",
-    "unforced",
-    "hominids",
-    "defusing",
-    "subentry",
-    "latterly",
-    "drizzled",
-    "outfalls",
-    "subscale",
-    "flagella",
-    "ruminate",
-    "biracial",
-    "chimeras",
-    "mandalas",
-    "instants",
-    "whoppers",
-    "shoptalk",
-    "anaphase",
-    "archduke",
-    "succumbs",
-    "focaccia",
-    "northing",
-    "hardener",
-    "reddened",
-    "blinkers",
-    "plummets",
-    "holdover",
-    "energise",
-    "bankside",
-    "misogyny",
-    "closeted",
-    "notching",
-    "sulfonic",
-    "monomial",
-    "turnouts",
-    "brouhaha",
-    "crannies",
-    "impactor",
-    "tankards",
-    "minutely",
-    "pontoons",
-    "silvered",
-    "dairying",
-    "subgenus",
-    "subtasks",
-    "pantries",
-    "theorize",
-    "eruptive",
-    "slotting",
-    "inflates",
-    "divining",
-    "hungover",
-    "fortieth",
-    "premixed",
-    "scalpers",
-    "moleskin",
-    "stomatal",
-    "holdalls",
-    "ambushes",
-    "cabarets",
-    "satanist",
-    "guttural",
-    "levelers",
-    "caramels",
-    "handbell",
-    "inverses",
-    "rewiring",
-    "barreled",
-    "capsized",
-    "kilobyte",
-    "triaxial",
-    "ejecting",
-    "matinees",
-    "tubeless",
-    "remarque",
-    "monkfish",
-    "refrains",
-    "furrowed",
-    "hedonist",
-    "hogmanay",
-    "uniaxial",
-    "pachinko",
-    "pirating",
-    "swayback",
-    "machismo",
-    "eduction",
-    "thumbing",
-    "shimmers",
-    "debonair",
-    "retinoid",
-    "grappled",
-    "sonogram",
-    "decouple",
-    "quizzing",
-    "ovations",
-    "illiquid",
-    "bleating",
-    "squatted",
-    "moonwalk",
-    "reassert",
-    "bettered",
-    "imbecile",
-    "alloying",
-    "pickerel",
-    "sargasso",
-    "dickhead",
-    "beasties",
-    "denarius",
-    "afflicts",
-    "thinness",
-    "dullness",
-    "oximetry",
-    "wrenched",
-    "usurping",
-    "foxholes",
-    "focusses",
-    "revelers",
-    "aquiline",
-    "grippers",
-    "lockouts",
-    "wristlet",
-    "admonish",
-    "connotes",
-    "sporrans",
-    "blackfin",
-    "ribozyme",
-    "smudging",
-    "squealed",
-    "convents",
-    "encumber",
-    "impetigo",
-    "drachmas",
-    "bindweed",
-    "resample",
-    "heedless",
-    "toolshed",
-    "indulges",
-    "indexers",
-    "pergolas",
-    "inductee",
-    "folktale",
-    "thespian",
-    "chelated",
-    "jeroboam",
-    "rightist",
-    "clearcut",
-    "graviton",
-    "meanness",
-    "arboreal",
-    "inhalant",
-    "biotechs",
-    "coercing",
-    "bolivars",
-    "atrophic",
-    "untangle",
-    "prebuilt",
-    "engorged",
-    "foretell",
-    "colorize",
-    "landward",
-    "notarial",
-    "cripples",
-    "cornices",
-    "penciled",
-    "antiphon",
-    "rerouted",
-    "retested",
-    "subdural",
-    "ratifies",
-    "subtests",
-    "epilator",
-    "releaser",
-    "gnashing",
-    "issuable",
-    "aardwolf",
-    "aasvogel",
-    "abacuses",
-    "abalones",
-    "abampere",
-    "abapical",
-    "abasedly",
-    "abashing",
-    "abatable",
-    "abatises",
-    "abbacies",
-    "abbatial",
-    "abbesses",
-    "abdomens",
-    "abdomina",
-    "abducens",
-    "abducent",
-    "abducing",
-    "abductee",
-    "abductor",
-    "abegging",
-    "abelmosk",
-    "abetment",
-    "abettals",
-    "abetters",
-    "abettors",
-    "abeyancy",
-    "abfarads",
-    "abhenrys",
-    "abhorred",
-    "abhorrer",
-    "abidance",
-    "abigails",
-    "abjectly",
-    "abjurers",
-    "abjuring",
-    "ablating",
-    "ablative",
-    "ablators",
-    "ablegate",
-    "ableisms",
-    "ableists",
-    "abluents",
-    "abnegate",
-    "aboideau",
-    "aboiteau",
-    "abomasal",
-    "abomasum",
-    "abomasus",
-    "aborally",
-    "aborning",
-    "aborters",
-    "aboulias",
-    "abrachia",
-    "abradant",
-    "abraders",
-    "abrading",
-    "abreacts",
-    "abridger",
-    "abridges",
-    "abrosias",
-    "abrupter",
-    "abscised",
-    "abscises",
-    "abscisin",
-    "abscissa",
-    "absconds",
-    "abseiled",
-    "absented",
-    "absenter",
-    "absently",
-    "absinths",
-    "absolver",
-    "absolves",
-    "absonant",
-    "abstains",
-    "absterge",
-    "abstrict",
-    "abstruse",
-    "absurder",
-    "abusable",
-    "abutilon",
-    "abuttals",
-    "abutters",
-    "academes",
-    "acalephe",
-    "acalephs",
-    "acanthae",
-    "acapnias",
-    "acarbose",
-    "acaridan",
-    "acarines",
-    "acarpous",
-    "acaudate",
-    "acauline",
-    "acaulose",
-    "acaulous",
-    "acceders",
-    "accentor",
-    "acceptee",
-    "accepter",
-    "accidias",
-    "accidies",
-    "acclaims",
-    "accorder",
-    "accouter",
-    "accoutre",
-    "accreted",
-    "accretes",
-    "accusals",
-    "accusant",
-    "accustom",
-    "aceldama",
-    "acentric",
-    "acequias",
-    "acerated",
-    "acerbate",
-    "acerbest",
-    "acerbity",
-    "acerolas",
-    "acervate",
-    "acervuli",
-    "acescent",
-    "acetamid",
-    "acetated",
-    "acetates",
-    "acetones",
-    "acetonic",
-    "acetoxyl",
-    "acetylic",
-    "achenial",
-    "achillea",
-    "achiness",
-    "achingly",
-    "achiotes",
-    "acholias",
-    "achromat",
-    "achromic",
-    "aciculae",
-    "acicular",
-    "aciculas",
-    "aciculum",
-    "acidemia",
-    "acidhead",
-    "acidness",
-    "acidoses",
-    "acidotic",
-    "aciduria",
-    "acierate",
-    "acoelous",
-    "aconites",
-    "aconitic",
-    "aconitum",
-    "acquests",
-    "acquiree",
-    "acrasias",
-    "acrasins",
-    "acridest",
-    "acridine",
-    "acridity",
-    "acrimony",
-    "acrodont",
-    "acrogens",
-    "acrolect",
-    "acrolein",
-    "acrolith",
-    "acromial",
-    "acromion",
-    "acrosome",
-    "acrostic",
-    "acrotism",
-    "actiniae",
-    "actinian",
-    "actinias",
-    "actinide",
-    "actinism",
-    "actinium",
-    "actinoid",
-    "actinons",
-    "actioner",
-    "activize",
-    "actorish",
-    "actressy",
-    "actuates",
-    "acuities",
-    "aculeate",
-    "acutance",
-    "acylated",
-    "acylates",
-    "acyloins",
-    "adamance",
-    "adamancy",
-    "adamants",
-    "adamsite",
-    "additory",
-    "adducent",
-    "adducers",
-    "adducing",
-    "adducted",
-    "adductor",
-    "adeeming",
-    "adenines",
-    "adenitis",
-    "adenoids",
-    "adenoses",
-    "adenosis",
-    "adeptest",
-    "adherend",
-    "adherers",
-    "adhibits",
-    "adiposes",
-    "adiposis",
-    "adjoined",
-    "adjoints",
-    "adjourns",
-    "adjudges",
-    "adjurers",
-    "adjuring",
-    "adjurors",
-    "adjustor",
-    "admasses",
-    "admittee",
-    "admitter",
-    "admixing",
-    "adnation",
-    "adonises",
-    "adorably",
-    "adorners",
-    "adrenals",
-    "adroiter",
-    "adroitly",
-    "adscript",
-    "adsorber",
-    "adularia",
-    "adulated",
-    "adulates",
-    "adulator",
-    "adumbral",
-    "aduncate",
-    "aduncous",
-    "advancer",
-    "advected",
-    "adverted",
-    "advisees",
-    "advowson",
-    "adynamia",
-    "adynamic",
-    "aecidial",
-    "aecidium",
-    "aequorin",
-    "aerating",
-    "aerially",
-    "aerified",
-    "aerifies",
-    "aeriform",
-    "aerobats",
-    "aerobium",
-    "aeroduct",
-    "aerodyne",
-    "aerofoil",
-    "aerogels",
-    "aerogram",
-    "aerolite",
-    "aerolith",
-    "aerology",
-    "aeronaut",
-    "aeronomy",
-    "aerosats",
-    "aerostat",
-    "aesthete",
-    "aestival",
-    "aetheric",
-    "afebrile",
-    "affecter",
-    "affiance",
-    "affiants",
-    "affinely",
-    "affirmer",
-    "affixers",
-    "affixial",
-    "afflatus",
-    "affluxes",
-    "afforest",
-    "affrayed",
-    "affrayer",
-    "affright",
-    "affronts",
-    "affusion",
-    "afghanis",
-    "aflutter",
-    "aftertax",
-    "agalloch",
-    "agalwood",
-    "agametes",
-    "agaroses",
-    "agatized",
-    "agatizes",
-    "agedness",
-    "agemates",
-    "agendums",
-    "ageneses",
-    "agenesia",
-    "agenesis",
-    "agenetic",
-    "agenized",
-    "agenizes",
-    "agential",
-    "agenting",
-    "agentive",
-    "ageratum",
-    "aggadahs",
-    "aggadoth",
-    "aggraded",
-    "aggrades",
-    "aggrieve",
-    "aginners",
-    "agiotage",
-    "agisting",
-    "agitable",
-    "agitates",
-    "aglimmer",
-    "aglitter",
-    "aglycone",
-    "aglycons",
-    "agminate",
-    "agnation",
-    "agnizing",
-    "agnomens",
-    "agnomina",
-    "agnosias",
-    "agonised",
-    "agonises",
-    "agonized",
-    "agonizes",
-    "agouties",
-    "agraffes",
-    "agraphia",
-    "agraphic",
-    "agrestal",
-    "agrestic",
-    "agrimony",
-    "agrology",
-    "agrypnia",
-    "aguacate",
-    "aguelike",
-    "agueweed",
-    "aguishly",
-    "aigrette",
-    "aiguille",
-    "ailerons",
-    "aimfully",
-    "ainsells",
-    "airboats",
-    "airbound",
-    "airburst",
-    "airbuses",
-    "aircheck",
-    "aircoach",
-    "aircrews",
-    "airdates",
-    "airdrome",
-    "airdrops",
-    "airflows",
-    "airfoils",
-    "airglows",
-    "airheads",
-    "airholes",
-    "airiness",
-    "airlifts",
-    "airmails",
-    "airparks",
-    "airplays",
-    "airposts",
-    "airproof",
-    "airscape",
-    "airscrew",
-    "airsheds",
-    "airshots",
-    "airshows",
-    "airthing",
-    "airtimes",
-    "airwoman",
-    "airwomen",
-    "aisleway",
-    "akinesia",
-    "akinetic",
-    "akvavits",
-    "alachlor",
-    "alamedas",
-    "alamodes",
-    "alanines",
-    "alarmism",
-    "alarumed",
-    "alastors",
-    "alations",
-    "albedoes",
-    "albicore",
-    "albinism",
-    "albizias",
-    "albizzia",
-    "albumens",
-    "albumins",
-    "albumose",
-    "alburnum",
-    "alcahest",
-    "alcaides",
-    "alcaldes",
-    "alcaydes",
-    "alcazars",
-    "alchemic",
-    "alcidine",
-    "alderfly",
-    "aldicarb",
-    "aleatory",
-    "alehouse",
-    "alembics",
-    "alencons",
-    "alertest",
-    "aleurone",
-    "aleurons",
-    "alewives",
-    "alexines",
-    "alfalfas",
-    "alfaquin",
-    "alfaquis",
-    "alforjas",
-    "algaroba",
-    "algerine",
-    "algicide",
-    "algidity",
-    "algology",
-    "algorism",
-    "alibiing",
-    "alidades",
-    "alienage",
-    "alienees",
-    "alieners",
-    "aliening",
-    "alienism",
-    "alienist",
-    "alienors",
-    "alighted",
-    "aligners",
-    "aliments",
-    "aliquant",
-    "alizarin",
-    "alkahest",
-    "alkalies",
-    "alkalify",
-    "alkalise",
-    "alkalize",
-    "alkanets",
-    "alkoxide",
-    "alkylate",
-    "allanite",
-    "allayers",
-    "allaying",
-    "allegers",
-    "allegros",
-    "allelism",
-    "allergin",
-    "allheals",
-    "alliable",
-    "allicins",
-    "allobars",
-    "allodial",
-    "allodium",
-    "allogamy",
-    "allonges",
-    "allonyms",
-    "allopath",
-    "allosaur",
-    "allottee",
-    "allotter",
-    "allotype",
-    "allotypy",
-    "allovers",
-    "alloxans",
-    "allseeds",
-    "allsorts",
-    "allurers",
-    "allusive",
-    "alluvion",
-    "almagest",
-    "almemars",
-    "almoners",
-    "alogical",
-    "alopecic",
-    "alphorns",
-    "alphosis",
-    "alpinely",
-    "alpinism",
-    "alpinist",
-    "alterant",
-    "alterers",
-    "alterity",
-    "althaeas",
-    "althorns",
-    "altoists",
-    "altruist",
-    "aluminas",
-    "alumines",
-    "aluminic",
-    "alumroot",
-    "alunites",
-    "alveolus",
-    "alyssums",
-    "amadavat",
-    "amalgams",
-    "amandine",
-    "amanitas",
-    "amanitin",
-    "amarelle",
-    "amaretti",
-    "amarones",
-    "amassers",
-    "amazedly",
-    "ambaries",
-    "amberies",
-    "amberina",
-    "amberoid",
-    "ambients",
-    "ambivert",
-    "amboinas",
-    "amboynas",
-    "ambroids",
-    "ambsaces",
-    "ambulant",
-    "ambulate",
-    "ambusher",
-    "ameerate",
-    "amelcorn",
-    "amenably",
-    "amenders",
-    "amentias",
-    "amercers",
-    "amercing",
-    "amesaces",
-    "amiantus",
-    "amidases",
-    "amidines",
-    "amidogen",
-    "amidones",
-    "amidship",
-    "amirates",
-    "amitoses",
-    "amitosis",
-    "amitotic",
-    "amitrole",
-    "ammeters",
-    "ammocete",
-    "ammonals",
-    "ammoniac",
-    "ammonias",
-    "ammonify",
-    "ammonite",
-    "ammonoid",
-    "amnesiac",
-    "amnesias",
-    "amnesics",
-    "amnestic",
-    "amnionic",
-    "amniotes",
-    "amoebean",
-    "amoeboid",
-    "amorally",
-    "amoretti",
-    "amoretto",
-    "amorists",
-    "amortise",
-    "amosites",
-    "amotions",
-    "amphibia",
-    "amphioxi",
-    "amphipod",
-    "amphorae",
-    "amphoral",
-    "amphoras",
-    "amplexus",
-    "ampoules",
-    "ampullae",
-    "ampullar",
-    "amputate",
-    "amreetas",
-    "amtracks",
-    "amusable",
-    "amusedly",
-    "amygdale",
-    "amygdule",
-    "amylases",
-    "amylenes",
-    "amylogen",
-    "amyloids",
-    "amyloses",
-    "anabases",
-    "anabasis",
-    "anabatic",
-    "anableps",
-    "anaemias",
-    "anaerobe",
-    "anaglyph",
-    "anagoges",
-    "anagogic",
-    "analcime",
-    "analcite",
-    "analecta",
-    "analects",
-    "analemma",
-    "analgias",
-    "anapaest",
-    "anapests",
-    "anaphora",
-    "anaphors",
-    "anasarca",
-    "anatases",
-    "anatoxin",
-    "anchoret",
-    "anchusas",
-    "anchusin",
-    "ancillae",
-    "ancillas",
-    "anconeal",
-    "anconoid",
-    "andantes",
-    "andesite",
-    "andesyte",
-    "andirons",
-    "anearing",
-    "anecdota",
-    "anechoic",
-    "anemoses",
-    "anemosis",
-    "anergias",
-    "anergies",
-    "aneroids",
-    "anestrus",
-    "anethole",
-    "anethols",
-    "aneurins",
-    "aneurism",
-    "angakoks",
-    "angarias",
-    "angaries",
-    "angeling",
-    "angering",
-    "anginose",
-    "anginous",
-    "angiomas",
-    "anglepod",
-    "anglings",
-    "angriest",
-    "angulate",
-    "angulose",
-    "angulous",
-    "anhingas",
-    "anilines",
-    "animalic",
-    "animally",
-    "animater",
-    "animisms",
-    "animists",
-    "animuses",
-    "aniseeds",
-    "anisette",
-    "anisoles",
-    "ankerite",
-    "ankushes",
-    "ankylose",
-    "annalist",
-    "annattos",
-    "annealer",
-    "annelids",
-    "annexing",
-    "annoyers",
-    "annulate",
-    "annulets",
-    "annulose",
-    "anodally",
-    "anodizes",
-    "anodynes",
-    "anodynic",
-    "anointer",
-    "anolytes",
-    "anoopsia",
-    "anopsias",
-    "anoretic",
-    "anorthic",
-    "anosmias",
-    "anovular",
-    "anoxemia",
-    "anoxemic",
-    "anserine",
-    "anserous",
-    "antalgic",
-    "antbears",
-    "anteater",
-    "antecede",
-    "antedate",
-    "antefixa",
-    "antennal",
-    "antepast",
-    "anteroom",
-    "antetype",
-    "antevert",
-    "anthelia",
-    "anthelix",
-    "anthemed",
-    "anthemia",
-    "anthemic",
-    "antheral",
-    "antherid",
-    "antheses",
-    "anthesis",
-    "anthills",
-    "anthodia",
-    "antiacne",
-    "antiarin",
-    "antiatom",
-    "antibias",
-    "antiboss",
-    "anticity",
-    "anticked",
-    "anticold",
-    "anticult",
-    "antidora",
-    "antidrug",
-    "antifoam",
-    "antigang",
-    "antigene",
-    "antiking",
-    "antileak",
-    "antileft",
-    "antilife",
-    "antilogs",
-    "antilogy",
-    "antimale",
-    "antimask",
-    "antimere",
-    "antimine",
-    "antinode",
-    "antinome",
-    "antinomy",
-    "antinuke",
-    "antipill",
-    "antipode",
-    "antipole",
-    "antipope",
-    "antiporn",
-    "antipyic",
-    "antiquer",
-    "antirape",
-    "antiriot",
-    "antirock",
-    "antiroll",
-    "antirust",
-    "antiship",
-    "antiskid",
-    "antislip",
-    "antismog",
-    "antismut",
-    "antisnob",
-    "antistat",
-    "antitank",
-    "antitype",
-    "antiwear",
-    "antiweed",
-    "antlered",
-    "antlions",
-    "antonymy",
-    "antrorse",
-    "antsiest",
-    "anureses",
-    "anuresis",
-    "anuretic",
-    "anviling",
-    "anvilled",
-    "anviltop",
-    "aoristic",
-    "apagoges",
-    "apagogic",
-    "apanages",
-    "aparejos",
-    "apatetic",
-    "apathies",
-    "apatites",
-    "aperient",
-    "aphagias",
-    "aphanite",
-    "aphasiac",
-    "aphasias",
-    "aphasics",
-    "aphelian",
-    "aphelion",
-    "aphidian",
-    "apholate",
-    "aphonias",
-    "aphonics",
-    "aphorise",
-    "aphorism",
-    "aphorist",
-    "aphorize",
-    "aphthous",
-    "apiarian",
-    "apiaries",
-    "apiarist",
-    "apically",
-    "apiculus",
-    "apimania",
-    "apiology",
-    "aplasias",
-    "apoapses",
-    "apoapsis",
-    "apocarps",
-    "apocarpy",
-    "apocopes",
-    "apocopic",
-    "apocrine",
-    "apodoses",
-    "apodosis",
-    "apogamic",
-    "apologal",
-    "apologue",
-    "apolunes",
-    "apomicts",
-    "apomixes",
-    "apomixis",
-    "apophony",
-    "apophyge",
-    "apoplexy",
-    "apospory",
-    "apostacy",
-    "apostils",
-    "apothece",
-    "apothegm",
-    "apothems",
-    "appanage",
-    "apparats",
-    "appealer",
-    "appeaser",
-    "appeases",
-    "appellor",
-    "appestat",
-    "appetent",
-    "appliers",
-    "apposers",
-    "apposing",
-    "apposite",
-    "appriser",
-    "apprises",
-    "apprized",
-    "apprizer",
-    "apprizes",
-    "appulses",
-    "apractic",
-    "apraxias",
-    "aproning",
-    "apterium",
-    "apterous",
-    "apyrases",
-    "apyretic",
-    "aquacade",
-    "aquafarm",
-    "aquanaut",
-    "aquarial",
-    "aquatint",
-    "aquatone",
-    "aquavits",
-    "arabesks",
-    "arabicas",
-    "arabized",
-    "arabizes",
-    "araceous",
-    "araneids",
-    "arapaima",
-    "ararobas",
-    "arbalest",
-    "arbalist",
-    "arbelest",
-    "arbiters",
-    "arboreta",
-    "arborize",
-    "arborous",
-    "arboured",
-    "arbuscle",
-    "arbutean",
-    "arcadias",
-    "arcading",
-    "arcanums",
-    "arcature",
-    "archaeal",
-    "archaean",
-    "archaeon",
-    "archaise",
-    "archaism",
-    "archaist",
-    "archaize",
-    "archfoes",
-    "archines",
-    "archings",
-    "archness",
-    "archways",
-    "arciform",
-    "arcsines",
-    "arcuated",
-    "areaways",
-    "arenites",
-    "areolate",
-    "areology",
-    "arethusa",
-    "argental",
-    "argentic",
-    "argentum",
-    "arginase",
-    "argosies",
-    "argufied",
-    "argufier",
-    "argufies",
-    "aridness",
-    "ariettas",
-    "ariettes",
-    "arillate",
-    "arillode",
-    "arilloid",
-    "aristate",
-    "armagnac",
-    "armholes",
-    "armigero",
-    "armigers",
-    "armillae",
-    "armillas",
-    "armloads",
-    "armlocks",
-    "armonica",
-    "armorers",
-    "armories",
-    "armoring",
-    "armourer",
-    "armyworm",
-    "arnattos",
-    "arnottos",
-    "arointed",
-    "arousals",
-    "arousers",
-    "aroynted",
-    "arpeggio",
-    "arquebus",
-    "arraigns",
-    "arrantly",
-    "arrayals",
-    "arrayers",
-    "arraying",
-    "arrestee",
-    "arrester",
-    "arrestor",
-    "arrhizal",
-    "arrivers",
-    "arrogate",
-    "arrowing",
-    "arsenate",
-    "arsenics",
-    "arsenide",
-    "arsenite",
-    "arsenous",
-    "arsonist",
-    "arsonous",
-    "articled",
-    "artiness",
-    "artsiest",
-    "arugolas",
-    "arugulas",
-    "arythmia",
-    "arythmic",
-    "asbestic",
-    "asbestus",
-    "ascarids",
-    "ascetics",
-    "ascidian",
-    "ascidium",
-    "ascocarp",
-    "ascribes",
-    "ashcakes",
-    "ashfalls",
-    "ashiness",
-    "ashlared",
-    "ashlered",
-    "ashplant",
-    "asocials",
-    "asparkle",
-    "asperate",
-    "asperges",
-    "asperity",
-    "aspersed",
-    "asperser",
-    "asperses",
-    "aspersor",
-    "asphalts",
-    "aspheric",
-    "asphodel",
-    "aspirata",
-    "aspirers",
-    "aspirins",
-    "assagais",
-    "assailer",
-    "assayers",
-    "assaying",
-    "assegais",
-    "assenter",
-    "assentor",
-    "asserter",
-    "assertor",
-    "assignat",
-    "assigner",
-    "assister",
-    "assistor",
-    "assoiled",
-    "assonant",
-    "assorter",
-    "assuaged",
-    "assuager",
-    "assuages",
-    "assumers",
-    "assureds",
-    "assurers",
-    "assurors",
-    "asswaged",
-    "asswages",
-    "astasias",
-    "astatine",
-    "asterias",
-    "asterism",
-    "asternal",
-    "asthenia",
-    "asthenic",
-    "astigmia",
-    "astilbes",
-    "astomous",
-    "astonied",
-    "astonies",
-    "astounds",
-    "astragal",
-    "astrally",
-    "astricts",
-    "astringe",
-    "astutely",
-    "asyndeta",
-    "atabrine",
-    "ataghans",
-    "atalayas",
-    "atamasco",
-    "ataraxia",
-    "ataraxic",
-    "atavisms",
-    "atavists",
-    "atechnic",
-    "ateliers",
-    "atemoyas",
-    "athanasy",
-    "atheisms",
-    "atheling",
-    "atheroma",
-    "athetoid",
-    "athodyds",
-    "atlantes",
-    "atomical",
-    "atomised",
-    "atomiser",
-    "atomises",
-    "atomisms",
-    "atomists",
-    "atomized",
-    "atomizes",
-    "atonable",
-    "atonally",
-    "atremble",
-    "atresias",
-    "atrophia",
-    "atropins",
-    "atropism",
-    "attacher",
-    "attagirl",
-    "attainer",
-    "attaints",
-    "attemper",
-    "attester",
-    "attestor",
-    "atticism",
-    "atticist",
-    "atticize",
-    "attiring",
-    "attorned",
-    "attrited",
-    "attrites",
-    "attuning",
-    "atwitter",
-    "aubretia",
-    "aubrieta",
-    "audibled",
-    "audibles",
-    "audients",
-    "auditees",
-    "auditive",
-    "augurers",
-    "auguries",
-    "auguring",
-    "auguster",
-    "augustly",
-    "aunthood",
-    "auntlier",
-    "auntlike",
-    "aurality",
-    "aureolae",
-    "aureolas",
-    "aureoled",
-    "aureoles",
-    "auricled",
-    "auricles",
-    "auricula",
-    "auriform",
-    "aurorean",
-    "ausforms",
-    "austerer",
-    "australs",
-    "autacoid",
-    "autarchs",
-    "autarchy",
-    "autarkic",
-    "autecism",
-    "autocade",
-    "autocoid",
-    "autocrat",
-    "autodyne",
-    "autogamy",
-    "autogeny",
-    "autogiro",
-    "autogyro",
-    "autolyse",
-    "autolyze",
-    "automats",
-    "autonyms",
-    "autopens",
-    "autopsic",
-    "autosome",
-    "autotomy",
-    "autotype",
-    "autotypy",
-    "autunite",
-    "auxetics",
-    "avadavat",
-    "avarices",
-    "avellane",
-    "averment",
-    "averring",
-    "aversely",
-    "aversive",
-    "averters",
-    "avgasses",
-    "avianize",
-    "aviaries",
-    "aviarist",
-    "aviating",
-    "aviatrix",
-    "avicular",
-    "avidness",
-    "avifauna",
-    "avigator",
-    "avodires",
-    "avoiders",
-    "avouched",
-    "avoucher",
-    "avouches",
-    "avowable",
-    "avowably",
-    "avowedly",
-    "avulsing",
-    "avulsion",
-    "awaiters",
-    "awakener",
-    "awarders",
-    "awayness",
-    "aweather",
-    "awfuller",
-    "awlworts",
-    "awninged",
-    "axiality",
-    "axillars",
-    "axiology",
-    "axletree",
-    "axolotls",
-    "axonemal",
-    "axonemes",
-    "axoplasm",
-    "azimuths",
-    "azotemia",
-    "azotemic",
-    "azotised",
-    "azotises",
-    "azotized",
-    "azotizes",
-    "azoturia",
-    "azulejos",
-    "azurites",
-    "azygoses",
-    "baalisms",
-    "baaskaap",
-    "baaskaps",
-    "baasskap",
-    "babassus",
-    "babbitry",
-    "babbitts",
-    "babblers",
-    "babesias",
-    "babiches",
-    "babirusa",
-    "babushka",
-    "babyhood",
-    "babysits",
-    "bacalaos",
-    "baccaras",
-    "baccated",
-    "bacchant",
-    "bacchius",
-    "bacillar",
-    "backbend",
-    "backbite",
-    "backcast",
-    "backchat",
-    "backdate",
-    "backfits",
-    "backhoed",
-    "backhoes",
-    "backings",
-    "backland",
-    "backload",
-    "backmost",
-    "backouts",
-    "backrush",
-    "backsaws",
-    "backsets",
-    "backslap",
-    "backslid",
-    "backspin",
-    "backstab",
-    "backstay",
-    "backwood",
-    "backwrap",
-    "bacterin",
-    "baculine",
-    "baculums",
-    "badassed",
-    "badasses",
-    "badgered",
-    "badgerly",
-    "badinage",
-    "badmouth",
-    "bafflers",
-    "bagasses",
-    "baggages",
-    "baggiest",
-    "baggings",
-    "baghouse",
-    "bagpiped",
-    "bagpiper",
-    "bagworms",
-    "bahadurs",
-    "baidarka",
-    "bailable",
-    "bailment",
-    "bailouts",
-    "bailsman",
-    "bailsmen",
-    "bairnish",
-    "baitfish",
-    "bakemeat",
-    "bakeshop",
-    "baklavas",
-    "baklawas",
-    "bakshish",
-    "baldhead",
-    "baldpate",
-    "baldrick",
-    "baldrics",
-    "balefire",
-    "balisaur",
-    "balkiest",
-    "balkline",
-    "ballades",
-    "balladic",
-    "balladry",
-    "balletic",
-    "ballhawk",
-    "ballista",
-    "ballonet",
-    "ballonne",
-    "balloted",
-    "balloter",
-    "ballsier",
-    "ballutes",
-    "ballyard",
-    "ballyhoo",
-    "ballyrag",
-    "balmiest",
-    "balmlike",
-    "baloneys",
-    "balsamed",
-    "baluster",
-    "bambinos",
-    "banalize",
-    "banausic",
-    "bandager",
-    "bandeaus",
-    "bandeaux",
-    "banderol",
-    "banditos",
-    "banditry",
-    "banditti",
-    "bandmate",
-    "bandoras",
-    "bandores",
-    "bandsaws",
-    "bandsman",
-    "bandsmen",
-    "bandying",
-    "bangkoks",
-    "bangtail",
-    "banisher",
-    "banishes",
-    "banjaxed",
-    "banjaxes",
-    "banjoist",
-    "bankable",
-    "bankbook",
-    "bankerly",
-    "bankings",
-    "banksias",
-    "bannable",
-    "bannered",
-    "banneret",
-    "bannerol",
-    "bannocks",
-    "banshies",
-    "bantengs",
-    "bantered",
-    "banterer",
-    "bantling",
-    "baptises",
-    "baptisia",
-    "baptizer",
-    "baptizes",
-    "barathea",
-    "barbasco",
-    "barbered",
-    "barberry",
-    "barbette",
-    "barbicel",
-    "barbital",
-    "barbless",
-    "barbules",
-    "barbwire",
-    "barchans",
-    "barehand",
-    "barehead",
-    "bareness",
-    "baresark",
-    "barflies",
-    "bargello",
-    "bargeman",
-    "bargemen",
-    "barghest",
-    "barguest",
-    "barillas",
-    "baristas",
-    "barkeeps",
-    "barkiest",
-    "barkless",
-    "barleduc",
-    "barmaids",
-    "barmiest",
-    "barniest",
-    "barnlike",
-    "barogram",
-    "baronage",
-    "baronets",
-    "baronial",
-    "baronies",
-    "baronnes",
-    "baroques",
-    "barosaur",
-    "barouche",
-    "barrable",
-    "barraged",
-    "barrages",
-    "barranca",
-    "barranco",
-    "barrater",
-    "barrator",
-    "barratry",
-    "barrener",
-    "barrenly",
-    "barretor",
-    "barretry",
-    "barrooms",
-    "bartends",
-    "bartered",
-    "barterer",
-    "bartisan",
-    "bartizan",
-    "barwares",
-    "baryonic",
-    "barytone",
-    "barytons",
-    "basaltes",
-    "bascules",
-    "baseborn",
-    "baseness",
-    "basenjis",
-    "bashings",
-    "bashlyks",
-    "basicity",
-    "basidial",
-    "basidium",
-    "basified",
-    "basifier",
-    "basifies",
-    "basilary",
-    "basilect",
-    "basinets",
-    "basinful",
-    "basmatis",
-    "basophil",
-    "basseted",
-    "bassetts",
-    "bassists",
-    "bassness",
-    "bassoons",
-    "bastardy",
-    "bastiles",
-    "bastings",
-    "bastions",
-    "batchers",
-    "batfowls",
-    "batgirls",
-    "bathetic",
-    "bathless",
-    "bathmats",
-    "bathoses",
-    "batiking",
-    "batistes",
-    "battalia",
-    "batteaux",
-    "battened",
-    "battener",
-    "batterer",
-    "battiest",
-    "battings",
-    "battlers",
-    "baudekin",
-    "baudrons",
-    "bauhinia",
-    "baulkier",
-    "baulking",
-    "bauxites",
-    "bauxitic",
-    "bawcocks",
-    "bawdiest",
-    "bawdrics",
-    "bawdries",
-    "bayadeer",
-    "bayadere",
-    "baywoods",
-    "bazookas",
-    "bdellium",
-    "beachboy",
-    "beachier",
-    "beaching",
-    "beaconed",
-    "beadiest",
-    "beadings",
-    "beadlike",
-    "beadroll",
-    "beadsman",
-    "beadsmen",
-    "beakiest",
-    "beakless",
-    "beaklike",
-    "beamiest",
-    "beamless",
-    "beamlike",
-    "beanbags",
-    "beanball",
-    "beanlike",
-    "beanpole",
-    "bearably",
-    "bearding",
-    "bearhugs",
-    "bearlike",
-    "bearskin",
-    "bearwood",
-    "beatable",
-    "beatific",
-    "beatless",
-    "beatniks",
-    "beavered",
-    "bebeerus",
-    "bebloods",
-    "bebopper",
-    "becalmed",
-    "becapped",
-    "becarpet",
-    "bechalks",
-    "bechamel",
-    "bechance",
-    "becharms",
-    "beckoner",
-    "beclamor",
-    "beclasps",
-    "becloaks",
-    "beclothe",
-    "beclouds",
-    "beclowns",
-    "becoward",
-    "becrawls",
-    "becrimed",
-    "becrimes",
-    "becrowds",
-    "becrusts",
-    "becudgel",
-    "becursed",
-    "becurses",
-    "bedabble",
-    "bedamned",
-    "bedarken",
-    "bedaubed",
-    "bedazzle",
-    "bedboard",
-    "bedchair",
-    "bedcover",
-    "beddable",
-    "beddings",
-    "bedeafen",
-    "bedecked",
-    "bedesman",
-    "bedesmen",
-    "bedevils",
-    "bedewing",
-    "bedframe",
-    "bedgowns",
-    "bediaper",
-    "bedights",
-    "bedimmed",
-    "bedimple",
-    "bedizens",
-    "bedlamps",
-    "bedmaker",
-    "bedmates",
-    "bedotted",
-    "bedouins",
-    "bedplate",
-    "bedposts",
-    "bedquilt",
-    "bedrails",
-    "bedraped",
-    "bedrapes",
-    "bedrench",
-    "bedrivel",
-    "bedrocks",
-    "bedrolls",
-    "bedsheet",
-    "bedsides",
-    "bedsonia",
-    "bedsores",
-    "bedstand",
-    "bedstraw",
-    "bedticks",
-    "bedtimes",
-    "bedumbed",
-    "bedunced",
-    "bedunces",
-    "bedwards",
-    "bedwarfs",
-    "beebread",
-    "beechier",
-    "beechnut",
-    "beefalos",
-    "beefcake",
-    "beefiest",
-    "beefless",
-    "beefwood",
-    "beehives",
-    "beelined",
-    "beelines",
-    "beeriest",
-    "beeswing",
-    "beetlers",
-    "beetling",
-    "beeyards",
-    "befinger",
-    "befitted",
-    "befleaed",
-    "beflecks",
-    "beflower",
-    "befogged",
-    "befooled",
-    "befouled",
-    "befouler",
-    "befringe",
-    "befuddle",
-    "begalled",
-    "begazing",
-    "begetter",
-    "beggared",
-    "beggarly",
-    "begirded",
-    "begirdle",
-    "beglamor",
-    "beglooms",
-    "begorrah",
-    "begrimed",
-    "begrimes",
-    "begroans",
-    "begrudge",
-    "beguiled",
-    "beguiler",
-    "beguiles",
-    "beguines",
-    "begulfed",
-    "behalves",
-    "behavers",
-    "beheadal",
-    "beheader",
-    "behooved",
-    "behooves",
-    "behoving",
-    "behowled",
-    "beignets",
-    "bejabers",
-    "bejeezus",
-    "bejewels",
-    "bejumble",
-    "bekissed",
-    "bekisses",
-    "beknight",
-    "belabors",
-    "belabour",
-    "beladied",
-    "beladies",
-    "belauded",
-    "belayers",
-    "belaying",
-    "belchers",
-    "beldames",
-    "beleaped",
-    "belfried",
-    "belfries",
-    "beliquor",
-    "bellbird",
-    "bellboys",
-    "belleeks",
-    "bellhops",
-    "bellings",
-    "bellower",
-    "bellpull",
-    "bellwort",
-    "bellyful",
-    "bellying",
-    "beloveds",
-    "beltings",
-    "beltless",
-    "beltways",
-    "bemadams",
-    "bemadden",
-    "bemeaned",
-    "bemingle",
-    "bemiring",
-    "bemisted",
-    "bemixing",
-    "bemoaned",
-    "bemocked",
-    "bemuddle",
-    "bemurmur",
-    "bemusing",
-    "bemuzzle",
-    "benaming",
-    "benchers",
-    "benching",
-    "bendayed",
-    "bendiest",
-    "bendways",
-    "bendwise",
-    "benedick",
-    "benefice",
-    "benignly",
-    "benisons",
-    "benomyls",
-    "benthons",
-    "bentwood",
-    "benumbed",
-    "benzenes",
-    "benzidin",
-    "benzines",
-    "benzoins",
-    "benzoles",
-    "benzoyls",
-    "benzylic",
-    "bepaints",
-    "bepimple",
-    "beraking",
-    "berascal",
-    "berating",
-    "berberin",
-    "berberis",
-    "berceuse",
-    "berdache",
-    "bereaver",
-    "bereaves",
-    "berettas",
-    "bergeres",
-    "berhymed",
-    "berhymes",
-    "beriberi",
-    "berimbau",
-    "beriming",
-    "beringed",
-    "berlines",
-    "bermudas",
-    "bernicle",
-    "berouged",
-    "berretta",
-    "berrying",
-    "berseems",
-    "berserks",
-    "beryline",
-    "bescorch",
-    "bescours",
-    "bescreen",
-    "beseemed",
-    "besetter",
-    "beshadow",
-    "beshamed",
-    "beshames",
-    "beshiver",
-    "beshouts",
-    "beshrews",
-    "beshroud",
-    "besieger",
-    "besieges",
-    "beslaved",
-    "beslimed",
-    "beslimes",
-    "besmears",
-    "besmiled",
-    "besmiles",
-    "besmirch",
-    "besmoked",
-    "besmokes",
-    "besmooth",
-    "besmudge",
-    "besnowed",
-    "besoothe",
-    "besotted",
-    "besought",
-    "bespeaks",
-    "bespoken",
-    "bespouse",
-    "bespread",
-    "besprent",
-    "besteads",
-    "bestowal",
-    "bestower",
-    "bestrewn",
-    "bestrews",
-    "bestride",
-    "bestrode",
-    "bestrown",
-    "bestrows",
-    "beswarms",
-    "betaines",
-    "betaking",
-    "betatron",
-    "betatter",
-    "betelnut",
-    "bethanks",
-    "bethinks",
-    "bethorns",
-    "bethumps",
-    "betiding",
-    "betokens",
-    "betonies",
-    "betrayer",
-    "betroths",
-    "beuncled",
-    "bevatron",
-    "bevelers",
-    "beveling",
-    "bevelled",
-    "beveller",
-    "bevomits",
-    "bewailed",
-    "bewailer",
-    "bewaring",
-    "bewigged",
-    "bewilder",
-    "bewinged",
-    "bewormed",
-    "bewrayed",
-    "bewrayer",
-    "bezazzes",
-    "beziques",
-    "bezzants",
-    "bhangras",
-    "bheestie",
-    "bhisties",
-    "biacetyl",
-    "biasedly",
-    "biasness",
-    "biassing",
-    "bibcocks",
-    "bibelots",
-    "biblists",
-    "bibulous",
-    "bicaudal",
-    "bicepses",
-    "bichrome",
-    "bickered",
-    "bickerer",
-    "bicolors",
-    "bicolour",
-    "biconvex",
-    "bicornes",
-    "bicuspid",
-    "bicycled",
-    "bicycler",
-    "bicyclic",
-    "bidarkas",
-    "bidarkee",
-    "biddable",
-    "biddably",
-    "biddings",
-    "bidental",
-    "bielding",
-    "bifacial",
-    "bifidity",
-    "bifocals",
-    "biforate",
-    "biforked",
-    "biformed",
-    "bigamies",
-    "bigamist",
-    "bigamous",
-    "bigarade",
-    "bigaroon",
-    "bigeminy",
-    "bigfoots",
-    "biggings",
-    "bigheads",
-    "bighorns",
-    "bighting",
-    "bigmouth",
-    "bignonia",
-    "bigstick",
-    "bihourly",
-    "bijugate",
-    "bijugous",
-    "bikeways",
-    "bikinied",
-    "bilabial",
-    "bilander",
-    "bilevels",
-    "bilgiest",
-    "billbugs",
-    "billeted",
-    "billeter",
-    "billhead",
-    "billhook",
-    "billowed",
-    "billycan",
-    "bilobate",
-    "bilsteds",
-    "biltongs",
-    "bimanous",
-    "bimanual",
-    "bimbette",
-    "bimensal",
-    "bimester",
-    "bimetals",
-    "bimethyl",
-    "bimorphs",
-    "binarism",
-    "binately",
-    "bindable",
-    "bingeing",
-    "binnacle",
-    "binocles",
-    "biochips",
-    "biocidal",
-    "bioclean",
-    "biocycle",
-    "bioethic",
-    "biogases",
-    "bioherms",
-    "biolyses",
-    "biolysis",
-    "biolytic",
-    "biometer",
-    "biometry",
-    "biomorph",
-    "bionomic",
-    "bioplasm",
-    "biopsied",
-    "bioscope",
-    "bioscopy",
-    "biosolid",
-    "biotical",
-    "biotites",
-    "biotitic",
-    "biotopes",
-    "biotoxin",
-    "biotrons",
-    "biotypes",
-    "biotypic",
-    "biovular",
-    "biparous",
-    "biparted",
-    "biplanes",
-    "biradial",
-    "biramose",
-    "biramous",
-    "birching",
-    "birdcall",
-    "birddogs",
-    "birdfarm",
-    "birdfeed",
-    "birdings",
-    "birdlike",
-    "birdlime",
-    "birdseed",
-    "birdshot",
-    "birettas",
-    "birianis",
-    "birlings",
-    "birretta",
-    "birrotch",
-    "biryanis",
-    "biscotto",
-    "biscuity",
-    "bisected",
-    "bisector",
-    "bishoped",
-    "bismuths",
-    "bisnagas",
-    "bistered",
-    "bistorts",
-    "bistoury",
-    "bistroic",
-    "bitchery",
-    "bitchier",
-    "bitchily",
-    "biteable",
-    "bitewing",
-    "bitingly",
-    "bitsiest",
-    "bitstock",
-    "bittered",
-    "bitterer",
-    "bitterns",
-    "bittiest",
-    "bittings",
-    "bittocks",
-    "bitumens",
-    "biunique",
-    "bivalent",
-    "bivalved",
-    "bivinyls",
-    "bivouacs",
-    "biyearly",
-    "bizarres",
-    "bizarros",
-    "biznagas",
-    "blabbers",
-    "blabbing",
-    "blackboy",
-    "blackcap",
-    "blackens",
-    "blackfly",
-    "blackgum",
-    "blacking",
-    "blackish",
-    "blackleg",
-    "bladdery",
-    "bladings",
-    "blagging",
-    "blamable",
-    "blamably",
-    "blameful",
-    "blancher",
-    "blanches",
-    "blandest",
-    "blandish",
-    "blankest",
-    "blarneys",
-    "blastema",
-    "blastier",
-    "blasties",
-    "blastoff",
-    "blastoma",
-    "blastula",
-    "blatancy",
-    "blathers",
-    "blatters",
-    "blatting",
-    "blauboks",
-    "blazered",
-    "blazoned",
-    "blazoner",
-    "blazonry",
-    "bleaches",
-    "bleakest",
-    "bleakish",
-    "blearier",
-    "blearily",
-    "blearing",
-    "bleaters",
-    "blebbing",
-    "bleeders",
-    "bleepers",
-    "blellums",
-    "blenched",
-    "blencher",
-    "blenches",
-    "blennies",
-    "blesboks",
-    "blesbuck",
-    "blessers",
-    "blethers",
-    "blighter",
-    "blimpish",
-    "blindage",
-    "blindest",
-    "blindgut",
-    "blinkard",
-    "blintzes",
-    "blipping",
-    "blissing",
-    "blistery",
-    "blithers",
-    "blithest",
-    "blitzers",
-    "blitzing",
-    "bloaters",
-    "blobbing",
-    "blockier",
-    "blockish",
-    "blondest",
-    "blondine",
-    "blondish",
-    "bloodfin",
-    "bloodier",
-    "bloodies",
-    "bloodily",
-    "blooding",
-    "bloodred",
-    "bloomery",
-    "bloomier",
-    "blooping",
-    "blossomy",
-    "blotched",
-    "blotches",
-    "blotless",
-    "blotters",
-    "blottier",
-    "blousier",
-    "blousily",
-    "blousing",
-    "blousons",
-    "bloviate",
-    "blowball",
-    "blowdown",
-    "blowguns",
-    "blowhard",
-    "blowhole",
-    "blowiest",
-    "blowoffs",
-    "blowpipe",
-    "blowsier",
-    "blowsily",
-    "blowtube",
-    "blowzier",
-    "blowzily",
-    "blubbers",
-    "blubbery",
-    "blubbing",
-    "bluchers",
-    "bludgeon",
-    "bludgers",
-    "bludging",
-    "blueball",
-    "bluebeat",
-    "bluebill",
-    "bluecaps",
-    "bluecoat",
-    "bluefins",
-    "bluegums",
-    "bluehead",
-    "blueings",
-    "bluejack",
-    "bluejays",
-    "blueness",
-    "bluenose",
-    "bluesier",
-    "bluesman",
-    "bluesmen",
-    "bluestem",
-    "bluetick",
-    "blueweed",
-    "bluewood",
-    "bluffers",
-    "bluffest",
-    "blungers",
-    "blunging",
-    "bluntest",
-    "blunting",
-    "blurbing",
-    "blurbist",
-    "blurrier",
-    "blurrily",
-    "blurters",
-    "blurting",
-    "blushers",
-    "blushful",
-    "blusters",
-    "boardmen",
-    "boarfish",
-    "boasters",
-    "boastful",
-    "boatable",
-    "boatbill",
-    "boatfuls",
-    "boathook",
-    "boatings",
-    "boatlift",
-    "boatlike",
-    "boatload",
-    "boatneck",
-    "boatsman",
-    "boatsmen",
-    "bobbinet",
-    "bobbling",
-    "bobbysox",
-    "bobeches",
-    "bobolink",
-    "bobsleds",
-    "bobstays",
-    "bobtails",
-    "bobwhite",
-    "bocaccio",
-    "bodement",
-    "bodhrans",
-    "bodiless",
-    "bodingly",
-    "bodysurf",
-    "boehmite",
-    "boffolas",
-    "bogarted",
-    "bogbeans",
-    "bogeying",
-    "bogeyman",
-    "bogeymen",
-    "boggiest",
-    "bogglers",
-    "bogwoods",
-    "bogyisms",
-    "bohemias",
-    "bohriums",
-    "boilable",
-    "boiloffs",
-    "boilover",
-    "boinking",
-    "boiserie",
-    "bolivias",
-    "bollixed",
-    "bollixes",
-    "bolloxed",
-    "bolloxes",
-    "bollworm",
-    "bolognas",
-    "boloneys",
-    "bolshies",
-    "bolthead",
-    "bolthole",
-    "boltless",
-    "boltlike",
-    "boltonia",
-    "boltrope",
-    "bombable",
-    "bombards",
-    "bombasts",
-    "bombesin",
-    "bomblets",
-    "bombload",
-    "bombycid",
-    "bombyxes",
-    "bonanzas",
-    "bondable",
-    "bondages",
-    "bondings",
-    "bondless",
-    "bondmaid",
-    "bondsmen",
-    "bonemeal",
-    "bonesets",
-    "boneyest",
-    "bongoist",
-    "bonhomie",
-    "boniatos",
-    "boniness",
-    "bonitoes",
-    "bonneted",
-    "bonniest",
-    "bonnocks",
-    "bonspell",
-    "bonspiel",
-    "bontebok",
-    "boobirds",
-    "boodlers",
-    "boodling",
-    "boogeyed",
-    "boogying",
-    "boogyman",
-    "boogymen",
-    "boohooed",
-    "bookfuls",
-    "booklice",
-    "booklore",
-    "bookrack",
-    "bookrest",
-    "boomiest",
-    "boomkins",
-    "boomlets",
-    "boonless",
-    "bootjack",
-    "bootlace",
-    "bootless",
-    "bootlick",
-    "booziest",
-    "boracite",
-    "borating",
-    "borderer",
-    "bordures",
-    "boreases",
-    "borecole",
-    "boredoms",
-    "boresome",
-    "boringly",
-    "borneols",
-    "bornites",
-    "bornitic",
-    "borsches",
-    "borschts",
-    "borstals",
-    "boscages",
-    "boschbok",
-    "boshboks",
-    "boshvark",
-    "boskages",
-    "boskiest",
-    "bosoming",
-    "bosquets",
-    "bossdoms",
-    "bossiest",
-    "bossisms",
-    "botanies",
-    "botanise",
-    "botanize",
-    "botchers",
-    "botchery",
-    "botchier",
-    "botchily",
-    "botching",
-    "botflies",
-    "bothrium",
-    "botonnee",
-    "botryoid",
-    "botryose",
-    "bottlers",
-    "bottomer",
-    "bottomry",
-    "botulins",
-    "bouchees",
-    "boudoirs",
-    "bouffant",
-    "boughpot",
-    "boughten",
-    "bouldery",
-    "bouncier",
-    "bouncily",
-    "bounders",
-    "bountied",
-    "bourbons",
-    "bourdons",
-    "bourgeon",
-    "bourrees",
-    "bourride",
-    "boursins",
-    "bourtree",
-    "bousouki",
-    "bouviers",
-    "bovinely",
-    "bovinity",
-    "boweling",
-    "bowelled",
-    "boweries",
-    "bowering",
-    "bowfront",
-    "bowheads",
-    "bowingly",
-    "bowknots",
-    "bowlders",
-    "bowlfuls",
-    "bowlines",
-    "bowlings",
-    "bowllike",
-    "bowshots",
-    "bowsprit",
-    "bowwowed",
-    "boxballs",
-    "boxberry",
-    "boxboard",
-    "boxhauls",
-    "boxiness",
-    "boxthorn",
-    "boxwoods",
-    "boyarism",
-    "boychick",
-    "boychiks",
-    "boyhoods",
-    "boyishly",
-    "brabbled",
-    "brabbler",
-    "brabbles",
-    "braceros",
-    "brachets",
-    "brachium",
-    "bracings",
-    "braciola",
-    "braciole",
-    "brackens",
-    "braconid",
-    "bracteal",
-    "bractlet",
-    "bradawls",
-    "bradding",
-    "bradoons",
-    "braggart",
-    "braggers",
-    "braggest",
-    "braggier",
-    "braiders",
-    "brailing",
-    "brailled",
-    "brailler",
-    "brailles",
-    "brainier",
-    "brainily",
-    "braining",
-    "brainish",
-    "brainpan",
-    "braising",
-    "brakeage",
-    "brakeman",
-    "brakemen",
-    "brakiest",
-    "brambled",
-    "branchia",
-    "branders",
-    "brandied",
-    "brandies",
-    "brandish",
-    "branners",
-    "brannier",
-    "branning",
-    "brantail",
-    "brashest",
-    "brashier",
-    "brasiers",
-    "brasilin",
-    "brassage",
-    "brassard",
-    "brassart",
-    "brassier",
-    "brassies",
-    "brassily",
-    "brassing",
-    "brassish",
-    "brattice",
-    "brattier",
-    "brattish",
-    "brattled",
-    "brattles",
-    "braunite",
-    "bravados",
-    "bravoing",
-    "bravuras",
-    "brawlers",
-    "brawlier",
-    "brawling",
-    "brawnier",
-    "brawnily",
-    "brazened",
-    "brazenly",
-    "braziers",
-    "brazilin",
-    "breacher",
-    "breadbox",
-    "breading",
-    "breadnut",
-    "breadths",
-    "breaming",
-    "breccial",
-    "breccias",
-    "brechams",
-    "brechans",
-    "breeched",
-    "breezier",
-    "breezily",
-    "breezing",
-    "bregmata",
-    "bregmate",
-    "brevetcy",
-    "breveted",
-    "breviary",
-    "breviers",
-    "brewages",
-    "brewings",
-    "brewises",
-    "brewskis",
-    "bribable",
-    "brickbat",
-    "brickier",
-    "bricking",
-    "brickles",
-    "bricoles",
-    "bridally",
-    "bridlers",
-    "bridling",
-    "bridoons",
-    "briefers",
-    "briefest",
-    "brigaded",
-    "brigands",
-    "brimfull",
-    "brimless",
-    "brimmers",
-    "brindled",
-    "brindles",
-    "bringers",
-    "briniest",
-    "brioches",
-    "brionies",
-    "briquets",
-    "brisance",
-    "briskest",
-    "briskets",
-    "brisking",
-    "brisling",
-    "bristled",
-    "bristols",
-    "britches",
-    "britskas",
-    "brittled",
-    "brittler",
-    "brittles",
-    "britzkas",
-    "britzska",
-    "broacher",
-    "broaches",
-    "broadaxe",
-    "broadish",
-    "brocaded",
-    "brocades",
-    "brocatel",
-    "brockage",
-    "brockets",
-    "brocolis",
-    "broguery",
-    "broguish",
-    "broiders",
-    "broidery",
-    "broiling",
-    "brokages",
-    "brokenly",
-    "brokings",
-    "brollies",
-    "bromated",
-    "bromates",
-    "bromelin",
-    "bromides",
-    "bromidic",
-    "bromines",
-    "bromisms",
-    "bromized",
-    "bromizes",
-    "bronchia",
-    "bronchos",
-    "bronzers",
-    "bronzier",
-    "brooders",
-    "broodier",
-    "broodily",
-    "brookies",
-    "brooking",
-    "brookite",
-    "brooklet",
-    "broomier",
-    "brooming",
-    "browband",
-    "browbeat",
-    "browless",
-    "brownest",
-    "brownier",
-    "brownout",
-    "brucines",
-    "bruisers",
-    "bruiters",
-    "bruiting",
-    "brulyies",
-    "brulzies",
-    "brumbies",
-    "brunched",
-    "bruncher",
-    "brunches",
-    "brunizem",
-    "brushers",
-    "brushier",
-    "brushoff",
-    "brushups",
-    "bruskest",
-    "brusquer",
-    "brutisms",
-    "bruxisms",
-    "bryology",
-    "bryonies",
-    "bryozoan",
-    "bubaline",
-    "bubblers",
-    "bubblier",
-    "bubblies",
-    "bubingas",
-    "buccally",
-    "buckayro",
-    "buckbean",
-    "buckeens",
-    "buckeroo",
-    "bucketed",
-    "bucklers",
-    "buckrams",
-    "bucksaws",
-    "buckshee",
-    "bucktail",
-    "bucolics",
-    "buddings",
-    "buddleia",
-    "buddying",
-    "budgeter",
-    "budworms",
-    "buffable",
-    "buffalos",
-    "buffeted",
-    "buffeter",
-    "buffiest",
-    "buffoons",
-    "bugaboos",
-    "bugbanes",
-    "bugbears",
-    "buggered",
-    "buggiest",
-    "bughouse",
-    "bugseeds",
-    "buhlwork",
-    "buildups",
-    "bulblets",
-    "bulghurs",
-    "bulgiest",
-    "bulimiac",
-    "bulimias",
-    "bulimics",
-    "bulkages",
-    "bulkiest",
-    "bullaces",
-    "bullbats",
-    "bulldoze",
-    "bulldyke",
-    "bullhorn",
-    "bulliest",
-    "bullions",
-    "bullneck",
-    "bullnose",
-    "bullocky",
-    "bullpens",
-    "bullpout",
-    "bullring",
-    "bullrush",
-    "bullshat",
-    "bullshot",
-    "bullweed",
-    "bullwhip",
-    "bullyboy",
-    "bullyrag",
-    "bulwarks",
-    "bumblers",
-    "bumboats",
-    "bumelias",
-    "bummalos",
-    "bumpered",
-    "bumpiest",
-    "bumpkins",
-    "bunchier",
-    "bunchily",
-    "buncoing",
-    "bundists",
-    "bundlers",
-    "bunghole",
-    "bunglers",
-    "bungling",
-    "bunkered",
-    "bunkmate",
-    "bunkoing",
-    "bunrakus",
-    "buntings",
-    "buntline",
-    "buoyages",
-    "buoyance",
-    "burblers",
-    "burblier",
-    "burbling",
-    "burdener",
-    "burdocks",
-    "burettes",
-    "burgages",
-    "burgeons",
-    "burghers",
-    "burgling",
-    "burgonet",
-    "burgouts",
-    "burgrave",
-    "burkites",
-    "burlesks",
-    "burliest",
-    "burnable",
-    "burnings",
-    "burnoose",
-    "burnouts",
-    "burriest",
-    "burrowed",
-    "burrower",
-    "burseeds",
-    "bursters",
-    "burstone",
-    "burthens",
-    "burweeds",
-    "busgirls",
-    "bushbuck",
-    "busheled",
-    "busheler",
-    "bushgoat",
-    "bushidos",
-    "bushiest",
-    "bushless",
-    "bushlike",
-    "bushpigs",
-    "bushtits",
-    "bushwahs",
-    "buskined",
-    "busloads",
-    "bussings",
-    "bustards",
-    "bustiest",
-    "bustlers",
-    "bustline",
-    "busulfan",
-    "busybody",
-    "busyness",
-    "busywork",
-    "butanols",
-    "butanone",
-    "buttoner",
-    "butylate",
-    "butylene",
-    "butyrals",
-    "butyrins",
-    "butyrous",
-    "butyryls",
-    "buxomest",
-    "buybacks",
-    "buzzcuts",
-    "buzzwigs",
-    "byliners",
-    "bylining",
-    "byssuses",
-    "bystreet",
-    "cabalism",
-    "cabalist",
-    "caballed",
-    "cabbaged",
-    "cabbagey",
-    "cabbalah",
-    "cabbalas",
-    "cabestro",
-    "cabezone",
-    "cabezons",
-    "cabildos",
-    "cabining",
-    "cableway",
-    "caboched",
-    "cabombas",
-    "caboodle",
-    "cabooses",
-    "caboshed",
-    "cabotage",
-    "cabresta",
-    "cabresto",
-    "cabretta",
-    "cabrilla",
-    "cabriole",
-    "cabstand",
-    "cachalot",
-    "cachepot",
-    "cacheted",
-    "cachexia",
-    "cachexic",
-    "cachucha",
-    "caciques",
-    "cacklers",
-    "cackling",
-    "cacodyls",
-    "cacomixl",
-    "caconyms",
-    "caconymy",
-    "cactuses",
-    "cadaster",
-    "caddices",
-    "caddised",
-    "caddises",
-    "caddying",
-    "cadelles",
-    "cadenced",
-    "cadences",
-    "cadenzas",
-    "cadmiums",
-    "caducean",
-    "caducity",
-    "caducous",
-    "caecally",
-    "caesiums",
-    "caesurae",
-    "caesural",
-    "caesuras",
-    "caesuric",
-    "caffeins",
-    "caftaned",
-    "cagefuls",
-    "cagelike",
-    "cageling",
-    "caginess",
-    "caissons",
-    "caitiffs",
-    "cajaputs",
-    "cajeputs",
-    "cajolers",
-    "cajolery",
-    "cajoling",
-    "cajuputs",
-    "cakiness",
-    "calabaza",
-    "caladium",
-    "calamars",
-    "calamary",
-    "calamata",
-    "calamine",
-    "calamint",
-    "calamite",
-    "calashes",
-    "calathos",
-    "calathus",
-    "calcanea",
-    "calcanei",
-    "calcaria",
-    "calceate",
-    "calcific",
-    "calcined",
-    "calcines",
-    "calcites",
-    "calcitic",
-    "calciums",
-    "calcspar",
-    "calctufa",
-    "calctuff",
-    "caldaria",
-    "calderas",
-    "caldrons",
-    "caleches",
-    "calendal",
-    "calflike",
-    "calibers",
-    "calibred",
-    "calibres",
-    "caliches",
-    "calicles",
-    "calicoes",
-    "califate",
-    "calipash",
-    "calipees",
-    "caliphal",
-    "calisaya",
-    "calkings",
-    "callaloo",
-    "callants",
-    "callboys",
-    "callings",
-    "callipee",
-    "calliper",
-    "calloses",
-    "callower",
-    "callused",
-    "calomels",
-    "calorics",
-    "calorize",
-    "calottes",
-    "calotype",
-    "caloyers",
-    "calpacks",
-    "calpains",
-    "calquing",
-    "calthrop",
-    "caltraps",
-    "caltrops",
-    "calumets",
-    "calutron",
-    "calvaria",
-    "calycate",
-    "calyceal",
-    "calycine",
-    "calycles",
-    "calyculi",
-    "calypsos",
-    "calypter",
-    "calyptra",
-    "calzones",
-    "camailed",
-    "camasses",
-    "cambered",
-    "cambisms",
-    "cambists",
-    "cambiums",
-    "cambogia",
-    "cambrics",
-    "cameleer",
-    "camelias",
-    "camelids",
-    "cameoing",
-    "camisade",
-    "camisado",
-    "camisias",
-    "camomile",
-    "camorras",
-    "camphene",
-    "camphine",
-    "camphire",
-    "camphols",
-    "camphors",
-    "campiest",
-    "campions",
-    "campongs",
-    "camporee",
-    "campouts",
-    "campused",
-    "canaille",
-    "canakins",
-    "canaling",
-    "canalise",
-    "canalize",
-    "canalled",
-    "canaller",
-    "canastas",
-    "canceler",
-    "cancered",
-    "cancroid",
-    "candelas",
-    "candidal",
-    "candidas",
-    "candider",
-    "candlers",
-    "candling",
-    "candours",
-    "candying",
-    "canellas",
-    "canephor",
-    "caneware",
-    "canikins",
-    "caninity",
-    "canistel",
-    "canities",
-    "cankered",
-    "cannabic",
-    "cannabin",
-    "cannelon",
-    "canniest",
-    "cannikin",
-    "cannings",
-    "cannolis",
-    "cannoned",
-    "cannonry",
-    "cannulae",
-    "cannular",
-    "cannulas",
-    "canoeist",
-    "canoness",
-    "canonise",
-    "canonist",
-    "canonize",
-    "canoodle",
-    "canopied",
-    "canorous",
-    "cantalas",
-    "cantdogs",
-    "cantered",
-    "canticle",
-    "cantinas",
-    "cantoned",
-    "cantraip",
-    "cantraps",
-    "cantrips",
-    "canulate",
-    "canvased",
-    "canvaser",
-    "canzonas",
-    "canzones",
-    "canzonet",
-    "capabler",
-    "capelans",
-    "capelets",
-    "capelins",
-    "caperers",
-    "capering",
-    "capeskin",
-    "capework",
-    "capiases",
-    "capitate",
-    "capitols",
-    "capitula",
-    "capmaker",
-    "caponata",
-    "caponier",
-    "caponize",
-    "caporals",
-    "cappings",
-    "capricci",
-    "caprices",
-    "caprifig",
-    "capriole",
-    "caprocks",
-    "capsicin",
-    "capsidal",
-    "capsizes",
-    "capsomer",
-    "capstans",
-    "capsuled",
-    "captious",
-    "capturer",
-    "capuched",
-    "capuches",
-    "capybara",
-    "carabaos",
-    "carabids",
-    "carabine",
-    "carabins",
-    "caracals",
-    "caracara",
-    "caracole",
-    "caracols",
-    "caraculs",
-    "caragana",
-    "carageen",
-    "carangid",
-    "carassow",
-    "caravels",
-    "caraways",
-    "carbamic",
-    "carbamyl",
-    "carbarns",
-    "carbaryl",
-    "carbides",
-    "carbines",
-    "carbinol",
-    "carbolic",
-    "carboras",
-    "carboyed",
-    "carburet",
-    "carcajou",
-    "carcanet",
-    "carcases",
-    "carceral",
-    "cardamon",
-    "cardamum",
-    "cardcase",
-    "cardiacs",
-    "cardings",
-    "carditic",
-    "carditis",
-    "cardoons",
-    "careened",
-    "careener",
-    "careered",
-    "careerer",
-    "caresser",
-    "caretake",
-    "caretook",
-    "careworn",
-    "carfares",
-    "caribous",
-    "carinate",
-    "cariocas",
-    "carioles",
-    "carjacks",
-    "carlines",
-    "carlings",
-    "carloads",
-    "carmaker",
-    "carmines",
-    "carnages",
-    "carnally",
-    "carnauba",
-    "caroches",
-    "carolers",
-    "carolled",
-    "caroller",
-    "caroming",
-    "carotids",
-    "carotins",
-    "carousal",
-    "caroused",
-    "carouser",
-    "carouses",
-    "carpalia",
-    "carpings",
-    "carpools",
-    "carracks",
-    "carrells",
-    "carriole",
-    "carrions",
-    "carritch",
-    "carromed",
-    "carrotin",
-    "carryall",
-    "carryons",
-    "carryout",
-    "cartable",
-    "cartages",
-    "cartload",
-    "cartoned",
-    "cartoony",
-    "cartouch",
-    "caruncle",
-    "caryatic",
-    "caryatid",
-    "caryotin",
-    "cascabel",
-    "cascable",
-    "cascaras",
-    "caseases",
-    "caseated",
-    "caseates",
-    "casefied",
-    "casefies",
-    "casemate",
-    "caseoses",
-    "casernes",
-    "casettes",
-    "caseworm",
-    "cashable",
-    "cashbook",
-    "casimere",
-    "casimire",
-    "casketed",
-    "cassabas",
-    "cassatas",
-    "cassavas",
-    "cassenas",
-    "cassenes",
-    "cassinas",
-    "cassines",
-    "cassinos",
-    "cassises",
-    "cassocks",
-    "castable",
-    "castanet",
-    "casteism",
-    "castling",
-    "castoffs",
-    "castrate",
-    "castrati",
-    "castrato",
-    "casuists",
-    "catacomb",
-    "cataloes",
-    "catalpas",
-    "catamite",
-    "catarrhs",
-    "catawbas",
-    "catbirds",
-    "catboats",
-    "catbrier",
-    "catcalls",
-    "catchall",
-    "catchfly",
-    "catchier",
-    "catchups",
-    "catclaws",
-    "catechin",
-    "catechol",
-    "catechus",
-    "catenary",
-    "catenate",
-    "catenoid",
-    "caterans",
-    "cateress",
-    "catfaces",
-    "catfalls",
-    "catheads",
-    "cathects",
-    "cathedra",
-    "cathexes",
-    "cathexis",
-    "cathodal",
-    "catjangs",
-    "catlings",
-    "catmints",
-    "catnaper",
-    "catspaws",
-    "catsuits",
-    "cattails",
-    "cattalos",
-    "cattiest",
-    "cattleya",
-    "catwalks",
-    "caucused",
-    "caudally",
-    "caudated",
-    "caudates",
-    "caudexes",
-    "caudices",
-    "caudillo",
-    "caulicle",
-    "caulkers",
-    "causable",
-    "causerie",
-    "caustics",
-    "cavalero",
-    "cavallas",
-    "cavatina",
-    "cavatine",
-    "caveated",
-    "caveator",
-    "cavefish",
-    "cavelike",
-    "caverned",
-    "cavettos",
-    "caviares",
-    "cavicorn",
-    "cavilers",
-    "caviling",
-    "cavilled",
-    "caviller",
-    "cavitary",
-    "cavitate",
-    "cavitied",
-    "cavorted",
-    "cavorter",
-    "cayenned",
-    "cayennes",
-    "caziques",
-    "cecities",
-    "cecropia",
-    "cedillas",
-    "ceilidhs",
-    "ceinture",
-    "celadons",
-    "celeriac",
-    "celeries",
-    "celerity",
-    "celestas",
-    "celestes",
-    "cellared",
-    "cellarer",
-    "cellaret",
-    "cellists",
-    "cellmate",
-    "cellules",
-    "celomata",
-    "celosias",
-    "cembalos",
-    "cementer",
-    "cementum",
-    "cenacles",
-    "cenobite",
-    "cenotaph",
-    "censurer",
-    "censures",
-    "censused",
-    "centares",
-    "centaury",
-    "centavos",
-    "centeses",
-    "centesis",
-    "centiare",
-    "centiles",
-    "centimes",
-    "centimos",
-    "centners",
-    "centones",
-    "centrals",
-    "centring",
-    "centrism",
-    "centrums",
-    "centuple",
-    "ceorlish",
-    "cephalad",
-    "cephalin",
-    "cepheids",
-    "ceramals",
-    "ceramist",
-    "cerastes",
-    "ceratins",
-    "ceratoid",
-    "cercaria",
-    "cercises",
-    "cerebric",
-    "cerebrum",
-    "cerement",
-    "cereuses",
-    "cernuous",
-    "cerotype",
-    "cerumens",
-    "cerusite",
-    "cervelas",
-    "cervelat",
-    "cervezas",
-    "cervices",
-    "cervixes",
-    "cesarian",
-    "cessions",
-    "cesspits",
-    "cestodes",
-    "cestoids",
-    "cestuses",
-    "cetology",
-    "ceviches",
-    "chabouks",
-    "chachkas",
-    "chaconne",
-    "chadarim",
-    "chadless",
-    "chaebols",
-    "chaffers",
-    "chaffier",
-    "chaffing",
-    "chagrins",
-    "chainman",
-    "chainmen",
-    "chalazae",
-    "chalazal",
-    "chalazas",
-    "chalazia",
-    "chalcids",
-    "chaldron",
-    "chaliced",
-    "chalices",
-    "chalkier",
-    "chalking",
-    "challahs",
-    "challies",
-    "challoth",
-    "chalones",
-    "chalupas",
-    "chamades",
-    "chamfers",
-    "chamfron",
-    "chamisas",
-    "chamises",
-    "chamisos",
-    "chammied",
-    "chammies",
-    "champaca",
-    "champacs",
-    "champaks",
-    "champers",
-    "champing",
-    "chancels",
-    "chancers",
-    "chancier",
-    "chancily",
-    "chancing",
-    "chancres",
-    "chanfron",
-    "changeup",
-    "chanoyus",
-    "chantage",
-    "chanters",
-    "chanteys",
-    "chanties",
-    "chantors",
-    "chapatis",
-    "chapatti",
-    "chapeaus",
-    "chapeaux",
-    "chaperon",
-    "chapiter",
-    "chaplets",
-    "chappati",
-    "chappies",
-    "chapping",
-    "chaqueta",
-    "characid",
-    "characin",
-    "charades",
-    "charases",
-    "chariest",
-    "charisms",
-    "charkhas",
-    "charking",
-    "charlady",
-    "charleys",
-    "charlock",
-    "charmers",
-    "charnels",
-    "charpais",
-    "charpoys",
-    "charquid",
-    "charquis",
-    "charrier",
-    "charring",
-    "chartist",
-    "chasings",
-    "chasseur",
-    "chastely",
-    "chastens",
-    "chastest",
-    "chastise",
-    "chasuble",
-    "chatchka",
-    "chatchke",
-    "chateaus",
-    "chattery",
-    "chattier",
-    "chattily",
-    "chaufers",
-    "chauffer",
-    "chaunted",
-    "chaunter",
-    "chausses",
-    "chayotes",
-    "chazanim",
-    "chazzans",
-    "chazzens",
-    "cheapens",
-    "cheapies",
-    "cheapish",
-    "chechako",
-    "checkrow",
-    "cheddars",
-    "cheddary",
-    "cheddite",
-    "chedites",
-    "cheekful",
-    "cheekier",
-    "cheekily",
-    "cheeking",
-    "cheepers",
-    "cheeping",
-    "cheerers",
-    "cheerier",
-    "cheerily",
-    "cheerled",
-    "cheesier",
-    "cheesily",
-    "cheesing",
-    "chefdoms",
-    "cheffing",
-    "chelates",
-    "chelator",
-    "cheliped",
-    "cheloids",
-    "chemisms",
-    "chemurgy",
-    "chenopod",
-    "chequers",
-    "cheroots",
-    "chertier",
-    "cherubic",
-    "chervils",
-    "chessman",
-    "chessmen",
-    "chestful",
-    "chestier",
-    "chestily",
-    "chetrums",
-    "chevalet",
-    "cheveron",
-    "cheviots",
-    "chevrets",
-    "chevrons",
-    "chevying",
-    "chewiest",
-    "chewinks",
-    "chiantis",
-    "chiasmal",
-    "chiasmas",
-    "chiasmic",
-    "chiasmus",
-    "chiastic",
-    "chiauses",
-    "chibouks",
-    "chicaned",
-    "chicaner",
-    "chicanes",
-    "chicanos",
-    "chiccory",
-    "chichier",
-    "chickees",
-    "chickory",
-    "chicness",
-    "chiefdom",
-    "chiefest",
-    "chiffons",
-    "chigetai",
-    "chiggers",
-    "chignons",
-    "childbed",
-    "childing",
-    "chiliads",
-    "chiliasm",
-    "chiliast",
-    "chilidog",
-    "chillest",
-    "chillier",
-    "chillily",
-    "chillums",
-    "chilopod",
-    "chimbley",
-    "chimeres",
-    "chimleys",
-    "chinbone",
-    "chinches",
-    "chinkier",
-    "chinking",
-    "chinless",
-    "chinning",
-    "chinones",
-    "chinooks",
-    "chintses",
-    "chintzes",
-    "chinwags",
-    "chipmuck",
-    "chippier",
-    "chippies",
-    "chirkest",
-    "chirking",
-    "chirming",
-    "chirpers",
-    "chirpier",
-    "chirpily",
-    "chirring",
-    "chirrups",
-    "chirrupy",
-    "chiseler",
-    "chitchat",
-    "chitling",
-    "chitlins",
-    "chitters",
-    "chitties",
-    "chivaree",
-    "chivvied",
-    "chivvies",
-    "chivying",
-    "chloasma",
-    "chlorals",
-    "chlorate",
-    "chlordan",
-    "chlorids",
-    "chlorins",
-    "chlorous",
-    "chockful",
-    "chocking",
-    "choicely",
-    "choicest",
-    "choirboy",
-    "choiring",
-    "chokiest",
-    "cholates",
-    "cholents",
-    "choleras",
-    "choleric",
-    "cholines",
-    "chompers",
-    "chomping",
-    "choosers",
-    "choosier",
-    "chopines",
-    "choppier",
-    "choppily",
-    "choragic",
-    "choragus",
-    "chorales",
-    "chorally",
-    "chordate",
-    "chording",
-    "choregus",
-    "choreman",
-    "choremen",
-    "choreoid",
-    "choriamb",
-    "chorines",
-    "chorioid",
-    "chorions",
-    "chorizos",
-    "choroids",
-    "chortens",
-    "chortled",
-    "chortler",
-    "chortles",
-    "chorused",
-    "chousers",
-    "choushes",
-    "chousing",
-    "chowchow",
-    "chowsing",
-    "chowtime",
-    "chresard",
-    "chrismal",
-    "chrismon",
-    "chrisoms",
-    "chromide",
-    "chromier",
-    "chroming",
-    "chromite",
-    "chromize",
-    "chromous",
-    "chromyls",
-    "chronaxy",
-    "chronics",
-    "chronons",
-    "chthonic",
-    "chubasco",
-    "chubbier",
-    "chubbily",
-    "chuckies",
-    "chuckler",
-    "chuddahs",
-    "chuddars",
-    "chudders",
-    "chuffest",
-    "chuffier",
-    "chuffing",
-    "chugalug",
-    "chuggers",
-    "chukkars",
-    "chukkers",
-    "chummier",
-    "chummily",
-    "chumming",
-    "chumping",
-    "chumship",
-    "chunkier",
-    "chunkily",
-    "chunnels",
-    "chunters",
-    "chuppahs",
-    "churched",
-    "churchly",
-    "churlish",
-    "churners",
-    "churring",
-    "chutists",
-    "chutnees",
-    "chutzpas",
-    "chymists",
-    "chymosin",
-    "chytrids",
-    "ciborium",
-    "ciboules",
-    "cicatrix",
-    "cicelies",
-    "cicerone",
-    "ciceroni",
-    "cicisbei",
-    "cicisbeo",
-    "cicorees",
-    "cigarets",
-    "ciliated",
-    "ciliates",
-    "cimbalom",
-    "cinching",
-    "cinchona",
-    "cincture",
-    "cindered",
-    "cineaste",
-    "cineasts",
-    "cineoles",
-    "cinerary",
-    "cinerins",
-    "cingulum",
-    "cinnamic",
-    "cinnamyl",
-    "cinquain",
-    "cioppino",
-    "ciphered",
-    "cipherer",
-    "cipolins",
-    "circlers",
-    "circlets",
-    "circuity",
-    "cirriped",
-    "cislunar",
-    "cissoids",
-    "cisterna",
-    "cistrons",
-    "cistuses",
-    "citadels",
-    "citators",
-    "citatory",
-    "citeable",
-    "citharas",
-    "citherns",
-    "cithrens",
-    "citified",
-    "citifies",
-    "citrated",
-    "citrates",
-    "citreous",
-    "citrines",
-    "citrinin",
-    "citruses",
-    "citterns",
-    "cityfied",
-    "cityward",
-    "civicism",
-    "civilise",
-    "civilize",
-    "clabbers",
-    "clachans",
-    "clackers",
-    "clacking",
-    "cladisms",
-    "cladists",
-    "cladodes",
-    "clafouti",
-    "clagging",
-    "claimers",
-    "clambake",
-    "clambers",
-    "clamlike",
-    "clammers",
-    "clammier",
-    "clammily",
-    "clamming",
-    "clamored",
-    "clamorer",
-    "clamours",
-    "clampers",
-    "clamworm",
-    "clangers",
-    "clanging",
-    "clangors",
-    "clangour",
-    "clankier",
-    "clanking",
-    "clannish",
-    "clansman",
-    "clansmen",
-    "clappers",
-    "claptrap",
-    "claquers",
-    "claqueur",
-    "clarions",
-    "clarkias",
-    "clashers",
-    "claspers",
-    "classers",
-    "classier",
-    "classily",
-    "classing",
-    "classism",
-    "classist",
-    "classons",
-    "clastics",
-    "clatters",
-    "clattery",
-    "claughts",
-    "claustra",
-    "clavered",
-    "clavicle",
-    "claviers",
-    "clawback",
-    "clawless",
-    "clawlike",
-    "claybank",
-    "clayiest",
-    "claylike",
-    "claypans",
-    "clayware",
-    "clearers",
-    "cleating",
-    "cleavers",
-    "cleeking",
-    "clefting",
-    "cleidoic",
-    "clencher",
-    "clenches",
-    "clergies",
-    "clerihew",
-    "clerkdom",
-    "clerking",
-    "clerkish",
-    "cleveite",
-    "cleverer",
-    "clevises",
-    "clickers",
-    "cliental",
-    "cliffier",
-    "climatal",
-    "climaxed",
-    "clinally",
-    "clinches",
-    "clingers",
-    "clingier",
-    "clinkers",
-    "clinking",
-    "cliquier",
-    "cliquing",
-    "cliquish",
-    "clitella",
-    "clitoric",
-    "clobbers",
-    "clochard",
-    "clockers",
-    "cloddier",
-    "cloddish",
-    "clodpate",
-    "clodpole",
-    "clodpoll",
-    "cloggers",
-    "cloggier",
-    "cloggily",
-    "clomping",
-    "clonally",
-    "clonings",
-    "clonisms",
-    "clonking",
-    "clonuses",
-    "clopping",
-    "closable",
-    "closured",
-    "clotured",
-    "clotures",
-    "cloudier",
-    "cloudily",
-    "cloudlet",
-    "clouring",
-    "clouters",
-    "clouting",
-    "clovered",
-    "clowders",
-    "clownery",
-    "clownish",
-    "clubable",
-    "clubbier",
-    "clubbish",
-    "clubface",
-    "clubfeet",
-    "clubfoot",
-    "clubhand",
-    "clubhaul",
-    "clubhead",
-    "clubroom",
-    "clubroot",
-    "clucking",
-    "clumbers",
-    "clumpier",
-    "clumpish",
-    "clumsier",
-    "clunkers",
-    "clunkier",
-    "clunking",
-    "clupeids",
-    "clupeoid",
-    "clustery",
-    "clutters",
-    "cluttery",
-    "clypeate",
-    "clysters",
-    "coachers",
-    "coacting",
-    "coaction",
-    "coactive",
-    "coactors",
-    "coadmire",
-    "coadmits",
-    "coaevals",
-    "coagency",
-    "coagents",
-    "coagulum",
-    "coalbins",
-    "coalfish",
-    "coalhole",
-    "coaliest",
-    "coalless",
-    "coalpits",
-    "coalsack",
-    "coalshed",
-    "coalyard",
-    "coamings",
-    "coanchor",
-    "coappear",
-    "coapting",
-    "coarsens",
-    "coarsest",
-    "coassist",
-    "coassume",
-    "coatless",
-    "coatrack",
-    "coatroom",
-    "coattail",
-    "coattend",
-    "coattest",
-    "cobaltic",
-    "cobbiest",
-    "cobbling",
-    "cobwebby",
-    "cocaines",
-    "coccidia",
-    "coccoids",
-    "coccyges",
-    "coccyxes",
-    "cochairs",
-    "cochleae",
-    "cochleas",
-    "cocinera",
-    "cockaded",
-    "cockades",
-    "cockapoo",
-    "cockbill",
-    "cockboat",
-    "cockcrow",
-    "cockered",
-    "cockerel",
-    "cockeyed",
-    "cockeyes",
-    "cockiest",
-    "cocklike",
-    "cockling",
-    "cockloft",
-    "cockneys",
-    "cockpits",
-    "cockshut",
-    "cockspur",
-    "cocksure",
-    "cocoanut",
-    "cocobola",
-    "cocobolo",
-    "cocomats",
-    "cocooned",
-    "cocoplum",
-    "cocottes",
-    "cocoyams",
-    "cocreate",
-    "coddlers",
-    "coddling",
-    "codebtor",
-    "codeinas",
-    "codeines",
-    "codeless",
-    "coderive",
-    "codesign",
-    "codicils",
-    "codifier",
-    "codifies",
-    "codirect",
-    "codlings",
-    "codpiece",
-    "codriven",
-    "codriver",
-    "codrives",
-    "coedited",
-    "coeditor",
-    "coeffect",
-    "coelomes",
-    "coelomic",
-    "coembody",
-    "coemploy",
-    "coempted",
-    "coenacts",
-    "coenamor",
-    "coendure",
-    "coenures",
-    "coenurus",
-    "coequals",
-    "coequate",
-    "coercers",
-    "coerects",
-    "coesites",
-    "coevally",
-    "coevolve",
-    "coexerts",
-    "coexists",
-    "coextend",
-    "coffered",
-    "coffined",
-    "coffling",
-    "coffrets",
-    "cofounds",
-    "cogently",
-    "cogitate",
-    "cognates",
-    "cognised",
-    "cognises",
-    "cognized",
-    "cognizer",
-    "cognizes",
-    "cognomen",
-    "cognovit",
-    "cogwheel",
-    "cohabits",
-    "coheaded",
-    "coherers",
-    "cohering",
-    "cohobate",
-    "coholder",
-    "cohoshes",
-    "cohosted",
-    "coiffeur",
-    "coiffing",
-    "coiffure",
-    "coigning",
-    "coinable",
-    "coinages",
-    "coinfect",
-    "coinfers",
-    "coinhere",
-    "coinmate",
-    "coinsure",
-    "cointers",
-    "coinvent",
-    "coistrel",
-    "coistril",
-    "coitally",
-    "coitions",
-    "coituses",
-    "cojoined",
-    "cokehead",
-    "cokelike",
-    "coldcock",
-    "coleader",
-    "coleseed",
-    "colessee",
-    "colessor",
-    "coleuses",
-    "colewort",
-    "colicine",
-    "colicins",
-    "colinear",
-    "colistin",
-    "collaged",
-    "collards",
-    "collaret",
-    "collates",
-    "collator",
-    "colleens",
-    "colleger",
-    "collegia",
-    "colleted",
-    "collogue",
-    "colluded",
-    "colluder",
-    "colludes",
-    "colluvia",
-    "collying",
-    "collyria",
-    "coloboma",
-    "colocate",
-    "cologned",
-    "colonics",
-    "colonise",
-    "colorant",
-    "coloreds",
-    "colorers",
-    "colorism",
-    "colorman",
-    "colormen",
-    "colorway",
-    "colotomy",
-    "colourer",
-    "colpitis",
-    "colubrid",
-    "columbic",
-    "columels",
-    "columnal",
-    "columnea",
-    "columned",
-    "comakers",
-    "comaking",
-    "comanage",
-    "comatiks",
-    "comatula",
-    "combated",
-    "combater",
-    "combings",
-    "comblike",
-    "combusts",
-    "comedown",
-    "comelier",
-    "comelily",
-    "comember",
-    "comether",
-    "comfiest",
-    "comfreys",
-    "comingle",
-    "comitial",
-    "comities",
-    "commixed",
-    "commixes",
-    "commodes",
-    "commoved",
-    "commoves",
-    "communed",
-    "communer",
-    "compadre",
-    "comparts",
-    "compeers",
-    "compends",
-    "compered",
-    "comperes",
-    "complect",
-    "complice",
-    "complier",
-    "compline",
-    "complins",
-    "complots",
-    "comports",
-    "composts",
-    "compotes",
-    "comprize",
-    "compting",
-    "comsymps",
-    "conation",
-    "conative",
-    "concaved",
-    "concaves",
-    "conceder",
-    "conceits",
-    "concents",
-    "concepti",
-    "conchies",
-    "conchoid",
-    "conciser",
-    "concocts",
-    "concords",
-    "condoled",
-    "condoler",
-    "condoles",
-    "condoner",
-    "condones",
-    "condores",
-    "conduced",
-    "conducer",
-    "conduces",
-    "condylar",
-    "condyles",
-    "conelrad",
-    "conenose",
-    "conepate",
-    "conepatl",
-    "confects",
-    "conferee",
-    "conferva",
-    "confetto",
-    "confider",
-    "confides",
-    "confiner",
-    "conflate",
-    "confrere",
-    "confuted",
-    "confuter",
-    "confutes",
-    "congaing",
-    "congeals",
-    "congener",
-    "congests",
-    "conglobe",
-    "conicity",
-    "conidial",
-    "conidian",
-    "conidium",
-    "coniines",
-    "conioses",
-    "coniosis",
-    "conjoins",
-    "conjurer",
-    "conjuror",
-    "connived",
-    "conniver",
-    "connives",
-    "connoted",
-    "conodont",
-    "conoidal",
-    "conquian",
-    "consigns",
-    "consoler",
-    "consomme",
-    "consorts",
-    "contagia",
-    "contemns",
-    "contorts",
-    "contrail",
-    "contrite",
-    "contrive",
-    "contused",
-    "contuses",
-    "convects",
-    "converso",
-    "convexes",
-    "convexly",
-    "conveyer",
-    "convoked",
-    "convoker",
-    "convokes",
-    "convolve",
-    "convoyed",
-    "convulse",
-    "cooeeing",
-    "cooeying",
-    "cooingly",
-    "cookable",
-    "cookings",
-    "cookless",
-    "cookoffs",
-    "cookouts",
-    "cookshop",
-    "coolants",
-    "cooncans",
-    "coonskin",
-    "coonties",
-    "coopered",
-    "coopting",
-    "cooption",
-    "copaibas",
-    "coparent",
-    "copastor",
-    "copatron",
-    "copemate",
-    "copihues",
-    "copilots",
-    "coplanar",
-    "copperah",
-    "coppered",
-    "coppiced",
-    "coppices",
-    "copremia",
-    "copremic",
-    "coprince",
-    "copulate",
-    "copurify",
-    "copyable",
-    "copybook",
-    "copyboys",
-    "copycats",
-    "copydesk",
-    "copyedit",
-    "copygirl",
-    "copyhold",
-    "copyists",
-    "copyread",
-    "coquetry",
-    "coquinas",
-    "coquitos",
-    "coracles",
-    "coracoid",
-    "corantos",
-    "corbeils",
-    "corbeled",
-    "corbinas",
-    "cordages",
-    "cordelle",
-    "cordings",
-    "cordites",
-    "cordlike",
-    "cordobas",
-    "cordoned",
-    "cordovan",
-    "cordwain",
-    "cordwood",
-    "coredeem",
-    "coreigns",
-    "corelate",
-    "coreless",
-    "coremium",
-    "corkages",
-    "corkiest",
-    "corklike",
-    "corkwood",
-    "cormlike",
-    "cornball",
-    "corncake",
-    "corncobs",
-    "corncrib",
-    "corneous",
-    "cornetcy",
-    "cornhusk",
-    "corniced",
-    "cornicle",
-    "corniest",
-    "cornpone",
-    "cornrows",
-    "cornuses",
-    "cornuted",
-    "cornutos",
-    "corodies",
-    "corollas",
-    "coronach",
-    "coronals",
-    "coronate",
-    "coronels",
-    "coronets",
-    "coronoid",
-    "corotate",
-    "corpsman",
-    "corpsmen",
-    "corpuses",
-    "corraded",
-    "corrades",
-    "corrival",
-    "corrodes",
-    "corsairs",
-    "corselet",
-    "corseted",
-    "corsetry",
-    "corslets",
-    "corteges",
-    "cortexes",
-    "cortices",
-    "cortinas",
-    "corulers",
-    "corundum",
-    "corvinas",
-    "corybant",
-    "corymbed",
-    "coryphee",
-    "coscript",
-    "cosecant",
-    "coshered",
-    "cosigned",
-    "cosigner",
-    "cosiness",
-    "cosmical",
-    "cosmisms",
-    "cosmists",
-    "cosmoses",
-    "cosseted",
-    "costally",
-    "costards",
-    "costless",
-    "costlier",
-    "costmary",
-    "costrels",
-    "costumey",
-    "cotenant",
-    "coteries",
-    "cothurni",
-    "cothurns",
-    "cotillon",
-    "cotingas",
-    "cotinine",
-    "cotquean",
-    "cottager",
-    "cottagey",
-    "cottered",
-    "cottiers",
-    "cottoned",
-    "coturnix",
-    "cotyloid",
-    "couchant",
-    "couchers",
-    "couching",
-    "coughers",
-    "couldest",
-    "coulisse",
-    "couloirs",
-    "coulombs",
-    "coulters",
-    "coumaric",
-    "coumarin",
-    "coumarou",
-    "countian",
-    "couplets",
-    "courages",
-    "courante",
-    "couranto",
-    "courants",
-    "courlans",
-    "coursers",
-    "courters",
-    "cousinly",
-    "cousinry",
-    "couteaux",
-    "couthest",
-    "couthier",
-    "coutures",
-    "couvades",
-    "covaried",
-    "covaries",
-    "coverers",
-    "coverlid",
-    "coverups",
-    "coveters",
-    "coveting",
-    "covetous",
-    "cowbanes",
-    "cowbells",
-    "cowberry",
-    "cowbinds",
-    "cowbirds",
-    "cowboyed",
-    "cowering",
-    "cowflaps",
-    "cowflops",
-    "cowhages",
-    "cowhands",
-    "cowherbs",
-    "cowherds",
-    "cowhided",
-    "cowhides",
-    "cowinner",
-    "cowlicks",
-    "cowlings",
-    "cowplops",
-    "cowpokes",
-    "cowpoxes",
-    "cowriter",
-    "cowrites",
-    "cowsheds",
-    "cowskins",
-    "cowslips",
-    "coxalgia",
-    "coxalgic",
-    "coxcombs",
-    "coxswain",
-    "cozenage",
-    "cozeners",
-    "cozening",
-    "coziness",
-    "craaling",
-    "crabbers",
-    "crabbier",
-    "crabbily",
-    "crabbing",
-    "crablike",
-    "crabwise",
-    "crackled",
-    "crackles",
-    "cracknel",
-    "crackups",
-    "cradlers",
-    "cradling",
-    "craftier",
-    "craftily",
-    "craggier",
-    "craggily",
-    "cragsman",
-    "cragsmen",
-    "cramboes",
-    "crammers",
-    "cramoisy",
-    "crampier",
-    "crampits",
-    "crampoon",
-    "cranched",
-    "cranches",
-    "craniate",
-    "craniums",
-    "crankest",
-    "crankier",
-    "crankily",
-    "crankish",
-    "crankled",
-    "crankles",
-    "crankous",
-    "crankpin",
-    "crannied",
-    "crannoge",
-    "crannogs",
-    "crapolas",
-    "crappers",
-    "crappier",
-    "crappies",
-    "crapping",
-    "crassest",
-    "cratches",
-    "cratered",
-    "cratonic",
-    "cravened",
-    "cravenly",
-    "crawdads",
-    "crawlier",
-    "crawlway",
-    "crayoned",
-    "crayoner",
-    "creakier",
-    "creakily",
-    "creamers",
-    "creamier",
-    "creamily",
-    "creaming",
-    "creasers",
-    "creasier",
-    "creatins",
-    "credenda",
-    "creeling",
-    "creepage",
-    "creepier",
-    "creepies",
-    "creepily",
-    "creeshed",
-    "creeshes",
-    "cremains",
-    "cremates",
-    "cremator",
-    "creminis",
-    "crenated",
-    "creneled",
-    "crenelle",
-    "creodont",
-    "creolise",
-    "creolize",
-    "creosols",
-    "crepiest",
-    "crescive",
-    "cressets",
-    "cresting",
-    "cresylic",
-    "cretonne",
-    "crevalle",
-    "crevasse",
-    "creviced",
-    "crewcuts",
-    "crewless",
-    "crewmate",
-    "cribbers",
-    "cribbing",
-    "cribbled",
-    "cribrous",
-    "cribwork",
-    "cricetid",
-    "cricking",
-    "cricoids",
-    "criminis",
-    "crimmers",
-    "crimpers",
-    "crimpier",
-    "crimpled",
-    "crimples",
-    "crimsons",
-    "cringers",
-    "cringing",
-    "cringles",
-    "crinites",
-    "crinkled",
-    "crinkles",
-    "crinoids",
-    "criollos",
-    "crippler",
-    "crispate",
-    "crispens",
-    "crispers",
-    "crispest",
-    "crispier",
-    "crispily",
-    "crisping",
-    "cristate",
-    "critturs",
-    "croakers",
-    "croakier",
-    "croakily",
-    "croaking",
-    "croceine",
-    "croceins",
-    "crochets",
-    "crockets",
-    "crocking",
-    "crocoite",
-    "crocuses",
-    "crofters",
-    "cromlech",
-    "crookery",
-    "crookest",
-    "crooking",
-    "crooners",
-    "crooning",
-    "cropless",
-    "croppers",
-    "croppies",
-    "croquets",
-    "crosiers",
-    "crossarm",
-    "crossers",
-    "crossest",
-    "crosslet",
-    "crosstie",
-    "crostini",
-    "crostino",
-    "crotched",
-    "crotches",
-    "crouches",
-    "croupily",
-    "croupous",
-    "crousely",
-    "crowbars",
-    "crowders",
-    "crowdies",
-    "crowfeet",
-    "crowfoot",
-    "crowners",
-    "crownets",
-    "crowstep",
-    "croziers",
-    "crucians",
-    "crucifer",
-    "cruddier",
-    "crudding",
-    "crudites",
-    "cruelest",
-    "crueller",
-    "crullers",
-    "crumbers",
-    "crumbier",
-    "crumbing",
-    "crumbums",
-    "crumhorn",
-    "crummier",
-    "crummies",
-    "crumpets",
-    "crumping",
-    "crumples",
-    "crunodal",
-    "crunodes",
-    "cruppers",
-    "crusaded",
-    "crusados",
-    "crustier",
-    "crustily",
-    "crusting",
-    "crustose",
-    "crutched",
-    "cruzados",
-    "cruzeiro",
-    "cryingly",
-    "cryobank",
-    "cryogens",
-    "cryogeny",
-    "cryolite",
-    "cryotron",
-    "ctenidia",
-    "cubature",
-    "cubicity",
-    "cubicula",
-    "cubiform",
-    "cubistic",
-    "cuboidal",
-    "cuckolds",
-    "cuckooed",
-    "cucurbit",
-    "cudbears",
-    "cuddlers",
-    "cuddlier",
-    "cudgeled",
-    "cudgeler",
-    "cudweeds",
-    "cuffless",
-    "cufflink",
-    "cuittled",
-    "cuittles",
-    "culicids",
-    "culicine",
-    "cullions",
-    "cullises",
-    "cullying",
-    "culottes",
-    "culpably",
-    "cultches",
-    "cultigen",
-    "cultisms",
-    "cultists",
-    "cultlike",
-    "cultrate",
-    "cultuses",
-    "culverin",
-    "cumarins",
-    "cumbered",
-    "cumberer",
-    "cumbrous",
-    "cumquats",
-    "cumshaws",
-    "cumulate",
-    "cumulous",
-    "cuneated",
-    "cuneatic",
-    "cuniform",
-    "cunnings",
-    "cupelers",
-    "cupeling",
-    "cupelled",
-    "cupeller",
-    "cupidity",
-    "cupolaed",
-    "cuppiest",
-    "cuppings",
-    "cupreous",
-    "cuprites",
-    "cupulate",
-    "curacaos",
-    "curacies",
-    "curacoas",
-    "curarine",
-    "curarize",
-    "curassow",
-    "curating",
-    "curbable",
-    "curbings",
-    "curculio",
-    "curcumas",
-    "curdiest",
-    "curdlers",
-    "curdling",
-    "cureless",
-    "curetted",
-    "curettes",
-    "curlicue",
-    "curliest",
-    "curlings",
-    "curlycue",
-    "currachs",
-    "curraghs",
-    "curricle",
-    "curriers",
-    "curriery",
-    "currying",
-    "curseder",
-    "cursedly",
-    "cursives",
-    "curtails",
-    "curtalax",
-    "curtness",
-    "curtseys",
-    "curtsied",
-    "curtsies",
-    "curvedly",
-    "curveted",
-    "curviest",
-    "cuscuses",
-    "cushiest",
-    "cushiony",
-    "cuspated",
-    "cuspidal",
-    "cuspides",
-    "cuspidor",
-    "cussedly",
-    "cussword",
-    "custards",
-    "custardy",
-    "custodes",
-    "custumal",
-    "cutaways",
-    "cutbanks",
-    "cutchery",
-    "cutdowns",
-    "cutesier",
-    "cutgrass",
-    "cuticles",
-    "cuticula",
-    "cutinise",
-    "cutinize",
-    "cutlases",
-    "cutlines",
-    "cutovers",
-    "cutpurse",
-    "cuttable",
-    "cuttages",
-    "cuttling",
-    "cutwater",
-    "cutworks",
-    "cutworms",
-    "cuvettes",
-    "cyanamid",
-    "cyanates",
-    "cyanided",
-    "cyanides",
-    "cyanines",
-    "cyanites",
-    "cyanitic",
-    "cyanogen",
-    "cyanosed",
-    "cyanoses",
-    "cyanosis",
-    "cyanotic",
-    "cycasins",
-    "cyclases",
-    "cyclecar",
-    "cycleway",
-    "cyclicly",
-    "cyclings",
-    "cyclitol",
-    "cyclized",
-    "cyclizes",
-    "cycloids",
-    "cyclonal",
-    "cyclopes",
-    "cycloses",
-    "cyclosis",
-    "cymatium",
-    "cymbaler",
-    "cymbalom",
-    "cymbidia",
-    "cymbling",
-    "cymlings",
-    "cymogene",
-    "cymosely",
-    "cynosure",
-    "cyphered",
-    "cypreses",
-    "cyprians",
-    "cyprinid",
-    "cypruses",
-    "cypselae",
-    "cysteins",
-    "cystines",
-    "cystoids",
-    "cytaster",
-    "cytidine",
-    "cytogeny",
-    "cytosols",
-    "czardoms",
-    "czarevna",
-    "czarinas",
-    "czarisms",
-    "czarists",
-    "czaritza",
-    "dabblers",
-    "dabchick",
-    "dabsters",
-    "dackered",
-    "dactylic",
-    "dactylus",
-    "dadaisms",
-    "dadaists",
-    "daddling",
-    "daemones",
-    "daemonic",
-    "daffiest",
-    "daftness",
-    "daggered",
-    "daggling",
-    "daglocks",
-    "dagwoods",
-    "dahabeah",
-    "dahabiah",
-    "dahabieh",
-    "dahabiya",
-    "daidzein",
-    "daikered",
-    "daimones",
-    "daimonic",
-    "daintier",
-    "daintily",
-    "dairyman",
-    "dairymen",
-    "daishiki",
-    "dakerhen",
-    "dalapons",
-    "dalesman",
-    "dalesmen",
-    "dalliers",
-    "dallying",
-    "dalmatic",
-    "daltonic",
-    "damagers",
-    "damasked",
-    "damewort",
-    "damianas",
-    "damnable",
-    "damnably",
-    "damndest",
-    "damneder",
-    "damosels",
-    "damozels",
-    "dampener",
-    "dampings",
-    "danazols",
-    "dandered",
-    "dandiest",
-    "dandlers",
-    "dandling",
-    "dandriff",
-    "dandyish",
-    "dandyism",
-    "danegeld",
-    "danegelt",
-    "daneweed",
-    "danewort",
-    "dangered",
-    "danglers",
-    "danglier",
-    "danishes",
-    "dankness",
-    "danseurs",
-    "danseuse",
-    "daphnias",
-    "dapperer",
-    "dapperly",
-    "dappling",
-    "dapsones",
-    "daringly",
-    "darioles",
-    "darkener",
-    "darklier",
-    "darkling",
-    "darksome",
-    "darndest",
-    "darneder",
-    "darnings",
-    "darshans",
-    "dartling",
-    "dasheens",
-    "dashiest",
-    "dashikis",
-    "dashpots",
-    "dastards",
-    "dasyures",
-    "dataries",
-    "dateable",
-    "dateless",
-    "datively",
-    "daubiest",
-    "daubries",
-    "daunders",
-    "daunters",
-    "dauphins",
-    "davening",
-    "dawdlers",
-    "dawdling",
-    "dawnlike",
-    "daybooks",
-    "daycares",
-    "dayflies",
-    "dayglows",
-    "daymares",
-    "dayrooms",
-    "daysides",
-    "daystars",
-    "daytimes",
-    "dayworks",
-    "dazzlers",
-    "deaconed",
-    "deaconry",
-    "deadened",
-    "deadener",
-    "deadeyes",
-    "deadfall",
-    "deadhead",
-    "deadlier",
-    "deadlift",
-    "deadness",
-    "deadpans",
-    "deaerate",
-    "deafened",
-    "deairing",
-    "dealated",
-    "dealates",
-    "dealfish",
-    "deanship",
-    "dearness",
-    "deashing",
-    "deathcup",
-    "deathful",
-    "debacles",
-    "debagged",
-    "debarked",
-    "debarker",
-    "debasers",
-    "debasing",
-    "debeaked",
-    "debeards",
-    "debility",
-    "debiting",
-    "deboners",
-    "deboning",
-    "debouche",
-    "debrided",
-    "debrides",
-    "debriefs",
-    "debruise",
-    "debtless",
-    "debunker",
-    "debutant",
-    "decagons",
-    "decagram",
-    "decalogs",
-    "decamped",
-    "decanted",
-    "decapods",
-    "decayers",
-    "deceases",
-    "deceives",
-    "decemvir",
-    "decenary",
-    "decennia",
-    "decenter",
-    "decentre",
-    "decerned",
-    "deciares",
-    "deciders",
-    "deciduae",
-    "decidual",
-    "deciduas",
-    "decigram",
-    "decimate",
-    "deckhand",
-    "deckings",
-    "declaims",
-    "declasse",
-    "declawed",
-    "decliner",
-    "decocted",
-    "decolors",
-    "decolour",
-    "decorous",
-    "decorums",
-    "decoyers",
-    "decoying",
-    "decreers",
-    "decretal",
-    "decrials",
-    "decriers",
-    "decrowns",
-    "decrying",
-    "decrypts",
-    "decupled",
-    "decuples",
-    "decuries",
-    "decurion",
-    "decurved",
-    "decurves",
-    "deducing",
-    "deediest",
-    "deedless",
-    "deejayed",
-    "deemster",
-    "deepener",
-    "deepness",
-    "deerlike",
-    "deerweed",
-    "deeryard",
-    "defacers",
-    "defamers",
-    "defaming",
-    "defanged",
-    "defatted",
-    "defeater",
-    "defecate",
-    "defenced",
-    "defensed",
-    "deferent",
-    "deferrer",
-    "defilade",
-    "defilers",
-    "defiling",
-    "definers",
-    "deflater",
-    "deflates",
-    "defleaed",
-    "deflects",
-    "deflexed",
-    "deflower",
-    "defoamed",
-    "defoamer",
-    "defogged",
-    "defogger",
-    "deforced",
-    "deforcer",
-    "deforces",
-    "deformer",
-    "defrauds",
-    "defrayal",
-    "defrayed",
-    "defrayer",
-    "defrocks",
-    "defrosts",
-    "deftness",
-    "defueled",
-    "defunded",
-    "defusers",
-    "defuzing",
-    "degassed",
-    "degasser",
-    "degasses",
-    "degender",
-    "degermed",
-    "deglazed",
-    "deglazes",
-    "degrader",
-    "degrease",
-    "degummed",
-    "degusted",
-    "dehisced",
-    "dehisces",
-    "dehorned",
-    "dehorner",
-    "dehorted",
-    "deicidal",
-    "deicides",
-    "deictics",
-    "deifical",
-    "deifiers",
-    "deifying",
-    "deigning",
-    "deionize",
-    "deixises",
-    "dejeuner",
-    "dekagram",
-    "delaines",
-    "delating",
-    "delation",
-    "delators",
-    "delayers",
-    "deleaded",
-    "deleaved",
-    "deleaves",
-    "delegacy",
-    "deliming",
-    "delimits",
-    "deloused",
-    "delouser",
-    "delouses",
-    "deltoids",
-    "deluders",
-    "deluding",
-    "deluging",
-    "delusive",
-    "delusory",
-    "deluster",
-    "demagogs",
-    "demagogy",
-    "demander",
-    "demarche",
-    "demarked",
-    "demasted",
-    "demeaned",
-    "demerara",
-    "demerged",
-    "demerger",
-    "demerges",
-    "demerits",
-    "demesnes",
-    "demetons",
-    "demigods",
-    "demijohn",
-    "demilune",
-    "demireps",
-    "demising",
-    "demister",
-    "demitted",
-    "demiurge",
-    "demivolt",
-    "demobbed",
-    "demoness",
-    "demoniac",
-    "demonian",
-    "demonise",
-    "demonism",
-    "demonist",
-    "demonize",
-    "demotics",
-    "demoting",
-    "demotist",
-    "demounts",
-    "demurely",
-    "demurest",
-    "demurral",
-    "demurred",
-    "demurrer",
-    "denature",
-    "denazify",
-    "dendroid",
-    "dendrons",
-    "deniable",
-    "deniably",
-    "denotive",
-    "dentalia",
-    "dentally",
-    "dentated",
-    "denticle",
-    "dentiled",
-    "dentinal",
-    "dentines",
-    "dentural",
-    "denudate",
-    "denuders",
-    "denuding",
-    "deodands",
-    "deodaras",
-    "deorbits",
-    "depaints",
-    "departee",
-    "depeople",
-    "depermed",
-    "depicter",
-    "depictor",
-    "depilate",
-    "deplaned",
-    "deplanes",
-    "depleter",
-    "depletes",
-    "deplorer",
-    "deplores",
-    "deployer",
-    "deplumed",
-    "deplumes",
-    "depolish",
-    "deponent",
-    "deponing",
-    "deportee",
-    "deporter",
-    "deposals",
-    "deposers",
-    "deposing",
-    "depraver",
-    "depraves",
-    "deprenyl",
-    "deprival",
-    "depriver",
-    "depsides",
-    "depurate",
-    "deputing",
-    "deputize",
-    "deraigns",
-    "deranger",
-    "deranges",
-    "derating",
-    "deratted",
-    "deriders",
-    "deriding",
-    "deringer",
-    "derisive",
-    "derisory",
-    "derivate",
-    "derivers",
-    "dermises",
-    "dermoids",
-    "derogate",
-    "derricks",
-    "derriere",
-    "derrises",
-    "desalted",
-    "desalter",
-    "desanded",
-    "descants",
-    "descried",
-    "descrier",
-    "descries",
-    "desertic",
-    "deserver",
-    "desexing",
-    "desilver",
-    "desinent",
-    "desirers",
-    "desisted",
-    "desmoids",
-    "desorbed",
-    "despairs",
-    "despisal",
-    "despiser",
-    "despited",
-    "despites",
-    "despoils",
-    "desponds",
-    "destains",
-    "destines",
-    "destrier",
-    "desugars",
-    "desulfur",
-    "detacher",
-    "detaches",
-    "detailer",
-    "detainer",
-    "detassel",
-    "detecter",
-    "detentes",
-    "deterged",
-    "deterger",
-    "deterges",
-    "deterrer",
-    "detester",
-    "dethatch",
-    "dethrone",
-    "deticked",
-    "deticker",
-    "detinues",
-    "detoured",
-    "detoxing",
-    "detrains",
-    "detruded",
-    "detrudes",
-    "deucedly",
-    "deuteric",
-    "deutzias",
-    "devalues",
-    "deveined",
-    "develing",
-    "deverbal",
-    "devested",
-    "deviancy",
-    "deviator",
-    "deviling",
-    "devilkin",
-    "devilled",
-    "deviltry",
-    "devisals",
-    "devisees",
-    "devisers",
-    "devisors",
-    "devoiced",
-    "devoices",
-    "devolves",
-    "devourer",
-    "devouter",
-    "devoutly",
-    "dewaters",
-    "dewaxing",
-    "dewclaws",
-    "dewdrops",
-    "dewfalls",
-    "dewiness",
-    "dewooled",
-    "dewormed",
-    "dewormer",
-    "dextrans",
-    "dextrine",
-    "dextrins",
-    "dextrous",
-    "dezinced",
-    "dhoolies",
-    "dhooties",
-    "dhourras",
-    "dhurries",
-    "diabases",
-    "diabasic",
-    "diablery",
-    "diabolos",
-    "diacetyl",
-    "diacidic",
-    "diaconal",
-    "diademed",
-    "diagraph",
-    "dialings",
-    "dialists",
-    "diallage",
-    "diallers",
-    "diallist",
-    "dialoged",
-    "dialoger",
-    "dialysed",
-    "dialyser",
-    "dialyses",
-    "dialytic",
-    "dialyzed",
-    "dialyzer",
-    "dialyzes",
-    "diamides",
-    "diamines",
-    "diapason",
-    "diapause",
-    "diapered",
-    "diaphone",
-    "diaphony",
-    "diapiric",
-    "diapsids",
-    "diarchic",
-    "diarists",
-    "diaspore",
-    "diastase",
-    "diastema",
-    "diastems",
-    "diasters",
-    "diastole",
-    "diastral",
-    "diatomic",
-    "diatrons",
-    "diazines",
-    "diazoles",
-    "dibblers",
-    "dibbling",
-    "dibbukim",
-    "dicambas",
-    "dicastic",
-    "dicentra",
-    "dichasia",
-    "dichotic",
-    "dickered",
-    "dickiest",
-    "dicotyls",
-    "dicrotal",
-    "dicrotic",
-    "dictiest",
-    "dictions",
-    "dicyclic",
-    "didactyl",
-    "didapper",
-    "diddlers",
-    "diddleys",
-    "diddlies",
-    "diddling",
-    "didymium",
-    "didymous",
-    "didynamy",
-    "diebacks",
-    "diecious",
-    "diehards",
-    "diemaker",
-    "diereses",
-    "dieresis",
-    "dieretic",
-    "dieseled",
-    "diesters",
-    "diestock",
-    "diestrum",
-    "diestrus",
-    "diethers",
-    "diffract",
-    "diffuses",
-    "diffusor",
-    "digamies",
-    "digamist",
-    "digammas",
-    "digamous",
-    "digerati",
-    "digestif",
-    "digestor",
-    "diggings",
-    "dighting",
-    "digitals",
-    "digitate",
-    "digoxins",
-    "dihedron",
-    "dihybrid",
-    "dihydric",
-    "dilatant",
-    "dilatate",
-    "dilaters",
-    "dilating",
-    "dilative",
-    "dilators",
-    "dilatory",
-    "dilemmic",
-    "diluents",
-    "diluters",
-    "dilutors",
-    "diluvial",
-    "diluvian",
-    "diluvion",
-    "diluvium",
-    "dimerism",
-    "dimerize",
-    "dimerous",
-    "dimeters",
-    "dimetric",
-    "dimities",
-    "dimmable",
-    "dimorphs",
-    "dimplier",
-    "dimpling",
-    "dindling",
-    "dinettes",
-    "dingdong",
-    "dingiest",
-    "dinguses",
-    "dinkiest",
-    "diobolon",
-    "dioecies",
-    "dioecism",
-    "dioicous",
-    "diolefin",
-    "diopside",
-    "dioptase",
-    "diopters",
-    "dioptral",
-    "dioptres",
-    "dioptric",
-    "dioramic",
-    "diorites",
-    "dioritic",
-    "dioxanes",
-    "dioxides",
-    "diphasic",
-    "diplegia",
-    "diplegic",
-    "diplexer",
-    "diploids",
-    "diploidy",
-    "diplonts",
-    "diplopia",
-    "diplopic",
-    "diplopod",
-    "diploses",
-    "diplosis",
-    "dipnoans",
-    "dipodies",
-    "dippable",
-    "dippiest",
-    "diprotic",
-    "dipsades",
-    "dipshits",
-    "dipteral",
-    "dipteran",
-    "dipteron",
-    "diptycas",
-    "diptychs",
-    "directer",
-    "direness",
-    "dirgeful",
-    "diriment",
-    "dirtbags",
-    "dirtying",
-    "disabler",
-    "disabuse",
-    "disannul",
-    "disarmer",
-    "disavows",
-    "disbands",
-    "disbosom",
-    "disbound",
-    "disbowel",
-    "discants",
-    "discased",
-    "discases",
-    "discepts",
-    "discerns",
-    "disclike",
-    "discoids",
-    "discoing",
-    "discords",
-    "discrown",
-    "discuses",
-    "disdains",
-    "disendow",
-    "diseuses",
-    "disfavor",
-    "disfrock",
-    "disgorge",
-    "disgusts",
-    "dishelms",
-    "disherit",
-    "dishevel",
-    "dishfuls",
-    "dishiest",
-    "dishlike",
-    "dishpans",
-    "dishrags",
-    "dishware",
-    "disinter",
-    "disjects",
-    "disjoins",
-    "disjunct",
-    "disklike",
-    "disliker",
-    "dislimns",
-    "dismaler",
-    "dismally",
-    "dismasts",
-    "disobeys",
-    "disowned",
-    "disparts",
-    "dispends",
-    "dispirit",
-    "displant",
-    "displode",
-    "displume",
-    "disports",
-    "dispread",
-    "disprize",
-    "disproof",
-    "disputer",
-    "disrated",
-    "disrates",
-    "disrobed",
-    "disrober",
-    "disrobes",
-    "disroots",
-    "dissaved",
-    "dissaves",
-    "disseats",
-    "dissects",
-    "disseise",
-    "disseize",
-    "dissents",
-    "disserts",
-    "disserve",
-    "dissever",
-    "distaffs",
-    "distains",
-    "distally",
-    "distaves",
-    "distends",
-    "distichs",
-    "distills",
-    "distomes",
-    "distrain",
-    "distrait",
-    "disulfid",
-    "disunion",
-    "disunite",
-    "disunity",
-    "disusing",
-    "disvalue",
-    "disyoked",
-    "disyokes",
-    "ditchers",
-    "ditheism",
-    "ditheist",
-    "dithered",
-    "ditherer",
-    "ditsiest",
-    "dittoing",
-    "ditziest",
-    "diureses",
-    "diuresis",
-    "diurnals",
-    "divagate",
-    "divebomb",
-    "dividual",
-    "diviners",
-    "divinest",
-    "divinise",
-    "divinize",
-    "divorcee",
-    "divorcer",
-    "divulger",
-    "divulges",
-    "divulsed",
-    "divulses",
-    "divvying",
-    "dizening",
-    "dizygous",
-    "dizziest",
-    "djellaba",
-    "doblones",
-    "docilely",
-    "docility",
-    "dockages",
-    "dockhand",
-    "dockland",
-    "doctorly",
-    "doddered",
-    "dodderer",
-    "dodgiest",
-    "dodoisms",
-    "doeskins",
-    "dogbanes",
-    "dogberry",
-    "dogcarts",
-    "dogeared",
-    "dogedoms",
-    "dogeship",
-    "dogfaces",
-    "doggedly",
-    "doggerel",
-    "doggiest",
-    "doggoned",
-    "doggoner",
-    "doggones",
-    "doggrels",
-    "dognaped",
-    "dognaper",
-    "dogsbody",
-    "dogsleds",
-    "dogteeth",
-    "dogtooth",
-    "dogtrots",
-    "dogvanes",
-    "dogwatch",
-    "dogwoods",
-    "dolcetto",
-    "dolerite",
-    "dolesome",
-    "dolloped",
-    "dollying",
-    "dolmades",
-    "dolmenic",
-    "doloroso",
-    "dolorous",
-    "domelike",
-    "domicils",
-    "domineer",
-    "dominies",
-    "dominium",
-    "donative",
-    "donators",
-    "doneness",
-    "dongolas",
-    "donnered",
-    "donniker",
-    "doodlers",
-    "doodling",
-    "doofuses",
-    "doomiest",
-    "doomster",
-    "doorjamb",
-    "doorless",
-    "doornail",
-    "doorpost",
-    "doorsill",
-    "doorstop",
-    "dooryard",
-    "dopehead",
-    "dopester",
-    "dopiness",
-    "dorhawks",
-    "dorkiest",
-    "dormered",
-    "dormient",
-    "dormouse",
-    "dornecks",
-    "dornicks",
-    "dornocks",
-    "dorsally",
-    "dosseret",
-    "dotardly",
-    "dotation",
-    "dotingly",
-    "dotterel",
-    "dottiest",
-    "dottrels",
-    "doublers",
-    "doublets",
-    "doubloon",
-    "doublure",
-    "douceurs",
-    "douching",
-    "doughier",
-    "doupioni",
-    "dourines",
-    "dourness",
-    "douzeper",
-    "dovecote",
-    "dovecots",
-    "dovekeys",
-    "dovekies",
-    "dovelike",
-    "dovening",
-    "dowagers",
-    "dowdiest",
-    "dowdyish",
-    "doweling",
-    "dowelled",
-    "doweries",
-    "dowering",
-    "downbows",
-    "downcome",
-    "downhaul",
-    "downiest",
-    "downland",
-    "downless",
-    "downlike",
-    "downpipe",
-    "downspin",
-    "downtick",
-    "downtrod",
-    "downwash",
-    "downzone",
-    "dowsabel",
-    "doxology",
-    "doyennes",
-    "dozening",
-    "dozenths",
-    "doziness",
-    "drabbest",
-    "drabbets",
-    "drabbing",
-    "drabbled",
-    "drabbles",
-    "drabness",
-    "dracaena",
-    "dracenas",
-    "drachmae",
-    "drachmai",
-    "draconic",
-    "draffier",
-    "draffish",
-    "draftees",
-    "draftier",
-    "draftily",
-    "draggers",
-    "draggier",
-    "draggled",
-    "draggles",
-    "dragline",
-    "dragnets",
-    "dragoman",
-    "dragomen",
-    "dragonet",
-    "dragrope",
-    "drainers",
-    "dramming",
-    "drammock",
-    "dramshop",
-    "drapable",
-    "dratting",
-    "draughty",
-    "drawbars",
-    "drawbore",
-    "drawlers",
-    "drawlier",
-    "drawling",
-    "drawtube",
-    "drayages",
-    "dreamful",
-    "dreamier",
-    "dreamily",
-    "drearier",
-    "drearies",
-    "drearily",
-    "dredgers",
-    "dreggier",
-    "dreggish",
-    "dreidels",
-    "drencher",
-    "drenches",
-    "dressier",
-    "dressily",
-    "dribbing",
-    "dribbled",
-    "dribbler",
-    "dribbles",
-    "dribblet",
-    "driblets",
-    "driftage",
-    "driftier",
-    "driftpin",
-    "dripless",
-    "drippers",
-    "drippier",
-    "drippily",
-    "drivable",
-    "driveled",
-    "driveler",
-    "drivings",
-    "drizzles",
-    "drollery",
-    "drollest",
-    "drolling",
-    "dromonds",
-    "droolier",
-    "droopier",
-    "droopily",
-    "drophead",
-    "droppers",
-    "dropshot",
-    "dropsied",
-    "dropsies",
-    "dropwort",
-    "droseras",
-    "droskies",
-    "drossier",
-    "droughty",
-    "drouking",
-    "drownded",
-    "drowners",
-    "drowsier",
-    "drowsily",
-    "drowsing",
-    "drubbers",
-    "drubbing",
-    "drudgers",
-    "drudging",
-    "druggets",
-    "druggier",
-    "druggies",
-    "drugging",
-    "druggist",
-    "druidess",
-    "druidism",
-    "drumbled",
-    "drumbles",
-    "drumfire",
-    "drumfish",
-    "drumhead",
-    "drumlier",
-    "drumlike",
-    "drumlins",
-    "drumroll",
-    "drunkest",
-    "drupelet",
-    "druthers",
-    "drypoint",
-    "drystone",
-    "drywalls",
-    "drywells",
-    "dualisms",
-    "dualists",
-    "dualized",
-    "dualizes",
-    "dubbings",
-    "dubniums",
-    "dubonnet",
-    "duckbill",
-    "duckiest",
-    "duckpins",
-    "ducktail",
-    "duckwalk",
-    "duckweed",
-    "ductings",
-    "ductless",
-    "ductules",
-    "dudgeons",
-    "dudishly",
-    "duecento",
-    "duelists",
-    "duellers",
-    "duelling",
-    "duellist",
-    "duetting",
-    "duettist",
-    "dukedoms",
-    "dulcetly",
-    "dulciana",
-    "dulcinea",
-    "dullards",
-    "dumbcane",
-    "dumbhead",
-    "dumbness",
-    "dumfound",
-    "dummkopf",
-    "dummying",
-    "dumpcart",
-    "dumpiest",
-    "dumpings",
-    "dumpsite",
-    "duncical",
-    "duneland",
-    "dunelike",
-    "dungaree",
-    "dunghill",
-    "dungiest",
-    "dunnages",
-    "dunnites",
-    "duologue",
-    "duopsony",
-    "duotones",
-    "duperies",
-    "duplexed",
-    "duplexer",
-    "duramens",
-    "durances",
-    "durative",
-    "duresses",
-    "durmasts",
-    "durndest",
-    "durneder",
-    "duskiest",
-    "dustbins",
-    "dustheap",
-    "dustiest",
-    "dustings",
-    "dustless",
-    "dustlike",
-    "dustoffs",
-    "dustpans",
-    "dustrags",
-    "dutiable",
-    "duumviri",
-    "duumvirs",
-    "duvetine",
-    "duvetyne",
-    "duvetyns",
-    "duxelles",
-    "dwarfest",
-    "dwarfing",
-    "dwarfish",
-    "dwarfism",
-    "dweebier",
-    "dweebish",
-    "dwindles",
-    "dyarchic",
-    "dybbukim",
-    "dyestuff",
-    "dyeweeds",
-    "dyewoods",
-    "dynamist",
-    "dynatron",
-    "dysgenic",
-    "dyspepsy",
-    "dyspneal",
-    "dyspneas",
-    "dyspneic",
-    "dyspnoea",
-    "dyspnoic",
-    "dystaxia",
-    "dystocia",
-    "dystonic",
-    "dysurias",
-    "eagerest",
-    "eanlings",
-    "earaches",
-    "eardrops",
-    "eardrums",
-    "earflaps",
-    "earldoms",
-    "earlobes",
-    "earlocks",
-    "earlship",
-    "earmuffs",
-    "earnests",
-    "earshots",
-    "earstone",
-    "earthier",
-    "earthily",
-    "earthman",
-    "earthmen",
-    "earthnut",
-    "earthpea",
-    "earthset",
-    "earwaxes",
-    "earworms",
-    "eastings",
-    "eatables",
-    "ebonised",
-    "ebonises",
-    "ebonites",
-    "ebonized",
-    "ebonizes",
-    "ecaudate",
-    "ecbolics",
-    "ecdysial",
-    "ecdysone",
-    "ecdysons",
-    "ecesises",
-    "echelles",
-    "echidnae",
-    "echidnas",
-    "echinate",
-    "echinoid",
-    "echogram",
-    "echoisms",
-    "echoless",
-    "eclipser",
-    "eclipsis",
-    "eclogite",
-    "eclogues",
-    "eclosion",
-    "ecocidal",
-    "ecocides",
-    "ecofreak",
-    "econobox",
-    "ecotages",
-    "ecotonal",
-    "ecotones",
-    "ecotours",
-    "ecotypes",
-    "ecotypic",
-    "ecraseur",
-    "ectoderm",
-    "ectomere",
-    "ectopias",
-    "ectosarc",
-    "ectozoan",
-    "ectozoon",
-    "ecumenic",
-    "edacious",
-    "edentate",
-    "edgeless",
-    "edgeways",
-    "edgewise",
-    "edginess",
-    "edifices",
-    "edifiers",
-    "editress",
-    "educable",
-    "educible",
-    "eductive",
-    "eductors",
-    "eelgrass",
-    "eelpouts",
-    "eelworms",
-    "eeriness",
-    "effacers",
-    "effacing",
-    "effecter",
-    "effendis",
-    "effetely",
-    "effigial",
-    "effigies",
-    "effluvia",
-    "effluxes",
-    "effulged",
-    "effulges",
-    "effusing",
-    "effusive",
-    "eftsoons",
-    "egalites",
-    "egesting",
-    "egestion",
-    "egestive",
-    "eggfruit",
-    "eggheads",
-    "eglatere",
-    "eglomise",
-    "egoistic",
-    "egomania",
-    "egotisms",
-    "egotists",
-    "egressed",
-    "egresses",
-    "eidolons",
-    "eighthly",
-    "eightvos",
-    "einkorns",
-    "eisweins",
-    "ejective",
-    "ejectors",
-    "ekistics",
-    "ekpweles",
-    "ektexine",
-    "elaphine",
-    "elapsing",
-    "elastins",
-    "elatedly",
-    "elaterid",
-    "elaterin",
-    "elations",
-    "elatives",
-    "elbowing",
-    "electees",
-    "electros",
-    "electrum",
-    "elegancy",
-    "elegiacs",
-    "elegised",
-    "elegises",
-    "elegists",
-    "elegized",
-    "elegizes",
-    "elenchic",
-    "elenchus",
-    "elenctic",
-    "elfishly",
-    "elflocks",
-    "elicitor",
-    "elidible",
-    "eligibly",
-    "elisions",
-    "elitisms",
-    "elkhound",
-    "eloigned",
-    "eloigner",
-    "eloiners",
-    "eloining",
-    "elusions",
-    "elutions",
-    "eluviate",
-    "eluviums",
-    "elvishly",
-    "elytroid",
-    "elytrous",
-    "emaciate",
-    "emanator",
-    "embalmed",
-    "embalmer",
-    "embanked",
-    "embarred",
-    "embattle",
-    "embaying",
-    "embezzle",
-    "embitter",
-    "emblazed",
-    "emblazer",
-    "emblazes",
-    "emblazon",
-    "emblemed",
-    "embodier",
-    "embolden",
-    "embolies",
-    "emborder",
-    "embosked",
-    "embosoms",
-    "embosser",
-    "embosses",
-    "embowels",
-    "embowers",
-    "embowing",
-    "embracer",
-    "embroils",
-    "embrowns",
-    "embruing",
-    "embruted",
-    "embrutes",
-    "embryoid",
-    "embryons",
-    "emceeing",
-    "emdashes",
-    "emeerate",
-    "emendate",
-    "emenders",
-    "emending",
-    "emeritae",
-    "emeritas",
-    "emeroids",
-    "emersion",
-    "emetines",
-    "eminency",
-    "emissive",
-    "empalers",
-    "empaling",
-    "empanada",
-    "empanels",
-    "emperies",
-    "empirics",
-    "emplaced",
-    "emplaces",
-    "emplaned",
-    "emplanes",
-    "empoison",
-    "emprises",
-    "emprizes",
-    "emptiers",
-    "emptiest",
-    "emptings",
-    "empurple",
-    "empyemas",
-    "empyemic",
-    "empyreal",
-    "empyrean",
-    "emulsify",
-    "emulsive",
-    "emulsoid",
-    "enactive",
-    "enactors",
-    "enactory",
-    "enameler",
-    "enamines",
-    "enamours",
-    "enations",
-    "encaenia",
-    "encaging",
-    "encashed",
-    "encashes",
-    "encasing",
-    "enceinte",
-    "enchains",
-    "enchants",
-    "enchased",
-    "enchaser",
-    "enchases",
-    "enchoric",
-    "encipher",
-    "enclasps",
-    "enclaved",
-    "enclitic",
-    "encloser",
-    "encomium",
-    "encoring",
-    "encrusts",
-    "encyclic",
-    "encysted",
-    "endamage",
-    "endameba",
-    "endarchy",
-    "endashes",
-    "endbrain",
-    "endeared",
-    "endemial",
-    "endemics",
-    "endemism",
-    "endermic",
-    "endexine",
-    "endgames",
-    "enditing",
-    "endleafs",
-    "endocarp",
-    "endocast",
-    "endoderm",
-    "endogamy",
-    "endogens",
-    "endogeny",
-    "endopods",
-    "endorsee",
-    "endorser",
-    "endorsor",
-    "endosarc",
-    "endosmos",
-    "endosome",
-    "endostea",
-    "endowers",
-    "endowing",
-    "endozoic",
-    "endplate",
-    "endplays",
-    "endurers",
-    "energids",
-    "enervate",
-    "enfacing",
-    "enfeeble",
-    "enfeoffs",
-    "enfetter",
-    "enfevers",
-    "enfilade",
-    "enflamed",
-    "enflames",
-    "enfolded",
-    "enfolder",
-    "enframed",
-    "enframes",
-    "engagers",
-    "engilded",
-    "enginery",
-    "engining",
-    "enginous",
-    "engirded",
-    "engirdle",
-    "engorges",
-    "engrafts",
-    "engrails",
-    "engrains",
-    "engramme",
-    "engraves",
-    "enhaloed",
-    "enhaloes",
-    "enigmata",
-    "enisling",
-    "enjambed",
-    "enjoiner",
-    "enjoyers",
-    "enkindle",
-    "enlacing",
-    "enlistee",
-    "enlister",
-    "enlivens",
-    "enmeshed",
-    "enmeshes",
-    "enmities",
-    "enneadic",
-    "enneagon",
-    "ennobled",
-    "ennobler",
-    "ennobles",
-    "enolases",
-    "enophile",
-    "enosises",
-    "enounced",
-    "enounces",
-    "enplaned",
-    "enplanes",
-    "enraging",
-    "enravish",
-    "enricher",
-    "enrobers",
-    "enrobing",
-    "enroller",
-    "enrooted",
-    "ensample",
-    "ensconce",
-    "enscroll",
-    "enserfed",
-    "ensheath",
-    "enshrine",
-    "enshroud",
-    "ensiform",
-    "ensigncy",
-    "ensilage",
-    "ensiling",
-    "enskying",
-    "enslaver",
-    "enslaves",
-    "ensnared",
-    "ensnarer",
-    "ensnares",
-    "ensnarls",
-    "ensorcel",
-    "ensouled",
-    "ensphere",
-    "ensurers",
-    "enswathe",
-    "entailer",
-    "entameba",
-    "entangle",
-    "entasias",
-    "entastic",
-    "entellus",
-    "ententes",
-    "enterers",
-    "enterics",
-    "enterons",
-    "enthetic",
-    "enthrall",
-    "enthrals",
-    "enthrone",
-    "enthuses",
-    "enticers",
-    "entoderm",
-    "entoiled",
-    "entozoal",
-    "entozoan",
-    "entozoic",
-    "entozoon",
-    "entrains",
-    "entreats",
-    "entreaty",
-    "entrench",
-    "entrepot",
-    "entresol",
-    "entrusts",
-    "entwines",
-    "entwists",
-    "enureses",
-    "enuresis",
-    "enuretic",
-    "envelops",
-    "envenoms",
-    "enviably",
-    "enwheels",
-    "enwombed",
-    "enzootic",
-    "eobionts",
-    "eohippus",
-    "eolipile",
-    "eolithic",
-    "eolopile",
-    "epaulets",
-    "epazotes",
-    "epeeists",
-    "ependyma",
-    "epergnes",
-    "ephedras",
-    "ephedrin",
-    "ephorate",
-    "epiblast",
-    "epibolic",
-    "epically",
-    "epicalyx",
-    "epicarps",
-    "epicedia",
-    "epicenes",
-    "epiclike",
-    "epicotyl",
-    "epicures",
-    "epicycle",
-    "epiderms",
-    "epidotes",
-    "epidotic",
-    "epifauna",
-    "epifocal",
-    "epigenic",
-    "epigeous",
-    "epigones",
-    "epigonic",
-    "epigonus",
-    "epigrams",
-    "epigraph",
-    "epilated",
-    "epilates",
-    "epimeres",
-    "epimeric",
-    "epimysia",
-    "epinasty",
-    "epiphyte",
-    "episcias",
-    "episcope",
-    "episomal",
-    "episomes",
-    "epistasy",
-    "epistler",
-    "epistome",
-    "epistyle",
-    "epitaphs",
-    "epitases",
-    "epitasis",
-    "epitaxic",
-    "epitomes",
-    "epitomic",
-    "epizoism",
-    "epizoite",
-    "epizooty",
-    "eponymic",
-    "epopoeia",
-    "epoxides",
-    "epoxying",
-    "epsilons",
-    "equalise",
-    "equators",
-    "equinely",
-    "equinity",
-    "equipage",
-    "equipper",
-    "equiseta",
-    "equitant",
-    "equivoke",
-    "eradiate",
-    "erasions",
-    "erasures",
-    "erecters",
-    "erective",
-    "eremites",
-    "eremitic",
-    "eremurus",
-    "erepsins",
-    "erethism",
-    "erewhile",
-    "ergastic",
-    "ergative",
-    "ergotism",
-    "erigeron",
-    "eringoes",
-    "eristics",
-    "erlkings",
-    "erodable",
-    "erodible",
-    "erogenic",
-    "erosible",
-    "erosions",
-    "erotical",
-    "erotisms",
-    "erotized",
-    "erotizes",
-    "errantly",
-    "errantry",
-    "erratics",
-    "errhines",
-    "erringly",
-    "ersatzes",
-    "eructate",
-    "eructing",
-    "erumpent",
-    "eryngoes",
-    "erythron",
-    "escallop",
-    "escalope",
-    "escalops",
-    "escapees",
-    "escapers",
-    "escargot",
-    "escarole",
-    "escarped",
-    "eschalot",
-    "escheats",
-    "eschewal",
-    "eschewed",
-    "eschewer",
-    "escolars",
-    "escoting",
-    "escrowed",
-    "escuages",
-    "esculent",
-    "eserines",
-    "esophagi",
-    "espalier",
-    "espartos",
-    "espiegle",
-    "espousal",
-    "espouser",
-    "espouses",
-    "esquired",
-    "esquires",
-    "essayers",
-    "essaying",
-    "essonite",
-    "estating",
-    "esterify",
-    "estheses",
-    "esthesia",
-    "esthesis",
-    "esthetes",
-    "estivate",
-    "estopped",
-    "estovers",
-    "estragon",
-    "estrange",
-    "estrayed",
-    "estreats",
-    "estriols",
-    "estrones",
-    "estruses",
-    "esurient",
-    "etageres",
-    "etamines",
-    "etatisms",
-    "etchants",
-    "eternals",
-    "eternise",
-    "eternize",
-    "etesians",
-    "ethanols",
-    "ethephon",
-    "etherify",
-    "etherish",
-    "etherize",
-    "ethicals",
-    "ethician",
-    "ethicize",
-    "ethinyls",
-    "ethmoids",
-    "ethnarch",
-    "ethnical",
-    "ethnonym",
-    "ethnoses",
-    "ethogram",
-    "ethoxies",
-    "ethoxyls",
-    "ethylate",
-    "ethynyls",
-    "etiolate",
-    "etouffee",
-    "eucaines",
-    "eucalypt",
-    "eucharis",
-    "euchring",
-    "euclases",
-    "eucrites",
-    "eucritic",
-    "eudaemon",
-    "eudaimon",
-    "eudemons",
-    "eugenias",
-    "eugenist",
-    "eugenols",
-    "euglenas",
-    "euglenid",
-    "eulachan",
-    "eulachon",
-    "eulogiae",
-    "eulogias",
-    "eulogies",
-    "eulogise",
-    "eulogist",
-    "eulogium",
-    "eulogize",
-    "euonymus",
-    "eupatrid",
-    "eupepsia",
-    "eupeptic",
-    "euphenic",
-    "euphonic",
-    "euphotic",
-    "euphrasy",
-    "euphroes",
-    "euphuism",
-    "euphuist",
-    "euploids",
-    "euploidy",
-    "eupnoeas",
-    "eupnoeic",
-    "eurokies",
-    "eurokous",
-    "europium",
-    "eurybath",
-    "eurythmy",
-    "eusocial",
-    "eustatic",
-    "eusteles",
-    "eutaxies",
-    "eutectic",
-    "eutrophy",
-    "euxenite",
-    "evacuant",
-    "evadable",
-    "evadible",
-    "evanesce",
-    "evangels",
-    "evasions",
-    "evection",
-    "evenfall",
-    "evenness",
-    "evensong",
-    "eversion",
-    "everting",
-    "evertors",
-    "everymen",
-    "everyway",
-    "evictees",
-    "evicting",
-    "evictors",
-    "evildoer",
-    "evillest",
-    "evilness",
-    "evincing",
-    "evincive",
-    "evitable",
-    "evocable",
-    "evocator",
-    "evolutes",
-    "evolvers",
-    "evonymus",
-    "evulsing",
-    "evulsion",
-    "exabytes",
-    "exacters",
-    "exactest",
-    "exaction",
-    "exactors",
-    "exahertz",
-    "exalters",
-    "exalting",
-    "examinee",
-    "exampled",
-    "exanthem",
-    "exaptive",
-    "exarchal",
-    "exceeder",
-    "excessed",
-    "exciding",
-    "excimers",
-    "exciples",
-    "excising",
-    "excitant",
-    "exciters",
-    "excitons",
-    "excitors",
-    "exclaves",
-    "excluder",
-    "excretal",
-    "excreter",
-    "excretes",
-    "excursus",
-    "excusers",
-    "execrate",
-    "executer",
-    "exegeses",
-    "exegetes",
-    "exegetic",
-    "exemplum",
-    "exequial",
-    "exequies",
-    "exergual",
-    "exergues",
-    "exertive",
-    "exhalant",
-    "exhalent",
-    "exhaling",
-    "exhedrae",
-    "exhorter",
-    "exhumers",
-    "exhuming",
-    "exigence",
-    "exigency",
-    "exigible",
-    "exiguity",
-    "exiguous",
-    "exilable",
-    "eximious",
-    "exitless",
-    "exocarps",
-    "exocrine",
-    "exocytic",
-    "exoderms",
-    "exoduses",
-    "exoergic",
-    "exogamic",
-    "exonumia",
-    "exorable",
-    "exorcise",
-    "exorcize",
-    "exordial",
-    "exordium",
-    "exosmose",
-    "exospore",
-    "exoteric",
-    "exotisms",
-    "exotoxic",
-    "exotoxin",
-    "expandor",
-    "expecter",
-    "expellee",
-    "expeller",
-    "expender",
-    "experted",
-    "expiable",
-    "expiated",
-    "expiates",
-    "expiator",
-    "expirers",
-    "expiries",
-    "explants",
-    "exploder",
-    "exposals",
-    "exposers",
-    "exposits",
-    "expounds",
-    "expulsed",
-    "expulses",
-    "expunger",
-    "expunges",
-    "exscinds",
-    "exsecant",
-    "exsected",
-    "exserted",
-    "externes",
-    "extincts",
-    "extolled",
-    "extoller",
-    "extorted",
-    "extorter",
-    "extrados",
-    "extremer",
-    "extremum",
-    "extrorse",
-    "extrudes",
-    "extubate",
-    "exudates",
-    "exultant",
-    "exulting",
-    "exurbias",
-    "exuviate",
-    "eyebeams",
-    "eyeblack",
-    "eyeblink",
-    "eyebolts",
-    "eyedness",
-    "eyedrops",
-    "eyefolds",
-    "eyeholes",
-    "eyehooks",
-    "eyelifts",
-    "eyepoint",
-    "eyeshade",
-    "eyeshine",
-    "eyeshots",
-    "eyesores",
-    "eyespots",
-    "eyestalk",
-    "eyestone",
-    "eyeteeth",
-    "eyetooth",
-    "eyewater",
-    "eyewinks",
-    "fabliaux",
-    "fabulate",
-    "fabulist",
-    "faceable",
-    "facedown",
-    "facemask",
-    "facetely",
-    "facetiae",
-    "faceting",
-    "facetted",
-    "facially",
-    "faciends",
-    "facilely",
-    "factious",
-    "factotum",
-    "factures",
-    "faddiest",
-    "faddisms",
-    "faddists",
-    "fadeless",
-    "fadeouts",
-    "faggiest",
-    "faggoted",
-    "faggotry",
-    "fagoters",
-    "fagoting",
-    "fahlband",
-    "faiences",
-    "faineant",
-    "fainters",
-    "faintish",
-    "fairgoer",
-    "fairings",
-    "fairlead",
-    "fairyism",
-    "faithing",
-    "faitours",
-    "fakeries",
-    "falafels",
-    "falbalas",
-    "falcated",
-    "falchion",
-    "falconet",
-    "falderal",
-    "falderol",
-    "fallaway",
-    "fallfish",
-    "fallibly",
-    "falloffs",
-    "fallouts",
-    "fallowed",
-    "faltboat",
-    "falterer",
-    "fameless",
-    "familism",
-    "famished",
-    "famishes",
-    "fanciest",
-    "fancying",
-    "fanegada",
-    "fanfares",
-    "fanfaron",
-    "fanfolds",
-    "fangless",
-    "fanglike",
-    "fanlight",
-    "fantails",
-    "fantasms",
-    "fantasts",
-    "fanworts",
-    "faradaic",
-    "faradays",
-    "faradise",
-    "faradism",
-    "faradize",
-    "farceurs",
-    "farfalle",
-    "farinhas",
-    "farinose",
-    "farmable",
-    "farmhand",
-    "farmings",
-    "farmwife",
-    "farmwork",
-    "farnesol",
-    "farolito",
-    "farouche",
-    "farriers",
-    "farriery",
-    "farrowed",
-    "farsides",
-    "fartleks",
-    "fasciate",
-    "fascicle",
-    "fascines",
-    "fascisms",
-    "fascitis",
-    "fashious",
-    "fastings",
-    "fastness",
-    "fastuous",
-    "fatalist",
-    "fatbacks",
-    "fatbirds",
-    "fatheads",
-    "fatherly",
-    "fathomed",
-    "fathomer",
-    "fatlings",
-    "fatstock",
-    "fattened",
-    "fattener",
-    "fattiest",
-    "fatwoods",
-    "faultier",
-    "faultily",
-    "faunally",
-    "faunlike",
-    "fauteuil",
-    "fauvisms",
-    "fauvists",
-    "favellas",
-    "favonian",
-    "favorers",
-    "favourer",
-    "fawniest",
-    "fawnlike",
-    "fayalite",
-    "fazendas",
-    "fealties",
-    "feasance",
-    "feasibly",
-    "feasters",
-    "feastful",
-    "featlier",
-    "febrific",
-    "feckless",
-    "feculent",
-    "fedayeen",
-    "federacy",
-    "federals",
-    "federate",
-    "fedexing",
-    "feeblest",
-    "feeblish",
-    "feedable",
-    "feedbags",
-    "feedhole",
-    "feedyard",
-    "feetless",
-    "feigners",
-    "feigning",
-    "feinting",
-    "feistier",
-    "feistily",
-    "felafels",
-    "feldsher",
-    "felinely",
-    "felinity",
-    "fellable",
-    "fellahin",
-    "fellated",
-    "fellates",
-    "fellator",
-    "fellness",
-    "fellowed",
-    "fellowly",
-    "felsites",
-    "felsitic",
-    "felspars",
-    "felstone",
-    "feltings",
-    "feltlike",
-    "feluccas",
-    "felworts",
-    "feminacy",
-    "feminazi",
-    "feminise",
-    "feminity",
-    "feminize",
-    "fenagled",
-    "fenagles",
-    "fencerow",
-    "fencible",
-    "fencings",
-    "fendered",
-    "fenestra",
-    "fenlands",
-    "fenniest",
-    "fenthion",
-    "fenurons",
-    "feoffees",
-    "feoffers",
-    "feoffing",
-    "feoffors",
-    "feracity",
-    "feretory",
-    "ferities",
-    "fermatas",
-    "ferments",
-    "fermiums",
-    "ferniest",
-    "ferninst",
-    "fernless",
-    "fernlike",
-    "ferrates",
-    "ferreled",
-    "ferreous",
-    "ferreted",
-    "ferreter",
-    "ferriage",
-    "ferrites",
-    "ferritic",
-    "ferruled",
-    "ferrying",
-    "ferryman",
-    "ferrymen",
-    "feruling",
-    "fervency",
-    "fervidly",
-    "fervours",
-    "fesswise",
-    "festally",
-    "festered",
-    "festoons",
-    "fetation",
-    "fetchers",
-    "feterita",
-    "fetiales",
-    "fetialis",
-    "fetiches",
-    "feticide",
-    "fetidity",
-    "fetlocks",
-    "fetology",
-    "fettered",
-    "fetterer",
-    "fettling",
-    "feudally",
-    "feudists",
-    "fevering",
-    "feverous",
-    "fewtrils",
-    "fiancees",
-    "fiascoes",
-    "fiberize",
-    "fibranne",
-    "fibrilla",
-    "fibroins",
-    "fibromas",
-    "fibroses",
-    "fibrotic",
-    "fibsters",
-    "ficklest",
-    "fideisms",
-    "fideists",
-    "fidgeted",
-    "fidgeter",
-    "fiefdoms",
-    "fielders",
-    "fieriest",
-    "fifteens",
-    "fiftyish",
-    "figeater",
-    "figments",
-    "figuline",
-    "figurant",
-    "figurate",
-    "figurers",
-    "figworts",
-    "filagree",
-    "filarees",
-    "filariae",
-    "filarial",
-    "filarian",
-    "filariid",
-    "filature",
-    "filberts",
-    "filchers",
-    "filching",
-    "fileable",
-    "filefish",
-    "fileting",
-    "filially",
-    "filiated",
-    "filiates",
-    "filibegs",
-    "filicide",
-    "filiform",
-    "filister",
-    "filleted",
-    "filliped",
-    "filmable",
-    "filmcard",
-    "filmdoms",
-    "filmgoer",
-    "filmiest",
-    "filmland",
-    "filmless",
-    "filmlike",
-    "filmsets",
-    "filterer",
-    "filthier",
-    "filthily",
-    "fimbriae",
-    "fimbrial",
-    "finagled",
-    "finagler",
-    "finagles",
-    "finalism",
-    "finbacks",
-    "findable",
-    "fineable",
-    "fineries",
-    "finespun",
-    "finessed",
-    "finesses",
-    "finfoots",
-    "fingerer",
-    "finialed",
-    "finickin",
-    "finiking",
-    "finitude",
-    "finmarks",
-    "finnicky",
-    "finniest",
-    "finnmark",
-    "finochio",
-    "fireable",
-    "fireback",
-    "firebase",
-    "fireboat",
-    "firebomb",
-    "firebrat",
-    "firebugs",
-    "fireclay",
-    "firedamp",
-    "firedogs",
-    "firefang",
-    "firehall",
-    "fireless",
-    "firelock",
-    "firepans",
-    "firepink",
-    "fireplug",
-    "firepots",
-    "fireroom",
-    "fireship",
-    "firetrap",
-    "fireweed",
-    "fireworm",
-    "firriest",
-    "fishable",
-    "fishbolt",
-    "fisheyes",
-    "fishgigs",
-    "fishhook",
-    "fishiest",
-    "fishings",
-    "fishless",
-    "fishlike",
-    "fishline",
-    "fishmeal",
-    "fishpole",
-    "fishtail",
-    "fishways",
-    "fishwife",
-    "fishworm",
-    "fissions",
-    "fissiped",
-    "fissural",
-    "fissured",
-    "fistfuls",
-    "fistnote",
-    "fistulae",
-    "fistular",
-    "fistulas",
-    "fitchets",
-    "fitchews",
-    "fitfully",
-    "fitments",
-    "fittable",
-    "fivefold",
-    "fivepins",
-    "fixatifs",
-    "fixating",
-    "fixities",
-    "fizziest",
-    "fizzling",
-    "flabbier",
-    "flabbily",
-    "flabella",
-    "flackery",
-    "flacking",
-    "flaggers",
-    "flaggier",
-    "flagless",
-    "flakiest",
-    "flambeed",
-    "flameout",
-    "flamiest",
-    "flamines",
-    "flamming",
-    "flancard",
-    "flanerie",
-    "flaneurs",
-    "flangers",
-    "flanging",
-    "flankers",
-    "flannels",
-    "flaperon",
-    "flapjack",
-    "flapless",
-    "flappers",
-    "flappier",
-    "flareups",
-    "flashgun",
-    "flashier",
-    "flashily",
-    "flaskets",
-    "flatbeds",
-    "flatboat",
-    "flatcaps",
-    "flatcars",
-    "flatfeet",
-    "flatfish",
-    "flatfoot",
-    "flatlets",
-    "flatling",
-    "flatlong",
-    "flattens",
-    "flatters",
-    "flattest",
-    "flatting",
-    "flattish",
-    "flattops",
-    "flatuses",
-    "flatwash",
-    "flatways",
-    "flatwise",
-    "flatwork",
-    "flatworm",
-    "flaunted",
-    "flaunter",
-    "flautist",
-    "flavanol",
-    "flavines",
-    "flavones",
-    "flavonol",
-    "flavorer",
-    "flavoury",
-    "flawiest",
-    "flaxiest",
-    "fleabags",
-    "fleabane",
-    "fleabite",
-    "fleapits",
-    "fleawort",
-    "flecking",
-    "flection",
-    "fledgier",
-    "fledging",
-    "fleecers",
-    "fleeched",
-    "fleeches",
-    "fleecier",
-    "fleecily",
-    "fleecing",
-    "fleering",
-    "fleetest",
-    "flehmens",
-    "fleishig",
-    "flenched",
-    "flenches",
-    "flensers",
-    "flensing",
-    "fleshers",
-    "fleshier",
-    "fleshily",
-    "fleshing",
-    "fleshpot",
-    "fletched",
-    "fletches",
-    "fleurons",
-    "flexagon",
-    "flexions",
-    "flextime",
-    "flexuose",
-    "flexuous",
-    "flexures",
-    "flichter",
-    "flickery",
-    "flighted",
-    "flimflam",
-    "flimsier",
-    "flimsies",
-    "flimsily",
-    "flinched",
-    "flincher",
-    "flinches",
-    "flingers",
-    "flinkite",
-    "flintier",
-    "flintily",
-    "flinting",
-    "flipflop",
-    "flippest",
-    "flirters",
-    "flirtier",
-    "flitched",
-    "flitches",
-    "flitters",
-    "flitting",
-    "flivvers",
-    "floatage",
-    "floatels",
-    "floatier",
-    "floccing",
-    "floccose",
-    "floccule",
-    "flocculi",
-    "flockier",
-    "floggers",
-    "flokatis",
-    "flooders",
-    "floorage",
-    "floorers",
-    "floosies",
-    "floozies",
-    "flopover",
-    "floppers",
-    "floppier",
-    "floppily",
-    "florally",
-    "floridly",
-    "florigen",
-    "floruits",
-    "flossers",
-    "flossier",
-    "flossies",
-    "flossily",
-    "flotages",
-    "flotsams",
-    "flounced",
-    "flounces",
-    "flouring",
-    "flouters",
-    "flouting",
-    "flowages",
-    "flowerer",
-    "floweret",
-    "flubbers",
-    "flubbing",
-    "flubdubs",
-    "fluerics",
-    "fluffers",
-    "fluffier",
-    "fluffily",
-    "fluffing",
-    "fluidics",
-    "fluidise",
-    "fluidize",
-    "fluidram",
-    "flukiest",
-    "flummery",
-    "flumping",
-    "flunkers",
-    "flunkeys",
-    "flunkies",
-    "flunking",
-    "fluorene",
-    "fluorids",
-    "fluorins",
-    "flurried",
-    "flushers",
-    "flushest",
-    "flusters",
-    "flutiest",
-    "flutings",
-    "flutists",
-    "flutters",
-    "fluttery",
-    "fluxgate",
-    "fluxions",
-    "flyaways",
-    "flybelts",
-    "flyblown",
-    "flyblows",
-    "flyboats",
-    "flyovers",
-    "flypaper",
-    "flypasts",
-    "flysches",
-    "flysheet",
-    "flyspeck",
-    "flytiers",
-    "flytings",
-    "flytraps",
-    "foamable",
-    "foamiest",
-    "foamless",
-    "foamlike",
-    "focalise",
-    "focalize",
-    "focusers",
-    "foddered",
-    "foetuses",
-    "fogbound",
-    "fogeyish",
-    "fogeyism",
-    "fogfruit",
-    "foggages",
-    "foggiest",
-    "foghorns",
-    "fogyisms",
-    "foilable",
-    "foilsman",
-    "foilsmen",
-    "foisting",
-    "folacins",
-    "foldaway",
-    "foldboat",
-    "folderol",
-    "foldouts",
-    "foliaged",
-    "foliages",
-    "foliated",
-    "foliates",
-    "folioing",
-    "folkiest",
-    "folklike",
-    "folkmoot",
-    "folkmote",
-    "folkmots",
-    "folksier",
-    "folksily",
-    "folksong",
-    "fomented",
-    "fomenter",
-    "fondants",
-    "fondlers",
-    "fonduing",
-    "fontanel",
-    "fontinas",
-    "foodless",
-    "foodways",
-    "foofaraw",
-    "foolfish",
-    "foolscap",
-    "footages",
-    "footbags",
-    "footbath",
-    "footboys",
-    "footfall",
-    "footgear",
-    "footiest",
-    "footlers",
-    "footless",
-    "footlike",
-    "footling",
-    "footmark",
-    "footpace",
-    "footpads",
-    "footrace",
-    "footrope",
-    "footsies",
-    "footslog",
-    "footsore",
-    "footstep",
-    "footwall",
-    "footways",
-    "footworn",
-    "foozlers",
-    "foozling",
-    "foragers",
-    "foramens",
-    "foramina",
-    "forayers",
-    "foraying",
-    "forbears",
-    "forbidal",
-    "forboded",
-    "forbodes",
-    "forborne",
-    "forcedly",
-    "forcipes",
-    "fordable",
-    "fordless",
-    "fordoing",
-    "forebays",
-    "forebear",
-    "forebode",
-    "forebody",
-    "foreboom",
-    "foredate",
-    "foredeck",
-    "foredoes",
-    "foredone",
-    "foredoom",
-    "foreface",
-    "forefeel",
-    "forefeet",
-    "forefelt",
-    "forefend",
-    "foregoer",
-    "foregoes",
-    "foreguts",
-    "forehoof",
-    "foreknew",
-    "foreknow",
-    "forelady",
-    "foreland",
-    "forelegs",
-    "forelimb",
-    "forelock",
-    "foremast",
-    "foremilk",
-    "forenoon",
-    "forepart",
-    "forepast",
-    "forepaws",
-    "forepeak",
-    "forerank",
-    "foreruns",
-    "foresaid",
-    "foresail",
-    "foreseer",
-    "foreshow",
-    "foreside",
-    "forestal",
-    "forestay",
-    "foretime",
-    "foretops",
-    "forevers",
-    "forewarn",
-    "forewent",
-    "forewing",
-    "foreworn",
-    "foreyard",
-    "forfends",
-    "forgiver",
-    "forgoers",
-    "forgoing",
-    "forjudge",
-    "forkball",
-    "forkedly",
-    "forkfuls",
-    "forkiest",
-    "forkless",
-    "forklike",
-    "forksful",
-    "formable",
-    "formably",
-    "formants",
-    "formates",
-    "formicas",
-    "fornical",
-    "fornices",
-    "forrader",
-    "forsaker",
-    "forsakes",
-    "forspent",
-    "forswear",
-    "forswore",
-    "forsworn",
-    "fortuity",
-    "fortuned",
-    "fortyish",
-    "forzandi",
-    "forzando",
-    "fossette",
-    "fossicks",
-    "fosterer",
-    "fouettes",
-    "foughten",
-    "foulards",
-    "foulings",
-    "foulness",
-    "fourchee",
-    "foureyed",
-    "fourgons",
-    "fourplex",
-    "foveated",
-    "foveolae",
-    "foveolar",
-    "foveolas",
-    "foveoles",
-    "foveolet",
-    "fowlings",
-    "foxfires",
-    "foxhunts",
-    "foxiness",
-    "foxskins",
-    "foxtails",
-    "foxtrots",
-    "foziness",
-    "frabjous",
-    "fracases",
-    "fracturs",
-    "fraenums",
-    "fragging",
-    "frailest",
-    "frakturs",
-    "framable",
-    "framings",
-    "francium",
-    "francize",
-    "frankers",
-    "frankest",
-    "frapping",
-    "fraughts",
-    "fraulein",
-    "frayings",
-    "frazzles",
-    "freakier",
-    "freakily",
-    "freakout",
-    "freebase",
-    "freebees",
-    "freeboot",
-    "freeload",
-    "freeness",
-    "freesias",
-    "freights",
-    "fremitus",
-    "frenched",
-    "frenches",
-    "frenular",
-    "frenulum",
-    "frenzies",
-    "frenzily",
-    "frescoed",
-    "frescoer",
-    "freshens",
-    "freshets",
-    "freshing",
-    "fresnels",
-    "fretsaws",
-    "fretsome",
-    "fretters",
-    "frettier",
-    "fretwork",
-    "friaries",
-    "fribbled",
-    "fribbler",
-    "fribbles",
-    "fricando",
-    "friended",
-    "frigging",
-    "frighted",
-    "frigidly",
-    "frijoles",
-    "frillers",
-    "frillier",
-    "frilling",
-    "fringier",
-    "frippery",
-    "frisette",
-    "friseurs",
-    "friskers",
-    "friskets",
-    "friskier",
-    "friskily",
-    "frisking",
-    "frissons",
-    "frittata",
-    "fritting",
-    "frivoled",
-    "frivoler",
-    "frizette",
-    "frizzers",
-    "frizzier",
-    "frizzies",
-    "frizzily",
-    "frizzing",
-    "frizzled",
-    "frizzler",
-    "frizzles",
-    "frocking",
-    "frogeyed",
-    "frogeyes",
-    "frogfish",
-    "froggier",
-    "frogging",
-    "froglets",
-    "froglike",
-    "frolicky",
-    "fromages",
-    "fromenty",
-    "frondeur",
-    "frondose",
-    "frontals",
-    "frontlet",
-    "frontmen",
-    "frontons",
-    "frostbit",
-    "frosteds",
-    "frostier",
-    "frostily",
-    "frostnip",
-    "frothers",
-    "frothier",
-    "frothily",
-    "frottage",
-    "frotteur",
-    "froufrou",
-    "frounced",
-    "frounces",
-    "frouzier",
-    "frowners",
-    "frowsier",
-    "frowsted",
-    "frowzier",
-    "frowzily",
-    "frozenly",
-    "fructify",
-    "frugally",
-    "frugging",
-    "fruitage",
-    "fruiters",
-    "fruitier",
-    "fruitily",
-    "fruitlet",
-    "frumenty",
-    "frumpier",
-    "frumpily",
-    "frumpish",
-    "frustule",
-    "frustums",
-    "frybread",
-    "fubsiest",
-    "fuchsias",
-    "fuchsine",
-    "fuchsins",
-    "fuckoffs",
-    "fucoidal",
-    "fuddling",
-    "fuehrers",
-    "fuellers",
-    "fugacity",
-    "fuggiest",
-    "fugleman",
-    "fuglemen",
-    "fuguists",
-    "fulcrums",
-    "fullered",
-    "fullface",
-    "fulmined",
-    "fulmines",
-    "fulminic",
-    "fumarase",
-    "fumarole",
-    "fumatory",
-    "fumblers",
-    "fumeless",
-    "fumelike",
-    "fumettes",
-    "fumigant",
-    "fumigate",
-    "fumingly",
-    "fumitory",
-    "funereal",
-    "funfairs",
-    "funfests",
-    "fungible",
-    "fungoids",
-    "funguses",
-    "funicles",
-    "funiculi",
-    "funkiest",
-    "funnyman",
-    "funnymen",
-    "furanose",
-    "furbelow",
-    "furcated",
-    "furcates",
-    "furcraea",
-    "furculae",
-    "furcular",
-    "furculum",
-    "furfural",
-    "furfuran",
-    "furfures",
-    "furibund",
-    "furlable",
-    "furmenty",
-    "furnaced",
-    "furriers",
-    "furriery",
-    "furriest",
-    "furriner",
-    "furrings",
-    "furrower",
-    "furuncle",
-    "furziest",
-    "fuseless",
-    "fuselike",
-    "fusiform",
-    "fusileer",
-    "fusilier",
-    "fusillis",
-    "fusional",
-    "fussiest",
-    "fusspots",
-    "fustians",
-    "fustiest",
-    "futharcs",
-    "futharks",
-    "futhorcs",
-    "futhorks",
-    "futilely",
-    "futtocks",
-    "fuzziest",
-    "fuzztone",
-    "gabbards",
-    "gabbarts",
-    "gabbiest",
-    "gabblers",
-    "gabbling",
-    "gabbroic",
-    "gabbroid",
-    "gabelled",
-    "gabelles",
-    "gabfests",
-    "gadabout",
-    "gadarene",
-    "gadflies",
-    "gadroons",
-    "gadwalls",
-    "gadzooks",
-    "gaggling",
-    "gagsters",
-    "gahnites",
-    "gaieties",
-    "gainable",
-    "gainless",
-    "gainlier",
-    "gainsaid",
-    "gainsays",
-    "galabias",
-    "galabieh",
-    "galabiya",
-    "galangal",
-    "galangas",
-    "galateas",
-    "galavant",
-    "galbanum",
-    "galeated",
-    "galenite",
-    "galettes",
-    "galilees",
-    "galipots",
-    "galivant",
-    "gallants",
-    "gallates",
-    "galleass",
-    "galleins",
-    "galleons",
-    "galletas",
-    "galleted",
-    "galliard",
-    "galliass",
-    "gallican",
-    "gallicas",
-    "galliots",
-    "gallipot",
-    "galliums",
-    "gallnuts",
-    "galloons",
-    "galloots",
-    "galloped",
-    "galloper",
-    "gallused",
-    "galluses",
-    "gallying",
-    "galopade",
-    "galoping",
-    "galoshed",
-    "galoshes",
-    "galumphs",
-    "gamashes",
-    "gambades",
-    "gambados",
-    "gambeson",
-    "gambiers",
-    "gamboges",
-    "gamboled",
-    "gambrels",
-    "gambusia",
-    "gamelans",
-    "gamelike",
-    "gameness",
-    "gamesman",
-    "gamesmen",
-    "gamesome",
-    "gamester",
-    "gaminess",
-    "gammadia",
-    "gammiest",
-    "gammoned",
-    "gammoner",
-    "gamodeme",
-    "ganaches",
-    "gandered",
-    "ganglial",
-    "gangliar",
-    "ganglier",
-    "gangling",
-    "gangplow",
-    "gangrels",
-    "gangstas",
-    "gangways",
-    "ganister",
-    "gantlets",
-    "gantline",
-    "gantlope",
-    "gantries",
-    "gapeseed",
-    "gapeworm",
-    "gapingly",
-    "gappiest",
-    "garaging",
-    "garbages",
-    "garbagey",
-    "garbanzo",
-    "garblers",
-    "garbless",
-    "garbling",
-    "garboard",
-    "garboils",
-    "gardened",
-    "gardyloo",
-    "garganey",
-    "garglers",
-    "gargling",
-    "garigues",
-    "garishly",
-    "garlicky",
-    "garoting",
-    "garotted",
-    "garotter",
-    "garottes",
-    "garpikes",
-    "garreted",
-    "garroted",
-    "garroter",
-    "garrotes",
-    "garrotte",
-    "gartered",
-    "gasalier",
-    "gaselier",
-    "gashouse",
-    "gasified",
-    "gasifier",
-    "gasifies",
-    "gasiform",
-    "gaskings",
-    "gasogene",
-    "gasohols",
-    "gasolene",
-    "gasolier",
-    "gassiest",
-    "gassings",
-    "gastight",
-    "gastness",
-    "gastraea",
-    "gastreas",
-    "gastrins",
-    "gastrula",
-    "gasworks",
-    "gateless",
-    "gatelike",
-    "gatepost",
-    "gauchely",
-    "gauchest",
-    "gaudiest",
-    "gauffers",
-    "gauntest",
-    "gauziest",
-    "gaveling",
-    "gavelled",
-    "gavelock",
-    "gavotted",
-    "gavottes",
-    "gawkiest",
-    "gayeties",
-    "gaywings",
-    "gazaboes",
-    "gazanias",
-    "gazeboes",
-    "gazelles",
-    "gazettes",
-    "gazogene",
-    "gazumped",
-    "gazumper",
-    "gearcase",
-    "gearings",
-    "gearless",
-    "geekdoms",
-    "geekiest",
-    "geepound",
-    "gelating",
-    "gelatins",
-    "gelation",
-    "geldings",
-    "gelidity",
-    "gellants",
-    "gelsemia",
-    "gematria",
-    "geminate",
-    "gemmated",
-    "gemmates",
-    "gemmiest",
-    "gemmules",
-    "gemology",
-    "gemsboks",
-    "gemsbuck",
-    "genettes",
-    "genially",
-    "genipaps",
-    "genitors",
-    "geniture",
-    "gennaker",
-    "genogram",
-    "genoises",
-    "gensengs",
-    "gentians",
-    "gentlest",
-    "gentling",
-    "gentrice",
-    "gentries",
-    "gentrify",
-    "geoducks",
-    "geognosy",
-    "geologer",
-    "geomancy",
-    "geometer",
-    "geophagy",
-    "geophone",
-    "geophyte",
-    "geoponic",
-    "geoprobe",
-    "georgics",
-    "geotaxes",
-    "geotaxis",
-    "geranial",
-    "geraniol",
-    "gerardia",
-    "gerbille",
-    "gerenuks",
-    "germfree",
-    "germiest",
-    "germlike",
-    "gerontic",
-    "gesneria",
-    "gestalts",
-    "gestapos",
-    "gestated",
-    "gestates",
-    "gestical",
-    "gestural",
-    "gesturer",
-    "gettable",
-    "gettered",
-    "gewgawed",
-    "gharials",
-    "gharries",
-    "ghastful",
-    "gheraoed",
-    "gheraoes",
-    "gherkins",
-    "ghettoed",
-    "ghettoes",
-    "ghillies",
-    "ghostier",
-    "ghoulies",
-    "giantism",
-    "giardias",
-    "gibbered",
-    "gibbeted",
-    "gibbsite",
-    "gibingly",
-    "giddiest",
-    "giddying",
-    "giftable",
-    "giftedly",
-    "giftless",
-    "gigabits",
-    "gigaflop",
-    "gigatons",
-    "gigawatt",
-    "gigglers",
-    "gigglier",
-    "gilberts",
-    "gildhall",
-    "gildings",
-    "gillnets",
-    "gillying",
-    "gilthead",
-    "gimbaled",
-    "gimcrack",
-    "gimleted",
-    "gimmicky",
-    "gimpiest",
-    "gingalls",
-    "gingeley",
-    "gingelis",
-    "gingelli",
-    "gingelly",
-    "gingered",
-    "ginghams",
-    "gingilis",
-    "gingilli",
-    "gingivae",
-    "gingkoes",
-    "ginkgoes",
-    "ginniest",
-    "ginnings",
-    "ginsengs",
-    "gipsying",
-    "girasole",
-    "girasols",
-    "girdlers",
-    "girdling",
-    "girlhood",
-    "girliest",
-    "girolles",
-    "girosols",
-    "girthing",
-    "gisarmes",
-    "gitterns",
-    "giveable",
-    "giveback",
-    "gizzards",
-    "gjetosts",
-    "glabella",
-    "glabrate",
-    "glaceing",
-    "glaciate",
-    "glacises",
-    "gladdens",
-    "gladdest",
-    "gladding",
-    "gladiate",
-    "gladiest",
-    "gladiola",
-    "gladioli",
-    "gladlier",
-    "gladsome",
-    "glairier",
-    "glairing",
-    "glamours",
-    "glancers",
-    "glanders",
-    "glandule",
-    "glariest",
-    "glassful",
-    "glassier",
-    "glassies",
-    "glassily",
-    "glassine",
-    "glassing",
-    "glassmen",
-    "glaucous",
-    "glaziery",
-    "glaziest",
-    "glazings",
-    "gleamers",
-    "gleamier",
-    "gleaners",
-    "gleaning",
-    "gleeking",
-    "gleesome",
-    "gleetier",
-    "gleeting",
-    "glegness",
-    "glenlike",
-    "gleyings",
-    "gliadine",
-    "gliadins",
-    "glibbest",
-    "glibness",
-    "glimmers",
-    "glimpser",
-    "glintier",
-    "glinting",
-    "gliomata",
-    "glissade",
-    "glistens",
-    "glisters",
-    "glitzier",
-    "glitzing",
-    "gloaming",
-    "gloaters",
-    "globated",
-    "globbier",
-    "globoids",
-    "globules",
-    "glochids",
-    "glomming",
-    "glonoins",
-    "gloomful",
-    "gloomier",
-    "gloomily",
-    "glooming",
-    "gloppier",
-    "glopping",
-    "gloriole",
-    "glorying",
-    "glosseme",
-    "glossers",
-    "glossier",
-    "glossies",
-    "glossily",
-    "glossina",
-    "glossing",
-    "glouting",
-    "glowered",
-    "glowworm",
-    "gloxinia",
-    "glucinic",
-    "glucinum",
-    "glucoses",
-    "glucosic",
-    "gluelike",
-    "gluepots",
-    "glugging",
-    "gluhwein",
-    "gluiness",
-    "glummest",
-    "glumness",
-    "glumpier",
-    "glumpily",
-    "glunched",
-    "glunches",
-    "glutelin",
-    "glutenin",
-    "glutting",
-    "gluttons",
-    "glyceric",
-    "glyceryl",
-    "glycines",
-    "glyconic",
-    "glyptics",
-    "gnarlier",
-    "gnarling",
-    "gnarring",
-    "gnathion",
-    "gnathite",
-    "gnatlike",
-    "gnattier",
-    "gnawable",
-    "gnawings",
-    "gneisses",
-    "gneissic",
-    "gnomical",
-    "gnomists",
-    "gnomonic",
-    "gnostics",
-    "goadlike",
-    "goalless",
-    "goalpost",
-    "goalward",
-    "goatfish",
-    "goatherd",
-    "goatlike",
-    "goatskin",
-    "gobblers",
-    "gobioids",
-    "gobshite",
-    "godchild",
-    "goddamns",
-    "godetias",
-    "godheads",
-    "godhoods",
-    "godliest",
-    "godlings",
-    "godroons",
-    "godsends",
-    "godships",
-    "goethite",
-    "goffered",
-    "gogglers",
-    "gogglier",
-    "goggling",
-    "goitrous",
-    "golconda",
-    "goldarns",
-    "goldbugs",
-    "goldener",
-    "goldenly",
-    "goldeyes",
-    "goldurns",
-    "golfings",
-    "goliards",
-    "goliaths",
-    "golliwog",
-    "gollywog",
-    "goloshes",
-    "gombeens",
-    "gombroon",
-    "gomerals",
-    "gomerels",
-    "gomerils",
-    "gonadial",
-    "goneness",
-    "gonfalon",
-    "gonfanon",
-    "gonglike",
-    "gonidial",
-    "gonidium",
-    "gonocyte",
-    "gonopore",
-    "goodlier",
-    "goodwife",
-    "goofball",
-    "goofiest",
-    "googlies",
-    "goombahs",
-    "goombays",
-    "gooniest",
-    "goopiest",
-    "goosiest",
-    "gorbelly",
-    "gorblimy",
-    "gorcocks",
-    "gorditas",
-    "gorgedly",
-    "gorgerin",
-    "gorgeted",
-    "goriness",
-    "gormands",
-    "gormless",
-    "gorsiest",
-    "goshawks",
-    "goslings",
-    "gospeler",
-    "gospelly",
-    "gosports",
-    "gossiped",
-    "gossiper",
-    "gossipry",
-    "gossoons",
-    "gossypol",
-    "gothites",
-    "gouaches",
-    "gouramis",
-    "gourmand",
-    "gourmets",
-    "goutiest",
-    "gownsman",
-    "gownsmen",
-    "grabbier",
-    "grabbled",
-    "grabbler",
-    "grabbles",
-    "graciles",
-    "gracioso",
-    "grackles",
-    "gradable",
-    "gradated",
-    "gradates",
-    "gradines",
-    "graduals",
-    "graduand",
-    "graduses",
-    "graecize",
-    "graffito",
-    "graftage",
-    "grafters",
-    "grainers",
-    "grainier",
-    "graining",
-    "gramarye",
-    "grandads",
-    "grandame",
-    "grandams",
-    "granddad",
-    "granddam",
-    "grandees",
-    "grandkid",
-    "grandpas",
-    "grandsir",
-    "grangers",
-    "granitas",
-    "granolas",
-    "granters",
-    "grantors",
-    "grapheme",
-    "grapiest",
-    "grapline",
-    "graplins",
-    "grapnels",
-    "grappler",
-    "graspers",
-    "grassier",
-    "grassily",
-    "grassing",
-    "gratinee",
-    "graupels",
-    "gravamen",
-    "graveled",
-    "gravidae",
-    "gravidas",
-    "gravidly",
-    "gravitas",
-    "gravlaks",
-    "gravures",
-    "grayback",
-    "grayfish",
-    "graylags",
-    "graymail",
-    "grayness",
-    "grayouts",
-    "grazable",
-    "graziers",
-    "grazings",
-    "grazioso",
-    "greasers",
-    "greasier",
-    "greasily",
-    "greasing",
-    "greatens",
-    "grecized",
-    "grecizes",
-    "greedier",
-    "greegree",
-    "greenbug",
-    "greenest",
-    "greenfly",
-    "greenier",
-    "greenlet",
-    "greenlit",
-    "greenths",
-    "greisens",
-    "gremials",
-    "gremmies",
-    "grewsome",
-    "greyhens",
-    "greylags",
-    "greyness",
-    "gribbles",
-    "gridders",
-    "griddled",
-    "grievers",
-    "griffons",
-    "grifters",
-    "grifting",
-    "grillade",
-    "grillage",
-    "grillers",
-    "grillery",
-    "grimaced",
-    "grimacer",
-    "grimaces",
-    "grimiest",
-    "grimmest",
-    "grimness",
-    "grinches",
-    "grindery",
-    "grinners",
-    "gripiest",
-    "grippier",
-    "gripsack",
-    "griseous",
-    "grisette",
-    "griskins",
-    "grislier",
-    "gristers",
-    "gristles",
-    "gritters",
-    "grittier",
-    "grittily",
-    "gritting",
-    "grizzler",
-    "grizzles",
-    "groaners",
-    "grodiest",
-    "groggery",
-    "groggier",
-    "groggily",
-    "grograms",
-    "grogshop",
-    "groining",
-    "grokking",
-    "gromwell",
-    "groovers",
-    "groovier",
-    "groschen",
-    "grossers",
-    "grossest",
-    "grottier",
-    "grottoed",
-    "grottoes",
-    "grouched",
-    "grouches",
-    "grounder",
-    "groupers",
-    "groupoid",
-    "grousers",
-    "grousing",
-    "grouters",
-    "groutier",
-    "groveled",
-    "groveler",
-    "growable",
-    "growlers",
-    "growlier",
-    "grubbers",
-    "grubbier",
-    "grubbily",
-    "grubworm",
-    "grudgers",
-    "grudging",
-    "gruelers",
-    "gruelled",
-    "grueller",
-    "gruffest",
-    "gruffier",
-    "gruffily",
-    "gruffing",
-    "gruffish",
-    "gruiform",
-    "grumbler",
-    "grummest",
-    "grummets",
-    "grumphie",
-    "grumpier",
-    "grumpily",
-    "grumping",
-    "grumpish",
-    "grungers",
-    "grungier",
-    "grunions",
-    "grunters",
-    "gruntled",
-    "gruntles",
-    "grutched",
-    "grutches",
-    "gruyeres",
-    "gryphons",
-    "guacharo",
-    "guaiacol",
-    "guaiacum",
-    "guaiocum",
-    "guanacos",
-    "guanases",
-    "guanidin",
-    "guanines",
-    "guaranas",
-    "guaranis",
-    "guardant",
-    "guarddog",
-    "guarders",
-    "guayules",
-    "gudgeons",
-    "guerdons",
-    "gueridon",
-    "guessers",
-    "guesting",
-    "guffawed",
-    "guggling",
-    "guidable",
-    "guideway",
-    "guileful",
-    "guiltier",
-    "guiltily",
-    "guipures",
-    "guisards",
-    "guitguit",
-    "gulfiest",
-    "gulflike",
-    "gulfweed",
-    "gullable",
-    "gullably",
-    "gullibly",
-    "gullwing",
-    "gullying",
-    "gulosity",
-    "gulpiest",
-    "gumballs",
-    "gumboils",
-    "gumboots",
-    "gumbotil",
-    "gumdrops",
-    "gumlines",
-    "gummiest",
-    "gummites",
-    "gummoses",
-    "gummosis",
-    "gumption",
-    "gumshoed",
-    "gumshoes",
-    "gumtrees",
-    "gumweeds",
-    "gumwoods",
-    "gunboats",
-    "gunfires",
-    "gunflint",
-    "gunkhole",
-    "gunkiest",
-    "gunlocks",
-    "gunnings",
-    "gunnybag",
-    "gunpaper",
-    "gunplays",
-    "gunrooms",
-    "gunships",
-    "gunstock",
-    "gunwales",
-    "gurglets",
-    "gurnards",
-    "guruship",
-    "gushiest",
-    "gussying",
-    "gustable",
-    "gustiest",
-    "gustless",
-    "gutsiest",
-    "guttated",
-    "guttered",
-    "guttiest",
-    "guttlers",
-    "guttling",
-    "guylines",
-    "gweducks",
-    "gymkhana",
-    "gymnasia",
-    "gynaecea",
-    "gynaecia",
-    "gynandry",
-    "gynarchy",
-    "gynecium",
-    "gynecoid",
-    "gyniatry",
-    "gynoecia",
-    "gyplures",
-    "gypseian",
-    "gypseous",
-    "gypsters",
-    "gypsydom",
-    "gypsying",
-    "gypsyish",
-    "gypsyism",
-    "gyrating",
-    "gyrators",
-    "gyratory",
-    "gyroidal",
-    "gyrostat",
-    "habanera",
-    "habdalah",
-    "habitans",
-    "habitant",
-    "habiting",
-    "habitude",
-    "habitues",
-    "hachured",
-    "hachures",
-    "hackable",
-    "hackbuts",
-    "hacklers",
-    "hacklier",
-    "hackling",
-    "hackneys",
-    "hacksawn",
-    "hacksaws",
-    "hackwork",
-    "haddocks",
-    "haematal",
-    "haematic",
-    "haematin",
-    "haeredes",
-    "hafniums",
-    "haftarah",
-    "haftaras",
-    "haftarot",
-    "haftorah",
-    "haftoros",
-    "haftorot",
-    "hagadist",
-    "hagberry",
-    "haggadah",
-    "haggadas",
-    "haggadic",
-    "haggadot",
-    "haggards",
-    "haggises",
-    "hagglers",
-    "hagrider",
-    "hagrides",
-    "hahniums",
-    "hairband",
-    "haircaps",
-    "hairiest",
-    "hairlike",
-    "hairlock",
-    "hairnets",
-    "hairpins",
-    "hairwork",
-    "hairworm",
-    "halachas",
-    "halachic",
-    "halachot",
-    "halakahs",
-    "halakhah",
-    "halakhas",
-    "halakhic",
-    "halakhot",
-    "halakist",
-    "halakoth",
-    "halalahs",
-    "halation",
-    "halavahs",
-    "halazone",
-    "halberds",
-    "halberts",
-    "halcyons",
-    "haleness",
-    "halfback",
-    "halfbeak",
-    "halfness",
-    "halibuts",
-    "halidome",
-    "halidoms",
-    "halliard",
-    "halloaed",
-    "halloing",
-    "hallooed",
-    "hallower",
-    "hallucal",
-    "halluces",
-    "halogens",
-    "halolike",
-    "haltered",
-    "halteres",
-    "haltless",
-    "halutzim",
-    "halyards",
-    "hamartia",
-    "hamboned",
-    "hambones",
-    "hamburgs",
-    "hammadas",
-    "hammerer",
-    "hammiest",
-    "hamperer",
-    "hamulate",
-    "hamulose",
-    "hamulous",
-    "hanapers",
-    "handaxes",
-    "handbill",
-    "handcars",
-    "handcart",
-    "handclap",
-    "handfast",
-    "handgrip",
-    "handhold",
-    "handiest",
-    "handless",
-    "handlike",
-    "handlist",
-    "handloom",
-    "handoffs",
-    "handpick",
-    "handsaws",
-    "handsels",
-    "handsewn",
-    "handsful",
-    "handwork",
-    "handwrit",
-    "hangable",
-    "hangared",
-    "hangbird",
-    "hangdogs",
-    "hangfire",
-    "hangnail",
-    "hangnest",
-    "hangtags",
-    "hankered",
-    "hankerer",
-    "hanseled",
-    "hanumans",
-    "haphtara",
-    "hapkidos",
-    "haplites",
-    "haploids",
-    "haploidy",
-    "haplonts",
-    "haplopia",
-    "haploses",
-    "haplosis",
-    "haptenes",
-    "haptenic",
-    "haptical",
-    "harangue",
-    "harasser",
-    "harasses",
-    "harborer",
-    "hardboot",
-    "hardedge",
-    "hardhack",
-    "hardhats",
-    "hardhead",
-    "hardiest",
-    "hardnose",
-    "hardpack",
-    "hardpans",
-    "hardtack",
-    "hardtops",
-    "hardwire",
-    "harebell",
-    "harelike",
-    "harelips",
-    "harianas",
-    "haricots",
-    "harijans",
-    "harissas",
-    "harkened",
-    "harkener",
-    "harlotry",
-    "harmines",
-    "harpings",
-    "harpists",
-    "harpoons",
-    "harridan",
-    "harrowed",
-    "harrower",
-    "harrumph",
-    "harrying",
-    "harshens",
-    "harslets",
-    "harumphs",
-    "haruspex",
-    "hasheesh",
-    "hashhead",
-    "hassiums",
-    "hassling",
-    "hassocks",
-    "hasteful",
-    "hastener",
-    "hastiest",
-    "hatbands",
-    "hatboxes",
-    "hatcheck",
-    "hatchels",
-    "hatchers",
-    "hatchets",
-    "hatchway",
-    "hateable",
-    "hatmaker",
-    "hatracks",
-    "hatteria",
-    "hauberks",
-    "haulages",
-    "haulmier",
-    "haulyard",
-    "haunched",
-    "haunches",
-    "haunters",
-    "hautbois",
-    "hautboys",
-    "hauteurs",
-    "havartis",
-    "havdalah",
-    "havening",
-    "haverels",
-    "haviours",
-    "havocked",
-    "havocker",
-    "hawfinch",
-    "hawkbill",
-    "hawkeyed",
-    "hawkings",
-    "hawklike",
-    "hawkmoth",
-    "hawknose",
-    "hawkshaw",
-    "hawkweed",
-    "haycocks",
-    "hayforks",
-    "haylages",
-    "haylofts",
-    "haymaker",
-    "hayracks",
-    "hayricks",
-    "hayrides",
-    "hayseeds",
-    "haywires",
-    "hazarded",
-    "hazarder",
-    "hazelhen",
-    "haziness",
-    "hazzanim",
-    "headachy",
-    "headends",
-    "headfish",
-    "headfuls",
-    "headgate",
-    "headhunt",
-    "headiest",
-    "headlock",
-    "headmost",
-    "headnote",
-    "headpins",
-    "headrace",
-    "headsail",
-    "headship",
-    "headsman",
-    "headsmen",
-    "headstay",
-    "headways",
-    "headwind",
-    "headword",
-    "headwork",
-    "healable",
-    "hearable",
-    "hearkens",
-    "hearsays",
-    "hearsing",
-    "heartens",
-    "heartier",
-    "hearties",
-    "hearting",
-    "heatable",
-    "heatedly",
-    "heathery",
-    "heathier",
-    "heatless",
-    "heavyset",
-    "hebdomad",
-    "hebetate",
-    "hebetude",
-    "hebraize",
-    "hecklers",
-    "heckling",
-    "hectical",
-    "hecticly",
-    "hectored",
-    "hedgehop",
-    "hedgepig",
-    "hedgiest",
-    "hedonics",
-    "heehawed",
-    "heelball",
-    "heelings",
-    "heelless",
-    "heelpost",
-    "heeltaps",
-    "heftiest",
-    "hegemons",
-    "hegumene",
-    "hegumens",
-    "hegumeny",
-    "heighths",
-    "heirdoms",
-    "heirless",
-    "heirship",
-    "heisters",
-    "heisting",
-    "hektares",
-    "heliacal",
-    "heliasts",
-    "helicoid",
-    "helicons",
-    "helicopt",
-    "helilift",
-    "helipads",
-    "helistop",
-    "hellbent",
-    "hellcats",
-    "helleris",
-    "hellhole",
-    "hellions",
-    "hellkite",
-    "helloing",
-    "helmeted",
-    "helminth",
-    "helmless",
-    "helmsmen",
-    "helotage",
-    "helotism",
-    "helpable",
-    "helpings",
-    "helpmate",
-    "helpmeet",
-    "hemagogs",
-    "hematein",
-    "hematics",
-    "hematine",
-    "hematins",
-    "hematoid",
-    "hemiolas",
-    "hemiolia",
-    "hemipter",
-    "hemlines",
-    "hemlocks",
-    "hemocoel",
-    "hemocyte",
-    "hemolyze",
-    "hemostat",
-    "hempiest",
-    "hemplike",
-    "hempseed",
-    "hempweed",
-    "henbanes",
-    "hencoops",
-    "henequen",
-    "henequin",
-    "henhouse",
-    "heniquen",
-    "hennaing",
-    "henpecks",
-    "heparins",
-    "hepatica",
-    "hepatics",
-    "hepatize",
-    "heptagon",
-    "heptanes",
-    "heptarch",
-    "heptoses",
-    "herbaged",
-    "herbages",
-    "herbaria",
-    "herbiest",
-    "herbless",
-    "herblike",
-    "herdlike",
-    "herdsman",
-    "herdsmen",
-    "hereaway",
-    "hereinto",
-    "heretrix",
-    "hereupon",
-    "heritors",
-    "heritrix",
-    "hermaean",
-    "hermitic",
-    "hermitry",
-    "herniate",
-    "heroical",
-    "heroisms",
-    "heroized",
-    "heroizes",
-    "herpetic",
-    "herrying",
-    "herstory",
-    "hessians",
-    "hessites",
-    "hetaerae",
-    "hetaeras",
-    "hetaeric",
-    "hetairai",
-    "hetairas",
-    "hexagons",
-    "hexagram",
-    "hexamine",
-    "hexaplar",
-    "hexaplas",
-    "hexapods",
-    "hexapody",
-    "hexarchy",
-    "hexereis",
-    "hexosans",
-    "hiatuses",
-    "hibachis",
-    "hibernal",
-    "hiccough",
-    "hiccuped",
-    "hidalgos",
-    "hiddenly",
-    "hideless",
-    "hideouts",
-    "hidroses",
-    "hidrosis",
-    "hidrotic",
-    "hieratic",
-    "hierurgy",
-    "higglers",
-    "higgling",
-    "highborn",
-    "highboys",
-    "highbred",
-    "highbrow",
-    "highbush",
-    "highjack",
-    "highlife",
-    "highroad",
-    "highspot",
-    "hightail",
-    "highting",
-    "hightops",
-    "hildings",
-    "hilliest",
-    "hilloaed",
-    "hillocks",
-    "hillocky",
-    "hilloing",
-    "hilltops",
-    "hiltless",
-    "himation",
-    "hinderer",
-    "hindguts",
-    "hindmost",
-    "hinkiest",
-    "hinnying",
-    "hipbones",
-    "hiplines",
-    "hipparch",
-    "hippiest",
-    "hireable",
-    "hireling",
-    "hirpling",
-    "hirseled",
-    "hirsling",
-    "hirudins",
-    "hissiest",
-    "hissings",
-    "histamin",
-    "histidin",
-    "histogen",
-    "hitchers",
-    "hittable",
-    "hiveless",
-    "hizzoner",
-    "hoactzin",
-    "hoarders",
-    "hoariest",
-    "hoarsely",
-    "hoarsens",
-    "hoarsest",
-    "hoatzins",
-    "hobblers",
-    "hobbling",
-    "hobnails",
-    "hoboisms",
-    "hockshop",
-    "hocusing",
-    "hocussed",
-    "hocusses",
-    "hoecakes",
-    "hoedowns",
-    "hogbacks",
-    "hogmanes",
-    "hogmenay",
-    "hognoses",
-    "hogtying",
-    "hogweeds",
-    "hoicking",
-    "hoidened",
-    "hoisters",
-    "hokiness",
-    "hokypoky",
-    "holdable",
-    "holdback",
-    "holddown",
-    "holdfast",
-    "holdouts",
-    "holeless",
-    "holibuts",
-    "hollaing",
-    "hollered",
-    "holloaed",
-    "holloing",
-    "hollooed",
-    "hollower",
-    "hollowly",
-    "holmiums",
-    "hologamy",
-    "hologyny",
-    "holozoic",
-    "holydays",
-    "holytide",
-    "homagers",
-    "homaging",
-    "homburgs",
-    "homebody",
-    "homeboys",
-    "homebred",
-    "homegirl",
-    "homelier",
-    "homelike",
-    "homeotic",
-    "homeport",
-    "homering",
-    "homilist",
-    "hominess",
-    "hominian",
-    "hominies",
-    "hominine",
-    "hominize",
-    "hominoid",
-    "hommocks",
-    "hommoses",
-    "homogamy",
-    "homogeny",
-    "homogony",
-    "homonyms",
-    "homonymy",
-    "honchoed",
-    "hondling",
-    "honester",
-    "honewort",
-    "honeybun",
-    "honeyful",
-    "honeying",
-    "hongiing",
-    "honorand",
-    "honorers",
-    "honourer",
-    "hoochies",
-    "hoodiest",
-    "hoodless",
-    "hoodlike",
-    "hoodlums",
-    "hoodmold",
-    "hoodooed",
-    "hoodwink",
-    "hoofbeat",
-    "hoofless",
-    "hooflike",
-    "hookiest",
-    "hookless",
-    "hooklets",
-    "hooklike",
-    "hooknose",
-    "hookworm",
-    "hoopless",
-    "hooplike",
-    "hoopster",
-    "hoorahed",
-    "hoorayed",
-    "hoosegow",
-    "hoosgows",
-    "hootches",
-    "hootiest",
-    "hoovered",
-    "hopheads",
-    "hopingly",
-    "hoplites",
-    "hoplitic",
-    "hoppiest",
-    "hoppings",
-    "hoppling",
-    "hopsacks",
-    "hoptoads",
-    "hordeins",
-    "hordeola",
-    "hormonic",
-    "hornbeam",
-    "hornbill",
-    "hornbook",
-    "hornfels",
-    "horniest",
-    "hornings",
-    "hornists",
-    "hornitos",
-    "hornless",
-    "hornlike",
-    "hornpout",
-    "horntail",
-    "hornworm",
-    "hornwort",
-    "horologe",
-    "horrider",
-    "horridly",
-    "horsecar",
-    "horsefly",
-    "horsepox",
-    "horsiest",
-    "hosannah",
-    "hosannas",
-    "hoselike",
-    "hosepipe",
-    "hoseying",
-    "hospitia",
-    "hospodar",
-    "hosteled",
-    "hosteler",
-    "hostelry",
-    "hostiles",
-    "hostlers",
-    "hotblood",
-    "hotboxes",
-    "hotcakes",
-    "hotching",
-    "hotchpot",
-    "hoteldom",
-    "hotelman",
-    "hotelmen",
-    "hotfoots",
-    "hotheads",
-    "hotpress",
-    "hotspurs",
-    "hounders",
-    "hounding",
-    "hourlies",
-    "hourlong",
-    "houseboy",
-    "housefly",
-    "houseful",
-    "houseled",
-    "houseman",
-    "housemen",
-    "housesat",
-    "housesit",
-    "housetop",
-    "hoveling",
-    "hovelled",
-    "hoverers",
-    "hoverfly",
-    "howdying",
-    "hoydened",
-    "hryvnias",
-    "huarache",
-    "huaracho",
-    "hubrises",
-    "huckster",
-    "huddlers",
-    "huddling",
-    "huffiest",
-    "hugeness",
-    "huipiles",
-    "huisache",
-    "hulkiest",
-    "hulloaed",
-    "hulloing",
-    "hullooed",
-    "humanest",
-    "humanise",
-    "humanize",
-    "humblers",
-    "humblest",
-    "humdrums",
-    "humerals",
-    "humidify",
-    "humified",
-    "humiture",
-    "hummable",
-    "hummocks",
-    "hummocky",
-    "hummuses",
-    "humorful",
-    "humoring",
-    "humoured",
-    "humphing",
-    "humpiest",
-    "humpless",
-    "hunching",
-    "hungered",
-    "hungrier",
-    "hunkered",
-    "hunkiest",
-    "huntable",
-    "huntedly",
-    "huntings",
-    "huntsmen",
-    "hurdlers",
-    "hurdling",
-    "hurlings",
-    "hurrahed",
-    "hurrayed",
-    "hurriers",
-    "hurtless",
-    "hushedly",
-    "huskiest",
-    "huskings",
-    "husklike",
-    "hustings",
-    "huswifes",
-    "huswives",
-    "hutching",
-    "hutments",
-    "hutzpahs",
-    "huzzahed",
-    "huzzaing",
-    "hyalines",
-    "hyalites",
-    "hyalogen",
-    "hyaloids",
-    "hybrises",
-    "hydatids",
-    "hydracid",
-    "hydragog",
-    "hydranth",
-    "hydrases",
-    "hydrator",
-    "hydrides",
-    "hydrilla",
-    "hydroids",
-    "hydromel",
-    "hydropic",
-    "hydropsy",
-    "hydroski",
-    "hydrosol",
-    "hygeists",
-    "hygieist",
-    "hygienes",
-    "hylozoic",
-    "hymeneal",
-    "hymenial",
-    "hymenium",
-    "hymnbook",
-    "hymnists",
-    "hymnless",
-    "hymnlike",
-    "hyoidean",
-    "hyoscine",
-    "hypergol",
-    "hyperons",
-    "hyperope",
-    "hyphemia",
-    "hyphened",
-    "hyphenic",
-    "hypnoses",
-    "hypoacid",
-    "hypoderm",
-    "hypogeal",
-    "hypogean",
-    "hypogene",
-    "hypogeum",
-    "hypogyny",
-    "hyponeas",
-    "hyponoia",
-    "hyponyms",
-    "hyponymy",
-    "hypopnea",
-    "hypopyon",
-    "hypothec",
-    "hypoxias",
-    "hyracoid",
-    "hysteric",
-    "iambuses",
-    "iatrical",
-    "ibogaine",
-    "iceblink",
-    "iceboats",
-    "icebound",
-    "iceboxes",
-    "icefalls",
-    "icekhana",
-    "icemaker",
-    "ichnites",
-    "ichorous",
-    "ichthyic",
-    "ickiness",
-    "iconical",
-    "icterics",
-    "idealess",
-    "idealise",
-    "ideality",
-    "idealize",
-    "idealogy",
-    "ideating",
-    "ideogram",
-    "idiocies",
-    "idiolect",
-    "idiotism",
-    "idiotype",
-    "idlesses",
-    "idocrase",
-    "idolater",
-    "idolator",
-    "idolised",
-    "idoliser",
-    "idolises",
-    "idolisms",
-    "idolized",
-    "idolizer",
-    "idolizes",
-    "idoneity",
-    "idoneous",
-    "idylists",
-    "idyllist",
-    "iffiness",
-    "ignatias",
-    "ignified",
-    "ignifies",
-    "igniters",
-    "ignitors",
-    "ignitron",
-    "ignominy",
-    "ignorami",
-    "ignorers",
-    "iguanian",
-    "iguanids",
-    "ikebanas",
-    "illation",
-    "illative",
-    "illinium",
-    "illogics",
-    "illuding",
-    "illumine",
-    "illuming",
-    "illuvial",
-    "illuvium",
-    "ilmenite",
-    "imaginal",
-    "imaginer",
-    "imagings",
-    "imagisms",
-    "imagists",
-    "imamates",
-    "imbalmed",
-    "imbalmer",
-    "imbarked",
-    "imbibers",
-    "imbibing",
-    "imbitter",
-    "imblazed",
-    "imblazes",
-    "imbodied",
-    "imbodies",
-    "imbolden",
-    "imbosoms",
-    "imbowers",
-    "imbrowns",
-    "imbruing",
-    "imbruted",
-    "imbrutes",
-    "imitable",
-    "imitator",
-    "immenser",
-    "immerged",
-    "immerges",
-    "immerses",
-    "immeshed",
-    "immeshes",
-    "immingle",
-    "immixing",
-    "immodest",
-    "immolate",
-    "immotile",
-    "immunise",
-    "immuring",
-    "impacter",
-    "impaints",
-    "impairer",
-    "impalers",
-    "impaling",
-    "impanels",
-    "imparity",
-    "imparked",
-    "imparter",
-    "impasses",
-    "impasted",
-    "impastes",
-    "impastos",
-    "impawned",
-    "impearls",
-    "impeders",
-    "impellor",
-    "impended",
-    "imperils",
-    "impinged",
-    "impinger",
-    "impinges",
-    "impishly",
-    "impleads",
-    "impledge",
-    "imploded",
-    "implodes",
-    "implorer",
-    "implores",
-    "impolicy",
-    "imponing",
-    "imporous",
-    "imposers",
-    "imposted",
-    "impounds",
-    "impowers",
-    "impregns",
-    "impresas",
-    "impreses",
-    "imprests",
-    "imprimis",
-    "improver",
-    "impudent",
-    "impugned",
-    "impugner",
-    "impulsed",
-    "impurely",
-    "impurest",
-    "imputers",
-    "imputing",
-    "inarable",
-    "inarched",
-    "inarches",
-    "inarming",
-    "inbeings",
-    "inboards",
-    "inbounds",
-    "inbreeds",
-    "inbursts",
-    "incaging",
-    "incanted",
-    "incasing",
-    "incenses",
-    "incented",
-    "incenter",
-    "incepted",
-    "inceptor",
-    "inchmeal",
-    "inchoate",
-    "inchworm",
-    "incipits",
-    "incising",
-    "incisors",
-    "incisory",
-    "incisure",
-    "incitant",
-    "inciters",
-    "inclasps",
-    "incliner",
-    "inclosed",
-    "incloser",
-    "incloses",
-    "incomers",
-    "inconnus",
-    "incorpse",
-    "increate",
-    "incrusts",
-    "incudate",
-    "incumber",
-    "incurved",
-    "incurves",
-    "incusing",
-    "indagate",
-    "indamine",
-    "indamins",
-    "indenter",
-    "indentor",
-    "indevout",
-    "indicans",
-    "indicant",
-    "indicias",
-    "indicium",
-    "indictee",
-    "indicter",
-    "indictor",
-    "indigene",
-    "indigens",
-    "indignly",
-    "indigoes",
-    "indigoid",
-    "inditers",
-    "inditing",
-    "indocile",
-    "indorsed",
-    "indorsee",
-    "indorser",
-    "indorses",
-    "indorsor",
-    "indowing",
-    "indoxyls",
-    "indrafts",
-    "inducers",
-    "indulger",
-    "induline",
-    "indulins",
-    "indurate",
-    "indusial",
-    "indusium",
-    "indwells",
-    "inearths",
-    "inedibly",
-    "inedited",
-    "inerrant",
-    "inertiae",
-    "inertias",
-    "inexpert",
-    "infamies",
-    "infantas",
-    "infantes",
-    "infarcts",
-    "infaunae",
-    "infaunal",
-    "infaunas",
-    "infecter",
-    "infector",
-    "infecund",
-    "infeoffs",
-    "infernos",
-    "inferrer",
-    "infester",
-    "infields",
-    "infights",
-    "infirmed",
-    "infirmly",
-    "infixing",
-    "infixion",
-    "inflamer",
-    "inflames",
-    "inflater",
-    "inflects",
-    "inflexed",
-    "influxes",
-    "infobahn",
-    "infolded",
-    "infolder",
-    "infought",
-    "infracts",
-    "infrugal",
-    "infusers",
-    "infusive",
-    "ingather",
-    "ingenues",
-    "ingoting",
-    "ingrafts",
-    "ingrains",
-    "ingrates",
-    "ingroups",
-    "ingrowth",
-    "ingulfed",
-    "inhauler",
-    "inhering",
-    "inhesion",
-    "inhibins",
-    "inholder",
-    "inhumers",
-    "inhuming",
-    "injurers",
-    "inkberry",
-    "inkblots",
-    "inkhorns",
-    "inkiness",
-    "inklings",
-    "inkstand",
-    "inkstone",
-    "inkwells",
-    "inkwoods",
-    "inlacing",
-    "inlander",
-    "inlayers",
-    "inlaying",
-    "inmeshed",
-    "inmeshes",
-    "innately",
-    "innerved",
-    "innerves",
-    "inosines",
-    "inosites",
-    "inpoured",
-    "inputted",
-    "inputter",
-    "inquests",
-    "inquiets",
-    "inrushes",
-    "insanest",
-    "inscapes",
-    "inscribe",
-    "inscroll",
-    "insculps",
-    "insectan",
-    "inserter",
-    "insetted",
-    "insetter",
-    "insheath",
-    "inshrine",
-    "insister",
-    "insnared",
-    "insnarer",
-    "insnares",
-    "insolate",
-    "insomuch",
-    "insouled",
-    "insphere",
-    "inspirer",
-    "inspirit",
-    "instable",
-    "instancy",
-    "instated",
-    "instates",
-    "instills",
-    "instroke",
-    "insulant",
-    "insulars",
-    "insulins",
-    "insulter",
-    "insurant",
-    "inswathe",
-    "intactly",
-    "intarsia",
-    "intender",
-    "intenser",
-    "interage",
-    "interbed",
-    "intercut",
-    "interims",
-    "interlap",
-    "interlay",
-    "intermat",
-    "intermit",
-    "internee",
-    "internes",
-    "interrex",
-    "interrow",
-    "intertie",
-    "interwar",
-    "inthrall",
-    "inthrals",
-    "inthrone",
-    "intimist",
-    "intitled",
-    "intitles",
-    "intitule",
-    "intombed",
-    "intonate",
-    "intoners",
-    "intoning",
-    "intorted",
-    "intrados",
-    "intrants",
-    "intreats",
-    "intrench",
-    "introits",
-    "intromit",
-    "introrse",
-    "intrudes",
-    "intrusts",
-    "intubate",
-    "intuited",
-    "inturned",
-    "intwined",
-    "intwines",
-    "intwists",
-    "inulases",
-    "inundant",
-    "inundate",
-    "inurbane",
-    "inurning",
-    "invalids",
-    "invected",
-    "inveighs",
-    "inveigle",
-    "inventer",
-    "inverity",
-    "inversed",
-    "invertin",
-    "invertor",
-    "inviable",
-    "inviably",
-    "invirile",
-    "inviscid",
-    "inviters",
-    "invocate",
-    "invokers",
-    "involute",
-    "involver",
-    "inwalled",
-    "inweaved",
-    "inweaves",
-    "iodating",
-    "iodation",
-    "iodinate",
-    "iodising",
-    "iodizers",
-    "iodizing",
-    "iodoform",
-    "iodophor",
-    "iodopsin",
-    "ionicity",
-    "ionizers",
-    "ionogens",
-    "ionomers",
-    "iotacism",
-    "ipomoeas",
-    "irefully",
-    "irenical",
-    "iridiums",
-    "iritises",
-    "ironbark",
-    "ironical",
-    "ironings",
-    "ironists",
-    "ironized",
-    "ironizes",
-    "ironlike",
-    "ironness",
-    "ironware",
-    "ironweed",
-    "irrupted",
-    "isagoges",
-    "isagogic",
-    "isarithm",
-    "isatines",
-    "isatinic",
-    "islanded",
-    "isleless",
-    "isobares",
-    "isobaths",
-    "isobutyl",
-    "isocheim",
-    "isochime",
-    "isochore",
-    "isochors",
-    "isochron",
-    "isocline",
-    "isocracy",
-    "isogenic",
-    "isogloss",
-    "isogonal",
-    "isogones",
-    "isogonic",
-    "isograft",
-    "isograms",
-    "isograph",
-    "isogrivs",
-    "isohyets",
-    "isolable",
-    "isoleads",
-    "isolines",
-    "isologue",
-    "isomeric",
-    "isometry",
-    "isomorph",
-    "isonomic",
-    "isopachs",
-    "isophote",
-    "isopleth",
-    "isopodan",
-    "isoprene",
-    "isospins",
-    "isospory",
-    "isostacy",
-    "isostasy",
-    "isotachs",
-    "isothere",
-    "isotones",
-    "isotropy",
-    "isotypes",
-    "isotypic",
-    "isozymes",
-    "isozymic",
-    "issuably",
-    "isthmian",
-    "isthmoid",
-    "itchiest",
-    "itchings",
-    "itemised",
-    "itemises",
-    "itemizer",
-    "itemizes",
-    "iterance",
-    "jabbered",
-    "jabberer",
-    "jacamars",
-    "jacinthe",
-    "jacinths",
-    "jackaroo",
-    "jackboot",
-    "jackdaws",
-    "jackeroo",
-    "jackfish",
-    "jacklegs",
-    "jackroll",
-    "jackstay",
-    "jacobins",
-    "jaconets",
-    "jaculate",
-    "jadeites",
-    "jadelike",
-    "jadishly",
-    "jaggeder",
-    "jaggedly",
-    "jagghery",
-    "jaggiest",
-    "jailable",
-    "jailbait",
-    "jailbird",
-    "jalapins",
-    "jalopies",
-    "jalousie",
-    "jambeaux",
-    "jammable",
-    "jammiest",
-    "janglers",
-    "janglier",
-    "jangling",
-    "janiform",
-    "janisary",
-    "janizary",
-    "japanize",
-    "japanned",
-    "japanner",
-    "japeries",
-    "japingly",
-    "jargoned",
-    "jargonel",
-    "jargoons",
-    "jarheads",
-    "jarldoms",
-    "jarosite",
-    "jarovize",
-    "jasmines",
-    "jauncing",
-    "jauntier",
-    "jauntily",
-    "jaunting",
-    "javelina",
-    "javelins",
-    "jawboned",
-    "jawboner",
-    "jawbones",
-    "jawlines",
-    "jaybirds",
-    "jaywalks",
-    "jazziest",
-    "jazzlike",
-    "jeepneys",
-    "jejunely",
-    "jejunity",
-    "jellabas",
-    "jellying",
-    "jelutong",
-    "jemadars",
-    "jemidars",
-    "jemmying",
-    "jeopards",
-    "jeremiad",
-    "jerkiest",
-    "jerreeds",
-    "jerrican",
-    "jerrycan",
-    "jerseyed",
-    "jestings",
-    "jesuitic",
-    "jesuitry",
-    "jetbeads",
-    "jetfoils",
-    "jetliner",
-    "jetports",
-    "jettiest",
-    "jettison",
-    "jettying",
-    "jeweling",
-    "jezebels",
-    "jibbooms",
-    "jibingly",
-    "jigaboos",
-    "jiggered",
-    "jiggiest",
-    "jigglier",
-    "jiggling",
-    "jigsawed",
-    "jillions",
-    "jimmying",
-    "jingalls",
-    "jingkoes",
-    "jinglers",
-    "jinglier",
-    "jingling",
-    "jingoish",
-    "jingoism",
-    "jingoist",
-    "jipijapa",
-    "jittered",
-    "jiujitsu",
-    "jiujutsu",
-    "jobnames",
-    "jockette",
-    "jockeyed",
-    "jocosely",
-    "jocosity",
-    "jocundly",
-    "jodhpurs",
-    "joggings",
-    "jogglers",
-    "joggling",
-    "johnboat",
-    "johnnies",
-    "joinable",
-    "joinders",
-    "joinings",
-    "jointers",
-    "jointure",
-    "joisting",
-    "jokester",
-    "jokiness",
-    "jolliers",
-    "jolliest",
-    "jollying",
-    "joltiest",
-    "jonesing",
-    "jongleur",
-    "jonquils",
-    "jostlers",
-    "jostling",
-    "jouncier",
-    "jouncing",
-    "jousters",
-    "jovially",
-    "jovialty",
-    "jowliest",
-    "joyances",
-    "joyrider",
-    "joyrides",
-    "jubilate",
-    "jubilees",
-    "juddered",
-    "judoists",
-    "jugglery",
-    "jugheads",
-    "jugulars",
-    "jugulate",
-    "juiciest",
-    "jujitsus",
-    "jujuisms",
-    "jujuists",
-    "jujutsus",
-    "jumblers",
-    "jumbling",
-    "jumbucks",
-    "jumpable",
-    "jumpiest",
-    "jumpoffs",
-    "junglier",
-    "junipers",
-    "junketed",
-    "junketer",
-    "junkiest",
-    "juratory",
-    "juristic",
-    "juryless",
-    "jussives",
-    "justling",
-    "justness",
-    "jutelike",
-    "juttying",
-    "juvenals",
-    "kabalism",
-    "kabalist",
-    "kabbalas",
-    "kabeljou",
-    "kachinas",
-    "kaffiyah",
-    "kaffiyeh",
-    "kailyard",
-    "kainites",
-    "kaiserin",
-    "kajeputs",
-    "kakemono",
-    "kakiemon",
-    "kalewife",
-    "kaleyard",
-    "kalifate",
-    "kalimbas",
-    "kallidin",
-    "kalyptra",
-    "kamaaina",
-    "kamacite",
-    "kampongs",
-    "kamseens",
-    "kanteles",
-    "kaoliang",
-    "kaolines",
-    "kaolinic",
-    "karakuls",
-    "karaokes",
-    "karosses",
-    "kartings",
-    "karyotin",
-    "kashered",
-    "kashmirs",
-    "kashruth",
-    "kashruts",
-    "katchina",
-    "katcinas",
-    "kathodal",
-    "kathodes",
-    "kathodic",
-    "katsuras",
-    "katydids",
-    "kavakava",
-    "kavasses",
-    "kazachki",
-    "kazachok",
-    "kazatski",
-    "kazatsky",
-    "kebbocks",
-    "kebbucks",
-    "keckling",
-    "kedgeree",
-    "keelages",
-    "keelboat",
-    "keelhale",
-    "keelhaul",
-    "keelless",
-    "keelsons",
-    "keenness",
-    "keepable",
-    "keepings",
-    "keesters",
-    "keffiyah",
-    "keffiyeh",
-    "kegelers",
-    "keglings",
-    "keiretsu",
-    "keisters",
-    "keitloas",
-    "keloidal",
-    "kenneled",
-    "kennings",
-    "kenotron",
-    "kephalin",
-    "keramics",
-    "keratins",
-    "keratoid",
-    "keratoma",
-    "keratose",
-    "kerchief",
-    "kermesse",
-    "kermises",
-    "kerneled",
-    "kernelly",
-    "kernites",
-    "kerogens",
-    "kerosine",
-    "kerplunk",
-    "kerygmas",
-    "kestrels",
-    "ketchups",
-    "keycards",
-    "keyholes",
-    "keynoted",
-    "keynoter",
-    "keypunch",
-    "keysters",
-    "khaddars",
-    "khalifas",
-    "khamseen",
-    "khamsins",
-    "khanates",
-    "khazenim",
-    "khedival",
-    "khedives",
-    "khirkahs",
-    "kibbling",
-    "kibitzed",
-    "kibitzer",
-    "kibitzes",
-    "kiboshed",
-    "kiboshes",
-    "kickable",
-    "kickiest",
-    "kickshaw",
-    "kidnaped",
-    "kidnapee",
-    "kidnaper",
-    "kidskins",
-    "kielbasa",
-    "kielbasi",
-    "kielbasy",
-    "kiesters",
-    "killable",
-    "killdees",
-    "killicks",
-    "killjoys",
-    "killocks",
-    "kilobars",
-    "kilobase",
-    "kilobaud",
-    "kilobits",
-    "kilomole",
-    "kilorads",
-    "kilotons",
-    "kilovolt",
-    "kiltings",
-    "kiltlike",
-    "kimchees",
-    "kimonoed",
-    "kindlers",
-    "kindless",
-    "kindlier",
-    "kindreds",
-    "kinesics",
-    "kinetins",
-    "kinfolks",
-    "kingbird",
-    "kingbolt",
-    "kingcups",
-    "kinghood",
-    "kingless",
-    "kinglets",
-    "kinglier",
-    "kinglike",
-    "kingpins",
-    "kingpost",
-    "kingside",
-    "kinkajou",
-    "kinkiest",
-    "kinsfolk",
-    "kinships",
-    "kippered",
-    "kipperer",
-    "kipskins",
-    "kirigami",
-    "kirsches",
-    "kismetic",
-    "kissable",
-    "kissably",
-    "kistfuls",
-    "kitelike",
-    "kitharas",
-    "kitlings",
-    "kitsches",
-    "kittened",
-    "kittlest",
-    "kittling",
-    "klatches",
-    "klaverns",
-    "kleagles",
-    "klephtic",
-    "klezmers",
-    "klisters",
-    "kludgier",
-    "kludging",
-    "klutzier",
-    "klystron",
-    "knackers",
-    "knackery",
-    "knacking",
-    "knappers",
-    "knapping",
-    "knapweed",
-    "kneaders",
-    "kneecaps",
-    "kneehole",
-    "kneelers",
-    "kneepads",
-    "kneepans",
-    "kneesies",
-    "kneesock",
-    "knelling",
-    "knessets",
-    "knobbier",
-    "knoblike",
-    "knollers",
-    "knolling",
-    "knothole",
-    "knotless",
-    "knotlike",
-    "knotters",
-    "knottier",
-    "knottily",
-    "knotweed",
-    "knouting",
-    "knowable",
-    "knowings",
-    "knubbier",
-    "knuckled",
-    "knuckler",
-    "knurlier",
-    "knurling",
-    "kohlrabi",
-    "kokanees",
-    "kolbasis",
-    "kolbassi",
-    "kolhozes",
-    "kolinski",
-    "kolinsky",
-    "kolkhosy",
-    "kolkhozy",
-    "kolkozes",
-    "komatiks",
-    "komondor",
-    "kookiest",
-    "kopiykas",
-    "koshered",
-    "kotowers",
-    "kotowing",
-    "koumises",
-    "koumyses",
-    "koupreys",
-    "kowtowed",
-    "kowtower",
-    "kraaling",
-    "kremlins",
-    "kreplach",
-    "kreplech",
-    "kreutzer",
-    "kreuzers",
-    "krimmers",
-    "krullers",
-    "krumhorn",
-    "krumkake",
-    "kryolite",
-    "kryolith",
-    "kryptons",
-    "kumisses",
-    "kumquats",
-    "kunzites",
-    "kurtoses",
-    "kuvaszok",
-    "kvelling",
-    "kvetched",
-    "kvetcher",
-    "kvetches",
-    "kyanised",
-    "kyanises",
-    "kyanites",
-    "kyanized",
-    "kyanizes",
-    "kyboshed",
-    "kyboshes",
-    "kymogram",
-    "kyphoses",
-    "kyphosis",
-    "kyphotic",
-    "laagered",
-    "labarums",
-    "labdanum",
-    "labelers",
-    "labeller",
-    "labellum",
-    "labially",
-    "labiated",
-    "labiates",
-    "lability",
-    "laborite",
-    "labroids",
-    "labrusca",
-    "laburnum",
-    "laceless",
-    "lacelike",
-    "lacerate",
-    "lacertid",
-    "lacewing",
-    "lacewood",
-    "lacework",
-    "laciness",
-    "lackaday",
-    "lackered",
-    "lackeyed",
-    "laconism",
-    "lacqueys",
-    "lactases",
-    "lactated",
-    "lactates",
-    "lacteals",
-    "lacteous",
-    "lactones",
-    "lactonic",
-    "lactoses",
-    "lacunars",
-    "lacunary",
-    "lacunate",
-    "lacunose",
-    "ladanums",
-    "laddered",
-    "ladening",
-    "ladhoods",
-    "ladleful",
-    "ladrones",
-    "ladyfish",
-    "ladyhood",
-    "ladykins",
-    "ladylike",
-    "ladylove",
-    "ladypalm",
-    "ladyship",
-    "laetrile",
-    "lagering",
-    "laggings",
-    "lagnappe",
-    "lagoonal",
-    "laically",
-    "laicised",
-    "laicises",
-    "laicisms",
-    "laicized",
-    "laicizes",
-    "laitance",
-    "lakebeds",
-    "lakelike",
-    "laliques",
-    "lallands",
-    "lallygag",
-    "lamasery",
-    "lambadas",
-    "lambaste",
-    "lambasts",
-    "lambdoid",
-    "lambency",
-    "lamberts",
-    "lambiest",
-    "lambkill",
-    "lambkins",
-    "lamblike",
-    "lamellae",
-    "lamellas",
-    "lamenter",
-    "laminals",
-    "laminary",
-    "laminins",
-    "laminose",
-    "laminous",
-    "lamister",
-    "lampases",
-    "lampions",
-    "lampoons",
-    "lamppost",
-    "lampreys",
-    "lampyrid",
-    "lamsters",
-    "lancelet",
-    "lanceted",
-    "lanciers",
-    "landgrab",
-    "landlers",
-    "landmass",
-    "landside",
-    "landskip",
-    "landslid",
-    "landslip",
-    "landsman",
-    "landsmen",
-    "laneways",
-    "langlauf",
-    "langleys",
-    "langrage",
-    "langrels",
-    "langshan",
-    "langsyne",
-    "languets",
-    "languors",
-    "laniards",
-    "lanitals",
-    "lankiest",
-    "lankness",
-    "lanneret",
-    "lanoline",
-    "lanolins",
-    "lanosity",
-    "lantanas",
-    "lanthorn",
-    "lapboard",
-    "lapelled",
-    "lapidate",
-    "lapidify",
-    "lapidist",
-    "lapillus",
-    "lappered",
-    "lappeted",
-    "lapsable",
-    "lapsible",
-    "lapwings",
-    "larboard",
-    "larcener",
-    "lardiest",
-    "lardlike",
-    "lardoons",
-    "largando",
-    "largesse",
-    "lariated",
-    "larkiest",
-    "larksome",
-    "larrigan",
-    "larrikin",
-    "larruped",
-    "larruper",
-    "laryngal",
-    "larynges",
-    "larynxes",
-    "lasagnas",
-    "lasagnes",
-    "lashings",
-    "lashkars",
-    "lassoers",
-    "lassoing",
-    "lastborn",
-    "lastings",
-    "latakias",
-    "latchets",
-    "latchkey",
-    "lateener",
-    "latening",
-    "latently",
-    "laterite",
-    "laterize",
-    "latewood",
-    "lathered",
-    "latherer",
-    "lathiest",
-    "lathings",
-    "lathwork",
-    "latigoes",
-    "latillas",
-    "latinity",
-    "latinize",
-    "latosols",
-    "latticed",
-    "laudably",
-    "laudanum",
-    "laudator",
-    "laughers",
-    "launders",
-    "laureled",
-    "lauwines",
-    "lavaboes",
-    "lavalava",
-    "lavalike",
-    "lavashes",
-    "lavation",
-    "laveered",
-    "laverock",
-    "lavisher",
-    "lavishes",
-    "lavrocks",
-    "lawbooks",
-    "lawgiver",
-    "lawyered",
-    "lawyerly",
-    "laxation",
-    "laxities",
-    "layabout",
-    "layaways",
-    "layerage",
-    "layettes",
-    "layovers",
-    "laywoman",
-    "laywomen",
-    "lazarets",
-    "lazulite",
-    "lazurite",
-    "leachers",
-    "leachier",
-    "leadened",
-    "leadenly",
-    "leadiest",
-    "leadings",
-    "leadless",
-    "leadoffs",
-    "leadsman",
-    "leadsmen",
-    "leadwork",
-    "leadwort",
-    "leafages",
-    "leafiest",
-    "leafless",
-    "leaflike",
-    "leafworm",
-    "leaguing",
-    "leakages",
-    "leakiest",
-    "leakless",
-    "lealties",
-    "leanness",
-    "leariest",
-    "leasable",
-    "leashing",
-    "leasings",
-    "leathern",
-    "leavened",
-    "leaviest",
-    "leavings",
-    "lechayim",
-    "lechered",
-    "lecterns",
-    "lections",
-    "lecythis",
-    "lecythus",
-    "ledgiest",
-    "leeboard",
-    "leeching",
-    "leeriest",
-    "leewards",
-    "leftisms",
-    "leftward",
-    "legalise",
-    "legalism",
-    "legalist",
-    "legatees",
-    "legatine",
-    "legating",
-    "legation",
-    "legators",
-    "legendry",
-    "legerity",
-    "leggiero",
-    "leggiest",
-    "leghorns",
-    "legrooms",
-    "legumins",
-    "legworks",
-    "lehayims",
-    "leisters",
-    "leisured",
-    "leisures",
-    "lekythoi",
-    "lekythos",
-    "lekythus",
-    "lemnisci",
-    "lemonish",
-    "lempiras",
-    "lemurine",
-    "lemuroid",
-    "lendable",
-    "lenience",
-    "lenities",
-    "leniting",
-    "lenition",
-    "lenitive",
-    "lensless",
-    "lentando",
-    "lenticel",
-    "lentisks",
-    "lentoids",
-    "lepidote",
-    "leporids",
-    "leporine",
-    "leprotic",
-    "leptonic",
-    "lesioned",
-    "lessoned",
-    "letching",
-    "letdowns",
-    "lethally",
-    "letterer",
-    "leucemia",
-    "leucemic",
-    "leucines",
-    "leucites",
-    "leucitic",
-    "leucomas",
-    "leukomas",
-    "leukoses",
-    "leukosis",
-    "leukotic",
-    "levanted",
-    "levanter",
-    "levators",
-    "leveeing",
-    "leveller",
-    "leverets",
-    "leviable",
-    "levigate",
-    "levirate",
-    "levitate",
-    "levities",
-    "levogyre",
-    "levulins",
-    "levulose",
-    "lewdness",
-    "lewisite",
-    "lewisson",
-    "libation",
-    "libeccio",
-    "libelant",
-    "libelees",
-    "libelers",
-    "libeling",
-    "libelist",
-    "libelled",
-    "libellee",
-    "libeller",
-    "librated",
-    "librates",
-    "libretti",
-    "licencee",
-    "licencer",
-    "licenser",
-    "lichened",
-    "lichenin",
-    "lichting",
-    "lickings",
-    "lickspit",
-    "liegeman",
-    "liegemen",
-    "lienable",
-    "lientery",
-    "lifecare",
-    "lifeways",
-    "lifework",
-    "liftable",
-    "liftgate",
-    "liftoffs",
-    "ligating",
-    "ligative",
-    "lightens",
-    "lightful",
-    "lightish",
-    "ligneous",
-    "lignites",
-    "lignitic",
-    "ligroine",
-    "ligroins",
-    "ligulate",
-    "liguloid",
-    "likelier",
-    "likening",
-    "lilylike",
-    "limacine",
-    "limacons",
-    "limbecks",
-    "limbered",
-    "limberer",
-    "limberly",
-    "limbiest",
-    "limbless",
-    "limbuses",
-    "limeades",
-    "limekiln",
-    "limeless",
-    "liminess",
-    "limitary",
-    "limiteds",
-    "limnetic",
-    "limonene",
-    "limonite",
-    "limpidly",
-    "limpkins",
-    "limpness",
-    "limpsier",
-    "limuloid",
-    "linalols",
-    "linalool",
-    "linchpin",
-    "lindanes",
-    "lineable",
-    "lineally",
-    "lineated",
-    "linebred",
-    "linecuts",
-    "lineless",
-    "linelike",
-    "linesmen",
-    "lingcods",
-    "lingerer",
-    "lingiest",
-    "linguals",
-    "linguica",
-    "linguini",
-    "linguisa",
-    "lingulae",
-    "lingular",
-    "liniment",
-    "linkable",
-    "linkboys",
-    "linksman",
-    "linksmen",
-    "linkwork",
-    "linocuts",
-    "linsangs",
-    "linseeds",
-    "linstock",
-    "lintiest",
-    "lintless",
-    "linurons",
-    "lionfish",
-    "lionised",
-    "lioniser",
-    "lionises",
-    "lionized",
-    "lionizer",
-    "lionizes",
-    "lionlike",
-    "lipocyte",
-    "lipoidal",
-    "lipomata",
-    "lippened",
-    "lippered",
-    "lippiest",
-    "lippings",
-    "lipreads",
-    "liquated",
-    "liquates",
-    "liquidly",
-    "liquored",
-    "liriopes",
-    "liripipe",
-    "lissomly",
-    "listable",
-    "litanies",
-    "liteness",
-    "litharge",
-    "lithemia",
-    "lithemic",
-    "lithiums",
-    "lithoing",
-    "lithosol",
-    "litmuses",
-    "litterer",
-    "littlish",
-    "liturgic",
-    "liveable",
-    "livelier",
-    "livelily",
-    "livelong",
-    "liveners",
-    "livening",
-    "liveried",
-    "liveries",
-    "livering",
-    "liverish",
-    "livetrap",
-    "lividity",
-    "livingly",
-    "lixivial",
-    "lixivium",
-    "loadstar",
-    "loamiest",
-    "loamless",
-    "loanable",
-    "loanings",
-    "loanword",
-    "loathers",
-    "loathful",
-    "lobately",
-    "lobation",
-    "lobbyers",
-    "lobbygow",
-    "lobbyism",
-    "lobefins",
-    "lobelias",
-    "lobeline",
-    "loblolly",
-    "lobstick",
-    "lobulate",
-    "lobulose",
-    "lobworms",
-    "localise",
-    "localism",
-    "localist",
-    "localite",
-    "locaters",
-    "lockages",
-    "lockjaws",
-    "locknuts",
-    "lockrams",
-    "locksets",
-    "lockstep",
-    "locofoco",
-    "locoisms",
-    "locomote",
-    "locoweed",
-    "loculate",
-    "locustae",
-    "locustal",
-    "locution",
-    "locutory",
-    "lodestar",
-    "lodgment",
-    "lodicule",
-    "loessial",
-    "loftiest",
-    "loftless",
-    "loftlike",
-    "loggiest",
-    "loggings",
-    "logician",
-    "logicise",
-    "logicize",
-    "loginess",
-    "logogram",
-    "logomach",
-    "logotypy",
-    "logrolls",
-    "logwoods",
-    "loitered",
-    "loiterer",
-    "lolloped",
-    "lollygag",
-    "lollypop",
-    "lomentum",
-    "lonelier",
-    "lonelily",
-    "loneness",
-    "longbows",
-    "longeing",
-    "longeron",
-    "longhand",
-    "longhead",
-    "longjump",
-    "longneck",
-    "longness",
-    "longship",
-    "longsome",
-    "longspur",
-    "longueur",
-    "longways",
-    "longwise",
-    "lookdown",
-    "lookisms",
-    "lookists",
-    "lookouts",
-    "looksism",
-    "looniest",
-    "loopiest",
-    "loosener",
-    "loppered",
-    "loppiest",
-    "lopstick",
-    "lordings",
-    "lordless",
-    "lordlier",
-    "lordlike",
-    "lordling",
-    "lordomas",
-    "lordoses",
-    "lordosis",
-    "lordotic",
-    "lorgnons",
-    "loricate",
-    "lorikeet",
-    "lorimers",
-    "loriners",
-    "lornness",
-    "losingly",
-    "lostness",
-    "lothario",
-    "lothsome",
-    "loudened",
-    "loudlier",
-    "lousiest",
-    "louvered",
-    "loveably",
-    "lovebird",
-    "lovebugs",
-    "lovefest",
-    "lovelier",
-    "lovelies",
-    "lovelily",
-    "lovelorn",
-    "lovesick",
-    "lovesome",
-    "lovevine",
-    "lowballs",
-    "lowbrows",
-    "lowdowns",
-    "lowliest",
-    "lowlifer",
-    "lowlifes",
-    "lowlight",
-    "lowlives",
-    "loyalest",
-    "loyalism",
-    "lubberly",
-    "lubrical",
-    "lucarnes",
-    "lucences",
-    "lucently",
-    "lucernes",
-    "lucifers",
-    "luckless",
-    "luculent",
-    "luggages",
-    "lugsails",
-    "lugworms",
-    "lumbagos",
-    "lumbered",
-    "lumberer",
-    "lumberly",
-    "luminism",
-    "luminist",
-    "lummoxes",
-    "lumpfish",
-    "lumpiest",
-    "lunacies",
-    "lunarian",
-    "lunately",
-    "lunation",
-    "lunchers",
-    "lunching",
-    "lunettes",
-    "lungfish",
-    "lungfuls",
-    "lungworm",
-    "lungwort",
-    "lunkhead",
-    "lunulate",
-    "lupanars",
-    "lupulins",
-    "lurchers",
-    "lurching",
-    "lurdanes",
-    "luringly",
-    "lushness",
-    "lustered",
-    "lustiest",
-    "lustrate",
-    "lustring",
-    "lustrums",
-    "lutanist",
-    "lutecium",
-    "lutefisk",
-    "lutenist",
-    "luteolin",
-    "lutetium",
-    "lutfisks",
-    "lutherns",
-    "luthiers",
-    "luxating",
-    "luxation",
-    "lycopods",
-    "lyddites",
-    "lynchers",
-    "lynchpin",
-    "lyophile",
-    "lyrately",
-    "lyrebird",
-    "lyricise",
-    "lyricize",
-    "lyricons",
-    "lyriform",
-    "lysogens",
-    "lysogeny",
-    "lysosome",
-    "macadams",
-    "macaroon",
-    "maccabaw",
-    "maccaboy",
-    "maccoboy",
-    "macerate",
-    "machetes",
-    "machoism",
-    "machrees",
-    "machzors",
-    "mackling",
-    "macrames",
-    "macrural",
-    "macruran",
-    "maculate",
-    "maculing",
-    "macumbas",
-    "maddened",
-    "madeiras",
-    "maderize",
-    "madonnas",
-    "madrasah",
-    "madrasas",
-    "madrases",
-    "madrassa",
-    "madronas",
-    "madrones",
-    "madronos",
-    "madwoman",
-    "madwomen",
-    "madworts",
-    "madzoons",
-    "maenades",
-    "maenadic",
-    "maestoso",
-    "maestros",
-    "mafficks",
-    "mafiosos",
-    "magalogs",
-    "magentas",
-    "magicked",
-    "magnates",
-    "magnesic",
-    "magneton",
-    "magnetos",
-    "magnific",
-    "maharani",
-    "mahatmas",
-    "mahimahi",
-    "mahjongs",
-    "mahonias",
-    "mahuangs",
-    "mahzorim",
-    "maiasaur",
-    "maidenly",
-    "maidhood",
-    "maieutic",
-    "mailable",
-    "mailbags",
-    "mailgram",
-    "mailless",
-    "maillots",
-    "mainmast",
-    "maintops",
-    "maiolica",
-    "majaguas",
-    "makeable",
-    "makebate",
-    "makefast",
-    "makimono",
-    "malaccas",
-    "malaises",
-    "malangas",
-    "malapert",
-    "malaprop",
-    "malarian",
-    "malarias",
-    "malarkey",
-    "malaroma",
-    "maleates",
-    "maledict",
-    "malemiut",
-    "malemute",
-    "maleness",
-    "maligner",
-    "malignly",
-    "malihini",
-    "malinger",
-    "malisons",
-    "malleoli",
-    "mallings",
-    "malmiest",
-    "malmseys",
-    "malodors",
-    "malposed",
-    "maltases",
-    "maltiest",
-    "maltoses",
-    "maltreat",
-    "maltster",
-    "malvasia",
-    "mamaliga",
-    "mamboing",
-    "mameluke",
-    "mammatus",
-    "mammered",
-    "mammilla",
-    "mammitis",
-    "mammocks",
-    "mammoths",
-    "manacled",
-    "manacles",
-    "manakins",
-    "manatoid",
-    "manchets",
-    "manciple",
-    "mandalic",
-    "mandator",
-    "mandioca",
-    "mandolas",
-    "mandrels",
-    "mandrill",
-    "mandrils",
-    "maneless",
-    "manfully",
-    "mangabey",
-    "manganic",
-    "manganin",
-    "mangiest",
-    "manglers",
-    "mangolds",
-    "mangonel",
-    "manhoods",
-    "manhunts",
-    "manihots",
-    "manikins",
-    "manillas",
-    "manilles",
-    "maniocas",
-    "maniples",
-    "manitous",
-    "manliest",
-    "mannerly",
-    "mannikin",
-    "mannites",
-    "mannitic",
-    "mannoses",
-    "manorial",
-    "manropes",
-    "mansards",
-    "manteaus",
-    "manteaux",
-    "mantelet",
-    "mantilla",
-    "mantises",
-    "mantissa",
-    "mantlets",
-    "mantling",
-    "mantrams",
-    "mantraps",
-    "manubria",
-    "manumits",
-    "manurers",
-    "manurial",
-    "manuring",
-    "manwards",
-    "manyfold",
-    "mapmaker",
-    "mappable",
-    "maquilas",
-    "marabous",
-    "marabout",
-    "marantas",
-    "marascas",
-    "marasmic",
-    "marasmus",
-    "marauded",
-    "maravedi",
-    "marblers",
-    "marblier",
-    "marbling",
-    "marcatos",
-    "marchesa",
-    "marchesi",
-    "margaric",
-    "margarin",
-    "margents",
-    "margined",
-    "margrave",
-    "marimbas",
-    "marishes",
-    "markhoor",
-    "markhors",
-    "marksmen",
-    "marliest",
-    "marlines",
-    "marlings",
-    "marlites",
-    "marlitic",
-    "marmites",
-    "marmoset",
-    "marocain",
-    "marplots",
-    "marranos",
-    "marrieds",
-    "marriers",
-    "marrowed",
-    "marsalas",
-    "marshier",
-    "marsupia",
-    "martagon",
-    "martello",
-    "martinet",
-    "martlets",
-    "martyrly",
-    "mascaras",
-    "mashgiah",
-    "maskable",
-    "maskings",
-    "masklike",
-    "masoning",
-    "masquers",
-    "masscult",
-    "massedly",
-    "masseter",
-    "masseurs",
-    "massicot",
-    "massiest",
-    "mastabah",
-    "mastabas",
-    "mastiche",
-    "mastiffs",
-    "mastitic",
-    "mastixes",
-    "mastless",
-    "mastlike",
-    "mastoids",
-    "masurium",
-    "matadors",
-    "matchers",
-    "mateless",
-    "matelote",
-    "matelots",
-    "mateship",
-    "matildas",
-    "matiness",
-    "matrixes",
-    "matronal",
-    "matronly",
-    "mattedly",
-    "mattings",
-    "mattocks",
-    "mattoids",
-    "mattrass",
-    "maturate",
-    "maturely",
-    "maturers",
-    "maturest",
-    "matzoons",
-    "maumetry",
-    "maunders",
-    "maundies",
-    "mausolea",
-    "maxicoat",
-    "maxillae",
-    "maxillas",
-    "maximals",
-    "maximins",
-    "maximite",
-    "maxwells",
-    "mayapple",
-    "maybirds",
-    "mayoress",
-    "maypoles",
-    "mayweeds",
-    "mazaedia",
-    "mazelike",
-    "mazeltov",
-    "maziness",
-    "mazourka",
-    "mazurkas",
-    "mazzards",
-    "mbaqanga",
-    "meagerly",
-    "meagrely",
-    "mealiest",
-    "mealless",
-    "mealworm",
-    "mealybug",
-    "measlier",
-    "measurer",
-    "meathead",
-    "meatiest",
-    "meatuses",
-    "mechitza",
-    "meconium",
-    "medaling",
-    "medalled",
-    "medallic",
-    "meddlers",
-    "medevacs",
-    "medflies",
-    "medially",
-    "medianly",
-    "mediants",
-    "medicals",
-    "medicant",
-    "medicate",
-    "medicide",
-    "medigaps",
-    "medivacs",
-    "medullae",
-    "medullar",
-    "medullas",
-    "medusans",
-    "medusoid",
-    "meerkats",
-    "meetness",
-    "megabars",
-    "megabuck",
-    "megacity",
-    "megadeal",
-    "megadose",
-    "megadyne",
-    "megaflop",
-    "megahits",
-    "megalops",
-    "megaplex",
-    "megapode",
-    "megapods",
-    "megasses",
-    "megatons",
-    "megavolt",
-    "megillah",
-    "megillas",
-    "megilphs",
-    "meisters",
-    "melamdim",
-    "melanges",
-    "melanian",
-    "melanics",
-    "melanins",
-    "melanism",
-    "melanist",
-    "melanite",
-    "melanize",
-    "melanoid",
-    "melanous",
-    "melilite",
-    "melilots",
-    "melinite",
-    "melismas",
-    "mellific",
-    "mellowed",
-    "mellower",
-    "mellowly",
-    "melodeon",
-    "melodica",
-    "melodise",
-    "melodist",
-    "melodize",
-    "meltable",
-    "meltages",
-    "memsahib",
-    "menacers",
-    "menarche",
-    "menazons",
-    "mendable",
-    "mendigos",
-    "mendings",
-    "menfolks",
-    "menhaden",
-    "menially",
-    "meninges",
-    "meniscal",
-    "menology",
-    "menorahs",
-    "mensches",
-    "menseful",
-    "menstrua",
-    "mensural",
-    "menthene",
-    "menthols",
-    "mephitic",
-    "mephitis",
-    "mercapto",
-    "mercuric",
-    "mergence",
-    "meristic",
-    "meriting",
-    "meropias",
-    "merriest",
-    "mescluns",
-    "mesdames",
-    "meseemed",
-    "meshiest",
-    "meshugah",
-    "meshugga",
-    "meshugge",
-    "meshwork",
-    "mesially",
-    "mesmeric",
-    "mesnalty",
-    "mesocarp",
-    "mesoglea",
-    "mesomere",
-    "mesophyl",
-    "mesosome",
-    "mesotron",
-    "mesozoan",
-    "mesquits",
-    "messaged",
-    "messiahs",
-    "messiest",
-    "messmate",
-    "messuage",
-    "mestesos",
-    "mestinos",
-    "mestizas",
-    "mestizos",
-    "metaling",
-    "metalise",
-    "metalist",
-    "metalize",
-    "metalled",
-    "metamere",
-    "metamers",
-    "metatags",
-    "metazoal",
-    "metazoan",
-    "metazoic",
-    "metazoon",
-    "meterage",
-    "methadon",
-    "methanes",
-    "methodic",
-    "methoxyl",
-    "methylal",
-    "methylic",
-    "meticais",
-    "meticals",
-    "metisses",
-    "metonyms",
-    "metonymy",
-    "metopons",
-    "metrazol",
-    "metrists",
-    "metritis",
-    "meuniere",
-    "mezereon",
-    "mezereum",
-    "mezquite",
-    "mezquits",
-    "mezuzahs",
-    "mezuzoth",
-    "miaouing",
-    "miaowing",
-    "miasmata",
-    "miauling",
-    "micawber",
-    "micellae",
-    "micellar",
-    "micklest",
-    "microbar",
-    "microbic",
-    "microbus",
-    "microcap",
-    "microdot",
-    "microhms",
-    "microlux",
-    "micromho",
-    "micrurgy",
-    "midcults",
-    "middlers",
-    "midirons",
-    "midlifer",
-    "midlines",
-    "midlists",
-    "midlives",
-    "midmonth",
-    "midmosts",
-    "midnoons",
-    "midriffs",
-    "midships",
-    "midsoles",
-    "midspace",
-    "midstory",
-    "midtowns",
-    "midwatch",
-    "midweeks",
-    "midwifed",
-    "midwifes",
-    "midwived",
-    "midyears",
-    "miffiest",
-    "mignonne",
-    "mijnheer",
-    "miladies",
-    "mildened",
-    "mildewed",
-    "mildness",
-    "mileages",
-    "milesian",
-    "milesimo",
-    "milfoils",
-    "miliaria",
-    "militate",
-    "milkfish",
-    "milkiest",
-    "milkless",
-    "milkmaid",
-    "milkshed",
-    "milksops",
-    "milkwood",
-    "milkwort",
-    "millable",
-    "millages",
-    "millcake",
-    "milldams",
-    "milleped",
-    "milliard",
-    "milliare",
-    "milliary",
-    "millibar",
-    "millieme",
-    "milliers",
-    "milligal",
-    "millilux",
-    "millimes",
-    "millimho",
-    "milliner",
-    "millines",
-    "millings",
-    "milliohm",
-    "milliped",
-    "millirem",
-    "millpond",
-    "millrace",
-    "millruns",
-    "miltiest",
-    "mimeoing",
-    "mimetite",
-    "mimicker",
-    "minacity",
-    "minarets",
-    "minatory",
-    "minciest",
-    "mindsets",
-    "mineable",
-    "mingiest",
-    "minglers",
-    "minibars",
-    "minibike",
-    "minicabs",
-    "minicamp",
-    "minicams",
-    "minicars",
-    "minified",
-    "minifies",
-    "minikins",
-    "minilabs",
-    "minimals",
-    "minimill",
-    "minipark",
-    "minipill",
-    "minished",
-    "minishes",
-    "miniskis",
-    "minivers",
-    "minorcas",
-    "minoring",
-    "minsters",
-    "mintages",
-    "mintiest",
-    "minuends",
-    "minutest",
-    "minutial",
-    "minuting",
-    "minyanim",
-    "miquelet",
-    "miradors",
-    "mirepoix",
-    "miriness",
-    "mirkiest",
-    "mirliton",
-    "mirthful",
-    "misacted",
-    "misadapt",
-    "misadded",
-    "misagent",
-    "misaimed",
-    "misalign",
-    "misallot",
-    "misalter",
-    "misandry",
-    "misapply",
-    "misassay",
-    "misatone",
-    "misavers",
-    "misaward",
-    "misbegan",
-    "misbegin",
-    "misbegot",
-    "misbegun",
-    "misbills",
-    "misbinds",
-    "misbound",
-    "misbrand",
-    "misbuild",
-    "misbuilt",
-    "miscalls",
-    "miscarry",
-    "miscasts",
-    "mischose",
-    "miscible",
-    "miscited",
-    "miscites",
-    "misclaim",
-    "misclass",
-    "miscoded",
-    "miscodes",
-    "miscoins",
-    "miscolor",
-    "miscooks",
-    "miscount",
-    "miscuing",
-    "misdated",
-    "misdates",
-    "misdeals",
-    "misdealt",
-    "misdeems",
-    "misdials",
-    "misdoers",
-    "misdoing",
-    "misdoubt",
-    "misdrawn",
-    "misdraws",
-    "misdrive",
-    "misdrove",
-    "miseases",
-    "miseaten",
-    "misedits",
-    "misenrol",
-    "misenter",
-    "misentry",
-    "miserere",
-    "misevent",
-    "misfaith",
-    "misfeeds",
-    "misfield",
-    "misfiled",
-    "misfiles",
-    "misfired",
-    "misfires",
-    "misfocus",
-    "misforms",
-    "misframe",
-    "misgauge",
-    "misgiven",
-    "misgives",
-    "misgrade",
-    "misgraft",
-    "misgrown",
-    "misgrows",
-    "misguess",
-    "misguide",
-    "mishears",
-    "mishmash",
-    "mishmosh",
-    "misinfer",
-    "misinter",
-    "misjoins",
-    "misjudge",
-    "miskeeps",
-    "miskicks",
-    "misknown",
-    "misknows",
-    "mislabel",
-    "mislabor",
-    "mislayer",
-    "misleads",
-    "mislearn",
-    "mislight",
-    "misliked",
-    "misliker",
-    "mislikes",
-    "mislived",
-    "mislives",
-    "mislodge",
-    "mislying",
-    "mismakes",
-    "mismarks",
-    "mismated",
-    "mismates",
-    "mismeets",
-    "mismoved",
-    "mismoves",
-    "misnamed",
-    "misnames",
-    "misogamy",
-    "misology",
-    "misorder",
-    "mispaged",
-    "mispages",
-    "mispaint",
-    "misparse",
-    "misparts",
-    "mispatch",
-    "misplans",
-    "misplant",
-    "misplays",
-    "misplead",
-    "mispoint",
-    "mispoise",
-    "misprice",
-    "misprint",
-    "misprize",
-    "misquote",
-    "misraise",
-    "misrated",
-    "misrates",
-    "misreads",
-    "misrefer",
-    "misroute",
-    "misruled",
-    "misrules",
-    "missable",
-    "misseats",
-    "missends",
-    "misshape",
-    "missilry",
-    "missises",
-    "missives",
-    "missorts",
-    "missound",
-    "missouts",
-    "misspace",
-    "misspeak",
-    "misspell",
-    "misspelt",
-    "misspend",
-    "misspent",
-    "misspoke",
-    "misstamp",
-    "misstart",
-    "misstate",
-    "missteer",
-    "misstops",
-    "misstyle",
-    "missuits",
-    "missuses",
-    "mistaker",
-    "mistbows",
-    "misteach",
-    "mistends",
-    "misterms",
-    "misthink",
-    "misthrew",
-    "misthrow",
-    "mistiest",
-    "mistimed",
-    "mistimes",
-    "mistitle",
-    "mistouch",
-    "mistrace",
-    "mistrain",
-    "mistrals",
-    "mistreat",
-    "mistruth",
-    "mistryst",
-    "mistuned",
-    "mistunes",
-    "mistutor",
-    "mistypes",
-    "misunion",
-    "misusage",
-    "misusers",
-    "misvalue",
-    "miswords",
-    "miswrite",
-    "miswrote",
-    "misyoked",
-    "misyokes",
-    "miterers",
-    "mitering",
-    "miticide",
-    "mitogens",
-    "mitsvahs",
-    "mitsvoth",
-    "mittened",
-    "mittimus",
-    "mitzvoth",
-    "mixology",
-    "mizzling",
-    "moatlike",
-    "mobbisms",
-    "mobocrat",
-    "mochilas",
-    "mockable",
-    "mocktail",
-    "modelist",
-    "modeming",
-    "moderner",
-    "modernes",
-    "modernly",
-    "modester",
-    "modicums",
-    "modiolus",
-    "modishly",
-    "modistes",
-    "modulars",
-    "mofettes",
-    "moffette",
-    "moidores",
-    "moistens",
-    "moistest",
-    "moistful",
-    "mojarras",
-    "molality",
-    "molarity",
-    "moldable",
-    "moldered",
-    "moldiest",
-    "moldwarp",
-    "molehill",
-    "moltenly",
-    "molybdic",
-    "momently",
-    "momentos",
-    "monachal",
-    "monacids",
-    "monadism",
-    "monandry",
-    "monardas",
-    "monaxial",
-    "monaxons",
-    "monazite",
-    "monecian",
-    "monellin",
-    "monerans",
-    "monetise",
-    "moneybag",
-    "moneyers",
-    "moneyman",
-    "moneymen",
-    "mongeese",
-    "mongered",
-    "mongrels",
-    "monicker",
-    "monikers",
-    "monished",
-    "monishes",
-    "monistic",
-    "monition",
-    "monitive",
-    "monitory",
-    "monkeyed",
-    "monkhood",
-    "monoacid",
-    "monocarp",
-    "monocled",
-    "monocles",
-    "monocots",
-    "monocrat",
-    "monodies",
-    "monodist",
-    "monofils",
-    "monofuel",
-    "monogeny",
-    "monogerm",
-    "monoglot",
-    "monogyny",
-    "monohull",
-    "monokine",
-    "monologs",
-    "monology",
-    "monopode",
-    "monopody",
-    "monosome",
-    "monosomy",
-    "monotint",
-    "monsoons",
-    "monstera",
-    "montaged",
-    "montanes",
-    "monteros",
-    "monurons",
-    "moochers",
-    "mooching",
-    "moodiest",
-    "moonbows",
-    "mooncalf",
-    "moondust",
-    "mooneyes",
-    "moonfish",
-    "mooniest",
-    "moonless",
-    "moonlets",
-    "moonlike",
-    "moonport",
-    "moonsail",
-    "moonseed",
-    "moonsets",
-    "moonshot",
-    "moonward",
-    "moonwort",
-    "moorages",
-    "moorfowl",
-    "moorhens",
-    "mooriest",
-    "moorwort",
-    "mootness",
-    "mopboard",
-    "moperies",
-    "mopiness",
-    "mopingly",
-    "mopishly",
-    "moquette",
-    "morainal",
-    "moraines",
-    "morainic",
-    "moralise",
-    "moralism",
-    "moralist",
-    "moralize",
-    "morasses",
-    "moratory",
-    "morbific",
-    "morbilli",
-    "morceaux",
-    "mordancy",
-    "mordants",
-    "mordents",
-    "morelles",
-    "morellos",
-    "moreness",
-    "moresque",
-    "moroccos",
-    "moronism",
-    "moronity",
-    "morosely",
-    "morosity",
-    "morphias",
-    "morphins",
-    "morrions",
-    "morrises",
-    "morseled",
-    "mortared",
-    "morticed",
-    "mortices",
-    "mortised",
-    "mortiser",
-    "mortises",
-    "mortmain",
-    "mosasaur",
-    "moschate",
-    "moseying",
-    "moshavim",
-    "moshings",
-    "mossback",
-    "mossiest",
-    "mosslike",
-    "mostests",
-    "mothball",
-    "mothered",
-    "mothiest",
-    "mothlike",
-    "motional",
-    "motioner",
-    "motiving",
-    "motivity",
-    "motleyer",
-    "motliest",
-    "motorbus",
-    "motorcar",
-    "motordom",
-    "motorise",
-    "motorize",
-    "motorman",
-    "motormen",
-    "mottlers",
-    "mottling",
-    "mouching",
-    "mouchoir",
-    "moufflon",
-    "mouflons",
-    "moulages",
-    "mouldier",
-    "moulters",
-    "moulting",
-    "mounding",
-    "mounters",
-    "mousakas",
-    "mousiest",
-    "mousings",
-    "moussaka",
-    "moussing",
-    "mouthers",
-    "mouthier",
-    "mouthily",
-    "movables",
-    "moveably",
-    "moveless",
-    "moviedom",
-    "movieola",
-    "movingly",
-    "moviolas",
-    "mozettas",
-    "mozzetta",
-    "mozzette",
-    "mridanga",
-    "muchacho",
-    "muchness",
-    "mucidity",
-    "mucilage",
-    "mucinoid",
-    "mucinous",
-    "muckiest",
-    "muckluck",
-    "muckrake",
-    "muckworm",
-    "mucoidal",
-    "mucosity",
-    "mucrones",
-    "muddiest",
-    "muddlers",
-    "muddling",
-    "muddying",
-    "mudflaps",
-    "mudflats",
-    "mudflows",
-    "mudguard",
-    "mudholes",
-    "mudlarks",
-    "mudpacks",
-    "mudpuppy",
-    "mudrocks",
-    "mudrooms",
-    "mudsills",
-    "mudslide",
-    "mueddins",
-    "muezzins",
-    "muffling",
-    "muggiest",
-    "muggings",
-    "mugworts",
-    "mugwumps",
-    "mulattos",
-    "mulcting",
-    "muleteer",
-    "mulishly",
-    "mulleins",
-    "mullions",
-    "mullites",
-    "mullocks",
-    "mullocky",
-    "multicar",
-    "multiday",
-    "multifid",
-    "multijet",
-    "multiped",
-    "multiton",
-    "multiuse",
-    "multures",
-    "mumblers",
-    "mummying",
-    "mundungo",
-    "mungoose",
-    "muniment",
-    "munnions",
-    "muntings",
-    "muntjacs",
-    "muntjaks",
-    "muoniums",
-    "muraenid",
-    "muralist",
-    "muralled",
-    "murderee",
-    "muriated",
-    "muriates",
-    "muricate",
-    "murkiest",
-    "murmurer",
-    "murphies",
-    "murrains",
-    "murrelet",
-    "murrhine",
-    "murthers",
-    "muscadel",
-    "muscadet",
-    "muscatel",
-    "muscling",
-    "musettes",
-    "mushiest",
-    "musicked",
-    "musingly",
-    "musketry",
-    "muskiest",
-    "muskoxen",
-    "muskrats",
-    "muskroot",
-    "muspikes",
-    "musquash",
-    "mussiest",
-    "mustardy",
-    "mustelid",
-    "mustiest",
-    "mutative",
-    "mutchkin",
-    "muteness",
-    "muticous",
-    "mutilate",
-    "mutineer",
-    "mutinied",
-    "mutinies",
-    "mutining",
-    "mutinous",
-    "mutterer",
-    "muzziest",
-    "muzzlers",
-    "muzzling",
-    "myalgias",
-    "mycelial",
-    "mycelian",
-    "mycelium",
-    "myceloid",
-    "mycetoma",
-    "myelines",
-    "myelinic",
-    "myelitis",
-    "myelomas",
-    "mylonite",
-    "mynheers",
-    "myoblast",
-    "myogenic",
-    "myograph",
-    "myologic",
-    "myoscope",
-    "myositis",
-    "myosotes",
-    "myosotis",
-    "myotomes",
-    "myotonia",
-    "myotonic",
-    "myriapod",
-    "myriopod",
-    "myrmidon",
-    "mystagog",
-    "mysticly",
-    "mythiest",
-    "myxameba",
-    "myxedema",
-    "myxocyte",
-    "myxomata",
-    "nabobery",
-    "nabobess",
-    "nabobish",
-    "nabobism",
-    "nacelles",
-    "nacreous",
-    "naething",
-    "naggiest",
-    "nailfold",
-    "nailhead",
-    "nailsets",
-    "nainsook",
-    "naivetes",
-    "nakedest",
-    "nameable",
-    "nametags",
-    "nandinas",
-    "nankeens",
-    "nannyish",
-    "nanogram",
-    "nanowatt",
-    "napalmed",
-    "naperies",
-    "naphthas",
-    "naphthol",
-    "naphthyl",
-    "naphtols",
-    "napiform",
-    "nappiest",
-    "narceine",
-    "narceins",
-    "narcisms",
-    "narcissi",
-    "narcists",
-    "narcomas",
-    "narcoses",
-    "narcosis",
-    "narghile",
-    "nargileh",
-    "nargiles",
-    "narrater",
-    "narwhale",
-    "narwhals",
-    "nasalise",
-    "nasalism",
-    "nasality",
-    "nasalize",
-    "nascence",
-    "nascency",
-    "natality",
-    "natantly",
-    "natation",
-    "natatory",
-    "nathless",
-    "nativism",
-    "nativist",
-    "natriums",
-    "nattered",
-    "nattiest",
-    "naumachy",
-    "nauplial",
-    "nauplius",
-    "nauseant",
-    "nauseate",
-    "nautches",
-    "navettes",
-    "navicert",
-    "naysayer",
-    "nazified",
-    "nazifies",
-    "nearlier",
-    "nearside",
-    "neatened",
-    "neatherd",
-    "neatniks",
-    "nebbishy",
-    "nebulise",
-    "nebulize",
-    "nebulose",
-    "neckband",
-    "neckings",
-    "neckless",
-    "necklike",
-    "necrosed",
-    "necroses",
-    "needfuls",
-    "neediest",
-    "needlers",
-    "needling",
-    "negaters",
-    "negatons",
-    "negators",
-    "negatron",
-    "negligee",
-    "negliges",
-    "negroids",
-    "negronis",
-    "neighing",
-    "nektonic",
-    "nelumbos",
-    "neoliths",
-    "neologic",
-    "neomorph",
-    "neotenic",
-    "neoteric",
-    "neotypes",
-    "nepenthe",
-    "nephrism",
-    "nephrite",
-    "nephrons",
-    "nepotist",
-    "nerdiest",
-    "nereides",
-    "nerviest",
-    "nervines",
-    "nervings",
-    "nervules",
-    "nervures",
-    "nescient",
-    "nestable",
-    "nestlers",
-    "nestlike",
-    "netizens",
-    "netsukes",
-    "nettable",
-    "nettiest",
-    "nettings",
-    "nettlers",
-    "nettlier",
-    "nettling",
-    "neumatic",
-    "neurally",
-    "neuraxon",
-    "neurines",
-    "neuritic",
-    "neuromas",
-    "neuronic",
-    "neurosal",
-    "neuroses",
-    "neurulae",
-    "neurular",
-    "neurulas",
-    "neustons",
-    "newsbeat",
-    "newsgirl",
-    "newshawk",
-    "newsiest",
-    "newsless",
-    "newspeak",
-    "newwaver",
-    "niblicks",
-    "niceness",
-    "nickeled",
-    "nickelic",
-    "nickered",
-    "nickling",
-    "nicknack",
-    "nicotins",
-    "nictated",
-    "nictates",
-    "nidating",
-    "nidation",
-    "nidering",
-    "nidified",
-    "nidifies",
-    "niellist",
-    "nielloed",
-    "niffered",
-    "niftiest",
-    "nigellas",
-    "niggards",
-    "nigglers",
-    "nigglier",
-    "niggling",
-    "nighness",
-    "nighties",
-    "nightjar",
-    "nigrosin",
-    "nihilist",
-    "nihility",
-    "nilghais",
-    "nilghaus",
-    "nimblest",
-    "nimbused",
-    "nimbuses",
-    "ninebark",
-    "ninefold",
-    "ninepins",
-    "ninnyish",
-    "niobates",
-    "niobites",
-    "niobiums",
-    "nippiest",
-    "nirvanas",
-    "nirvanic",
-    "nitchies",
-    "niteries",
-    "nitinols",
-    "nitpicks",
-    "nitpicky",
-    "nitrated",
-    "nitrator",
-    "nitrided",
-    "nitrides",
-    "nitriles",
-    "nitrolic",
-    "nitrosyl",
-    "nittiest",
-    "nizamate",
-    "nobbiest",
-    "nobblers",
-    "nobbling",
-    "nobelium",
-    "noblemen",
-    "noblesse",
-    "nobodies",
-    "noctuids",
-    "noctules",
-    "noctuoid",
-    "nocturns",
-    "nodality",
-    "noddling",
-    "nodosity",
-    "nodulose",
-    "nodulous",
-    "noesises",
-    "noggings",
-    "noisette",
-    "noisiest",
-    "nomadism",
-    "nomarchs",
-    "nomarchy",
-    "nombrils",
-    "nominals",
-    "nomistic",
-    "nomogram",
-    "nomology",
-    "nonacids",
-    "nonactor",
-    "nonadult",
-    "nonagons",
-    "nonbanks",
-    "nonbasic",
-    "nonbeing",
-    "nonblack",
-    "nonbooks",
-    "nonbrand",
-    "nonclass",
-    "noncling",
-    "noncolas",
-    "noncolor",
-    "noncrime",
-    "nondairy",
-    "nondance",
-    "nonelect",
-    "nonelite",
-    "nonentry",
-    "nonequal",
-    "nonevent",
-    "nonfacts",
-    "nonfatty",
-    "nonfinal",
-    "nonfluid",
-    "nonfocal",
-    "nonglare",
-    "nongreen",
-    "nonguest",
-    "nonguilt",
-    "nonhardy",
-    "nonideal",
-    "nonimage",
-    "noninert",
-    "nonionic",
-    "nonissue",
-    "nonjuror",
-    "nonlabor",
-    "nonleafy",
-    "nonlegal",
-    "nonlevel",
-    "nonlives",
-    "nonloyal",
-    "nonlyric",
-    "nonmajor",
-    "nonmetal",
-    "nonmetro",
-    "nonmodal",
-    "nonmoney",
-    "nonmoral",
-    "nonmusic",
-    "nonnasal",
-    "nonnaval",
-    "nonnoble",
-    "nonnovel",
-    "nonobese",
-    "nonohmic",
-    "nonowner",
-    "nonpagan",
-    "nonpapal",
-    "nonparty",
-    "nonpasts",
-    "nonplays",
-    "nonpolar",
-    "nonprint",
-    "nonquota",
-    "nonrated",
-    "nonrigid",
-    "nonrival",
-    "nonroyal",
-    "nonrural",
-    "nonskeds",
-    "nonskier",
-    "nonsolar",
-    "nonsolid",
-    "nonstops",
-    "nonstory",
-    "nonstyle",
-    "nonsugar",
-    "nonsuits",
-    "nontaxes",
-    "nontidal",
-    "nontitle",
-    "nontonal",
-    "nontonic",
-    "nontrump",
-    "nontruth",
-    "nonuples",
-    "nonurban",
-    "nonusers",
-    "nonusing",
-    "nonvalid",
-    "nonviral",
-    "nonvital",
-    "nonvocal",
-    "nonvoter",
-    "nonwhite",
-    "nonwoody",
-    "nonwords",
-    "noodging",
-    "noodling",
-    "nooklike",
-    "noondays",
-    "noonings",
-    "noontide",
-    "noontime",
-    "nopalito",
-    "norlands",
-    "normande",
-    "normless",
-    "northers",
-    "nosebags",
-    "noseband",
-    "nosedive",
-    "nosedove",
-    "nosegays",
-    "noseless",
-    "noselike",
-    "nosiness",
-    "nosology",
-    "nostrums",
-    "notarize",
-    "notating",
-    "notchers",
-    "notecase",
-    "noteless",
-    "noticers",
-    "notornis",
-    "notturni",
-    "notturno",
-    "noumenal",
-    "noumenon",
-    "nounally",
-    "nounless",
-    "novalike",
-    "novelise",
-    "novelize",
-    "novercal",
-    "nowheres",
-    "nubbiest",
-    "nubblier",
-    "nubility",
-    "nubilose",
-    "nubilous",
-    "nucellar",
-    "nucellus",
-    "nucleate",
-    "nucleins",
-    "nucleoid",
-    "nucleole",
-    "nucleoli",
-    "nucleons",
-    "nuclidic",
-    "nudeness",
-    "nudicaul",
-    "nudities",
-    "nudnicks",
-    "nudzhing",
-    "nugatory",
-    "numberer",
-    "numbfish",
-    "numchuck",
-    "numerary",
-    "numerate",
-    "numinous",
-    "nummular",
-    "numskull",
-    "nunataks",
-    "nunchaku",
-    "nursings",
-    "nursling",
-    "nurtural",
-    "nurturer",
-    "nutating",
-    "nutation",
-    "nutbrown",
-    "nutcases",
-    "nutgalls",
-    "nutgrass",
-    "nuthouse",
-    "nutmeats",
-    "nutpicks",
-    "nutsedge",
-    "nutsiest",
-    "nuttiest",
-    "nuttings",
-    "nutwoods",
-    "nuzzlers",
-    "nuzzling",
-    "nylghais",
-    "nylghaus",
-    "nymphean",
-    "oafishly",
-    "oarlocks",
-    "oatcakes",
-    "oatmeals",
-    "obduracy",
-    "obdurate",
-    "obeahism",
-    "obeisant",
-    "obelised",
-    "obelises",
-    "obelisks",
-    "obelisms",
-    "obelized",
-    "obelizes",
-    "obeyable",
-    "oblately",
-    "oblation",
-    "oblatory",
-    "obligati",
-    "obligato",
-    "obligees",
-    "obligers",
-    "obligors",
-    "obliqued",
-    "obliques",
-    "oblongly",
-    "obscener",
-    "obscurer",
-    "obsesses",
-    "obsessor",
-    "obtainer",
-    "obtected",
-    "obtested",
-    "obtruded",
-    "obtruder",
-    "obtrudes",
-    "obtunded",
-    "obturate",
-    "obtusely",
-    "obtusest",
-    "obtusity",
-    "obverses",
-    "obverted",
-    "obviable",
-    "obviated",
-    "obviates",
-    "obviator",
-    "obvolute",
-    "ocarinas",
-    "occident",
-    "occipita",
-    "occiputs",
-    "occludes",
-    "occulted",
-    "occulter",
-    "occultly",
-    "oceanaut",
-    "ocellate",
-    "ochering",
-    "ocherous",
-    "ochreous",
-    "ocotillo",
-    "octagons",
-    "octangle",
-    "octanols",
-    "octantal",
-    "octarchy",
-    "octettes",
-    "octonary",
-    "octopods",
-    "octoroon",
-    "octupled",
-    "octuples",
-    "octuplet",
-    "octuplex",
-    "ocularly",
-    "oculists",
-    "odalisks",
-    "oddballs",
-    "oddments",
-    "odiously",
-    "odograph",
-    "odometry",
-    "odonates",
-    "odontoid",
-    "odorants",
-    "odorized",
-    "odorizes",
-    "odourful",
-    "odysseys",
-    "oecology",
-    "oedemata",
-    "oedipean",
-    "oeillade",
-    "oenology",
-    "oenomels",
-    "oersteds",
-    "oestrins",
-    "oestriol",
-    "oestrone",
-    "oestrous",
-    "oestrums",
-    "offbeats",
-    "offcasts",
-    "offerers",
-    "offishly",
-    "offloads",
-    "offprint",
-    "offramps",
-    "offstage",
-    "offtrack",
-    "oftenest",
-    "ofttimes",
-    "oghamist",
-    "ogreisms",
-    "ogresses",
-    "ogrishly",
-    "ohmmeter",
-    "oilbirds",
-    "oilcamps",
-    "oilcloth",
-    "oilholes",
-    "oiliness",
-    "oilpaper",
-    "oilproof",
-    "oilskins",
-    "oilstone",
-    "oiltight",
-    "oinology",
-    "oinomels",
-    "oiticica",
-    "okeydoke",
-    "oldsquaw",
-    "oldsters",
-    "oldstyle",
-    "oldwives",
-    "oleaster",
-    "olefines",
-    "olefinic",
-    "olestras",
-    "olibanum",
-    "olicooks",
-    "oligarch",
-    "oligomer",
-    "oliguria",
-    "olivines",
-    "olivinic",
-    "ologists",
-    "olorosos",
-    "omentums",
-    "omicrons",
-    "omikrons",
-    "omissive",
-    "omitters",
-    "omniarch",
-    "omniform",
-    "omnimode",
-    "omnivora",
-    "omnivore",
-    "omophagy",
-    "omphalos",
-    "onanisms",
-    "onanists",
-    "oncidium",
-    "ondogram",
-    "oneriest",
-    "onloaded",
-    "onlooker",
-    "onrushes",
-    "onstream",
-    "oogamete",
-    "oogamies",
-    "oogamous",
-    "oogenies",
-    "oogonial",
-    "oogonium",
-    "oolachan",
-    "oologies",
-    "oologist",
-    "oomiacks",
-    "oompahed",
-    "oophytes",
-    "oophytic",
-    "oosperms",
-    "oosphere",
-    "oospores",
-    "oosporic",
-    "oothecae",
-    "oothecal",
-    "ooziness",
-    "opalesce",
-    "opalines",
-    "opaquely",
-    "opaquest",
-    "opaquing",
-    "openable",
-    "opencast",
-    "openwork",
-    "operably",
-    "operants",
-    "opercele",
-    "opercula",
-    "opercule",
-    "ophidian",
-    "opiating",
-    "opiumism",
-    "opossums",
-    "oppidans",
-    "oppilant",
-    "oppilate",
-    "opposers",
-    "oppugned",
-    "oppugner",
-    "opsonify",
-    "opsonins",
-    "opsonize",
-    "optative",
-    "opticist",
-    "optimums",
-    "opulency",
-    "opuntias",
-    "opuscula",
-    "opuscule",
-    "oquassas",
-    "oracular",
-    "oralisms",
-    "oralists",
-    "orangery",
-    "orangier",
-    "orangish",
-    "orations",
-    "oratress",
-    "orbiters",
-    "orchises",
-    "orchitic",
-    "orchitis",
-    "orcinols",
-    "ordainer",
-    "orderers",
-    "ordinals",
-    "ordinand",
-    "ordurous",
-    "orective",
-    "oreganos",
-    "oreodont",
-    "organdie",
-    "organons",
-    "organums",
-    "organzas",
-    "orgasmed",
-    "orgastic",
-    "orgiasts",
-    "orgulous",
-    "oribatid",
-    "orienter",
-    "origamis",
-    "origanum",
-    "orinasal",
-    "ornately",
-    "ornerier",
-    "ornithes",
-    "ornithic",
-    "orogenic",
-    "orometer",
-    "orphical",
-    "orphisms",
-    "orphreys",
-    "orpiment",
-    "orreries",
-    "orthicon",
-    "orthoepy",
-    "orthoses",
-    "orthosis",
-    "ortolans",
-    "oscinine",
-    "oscitant",
-    "osculant",
-    "osculate",
-    "osmosing",
-    "osmundas",
-    "osnaburg",
-    "ossature",
-    "ossetras",
-    "ossicles",
-    "ossified",
-    "ossifier",
-    "ossifies",
-    "osteitic",
-    "osteitis",
-    "osteoids",
-    "osteomas",
-    "osteoses",
-    "osteosis",
-    "ostinati",
-    "ostinato",
-    "ostiolar",
-    "ostioles",
-    "ostmarks",
-    "ostomate",
-    "ostomies",
-    "ostracod",
-    "ostracon",
-    "ostrakon",
-    "otalgias",
-    "otalgies",
-    "otiosely",
-    "otiosity",
-    "otitides",
-    "otitises",
-    "otocysts",
-    "otoliths",
-    "otoscope",
-    "otoscopy",
-    "ototoxic",
-    "ouabains",
-    "oughting",
-    "ouguiyas",
-    "ouistiti",
-    "outacted",
-    "outadded",
-    "outargue",
-    "outasked",
-    "outbacks",
-    "outbaked",
-    "outbakes",
-    "outbarks",
-    "outbawls",
-    "outbeams",
-    "outbitch",
-    "outblaze",
-    "outbleat",
-    "outbless",
-    "outbloom",
-    "outbluff",
-    "outblush",
-    "outboast",
-    "outboxed",
-    "outboxes",
-    "outbrags",
-    "outbrave",
-    "outbrawl",
-    "outbreed",
-    "outbribe",
-    "outbuild",
-    "outbuilt",
-    "outbulge",
-    "outbulks",
-    "outbully",
-    "outburns",
-    "outburnt",
-    "outcalls",
-    "outcaper",
-    "outcaste",
-    "outcatch",
-    "outcavil",
-    "outcharm",
-    "outcheat",
-    "outchide",
-    "outclass",
-    "outclimb",
-    "outclomb",
-    "outcoach",
-    "outcooks",
-    "outcount",
-    "outcrawl",
-    "outcried",
-    "outcries",
-    "outcross",
-    "outcrowd",
-    "outcrows",
-    "outcurse",
-    "outcurve",
-    "outdance",
-    "outdared",
-    "outdares",
-    "outdates",
-    "outdodge",
-    "outdoers",
-    "outdoing",
-    "outdrags",
-    "outdrank",
-    "outdrawn",
-    "outdraws",
-    "outdream",
-    "outdress",
-    "outdrink",
-    "outdrive",
-    "outdrops",
-    "outdrove",
-    "outdrunk",
-    "outduels",
-    "outearns",
-    "outeaten",
-    "outfable",
-    "outfaced",
-    "outfaces",
-    "outfasts",
-    "outfawns",
-    "outfeast",
-    "outfeels",
-    "outfence",
-    "outfight",
-    "outfinds",
-    "outfired",
-    "outfires",
-    "outflank",
-    "outflies",
-    "outfloat",
-    "outflown",
-    "outfools",
-    "outfoots",
-    "outfound",
-    "outfoxed",
-    "outfoxes",
-    "outfrown",
-    "outgains",
-    "outgazed",
-    "outgazes",
-    "outgiven",
-    "outgives",
-    "outglare",
-    "outgleam",
-    "outglows",
-    "outgnawn",
-    "outgnaws",
-    "outgrins",
-    "outgross",
-    "outgroup",
-    "outgrows",
-    "outguess",
-    "outguide",
-    "outhauls",
-    "outheard",
-    "outhears",
-    "outhomer",
-    "outhowls",
-    "outhumor",
-    "outhunts",
-    "outjumps",
-    "outkeeps",
-    "outkicks",
-    "outkills",
-    "outlands",
-    "outlasts",
-    "outlaugh",
-    "outlawry",
-    "outleads",
-    "outleaps",
-    "outleapt",
-    "outlearn",
-    "outliver",
-    "outlives",
-    "outloved",
-    "outloves",
-    "outmarch",
-    "outmatch",
-    "outmodes",
-    "outmoved",
-    "outmoves",
-    "outpaces",
-    "outpaint",
-    "outpitch",
-    "outplace",
-    "outplans",
-    "outplays",
-    "outplods",
-    "outplots",
-    "outpoint",
-    "outpolls",
-    "outports",
-    "outpours",
-    "outpower",
-    "outprays",
-    "outpreen",
-    "outpress",
-    "outprice",
-    "outpulls",
-    "outpunch",
-    "outpupil",
-    "outquote",
-    "outraced",
-    "outraces",
-    "outraise",
-    "outrance",
-    "outrange",
-    "outranks",
-    "outrated",
-    "outrates",
-    "outraved",
-    "outraves",
-    "outreads",
-    "outrider",
-    "outrides",
-    "outrings",
-    "outrival",
-    "outroars",
-    "outrocks",
-    "outrolls",
-    "outroots",
-    "outrowed",
-    "outsails",
-    "outsavor",
-    "outscold",
-    "outscoop",
-    "outscore",
-    "outscorn",
-    "outsells",
-    "outserts",
-    "outserve",
-    "outshame",
-    "outshine",
-    "outshone",
-    "outshoot",
-    "outshout",
-    "outsides",
-    "outsight",
-    "outsings",
-    "outsized",
-    "outsizes",
-    "outskate",
-    "outskirt",
-    "outsleep",
-    "outslept",
-    "outslick",
-    "outsmell",
-    "outsmelt",
-    "outsmile",
-    "outsmoke",
-    "outsnore",
-    "outsoars",
-    "outsoles",
-    "outspans",
-    "outspeak",
-    "outspeed",
-    "outspell",
-    "outspelt",
-    "outspend",
-    "outspent",
-    "outspoke",
-    "outstand",
-    "outstare",
-    "outstart",
-    "outstate",
-    "outstays",
-    "outsteer",
-    "outstood",
-    "outstrip",
-    "outstudy",
-    "outstunt",
-    "outsulks",
-    "outsware",
-    "outswear",
-    "outsweep",
-    "outswept",
-    "outswims",
-    "outswing",
-    "outswore",
-    "outsworn",
-    "outswung",
-    "outtalks",
-    "outtasks",
-    "outtells",
-    "outthank",
-    "outthink",
-    "outthrew",
-    "outthrob",
-    "outthrow",
-    "outtower",
-    "outtrade",
-    "outtrick",
-    "outtrots",
-    "outtrump",
-    "outturns",
-    "outvalue",
-    "outvaunt",
-    "outvoice",
-    "outvoted",
-    "outvotes",
-    "outvying",
-    "outwaits",
-    "outwalks",
-    "outwaste",
-    "outwatch",
-    "outwears",
-    "outweary",
-    "outweeps",
-    "outwhirl",
-    "outwiled",
-    "outwiles",
-    "outwills",
-    "outwinds",
-    "outworks",
-    "outwrite",
-    "outwrote",
-    "outyells",
-    "outyelps",
-    "outyield",
-    "ovalness",
-    "ovariole",
-    "ovaritis",
-    "ovenbird",
-    "ovenlike",
-    "ovenware",
-    "overable",
-    "overacts",
-    "overaged",
-    "overages",
-    "overarch",
-    "overarms",
-    "overawed",
-    "overawes",
-    "overbake",
-    "overbear",
-    "overbeat",
-    "overbets",
-    "overbids",
-    "overbill",
-    "overbite",
-    "overblew",
-    "overblow",
-    "overboil",
-    "overbold",
-    "overbook",
-    "overbore",
-    "overborn",
-    "overbred",
-    "overburn",
-    "overbusy",
-    "overbuys",
-    "overcall",
-    "overcold",
-    "overcook",
-    "overcool",
-    "overcram",
-    "overcrop",
-    "overcure",
-    "overcuts",
-    "overdare",
-    "overdear",
-    "overdeck",
-    "overdoer",
-    "overdoes",
-    "overdogs",
-    "overdraw",
-    "overdrew",
-    "overdubs",
-    "overdyed",
-    "overdyer",
-    "overdyes",
-    "overeasy",
-    "overeats",
-    "overedit",
-    "overfast",
-    "overfear",
-    "overfeed",
-    "overfill",
-    "overfish",
-    "overflew",
-    "overfond",
-    "overfoul",
-    "overfree",
-    "overfund",
-    "overgild",
-    "overgilt",
-    "overgird",
-    "overgirt",
-    "overglad",
-    "overgoad",
-    "overgrew",
-    "overgrow",
-    "overhand",
-    "overhard",
-    "overhate",
-    "overheap",
-    "overhear",
-    "overheld",
-    "overhigh",
-    "overhold",
-    "overholy",
-    "overhope",
-    "overhung",
-    "overhunt",
-    "overhype",
-    "overidle",
-    "overjoys",
-    "overjust",
-    "overkeen",
-    "overkind",
-    "overlade",
-    "overlain",
-    "overlate",
-    "overleap",
-    "overlend",
-    "overlent",
-    "overlets",
-    "overlewd",
-    "overlies",
-    "overlive",
-    "overlong",
-    "overloud",
-    "overlove",
-    "overlush",
-    "overmans",
-    "overmany",
-    "overmeek",
-    "overmelt",
-    "overmild",
-    "overmilk",
-    "overmine",
-    "overmuch",
-    "overnear",
-    "overneat",
-    "overnice",
-    "overpack",
-    "overpast",
-    "overpays",
-    "overpert",
-    "overplan",
-    "overplot",
-    "overplus",
-    "overpump",
-    "overrank",
-    "overrash",
-    "overrate",
-    "overrich",
-    "overrife",
-    "overripe",
-    "overrode",
-    "overrude",
-    "overruff",
-    "oversale",
-    "oversalt",
-    "oversave",
-    "overseed",
-    "oversell",
-    "oversets",
-    "oversewn",
-    "oversews",
-    "overshoe",
-    "overshot",
-    "oversick",
-    "overside",
-    "overslip",
-    "overslow",
-    "oversoak",
-    "oversoft",
-    "oversoon",
-    "oversoul",
-    "overspin",
-    "overstay",
-    "overstep",
-    "overstir",
-    "oversuds",
-    "oversups",
-    "oversure",
-    "overtalk",
-    "overtame",
-    "overtart",
-    "overtask",
-    "overthin",
-    "overtips",
-    "overtire",
-    "overtoil",
-    "overtops",
-    "overtrim",
-    "overurge",
-    "overuses",
-    "overvote",
-    "overwarm",
-    "overwary",
-    "overweak",
-    "overwear",
-    "overween",
-    "overwets",
-    "overwide",
-    "overwily",
-    "overwind",
-    "overwise",
-    "overword",
-    "overwore",
-    "overworn",
-    "overzeal",
-    "ovicidal",
-    "ovicides",
-    "oviducal",
-    "oviducts",
-    "oviposit",
-    "ovoidals",
-    "ovulated",
-    "ovulates",
-    "owlishly",
-    "oxalated",
-    "oxalates",
-    "oxalises",
-    "oxazepam",
-    "oxazines",
-    "oxbloods",
-    "oxhearts",
-    "oxidable",
-    "oxidases",
-    "oxidasic",
-    "oxidated",
-    "oxidates",
-    "oxidised",
-    "oxidiser",
-    "oxidises",
-    "oxidizes",
-    "oximeter",
-    "oxpecker",
-    "oxtongue",
-    "oxyacids",
-    "oxygenic",
-    "oxyphile",
-    "oxyphils",
-    "oxysalts",
-    "oxysomes",
-    "oxytocic",
-    "oxytones",
-    "oystered",
-    "oysterer",
-    "ozonated",
-    "ozonates",
-    "ozonides",
-    "ozonised",
-    "ozonises",
-    "ozonized",
-    "ozonizer",
-    "ozonizes",
-    "pabulums",
-    "pachadom",
-    "pachalic",
-    "pachisis",
-    "pachouli",
-    "pachucos",
-    "pacified",
-    "pacifies",
-    "packable",
-    "packeted",
-    "packness",
-    "packsack",
-    "pactions",
-    "paddings",
-    "padishah",
-    "padrones",
-    "padshahs",
-    "paduasoy",
-    "paeanism",
-    "paesanos",
-    "pagandom",
-    "paganise",
-    "paganish",
-    "paganist",
-    "paganize",
-    "pageboys",
-    "pagefuls",
-    "paginate",
-    "pagurian",
-    "pagurids",
-    "pahlavis",
-    "pahoehoe",
-    "pailfuls",
-    "paillard",
-    "pailsful",
-    "painches",
-    "paintier",
-    "paisanas",
-    "paisanos",
-    "paisleys",
-    "pajamaed",
-    "palatals",
-    "palavers",
-    "palazzos",
-    "paleface",
-    "paleness",
-    "paleosol",
-    "palestra",
-    "paletots",
-    "paleways",
-    "palewise",
-    "palfreys",
-    "palikars",
-    "palimony",
-    "palinode",
-    "palladia",
-    "palladic",
-    "palleted",
-    "pallette",
-    "palliate",
-    "pallidly",
-    "palliest",
-    "palliums",
-    "palmated",
-    "palmette",
-    "palmfuls",
-    "palmiest",
-    "palmists",
-    "palmitin",
-    "palmlike",
-    "palmtops",
-    "palmyras",
-    "palookas",
-    "palpably",
-    "palpated",
-    "palpates",
-    "palpator",
-    "palpebra",
-    "palships",
-    "palsying",
-    "paltered",
-    "palterer",
-    "paltrier",
-    "paltrily",
-    "paludism",
-    "pampeans",
-    "pamperer",
-    "pamperos",
-    "panacean",
-    "panaceas",
-    "panaches",
-    "panatela",
-    "panbroil",
-    "pancaked",
-    "pancetta",
-    "pandanus",
-    "pandects",
-    "pandered",
-    "panderer",
-    "pandoors",
-    "pandoras",
-    "pandores",
-    "pandours",
-    "pandowdy",
-    "panduras",
-    "pandying",
-    "paneless",
-    "panetela",
-    "panfried",
-    "panfries",
-    "pangenes",
-    "pangolin",
-    "pangrams",
-    "panhuman",
-    "panicled",
-    "panicles",
-    "panicums",
-    "panmixes",
-    "panmixia",
-    "panmixis",
-    "pannikin",
-    "panochas",
-    "panoches",
-    "panoptic",
-    "panpipes",
-    "pansophy",
-    "pantalet",
-    "pantiled",
-    "pantiles",
-    "pantofle",
-    "pantoums",
-    "pantsuit",
-    "papacies",
-    "papadams",
-    "papadoms",
-    "papadums",
-    "paperers",
-    "papering",
-    "paphians",
-    "papillae",
-    "papillar",
-    "papistic",
-    "papistry",
-    "papooses",
-    "pappadam",
-    "pappiest",
-    "pappoose",
-    "papricas",
-    "paprikas",
-    "papulose",
-    "papyrian",
-    "papyrine",
-    "parachor",
-    "paraders",
-    "paradors",
-    "paradrop",
-    "parafoil",
-    "paraform",
-    "paragoge",
-    "paragons",
-    "parakite",
-    "paralyse",
-    "parament",
-    "paramour",
-    "paranoea",
-    "paranoic",
-    "parapets",
-    "paraquet",
-    "parasail",
-    "parasang",
-    "parashah",
-    "parashot",
-    "paravane",
-    "parawing",
-    "parazoan",
-    "parbaked",
-    "parbakes",
-    "parboils",
-    "parceled",
-    "parcener",
-    "parchesi",
-    "parching",
-    "parchisi",
-    "parclose",
-    "pardners",
-    "pardoner",
-    "parecism",
-    "pareiras",
-    "parented",
-    "parergon",
-    "paretics",
-    "parfaits",
-    "parflesh",
-    "parfocal",
-    "pargeted",
-    "pargings",
-    "parhelia",
-    "parhelic",
-    "parietes",
-    "parities",
-    "parkades",
-    "parkette",
-    "parkings",
-    "parklike",
-    "parkways",
-    "parlando",
-    "parlante",
-    "parlayed",
-    "parleyed",
-    "parleyer",
-    "parodied",
-    "parodist",
-    "parolees",
-    "paroling",
-    "paronyms",
-    "paroquet",
-    "parosmia",
-    "parotids",
-    "parotoid",
-    "paroxysm",
-    "parquets",
-    "parridge",
-    "parriers",
-    "parritch",
-    "parroket",
-    "parroted",
-    "parroter",
-    "parrying",
-    "parsable",
-    "parsleys",
-    "parslied",
-    "parsnips",
-    "parsonic",
-    "partaken",
-    "partaker",
-    "partakes",
-    "parterre",
-    "partials",
-    "partible",
-    "partiers",
-    "partings",
-    "partitas",
-    "partizan",
-    "partlets",
-    "partyers",
-    "parvenue",
-    "parvenus",
-    "parvises",
-    "parvolin",
-    "paschals",
-    "pashadom",
-    "pashalic",
-    "pashalik",
-    "pasquils",
-    "passably",
-    "passades",
-    "passados",
-    "passaged",
-    "passbook",
-    "passerby",
-    "passible",
-    "passings",
-    "passkeys",
-    "passless",
-    "passuses",
-    "pasterns",
-    "pasteups",
-    "pasticci",
-    "pastiest",
-    "pastille",
-    "pastinas",
-    "pastises",
-    "pastitso",
-    "pastless",
-    "pastness",
-    "pastored",
-    "pastorly",
-    "pastrami",
-    "pastromi",
-    "pastural",
-    "pastured",
-    "pasturer",
-    "patagial",
-    "patagium",
-    "patamars",
-    "patchers",
-    "patchier",
-    "patchily",
-    "patellae",
-    "patellas",
-    "patentor",
-    "pathless",
-    "pathoses",
-    "patinaed",
-    "patinate",
-    "patining",
-    "patinize",
-    "patootie",
-    "patriate",
-    "patronal",
-    "patronly",
-    "patroons",
-    "pattamar",
-    "pattened",
-    "pattered",
-    "patterer",
-    "pattypan",
-    "patulent",
-    "patulous",
-    "pauldron",
-    "paunched",
-    "paunches",
-    "paupered",
-    "paviours",
-    "pavisers",
-    "pavisses",
-    "pavlovas",
-    "pavonine",
-    "pawkiest",
-    "pawnable",
-    "pawnages",
-    "pawnshop",
-    "paxwaxes",
-    "paybacks",
-    "paygrade",
-    "pazazzes",
-    "peacenik",
-    "peachers",
-    "peachier",
-    "peaching",
-    "peacoats",
-    "peacocky",
-    "peafowls",
-    "peakiest",
-    "peakless",
-    "peaklike",
-    "pearlash",
-    "pearlers",
-    "pearlier",
-    "pearling",
-    "pearlite",
-    "pearmain",
-    "peartest",
-    "pearwood",
-    "peascods",
-    "peasecod",
-    "peatiest",
-    "pebblier",
-    "pebbling",
-    "peccable",
-    "peccancy",
-    "peccavis",
-    "peckiest",
-    "pecorini",
-    "pecorino",
-    "pectases",
-    "pectates",
-    "pectines",
-    "pectized",
-    "pectizes",
-    "peculate",
-    "peculium",
-    "pedagogs",
-    "pedalers",
-    "pedalfer",
-    "pedalier",
-    "pedalled",
-    "pedaller",
-    "pedantry",
-    "pedately",
-    "peddlery",
-    "pederast",
-    "pedicabs",
-    "pedicels",
-    "pedicled",
-    "pedicles",
-    "pediform",
-    "pediment",
-    "pedipalp",
-    "pedocals",
-    "pedology",
-    "peduncle",
-    "peebeens",
-    "peekapoo",
-    "peelable",
-    "peelings",
-    "peephole",
-    "peerages",
-    "peesweep",
-    "peetweet",
-    "pegboard",
-    "pegboxes",
-    "peignoir",
-    "pekepoos",
-    "pelagial",
-    "pelagics",
-    "pelerine",
-    "pelisses",
-    "pellagra",
-    "pelletal",
-    "pelleted",
-    "pellicle",
-    "pellmell",
-    "pellucid",
-    "pelorian",
-    "pelorias",
-    "pelotons",
-    "peltasts",
-    "peltered",
-    "peltless",
-    "peltries",
-    "pelvises",
-    "pembinas",
-    "pemicans",
-    "pemmican",
-    "pemoline",
-    "penalise",
-    "penality",
-    "penanced",
-    "penances",
-    "penciler",
-    "pendents",
-    "pendular",
-    "penicils",
-    "penknife",
-    "penlight",
-    "penlites",
-    "pennames",
-    "pennated",
-    "pennines",
-    "pennoned",
-    "penoches",
-    "penology",
-    "penoncel",
-    "penpoint",
-    "pensters",
-    "penstock",
-    "pentanes",
-    "pentanol",
-    "pentarch",
-    "pentenes",
-    "pentodes",
-    "pentomic",
-    "pentosan",
-    "pentoses",
-    "penuches",
-    "penuchis",
-    "penuchle",
-    "penuckle",
-    "penuries",
-    "peonages",
-    "peonisms",
-    "peoplers",
-    "peopling",
-    "peperoni",
-    "peploses",
-    "peplumed",
-    "pepluses",
-    "peponida",
-    "peponium",
-    "pepperer",
-    "peppiest",
-    "pepsines",
-    "peptalks",
-    "peptidic",
-    "peptized",
-    "peptizer",
-    "peptizes",
-    "peptones",
-    "peptonic",
-    "peracids",
-    "percales",
-    "percepts",
-    "perchers",
-    "perching",
-    "percoids",
-    "perdured",
-    "perdures",
-    "peregrin",
-    "pereions",
-    "pereopod",
-    "perfecta",
-    "perfects",
-    "perfumer",
-    "perfuses",
-    "perianth",
-    "periapts",
-    "periblem",
-    "pericarp",
-    "pericope",
-    "periderm",
-    "peridial",
-    "peridium",
-    "peridots",
-    "perigeal",
-    "perigean",
-    "perigees",
-    "perigons",
-    "perigyny",
-    "periling",
-    "perillas",
-    "perilled",
-    "perilune",
-    "perineum",
-    "periodid",
-    "periotic",
-    "peripety",
-    "peripter",
-    "periques",
-    "perisarc",
-    "perishes",
-    "periwigs",
-    "perjured",
-    "perjurer",
-    "perjures",
-    "perkiest",
-    "perlites",
-    "perlitic",
-    "permeant",
-    "permuted",
-    "permutes",
-    "peroneal",
-    "perorate",
-    "peroxids",
-    "perpends",
-    "perpents",
-    "persalts",
-    "perspire",
-    "perspiry",
-    "pertness",
-    "perturbs",
-    "perusals",
-    "perusers",
-    "pervader",
-    "peskiest",
-    "pestered",
-    "pesterer",
-    "pesthole",
-    "pestiest",
-    "pestling",
-    "petabyte",
-    "petaline",
-    "petalled",
-    "petalody",
-    "petaloid",
-    "petalous",
-    "petcocks",
-    "petechia",
-    "petering",
-    "petiolar",
-    "petioled",
-    "petioles",
-    "petnaper",
-    "petrales",
-    "petrolic",
-    "petronel",
-    "petrosal",
-    "pettable",
-    "pettedly",
-    "pettiest",
-    "pettifog",
-    "pettings",
-    "pettling",
-    "petulant",
-    "petunias",
-    "petuntse",
-    "petuntze",
-    "pewterer",
-    "peytrals",
-    "peytrels",
-    "pfennige",
-    "pfennigs",
-    "phaetons",
-    "phalange",
-    "phallism",
-    "phallist",
-    "phantast",
-    "pharming",
-    "pharoses",
-    "phaseout",
-    "phasmids",
-    "phattest",
-    "phellems",
-    "phelonia",
-    "phenates",
-    "phenazin",
-    "phenetic",
-    "phenetol",
-    "phenixes",
-    "phenylic",
-    "phereses",
-    "pheresis",
-    "philabeg",
-    "philibeg",
-    "philomel",
-    "philters",
-    "philtred",
-    "philtres",
-    "philtrum",
-    "phimoses",
-    "phimosis",
-    "phimotic",
-    "phonated",
-    "phonates",
-    "phoneyed",
-    "phoniest",
-    "phonying",
-    "phorates",
-    "phoronid",
-    "phosgene",
-    "phosphid",
-    "phosphin",
-    "photoing",
-    "photomap",
-    "photopia",
-    "photopic",
-    "phratral",
-    "phratric",
-    "phreaked",
-    "phreaker",
-    "phreatic",
-    "phthalic",
-    "phthalin",
-    "phthises",
-    "phthisic",
-    "phthisis",
-    "phylaxis",
-    "phyleses",
-    "phylesis",
-    "phyletic",
-    "phyllary",
-    "phyllite",
-    "phyllode",
-    "phylloid",
-    "phyllome",
-    "phytanes",
-    "phytonic",
-    "piacular",
-    "piaffers",
-    "piaffing",
-    "pianisms",
-    "piasabas",
-    "piasavas",
-    "piassaba",
-    "piassava",
-    "piasters",
-    "piastres",
-    "pibrochs",
-    "picachos",
-    "picadors",
-    "picaroon",
-    "piccolos",
-    "piciform",
-    "pickadil",
-    "pickaxed",
-    "pickaxes",
-    "pickeers",
-    "picketed",
-    "picketer",
-    "pickiest",
-    "picklock",
-    "pickoffs",
-    "picloram",
-    "picnicky",
-    "picogram",
-    "picoline",
-    "picolins",
-    "picomole",
-    "picotees",
-    "picoting",
-    "picowave",
-    "picquets",
-    "picrated",
-    "picrates",
-    "picrites",
-    "picritic",
-    "piddlers",
-    "piddling",
-    "piddocks",
-    "piebalds",
-    "piecings",
-    "piecrust",
-    "piedfort",
-    "pieforts",
-    "pieholes",
-    "pieplant",
-    "piercers",
-    "pierrots",
-    "pietisms",
-    "pietists",
-    "piffling",
-    "pigboats",
-    "piggiest",
-    "pignolia",
-    "pignolis",
-    "pigskins",
-    "pigsneys",
-    "pigstick",
-    "pigsties",
-    "pigweeds",
-    "pilaster",
-    "pilchard",
-    "pileated",
-    "pileless",
-    "pilewort",
-    "pilfered",
-    "pilferer",
-    "piliform",
-    "pillaged",
-    "pillager",
-    "pillages",
-    "pillared",
-    "pillions",
-    "pillowed",
-    "pilosity",
-    "pilsener",
-    "pilsners",
-    "pimentos",
-    "pimiento",
-    "pimplier",
-    "pinaster",
-    "pinballs",
-    "pinbones",
-    "pinchbug",
-    "pincheck",
-    "pinchers",
-    "pindling",
-    "pineland",
-    "pinelike",
-    "pineries",
-    "pinesaps",
-    "pinfolds",
-    "pingrass",
-    "pinheads",
-    "pinholes",
-    "pinioned",
-    "pinitols",
-    "pinkened",
-    "pinkeyes",
-    "pinkings",
-    "pinkness",
-    "pinkroot",
-    "pinnaces",
-    "pinnated",
-    "pinniped",
-    "pinnulae",
-    "pinnular",
-    "pinnules",
-    "pinocles",
-    "pinprick",
-    "pintadas",
-    "pintados",
-    "pintails",
-    "pintanos",
-    "pintsize",
-    "pinwales",
-    "pinweeds",
-    "pinworks",
-    "pinworms",
-    "pipeages",
-    "pipefish",
-    "pipefuls",
-    "pipeless",
-    "pipelike",
-    "piperine",
-    "pipestem",
-    "pipetted",
-    "pipiness",
-    "pipingly",
-    "piquance",
-    "piquancy",
-    "piracies",
-    "piraguas",
-    "pirarucu",
-    "piriform",
-    "pirogies",
-    "pirogues",
-    "piroques",
-    "piroshki",
-    "pirozhki",
-    "pirozhok",
-    "piscator",
-    "piscinae",
-    "piscinal",
-    "piscinas",
-    "pishoges",
-    "pishogue",
-    "pisiform",
-    "pismires",
-    "pisolite",
-    "pisolith",
-    "pissants",
-    "pissoirs",
-    "pistache",
-    "pistoled",
-    "pistoles",
-    "pitahaya",
-    "pitapats",
-    "pitchier",
-    "pitchily",
-    "pitchman",
-    "pitchmen",
-    "pitchout",
-    "pitheads",
-    "pithiest",
-    "pithless",
-    "pitiable",
-    "pitiably",
-    "pitiless",
-    "pittance",
-    "pittings",
-    "pivotman",
-    "pivotmen",
-    "pixieish",
-    "pixiness",
-    "pizazzes",
-    "pizzazes",
-    "pizzazzy",
-    "pizzelle",
-    "placable",
-    "placably",
-    "placated",
-    "placater",
-    "placates",
-    "placeman",
-    "placemen",
-    "placidly",
-    "plackets",
-    "placoids",
-    "plafonds",
-    "plagiary",
-    "plaguers",
-    "plaguily",
-    "plainest",
-    "plaining",
-    "plaister",
-    "plaiters",
-    "plaiting",
-    "planaria",
-    "planches",
-    "planchet",
-    "planform",
-    "plangent",
-    "planking",
-    "plankter",
-    "planless",
-    "planosol",
-    "plantlet",
-    "planulae",
-    "planular",
-    "plashers",
-    "plashier",
-    "plashing",
-    "plasmins",
-    "plasmoid",
-    "plasmons",
-    "plastery",
-    "plastids",
-    "plastral",
-    "plastron",
-    "plastrum",
-    "platanes",
-    "plateaux",
-    "plateful",
-    "platiest",
-    "platinas",
-    "platings",
-    "platinic",
-    "platting",
-    "plaudits",
-    "plausive",
-    "playacts",
-    "playdate",
-    "playdays",
-    "playdown",
-    "playgoer",
-    "playless",
-    "playlets",
-    "playlike",
-    "playpens",
-    "playsuit",
-    "playwear",
-    "pleached",
-    "pleaches",
-    "pleaders",
-    "pleasers",
-    "pleaters",
-    "pleather",
-    "pleating",
-    "plebeian",
-    "plectron",
-    "plectrum",
-    "pledgees",
-    "pledgeor",
-    "pledgers",
-    "pledgets",
-    "pledgors",
-    "plenches",
-    "plenisms",
-    "plenists",
-    "plenties",
-    "pleonasm",
-    "pleopods",
-    "plessors",
-    "pleuston",
-    "plexuses",
-    "pliantly",
-    "plicated",
-    "plighted",
-    "plighter",
-    "plimsole",
-    "plimsoll",
-    "plimsols",
-    "plinkers",
-    "plinking",
-    "pliofilm",
-    "pliotron",
-    "pliskies",
-    "plodders",
-    "ploidies",
-    "plonking",
-    "plopping",
-    "plosions",
-    "plosives",
-    "plotless",
-    "plotline",
-    "plottage",
-    "plottier",
-    "plotties",
-    "plotzing",
-    "plougher",
-    "plowable",
-    "plowback",
-    "plowboys",
-    "plowhead",
-    "plowland",
-    "pluckers",
-    "pluckier",
-    "pluckily",
-    "pluggers",
-    "plugless",
-    "plugolas",
-    "plugugly",
-    "plumaged",
-    "plumages",
-    "plumbago",
-    "plumbery",
-    "plumbism",
-    "plumbous",
-    "plumbums",
-    "plumelet",
-    "plumiest",
-    "plumiped",
-    "plumlike",
-    "plummest",
-    "plummier",
-    "plumpens",
-    "plumpest",
-    "plumping",
-    "plumpish",
-    "plumular",
-    "plumules",
-    "plunders",
-    "plungers",
-    "plunkers",
-    "plunkier",
-    "plunking",
-    "plurally",
-    "plushest",
-    "plushier",
-    "plushily",
-    "plussage",
-    "plutonic",
-    "pluvials",
-    "pluviose",
-    "pluvious",
-    "plyingly",
-    "plywoods",
-    "poaceous",
-    "poachier",
-    "poblanos",
-    "pochards",
-    "pocketer",
-    "pockiest",
-    "pockmark",
-    "pocosens",
-    "pocosins",
-    "pocosons",
-    "podagral",
-    "podagras",
-    "podagric",
-    "podestas",
-    "podgiest",
-    "podocarp",
-    "podomere",
-    "podsolic",
-    "podzolic",
-    "poechore",
-    "poetised",
-    "poetiser",
-    "poetises",
-    "poetized",
-    "poetizer",
-    "poetizes",
-    "poetless",
-    "poetlike",
-    "poetries",
-    "pogonias",
-    "pogonips",
-    "pogromed",
-    "poinding",
-    "pointier",
-    "pointman",
-    "pointmen",
-    "poisoner",
-    "poitrels",
-    "pokeroot",
-    "pokeweed",
-    "pokiness",
-    "polarise",
-    "polarize",
-    "polarons",
-    "poleaxed",
-    "poleaxes",
-    "polecats",
-    "poleless",
-    "polemist",
-    "polemize",
-    "polentas",
-    "polestar",
-    "poleward",
-    "policers",
-    "politest",
-    "politick",
-    "polities",
-    "polkaing",
-    "pollacks",
-    "pollards",
-    "pollened",
-    "pollical",
-    "pollices",
-    "pollinia",
-    "pollinic",
-    "pollists",
-    "polliwog",
-    "pollocks",
-    "pollutes",
-    "pollywog",
-    "poloists",
-    "polonium",
-    "poltroon",
-    "polybrid",
-    "polycots",
-    "polyenes",
-    "polyenic",
-    "polygala",
-    "polygene",
-    "polygony",
-    "polygyny",
-    "polymath",
-    "polynyas",
-    "polyomas",
-    "polypary",
-    "polypeds",
-    "polypide",
-    "polypnea",
-    "polypods",
-    "polypody",
-    "polypoid",
-    "polypore",
-    "polypous",
-    "polysemy",
-    "polysome",
-    "polytene",
-    "polyteny",
-    "polytype",
-    "polyuria",
-    "polyuric",
-    "polyzoan",
-    "polyzoic",
-    "pomading",
-    "pomander",
-    "pomatums",
-    "pomfrets",
-    "pommeled",
-    "pomology",
-    "pompanos",
-    "ponchoed",
-    "ponderer",
-    "pondweed",
-    "poniards",
-    "pontifex",
-    "pontiffs",
-    "pontific",
-    "pooching",
-    "pooftahs",
-    "poofters",
-    "poolhall",
-    "poolroom",
-    "poorness",
-    "poortith",
-    "popcorns",
-    "popedoms",
-    "popeless",
-    "popelike",
-    "poperies",
-    "popinjay",
-    "popishly",
-    "poplitei",
-    "poplitic",
-    "popovers",
-    "poppadom",
-    "poppadum",
-    "poppling",
-    "porcinis",
-    "porkiest",
-    "porkpies",
-    "porkwood",
-    "porniest",
-    "porously",
-    "porridgy",
-    "portably",
-    "portaged",
-    "portages",
-    "portaled",
-    "portance",
-    "portapak",
-    "portends",
-    "portents",
-    "portered",
-    "porticos",
-    "portiere",
-    "portless",
-    "portlier",
-    "portress",
-    "portside",
-    "poshness",
-    "posingly",
-    "positing",
-    "posology",
-    "postages",
-    "postally",
-    "postanal",
-    "postbags",
-    "postbase",
-    "postboys",
-    "postburn",
-    "postcava",
-    "postcoup",
-    "postdate",
-    "postdive",
-    "postdrug",
-    "posteens",
-    "posterns",
-    "postface",
-    "postfire",
-    "postform",
-    "postheat",
-    "posthole",
-    "postiche",
-    "postique",
-    "postlude",
-    "postoral",
-    "postpose",
-    "postpunk",
-    "postrace",
-    "postriot",
-    "postshow",
-    "postsync",
-    "postteen",
-    "postured",
-    "posturer",
-    "potables",
-    "potashes",
-    "potassic",
-    "potation",
-    "potatory",
-    "potbelly",
-    "potboils",
-    "potbound",
-    "potences",
-    "potently",
-    "potheads",
-    "potheens",
-    "potherbs",
-    "pothered",
-    "potholed",
-    "pothooks",
-    "pothouse",
-    "potiches",
-    "potlache",
-    "potlines",
-    "potlucks",
-    "potshard",
-    "potsherd",
-    "potshots",
-    "potstone",
-    "pottages",
-    "potteens",
-    "pottered",
-    "potterer",
-    "pottiest",
-    "pouchier",
-    "pouching",
-    "poularde",
-    "poulards",
-    "poulters",
-    "poultice",
-    "pouncers",
-    "pouncing",
-    "poundage",
-    "poundals",
-    "pounders",
-    "pourable",
-    "poussies",
-    "poutiest",
-    "poutines",
-    "powderer",
-    "powwowed",
-    "poxvirus",
-    "pozzolan",
-    "praecipe",
-    "praedial",
-    "praefect",
-    "praelect",
-    "praetors",
-    "praisers",
-    "pralines",
-    "prancers",
-    "prandial",
-    "pranging",
-    "pranking",
-    "prankish",
-    "pratfall",
-    "prattled",
-    "prattler",
-    "prattles",
-    "prawners",
-    "prawning",
-    "praxises",
-    "preacted",
-    "preadapt",
-    "preadmit",
-    "preadopt",
-    "preadult",
-    "preallot",
-    "prealter",
-    "preapply",
-    "prearmed",
-    "preaudit",
-    "preavers",
-    "preaxial",
-    "prebaked",
-    "prebakes",
-    "prebasal",
-    "prebends",
-    "prebills",
-    "prebinds",
-    "prebirth",
-    "prebless",
-    "preboard",
-    "preboils",
-    "prebooks",
-    "prebound",
-    "prebuild",
-    "precasts",
-    "precavae",
-    "precaval",
-    "precents",
-    "precheck",
-    "prechill",
-    "prechose",
-    "precieux",
-    "precipes",
-    "precised",
-    "preciser",
-    "precises",
-    "precited",
-    "preclean",
-    "preclear",
-    "precoded",
-    "precodes",
-    "precooks",
-    "precools",
-    "precrash",
-    "precured",
-    "precures",
-    "predated",
-    "predawns",
-    "predeath",
-    "predella",
-    "predraft",
-    "predried",
-    "predries",
-    "predrill",
-    "predusks",
-    "preedits",
-    "preelect",
-    "preemies",
-    "preempts",
-    "preenact",
-    "preeners",
-    "preening",
-    "preerect",
-    "preexist",
-    "prefacer",
-    "prefaces",
-    "prefaded",
-    "prefades",
-    "prefects",
-    "prefight",
-    "prefiled",
-    "prefiles",
-    "prefired",
-    "prefires",
-    "prefixal",
-    "preflame",
-    "prefocus",
-    "preforms",
-    "prefrank",
-    "prefroze",
-    "prefunds",
-    "pregames",
-    "preggers",
-    "preguide",
-    "preheats",
-    "prehuman",
-    "prejudge",
-    "prelates",
-    "prelatic",
-    "prelects",
-    "prelegal",
-    "prelimit",
-    "prelives",
-    "preloads",
-    "preluded",
-    "preluder",
-    "prelunch",
-    "premedic",
-    "premixes",
-    "premolar",
-    "premolds",
-    "premoral",
-    "premorse",
-    "prenames",
-    "prenomen",
-    "prepacks",
-    "prepaste",
-    "prepaved",
-    "prepaves",
-    "prepense",
-    "preplace",
-    "preplans",
-    "preplant",
-    "preppier",
-    "preppies",
-    "preppily",
-    "prepregs",
-    "preprice",
-    "prepubes",
-    "prepubis",
-    "prepuces",
-    "prepunch",
-    "prepupae",
-    "prepupal",
-    "prepupas",
-    "prequels",
-    "preradio",
-    "prerenal",
-    "prerinse",
-    "presaged",
-    "presager",
-    "presages",
-    "presales",
-    "prescind",
-    "prescore",
-    "presells",
-    "preshape",
-    "preships",
-    "preshown",
-    "preshows",
-    "presider",
-    "presidia",
-    "presifts",
-    "presleep",
-    "preslice",
-    "presoaks",
-    "presolve",
-    "presorts",
-    "presplit",
-    "pressers",
-    "pressmen",
-    "pressors",
-    "pressrun",
-    "prestamp",
-    "presters",
-    "prestore",
-    "presumer",
-    "pretaped",
-    "pretapes",
-    "pretaste",
-    "pretells",
-    "preterit",
-    "preterms",
-    "pretests",
-    "pretexts",
-    "pretrain",
-    "pretreat",
-    "pretrims",
-    "prettied",
-    "pretties",
-    "prettify",
-    "prettily",
-    "pretyped",
-    "pretypes",
-    "preunion",
-    "preunite",
-    "prevalue",
-    "preverbs",
-    "prevised",
-    "previses",
-    "previsit",
-    "previsor",
-    "prevuing",
-    "prewarms",
-    "prewarns",
-    "preweigh",
-    "prewired",
-    "prewires",
-    "preworks",
-    "prewraps",
-    "priapean",
-    "priapism",
-    "priciest",
-    "prickers",
-    "prickets",
-    "prickier",
-    "pricking",
-    "prickled",
-    "prickles",
-    "prideful",
-    "priedieu",
-    "priested",
-    "priggery",
-    "prigging",
-    "priggish",
-    "priggism",
-    "prilling",
-    "primages",
-    "primatal",
-    "primeros",
-    "primines",
-    "primings",
-    "primmest",
-    "primming",
-    "primness",
-    "primping",
-    "primulas",
-    "primuses",
-    "princock",
-    "prinkers",
-    "prinking",
-    "printery",
-    "priorate",
-    "prioress",
-    "priories",
-    "priseres",
-    "prismoid",
-    "prisoned",
-    "prissier",
-    "prissies",
-    "prissily",
-    "prissing",
-    "pristane",
-    "privater",
-    "priviest",
-    "probands",
-    "probangs",
-    "probated",
-    "probates",
-    "procaine",
-    "procarps",
-    "prochain",
-    "prochein",
-    "proctors",
-    "procural",
-    "procurer",
-    "procures",
-    "prodders",
-    "prodrome",
-    "prodrugs",
-    "proemial",
-    "proettes",
-    "profaned",
-    "profaner",
-    "profanes",
-    "proffers",
-    "profiter",
-    "progeria",
-    "proggers",
-    "progging",
-    "prognose",
-    "prograde",
-    "prolabor",
-    "prolamin",
-    "prolines",
-    "prolixly",
-    "prologed",
-    "prolonge",
-    "promines",
-    "promisee",
-    "promiser",
-    "promisor",
-    "promoing",
-    "prompter",
-    "promulge",
-    "pronated",
-    "pronates",
-    "pronator",
-    "pronging",
-    "pronotum",
-    "proofers",
-    "propanes",
-    "propends",
-    "propenes",
-    "propenol",
-    "propense",
-    "propenyl",
-    "properer",
-    "prophage",
-    "prophase",
-    "propined",
-    "propines",
-    "propjets",
-    "proponed",
-    "propones",
-    "propound",
-    "proprium",
-    "propylic",
-    "propylon",
-    "prorates",
-    "prorogue",
-    "prosaism",
-    "prosaist",
-    "prosects",
-    "prosiest",
-    "prosomal",
-    "prosomas",
-    "prospers",
-    "prossies",
-    "prosties",
-    "prostyle",
-    "protamin",
-    "protases",
-    "protasis",
-    "protatic",
-    "proteans",
-    "protegee",
-    "proteges",
-    "proteide",
-    "proteids",
-    "protends",
-    "proteose",
-    "protists",
-    "protiums",
-    "protonic",
-    "protopod",
-    "protoxid",
-    "protract",
-    "protrade",
-    "protyles",
-    "proudful",
-    "prounion",
-    "provenly",
-    "proviral",
-    "provirus",
-    "provisos",
-    "provoker",
-    "provosts",
-    "prowlers",
-    "proxemic",
-    "pruinose",
-    "prunable",
-    "prunella",
-    "prunelle",
-    "prunello",
-    "prunuses",
-    "prurient",
-    "prurigos",
-    "pruritic",
-    "pryingly",
-    "psalming",
-    "psalmody",
-    "psalters",
-    "psaltery",
-    "psammite",
-    "psammons",
-    "pschents",
-    "psephite",
-    "pshawing",
-    "psilocin",
-    "psiloses",
-    "psilosis",
-    "psilotic",
-    "psoralea",
-    "psoralen",
-    "psyching",
-    "psyllids",
-    "pteropod",
-    "pterygia",
-    "pterylae",
-    "ptomaine",
-    "ptomains",
-    "ptyalins",
-    "ptyalism",
-    "pubertal",
-    "puccoons",
-    "puckerer",
-    "puddlers",
-    "puddlier",
-    "puddling",
-    "pudendal",
-    "pudendum",
-    "pudgiest",
-    "pudibund",
-    "puerpera",
-    "puffball",
-    "puffiest",
-    "pugarees",
-    "puggaree",
-    "puggiest",
-    "puggrees",
-    "puggries",
-    "pugilism",
-    "pugilist",
-    "pugmarks",
-    "puissant",
-    "pulicene",
-    "pulicide",
-    "pulingly",
-    "pullmans",
-    "pullouts",
-    "pulmonic",
-    "pulmotor",
-    "pulpally",
-    "pulpiest",
-    "pulpital",
-    "pulpless",
-    "pulpwood",
-    "pulsated",
-    "pulsates",
-    "pulsator",
-    "pulsejet",
-    "pulsions",
-    "pulsojet",
-    "pulvilli",
-    "pulvinar",
-    "pulvinus",
-    "pumicers",
-    "pumicing",
-    "pumicite",
-    "pummeled",
-    "pummelos",
-    "pumpless",
-    "pumplike",
-    "puncheon",
-    "punchers",
-    "punchier",
-    "punchily",
-    "punctate",
-    "punditic",
-    "pungency",
-    "pungling",
-    "puniness",
-    "punition",
-    "punitory",
-    "punkiest",
-    "punniest",
-    "punsters",
-    "puparial",
-    "puparium",
-    "pupating",
-    "pupation",
-    "pupilage",
-    "pupilary",
-    "puppydom",
-    "puppyish",
-    "purblind",
-    "pureeing",
-    "pureness",
-    "purflers",
-    "purfling",
-    "purgings",
-    "puristic",
-    "purities",
-    "purlieus",
-    "purlines",
-    "purlings",
-    "purloins",
-    "purplest",
-    "purpling",
-    "purpuras",
-    "purpures",
-    "purpuric",
-    "purpurin",
-    "pursiest",
-    "purslane",
-    "purtiest",
-    "purulent",
-    "purveyed",
-    "purviews",
-    "pushball",
-    "pushcart",
-    "pushdown",
-    "pushiest",
-    "pushover",
-    "pushpins",
-    "pushrods",
-    "pussiest",
-    "pussleys",
-    "pusslies",
-    "pusslike",
-    "pustular",
-    "pustuled",
-    "pustules",
-    "putamina",
-    "putdowns",
-    "putridly",
-    "putsches",
-    "puttered",
-    "putterer",
-    "puttiers",
-    "puttying",
-    "puzzlers",
-    "pyaemias",
-    "pycnidia",
-    "pycnoses",
-    "pycnosis",
-    "pycnotic",
-    "pyelitic",
-    "pyelitis",
-    "pygidial",
-    "pygidium",
-    "pygmaean",
-    "pygmyish",
-    "pygmyism",
-    "pyknoses",
-    "pyknosis",
-    "pyknotic",
-    "pyoderma",
-    "pyogenic",
-    "pyorrhea",
-    "pyralids",
-    "pyranoid",
-    "pyranose",
-    "pyrenoid",
-    "pyrexial",
-    "pyrexias",
-    "pyriform",
-    "pyritous",
-    "pyrogens",
-    "pyrolize",
-    "pyrology",
-    "pyrolyze",
-    "pyronine",
-    "pyrostat",
-    "pyroxene",
-    "pyrrhics",
-    "pyrroles",
-    "pyrrolic",
-    "pythonic",
-    "pyxidium",
-    "qabalahs",
-    "qindarka",
-    "quaalude",
-    "quackier",
-    "quacking",
-    "quackish",
-    "quackism",
-    "quadding",
-    "quadplex",
-    "quadrans",
-    "quadrate",
-    "quadrats",
-    "quadrics",
-    "quadriga",
-    "quadroon",
-    "quaestor",
-    "quaffers",
-    "quaffing",
-    "quaggier",
-    "quagmiry",
-    "quahaugs",
-    "quaiches",
-    "quailing",
-    "quainter",
-    "quaintly",
-    "quakiest",
-    "qualmier",
-    "qualmish",
-    "quandang",
-    "quandong",
-    "quantics",
-    "quanting",
-    "quantize",
-    "quantong",
-    "quarried",
-    "quarrier",
-    "quartans",
-    "quartern",
-    "quartics",
-    "quartzes",
-    "quashers",
-    "quashing",
-    "quassias",
-    "quassins",
-    "quatorze",
-    "quatrain",
-    "quavered",
-    "quaverer",
-    "quayages",
-    "quaylike",
-    "queasier",
-    "queasily",
-    "queazier",
-    "queendom",
-    "queening",
-    "queerest",
-    "queering",
-    "queerish",
-    "quellers",
-    "quelling",
-    "quencher",
-    "quenches",
-    "quenelle",
-    "quercine",
-    "queridas",
-    "queriers",
-    "querists",
-    "questers",
-    "questors",
-    "quetzals",
-    "quezales",
-    "quibbled",
-    "quibbler",
-    "quickens",
-    "quickset",
-    "quiddity",
-    "quidnunc",
-    "quietens",
-    "quieters",
-    "quieting",
-    "quietism",
-    "quietist",
-    "quillaia",
-    "quillais",
-    "quillaja",
-    "quillets",
-    "quilling",
-    "quincunx",
-    "quinelas",
-    "quinella",
-    "quiniela",
-    "quininas",
-    "quinines",
-    "quinnats",
-    "quinoids",
-    "quinolin",
-    "quinsied",
-    "quinsies",
-    "quintain",
-    "quintals",
-    "quintans",
-    "quintars",
-    "quintets",
-    "quintics",
-    "quintins",
-    "quippers",
-    "quippier",
-    "quipping",
-    "quippish",
-    "quipster",
-    "quirkier",
-    "quirkily",
-    "quirking",
-    "quirkish",
-    "quirting",
-    "quisling",
-    "quitches",
-    "quitrent",
-    "quitters",
-    "quittors",
-    "quivered",
-    "quiverer",
-    "quixotes",
-    "quixotry",
-    "quizzers",
-    "quoining",
-    "quoiting",
-    "quomodos",
-    "quotably",
-    "qurushes",
-    "rabbeted",
-    "rabbited",
-    "rabbiter",
-    "rabbitry",
-    "rabblers",
-    "rabbling",
-    "rabbonis",
-    "rabidity",
-    "rabietic",
-    "racemate",
-    "racemism",
-    "racemize",
-    "racemoid",
-    "racemose",
-    "racemous",
-    "racewalk",
-    "racheted",
-    "rachides",
-    "rachilla",
-    "rachises",
-    "rachitic",
-    "rachitis",
-    "raciness",
-    "racketed",
-    "rackfuls",
-    "rackwork",
-    "raclette",
-    "raddling",
-    "radiable",
-    "radialia",
-    "radiancy",
-    "radiants",
-    "radicand",
-    "radicate",
-    "radicels",
-    "radicles",
-    "radioing",
-    "radioman",
-    "radiomen",
-    "radiuses",
-    "radwaste",
-    "rafflers",
-    "raffling",
-    "raftered",
-    "raftsman",
-    "raftsmen",
-    "raggeder",
-    "raggedly",
-    "ragingly",
-    "ragouted",
-    "ragtimes",
-    "ragweeds",
-    "ragworts",
-    "railbird",
-    "railcars",
-    "railhead",
-    "raillery",
-    "raiments",
-    "rainband",
-    "rainbird",
-    "rainiest",
-    "rainless",
-    "rainouts",
-    "rainwash",
-    "raisable",
-    "raisings",
-    "raisonne",
-    "rakehell",
-    "rakeoffs",
-    "rakishly",
-    "ralliers",
-    "rallyist",
-    "ralphing",
-    "rambutan",
-    "ramekins",
-    "ramentum",
-    "ramequin",
-    "ramified",
-    "ramifies",
-    "ramiform",
-    "ramilies",
-    "ramillie",
-    "rammiest",
-    "ramosely",
-    "ramosity",
-    "rampaged",
-    "rampager",
-    "rampages",
-    "rampancy",
-    "rampikes",
-    "rampions",
-    "rampoles",
-    "ramshorn",
-    "ramtilla",
-    "ramulose",
-    "ramulous",
-    "ranchman",
-    "ranchmen",
-    "rancidly",
-    "rancored",
-    "rancours",
-    "randiest",
-    "rangiest",
-    "rankless",
-    "rankling",
-    "rankness",
-    "ranpikes",
-    "ransacks",
-    "ransomed",
-    "ransomer",
-    "rapacity",
-    "raphides",
-    "rapidest",
-    "rapiered",
-    "rapparee",
-    "rappeled",
-    "raptness",
-    "raptured",
-    "raptures",
-    "rarebits",
-    "rarefied",
-    "rarefier",
-    "rarefies",
-    "rareness",
-    "rareripe",
-    "rarified",
-    "rarifies",
-    "rasboras",
-    "rascally",
-    "rashlike",
-    "rashness",
-    "rasorial",
-    "raspiest",
-    "raspings",
-    "rassling",
-    "ratables",
-    "ratafees",
-    "ratafias",
-    "ratanies",
-    "rataplan",
-    "ratatats",
-    "rateably",
-    "ratfinks",
-    "ratholes",
-    "raticide",
-    "ratifier",
-    "rationed",
-    "ratlines",
-    "ratooned",
-    "ratooner",
-    "ratsbane",
-    "rattails",
-    "ratteens",
-    "rattened",
-    "rattener",
-    "rattiest",
-    "rattoons",
-    "rattraps",
-    "raunches",
-    "ravagers",
-    "ravaging",
-    "ravelers",
-    "raveling",
-    "ravelins",
-    "ravelled",
-    "raveller",
-    "raveners",
-    "ravening",
-    "ravigote",
-    "ravingly",
-    "ravining",
-    "raviolis",
-    "ravisher",
-    "ravishes",
-    "rawboned",
-    "rawhided",
-    "rawhides",
-    "raygrass",
-    "razeeing",
-    "razoring",
-    "reabsorb",
-    "reaccede",
-    "reaccent",
-    "reaccept",
-    "reaccuse",
-    "reachers",
-    "readably",
-    "readapts",
-    "readdict",
-    "readding",
-    "readerly",
-    "readiest",
-    "readmits",
-    "readopts",
-    "readorns",
-    "reaginic",
-    "realgars",
-    "realigns",
-    "realiser",
-    "realisms",
-    "realizer",
-    "reallots",
-    "realness",
-    "realters",
-    "realties",
-    "reanoint",
-    "reapable",
-    "reaphook",
-    "reargued",
-    "reargues",
-    "rearmice",
-    "rearming",
-    "rearmost",
-    "rearouse",
-    "rearrest",
-    "reascend",
-    "reascent",
-    "reassail",
-    "reassort",
-    "reassume",
-    "reattach",
-    "reattack",
-    "reattain",
-    "reavails",
-    "reavowed",
-    "reawaked",
-    "reawaken",
-    "reawakes",
-    "reawoken",
-    "rebaited",
-    "rebaters",
-    "rebating",
-    "rebegins",
-    "rebeldom",
-    "rebidden",
-    "rebilled",
-    "rebirths",
-    "reblends",
-    "reblooms",
-    "reboards",
-    "rebodied",
-    "rebodies",
-    "reboiled",
-    "rebooked",
-    "reboring",
-    "rebottle",
-    "rebought",
-    "rebranch",
-    "rebreeds",
-    "rebukers",
-    "rebuking",
-    "reburial",
-    "reburied",
-    "reburies",
-    "rebutter",
-    "rebutton",
-    "rebuying",
-    "recaller",
-    "recamier",
-    "recaning",
-    "recanted",
-    "recanter",
-    "recapped",
-    "recarpet",
-    "recement",
-    "recensor",
-    "rechange",
-    "recharts",
-    "recheats",
-    "rechecks",
-    "rechewed",
-    "rechoose",
-    "rechosen",
-    "recircle",
-    "recision",
-    "reciters",
-    "reckoner",
-    "reclaims",
-    "reclames",
-    "reclasps",
-    "recleans",
-    "reclined",
-    "reclines",
-    "reclothe",
-    "recluses",
-    "recoaled",
-    "recoated",
-    "recocked",
-    "recodify",
-    "recoiled",
-    "recoiler",
-    "recoined",
-    "recolors",
-    "recombed",
-    "reconfer",
-    "reconned",
-    "reconvey",
-    "recooked",
-    "recopied",
-    "recopies",
-    "recorked",
-    "recouped",
-    "recouple",
-    "recrated",
-    "recrates",
-    "recreant",
-    "recrowns",
-    "rectally",
-    "recurred",
-    "recurved",
-    "recurves",
-    "recusals",
-    "recusant",
-    "recusing",
-    "redactor",
-    "redamage",
-    "redargue",
-    "redating",
-    "redbaits",
-    "redbones",
-    "redbrick",
-    "redcoats",
-    "reddling",
-    "redecide",
-    "redefeat",
-    "redefect",
-    "redefied",
-    "redefies",
-    "redemand",
-    "redenied",
-    "redenies",
-    "redeploy",
-    "redhorse",
-    "redialed",
-    "redigest",
-    "redipped",
-    "redivide",
-    "redlined",
-    "redliner",
-    "redlines",
-    "redocked",
-    "redolent",
-    "redonned",
-    "redouble",
-    "redoubts",
-    "redounds",
-    "redpolls",
-    "redrafts",
-    "redrawer",
-    "redreams",
-    "redreamt",
-    "redrills",
-    "redriven",
-    "redrives",
-    "redroots",
-    "redrying",
-    "redshank",
-    "redstart",
-    "redtails",
-    "redubbed",
-    "reductor",
-    "reduviid",
-    "redwares",
-    "redwings",
-    "redyeing",
-    "reearned",
-    "reechier",
-    "reechoed",
-    "reechoes",
-    "reedbird",
-    "reedbuck",
-    "reediest",
-    "reedings",
-    "reedited",
-    "reedlike",
-    "reedling",
-    "reefable",
-    "reefiest",
-    "reejects",
-    "reekiest",
-    "reelable",
-    "reelects",
-    "reelings",
-    "reembark",
-    "reembody",
-    "reemerge",
-    "reemploy",
-    "reenacts",
-    "reendows",
-    "reengage",
-    "reenjoys",
-    "reenlist",
-    "reenroll",
-    "reenters",
-    "reequips",
-    "reerects",
-    "reesting",
-    "reevoked",
-    "reevokes",
-    "reexpels",
-    "reexport",
-    "reexpose",
-    "refallen",
-    "refasten",
-    "refected",
-    "refelled",
-    "refenced",
-    "refences",
-    "refights",
-    "refigure",
-    "refiling",
-    "refilmed",
-    "refilter",
-    "refiring",
-    "refitted",
-    "refixing",
-    "reflated",
-    "reflates",
-    "reflexed",
-    "reflexly",
-    "refloats",
-    "refloods",
-    "reflowed",
-    "reflower",
-    "refluent",
-    "refluxed",
-    "refluxes",
-    "reflying",
-    "refolded",
-    "reforest",
-    "reforged",
-    "reforges",
-    "refought",
-    "refounds",
-    "refracts",
-    "reframed",
-    "reframes",
-    "refreeze",
-    "refronts",
-    "refrozen",
-    "refrying",
-    "refueled",
-    "refuging",
-    "refugium",
-    "refunder",
-    "refusers",
-    "refusnik",
-    "refutals",
-    "refuters",
-    "regainer",
-    "regalers",
-    "regaling",
-    "regality",
-    "regather",
-    "regauged",
-    "regauges",
-    "regeared",
-    "regelate",
-    "regental",
-    "regicide",
-    "regilded",
-    "regiving",
-    "reglazed",
-    "reglazes",
-    "reglowed",
-    "regluing",
-    "regnancy",
-    "regolith",
-    "regorged",
-    "regorges",
-    "regosols",
-    "regraded",
-    "regrades",
-    "regrafts",
-    "regrants",
-    "regrated",
-    "regrates",
-    "regreens",
-    "regreets",
-    "regrinds",
-    "regrooms",
-    "regroove",
-    "reground",
-    "regroups",
-    "reguline",
-    "rehabbed",
-    "rehabber",
-    "rehammer",
-    "rehandle",
-    "rehanged",
-    "reharden",
-    "rehashed",
-    "rehashes",
-    "reheated",
-    "reheater",
-    "reheeled",
-    "rehemmed",
-    "rehinged",
-    "rehinges",
-    "rehiring",
-    "rehoboam",
-    "rehoused",
-    "rehouses",
-    "reifiers",
-    "reifying",
-    "reignite",
-    "reimaged",
-    "reimages",
-    "reimport",
-    "reimpose",
-    "reincite",
-    "reincurs",
-    "reindict",
-    "reinduce",
-    "reinduct",
-    "reinfect",
-    "reinform",
-    "reinfuse",
-    "reinject",
-    "reinjure",
-    "reinjury",
-    "reinking",
-    "reinless",
-    "reinsert",
-    "reinsman",
-    "reinsmen",
-    "reinsure",
-    "reinters",
-    "reinvade",
-    "reinvite",
-    "reinvoke",
-    "reissuer",
-    "reitboks",
-    "rejacket",
-    "rejectee",
-    "rejecter",
-    "rejector",
-    "rejigged",
-    "rejigger",
-    "rejoicer",
-    "rejudged",
-    "rejudges",
-    "rejuggle",
-    "rekeying",
-    "relabels",
-    "relacing",
-    "relanded",
-    "relapser",
-    "relaters",
-    "relators",
-    "relaxins",
-    "relearns",
-    "relearnt",
-    "relegate",
-    "reletter",
-    "relievos",
-    "relights",
-    "relining",
-    "relinked",
-    "reliques",
-    "rellenos",
-    "reloader",
-    "reloaned",
-    "relocked",
-    "relooked",
-    "relucent",
-    "relucted",
-    "relumine",
-    "reluming",
-    "remailed",
-    "remakers",
-    "remanent",
-    "remanned",
-    "remapped",
-    "remarker",
-    "remarket",
-    "remating",
-    "remelted",
-    "remended",
-    "remerged",
-    "remerges",
-    "remigial",
-    "reminted",
-    "remising",
-    "remissly",
-    "remittal",
-    "remitter",
-    "remittor",
-    "remodify",
-    "remolade",
-    "remolded",
-    "remorses",
-    "remotion",
-    "remounts",
-    "renailed",
-    "renature",
-    "rendible",
-    "rendzina",
-    "renegado",
-    "renegers",
-    "reneging",
-    "renested",
-    "renewers",
-    "reniform",
-    "renigged",
-    "renitent",
-    "rennases",
-    "renogram",
-    "renotify",
-    "rentable",
-    "rentiers",
-    "reobject",
-    "reobtain",
-    "reoccupy",
-    "reoccurs",
-    "reoffers",
-    "reoiling",
-    "reoppose",
-    "reordain",
-    "reorders",
-    "reorient",
-    "reoutfit",
-    "reovirus",
-    "repacify",
-    "repacked",
-    "repaints",
-    "repandly",
-    "repanels",
-    "repapers",
-    "reparked",
-    "repassed",
-    "repasses",
-    "repasted",
-    "repaving",
-    "repealer",
-    "repegged",
-    "repenter",
-    "repeople",
-    "reperked",
-    "repetend",
-    "repiners",
-    "repining",
-    "repinned",
-    "replants",
-    "replated",
-    "replates",
-    "repleads",
-    "repledge",
-    "repletes",
-    "replevin",
-    "replicon",
-    "repliers",
-    "replowed",
-    "replumbs",
-    "replunge",
-    "repolish",
-    "repolled",
-    "reposals",
-    "reposers",
-    "reposing",
-    "reposits",
-    "repotted",
-    "repoured",
-    "repousse",
-    "repowers",
-    "repriced",
-    "reprices",
-    "reprised",
-    "reprises",
-    "reprobed",
-    "reprobes",
-    "reproofs",
-    "reproval",
-    "reproved",
-    "reprover",
-    "reproves",
-    "reptilia",
-    "repugned",
-    "repulser",
-    "repulses",
-    "repumped",
-    "repurify",
-    "repursue",
-    "reputing",
-    "requiems",
-    "requirer",
-    "requital",
-    "requited",
-    "requiter",
-    "requites",
-    "reracked",
-    "reraised",
-    "reraises",
-    "rerecord",
-    "reremice",
-    "reremind",
-    "rerented",
-    "rerepeat",
-    "rereview",
-    "rereward",
-    "rerigged",
-    "rerising",
-    "rerolled",
-    "reroller",
-    "reroofed",
-    "reroutes",
-    "resaddle",
-    "resailed",
-    "resalute",
-    "resawing",
-    "resaying",
-    "rescaled",
-    "rescales",
-    "reschool",
-    "rescinds",
-    "rescored",
-    "rescores",
-    "rescreen",
-    "rescript",
-    "resculpt",
-    "resealed",
-    "reseason",
-    "reseated",
-    "resecure",
-    "reseeded",
-    "reseeing",
-    "reseized",
-    "reseizes",
-    "reselect",
-    "reserver",
-    "resetter",
-    "resettle",
-    "resewing",
-    "reshaper",
-    "reshapes",
-    "reshaved",
-    "reshaven",
-    "reshaves",
-    "reshined",
-    "reshines",
-    "reshoots",
-    "reshowed",
-    "reshower",
-    "residers",
-    "residuum",
-    "resifted",
-    "resights",
-    "resigner",
-    "resiling",
-    "resilins",
-    "resilver",
-    "resinate",
-    "resinify",
-    "resining",
-    "resinoid",
-    "resinous",
-    "resister",
-    "resiting",
-    "resketch",
-    "reslated",
-    "reslates",
-    "resmelts",
-    "resmooth",
-    "resoaked",
-    "resodded",
-    "resoften",
-    "resojets",
-    "resolder",
-    "resoling",
-    "resorbed",
-    "resorcin",
-    "resorter",
-    "resought",
-    "resounds",
-    "resowing",
-    "respaced",
-    "respaces",
-    "respaded",
-    "respades",
-    "respeaks",
-    "respells",
-    "respired",
-    "respires",
-    "respited",
-    "respites",
-    "resplice",
-    "resplits",
-    "respoken",
-    "responsa",
-    "respools",
-    "resprang",
-    "resprays",
-    "respread",
-    "respring",
-    "resprout",
-    "resprung",
-    "restable",
-    "restacks",
-    "restaffs",
-    "restaged",
-    "restages",
-    "restamps",
-    "restates",
-    "restitch",
-    "restocks",
-    "restoked",
-    "restokes",
-    "restoral",
-    "restress",
-    "restring",
-    "restrive",
-    "restrove",
-    "restruck",
-    "restrung",
-    "restuffs",
-    "restyled",
-    "restyles",
-    "resumers",
-    "resummon",
-    "resupine",
-    "resurged",
-    "resurges",
-    "resurvey",
-    "retables",
-    "retacked",
-    "retackle",
-    "retagged",
-    "retailed",
-    "retailor",
-    "retakers",
-    "retaking",
-    "retaping",
-    "retarder",
-    "retarget",
-    "retasted",
-    "retastes",
-    "retaught",
-    "retaxing",
-    "retching",
-    "reteamed",
-    "retemper",
-    "rethinks",
-    "rethread",
-    "retiarii",
-    "reticles",
-    "reticula",
-    "retieing",
-    "retiform",
-    "retiling",
-    "retiming",
-    "retinals",
-    "retinene",
-    "retinite",
-    "retinols",
-    "retinted",
-    "retinued",
-    "retinues",
-    "retinula",
-    "retirant",
-    "retirers",
-    "retitled",
-    "retitles",
-    "retooled",
-    "retorter",
-    "retotals",
-    "retraced",
-    "retracer",
-    "retraces",
-    "retracks",
-    "retrains",
-    "retrally",
-    "retreads",
-    "retrench",
-    "retrials",
-    "retroact",
-    "retronym",
-    "retrorse",
-    "retrying",
-    "retsinas",
-    "retuning",
-    "returnee",
-    "retwists",
-    "retyping",
-    "reuniter",
-    "reutters",
-    "revalued",
-    "revalues",
-    "revamper",
-    "revanche",
-    "revehent",
-    "reveille",
-    "reveling",
-    "revelled",
-    "reveller",
-    "revenant",
-    "revenged",
-    "revenger",
-    "revenges",
-    "revenual",
-    "revenued",
-    "revenuer",
-    "reverbed",
-    "reverers",
-    "reveries",
-    "reverify",
-    "revering",
-    "reverser",
-    "reversos",
-    "reverter",
-    "revested",
-    "revetted",
-    "reviewal",
-    "revilers",
-    "reviling",
-    "revisals",
-    "revisers",
-    "revisors",
-    "revisory",
-    "revivers",
-    "revivify",
-    "revoiced",
-    "revoices",
-    "revokers",
-    "revolter",
-    "revolute",
-    "revoting",
-    "revuists",
-    "revulsed",
-    "rewakens",
-    "rewaking",
-    "rewarder",
-    "rewarmed",
-    "rewashed",
-    "rewashes",
-    "rewaxing",
-    "reweaved",
-    "reweaves",
-    "rewedded",
-    "reweighs",
-    "rewelded",
-    "rewetted",
-    "rewidens",
-    "rewinded",
-    "rewinder",
-    "reworded",
-    "reynards",
-    "rezeroed",
-    "rezeroes",
-    "rhabdome",
-    "rhabdoms",
-    "rhamnose",
-    "rhapsode",
-    "rhematic",
-    "rheniums",
-    "rheobase",
-    "rheophil",
-    "rheostat",
-    "rhesuses",
-    "rheumier",
-    "rhizobia",
-    "rhizoids",
-    "rhizomic",
-    "rhizopod",
-    "rhizopus",
-    "rhodamin",
-    "rhodiums",
-    "rhodoras",
-    "rhomboid",
-    "rhonchal",
-    "rhonchus",
-    "rhubarbs",
-    "rhumbaed",
-    "rhyolite",
-    "ribaldly",
-    "ribaldry",
-    "ribbands",
-    "ribbiest",
-    "ribbings",
-    "ribboned",
-    "ribgrass",
-    "ribworts",
-    "ricebird",
-    "ricercar",
-    "richened",
-    "richweed",
-    "rickrack",
-    "rickshas",
-    "ricottas",
-    "rictuses",
-    "riddlers",
-    "riddling",
-    "rideable",
-    "ridgetop",
-    "ridgiest",
-    "ridgling",
-    "ridottos",
-    "rifeness",
-    "rifflers",
-    "riffling",
-    "riffraff",
-    "riflings",
-    "riftless",
-    "rigadoon",
-    "rigatoni",
-    "rigaudon",
-    "riggings",
-    "righters",
-    "rightest",
-    "righties",
-    "rightism",
-    "rigidify",
-    "rigorism",
-    "rigorist",
-    "rikishas",
-    "rikshaws",
-    "rimester",
-    "rimfires",
-    "riminess",
-    "rimlands",
-    "rimosely",
-    "rimosity",
-    "rimpling",
-    "rimrocks",
-    "rimshots",
-    "rindless",
-    "ringbark",
-    "ringbolt",
-    "ringbone",
-    "ringdove",
-    "ringhals",
-    "ringlets",
-    "ringlike",
-    "ringneck",
-    "ringtail",
-    "ringtaws",
-    "ringtoss",
-    "rinsable",
-    "rinsible",
-    "rinsings",
-    "ripcords",
-    "ripeners",
-    "ripienos",
-    "riposted",
-    "ripostes",
-    "rippable",
-    "ripplers",
-    "ripplets",
-    "ripplier",
-    "ripsawed",
-    "ripstops",
-    "riptides",
-    "risibles",
-    "riskiest",
-    "riskless",
-    "risottos",
-    "rissoles",
-    "ritually",
-    "ritziest",
-    "rivaling",
-    "rivalled",
-    "riveters",
-    "rivetted",
-    "rivieras",
-    "rivulets",
-    "rivulose",
-    "roaching",
-    "roadbeds",
-    "roadwork",
-    "roarings",
-    "roborant",
-    "robotism",
-    "robotize",
-    "robustas",
-    "robuster",
-    "rocaille",
-    "rockable",
-    "rockabye",
-    "rocketer",
-    "rockfall",
-    "rockiest",
-    "rockless",
-    "rocklike",
-    "rockling",
-    "rockoons",
-    "rockrose",
-    "rockweed",
-    "rockwork",
-    "rodeoing",
-    "roebucks",
-    "roentgen",
-    "rogation",
-    "rogatory",
-    "rogering",
-    "rogueing",
-    "roiliest",
-    "roisters",
-    "rolamite",
-    "rollicks",
-    "rollicky",
-    "rollings",
-    "rollmops",
-    "rollouts",
-    "rollways",
-    "romaines",
-    "romanced",
-    "romancer",
-    "romanise",
-    "romanize",
-    "romaunts",
-    "rondeaux",
-    "rondelet",
-    "rondelle",
-    "rondures",
-    "rontgens",
-    "roofings",
-    "roofless",
-    "rooflike",
-    "roofline",
-    "rooftree",
-    "rookiest",
-    "roomette",
-    "roomfuls",
-    "roomiest",
-    "roorbach",
-    "roorback",
-    "rootages",
-    "rootcaps",
-    "roothold",
-    "rootiest",
-    "rootless",
-    "rootlets",
-    "rootlike",
-    "rootling",
-    "rootworm",
-    "ropelike",
-    "roperies",
-    "ropewalk",
-    "ropeways",
-    "ropiness",
-    "roqueted",
-    "roquette",
-    "rorquals",
-    "rosaceas",
-    "rosarian",
-    "rosarium",
-    "rosebays",
-    "rosebuds",
-    "rosebush",
-    "rosefish",
-    "rosehips",
-    "roselike",
-    "roselles",
-    "roseolar",
-    "roseolas",
-    "roseries",
-    "roseroot",
-    "roseslug",
-    "rosiness",
-    "rosining",
-    "rosinols",
-    "rosinous",
-    "rosolios",
-    "rostella",
-    "rostrate",
-    "rostrums",
-    "rosulate",
-    "rotaries",
-    "rotative",
-    "rotators",
-    "rotatory",
-    "rotenone",
-    "rotifers",
-    "rotiform",
-    "rototill",
-    "rottener",
-    "rottenly",
-    "rotundas",
-    "rotundly",
-    "roturier",
-    "roughage",
-    "roughdry",
-    "roughens",
-    "roughers",
-    "roughest",
-    "roughhew",
-    "roughies",
-    "roughish",
-    "roughleg",
-    "rouilles",
-    "roulades",
-    "rouleaus",
-    "rouleaux",
-    "roundels",
-    "roundest",
-    "roundish",
-    "roundlet",
-    "roupiest",
-    "rousters",
-    "rousting",
-    "routeman",
-    "routemen",
-    "routeway",
-    "rovingly",
-    "rowboats",
-    "rowdiest",
-    "rowdyish",
-    "rowdyism",
-    "roweling",
-    "rowelled",
-    "rowlocks",
-    "royalism",
-    "roysters",
-    "rubaboos",
-    "rubaiyat",
-    "rubasses",
-    "rubbaboo",
-    "rubbered",
-    "rubbings",
-    "rubbishy",
-    "rubblier",
-    "rubbling",
-    "rubboard",
-    "rubdowns",
-    "rubellas",
-    "rubeolar",
-    "rubeolas",
-    "rubicund",
-    "rubrical",
-    "rubylike",
-    "ruchings",
-    "ruckling",
-    "ruckuses",
-    "ructions",
-    "ructious",
-    "ruddiest",
-    "ruddling",
-    "ruddocks",
-    "ruderals",
-    "ruderies",
-    "rudiment",
-    "ruefully",
-    "ruffians",
-    "rufflers",
-    "rufflier",
-    "rufflike",
-    "ruffling",
-    "rugalach",
-    "rugelach",
-    "ruggeder",
-    "ruggedly",
-    "rugosely",
-    "rugosity",
-    "rugulose",
-    "ruinable",
-    "ruinated",
-    "ruinates",
-    "ruleless",
-    "rumbaing",
-    "rumblers",
-    "rummaged",
-    "rummager",
-    "rummages",
-    "rummiest",
-    "rumoring",
-    "rumpless",
-    "rumplier",
-    "rumpling",
-    "rumpuses",
-    "runagate",
-    "runbacks",
-    "rundlets",
-    "rundowns",
-    "runelike",
-    "rungless",
-    "runkling",
-    "runniest",
-    "runnings",
-    "runovers",
-    "runround",
-    "runtiest",
-    "ruralise",
-    "ruralism",
-    "ruralist",
-    "ruralite",
-    "rurality",
-    "ruralize",
-    "rushiest",
-    "rushings",
-    "rushlike",
-    "rustable",
-    "rustical",
-    "rusticly",
-    "rustiest",
-    "rustlers",
-    "rustless",
-    "rutabaga",
-    "ruthenic",
-    "rutilant",
-    "ruttiest",
-    "sabatons",
-    "sabayons",
-    "sabbaths",
-    "sabbatic",
-    "sabering",
-    "sabulose",
-    "sabulous",
-    "sacatons",
-    "saccades",
-    "saccadic",
-    "saccular",
-    "saccules",
-    "sacculus",
-    "sachemic",
-    "sacheted",
-    "sackbuts",
-    "sackfuls",
-    "sackings",
-    "sacklike",
-    "sacksful",
-    "sacraria",
-    "sacredly",
-    "sacrings",
-    "sacrists",
-    "sacristy",
-    "saddlers",
-    "saddling",
-    "sadirons",
-    "safaried",
-    "safeness",
-    "safetied",
-    "safeties",
-    "saffrons",
-    "safranin",
-    "safroles",
-    "saganash",
-    "sageness",
-    "saggards",
-    "saggared",
-    "saggered",
-    "saggiest",
-    "saguaros",
-    "sahiwals",
-    "sahuaros",
-    "sailable",
-    "sailless",
-    "sailorly",
-    "sainfoin",
-    "saintdom",
-    "sainting",
-    "salaamed",
-    "salacity",
-    "saladang",
-    "salariat",
-    "salchows",
-    "saleably",
-    "saleroom",
-    "salicine",
-    "salicins",
-    "saliency",
-    "salients",
-    "salified",
-    "salifies",
-    "salinize",
-    "salivate",
-    "salliers",
-    "sallowed",
-    "sallower",
-    "sallowly",
-    "sallying",
-    "salpians",
-    "salsilla",
-    "saltbush",
-    "salterns",
-    "saltiers",
-    "saltiest",
-    "saltines",
-    "saltings",
-    "saltires",
-    "saltless",
-    "saltlike",
-    "saltness",
-    "saltpans",
-    "saltwork",
-    "saltwort",
-    "saluters",
-    "salvable",
-    "salvably",
-    "salvagee",
-    "salvager",
-    "salvages",
-    "salvific",
-    "salvoing",
-    "samadhis",
-    "samarium",
-    "sambaing",
-    "sambhars",
-    "sambhurs",
-    "sambucas",
-    "sambukes",
-    "samisens",
-    "samovars",
-    "samoyeds",
-    "samphire",
-    "samsaras",
-    "samurais",
-    "sanative",
-    "sanctums",
-    "sandable",
-    "sandaled",
-    "sandarac",
-    "sandbank",
-    "sandbars",
-    "sandburr",
-    "sandburs",
-    "sanddabs",
-    "sandfish",
-    "sandhogs",
-    "sandiest",
-    "sandless",
-    "sandlike",
-    "sandling",
-    "sandlots",
-    "sandpeep",
-    "sandpile",
-    "sandpits",
-    "sandshoe",
-    "sandsoap",
-    "sandspur",
-    "sandworm",
-    "sandwort",
-    "saneness",
-    "sangaree",
-    "sangrias",
-    "sanicles",
-    "sanidine",
-    "sanitate",
-    "sanities",
-    "sanitise",
-    "sannyasi",
-    "sanserif",
-    "santalic",
-    "santalol",
-    "santeras",
-    "santeria",
-    "santeros",
-    "santonin",
-    "santoors",
-    "santours",
-    "sapajous",
-    "sapheads",
-    "saphenae",
-    "saphenas",
-    "sapidity",
-    "sapience",
-    "sapiency",
-    "sapients",
-    "saponify",
-    "saponine",
-    "saponins",
-    "saponite",
-    "saporous",
-    "sapphics",
-    "sapphism",
-    "sapphist",
-    "sappiest",
-    "sapremia",
-    "sapremic",
-    "saprobes",
-    "saprobic",
-    "sapropel",
-    "sapsagos",
-    "sapwoods",
-    "sarcasms",
-    "sarcenet",
-    "sarcinae",
-    "sarcinas",
-    "sarcoids",
-    "sardanas",
-    "sardined",
-    "sardonyx",
-    "sarkiest",
-    "sarmenta",
-    "sarments",
-    "sarodist",
-    "sarsenet",
-    "sarsnets",
-    "sartorii",
-    "sashayed",
-    "sashimis",
-    "sashless",
-    "sassiest",
-    "sasswood",
-    "sastruga",
-    "sastrugi",
-    "satchels",
-    "satiable",
-    "satiably",
-    "satiated",
-    "satiates",
-    "satinets",
-    "satinpod",
-    "satirise",
-    "satirize",
-    "satsumas",
-    "saturant",
-    "satyrids",
-    "saucebox",
-    "saucepot",
-    "sauciers",
-    "sauciest",
-    "saunaing",
-    "saunters",
-    "saurians",
-    "sauropod",
-    "sauteing",
-    "sauterne",
-    "sautoire",
-    "sautoirs",
-    "savagest",
-    "savaging",
-    "savagism",
-    "savarins",
-    "saveable",
-    "saveloys",
-    "savingly",
-    "saviours",
-    "savorers",
-    "savorier",
-    "savories",
-    "savorily",
-    "savorous",
-    "savoured",
-    "savourer",
-    "savviest",
-    "savvying",
-    "sawbills",
-    "sawbones",
-    "sawbucks",
-    "sawdusts",
-    "sawdusty",
-    "sawflies",
-    "sawhorse",
-    "sawteeth",
-    "saxatile",
-    "saxhorns",
-    "saxonies",
-    "saxtubas",
-    "scabbier",
-    "scabbily",
-    "scabbing",
-    "scabbled",
-    "scabbles",
-    "scabiosa",
-    "scabious",
-    "scabland",
-    "scablike",
-    "scabrous",
-    "scalably",
-    "scalades",
-    "scalados",
-    "scalages",
-    "scalares",
-    "scalawag",
-    "scalenus",
-    "scalepan",
-    "scaleups",
-    "scaliest",
-    "scallion",
-    "scalpels",
-    "scamming",
-    "scammony",
-    "scampers",
-    "scampies",
-    "scamping",
-    "scampish",
-    "scamster",
-    "scandent",
-    "scandias",
-    "scandium",
-    "scansion",
-    "scantest",
-    "scantier",
-    "scanties",
-    "scanting",
-    "scaphoid",
-    "scapulae",
-    "scapular",
-    "scapulas",
-    "scarcest",
-    "scareder",
-    "scarfers",
-    "scarfing",
-    "scarfpin",
-    "scariose",
-    "scarious",
-    "scarless",
-    "scarlets",
-    "scarpers",
-    "scarphed",
-    "scarping",
-    "scarrier",
-    "scarting",
-    "scatback",
-    "scattier",
-    "scatting",
-    "scaupers",
-    "scavenge",
-    "scending",
-    "scenical",
-    "scenting",
-    "scepters",
-    "sceptral",
-    "sceptred",
-    "sceptres",
-    "schappes",
-    "schemers",
-    "scherzos",
-    "schizier",
-    "schizont",
-    "schlepps",
-    "schliere",
-    "schlocks",
-    "schlocky",
-    "schlumps",
-    "schlumpy",
-    "schmaltz",
-    "schmalzy",
-    "schmatte",
-    "schmears",
-    "schmeers",
-    "schmelze",
-    "schmoose",
-    "schmooze",
-    "schmoozy",
-    "schmucks",
-    "schnecke",
-    "schnooks",
-    "schnozes",
-    "scholium",
-    "schticks",
-    "schussed",
-    "schusser",
-    "schusses",
-    "sciaenid",
-    "sciatics",
-    "scilicet",
-    "scimetar",
-    "scimiter",
-    "scincoid",
-    "sciolism",
-    "sciolist",
-    "scirrhus",
-    "scissile",
-    "scission",
-    "scissure",
-    "sciurids",
-    "sciurine",
-    "sciuroid",
-    "sclaffed",
-    "sclaffer",
-    "sclereid",
-    "sclerite",
-    "scleroid",
-    "scleroma",
-    "sclerose",
-    "sclerous",
-    "scoffers",
-    "scoffing",
-    "scofflaw",
-    "scolders",
-    "scoleces",
-    "scolices",
-    "scolioma",
-    "scollops",
-    "scombrid",
-    "sconcing",
-    "scooched",
-    "scooches",
-    "scoopers",
-    "scoopful",
-    "scooting",
-    "scopulae",
-    "scopulas",
-    "scorcher",
-    "scorches",
-    "scorepad",
-    "scorners",
-    "scornful",
-    "scorning",
-    "scotched",
-    "scotches",
-    "scotomas",
-    "scotopia",
-    "scotopic",
-    "scotties",
-    "scourers",
-    "scourged",
-    "scourger",
-    "scourges",
-    "scouters",
-    "scouther",
-    "scowders",
-    "scowlers",
-    "scowling",
-    "scrabbly",
-    "scragged",
-    "scraggly",
-    "scraichs",
-    "scraighs",
-    "scramjet",
-    "scrammed",
-    "scrannel",
-    "scrapies",
-    "scrapple",
-    "scrawler",
-    "screaked",
-    "screechy",
-    "screeded",
-    "screwers",
-    "screwier",
-    "screwups",
-    "scribbly",
-    "scribers",
-    "scribing",
-    "scrieved",
-    "scrieves",
-    "scrimped",
-    "scrimper",
-    "scrimpit",
-    "scripter",
-    "scriving",
-    "scrofula",
-    "scrooges",
-    "scrooped",
-    "scrootch",
-    "scrotums",
-    "scrouged",
-    "scrouges",
-    "scrounge",
-    "scroungy",
-    "scrummed",
-    "scrunchy",
-    "scrupled",
-    "scubaing",
-    "scudding",
-    "scuffers",
-    "scuffing",
-    "scuffled",
-    "scuffler",
-    "scuffles",
-    "sculches",
-    "sculkers",
-    "sculking",
-    "scullers",
-    "scullery",
-    "sculling",
-    "scullion",
-    "sculping",
-    "sculpins",
-    "scumbags",
-    "scumbled",
-    "scumbles",
-    "scumless",
-    "scumlike",
-    "scummers",
-    "scummier",
-    "scummily",
-    "scumming",
-    "scunners",
-    "scuppaug",
-    "scuppers",
-    "scurfier",
-    "scurried",
-    "scurries",
-    "scurrile",
-    "scurvier",
-    "scurvies",
-    "scurvily",
-    "scutages",
-    "scutched",
-    "scutcher",
-    "scutches",
-    "scutella",
-    "scutters",
-    "scuttles",
-    "scutwork",
-    "scuzzier",
-    "scyphate",
-    "scything",
-    "seabeach",
-    "seaboots",
-    "seaborne",
-    "seacocks",
-    "seacraft",
-    "seadrome",
-    "seafowls",
-    "seagoing",
-    "sealable",
-    "sealifts",
-    "seallike",
-    "sealskin",
-    "seamanly",
-    "seamarks",
-    "seamiest",
-    "seamlike",
-    "seamster",
-    "seapiece",
-    "seaquake",
-    "searobin",
-    "seascout",
-    "seasides",
-    "seasoner",
-    "seatback",
-    "seatings",
-    "seatless",
-    "seatmate",
-    "seatrain",
-    "seatrout",
-    "seatwork",
-    "seawalls",
-    "seawants",
-    "seawards",
-    "seawares",
-    "seaweeds",
-    "secalose",
-    "secantly",
-    "secateur",
-    "seceders",
-    "seceding",
-    "secerned",
-    "secludes",
-    "seconals",
-    "seconder",
-    "secondes",
-    "secreter",
-    "secretes",
-    "secretin",
-    "secretor",
-    "sectored",
-    "seculars",
-    "secundly",
-    "secundum",
-    "securers",
-    "securest",
-    "sedately",
-    "sedatest",
-    "sedating",
-    "sederunt",
-    "sedgiest",
-    "sedilium",
-    "seducers",
-    "seducive",
-    "sedulity",
-    "sedulous",
-    "seecatch",
-    "seedbeds",
-    "seedcake",
-    "seedcase",
-    "seediest",
-    "seedlike",
-    "seedpods",
-    "seedsman",
-    "seedsmen",
-    "seedtime",
-    "seemings",
-    "seemlier",
-    "seepages",
-    "seepiest",
-    "seesawed",
-    "segueing",
-    "seicento",
-    "seignior",
-    "seignory",
-    "seisable",
-    "seisings",
-    "seismism",
-    "seisures",
-    "seizable",
-    "seizings",
-    "seladang",
-    "selamlik",
-    "selcouth",
-    "seldomly",
-    "selectee",
-    "selectly",
-    "selenate",
-    "selenide",
-    "selenite",
-    "selenous",
-    "selfdoms",
-    "selfheal",
-    "selfhood",
-    "selfness",
-    "selfsame",
-    "selfward",
-    "sellable",
-    "selloffs",
-    "sellouts",
-    "seltzers",
-    "selvaged",
-    "selvages",
-    "selvedge",
-    "semiarid",
-    "semibald",
-    "semicoma",
-    "semideaf",
-    "semidome",
-    "semigala",
-    "semihard",
-    "semihigh",
-    "semihobo",
-    "semimatt",
-    "semimild",
-    "semimute",
-    "seminoma",
-    "seminude",
-    "semiopen",
-    "semioses",
-    "semiosis",
-    "semioval",
-    "semipros",
-    "semisoft",
-    "semitist",
-    "semitone",
-    "semiwild",
-    "semolina",
-    "semplice",
-    "senarius",
-    "sendable",
-    "sendoffs",
-    "senecios",
-    "senhoras",
-    "senhores",
-    "senilely",
-    "senility",
-    "sennight",
-    "senopias",
-    "sensated",
-    "sensates",
-    "senseful",
-    "sensilla",
-    "sensoria",
-    "sentimos",
-    "sentries",
-    "sepaline",
-    "sepalled",
-    "sepaloid",
-    "sepalous",
-    "seppukus",
-    "septages",
-    "septaria",
-    "septette",
-    "septical",
-    "septimes",
-    "septuple",
-    "sequency",
-    "sequents",
-    "sequoias",
-    "seraglio",
-    "seraphic",
-    "seraphin",
-    "serenate",
-    "serenely",
-    "serenest",
-    "serfages",
-    "serfdoms",
-    "serfhood",
-    "serflike",
-    "sergings",
-    "seriated",
-    "seriates",
-    "seriatim",
-    "sericins",
-    "seriemas",
-    "seriffed",
-    "seringas",
-    "serjeant",
-    "sermonic",
-    "serosity",
-    "serotine",
-    "serotiny",
-    "serovars",
-    "serpigos",
-    "serranid",
-    "serranos",
-    "serrates",
-    "serrying",
-    "servable",
-    "servitor",
-    "sesamoid",
-    "sesspool",
-    "sesterce",
-    "sestinas",
-    "sestines",
-    "setenant",
-    "setiform",
-    "setlines",
-    "setscrew",
-    "settlors",
-    "setulose",
-    "setulous",
-    "sevenths",
-    "severals",
-    "severest",
-    "seviches",
-    "sevrugas",
-    "sewering",
-    "sexiness",
-    "sexology",
-    "sextains",
-    "sextants",
-    "sextarii",
-    "sextette",
-    "sextiles",
-    "sextuple",
-    "sextuply",
-    "sforzato",
-    "sfumatos",
-    "shabbier",
-    "shabbily",
-    "shacking",
-    "shackler",
-    "shackoes",
-    "shadblow",
-    "shadbush",
-    "shadchan",
-    "shaddock",
-    "shadiest",
-    "shadings",
-    "shadkhan",
-    "shadoofs",
-    "shadower",
-    "shadrach",
-    "shafting",
-    "shagbark",
-    "shaggier",
-    "shaggily",
-    "shagreen",
-    "shahdoms",
-    "shaitans",
-    "shakable",
-    "shakeout",
-    "shakeups",
-    "shakiest",
-    "shaliest",
-    "shalloon",
-    "shallops",
-    "shamable",
-    "shamably",
-    "shambled",
-    "shamisen",
-    "shammash",
-    "shammers",
-    "shammied",
-    "shammies",
-    "shamming",
-    "shamosim",
-    "shamoyed",
-    "shamuses",
-    "shandies",
-    "shanking",
-    "shannies",
-    "shanteys",
-    "shanties",
-    "shantihs",
-    "shantung",
-    "shapable",
-    "shapeups",
-    "sharable",
-    "shariahs",
-    "sharkers",
-    "sharking",
-    "sharpers",
-    "sharpies",
-    "sharping",
-    "shashlik",
-    "shasliks",
-    "shauling",
-    "shavable",
-    "shawling",
-    "sheafing",
-    "shealing",
-    "shearers",
-    "sheather",
-    "sheathes",
-    "sheaving",
-    "shebangs",
-    "shebeans",
-    "shebeens",
-    "shedable",
-    "shedders",
-    "shedlike",
-    "sheeneys",
-    "sheenful",
-    "sheenier",
-    "sheenies",
-    "sheening",
-    "sheepcot",
-    "sheepman",
-    "sheepmen",
-    "sheerest",
-    "sheering",
-    "sheeters",
-    "sheikdom",
-    "sheitans",
-    "shekalim",
-    "shekelim",
-    "shelduck",
-    "shelfful",
-    "shellack",
-    "shellacs",
-    "shellers",
-    "shellier",
-    "shelties",
-    "shelvers",
-    "shelvier",
-    "shending",
-    "sheqalim",
-    "sherbert",
-    "sherbets",
-    "shereefs",
-    "sheroots",
-    "sherries",
-    "shiatsus",
-    "shiatzus",
-    "shickers",
-    "shicksas",
-    "shielder",
-    "shieling",
-    "shiftier",
-    "shiftily",
-    "shikaree",
-    "shikaris",
-    "shikkers",
-    "shiksehs",
-    "shilingi",
-    "shillala",
-    "shimmery",
-    "shimmied",
-    "shimmies",
-    "shimming",
-    "shinbone",
-    "shindies",
-    "shindigs",
-    "shingled",
-    "shingler",
-    "shiniest",
-    "shinleaf",
-    "shinnery",
-    "shinneys",
-    "shinnied",
-    "shinnies",
-    "shinning",
-    "shiplaps",
-    "shipless",
-    "shipload",
-    "shipmate",
-    "shippens",
-    "shippons",
-    "shipside",
-    "shipways",
-    "shipworm",
-    "shirkers",
-    "shirking",
-    "shirring",
-    "shirtier",
-    "shirting",
-    "shitakes",
-    "shithead",
-    "shitless",
-    "shitlist",
-    "shitload",
-    "shittahs",
-    "shittier",
-    "shittims",
-    "shivaree",
-    "shiverer",
-    "shivitis",
-    "shkotzim",
-    "shlemiel",
-    "shlepped",
-    "shlumped",
-    "shmaltzy",
-    "shmoozed",
-    "shmoozes",
-    "shnorrer",
-    "shoalest",
-    "shoalier",
-    "shoaling",
-    "shoddier",
-    "shoddies",
-    "shoddily",
-    "shoebill",
-    "shoehorn",
-    "shoelace",
-    "shoeless",
-    "shoepack",
-    "shoepacs",
-    "shoetree",
-    "shofroth",
-    "shogging",
-    "shogunal",
-    "shooling",
-    "shopboys",
-    "shophars",
-    "shoplift",
-    "shopworn",
-    "shorings",
-    "shortias",
-    "shorties",
-    "shortish",
-    "shothole",
-    "shotting",
-    "shouldst",
-    "shouters",
-    "shoveled",
-    "shoveler",
-    "showable",
-    "showerer",
-    "showiest",
-    "showoffs",
-    "showring",
-    "shrewder",
-    "shrewdie",
-    "shrewdly",
-    "shrewing",
-    "shrewish",
-    "shrieker",
-    "shrieval",
-    "shrieved",
-    "shrieves",
-    "shrilled",
-    "shriller",
-    "shrimped",
-    "shrimper",
-    "shrining",
-    "shrinker",
-    "shrivels",
-    "shrivers",
-    "shriving",
-    "shroffed",
-    "shtetels",
-    "shuckers",
-    "shucking",
-    "shuddery",
-    "shunners",
-    "shunpike",
-    "shunters",
-    "shushers",
-    "shushing",
-    "shuteyes",
-    "shutoffs",
-    "shuttled",
-    "shuttler",
-    "shvartze",
-    "shwanpan",
-    "shylocks",
-    "shysters",
-    "sialidan",
-    "siamangs",
-    "siameses",
-    "sibilant",
-    "sibilate",
-    "sibyllic",
-    "sickbays",
-    "sickbeds",
-    "sickener",
-    "sickerly",
-    "sicklied",
-    "sicklier",
-    "sicklies",
-    "sicklily",
-    "sickling",
-    "sickouts",
-    "sickroom",
-    "siddurim",
-    "sidearms",
-    "sidecars",
-    "sidehill",
-    "sideling",
-    "sidelong",
-    "siderite",
-    "sideslip",
-    "sidespin",
-    "sideward",
-    "sidewise",
-    "sienites",
-    "sierozem",
-    "sieverts",
-    "siffleur",
-    "siftings",
-    "siganids",
-    "sighless",
-    "sighlike",
-    "sighters",
-    "sightsaw",
-    "sightsee",
-    "sigmoids",
-    "signages",
-    "signally",
-    "signeted",
-    "signiori",
-    "signiors",
-    "signiory",
-    "signoras",
-    "silenter",
-    "silesias",
-    "silicide",
-    "silicify",
-    "silicium",
-    "silicles",
-    "silicons",
-    "silicula",
-    "siliquae",
-    "siliques",
-    "silkiest",
-    "silklike",
-    "silkweed",
-    "sillabub",
-    "sillibub",
-    "silliest",
-    "siloxane",
-    "siltiest",
-    "silurids",
-    "siluroid",
-    "silverer",
-    "silverly",
-    "silvexes",
-    "silvical",
-    "simaruba",
-    "simazine",
-    "simitars",
-    "simoleon",
-    "simoniac",
-    "simonies",
-    "simonist",
-    "simonize",
-    "simpered",
-    "simperer",
-    "simplism",
-    "simplist",
-    "simulant",
-    "simulars",
-    "sinapism",
-    "sincerer",
-    "sinciput",
-    "sinecure",
-    "sinewing",
-    "sinfonie",
-    "sinfully",
-    "singable",
-    "singeing",
-    "singsong",
-    "sinicize",
-    "sinkable",
-    "sinkages",
-    "sinology",
-    "sinopias",
-    "sinuated",
-    "sinuates",
-    "sinusoid",
-    "siphonal",
-    "siphoned",
-    "siphonic",
-    "sirenian",
-    "sirloins",
-    "siroccos",
-    "sirupier",
-    "siruping",
-    "sirvente",
-    "sissiest",
-    "sissyish",
-    "sistered",
-    "sisterly",
-    "sistroid",
-    "sistrums",
-    "sitarist",
-    "sithence",
-    "sitology",
-    "situates",
-    "sitzmark",
-    "sixpenny",
-    "sixteens",
-    "sixtieth",
-    "sixtyish",
-    "sizeably",
-    "siziness",
-    "sizzlers",
-    "sjamboks",
-    "skankers",
-    "skankier",
-    "skanking",
-    "skatings",
-    "skatoles",
-    "skeeters",
-    "skeining",
-    "skellums",
-    "skelping",
-    "skelters",
-    "skerries",
-    "sketcher",
-    "skewback",
-    "skewbald",
-    "skewered",
-    "skiagram",
-    "skidders",
-    "skiddier",
-    "skiddoos",
-    "skidooed",
-    "skidways",
-    "skiffled",
-    "skiffles",
-    "skijorer",
-    "skilless",
-    "skimpier",
-    "skimpily",
-    "skimping",
-    "skinfuls",
-    "skinkers",
-    "skinking",
-    "skinlike",
-    "skinners",
-    "skinnier",
-    "skioring",
-    "skiplane",
-    "skippets",
-    "skirling",
-    "skirrets",
-    "skirring",
-    "skirters",
-    "skitters",
-    "skittery",
-    "skittish",
-    "skivvied",
-    "skivvies",
-    "sklented",
-    "skoaling",
-    "skreeghs",
-    "skreighs",
-    "skulkers",
-    "skulking",
-    "skulling",
-    "skunkier",
-    "skunking",
-    "skyboard",
-    "skyborne",
-    "skyboxes",
-    "skydived",
-    "skydiver",
-    "skydives",
-    "skyhooks",
-    "skyjacks",
-    "skylarks",
-    "skysails",
-    "skysurfs",
-    "skywalks",
-    "skywards",
-    "skywrite",
-    "skywrote",
-    "slabbers",
-    "slabbery",
-    "slabbing",
-    "slablike",
-    "slackens",
-    "slackest",
-    "slaggier",
-    "slagging",
-    "slakable",
-    "slalomed",
-    "slalomer",
-    "slammers",
-    "slanders",
-    "slangier",
-    "slangily",
-    "slanging",
-    "slapdash",
-    "slapjack",
-    "slappers",
-    "slatches",
-    "slathers",
-    "slatiest",
-    "slatings",
-    "slattern",
-    "slatting",
-    "slavered",
-    "slaverer",
-    "slayable",
-    "sleaving",
-    "sleazier",
-    "sleazily",
-    "sleazoid",
-    "sledders",
-    "sledging",
-    "sleekens",
-    "sleekers",
-    "sleekest",
-    "sleekier",
-    "sleeking",
-    "sleepier",
-    "sleetier",
-    "sleeting",
-    "sleighed",
-    "sleigher",
-    "sleights",
-    "sleuthed",
-    "slickens",
-    "slickest",
-    "slicking",
-    "slidable",
-    "slideway",
-    "slighted",
-    "slighter",
-    "slimiest",
-    "slimmest",
-    "slimness",
-    "slimsier",
-    "slingers",
-    "slinkier",
-    "slinkily",
-    "slinking",
-    "slipform",
-    "slipless",
-    "slipouts",
-    "slipover",
-    "slippier",
-    "slippily",
-    "slipshod",
-    "slipslop",
-    "slipsole",
-    "slipware",
-    "slipways",
-    "slithers",
-    "slithery",
-    "slitless",
-    "slitlike",
-    "slitters",
-    "slittier",
-    "slivered",
-    "sliverer",
-    "slivovic",
-    "slobbers",
-    "slobbery",
-    "slobbier",
-    "slobbish",
-    "sloggers",
-    "slogging",
-    "sloppier",
-    "sloppily",
-    "slopping",
-    "slopwork",
-    "sloshier",
-    "sloshing",
-    "slotback",
-    "slothful",
-    "slotters",
-    "slouched",
-    "sloucher",
-    "slouches",
-    "sloughed",
-    "slovenly",
-    "slowpoke",
-    "slowworm",
-    "slubbers",
-    "slubbing",
-    "sludgier",
-    "sludging",
-    "sluffing",
-    "slugabed",
-    "sluggard",
-    "sluggers",
-    "sluicing",
-    "slumbers",
-    "slumbery",
-    "slumgums",
-    "slumisms",
-    "slumlord",
-    "slummers",
-    "slummier",
-    "slumming",
-    "slurried",
-    "slurries",
-    "slurring",
-    "slushier",
-    "slushily",
-    "slushing",
-    "sluttier",
-    "sluttish",
-    "slyboots",
-    "smackers",
-    "smallage",
-    "smaltine",
-    "smaltite",
-    "smaragde",
-    "smaragds",
-    "smarmier",
-    "smarmily",
-    "smartass",
-    "smartens",
-    "smarting",
-    "smashers",
-    "smashups",
-    "smatters",
-    "smearers",
-    "smearier",
-    "smectite",
-    "smeddums",
-    "smeeking",
-    "smellers",
-    "smellier",
-    "smeltery",
-    "smerking",
-    "smidgens",
-    "smidgeon",
-    "smidgins",
-    "smilaxes",
-    "smirched",
-    "smirches",
-    "smirkers",
-    "smirkier",
-    "smirkily",
-    "smithery",
-    "smithies",
-    "smocking",
-    "smoggier",
-    "smogless",
-    "smokable",
-    "smokepot",
-    "smokiest",
-    "smolders",
-    "smooched",
-    "smoocher",
-    "smooches",
-    "smooshed",
-    "smooshes",
-    "smoothen",
-    "smothery",
-    "smoulder",
-    "smudgier",
-    "smudgily",
-    "smuggest",
-    "smuggles",
-    "smugness",
-    "smushing",
-    "smutched",
-    "smutches",
-    "smuttier",
-    "smuttily",
-    "smutting",
-    "snackers",
-    "snaffled",
-    "snaffles",
-    "snafuing",
-    "snaggier",
-    "snaglike",
-    "snailing",
-    "snakebit",
-    "snakepit",
-    "snakiest",
-    "snapback",
-    "snapless",
-    "snappier",
-    "snappily",
-    "snappish",
-    "snapweed",
-    "snarfing",
-    "snarkier",
-    "snarkily",
-    "snarlers",
-    "snarlier",
-    "snatcher",
-    "snazzier",
-    "sneakier",
-    "sneakily",
-    "sneaping",
-    "snedding",
-    "sneerers",
-    "sneerful",
-    "sneerier",
-    "sneeshes",
-    "sneezers",
-    "sneezier",
-    "snellest",
-    "snibbing",
-    "snickery",
-    "snicking",
-    "sniffier",
-    "sniffily",
-    "sniffish",
-    "sniffled",
-    "sniffler",
-    "sniffles",
-    "snifters",
-    "sniggers",
-    "sniggled",
-    "sniggler",
-    "sniggles",
-    "sniglets",
-    "snippers",
-    "snippety",
-    "snippier",
-    "snippily",
-    "snipping",
-    "snitched",
-    "snitcher",
-    "snitches",
-    "sniveled",
-    "sniveler",
-    "snobbier",
-    "snobbily",
-    "snobbish",
-    "snobbism",
-    "snogging",
-    "snooding",
-    "snookers",
-    "snooking",
-    "snooling",
-    "snoopers",
-    "snoopier",
-    "snoopily",
-    "snootier",
-    "snootily",
-    "snooting",
-    "snoozers",
-    "snoozier",
-    "snoozing",
-    "snoozled",
-    "snoozles",
-    "snorters",
-    "snottier",
-    "snottily",
-    "snoutier",
-    "snouting",
-    "snoutish",
-    "snowbank",
-    "snowbell",
-    "snowbelt",
-    "snowbush",
-    "snowcaps",
-    "snowcats",
-    "snowdrop",
-    "snowiest",
-    "snowland",
-    "snowless",
-    "snowlike",
-    "snowmold",
-    "snowplow",
-    "snowshed",
-    "snowsuit",
-    "snubbers",
-    "snubbier",
-    "snubbing",
-    "snubness",
-    "snuffbox",
-    "snuffers",
-    "snuffier",
-    "snuffily",
-    "snuffing",
-    "snuffled",
-    "snuffler",
-    "snuffles",
-    "snuggery",
-    "snuggest",
-    "snuggies",
-    "snugging",
-    "snuggles",
-    "snugness",
-    "soakages",
-    "soapbark",
-    "soapiest",
-    "soapless",
-    "soaplike",
-    "soapsuds",
-    "soapwort",
-    "soarings",
-    "soberest",
-    "soberize",
-    "socagers",
-    "soccages",
-    "sociably",
-    "socketed",
-    "sockeyes",
-    "sockless",
-    "sodaless",
-    "sodalist",
-    "sodalite",
-    "sodality",
-    "sodamide",
-    "soddened",
-    "soddenly",
-    "sodomies",
-    "sodomist",
-    "sodomite",
-    "sodomize",
-    "sofabeds",
-    "softback",
-    "softhead",
-    "soggiest",
-    "soilages",
-    "soilless",
-    "soilures",
-    "sojourns",
-    "solacers",
-    "solacing",
-    "solander",
-    "solanine",
-    "solanins",
-    "solanums",
-    "solarise",
-    "solarism",
-    "solarize",
-    "solating",
-    "solation",
-    "solatium",
-    "solderer",
-    "soldiery",
-    "solecise",
-    "solecism",
-    "solecist",
-    "solecize",
-    "soleless",
-    "solemner",
-    "soleness",
-    "solerets",
-    "soleuses",
-    "solfeges",
-    "solfeggi",
-    "solidago",
-    "solidary",
-    "solidest",
-    "soliquid",
-    "solleret",
-    "solonets",
-    "solonetz",
-    "solubles",
-    "solvated",
-    "solvates",
-    "somberly",
-    "sombrely",
-    "sombrous",
-    "somedeal",
-    "someways",
-    "somewhen",
-    "somewise",
-    "sonances",
-    "sonantal",
-    "sonantic",
-    "sonarman",
-    "sonarmen",
-    "sonatina",
-    "sonatine",
-    "songfest",
-    "songless",
-    "songlike",
-    "songster",
-    "sonhoods",
-    "sonicate",
-    "sonneted",
-    "sonobuoy",
-    "sonorant",
-    "sonority",
-    "sonships",
-    "sonsiest",
-    "soochong",
-    "soothers",
-    "soothest",
-    "soothsay",
-    "sootiest",
-    "sophisms",
-    "sophists",
-    "sopiting",
-    "soppiest",
-    "sorbable",
-    "sorbates",
-    "sorbents",
-    "sorboses",
-    "sordidly",
-    "sordines",
-    "sorehead",
-    "sorghums",
-    "soricine",
-    "soroches",
-    "sororate",
-    "sorptive",
-    "sorriest",
-    "sorrowed",
-    "sorrower",
-    "sortably",
-    "sottedly",
-    "soubises",
-    "souchong",
-    "souffled",
-    "souffles",
-    "soughing",
-    "soullike",
-    "soundbox",
-    "soundest",
-    "soundman",
-    "soundmen",
-    "soupcons",
-    "soupiest",
-    "soupless",
-    "souplike",
-    "sourball",
-    "sourdine",
-    "sourness",
-    "sourpuss",
-    "soursops",
-    "sourwood",
-    "sousliks",
-    "soutache",
-    "soutanes",
-    "southers",
-    "southing",
-    "southron",
-    "souvlaki",
-    "sovkhozy",
-    "sovranly",
-    "sovranty",
-    "sowbelly",
-    "sowbread",
-    "soymilks",
-    "spacemen",
-    "spaciest",
-    "spackled",
-    "spackles",
-    "spadeful",
-    "spadices",
-    "spadille",
-    "spadixes",
-    "spadones",
-    "spaeings",
-    "spaetzle",
-    "spagyric",
-    "spaldeen",
-    "spallers",
-    "spalling",
-    "spalpeen",
-    "spambots",
-    "spancels",
-    "spandrel",
-    "spandril",
-    "spangles",
-    "spankers",
-    "spanless",
-    "spansule",
-    "spanworm",
-    "sparable",
-    "sparerib",
-    "spargers",
-    "sparging",
-    "sparkers",
-    "sparkier",
-    "sparkily",
-    "sparkish",
-    "sparkler",
-    "sparklet",
-    "sparlike",
-    "sparling",
-    "sparoids",
-    "sparrier",
-    "sparsest",
-    "spartina",
-    "spasming",
-    "spastics",
-    "spathose",
-    "spatters",
-    "spatting",
-    "spatular",
-    "spatzles",
-    "spavined",
-    "spawners",
-    "speaning",
-    "spearers",
-    "speargun",
-    "spearing",
-    "spearmen",
-    "speccing",
-    "speciate",
-    "specking",
-    "speckles",
-    "spectate",
-    "specters",
-    "spectres",
-    "speeders",
-    "speedups",
-    "speeling",
-    "speering",
-    "speiling",
-    "speiring",
-    "speisses",
-    "spelaean",
-    "spellers",
-    "spelters",
-    "speltzes",
-    "spelunks",
-    "spendier",
-    "spermary",
-    "spermine",
-    "spermous",
-    "sphenoid",
-    "spherics",
-    "spherier",
-    "sphering",
-    "spheroid",
-    "spherule",
-    "sphinges",
-    "sphingid",
-    "sphinxes",
-    "sphygmic",
-    "sphygmus",
-    "sphynxes",
-    "spicated",
-    "spiccato",
-    "spiciest",
-    "spiculae",
-    "spicular",
-    "spicules",
-    "spiculum",
-    "spiegels",
-    "spielers",
-    "spieling",
-    "spiering",
-    "spiffied",
-    "spiffier",
-    "spiffies",
-    "spiffily",
-    "spiffing",
-    "spikelet",
-    "spikiest",
-    "spilikin",
-    "spilings",
-    "spillers",
-    "spinachy",
-    "spinages",
-    "spinally",
-    "spindled",
-    "spindler",
-    "spinelle",
-    "spiniest",
-    "spinifex",
-    "spinless",
-    "spinnery",
-    "spinneys",
-    "spinnies",
-    "spinouts",
-    "spinulae",
-    "spinules",
-    "spiracle",
-    "spiraeas",
-    "spiraled",
-    "spirally",
-    "spirants",
-    "spiremes",
-    "spiriest",
-    "spirilla",
-    "spirting",
-    "spirulae",
-    "spirulas",
-    "spitball",
-    "spitters",
-    "spittles",
-    "spittoon",
-    "splasher",
-    "splatted",
-    "splaying",
-    "splenial",
-    "splenium",
-    "splenius",
-    "splicers",
-    "splining",
-    "splinted",
-    "splodged",
-    "splodges",
-    "sploshed",
-    "sploshes",
-    "splotchy",
-    "splurged",
-    "splurger",
-    "splurges",
-    "splutter",
-    "spodosol",
-    "spoliate",
-    "spondaic",
-    "spondees",
-    "spongers",
-    "spongier",
-    "spongily",
-    "sponging",
-    "spongins",
-    "sponsion",
-    "sponsons",
-    "spontoon",
-    "spoofers",
-    "spoofery",
-    "spookery",
-    "spookier",
-    "spookily",
-    "spooking",
-    "spookish",
-    "spoolers",
-    "spooneys",
-    "spoonier",
-    "spoonies",
-    "spoonily",
-    "spooning",
-    "spooring",
-    "sporozoa",
-    "sporters",
-    "sportful",
-    "sportier",
-    "sportily",
-    "sporular",
-    "sporules",
-    "spottier",
-    "spottily",
-    "spousals",
-    "spousing",
-    "spouters",
-    "spraddle",
-    "sprattle",
-    "sprawler",
-    "sprigged",
-    "sprigger",
-    "sprights",
-    "springal",
-    "springed",
-    "springes",
-    "sprinted",
-    "spritzed",
-    "spritzer",
-    "spritzes",
-    "sprucely",
-    "sprucest",
-    "sprucier",
-    "sprucing",
-    "spryness",
-    "spudders",
-    "spudding",
-    "spumiest",
-    "spumones",
-    "spumonis",
-    "spunkier",
-    "spunkies",
-    "spunkily",
-    "spunking",
-    "spurgall",
-    "spurners",
-    "spurning",
-    "spurrers",
-    "spurreys",
-    "spurries",
-    "spurters",
-    "spurting",
-    "spurtles",
-    "sputniks",
-    "sputters",
-    "sputtery",
-    "squadded",
-    "squalled",
-    "squaller",
-    "squalors",
-    "squamate",
-    "squamose",
-    "squarers",
-    "squarest",
-    "squarish",
-    "squasher",
-    "squashes",
-    "squawked",
-    "squawker",
-    "squeaked",
-    "squeaker",
-    "squealer",
-    "squeezer",
-    "squegged",
-    "squelchy",
-    "squibbed",
-    "squidded",
-    "squiffed",
-    "squiggle",
-    "squiggly",
-    "squilgee",
-    "squillae",
-    "squillas",
-    "squinted",
-    "squinter",
-    "squireen",
-    "squiring",
-    "squirish",
-    "squirmed",
-    "squirmer",
-    "squirted",
-    "squished",
-    "squishes",
-    "squooshy",
-    "squushed",
-    "squushes",
-    "sraddhas",
-    "stabbers",
-    "stabiles",
-    "stablers",
-    "stablest",
-    "stabling",
-    "stablish",
-    "staccati",
-    "stackups",
-    "staddles",
-    "stageful",
-    "staggard",
-    "staggart",
-    "staggery",
-    "staggier",
-    "staggies",
-    "stagging",
-    "stagiest",
-    "stagings",
-    "stagnate",
-    "staidest",
-    "stainers",
-    "staithes",
-    "stakeout",
-    "stalkier",
-    "stalkily",
-    "stamened",
-    "staminal",
-    "staminas",
-    "stammels",
-    "stammers",
-    "stanched",
-    "stancher",
-    "stanches",
-    "stanchly",
-    "standbys",
-    "standees",
-    "standers",
-    "standpat",
-    "stanging",
-    "stanines",
-    "stannary",
-    "stannite",
-    "stannous",
-    "stannums",
-    "stanzaed",
-    "stanzaic",
-    "stapedes",
-    "stapelia",
-    "starched",
-    "stardoms",
-    "starkers",
-    "starkest",
-    "starless",
-    "starlike",
-    "starnose",
-    "starrier",
-    "startler",
-    "startles",
-    "starvers",
-    "starwort",
-    "stashing",
-    "stasimon",
-    "statable",
-    "statedly",
-    "statical",
-    "statices",
-    "staticky",
-    "statisms",
-    "statists",
-    "statives",
-    "statures",
-    "staumrel",
-    "staysail",
-    "steadied",
-    "steadier",
-    "steadies",
-    "steading",
-    "stealage",
-    "stealers",
-    "stealths",
-    "steamier",
-    "steamily",
-    "steapsin",
-    "stearine",
-    "stearins",
-    "steatite",
-    "stedfast",
-    "steeking",
-    "steelier",
-    "steelies",
-    "steeling",
-    "steenbok",
-    "steepens",
-    "steepers",
-    "steeping",
-    "steepish",
-    "steepled",
-    "steeples",
-    "steerers",
-    "steeving",
-    "stegodon",
-    "steinbok",
-    "stellate",
-    "stellify",
-    "stellite",
-    "stemless",
-    "stemlike",
-    "stemmata",
-    "stemmers",
-    "stemmery",
-    "stemmier",
-    "stemsons",
-    "stenches",
-    "stengahs",
-    "stenosed",
-    "stenoses",
-    "stenotic",
-    "stentors",
-    "stepdame",
-    "steplike",
-    "stepsons",
-    "stereoed",
-    "sterical",
-    "sterigma",
-    "sterlets",
-    "sternest",
-    "sternite",
-    "sternson",
-    "sternums",
-    "sternway",
-    "stertors",
-    "stetsons",
-    "stetting",
-    "stewable",
-    "stewbums",
-    "stewpans",
-    "sthenias",
-    "stibines",
-    "stibiums",
-    "stibnite",
-    "stickful",
-    "stickier",
-    "stickies",
-    "stickily",
-    "stickled",
-    "stickles",
-    "stickmen",
-    "stickout",
-    "stickpin",
-    "stickums",
-    "stickups",
-    "stiction",
-    "stiffens",
-    "stiffest",
-    "stiffies",
-    "stiffing",
-    "stiffish",
-    "stiflers",
-    "stilbene",
-    "stilbite",
-    "stillest",
-    "stillier",
-    "stilling",
-    "stillmen",
-    "stilting",
-    "stimying",
-    "stingier",
-    "stingily",
-    "stinkard",
-    "stinkbug",
-    "stinkers",
-    "stinkier",
-    "stinkpot",
-    "stinters",
-    "stinting",
-    "stipites",
-    "stippled",
-    "stippler",
-    "stipples",
-    "stipular",
-    "stipuled",
-    "stipules",
-    "stithied",
-    "stithies",
-    "stobbing",
-    "stoccado",
-    "stoccata",
-    "stockage",
-    "stockcar",
-    "stockers",
-    "stockier",
-    "stockily",
-    "stockish",
-    "stockmen",
-    "stodgier",
-    "stodgily",
-    "stodging",
-    "stoicism",
-    "stokesia",
-    "stolider",
-    "stolidly",
-    "stollens",
-    "stolonic",
-    "stolport",
-    "stomachy",
-    "stomates",
-    "stomatic",
-    "stomodea",
-    "stompers",
-    "stonable",
-    "stoniest",
-    "stooging",
-    "stookers",
-    "stooking",
-    "stoolies",
-    "stooling",
-    "stoopers",
-    "stopbank",
-    "stopcock",
-    "stopgaps",
-    "stopoffs",
-    "stoppled",
-    "stopples",
-    "stopword",
-    "storaxes",
-    "storeyed",
-    "stormier",
-    "stormily",
-    "storying",
-    "stotinka",
-    "stotinki",
-    "stotinov",
-    "stotting",
-    "stounded",
-    "stoutens",
-    "stoutest",
-    "stoutish",
-    "stowable",
-    "stowages",
-    "strafers",
-    "strafing",
-    "straggle",
-    "straggly",
-    "straiten",
-    "straiter",
-    "straitly",
-    "stramash",
-    "stramony",
-    "strander",
-    "stranges",
-    "strapper",
-    "strasses",
-    "stratify",
-    "stratous",
-    "stratums",
-    "stravage",
-    "stravaig",
-    "strawhat",
-    "strawier",
-    "strawing",
-    "strayers",
-    "streaker",
-    "streeked",
-    "streeker",
-    "streeled",
-    "strettas",
-    "strettos",
-    "streusel",
-    "strewers",
-    "strewing",
-    "striates",
-    "strickle",
-    "stridden",
-    "stridors",
-    "strigils",
-    "strigose",
-    "stripier",
-    "strivers",
-    "strobila",
-    "strobile",
-    "strobili",
-    "strobils",
-    "stromata",
-    "strongyl",
-    "strontia",
-    "strontic",
-    "strophes",
-    "strophic",
-    "stropped",
-    "stropper",
-    "strowing",
-    "stroyers",
-    "stroying",
-    "strucken",
-    "strudels",
-    "strummed",
-    "strumose",
-    "strumous",
-    "strumpet",
-    "strunted",
-    "strutted",
-    "strutter",
-    "stubbier",
-    "stubbily",
-    "stubbing",
-    "stubbled",
-    "stubbles",
-    "stuccoed",
-    "stuccoer",
-    "stuccoes",
-    "studbook",
-    "studdies",
-    "studding",
-    "studfish",
-    "studiers",
-    "studlier",
-    "studwork",
-    "stuffier",
-    "stuffily",
-    "stuivers",
-    "stultify",
-    "stumming",
-    "stumpage",
-    "stumpers",
-    "stumpier",
-    "stumping",
-    "stunners",
-    "stunsail",
-    "stuntmen",
-    "stupider",
-    "sturdied",
-    "sturdier",
-    "sturdies",
-    "sturdily",
-    "stutters",
-    "styliser",
-    "stylises",
-    "stylites",
-    "stylitic",
-    "stylizer",
-    "stylizes",
-    "styluses",
-    "stymying",
-    "styptics",
-    "styraxes",
-    "styrenes",
-    "suasions",
-    "subabbot",
-    "subacrid",
-    "subadars",
-    "subadult",
-    "subagent",
-    "subahdar",
-    "subareas",
-    "subatoms",
-    "subaural",
-    "subaxial",
-    "subbases",
-    "subbings",
-    "subblock",
-    "subbreed",
-    "subcaste",
-    "subcause",
-    "subcells",
-    "subchief",
-    "subclaim",
-    "subclans",
-    "subclerk",
-    "subcodes",
-    "subcools",
-    "subcults",
-    "subcutes",
-    "subcutis",
-    "subdeans",
-    "subdepot",
-    "subduals",
-    "subduced",
-    "subduces",
-    "subducts",
-    "subduers",
-    "subduing",
-    "subdwarf",
-    "subedits",
-    "subepoch",
-    "suberect",
-    "suberins",
-    "suberise",
-    "suberize",
-    "suberose",
-    "suberous",
-    "subfiles",
-    "subfixes",
-    "subfloor",
-    "subfluid",
-    "subframe",
-    "subfuscs",
-    "subgoals",
-    "subheads",
-    "subhuman",
-    "subhumid",
-    "subideas",
-    "subindex",
-    "subitems",
-    "subjoins",
-    "sublated",
-    "sublates",
-    "sublevel",
-    "sublimed",
-    "sublimer",
-    "sublimes",
-    "sublimit",
-    "sublines",
-    "sublunar",
-    "submerse",
-    "subnasal",
-    "subniche",
-    "subnodal",
-    "subocean",
-    "suboptic",
-    "suborned",
-    "suborner",
-    "subovate",
-    "suboxide",
-    "subpanel",
-    "subpenas",
-    "subphase",
-    "subphyla",
-    "subpolar",
-    "subpubic",
-    "subraces",
-    "subrents",
-    "subrings",
-    "subrules",
-    "subsales",
-    "subsects",
-    "subsense",
-    "subseres",
-    "subserve",
-    "subshaft",
-    "subshell",
-    "subshrub",
-    "subsider",
-    "subsists",
-    "subsites",
-    "subskill",
-    "subsoils",
-    "subsolar",
-    "substage",
-    "substate",
-    "subsumes",
-    "subtaxon",
-    "subteens",
-    "subtends",
-    "subtexts",
-    "subtheme",
-    "subtiler",
-    "subtilin",
-    "subtilty",
-    "subtlest",
-    "subtones",
-    "subtonic",
-    "subtopia",
-    "subtrend",
-    "subtribe",
-    "subtunic",
-    "subulate",
-    "suburbed",
-    "subvened",
-    "subvenes",
-    "subverts",
-    "subvicar",
-    "subviral",
-    "subvirus",
-    "subvocal",
-    "subwayed",
-    "subworld",
-    "subzones",
-    "succinic",
-    "succinyl",
-    "succored",
-    "succorer",
-    "succours",
-    "succubae",
-    "succubas",
-    "succubus",
-    "suchlike",
-    "suchness",
-    "suckered",
-    "suckfish",
-    "suckiest",
-    "sucklers",
-    "suckless",
-    "sucrases",
-    "sucroses",
-    "suctions",
-    "sudaries",
-    "sudarium",
-    "sudation",
-    "sudatory",
-    "sudsiest",
-    "sudsless",
-    "suffaris",
-    "sufficer",
-    "suffixal",
-    "suffixed",
-    "sufflate",
-    "suffused",
-    "suffuses",
-    "sugarers",
-    "sugarier",
-    "sugaring",
-    "suicided",
-    "suitings",
-    "suitlike",
-    "sukiyaki",
-    "sulcated",
-    "sulfated",
-    "sulfinyl",
-    "sulfites",
-    "sulfitic",
-    "sulfones",
-    "sulfonyl",
-    "sulfured",
-    "sulfuret",
-    "sulfuryl",
-    "sulkiest",
-    "sullages",
-    "sullener",
-    "sullenly",
-    "sullying",
-    "sulphids",
-    "sulphite",
-    "sulphone",
-    "sulphurs",
-    "sulphury",
-    "sultanas",
-    "sultanic",
-    "sultrier",
-    "sultrily",
-    "summable",
-    "summands",
-    "summated",
-    "summates",
-    "summered",
-    "summerly",
-    "summital",
-    "summited",
-    "summitry",
-    "sumoists",
-    "sumpters",
-    "sumpweed",
-    "sunbaked",
-    "sunbathe",
-    "sunbaths",
-    "sunbeams",
-    "sunbeamy",
-    "sunbelts",
-    "sunbirds",
-    "sunburns",
-    "sunburnt",
-    "sunchoke",
-    "sundecks",
-    "sundered",
-    "sunderer",
-    "sundowns",
-    "sundress",
-    "sundrily",
-    "sundrops",
-    "sunglows",
-    "sunlamps",
-    "sunlands",
-    "sunniest",
-    "sunporch",
-    "sunproof",
-    "sunroofs",
-    "sunscald",
-    "sunshiny",
-    "sunsuits",
-    "sunwards",
-    "superadd",
-    "superbad",
-    "superber",
-    "superbug",
-    "supercop",
-    "superego",
-    "superfan",
-    "superfix",
-    "superhit",
-    "superhot",
-    "supering",
-    "superjet",
-    "superlay",
-    "superlie",
-    "supermen",
-    "supermom",
-    "supernal",
-    "superpro",
-    "supersex",
-    "superspy",
-    "supertax",
-    "supinate",
-    "supinely",
-    "supplely",
-    "supplest",
-    "suppling",
-    "supposal",
-    "supposer",
-    "supremer",
-    "supremos",
-    "surbased",
-    "surbases",
-    "surcease",
-    "surcoats",
-    "sureness",
-    "surfable",
-    "surfacer",
-    "surfbird",
-    "surfboat",
-    "surfeits",
-    "surffish",
-    "surfiest",
-    "surfings",
-    "surflike",
-    "suricate",
-    "surliest",
-    "surmiser",
-    "surmises",
-    "surmount",
-    "surnamed",
-    "surnamer",
-    "surplice",
-    "surprint",
-    "surprize",
-    "surroyal",
-    "surtaxed",
-    "surtaxes",
-    "surtitle",
-    "surtouts",
-    "surveils",
-    "surviver",
-    "suspired",
-    "suspires",
-    "susurrus",
-    "suturing",
-    "suzerain",
-    "svarajes",
-    "svedberg",
-    "sveltely",
-    "sveltest",
-    "swabbers",
-    "swabbies",
-    "swabbing",
-    "swaddled",
-    "swaddles",
-    "swaggers",
-    "swaggies",
-    "swagging",
-    "swainish",
-    "swampers",
-    "swampier",
-    "swamping",
-    "swampish",
-    "swanherd",
-    "swankest",
-    "swankier",
-    "swankily",
-    "swanking",
-    "swanlike",
-    "swannery",
-    "swanning",
-    "swanpans",
-    "swanskin",
-    "swarajes",
-    "swarding",
-    "swarmers",
-    "swashers",
-    "swashing",
-    "swastica",
-    "swathers",
-    "swathing",
-    "swatters",
-    "swatting",
-    "swayable",
-    "swearers",
-    "sweatbox",
-    "sweatier",
-    "sweatily",
-    "sweeneys",
-    "sweenies",
-    "sweepier",
-    "sweetens",
-    "sweeting",
-    "sweetish",
-    "sweetsop",
-    "swellest",
-    "swelters",
-    "swervers",
-    "swerving",
-    "swiddens",
-    "swifters",
-    "swiftest",
-    "swiftlet",
-    "swiggers",
-    "swigging",
-    "swillers",
-    "swilling",
-    "swimmier",
-    "swimmily",
-    "swindled",
-    "swindler",
-    "swindles",
-    "swinepox",
-    "swingbys",
-    "swingier",
-    "swingled",
-    "swingles",
-    "swingmen",
-    "swinking",
-    "swinneys",
-    "swipples",
-    "swirlier",
-    "swishers",
-    "swishier",
-    "swishing",
-    "swithers",
-    "swiveled",
-    "swizzled",
-    "swizzler",
-    "swizzles",
-    "swobbers",
-    "swobbing",
-    "swooners",
-    "swoonier",
-    "swooning",
-    "swoopers",
-    "swoopier",
-    "swooshed",
-    "swooshes",
-    "swopping",
-    "swordman",
-    "swordmen",
-    "swotters",
-    "swotting",
-    "swounded",
-    "swouning",
-    "sybarite",
-    "sycamine",
-    "sycomore",
-    "syconium",
-    "syenites",
-    "syenitic",
-    "syllabic",
-    "syllabub",
-    "sylphids",
-    "sylphish",
-    "sylvatic",
-    "sylvines",
-    "sylvites",
-    "symbions",
-    "symbiont",
-    "symbiote",
-    "symbiots",
-    "symboled",
-    "sympatry",
-    "sympodia",
-    "synagogs",
-    "synanons",
-    "synapsed",
-    "synapsid",
-    "synapsis",
-    "syncarps",
-    "syncarpy",
-    "synchros",
-    "syncline",
-    "syncopal",
-    "syncopes",
-    "syncopic",
-    "syncytia",
-    "syndeses",
-    "syndesis",
-    "syndetic",
-    "syndical",
-    "synectic",
-    "synergia",
-    "synergic",
-    "synergid",
-    "synfuels",
-    "syngamic",
-    "syngases",
-    "syngenic",
-    "synkarya",
-    "synonyme",
-    "synovias",
-    "syntagma",
-    "syntagms",
-    "syntonic",
-    "syphered",
-    "syphoned",
-    "syrettes",
-    "syringas",
-    "syringed",
-    "syrinxes",
-    "syrphian",
-    "syrphids",
-    "syrupier",
-    "syruping",
-    "systoles",
-    "syzygial",
-    "syzygies",
-    "tabanids",
-    "tabarded",
-    "tabarets",
-    "tabbises",
-    "tabbying",
-    "tabering",
-    "tabetics",
-    "tableaus",
-    "tableful",
-    "tableted",
-    "tabooing",
-    "tabooley",
-    "taborers",
-    "taborets",
-    "taborine",
-    "taboring",
-    "taborins",
-    "tabouleh",
-    "taboulis",
-    "taboured",
-    "tabourer",
-    "tabouret",
-    "tachinid",
-    "tachisme",
-    "tachisms",
-    "tachiste",
-    "tachists",
-    "tachyons",
-    "taciturn",
-    "tackiest",
-    "tacklers",
-    "tackless",
-    "tacnodes",
-    "taconite",
-    "tacrines",
-    "tactions",
-    "tactless",
-    "taffarel",
-    "tafferel",
-    "taffetas",
-    "taffrail",
-    "tagalong",
-    "taggants",
-    "tagmemes",
-    "tagmemic",
-    "taiglach",
-    "tailbone",
-    "tailcoat",
-    "tailfans",
-    "tailfins",
-    "taillamp",
-    "tailless",
-    "tailleur",
-    "taillike",
-    "tailrace",
-    "tailskid",
-    "tailspin",
-    "tailwind",
-    "tainting",
-    "takeable",
-    "takeoffs",
-    "takeouts",
-    "takingly",
-    "talapoin",
-    "talcking",
-    "taleggio",
-    "talesman",
-    "talesmen",
-    "taleysim",
-    "talipeds",
-    "talipots",
-    "talkable",
-    "talkiest",
-    "talkings",
-    "tallaged",
-    "tallages",
-    "tallboys",
-    "talliers",
-    "tallises",
-    "tallisim",
-    "talliths",
-    "tallitim",
-    "tallness",
-    "tallowed",
-    "tallyhos",
-    "tallyman",
-    "tallymen",
-    "talookas",
-    "tamandua",
-    "tamandus",
-    "tamaraos",
-    "tamaraus",
-    "tamarins",
-    "tamarisk",
-    "tamashas",
-    "tambalas",
-    "tamboura",
-    "tambours",
-    "tamburas",
-    "tameable",
-    "tameless",
-    "tameness",
-    "tampalas",
-    "tamperer",
-    "tampions",
-    "tamponed",
-    "tanagers",
-    "tanbarks",
-    "tandoors",
-    "tangelos",
-    "tangence",
-    "tangency",
-    "tangibly",
-    "tangiest",
-    "tanglers",
-    "tanglier",
-    "tangling",
-    "tangoing",
-    "tangrams",
-    "tanistry",
-    "tankages",
-    "tankfuls",
-    "tankinis",
-    "tanklike",
-    "tankship",
-    "tannable",
-    "tannages",
-    "tannates",
-    "tannings",
-    "tantalic",
-    "tantalus",
-    "tantaras",
-    "tantrism",
-    "tanyards",
-    "tapadera",
-    "tapadero",
-    "tapeable",
-    "tapeless",
-    "tapelike",
-    "tapeline",
-    "tapenade",
-    "taperers",
-    "tapholes",
-    "taphouse",
-    "tapiocas",
-    "tappable",
-    "tappings",
-    "taprooms",
-    "taproots",
-    "tapsters",
-    "tarantas",
-    "tarboosh",
-    "tardiest",
-    "tardyons",
-    "tariffed",
-    "tarlatan",
-    "tarletan",
-    "tarnally",
-    "tarpaper",
-    "tarriers",
-    "tarriest",
-    "tarrying",
-    "tarsiers",
-    "tartanas",
-    "tartaric",
-    "tartiest",
-    "tartlets",
-    "tartness",
-    "tartufes",
-    "tartuffe",
-    "tarweeds",
-    "taskbars",
-    "taskwork",
-    "tasseled",
-    "tastable",
-    "tastiest",
-    "tatouays",
-    "tattiest",
-    "tattings",
-    "tattlers",
-    "tattling",
-    "tattooer",
-    "taunters",
-    "taurines",
-    "tautaugs",
-    "tautened",
-    "tautness",
-    "tautomer",
-    "tautonym",
-    "tavernas",
-    "taverner",
-    "tawdrier",
-    "tawdries",
-    "tawdrily",
-    "tawniest",
-    "taxables",
-    "taxingly",
-    "taxiways",
-    "teaberry",
-    "teaboard",
-    "teabowls",
-    "teaboxes",
-    "teacakes",
-    "teacarts",
-    "teakwood",
-    "teamaker",
-    "tearable",
-    "tearaway",
-    "teariest",
-    "tearless",
-    "tearooms",
-    "teasable",
-    "teaseled",
-    "teaseler",
-    "teashops",
-    "teatimes",
-    "teawares",
-    "teazeled",
-    "teazling",
-    "techiest",
-    "tectites",
-    "teddered",
-    "teeniest",
-    "teensier",
-    "teenybop",
-    "teetered",
-    "teetotal",
-    "teetotum",
-    "tefillin",
-    "tegmenta",
-    "tegminal",
-    "tegument",
-    "tegumina",
-    "teiglach",
-    "tektites",
-    "tektitic",
-    "telegony",
-    "teleosts",
-    "telepath",
-    "teleplay",
-    "telerans",
-    "teleshop",
-    "telestic",
-    "teleview",
-    "televise",
-    "telexing",
-    "telfered",
-    "telfords",
-    "tellable",
-    "telluric",
-    "telneted",
-    "telphers",
-    "telsonic",
-    "temblors",
-    "temerity",
-    "temperas",
-    "temperer",
-    "tempests",
-    "templets",
-    "tempters",
-    "tempuras",
-    "tenacula",
-    "tenaille",
-    "tenanted",
-    "tenantry",
-    "tendance",
-    "tendence",
-    "tenebrae",
-    "tenesmic",
-    "tenesmus",
-    "tenfolds",
-    "teniases",
-    "teniasis",
-    "tennises",
-    "tennists",
-    "tenoners",
-    "tenoning",
-    "tenorist",
-    "tenorite",
-    "tenotomy",
-    "tenpence",
-    "tenpenny",
-    "tensible",
-    "tensibly",
-    "tentages",
-    "tentered",
-    "tentiest",
-    "tentless",
-    "tentlike",
-    "tentoria",
-    "tenurial",
-    "tenuring",
-    "teocalli",
-    "teosinte",
-    "tepefied",
-    "tepefies",
-    "tephrite",
-    "tepidity",
-    "tequilas",
-    "teraflop",
-    "teraohms",
-    "teraphim",
-    "teratism",
-    "teratoid",
-    "teratoma",
-    "terawatt",
-    "terbiums",
-    "tercelet",
-    "terebene",
-    "tergites",
-    "termitic",
-    "termless",
-    "termtime",
-    "ternions",
-    "terpenes",
-    "terpenic",
-    "terpinol",
-    "terranes",
-    "terraria",
-    "terrases",
-    "terreens",
-    "terrella",
-    "terrenes",
-    "terrines",
-    "tertials",
-    "tertians",
-    "terylene",
-    "tesserae",
-    "testates",
-    "testiest",
-    "testoons",
-    "testudos",
-    "tetanics",
-    "tetanies",
-    "tetanise",
-    "tetanize",
-    "tetanoid",
-    "tetchier",
-    "tetchily",
-    "tetotums",
-    "tetracid",
-    "tetradic",
-    "tetragon",
-    "tetramer",
-    "tetrapod",
-    "tetrarch",
-    "tetrodes",
-    "tetroxid",
-    "textless",
-    "textuary",
-    "thacking",
-    "thalloid",
-    "thallous",
-    "thalwegs",
-    "thanages",
-    "thanatos",
-    "thankers",
-    "thataway",
-    "thatches",
-    "thawless",
-    "thearchy",
-    "theatric",
-    "thebaine",
-    "theelins",
-    "theelols",
-    "thelitis",
-    "thenages",
-    "theocrat",
-    "theodicy",
-    "theogony",
-    "theologs",
-    "theonomy",
-    "theorbos",
-    "theorise",
-    "theriaca",
-    "theriacs",
-    "therians",
-    "thermels",
-    "thermion",
-    "thermite",
-    "thermits",
-    "theropod",
-    "thetical",
-    "theurgic",
-    "thewiest",
-    "thewless",
-    "thiamins",
-    "thiazide",
-    "thiazine",
-    "thiazins",
-    "thiazole",
-    "thiazols",
-    "thickety",
-    "thickish",
-    "thickset",
-    "thievish",
-    "thinclad",
-    "thindown",
-    "thinnish",
-    "thionate",
-    "thionine",
-    "thionins",
-    "thionyls",
-    "thiophen",
-    "thiotepa",
-    "thiourea",
-    "thirlage",
-    "thirling",
-    "thirsted",
-    "thirster",
-    "thisaway",
-    "tholepin",
-    "thoracal",
-    "thoraces",
-    "thoraxes",
-    "thorites",
-    "thoriums",
-    "thornier",
-    "thornily",
-    "thorning",
-    "thowless",
-    "thraldom",
-    "thralled",
-    "thrashes",
-    "thrawart",
-    "thrawing",
-    "thrawnly",
-    "threaped",
-    "threaper",
-    "threated",
-    "threeped",
-    "threnode",
-    "threnody",
-    "threshed",
-    "threshes",
-    "thrivers",
-    "throbbed",
-    "throbber",
-    "thronged",
-    "throning",
-    "throstle",
-    "thrummed",
-    "thrummer",
-    "thruputs",
-    "thrushes",
-    "thrusted",
-    "thrustor",
-    "thruways",
-    "thudding",
-    "thuggees",
-    "thuggery",
-    "thuggish",
-    "thuliums",
-    "thumbkin",
-    "thumbnut",
-    "thumpers",
-    "thundery",
-    "thunking",
-    "thurible",
-    "thurifer",
-    "thwacked",
-    "thwacker",
-    "thwarter",
-    "thwartly",
-    "thymiest",
-    "thymines",
-    "thymosin",
-    "thymuses",
-    "thyreoid",
-    "thyroids",
-    "thyroxin",
-    "thyrsoid",
-    "tickings",
-    "tickseed",
-    "ticktack",
-    "ticktock",
-    "tiddlers",
-    "tideland",
-    "tideless",
-    "tidelike",
-    "tidemark",
-    "tiderips",
-    "tideways",
-    "tidiness",
-    "tidytips",
-    "tiebacks",
-    "tiebreak",
-    "tieclasp",
-    "tiercels",
-    "tiffined",
-    "tigereye",
-    "tigerish",
-    "tightwad",
-    "tilapias",
-    "tilefish",
-    "tilelike",
-    "tillable",
-    "tillages",
-    "tillered",
-    "tillites",
-    "tiltable",
-    "tiltyard",
-    "timaraus",
-    "timbales",
-    "timbrels",
-    "timecard",
-    "timelier",
-    "timework",
-    "timeworn",
-    "timidest",
-    "timolols",
-    "timorous",
-    "timpanum",
-    "tinamous",
-    "tincting",
-    "tinfoils",
-    "tingeing",
-    "tinglers",
-    "tinglier",
-    "tinhorns",
-    "tininess",
-    "tinkered",
-    "tinkerer",
-    "tinklers",
-    "tinklier",
-    "tinniest",
-    "tinseled",
-    "tinselly",
-    "tinsmith",
-    "tinsnips",
-    "tinstone",
-    "tintings",
-    "tintless",
-    "tintypes",
-    "tinwares",
-    "tinworks",
-    "tipcarts",
-    "tippable",
-    "tippiest",
-    "tipplers",
-    "tippling",
-    "tippytoe",
-    "tipsheet",
-    "tipsiest",
-    "tipstaff",
-    "tipsters",
-    "tipstock",
-    "tiredest",
-    "tirrivee",
-    "tissuing",
-    "tissular",
-    "titanate",
-    "titaness",
-    "titanias",
-    "titanism",
-    "titanite",
-    "titanous",
-    "tithable",
-    "tithings",
-    "tithonia",
-    "titivate",
-    "titlarks",
-    "titlists",
-    "titmouse",
-    "titrable",
-    "titrants",
-    "titrated",
-    "titrates",
-    "titrator",
-    "tittered",
-    "titterer",
-    "tittuped",
-    "tittuppy",
-    "titubant",
-    "titulars",
-    "titulary",
-    "toadfish",
-    "toadflax",
-    "toadless",
-    "toadlike",
-    "toadying",
-    "toadyish",
-    "toadyism",
-    "toastier",
-    "toccatas",
-    "tochered",
-    "tocology",
-    "toddling",
-    "toeholds",
-    "toepiece",
-    "toeplate",
-    "toeshoes",
-    "tofuttis",
-    "togglers",
-    "toileted",
-    "toilsome",
-    "toilworn",
-    "tokamaks",
-    "tokening",
-    "tokenism",
-    "tokology",
-    "tokomaks",
-    "tokonoma",
-    "tolarjev",
-    "tolbooth",
-    "tolidine",
-    "tolidins",
-    "tollages",
-    "tollbars",
-    "tollgate",
-    "tollways",
-    "toluates",
-    "toluenes",
-    "toluides",
-    "toluidin",
-    "toluoles",
-    "tomalley",
-    "tomatoey",
-    "tombacks",
-    "tombless",
-    "tomblike",
-    "tombolas",
-    "tombolos",
-    "tomentum",
-    "tomfools",
-    "tommyrot",
-    "tomogram",
-    "tompions",
-    "tonearms",
-    "toneless",
-    "tonetics",
-    "tonettes",
-    "tonguing",
-    "tonicity",
-    "tonishly",
-    "tonnages",
-    "tonneaus",
-    "tonneaux",
-    "tonsilar",
-    "tonsured",
-    "tonsures",
-    "tontines",
-    "toolhead",
-    "toolings",
-    "toolless",
-    "toolroom",
-    "toothier",
-    "toothily",
-    "toothing",
-    "tootlers",
-    "tootling",
-    "tootsies",
-    "topazine",
-    "topcoats",
-    "topcross",
-    "topkicks",
-    "topknots",
-    "toplines",
-    "toplofty",
-    "topmasts",
-    "topnotch",
-    "toponyms",
-    "toponymy",
-    "topotype",
-    "topsails",
-    "topsider",
-    "topsides",
-    "topsoils",
-    "topspins",
-    "topstone",
-    "topworks",
-    "torchere",
-    "torchier",
-    "torching",
-    "torchons",
-    "toreutic",
-    "tornadic",
-    "tornillo",
-    "torosity",
-    "torpedos",
-    "torpidly",
-    "torquate",
-    "torquers",
-    "torquing",
-    "torrider",
-    "torridly",
-    "torsades",
-    "torsions",
-    "tortonis",
-    "torturer",
-    "tosspots",
-    "tostadas",
-    "tostados",
-    "totalise",
-    "totalism",
-    "totalist",
-    "totalize",
-    "toteable",
-    "totemism",
-    "totemist",
-    "totemite",
-    "tottered",
-    "totterer",
-    "touchers",
-    "touchier",
-    "touchily",
-    "touchups",
-    "toughens",
-    "toughies",
-    "toughing",
-    "toughish",
-    "touracos",
-    "tourings",
-    "tourisms",
-    "tourista",
-    "tousling",
-    "touzling",
-    "tovarich",
-    "tovarish",
-    "towardly",
-    "towaways",
-    "towboats",
-    "toweling",
-    "towelled",
-    "towerier",
-    "towheads",
-    "towlines",
-    "towmonds",
-    "towmonts",
-    "townfolk",
-    "townless",
-    "townlets",
-    "townsman",
-    "townwear",
-    "towpaths",
-    "towplane",
-    "towropes",
-    "towsacks",
-    "toxaemia",
-    "toxaemic",
-    "toxemias",
-    "toxicant",
-    "toyshops",
-    "trabeate",
-    "tracheae",
-    "tracheas",
-    "tracheid",
-    "trachled",
-    "trachles",
-    "trachoma",
-    "trachyte",
-    "tracings",
-    "trackage",
-    "trackman",
-    "trackmen",
-    "trackpad",
-    "trackway",
-    "tractate",
-    "tractile",
-    "tractive",
-    "traditor",
-    "traduced",
-    "traducer",
-    "traduces",
-    "traffics",
-    "tragical",
-    "tragopan",
-    "traiking",
-    "trainful",
-    "trainman",
-    "trainmen",
-    "trainway",
-    "traipsed",
-    "traipses",
-    "trajects",
-    "tramcars",
-    "trameled",
-    "tramells",
-    "tramless",
-    "tramline",
-    "trammels",
-    "tramming",
-    "trampers",
-    "trampier",
-    "trampish",
-    "trampler",
-    "tramples",
-    "tramroad",
-    "tramways",
-    "trancing",
-    "trangams",
-    "transept",
-    "transfix",
-    "tranship",
-    "transoms",
-    "transude",
-    "trapball",
-    "trapesed",
-    "trapeses",
-    "trapezes",
-    "trapezia",
-    "trapezii",
-    "traplike",
-    "trapline",
-    "trapnest",
-    "trappean",
-    "trappose",
-    "trappous",
-    "traprock",
-    "trapunto",
-    "trashers",
-    "trashier",
-    "trashily",
-    "trashman",
-    "trashmen",
-    "trauchle",
-    "traumata",
-    "travoise",
-    "trawleys",
-    "trawlnet",
-    "trayfuls",
-    "treacles",
-    "treaders",
-    "treadled",
-    "treadler",
-    "treadles",
-    "treasons",
-    "treaters",
-    "trebling",
-    "trecento",
-    "treddled",
-    "treddles",
-    "treelawn",
-    "treelike",
-    "treenail",
-    "trefoils",
-    "trehalas",
-    "trembler",
-    "trembles",
-    "tremolos",
-    "trenails",
-    "trenched",
-    "trencher",
-    "trendier",
-    "trendies",
-    "trendily",
-    "trendoid",
-    "trepangs",
-    "trephine",
-    "tressels",
-    "tressier",
-    "tressour",
-    "tressure",
-    "trestles",
-    "trevally",
-    "triacids",
-    "triadics",
-    "triadism",
-    "triaging",
-    "triarchy",
-    "triazine",
-    "triazins",
-    "triazole",
-    "tribades",
-    "tribadic",
-    "tribally",
-    "tribasic",
-    "tribrach",
-    "tribunes",
-    "trichina",
-    "trichite",
-    "trichoid",
-    "trichome",
-    "trickers",
-    "trickily",
-    "trickish",
-    "trickles",
-    "triclads",
-    "tricorne",
-    "tricorns",
-    "trictrac",
-    "tridents",
-    "triduums",
-    "triennia",
-    "trientes",
-    "triethyl",
-    "triflers",
-    "trifocal",
-    "triforia",
-    "triggest",
-    "trigging",
-    "triglyph",
-    "trigness",
-    "trigonal",
-    "trigrams",
-    "trigraph",
-    "trihedra",
-    "trilbies",
-    "triliths",
-    "trillers",
-    "trilling",
-    "trilobal",
-    "trilobed",
-    "trimaran",
-    "trimeric",
-    "trimeter",
-    "trimmest",
-    "trimness",
-    "trimorph",
-    "trimotor",
-    "trindled",
-    "trindles",
-    "trinkums",
-    "trinodal",
-    "triolets",
-    "trioxids",
-    "tripacks",
-    "tripedal",
-    "triphase",
-    "triplane",
-    "triplite",
-    "triploid",
-    "tripodal",
-    "tripodic",
-    "tripolis",
-    "triposes",
-    "trippers",
-    "trippets",
-    "trippier",
-    "triptane",
-    "triptans",
-    "triptyca",
-    "triremes",
-    "triscele",
-    "trisects",
-    "trisemes",
-    "trisemic",
-    "trishaws",
-    "triskele",
-    "trisomes",
-    "trisomic",
-    "tristeza",
-    "tristful",
-    "tristich",
-    "trithing",
-    "tritiums",
-    "tritomas",
-    "tritones",
-    "triumvir",
-    "triunity",
-    "trivalve",
-    "troaking",
-    "trochaic",
-    "trochars",
-    "trochees",
-    "trochili",
-    "trochils",
-    "trochlea",
-    "trochoid",
-    "trocking",
-    "troffers",
-    "troilism",
-    "troilite",
-    "trolands",
-    "trollers",
-    "trollied",
-    "trollies",
-    "trollops",
-    "trollopy",
-    "trommels",
-    "tromping",
-    "troopial",
-    "trooping",
-    "trophied",
-    "tropines",
-    "tropisms",
-    "trothing",
-    "trotline",
-    "troubler",
-    "trounced",
-    "trouncer",
-    "trounces",
-    "troupers",
-    "troupial",
-    "trouping",
-    "troutier",
-    "trouvere",
-    "trouveur",
-    "troweled",
-    "troweler",
-    "trowsers",
-    "truanted",
-    "truantly",
-    "truantry",
-    "truckage",
-    "truckful",
-    "truckled",
-    "truckler",
-    "truckles",
-    "truckman",
-    "truckmen",
-    "trudgens",
-    "trudgeon",
-    "trudgers",
-    "trudging",
-    "trueblue",
-    "trueborn",
-    "truebred",
-    "truelove",
-    "trueness",
-    "truffled",
-    "truistic",
-    "trumeaux",
-    "trumpery",
-    "trumping",
-    "trundled",
-    "trundler",
-    "trundles",
-    "trunkful",
-    "trunnels",
-    "trunnion",
-    "trussers",
-    "trussing",
-    "trusteed",
-    "trusters",
-    "trustful",
-    "trustier",
-    "trusties",
-    "trustily",
-    "trustors",
-    "tryingly",
-    "trypsins",
-    "trysails",
-    "trysters",
-    "trysting",
-    "tryworks",
-    "tsardoms",
-    "tsarevna",
-    "tsarinas",
-    "tsarisms",
-    "tsarists",
-    "tsaritza",
-    "tsatskes",
-    "tsktsked",
-    "tsorriss",
-    "tsunamic",
-    "tuataras",
-    "tuateras",
-    "tubaists",
-    "tubbable",
-    "tubbiest",
-    "tubelike",
-    "tubenose",
-    "tubercle",
-    "tuberoid",
-    "tuberose",
-    "tubework",
-    "tubeworm",
-    "tubiform",
-    "tubulate",
-    "tubulins",
-    "tubulose",
-    "tubulous",
-    "tubulure",
-    "tuckered",
-    "tuckshop",
-    "tuftiest",
-    "tuftings",
-    "tugboats",
-    "tughriks",
-    "tuitions",
-    "tullibee",
-    "tumbrels",
-    "tumbrils",
-    "tumefied",
-    "tumefies",
-    "tumesced",
-    "tumesces",
-    "tumidity",
-    "tummlers",
-    "tumorous",
-    "tumpline",
-    "tumulose",
-    "tumulous",
-    "tuneable",
-    "tuneably",
-    "tuneless",
-    "tungstic",
-    "tunicate",
-    "tunicles",
-    "tunnages",
-    "tunneler",
-    "tuppence",
-    "tuppenny",
-    "turacous",
-    "turbaned",
-    "turbeths",
-    "turbidly",
-    "turbinal",
-    "turbiths",
-    "turbocar",
-    "turbofan",
-    "turbojet",
-    "turfiest",
-    "turfless",
-    "turflike",
-    "turfskis",
-    "turgency",
-    "turgidly",
-    "turgites",
-    "turistas",
-    "turmoils",
-    "turnable",
-    "turncoat",
-    "turnhall",
-    "turnings",
-    "turnkeys",
-    "turnoffs",
-    "turnsole",
-    "turnspit",
-    "turpeths",
-    "turquois",
-    "turreted",
-    "turrical",
-    "turtlers",
-    "turtling",
-    "tuskless",
-    "tusklike",
-    "tussises",
-    "tussling",
-    "tussocks",
-    "tussocky",
-    "tussores",
-    "tussucks",
-    "tutelars",
-    "tutelary",
-    "tutorage",
-    "tutoress",
-    "tutoyers",
-    "tuxedoed",
-    "tuxedoes",
-    "twaddled",
-    "twaddler",
-    "twaddles",
-    "twangers",
-    "twangier",
-    "twanging",
-    "twangled",
-    "twangler",
-    "twangles",
-    "twankies",
-    "twasomes",
-    "twattled",
-    "twattles",
-    "tweakier",
-    "tweedier",
-    "tweedled",
-    "tweedles",
-    "tweeners",
-    "tweeness",
-    "tweeting",
-    "tweezing",
-    "twelfths",
-    "twelvemo",
-    "twibills",
-    "twiddled",
-    "twiddler",
-    "twiddles",
-    "twiggier",
-    "twigging",
-    "twigless",
-    "twiglike",
-    "twilling",
-    "twinborn",
-    "twinging",
-    "twiniest",
-    "twinight",
-    "twinjets",
-    "twinkies",
-    "twinkled",
-    "twinkler",
-    "twinkles",
-    "twinsets",
-    "twinship",
-    "twirlers",
-    "twirlier",
-    "twistier",
-    "twitcher",
-    "twitches",
-    "twitters",
-    "twittery",
-    "twitting",
-    "twofolds",
-    "twoonies",
-    "twopence",
-    "twopenny",
-    "twosomes",
-    "tylosins",
-    "tympanal",
-    "tympanic",
-    "tympanum",
-    "typeable",
-    "typebars",
-    "typecase",
-    "typecast",
-    "typesets",
-    "typhoids",
-    "typhonic",
-    "typhuses",
-    "typifier",
-    "typifies",
-    "tyramine",
-    "tyrannic",
-    "tzardoms",
-    "tzarevna",
-    "tzarinas",
-    "tzarisms",
-    "tzarists",
-    "tzaritza",
-    "tziganes",
-    "tzitzith",
-    "ubieties",
-    "udometer",
-    "udometry",
-    "uglified",
-    "uglifier",
-    "uglifies",
-    "uintaite",
-    "ukeleles",
-    "ukuleles",
-    "ulcerate",
-    "ulcering",
-    "ulcerous",
-    "ulexites",
-    "ultimacy",
-    "ultimata",
-    "ultradry",
-    "ultrahip",
-    "ultrahot",
-    "ultraism",
-    "ultraist",
-    "ultralow",
-    "ultrared",
-    "ululated",
-    "ululates",
-    "umangite",
-    "umbellar",
-    "umbelled",
-    "umbellet",
-    "umbering",
-    "umbilici",
-    "umbonate",
-    "umbrages",
-    "umbrette",
-    "umlauted",
-    "umpirage",
-    "umteenth",
-    "unabused",
-    "unacidic",
-    "unageing",
-    "unagreed",
-    "unakites",
-    "unallied",
-    "unamazed",
-    "unamused",
-    "unanchor",
-    "unaneled",
-    "unarched",
-    "unargued",
-    "unarming",
-    "unartful",
-    "unatoned",
-    "unavowed",
-    "unawaked",
-    "unawares",
-    "unbacked",
-    "unbaling",
-    "unbanded",
-    "unbanned",
-    "unbarbed",
-    "unbarred",
-    "unbasted",
-    "unbathed",
-    "unbeared",
-    "unbelted",
-    "unbended",
-    "unbenign",
-    "unbidden",
-    "unbilled",
-    "unbitted",
-    "unbitten",
-    "unbitter",
-    "unblamed",
-    "unblocks",
-    "unbloody",
-    "unbobbed",
-    "unbodied",
-    "unboiled",
-    "unbolted",
-    "unbonnet",
-    "unbooted",
-    "unbosoms",
-    "unbottle",
-    "unbought",
-    "unbouncy",
-    "unbowing",
-    "unboxing",
-    "unbraced",
-    "unbraces",
-    "unbraids",
-    "unbraked",
-    "unbrakes",
-    "unbreech",
-    "unbridle",
-    "unbright",
-    "unbuckle",
-    "unbuilds",
-    "unbundle",
-    "unburden",
-    "unburied",
-    "unburned",
-    "unbusted",
-    "unbutton",
-    "uncaging",
-    "uncaking",
-    "uncandid",
-    "uncanned",
-    "uncarded",
-    "uncarted",
-    "uncarved",
-    "uncashed",
-    "uncasing",
-    "uncasked",
-    "uncatchy",
-    "uncaught",
-    "uncaused",
-    "unchains",
-    "unchairs",
-    "unchancy",
-    "uncharge",
-    "unchaste",
-    "unchewed",
-    "unchicly",
-    "unchoked",
-    "unchokes",
-    "unchosen",
-    "unchurch",
-    "uncially",
-    "unciform",
-    "uncinate",
-    "unclamps",
-    "unclasps",
-    "unclassy",
-    "unclawed",
-    "unclench",
-    "unclinch",
-    "uncloaks",
-    "unclosed",
-    "uncloses",
-    "unclothe",
-    "unclouds",
-    "uncloudy",
-    "uncloyed",
-    "uncocked",
-    "uncoffin",
-    "uncoiled",
-    "uncoined",
-    "uncombed",
-    "uncomely",
-    "uncooled",
-    "uncouple",
-    "uncrated",
-    "uncrates",
-    "uncreate",
-    "uncrewed",
-    "uncrowns",
-    "unctions",
-    "unctuous",
-    "uncuffed",
-    "uncurbed",
-    "uncurled",
-    "uncursed",
-    "undamped",
-    "undaring",
-    "undecked",
-    "undenied",
-    "undented",
-    "underact",
-    "underate",
-    "underbid",
-    "underbud",
-    "underbuy",
-    "underdid",
-    "undereat",
-    "underfed",
-    "underfur",
-    "undergod",
-    "underjaw",
-    "underlap",
-    "underlet",
-    "underlip",
-    "underlit",
-    "underpay",
-    "underran",
-    "underrun",
-    "underset",
-    "undertax",
-    "underuse",
-    "undevout",
-    "undimmed",
-    "undoable",
-    "undocile",
-    "undocked",
-    "undoings",
-    "undotted",
-    "undouble",
-    "undraped",
-    "undrapes",
-    "undreamt",
-    "undubbed",
-    "undulant",
-    "undulate",
-    "undulled",
-    "unearths",
-    "uneasier",
-    "unedible",
-    "unenvied",
-    "unequals",
-    "unerased",
-    "unerotic",
-    "unerring",
-    "unevaded",
-    "unevener",
-    "unexotic",
-    "unexpert",
-    "unfading",
-    "unfairer",
-    "unfaiths",
-    "unfallen",
-    "unfamous",
-    "unfasten",
-    "unfeared",
-    "unfelted",
-    "unfenced",
-    "unfences",
-    "unfetter",
-    "unfilial",
-    "unfilmed",
-    "unfished",
-    "unfitted",
-    "unfixing",
-    "unflashy",
-    "unflawed",
-    "unflexed",
-    "unfluted",
-    "unfoiled",
-    "unfolder",
-    "unforged",
-    "unforgot",
-    "unforked",
-    "unformed",
-    "unfought",
-    "unfreeze",
-    "unfrocks",
-    "unfrozen",
-    "unfurled",
-    "ungainly",
-    "ungalled",
-    "ungarbed",
-    "ungazing",
-    "ungelded",
-    "ungenial",
-    "ungentle",
-    "ungently",
-    "ungifted",
-    "ungirded",
-    "ungiving",
-    "unglazed",
-    "ungloved",
-    "ungloves",
-    "ungluing",
-    "ungotten",
-    "ungowned",
-    "ungraced",
-    "ungreedy",
-    "unground",
-    "unguards",
-    "unguenta",
-    "unguents",
-    "unguided",
-    "ungulate",
-    "unhailed",
-    "unhaired",
-    "unhairer",
-    "unhallow",
-    "unhalved",
-    "unhanded",
-    "unhanged",
-    "unhatted",
-    "unhealed",
-    "unhedged",
-    "unheeded",
-    "unhelmed",
-    "unhelped",
-    "unheroic",
-    "unhinges",
-    "unholier",
-    "unholily",
-    "unhooded",
-    "unhooked",
-    "unhorsed",
-    "unhorses",
-    "unhoused",
-    "unhouses",
-    "unhusked",
-    "unialgal",
-    "unicolor",
-    "unideaed",
-    "unifaces",
-    "unifiers",
-    "unifilar",
-    "unilobed",
-    "unimbued",
-    "unionise",
-    "unionize",
-    "uniquest",
-    "unironed",
-    "unironic",
-    "unisexes",
-    "unisonal",
-    "unitages",
-    "unitards",
-    "unitedly",
-    "unitized",
-    "unitizer",
-    "unitizes",
-    "univalve",
-    "univocal",
-    "unjammed",
-    "unjoined",
-    "unjoints",
-    "unjoyful",
-    "unjudged",
-    "unkeeled",
-    "unkenned",
-    "unkennel",
-    "unkinder",
-    "unkindly",
-    "unkingly",
-    "unkinked",
-    "unkissed",
-    "unkosher",
-    "unlacing",
-    "unlading",
-    "unlashed",
-    "unlashes",
-    "unlaying",
-    "unlearns",
-    "unlearnt",
-    "unleased",
-    "unlethal",
-    "unletted",
-    "unlevels",
-    "unlevied",
-    "unlicked",
-    "unlimber",
-    "unlively",
-    "unliving",
-    "unloader",
-    "unloosed",
-    "unloosen",
-    "unlooses",
-    "unlovely",
-    "unloving",
-    "unmailed",
-    "unmakers",
-    "unmaking",
-    "unmanful",
-    "unmapped",
-    "unmarred",
-    "unmasker",
-    "unmatted",
-    "unmeetly",
-    "unmellow",
-    "unmelted",
-    "unmended",
-    "unmeshed",
-    "unmeshes",
-    "unmewing",
-    "unmilled",
-    "unmingle",
-    "unmiters",
-    "unmitred",
-    "unmitres",
-    "unmixing",
-    "unmodish",
-    "unmolded",
-    "unmolten",
-    "unmoored",
-    "unmoving",
-    "unmuffle",
-    "unmuzzle",
-    "unnailed",
-    "unnerved",
-    "unnerves",
-    "unornate",
-    "unpacker",
-    "unpadded",
-    "unparted",
-    "unpaying",
-    "unpeeled",
-    "unpegged",
-    "unpenned",
-    "unpeople",
-    "unperson",
-    "unpicked",
-    "unpiling",
-    "unpinned",
-    "unpitied",
-    "unpitted",
-    "unplaced",
-    "unplaits",
-    "unpliant",
-    "unplowed",
-    "unpoetic",
-    "unpoised",
-    "unpolite",
-    "unpolled",
-    "unposted",
-    "unpotted",
-    "unpretty",
-    "unpriced",
-    "unprimed",
-    "unprized",
-    "unprobed",
-    "unproved",
-    "unpruned",
-    "unpucker",
-    "unpurely",
-    "unpurged",
-    "unpuzzle",
-    "unquiets",
-    "unquotes",
-    "unraised",
-    "unreally",
-    "unreason",
-    "unreeled",
-    "unreeler",
-    "unreeved",
-    "unreeves",
-    "unrented",
-    "unrepaid",
-    "unrepair",
-    "unrested",
-    "unretire",
-    "unrhymed",
-    "unribbed",
-    "unriddle",
-    "unrifled",
-    "unrigged",
-    "unrinsed",
-    "unripely",
-    "unripest",
-    "unripped",
-    "unrobing",
-    "unrolled",
-    "unroofed",
-    "unrooted",
-    "unrounds",
-    "unrulier",
-    "unrushed",
-    "unrusted",
-    "unsaddle",
-    "unsafely",
-    "unsafety",
-    "unsaying",
-    "unscaled",
-    "unscrews",
-    "unseamed",
-    "unseared",
-    "unseated",
-    "unseeded",
-    "unseeing",
-    "unseized",
-    "unserved",
-    "unsettle",
-    "unsewing",
-    "unsexing",
-    "unsexual",
-    "unshaded",
-    "unshaken",
-    "unshamed",
-    "unshaped",
-    "unshapen",
-    "unshared",
-    "unshells",
-    "unshifts",
-    "unshrunk",
-    "unsicker",
-    "unsifted",
-    "unsights",
-    "unsilent",
-    "unsinful",
-    "unslaked",
-    "unsliced",
-    "unslings",
-    "unsmoked",
-    "unsnarls",
-    "unsoaked",
-    "unsocial",
-    "unsoiled",
-    "unsolder",
-    "unsonsie",
-    "unsought",
-    "unsoured",
-    "unspeaks",
-    "unsphere",
-    "unspools",
-    "unsprung",
-    "unstably",
-    "unstacks",
-    "unstates",
-    "unstayed",
-    "unsteels",
-    "unsticks",
-    "unstitch",
-    "unstoned",
-    "unstraps",
-    "unstress",
-    "unstring",
-    "unstuffy",
-    "unsubtle",
-    "unsubtly",
-    "unsurely",
-    "unswathe",
-    "unswayed",
-    "unswears",
-    "untacked",
-    "untanned",
-    "untasted",
-    "untaught",
-    "untended",
-    "untented",
-    "untether",
-    "unthawed",
-    "unthinks",
-    "unthread",
-    "unthrone",
-    "untidied",
-    "untidier",
-    "untidies",
-    "untidily",
-    "untieing",
-    "untilled",
-    "untilted",
-    "untinged",
-    "untipped",
-    "untiring",
-    "untraced",
-    "untracks",
-    "untreads",
-    "untrendy",
-    "untruest",
-    "untrusty",
-    "untruths",
-    "untucked",
-    "untufted",
-    "untuning",
-    "untwined",
-    "untwines",
-    "untwists",
-    "ununbium",
-    "ununited",
-    "unvalued",
-    "unvaried",
-    "unveined",
-    "unversed",
-    "unvested",
-    "unviable",
-    "unvoiced",
-    "unvoices",
-    "unwalled",
-    "unwaning",
-    "unwarier",
-    "unwarily",
-    "unwarmed",
-    "unwarned",
-    "unwarped",
-    "unwasted",
-    "unweaned",
-    "unweaves",
-    "unwedded",
-    "unweeded",
-    "unweight",
-    "unwelded",
-    "unwetted",
-    "unwifely",
-    "unwilled",
-    "unwinder",
-    "unwisdom",
-    "unwisely",
-    "unwisest",
-    "unwished",
-    "unwishes",
-    "unwitted",
-    "unwonted",
-    "unwooded",
-    "unworked",
-    "unyeaned",
-    "unyoking",
-    "upbearer",
-    "upboiled",
-    "upbraids",
-    "upbuilds",
-    "upchucks",
-    "upclimbs",
-    "upcoiled",
-    "upcurled",
-    "upcurved",
-    "upcurves",
-    "updarted",
-    "updaters",
-    "updiving",
-    "updrafts",
-    "updrying",
-    "upending",
-    "upflings",
-    "upflowed",
-    "upfolded",
-    "upgather",
-    "upgazing",
-    "upgirded",
-    "upgrowth",
-    "upheaped",
-    "upheaved",
-    "upheaver",
-    "upheaves",
-    "uphoards",
-    "upholder",
-    "upleaped",
-    "uplifter",
-    "uplights",
-    "uppiling",
-    "uppishly",
-    "upraised",
-    "upraiser",
-    "upraises",
-    "uprating",
-    "upreared",
-    "uprisers",
-    "uprivers",
-    "uprootal",
-    "uprooter",
-    "uproused",
-    "uprouses",
-    "uprushed",
-    "uprushes",
-    "upscaled",
-    "upscales",
-    "upsetter",
-    "upshifts",
-    "upshoots",
-    "upsilons",
-    "upsizing",
-    "upsoared",
-    "upsprang",
-    "upspring",
-    "upsprung",
-    "upstaged",
-    "upstager",
-    "upstages",
-    "upstands",
-    "upstared",
-    "upstares",
-    "upstater",
-    "upstates",
-    "upstroke",
-    "upsurged",
-    "upsurges",
-    "upsweeps",
-    "upswells",
-    "upswings",
-    "uptalked",
-    "uptempos",
-    "upthrown",
-    "upthrows",
-    "upthrust",
-    "uptilted",
-    "uptossed",
-    "uptosses",
-    "uptowner",
-    "uptrends",
-    "upwafted",
-    "upwelled",
-    "uraemias",
-    "uraeuses",
-    "uralites",
-    "uralitic",
-    "uranides",
-    "uranisms",
-    "uranites",
-    "uranitic",
-    "uraniums",
-    "uranylic",
-    "urbanely",
-    "urbanest",
-    "urbanise",
-    "urbanist",
-    "urbanite",
-    "urbanity",
-    "urbanize",
-    "uredinia",
-    "ureteric",
-    "urethans",
-    "urethrae",
-    "urethras",
-    "urgingly",
-    "uridines",
-    "urinated",
-    "urinates",
-    "urinator",
-    "urinemia",
-    "urinemic",
-    "urochord",
-    "urodeles",
-    "uroliths",
-    "uropodal",
-    "uropygia",
-    "uroscopy",
-    "urostyle",
-    "ursiform",
-    "urticant",
-    "urticate",
-    "urushiol",
-    "usaunces",
-    "usquabae",
-    "usquebae",
-    "ustulate",
-    "usufruct",
-    "usurious",
-    "usurpers",
-    "uteruses",
-    "utilidor",
-    "utilizer",
-    "utopians",
-    "utopisms",
-    "utopists",
-    "utricles",
-    "utriculi",
-    "utterers",
-    "uvularly",
-    "uvulitis",
-    "uxorious",
-    "vacantly",
-    "vaccinal",
-    "vaccinas",
-    "vaccinee",
-    "vacuumed",
-    "vagility",
-    "vaginate",
-    "vagotomy",
-    "vagrancy",
-    "vagrants",
-    "vainness",
-    "valanced",
-    "valences",
-    "valerate",
-    "valguses",
-    "valiance",
-    "valiancy",
-    "valiants",
-    "valleyed",
-    "valonias",
-    "valorise",
-    "valorize",
-    "valorous",
-    "valuably",
-    "valuated",
-    "valuates",
-    "valuator",
-    "valvelet",
-    "valvulae",
-    "valvules",
-    "vambrace",
-    "vamoosed",
-    "vamooses",
-    "vamosing",
-    "vampiest",
-    "vampiric",
-    "vanadate",
-    "vanadous",
-    "vandalic",
-    "vandyked",
-    "vandykes",
-    "vanillas",
-    "vanillic",
-    "vanillin",
-    "vanisher",
-    "vanitied",
-    "vanitory",
-    "vanloads",
-    "vanpools",
-    "vantages",
-    "vapidity",
-    "vaporers",
-    "vaporing",
-    "vaporise",
-    "vaporish",
-    "vaporize",
-    "vaporous",
-    "vapoured",
-    "vapourer",
-    "vaqueros",
-    "varactor",
-    "variated",
-    "variates",
-    "variedly",
-    "variform",
-    "variolar",
-    "variolas",
-    "varioles",
-    "variorum",
-    "varistor",
-    "varletry",
-    "varments",
-    "varmints",
-    "varnishy",
-    "varoomed",
-    "vasculum",
-    "vaselike",
-    "vasiform",
-    "vasotomy",
-    "vastiest",
-    "vaticide",
-    "vaulters",
-    "vaultier",
-    "vaunters",
-    "vauntful",
-    "vaunting",
-    "vavasors",
-    "vavasour",
-    "vavassor",
-    "vealiest",
-    "vectored",
-    "vedalias",
-    "vedettes",
-    "vegetant",
-    "vegetate",
-    "vegetist",
-    "vegetive",
-    "veiledly",
-    "veilings",
-    "veillike",
-    "veiniest",
-    "veinings",
-    "veinless",
-    "veinlets",
-    "veinlike",
-    "veinules",
-    "veinulet",
-    "velamina",
-    "velarium",
-    "velarize",
-    "veligers",
-    "velleity",
-    "veloutes",
-    "veluring",
-    "velveret",
-    "velveted",
-    "venality",
-    "venation",
-    "vendable",
-    "vendaces",
-    "vendeuse",
-    "vendible",
-    "vendibly",
-    "veneered",
-    "veneerer",
-    "venenate",
-    "venenose",
-    "venerate",
-    "veneries",
-    "venially",
-    "venisons",
-    "venogram",
-    "venology",
-    "venomers",
-    "venoming",
-    "venosity",
-    "venously",
-    "ventages",
-    "ventails",
-    "ventless",
-    "ventrals",
-    "venturis",
-    "venulose",
-    "venulous",
-    "verandas",
-    "veratria",
-    "veratrin",
-    "veratrum",
-    "verbenas",
-    "verbiles",
-    "verbless",
-    "verdancy",
-    "verderer",
-    "verderor",
-    "verditer",
-    "verdured",
-    "verdures",
-    "verecund",
-    "vergence",
-    "verismos",
-    "veristic",
-    "verities",
-    "verjuice",
-    "vermeils",
-    "vermoulu",
-    "vermuths",
-    "vernacle",
-    "vernally",
-    "vernicle",
-    "verniers",
-    "vernixes",
-    "verrucae",
-    "verrucas",
-    "versants",
-    "verseman",
-    "versemen",
-    "versicle",
-    "versines",
-    "vertexes",
-    "verticil",
-    "vertigos",
-    "vervains",
-    "vesicant",
-    "vesicate",
-    "vesicula",
-    "vesperal",
-    "vespiary",
-    "vesseled",
-    "vestally",
-    "vestiary",
-    "vestigia",
-    "vestings",
-    "vestless",
-    "vestlike",
-    "vestment",
-    "vestries",
-    "vestural",
-    "vestured",
-    "vestures",
-    "vesuvian",
-    "vetivers",
-    "vetivert",
-    "vexation",
-    "vexillar",
-    "vexillum",
-    "vexingly",
-    "viaducts",
-    "vialling",
-    "viaticum",
-    "viatores",
-    "vibrance",
-    "vibrants",
-    "vibrated",
-    "vibratos",
-    "vibrioid",
-    "vibrions",
-    "vibrissa",
-    "vibronic",
-    "vicarate",
-    "vicarial",
-    "viceless",
-    "vicenary",
-    "viceroys",
-    "vicinage",
-    "vicomtes",
-    "victress",
-    "victuals",
-    "vicugnas",
-    "videotex",
-    "videttes",
-    "vidicons",
-    "viewdata",
-    "viewiest",
-    "viewless",
-    "vigneron",
-    "vigoroso",
-    "vilayets",
-    "vileness",
-    "vilifier",
-    "vilifies",
-    "vilipend",
-    "villadom",
-    "villatic",
-    "villeins",
-    "vinasses",
-    "vincible",
-    "vincibly",
-    "vinculum",
-    "vindaloo",
-    "vinegary",
-    "vineries",
-    "vinifera",
-    "vinified",
-    "vinifies",
-    "vinosity",
-    "vinously",
-    "vintager",
-    "violable",
-    "violably",
-    "violater",
-    "violists",
-    "violones",
-    "viomycin",
-    "viperine",
-    "viperish",
-    "viperous",
-    "viragoes",
-    "virelais",
-    "virelays",
-    "viremias",
-    "virgates",
-    "virgules",
-    "viricide",
-    "viridity",
-    "virilely",
-    "virilism",
-    "virilize",
-    "virtuosa",
-    "virtuose",
-    "virtuosi",
-    "virucide",
-    "virusoid",
-    "viscacha",
-    "viscidly",
-    "viscoses",
-    "viselike",
-    "visional",
-    "visioned",
-    "visitant",
-    "visiters",
-    "visoring",
-    "vitalise",
-    "vitalism",
-    "vitalist",
-    "vitalize",
-    "vitamers",
-    "vitellin",
-    "vitellus",
-    "vitesses",
-    "vitiable",
-    "vitiated",
-    "vitiates",
-    "vitiator",
-    "vitrains",
-    "vitrines",
-    "vitriols",
-    "vittling",
-    "vituline",
-    "vivacity",
-    "vivaries",
-    "vivarium",
-    "viverrid",
-    "vividest",
-    "vivified",
-    "vivifier",
-    "vivifies",
-    "vivipara",
-    "vivisect",
-    "vixenish",
-    "vizarded",
-    "vizcacha",
-    "vizirate",
-    "vizirial",
-    "vizoring",
-    "vocables",
-    "vocalese",
-    "vocalics",
-    "vocalise",
-    "vocalism",
-    "vocality",
-    "vocalize",
-    "vocative",
-    "vocoders",
-    "vogueing",
-    "voguings",
-    "voiceful",
-    "voicings",
-    "voidable",
-    "voidance",
-    "voidness",
-    "volcanos",
-    "voleries",
-    "volitant",
-    "volitive",
-    "volleyed",
-    "volleyer",
-    "volplane",
-    "voltaism",
-    "voluming",
-    "volutins",
-    "volution",
-    "volvoxes",
-    "volvulus",
-    "vomerine",
-    "vomiters",
-    "vomitive",
-    "vomitory",
-    "vomitous",
-    "voodooed",
-    "voracity",
-    "vorlages",
-    "vortexes",
-    "vortical",
-    "votaress",
-    "votaries",
-    "votarist",
-    "voteable",
-    "voteless",
-    "votively",
-    "vouchees",
-    "vouching",
-    "voudouns",
-    "voussoir",
-    "vouvrays",
-    "vowelize",
-    "voyaging",
-    "vrooming",
-    "vuggiest",
-    "vulcanic",
-    "vulgarer",
-    "vulgarly",
-    "vulgates",
-    "vulguses",
-    "vulvitis",
-    "wabblers",
-    "wabblier",
-    "wabbling",
-    "wackiest",
-    "waddings",
-    "waddlers",
-    "waddling",
-    "waddying",
-    "wadeable",
-    "wadmaals",
-    "wadmolls",
-    "waesucks",
-    "wafering",
-    "wafflers",
-    "wafflier",
-    "waffling",
-    "waftages",
-    "waftures",
-    "wageless",
-    "wagerers",
-    "wagglier",
-    "waggling",
-    "waggoned",
-    "wagonage",
-    "wagoners",
-    "wagoning",
-    "wagtails",
-    "wahconda",
-    "waiflike",
-    "wailsome",
-    "wainscot",
-    "waisters",
-    "waisting",
-    "waitered",
-    "waitings",
-    "waitrons",
-    "wakandas",
-    "wakeless",
-    "wakeners",
-    "wakening",
-    "wakerife",
-    "walkaway",
-    "walkings",
-    "walkouts",
-    "walkover",
-    "walkyrie",
-    "wallaroo",
-    "walleyed",
-    "walleyes",
-    "walloped",
-    "walloper",
-    "wallowed",
-    "wallower",
-    "walruses",
-    "waltzers",
-    "wamblier",
-    "wambling",
-    "wamefous",
-    "wamefuls",
-    "wammuses",
-    "wampuses",
-    "wanderoo",
-    "wanglers",
-    "wangling",
-    "wanigans",
-    "wannabee",
-    "wannigan",
-    "wantages",
-    "wantoned",
-    "wantoner",
-    "wantonly",
-    "warbling",
-    "wardenry",
-    "wardless",
-    "wardress",
-    "wardroom",
-    "wardship",
-    "wareroom",
-    "warfares",
-    "warhorse",
-    "wariness",
-    "warisons",
-    "warmaker",
-    "warmness",
-    "warmouth",
-    "warpages",
-    "warpaths",
-    "warplane",
-    "warpower",
-    "warpwise",
-    "warragal",
-    "warrener",
-    "warrigal",
-    "warslers",
-    "warsling",
-    "warstled",
-    "warstler",
-    "warstles",
-    "warthogs",
-    "wartiest",
-    "wartimes",
-    "wartless",
-    "wartlike",
-    "warworks",
-    "washbowl",
-    "washdays",
-    "washiest",
-    "washings",
-    "washouts",
-    "washrags",
-    "washtubs",
-    "waspiest",
-    "wasplike",
-    "wassails",
-    "wastable",
-    "wastages",
-    "wastelot",
-    "wasterie",
-    "wasteway",
-    "wastrels",
-    "wastries",
-    "watchcry",
-    "watcheye",
-    "watchout",
-    "waterage",
-    "waterbus",
-    "waterdog",
-    "waterers",
-    "waterhen",
-    "waterier",
-    "waterily",
-    "waterish",
-    "waterlog",
-    "watermen",
-    "waterski",
-    "wattages",
-    "wattapes",
-    "watthour",
-    "wattless",
-    "wattling",
-    "wauchted",
-    "waughted",
-    "waveband",
-    "waveless",
-    "wavelike",
-    "waveoffs",
-    "waverers",
-    "wavicles",
-    "waviness",
-    "waxberry",
-    "waxbills",
-    "waxiness",
-    "waxplant",
-    "waxweeds",
-    "waxwings",
-    "waxworks",
-    "waxworms",
-    "waybills",
-    "waygoing",
-    "waylayer",
-    "waysides",
-    "weakener",
-    "weakfish",
-    "weaklier",
-    "weakling",
-    "weakside",
-    "weanling",
-    "weaponed",
-    "weariest",
-    "weariful",
-    "wearying",
-    "weasands",
-    "weaseled",
-    "weaselly",
-    "weazands",
-    "webbiest",
-    "webbings",
-    "webworms",
-    "wedeling",
-    "wedgiest",
-    "wedlocks",
-    "weediest",
-    "weedless",
-    "weedlike",
-    "weeniest",
-    "weensier",
-    "weepiest",
-    "weepings",
-    "weeviled",
-    "weevilly",
-    "weftwise",
-    "weigelas",
-    "weigelia",
-    "weighers",
-    "weighman",
-    "weighmen",
-    "weighter",
-    "weirdies",
-    "weirding",
-    "weirdoes",
-    "welchers",
-    "welching",
-    "welcomer",
-    "weldable",
-    "weldless",
-    "weldment",
-    "welfares",
-    "welladay",
-    "wellaway",
-    "wellborn",
-    "wellcurb",
-    "welldoer",
-    "wellhole",
-    "wellsite",
-    "welshers",
-    "welshing",
-    "weltered",
-    "weltings",
-    "wenchers",
-    "wenching",
-    "wendigos",
-    "wenniest",
-    "weregild",
-    "wergelds",
-    "wergelts",
-    "wergilds",
-    "wessands",
-    "westered",
-    "westings",
-    "westmost",
-    "wetbacks",
-    "wetproof",
-    "wettable",
-    "wettings",
-    "wetwares",
-    "whackers",
-    "whackier",
-    "whaleman",
-    "whalemen",
-    "whalings",
-    "whammies",
-    "whamming",
-    "whangees",
-    "whanging",
-    "whappers",
-    "whapping",
-    "wharfage",
-    "wharfing",
-    "whatness",
-    "whatnots",
-    "whatsits",
-    "wheatear",
-    "wheatens",
-    "wheedled",
-    "wheedler",
-    "wheedles",
-    "wheelies",
-    "wheelman",
-    "wheelmen",
-    "wheeping",
-    "wheepled",
-    "wheeples",
-    "wheezers",
-    "wheezier",
-    "wheezily",
-    "whelkier",
-    "whelming",
-    "whelping",
-    "wherried",
-    "wherries",
-    "whetters",
-    "whetting",
-    "wheyface",
-    "wheylike",
-    "whickers",
-    "whidding",
-    "whiffers",
-    "whiffets",
-    "whiffing",
-    "whiffled",
-    "whiffler",
-    "whiffles",
-    "whimbrel",
-    "whimpers",
-    "whimseys",
-    "whimsied",
-    "whimsies",
-    "whinchat",
-    "whingers",
-    "whinging",
-    "whiniest",
-    "whinnied",
-    "whinnier",
-    "whinnies",
-    "whipcord",
-    "whiplike",
-    "whippers",
-    "whippets",
-    "whippier",
-    "whiprays",
-    "whipsawn",
-    "whipsaws",
-    "whiptail",
-    "whipworm",
-    "whirlers",
-    "whirlier",
-    "whirlies",
-    "whirried",
-    "whirries",
-    "whirring",
-    "whishing",
-    "whishted",
-    "whiskery",
-    "whiskeys",
-    "whisking",
-    "whispery",
-    "whisting",
-    "whitecap",
-    "whitefly",
-    "whitened",
-    "whiteout",
-    "whitiest",
-    "whitings",
-    "whitlows",
-    "whitrack",
-    "whitters",
-    "whittled",
-    "whittler",
-    "whittles",
-    "whittret",
-    "whizbang",
-    "whizzers",
-    "whizzier",
-    "whizzing",
-    "wholisms",
-    "whomping",
-    "whoofing",
-    "whoopees",
-    "whoopers",
-    "whoopies",
-    "whooplas",
-    "whooshed",
-    "whooshes",
-    "whoredom",
-    "whoreson",
-    "whortles",
-    "whosever",
-    "whosises",
-    "whumping",
-    "whupping",
-    "wickapes",
-    "wickeder",
-    "wickings",
-    "wickiups",
-    "wickless",
-    "wickyups",
-    "wicopies",
-    "widdling",
-    "widebody",
-    "wideners",
-    "wideness",
-    "wideouts",
-    "widgeons",
-    "widowing",
-    "widthway",
-    "wielders",
-    "wieldier",
-    "wifedoms",
-    "wifehood",
-    "wifeless",
-    "wifelier",
-    "wifelike",
-    "wiftiest",
-    "wiggiest",
-    "wiggings",
-    "wigglers",
-    "wigglier",
-    "wigmaker",
-    "wildered",
-    "wildings",
-    "wildling",
-    "wiliness",
-    "willable",
-    "williwau",
-    "williwaw",
-    "willowed",
-    "willower",
-    "willyard",
-    "willyart",
-    "willying",
-    "willywaw",
-    "wimbling",
-    "wimpiest",
-    "wimpling",
-    "winchers",
-    "winching",
-    "windable",
-    "windages",
-    "windbags",
-    "windbell",
-    "windburn",
-    "windflaw",
-    "windgall",
-    "windiest",
-    "windigos",
-    "windless",
-    "windling",
-    "windpipe",
-    "windrows",
-    "windsock",
-    "windways",
-    "wineless",
-    "winesaps",
-    "wineshop",
-    "wineskin",
-    "winesops",
-    "wingback",
-    "wingbows",
-    "wingding",
-    "wingedly",
-    "wingiest",
-    "winglets",
-    "winglike",
-    "wingover",
-    "wingtips",
-    "winkling",
-    "winnable",
-    "winnocks",
-    "winnowed",
-    "winnower",
-    "winsomer",
-    "wintered",
-    "winterer",
-    "winterly",
-    "wintling",
-    "wintrier",
-    "wintrily",
-    "wipeouts",
-    "wiredraw",
-    "wiredrew",
-    "wirehair",
-    "wirelike",
-    "wireways",
-    "wirework",
-    "wireworm",
-    "wiriness",
-    "wiseacre",
-    "wiseguys",
-    "wiselier",
-    "wiseness",
-    "wishless",
-    "wispiest",
-    "wisplike",
-    "wistaria",
-    "witchier",
-    "witherer",
-    "witherod",
-    "withiest",
-    "withouts",
-    "witlings",
-    "witloofs",
-    "wittiest",
-    "wittings",
-    "wizardly",
-    "wizening",
-    "wobblers",
-    "wobblier",
-    "wobblies",
-    "wobegone",
-    "wofuller",
-    "wolffish",
-    "wolflike",
-    "wolframs",
-    "womaning",
-    "womanise",
-    "womanish",
-    "womanism",
-    "womanist",
-    "womanize",
-    "wombiest",
-    "wommeras",
-    "wonderer",
-    "wonkiest",
-    "wontedly",
-    "woodbind",
-    "woodbins",
-    "woodchat",
-    "woodener",
-    "woodenly",
-    "woodhens",
-    "woodiest",
-    "woodlark",
-    "woodless",
-    "woodlore",
-    "woodlots",
-    "woodnote",
-    "woodpile",
-    "woodshed",
-    "woodsias",
-    "woodsier",
-    "woodsmen",
-    "woodtone",
-    "woodworm",
-    "wooingly",
-    "woolfell",
-    "woolhats",
-    "wooliest",
-    "woollens",
-    "woollier",
-    "woollies",
-    "woollike",
-    "woollily",
-    "woolpack",
-    "woolsack",
-    "woolshed",
-    "woolskin",
-    "woolwork",
-    "woomeras",
-    "woopsing",
-    "wooralis",
-    "wooraris",
-    "wooshing",
-    "wooziest",
-    "wordages",
-    "wordbook",
-    "wordiest",
-    "wordings",
-    "workably",
-    "workaday",
-    "workbags",
-    "workboat",
-    "workfare",
-    "workfolk",
-    "workhour",
-    "workless",
-    "workmate",
-    "wormgear",
-    "wormiest",
-    "wormlike",
-    "wormroot",
-    "wormseed",
-    "wornness",
-    "worriers",
-    "worrited",
-    "worsteds",
-    "worsting",
-    "worthful",
-    "worthier",
-    "worthies",
-    "worthily",
-    "wouldest",
-    "wrackful",
-    "wracking",
-    "wrangled",
-    "wrangles",
-    "wrassled",
-    "wrassles",
-    "wrastled",
-    "wrastles",
-    "wrathful",
-    "wrathier",
-    "wrathily",
-    "wrathing",
-    "wreakers",
-    "wreathed",
-    "wreathen",
-    "wreather",
-    "wreathes",
-    "wreckful",
-    "wrencher",
-    "wresters",
-    "wretches",
-    "wricking",
-    "wriggled",
-    "wriggler",
-    "wriggles",
-    "wringers",
-    "wristier",
-    "writerly",
-    "writhers",
-    "wrongers",
-    "wrongest",
-    "wronging",
-    "wrothful",
-    "wrynecks",
-    "wurtzite",
-    "wussiest",
-    "wuthered",
-    "xanthans",
-    "xanthate",
-    "xanthein",
-    "xanthene",
-    "xanthins",
-    "xanthoma",
-    "xanthone",
-    "xanthous",
-    "xenogamy",
-    "xenogeny",
-    "xenolith",
-    "xerosere",
-    "xeroxing",
-    "xiphoids",
-    "xylidine",
-    "xylidins",
-    "xylitols",
-    "xylocarp",
-    "xylotomy",
-    "yabbered",
-    "yachters",
-    "yachtman",
-    "yachtmen",
-    "yahooism",
-    "yahrzeit",
-    "yakitori",
-    "yamalkas",
-    "yammered",
-    "yammerer",
-    "yamulkas",
-    "yardages",
-    "yardarms",
-    "yardbird",
-    "yardland",
-    "yardwand",
-    "yardwork",
-    "yarmelke",
-    "yarmulke",
-    "yashmacs",
-    "yashmaks",
-    "yatagans",
-    "yataghan",
-    "yattered",
-    "yawmeter",
-    "yawpings",
-    "yealings",
-    "yeanling",
-    "yearends",
-    "yearlies",
-    "yearners",
-    "yeasayer",
-    "yeastier",
-    "yeastily",
-    "yeasting",
-    "yellower",
-    "yellowly",
-    "yeomanly",
-    "yeomanry",
-    "yeshivah",
-    "yeshivas",
-    "yeshivot",
-    "yestreen",
-    "yielders",
-    "yodelers",
-    "yodeling",
-    "yodelled",
-    "yodeller",
-    "yoghourt",
-    "yoghurts",
-    "yohimbes",
-    "yokeless",
-    "yokelish",
-    "yokemate",
-    "yokozuna",
-    "yolkiest",
-    "youngers",
-    "youngish",
-    "younkers",
-    "youthens",
-    "yperites",
-    "ytterbia",
-    "ytterbic",
-    "yttriums",
-    "yuckiest",
-    "yukkiest",
-    "yummiest",
-    "zabaione",
-    "zabajone",
-    "zacatons",
-    "zaddikim",
-    "zaibatsu",
-    "zamarras",
-    "zamarros",
-    "zamindar",
-    "zaniness",
-    "zapateos",
-    "zappiest",
-    "zaptiahs",
-    "zaptiehs",
-    "zaratite",
-    "zareebas",
-    "zarzuela",
-    "zastruga",
-    "zastrugi",
-    "zealotry",
-    "zebranos",
-    "zebrines",
-    "zecchini",
-    "zecchino",
-    "zecchins",
-    "zelkovas",
-    "zemindar",
-    "zemstvos",
-    "zenaidas",
-    "zenithal",
-    "zeolitic",
-    "zeppoles",
-    "zestiest",
-    "zestless",
-    "zibeline",
-    "ziggurat",
-    "zigzaggy",
-    "zikkurat",
-    "zikurats",
-    "zincates",
-    "zincites",
-    "zincking",
-    "zingiest",
-    "zippiest",
-    "zircaloy",
-    "zirconic",
-    "zitherns",
-    "zizzling",
-    "zoisites",
-    "zombiism",
-    "zonation",
-    "zoneless",
-    "zonetime",
-    "zoochore",
-    "zooecium",
-    "zoogenic",
-    "zoogleae",
-    "zoogleal",
-    "zoogleas",
-    "zoogloea",
-    "zoolater",
-    "zoolatry",
-    "zoologic",
-    "zoomania",
-    "zoometry",
-    "zoomorph",
-    "zoonoses",
-    "zoonosis",
-    "zoophile",
-    "zoophily",
-    "zoophobe",
-    "zoophyte",
-    "zoosperm",
-    "zoospore",
-    "zootiest",
-    "zootomic",
-    "zorillas",
-    "zorilles",
-    "zorillos",
-    "zugzwang",
-    "zwieback",
-    "zygomata",
-    "zygosity",
-    "zygotene",
-    "zymogene",
-    "zymogens",
-    "zymogram",
-    "zymology",
-    "zymosans",
-    "zyzzyvas",
-]